@@ -1,9 +1,878 @@
 import os
+import re
+import struct
 import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from array import array
+from xml.sax.saxutils import escape, quoteattr
 
-# Define JAR path
+try:
+    from jvm_helper import run_jar
+except ImportError:  # running without the helper module next to this script
+    run_jar = None
+
+# Define JAR path (only needed for files the built-in codec can't read)
 JAR_PATH = "/storage/emulated/0/YouTube/Cookies/axml2xml.jar"
 
+# Binary XML chunk and value types (frameworks/base ResourceTypes.h)
+RES_STRING_POOL = 0x0001
+RES_XML = 0x0003
+RES_XML_START_NAMESPACE = 0x0100
+RES_XML_END_NAMESPACE = 0x0101
+RES_XML_START_ELEMENT = 0x0102
+RES_XML_END_ELEMENT = 0x0103
+RES_XML_CDATA = 0x0104
+RES_XML_RESOURCE_MAP = 0x0180
+
+TYPE_NULL = 0x00
+TYPE_REFERENCE = 0x01
+TYPE_ATTRIBUTE = 0x02
+TYPE_STRING = 0x03
+TYPE_FLOAT = 0x04
+TYPE_DIMENSION = 0x05
+TYPE_FRACTION = 0x06
+TYPE_INT_DEC = 0x10
+TYPE_INT_HEX = 0x11
+TYPE_INT_BOOLEAN = 0x12
+TYPE_INT_COLOR_ARGB8 = 0x1C
+TYPE_INT_COLOR_RGB8 = 0x1D
+TYPE_INT_COLOR_ARGB4 = 0x1E
+TYPE_INT_COLOR_RGB4 = 0x1F
+NO_INDEX = 0xFFFFFFFF
+
+ANDROID_NS = "http://schemas.android.com/apk/res/android"
+DIMENSION_UNITS = ("px", "dip", "sp", "pt", "in", "mm")
+FRACTION_UNITS = ("%", "%p")
+COMPLEX_SHIFTS = (0, 7, 15, 23)  # fraction bits of each complex radix
+# Framework ids of the android: attributes a manifest may gain while edited as text
+ANDROID_ATTR_IDS = {
+    "theme": 0x01010000,
+    "label": 0x01010001,
+    "icon": 0x01010002,
+    "name": 0x01010003,
+    "permission": 0x01010006,
+    "readPermission": 0x01010007,
+    "writePermission": 0x01010008,
+    "protectionLevel": 0x01010009,
+    "sharedUserId": 0x0101000B,
+    "hasCode": 0x0101000C,
+    "persistent": 0x0101000D,
+    "enabled": 0x0101000E,
+    "debuggable": 0x0101000F,
+    "exported": 0x01010010,
+    "process": 0x01010011,
+    "taskAffinity": 0x01010012,
+    "multiprocess": 0x01010013,
+    "finishOnTaskLaunch": 0x01010014,
+    "clearTaskOnLaunch": 0x01010015,
+    "stateNotNeeded": 0x01010016,
+    "excludeFromRecents": 0x01010017,
+    "authorities": 0x01010018,
+    "syncable": 0x01010019,
+    "initOrder": 0x0101001A,
+    "grantUriPermissions": 0x0101001B,
+    "priority": 0x0101001C,
+    "launchMode": 0x0101001D,
+    "screenOrientation": 0x0101001E,
+    "configChanges": 0x0101001F,
+    "description": 0x01010020,
+    "targetPackage": 0x01010021,
+    "handleProfiling": 0x01010022,
+    "functionalTest": 0x01010023,
+    "value": 0x01010024,
+    "resource": 0x01010025,
+    "mimeType": 0x01010026,
+    "scheme": 0x01010027,
+    "host": 0x01010028,
+    "port": 0x01010029,
+    "path": 0x0101002A,
+    "pathPrefix": 0x0101002B,
+    "pathPattern": 0x0101002C,
+    "alwaysRetainTaskState": 0x01010203,
+    "allowTaskReparenting": 0x01010204,
+    "minSdkVersion": 0x0101020C,
+    "versionCode": 0x0101021B,
+    "versionName": 0x0101021C,
+    "windowSoftInputMode": 0x0101022B,
+    "noHistory": 0x0101022D,
+    "targetSdkVersion": 0x01010270,
+    "maxSdkVersion": 0x01010271,
+    "testOnly": 0x01010272,
+    "backupAgent": 0x0101027F,
+    "allowBackup": 0x01010280,
+    "glEsVersion": 0x01010281,
+    "required": 0x0101028E,
+    "killAfterRestore": 0x0101029C,
+    "installLocation": 0x010102B7,
+    "vmSafeMode": 0x010102B8,
+    "restoreAnyVersion": 0x010102BA,
+    "logo": 0x010102BE,
+    "hardwareAccelerated": 0x010102D3,
+    "largeHeap": 0x0101035A,
+    "stopWithTask": 0x0101036A,
+    "isolatedProcess": 0x010103A9,
+    "supportsRtl": 0x010103AF,
+    "banner": 0x010103F2,
+    "isGame": 0x010103F4,
+    "documentLaunchMode": 0x01010445,
+    "fullBackupOnly": 0x01010473,
+    "multiArch": 0x0101048E,
+    "extractNativeLibs": 0x010104EA,
+    "fullBackupContent": 0x010104EB,
+    "usesCleartextTraffic": 0x010104EC,
+    "autoVerify": 0x010104EE,
+    "resizeableActivity": 0x010104F6,
+    "supportsPictureInPicture": 0x010104F7,
+    "directBootAware": 0x01010505,
+    "networkSecurityConfig": 0x01010527,
+    "roundIcon": 0x0101052C,
+    "visibleToInstantApps": 0x01010531,
+    "splitName": 0x01010549,
+    "isolatedSplits": 0x0101054B,
+    "isFeatureSplit": 0x0101055B,
+    "showWhenLocked": 0x01010569,
+    "turnScreenOn": 0x0101056A,
+}
+ATTR_NAMES = {resource_id: name for name, resource_id in ANDROID_ATTR_IDS.items()}
+
+
+def _u32_array(data):
+    values = array("I", data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def _u32_bytes(values):
+    if sys.byteorder == "big":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+def _number_text(number):
+    text = repr(number)
+    return text[:-2] if text.endswith(".0") else text
+
+def complex_to_float(value):
+    """A dimension/fraction's number (Android's TypedValue.complexToFloat)"""
+    mantissa = value & 0xFFFFFF00
+    if mantissa & 0x80000000:
+        mantissa -= 1 << 32
+    return mantissa / (1 << 8) / (1 << COMPLEX_SHIFTS[(value >> 4) & 3])
+
+def float_to_complex(number, unit):
+    """The radix/mantissa aapt picks for a dimension or fraction"""
+    negative = number < 0
+    bits = int(abs(number) * (1 << 23) + 0.5)
+    if bits & 0x7FFFFF == 0:
+        radix, shift = 0, 23
+    elif bits >> 23 == 0:
+        radix, shift = 3, 0
+    elif bits >> 31 == 0:
+        radix, shift = 2, 8
+    elif bits >> 39 == 0:
+        radix, shift = 1, 16
+    else:
+        radix, shift = 0, 23
+    mantissa = (bits >> shift) & 0xFFFFFF
+    if negative:
+        mantissa = -mantissa & 0xFFFFFF
+    return mantissa << 8 | radix << 4 | unit
+
+def format_value(value_type, value):
+    """Text for a typed (non-string) attribute value"""
+    if value_type == TYPE_NULL:
+        return "@empty" if value == 1 else "@null"
+    if value_type == TYPE_REFERENCE:
+        return f"@0x{value:08x}"
+    if value_type == TYPE_ATTRIBUTE:
+        return f"?0x{value:08x}"
+    if value_type == TYPE_FLOAT:
+        return _number_text(struct.unpack("<f", struct.pack("<I", value))[0])
+    if value_type == TYPE_DIMENSION and value & 0xF < len(DIMENSION_UNITS):
+        return _number_text(complex_to_float(value)) + DIMENSION_UNITS[value & 0xF]
+    if value_type == TYPE_FRACTION and value & 0xF < len(FRACTION_UNITS):
+        return _number_text(complex_to_float(value) * 100) + FRACTION_UNITS[value & 0xF]
+    if value_type == TYPE_INT_DEC:
+        return str(value - (1 << 32) if value & 0x80000000 else value)
+    if value_type == TYPE_INT_BOOLEAN:
+        return "true" if value else "false"
+    if value_type == TYPE_INT_COLOR_ARGB8:
+        return f"#{value:08x}"
+    if value_type == TYPE_INT_COLOR_RGB8:
+        return f"#{value & 0xFFFFFF:06x}"
+    if value_type in (TYPE_INT_COLOR_ARGB4, TYPE_INT_COLOR_RGB4):
+        nibbles = "".join(f"{value >> shift & 0xF:x}" for shift in (28, 20, 12, 4))
+        return "#" + (nibbles if value_type == TYPE_INT_COLOR_ARGB4 else nibbles[1:])
+    return f"0x{value:08x}"
+
+def parse_value(text, hint=None, numbers=True):
+    """
+    (value_type, data) for an attribute's text; strings come back as
+    (TYPE_STRING, None). hint is the type the attribute had before, numbers
+    turns on number/color/dimension parsing (aapt only types those for
+    attributes it knows, i.e. namespaced ones).
+    """
+    if hint == TYPE_STRING:
+        return TYPE_STRING, None
+    if text == "@null":
+        return TYPE_REFERENCE, 0
+    if text == "@empty":
+        return TYPE_NULL, 1
+    match = re.fullmatch(r"([@?])0x([0-9a-fA-F]{8})", text)
+    if match:
+        return TYPE_REFERENCE if match.group(1) == "@" else TYPE_ATTRIBUTE, int(match.group(2), 16)
+    if text in ("true", "false"):
+        return TYPE_INT_BOOLEAN, NO_INDEX if text == "true" else 0
+    if not numbers:
+        return TYPE_STRING, None
+    if hint == TYPE_FLOAT:
+        try:
+            return TYPE_FLOAT, struct.unpack("<I", struct.pack("<f", float(text)))[0]
+        except (ValueError, OverflowError):
+            pass
+    if re.fullmatch(r"-?\d+", text) and -(1 << 31) <= int(text) < 1 << 32:
+        return TYPE_INT_DEC, int(text) & 0xFFFFFFFF
+    if re.fullmatch(r"0x[0-9a-fA-F]{1,8}", text):
+        return TYPE_INT_HEX, int(text, 16)
+    match = re.fullmatch(r"#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})", text)
+    if match:
+        digits = match.group(1)
+        if len(digits) <= 4:
+            digits = "".join(digit * 2 for digit in digits)
+        value = int(digits, 16) | (0 if len(digits) == 8 else 0xFF000000)
+        return {3: TYPE_INT_COLOR_RGB4, 4: TYPE_INT_COLOR_ARGB4, 6: TYPE_INT_COLOR_RGB8,
+                8: TYPE_INT_COLOR_ARGB8}[len(match.group(1))], value
+    match = re.fullmatch(r"(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)(px|dip|dp|sp|pt|in|mm|%p|%)", text)
+    if match:
+        number, unit = float(match.group(1)), match.group(2)
+        if unit in FRACTION_UNITS:
+            return TYPE_FRACTION, float_to_complex(number / 100, FRACTION_UNITS.index(unit))
+        unit = "dip" if unit == "dp" else unit
+        return TYPE_DIMENSION, float_to_complex(number, DIMENSION_UNITS.index(unit))
+    return TYPE_STRING, None
+
+def _split_name(key):
+    """("{uri}name" or "name") -> (uri or None, name)"""
+    if key.startswith("{"):
+        uri, name = key[1:].split("}", 1)
+        return uri, name
+    return None, key
+
+
+class StringPool:
+    """A ResStringPool chunk. Offsets live in arrays; string bytes stay as read and new ones are appended."""
+
+    UTF8_FLAG = 0x100
+    SORTED_FLAG = 0x1
+
+    def __init__(self, chunk=b"", utf8=True):
+        self._index = None
+        self._raw = bytes(chunk) or None  # written back as-is until the pool changes
+        if not chunk:
+            self.flags = self.UTF8_FLAG if utf8 else 0
+            self.offsets, self.style_offsets = array("I"), array("I")
+            self.string_data, self.style_data = bytearray(), b""
+            return
+        (_, header_size, size, count, style_count, flags, strings_start,
+         styles_start) = struct.unpack_from("<HHIIIIII", chunk)
+        self.flags = flags
+        offsets_end = header_size + 4 * count
+        self.offsets = _u32_array(chunk[header_size:offsets_end])
+        self.style_offsets = _u32_array(chunk[offsets_end:offsets_end + 4 * style_count])
+        if len(self.offsets) != count or len(self.style_offsets) != style_count:
+            raise ValueError("truncated string pool")
+        strings_end = styles_start if style_count else size
+        self.string_data = bytearray(chunk[strings_start:strings_end]) if count else bytearray()
+        self.style_data = bytes(chunk[styles_start:size]) if style_count else b""
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def get(self, index):
+        data, pos = self.string_data, self.offsets[index]
+        if self.flags & self.UTF8_FLAG:
+            pos += 2 if data[pos] & 0x80 else 1  # skip the UTF-16 length
+            length = data[pos]
+            if length & 0x80:
+                length = ((length & 0x7F) << 8) | data[pos + 1]
+                pos += 1
+            return data[pos + 1 : pos + 1 + length].decode("utf-8", "replace")
+        (length,) = struct.unpack_from("<H", data, pos)
+        if length & 0x8000:
+            length = ((length & 0x7FFF) << 16) | struct.unpack_from("<H", data, pos + 2)[0]
+            pos += 2
+        return data[pos + 2 : pos + 2 + 2 * length].decode("utf-16-le", "replace")
+
+    def find(self, text):
+        if self._index is None:
+            self._index = {}
+            for i in range(len(self.offsets)):
+                self._index.setdefault(self.get(i), i)
+        return self._index.get(text, -1)
+
+    def _encode(self, text):
+        units = len(text.encode("utf-16-le")) // 2
+        if self.flags & self.UTF8_FLAG:
+            raw = text.encode("utf-8")
+            if units > 0x7FFF or len(raw) > 0x7FFF:
+                raise ValueError("string too long for a UTF-8 pool")
+
+            def length(n):
+                return bytes([n]) if n < 0x80 else bytes([0x80 | n >> 8, n & 0xFF])
+
+            return length(units) + length(len(raw)) + raw + b"\0"
+        if units < 0x8000:
+            prefix = struct.pack("<H", units)
+        else:
+            prefix = struct.pack("<HH", 0x8000 | units >> 16, units & 0xFFFF)
+        return prefix + text.encode("utf-16-le") + b"\0\0"
+
+    def insert(self, index, text):
+        if index < len(self.style_offsets):
+            raise ValueError("can't insert in front of styled strings")
+        self.offsets.insert(index, len(self.string_data))
+        self.string_data += self._encode(text)
+        self.flags &= ~self.SORTED_FLAG
+        self._index = None
+        self._raw = None
+        return index
+
+    def append(self, text):
+        return self.insert(len(self.offsets), text)
+
+    def to_bytes(self):
+        if self._raw is not None:
+            return self._raw
+        count, style_count = len(self.offsets), len(self.style_offsets)
+        strings = bytes(self.string_data) + b"\0" * (-len(self.string_data) % 4)
+        strings_start = 28 + 4 * (count + style_count)
+        styles_start = strings_start + len(strings) if style_count else 0
+        size = strings_start + len(strings) + len(self.style_data)
+        return b"".join((
+            struct.pack("<HHIIIIII", RES_STRING_POOL, 28, size, count, style_count,
+                        self.flags, strings_start if count else 0, styles_start),
+            _u32_bytes(self.offsets),
+            _u32_bytes(self.style_offsets),
+            strings,
+            self.style_data,
+        ))
+
+
+class AxmlDocument:
+    """
+    Binary XML (AndroidManifest.xml, res/xml/*.xml) as a string pool,
+    resource map and chunk table.
+
+    The table keeps each chunk's type, offset and size in the file as read;
+    chunks are decoded when asked for and only edited ones are re-encoded,
+    so everything untouched is written back byte for byte.
+    """
+
+    def __init__(self, data=b""):
+        self.data = bytes(data)
+        self.header = struct.pack("<HHI", RES_XML, 8, 0)
+        self.trailer = b""
+        self.pool = StringPool()
+        self.resource_ids = array("I")
+        self._resource_map_raw = None
+        self._pool_index = self._map_index = None
+        self.types, self.offsets, self.sizes = array("H"), array("I"), array("I")
+        self.edited = {}  # chunk index -> bytes that replace it
+        if self.data:
+            self._parse()
+
+    def _parse(self):
+        data = self.data
+        chunk_type, header_size, size = struct.unpack_from("<HHI", data)
+        if chunk_type != RES_XML:
+            raise ValueError("not a binary XML file")
+        self.header = data[:header_size]
+        pos, end = header_size, min(size, len(data))
+        while pos + 8 <= end:
+            chunk_type, header_size, size = struct.unpack_from("<HHI", data, pos)
+            if size < 8 or pos + size > end:
+                raise ValueError(f"broken chunk at offset {pos}")
+            if chunk_type == RES_STRING_POOL and self._pool_index is None:
+                self._pool_index = len(self.types)
+                self.pool = StringPool(data[pos : pos + size])
+            elif chunk_type == RES_XML_RESOURCE_MAP and self._map_index is None:
+                self._map_index = len(self.types)
+                count = (size - header_size) // 4
+                self.resource_ids = _u32_array(data[pos + header_size : pos + header_size + 4 * count])
+                self._resource_map_raw = data[pos : pos + size]
+            self.types.append(chunk_type)
+            self.offsets.append(pos)
+            self.sizes.append(size)
+            pos += size
+        self.trailer = data[pos:end]
+
+    def _append(self, chunk_type, chunk):
+        self.types.append(chunk_type)
+        self.offsets.append(0)
+        self.sizes.append(len(chunk))
+        self.edited[len(self.types) - 1] = chunk
+
+    def chunk(self, index):
+        if index in self.edited:
+            return self.edited[index]
+        offset = self.offsets[index]
+        return self.data[offset : offset + self.sizes[index]]
+
+    def elements(self):
+        """Chunk indices of every start tag, in document order"""
+        return [i for i, chunk_type in enumerate(self.types) if chunk_type == RES_XML_START_ELEMENT]
+
+    def node(self, index):
+        """Decode one chunk into a dict; string fields stay pool indices."""
+        chunk, chunk_type = self.chunk(index), self.types[index]
+        node = {"type": chunk_type}
+        if not RES_XML_START_NAMESPACE <= chunk_type <= RES_XML_CDATA:
+            return node
+        header_size = struct.unpack_from("<H", chunk, 2)[0]
+        node["line"], node["comment"] = struct.unpack_from("<II", chunk, 8)
+        if chunk_type == RES_XML_START_ELEMENT:
+            (node["ns"], node["name"], attr_start, attr_size, count, node["id_index"],
+             node["class_index"], node["style_index"]) = struct.unpack_from("<IIHHHHHH", chunk, header_size)
+            node["attrs"] = []
+            for i in range(count):
+                ns, name, raw, _, _, value_type, value = struct.unpack_from(
+                    "<IIIHBBI", chunk, header_size + attr_start + i * attr_size
+                )
+                node["attrs"].append(
+                    {"ns": ns, "name": name, "raw": raw, "value_type": value_type, "value": value}
+                )
+        elif chunk_type == RES_XML_CDATA:
+            node["text"], _, _, node["value_type"], node["value"] = struct.unpack_from(
+                "<IHBBI", chunk, header_size
+            )
+        elif chunk_type in (RES_XML_START_NAMESPACE, RES_XML_END_NAMESPACE):
+            node["prefix"], node["uri"] = struct.unpack_from("<II", chunk, header_size)
+        else:
+            node["ns"], node["name"] = struct.unpack_from("<II", chunk, header_size)
+        return node
+
+    @staticmethod
+    def _string_refs(chunk, chunk_type):
+        """Offsets of every string reference in a node chunk"""
+        header_size = struct.unpack_from("<H", chunk, 2)[0]
+        refs = [12]  # comment
+        if chunk_type == RES_XML_START_ELEMENT:
+            refs += [header_size, header_size + 4]
+            attr_start, attr_size, count = struct.unpack_from("<HHH", chunk, header_size + 8)
+            for i in range(count):
+                base = header_size + attr_start + i * attr_size
+                refs += [base, base + 4, base + 8]
+                if chunk[base + 15] == TYPE_STRING:
+                    refs.append(base + 16)
+        elif chunk_type == RES_XML_CDATA:
+            refs.append(header_size)
+            if chunk[header_size + 7] == TYPE_STRING:
+                refs.append(header_size + 8)
+        else:
+            refs += [header_size, header_size + 4]
+        return refs
+
+    def _shift_strings(self, first):
+        """Renumber every string reference >= first after a string is inserted there."""
+        for i, chunk_type in enumerate(self.types):
+            if not RES_XML_START_NAMESPACE <= chunk_type <= RES_XML_CDATA:
+                continue
+            chunk, changed = bytearray(self.chunk(i)), False
+            for pos in self._string_refs(chunk, chunk_type):
+                (ref,) = struct.unpack_from("<I", chunk, pos)
+                if ref != NO_INDEX and ref >= first:
+                    struct.pack_into("<I", chunk, pos, ref + 1)
+                    changed = True
+            if changed:
+                self.edited[i] = bytes(chunk)
+
+    def string(self, ref):
+        return None if ref == NO_INDEX else self.pool.get(ref)
+
+    def attribute_id(self, attr):
+        name = attr["name"]
+        return self.resource_ids[name] if name < len(self.resource_ids) else 0
+
+    def attribute_name(self, attr):
+        name = self.string(attr["name"]) or ATTR_NAMES.get(self.attribute_id(attr))
+        if not name:
+            raise ValueError(f"attribute without a name (id 0x{self.attribute_id(attr):08x})")
+        return name
+
+    def find_element(self, name):
+        """Chunk index of the first <name> start tag, or None"""
+        for index in self.elements():
+            if self.string(self.node(index)["name"]) == name:
+                return index
+        return None
+
+    def get_attribute(self, element, resource_id):
+        for attr in self.node(element)["attrs"]:
+            if self.attribute_id(attr) == resource_id:
+                return attr
+        return None
+
+    def _write_element(self, index, node):
+        """Re-encode a start tag's attributes, keeping its header and attribute layout."""
+        chunk = self.chunk(index)
+        header_size = struct.unpack_from("<H", chunk, 2)[0]
+        attr_start, attr_size, count = struct.unpack_from("<HHH", chunk, header_size + 8)
+        head = bytearray(chunk[: header_size + attr_start])
+        struct.pack_into("<HHHH", head, header_size + 12, len(node["attrs"]), node["id_index"],
+                         node["class_index"], node["style_index"])
+        padding = bytes(attr_size - 20)
+        attrs = b"".join(
+            struct.pack("<IIIHBBI", a["ns"], a["name"], a["raw"], 8, 0, a["value_type"], a["value"])
+            + padding
+            for a in node["attrs"]
+        )
+        chunk = head + attrs + chunk[header_size + attr_start + attr_size * count :]
+        struct.pack_into("<I", chunk, 4, len(chunk))
+        self.edited[index] = bytes(chunk)
+
+    def set_attribute(self, element, resource_id, name, value_type, value):
+        """Set an android: attribute, adding its name and resource id if the file lacks them."""
+        node = self.node(element)
+        attr = next((a for a in node["attrs"] if self.attribute_id(a) == resource_id), None)
+        if attr is not None:
+            attr.update(raw=NO_INDEX, value_type=value_type, value=value)
+            self._write_element(element, node)
+            return
+        if resource_id in self.resource_ids:
+            name_ref = self.resource_ids.index(resource_id)
+        else:
+            # The resource map covers the first N strings, so the name has to
+            # go right after them and every later reference moves up by one
+            name_ref = len(self.resource_ids)
+            self._shift_strings(name_ref)
+            self.pool.insert(name_ref, name)
+            self.resource_ids.append(resource_id)
+            self._resource_map_raw = None
+            node = self.node(element)
+        ns_ref = self.pool.find(ANDROID_NS)
+        if ns_ref < 0:
+            raise ValueError("no android namespace in the manifest")
+        attrs = node["attrs"]
+        # aapt keeps attributes sorted by resource id, plain ones last
+        position = next(
+            (i for i, other in enumerate(attrs)
+             if not self.attribute_id(other) or self.attribute_id(other) > resource_id),
+            len(attrs),
+        )
+        attrs.insert(position, {"ns": ns_ref, "name": name_ref, "raw": NO_INDEX,
+                                "value_type": value_type, "value": value})
+        for key in ("id_index", "class_index", "style_index"):
+            if node[key] > position:  # 1-based, 0 means none
+                node[key] += 1
+        self._write_element(element, node)
+
+    def value_text(self, value_type, value, raw):
+        if value_type == TYPE_STRING:
+            return self.pool.get(value)
+        if raw != NO_INDEX and value_type not in (TYPE_REFERENCE, TYPE_INT_BOOLEAN):
+            return self.pool.get(raw)
+        return format_value(value_type, value)
+
+    def to_element(self):
+        """Decode into an ElementTree element (namespaced attributes as {namespace}name)."""
+        root, stack = None, []
+        for index, chunk_type in enumerate(self.types):
+            if chunk_type == RES_XML_START_ELEMENT:
+                node = self.node(index)
+                element = ET.Element(self.string(node["name"]))
+                for attr in node["attrs"]:
+                    key = self.attribute_name(attr)
+                    if attr["ns"] != NO_INDEX:
+                        key = f"{{{self.string(attr['ns'])}}}{key}"
+                    element.set(key, self.value_text(attr["value_type"], attr["value"], attr["raw"]))
+                if stack:
+                    stack[-1].append(element)
+                else:
+                    root = element
+                stack.append(element)
+            elif chunk_type == RES_XML_END_ELEMENT and stack:
+                stack.pop()
+            elif chunk_type == RES_XML_CDATA and stack:
+                parent, text = stack[-1], self.string(self.node(index)["text"]) or ""
+                if len(parent):
+                    parent[-1].tail = (parent[-1].tail or "") + text
+                else:
+                    parent.text = (parent.text or "") + text
+        if root is None:
+            raise ValueError("binary XML without a root element")
+        return root
+
+    def to_text(self):
+        """Decode into indented text XML, android: prefixes and all."""
+        lines = ['<?xml version="1.0" encoding="utf-8"?>']
+        prefixes, declared = {}, set()
+        for index in self.elements():
+            for attr in self.node(index)["attrs"]:
+                uri = self.string(attr["ns"])
+                if uri is not None:
+                    prefixes.setdefault(uri, None)
+        for index, chunk_type in enumerate(self.types):
+            if chunk_type == RES_XML_START_NAMESPACE:
+                node = self.node(index)
+                uri, prefix = self.string(node["uri"]), self.string(node["prefix"])
+                if uri is not None and uri not in declared:
+                    prefixes[uri] = prefix or f"ns{len(declared)}"
+                    declared.add(uri)
+        # Namespaces used without a declaration (stripped by obfuscators) get one on the root
+        implicit = []
+        for uri, prefix in prefixes.items():
+            if prefix is None:
+                prefixes[uri] = "android" if uri == ANDROID_NS else f"ns{len(declared)}"
+                declared.add(uri)
+                implicit.append(uri)
+        depth, open_tag, pending = 0, False, []
+
+        def qualified(ns_ref, name):
+            uri = self.string(ns_ref)
+            return name if uri is None else f"{prefixes[uri]}:{name}"
+
+        for index, chunk_type in enumerate(self.types):
+            if chunk_type == RES_XML_START_NAMESPACE:
+                # Declared on the element that follows, redeclarations included
+                uri = self.string(self.node(index)["uri"])
+                if uri is not None and uri not in pending:
+                    pending.append(uri)
+            elif chunk_type == RES_XML_START_ELEMENT:
+                node = self.node(index)
+                if open_tag:
+                    lines[-1] += ">"
+                parts = [qualified(node["ns"], self.string(node["name"]))]
+                parts += [f"xmlns:{prefixes[uri]}={quoteattr(uri)}" for uri in pending + implicit]
+                pending, implicit = [], []
+                for attr in node["attrs"]:
+                    text = self.value_text(attr["value_type"], attr["value"], attr["raw"])
+                    parts.append(f"{qualified(attr['ns'], self.attribute_name(attr))}={quoteattr(text)}")
+                lines.append("    " * depth + "<" + " ".join(parts))
+                depth, open_tag = depth + 1, True
+            elif chunk_type == RES_XML_END_ELEMENT and depth:
+                node = self.node(index)
+                depth -= 1
+                if open_tag:
+                    lines[-1] += " />"
+                else:
+                    lines.append("    " * depth + f"</{qualified(node['ns'], self.string(node['name']))}>")
+                open_tag = False
+            elif chunk_type == RES_XML_CDATA and depth:
+                text = (self.string(self.node(index)["text"]) or "").strip()
+                if text:
+                    if open_tag:
+                        lines[-1] += ">"
+                        open_tag = False
+                    lines.append("    " * depth + escape(text))
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def from_element(cls, root):
+        """Encode an element tree of plain (un-namespaced) tags and attributes, like res/xml files."""
+        events = []
+
+        def visit(element):
+            if "{" in element.tag or any("{" in key for key in element.attrib):
+                raise ValueError("namespaced tags and attributes are not supported")
+            events.append(("start", element.tag, list(element.attrib.items())))
+            if element.text:
+                events.append(("text", element.text))
+            for child in element:
+                visit(child)
+                if child.tail:
+                    events.append(("text", child.tail))
+            events.append(("end", element.tag))
+
+        visit(root)
+        return cls._from_events(events)
+
+    @classmethod
+    def from_text(cls, text, template=None):
+        """
+        Encode text XML. Attribute resource ids and value types come from
+        template (the binary file the text was decoded from) when given,
+        then from ANDROID_ATTR_IDS and the text itself. The template's string
+        pool and resource map are kept as they are, so text that wasn't
+        edited encodes back to the template's bytes.
+        """
+        events, declared = [], []
+        parser = ET.XMLPullParser(events=("start", "end", "start-ns", "end-ns"))
+        parser.feed(text)
+        parser.close()
+        depth = 0
+        for event, item in parser.read_events():
+            if event == "start-ns":
+                declared.append(item)
+                events.append(("start-ns", *item))
+            elif event == "end-ns":
+                events.append(("end-ns", *declared.pop()))
+            elif event == "start":
+                events.append(("start", item.tag, list(item.attrib.items())))
+                if item.text:
+                    events.append(("text", item.text))
+                depth += 1
+            else:
+                events.append(("end", item.tag))
+                depth -= 1
+                if item.tail and depth:
+                    events.append(("text", item.tail))
+        return cls._from_events(events, template)
+
+    @classmethod
+    def _from_events(cls, events, template=None):
+        exact, hints = {}, {}
+        ids = {(ANDROID_NS, name): resource_id for name, resource_id in ANDROID_ATTR_IDS.items()}
+        doc = cls()
+        if template is not None:
+            # Start from the template's pool and resource map in their original
+            # order so unchanged text encodes back to the same bytes; strings
+            # the text adds are appended
+            doc.pool = StringPool(template.pool.to_bytes())
+            doc.resource_ids = array("I", template.resource_ids)
+            doc._resource_map_raw = template._resource_map_raw
+            for index in template.elements():
+                for attr in template.node(index)["attrs"]:
+                    key = (template.string(attr["ns"]), template.attribute_name(attr))
+                    if template.attribute_id(attr):
+                        ids[key] = template.attribute_id(attr)
+                    value_type, raw = attr["value_type"], template.string(attr["raw"])
+                    text = template.value_text(value_type, attr["value"], attr["raw"])
+                    exact.setdefault((*key, text), (value_type, attr["value"], raw))
+                    hints.setdefault(key, value_type)
+
+        # Names with a resource id go first, in id order, as the resource map
+        # covers the first N strings
+        mapped = sorted({
+            (ids[_split_name(key)], _split_name(key)[1])
+            for event in events if event[0] == "start"
+            for key, _ in event[2] if _split_name(key) in ids
+        })
+        known = {(resource_id, doc.pool.get(i)): i for i, resource_id in enumerate(doc.resource_ids)}
+        mapped_refs = {}
+        for resource_id, name in mapped:
+            if (resource_id, name) not in known:
+                known[resource_id, name] = doc.pool.insert(len(doc.resource_ids), name)
+                doc.resource_ids.append(resource_id)
+                doc._resource_map_raw = None
+            mapped_refs[resource_id, name] = known[resource_id, name]
+        # Other references reuse the template's strings past the mapped ones
+        strings = {}
+        for i in range(len(doc.resource_ids), len(doc.pool)):
+            strings.setdefault(doc.pool.get(i), i)
+
+        def ref(text):
+            if text is None:
+                return NO_INDEX
+            if text not in strings:
+                strings[text] = doc.pool.append(text)
+            return strings[text]
+
+        # Line numbers only show up in error messages, so the template's are
+        # reused in document order; our own count covers anything past them
+        template_lines = {}
+        if template is not None:
+            for index, chunk_type in enumerate(template.types):
+                if RES_XML_START_NAMESPACE <= chunk_type <= RES_XML_CDATA:
+                    template_lines.setdefault(chunk_type, []).append(
+                        struct.unpack_from("<I", template.chunk(index), 8)[0])
+        template_lines = {chunk_type: iter(found) for chunk_type, found in template_lines.items()}
+
+        def pack(chunk_type, line, body):
+            line = next(template_lines.get(chunk_type, iter(())), line)
+            doc._append(chunk_type, struct.pack("<HHIII", chunk_type, 16, 16 + len(body), line, NO_INDEX) + body)
+
+        doc._append(RES_STRING_POOL, b"")
+        doc._pool_index = 0
+        if doc.resource_ids or (template is not None and template._map_index is not None):
+            doc._append(RES_XML_RESOURCE_MAP, b"")
+            doc._map_index = 1
+        line, lines = 0, []
+        for event in events:
+            kind = event[0]
+            if kind in ("start-ns", "end-ns"):
+                chunk_type = RES_XML_START_NAMESPACE if kind == "start-ns" else RES_XML_END_NAMESPACE
+                pack(chunk_type, line + 1 if kind == "start-ns" else line,
+                     struct.pack("<II", ref(event[1] or None), ref(event[2])))
+            elif kind == "start":
+                line += 1
+                lines.append(line)
+                uri, name = _split_name(event[1])
+                attrs = []
+                for key, text in event[2]:
+                    attr_uri, attr_name = _split_name(key)
+                    resource_id = ids.get((attr_uri, attr_name), 0)
+                    if (attr_uri, attr_name, text) in exact:
+                        value_type, value, raw = exact[attr_uri, attr_name, text]
+                    else:
+                        value_type, value = parse_value(text, hints.get((attr_uri, attr_name)),
+                                                        numbers=attr_uri is not None)
+                        raw = text if value_type == TYPE_STRING or attr_uri is None else None
+                    if value_type == TYPE_STRING:
+                        value = raw = text
+                    name_ref = mapped_refs[resource_id, attr_name] if resource_id else ref(attr_name)
+                    attrs.append((resource_id or 0xFFFFFFFF, len(attrs), {
+                        "ns": ref(attr_uri), "name": name_ref, "raw": ref(raw),
+                        "value_type": value_type,
+                        "value": ref(value) if value_type == TYPE_STRING else value,
+                        "key": (attr_uri, attr_name),
+                    }))
+                # aapt keeps attributes sorted by resource id, plain ones last
+                attrs = [attr for _, _, attr in sorted(attrs, key=lambda a: a[:2])]
+
+                def position(wanted):
+                    return next((i + 1 for i, a in enumerate(attrs) if a["key"] == wanted), 0)
+
+                body = struct.pack("<IIHHHHHH", ref(uri), ref(name), 20, 20, len(attrs),
+                                   position((ANDROID_NS, "id")), position((None, "class")),
+                                   position((None, "style")))
+                body += b"".join(
+                    struct.pack("<IIIHBBI", a["ns"], a["name"], a["raw"], 8, 0, a["value_type"], a["value"])
+                    for a in attrs
+                )
+                pack(RES_XML_START_ELEMENT, line, body)
+            elif kind == "end":
+                uri, name = _split_name(event[1])
+                pack(RES_XML_END_ELEMENT, lines.pop(), struct.pack("<II", ref(uri), ref(name)))
+            elif event[1].strip():
+                pack(RES_XML_CDATA, line, struct.pack("<IHBBI", ref(event[1].strip()), 8, 0, 0, 0))
+        return doc
+
+    def _resource_map(self):
+        if self._resource_map_raw is not None:
+            return self._resource_map_raw
+        return struct.pack("<HHI", RES_XML_RESOURCE_MAP, 8, 8 + 4 * len(self.resource_ids)) + _u32_bytes(
+            self.resource_ids
+        )
+
+    def to_bytes(self):
+        missing_map = self._map_index is None and len(self.resource_ids) > 0
+        chunks = []
+        if self._pool_index is None:
+            chunks.append(self.pool.to_bytes())
+            if missing_map:
+                chunks.append(self._resource_map())
+        for index in range(len(self.types)):
+            if index == self._pool_index:
+                chunks.append(self.pool.to_bytes())
+                if missing_map:
+                    chunks.append(self._resource_map())
+            elif index == self._map_index:
+                chunks.append(self._resource_map())
+            else:
+                chunks.append(self.chunk(index))
+        chunks.append(self.trailer)
+        header = bytearray(self.header)
+        struct.pack_into("<I", header, 4, len(header) + sum(len(chunk) for chunk in chunks))
+        return bytes(header) + b"".join(chunks)
+
+
+def run_java(jar, args, **kwargs):
+    """java -jar, through the persistent JVM helper when it is running"""
+    if run_jar is not None:
+        return run_jar(jar, args, **kwargs)
+    return subprocess.run(["java", "-jar", jar, *args], **kwargs)
+
 def get_file_path():
     """Ask user for AndroidManifest.xml path and set all paths accordingly."""
     while True:
@@ -12,15 +881,15 @@ def get_file_path():
             print(f"Error: File not found at {input_path}")
             continue
         
-        base_dir = os.path.dirname(input_path)
+        base_dir = os.path.dirname(os.path.abspath(input_path))
         file_name = os.path.basename(input_path)
         
         # Set all paths based on user input
         global INPUT_AXML, OUTPUT_XML, RECOMPILED_AXML, FINAL_AXML
-        INPUT_AXML = input_path
+        INPUT_AXML = os.path.abspath(input_path)
         OUTPUT_XML = os.path.join(base_dir, f"{os.path.splitext(file_name)[0]}_decoded.xml")
         RECOMPILED_AXML = os.path.join(base_dir, f"{os.path.splitext(file_name)[0]}_recompiled.xml")
-        FINAL_AXML = input_path  # Original path will be overwritten
+        FINAL_AXML = INPUT_AXML  # Original path will be overwritten
         
         return True
 
@@ -31,23 +900,74 @@ def check_jar():
         return False
     return True
 
+# The original binary, kept in memory after decoding: recompiling takes
+# attribute ids and value types from it. None when axml2xml.jar decoded it.
+TEMPLATE = None
+
+def delete_original():
+    try:
+        os.remove(INPUT_AXML)
+        print(f"Deleted original {INPUT_AXML}")
+    except OSError as e:
+        print(f"Error deleting {INPUT_AXML}: {e}")
+
 def decompile_axml():
+    """Decompile AndroidManifest.xml to XML in-process and delete original."""
+    global TEMPLATE
+    print(f"Decompiling {INPUT_AXML} to {OUTPUT_XML}...")
+    try:
+        with open(INPUT_AXML, "rb") as f:
+            data = f.read()
+        text = AxmlDocument(data).to_text()
+    except (ValueError, struct.error, IndexError) as e:
+        print(f"Built-in decoder failed ({e}), trying axml2xml.jar...")
+        return check_jar() and decompile_axml_jar()
+    with open(OUTPUT_XML, "w", encoding="utf-8") as f:
+        f.write(text)
+    TEMPLATE = data
+    print(f"Successfully decompiled to {OUTPUT_XML}")
+    # Delete the original AndroidManifest.xml
+    delete_original()
+    return True
+
+def recompile_xml():
+    """Recompile XML to AXML and rename to original AndroidManifest.xml path."""
+    if TEMPLATE is None:
+        return check_jar() and recompile_xml_jar()
+    print(f"Recompiling {OUTPUT_XML} to {RECOMPILED_AXML}...")
+    try:
+        with open(OUTPUT_XML, encoding="utf-8") as f:
+            data = AxmlDocument.from_text(f.read(), AxmlDocument(TEMPLATE)).to_bytes()
+    except (ValueError, ET.ParseError) as e:
+        print(f"Error recompiling: {e}")
+        return False
+    with open(RECOMPILED_AXML, "wb") as f:
+        f.write(data)
+    print(f"Successfully recompiled to {RECOMPILED_AXML}")
+    return rename_recompiled()
+
+def rename_recompiled():
+    # Rename recompiled file to original path
+    try:
+        os.rename(RECOMPILED_AXML, FINAL_AXML)
+        print(f"Renamed {RECOMPILED_AXML} to {FINAL_AXML}")
+        return True
+    except OSError as e:
+        print(f"Error renaming {RECOMPILED_AXML} to {FINAL_AXML}: {e}")
+        return False
+
+def decompile_axml_jar():
     """Decompile AndroidManifest.xml to XML using axml2xml.jar and delete original."""
     try:
-        print(f"Decompiling {INPUT_AXML} to {OUTPUT_XML}...")
-        result = subprocess.run(
-            ["java", "-jar", JAR_PATH, "d", INPUT_AXML, OUTPUT_XML],
+        result = run_java(
+            JAR_PATH, ["d", INPUT_AXML, OUTPUT_XML],
             capture_output=True,
             text=True
         )
         if result.returncode == 0:
             print(f"Successfully decompiled to {OUTPUT_XML}")
             # Delete the original AndroidManifest.xml
-            try:
-                os.remove(INPUT_AXML)
-                print(f"Deleted original {INPUT_AXML}")
-            except OSError as e:
-                print(f"Error deleting {INPUT_AXML}: {e}")
+            delete_original()
             return True
         else:
             print(f"Error decompiling: {result.stderr}")
@@ -56,25 +976,18 @@ def decompile_axml():
         print(f"Error running decompile command: {e}")
         return False
 
-def recompile_xml():
-    """Recompile XML to AXML and rename to original AndroidManifest.xml path."""
+def recompile_xml_jar():
+    """Recompile XML to AXML using axml2xml.jar and rename to original AndroidManifest.xml path."""
     try:
         print(f"Recompiling {OUTPUT_XML} to {RECOMPILED_AXML}...")
-        result = subprocess.run(
-            ["java", "-jar", JAR_PATH, "e", OUTPUT_XML, RECOMPILED_AXML],
+        result = run_java(
+            JAR_PATH, ["e", OUTPUT_XML, RECOMPILED_AXML],
             capture_output=True,
             text=True
         )
         if result.returncode == 0:
             print(f"Successfully recompiled to {RECOMPILED_AXML}")
-            # Rename recompiled file to original path
-            try:
-                os.rename(RECOMPILED_AXML, FINAL_AXML)
-                print(f"Renamed {RECOMPILED_AXML} to {FINAL_AXML}")
-                return True
-            except OSError as e:
-                print(f"Error renaming {RECOMPILED_AXML} to {FINAL_AXML}: {e}")
-                return False
+            return rename_recompiled()
         else:
             print(f"Error recompiling: {result.stderr}")
             return False
@@ -83,10 +996,6 @@ def recompile_xml():
         return False
 
 def main():
-    # Check if JAR exists
-    if not check_jar():
-        return
-
     # Get AndroidManifest.xml path from user
     if not get_file_path():
         return
@@ -117,4 +1026,4 @@ def main():
             print("Invalid input. Please enter 'y' or 'n'.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
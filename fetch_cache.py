@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Shared resource cache for WeasyPrint renders.
+
+Remote (http/https) fonts, images and stylesheets referenced by a document are
+fetched once per process (in memory) and once per REMOTE_MAX_AGE (on disk),
+instead of once per document. Local files are read directly: copying them into
+the cache would gain nothing. The disk cache is capped at MAX_DISK_BYTES, oldest
+entries first.
+
+Usage:
+    from fetch_cache import CachedURLFetcher
+    fetcher = CachedURLFetcher()
+    HTML(filename=..., url_fetcher=fetcher).write_pdf(..., cache=fetcher.image_cache)
+"""
+
+import os
+import json
+import time
+import hashlib
+from urllib.parse import urlparse
+
+CACHE_DIR = os.path.expanduser("~/.cache/weasyprint-fetch")
+REMOTE_MAX_AGE = 7 * 24 * 3600  # seconds before a remote resource is fetched again
+MAX_DISK_BYTES = 64 * 1024 * 1024  # total on-disk cache size before old entries are evicted
+
+
+class CachedURLFetcher:
+    """Drop-in url_fetcher for weasyprint.HTML / CSS"""
+
+    def __init__(self, cache_dir=CACHE_DIR, remote_max_age=REMOTE_MAX_AGE, max_disk_bytes=MAX_DISK_BYTES):
+        self.cache_dir = cache_dir
+        self.remote_max_age = remote_max_age
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = {}
+        # Passed to write_pdf(cache=...) so decoded images are reused too
+        self.image_cache = {}
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _cache_key(self, url):
+        """Cache key for url; None means fetch it directly"""
+        if urlparse(url).scheme in ("http", "https"):
+            return url
+        return None  # local files and data: URLs are cheaper to read than to cache
+
+    def _disk_paths(self, key):
+        name = hashlib.sha256(key.encode()).hexdigest()
+        base = os.path.join(self.cache_dir, name)
+        return base + ".bin", base + ".json"
+
+    def _load_disk(self, key):
+        data_path, meta_path = self._disk_paths(key)
+        try:
+            if time.time() - os.path.getmtime(meta_path) > self.remote_max_age:
+                return None
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(data_path, "rb") as f:
+                meta["string"] = f.read()
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    def _prune_disk(self, incoming):
+        """Drop expired entries, then the oldest ones until incoming bytes fit"""
+        entries = []
+        total = 0
+        now = time.time()
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    base = entry.path[:-len(".json")]
+                    try:
+                        mtime = entry.stat().st_mtime
+                        size = os.path.getsize(base + ".bin")
+                    except OSError:
+                        size = 0
+                        mtime = 0  # orphaned metadata goes first
+                    entries.append((mtime, size, base))
+                    total += size
+        except OSError:
+            return
+        entries.sort()
+        for mtime, size, base in entries:
+            if now - mtime <= self.remote_max_age and total + incoming <= self.max_disk_bytes:
+                break
+            for path in (base + ".json", base + ".bin"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
+    def _save_disk(self, key, result):
+        if len(result["string"]) > self.max_disk_bytes:
+            return
+        self._prune_disk(len(result["string"]))
+        data_path, meta_path = self._disk_paths(key)
+        meta = {k: v for k, v in result.items() if k != "string"}
+        try:
+            with open(data_path + ".tmp", "wb") as f:
+                f.write(result["string"])
+            os.replace(data_path + ".tmp", data_path)
+            # Metadata last: its presence marks the entry complete
+            with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(meta_path + ".tmp", meta_path)
+        except OSError:
+            pass  # cache is best-effort
+
+    def __call__(self, url, *args, **kwargs):
+        from weasyprint import default_url_fetcher
+
+        key = self._cache_key(url)
+        if key is None:
+            return default_url_fetcher(url, *args, **kwargs)
+
+        cached = self.memory.get(key)
+        if cached is None:
+            cached = self._load_disk(key)
+            if cached is not None:
+                self.memory[key] = cached
+        if cached is not None:
+            self.hits += 1
+            return dict(cached)
+
+        self.misses += 1
+        result = default_url_fetcher(url, *args, **kwargs)
+        if "file_obj" in result:
+            file_obj = result.pop("file_obj")
+            try:
+                result["string"] = file_obj.read()
+            finally:
+                file_obj.close()
+        if isinstance(result.get("string"), str):
+            encoding = result.get("encoding") or "utf-8"
+            result["string"] = result["string"].encode(encoding)
+            result["encoding"] = encoding
+        entry = {k: v for k, v in result.items()
+                 if k in ("string", "mime_type", "encoding", "redirected_url", "filename")}
+        self.memory[key] = entry
+        self._save_disk(key, entry)
+        return dict(entry)
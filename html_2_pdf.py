@@ -8,6 +8,26 @@ import os
 from pathlib import Path
 import time
 import sys
+import re
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse, unquote
+
+try:
+    from fetch_cache import CachedURLFetcher
+except ImportError:  # running without the helper module next to this script
+    CachedURLFetcher = None
+
+MANIFEST_NAME = ".build_manifest.json"
+# src/href attributes plus CSS url(...) and @import "..." (inline or in linked stylesheets)
+ASSET_REF_RE = re.compile(
+    r"""(?:src|href)\s*=\s*["']([^"']+)["']"""
+    r"""|url\(\s*["']?([^"')\s]+)["']?\s*\)"""
+    r"""|@import\s+["']([^"']+)["']""",
+    re.IGNORECASE,
+)
 
 def get_weasyprint_css():
     """CSS with A4 layout, page-break control + aggressive long-line breaking"""
@@ -90,7 +110,97 @@ def get_weasyprint_css():
     """
 
 
-def convert_html_to_pdf():
+# Stylesheet and resource cache set up once per process (see init_render_worker)
+_worker_css = None
+_worker_fetcher = None
+
+
+def init_render_worker():
+    """Compile the shared CSS once in this process instead of once per file"""
+    global _worker_css, _worker_fetcher
+    from weasyprint import CSS
+    _worker_css = CSS(string=get_weasyprint_css())
+    if CachedURLFetcher is not None:
+        _worker_fetcher = CachedURLFetcher()
+
+
+def render_html_file(task):
+    """Render one (html_path, pdf_path) pair. Returns (ok, size_kb or error text)."""
+    from weasyprint import HTML
+    html_path, pdf_path = task
+    try:
+        if _worker_fetcher is not None:
+            HTML(filename=str(html_path), url_fetcher=_worker_fetcher).write_pdf(
+                target=str(pdf_path),
+                stylesheets=[_worker_css],
+                cache=_worker_fetcher.image_cache
+            )
+        else:
+            HTML(filename=str(html_path)).write_pdf(
+                target=str(pdf_path),
+                stylesheets=[_worker_css]
+            )
+        return True, pdf_path.stat().st_size / 1024
+    except Exception as e:
+        return False, f"{type(e).__name__}: {str(e)}"
+
+
+def file_digest(path, cache):
+    """sha256 of a file, memoised for assets shared by many pages"""
+    if path not in cache:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        cache[path] = h.hexdigest()
+    return cache[path]
+
+
+def source_fingerprint(html_path, css_digest, asset_cache):
+    """Hash of the HTML, every local image/stylesheet it references (and what those
+    stylesheets pull in through url()/@import), and the CSS"""
+    data = html_path.read_bytes()
+    h = hashlib.sha256(css_digest.encode())
+    h.update(data)
+    seen = set()
+    pending = [(html_path.parent, data.decode("utf-8", "replace"))]
+    while pending:
+        base, text = pending.pop()
+        refs = {next(r for r in groups if r) for groups in ASSET_REF_RE.findall(text)}
+        for ref in sorted(refs):
+            parsed = urlparse(ref)
+            if parsed.scheme not in ("", "file") or not parsed.path:
+                continue
+            asset = Path(unquote(parsed.path))
+            if parsed.scheme == "":
+                asset = base / asset
+            # Links to other pages aren't rendered into this PDF
+            if asset in seen or asset.suffix.lower() in (".html", ".htm") or not asset.is_file():
+                continue
+            seen.add(asset)
+            h.update(ref.encode())
+            h.update(file_digest(asset, asset_cache).encode())
+            if asset.suffix.lower() == ".css":
+                pending.append((asset.parent, asset.read_text("utf-8", "replace")))
+    return h.hexdigest()
+
+
+def load_manifest(pdf_dir):
+    try:
+        with open(pdf_dir / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(pdf_dir, manifest):
+    tmp_path = pdf_dir / (MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, pdf_dir / MANIFEST_NAME)
+
+
+def convert_html_to_pdf(jobs=1, force=False):
     html_dir = Path("downloaded_html_fixed")
     pdf_dir = Path("pdf_output")
 
@@ -113,7 +223,7 @@ def convert_html_to_pdf():
     print("=" * 70)
 
     try:
-        from weasyprint import HTML, CSS
+        import weasyprint  # noqa: F401
     except ImportError:
         print("❌ WeasyPrint not installed.")
         print("   Run:  pip install weasyprint")
@@ -123,42 +233,179 @@ def convert_html_to_pdf():
     successful = 0
     failed = 0
 
-    custom_css = CSS(string=get_weasyprint_css())
+    # Incremental build: only render sources whose fingerprint changed
+    old_manifest = load_manifest(pdf_dir)
+    manifest = {}
+    css_digest = hashlib.sha256(get_weasyprint_css().encode()).hexdigest()
+    asset_cache = {}
+    fingerprints = {}
+    tasks = []
+    for html_path in html_files:
+        pdf_path = pdf_dir / (html_path.stem + ".pdf")
+        fingerprint = source_fingerprint(html_path, css_digest, asset_cache)
+        previous = old_manifest.get(html_path.name)
+        if not force and pdf_path.exists() and previous and previous.get("hash") == fingerprint:
+            manifest[html_path.name] = previous
+            continue
+        fingerprints[html_path.name] = fingerprint
+        tasks.append((html_path, pdf_path))
+    skipped = len(html_files) - len(tasks)
+
+    # Garbage-collect PDFs we built from sources that no longer exist
+    removed = 0
+    for name, entry in old_manifest.items():
+        if name in manifest or (html_dir / name).exists():
+            continue
+        stale_pdf = pdf_dir / entry.get("pdf", "")
+        if entry.get("pdf") and stale_pdf.exists():
+            stale_pdf.unlink()
+            print(f"🗑  Removed stale {stale_pdf.name} (source {name} is gone)")
+            removed += 1
+
+    if skipped:
+        print(f"Up to date: {skipped} file(s) unchanged since last build")
+    if tasks:
+        print(f"Rendering {len(tasks)} changed file(s)")
+    print("=" * 70)
 
-    for i, html_path in enumerate(html_files, 1):
-        pdf_name = html_path.stem + ".pdf"
-        pdf_path = pdf_dir / pdf_name
+    def report(i, task, result):
+        nonlocal successful, failed
+        html_path, pdf_path = task
+        ok, detail = result
+        print(f"[{i:2d}/{len(tasks)}]  {html_path.name} → {pdf_path.name}")
+        if ok:
+            print(f"      ✓ Success  ({detail:6.1f} KB)")
+            successful += 1
+            manifest[html_path.name] = {"hash": fingerprints[html_path.name], "pdf": pdf_path.name}
+        else:
+            print(f"      ✗ Failed   {detail}")
+            failed += 1
 
-        print(f"[{i:2d}/{len(html_files)}]  {html_path.name} → {pdf_name}")
+    try:
+        if jobs > 1:
+            print(f"Rendering with {jobs} worker processes")
+            # map() yields in submission order, so progress lines stay ordered
+            with ProcessPoolExecutor(max_workers=jobs, initializer=init_render_worker) as pool:
+                for i, (task, result) in enumerate(zip(tasks, pool.map(render_html_file, tasks)), 1):
+                    report(i, task, result)
+        else:
+            init_render_worker()
+            for i, task in enumerate(tasks, 1):
+                report(i, task, render_html_file(task))
+
+                if i < len(tasks):
+                    time.sleep(0.4)
+    finally:
+        # Failed or never-reached sources keep their old entry: the stale hash
+        # makes them render next time, and their PDF stays tracked for cleanup
+        for html_path, _ in tasks:
+            if html_path.name not in manifest and html_path.name in old_manifest:
+                manifest[html_path.name] = old_manifest[html_path.name]
+        # Saved even on a crashed worker or Ctrl+C so finished renders aren't redone
+        save_manifest(pdf_dir, manifest)
 
-        try:
-            HTML(filename=str(html_path)).write_pdf(
-                target=str(pdf_path),
-                stylesheets=[custom_css]
-            )
+    print("=" * 70)
+    print("Conversion summary:")
+    print(f"  Successful : {successful:3d}")
+    print(f"  Failed     : {failed:3d}")
+    print(f"  Unchanged  : {skipped:3d}")
+    if removed:
+        print(f"  Removed    : {removed:3d}")
+    print(f"  Total      : {successful + failed + skipped:3d}")
+    if successful > 0:
+        print(f"\nAll PDFs saved to: {pdf_dir.absolute()}")
+    return successful + skipped > 0
 
-            size_kb = pdf_path.stat().st_size / 1024
-            print(f"      ✓ Success  ({size_kb:6.1f} KB)")
-            successful += 1
 
+def convert_html_to_single_pdf(output_name="combined.pdf"):
+    """
+    Render every HTML file and write all pages as ONE PDF, with a top-level
+    bookmark per source file (headings nest under it). Replaces the
+    per-file PDFs + pdf_merge.py pass.
+    """
+    html_dir = Path("downloaded_html_fixed")
+    pdf_dir = Path("pdf_output")
+
+    html_files = sorted(html_dir.glob("*.html")) if html_dir.exists() else []
+    if not html_files:
+        print("❌ No .html files found in downloaded_html_fixed/")
+        return False
+
+    try:
+        from weasyprint import HTML
+    except ImportError:
+        print("❌ WeasyPrint not installed.")
+        print("   Run:  pip install weasyprint")
+        return False
+
+    pdf_dir.mkdir(exist_ok=True)
+    pdf_path = pdf_dir / output_name
+    print(f"Rendering {len(html_files)} HTML files into {pdf_path}")
+    print("=" * 70)
+
+    init_render_worker()
+    render_options = {"stylesheets": [_worker_css]}
+    if _worker_fetcher is not None:
+        render_options["cache"] = _worker_fetcher.image_cache
+
+    documents = []
+    all_pages = []
+    failed = 0
+    for i, html_path in enumerate(html_files, 1):
+        print(f"[{i:2d}/{len(html_files)}]  {html_path.name}")
+        try:
+            if _worker_fetcher is not None:
+                html = HTML(filename=str(html_path), url_fetcher=_worker_fetcher)
+            else:
+                html = HTML(filename=str(html_path))
+            document = html.render(**render_options)
         except Exception as e:
             print(f"      ✗ Failed   {type(e).__name__}: {str(e)}")
             failed += 1
+            continue
+        if not document.pages:
+            continue
 
-        if i < len(html_files):
-            time.sleep(0.4)
+        # Nest the document's own heading bookmarks under one entry for the file
+        for page in document.pages:
+            page.bookmarks = [(level + 1, *rest) for level, *rest in page.bookmarks]
+        document.pages[0].bookmarks.insert(0, (1, html_path.stem, (0, 0), "closed"))
+
+        print(f"      ✓ Rendered ({len(document.pages)} pages)")
+        documents.append(document)
+        all_pages.extend(document.pages)
+
+    if not documents:
+        print("\nNo files were rendered successfully.")
+        return False
 
     print("=" * 70)
+    print(f"Writing {len(all_pages)} pages...")
+    documents[0].copy(all_pages).write_pdf(target=str(pdf_path))
+
+    size_kb = pdf_path.stat().st_size / 1024
     print("Conversion summary:")
-    print(f"  Successful : {successful:3d}")
+    print(f"  Rendered   : {len(documents):3d}")
     print(f"  Failed     : {failed:3d}")
-    print(f"  Total      : {successful + failed:3d}")
-    if successful > 0:
-        print(f"\nAll PDFs saved to: {pdf_dir.absolute()}")
-    return successful > 0
+    print(f"  Pages      : {len(all_pages):3d}")
+    print(f"\nCombined PDF saved to: {pdf_path.absolute()}  ({size_kb:.1f} KB)")
+    return True
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Convert downloaded HTML files to PDF.")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Render N files in parallel worker processes (default: 1)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render every file, ignoring the build manifest")
+    parser.add_argument("--combine", nargs="?", const="combined.pdf", metavar="NAME",
+                        help="Write all pages into one PDF with a bookmark per file "
+                             "(default name: combined.pdf)")
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
     print("HTML → PDF Converter   (A4 + smart breaks + long-line wrapping)")
     print("=" * 70)
 
@@ -170,7 +417,10 @@ def main():
 
     print("\nThis will convert all HTML files in:")
     print(f"  {html_dir.absolute()}")
-    print(f"  → PDF files in pdf_output/\n")
+    if args.combine:
+        print(f"  → one PDF: pdf_output/{args.combine}\n")
+    else:
+        print(f"  → PDF files in pdf_output/\n")
 
     answer = input("Proceed? [y/N]: ").strip().lower()
     if answer not in ('y', 'yes'):
@@ -179,7 +429,10 @@ def main():
 
     print("\nStarting conversion...\n")
     try:
-        success = convert_html_to_pdf()
+        if args.combine:
+            success = convert_html_to_single_pdf(args.combine)
+        else:
+            success = convert_html_to_pdf(jobs=max(1, args.jobs), force=args.force)
         if not success:
             print("\nNo files were converted successfully.")
     except KeyboardInterrupt:
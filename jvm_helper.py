@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+"""
+Persistent JVM for the jar tools used by ssl.py, KCS.py and AXML.py.
+
+Every `java -jar APKEditor.jar ...` pays JVM start-up and JIT warm-up again,
+which takes seconds on a phone, and patching one APK runs APKEditor three or
+four times. This keeps a single JVM running (nailgun style) and sends it
+commands over a loopback socket, so the jar's classes stay loaded and
+compiled between calls.
+
+    python jvm_helper.py start | stop | status
+    python jvm_helper.py benchmark [--runs N] JAR [ARGS...]
+
+run_jar() uses the server when it is running and falls back to a plain
+`java -jar` subprocess when it isn't, so callers work either way.
+The server shares one working directory between callers: pass absolute paths.
+
+Jar runs inside the server are serialized: the tools write to the global
+System.out/System.err, which the server redirects per call. A caller that
+finds the JVM busy for longer than BUSY_WAIT_MS (for example a parallel
+ssl.py --jobs worker) gets a plain subprocess instead of queueing, so batch
+workers still run concurrently, only one of them in the warm JVM.
+"""
+
+import os
+import sys
+import time
+import socket
+import struct
+import hashlib
+import secrets
+import subprocess
+
+HELPER_DIR = os.path.expanduser("~/.cache/jvm-helper")
+PORT_FILE = os.path.join(HELPER_DIR, "port")
+TOKEN_FILE = os.path.join(HELPER_DIR, "token")
+LOG_FILE = os.path.join(HELPER_DIR, "server.log")
+JAVA = "java"
+START_TIMEOUT = 60  # seconds to wait for the server to come up
+CONNECT_TIMEOUT = 2  # seconds for connect, PING/STOP replies
+READY_TIMEOUT = 10  # seconds to wait for the server to take a RUN before using a subprocess
+
+# Set to False to always spawn a fresh JVM (used by benchmarks)
+USE_SERVER = True
+
+# Frame types sent by the server: stdout/stderr chunks, exit status,
+# "can't run this jar in-process / busy" (caller falls back to a subprocess),
+# or "ready for the RUN request"
+FRAME_OUT, FRAME_ERR, FRAME_EXIT, FRAME_UNSUPPORTED, FRAME_READY = 1, 2, 3, 4, 5
+
+JAVA_SOURCE = r"""
+import java.io.*;
+import java.lang.reflect.*;
+import java.net.*;
+import java.nio.charset.StandardCharsets;
+import java.security.Permission;
+import java.util.*;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.locks.ReentrantLock;
+import java.util.jar.JarFile;
+
+/** Long-lived JVM that runs jar tools for jvm_helper.py. */
+public class JvmHelper {
+    static final int OUT = 1, ERR = 2, EXIT = 3, UNSUPPORTED = 4, READY = 5;
+    // A client has this long to send its request; lengths it sends are capped
+    static final int HANDSHAKE_MS = 5000, BUSY_WAIT_MS = 2000;
+    static final int MAX_STRING = 1 << 20, MAX_ARGS = 4096;
+
+    static volatile boolean trapping = false;
+    static volatile boolean stopping = false;
+    static boolean canTrapExit = false;
+    static PrintStream realOut, realErr;
+    // One jar at a time: System.out/err are process-wide
+    static final ReentrantLock runLock = new ReentrantLock();
+    // canonical jar path -> {Long mtime, Class main class}, guarded by runLock
+    static final Map<String, Object[]> mainClasses = new HashMap<String, Object[]>();
+
+    static class ExitTrap extends SecurityException {
+        final int status;
+        ExitTrap(int status) { super("System.exit(" + status + ")"); this.status = status; }
+    }
+
+    /** Forwards writes to the client as framed chunks. */
+    static class FrameStream extends OutputStream {
+        final DataOutputStream out;
+        final int type;
+        FrameStream(DataOutputStream out, int type) { this.out = out; this.type = type; }
+        public void write(int b) throws IOException { write(new byte[] {(byte) b}, 0, 1); }
+        public void write(byte[] b, int off, int len) throws IOException {
+            synchronized (out) {
+                out.writeByte(type);
+                out.writeInt(len);
+                out.write(b, off, len);
+            }
+        }
+        public void flush() throws IOException { synchronized (out) { out.flush(); } }
+    }
+
+    public static void main(String[] args) throws Exception {
+        File portFile = new File(args[0]);
+        String token = args[1];
+        try {
+            // Lets tools that end with System.exit() run in-process (JDK 23 and older)
+            System.setSecurityManager(new SecurityManager() {
+                public void checkPermission(Permission perm) {}
+                public void checkPermission(Permission perm, Object context) {}
+                public void checkExit(int status) {
+                    if (trapping) throw new ExitTrap(status);
+                }
+            });
+            canTrapExit = true;
+        } catch (Throwable t) {
+            // Security manager removed or disabled: only execute(String[]) entry points
+        }
+
+        ServerSocket server = new ServerSocket(0, 50, InetAddress.getLoopbackAddress());
+        File tmp = new File(portFile.getPath() + ".tmp");
+        Writer w = new OutputStreamWriter(new FileOutputStream(tmp), StandardCharsets.UTF_8);
+        w.write(server.getLocalPort() + "\n");
+        w.close();
+        tmp.renameTo(portFile);
+
+        realOut = System.out;
+        realErr = System.err;
+        // Each connection gets its own thread, so a stalled client or a long
+        // jar run doesn't keep PING/STOP (or the busy reply) from being answered
+        while (!stopping) {
+            final Socket socket;
+            try {
+                socket = server.accept();
+            } catch (IOException e) {
+                if (stopping) break;
+                throw e;
+            }
+            final String expected = token;
+            final ServerSocket listener = server;
+            Thread worker = new Thread(new Runnable() {
+                public void run() {
+                    try {
+                        if (!handle(socket, expected)) {
+                            stopping = true;
+                            listener.close();
+                        }
+                    } catch (Throwable t) {
+                        t.printStackTrace(realErr);
+                    } finally {
+                        try { socket.close(); } catch (IOException e) {}
+                    }
+                }
+            });
+            worker.setDaemon(true);
+            worker.start();
+        }
+        try { server.close(); } catch (IOException e) {}
+        portFile.delete();
+        System.exit(0);
+    }
+
+    static String readString(DataInputStream in) throws IOException {
+        int length = in.readInt();
+        if (length < 0 || length > MAX_STRING) {
+            throw new IOException("bad string length " + length);
+        }
+        byte[] data = new byte[length];
+        in.readFully(data);
+        return new String(data, StandardCharsets.UTF_8);
+    }
+
+    static void sendFrame(DataOutputStream out, int type) throws IOException {
+        synchronized (out) {
+            out.writeByte(type);
+            out.writeInt(0);
+            out.flush();
+        }
+    }
+
+    static void sendExit(DataOutputStream out, int status) throws IOException {
+        synchronized (out) {
+            out.writeByte(EXIT);
+            out.writeInt(4);
+            out.writeInt(status);
+            out.flush();
+        }
+    }
+
+    static Class<?> mainClass(String jarPath) throws Exception {
+        File jar = new File(jarPath).getCanonicalFile();
+        Object[] cached = (Object[]) mainClasses.get(jar.getPath());
+        if (cached != null && ((Long) cached[0]).longValue() == jar.lastModified()) {
+            return (Class<?>) cached[1];
+        }
+        JarFile jarFile = new JarFile(jar);
+        String name;
+        try {
+            name = jarFile.getManifest().getMainAttributes().getValue("Main-Class");
+        } finally {
+            jarFile.close();
+        }
+        URLClassLoader loader = new URLClassLoader(new URL[] {jar.toURI().toURL()},
+                                                   ClassLoader.getSystemClassLoader().getParent());
+        Class<?> cls = Class.forName(name.trim(), true, loader);
+        mainClasses.put(jar.getPath(), new Object[] {Long.valueOf(jar.lastModified()), cls});
+        return cls;
+    }
+
+    static boolean handle(Socket socket, String token) throws Exception {
+        socket.setSoTimeout(HANDSHAKE_MS);
+        DataInputStream in = new DataInputStream(new BufferedInputStream(socket.getInputStream()));
+        DataOutputStream out = new DataOutputStream(new BufferedOutputStream(socket.getOutputStream()));
+        if (!token.equals(readString(in))) {
+            return true;
+        }
+        String command = readString(in);
+        if (command.equals("STOP")) {
+            sendExit(out, 0);
+            return false;
+        }
+        if (command.equals("PING")) {
+            sendExit(out, 0);
+            return true;
+        }
+
+        // Busy with another jar: tell the client to use its own subprocess
+        if (!runLock.tryLock(BUSY_WAIT_MS, TimeUnit.MILLISECONDS)) {
+            sendFrame(out, UNSUPPORTED);
+            return true;
+        }
+        try {
+            // The request is only sent after READY, so a client that gave up
+            // waiting can't have its job run here as well as in its fallback
+            sendFrame(out, READY);
+            return run(in, out);
+        } finally {
+            System.setOut(realOut);
+            System.setErr(realErr);
+            runLock.unlock();
+        }
+    }
+
+    static boolean run(DataInputStream in, DataOutputStream out) throws Exception {
+        String jar = readString(in);
+        int argc = in.readInt();
+        if (argc < 0 || argc > MAX_ARGS) {
+            throw new IOException("bad argument count " + argc);
+        }
+        String[] argv = new String[argc];
+        for (int i = 0; i < argv.length; i++) {
+            argv[i] = readString(in);
+        }
+
+        Class<?> cls = mainClass(jar);
+        // Tools like APKEditor expose "static int execute(String[])" next to a
+        // main() that calls System.exit(); prefer it so the JVM survives
+        Method execute = null;
+        try {
+            execute = cls.getMethod("execute", String[].class);
+            if (!Modifier.isStatic(execute.getModifiers()) || execute.getReturnType() != int.class) {
+                execute = null;
+            }
+        } catch (NoSuchMethodException e) {
+        }
+        if (execute == null && !canTrapExit) {
+            sendFrame(out, UNSUPPORTED);
+            return true;
+        }
+        Method main = execute != null ? execute : cls.getMethod("main", String[].class);
+
+        PrintStream stdout = new PrintStream(new FrameStream(out, OUT), true, "UTF-8");
+        PrintStream stderr = new PrintStream(new FrameStream(out, ERR), true, "UTF-8");
+        System.setOut(stdout);
+        System.setErr(stderr);
+        Thread.currentThread().setContextClassLoader(cls.getClassLoader());
+        int status = 0;
+        trapping = true;
+        try {
+            Object result = main.invoke(null, new Object[] {argv});
+            if (execute != null) {
+                status = ((Integer) result).intValue();
+            }
+        } catch (InvocationTargetException e) {
+            Throwable cause = e.getCause();
+            if (cause instanceof ExitTrap) {
+                status = ((ExitTrap) cause).status;
+            } else {
+                cause.printStackTrace();
+                status = 1;
+            }
+        } finally {
+            trapping = false;
+            stdout.flush();
+            stderr.flush();
+        }
+        sendExit(out, status);
+        return true;
+    }
+}
+"""
+
+
+def _source_dir():
+    digest = hashlib.sha256(JAVA_SOURCE.encode()).hexdigest()[:12]
+    return os.path.join(HELPER_DIR, f"classes-{digest}")
+
+
+def _read_connection_info():
+    try:
+        with open(PORT_FILE, "r", encoding="utf-8") as f:
+            port = int(f.read().strip())
+        with open(TOKEN_FILE, "r", encoding="utf-8") as f:
+            token = f.read().strip()
+        return port, token
+    except (OSError, ValueError):
+        return None
+
+
+def _send_string(sock, value):
+    data = value.encode("utf-8")
+    sock.sendall(struct.pack(">i", len(data)) + data)
+
+
+def _recv_exact(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("JVM helper closed the connection")
+        data += chunk
+    return bytes(data)
+
+
+def _connect(command, timeout=CONNECT_TIMEOUT):
+    """
+    Open an authenticated connection and send command, or None if no server is up.
+    The socket keeps the timeout; run_jar lifts it once the server is ready.
+    """
+    info = _read_connection_info()
+    if info is None:
+        return None
+    port, token = info
+    try:
+        sock = socket.create_connection(("127.0.0.1", port), timeout=timeout)
+        _send_string(sock, token)
+        _send_string(sock, command)
+    except OSError:
+        return None
+    return sock
+
+
+def _wait_ready(sock):
+    """True once the server has taken the RUN; False if it is busy, gone or stalled"""
+    sock.settimeout(READY_TIMEOUT)
+    try:
+        kind, length = struct.unpack(">bi", _recv_exact(sock, 5))
+        _recv_exact(sock, length)
+    except (OSError, ConnectionError, struct.error):
+        return False
+    return kind == FRAME_READY
+
+
+def _read_frames(sock, on_output):
+    """Read frames until the exit status; None means the jar needs its own process"""
+    while True:
+        kind, length = struct.unpack(">bi", _recv_exact(sock, 5))
+        payload = _recv_exact(sock, length)
+        if kind == FRAME_EXIT:
+            return struct.unpack(">i", payload)[0]
+        if kind == FRAME_UNSUPPORTED:
+            return None
+        on_output(kind, payload)
+
+
+def server_running():
+    sock = _connect("PING")
+    if sock is None:
+        return False
+    try:
+        with sock:
+            return _read_frames(sock, lambda kind, payload: None) == 0
+    except (OSError, ConnectionError, struct.error):
+        return False
+
+
+def run_jar(jar_path, args, capture_output=False, text=False, check=False):
+    """
+    Run `java -jar jar_path args...`, in the persistent JVM when available.
+    Mirrors subprocess.run(): returns a CompletedProcess, raises
+    CalledProcessError with check=True.
+    """
+    cmd = [JAVA, "-jar", jar_path, *args]
+    sock = _connect("RUN") if USE_SERVER else None
+    if sock is not None and not _wait_ready(sock):
+        sock.close()
+        sock = None
+    if sock is None:
+        return subprocess.run(cmd, capture_output=capture_output, text=text, check=check)
+    # A jar can legitimately run for minutes once it has started
+    sock.settimeout(None)
+
+    chunks = {FRAME_OUT: bytearray(), FRAME_ERR: bytearray()}
+
+    def on_output(kind, payload):
+        if capture_output:
+            chunks[kind] += payload
+        else:
+            stream = sys.stdout if kind == FRAME_OUT else sys.stderr
+            stream.flush()
+            stream.buffer.write(payload)
+            stream.buffer.flush()
+
+    with sock:
+        _send_string(sock, os.path.abspath(jar_path))
+        sock.sendall(struct.pack(">i", len(args)))
+        for arg in args:
+            _send_string(sock, str(arg))
+        try:
+            returncode = _read_frames(sock, on_output)
+        except (OSError, ConnectionError, struct.error) as e:
+            # The work may be half done, so don't silently run it again
+            chunks[FRAME_ERR] += f"JVM helper failed: {e}\n".encode()
+            returncode = 1
+    if returncode is None:
+        return subprocess.run(cmd, capture_output=capture_output, text=text, check=check)
+
+    stdout = stderr = None
+    if capture_output:
+        stdout, stderr = bytes(chunks[FRAME_OUT]), bytes(chunks[FRAME_ERR])
+        if text:
+            stdout = stdout.decode("utf-8", "replace")
+            stderr = stderr.decode("utf-8", "replace")
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+
+def _compile(class_dir):
+    """Compile the server once per source version; False if no javac is available"""
+    if os.path.exists(os.path.join(class_dir, "JvmHelper.class")):
+        return True
+    os.makedirs(class_dir, exist_ok=True)
+    source = os.path.join(class_dir, "JvmHelper.java")
+    with open(source, "w", encoding="utf-8") as f:
+        f.write(JAVA_SOURCE)
+    try:
+        result = subprocess.run(["javac", "-nowarn", "-d", class_dir, source],
+                                capture_output=True, text=True)
+    except FileNotFoundError:
+        return False
+    if result.returncode != 0:
+        print(result.stderr)
+    return result.returncode == 0
+
+
+def start_server():
+    """Start the JVM helper in the background; True once it answers"""
+    if server_running():
+        return True
+    os.makedirs(HELPER_DIR, exist_ok=True)
+    class_dir = _source_dir()
+    if _compile(class_dir):
+        target = ["-cp", class_dir, "JvmHelper"]
+    else:
+        # JDK 11+ can run the source file directly
+        target = [os.path.join(class_dir, "JvmHelper.java")]
+
+    token = secrets.token_hex(16)
+    fd = os.open(TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(token)
+    try:
+        os.remove(PORT_FILE)
+    except OSError:
+        pass
+
+    # JDK 24+ refuses to start with a security manager allowed; retry without
+    for flags in (["-Djava.security.manager=allow"], []):
+        with open(LOG_FILE, "ab") as log:
+            process = subprocess.Popen(
+                [JAVA, *flags, *target, PORT_FILE, token],
+                stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+                start_new_session=True,
+            )
+        deadline = time.time() + START_TIMEOUT
+        while time.time() < deadline and process.poll() is None:
+            if os.path.exists(PORT_FILE) and server_running():
+                return True
+            time.sleep(0.1)
+        if process.poll() is None:
+            process.kill()
+            break
+    return False
+
+
+def stop_server():
+    sock = _connect("STOP")
+    if sock is None:
+        return False
+    with sock:
+        try:
+            _read_frames(sock, lambda kind, payload: None)
+        except (OSError, ConnectionError, struct.error):
+            pass
+    return True
+
+
+def run_benchmark(jar_path, args, runs=3):
+    """Time the same jar command as fresh JVMs and through the helper"""
+    global USE_SERVER
+    print(f"Command: java -jar {jar_path} {' '.join(args)}  ({runs} runs each)\n")
+    timings = {}
+    for mode in ("subprocess", "helper"):
+        USE_SERVER = mode == "helper"
+        if USE_SERVER and not start_server():
+            print(f"❌ Could not start the JVM helper, see {LOG_FILE}")
+            return
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            run_jar(jar_path, args, capture_output=True)
+            times.append(time.perf_counter() - start)
+        timings[mode] = times
+        print(f"{mode:<11} first {times[0]:6.2f}s  best {min(times):6.2f}s  "
+              f"mean {sum(times) / len(times):6.2f}s")
+    USE_SERVER = True
+    speedup = min(timings["subprocess"]) / min(timings["helper"])
+    print(f"\nSpeedup (best run): {speedup:.1f}x")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Persistent JVM for APKEditor/axml2xml calls.")
+    parser.add_argument("command", choices=["start", "stop", "status", "benchmark"])
+    parser.add_argument("jar", nargs="?", help="Jar to benchmark")
+    parser.add_argument("jar_args", nargs=argparse.REMAINDER, help="Arguments for the jar")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode when benchmarking")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        if start_server():
+            print("✅ JVM helper running")
+        else:
+            print(f"❌ Could not start the JVM helper, see {LOG_FILE}")
+            sys.exit(1)
+    elif args.command == "stop":
+        print("✅ JVM helper stopped" if stop_server() else "JVM helper was not running")
+    elif args.command == "status":
+        print("JVM helper is running" if server_running() else "JVM helper is not running")
+    else:
+        if not args.jar:
+            parser.error("benchmark needs a jar")
+        run_benchmark(args.jar, args.jar_args, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,50 @@
 PDF Merger Script
 Merge multiple PDF files into a single PDF document.
 Asks user for sorting preference (by name or date) and folder location.
+
+Pages are streamed to disk one input at a time (see StreamingPdfWriter), so
+hundreds of large PDFs can be merged without holding them all in memory.
+Every input gets a bookmark and page labels ("name: 1", "name: 2", ...).
+Choosing "append" for an existing output adds only files that are not
+bookmarked in it yet, as an incremental update at the end of the file.
+Run with --benchmark [N] to compare against PyPDF2's PdfMerger on N
+synthetic files.
+
+Batch mode (no prompts), each folder merged into its own output in parallel:
+    python pdf_merge.py book1/ book2/ --sort date -r --glob "ch*.pdf" -o book.pdf
+
 """
 
 import os
 import sys
 import re
+import io
+import time
+import zlib
+import random
+import hashlib
+import fnmatch
+import argparse
+import tempfile
+import contextlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from PyPDF2 import PdfMerger, PdfReader
+from PyPDF2.generic import (
+    ArrayObject, DictionaryObject, DecodedStreamObject, EncodedStreamObject,
+    IndirectObject, NameObject, NullObject, NumberObject, StreamObject,
+    TextStringObject,
+)
 from pathlib import Path
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# Flate-compress content streams that inputs stored uncompressed
+COMPRESS_STREAMS = False
+
 def natural_sort_key(text):
     """
     Convert text to a list of string and integer parts for natural sorting.
@@ -53,43 +89,132 @@ def get_folder_path():
         else:
             print(f"Error: Folder '{folder}' not found. Please try again.")
 
+def scan_pdfs(folder_path, pattern="*.pdf", recursive=False, exclude=()):
+    """
+    Find matching files with one os.scandir pass per directory.
+    Returns {path: stat_result}; the stats are reused for sorting and sizes.
+    """
+    found = {}
+    pending = [str(folder_path)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        pending.append(entry.path)
+                elif fnmatch.fnmatch(entry.name, pattern) and entry.path not in exclude:
+                    found[Path(entry.path)] = entry.stat()
+    return found
+
+
+def sort_pdf_files(stats, folder_path, sort_by):
+    """Sort scanned files by natural name (relative path) or modification time"""
+    pdf_files = list(stats)
+    if sort_by == 'name':
+        pdf_files.sort(key=lambda x: natural_sort_key(x.relative_to(folder_path).with_suffix('')))
+    else:  # sort_by == 'date'
+        pdf_files.sort(key=lambda x: stats[x].st_mtime)
+    return pdf_files
+
+
+def inspect_pdf(pdf):
+    """Open one input and collect its page count and encryption"""
+    info = {"pages": 0, "encrypted": False, "error": None}
+    try:
+        with open(pdf, "rb") as f:
+            reader = PdfReader(f)
+            if reader.is_encrypted:
+                info["encrypted"] = True
+                if not reader.decrypt(""):
+                    info["error"] = "encrypted (password required)"
+                    return info
+            info["pages"] = len(reader.pages)
+    except Exception as e:
+        info["error"] = f"{type(e).__name__}: {e}"
+    return info
+
+
+def preflight_pdfs(pdf_files, stats, parallel=True):
+    """Inspect all inputs, in parallel by default. Returns {path: info} in input order."""
+    workers = max(1, min(len(pdf_files), os.cpu_count() or 1)) if parallel else 1
+    if workers == 1:
+        infos = map(inspect_pdf, pdf_files)
+        preflight = dict(zip(pdf_files, infos))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            preflight = dict(zip(pdf_files, pool.map(inspect_pdf, pdf_files, chunksize=8)))
+    for pdf, info in preflight.items():
+        info["size"] = stats[pdf].st_size
+    return preflight
+
+
 def get_pdf_files(folder_path, sort_by):
     """
     Get PDF files from folder and sort them according to user preference.
-    Returns list of PDF file paths.
+    Returns (list of PDF file paths, {path: info} for files to repair).
     """
     # Get all PDF files from the folder
-    pdf_files = list(folder_path.glob("*.pdf"))
+    stats = scan_pdfs(folder_path)
     
-    if not pdf_files:
+    if not stats:
         print(f"\nError: No PDF files found in '{folder_path}'")
         sys.exit(1)
     
     # Sort files according to user preference
+    pdf_files = sort_pdf_files(stats, folder_path, sort_by)
     if sort_by == 'name':
-        # Use natural sorting for filenames
-        pdf_files.sort(key=lambda x: natural_sort_key(x.stem))
         print("\nSorting files by name (natural order: ch1, ch2, ch10, ch11...)...")
-    else:  # sort_by == 'date'
-        pdf_files.sort(key=lambda x: x.stat().st_mtime)
+    else:
         print("\nSorting files by date (oldest first)...")
     
+    # Open every input up front so bad files show up before the merge starts
+    print("Checking files...")
+    preflight = preflight_pdfs(pdf_files, stats)
+
     # Display the files that will be merged
     print("\nFiles to be merged (in this order):")
     for i, pdf in enumerate(pdf_files, 1):
+        info = preflight[pdf]
+        if info["error"]:
+            details = f"⚠️  {info['error']}"
+        else:
+            details = f"{info['pages']} pages, {info['size'] / 1024:.0f} KB"
+            if info["encrypted"]:
+                details += ", encrypted"
         if sort_by == 'date':
-            mod_time = os.path.getmtime(pdf)
+            mod_time = stats[pdf].st_mtime
             from datetime import datetime
             mod_date = datetime.fromtimestamp(mod_time).strftime('%Y-%m-%d %H:%M:%S')
-            print(f"{i:2d}. {pdf.name} (Modified: {mod_date})")
+            print(f"{i:2d}. {pdf.name} (Modified: {mod_date}) [{details}]")
         else:
-            print(f"{i:2d}. {pdf.name}")
+            print(f"{i:2d}. {pdf.name} [{details}]")
+
+    total_pages = sum(info["pages"] for info in preflight.values())
+    total_mb = sum(info["size"] for info in preflight.values()) / (1024 * 1024)
+    problems = {pdf: info for pdf, info in preflight.items() if info["error"]}
+    print(f"\nTotal: {len(pdf_files)} files, {total_pages} pages, {total_mb:.1f} MB")
+
+    if problems:
+        print(f"⚠️  {len(problems)} file(s) could not be read.")
+        while True:
+            choice = input("Skip them (s) or try to repair them (r)? ").strip().lower()
+            if choice in ['s', 'skip']:
+                pdf_files = [pdf for pdf in pdf_files if pdf not in problems]
+                problems = {}
+                break
+            elif choice in ['r', 'repair']:
+                break
+            else:
+                print("Please enter 's' or 'r'.")
+        if not pdf_files:
+            print("\nError: No readable PDF files left to merge.")
+            sys.exit(1)
     
     # Ask for confirmation
     while True:
         confirm = input("\nProceed with merging these files? (y/n): ").strip().lower()
         if confirm in ['y', 'yes']:
-            return pdf_files
+            return pdf_files, problems
         elif confirm in ['n', 'no']:
             print("Operation cancelled.")
             sys.exit(0)
@@ -97,7 +222,7 @@ def get_pdf_files(folder_path, sort_by):
             print("Please enter 'y' or 'n'.")
 
 def get_output_filename(folder_path):
-    """Ask user for output filename."""
+    """Ask user for output filename. Returns (path, append)."""
     default_name = "merged.pdf"
     output = input(f"\nEnter output filename (default: {default_name}): ").strip()
     
@@ -114,42 +239,743 @@ def get_output_filename(folder_path):
     # Check if file already exists
     if output_path.exists():
         while True:
-            overwrite = input(f"File '{output}' already exists. Overwrite? (y/n): ").strip().lower()
-            if overwrite in ['y', 'yes']:
+            choice = input(f"File '{output}' already exists. "
+                           "(o)verwrite, (a)ppend new files, or (n)ew name? ").strip().lower()
+            if choice in ['o', 'overwrite', 'y', 'yes']:
                 break
-            elif overwrite in ['n', 'no']:
+            elif choice in ['a', 'append']:
+                return str(output_path), True
+            elif choice in ['n', 'no', 'new']:
                 return get_output_filename(folder_path)
             else:
-                print("Please enter 'y' or 'n'.")
+                print("Please enter 'o', 'a' or 'n'.")
     
-    return str(output_path)
+    return str(output_path), False
+
+class StreamingPdfWriter:
+    """
+    Writes merged pages straight to the output file, one input at a time.
+
+    Every object reachable from an input's pages gets a new object number and
+    is written as soon as it is copied, so memory holds only the current input
+    plus the xref offsets. Objects whose content is identical to one already
+    written (shared fonts, images, ICC profiles...) are written once and
+    referenced from every page that uses them.
+
+    Each input gets its own intermediate /Pages node, a top-level bookmark
+    and a page-label range, so later appends only touch O(inputs) objects.
+    """
+
+    def __init__(self, path, compress=False):
+        self.path = path
+        self.compress = compress
+        self.stream = open(path, "wb")
+        self.stream.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        self._init_state(first_num=1)
+        self.pages_num = self._reserve()
+
+    def _init_state(self, first_num):
+        self.first_num = first_num
+        self.offsets = []      # offsets[i] is the byte offset of object first_num + i
+        self.rewritten = {}    # existing object number -> (offset, generation)
+        self.page_nums = []
+        self.groups = []       # (Pages node number, [page numbers]) per input
+        self.outline = []      # (title, page number, children) per input
+        self.labels = []       # (first page index, label prefix) per input
+        self.digests = {}      # content digest -> object number
+        self.deduplicated = 0
+        self.skipped_pages = 0
+        self.file_index = 0
+
+    def _reserve(self):
+        self.offsets.append(None)
+        return self.first_num + len(self.offsets) - 1
+
+    def _written(self, num):
+        return self.offsets[num - self.first_num] is not None
+
+    def _ref(self, num):
+        return IndirectObject(num, 0, self)
+
+    def _write(self, num, obj):
+        self.offsets[num - self.first_num] = self.stream.tell()
+        self.stream.write(f"{num} 0 obj\n".encode())
+        obj.write_to_stream(self.stream, None)
+        self.stream.write(b"\nendobj\n")
+
+    def add_reader(self, reader, skip_broken_pages=False, title=None):
+        """
+        Copy every page of reader. Returns the index of its first output page.
+
+        If a page can't be copied the whole input is left out and the error
+        re-raised, unless skip_broken_pages is set, in which case only the
+        broken pages are dropped (counted in self.skipped_pages).
+        With a title, the input gets a bookmark (its own bookmarks nest under
+        it) and its pages are labelled "title: 1", "title: 2", ...
+        """
+        self.file_index += 1
+        mapping = {}  # (idnum, generation) in reader -> object number in output
+        memo = {}     # (idnum, generation) -> content digest
+        pending = deque()
+
+        pages = list(reader.pages)
+        first = len(self.page_nums)
+        node_num = self._reserve()
+        # Number pages first so links between them resolve to the copies
+        for page in pages:
+            num = self._reserve()
+            ref = page.indirect_reference
+            if ref is not None:
+                mapping[(ref.idnum, ref.generation)] = num
+            self.page_nums.append(num)
+        file_page_nums = self.page_nums[first:]
+
+        for page, num in zip(pages, file_page_nums):
+            try:
+                new_page = DictionaryObject()
+                for key, value in page.items():
+                    if key in ("/Parent", "/B"):
+                        continue
+                    new_page[key] = self._copy(value, mapping, memo, pending)
+                new_page[NameObject("/Parent")] = self._ref(node_num)
+                # Page goes last so a failure never leaves it pointing at missing objects
+                while pending:
+                    obj_num, target = pending.popleft()
+                    self._write(obj_num, self._copy(target, mapping, memo, pending))
+                self._write(num, new_page)
+            except Exception:
+                pending.clear()
+                self._forget_unwritten(mapping, set(file_page_nums))
+                if not skip_broken_pages:
+                    del self.page_nums[first:]
+                    raise
+                self.page_nums.remove(num)
+                self.skipped_pages += 1
+
+        group = self.page_nums[first:]
+        if group:
+            self.groups.append((node_num, group))
+            if title:
+                children = self._source_outline(reader, mapping)
+                self.outline.append((title, group[0], children))
+                self.labels.append((first, f"{title}: "))
+        return first
+
+    def _forget_unwritten(self, mapping, keep):
+        """Drop numbers handed out for objects that were never written"""
+        for key, num in list(mapping.items()):
+            if num >= self.first_num and not self._written(num) and num not in keep:
+                del mapping[key]
+        for digest, num in list(self.digests.items()):
+            if not self._written(num):
+                del self.digests[digest]
+
+    def _source_outline(self, reader, mapping):
+        """The input's own bookmarks as (title, page number, children), pointing at the copies"""
+        try:
+            items = reader.outline
+        except Exception:
+            return []
+
+        def convert(items):
+            result = []
+            for item in items:
+                if isinstance(item, list):
+                    # A nested list holds the children of the preceding entry
+                    if result:
+                        result[-1][2].extend(convert(item))
+                    continue
+                page = getattr(item, "page", None)
+                if not isinstance(page, IndirectObject):
+                    continue
+                num = mapping.get((page.idnum, page.generation))
+                if num is None or not self._written(num):
+                    continue
+                result.append((str(item.title), num, []))
+            return result
+
+        return convert(items)
+
+    def _copy(self, value, mapping, memo, pending):
+        """Copy value for the output, renumbering (and queueing) indirect objects"""
+        if isinstance(value, IndirectObject):
+            key = (value.idnum, value.generation)
+            if key not in mapping:
+                target = value.get_object()
+                if target is None:
+                    target = NullObject()
+                digest = self._digest(value, mapping, memo)
+                if digest in self.digests:
+                    mapping[key] = self.digests[digest]
+                    self.deduplicated += 1
+                else:
+                    num = self._reserve()
+                    mapping[key] = num
+                    self.digests[digest] = num
+                    pending.append((num, target))
+            return self._ref(mapping[key])
+        if isinstance(value, StreamObject):
+            data = value._data
+            if "/Filter" in value:
+                copy = EncodedStreamObject()
+            elif self.compress:
+                copy = EncodedStreamObject()
+                copy[NameObject("/Filter")] = NameObject("/FlateDecode")
+                data = zlib.compress(data)
+            else:
+                copy = DecodedStreamObject()
+            copy._data = data
+            for key, item in value.items():
+                if key != "/Length":
+                    copy[key] = self._copy(item, mapping, memo, pending)
+            return copy
+        if isinstance(value, DictionaryObject):
+            copy = DictionaryObject()
+            for key, item in value.items():
+                copy[key] = self._copy(item, mapping, memo, pending)
+            return copy
+        if isinstance(value, ArrayObject):
+            return ArrayObject(self._copy(item, mapping, memo, pending) for item in value)
+        return value
+
+    def _digest(self, ref, mapping, memo):
+        """Content hash of an indirect object, following the objects it references"""
+        key = (ref.idnum, ref.generation)
+        if key in mapping and key not in memo:
+            # A page of this input: never equal to anything in another input
+            return f"page:{self.file_index}:{key}".encode()
+        if key in memo:
+            return memo[key]
+        # Placeholder for reference cycles; file-specific so it can't match across inputs
+        memo[key] = f"cycle:{self.file_index}:{key}".encode()
+        h = hashlib.sha256()
+        self._feed(ref.get_object(), h, mapping, memo)
+        memo[key] = h.digest()
+        return memo[key]
+
+    def _feed(self, value, h, mapping, memo):
+        if isinstance(value, IndirectObject):
+            h.update(b"R")
+            h.update(self._digest(value, mapping, memo))
+        elif isinstance(value, DictionaryObject):
+            h.update(b"<<")
+            for key in sorted(value.keys()):
+                if key == "/Length":
+                    continue
+                h.update(key.encode())
+                self._feed(value[key], h, mapping, memo)
+            h.update(b">>")
+            if isinstance(value, StreamObject):
+                h.update(b"stream")
+                h.update(hashlib.sha256(value._data).digest())
+        elif isinstance(value, ArrayObject):
+            h.update(b"[")
+            for item in value:
+                self._feed(item, h, mapping, memo)
+            h.update(b"]")
+        elif value is None:
+            h.update(b"null")
+        else:
+            buf = io.BytesIO()
+            value.write_to_stream(buf, None)
+            h.update(type(value).__name__.encode())
+            h.update(buf.getvalue())
+
+    def _write_page_groups(self, parent_ref):
+        """Write one /Pages node per input under parent_ref; returns their refs"""
+        kids = ArrayObject()
+        for node_num, group in self.groups:
+            self._write(node_num, DictionaryObject({
+                NameObject("/Type"): NameObject("/Pages"),
+                NameObject("/Parent"): parent_ref,
+                NameObject("/Kids"): ArrayObject(self._ref(n) for n in group),
+                NameObject("/Count"): NumberObject(len(group)),
+            }))
+            kids.append(self._ref(node_num))
+        return kids
+
+    def _write_outline(self, items, parent_ref, prev_ref=None):
+        """Write sibling bookmarks (and their children); returns (first ref, last ref)"""
+        nums = [self._reserve() for _ in items]
+        for i, (title, page_num, children) in enumerate(items):
+            entry = DictionaryObject({
+                NameObject("/Title"): TextStringObject(title),
+                NameObject("/Parent"): parent_ref,
+                NameObject("/Dest"): ArrayObject([self._ref(page_num), NameObject("/Fit")]),
+            })
+            if i > 0:
+                entry[NameObject("/Prev")] = self._ref(nums[i - 1])
+            elif prev_ref is not None:
+                entry[NameObject("/Prev")] = prev_ref
+            if i + 1 < len(nums):
+                entry[NameObject("/Next")] = self._ref(nums[i + 1])
+            if children:
+                first, last = self._write_outline(children, self._ref(nums[i]))
+                entry[NameObject("/First")] = first
+                entry[NameObject("/Last")] = last
+                entry[NameObject("/Count")] = NumberObject(-len(children))  # collapsed
+            self._write(nums[i], entry)
+        return self._ref(nums[0]), self._ref(nums[-1])
+
+    def _label_nums(self, page_offset):
+        """/PageLabels /Nums entries: numbering restarts at 1 for each input"""
+        nums = ArrayObject()
+        for first, prefix in self.labels:
+            nums.append(NumberObject(page_offset + first))
+            nums.append(DictionaryObject({
+                NameObject("/S"): NameObject("/D"),
+                NameObject("/P"): TextStringObject(prefix),
+            }))
+        return nums
+
+    def _write_xref(self):
+        """Write the xref section for everything written by this writer"""
+        xref_offset = self.stream.tell()
+        # The free-list head first: some readers assume sections start at 0
+        self.stream.write(b"xref\n0 1\n0000000000 65535 f \n")
+        for num, (offset, generation) in sorted(self.rewritten.items()):
+            self.stream.write(f"{num} 1\n{offset:010d} {generation:05d} n \n".encode())
+        self.stream.write(f"{self.first_num} {len(self.offsets)}\n".encode())
+        for offset in self.offsets:
+            if offset is None:
+                self.stream.write(b"0000000000 00000 f \n")
+            else:
+                self.stream.write(f"{offset:010d} 00000 n \n".encode())
+        return xref_offset
 
-def merge_pdfs(pdf_files, output_filename):
+    def _write_trailer(self, xref_offset, entries):
+        trailer = DictionaryObject({NameObject("/Size"): NumberObject(self.first_num + len(self.offsets))})
+        trailer.update(entries)
+        self.stream.write(b"trailer\n")
+        trailer.write_to_stream(self.stream, None)
+        self.stream.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+        self.stream.close()
+
+    def close(self):
+        """Write the page tree, outline, catalog, xref table and trailer"""
+        pages = DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): self._write_page_groups(self._ref(self.pages_num)),
+            NameObject("/Count"): NumberObject(len(self.page_nums)),
+        })
+        self._write(self.pages_num, pages)
+
+        catalog = DictionaryObject({
+            NameObject("/Type"): NameObject("/Catalog"),
+            NameObject("/Pages"): self._ref(self.pages_num),
+        })
+        if self.outline:
+            outlines_num = self._reserve()
+            first, last = self._write_outline(self.outline, self._ref(outlines_num))
+            self._write(outlines_num, DictionaryObject({
+                NameObject("/Type"): NameObject("/Outlines"),
+                NameObject("/First"): first,
+                NameObject("/Last"): last,
+                NameObject("/Count"): NumberObject(len(self.outline)),
+            }))
+            catalog[NameObject("/Outlines")] = self._ref(outlines_num)
+            catalog[NameObject("/PageMode")] = NameObject("/UseOutlines")
+        if self.labels:
+            catalog[NameObject("/PageLabels")] = DictionaryObject({
+                NameObject("/Nums"): self._label_nums(0),
+            })
+        catalog_num = self._reserve()
+        self._write(catalog_num, catalog)
+
+        xref_offset = self._write_xref()
+        self._write_trailer(xref_offset, {NameObject("/Root"): self._ref(catalog_num)})
+
+    def abort(self):
+        """Close and delete a partially written output"""
+        self.stream.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def find_startxref(path):
+    """Byte offset of the last xref section of a PDF"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 2048))
+        tail = f.read()
+    match = re.search(rb"startxref\s+(\d+)\s+%%EOF\s*$", tail)
+    if not match:
+        raise ValueError("startxref not found")
+    return int(match.group(1))
+
+
+class IncrementalPdfWriter(StreamingPdfWriter):
+    """
+    Appends inputs to an existing PDF as an incremental update.
+
+    The original bytes are left untouched; new pages, a rewritten page tree
+    root, the bookmark/page-label changes and a new xref section (with /Prev
+    pointing at the old one) are added at the end of the file. Cost is
+    proportional to the new pages plus the number of inputs, not the size
+    of the existing book.
+    """
+
+    def __init__(self, path, compress=False):
+        self.path = path
+        self.compress = compress
+        self.base_file = open(path, "rb")
+        self.base = PdfReader(self.base_file)
+        if self.base.is_encrypted:
+            self.base_file.close()
+            raise ValueError("cannot append to an encrypted PDF")
+        self.prev_xref = find_startxref(path)
+        trailer = self.base.trailer
+        self._init_state(first_num=int(trailer["/Size"]))
+        self.catalog_ref = trailer.raw_get("/Root")
+        self.pages_ref = self.catalog_ref.get_object().raw_get("/Pages")
+        self.pages_num = self.pages_ref.idnum
+        self.base_page_count = int(self.pages_ref.get_object()["/Count"])
+
+        self.stream = open(path, "r+b")
+        self.base_size = self.stream.seek(0, os.SEEK_END)
+        self.stream.seek(self.base_size - 1)
+        if self.stream.read(1) not in (b"\n", b"\r"):
+            self.stream.write(b"\n")
+
+    def existing_titles(self):
+        """Titles of the top-level bookmarks already in the file"""
+        titles = set()
+        catalog = self.catalog_ref.get_object()
+        outlines = catalog["/Outlines"] if "/Outlines" in catalog else {}
+        item = outlines["/First"] if "/First" in outlines else None
+        seen = set()
+        while item is not None and id(item) not in seen:
+            seen.add(id(item))
+            if "/Title" in item:
+                titles.add(str(item["/Title"]))
+            item = item["/Next"] if "/Next" in item else None
+        return titles
+
+    def _rewrite(self, ref, obj):
+        """Write a new version of an existing object"""
+        self.rewritten[ref.idnum] = (self.stream.tell(), ref.generation)
+        self.stream.write(f"{ref.idnum} {ref.generation} obj\n".encode())
+        obj.write_to_stream(self.stream, None)
+        self.stream.write(b"\nendobj\n")
+
+    @staticmethod
+    def _shallow_copy(obj):
+        copy = DictionaryObject()
+        for key, value in obj.items():
+            copy[key] = value
+        return copy
+
+    def close(self):
+        """Append the updated page tree, outline, catalog, xref section and trailer"""
+        pages_root = self.pages_ref.get_object()
+        new_root = self._shallow_copy(pages_root)
+        kids = ArrayObject(pages_root["/Kids"])
+        kids.extend(self._write_page_groups(self.pages_ref))
+        new_root[NameObject("/Kids")] = kids
+        new_root[NameObject("/Count")] = NumberObject(self.base_page_count + len(self.page_nums))
+        self._rewrite(self.pages_ref, new_root)
+
+        catalog = self.catalog_ref.get_object()
+        new_catalog = None
+        if self.outline:
+            outlines_ref = catalog.raw_get("/Outlines") if "/Outlines" in catalog else None
+            if isinstance(outlines_ref, IndirectObject):
+                outlines = outlines_ref.get_object()
+                old_last = outlines.raw_get("/Last")
+                first, last = self._write_outline(self.outline, outlines_ref, prev_ref=old_last)
+                if isinstance(old_last, IndirectObject):
+                    linked = self._shallow_copy(old_last.get_object())
+                    linked[NameObject("/Next")] = first
+                    self._rewrite(old_last, linked)
+                new_outlines = self._shallow_copy(outlines)
+                if "/First" not in new_outlines:
+                    new_outlines[NameObject("/First")] = first
+                new_outlines[NameObject("/Last")] = last
+                old_count = abs(int(outlines["/Count"])) if "/Count" in outlines else 0
+                new_outlines[NameObject("/Count")] = NumberObject(old_count + len(self.outline))
+                self._rewrite(outlines_ref, new_outlines)
+            else:
+                outlines_num = self._reserve()
+                first, last = self._write_outline(self.outline, self._ref(outlines_num))
+                self._write(outlines_num, DictionaryObject({
+                    NameObject("/Type"): NameObject("/Outlines"),
+                    NameObject("/First"): first,
+                    NameObject("/Last"): last,
+                    NameObject("/Count"): NumberObject(len(self.outline)),
+                }))
+                new_catalog = self._shallow_copy(catalog)
+                new_catalog[NameObject("/Outlines")] = self._ref(outlines_num)
+                new_catalog[NameObject("/PageMode")] = NameObject("/UseOutlines")
+
+        page_labels = catalog["/PageLabels"] if "/PageLabels" in catalog else None
+        if self.labels and (page_labels is None or "/Nums" in page_labels):
+            if page_labels is None:
+                # Existing pages keep plain 1, 2, 3... numbering
+                nums = ArrayObject([NumberObject(0), DictionaryObject({NameObject("/S"): NameObject("/D")})])
+            else:
+                nums = ArrayObject(page_labels["/Nums"])
+            nums.extend(self._label_nums(self.base_page_count))
+            if new_catalog is None:
+                new_catalog = self._shallow_copy(catalog)
+            new_catalog[NameObject("/PageLabels")] = DictionaryObject({NameObject("/Nums"): nums})
+
+        if new_catalog is not None:
+            self._rewrite(self.catalog_ref, new_catalog)
+
+        xref_offset = self._write_xref()
+        entries = {
+            NameObject("/Root"): self.catalog_ref,
+            NameObject("/Prev"): NumberObject(self.prev_xref),
+        }
+        for key in ("/Info", "/ID"):
+            if key in self.base.trailer:
+                entries[NameObject(key)] = self.base.trailer.raw_get(key)
+        self._write_trailer(xref_offset, entries)
+        self.base_file.close()
+
+    def abort(self):
+        """Cut the file back to its original bytes"""
+        self.stream.truncate(self.base_size)
+        self.stream.close()
+        self.base_file.close()
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process in MB (None if unknown)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def merge_pdfs(pdf_files, output_filename, compress=COMPRESS_STREAMS, repair=(), append=False):
     """
     Merge multiple PDF files into one.
+    Files that fail are skipped; files in `repair` keep whatever pages can be read.
+    With append, the files are added to the end of an existing output as an
+    incremental update, skipping files already bookmarked in it.
     """
     if not pdf_files:
         print("Error: No PDF files to merge.")
         sys.exit(1)
     
-    merger = PdfMerger()
+    start = time.perf_counter()
+    if append:
+        try:
+            writer = IncrementalPdfWriter(output_filename, compress=compress)
+        except Exception as e:
+            print(f"\n❌ Cannot append to {output_filename}: {e}")
+            sys.exit(1)
+        existing = writer.existing_titles()
+        already = [pdf for pdf in pdf_files if pdf.stem in existing]
+        pdf_files = [pdf for pdf in pdf_files if pdf.stem not in existing]
+        if already:
+            print(f"\nAlready in {Path(output_filename).name}: {len(already)} file(s)")
+        if not pdf_files:
+            writer.abort()
+            print("✅ Nothing new to append.")
+            return
+    else:
+        writer = StreamingPdfWriter(output_filename, compress=compress)
     
     try:
         print("\nMerging PDF files...")
+        skipped = []
         for pdf in pdf_files:
             print(f"  Adding: {pdf.name}")
-            merger.append(str(pdf))
+            try:
+                with open(pdf, "rb") as f:
+                    reader = PdfReader(f, strict=False)
+                    if reader.is_encrypted:
+                        reader.decrypt("")
+                    writer.add_reader(reader, skip_broken_pages=pdf in repair, title=pdf.stem)
+            except Exception as e:
+                print(f"    ⚠️  Skipped: {type(e).__name__}: {e}")
+                skipped.append(pdf)
         
-        # Write merged PDF
-        merger.write(output_filename)
-        merger.close()
-        print(f"\n✅ Successfully created: {output_filename}")
-        print(f"   Merged {len(pdf_files)} PDF files.")
+        if not writer.page_nums:
+            raise RuntimeError("no pages could be read from the input files")
+        
+        # Finish merged PDF
+        writer.close()
+        elapsed = time.perf_counter() - start
+        merged = len(pdf_files) - len(skipped)
+        if append:
+            print(f"\n✅ Successfully appended to: {output_filename}")
+            print(f"   Appended {merged} PDF files ({len(writer.page_nums)} pages, "
+                  f"{writer.base_page_count + len(writer.page_nums)} in total).")
+        else:
+            print(f"\n✅ Successfully created: {output_filename}")
+            print(f"   Merged {merged} PDF files ({len(writer.page_nums)} pages).")
+        if skipped:
+            print(f"   Skipped {len(skipped)} unreadable file(s): {', '.join(p.name for p in skipped)}")
+        if writer.skipped_pages:
+            print(f"   Dropped {writer.skipped_pages} broken page(s) while repairing.")
+        print(f"   Shared objects written once: {writer.deduplicated}")
+        peak = peak_memory_mb()
+        peak_text = f", peak memory {peak:.1f} MB" if peak is not None else ""
+        print(f"   Time: {elapsed:.1f}s{peak_text}")
         
     except Exception as e:
+        writer.abort()
         print(f"\n❌ Error during merge: {e}")
         sys.exit(1)
 
+
+def write_synthetic_pdf(path, index, pages=4, image_size=128):
+    """
+    Write a small PDF resembling a scanned chapter: text pages plus an image
+    and font shared by every file (so deduplication has something to find).
+    """
+    rng = random.Random(0)  # same image bytes in every file
+    image = bytes(rng.getrandbits(8) for _ in range(image_size * image_size))
+    objects = {
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        4: (b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceGray"
+            b" /BitsPerComponent 8 /Length %d >>\nstream\n" % (image_size, image_size, len(image))
+            + image + b"\nendstream"),
+    }
+    kids = []
+    for p in range(pages):
+        page_num, content_num = 5 + 2 * p, 6 + 2 * p
+        kids.append(b"%d 0 R" % page_num)
+        lines = b"".join(
+            b"BT /F1 11 Tf 72 %d Td (Chapter %d page %d line %d lorem ipsum dolor sit amet) Tj ET\n"
+            % (760 - 16 * i, index, p + 1, i + 1) for i in range(40)
+        )
+        content = lines + b"q 120 0 0 120 420 40 cm /Im1 Do Q\n"
+        objects[page_num] = (b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792]"
+                             b" /Resources << /Font << /F1 3 0 R >> /XObject << /Im1 4 0 R >> >>"
+                             b" /Contents %d 0 R >>" % content_num)
+        objects[content_num] = b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % pages
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n" % num + objects[num] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for num in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[num]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def _benchmark_merge(method, pdf_files, output):
+    """Run one merge in a fresh process; returns (seconds, peak MB, output bytes)"""
+    start = time.perf_counter()
+    if method == "PdfMerger":
+        merger = PdfMerger()
+        for pdf in pdf_files:
+            merger.append(str(pdf))
+        merger.write(output)
+        merger.close()
+    else:
+        writer = StreamingPdfWriter(output, compress=(method == "streaming+compress"))
+        for pdf in pdf_files:
+            with open(pdf, "rb") as f:
+                writer.add_reader(PdfReader(f))
+        writer.close()
+    return time.perf_counter() - start, peak_memory_mb(), os.path.getsize(output)
+
+
+def run_benchmark(n_files=500, pages_per_file=4):
+    """Compare PdfMerger with the streaming writer on a synthetic corpus"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        print(f"Generating {n_files} synthetic PDFs ({pages_per_file} pages each)...")
+        pdf_files = []
+        for i in range(1, n_files + 1):
+            path = tmp_path / f"ch{i}.pdf"
+            write_synthetic_pdf(path, i, pages=pages_per_file)
+            pdf_files.append(path)
+        corpus_mb = sum(p.stat().st_size for p in pdf_files) / (1024 * 1024)
+        print(f"Corpus: {corpus_mb:.1f} MB\n")
+
+        print(f"{'method':<20} {'time':>8} {'peak RSS':>10} {'output':>10}")
+        for method in ("PdfMerger", "streaming", "streaming+compress"):
+            output = str(tmp_path / f"out_{method}.pdf")
+            # Fresh process per method so peak RSS isn't shared between runs
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                elapsed, peak, size = pool.submit(_benchmark_merge, method, pdf_files, output).result()
+            peak_text = f"{peak:.1f} MB" if peak is not None else "n/a"
+            print(f"{method:<20} {elapsed:7.2f}s {peak_text:>10} {size / (1024 * 1024):7.1f} MB")
+
+def merge_folder(folder, options):
+    """
+    Merge one folder without prompting (batch mode).
+    Returns (folder, ok, captured output) so parallel runs print cleanly.
+    """
+    log = io.StringIO()
+    ok = True
+    with contextlib.redirect_stdout(log):
+        folder_path = Path(folder)
+        output_path = folder_path / options["output"]
+        try:
+            stats = scan_pdfs(folder_path, options["glob"], options["recursive"],
+                              exclude={str(output_path)})
+            if not stats:
+                print(f"Error: No files matching '{options['glob']}' in '{folder_path}'")
+                return folder, False, log.getvalue()
+            pdf_files = sort_pdf_files(stats, folder_path, options["sort"])
+            # Folders already run in parallel, so inspect files in this process
+            preflight = preflight_pdfs(pdf_files, stats, parallel=False)
+            problems = {pdf: info for pdf, info in preflight.items() if info["error"]}
+            for pdf, info in problems.items():
+                print(f"  ⚠️  {pdf.name}: {info['error']}")
+            if problems and options["on_error"] == "skip":
+                pdf_files = [pdf for pdf in pdf_files if pdf not in problems]
+                problems = {}
+            append = options["append"] and output_path.exists()
+            merge_pdfs(pdf_files, str(output_path), compress=options["compress"],
+                       repair=problems, append=append)
+        except SystemExit as e:
+            ok = not e.code
+        except Exception as e:
+            print(f"❌ {type(e).__name__}: {e}")
+            ok = False
+    return folder, ok, log.getvalue()
+
+
+def run_batch(folders, options, jobs=None):
+    """Merge every folder into its own output, several folders at a time"""
+    folders = list(dict.fromkeys(folders))
+    missing = [folder for folder in folders if not os.path.isdir(folder)]
+    for folder in missing:
+        print(f"Error: Folder '{folder}' not found.")
+    folders = [folder for folder in folders if folder not in missing]
+
+    start = time.perf_counter()
+    workers = max(1, min(len(folders), jobs or os.cpu_count() or 1))
+    failed = len(missing)
+    if workers == 1:
+        results = (merge_folder(folder, options) for folder in folders)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(merge_folder, folders, [options] * len(folders))
+    try:
+        for folder, ok, output in results:
+            print("=" * 60)
+            print(f"📁 {folder}")
+            print(output.rstrip())
+            failed += not ok
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    print("=" * 60)
+    done = len(folders) + len(missing) - failed
+    print(f"Folders merged: {done}, failed: {failed} "
+          f"({time.perf_counter() - start:.1f}s, {workers} worker(s))")
+    return failed == 0
+
+
 def main():
     print("=" * 60)
     print("PDF MERGER TOOL")
@@ -162,19 +988,63 @@ def main():
     folder_path = get_folder_path()
     
     # Get PDF files and sort them
-    pdf_files = get_pdf_files(folder_path, sort_by)
+    pdf_files, repair = get_pdf_files(folder_path, sort_by)
     
     # Get output filename
-    output_filename = get_output_filename(folder_path)
+    output_filename, append = get_output_filename(folder_path)
+    
+    # Never read the output back in as one of its own inputs
+    pdf_files = [pdf for pdf in pdf_files if str(pdf) != output_filename]
     
     # Merge PDFs
-    merge_pdfs(pdf_files, output_filename)
+    merge_pdfs(pdf_files, output_filename, repair=repair, append=append)
     
     print("\n" + "=" * 60)
     print("Thank you for using PDF Merger Tool!")
     print("=" * 60)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge PDF files in a folder.")
+    parser.add_argument("folders", nargs="*",
+                        help="Merge these folders without prompting, each into its own output")
+    parser.add_argument("--sort", choices=["name", "date"], default="name",
+                        help="Input order in batch mode (default: name)")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="Include PDFs in subfolders")
+    parser.add_argument("--glob", default="*.pdf", metavar="PATTERN",
+                        help="Only merge files matching PATTERN (default: *.pdf)")
+    parser.add_argument("-o", "--output", default="merged.pdf",
+                        help="Output filename inside each folder (default: merged.pdf)")
+    parser.add_argument("--append", action="store_true",
+                        help="Append new files to an existing output instead of overwriting it")
+    parser.add_argument("--on-error", choices=["skip", "repair"], default="skip",
+                        help="What to do with unreadable files (default: skip)")
+    parser.add_argument("--compress", action="store_true", default=COMPRESS_STREAMS,
+                        help="Flate-compress uncompressed content streams")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Folders to merge in parallel (default: CPU count)")
+    parser.add_argument("--benchmark", nargs="?", type=int, const=500, metavar="N",
+                        help="Benchmark merge engines on N synthetic PDFs (default: 500)")
+    args = parser.parse_args()
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        sys.exit(0)
+    if args.folders:
+        output = args.output if args.output.lower().endswith(".pdf") else args.output + ".pdf"
+        options = {
+            "sort": args.sort,
+            "recursive": args.recursive,
+            "glob": args.glob,
+            "output": output,
+            "append": args.append,
+            "on_error": args.on_error,
+            "compress": args.compress,
+        }
+        try:
+            sys.exit(0 if run_batch(args.folders, options, args.jobs) else 1)
+        except KeyboardInterrupt:
+            print("\n\nOperation cancelled by user.")
+            sys.exit(1)
     try:
         main()
     except KeyboardInterrupt:
@@ -2,11 +2,31 @@
 # @auhtor: AbhiTheModder
 
 import argparse
+import contextlib
+import hashlib
+import io
 import os
 import re
+import shutil
+import struct
 import subprocess
 import tempfile
-from zipfile import BadZipFile, ZipFile
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile, ZipInfo
+
+try:
+    from jvm_helper import run_jar
+except ImportError:  # running without the helper module next to this script
+    run_jar = None
+
+try:
+    from AXML import AxmlDocument, StringPool
+except ImportError:  # running without AXML.py next to this script
+    AxmlDocument = StringPool = None
 
 RED = "\033[0;31m"
 GREEN = "\033[0;32m"
@@ -21,6 +41,28 @@ JAVAX_SEARCH_REGEX = r"(\.method public (final )?\S+\(Ljava/lang/String;Ljavax/n
 JAVAX_REPLACE_REGEX = (
     r"\1\n\t.registers 3\n\n\tconst/4 v0, 0x1\n\n\treturn v0\n.end method"
 )
+# name -> (substrings every match must contain, search regex, replacement)
+# The substrings are a cheap bytes check that lets most files skip the regex.
+SMALI_PATCHES = {
+    "okhttp3": (
+        (b"Ljava/security/cert/X509Certificate;", b"Ljavax/net/ssl/SSLPeerUnverifiedException;"),
+        re.compile(OKHTTP3_SEARCH_REGEX),
+        OKHTTP3_REPLACE_REGEX,
+    ),
+    "javax": (
+        (b"Ljavax/net/ssl/SSLSession;)Z",),
+        re.compile(JAVAX_SEARCH_REGEX),
+        JAVAX_REPLACE_REGEX,
+    ),
+}
+SMALI_BATCH_SIZE = 500  # files per worker task
+# Batch mode keeps the decompiled (unmodified) output of recent builds here,
+# keyed by the SHA-256 of the APK/APKS, so patching the same build again
+# with other options skips APKEditor's decompile step
+CACHE_DIR = os.path.expanduser("~/.cache/ssl-patch")
+CACHE_KEEP = 4  # builds kept; the least recently used go first
+# Set by batch mode: one smali process pool shared by every batch worker
+SMALI_POOL = None
 XML_CONTENT = """<?xml version="1.0" encoding="utf-8"?>
 <network-security-config>
     <base-config cleartextTrafficPermitted="true">
@@ -38,50 +80,148 @@ XML_CONTENT = """<?xml version="1.0" encoding="utf-8"?>
 </network-security-config>"""
 
 
-def merge_apks(file_path: str) -> str | None:
-    file_name = os.path.basename(file_path)
-    out_path = os.path.join(
-        os.path.dirname(file_path), file_name.rsplit(".", maxsplit=1)[0] + ".apk"
-    )
-    cmdr = ["java", "-jar", APKEDITOR_PATH, "m", "-i", file_path, "-o", out_path]
+def run_java(jar: str, args: list[str], log=None, **kwargs) -> subprocess.CompletedProcess:
+    """`java -jar`, through the persistent JVM helper when it is running.
+
+    The patch steps all take a `log` file (None: the terminal). Batch mode
+    gives each APK its own, and java's output is captured into it too, so
+    parallel runs don't interleave.
+    """
+    if log is not None and "capture_output" not in kwargs:
+        check = kwargs.pop("check", False)
+        result = run_java(jar, args, capture_output=True, text=True, **kwargs)
+        print(result.stdout + result.stderr, end="", file=log)
+        if check:
+            result.check_returncode()
+        return result
+    if run_jar is not None:
+        return run_jar(jar, args, **kwargs)
+    return subprocess.run(["java", "-jar", jar, *args], **kwargs)
+
+
+def merge_apks(file_path: str, out_path: str | None = None, log=None) -> str | None:
+    if out_path is None:
+        file_name = os.path.basename(file_path)
+        out_path = os.path.join(
+            os.path.dirname(file_path), file_name.rsplit(".", maxsplit=1)[0] + ".apk"
+        )
+    # Absolute paths: the JVM helper doesn't share our working directory
+    cmdr = ["m", "-i", os.path.abspath(file_path), "-o", os.path.abspath(out_path)]
     try:
-        subprocess.run(cmdr, check=True)
+        run_java(APKEDITOR_PATH, cmdr, log, check=True)
         return out_path
     except subprocess.CalledProcessError:
-        print(f"{RED}ERROR: Failed to merge apk{NC}")
+        print(f"{RED}ERROR: Failed to merge apk{NC}", file=log)
         return None
 
 
-# https://github.com/AbhiTheModder/termux-scripts/blob/1e90d618bc9725798c96ca1313d79a71e31b5dcb/tgpatcher.py#L240
-def apply_regex(root_directory: str, search_pattern: str, replace_pattern: str):
-    """Apply a regex search and replace patch across all smali files in the root directory."""
-    pattern = re.compile(search_pattern)
-
-    print(f"INFO: Applying regex patch to {root_directory}")
+def find_smali_files(root_directory: str) -> list[str]:
+    files = []
+    pending = [root_directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".smali"):
+                    files.append(entry.path)
+    return files
+
+
+def patch_smali_batch(file_paths: list[str], patch_names: tuple[str, ...]) -> dict:
+    """Apply every selected patch to each file with a single read and at most one write."""
+    stats = {"scanned": 0, "candidates": 0, "matched": [], "patched": [],
+             "hits": dict.fromkeys(patch_names, 0)}
+    for file_path in file_paths:
+        stats["scanned"] += 1
+        with open(file_path, "rb") as file:
+            raw = file.read()
+        selected = [
+            name for name in patch_names
+            if all(needle in raw for needle in SMALI_PATCHES[name][0])
+        ]
+        if not selected:
+            continue
+        stats["candidates"] += 1
+        content = new_content = raw.decode("utf-8")
+        matched = False
+        for name in selected:
+            _, pattern, replacement = SMALI_PATCHES[name]
+            new_content, count = pattern.subn(replacement, new_content)
+            if count:
+                matched = True
+                stats["hits"][name] += count
+        if not matched:
+            continue
+        stats["matched"].append(file_path)
+        if new_content != content:
+            with open(file_path, "wb") as file:
+                file.write(new_content.encode("utf-8"))
+            stats["patched"].append(file_path)
+    return stats
 
-    for dirpath, _, filenames in os.walk(root_directory):
-        for filename in filenames:
-            if filename.endswith(".smali"):
-                file_path = os.path.join(dirpath, filename)
-                with open(file_path, "r") as file:
-                    file_content = file.read()
 
-                new_content = pattern.sub(replace_pattern, file_content)
-
-                if new_content != file_content:
-                    with open(file_path, "w") as file:
-                        file.write(new_content)
-                    print(f"INFO: Applied regex patch to {file_path}")
+# https://github.com/AbhiTheModder/termux-scripts/blob/1e90d618bc9725798c96ca1313d79a71e31b5dcb/tgpatcher.py#L240
+def apply_smali_patches(
+    root_directory: str, patch_names: tuple[str, ...], jobs: int | None = None, log=None
+) -> dict:
+    """Apply regex patches across all smali files in one pass, spread over worker processes."""
+    print(f"INFO: Applying regex patches ({', '.join(patch_names)}) to {root_directory}", file=log)
+
+    start = time.perf_counter()
+    files = find_smali_files(root_directory)
+    walk_time = time.perf_counter() - start
+
+    batches = [
+        files[i : i + SMALI_BATCH_SIZE] for i in range(0, len(files), SMALI_BATCH_SIZE)
+    ]
+    workers = max(1, min(len(batches), jobs or os.cpu_count() or 1))
+    start = time.perf_counter()
+    if workers == 1:
+        results = [patch_smali_batch(batch, patch_names) for batch in batches]
+    elif SMALI_POOL is not None:
+        results = list(
+            SMALI_POOL.map(patch_smali_batch, batches, [patch_names] * len(batches))
+        )
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(patch_smali_batch, batches, [patch_names] * len(batches))
+            )
+    patch_time = time.perf_counter() - start
+
+    total = {"scanned": 0, "candidates": 0, "matched": [], "patched": [],
+             "hits": dict.fromkeys(patch_names, 0)}
+    for result in results:
+        total["scanned"] += result["scanned"]
+        total["candidates"] += result["candidates"]
+        total["matched"] += result["matched"]
+        total["patched"] += result["patched"]
+        for name, count in result["hits"].items():
+            total["hits"][name] += count
+
+    for file_path in total["patched"]:
+        print(f"INFO: Applied regex patch to {file_path}", file=log)
+    hits = ", ".join(f"{name}: {count}" for name, count in total["hits"].items())
+    print(
+        f"INFO: Scanned {total['scanned']} smali files, {total['candidates']} passed the "
+        f"substring check, {len(total['matched'])} matched ({hits}), "
+        f"{len(total['patched'])} patched",
+        file=log,
+    )
+    print(
+        f"INFO: Listing took {walk_time:.2f}s, patching {patch_time:.2f}s "
+        f"with {workers} worker(s)",
+        file=log,
+    )
+    return total
 
 
-def decompile_apk(temp_dir: str, file_path: str, okhttp: bool) -> None:
+def decompile_apk(temp_dir: str, file_path: str, okhttp: bool, log=None) -> None:
     cmdr = [
-        "java",
-        "-jar",
-        APKEDITOR_PATH,
         "d",
         "-i",
-        file_path,
+        os.path.abspath(file_path),
         "-o",
         f"{temp_dir}/out",
         "-dex",
@@ -90,28 +230,25 @@ def decompile_apk(temp_dir: str, file_path: str, okhttp: bool) -> None:
     if okhttp:
         cmdr.remove("-dex")
     try:
-        subprocess.run(cmdr, check=True)
+        run_java(APKEDITOR_PATH, cmdr, log, check=True)
     except subprocess.CalledProcessError as e:
-        print(f"ERROR: {e}")
+        print(f"ERROR: {e}", file=log)
         exit(1)
 
 
-def recompile_apk(temp_dir: str, file_name: str) -> None:
+def recompile_apk(temp_dir: str, file_name: str, log=None) -> None:
     cmdr = [
-        "java",
-        "-jar",
-        APKEDITOR_PATH,
         "b",
         "-i",
         f"{temp_dir}/out",
         "-o",
-        file_name,
+        os.path.abspath(file_name),
         "-f",
     ]
     try:
-        subprocess.run(cmdr, check=True)
+        run_java(APKEDITOR_PATH, cmdr, log, check=True)
     except subprocess.CalledProcessError as e:
-        print(f"ERROR: {e}")
+        print(f"ERROR: {e}", file=log)
         exit(1)
 
 
@@ -148,7 +285,7 @@ def find_next_id(root) -> str:
     return hex(next_id)
 
 
-def modify_public_xml(xml_file: str) -> None:
+def modify_public_xml(xml_file: str, log=None) -> None:
     import xml.etree.ElementTree as ET  # skipcq
 
     import defusedxml.ElementTree as DET
@@ -158,7 +295,7 @@ def modify_public_xml(xml_file: str) -> None:
 
     for elem in root.findall("public"):
         if elem.get("name") == "network_security_config":
-            print("network_security_config already exists. No modification needed.")
+            print("network_security_config already exists. No modification needed.", file=log)
             return
 
     new_id = find_next_id(root)
@@ -182,6 +319,59 @@ def modify_public_xml(xml_file: str) -> None:
     tree.write(xml_file, encoding="utf-8", xml_declaration=True)
 
 
+def patch_network_config(root) -> bool:
+    """Allow cleartext and user CAs in a parsed <network-security-config>.
+
+    Returns False when there is no base-config to edit; callers then replace
+    the whole file with XML_CONTENT.
+    """
+    import xml.etree.ElementTree as ET  # skipcq
+
+    def modify_config(config_element):
+        if config_element is None:
+            return
+
+        if "cleartextTrafficPermitted" in config_element.attrib:
+            if config_element.attrib["cleartextTrafficPermitted"] == "false":
+                config_element.set("cleartextTrafficPermitted", "true")
+        else:
+            config_element.set("cleartextTrafficPermitted", "true")
+
+        trust_anchors = config_element.find("trust-anchors")
+        if trust_anchors is None:
+            trust_anchors = ET.SubElement(config_element, "trust-anchors")
+            ET.SubElement(trust_anchors, "certificates", {"src": "system"})
+            ET.SubElement(
+                trust_anchors,
+                "certificates",
+                {"src": "user", "overridePins": "true"},
+            )
+        else:
+            for child in trust_anchors.findall("certificates"):
+                if child.get("src") == "user":
+                    trust_anchors.remove(child)
+
+            ET.SubElement(
+                trust_anchors,
+                "certificates",
+                {"src": "user", "overridePins": "true"},
+            )
+
+    base_config = root.find("base-config")
+    if base_config is None:
+        return False
+    modify_config(base_config)
+
+    debug_overrides = root.find("debug-overrides")
+    if debug_overrides:
+        modify_config(debug_overrides)
+
+        base_conf = debug_overrides.find("base-config")
+        if base_conf is not None:
+            debug_overrides.remove(base_conf)
+    return True
+
+
 def modify_xml(temp_dir: str, nsc: str | None = None) -> None:
     import xml.etree.ElementTree as ET  # skipcq
 
@@ -216,51 +406,10 @@ def modify_xml(temp_dir: str, nsc: str | None = None) -> None:
             xml_content = f.read()
 
         root = DET.fromstring(xml_content)
-
-        def modify_config(config_element):
-            if config_element is None:
-                return
-
-            if "cleartextTrafficPermitted" in config_element.attrib:
-                if config_element.attrib["cleartextTrafficPermitted"] == "false":
-                    config_element.set("cleartextTrafficPermitted", "true")
-            else:
-                config_element.set("cleartextTrafficPermitted", "true")
-
-            trust_anchors = config_element.find("trust-anchors")
-            if trust_anchors is None:
-                trust_anchors = ET.SubElement(config_element, "trust-anchors")
-                ET.SubElement(trust_anchors, "certificates", {"src": "system"})
-                ET.SubElement(
-                    trust_anchors,
-                    "certificates",
-                    {"src": "user", "overridePins": "true"},
-                )
-            else:
-                for child in trust_anchors.findall("certificates"):
-                    if child.get("src") == "user":
-                        trust_anchors.remove(child)
-
-                ET.SubElement(
-                    trust_anchors,
-                    "certificates",
-                    {"src": "user", "overridePins": "true"},
-                )
-
-        base_config = root.find("base-config")
-        if base_config is None:
+        if not patch_network_config(root):
             with open(config_file_path, "w") as f:
                 f.write(XML_CONTENT)
             return
-        modify_config(base_config)
-
-        debug_overrides = root.find("debug-overrides")
-        if debug_overrides:
-            modify_config(debug_overrides)
-
-            base_conf = debug_overrides.find("base-config")
-            if base_conf is not None:
-                debug_overrides.remove(base_conf)
 
         xml_str = ET.tostring(root, encoding="utf-8").decode()
         with open(config_file_path, "w") as f:
@@ -300,7 +449,13 @@ def modify_manifest(manifest_path: str) -> str:
     return nsc
 
 
-def modify_apk(temp_dir: str, okhttp: bool) -> None:
+def print_flutter_tip(log=None) -> None:
+    print(f"{GREEN}[TIP]{NC}{YELLOW}This application seems to be a Flutter app.{NC}", file=log)
+    print(f"{YELLOW}You might need to patch the Flutter engine.{NC}", file=log)
+    print(f"{YELLOW}Feel free to use the flutter patch script if required.{NC}", file=log)
+
+
+def modify_apk(temp_dir: str, okhttp: bool, jobs: int | None = None, log=None) -> None:
     lib_dirs = [
         f"{temp_dir}/out/root/lib/armeabi-v7a",
         f"{temp_dir}/out/root/lib/arm64-v8a",
@@ -308,17 +463,12 @@ def modify_apk(temp_dir: str, okhttp: bool) -> None:
     ]
     try:
         if okhttp:
-            apply_regex(
-                f"{temp_dir}/out/smali", OKHTTP3_SEARCH_REGEX, OKHTTP3_REPLACE_REGEX
-            )
-            apply_regex(
-                f"{temp_dir}/out/smali", JAVAX_SEARCH_REGEX, JAVAX_REPLACE_REGEX
-            )
+            apply_smali_patches(f"{temp_dir}/out/smali", ("okhttp3", "javax"), jobs, log)
         nsc = modify_manifest(f"{temp_dir}/out/AndroidManifest.xml")
         os.makedirs(temp_dir, exist_ok=True)
         if nsc == "@xml/network_security_config":
             modify_public_xml(
-                f"{temp_dir}/out/resources/package_1/res/values/public.xml"
+                f"{temp_dir}/out/resources/package_1/res/values/public.xml", log
             )
             modify_xml(temp_dir)
         else:
@@ -327,51 +477,932 @@ def modify_apk(temp_dir: str, okhttp: bool) -> None:
             if os.path.exists(lib_dir):
                 for file in os.listdir(lib_dir):
                     if file == "libflutter.so":
-                        print(
-                            f"{GREEN}[TIP]{NC}{YELLOW}This application seems to be a Flutter app.{NC}"
-                        )
-                        print(
-                            f"{YELLOW}You might need to patch the Flutter engine.{NC}"
-                        )
-                        print(
-                            f"{YELLOW}Feel free to use the flutter patch script if required.{NC}"
-                        )
+                        print_flutter_tip(log)
 
     except Exception as e:
         raise RuntimeError(f"Error modifying APK: {str(e)}")
 
 
-def patch_apk(apk_path: str, okhttp: bool) -> None:
-    file_name = os.path.basename(apk_path) + "_ssl_patched.apk"
-    with tempfile.TemporaryDirectory() as temp_dir:
-        print(f"{GREEN}Decompiling APK...{NC}")
-        decompile_apk(temp_dir, apk_path, okhttp)
+# --- Targeted patching -----------------------------------------------------
+# Instead of decompiling the whole APK, edit the few entries that change in
+# their binary form (AndroidManifest.xml, resources.arsc, the network security
+# config and, with --okhttp, the dex files that can contain a match) and copy
+# every other zip entry's compressed bytes across untouched.
+
+RES_STRING_POOL = 0x0001
+RES_TABLE = 0x0002
+RES_TABLE_PACKAGE = 0x0200
+RES_TABLE_TYPE = 0x0201
+RES_TABLE_TYPE_SPEC = 0x0202
+
+TYPE_REFERENCE = 0x01
+TYPE_STRING = 0x03
+TYPE_INT_BOOLEAN = 0x12
+NO_INDEX = 0xFFFFFFFF
+
+ATTR_USES_CLEARTEXT_TRAFFIC = 0x010104EC
+ATTR_NETWORK_SECURITY_CONFIG = 0x01010527
+NSC_NAME = "network_security_config"
+NSC_PATH = "res/xml/network_security_config.xml"
+# Type descriptors a dex file's string table must hold for a patch to match
+# anything in it (the dex-level counterpart of SMALI_PATCHES' substrings)
+DEX_NEEDLES = {
+    "okhttp3": (
+        b"Ljava/security/cert/X509Certificate;",
+        b"Ljavax/net/ssl/SSLPeerUnverifiedException;",
+    ),
+    "javax": (b"Ljavax/net/ssl/SSLSession;",),
+}
+SIGNATURE_FILE = re.compile(r"META-INF/[^/]+\.(SF|RSA|DSA|EC)$|META-INF/MANIFEST\.MF$", re.IGNORECASE)
+COPY_CHUNK_SIZE = 1 << 20
+
+
+class ResPackage:
+    """One package chunk of resources.arsc: its type/key string pools and raw type chunks."""
+
+    def __init__(self, chunk: bytes):
+        header_size = struct.unpack_from("<H", chunk, 2)[0]
+        self.header = bytearray(chunk[:header_size])
+        self.id = struct.unpack_from("<I", chunk, 8)[0]
+        type_strings, _, key_strings = struct.unpack_from("<III", chunk, 268)
+        self.type_id_offset = (
+            struct.unpack_from("<I", chunk, 284)[0] if header_size >= 288 else 0
+        )
+        self.type_pool = self.key_pool = None
+        self.chunks = []
+        pos = header_size
+        while pos + 8 <= len(chunk):
+            chunk_type, _, size = struct.unpack_from("<HHI", chunk, pos)
+            if size < 8:
+                raise ValueError(f"broken package chunk at offset {pos}")
+            body = chunk[pos : pos + size]
+            if pos == type_strings:
+                self.type_pool = StringPool(body)
+                self.chunks.append(self.type_pool)
+            elif pos == key_strings:
+                self.key_pool = StringPool(body)
+                self.chunks.append(self.key_pool)
+            else:
+                self.chunks.append(bytearray(body))
+            pos += size
+        if self.type_pool is None or self.key_pool is None:
+            raise ValueError("package without type or key strings")
+
+    def type_id(self, name: str) -> int:
+        index = self.type_pool.find(name)
+        return index + 1 + self.type_id_offset if index >= 0 else 0
+
+    def chunks_of(self, chunk_type: int, type_id: int) -> list[int]:
+        return [
+            i for i, chunk in enumerate(self.chunks)
+            if isinstance(chunk, bytearray)
+            and struct.unpack_from("<H", chunk)[0] == chunk_type and chunk[8] == type_id
+        ]
+
+    @staticmethod
+    def entry_offsets(chunk: bytearray) -> dict[int, int]:
+        """entry index -> offset of the entry from the chunk start, for one type chunk."""
+        header_size = struct.unpack_from("<H", chunk, 2)[0]
+        flags = chunk[9]
+        count, entries_start = struct.unpack_from("<II", chunk, 12)
+        offsets = {}
+        if flags & 0x01:  # sparse: (index, offset / 4) pairs
+            for i in range(count):
+                index, offset = struct.unpack_from("<HH", chunk, header_size + 4 * i)
+                offsets[index] = entries_start + offset * 4
+        elif flags & 0x02:  # 16-bit offsets / 4
+            for index, offset in enumerate(struct.unpack_from(f"<{count}H", chunk, header_size)):
+                if offset != 0xFFFF:
+                    offsets[index] = entries_start + offset * 4
+        else:
+            for index, offset in enumerate(struct.unpack_from(f"<{count}I", chunk, header_size)):
+                if offset != NO_INDEX:
+                    offsets[index] = entries_start + offset
+        return offsets
+
+    @staticmethod
+    def entry(chunk: bytearray, pos: int) -> tuple[int, int | None, int | None]:
+        """(key index, value type, value) of the entry at pos; value is None for bags."""
+        size, flags = struct.unpack_from("<HH", chunk, pos)
+        if flags & 0x08:  # compact entry: key in the size field, type in the flags
+            return size, flags >> 8, struct.unpack_from("<I", chunk, pos + 4)[0]
+        key = struct.unpack_from("<I", chunk, pos + 4)[0]
+        if flags & 0x01:  # complex (bag) entry
+            return key, None, None
+        _, _, value_type, value = struct.unpack_from("<HBBI", chunk, pos + size)
+        return key, value_type, value
+
+    @staticmethod
+    def is_default_config(chunk: bytearray) -> bool:
+        config_size = struct.unpack_from("<I", chunk, 20)[0]
+        return not any(chunk[24 : 20 + config_size])
+
+    def find_entry(self, type_name: str, key: str) -> int | None:
+        type_id, key_index = self.type_id(type_name), self.key_pool.find(key)
+        if not type_id or key_index < 0:
+            return None
+        for i in self.chunks_of(RES_TABLE_TYPE, type_id):
+            chunk = self.chunks[i]
+            for index, pos in self.entry_offsets(chunk).items():
+                if self.entry(chunk, pos)[0] == key_index:
+                    return (self.id << 24) | (type_id << 16) | index
+        return None
+
+    def add_string_entry(self, type_name: str, key: str, string_index: int) -> int:
+        """Add a default-config entry holding a global string (a file path); returns its id."""
+        key_index = self.key_pool.find(key)
+        if key_index < 0:
+            key_index = self.key_pool.append(key)
+        type_id = self.type_id(type_name)
+        if not type_id:
+            type_id = self.type_pool.append(type_name) + 1 + self.type_id_offset
+            self.chunks.append(bytearray(
+                struct.pack("<HHIBBHI", RES_TABLE_TYPE_SPEC, 16, 16, type_id, 0, 0, 0)
+            ))
+        (spec_index,) = self.chunks_of(RES_TABLE_TYPE_SPEC, type_id)
+        spec = self.chunks[spec_index]
+        index = struct.unpack_from("<I", spec, 12)[0]
+        spec += struct.pack("<I", 0)
+        struct.pack_into("<I", spec, 4, len(spec))
+        struct.pack_into("<I", spec, 12, index + 1)
+
+        # Only the default configuration gets the entry; other configs have
+        # fewer entries than the spec, which reads as "no value here"
+        entry = struct.pack("<HHIHBBI", 8, 0, key_index, 8, 0, TYPE_STRING, string_index)
+        types = self.chunks_of(RES_TABLE_TYPE, type_id)
+        default = next((i for i in types if self.is_default_config(self.chunks[i])), None)
+        if default is not None:
+            chunk = self.chunks[default]
+            if chunk[9] & 0x03:
+                raise ValueError(f"sparse or 16-bit offset '{type_name}' table")
+            if struct.unpack_from("<I", chunk, 12)[0] != index:
+                raise ValueError(f"'{type_name}' table doesn't match its spec")
+            self.chunks[default] = self._append_entry(chunk, entry)
+        else:
+            config_size = struct.unpack_from("<I", self.chunks[types[0]], 20)[0] if types else 64
+            header_size = 20 + config_size
+            offsets = struct.pack(f"<{index + 1}I", *([NO_INDEX] * index + [0]))
+            entries_start = header_size + len(offsets)
+            chunk = bytearray(
+                struct.pack("<HHIBBHII", RES_TABLE_TYPE, header_size,
+                            entries_start + len(entry), type_id, 0, 0, index + 1, entries_start)
+                + struct.pack("<I", config_size) + bytes(config_size - 4) + offsets + entry
+            )
+            self.chunks.insert((types[-1] if types else spec_index) + 1, chunk)
+            if spec[10] or spec[11]:  # typesCount, when the writer filled it in
+                struct.pack_into("<H", spec, 10, struct.unpack_from("<H", spec, 10)[0] + 1)
+        return (self.id << 24) | (type_id << 16) | index
+
+    @staticmethod
+    def _append_entry(chunk: bytearray, entry: bytes) -> bytearray:
+        header_size = struct.unpack_from("<H", chunk, 2)[0]
+        count, entries_start = struct.unpack_from("<II", chunk, 12)
+        offsets_end = header_size + 4 * count
+        entries = chunk[entries_start:]
+        new = bytearray(
+            chunk[:offsets_end] + struct.pack("<I", len(entries))
+            + chunk[offsets_end:entries_start] + entries + entry
+        )
+        struct.pack_into("<I", new, 4, len(new))
+        struct.pack_into("<II", new, 12, count + 1, entries_start + 4)
+        return new
+
+    def to_bytes(self) -> bytes:
+        header = bytearray(self.header)
+        body, pos = [], len(header)
+        for chunk in self.chunks:
+            data = chunk.to_bytes() if isinstance(chunk, StringPool) else bytes(chunk)
+            if chunk is self.type_pool:
+                struct.pack_into("<I", header, 268, pos)
+            elif chunk is self.key_pool:
+                struct.pack_into("<I", header, 276, pos)
+            body.append(data)
+            pos += len(data)
+        struct.pack_into("<I", header, 4, pos)
+        return bytes(header) + b"".join(body)
+
+
+class ResTable:
+    """resources.arsc: the global string pool plus its packages, other chunks kept as-is."""
+
+    def __init__(self, data: bytes):
+        chunk_type, header_size, size = struct.unpack_from("<HHI", data)
+        if chunk_type != RES_TABLE:
+            raise ValueError("not a resources.arsc file")
+        self.header = bytearray(data[:header_size])
+        self.pool = None
+        self.packages = []
+        self.chunks = []
+        pos, end = header_size, min(size, len(data))
+        while pos + 8 <= end:
+            chunk_type, _, chunk_size = struct.unpack_from("<HHI", data, pos)
+            if chunk_size < 8:
+                raise ValueError(f"broken table chunk at offset {pos}")
+            chunk = data[pos : pos + chunk_size]
+            if chunk_type == RES_STRING_POOL and self.pool is None:
+                self.pool = StringPool(chunk)
+                self.chunks.append(self.pool)
+            elif chunk_type == RES_TABLE_PACKAGE:
+                self.packages.append(ResPackage(chunk))
+                self.chunks.append(self.packages[-1])
+            else:
+                self.chunks.append(chunk)
+            pos += chunk_size
+        if self.pool is None or not self.packages:
+            raise ValueError("resources.arsc without strings or packages")
+
+    def package(self, package_id: int = 0x7F) -> ResPackage:
+        for package in self.packages:
+            if package.id == package_id:
+                return package
+        return self.packages[0]
+
+    def entry_files(self, resource_id: int) -> list[str]:
+        """File paths a resource id points at, one per configuration."""
+        package = self.package(resource_id >> 24)
+        type_id, index = (resource_id >> 16) & 0xFF, resource_id & 0xFFFF
+        paths = []
+        for i in package.chunks_of(RES_TABLE_TYPE, type_id):
+            chunk = package.chunks[i]
+            pos = package.entry_offsets(chunk).get(index)
+            if pos is None:
+                continue
+            _, value_type, value = package.entry(chunk, pos)
+            if value_type != TYPE_STRING:
+                raise ValueError(f"resource 0x{resource_id:08x} is not a file")
+            path = self.pool.get(value)
+            if path not in paths:
+                paths.append(path)
+        return paths
+
+    def add_file(self, type_name: str, key: str, path: str) -> int:
+        return self.package().add_string_entry(type_name, key, self.pool.append(path))
+
+    def to_bytes(self) -> bytes:
+        header = bytearray(self.header)
+        body = b"".join(
+            chunk if isinstance(chunk, bytes) else chunk.to_bytes() for chunk in self.chunks
+        )
+        struct.pack_into("<I", header, 4, len(header) + len(body))
+        return bytes(header) + body
+
+
+def compile_network_config(root) -> bytes:
+    return AxmlDocument.from_element(root).to_bytes()
+
+
+def patch_binary_resources(manifest: bytes, arsc: bytes, read_entry) -> dict[str, bytes]:
+    """Binary counterpart of modify_manifest/modify_public_xml/modify_xml.
+
+    read_entry(name) returns a zip entry's bytes or None; the result maps
+    entry names to their new contents.
+    """
+    import xml.etree.ElementTree as ET  # skipcq
+
+    doc = AxmlDocument(manifest)
+    application = doc.find_element("application")
+    if application is None:
+        raise ValueError("no <application> in the manifest")
+    table = ResTable(arsc)
+    changed = {}
+
+    current = doc.get_attribute(application, ATTR_NETWORK_SECURITY_CONFIG)
+    if current is not None:
+        if current["value_type"] != TYPE_REFERENCE:
+            raise ValueError("networkSecurityConfig is not a resource reference")
+        nsc_id = current["value"]
+    else:
+        nsc_id = table.package().find_entry("xml", NSC_NAME)
+        if nsc_id is None:
+            nsc_id = table.add_file("xml", NSC_NAME, NSC_PATH)
+            changed["resources.arsc"] = table.to_bytes()
+    paths = table.entry_files(nsc_id)
+    if not paths:
+        raise ValueError(f"no file behind resource 0x{nsc_id:08x}")
+
+    for path in paths:
+        data = read_entry(path)
+        root = AxmlDocument(data).to_element() if data else None
+        if root is None or not patch_network_config(root):
+            root = ET.fromstring(XML_CONTENT)
+        changed[path] = compile_network_config(root)
+
+    doc.set_attribute(application, ATTR_NETWORK_SECURITY_CONFIG, "networkSecurityConfig",
+                      TYPE_REFERENCE, nsc_id)
+    doc.set_attribute(application, ATTR_USES_CLEARTEXT_TRAFFIC, "usesCleartextTraffic",
+                      TYPE_INT_BOOLEAN, NO_INDEX)
+    changed["AndroidManifest.xml"] = doc.to_bytes()
+    return changed
+
+
+def find_dex_candidates(zip_file: ZipFile, patch_names: tuple[str, ...]) -> list[str]:
+    """Dex files whose string table holds every type a patch needs."""
+    candidates = []
+    for name in zip_file.namelist():
+        if not re.fullmatch(r"classes\d*\.dex", name):
+            continue
+        data = zip_file.read(name)
+        if any(all(needle in data for needle in DEX_NEEDLES[patch]) for patch in patch_names):
+            candidates.append(name)
+    return candidates
+
+
+def rebuild_dex_files(apk_path: str, dex_names: list[str], temp_dir: str,
+                      jobs: int | None = None, log=None) -> dict[str, bytes]:
+    """Smali-patch just the given dex files by round-tripping a small APK holding only them."""
+    mini_apk = os.path.join(temp_dir, "dex.apk")
+    with ZipFile(apk_path) as source, ZipFile(mini_apk, "w") as mini:
+        for name in ("AndroidManifest.xml", "resources.arsc", *dex_names):
+            mini.writestr(name, source.read(name))
+    out_dir = os.path.join(temp_dir, "out")
+    rebuilt = os.path.join(temp_dir, "dex_patched.apk")
+    run_java(APKEDITOR_PATH, ["d", "-i", mini_apk, "-o", out_dir, "-f"], log, check=True)
+    stats = apply_smali_patches(os.path.join(out_dir, "smali"), ("okhttp3", "javax"), jobs, log)
+    # smali/<dex name>/... -> the dex files that actually changed
+    changed = {
+        os.path.relpath(path, os.path.join(out_dir, "smali")).split(os.sep)[0] + ".dex"
+        for path in stats["patched"]
+    }
+    if not changed:
+        return {}
+    run_java(APKEDITOR_PATH, ["b", "-i", out_dir, "-o", rebuilt, "-f"], log, check=True)
+    with ZipFile(rebuilt) as zip_file:
+        return {name: zip_file.read(name) for name in sorted(changed)}
+
+
+def _local_data_offset(file, info) -> int:
+    file.seek(info.header_offset)
+    header = file.read(30)
+    if header[:4] != b"PK\x03\x04":
+        raise ValueError(f"bad local header for {info.filename}")
+    name_length, extra_length = struct.unpack_from("<HH", header, 26)
+    return info.header_offset + 30 + name_length + extra_length
+
+
+def write_patched_apk(apk_path: str, out_path: str, replacements: dict[str, bytes]) -> dict:
+    """Copy apk_path to out_path entry by entry, swapping in replacements.
+
+    Untouched entries keep their compressed bytes; stored entries are aligned
+    like zipalign does (4 bytes, 16 KiB for native libraries). Old v1
+    signature files are dropped since the result has to be re-signed anyway.
+    """
+    stats = {"copied": 0, "replaced": 0, "dropped": 0}
+    tmp_path = out_path + ".tmp"
+    try:
+        _write_entries(apk_path, tmp_path, dict(replacements), stats)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, out_path)
+    return stats
+
+
+def _write_entries(apk_path: str, tmp_path: str, pending: dict, stats: dict) -> None:
+    central = []
+    with ZipFile(apk_path) as zip_file, open(apk_path, "rb") as source, \
+            open(tmp_path, "wb") as out:
+        entries = [(info, pending.pop(info.filename, None)) for info in zip_file.infolist()]
+        for name, data in pending.items():
+            info = ZipInfo(name)
+            info.compress_type = ZIP_DEFLATED
+            entries.append((info, data))
+        for info, data in entries:
+            if SIGNATURE_FILE.match(info.filename):
+                stats["dropped"] += 1
+                continue
+            if info.flag_bits & 0x1:
+                raise ValueError(f"{info.filename} is encrypted")
+            name = info.filename.encode("utf-8")
+            flags = info.flag_bits & 0x800 if info.filename.isascii() else 0x800
+            method = info.compress_type
+            if data is not None:
+                crc, size = zlib.crc32(data), len(data)
+                if method == ZIP_STORED:
+                    payload = data
+                else:
+                    method = ZIP_DEFLATED
+                    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+                    payload = compressor.compress(data) + compressor.flush()
+                compressed_size = len(payload)
+                stats["replaced"] += 1
+            else:
+                crc, size, compressed_size = info.CRC, info.file_size, info.compress_size
+                stats["copied"] += 1
+
+            offset = out.tell()
+            extra = b""
+            if method == ZIP_STORED:
+                align = 16384 if info.filename.endswith(".so") else 4
+                data_start = offset + 30 + len(name) + 6
+                # zipalign's extra field: id 0xd935, then the alignment, then padding
+                padding = -data_start % align
+                extra = struct.pack("<HHH", 0xD935, 2 + padding, align) + b"\0" * padding
+            dos_time = (info.date_time[3] << 11) | (info.date_time[4] << 5) | (info.date_time[5] // 2)
+            dos_date = ((info.date_time[0] - 1980) << 9) | (info.date_time[1] << 5) | info.date_time[2]
+            fields = (20, flags, method, dos_time, dos_date, crc, compressed_size, size)
+            out.write(struct.pack("<IHHHHHIIIHH", 0x04034B50, *fields, len(name), len(extra)))
+            out.write(name + extra)
+            if data is not None:
+                out.write(payload)
+            else:
+                source.seek(_local_data_offset(source, info))
+                remaining = compressed_size
+                while remaining:
+                    chunk = source.read(min(COPY_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise ValueError(f"{info.filename} is truncated")
+                    out.write(chunk)
+                    remaining -= len(chunk)
+            central.append(
+                struct.pack("<IHHHHHHIIIHHHHHII", 0x02014B50,
+                            (info.create_system << 8) | 20, *fields, len(name), 0, 0, 0,
+                            info.internal_attr, info.external_attr, offset) + name
+            )
+
+        directory_offset = out.tell()
+        if len(central) > 0xFFFF or directory_offset > 0xFFFFFFFF:
+            raise ValueError("APK too large for the targeted patcher (needs zip64)")
+        directory = b"".join(central)
+        out.write(directory)
+        out.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central),
+                              len(directory), directory_offset, 0))
+
+
+def targeted_patch_apk(apk_path: str, out_path: str, okhttp: bool,
+                       jobs: int | None = None, log=None) -> None:
+    """Patch only the entries that change; raises ValueError when the APK needs the full path."""
+    if AxmlDocument is None:
+        raise ValueError("AXML.py is needed for the binary manifest and resources")
+    start = time.perf_counter()
+    with ZipFile(apk_path) as zip_file:
+        names = set(zip_file.namelist())
+        if "AndroidManifest.xml" not in names or "resources.arsc" not in names:
+            raise ValueError("no binary manifest or resources.arsc")
+        replacements = patch_binary_resources(
+            zip_file.read("AndroidManifest.xml"),
+            zip_file.read("resources.arsc"),
+            lambda name: zip_file.read(name) if name in names else None,
+        )
+        dex_names = find_dex_candidates(zip_file, ("okhttp3", "javax")) if okhttp else []
+    resource_time = time.perf_counter() - start
+    print(f"INFO: Patched {', '.join(sorted(replacements))} in {resource_time:.2f}s", file=log)
+
+    if dex_names:
+        print(f"INFO: Re-assembling {', '.join(dex_names)}", file=log)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                replacements.update(rebuild_dex_files(apk_path, dex_names, temp_dir, jobs, log))
+            except (subprocess.CalledProcessError, KeyError) as e:
+                raise ValueError(f"could not re-assemble dex files: {e}")
+    elif okhttp:
+        print("INFO: No dex file references the classes the smali patches look for", file=log)
+
+    start = time.perf_counter()
+    stats = write_patched_apk(apk_path, out_path, replacements)
+    print(
+        f"INFO: Wrote {stats['replaced']} patched and copied {stats['copied']} untouched "
+        f"entries ({stats['dropped']} signature files dropped) in "
+        f"{time.perf_counter() - start:.2f}s",
+        file=log,
+    )
+    if any(name.startswith("lib/") and name.endswith("/libflutter.so") for name in names):
+        print_flutter_tip(log)
+
+
+def patch_apk(
+    apk_path: str,
+    okhttp: bool,
+    jobs: int | None = None,
+    full: bool = False,
+    file_name: str | None = None,
+    cache_key: "str | Callable[[], str] | None" = None,
+    budget: "MemoryBudget | None" = None,
+    log=None,
+) -> None:
+    """Patch apk_path into file_name (default: <apk name>_ssl_patched.apk here).
+
+    With cache_key the decompiled tree comes from / goes to the cache; it may
+    be a callable, so hashing the APK only happens if the full rebuild runs.
+    With a budget the APKEditor steps wait for their share of RAM. Output
+    goes to log (default: the terminal).
+    """
+    file_name = file_name or os.path.basename(apk_path) + "_ssl_patched.apk"
+    reserve = budget.reserve if budget else lambda apk: contextlib.nullcontext()
+    if not full:
+        print(f"{GREEN}Patching changed entries only...{NC}", file=log)
+        try:
+            targeted_patch_apk(apk_path, file_name, okhttp, jobs, log)
+            print(f"{GREEN}APK patched successfully!{NC}", file=log)
+            print(f"{GREEN}Patched APK saved as {file_name}{NC}", file=log)
+            return
+        except Exception as e:
+            print(f"{YELLOW}Targeted patch failed ({e}), falling back to a full rebuild{NC}", file=log)
+    if callable(cache_key):
+        cache_key = cache_key()
+    with using_cache(cache_key), tempfile.TemporaryDirectory() as temp_dir:
+        if cache_key:
+            load_decompiled(temp_dir, apk_path, okhttp, cache_key, reserve, log)
+        else:
+            print(f"{GREEN}Decompiling APK...{NC}", file=log)
+            with reserve(apk_path):
+                decompile_apk(temp_dir, apk_path, okhttp, log)
         if not os.path.exists(f"{temp_dir}/out"):
-            print(f"{RED}ERROR: {NC}Failed to decompile APK.")
+            print(f"{RED}ERROR: {NC}Failed to decompile APK.", file=log)
             exit(1)
-        print(f"{GREEN}Modifying APK...{NC}")
-        modify_apk(temp_dir, okhttp)
+        print(f"{GREEN}Modifying APK...{NC}", file=log)
+        modify_apk(temp_dir, okhttp, jobs, log)
 
-        print(f"{GREEN}Recompiling APK...{NC}")
-        recompile_apk(temp_dir, file_name)
+        print(f"{GREEN}Recompiling APK...{NC}", file=log)
+        with reserve(apk_path):
+            recompile_apk(temp_dir, file_name, log)
         if os.path.exists(file_name):
-            print(f"{GREEN}APK patched successfully!{NC}")
-            print(f"{GREEN}Patched APK saved as {file_name}{NC}")
+            print(f"{GREEN}APK patched successfully!{NC}", file=log)
+            print(f"{GREEN}Patched APK saved as {file_name}{NC}", file=log)
         else:
-            print(f"{RED}ERROR: {NC}Failed to recompile APK.")
+            print(f"{RED}ERROR: {NC}Failed to recompile APK.", file=log)
             exit(1)
 
 
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+_cache_locks = {}
+_cache_users = {}  # build -> batch jobs using it right now, never pruned
+_cache_locks_guard = threading.Lock()
+
+
+def _cache_lock(key: str) -> threading.Lock:
+    """One lock per build, so two jobs never decompile the same APK at once."""
+    with _cache_locks_guard:
+        return _cache_locks.setdefault(key, threading.Lock())
+
+
+def prune_cache(keep: int = CACHE_KEEP) -> None:
+    with _cache_locks_guard:
+        if not os.path.isdir(CACHE_DIR):
+            return
+        with os.scandir(CACHE_DIR) as entries:
+            builds = sorted(
+                (entry for entry in entries if entry.is_dir()),
+                key=lambda entry: entry.stat().st_mtime,
+                reverse=True,
+            )
+        for entry in builds[keep:]:
+            if not _cache_users.get(entry.name):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def using_cache(key: str | None):
+    if key is None:
+        yield
+        return
+    with _cache_locks_guard:
+        _cache_users[key] = _cache_users.get(key, 0) + 1
+    try:
+        yield
+    finally:
+        with _cache_locks_guard:
+            _cache_users[key] -= 1
+
+
+def load_decompiled(temp_dir: str, apk_path: str, okhttp: bool, cache_key: str,
+                    reserve, log=None) -> None:
+    """Fill temp_dir/out from the cache, decompiling into the cache on a miss.
+
+    A smali tree also serves a run without --okhttp, so switching options
+    only decompiles again when --okhttp needs smali and only dex was cached.
+    """
+    build_dir = os.path.join(CACHE_DIR, cache_key)
+    modes = ("smali",) if okhttp else ("dex", "smali")
+    with _cache_lock(cache_key):
+        tree = next(
+            (os.path.join(build_dir, mode) for mode in modes
+             if os.path.isdir(os.path.join(build_dir, mode))),
+            None,
+        )
+        if tree:
+            print(f"{GREEN}Using cached decompile ({os.path.basename(tree)}){NC}", file=log)
+        else:
+            print(f"{GREEN}Decompiling APK...{NC}", file=log)
+            os.makedirs(build_dir, exist_ok=True)
+            tree = os.path.join(build_dir, modes[0])
+            staging = tempfile.mkdtemp(dir=build_dir)
+            try:
+                with reserve(apk_path):
+                    decompile_apk(staging, apk_path, okhttp, log)
+                os.replace(os.path.join(staging, "out"), tree)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+        os.utime(build_dir)
+        # A copy, not links: modify_apk rewrites files in place
+        shutil.copytree(tree, f"{temp_dir}/out", copy_function=shutil.copyfile)
+    prune_cache()
+
+
+def available_ram_mb() -> int | None:
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+class MemoryBudget:
+    """Lets APKEditor steps run in parallel while their estimated RAM fits in limit_mb.
+
+    A step bigger than the whole budget still runs, just on its own.
+    """
+
+    def __init__(self, limit_mb: int):
+        self.limit_mb = limit_mb
+        self.used_mb = 0
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def estimate_mb(apk_path: str) -> int:
+        # JVM baseline plus a few times the APK size for APKEditor's model
+        return 300 + 4 * os.path.getsize(apk_path) // (1 << 20)
+
+    @contextlib.contextmanager
+    def reserve(self, apk_path: str):
+        needed = self.estimate_mb(apk_path)
+        with self._condition:
+            while self.used_mb and self.used_mb + needed > self.limit_mb:
+                self._condition.wait()
+            self.used_mb += needed
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.used_mb -= needed
+                self._condition.notify_all()
+
+
+def collect_apks(paths: list[str], recursive: bool = False) -> list[str]:
+    """APK/APKS files named on the command line or found in the given folders."""
+    found = []
+    for path in paths:
+        if not os.path.isdir(path):
+            found.append(path)
+            continue
+        pending = [path]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in sorted(entries, key=lambda entry: entry.name):
+                    if entry.is_dir() and recursive:
+                        pending.append(entry.path)
+                    elif entry.name.endswith((".apk", ".apks")) and not entry.name.endswith(
+                        "_ssl_patched.apk"
+                    ):
+                        found.append(entry.path)
+    return list(dict.fromkeys(found))
+
+
+def output_names(files: list[str], output_dir: str | None) -> dict[str, str]:
+    """Patched APK path for every batch input, unique even when basenames repeat.
+
+    Clashing names (same basename in several folders with -o, or app.apk next
+    to app.apks) get their folder, relative to the clashing inputs' common
+    folder, as a prefix; a counter settles anything still left.
+    """
+    def target(path: str, prefix: str = "") -> str:
+        apk_name = os.path.basename(path).rsplit(".", maxsplit=1)[0] + ".apk"
+        out_dir = output_dir or os.path.dirname(path) or "."
+        return os.path.join(out_dir, prefix + apk_name + "_ssl_patched.apk")
+
+    groups = {}
+    for path in files:
+        groups.setdefault(target(path), []).append(path)
+    names = {}
+    used = set()
+    for name, paths in groups.items():
+        if len(paths) == 1:
+            names[paths[0]] = name
+            used.add(name)
+            continue
+        common = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+        for path in paths:
+            rel = os.path.relpath(os.path.dirname(os.path.abspath(path)), common)
+            prefix = "" if rel == "." else rel.replace(os.sep, "_") + "_"
+            if path.endswith(".apks"):
+                prefix += "apks_"
+            candidate = target(path, prefix)
+            count = 2
+            while candidate in used:
+                candidate = target(path, f"{prefix}{count}_")
+                count += 1
+            names[path] = candidate
+            used.add(candidate)
+    return names
+
+
+def patch_build(path: str, file_name: str, options: dict, budget: MemoryBudget,
+                log=None) -> None:
+    """merge -> decompile -> modify -> recompile for one APK/APKS.
+
+    The SHA-256 cache key is only computed when the cache is read: for the
+    merged split APKs, or for the full rebuild after a failed targeted patch.
+    """
+    cache_key = (lambda: file_sha256(path)) if options["cache"] else None
+    if not path.endswith(".apks"):
+        patch_apk(path, options["okhttp"], options["jobs"], options["full"],
+                  file_name, cache_key, budget, log)
+        return
+
+    stem = os.path.basename(path).rsplit(".", maxsplit=1)[0]
+    cache_key = cache_key and cache_key()
+    with using_cache(cache_key):
+        if cache_key:
+            apk_path = os.path.join(CACHE_DIR, cache_key, stem + ".apk")
+            with _cache_lock(cache_key):
+                if not os.path.exists(apk_path):
+                    os.makedirs(os.path.dirname(apk_path), exist_ok=True)
+                    with budget.reserve(path):
+                        apk_path = merge_apks(path, apk_path, log)
+        else:
+            with budget.reserve(path):
+                apk_path = merge_apks(path, log=log)
+        if not apk_path:
+            raise RuntimeError("could not merge the split APKs")
+        patch_apk(apk_path, options["okhttp"], options["jobs"], options["full"],
+                  file_name, cache_key, budget, log)
+
+
+def patch_one(path: str, file_name: str, options: dict,
+              budget: MemoryBudget) -> tuple[str, bool, str]:
+    """Patch one batch item without prompting.
+
+    Returns (path, ok, captured output) so parallel runs print cleanly.
+    """
+    log = io.StringIO()
+    ok = True
+    start = time.perf_counter()
+    try:
+        patch_build(path, file_name, options, budget, log)
+    except SystemExit as e:
+        ok = not e.code
+    except Exception as e:
+        print(f"{RED}ERROR: {NC}{type(e).__name__}: {e}", file=log)
+        ok = False
+    log.write(f"({time.perf_counter() - start:.1f}s)\n")
+    return path, ok, log.getvalue()
+
+
+def run_batch(paths: list[str], options: dict, workers: int | None = None,
+              max_ram_mb: int | None = None) -> bool:
+    """Patch many APKs, several at a time.
+
+    Threads rather than processes: the work happens in APKEditor (or the JVM
+    helper) and in the smali worker pool, and threads can share the RAM
+    budget and the per-build cache locks. The smali pool is shared too, and
+    started before any worker thread, so its processes aren't forked from a
+    multithreaded parent and there are never more of them than --jobs.
+    """
+    global SMALI_POOL
+
+    files = collect_apks(paths, options["recursive"])
+    missing = [path for path in files if not os.path.isfile(path)]
+    for path in missing:
+        print(f"{RED}ERROR: {NC}{path} not found")
+    files = [path for path in files if path not in missing]
+    if options["output_dir"]:
+        os.makedirs(options["output_dir"], exist_ok=True)
+
+    if max_ram_mb is None:
+        max_ram_mb = int((available_ram_mb() or 2048) * 0.75)
+    budget = MemoryBudget(max_ram_mb)
+    workers = max(1, min(len(files), workers or os.cpu_count() or 1))
+    print(f"Patching {len(files)} APK(s) with {workers} worker(s), {max_ram_mb} MB RAM budget")
+    names = output_names(files, options["output_dir"])
+
+    start = time.perf_counter()
+    failed = len(missing)
+    smali_workers = options["jobs"] or os.cpu_count() or 1
+    try:
+        if smali_workers > 1:
+            SMALI_POOL = ProcessPoolExecutor(max_workers=smali_workers)
+            # With fork, the first task starts every worker process: do it now,
+            # while this is still the only thread
+            SMALI_POOL.submit(int).result()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(patch_one, files, [names[path] for path in files],
+                               [options] * len(files), [budget] * len(files))
+            for path, ok, output in results:
+                print("=" * 60)
+                print(f"{BLUE}{path}{NC}")
+                print(output.rstrip())
+                failed += not ok
+    finally:
+        if SMALI_POOL is not None:
+            SMALI_POOL.shutdown()
+            SMALI_POOL = None
+
+    print("=" * 60)
+    done = len(files) + len(missing) - failed
+    print(f"APKs patched: {done}, failed: {failed} "
+          f"({time.perf_counter() - start:.1f}s, {workers} worker(s))")
+    return failed == 0
+
+
+def benchmark_pipeline(apk_path: str, okhttp: bool, jobs: int | None = None) -> None:
+    """Time the full patch with a fresh JVM per step, then through the JVM helper,
+    then the targeted patch."""
+    import jvm_helper
+
+    timings = []
+    for label, use_server in (
+        ("fresh JVM per step", False),
+        ("JVM helper, first run", True),
+        ("JVM helper, warm", True),
+    ):
+        jvm_helper.USE_SERVER = use_server
+        if use_server and not jvm_helper.server_running():
+            start = time.perf_counter()
+            if not jvm_helper.start_server():
+                print(f"{RED}ERROR: {NC}Could not start the JVM helper.")
+                exit(1)
+            timings.append(("JVM helper start-up", time.perf_counter() - start))
+        print(f"{BLUE}=== {label} ==={NC}")
+        start = time.perf_counter()
+        patch_apk(apk_path, okhttp, jobs, full=True)
+        timings.append((label, time.perf_counter() - start))
+
+    print(f"{BLUE}=== targeted patch ==={NC}")
+    start = time.perf_counter()
+    patch_apk(apk_path, okhttp, jobs)
+    timings.append(("targeted patch", time.perf_counter() - start))
+
+    print(f"\n{GREEN}Patch pipeline timings:{NC}")
+    for label, seconds in timings:
+        print(f"  {label:<24} {seconds:7.1f}s")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Patch APK to bypass SSL verification."
     )
-    parser.add_argument("apk_path", help="Path to the APK/APKS file")
+    parser.add_argument(
+        "apk_paths",
+        nargs="+",
+        help="Path to the APK/APKS file; several files or folders patch them in batch mode",
+    )
     parser.add_argument(
         "--okhttp", help="Patch OkHttp3", action="store_true", required=False
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for smali patching (default: CPU count)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Always decompile and rebuild the whole APK instead of patching changed entries",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Patch four times (full rebuild with fresh JVMs, then the JVM helper cold and "
+        "warm, then targeted) and compare",
+    )
+    parser.add_argument(
+        "-r", "--recursive", action="store_true", help="Batch mode: look in subfolders too"
+    )
+    parser.add_argument(
+        "-o", "--output-dir", help="Batch mode: write patched APKs here (default: next to each input)"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Batch mode: APKs patched at the same time (default: CPU count)",
+    )
+    parser.add_argument(
+        "--max-ram",
+        type=int,
+        default=None,
+        metavar="MB",
+        help="Batch mode: RAM the APKEditor steps may use together (default: 75%% of available)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Batch mode: don't keep decompiled builds in {CACHE_DIR}",
+    )
     args = parser.parse_args()
-    apk_path = args.apk_path
     okhttp = args.okhttp
 
     if not os.path.exists(APKEDITOR_PATH):
@@ -380,6 +1411,22 @@ if __name__ == "__main__":
         )
         exit(1)
 
+    if len(args.apk_paths) > 1 or os.path.isdir(args.apk_paths[0]):
+        options = {
+            "okhttp": okhttp,
+            "jobs": args.jobs,
+            "full": args.full,
+            "recursive": args.recursive,
+            "output_dir": args.output_dir,
+            "cache": not args.no_cache,
+        }
+        try:
+            exit(0 if run_batch(args.apk_paths, options, args.workers, args.max_ram) else 1)
+        except KeyboardInterrupt:
+            print("\n\nOperation cancelled by user.")
+            exit(1)
+
+    apk_path = args.apk_paths[0]
     if apk_path.endswith(".apks"):
         try:
             with ZipFile(apk_path, "r") as zip_ref:
@@ -394,4 +1441,7 @@ if __name__ == "__main__":
         except BadZipFile:
             print(f"{RED}ERROR: {NC}Invalid APKS file: {apk_path}")
             exit(1)
-    patch_apk(apk_path, okhttp)
\ No newline at end of file
+    if args.benchmark:
+        benchmark_pipeline(apk_path, okhttp, args.jobs)
+    else:
+        patch_apk(apk_path, okhttp, args.jobs, args.full)
\ No newline at end of file